@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Hedged attempts for the idempotent methods of a synchronous client.
+
+With :class:`Hedging` attached to a transport, an attempt of an idempotent
+method that has not answered after a delay is raced by a second, identical
+attempt; whichever answers first is returned. The delay is a percentile
+of the method's recent latencies, so only the slowest calls are hedged,
+and a budget caps the extra load hedges put on the service.
+
+Only idempotent methods are hedged: those whose default retry covers
+``UNAVAILABLE``, which the generator only does for methods that are safe
+to repeat, and those named in ``methods``. Services whose methods have no
+default retry hedge only the methods named.
+
+An attempt that no hedge can follow, because the method has no delay yet
+or the budget is spent, is made on the caller's thread. Otherwise it runs
+on a worker thread, so that the caller can return the hedge's answer
+without waiting for the slower attempt.
+
+.. code-block:: python
+
+    Hedging(methods=["get_property"], initial_delay=0.5).attach(client.transport)
+"""
+
+import collections
+from concurrent import futures
+import contextvars
+import math
+import threading
+import time
+from typing import Callable, Deque, Dict, Iterable, Optional
+
+import grpc  # type: ignore
+
+from google.analytics.admin_helpers import wrapping
+
+_STREAMING = (grpc.UnaryStreamMultiCallable, grpc.StreamStreamMultiCallable)
+
+
+class _Latencies:
+    """Recent latencies of one method and the hedging delay derived from them."""
+
+    def __init__(self, window: int):
+        self._samples: Deque[float] = collections.deque(maxlen=window)
+        self._since_update = 0
+        self._refresh_every = max(1, window // 10)
+        self.delay: Optional[float] = None
+
+    def record(self, latency: float, percentile: float, min_samples: int) -> None:
+        self._samples.append(latency)
+        self._since_update += 1
+        if len(self._samples) >= min_samples and (
+            self.delay is None or self._since_update >= self._refresh_every
+        ):
+            ordered = sorted(self._samples)
+            rank = math.ceil(percentile / 100 * len(ordered)) - 1
+            self.delay = ordered[max(0, rank)]
+            self._since_update = 0
+
+
+class Hedging:
+    """Hedges slow attempts of idempotent methods.
+
+    Args:
+        methods (Optional[Iterable[str]]): The names of methods to hedge
+            although their default retry does not cover ``UNAVAILABLE``, for
+            example ``"get_property"``. Only name methods that are safe to
+            repeat.
+        percentile (float): An attempt is hedged once it has taken longer
+            than this percentile of the method's recent latencies.
+        min_samples (int): Latencies a method must have recorded before
+            its attempts are hedged, unless ``initial_delay`` is set.
+        initial_delay (Optional[float]): Seconds to wait before hedging
+            until ``min_samples`` latencies have been recorded.
+        window (int): How many recent latencies per method to keep.
+        max_hedge_ratio (float): The largest fraction of attempts that may
+            be hedged, averaged over time. Each attempt earns the budget
+            this much; each hedge spends 1.
+        max_burst (float): The most budget that can be saved up, which is
+            how many hedges can be sent back to back.
+        max_workers (int): Threads used to run the attempts that a hedge
+            may follow, and the hedges. An attempt waits for a free thread,
+            so set this to at least twice the number of threads making
+            calls.
+    """
+
+    def __init__(
+        self,
+        methods: Optional[Iterable[str]] = None,
+        *,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        initial_delay: Optional[float] = None,
+        window: int = 1000,
+        max_hedge_ratio: float = 0.1,
+        max_burst: float = 10.0,
+        max_workers: int = 64,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be between 0 and 1")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError(
+                "window must be at least min_samples, which must be positive"
+            )
+        self.methods = frozenset(methods or ())
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.window = window
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_burst = max_burst
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedging"
+        )
+        self._lock = threading.Lock()
+        self._budget = max_burst
+        self._latencies: Dict[str, _Latencies] = {}
+        self.attempts = 0
+        self.hedges = 0
+
+    def attach(self, transport) -> None:
+        """Hedge the idempotent methods of a transport from their next call on."""
+        transport._hedging = self
+        transport._wrapped_methods.clear()
+
+    def detach(self, transport) -> None:
+        """Stop hedging a transport's methods."""
+        transport._hedging = None
+        transport._wrapped_methods.clear()
+
+    def close(self) -> None:
+        """Stop the threads running attempts, once they finish."""
+        self._executor.shutdown(wait=False)
+
+    def factory(
+        self, name: str, factory: Callable[[Callable], Callable]
+    ) -> Callable[[Callable], Callable]:
+        """Make a wrapped-method factory hedge the method if it is idempotent.
+
+        Args:
+            name (str): The transport method's name.
+            factory (Callable[[Callable], Callable]): Applies the method's
+                retry, timeout and error handling to a callable.
+        """
+
+        def hedged_factory(method):
+            wrapped = factory(method)
+            if isinstance(method, _STREAMING) or not (
+                name in self.methods or wrapping.is_idempotent(wrapped)
+            ):
+                return wrapped
+            # Hedge each attempt, inside the method's retry and timeout.
+            return factory(self._hedged(name, method))
+
+        return hedged_factory
+
+    def delay(self, name: str) -> Optional[float]:
+        """Return the current hedging delay of a method, if there is one."""
+        with self._lock:
+            latencies = self._latencies.get(name)
+            delay = latencies.delay if latencies is not None else None
+        return self.initial_delay if delay is None else delay
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self.hedges += 1
+            return True
+
+    def _record(self, name: str, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(name)
+            if latencies is None:
+                latencies = self._latencies[name] = _Latencies(self.window)
+            latencies.record(latency, self.percentile, self.min_samples)
+
+    def _hedged(self, name: str, method: Callable) -> Callable:
+        def attempt(request, *args, **kwargs):
+            delay = self.delay(name)
+            with self._lock:
+                self.attempts += 1
+                self._budget = min(self.max_burst, self._budget + self.max_hedge_ratio)
+                may_hedge = delay is not None and self._budget >= 1
+            started = time.monotonic()
+            if not may_hedge:
+                response = method(request, *args, **kwargs)
+                self._record(name, time.monotonic() - started)
+                return response
+
+            def run(**overrides):
+                call_kwargs = dict(kwargs, **overrides)
+                # Run in a copy of the caller's context, so that context
+                # variables (such as instrumentation's) carry over.
+                return self._executor.submit(
+                    contextvars.copy_context().run,
+                    method,
+                    request,
+                    *args,
+                    **call_kwargs,
+                )
+
+            pending = {run()}
+            done, _ = futures.wait(pending, timeout=delay)
+            if not done and self._spend():
+                timeout = kwargs.get("timeout")
+                overrides = {}
+                if isinstance(timeout, (int, float)):
+                    # The hedge must finish by the original attempt's deadline.
+                    overrides["timeout"] = max(
+                        0.0, timeout - (time.monotonic() - started)
+                    )
+                pending.add(run(**overrides))
+            while True:
+                done, pending = futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED
+                )
+                failed = None
+                for future in done:
+                    if future.exception() is None:
+                        self._record(name, time.monotonic() - started)
+                        # The slower attempt runs on and its result is dropped.
+                        return future.result()
+                    failed = future
+                if not pending:
+                    return failed.result()
+
+        return attempt
+
+
+__all__ = ("Hedging",)
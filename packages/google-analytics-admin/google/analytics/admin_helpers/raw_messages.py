@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Protobuf messages, rather than proto-plus ones, from a transport.
+
+Reading a field of a proto-plus message goes through its marshal, which
+converts the value on every access and wraps each message it returns,
+including each item of a repeated field. With :class:`RawMessages`
+attached to a transport, its methods return the protobuf message under
+the proto-plus response instead, which is taken without a copy. Pagers
+then hold protobuf pages and yield protobuf items, and server-streaming
+methods yield protobuf messages.
+
+Clients already accept protobuf requests, such as
+``ListAccountsRequest.pb()`` instances, which they copy into the proto-plus
+request type as they do dicts.
+
+.. code-block:: python
+
+    RawMessages().attach(client.transport)
+    for account in client.list_accounts():
+        # An admin_v1beta.Account.pb() message.
+        print(account.name, account.display_name)
+"""
+
+from typing import Any, Callable
+
+import proto  # type: ignore
+
+from google.analytics.admin_helpers import wrapping
+
+
+def unwrap(response: Any) -> Any:
+    """Return the protobuf message of a proto-plus response.
+
+    Other responses, such as ``operations_pb2.Operation``, are returned
+    as is.
+    """
+    if isinstance(response, proto.Message):
+        return type(response).pb(response)
+    return response
+
+
+class _RawStream:
+    """Yields the protobuf messages of a stream of proto-plus responses."""
+
+    def __init__(self, stream: Any):
+        self._stream = stream
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        return unwrap(next(self._stream))
+
+    def __getattr__(self, name: str) -> Any:
+        # cancel(), trailing_metadata() and the like.
+        return getattr(self._stream, name)
+
+
+class RawMessages:
+    """Makes a transport's methods return protobuf messages."""
+
+    def attach(self, transport) -> None:
+        """Return protobuf messages from a transport's next calls on."""
+        transport._raw_messages = self
+        transport._wrapped_methods.clear()
+        wrapping.hook_async_stubs(transport)
+
+    def detach(self, transport) -> None:
+        """Return proto-plus messages from a transport again."""
+        transport._raw_messages = None
+        transport._wrapped_methods.clear()
+
+    def wrap(self, wrapped: Callable) -> Callable:
+        """Return the protobuf messages of a wrapped method's responses."""
+
+        def call(*args, **kwargs):
+            response = wrapped(*args, **kwargs)
+            if hasattr(response, "__next__"):
+                return _RawStream(response)
+            return unwrap(response)
+
+        return call
+
+    def wrap_async(self, stub: Callable) -> Callable:
+        """Return the protobuf messages of an asyncio unary stub's responses."""
+
+        async def call(request, **kwargs):
+            return unwrap(await stub(request, **kwargs))
+
+        return call
+
+
+__all__ = (
+    "RawMessages",
+    "unwrap",
+)
@@ -50,6 +50,7 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 from google.protobuf import wrappers_pb2  # type: ignore
 
+from google.analytics.admin_helpers import fanout, resource_names
 from google.analytics.admin_v1alpha.services.analytics_admin_service import pagers
 from google.analytics.admin_v1alpha.types import channel_group as gaa_channel_group
 from google.analytics.admin_v1alpha.types import (
@@ -110,7 +111,9 @@ class AnalyticsAdminServiceClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
+class AnalyticsAdminServiceClient(
+    fanout.FanOutMixin, metaclass=AnalyticsAdminServiceClientMeta
+):
     """Service Interface for the Analytics Admin API (GA4)."""
 
     @staticmethod
@@ -201,48 +204,42 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         access_binding: str,
     ) -> str:
         """Returns a fully-qualified access_binding string."""
-        return "accounts/{account}/accessBindings/{access_binding}".format(
-            account=account,
-            access_binding=access_binding,
-        )
+        return resource_names.get(
+            "accounts/{account}/accessBindings/{access_binding}"
+        ).format(account, access_binding)
 
     @staticmethod
     def parse_access_binding_path(path: str) -> Dict[str, str]:
         """Parses a access_binding path into its component segments."""
-        m = re.match(
-            r"^accounts/(?P<account>.+?)/accessBindings/(?P<access_binding>.+?)$", path
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "accounts/{account}/accessBindings/{access_binding}"
+        ).parse(path)
 
     @staticmethod
     def account_path(
         account: str,
     ) -> str:
         """Returns a fully-qualified account string."""
-        return "accounts/{account}".format(
-            account=account,
-        )
+        return resource_names.get("accounts/{account}").format(account)
 
     @staticmethod
     def parse_account_path(path: str) -> Dict[str, str]:
         """Parses a account path into its component segments."""
-        m = re.match(r"^accounts/(?P<account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("accounts/{account}").parse(path)
 
     @staticmethod
     def account_summary_path(
         account_summary: str,
     ) -> str:
         """Returns a fully-qualified account_summary string."""
-        return "accountSummaries/{account_summary}".format(
-            account_summary=account_summary,
+        return resource_names.get("accountSummaries/{account_summary}").format(
+            account_summary
         )
 
     @staticmethod
     def parse_account_summary_path(path: str) -> Dict[str, str]:
         """Parses a account_summary path into its component segments."""
-        m = re.match(r"^accountSummaries/(?P<account_summary>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("accountSummaries/{account_summary}").parse(path)
 
     @staticmethod
     def ad_sense_link_path(
@@ -250,33 +247,32 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         adsense_link: str,
     ) -> str:
         """Returns a fully-qualified ad_sense_link string."""
-        return "properties/{property}/adSenseLinks/{adsense_link}".format(
-            property=property,
-            adsense_link=adsense_link,
-        )
+        return resource_names.get(
+            "properties/{property}/adSenseLinks/{adsense_link}"
+        ).format(property, adsense_link)
 
     @staticmethod
     def parse_ad_sense_link_path(path: str) -> Dict[str, str]:
         """Parses a ad_sense_link path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/adSenseLinks/(?P<adsense_link>.+?)$", path
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/adSenseLinks/{adsense_link}"
+        ).parse(path)
 
     @staticmethod
     def attribution_settings_path(
         property: str,
     ) -> str:
         """Returns a fully-qualified attribution_settings string."""
-        return "properties/{property}/attributionSettings".format(
-            property=property,
+        return resource_names.get("properties/{property}/attributionSettings").format(
+            property
         )
 
     @staticmethod
     def parse_attribution_settings_path(path: str) -> Dict[str, str]:
         """Parses a attribution_settings path into its component segments."""
-        m = re.match(r"^properties/(?P<property>.+?)/attributionSettings$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("properties/{property}/attributionSettings").parse(
+            path
+        )
 
     @staticmethod
     def audience_path(
@@ -284,18 +280,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         audience: str,
     ) -> str:
         """Returns a fully-qualified audience string."""
-        return "properties/{property}/audiences/{audience}".format(
-            property=property,
-            audience=audience,
+        return resource_names.get("properties/{property}/audiences/{audience}").format(
+            property, audience
         )
 
     @staticmethod
     def parse_audience_path(path: str) -> Dict[str, str]:
         """Parses a audience path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/audiences/(?P<audience>.+?)$", path
+        return resource_names.get("properties/{property}/audiences/{audience}").parse(
+            path
         )
-        return m.groupdict() if m else {}
 
     @staticmethod
     def big_query_link_path(
@@ -303,18 +297,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         bigquery_link: str,
     ) -> str:
         """Returns a fully-qualified big_query_link string."""
-        return "properties/{property}/bigQueryLinks/{bigquery_link}".format(
-            property=property,
-            bigquery_link=bigquery_link,
-        )
+        return resource_names.get(
+            "properties/{property}/bigQueryLinks/{bigquery_link}"
+        ).format(property, bigquery_link)
 
     @staticmethod
     def parse_big_query_link_path(path: str) -> Dict[str, str]:
         """Parses a big_query_link path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/bigQueryLinks/(?P<bigquery_link>.+?)$", path
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/bigQueryLinks/{bigquery_link}"
+        ).parse(path)
 
     @staticmethod
     def calculated_metric_path(
@@ -322,19 +314,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         calculated_metric: str,
     ) -> str:
         """Returns a fully-qualified calculated_metric string."""
-        return "properties/{property}/calculatedMetrics/{calculated_metric}".format(
-            property=property,
-            calculated_metric=calculated_metric,
-        )
+        return resource_names.get(
+            "properties/{property}/calculatedMetrics/{calculated_metric}"
+        ).format(property, calculated_metric)
 
     @staticmethod
     def parse_calculated_metric_path(path: str) -> Dict[str, str]:
         """Parses a calculated_metric path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/calculatedMetrics/(?P<calculated_metric>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/calculatedMetrics/{calculated_metric}"
+        ).parse(path)
 
     @staticmethod
     def channel_group_path(
@@ -342,18 +331,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         channel_group: str,
     ) -> str:
         """Returns a fully-qualified channel_group string."""
-        return "properties/{property}/channelGroups/{channel_group}".format(
-            property=property,
-            channel_group=channel_group,
-        )
+        return resource_names.get(
+            "properties/{property}/channelGroups/{channel_group}"
+        ).format(property, channel_group)
 
     @staticmethod
     def parse_channel_group_path(path: str) -> Dict[str, str]:
         """Parses a channel_group path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/channelGroups/(?P<channel_group>.+?)$", path
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/channelGroups/{channel_group}"
+        ).parse(path)
 
     @staticmethod
     def conversion_event_path(
@@ -361,19 +348,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         conversion_event: str,
     ) -> str:
         """Returns a fully-qualified conversion_event string."""
-        return "properties/{property}/conversionEvents/{conversion_event}".format(
-            property=property,
-            conversion_event=conversion_event,
-        )
+        return resource_names.get(
+            "properties/{property}/conversionEvents/{conversion_event}"
+        ).format(property, conversion_event)
 
     @staticmethod
     def parse_conversion_event_path(path: str) -> Dict[str, str]:
         """Parses a conversion_event path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/conversionEvents/(?P<conversion_event>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/conversionEvents/{conversion_event}"
+        ).parse(path)
 
     @staticmethod
     def custom_dimension_path(
@@ -381,19 +365,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         custom_dimension: str,
     ) -> str:
         """Returns a fully-qualified custom_dimension string."""
-        return "properties/{property}/customDimensions/{custom_dimension}".format(
-            property=property,
-            custom_dimension=custom_dimension,
-        )
+        return resource_names.get(
+            "properties/{property}/customDimensions/{custom_dimension}"
+        ).format(property, custom_dimension)
 
     @staticmethod
     def parse_custom_dimension_path(path: str) -> Dict[str, str]:
         """Parses a custom_dimension path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/customDimensions/(?P<custom_dimension>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/customDimensions/{custom_dimension}"
+        ).parse(path)
 
     @staticmethod
     def custom_metric_path(
@@ -401,18 +382,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         custom_metric: str,
     ) -> str:
         """Returns a fully-qualified custom_metric string."""
-        return "properties/{property}/customMetrics/{custom_metric}".format(
-            property=property,
-            custom_metric=custom_metric,
-        )
+        return resource_names.get(
+            "properties/{property}/customMetrics/{custom_metric}"
+        ).format(property, custom_metric)
 
     @staticmethod
     def parse_custom_metric_path(path: str) -> Dict[str, str]:
         """Parses a custom_metric path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/customMetrics/(?P<custom_metric>.+?)$", path
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/customMetrics/{custom_metric}"
+        ).parse(path)
 
     @staticmethod
     def data_redaction_settings_path(
@@ -420,49 +399,46 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         data_stream: str,
     ) -> str:
         """Returns a fully-qualified data_redaction_settings string."""
-        return "properties/{property}/dataStreams/{data_stream}/dataRedactionSettings".format(
-            property=property,
-            data_stream=data_stream,
-        )
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/dataRedactionSettings"
+        ).format(property, data_stream)
 
     @staticmethod
     def parse_data_redaction_settings_path(path: str) -> Dict[str, str]:
         """Parses a data_redaction_settings path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/dataStreams/(?P<data_stream>.+?)/dataRedactionSettings$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/dataRedactionSettings"
+        ).parse(path)
 
     @staticmethod
     def data_retention_settings_path(
         property: str,
     ) -> str:
         """Returns a fully-qualified data_retention_settings string."""
-        return "properties/{property}/dataRetentionSettings".format(
-            property=property,
+        return resource_names.get("properties/{property}/dataRetentionSettings").format(
+            property
         )
 
     @staticmethod
     def parse_data_retention_settings_path(path: str) -> Dict[str, str]:
         """Parses a data_retention_settings path into its component segments."""
-        m = re.match(r"^properties/(?P<property>.+?)/dataRetentionSettings$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("properties/{property}/dataRetentionSettings").parse(
+            path
+        )
 
     @staticmethod
     def data_sharing_settings_path(
         account: str,
     ) -> str:
         """Returns a fully-qualified data_sharing_settings string."""
-        return "accounts/{account}/dataSharingSettings".format(
-            account=account,
+        return resource_names.get("accounts/{account}/dataSharingSettings").format(
+            account
         )
 
     @staticmethod
     def parse_data_sharing_settings_path(path: str) -> Dict[str, str]:
         """Parses a data_sharing_settings path into its component segments."""
-        m = re.match(r"^accounts/(?P<account>.+?)/dataSharingSettings$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("accounts/{account}/dataSharingSettings").parse(path)
 
     @staticmethod
     def data_stream_path(
@@ -470,18 +446,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         data_stream: str,
     ) -> str:
         """Returns a fully-qualified data_stream string."""
-        return "properties/{property}/dataStreams/{data_stream}".format(
-            property=property,
-            data_stream=data_stream,
-        )
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}"
+        ).format(property, data_stream)
 
     @staticmethod
     def parse_data_stream_path(path: str) -> Dict[str, str]:
         """Parses a data_stream path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/dataStreams/(?P<data_stream>.+?)$", path
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}"
+        ).parse(path)
 
     @staticmethod
     def display_video360_advertiser_link_path(
@@ -489,19 +463,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         display_video_360_advertiser_link: str,
     ) -> str:
         """Returns a fully-qualified display_video360_advertiser_link string."""
-        return "properties/{property}/displayVideo360AdvertiserLinks/{display_video_360_advertiser_link}".format(
-            property=property,
-            display_video_360_advertiser_link=display_video_360_advertiser_link,
-        )
+        return resource_names.get(
+            "properties/{property}/displayVideo360AdvertiserLinks/{display_video_360_advertiser_link}"
+        ).format(property, display_video_360_advertiser_link)
 
     @staticmethod
     def parse_display_video360_advertiser_link_path(path: str) -> Dict[str, str]:
         """Parses a display_video360_advertiser_link path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/displayVideo360AdvertiserLinks/(?P<display_video_360_advertiser_link>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/displayVideo360AdvertiserLinks/{display_video_360_advertiser_link}"
+        ).parse(path)
 
     @staticmethod
     def display_video360_advertiser_link_proposal_path(
@@ -509,21 +480,18 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         display_video_360_advertiser_link_proposal: str,
     ) -> str:
         """Returns a fully-qualified display_video360_advertiser_link_proposal string."""
-        return "properties/{property}/displayVideo360AdvertiserLinkProposals/{display_video_360_advertiser_link_proposal}".format(
-            property=property,
-            display_video_360_advertiser_link_proposal=display_video_360_advertiser_link_proposal,
-        )
+        return resource_names.get(
+            "properties/{property}/displayVideo360AdvertiserLinkProposals/{display_video_360_advertiser_link_proposal}"
+        ).format(property, display_video_360_advertiser_link_proposal)
 
     @staticmethod
     def parse_display_video360_advertiser_link_proposal_path(
         path: str,
     ) -> Dict[str, str]:
         """Parses a display_video360_advertiser_link_proposal path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/displayVideo360AdvertiserLinkProposals/(?P<display_video_360_advertiser_link_proposal>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/displayVideo360AdvertiserLinkProposals/{display_video_360_advertiser_link_proposal}"
+        ).parse(path)
 
     @staticmethod
     def enhanced_measurement_settings_path(
@@ -531,19 +499,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         data_stream: str,
     ) -> str:
         """Returns a fully-qualified enhanced_measurement_settings string."""
-        return "properties/{property}/dataStreams/{data_stream}/enhancedMeasurementSettings".format(
-            property=property,
-            data_stream=data_stream,
-        )
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/enhancedMeasurementSettings"
+        ).format(property, data_stream)
 
     @staticmethod
     def parse_enhanced_measurement_settings_path(path: str) -> Dict[str, str]:
         """Parses a enhanced_measurement_settings path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/dataStreams/(?P<data_stream>.+?)/enhancedMeasurementSettings$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/enhancedMeasurementSettings"
+        ).parse(path)
 
     @staticmethod
     def event_create_rule_path(
@@ -552,20 +517,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         event_create_rule: str,
     ) -> str:
         """Returns a fully-qualified event_create_rule string."""
-        return "properties/{property}/dataStreams/{data_stream}/eventCreateRules/{event_create_rule}".format(
-            property=property,
-            data_stream=data_stream,
-            event_create_rule=event_create_rule,
-        )
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/eventCreateRules/{event_create_rule}"
+        ).format(property, data_stream, event_create_rule)
 
     @staticmethod
     def parse_event_create_rule_path(path: str) -> Dict[str, str]:
         """Parses a event_create_rule path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/dataStreams/(?P<data_stream>.+?)/eventCreateRules/(?P<event_create_rule>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/eventCreateRules/{event_create_rule}"
+        ).parse(path)
 
     @staticmethod
     def expanded_data_set_path(
@@ -573,19 +534,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         expanded_data_set: str,
     ) -> str:
         """Returns a fully-qualified expanded_data_set string."""
-        return "properties/{property}/expandedDataSets/{expanded_data_set}".format(
-            property=property,
-            expanded_data_set=expanded_data_set,
-        )
+        return resource_names.get(
+            "properties/{property}/expandedDataSets/{expanded_data_set}"
+        ).format(property, expanded_data_set)
 
     @staticmethod
     def parse_expanded_data_set_path(path: str) -> Dict[str, str]:
         """Parses a expanded_data_set path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/expandedDataSets/(?P<expanded_data_set>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/expandedDataSets/{expanded_data_set}"
+        ).parse(path)
 
     @staticmethod
     def firebase_link_path(
@@ -593,18 +551,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         firebase_link: str,
     ) -> str:
         """Returns a fully-qualified firebase_link string."""
-        return "properties/{property}/firebaseLinks/{firebase_link}".format(
-            property=property,
-            firebase_link=firebase_link,
-        )
+        return resource_names.get(
+            "properties/{property}/firebaseLinks/{firebase_link}"
+        ).format(property, firebase_link)
 
     @staticmethod
     def parse_firebase_link_path(path: str) -> Dict[str, str]:
         """Parses a firebase_link path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/firebaseLinks/(?P<firebase_link>.+?)$", path
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/firebaseLinks/{firebase_link}"
+        ).parse(path)
 
     @staticmethod
     def global_site_tag_path(
@@ -612,19 +568,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         data_stream: str,
     ) -> str:
         """Returns a fully-qualified global_site_tag string."""
-        return "properties/{property}/dataStreams/{data_stream}/globalSiteTag".format(
-            property=property,
-            data_stream=data_stream,
-        )
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/globalSiteTag"
+        ).format(property, data_stream)
 
     @staticmethod
     def parse_global_site_tag_path(path: str) -> Dict[str, str]:
         """Parses a global_site_tag path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/dataStreams/(?P<data_stream>.+?)/globalSiteTag$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/globalSiteTag"
+        ).parse(path)
 
     @staticmethod
     def google_ads_link_path(
@@ -632,34 +585,32 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         google_ads_link: str,
     ) -> str:
         """Returns a fully-qualified google_ads_link string."""
-        return "properties/{property}/googleAdsLinks/{google_ads_link}".format(
-            property=property,
-            google_ads_link=google_ads_link,
-        )
+        return resource_names.get(
+            "properties/{property}/googleAdsLinks/{google_ads_link}"
+        ).format(property, google_ads_link)
 
     @staticmethod
     def parse_google_ads_link_path(path: str) -> Dict[str, str]:
         """Parses a google_ads_link path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/googleAdsLinks/(?P<google_ads_link>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/googleAdsLinks/{google_ads_link}"
+        ).parse(path)
 
     @staticmethod
     def google_signals_settings_path(
         property: str,
     ) -> str:
         """Returns a fully-qualified google_signals_settings string."""
-        return "properties/{property}/googleSignalsSettings".format(
-            property=property,
+        return resource_names.get("properties/{property}/googleSignalsSettings").format(
+            property
         )
 
     @staticmethod
     def parse_google_signals_settings_path(path: str) -> Dict[str, str]:
         """Parses a google_signals_settings path into its component segments."""
-        m = re.match(r"^properties/(?P<property>.+?)/googleSignalsSettings$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("properties/{property}/googleSignalsSettings").parse(
+            path
+        )
 
     @staticmethod
     def measurement_protocol_secret_path(
@@ -668,35 +619,28 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         measurement_protocol_secret: str,
     ) -> str:
         """Returns a fully-qualified measurement_protocol_secret string."""
-        return "properties/{property}/dataStreams/{data_stream}/measurementProtocolSecrets/{measurement_protocol_secret}".format(
-            property=property,
-            data_stream=data_stream,
-            measurement_protocol_secret=measurement_protocol_secret,
-        )
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/measurementProtocolSecrets/{measurement_protocol_secret}"
+        ).format(property, data_stream, measurement_protocol_secret)
 
     @staticmethod
     def parse_measurement_protocol_secret_path(path: str) -> Dict[str, str]:
         """Parses a measurement_protocol_secret path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/dataStreams/(?P<data_stream>.+?)/measurementProtocolSecrets/(?P<measurement_protocol_secret>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/measurementProtocolSecrets/{measurement_protocol_secret}"
+        ).parse(path)
 
     @staticmethod
     def property_path(
         property: str,
     ) -> str:
         """Returns a fully-qualified property string."""
-        return "properties/{property}".format(
-            property=property,
-        )
+        return resource_names.get("properties/{property}").format(property)
 
     @staticmethod
     def parse_property_path(path: str) -> Dict[str, str]:
         """Parses a property path into its component segments."""
-        m = re.match(r"^properties/(?P<property>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("properties/{property}").parse(path)
 
     @staticmethod
     def rollup_property_source_link_path(
@@ -704,19 +648,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         rollup_property_source_link: str,
     ) -> str:
         """Returns a fully-qualified rollup_property_source_link string."""
-        return "properties/{property}/rollupPropertySourceLinks/{rollup_property_source_link}".format(
-            property=property,
-            rollup_property_source_link=rollup_property_source_link,
-        )
+        return resource_names.get(
+            "properties/{property}/rollupPropertySourceLinks/{rollup_property_source_link}"
+        ).format(property, rollup_property_source_link)
 
     @staticmethod
     def parse_rollup_property_source_link_path(path: str) -> Dict[str, str]:
         """Parses a rollup_property_source_link path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/rollupPropertySourceLinks/(?P<rollup_property_source_link>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/rollupPropertySourceLinks/{rollup_property_source_link}"
+        ).parse(path)
 
     @staticmethod
     def search_ads360_link_path(
@@ -724,19 +665,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         search_ads_360_link: str,
     ) -> str:
         """Returns a fully-qualified search_ads360_link string."""
-        return "properties/{property}/searchAds360Links/{search_ads_360_link}".format(
-            property=property,
-            search_ads_360_link=search_ads_360_link,
-        )
+        return resource_names.get(
+            "properties/{property}/searchAds360Links/{search_ads_360_link}"
+        ).format(property, search_ads_360_link)
 
     @staticmethod
     def parse_search_ads360_link_path(path: str) -> Dict[str, str]:
         """Parses a search_ads360_link path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/searchAds360Links/(?P<search_ads_360_link>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/searchAds360Links/{search_ads_360_link}"
+        ).parse(path)
 
     @staticmethod
     def sk_ad_network_conversion_value_schema_path(
@@ -745,20 +683,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         skadnetwork_conversion_value_schema: str,
     ) -> str:
         """Returns a fully-qualified sk_ad_network_conversion_value_schema string."""
-        return "properties/{property}/dataStreams/{data_stream}/sKAdNetworkConversionValueSchema/{skadnetwork_conversion_value_schema}".format(
-            property=property,
-            data_stream=data_stream,
-            skadnetwork_conversion_value_schema=skadnetwork_conversion_value_schema,
-        )
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/sKAdNetworkConversionValueSchema/{skadnetwork_conversion_value_schema}"
+        ).format(property, data_stream, skadnetwork_conversion_value_schema)
 
     @staticmethod
     def parse_sk_ad_network_conversion_value_schema_path(path: str) -> Dict[str, str]:
         """Parses a sk_ad_network_conversion_value_schema path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/dataStreams/(?P<data_stream>.+?)/sKAdNetworkConversionValueSchema/(?P<skadnetwork_conversion_value_schema>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/sKAdNetworkConversionValueSchema/{skadnetwork_conversion_value_schema}"
+        ).parse(path)
 
     @staticmethod
     def subproperty_event_filter_path(
@@ -766,79 +700,66 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         sub_property_event_filter: str,
     ) -> str:
         """Returns a fully-qualified subproperty_event_filter string."""
-        return "properties/{property}/subpropertyEventFilters/{sub_property_event_filter}".format(
-            property=property,
-            sub_property_event_filter=sub_property_event_filter,
-        )
+        return resource_names.get(
+            "properties/{property}/subpropertyEventFilters/{sub_property_event_filter}"
+        ).format(property, sub_property_event_filter)
 
     @staticmethod
     def parse_subproperty_event_filter_path(path: str) -> Dict[str, str]:
         """Parses a subproperty_event_filter path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/subpropertyEventFilters/(?P<sub_property_event_filter>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/subpropertyEventFilters/{sub_property_event_filter}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -846,16 +767,14 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -25,6 +25,7 @@ from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.analytics.admin_helpers import forking, wrapping
 from google.analytics.admin_v1alpha import gapic_version as package_version
 from google.analytics.admin_v1alpha.types import channel_group as gaa_channel_group
 from google.analytics.admin_v1alpha.types import (
@@ -138,691 +139,715 @@ class AnalyticsAdminServiceTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.get_account: gapic_v1.method.wrap_method(
-                self.get_account,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_accounts: gapic_v1.method.wrap_method(
-                self.list_accounts,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.delete_account: gapic_v1.method.wrap_method(
-                self.delete_account,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_account: gapic_v1.method.wrap_method(
-                self.update_account,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.provision_account_ticket: gapic_v1.method.wrap_method(
-                self.provision_account_ticket,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_account_summaries: gapic_v1.method.wrap_method(
-                self.list_account_summaries,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_property: gapic_v1.method.wrap_method(
-                self.get_property,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_properties: gapic_v1.method.wrap_method(
-                self.list_properties,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_property: gapic_v1.method.wrap_method(
-                self.create_property,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.delete_property: gapic_v1.method.wrap_method(
-                self.delete_property,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_property: gapic_v1.method.wrap_method(
-                self.update_property,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_firebase_link: gapic_v1.method.wrap_method(
-                self.create_firebase_link,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.delete_firebase_link: gapic_v1.method.wrap_method(
-                self.delete_firebase_link,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_firebase_links: gapic_v1.method.wrap_method(
-                self.list_firebase_links,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_global_site_tag: gapic_v1.method.wrap_method(
-                self.get_global_site_tag,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_google_ads_link: gapic_v1.method.wrap_method(
-                self.create_google_ads_link,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_google_ads_link: gapic_v1.method.wrap_method(
-                self.update_google_ads_link,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.delete_google_ads_link: gapic_v1.method.wrap_method(
-                self.delete_google_ads_link,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_google_ads_links: gapic_v1.method.wrap_method(
-                self.list_google_ads_links,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_data_sharing_settings: gapic_v1.method.wrap_method(
-                self.get_data_sharing_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_measurement_protocol_secret: gapic_v1.method.wrap_method(
-                self.get_measurement_protocol_secret,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_measurement_protocol_secrets: gapic_v1.method.wrap_method(
-                self.list_measurement_protocol_secrets,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_measurement_protocol_secret: gapic_v1.method.wrap_method(
-                self.create_measurement_protocol_secret,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_measurement_protocol_secret: gapic_v1.method.wrap_method(
-                self.delete_measurement_protocol_secret,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_measurement_protocol_secret: gapic_v1.method.wrap_method(
-                self.update_measurement_protocol_secret,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.acknowledge_user_data_collection: gapic_v1.method.wrap_method(
-                self.acknowledge_user_data_collection,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_sk_ad_network_conversion_value_schema: gapic_v1.method.wrap_method(
-                self.get_sk_ad_network_conversion_value_schema,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_sk_ad_network_conversion_value_schema: gapic_v1.method.wrap_method(
-                self.create_sk_ad_network_conversion_value_schema,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_sk_ad_network_conversion_value_schema: gapic_v1.method.wrap_method(
-                self.delete_sk_ad_network_conversion_value_schema,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_sk_ad_network_conversion_value_schema: gapic_v1.method.wrap_method(
-                self.update_sk_ad_network_conversion_value_schema,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_sk_ad_network_conversion_value_schemas: gapic_v1.method.wrap_method(
-                self.list_sk_ad_network_conversion_value_schemas,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.search_change_history_events: gapic_v1.method.wrap_method(
-                self.search_change_history_events,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_google_signals_settings: gapic_v1.method.wrap_method(
-                self.get_google_signals_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_google_signals_settings: gapic_v1.method.wrap_method(
-                self.update_google_signals_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_conversion_event: gapic_v1.method.wrap_method(
-                self.create_conversion_event,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_conversion_event: gapic_v1.method.wrap_method(
-                self.update_conversion_event,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_conversion_event: gapic_v1.method.wrap_method(
-                self.get_conversion_event,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_conversion_event: gapic_v1.method.wrap_method(
-                self.delete_conversion_event,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_conversion_events: gapic_v1.method.wrap_method(
-                self.list_conversion_events,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_display_video360_advertiser_link: gapic_v1.method.wrap_method(
-                self.get_display_video360_advertiser_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_display_video360_advertiser_links: gapic_v1.method.wrap_method(
-                self.list_display_video360_advertiser_links,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_display_video360_advertiser_link: gapic_v1.method.wrap_method(
-                self.create_display_video360_advertiser_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_display_video360_advertiser_link: gapic_v1.method.wrap_method(
-                self.delete_display_video360_advertiser_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_display_video360_advertiser_link: gapic_v1.method.wrap_method(
-                self.update_display_video360_advertiser_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_display_video360_advertiser_link_proposal: gapic_v1.method.wrap_method(
-                self.get_display_video360_advertiser_link_proposal,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_display_video360_advertiser_link_proposals: gapic_v1.method.wrap_method(
-                self.list_display_video360_advertiser_link_proposals,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_display_video360_advertiser_link_proposal: gapic_v1.method.wrap_method(
-                self.create_display_video360_advertiser_link_proposal,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_display_video360_advertiser_link_proposal: gapic_v1.method.wrap_method(
-                self.delete_display_video360_advertiser_link_proposal,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.approve_display_video360_advertiser_link_proposal: gapic_v1.method.wrap_method(
-                self.approve_display_video360_advertiser_link_proposal,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.cancel_display_video360_advertiser_link_proposal: gapic_v1.method.wrap_method(
-                self.cancel_display_video360_advertiser_link_proposal,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_custom_dimension: gapic_v1.method.wrap_method(
-                self.create_custom_dimension,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_custom_dimension: gapic_v1.method.wrap_method(
-                self.update_custom_dimension,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_custom_dimensions: gapic_v1.method.wrap_method(
-                self.list_custom_dimensions,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.archive_custom_dimension: gapic_v1.method.wrap_method(
-                self.archive_custom_dimension,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_custom_dimension: gapic_v1.method.wrap_method(
-                self.get_custom_dimension,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_custom_metric: gapic_v1.method.wrap_method(
-                self.create_custom_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_custom_metric: gapic_v1.method.wrap_method(
-                self.update_custom_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_custom_metrics: gapic_v1.method.wrap_method(
-                self.list_custom_metrics,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.archive_custom_metric: gapic_v1.method.wrap_method(
-                self.archive_custom_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_custom_metric: gapic_v1.method.wrap_method(
-                self.get_custom_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_data_retention_settings: gapic_v1.method.wrap_method(
-                self.get_data_retention_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_data_retention_settings: gapic_v1.method.wrap_method(
-                self.update_data_retention_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_data_stream: gapic_v1.method.wrap_method(
-                self.create_data_stream,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_data_stream: gapic_v1.method.wrap_method(
-                self.delete_data_stream,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_data_stream: gapic_v1.method.wrap_method(
-                self.update_data_stream,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_data_streams: gapic_v1.method.wrap_method(
-                self.list_data_streams,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_data_stream: gapic_v1.method.wrap_method(
-                self.get_data_stream,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_audience: gapic_v1.method.wrap_method(
-                self.get_audience,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_audiences: gapic_v1.method.wrap_method(
-                self.list_audiences,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_audience: gapic_v1.method.wrap_method(
-                self.create_audience,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_audience: gapic_v1.method.wrap_method(
-                self.update_audience,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.archive_audience: gapic_v1.method.wrap_method(
-                self.archive_audience,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_search_ads360_link: gapic_v1.method.wrap_method(
-                self.get_search_ads360_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_search_ads360_links: gapic_v1.method.wrap_method(
-                self.list_search_ads360_links,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_search_ads360_link: gapic_v1.method.wrap_method(
-                self.create_search_ads360_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_search_ads360_link: gapic_v1.method.wrap_method(
-                self.delete_search_ads360_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_search_ads360_link: gapic_v1.method.wrap_method(
-                self.update_search_ads360_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_attribution_settings: gapic_v1.method.wrap_method(
-                self.get_attribution_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_attribution_settings: gapic_v1.method.wrap_method(
-                self.update_attribution_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.run_access_report: gapic_v1.method.wrap_method(
-                self.run_access_report,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_access_binding: gapic_v1.method.wrap_method(
-                self.create_access_binding,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_access_binding: gapic_v1.method.wrap_method(
-                self.get_access_binding,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_access_binding: gapic_v1.method.wrap_method(
-                self.update_access_binding,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_access_binding: gapic_v1.method.wrap_method(
-                self.delete_access_binding,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_access_bindings: gapic_v1.method.wrap_method(
-                self.list_access_bindings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.batch_create_access_bindings: gapic_v1.method.wrap_method(
-                self.batch_create_access_bindings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.batch_get_access_bindings: gapic_v1.method.wrap_method(
-                self.batch_get_access_bindings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.batch_update_access_bindings: gapic_v1.method.wrap_method(
-                self.batch_update_access_bindings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.batch_delete_access_bindings: gapic_v1.method.wrap_method(
-                self.batch_delete_access_bindings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_expanded_data_set: gapic_v1.method.wrap_method(
-                self.get_expanded_data_set,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_expanded_data_sets: gapic_v1.method.wrap_method(
-                self.list_expanded_data_sets,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_expanded_data_set: gapic_v1.method.wrap_method(
-                self.create_expanded_data_set,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_expanded_data_set: gapic_v1.method.wrap_method(
-                self.update_expanded_data_set,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_expanded_data_set: gapic_v1.method.wrap_method(
-                self.delete_expanded_data_set,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_channel_group: gapic_v1.method.wrap_method(
-                self.get_channel_group,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_channel_groups: gapic_v1.method.wrap_method(
-                self.list_channel_groups,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_channel_group: gapic_v1.method.wrap_method(
-                self.create_channel_group,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_channel_group: gapic_v1.method.wrap_method(
-                self.update_channel_group,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_channel_group: gapic_v1.method.wrap_method(
-                self.delete_channel_group,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_automated_ga4_configuration_opt_out: gapic_v1.method.wrap_method(
-                self.set_automated_ga4_configuration_opt_out,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.fetch_automated_ga4_configuration_opt_out: gapic_v1.method.wrap_method(
-                self.fetch_automated_ga4_configuration_opt_out,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_big_query_link: gapic_v1.method.wrap_method(
-                self.get_big_query_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_big_query_links: gapic_v1.method.wrap_method(
-                self.list_big_query_links,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_enhanced_measurement_settings: gapic_v1.method.wrap_method(
-                self.get_enhanced_measurement_settings,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_enhanced_measurement_settings: gapic_v1.method.wrap_method(
-                self.update_enhanced_measurement_settings,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_connected_site_tag: gapic_v1.method.wrap_method(
-                self.create_connected_site_tag,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_connected_site_tag: gapic_v1.method.wrap_method(
-                self.delete_connected_site_tag,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_connected_site_tags: gapic_v1.method.wrap_method(
-                self.list_connected_site_tags,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.fetch_connected_ga4_property: gapic_v1.method.wrap_method(
-                self.fetch_connected_ga4_property,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_ad_sense_link: gapic_v1.method.wrap_method(
-                self.get_ad_sense_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_ad_sense_link: gapic_v1.method.wrap_method(
-                self.create_ad_sense_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_ad_sense_link: gapic_v1.method.wrap_method(
-                self.delete_ad_sense_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_ad_sense_links: gapic_v1.method.wrap_method(
-                self.list_ad_sense_links,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_event_create_rule: gapic_v1.method.wrap_method(
-                self.get_event_create_rule,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_event_create_rules: gapic_v1.method.wrap_method(
-                self.list_event_create_rules,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_event_create_rule: gapic_v1.method.wrap_method(
-                self.create_event_create_rule,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_event_create_rule: gapic_v1.method.wrap_method(
-                self.update_event_create_rule,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_event_create_rule: gapic_v1.method.wrap_method(
-                self.delete_event_create_rule,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_data_redaction_settings: gapic_v1.method.wrap_method(
-                self.update_data_redaction_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_data_redaction_settings: gapic_v1.method.wrap_method(
-                self.get_data_redaction_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_calculated_metric: gapic_v1.method.wrap_method(
-                self.get_calculated_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_calculated_metric: gapic_v1.method.wrap_method(
-                self.create_calculated_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_calculated_metrics: gapic_v1.method.wrap_method(
-                self.list_calculated_metrics,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_calculated_metric: gapic_v1.method.wrap_method(
-                self.update_calculated_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_calculated_metric: gapic_v1.method.wrap_method(
-                self.delete_calculated_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_rollup_property: gapic_v1.method.wrap_method(
-                self.create_rollup_property,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_rollup_property_source_link: gapic_v1.method.wrap_method(
-                self.get_rollup_property_source_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_rollup_property_source_links: gapic_v1.method.wrap_method(
-                self.list_rollup_property_source_links,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_rollup_property_source_link: gapic_v1.method.wrap_method(
-                self.create_rollup_property_source_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_rollup_property_source_link: gapic_v1.method.wrap_method(
-                self.delete_rollup_property_source_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_subproperty: gapic_v1.method.wrap_method(
-                self.create_subproperty,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_subproperty_event_filter: gapic_v1.method.wrap_method(
-                self.create_subproperty_event_filter,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_subproperty_event_filter: gapic_v1.method.wrap_method(
-                self.get_subproperty_event_filter,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_subproperty_event_filters: gapic_v1.method.wrap_method(
-                self.list_subproperty_event_filters,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_subproperty_event_filter: gapic_v1.method.wrap_method(
-                self.update_subproperty_event_filter,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_subproperty_event_filter: gapic_v1.method.wrap_method(
-                self.delete_subproperty_event_filter,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "get_account": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "list_accounts": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "delete_account": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "update_account": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "provision_account_ticket": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "list_account_summaries": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_property": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "list_properties": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "create_property": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "delete_property": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "update_property": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "create_firebase_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "delete_firebase_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "list_firebase_links": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "get_global_site_tag": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "create_google_ads_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "update_google_ads_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "delete_google_ads_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "list_google_ads_links": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "get_data_sharing_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_measurement_protocol_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_measurement_protocol_secrets": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_measurement_protocol_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_measurement_protocol_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_measurement_protocol_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "acknowledge_user_data_collection": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_sk_ad_network_conversion_value_schema": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_sk_ad_network_conversion_value_schema": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_sk_ad_network_conversion_value_schema": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_sk_ad_network_conversion_value_schema": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_sk_ad_network_conversion_value_schemas": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "search_change_history_events": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_google_signals_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_google_signals_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_conversion_event": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_conversion_event": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_conversion_event": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_conversion_event": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_conversion_events": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_display_video360_advertiser_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_display_video360_advertiser_links": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_display_video360_advertiser_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_display_video360_advertiser_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_display_video360_advertiser_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_display_video360_advertiser_link_proposal": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_display_video360_advertiser_link_proposals": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_display_video360_advertiser_link_proposal": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_display_video360_advertiser_link_proposal": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "approve_display_video360_advertiser_link_proposal": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "cancel_display_video360_advertiser_link_proposal": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_custom_dimension": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_custom_dimension": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_custom_dimensions": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "archive_custom_dimension": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_custom_dimension": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_custom_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_custom_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_custom_metrics": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "archive_custom_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_custom_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_data_retention_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_data_retention_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_data_stream": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_data_stream": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_data_stream": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_data_streams": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_data_stream": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_audience": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_audiences": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_audience": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_audience": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "archive_audience": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_search_ads360_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_search_ads360_links": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_search_ads360_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_search_ads360_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_search_ads360_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_attribution_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_attribution_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "run_access_report": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_access_binding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_access_binding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_access_binding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_access_binding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_access_bindings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "batch_create_access_bindings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "batch_get_access_bindings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "batch_update_access_bindings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "batch_delete_access_bindings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_expanded_data_set": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_expanded_data_sets": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_expanded_data_set": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_expanded_data_set": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_expanded_data_set": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_channel_group": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_channel_groups": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_channel_group": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_channel_group": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_channel_group": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_automated_ga4_configuration_opt_out": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "fetch_automated_ga4_configuration_opt_out": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_big_query_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_big_query_links": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_enhanced_measurement_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "update_enhanced_measurement_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "create_connected_site_tag": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_connected_site_tag": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_connected_site_tags": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "fetch_connected_ga4_property": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_ad_sense_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_ad_sense_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_ad_sense_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_ad_sense_links": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_event_create_rule": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_event_create_rules": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_event_create_rule": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_event_create_rule": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_event_create_rule": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_data_redaction_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_data_redaction_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_calculated_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_calculated_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_calculated_metrics": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_calculated_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_calculated_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_rollup_property": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_rollup_property_source_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_rollup_property_source_links": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_rollup_property_source_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_rollup_property_source_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_subproperty": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_subproperty_event_filter": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_subproperty_event_filter": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_subproperty_event_filters": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_subproperty_event_filter": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_subproperty_event_filter": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
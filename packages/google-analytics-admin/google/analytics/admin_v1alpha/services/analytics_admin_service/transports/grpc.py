@@ -172,21 +172,28 @@ class AnalyticsAdminServiceGrpcTransport(AnalyticsAdminServiceTransport):
         )
 
         if not self._grpc_channel:
-            self._grpc_channel = type(self).create_channel(
-                self._host,
-                # use the credentials which are saved
-                credentials=self._credentials,
-                # Set ``credentials_file`` to ``None`` here as
-                # the credentials that we saved earlier should be used.
-                credentials_file=None,
-                scopes=self._scopes,
-                ssl_credentials=self._ssl_channel_credentials,
-                quota_project_id=quota_project_id,
-                options=[
-                    ("grpc.max_send_message_length", -1),
-                    ("grpc.max_receive_message_length", -1),
-                ],
-            )
+
+            def connect():
+                self._grpc_channel = type(self).create_channel(
+                    self._host,
+                    # use the credentials which are saved
+                    credentials=self._credentials,
+                    # Set ``credentials_file`` to ``None`` here as
+                    # the credentials that we saved earlier should be used.
+                    credentials_file=None,
+                    scopes=self._scopes,
+                    ssl_credentials=self._ssl_channel_credentials,
+                    quota_project_id=quota_project_id,
+                    options=[
+                        ("grpc.max_send_message_length", -1),
+                        ("grpc.max_receive_message_length", -1),
+                    ],
+                )
+                self._stubs.clear()
+
+            # Run again on the first call in a forked child.
+            self._connect = connect
+            connect()
 
         # Wrap messages. This must be done after self._grpc_channel exists
         self._prep_wrapped_messages(client_info)
@@ -17,10 +17,10 @@
 import dataclasses
 import json  # type: ignore
 import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 import warnings
 
-from google.api_core import gapic_v1, path_template, rest_helpers, rest_streaming
+from google.api_core import gapic_v1, rest_helpers, rest_streaming
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
@@ -38,6 +38,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.analytics.admin_helpers import http_pool, rest_encoding, transcoding
 from google.analytics.admin_v1alpha.types import channel_group as gaa_channel_group
 from google.analytics.admin_v1alpha.types import (
     expanded_data_set as gaa_expanded_data_set,
@@ -4121,6 +4122,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         url_scheme: str = "https",
         interceptor: Optional[AnalyticsAdminServiceRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -4153,6 +4155,10 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            http_pool_options (Optional[google.analytics.admin_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -4175,11 +4181,19 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or AnalyticsAdminServiceRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -4197,6 +4211,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{property=properties/*}:acknowledgeUserDataCollection",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.AcknowledgeUserDataCollectionRequest,
@@ -4225,20 +4249,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{property=properties/*}:acknowledgeUserDataCollection",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_acknowledge_user_data_collection(
                 request, metadata
             )
             pb_request = analytics_admin.AcknowledgeUserDataCollectionRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -4250,17 +4267,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4269,7 +4282,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -4300,6 +4313,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinkProposals/*}:approve",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ApproveDisplayVideo360AdvertiserLinkProposalRequest,
@@ -4330,13 +4353,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinkProposals/*}:approve",
-                    "body": "*",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -4348,7 +4364,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -4360,17 +4376,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4379,7 +4391,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -4418,6 +4430,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{name=properties/*/audiences/*}:archive",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ArchiveAudienceRequest,
@@ -4439,18 +4461,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{name=properties/*/audiences/*}:archive",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_archive_audience(
                 request, metadata
             )
             pb_request = analytics_admin.ArchiveAudienceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -4462,17 +4477,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4481,7 +4492,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -4504,6 +4515,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{name=properties/*/customDimensions/*}:archive",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ArchiveCustomDimensionRequest,
@@ -4525,18 +4546,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{name=properties/*/customDimensions/*}:archive",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_archive_custom_dimension(
                 request, metadata
             )
             pb_request = analytics_admin.ArchiveCustomDimensionRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -4548,17 +4562,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4567,7 +4577,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -4590,6 +4600,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{name=properties/*/customMetrics/*}:archive",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ArchiveCustomMetricRequest,
@@ -4611,18 +4631,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{name=properties/*/customMetrics/*}:archive",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_archive_custom_metric(
                 request, metadata
             )
             pb_request = analytics_admin.ArchiveCustomMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -4634,17 +4647,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4653,7 +4662,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -4676,6 +4685,21 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings:batchCreate",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/accessBindings:batchCreate",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.BatchCreateAccessBindingsRequest,
@@ -4704,23 +4728,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings:batchCreate",
-                    "body": "*",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/accessBindings:batchCreate",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_batch_create_access_bindings(
                 request, metadata
             )
             pb_request = analytics_admin.BatchCreateAccessBindingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -4732,17 +4744,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4751,7 +4759,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -4782,6 +4790,21 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings:batchDelete",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/accessBindings:batchDelete",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.BatchDeleteAccessBindingsRequest,
@@ -4804,23 +4827,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                         sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings:batchDelete",
-                    "body": "*",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/accessBindings:batchDelete",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_batch_delete_access_bindings(
                 request, metadata
             )
             pb_request = analytics_admin.BatchDeleteAccessBindingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -4832,17 +4843,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4851,7 +4858,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -4876,6 +4883,19 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings:batchGet",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/accessBindings:batchGet",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.BatchGetAccessBindingsRequest,
@@ -4903,36 +4923,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings:batchGet",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/accessBindings:batchGet",
-                },
-            ]
             request, metadata = self._interceptor.pre_batch_get_access_bindings(
                 request, metadata
             )
             pb_request = analytics_admin.BatchGetAccessBindingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4941,7 +4947,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4971,6 +4977,21 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings:batchUpdate",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/accessBindings:batchUpdate",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.BatchUpdateAccessBindingsRequest,
@@ -4999,23 +5020,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings:batchUpdate",
-                    "body": "*",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/accessBindings:batchUpdate",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_batch_update_access_bindings(
                 request, metadata
             )
             pb_request = analytics_admin.BatchUpdateAccessBindingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5027,17 +5036,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5046,7 +5051,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5077,6 +5082,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinkProposals/*}:cancel",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CancelDisplayVideo360AdvertiserLinkProposalRequest,
@@ -5114,13 +5129,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinkProposals/*}:cancel",
-                    "body": "*",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -5132,7 +5140,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5144,17 +5152,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5163,7 +5167,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5198,6 +5202,21 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings",
+                    "body": "access_binding",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/accessBindings",
+                    "body": "access_binding",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateAccessBindingRequest,
@@ -5225,23 +5244,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings",
-                    "body": "access_binding",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/accessBindings",
-                    "body": "access_binding",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_access_binding(
                 request, metadata
             )
             pb_request = analytics_admin.CreateAccessBindingRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5253,17 +5260,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5272,7 +5275,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5303,6 +5306,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/adSenseLinks",
+                    "body": "adsense_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateAdSenseLinkRequest,
@@ -5330,18 +5343,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/adSenseLinks",
-                    "body": "adsense_link",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_ad_sense_link(
                 request, metadata
             )
             pb_request = analytics_admin.CreateAdSenseLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5353,17 +5359,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5372,7 +5374,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5403,6 +5405,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/audiences",
+                    "body": "audience",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateAudienceRequest,
@@ -5430,16 +5442,9 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/audiences",
-                    "body": "audience",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_audience(request, metadata)
             pb_request = analytics_admin.CreateAudienceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5451,17 +5456,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5470,7 +5471,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5503,6 +5504,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/calculatedMetrics",
+                    "body": "calculated_metric",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateCalculatedMetricRequest,
@@ -5528,18 +5539,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a calculated metric.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/calculatedMetrics",
-                    "body": "calculated_metric",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_calculated_metric(
                 request, metadata
             )
             pb_request = analytics_admin.CreateCalculatedMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5551,17 +5555,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5570,7 +5570,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5601,6 +5601,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/channelGroups",
+                    "body": "channel_group",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateChannelGroupRequest,
@@ -5628,18 +5638,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/channelGroups",
-                    "body": "channel_group",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_channel_group(
                 request, metadata
             )
             pb_request = analytics_admin.CreateChannelGroupRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5651,17 +5654,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5670,7 +5669,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5701,6 +5700,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/properties:createConnectedSiteTag",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateConnectedSiteTagRequest,
@@ -5728,18 +5737,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/properties:createConnectedSiteTag",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_connected_site_tag(
                 request, metadata
             )
             pb_request = analytics_admin.CreateConnectedSiteTagRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5751,17 +5753,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5770,7 +5768,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5801,6 +5799,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/conversionEvents",
+                    "body": "conversion_event",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateConversionEventRequest,
@@ -5828,18 +5836,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/conversionEvents",
-                    "body": "conversion_event",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_conversion_event(
                 request, metadata
             )
             pb_request = analytics_admin.CreateConversionEventRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5851,17 +5852,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5870,7 +5867,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5901,6 +5898,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/customDimensions",
+                    "body": "custom_dimension",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateCustomDimensionRequest,
@@ -5926,18 +5933,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a CustomDimension.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/customDimensions",
-                    "body": "custom_dimension",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_custom_dimension(
                 request, metadata
             )
             pb_request = analytics_admin.CreateCustomDimensionRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5949,17 +5949,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5968,7 +5964,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5999,6 +5995,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/customMetrics",
+                    "body": "custom_metric",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateCustomMetricRequest,
@@ -6024,18 +6030,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a custom metric.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/customMetrics",
-                    "body": "custom_metric",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_custom_metric(
                 request, metadata
             )
             pb_request = analytics_admin.CreateCustomMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6047,17 +6046,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -6066,7 +6061,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -6097,6 +6092,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/dataStreams",
+                    "body": "data_stream",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateDataStreamRequest,
@@ -6124,18 +6129,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/dataStreams",
-                    "body": "data_stream",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_data_stream(
                 request, metadata
             )
             pb_request = analytics_admin.CreateDataStreamRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6147,17 +6145,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -6166,7 +6160,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -6197,6 +6191,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/displayVideo360AdvertiserLinks",
+                    "body": "display_video_360_advertiser_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateDisplayVideo360AdvertiserLinkRequest,
@@ -6225,13 +6229,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/displayVideo360AdvertiserLinks",
-                    "body": "display_video_360_advertiser_link",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -6241,7 +6238,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.CreateDisplayVideo360AdvertiserLinkRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6253,17 +6250,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -6272,7 +6265,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -6303,6 +6296,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/displayVideo360AdvertiserLinkProposals",
+                    "body": "display_video_360_advertiser_link_proposal",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateDisplayVideo360AdvertiserLinkProposalRequest,
@@ -6340,13 +6343,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/displayVideo360AdvertiserLinkProposals",
-                    "body": "display_video_360_advertiser_link_proposal",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -6358,7 +6354,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6370,17 +6366,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -6389,7 +6381,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -6424,6 +6416,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/eventCreateRules",
+                    "body": "event_create_rule",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateEventCreateRuleRequest,
@@ -6463,18 +6465,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/eventCreateRules",
-                    "body": "event_create_rule",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_event_create_rule(
                 request, metadata
             )
             pb_request = analytics_admin.CreateEventCreateRuleRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6486,17 +6481,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -6505,7 +6496,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -6536,6 +6527,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/expandedDataSets",
+                    "body": "expanded_data_set",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateExpandedDataSetRequest,
@@ -6563,18 +6564,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/expandedDataSets",
-                    "body": "expanded_data_set",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_expanded_data_set(
                 request, metadata
             )
             pb_request = analytics_admin.CreateExpandedDataSetRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6586,17 +6580,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -6605,7 +6595,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -6636,6 +6626,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/firebaseLinks",
+                    "body": "firebase_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateFirebaseLinkRequest,
@@ -6663,18 +6663,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/firebaseLinks",
-                    "body": "firebase_link",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_firebase_link(
                 request, metadata
             )
             pb_request = analytics_admin.CreateFirebaseLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6686,17 +6679,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -6705,7 +6694,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -6736,6 +6725,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/googleAdsLinks",
+                    "body": "google_ads_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateGoogleAdsLinkRequest,
@@ -6763,18 +6762,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/googleAdsLinks",
-                    "body": "google_ads_link",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_google_ads_link(
                 request, metadata
             )
             pb_request = analytics_admin.CreateGoogleAdsLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6786,17 +6778,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -6805,7 +6793,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -6836,6 +6824,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/measurementProtocolSecrets",
+                    "body": "measurement_protocol_secret",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateMeasurementProtocolSecretRequest,
@@ -6864,13 +6862,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/measurementProtocolSecrets",
-                    "body": "measurement_protocol_secret",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -6880,7 +6871,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.CreateMeasurementProtocolSecretRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6892,17 +6883,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -6911,7 +6898,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -6942,6 +6929,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/properties",
+                    "body": "property",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreatePropertyRequest,
@@ -6969,16 +6966,9 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/properties",
-                    "body": "property",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_property(request, metadata)
             pb_request = analytics_admin.CreatePropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6990,17 +6980,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7009,7 +6995,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -7040,6 +7026,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/properties:createRollupProperty",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateRollupPropertyRequest,
@@ -7067,18 +7063,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/properties:createRollupProperty",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_rollup_property(
                 request, metadata
             )
             pb_request = analytics_admin.CreateRollupPropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -7090,17 +7079,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7109,7 +7094,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -7140,6 +7125,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/rollupPropertySourceLinks",
+                    "body": "rollup_property_source_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateRollupPropertySourceLinkRequest,
@@ -7169,13 +7164,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/rollupPropertySourceLinks",
-                    "body": "rollup_property_source_link",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -7185,7 +7173,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.CreateRollupPropertySourceLinkRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -7197,17 +7185,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7216,7 +7200,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -7247,6 +7231,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/searchAds360Links",
+                    "body": "search_ads_360_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateSearchAds360LinkRequest,
@@ -7274,18 +7268,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/searchAds360Links",
-                    "body": "search_ads_360_link",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_search_ads360_link(
                 request, metadata
             )
             pb_request = analytics_admin.CreateSearchAds360LinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -7297,17 +7284,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7316,7 +7299,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -7347,6 +7330,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/sKAdNetworkConversionValueSchema",
+                    "body": "skadnetwork_conversion_value_schema",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateSKAdNetworkConversionValueSchemaRequest,
@@ -7376,13 +7369,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/sKAdNetworkConversionValueSchema",
-                    "body": "skadnetwork_conversion_value_schema",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -7394,7 +7380,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -7406,17 +7392,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7425,7 +7407,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -7458,6 +7440,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/properties:createSubproperty",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateSubpropertyRequest,
@@ -7485,18 +7477,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/properties:createSubproperty",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_subproperty(
                 request, metadata
             )
             pb_request = analytics_admin.CreateSubpropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -7508,17 +7493,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7527,7 +7508,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -7558,6 +7539,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{parent=properties/*}/subpropertyEventFilters",
+                    "body": "subproperty_event_filter",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateSubpropertyEventFilterRequest,
@@ -7586,18 +7577,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{parent=properties/*}/subpropertyEventFilters",
-                    "body": "subproperty_event_filter",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_subproperty_event_filter(
                 request, metadata
             )
             pb_request = analytics_admin.CreateSubpropertyEventFilterRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -7609,17 +7593,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7628,7 +7608,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -7659,6 +7639,19 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=accounts/*/accessBindings/*}",
+                },
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/accessBindings/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteAccessBindingRequest,
@@ -7680,36 +7673,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=accounts/*/accessBindings/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/accessBindings/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_access_binding(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteAccessBindingRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7718,7 +7697,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -7740,6 +7719,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=accounts/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteAccountRequest,
@@ -7761,30 +7749,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=accounts/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_account(request, metadata)
             pb_request = analytics_admin.DeleteAccountRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7793,7 +7771,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -7815,6 +7793,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/adSenseLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteAdSenseLinkRequest,
@@ -7836,32 +7823,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/adSenseLinks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_ad_sense_link(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteAdSenseLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7870,7 +7847,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -7892,6 +7869,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/calculatedMetrics/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteCalculatedMetricRequest,
@@ -7913,32 +7899,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/calculatedMetrics/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_calculated_metric(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteCalculatedMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -7947,7 +7923,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -7969,6 +7945,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/channelGroups/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteChannelGroupRequest,
@@ -7990,32 +7975,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/channelGroups/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_channel_group(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteChannelGroupRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8024,7 +7999,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8036,6 +8011,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         def __hash__(self):
             return hash("DeleteConnectedSiteTag")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/properties:deleteConnectedSiteTag",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteConnectedSiteTagRequest,
@@ -8057,18 +8042,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/properties:deleteConnectedSiteTag",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_connected_site_tag(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteConnectedSiteTagRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -8080,16 +8058,12 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8098,7 +8072,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -8121,6 +8095,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/conversionEvents/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteConversionEventRequest,
@@ -8142,32 +8125,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/conversionEvents/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_conversion_event(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteConversionEventRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8176,7 +8149,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8198,6 +8171,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteDataStreamRequest,
@@ -8219,32 +8201,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_data_stream(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteDataStreamRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8253,7 +8225,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8275,6 +8247,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteDisplayVideo360AdvertiserLinkRequest,
@@ -8297,12 +8278,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                         sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinks/*}",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -8312,22 +8287,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.DeleteDisplayVideo360AdvertiserLinkRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8336,7 +8307,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8358,6 +8329,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinkProposals/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteDisplayVideo360AdvertiserLinkProposalRequest,
@@ -8381,12 +8361,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                         sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinkProposals/*}",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -8398,22 +8372,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8422,7 +8392,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8444,6 +8414,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/eventCreateRules/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteEventCreateRuleRequest,
@@ -8465,32 +8444,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/eventCreateRules/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_event_create_rule(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteEventCreateRuleRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8499,7 +8468,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8521,6 +8490,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/expandedDataSets/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteExpandedDataSetRequest,
@@ -8542,32 +8520,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/expandedDataSets/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_expanded_data_set(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteExpandedDataSetRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8576,7 +8544,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8598,6 +8566,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/firebaseLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteFirebaseLinkRequest,
@@ -8619,32 +8596,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/firebaseLinks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_firebase_link(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteFirebaseLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8653,7 +8620,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8675,6 +8642,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/googleAdsLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteGoogleAdsLinkRequest,
@@ -8696,32 +8672,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/googleAdsLinks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_google_ads_link(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteGoogleAdsLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8730,7 +8696,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8752,6 +8718,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteMeasurementProtocolSecretRequest,
@@ -8774,12 +8749,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                         sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -8789,22 +8758,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.DeleteMeasurementProtocolSecretRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8813,7 +8778,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8835,6 +8800,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeletePropertyRequest,
@@ -8862,30 +8836,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_property(request, metadata)
             pb_request = analytics_admin.DeletePropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8894,7 +8858,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -8924,6 +8888,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/rollupPropertySourceLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteRollupPropertySourceLinkRequest,
@@ -8946,12 +8919,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                         sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/rollupPropertySourceLinks/*}",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -8961,22 +8928,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.DeleteRollupPropertySourceLinkRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -8985,7 +8948,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9007,6 +8970,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/searchAds360Links/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteSearchAds360LinkRequest,
@@ -9028,32 +9000,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/searchAds360Links/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_search_ads360_link(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteSearchAds360LinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9062,7 +9024,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9084,6 +9046,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/sKAdNetworkConversionValueSchema/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteSKAdNetworkConversionValueSchemaRequest,
@@ -9107,12 +9078,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                         sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/sKAdNetworkConversionValueSchema/*}",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -9124,22 +9089,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9148,7 +9109,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9170,6 +9131,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1alpha/{name=properties/*/subpropertyEventFilters/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteSubpropertyEventFilterRequest,
@@ -9192,32 +9162,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                         sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1alpha/{name=properties/*/subpropertyEventFilters/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_subproperty_event_filter(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteSubpropertyEventFilterRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9226,7 +9186,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9248,6 +9208,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/properties:fetchAutomatedGa4ConfigurationOptOut",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.FetchAutomatedGa4ConfigurationOptOutRequest,
@@ -9278,13 +9248,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/properties:fetchAutomatedGa4ConfigurationOptOut",
-                    "body": "*",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -9294,7 +9257,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.FetchAutomatedGa4ConfigurationOptOutRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -9306,17 +9269,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9325,7 +9284,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -9362,6 +9321,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/properties:fetchConnectedGa4Property",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.FetchConnectedGa4PropertyRequest,
@@ -9390,32 +9358,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/properties:fetchConnectedGa4Property",
-                },
-            ]
             request, metadata = self._interceptor.pre_fetch_connected_ga4_property(
                 request, metadata
             )
             pb_request = analytics_admin.FetchConnectedGa4PropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9424,7 +9382,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9454,6 +9412,19 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=accounts/*/accessBindings/*}",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/accessBindings/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetAccessBindingRequest,
@@ -9481,36 +9452,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=accounts/*/accessBindings/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/accessBindings/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_access_binding(
                 request, metadata
             )
             pb_request = analytics_admin.GetAccessBindingRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9519,7 +9476,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9549,6 +9506,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=accounts/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetAccountRequest,
@@ -9575,30 +9541,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=accounts/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_account(request, metadata)
             pb_request = analytics_admin.GetAccountRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9607,7 +9563,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9637,6 +9593,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/adSenseLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetAdSenseLinkRequest,
@@ -9664,32 +9629,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/adSenseLinks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_ad_sense_link(
                 request, metadata
             )
             pb_request = analytics_admin.GetAdSenseLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9698,7 +9653,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9728,6 +9683,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/attributionSettings}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetAttributionSettingsRequest,
@@ -9756,32 +9720,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/attributionSettings}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_attribution_settings(
                 request, metadata
             )
             pb_request = analytics_admin.GetAttributionSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9790,7 +9744,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9820,6 +9774,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/audiences/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetAudienceRequest,
@@ -9846,30 +9809,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/audiences/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_audience(request, metadata)
             pb_request = analytics_admin.GetAudienceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9878,7 +9831,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9908,6 +9861,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/bigQueryLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetBigQueryLinkRequest,
@@ -9935,32 +9897,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/bigQueryLinks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_big_query_link(
                 request, metadata
             )
             pb_request = analytics_admin.GetBigQueryLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -9969,7 +9921,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -9999,6 +9951,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/calculatedMetrics/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetCalculatedMetricRequest,
@@ -10024,32 +9985,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a calculated metric.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/calculatedMetrics/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_calculated_metric(
                 request, metadata
             )
             pb_request = analytics_admin.GetCalculatedMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10058,7 +10009,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -10088,6 +10039,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/channelGroups/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetChannelGroupRequest,
@@ -10112,35 +10072,25 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 ~.channel_group.ChannelGroup:
                     A resource message representing a
                 Channel Group.
-
-            """
-
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/channelGroups/*}",
-                },
-            ]
+
+            """
+
             request, metadata = self._interceptor.pre_get_channel_group(
                 request, metadata
             )
             pb_request = analytics_admin.GetChannelGroupRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10149,7 +10099,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -10179,6 +10129,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/conversionEvents/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetConversionEventRequest,
@@ -10206,32 +10165,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/conversionEvents/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_conversion_event(
                 request, metadata
             )
             pb_request = analytics_admin.GetConversionEventRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10240,7 +10189,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -10270,6 +10219,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/customDimensions/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetCustomDimensionRequest,
@@ -10295,32 +10253,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a CustomDimension.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/customDimensions/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_custom_dimension(
                 request, metadata
             )
             pb_request = analytics_admin.GetCustomDimensionRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10329,7 +10277,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -10359,6 +10307,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/customMetrics/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetCustomMetricRequest,
@@ -10384,32 +10341,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a custom metric.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/customMetrics/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_custom_metric(
                 request, metadata
             )
             pb_request = analytics_admin.GetCustomMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10418,7 +10365,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -10448,6 +10395,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/dataRedactionSettings}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetDataRedactionSettingsRequest,
@@ -10477,32 +10433,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/dataRedactionSettings}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_data_redaction_settings(
                 request, metadata
             )
             pb_request = analytics_admin.GetDataRedactionSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10511,7 +10457,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -10541,6 +10487,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/dataRetentionSettings}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetDataRetentionSettingsRequest,
@@ -10569,32 +10524,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/dataRetentionSettings}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_data_retention_settings(
                 request, metadata
             )
             pb_request = analytics_admin.GetDataRetentionSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10603,7 +10548,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -10633,6 +10578,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=accounts/*/dataSharingSettings}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetDataSharingSettingsRequest,
@@ -10661,32 +10615,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=accounts/*/dataSharingSettings}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_data_sharing_settings(
                 request, metadata
             )
             pb_request = analytics_admin.GetDataSharingSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10695,7 +10639,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -10725,6 +10669,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetDataStreamRequest,
@@ -10752,30 +10705,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_data_stream(request, metadata)
             pb_request = analytics_admin.GetDataStreamRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10784,7 +10727,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -10814,6 +10757,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetDisplayVideo360AdvertiserLinkRequest,
@@ -10842,12 +10794,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinks/*}",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -10857,22 +10803,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.GetDisplayVideo360AdvertiserLinkRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10881,7 +10823,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -10911,6 +10853,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinkProposals/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetDisplayVideo360AdvertiserLinkProposalRequest,
@@ -10948,12 +10899,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/displayVideo360AdvertiserLinkProposals/*}",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -10965,22 +10910,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -10989,7 +10930,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11021,6 +10962,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/enhancedMeasurementSettings}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetEnhancedMeasurementSettingsRequest,
@@ -11051,34 +11001,24 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/enhancedMeasurementSettings}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_enhanced_measurement_settings(
                 request, metadata
             )
             pb_request = analytics_admin.GetEnhancedMeasurementSettingsRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -11087,7 +11027,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11117,6 +11057,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/eventCreateRules/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetEventCreateRuleRequest,
@@ -11156,32 +11105,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/eventCreateRules/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_event_create_rule(
                 request, metadata
             )
             pb_request = analytics_admin.GetEventCreateRuleRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -11190,7 +11129,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11220,6 +11159,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/expandedDataSets/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetExpandedDataSetRequest,
@@ -11247,32 +11195,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/expandedDataSets/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_expanded_data_set(
                 request, metadata
             )
             pb_request = analytics_admin.GetExpandedDataSetRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -11281,7 +11219,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11311,6 +11249,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/globalSiteTag}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetGlobalSiteTagRequest,
@@ -11340,32 +11287,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/globalSiteTag}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_global_site_tag(
                 request, metadata
             )
             pb_request = analytics_admin.GetGlobalSiteTagRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -11374,7 +11311,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11404,6 +11341,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/googleSignalsSettings}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetGoogleSignalsSettingsRequest,
@@ -11432,32 +11378,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/googleSignalsSettings}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_google_signals_settings(
                 request, metadata
             )
             pb_request = analytics_admin.GetGoogleSignalsSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -11466,7 +11402,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11496,6 +11432,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetMeasurementProtocolSecretRequest,
@@ -11524,32 +11469,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_measurement_protocol_secret(
                 request, metadata
             )
             pb_request = analytics_admin.GetMeasurementProtocolSecretRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -11558,7 +11493,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11588,6 +11523,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetPropertyRequest,
@@ -11614,30 +11558,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_property(request, metadata)
             pb_request = analytics_admin.GetPropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -11646,7 +11580,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11676,6 +11610,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/rollupPropertySourceLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetRollupPropertySourceLinkRequest,
@@ -11705,32 +11648,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/rollupPropertySourceLinks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_rollup_property_source_link(
                 request, metadata
             )
             pb_request = analytics_admin.GetRollupPropertySourceLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -11739,7 +11672,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11769,6 +11702,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/searchAds360Links/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetSearchAds360LinkRequest,
@@ -11796,32 +11738,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/searchAds360Links/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_search_ads360_link(
                 request, metadata
             )
             pb_request = analytics_admin.GetSearchAds360LinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -11830,7 +11762,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11860,6 +11792,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/sKAdNetworkConversionValueSchema/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetSKAdNetworkConversionValueSchemaRequest,
@@ -11888,12 +11829,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/dataStreams/*/sKAdNetworkConversionValueSchema/*}",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -11903,22 +11838,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.GetSKAdNetworkConversionValueSchemaRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -11927,7 +11858,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -11959,6 +11890,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{name=properties/*/subpropertyEventFilters/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetSubpropertyEventFilterRequest,
@@ -11987,32 +11927,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{name=properties/*/subpropertyEventFilters/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_subproperty_event_filter(
                 request, metadata
             )
             pb_request = analytics_admin.GetSubpropertyEventFilterRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12021,7 +11951,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -12051,6 +11981,19 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/accessBindings",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListAccessBindingsRequest,
@@ -12078,36 +12021,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=accounts/*}/accessBindings",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/accessBindings",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_access_bindings(
                 request, metadata
             )
             pb_request = analytics_admin.ListAccessBindingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12116,7 +12045,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -12136,6 +12065,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         def __hash__(self):
             return hash("ListAccounts")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/accounts",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListAccountsRequest,
@@ -12160,29 +12098,19 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     Request message for ListAccounts RPC.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/accounts",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_accounts(request, metadata)
             pb_request = analytics_admin.ListAccountsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12191,7 +12119,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -12211,6 +12139,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         def __hash__(self):
             return hash("ListAccountSummaries")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/accountSummaries",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListAccountSummariesRequest,
@@ -12238,31 +12175,21 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/accountSummaries",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_account_summaries(
                 request, metadata
             )
             pb_request = analytics_admin.ListAccountSummariesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12271,7 +12198,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -12301,6 +12228,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/adSenseLinks",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListAdSenseLinksRequest,
@@ -12328,32 +12264,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/adSenseLinks",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_ad_sense_links(
                 request, metadata
             )
             pb_request = analytics_admin.ListAdSenseLinksRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12362,7 +12288,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -12392,6 +12318,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/audiences",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListAudiencesRequest,
@@ -12419,30 +12354,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/audiences",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_audiences(request, metadata)
             pb_request = analytics_admin.ListAudiencesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12451,7 +12376,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -12481,6 +12406,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/bigQueryLinks",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListBigQueryLinksRequest,
@@ -12508,32 +12442,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/bigQueryLinks",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_big_query_links(
                 request, metadata
             )
             pb_request = analytics_admin.ListBigQueryLinksRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12542,7 +12466,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -12572,6 +12496,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/calculatedMetrics",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListCalculatedMetricsRequest,
@@ -12599,32 +12532,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/calculatedMetrics",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_calculated_metrics(
                 request, metadata
             )
             pb_request = analytics_admin.ListCalculatedMetricsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12633,7 +12556,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -12663,6 +12586,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/channelGroups",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListChannelGroupsRequest,
@@ -12690,32 +12622,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/channelGroups",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_channel_groups(
                 request, metadata
             )
             pb_request = analytics_admin.ListChannelGroupsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12724,7 +12646,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -12744,6 +12666,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         def __hash__(self):
             return hash("ListConnectedSiteTags")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/properties:listConnectedSiteTags",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListConnectedSiteTagsRequest,
@@ -12771,18 +12703,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/properties:listConnectedSiteTags",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_connected_site_tags(
                 request, metadata
             )
             pb_request = analytics_admin.ListConnectedSiteTagsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -12794,16 +12719,12 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12812,7 +12733,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -12843,6 +12764,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/conversionEvents",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListConversionEventsRequest,
@@ -12870,32 +12800,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/conversionEvents",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_conversion_events(
                 request, metadata
             )
             pb_request = analytics_admin.ListConversionEventsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12904,7 +12824,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -12934,6 +12854,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/customDimensions",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListCustomDimensionsRequest,
@@ -12961,32 +12890,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/customDimensions",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_custom_dimensions(
                 request, metadata
             )
             pb_request = analytics_admin.ListCustomDimensionsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -12995,7 +12914,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13025,6 +12944,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/customMetrics",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListCustomMetricsRequest,
@@ -13052,32 +12980,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/customMetrics",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_custom_metrics(
                 request, metadata
             )
             pb_request = analytics_admin.ListCustomMetricsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -13086,7 +13004,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13116,6 +13034,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/dataStreams",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListDataStreamsRequest,
@@ -13143,32 +13070,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/dataStreams",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_data_streams(
                 request, metadata
             )
             pb_request = analytics_admin.ListDataStreamsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -13177,7 +13094,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13207,6 +13124,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/displayVideo360AdvertiserLinkProposals",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListDisplayVideo360AdvertiserLinkProposalsRequest,
@@ -13237,12 +13163,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/displayVideo360AdvertiserLinkProposals",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -13254,22 +13174,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -13278,7 +13194,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13316,6 +13232,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/displayVideo360AdvertiserLinks",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListDisplayVideo360AdvertiserLinksRequest,
@@ -13344,12 +13269,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/displayVideo360AdvertiserLinks",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -13359,22 +13278,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.ListDisplayVideo360AdvertiserLinksRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -13383,7 +13298,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13415,6 +13330,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/eventCreateRules",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListEventCreateRulesRequest,
@@ -13442,32 +13366,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/eventCreateRules",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_event_create_rules(
                 request, metadata
             )
             pb_request = analytics_admin.ListEventCreateRulesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -13476,7 +13390,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13506,6 +13420,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/expandedDataSets",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListExpandedDataSetsRequest,
@@ -13533,32 +13456,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/expandedDataSets",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_expanded_data_sets(
                 request, metadata
             )
             pb_request = analytics_admin.ListExpandedDataSetsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -13567,7 +13480,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13597,6 +13510,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/firebaseLinks",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListFirebaseLinksRequest,
@@ -13624,32 +13546,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/firebaseLinks",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_firebase_links(
                 request, metadata
             )
             pb_request = analytics_admin.ListFirebaseLinksRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -13658,7 +13570,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13688,6 +13600,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/googleAdsLinks",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListGoogleAdsLinksRequest,
@@ -13715,32 +13636,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/googleAdsLinks",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_google_ads_links(
                 request, metadata
             )
             pb_request = analytics_admin.ListGoogleAdsLinksRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -13749,7 +13660,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13779,6 +13690,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/measurementProtocolSecrets",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListMeasurementProtocolSecretsRequest,
@@ -13807,34 +13727,24 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/measurementProtocolSecrets",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_measurement_protocol_secrets(
                 request, metadata
             )
             pb_request = analytics_admin.ListMeasurementProtocolSecretsRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -13843,7 +13753,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13875,6 +13785,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/properties",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListPropertiesRequest,
@@ -13902,30 +13821,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/properties",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_properties(request, metadata)
             pb_request = analytics_admin.ListPropertiesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -13934,7 +13843,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -13964,6 +13873,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/rollupPropertySourceLinks",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListRollupPropertySourceLinksRequest,
@@ -13992,34 +13910,24 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/rollupPropertySourceLinks",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_rollup_property_source_links(
                 request, metadata
             )
             pb_request = analytics_admin.ListRollupPropertySourceLinksRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -14028,7 +13936,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -14058,6 +13966,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/searchAds360Links",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListSearchAds360LinksRequest,
@@ -14085,32 +14002,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/searchAds360Links",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_search_ads360_links(
                 request, metadata
             )
             pb_request = analytics_admin.ListSearchAds360LinksRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -14119,7 +14026,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -14149,6 +14056,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/sKAdNetworkConversionValueSchema",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListSKAdNetworkConversionValueSchemasRequest,
@@ -14179,12 +14095,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*/dataStreams/*}/sKAdNetworkConversionValueSchema",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -14194,22 +14104,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = (
                 analytics_admin.ListSKAdNetworkConversionValueSchemasRequest.pb(request)
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -14218,7 +14124,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -14252,6 +14158,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1alpha/{parent=properties/*}/subpropertyEventFilters",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListSubpropertyEventFiltersRequest,
@@ -14280,32 +14195,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1alpha/{parent=properties/*}/subpropertyEventFilters",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_subproperty_event_filters(
                 request, metadata
             )
             pb_request = analytics_admin.ListSubpropertyEventFiltersRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -14314,7 +14219,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -14334,6 +14239,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         def __hash__(self):
             return hash("ProvisionAccountTicket")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/accounts:provisionAccountTicket",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ProvisionAccountTicketRequest,
@@ -14361,18 +14276,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/accounts:provisionAccountTicket",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_provision_account_ticket(
                 request, metadata
             )
             pb_request = analytics_admin.ProvisionAccountTicketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -14384,16 +14292,12 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -14402,7 +14306,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -14423,6 +14327,21 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         def __hash__(self):
             return hash("RunAccessReport")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{entity=properties/*}:runAccessReport",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{entity=accounts/*}:runAccessReport",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.RunAccessReportRequest,
@@ -14450,23 +14369,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{entity=properties/*}:runAccessReport",
-                    "body": "*",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{entity=accounts/*}:runAccessReport",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_run_access_report(
                 request, metadata
             )
             pb_request = analytics_admin.RunAccessReportRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -14478,16 +14385,12 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -14496,7 +14399,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -14527,6 +14430,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/{account=accounts/*}:searchChangeHistoryEvents",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.SearchChangeHistoryEventsRequest,
@@ -14555,18 +14468,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/{account=accounts/*}:searchChangeHistoryEvents",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_search_change_history_events(
                 request, metadata
             )
             pb_request = analytics_admin.SearchChangeHistoryEventsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -14578,17 +14484,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -14597,7 +14499,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -14628,6 +14530,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1alpha/properties:setAutomatedGa4ConfigurationOptOut",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.SetAutomatedGa4ConfigurationOptOutRequest,
@@ -14658,13 +14570,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1alpha/properties:setAutomatedGa4ConfigurationOptOut",
-                    "body": "*",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -14674,7 +14579,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.SetAutomatedGa4ConfigurationOptOutRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -14686,17 +14591,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -14705,7 +14606,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -14738,6 +14639,21 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{access_binding.name=accounts/*/accessBindings/*}",
+                    "body": "access_binding",
+                },
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{access_binding.name=properties/*/accessBindings/*}",
+                    "body": "access_binding",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateAccessBindingRequest,
@@ -14765,23 +14681,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{access_binding.name=accounts/*/accessBindings/*}",
-                    "body": "access_binding",
-                },
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{access_binding.name=properties/*/accessBindings/*}",
-                    "body": "access_binding",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_access_binding(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateAccessBindingRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -14793,17 +14697,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -14812,7 +14712,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -14845,6 +14745,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{account.name=accounts/*}",
+                    "body": "account",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateAccountRequest,
@@ -14872,16 +14782,9 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{account.name=accounts/*}",
-                    "body": "account",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_account(request, metadata)
             pb_request = analytics_admin.UpdateAccountRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -14893,17 +14796,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -14912,7 +14811,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -14945,6 +14844,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{attribution_settings.name=properties/*/attributionSettings}",
+                    "body": "attribution_settings",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateAttributionSettingsRequest,
@@ -14974,18 +14883,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{attribution_settings.name=properties/*/attributionSettings}",
-                    "body": "attribution_settings",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_attribution_settings(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateAttributionSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -14997,17 +14899,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -15016,7 +14914,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -15049,6 +14947,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{audience.name=properties/*/audiences/*}",
+                    "body": "audience",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateAudienceRequest,
@@ -15076,16 +14984,9 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{audience.name=properties/*/audiences/*}",
-                    "body": "audience",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_audience(request, metadata)
             pb_request = analytics_admin.UpdateAudienceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -15097,17 +14998,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -15116,7 +15013,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -15149,6 +15046,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{calculated_metric.name=properties/*/calculatedMetrics/*}",
+                    "body": "calculated_metric",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateCalculatedMetricRequest,
@@ -15174,18 +15081,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a calculated metric.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{calculated_metric.name=properties/*/calculatedMetrics/*}",
-                    "body": "calculated_metric",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_calculated_metric(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateCalculatedMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -15197,17 +15097,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -15216,7 +15112,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -15249,6 +15145,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{channel_group.name=properties/*/channelGroups/*}",
+                    "body": "channel_group",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateChannelGroupRequest,
@@ -15276,18 +15182,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{channel_group.name=properties/*/channelGroups/*}",
-                    "body": "channel_group",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_channel_group(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateChannelGroupRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -15299,17 +15198,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -15318,7 +15213,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -15351,6 +15246,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{conversion_event.name=properties/*/conversionEvents/*}",
+                    "body": "conversion_event",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateConversionEventRequest,
@@ -15378,18 +15283,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{conversion_event.name=properties/*/conversionEvents/*}",
-                    "body": "conversion_event",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_conversion_event(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateConversionEventRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -15401,17 +15299,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -15420,7 +15314,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -15453,6 +15347,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{custom_dimension.name=properties/*/customDimensions/*}",
+                    "body": "custom_dimension",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateCustomDimensionRequest,
@@ -15478,18 +15382,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a CustomDimension.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{custom_dimension.name=properties/*/customDimensions/*}",
-                    "body": "custom_dimension",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_custom_dimension(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateCustomDimensionRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -15501,17 +15398,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -15520,7 +15413,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -15553,6 +15446,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{custom_metric.name=properties/*/customMetrics/*}",
+                    "body": "custom_metric",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateCustomMetricRequest,
@@ -15578,18 +15481,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a custom metric.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{custom_metric.name=properties/*/customMetrics/*}",
-                    "body": "custom_metric",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_custom_metric(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateCustomMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -15601,17 +15497,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -15620,7 +15512,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -15653,6 +15545,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{data_redaction_settings.name=properties/*/dataStreams/*/dataRedactionSettings}",
+                    "body": "data_redaction_settings",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateDataRedactionSettingsRequest,
@@ -15682,18 +15584,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{data_redaction_settings.name=properties/*/dataStreams/*/dataRedactionSettings}",
-                    "body": "data_redaction_settings",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_data_redaction_settings(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateDataRedactionSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -15705,17 +15600,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -15724,7 +15615,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -15757,6 +15648,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{data_retention_settings.name=properties/*/dataRetentionSettings}",
+                    "body": "data_retention_settings",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateDataRetentionSettingsRequest,
@@ -15785,18 +15686,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{data_retention_settings.name=properties/*/dataRetentionSettings}",
-                    "body": "data_retention_settings",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_data_retention_settings(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateDataRetentionSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -15808,17 +15702,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -15827,7 +15717,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -15860,6 +15750,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{data_stream.name=properties/*/dataStreams/*}",
+                    "body": "data_stream",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateDataStreamRequest,
@@ -15887,18 +15787,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{data_stream.name=properties/*/dataStreams/*}",
-                    "body": "data_stream",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_data_stream(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateDataStreamRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -15910,17 +15803,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -15929,7 +15818,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -15962,6 +15851,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{display_video_360_advertiser_link.name=properties/*/displayVideo360AdvertiserLinks/*}",
+                    "body": "display_video_360_advertiser_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateDisplayVideo360AdvertiserLinkRequest,
@@ -15990,13 +15889,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{display_video_360_advertiser_link.name=properties/*/displayVideo360AdvertiserLinks/*}",
-                    "body": "display_video_360_advertiser_link",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -16006,7 +15898,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.UpdateDisplayVideo360AdvertiserLinkRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -16018,17 +15910,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -16037,7 +15925,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -16070,6 +15958,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{enhanced_measurement_settings.name=properties/*/dataStreams/*/enhancedMeasurementSettings}",
+                    "body": "enhanced_measurement_settings",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateEnhancedMeasurementSettingsRequest,
@@ -16100,13 +15998,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{enhanced_measurement_settings.name=properties/*/dataStreams/*/enhancedMeasurementSettings}",
-                    "body": "enhanced_measurement_settings",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -16116,7 +16007,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.UpdateEnhancedMeasurementSettingsRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -16128,17 +16019,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -16147,7 +16034,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -16180,6 +16067,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{event_create_rule.name=properties/*/dataStreams/*/eventCreateRules/*}",
+                    "body": "event_create_rule",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateEventCreateRuleRequest,
@@ -16219,18 +16116,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{event_create_rule.name=properties/*/dataStreams/*/eventCreateRules/*}",
-                    "body": "event_create_rule",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_event_create_rule(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateEventCreateRuleRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -16242,17 +16132,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -16261,7 +16147,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -16294,6 +16180,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{expanded_data_set.name=properties/*/expandedDataSets/*}",
+                    "body": "expanded_data_set",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateExpandedDataSetRequest,
@@ -16321,18 +16217,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{expanded_data_set.name=properties/*/expandedDataSets/*}",
-                    "body": "expanded_data_set",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_expanded_data_set(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateExpandedDataSetRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -16344,17 +16233,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -16363,7 +16248,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -16396,6 +16281,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{google_ads_link.name=properties/*/googleAdsLinks/*}",
+                    "body": "google_ads_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateGoogleAdsLinkRequest,
@@ -16423,18 +16318,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{google_ads_link.name=properties/*/googleAdsLinks/*}",
-                    "body": "google_ads_link",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_google_ads_link(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateGoogleAdsLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -16446,17 +16334,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -16465,7 +16349,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -16498,6 +16382,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{google_signals_settings.name=properties/*/googleSignalsSettings}",
+                    "body": "google_signals_settings",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateGoogleSignalsSettingsRequest,
@@ -16526,18 +16420,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{google_signals_settings.name=properties/*/googleSignalsSettings}",
-                    "body": "google_signals_settings",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_google_signals_settings(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateGoogleSignalsSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -16549,17 +16436,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -16568,7 +16451,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -16601,6 +16484,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{measurement_protocol_secret.name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
+                    "body": "measurement_protocol_secret",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateMeasurementProtocolSecretRequest,
@@ -16629,13 +16522,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{measurement_protocol_secret.name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
-                    "body": "measurement_protocol_secret",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -16645,7 +16531,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.UpdateMeasurementProtocolSecretRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -16657,17 +16543,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -16676,7 +16558,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -16709,6 +16591,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{property.name=properties/*}",
+                    "body": "property",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdatePropertyRequest,
@@ -16736,16 +16628,9 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{property.name=properties/*}",
-                    "body": "property",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_property(request, metadata)
             pb_request = analytics_admin.UpdatePropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -16757,17 +16642,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -16776,7 +16657,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -16809,6 +16690,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{search_ads_360_link.name=properties/*/searchAds360Links/*}",
+                    "body": "search_ads_360_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateSearchAds360LinkRequest,
@@ -16836,18 +16727,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{search_ads_360_link.name=properties/*/searchAds360Links/*}",
-                    "body": "search_ads_360_link",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_search_ads360_link(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateSearchAds360LinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -16859,17 +16743,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -16878,7 +16758,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -16911,6 +16791,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{skadnetwork_conversion_value_schema.name=properties/*/dataStreams/*/sKAdNetworkConversionValueSchema/*}",
+                    "body": "skadnetwork_conversion_value_schema",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateSKAdNetworkConversionValueSchemaRequest,
@@ -16940,13 +16830,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{skadnetwork_conversion_value_schema.name=properties/*/dataStreams/*/sKAdNetworkConversionValueSchema/*}",
-                    "body": "skadnetwork_conversion_value_schema",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -16958,7 +16841,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -16970,17 +16853,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -16989,7 +16868,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -17024,6 +16903,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1alpha/{subproperty_event_filter.name=properties/*/subpropertyEventFilters/*}",
+                    "body": "subproperty_event_filter",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateSubpropertyEventFilterRequest,
@@ -17052,18 +16941,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1alpha/{subproperty_event_filter.name=properties/*/subpropertyEventFilters/*}",
-                    "body": "subproperty_event_filter",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_subproperty_event_filter(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateSubpropertyEventFilterRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -17075,17 +16957,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -17094,7 +16972,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
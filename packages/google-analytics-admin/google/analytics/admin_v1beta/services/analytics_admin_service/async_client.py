@@ -46,6 +46,7 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 from google.protobuf import wrappers_pb2  # type: ignore
 
+from google.analytics.admin_helpers import fanout
 from google.analytics.admin_v1beta.services.analytics_admin_service import pagers
 from google.analytics.admin_v1beta.types import (
     access_report,
@@ -58,7 +59,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, AnalyticsAdminServiceTransport
 from .transports.grpc_asyncio import AnalyticsAdminServiceGrpcAsyncIOTransport
 
 
-class AnalyticsAdminServiceAsyncClient:
+class AnalyticsAdminServiceAsyncClient(fanout.AsyncFanOutMixin):
     """Service Interface for the Analytics Admin API (GA4)."""
 
     _client: AnalyticsAdminServiceClient
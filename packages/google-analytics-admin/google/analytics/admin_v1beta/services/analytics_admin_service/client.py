@@ -50,6 +50,7 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 from google.protobuf import wrappers_pb2  # type: ignore
 
+from google.analytics.admin_helpers import fanout, resource_names
 from google.analytics.admin_v1beta.services.analytics_admin_service import pagers
 from google.analytics.admin_v1beta.types import (
     access_report,
@@ -100,7 +101,9 @@ class AnalyticsAdminServiceClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
+class AnalyticsAdminServiceClient(
+    fanout.FanOutMixin, metaclass=AnalyticsAdminServiceClientMeta
+):
     """Service Interface for the Analytics Admin API (GA4)."""
 
     @staticmethod
@@ -190,30 +193,26 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         account: str,
     ) -> str:
         """Returns a fully-qualified account string."""
-        return "accounts/{account}".format(
-            account=account,
-        )
+        return resource_names.get("accounts/{account}").format(account)
 
     @staticmethod
     def parse_account_path(path: str) -> Dict[str, str]:
         """Parses a account path into its component segments."""
-        m = re.match(r"^accounts/(?P<account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("accounts/{account}").parse(path)
 
     @staticmethod
     def account_summary_path(
         account_summary: str,
     ) -> str:
         """Returns a fully-qualified account_summary string."""
-        return "accountSummaries/{account_summary}".format(
-            account_summary=account_summary,
+        return resource_names.get("accountSummaries/{account_summary}").format(
+            account_summary
         )
 
     @staticmethod
     def parse_account_summary_path(path: str) -> Dict[str, str]:
         """Parses a account_summary path into its component segments."""
-        m = re.match(r"^accountSummaries/(?P<account_summary>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("accountSummaries/{account_summary}").parse(path)
 
     @staticmethod
     def conversion_event_path(
@@ -221,19 +220,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         conversion_event: str,
     ) -> str:
         """Returns a fully-qualified conversion_event string."""
-        return "properties/{property}/conversionEvents/{conversion_event}".format(
-            property=property,
-            conversion_event=conversion_event,
-        )
+        return resource_names.get(
+            "properties/{property}/conversionEvents/{conversion_event}"
+        ).format(property, conversion_event)
 
     @staticmethod
     def parse_conversion_event_path(path: str) -> Dict[str, str]:
         """Parses a conversion_event path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/conversionEvents/(?P<conversion_event>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/conversionEvents/{conversion_event}"
+        ).parse(path)
 
     @staticmethod
     def custom_dimension_path(
@@ -241,19 +237,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         custom_dimension: str,
     ) -> str:
         """Returns a fully-qualified custom_dimension string."""
-        return "properties/{property}/customDimensions/{custom_dimension}".format(
-            property=property,
-            custom_dimension=custom_dimension,
-        )
+        return resource_names.get(
+            "properties/{property}/customDimensions/{custom_dimension}"
+        ).format(property, custom_dimension)
 
     @staticmethod
     def parse_custom_dimension_path(path: str) -> Dict[str, str]:
         """Parses a custom_dimension path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/customDimensions/(?P<custom_dimension>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/customDimensions/{custom_dimension}"
+        ).parse(path)
 
     @staticmethod
     def custom_metric_path(
@@ -261,48 +254,46 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         custom_metric: str,
     ) -> str:
         """Returns a fully-qualified custom_metric string."""
-        return "properties/{property}/customMetrics/{custom_metric}".format(
-            property=property,
-            custom_metric=custom_metric,
-        )
+        return resource_names.get(
+            "properties/{property}/customMetrics/{custom_metric}"
+        ).format(property, custom_metric)
 
     @staticmethod
     def parse_custom_metric_path(path: str) -> Dict[str, str]:
         """Parses a custom_metric path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/customMetrics/(?P<custom_metric>.+?)$", path
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/customMetrics/{custom_metric}"
+        ).parse(path)
 
     @staticmethod
     def data_retention_settings_path(
         property: str,
     ) -> str:
         """Returns a fully-qualified data_retention_settings string."""
-        return "properties/{property}/dataRetentionSettings".format(
-            property=property,
+        return resource_names.get("properties/{property}/dataRetentionSettings").format(
+            property
         )
 
     @staticmethod
     def parse_data_retention_settings_path(path: str) -> Dict[str, str]:
         """Parses a data_retention_settings path into its component segments."""
-        m = re.match(r"^properties/(?P<property>.+?)/dataRetentionSettings$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("properties/{property}/dataRetentionSettings").parse(
+            path
+        )
 
     @staticmethod
     def data_sharing_settings_path(
         account: str,
     ) -> str:
         """Returns a fully-qualified data_sharing_settings string."""
-        return "accounts/{account}/dataSharingSettings".format(
-            account=account,
+        return resource_names.get("accounts/{account}/dataSharingSettings").format(
+            account
         )
 
     @staticmethod
     def parse_data_sharing_settings_path(path: str) -> Dict[str, str]:
         """Parses a data_sharing_settings path into its component segments."""
-        m = re.match(r"^accounts/(?P<account>.+?)/dataSharingSettings$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("accounts/{account}/dataSharingSettings").parse(path)
 
     @staticmethod
     def data_stream_path(
@@ -310,18 +301,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         data_stream: str,
     ) -> str:
         """Returns a fully-qualified data_stream string."""
-        return "properties/{property}/dataStreams/{data_stream}".format(
-            property=property,
-            data_stream=data_stream,
-        )
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}"
+        ).format(property, data_stream)
 
     @staticmethod
     def parse_data_stream_path(path: str) -> Dict[str, str]:
         """Parses a data_stream path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/dataStreams/(?P<data_stream>.+?)$", path
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}"
+        ).parse(path)
 
     @staticmethod
     def firebase_link_path(
@@ -329,18 +318,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         firebase_link: str,
     ) -> str:
         """Returns a fully-qualified firebase_link string."""
-        return "properties/{property}/firebaseLinks/{firebase_link}".format(
-            property=property,
-            firebase_link=firebase_link,
-        )
+        return resource_names.get(
+            "properties/{property}/firebaseLinks/{firebase_link}"
+        ).format(property, firebase_link)
 
     @staticmethod
     def parse_firebase_link_path(path: str) -> Dict[str, str]:
         """Parses a firebase_link path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/firebaseLinks/(?P<firebase_link>.+?)$", path
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/firebaseLinks/{firebase_link}"
+        ).parse(path)
 
     @staticmethod
     def google_ads_link_path(
@@ -348,19 +335,16 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         google_ads_link: str,
     ) -> str:
         """Returns a fully-qualified google_ads_link string."""
-        return "properties/{property}/googleAdsLinks/{google_ads_link}".format(
-            property=property,
-            google_ads_link=google_ads_link,
-        )
+        return resource_names.get(
+            "properties/{property}/googleAdsLinks/{google_ads_link}"
+        ).format(property, google_ads_link)
 
     @staticmethod
     def parse_google_ads_link_path(path: str) -> Dict[str, str]:
         """Parses a google_ads_link path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/googleAdsLinks/(?P<google_ads_link>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/googleAdsLinks/{google_ads_link}"
+        ).parse(path)
 
     @staticmethod
     def measurement_protocol_secret_path(
@@ -369,95 +353,78 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         measurement_protocol_secret: str,
     ) -> str:
         """Returns a fully-qualified measurement_protocol_secret string."""
-        return "properties/{property}/dataStreams/{data_stream}/measurementProtocolSecrets/{measurement_protocol_secret}".format(
-            property=property,
-            data_stream=data_stream,
-            measurement_protocol_secret=measurement_protocol_secret,
-        )
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/measurementProtocolSecrets/{measurement_protocol_secret}"
+        ).format(property, data_stream, measurement_protocol_secret)
 
     @staticmethod
     def parse_measurement_protocol_secret_path(path: str) -> Dict[str, str]:
         """Parses a measurement_protocol_secret path into its component segments."""
-        m = re.match(
-            r"^properties/(?P<property>.+?)/dataStreams/(?P<data_stream>.+?)/measurementProtocolSecrets/(?P<measurement_protocol_secret>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "properties/{property}/dataStreams/{data_stream}/measurementProtocolSecrets/{measurement_protocol_secret}"
+        ).parse(path)
 
     @staticmethod
     def property_path(
         property: str,
     ) -> str:
         """Returns a fully-qualified property string."""
-        return "properties/{property}".format(
-            property=property,
-        )
+        return resource_names.get("properties/{property}").format(property)
 
     @staticmethod
     def parse_property_path(path: str) -> Dict[str, str]:
         """Parses a property path into its component segments."""
-        m = re.match(r"^properties/(?P<property>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("properties/{property}").parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -465,16 +432,14 @@ class AnalyticsAdminServiceClient(metaclass=AnalyticsAdminServiceClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
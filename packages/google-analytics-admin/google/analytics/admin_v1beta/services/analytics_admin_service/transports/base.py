@@ -25,6 +25,7 @@ from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.analytics.admin_helpers import forking, wrapping
 from google.analytics.admin_v1beta import gapic_version as package_version
 from google.analytics.admin_v1beta.types import analytics_admin, resources
 
@@ -122,256 +123,280 @@ class AnalyticsAdminServiceTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.get_account: gapic_v1.method.wrap_method(
-                self.get_account,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_accounts: gapic_v1.method.wrap_method(
-                self.list_accounts,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_account: gapic_v1.method.wrap_method(
-                self.delete_account,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_account: gapic_v1.method.wrap_method(
-                self.update_account,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.provision_account_ticket: gapic_v1.method.wrap_method(
-                self.provision_account_ticket,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_account_summaries: gapic_v1.method.wrap_method(
-                self.list_account_summaries,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_property: gapic_v1.method.wrap_method(
-                self.get_property,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_properties: gapic_v1.method.wrap_method(
-                self.list_properties,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_property: gapic_v1.method.wrap_method(
-                self.create_property,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_property: gapic_v1.method.wrap_method(
-                self.delete_property,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_property: gapic_v1.method.wrap_method(
-                self.update_property,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_firebase_link: gapic_v1.method.wrap_method(
-                self.create_firebase_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_firebase_link: gapic_v1.method.wrap_method(
-                self.delete_firebase_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_firebase_links: gapic_v1.method.wrap_method(
-                self.list_firebase_links,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_google_ads_link: gapic_v1.method.wrap_method(
-                self.create_google_ads_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_google_ads_link: gapic_v1.method.wrap_method(
-                self.update_google_ads_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_google_ads_link: gapic_v1.method.wrap_method(
-                self.delete_google_ads_link,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_google_ads_links: gapic_v1.method.wrap_method(
-                self.list_google_ads_links,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_data_sharing_settings: gapic_v1.method.wrap_method(
-                self.get_data_sharing_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_measurement_protocol_secret: gapic_v1.method.wrap_method(
-                self.get_measurement_protocol_secret,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_measurement_protocol_secrets: gapic_v1.method.wrap_method(
-                self.list_measurement_protocol_secrets,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_measurement_protocol_secret: gapic_v1.method.wrap_method(
-                self.create_measurement_protocol_secret,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_measurement_protocol_secret: gapic_v1.method.wrap_method(
-                self.delete_measurement_protocol_secret,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_measurement_protocol_secret: gapic_v1.method.wrap_method(
-                self.update_measurement_protocol_secret,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.acknowledge_user_data_collection: gapic_v1.method.wrap_method(
-                self.acknowledge_user_data_collection,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.search_change_history_events: gapic_v1.method.wrap_method(
-                self.search_change_history_events,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_conversion_event: gapic_v1.method.wrap_method(
-                self.create_conversion_event,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_conversion_event: gapic_v1.method.wrap_method(
-                self.update_conversion_event,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_conversion_event: gapic_v1.method.wrap_method(
-                self.get_conversion_event,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_conversion_event: gapic_v1.method.wrap_method(
-                self.delete_conversion_event,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_conversion_events: gapic_v1.method.wrap_method(
-                self.list_conversion_events,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_custom_dimension: gapic_v1.method.wrap_method(
-                self.create_custom_dimension,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_custom_dimension: gapic_v1.method.wrap_method(
-                self.update_custom_dimension,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_custom_dimensions: gapic_v1.method.wrap_method(
-                self.list_custom_dimensions,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.archive_custom_dimension: gapic_v1.method.wrap_method(
-                self.archive_custom_dimension,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_custom_dimension: gapic_v1.method.wrap_method(
-                self.get_custom_dimension,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_custom_metric: gapic_v1.method.wrap_method(
-                self.create_custom_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_custom_metric: gapic_v1.method.wrap_method(
-                self.update_custom_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_custom_metrics: gapic_v1.method.wrap_method(
-                self.list_custom_metrics,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.archive_custom_metric: gapic_v1.method.wrap_method(
-                self.archive_custom_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_custom_metric: gapic_v1.method.wrap_method(
-                self.get_custom_metric,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_data_retention_settings: gapic_v1.method.wrap_method(
-                self.get_data_retention_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_data_retention_settings: gapic_v1.method.wrap_method(
-                self.update_data_retention_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_data_stream: gapic_v1.method.wrap_method(
-                self.create_data_stream,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_data_stream: gapic_v1.method.wrap_method(
-                self.delete_data_stream,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_data_stream: gapic_v1.method.wrap_method(
-                self.update_data_stream,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_data_streams: gapic_v1.method.wrap_method(
-                self.list_data_streams,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_data_stream: gapic_v1.method.wrap_method(
-                self.get_data_stream,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.run_access_report: gapic_v1.method.wrap_method(
-                self.run_access_report,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "get_account": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_accounts": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_account": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_account": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "provision_account_ticket": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_account_summaries": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_property": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_properties": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_property": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_property": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_property": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_firebase_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_firebase_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_firebase_links": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_google_ads_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_google_ads_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_google_ads_link": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_google_ads_links": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_data_sharing_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_measurement_protocol_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_measurement_protocol_secrets": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_measurement_protocol_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_measurement_protocol_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_measurement_protocol_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "acknowledge_user_data_collection": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "search_change_history_events": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_conversion_event": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_conversion_event": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_conversion_event": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_conversion_event": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_conversion_events": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_custom_dimension": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_custom_dimension": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_custom_dimensions": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "archive_custom_dimension": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_custom_dimension": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_custom_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_custom_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_custom_metrics": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "archive_custom_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_custom_metric": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_data_retention_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_data_retention_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_data_stream": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_data_stream": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_data_stream": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_data_streams": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_data_stream": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "run_access_report": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
@@ -17,10 +17,10 @@
 import dataclasses
 import json  # type: ignore
 import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 import warnings
 
-from google.api_core import gapic_v1, path_template, rest_helpers, rest_streaming
+from google.api_core import gapic_v1, rest_helpers, rest_streaming
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
@@ -38,6 +38,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.analytics.admin_helpers import http_pool, rest_encoding, transcoding
 from google.analytics.admin_v1beta.types import analytics_admin, resources
 
 from .base import AnalyticsAdminServiceTransport
@@ -1520,6 +1521,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         url_scheme: str = "https",
         interceptor: Optional[AnalyticsAdminServiceRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -1552,6 +1554,10 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            http_pool_options (Optional[google.analytics.admin_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -1574,11 +1580,19 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or AnalyticsAdminServiceRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -1596,6 +1610,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{property=properties/*}:acknowledgeUserDataCollection",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.AcknowledgeUserDataCollectionRequest,
@@ -1624,20 +1648,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{property=properties/*}:acknowledgeUserDataCollection",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_acknowledge_user_data_collection(
                 request, metadata
             )
             pb_request = analytics_admin.AcknowledgeUserDataCollectionRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1649,17 +1666,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1668,7 +1681,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1699,6 +1712,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{name=properties/*/customDimensions/*}:archive",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ArchiveCustomDimensionRequest,
@@ -1720,18 +1743,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{name=properties/*/customDimensions/*}:archive",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_archive_custom_dimension(
                 request, metadata
             )
             pb_request = analytics_admin.ArchiveCustomDimensionRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1743,17 +1759,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1762,7 +1774,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1785,6 +1797,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{name=properties/*/customMetrics/*}:archive",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ArchiveCustomMetricRequest,
@@ -1806,18 +1828,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{name=properties/*/customMetrics/*}:archive",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_archive_custom_metric(
                 request, metadata
             )
             pb_request = analytics_admin.ArchiveCustomMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1829,17 +1844,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1848,7 +1859,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1871,6 +1882,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{parent=properties/*}/conversionEvents",
+                    "body": "conversion_event",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateConversionEventRequest,
@@ -1898,18 +1919,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{parent=properties/*}/conversionEvents",
-                    "body": "conversion_event",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_conversion_event(
                 request, metadata
             )
             pb_request = analytics_admin.CreateConversionEventRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1921,17 +1935,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1940,7 +1950,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1971,6 +1981,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{parent=properties/*}/customDimensions",
+                    "body": "custom_dimension",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateCustomDimensionRequest,
@@ -1996,18 +2016,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a CustomDimension.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{parent=properties/*}/customDimensions",
-                    "body": "custom_dimension",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_custom_dimension(
                 request, metadata
             )
             pb_request = analytics_admin.CreateCustomDimensionRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2019,17 +2032,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2038,7 +2047,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2069,6 +2078,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{parent=properties/*}/customMetrics",
+                    "body": "custom_metric",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateCustomMetricRequest,
@@ -2094,18 +2113,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a custom metric.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{parent=properties/*}/customMetrics",
-                    "body": "custom_metric",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_custom_metric(
                 request, metadata
             )
             pb_request = analytics_admin.CreateCustomMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2117,17 +2129,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2136,7 +2144,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2167,6 +2175,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{parent=properties/*}/dataStreams",
+                    "body": "data_stream",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateDataStreamRequest,
@@ -2194,18 +2212,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{parent=properties/*}/dataStreams",
-                    "body": "data_stream",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_data_stream(
                 request, metadata
             )
             pb_request = analytics_admin.CreateDataStreamRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2217,17 +2228,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2236,7 +2243,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2267,6 +2274,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{parent=properties/*}/firebaseLinks",
+                    "body": "firebase_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateFirebaseLinkRequest,
@@ -2294,18 +2311,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{parent=properties/*}/firebaseLinks",
-                    "body": "firebase_link",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_firebase_link(
                 request, metadata
             )
             pb_request = analytics_admin.CreateFirebaseLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2317,17 +2327,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2336,7 +2342,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2367,6 +2373,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{parent=properties/*}/googleAdsLinks",
+                    "body": "google_ads_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateGoogleAdsLinkRequest,
@@ -2394,18 +2410,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{parent=properties/*}/googleAdsLinks",
-                    "body": "google_ads_link",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_google_ads_link(
                 request, metadata
             )
             pb_request = analytics_admin.CreateGoogleAdsLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2417,17 +2426,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2436,7 +2441,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2467,6 +2472,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{parent=properties/*/dataStreams/*}/measurementProtocolSecrets",
+                    "body": "measurement_protocol_secret",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreateMeasurementProtocolSecretRequest,
@@ -2495,13 +2510,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{parent=properties/*/dataStreams/*}/measurementProtocolSecrets",
-                    "body": "measurement_protocol_secret",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -2511,7 +2519,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.CreateMeasurementProtocolSecretRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2523,17 +2531,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2542,7 +2546,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2573,6 +2577,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/properties",
+                    "body": "property",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.CreatePropertyRequest,
@@ -2600,16 +2614,9 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/properties",
-                    "body": "property",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_property(request, metadata)
             pb_request = analytics_admin.CreatePropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2621,17 +2628,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2640,7 +2643,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2671,6 +2674,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1beta/{name=accounts/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteAccountRequest,
@@ -2692,30 +2704,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1beta/{name=accounts/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_account(request, metadata)
             pb_request = analytics_admin.DeleteAccountRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2724,7 +2726,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2746,6 +2748,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1beta/{name=properties/*/conversionEvents/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteConversionEventRequest,
@@ -2767,32 +2778,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1beta/{name=properties/*/conversionEvents/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_conversion_event(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteConversionEventRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2801,7 +2802,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2823,6 +2824,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1beta/{name=properties/*/dataStreams/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteDataStreamRequest,
@@ -2844,32 +2854,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1beta/{name=properties/*/dataStreams/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_data_stream(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteDataStreamRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2878,7 +2878,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2900,6 +2900,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1beta/{name=properties/*/firebaseLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteFirebaseLinkRequest,
@@ -2921,32 +2930,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1beta/{name=properties/*/firebaseLinks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_firebase_link(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteFirebaseLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2955,7 +2954,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2977,6 +2976,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1beta/{name=properties/*/googleAdsLinks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteGoogleAdsLinkRequest,
@@ -2998,32 +3006,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1beta/{name=properties/*/googleAdsLinks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_google_ads_link(
                 request, metadata
             )
             pb_request = analytics_admin.DeleteGoogleAdsLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3032,7 +3030,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3054,6 +3052,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1beta/{name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeleteMeasurementProtocolSecretRequest,
@@ -3076,12 +3083,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                         sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1beta/{name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -3091,22 +3092,18 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.DeleteMeasurementProtocolSecretRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3115,7 +3112,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3137,6 +3134,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v1beta/{name=properties/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.DeletePropertyRequest,
@@ -3164,30 +3170,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1beta/{name=properties/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_property(request, metadata)
             pb_request = analytics_admin.DeletePropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3196,7 +3192,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3226,6 +3222,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{name=accounts/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetAccountRequest,
@@ -3252,30 +3257,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{name=accounts/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_account(request, metadata)
             pb_request = analytics_admin.GetAccountRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3284,7 +3279,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3314,6 +3309,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{name=properties/*/conversionEvents/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetConversionEventRequest,
@@ -3341,32 +3345,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{name=properties/*/conversionEvents/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_conversion_event(
                 request, metadata
             )
             pb_request = analytics_admin.GetConversionEventRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3375,7 +3369,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3405,6 +3399,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{name=properties/*/customDimensions/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetCustomDimensionRequest,
@@ -3430,32 +3433,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a CustomDimension.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{name=properties/*/customDimensions/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_custom_dimension(
                 request, metadata
             )
             pb_request = analytics_admin.GetCustomDimensionRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3464,7 +3457,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3494,6 +3487,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{name=properties/*/customMetrics/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetCustomMetricRequest,
@@ -3519,32 +3521,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a custom metric.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{name=properties/*/customMetrics/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_custom_metric(
                 request, metadata
             )
             pb_request = analytics_admin.GetCustomMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3553,7 +3545,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3583,6 +3575,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{name=properties/*/dataRetentionSettings}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetDataRetentionSettingsRequest,
@@ -3611,32 +3612,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{name=properties/*/dataRetentionSettings}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_data_retention_settings(
                 request, metadata
             )
             pb_request = analytics_admin.GetDataRetentionSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3645,7 +3636,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3675,6 +3666,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{name=accounts/*/dataSharingSettings}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetDataSharingSettingsRequest,
@@ -3703,32 +3703,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{name=accounts/*/dataSharingSettings}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_data_sharing_settings(
                 request, metadata
             )
             pb_request = analytics_admin.GetDataSharingSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3737,7 +3727,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3767,6 +3757,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{name=properties/*/dataStreams/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetDataStreamRequest,
@@ -3794,30 +3793,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{name=properties/*/dataStreams/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_data_stream(request, metadata)
             pb_request = analytics_admin.GetDataStreamRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3826,7 +3815,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3856,6 +3845,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetMeasurementProtocolSecretRequest,
@@ -3884,32 +3882,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_measurement_protocol_secret(
                 request, metadata
             )
             pb_request = analytics_admin.GetMeasurementProtocolSecretRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -3918,7 +3906,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3948,6 +3936,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{name=properties/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.GetPropertyRequest,
@@ -3974,30 +3971,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{name=properties/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_property(request, metadata)
             pb_request = analytics_admin.GetPropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4006,7 +3993,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4026,6 +4013,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         def __hash__(self):
             return hash("ListAccounts")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/accounts",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListAccountsRequest,
@@ -4050,29 +4046,19 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     Request message for ListAccounts RPC.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/accounts",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_accounts(request, metadata)
             pb_request = analytics_admin.ListAccountsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4081,7 +4067,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4101,6 +4087,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         def __hash__(self):
             return hash("ListAccountSummaries")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/accountSummaries",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListAccountSummariesRequest,
@@ -4128,31 +4123,21 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/accountSummaries",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_account_summaries(
                 request, metadata
             )
             pb_request = analytics_admin.ListAccountSummariesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4161,7 +4146,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4191,6 +4176,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{parent=properties/*}/conversionEvents",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListConversionEventsRequest,
@@ -4218,32 +4212,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{parent=properties/*}/conversionEvents",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_conversion_events(
                 request, metadata
             )
             pb_request = analytics_admin.ListConversionEventsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4252,7 +4236,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4282,6 +4266,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{parent=properties/*}/customDimensions",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListCustomDimensionsRequest,
@@ -4309,32 +4302,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{parent=properties/*}/customDimensions",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_custom_dimensions(
                 request, metadata
             )
             pb_request = analytics_admin.ListCustomDimensionsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4343,7 +4326,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4373,6 +4356,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{parent=properties/*}/customMetrics",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListCustomMetricsRequest,
@@ -4400,32 +4392,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{parent=properties/*}/customMetrics",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_custom_metrics(
                 request, metadata
             )
             pb_request = analytics_admin.ListCustomMetricsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4434,7 +4416,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4464,6 +4446,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{parent=properties/*}/dataStreams",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListDataStreamsRequest,
@@ -4491,32 +4482,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{parent=properties/*}/dataStreams",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_data_streams(
                 request, metadata
             )
             pb_request = analytics_admin.ListDataStreamsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4525,7 +4506,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4555,6 +4536,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{parent=properties/*}/firebaseLinks",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListFirebaseLinksRequest,
@@ -4582,32 +4572,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{parent=properties/*}/firebaseLinks",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_firebase_links(
                 request, metadata
             )
             pb_request = analytics_admin.ListFirebaseLinksRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4616,7 +4596,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4646,6 +4626,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{parent=properties/*}/googleAdsLinks",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListGoogleAdsLinksRequest,
@@ -4673,32 +4662,22 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{parent=properties/*}/googleAdsLinks",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_google_ads_links(
                 request, metadata
             )
             pb_request = analytics_admin.ListGoogleAdsLinksRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4707,7 +4686,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4737,6 +4716,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/{parent=properties/*/dataStreams/*}/measurementProtocolSecrets",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListMeasurementProtocolSecretsRequest,
@@ -4765,34 +4753,24 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/{parent=properties/*/dataStreams/*}/measurementProtocolSecrets",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_measurement_protocol_secrets(
                 request, metadata
             )
             pb_request = analytics_admin.ListMeasurementProtocolSecretsRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4801,7 +4779,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4833,6 +4811,15 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v1beta/properties",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ListPropertiesRequest,
@@ -4860,30 +4847,20 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1beta/properties",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_properties(request, metadata)
             pb_request = analytics_admin.ListPropertiesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4892,7 +4869,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -4912,6 +4889,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         def __hash__(self):
             return hash("ProvisionAccountTicket")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/accounts:provisionAccountTicket",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.ProvisionAccountTicketRequest,
@@ -4939,18 +4926,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/accounts:provisionAccountTicket",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_provision_account_ticket(
                 request, metadata
             )
             pb_request = analytics_admin.ProvisionAccountTicketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -4962,16 +4942,12 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -4980,7 +4956,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5001,6 +4977,21 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
         def __hash__(self):
             return hash("RunAccessReport")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{entity=properties/*}:runAccessReport",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{entity=accounts/*}:runAccessReport",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.RunAccessReportRequest,
@@ -5028,23 +5019,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{entity=properties/*}:runAccessReport",
-                    "body": "*",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{entity=accounts/*}:runAccessReport",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_run_access_report(
                 request, metadata
             )
             pb_request = analytics_admin.RunAccessReportRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5056,16 +5035,12 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5074,7 +5049,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5105,6 +5080,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v1beta/{account=accounts/*}:searchChangeHistoryEvents",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.SearchChangeHistoryEventsRequest,
@@ -5133,18 +5118,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1beta/{account=accounts/*}:searchChangeHistoryEvents",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_search_change_history_events(
                 request, metadata
             )
             pb_request = analytics_admin.SearchChangeHistoryEventsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5156,17 +5134,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5175,7 +5149,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5208,6 +5182,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1beta/{account.name=accounts/*}",
+                    "body": "account",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateAccountRequest,
@@ -5235,16 +5219,9 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1beta/{account.name=accounts/*}",
-                    "body": "account",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_account(request, metadata)
             pb_request = analytics_admin.UpdateAccountRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5256,17 +5233,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5275,7 +5248,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5308,6 +5281,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1beta/{conversion_event.name=properties/*/conversionEvents/*}",
+                    "body": "conversion_event",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateConversionEventRequest,
@@ -5335,18 +5318,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1beta/{conversion_event.name=properties/*/conversionEvents/*}",
-                    "body": "conversion_event",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_conversion_event(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateConversionEventRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5358,17 +5334,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5377,7 +5349,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5410,6 +5382,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1beta/{custom_dimension.name=properties/*/customDimensions/*}",
+                    "body": "custom_dimension",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateCustomDimensionRequest,
@@ -5435,18 +5417,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a CustomDimension.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1beta/{custom_dimension.name=properties/*/customDimensions/*}",
-                    "body": "custom_dimension",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_custom_dimension(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateCustomDimensionRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5458,17 +5433,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5477,7 +5448,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5510,6 +5481,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1beta/{custom_metric.name=properties/*/customMetrics/*}",
+                    "body": "custom_metric",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateCustomMetricRequest,
@@ -5535,18 +5516,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                     A definition for a custom metric.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1beta/{custom_metric.name=properties/*/customMetrics/*}",
-                    "body": "custom_metric",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_custom_metric(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateCustomMetricRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5558,17 +5532,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5577,7 +5547,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5610,6 +5580,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1beta/{data_retention_settings.name=properties/*/dataRetentionSettings}",
+                    "body": "data_retention_settings",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateDataRetentionSettingsRequest,
@@ -5638,18 +5618,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1beta/{data_retention_settings.name=properties/*/dataRetentionSettings}",
-                    "body": "data_retention_settings",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_data_retention_settings(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateDataRetentionSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5661,17 +5634,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5680,7 +5649,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5713,6 +5682,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1beta/{data_stream.name=properties/*/dataStreams/*}",
+                    "body": "data_stream",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateDataStreamRequest,
@@ -5740,18 +5719,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1beta/{data_stream.name=properties/*/dataStreams/*}",
-                    "body": "data_stream",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_data_stream(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateDataStreamRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5763,17 +5735,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5782,7 +5750,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5815,6 +5783,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1beta/{google_ads_link.name=properties/*/googleAdsLinks/*}",
+                    "body": "google_ads_link",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateGoogleAdsLinkRequest,
@@ -5842,18 +5820,11 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1beta/{google_ads_link.name=properties/*/googleAdsLinks/*}",
-                    "body": "google_ads_link",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_google_ads_link(
                 request, metadata
             )
             pb_request = analytics_admin.UpdateGoogleAdsLinkRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5865,17 +5836,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5884,7 +5851,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -5917,6 +5884,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1beta/{measurement_protocol_secret.name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
+                    "body": "measurement_protocol_secret",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdateMeasurementProtocolSecretRequest,
@@ -5945,13 +5922,6 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1beta/{measurement_protocol_secret.name=properties/*/dataStreams/*/measurementProtocolSecrets/*}",
-                    "body": "measurement_protocol_secret",
-                },
-            ]
             (
                 request,
                 metadata,
@@ -5961,7 +5931,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             pb_request = analytics_admin.UpdateMeasurementProtocolSecretRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -5973,17 +5943,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -5992,7 +5958,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -6025,6 +5991,16 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v1beta/{property.name=properties/*}",
+                    "body": "property",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: analytics_admin.UpdatePropertyRequest,
@@ -6052,16 +6028,9 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1beta/{property.name=properties/*}",
-                    "body": "property",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_property(request, metadata)
             pb_request = analytics_admin.UpdatePropertyRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -6073,17 +6042,13 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -6092,7 +6057,7 @@ class AnalyticsAdminServiceRestTransport(AnalyticsAdminServiceTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.analytics.admin_helpers import caching
+from google.analytics.admin_v1alpha.types import analytics_admin, resources
+
+_NAME = "properties/1"
+# Analytics Admin methods have no default retry, so none is cached unless named.
+_TTLS = {"get_property": 60.0}
+
+
+def _credentials(caller):
+    credentials = ga_credentials.AnonymousCredentials()
+    credentials.service_account_email = caller
+    return credentials
+
+
+def test_repeated_call_is_answered_from_cache(server, grpc_client):
+    cache = caching.ResponseCache(ttls=_TTLS)
+    client = grpc_client(cache)
+
+    first = client.get_property(name=_NAME)
+    second = client.get_property(name=_NAME)
+    client.get_property(name=_NAME + "2")
+
+    assert first == second
+    assert second.time_zone == "UTC"
+    assert len(server.requests) == 2
+    assert cache.stats() == {
+        "get_property": {"hits": 1, "misses": 2, "negative_hits": 0}
+    }
+
+
+@pytest.mark.parametrize("ttls,rpcs", [({}, 2), (_TTLS, 1)])
+def test_methods_without_retry_cached_only_when_named(ttls, rpcs, server, grpc_client):
+    client = grpc_client(caching.ResponseCache(ttls=ttls))
+
+    for _ in range(2):
+        client.get_property(name=_NAME)
+
+    assert len(server.requests) == rpcs
+
+
+def test_pages_cached_when_named(server, grpc_client):
+    client = grpc_client(caching.ResponseCache(ttls={"list_properties": 10.0}))
+
+    for _ in range(2):
+        properties = client.list_properties(request={"filter": "parent:accounts/1"})
+        assert [p.name for p in properties] == ["a", "b", "c"]
+
+    assert len(server.requests) == 2
+
+
+def test_not_found_cached_for_negative_ttl(server, grpc_client):
+    cache = caching.ResponseCache(ttls=_TTLS, negative_ttl=10.0)
+    server.error = core_exceptions.NotFound("no such property")
+    client = grpc_client(cache)
+
+    for _ in range(2):
+        with pytest.raises(core_exceptions.NotFound):
+            client.get_property(name=_NAME)
+
+    assert len(server.requests) == 1
+
+
+def test_transports_of_other_callers_do_not_share(server, grpc_client):
+    cache = caching.ResponseCache(ttls=_TTLS)
+    client = grpc_client(cache, credentials=_credentials("a@p.iam.gserviceaccount.com"))
+    other_client = grpc_client(
+        cache, credentials=_credentials("b@p.iam.gserviceaccount.com")
+    )
+
+    client.get_property(name=_NAME)
+    other_client.get_property(name=_NAME)
+    client.get_property(name=_NAME)
+
+    assert len(server.requests) == 2
+
+
+def test_invalidate(server, grpc_client):
+    cache = caching.ResponseCache(ttls=_TTLS)
+    client = grpc_client(cache)
+
+    client.get_property(name=_NAME)
+    cache.invalidate("get_property", analytics_admin.GetPropertyRequest(name=_NAME))
+    client.get_property(name=_NAME)
+
+    assert len(server.requests) == 2
+
+
+def test_disk_entries_decoded_as_service_types(tmp_path, server, grpc_client):
+    path = str(tmp_path / "cache.sqlite")
+    credentials = _credentials("a@p.iam.gserviceaccount.com")
+    grpc_client(
+        caching.ResponseCache(caching.DiskBackend(path), ttls=_TTLS),
+        credentials=credentials,
+    ).get_property(name=_NAME)
+
+    # A new cache on the same file, as after a restart.
+    cache = caching.ResponseCache(caching.DiskBackend(path), ttls=_TTLS)
+    client = grpc_client(cache, credentials=credentials)
+    response = client.get_property(name=_NAME)
+
+    assert isinstance(response, resources.Property)
+    assert response.name == _NAME
+    assert len(server.requests) == 1
+
+
+def test_async_repeated_call_is_answered_from_cache(server, async_client):
+    cache = caching.ResponseCache(ttls=_TTLS)
+
+    async def main():
+        client = async_client(cache)
+        return [await client.get_property(name=_NAME) for _ in range(3)]
+
+    responses = asyncio.run(main())
+
+    assert [r.name for r in responses] == [_NAME] * 3
+    assert len(server.requests) == 1
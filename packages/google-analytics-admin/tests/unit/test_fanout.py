@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.analytics.admin_v1alpha.types import analytics_admin
+
+_NAME = "properties/1"
+
+
+def _requests(count):
+    return [
+        analytics_admin.GetPropertyRequest(name="{}{}".format(_NAME, i))
+        for i in range(count)
+    ]
+
+
+def _summary(results):
+    return [
+        (r.index, r.response.name if r.exception is None else type(r.exception))
+        for r in results
+    ]
+
+
+def test_ordered_results_capture_errors(server, grpc_client):
+    server.errors = [None, core_exceptions.NotFound("no such property")]
+    client = grpc_client()
+
+    results = list(client.batch_call("get_property", _requests(3), max_concurrency=1))
+
+    assert _summary(results) == [
+        (0, _NAME + "0"),
+        (1, core_exceptions.NotFound),
+        (2, _NAME + "2"),
+    ]
+
+
+def test_concurrency_bounded(server, grpc_client):
+    server.delay = 0.02
+    client = grpc_client()
+
+    results = list(client.batch_call("get_property", _requests(12), max_concurrency=3))
+
+    assert [r.index for r in results] == list(range(12))
+    assert server.max_in_flight <= 3
+
+
+def test_unknown_method_rejected(grpc_client):
+    with pytest.raises(ValueError):
+        grpc_client().batch_call("no_such_method", [])
+
+
+def test_async_ordered_results_capture_errors(server, async_client):
+    server.errors = [None, core_exceptions.NotFound("no such property")]
+
+    async def main():
+        client = async_client()
+        return [
+            result
+            async for result in client.batch_call(
+                "get_property", _requests(3), max_concurrency=1
+            )
+        ]
+
+    results = asyncio.run(main())
+
+    assert _summary(results) == [
+        (0, _NAME + "0"),
+        (1, core_exceptions.NotFound),
+        (2, _NAME + "2"),
+    ]
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+
+from google.analytics.admin_helpers import forking
+from google.analytics.admin_v1alpha.services.analytics_admin_service import transports
+
+
+def _forked():
+    """Make the guards behave as in a child forked after their creation."""
+    return mock.patch.object(forking, "_generation", forking._generation + 1)
+
+
+def test_grpc_transport_reopens_channel():
+    with mock.patch.object(
+        transports.AnalyticsAdminServiceGrpcTransport,
+        "create_channel",
+        side_effect=lambda *args, **kwargs: mock.Mock(),
+    ) as create_channel:
+        transport = transports.AnalyticsAdminServiceGrpcTransport(
+            credentials=ga_credentials.AnonymousCredentials()
+        )
+        inherited = transport.grpc_channel
+        stub = transport.get_property
+        wrapped = transport._wrapped_methods[stub]
+
+        with _forked():
+            wrapped_methods = transport._wrapped_methods
+
+    assert create_channel.call_count == 2
+    assert transport.grpc_channel is not inherited
+    assert transport.get_property is not stub
+    assert wrapped_methods[transport.get_property] is not wrapped
+
+
+def test_rest_transport_reopens_session():
+    credentials = ga_credentials.AnonymousCredentials()
+    transport = transports.AnalyticsAdminServiceRestTransport(credentials=credentials)
+    inherited = transport._session
+
+    with _forked():
+        transport._wrapped_methods
+
+    assert transport._session is not inherited
+    assert transport._session.credentials is credentials
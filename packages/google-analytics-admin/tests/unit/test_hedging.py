@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+
+from google.analytics.admin_helpers import hedging
+
+_NAME = "properties/1"
+
+
+def test_slow_attempt_of_named_method_is_hedged(server, grpc_client):
+    hedges = hedging.Hedging(methods=["get_property"], initial_delay=0.02)
+    server.delays = [0.5, 0.0]
+    client = grpc_client(hedges)
+
+    started = time.monotonic()
+    response = client.get_property(name=_NAME)
+    elapsed = time.monotonic() - started
+
+    assert response.name == _NAME
+    assert elapsed < 0.4
+    assert len(server.calls) == 2
+    assert (hedges.attempts, hedges.hedges) == (1, 1)
+
+
+def test_method_without_retry_is_not_hedged_unless_named(server, grpc_client):
+    hedges = hedging.Hedging(initial_delay=0.0)
+    server.delays = [0.05]
+    client = grpc_client(hedges)
+
+    client.get_property(name=_NAME)
+
+    assert len(server.calls) == 1
+    assert hedges.attempts == 0
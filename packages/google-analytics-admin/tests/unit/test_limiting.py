@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from concurrent import futures
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.analytics.admin_helpers import limiting
+
+_NAME = "properties/1"
+
+
+def test_concurrency_is_limited(server, grpc_client):
+    limiter = limiting.Limiter(initial_limit=3, max_limit=3)
+    server.delay = 0.02
+    client = grpc_client(limiter)
+
+    with futures.ThreadPoolExecutor(max_workers=12) as pool:
+        for _ in range(12):
+            pool.submit(client.get_property, name=_NAME)
+
+    assert len(server.calls) == 12
+    assert server.max_in_flight == 3
+    assert limiter.throttled > 0
+
+
+def test_overload_cuts_limit(server, grpc_client):
+    limiter = limiting.Limiter(initial_limit=8, backoff=0.5)
+    server.errors = [core_exceptions.ResourceExhausted("quota")]
+    client = grpc_client(limiter)
+
+    with pytest.raises(core_exceptions.ResourceExhausted):
+        client.get_property(name=_NAME)
+
+    assert limiter.limit("get_property") == 4
+
+
+def test_async_concurrency_is_limited(server, async_client):
+    limiter = limiting.Limiter(initial_limit=2, max_limit=2)
+    server.delay = 0.02
+
+    async def main():
+        client = async_client(limiter)
+        return await asyncio.gather(
+            *(client.get_property(name=_NAME) for _ in range(6))
+        )
+
+    responses = asyncio.run(main())
+
+    assert [r.name for r in responses] == [_NAME] * 6
+    assert server.max_in_flight == 2
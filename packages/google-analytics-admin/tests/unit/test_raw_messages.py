@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+from google.analytics.admin_helpers import raw_messages
+from google.analytics.admin_v1alpha.types import resources
+
+_FILTER = "parent:accounts/1"
+_NAME = "properties/1"
+
+
+def test_response_is_protobuf(grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+
+    response = client.get_property(name=_NAME)
+
+    assert type(response) is resources.Property.pb()
+    assert response.time_zone == "UTC"
+
+
+def test_pager_yields_protobuf_items(server, grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+
+    properties = list(client.list_properties(request={"filter": _FILTER}))
+
+    assert [type(p) for p in properties] == [resources.Property.pb()] * 3
+    assert [p.name for p in properties] == ["a", "b", "c"]
+    assert [r.page_token for r in server.requests] == ["", "2"]
+
+
+def test_async_pager_yields_protobuf_items(async_client):
+    async def main():
+        client = async_client(raw_messages.RawMessages(), methods=["list_properties"])
+        pager = await client.list_properties(request={"filter": _FILTER})
+        return [p async for p in pager]
+
+    properties = asyncio.run(main())
+
+    assert [type(p) for p in properties] == [resources.Property.pb()] * 3
+    assert [p.name for p in properties] == ["a", "b", "c"]
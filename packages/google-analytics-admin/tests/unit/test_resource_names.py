@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+
+import pytest
+
+from google.analytics.admin_helpers import resource_names
+from google.analytics.admin_v1alpha import (
+    AnalyticsAdminServiceAsyncClient,
+    AnalyticsAdminServiceClient,
+)
+
+_DATA_STREAM = "properties/{property}/dataStreams/{data_stream}"
+
+
+def _generated_parse(template, path):
+    # The code the generator emits for parse_*_path.
+    pattern = "^" + re.sub(r"\{(\w+)\}", r"(?P<\1>.+?)", template) + "$"
+    m = re.match(pattern, path)
+    return m.groupdict() if m else {}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "properties/1/dataStreams/2",
+        "properties/1/dataStreams/2/3",
+        "properties/1/2/dataStreams/3",
+        "properties/1/dataStreams/",
+        "properties/1/dataStreams/2\n",
+        "properties/1",
+        "",
+    ],
+)
+def test_parse_matches_generated_code(path):
+    parsed = resource_names.ResourceName(_DATA_STREAM).parse(path)
+
+    assert parsed == _generated_parse(_DATA_STREAM, path)
+
+
+def test_client_methods():
+    path = AnalyticsAdminServiceClient.data_stream_path("1", "2")
+    fields = {"property": "1", "data_stream": "2"}
+
+    assert path == "properties/1/dataStreams/2"
+    assert AnalyticsAdminServiceClient.parse_data_stream_path(path) == fields
+    assert AnalyticsAdminServiceAsyncClient.parse_data_stream_path(path) == fields
+    assert AnalyticsAdminServiceClient.parse_account_path(path) == {}
+    assert AnalyticsAdminServiceClient.common_project_path("p") == "projects/p"
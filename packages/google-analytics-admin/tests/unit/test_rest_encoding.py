@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+from google.api_core import rest_helpers
+from google.protobuf import field_mask_pb2, json_format, timestamp_pb2
+import pytest
+
+from google.analytics.admin_helpers import rest_encoding
+from google.analytics.admin_v1alpha.types import analytics_admin, resources
+
+
+def _legacy(message, use_integers_for_enums=True):
+    query_params = json.loads(
+        json_format.MessageToJson(
+            message,
+            including_default_value_fields=False,
+            use_integers_for_enums=use_integers_for_enums,
+        )
+    )
+    return rest_helpers.flatten_query_params(query_params, strict=True)
+
+
+MESSAGES = [
+    analytics_admin.ListPropertiesRequest.pb(analytics_admin.ListPropertiesRequest()),
+    analytics_admin.ListPropertiesRequest.pb(
+        analytics_admin.ListPropertiesRequest(
+            filter="parent:accounts/1",
+            page_size=50,
+            page_token="token/with?reserved&chars",
+            show_deleted=True,
+        )
+    ),
+    analytics_admin.UpdatePropertyRequest.pb(
+        analytics_admin.UpdatePropertyRequest(
+            update_mask=field_mask_pb2.FieldMask(paths=["display_name", "time_zone"]),
+            property=resources.Property(
+                name="properties/1",
+                display_name="two words",
+                create_time=timestamp_pb2.Timestamp(seconds=1700000000, nanos=1000),
+                property_type=resources.PropertyType.PROPERTY_TYPE_ORDINARY,
+                industry_category=resources.IndustryCategory.TRAVEL,
+                service_level=resources.ServiceLevel.GOOGLE_ANALYTICS_360,
+            ),
+        )
+    ),
+]
+
+
+@pytest.mark.parametrize("use_integers_for_enums", [True, False])
+@pytest.mark.parametrize("message", MESSAGES)
+def test_message_to_query_params_matches_json_round_trip(
+    message, use_integers_for_enums
+):
+    assert rest_encoding.message_to_query_params(
+        message, use_integers_for_enums=use_integers_for_enums
+    ) == _legacy(message, use_integers_for_enums=use_integers_for_enums)
+
+
+def test_false_bool_is_not_sent():
+    message = analytics_admin.ListPropertiesRequest.pb(
+        analytics_admin.ListPropertiesRequest(filter="parent:accounts/1")
+    )
+
+    assert rest_encoding.message_to_query_params(message) == [
+        ("filter", "parent:accounts/1")
+    ]
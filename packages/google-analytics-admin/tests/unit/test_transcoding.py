@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+
+from google.api_core import path_template
+import pytest
+
+from google.analytics.admin_helpers import transcoding
+from google.analytics.admin_v1alpha.services.analytics_admin_service.transports import (
+    rest,
+)
+from google.analytics.admin_v1alpha.types import analytics_admin, resources
+
+_STUBS = sorted(
+    (name, stub)
+    for name, stub in vars(rest.AnalyticsAdminServiceRestTransport).items()
+    if isinstance(getattr(stub, "_TRANSCODER", None), transcoding.Transcoder)
+)
+# Methods such as ListProperties take no fields in their path, so any
+# request matches them.
+_PATH_STUBS = [
+    (name, stub)
+    for name, stub in _STUBS
+    if "{" in stub._TRANSCODER.http_options[0]["uri"]
+]
+
+
+def _request(stub):
+    cls = stub.__call__.__annotations__["request"]
+    pb = getattr(cls, "pb", None)
+    return pb(cls()) if pb is not None else cls()
+
+
+def _fill(message, uri):
+    """Set the fields of a URI template to values that match it."""
+    for match in re.finditer(r"{([^=}]+)(?:=([^}]+))?}", uri):
+        *parents, name = match.group(1).split(".")
+        value = (match.group(2) or "*").replace("**", "a/b").replace("*", "x")
+        target = message
+        for parent in parents:
+            target = getattr(target, parent)
+        setattr(target, name, value)
+    return message
+
+
+def _transcode_both(transcoder, message):
+    expected = path_template.transcode(transcoder.http_options, message)
+    assert transcoder.transcode(message) == expected
+    return expected
+
+
+@pytest.mark.parametrize("name,stub", _STUBS, ids=[name for name, _ in _STUBS])
+def test_matches_path_template(name, stub):
+    transcoder = stub._TRANSCODER
+    message = _fill(_request(stub), transcoder.http_options[0]["uri"])
+
+    transcoded = _transcode_both(transcoder, message)
+
+    assert transcoded["uri"].startswith("/v1alpha/")
+
+
+@pytest.mark.parametrize(
+    "name,stub", _PATH_STUBS, ids=[name for name, _ in _PATH_STUBS]
+)
+def test_mismatch_raises_path_template_error(name, stub):
+    with pytest.raises(ValueError) as expected:
+        path_template.transcode(stub._TRANSCODER.http_options, _request(stub))
+
+    with pytest.raises(ValueError, match=re.escape(str(expected.value))):
+        stub._TRANSCODER.transcode(_request(stub))
+
+
+def test_query_params_and_body():
+    transcoder = rest.AnalyticsAdminServiceRestTransport._UpdateProperty._TRANSCODER
+    request = analytics_admin.UpdatePropertyRequest(
+        property=resources.Property(name="properties/1", display_name="d"),
+        update_mask={"paths": ["display_name"]},
+    )
+
+    transcoded = _transcode_both(
+        transcoder, analytics_admin.UpdatePropertyRequest.pb(request)
+    )
+
+    assert transcoded["method"] == "patch"
+    assert transcoded["uri"] == "/v1alpha/properties/1"
+    assert transcoded["body"].display_name == "d"
+    assert transcoded["query_params"].update_mask.paths == ["display_name"]
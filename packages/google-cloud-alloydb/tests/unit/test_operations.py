@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from concurrent import futures
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import operation
+from google.auth import credentials as ga_credentials
+from google.longrunning import operations_pb2
+from google.rpc import status_pb2
+import pytest
+
+from google.cloud.alloydb_helpers import operations
+from google.cloud.alloydb_v1 import AlloyDBAdminClient
+from google.cloud.alloydb_v1.types import resources, service
+
+_PARENT = "projects/p/locations/l"
+
+
+def _name(i, parent=_PARENT):
+    return "{}/operations/op{}".format(parent, i)
+
+
+class _Server:
+    """Serves operations that complete after a number of RPCs."""
+
+    def __init__(
+        self,
+        done_after,
+        list_error=None,
+        page_size=None,
+        fail=(),
+        unlisted=(),
+        errors=(),
+    ):
+        self.done_after = done_after
+        # Raised by the first calls.
+        self.errors = list(errors)
+        self.unlisted = unlisted
+        self.list_error = list_error
+        self.page_size = page_size
+        self.fail = fail
+        self.requests = []
+
+    def _state(self, name):
+        state = operations_pb2.Operation(name=name)
+        if len(self.requests) >= self.done_after[name]:
+            state.done = True
+            if name in self.fail:
+                state.error.CopyFrom(status_pb2.Status(code=5, message="gone"))
+            else:
+                response = resources.Cluster(name=name + "-cluster")
+                state.response.Pack(resources.Cluster.pb(response))
+        return state
+
+    def __call__(self, request, timeout=None, metadata=(), compression=None):
+        self.requests.append(request)
+        if self.errors:
+            raise self.errors.pop(0)
+        if isinstance(request, operations_pb2.GetOperationRequest):
+            return self._state(request.name)
+        if self.list_error is not None:
+            raise self.list_error
+        names = sorted(
+            n
+            for n in self.done_after
+            if n.startswith(request.name + "/") and n not in self.unlisted
+        )
+        start = int(request.page_token or 0)
+        end = len(names) if self.page_size is None else start + self.page_size
+        return operations_pb2.ListOperationsResponse(
+            operations=[self._state(n) for n in names[start:end]],
+            next_page_token=str(end) if end < len(names) else "",
+        )
+
+
+def _waiter(server, **kwargs):
+    client = AlloyDBAdminClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="grpc"
+    )
+    patcher = mock.patch.object(
+        type(client.transport.list_operations), "__call__", side_effect=server
+    )
+    kwargs.setdefault("initial_delay", 0.0)
+    kwargs.setdefault("max_delay", 0.01)
+    return client, operations.Waiter(client, **kwargs), patcher
+
+
+def _futures(client, names):
+    return [
+        operation.from_gapic(
+            operations_pb2.Operation(name=name),
+            client.transport.operations_client,
+            resources.Cluster,
+            metadata_type=service.OperationMetadata,
+        )
+        for name in names
+    ]
+
+
+def test_operations_polled_in_shared_rounds():
+    names = [_name(i) for i in range(5)]
+    server = _Server({name: i + 1 for i, name in enumerate(names)})
+    client, waiter, patcher = _waiter(server)
+
+    with patcher:
+        completed = list(waiter.as_completed(_futures(client, names)))
+
+    assert [f.operation.name for f in completed] == names
+    assert [f.result().name for f in completed] == [n + "-cluster" for n in names]
+    # One list per round; each completed operation then refreshes itself.
+    assert [type(r).__name__ for r in server.requests] == [
+        "ListOperationsRequest",
+        "GetOperationRequest",
+        "ListOperationsRequest",
+        "GetOperationRequest",
+        "GetOperationRequest",
+        "ListOperationsRequest",
+        "GetOperationRequest",
+        "GetOperationRequest",
+    ]
+    assert (waiter.rounds, waiter.rpcs) == (3, 8)
+
+
+def test_completed_operations_yielded_without_rpcs():
+    server = _Server({_name(0): 0})
+    client, waiter, patcher = _waiter(server)
+    done = operations_pb2.Operation(name=_name(0), done=True)
+    future = operation.from_gapic(
+        done, client.transport.operations_client, resources.Cluster
+    )
+
+    with patcher:
+        assert list(waiter.as_completed([future])) == [future]
+
+    assert server.requests == []
+
+
+def test_operations_under_each_parent_listed_separately():
+    names = [_name(i, parent) for parent in ("a", "b") for i in range(2)]
+    server = _Server(dict.fromkeys(names, 1))
+    client, waiter, patcher = _waiter(server)
+
+    with patcher:
+        assert len(list(waiter.as_completed(_futures(client, names)))) == 4
+
+    lists = [
+        r.name
+        for r in server.requests
+        if isinstance(r, operations_pb2.ListOperationsRequest)
+    ]
+    assert lists == ["a", "b"]
+
+
+def test_operation_missing_from_list_is_got():
+    names = [_name(i) for i in range(3)]
+    server = _Server(dict.fromkeys(names, 1), unlisted={names[2]})
+    client, waiter, patcher = _waiter(server)
+
+    with patcher:
+        assert len(list(waiter.as_completed(_futures(client, names)))) == 3
+
+    assert [type(r).__name__ for r in server.requests] == ["ListOperationsRequest"] + [
+        "GetOperationRequest"
+    ] * 3
+    assert [r.name for r in server.requests[1:]] == names
+
+
+def test_unimplemented_list_falls_back_to_get():
+    names = [_name(i) for i in range(2)]
+    server = _Server(
+        dict.fromkeys(names, 4), list_error=core_exceptions.MethodNotImplemented("")
+    )
+    client, waiter, patcher = _waiter(server)
+
+    with patcher:
+        assert len(list(waiter.as_completed(_futures(client, names)))) == 2
+
+    # The list is tried once only.
+    kinds = [type(r).__name__ for r in server.requests]
+    assert kinds.count("ListOperationsRequest") == 1
+    assert kinds.count("GetOperationRequest") == 4
+
+
+def test_listing_stops_when_getting_is_cheaper():
+    names = [_name(i) for i in range(3)]
+    # Ten older operations are listed first, one per page.
+    older = ["{}/operations/a{}".format(_PARENT, i) for i in range(10)]
+    server = _Server(dict.fromkeys(names + older, 0), page_size=1)
+    client, waiter, patcher = _waiter(server)
+
+    with patcher:
+        assert len(list(waiter.as_completed(_futures(client, names)))) == 3
+
+    kinds = [type(r).__name__ for r in server.requests]
+    assert kinds == ["ListOperationsRequest"] * 3 + ["GetOperationRequest"] * 3
+
+
+def test_failed_operation():
+    names = [_name(i) for i in range(2)]
+    server = _Server(dict.fromkeys(names, 1), fail={names[0]})
+    client, waiter, patcher = _waiter(server)
+
+    with patcher:
+        completed = list(waiter.as_completed(_futures(client, names)))
+
+    with pytest.raises(core_exceptions.NotFound, match="gone"):
+        completed[0].result()
+    assert completed[1].result().name == names[1] + "-cluster"
+
+
+def test_delay_grows_while_nothing_completes():
+    names = [_name(i) for i in range(2)]
+    server = _Server({names[0]: 3, names[1]: 4})
+    client, waiter, patcher = _waiter(
+        server, initial_delay=1.0, max_delay=3.0, multiplier=2.0
+    )
+
+    with patcher, mock.patch.object(operations.time, "sleep") as sleep:
+        list(waiter.as_completed(_futures(client, names)))
+
+    assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0, 3.0, 1.5]
+
+
+def test_timeout():
+    server = _Server({_name(0): 1000})
+    client, waiter, patcher = _waiter(server)
+
+    with patcher:
+        with pytest.raises(futures.TimeoutError, match="1 operations"):
+            list(waiter.as_completed(_futures(client, [_name(0)]), timeout=0.05))
+
+
+def test_transient_list_error_polls_again_next_round():
+    names = [_name(i) for i in range(2)]
+    server = _Server(
+        dict.fromkeys(names, 0), errors=[core_exceptions.ServiceUnavailable("")]
+    )
+    client, waiter, patcher = _waiter(server)
+
+    with patcher:
+        assert len(list(waiter.as_completed(_futures(client, names)))) == 2
+
+    assert (waiter.rounds, waiter.errors) == (2, 1)
+
+
+def test_transient_get_error_polls_again_next_round():
+    server = _Server({_name(0): 0}, errors=[core_exceptions.InternalServerError("")])
+    client, waiter, patcher = _waiter(server)
+
+    with patcher:
+        (completed,) = waiter.as_completed(_futures(client, [_name(0)]))
+
+    assert completed.result().name == _name(0) + "-cluster"
+    assert (waiter.rounds, waiter.errors) == (2, 1)
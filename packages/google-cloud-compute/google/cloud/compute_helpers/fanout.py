@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Issuing one RPC for each of many requests, with bounded concurrency.
+
+The generated clients inherit ``batch_call`` from :class:`FanOutMixin`,
+which makes the calls on a thread pool.
+"""
+
+from concurrent import futures
+import dataclasses
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+
+
+@dataclasses.dataclass(frozen=True)
+class CallResult:
+    """The outcome of one call made by ``batch_call``.
+
+    Attributes:
+        index (int): The position of the request in the input.
+        request (Any): The request.
+        response (Any): The response, or ``None`` if the call failed.
+        exception (Optional[Exception]): The error the call raised, if any.
+    """
+
+    index: int
+    request: Any
+    response: Any = None
+    exception: Optional[Exception] = None
+
+    def result(self) -> Any:
+        """Return the response, or raise the error the call raised."""
+        if self.exception is not None:
+            raise self.exception
+        return self.response
+
+
+class _Batch:
+    """State shared by the calls of one ``batch_call``."""
+
+    def __init__(self, client, method, max_concurrency, timeout, retry, metadata):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if method.startswith("_") or not callable(getattr(client, method, None)):
+            raise ValueError("{!r} is not a method of the client".format(method))
+        self.method = getattr(client, method)
+        self.max_concurrency = max_concurrency
+        self.retry = retry
+        self.metadata = metadata
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+
+    def call_kwargs(self):
+        """Return the per-call arguments, or ``None`` once past the deadline."""
+        if self.deadline is None:
+            timeout = gapic_v1.method.DEFAULT
+        else:
+            timeout = self.deadline - time.monotonic()
+            if timeout <= 0:
+                return None
+        return {"retry": self.retry, "timeout": timeout, "metadata": self.metadata}
+
+    @staticmethod
+    def expired(index, request) -> CallResult:
+        return CallResult(
+            index,
+            request,
+            exception=core_exceptions.DeadlineExceeded(
+                "The batch deadline passed before the call was made."
+            ),
+        )
+
+
+class _Order:
+    """Holds results back until all earlier ones have been returned.
+
+    Calls are only started for requests within ``window`` of the earliest
+    result not yet returned, so that a slow call holds back a bounded
+    number of results.
+    """
+
+    def __init__(self, ordered: bool, max_concurrency: int):
+        self.ordered = ordered
+        self.window = 2 * max_concurrency
+        self.started = 0
+        self._held: Dict[int, CallResult] = {}
+        self._next = 0
+
+    def may_start(self) -> bool:
+        """Whether a call may be started for the next request."""
+        return not self.ordered or self.started < self._next + self.window
+
+    def add(self, result: CallResult) -> Iterator[CallResult]:
+        """Return the results that are now due, in order."""
+        if not self.ordered:
+            yield result
+            return
+        self._held[result.index] = result
+        while self._next in self._held:
+            yield self._held.pop(self._next)
+            self._next += 1
+
+
+class FanOutMixin:
+    """Adds :meth:`batch_call` to a synchronous client."""
+
+    def batch_call(
+        self,
+        method: str,
+        requests: Iterable[Any],
+        *,
+        max_concurrency: int = 10,
+        ordered: bool = True,
+        timeout: Optional[float] = None,
+        retry: Any = gapic_v1.method.DEFAULT,
+        metadata: Any = (),
+    ) -> Iterator[CallResult]:
+        """Call ``method`` once per request, several calls at a time.
+
+        .. code-block:: python
+
+            for result in client.batch_call("get", requests):
+                if result.exception is None:
+                    print(result.response.status)
+
+        Requests are read from ``requests`` as calls finish, so it may be a
+        long or lazy iterable. A failed call does not stop the batch; its
+        error is returned in its :class:`CallResult`.
+
+        Args:
+            method (str): The name of the client method to call, for example
+                ``"get"``.
+            requests (Iterable[Any]): The requests, each a request message or
+                a dict, passed to the method as ``request``.
+            max_concurrency (int): The largest number of calls in progress at
+                once, each on its own thread.
+            ordered (bool): Whether to return the results in the order of the
+                requests. Otherwise each result is returned as soon as its
+                call finishes. In order, calls are only started for the
+                ``2 * max_concurrency`` requests after the earliest whose
+                result has not been returned, so a slow call holds back a
+                bounded number of results.
+            timeout (Optional[float]): Seconds the whole batch may take. Each
+                call is given the time that remains, and calls not yet made
+                when it runs out fail with
+                :class:`~google.api_core.exceptions.DeadlineExceeded`. By
+                default every call uses the method's own timeout.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried, for every call.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with every request as metadata.
+
+        Returns:
+            Iterator[CallResult]: One result per request.
+
+        Raises:
+            ValueError: If ``method`` is not a method of the client, or
+                ``max_concurrency`` or ``timeout`` is not positive.
+        """
+        batch = _Batch(self, method, max_concurrency, timeout, retry, metadata)
+        return self._run_batch(batch, requests, _Order(ordered, max_concurrency))
+
+    @staticmethod
+    def _run_batch(
+        batch: _Batch, requests: Iterable[Any], order: _Order
+    ) -> Iterator[CallResult]:
+        def call(index, request):
+            kwargs = batch.call_kwargs()
+            if kwargs is None:
+                return batch.expired(index, request)
+            try:
+                return CallResult(index, request, batch.method(request, **kwargs))
+            except Exception as exc:
+                return CallResult(index, request, exception=exc)
+
+        pending = enumerate(requests)
+        executor = futures.ThreadPoolExecutor(max_workers=batch.max_concurrency)
+        running = set()
+        try:
+            while True:
+                while len(running) < batch.max_concurrency and order.may_start():
+                    item = next(pending, None)
+                    if item is None:
+                        break
+                    running.add(executor.submit(call, *item))
+                    order.started += 1
+                if not running:
+                    return
+                done, running = futures.wait(
+                    running, return_when=futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield from order.add(future.result())
+        finally:
+            # Reached early if the caller stops iterating.
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+__all__ = (
+    "CallResult",
+    "FanOutMixin",
+)
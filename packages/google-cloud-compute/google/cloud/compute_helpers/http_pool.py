@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Connection pool settings for the Compute REST transports.
+
+Each REST transport sends its requests through one ``AuthorizedSession``,
+whose ``requests`` adapters keep at most 10 idle connections per host.
+When more threads than that share a transport, every request beyond the
+tenth opens a new TLS connection and throws it away afterwards.
+:class:`HttpPoolOptions` resizes the pools, and can enable TCP keep-alive
+probes and retries of failed connection attempts.
+"""
+
+import dataclasses
+import socket
+from typing import List, Optional, Tuple
+
+from requests import adapters
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+
+@dataclasses.dataclass(frozen=True)
+class HttpPoolOptions:
+    """HTTP connection pool settings for a REST transport.
+
+    Attributes:
+        pool_connections (int): The number of hosts to keep connection
+            pools for.
+        pool_maxsize (int): The maximum number of connections kept open
+            to one host. Set it to the number of threads sharing the
+            transport.
+        pool_block (bool): Whether a request waits for a free connection
+            when ``pool_maxsize`` are in use, instead of opening a
+            connection that is closed after the request.
+        tcp_keepalive (Optional[float]): Seconds a connection may be idle
+            before TCP keep-alive probes are sent, or ``None`` to leave
+            keep-alive off. Probes stop idle connections from being dropped
+            by NAT gateways and load balancers.
+        connect_retries (int): How many times to retry a failed attempt to
+            connect to the server. Requests are never resent once any of
+            them may have reached the server.
+    """
+
+    pool_connections: int = adapters.DEFAULT_POOLSIZE
+    pool_maxsize: int = adapters.DEFAULT_POOLSIZE
+    pool_block: bool = adapters.DEFAULT_POOLBLOCK
+    tcp_keepalive: Optional[float] = None
+    connect_retries: int = 0
+
+    def __post_init__(self):
+        if self.pool_connections < 1 or self.pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1")
+        if self.tcp_keepalive is not None and self.tcp_keepalive <= 0:
+            raise ValueError("tcp_keepalive must be positive")
+        if self.connect_retries < 0:
+            raise ValueError("connect_retries must be non-negative")
+
+    def socket_options(self) -> List[Tuple[int, int, int]]:
+        """Return the socket options for new connections."""
+        options = list(HTTPConnection.default_socket_options)
+        if self.tcp_keepalive is not None:
+            idle = max(1, int(self.tcp_keepalive))
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # TCP_KEEPALIVE is the macOS spelling of TCP_KEEPIDLE.
+            for name in ("TCP_KEEPIDLE", "TCP_KEEPALIVE"):
+                if hasattr(socket, name):
+                    options.append((socket.IPPROTO_TCP, getattr(socket, name), idle))
+                    break
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                interval = max(1, idle // 4)
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+        return options
+
+    def apply(self, session) -> None:
+        """Reconfigure the adapters mounted on ``session`` in place.
+
+        Adapters are reconfigured rather than replaced so that one set up by
+        ``configure_mtls_channel`` keeps its client certificate.
+
+        Args:
+            session (requests.Session): The session to configure.
+        """
+        for adapter in session.adapters.values():
+            if not isinstance(adapter, adapters.HTTPAdapter):
+                continue
+            adapter.max_retries = Retry(
+                total=None,
+                connect=self.connect_retries,
+                read=False,
+                redirect=None,
+                status=0,
+                other=0,
+            )
+            adapter._pool_connections = self.pool_connections
+            adapter._pool_maxsize = self.pool_maxsize
+            adapter._pool_block = self.pool_block
+            adapter.poolmanager.clear()
+            adapter.init_poolmanager(
+                self.pool_connections,
+                self.pool_maxsize,
+                block=self.pool_block,
+                socket_options=self.socket_options(),
+            )
+
+
+__all__ = ("HttpPoolOptions",)
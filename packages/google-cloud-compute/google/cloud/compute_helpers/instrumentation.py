@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Per-RPC events from the methods of a synchronous client.
+
+An :class:`Instrumentation` attached to a transport reports every attempt
+of every call, for gRPC and REST alike, to its listeners: when the attempt
+starts, and when it ends with its status, sizes and duration. A final
+event per call carries the number of attempts made, so retries can be
+counted. :class:`LatencyHistogram` is a listener that aggregates the
+events in memory.
+
+.. code-block:: python
+
+    histogram = instrumentation.LatencyHistogram()
+    instrumentation.Instrumentation(histogram).attach(client.transport)
+    client.get(project=project, zone=zone, instance=instance)
+    print(histogram.summary())
+"""
+
+import bisect
+import contextvars
+import dataclasses
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from google.api_core import exceptions as core_exceptions
+import grpc  # type: ignore
+
+START = "start"
+END = "end"
+CALL = "call"
+
+# Attempts made so far by the call running in this context.
+_attempts: contextvars.ContextVar = contextvars.ContextVar("attempts")
+
+_STREAMING = (grpc.UnaryStreamMultiCallable, grpc.StreamStreamMultiCallable)
+
+
+@dataclasses.dataclass(frozen=True)
+class RpcEvent:
+    """Something that happened to one call.
+
+    Attributes:
+        kind (str): :data:`START` before an attempt is sent, :data:`END`
+            when it has finished, and :data:`CALL` when the call as a whole
+            has finished, after any retries.
+        method (str): The transport method, for example ``"get"``.
+        attempt (int): The attempt, counting from 1. For :data:`CALL`
+            events, the number of attempts made.
+        status (Optional[str]): The status code name, such as ``"OK"`` or
+            ``"UNAVAILABLE"``; ``None`` for :data:`START` events.
+        request_size (int): The serialized size of the request in bytes.
+        response_size (Optional[int]): The serialized size of the response
+            in bytes, if there was one.
+        duration (float): Seconds since the attempt (or, for :data:`CALL`
+            events, the call) started; ``0.0`` for :data:`START` events.
+    """
+
+    kind: str
+    method: str
+    attempt: int
+    status: Optional[str] = None
+    request_size: int = 0
+    response_size: Optional[int] = None
+    duration: float = 0.0
+
+
+def _size(message: Any) -> Optional[int]:
+    pb = getattr(type(message), "pb", None)
+    if pb is not None:
+        # A proto-plus message.
+        return pb(message).ByteSize()
+    byte_size = getattr(message, "ByteSize", None)
+    return byte_size() if byte_size is not None else None
+
+
+def _status(exc: Optional[BaseException]) -> str:
+    if exc is None:
+        return "OK"
+    if isinstance(exc, core_exceptions.GoogleAPICallError):
+        if exc.grpc_status_code is not None:
+            return exc.grpc_status_code.name
+        return str(exc.code)
+    if isinstance(exc, grpc.RpcError) and callable(getattr(exc, "code", None)):
+        return exc.code().name
+    return type(exc).__name__
+
+
+class Instrumentation:
+    """Reports the calls made through a transport to listeners.
+
+    Args:
+        listeners (Callable[[RpcEvent], None]): Called with every event, on
+            the thread making the call. Exceptions they raise propagate to
+            the caller.
+    """
+
+    def __init__(self, *listeners: Callable[[RpcEvent], None]):
+        self._listeners: List[Callable[[RpcEvent], None]] = list(listeners)
+
+    def add_listener(self, listener: Callable[[RpcEvent], None]) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[RpcEvent], None]) -> None:
+        self._listeners.remove(listener)
+
+    def attach(self, transport) -> None:
+        """Instrument every method of a transport from its next call on."""
+        transport._instrumentation = self
+        # Methods already wrapped are wrapped again, with instrumentation.
+        transport._wrapped_methods.clear()
+
+    def detach(self, transport) -> None:
+        """Stop instrumenting a transport."""
+        transport._instrumentation = None
+        transport._wrapped_methods.clear()
+
+    def _emit(self, event: RpcEvent) -> None:
+        for listener in self._listeners:
+            listener(event)
+
+    def wrap(
+        self,
+        name: str,
+        method: Callable,
+        factory: Callable[[Callable], Callable],
+    ) -> Callable:
+        """Wrap a transport method, reporting each of its attempts and calls.
+
+        Args:
+            name (str): The transport method's name.
+            method (Callable): The transport method.
+            factory (Callable[[Callable], Callable]): Applies the method's
+                retry, timeout and error handling to a callable, like
+                ``gapic_v1.method.wrap_method``.
+        """
+        if isinstance(method, _STREAMING):
+            # Streaming stubs must reach wrap_method unchanged for their
+            # errors to be translated; only whole calls are reported.
+            wrapped = factory(method)
+        else:
+            wrapped = factory(self._attempts_of(name, method))
+
+        def call(request, *args, **kwargs):
+            counter = [0]
+            token = _attempts.set(counter)
+            started = time.perf_counter()
+            exception = None
+            try:
+                return wrapped(request, *args, **kwargs)
+            except BaseException as exc:
+                exception = exc
+                raise
+            finally:
+                _attempts.reset(token)
+                self._emit(
+                    RpcEvent(
+                        CALL,
+                        name,
+                        max(counter[0], 1),
+                        _status(exception),
+                        _size(request) or 0,
+                        duration=time.perf_counter() - started,
+                    )
+                )
+
+        return call
+
+    def _attempts_of(self, name: str, method: Callable) -> Callable:
+        def attempt(request, *args, **kwargs):
+            counter = _attempts.get(None)
+            if counter is None:
+                counter = [0]
+            counter[0] += 1
+            number = counter[0]
+            request_size = _size(request) or 0
+            self._emit(RpcEvent(START, name, number, request_size=request_size))
+            started = time.perf_counter()
+            response = exception = None
+            try:
+                response = method(request, *args, **kwargs)
+                return response
+            except BaseException as exc:
+                exception = exc
+                raise
+            finally:
+                self._emit(
+                    RpcEvent(
+                        END,
+                        name,
+                        number,
+                        _status(exception),
+                        request_size,
+                        None if exception is not None else _size(response),
+                        time.perf_counter() - started,
+                    )
+                )
+
+        return attempt
+
+
+def _bucket_bounds(smallest: float, largest: float, per_doubling: int) -> List[float]:
+    bounds = [smallest]
+    while bounds[-1] < largest:
+        bounds.append(bounds[-1] * 2 ** (1 / per_doubling))
+    return bounds
+
+
+@dataclasses.dataclass
+class _MethodStats:
+    bucket_counts: List[int]
+    attempts: int = 0
+    calls: int = 0
+    retries: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    statuses: Dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+class LatencyHistogram:
+    """An in-memory listener aggregating attempt latencies per method.
+
+    Latencies fall into buckets whose bounds grow by a factor of
+    ``2 ** (1 / per_doubling)``, so a percentile is accurate to within that
+    factor.
+
+    Args:
+        smallest (float): The upper bound, in seconds, of the first bucket.
+        largest (float): Latencies above this many seconds share one bucket.
+        per_doubling (int): Buckets per doubling of the latency.
+    """
+
+    def __init__(
+        self, smallest: float = 1e-5, largest: float = 100.0, per_doubling: int = 4
+    ):
+        self._bounds = _bucket_bounds(smallest, largest, per_doubling)
+        self._lock = threading.Lock()
+        self._methods: Dict[str, _MethodStats] = {}
+
+    def _stats(self, method: str) -> _MethodStats:
+        stats = self._methods.get(method)
+        if stats is None:
+            stats = self._methods[method] = _MethodStats([0] * (len(self._bounds) + 1))
+        return stats
+
+    def __call__(self, event: RpcEvent) -> None:
+        if event.kind == START:
+            return
+        with self._lock:
+            stats = self._stats(event.method)
+            if event.kind == CALL:
+                stats.calls += 1
+                stats.retries += event.attempt - 1
+                return
+            stats.attempts += 1
+            stats.bucket_counts[bisect.bisect_left(self._bounds, event.duration)] += 1
+            stats.request_bytes += event.request_size
+            stats.response_bytes += event.response_size or 0
+            stats.statuses[event.status] = stats.statuses.get(event.status, 0) + 1
+
+    def percentile(self, method: str, percent: float) -> float:
+        """Return the latency, in seconds, below which ``percent`` of the
+        attempts of ``method`` finished.
+
+        Raises:
+            KeyError: If no attempt of ``method`` has finished.
+        """
+        with self._lock:
+            counts = list(self._methods[method].bucket_counts)
+        total = sum(counts)
+        if total == 0:
+            raise KeyError(method)
+        rank = percent / 100 * total
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if count and seen >= rank:
+                break
+        return self._bounds[min(index, len(self._bounds) - 1)]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Return the counts, sizes and latency percentiles of each method."""
+        with self._lock:
+            methods = sorted(
+                name for name, stats in self._methods.items() if stats.attempts
+            )
+            summary = {
+                name: {
+                    "calls": self._methods[name].calls,
+                    "attempts": self._methods[name].attempts,
+                    "retries": self._methods[name].retries,
+                    "request_bytes": self._methods[name].request_bytes,
+                    "response_bytes": self._methods[name].response_bytes,
+                    "statuses": dict(self._methods[name].statuses),
+                }
+                for name in methods
+            }
+        for name in methods:
+            for percent in (50, 90, 99):
+                summary[name]["p{}".format(percent)] = self.percentile(name, percent)
+        return summary
+
+
+__all__ = (
+    "CALL",
+    "END",
+    "Instrumentation",
+    "LatencyHistogram",
+    "RpcEvent",
+    "START",
+)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Waiting for many extended operations at once.
+
+Each :class:`~google.api_core.extended_operation.ExtendedOperation`
+returned by a client polls its operation service's ``get`` method on its
+own, so waiting for hundreds of operations runs hundreds of polling loops.
+A :class:`Waiter` calls the services' ``wait`` method instead. The server
+holds each ``wait`` call until the operation is done, or for up to two
+minutes, so an operation costs one call per two minutes it runs. Several
+operations are waited for at once, on a thread pool. Operations whose
+service has no ``wait`` method are polled with ``get``, backing off while
+they run.
+
+.. code-block:: python
+
+    waiter = operations.Waiter()
+    pending = [client.insert(request=r) for r in requests]
+    for future in waiter.as_completed(pending, timeout=3600):
+        future.result()
+"""
+
+import collections
+from concurrent import futures
+import functools
+import threading
+import time
+from typing import Deque, Dict, Iterable, Iterator, Optional
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import extended_operation
+
+
+def _wait_method(refresh):
+    """Return the ``wait`` method matching an operation's refresh, if any."""
+    if not isinstance(refresh, functools.partial) or len(refresh.args) != 1:
+        return None
+    service = getattr(refresh.func, "__self__", None)
+    wait = getattr(service, "wait", None)
+    if wait is None:
+        return None
+    request = refresh.args[0]
+    # The Wait*OperationRequest messages have the fields of their
+    # Get*OperationRequest counterparts.
+    return functools.partial(wait, request=type(request).to_dict(request))
+
+
+class Waiter:
+    """Waits for many extended operations at once.
+
+    Args:
+        max_concurrency (int): The largest number of ``wait`` calls in
+            progress at once, each on its own thread.
+        initial_delay (float): Seconds between the first polls of an
+            operation whose service has no ``wait`` method.
+        max_delay (float): The longest delay between such polls.
+        multiplier (float): How much the delay grows after each poll.
+
+    Attributes:
+        rpcs (int): ``wait`` and ``get`` calls made.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 50,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        multiplier: float = 1.5,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if initial_delay < 0 or max_delay < initial_delay:
+            raise ValueError("need 0 <= initial_delay <= max_delay")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.rpcs = 0
+        self._lock = threading.Lock()
+
+    def _refresh(self, future, delays, deadline):
+        """Bring one operation's state up to date, waiting while it runs."""
+        kwargs = {}
+        if deadline is not None:
+            kwargs["timeout"] = max(deadline - time.monotonic(), 0.0)
+        wait = _wait_method(future._refresh)
+        if wait is None:
+            delay = delays.get(future, self.initial_delay)
+            delays[future] = min(delay * self.multiplier, self.max_delay)
+            time.sleep(delay)
+        with self._lock:
+            self.rpcs += 1
+        try:
+            state = wait(**kwargs) if wait is not None else future._refresh(**kwargs)
+        except core_exceptions.DeadlineExceeded:
+            if deadline is None or time.monotonic() < deadline:
+                raise
+            # Out of time; as_completed raises the timeout.
+            return
+        future._extended_operation = state
+        future._handle_refreshed_operation()
+
+    def as_completed(
+        self,
+        operations: Iterable[extended_operation.ExtendedOperation],
+        timeout: Optional[float] = None,
+    ) -> Iterator[extended_operation.ExtendedOperation]:
+        """Yield operations as they complete.
+
+        Operations that have already completed are yielded first. A
+        yielded operation's ``result()`` returns without another call.
+
+        Args:
+            operations (Iterable[google.api_core.extended_operation.ExtendedOperation]):
+                The operations, as returned by the client.
+            timeout (Optional[float]): Seconds to wait in all. By default
+                there is no limit.
+
+        Raises:
+            concurrent.futures.TimeoutError: If operations are still running
+                when ``timeout`` passes.
+            google.api_core.exceptions.GoogleAPICallError: If a ``wait`` or
+                ``get`` call fails.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        queued: Deque[extended_operation.ExtendedOperation] = collections.deque()
+        for future in operations:
+            if future._extended_operation.done:
+                yield future
+            else:
+                queued.append(future)
+
+        delays: Dict[extended_operation.ExtendedOperation, float] = {}
+        running: Dict[futures.Future, extended_operation.ExtendedOperation] = {}
+        executor = futures.ThreadPoolExecutor(max_workers=self.max_concurrency)
+        try:
+            while queued or running:
+                while queued and len(running) < self.max_concurrency:
+                    future = queued.popleft()
+                    task = executor.submit(self._refresh, future, delays, deadline)
+                    running[task] = future
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                done = set()
+                if remaining is None or remaining > 0:
+                    done, _ = futures.wait(
+                        running, remaining, return_when=futures.FIRST_COMPLETED
+                    )
+                if not done:
+                    raise futures.TimeoutError(
+                        "{} operations are still running".format(
+                            len(running) + len(queued)
+                        )
+                    )
+                for task in done:
+                    future = running.pop(task)
+                    task.result()
+                    if future._extended_operation.done:
+                        yield future
+                    else:
+                        queued.append(future)
+        finally:
+            # Reached early if the caller stops iterating.
+            for task in running:
+                task.cancel()
+            executor.shutdown(wait=False)
+
+
+__all__ = ("Waiter",)
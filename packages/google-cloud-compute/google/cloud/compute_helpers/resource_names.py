@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Building and parsing resource names with compiled templates.
+
+The ``*_path`` and ``parse_*_path`` methods of the clients go through a
+:class:`ResourceName` per template, shared by every client that uses the
+template. It compiles the template once, remembers the names it parsed
+most recently and interns the segments it returns, so parsing the same
+few projects and locations over and over costs little time and memory.
+
+:meth:`ResourceName.parse_many` parses names in bulk into columns:
+
+.. code-block:: python
+
+    locations = resource_names.get("projects/{project}/locations/{location}")
+    columns = locations.parse_many(line.split()[0] for line in log)
+    per_location = collections.Counter(columns["location"])
+"""
+
+import functools
+import re
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_VARIABLE_RE = re.compile(r"\{(\w+)\}")
+
+_intern = sys.intern
+
+
+class ResourceName:
+    """One resource name template, compiled.
+
+    Gives the same results as the generated ``*_path`` and
+    ``parse_*_path`` methods for the same template.
+
+    Args:
+        template (str): The template, with a ``{field}`` for each variable
+            segment, e.g. ``"projects/{project}/locations/{location}"``.
+        cache_size (int): How many of the most recently parsed names to
+            remember.
+
+    Attributes:
+        template (str): The template.
+        fields (Tuple[str, ...]): The names of the variables, in order.
+    """
+
+    def __init__(self, template: str, cache_size: int = 4096):
+        self.template = template
+        self.fields: Tuple[str, ...] = tuple(_VARIABLE_RE.findall(template))
+        literals = _VARIABLE_RE.split(template)[::2]
+        self._format = "{}".join(
+            literal.replace("{", "{{").replace("}", "}}") for literal in literals
+        ).format
+        # The expression the generator emits for the template.
+        self._pattern = re.compile(
+            "^" + _VARIABLE_RE.sub(r"(?P<\1>.+?)", template) + "$"
+        )
+        self._parse_cached = functools.lru_cache(maxsize=cache_size)(self._parse)
+
+    def format(self, *values: Any, **segments: Any) -> str:
+        """Build a resource name.
+
+        Args:
+            values: Values for the first fields, in order.
+            segments: Values for the other fields, by name.
+
+        Returns:
+            str: The resource name.
+
+        Raises:
+            KeyError: If a field has no value.
+            TypeError: If there are more values than fields.
+        """
+        if segments:
+            values += tuple(segments[name] for name in self.fields[len(values) :])
+        if len(values) != len(self.fields):
+            if len(values) < len(self.fields):
+                raise KeyError(self.fields[len(values)])
+            raise TypeError(
+                "{!r} has {} fields, got {} values".format(
+                    self.template, len(self.fields), len(values)
+                )
+            )
+        return self._format(*values)
+
+    def _parse(self, path: str) -> Dict[str, str]:
+        match = self._pattern.match(path)
+        if match is None:
+            return {}
+        return {name: _intern(value) for name, value in match.groupdict().items()}
+
+    def parse(self, path: str) -> Dict[str, str]:
+        """Parse a resource name into its segments.
+
+        Args:
+            path (str): The resource name.
+
+        Returns:
+            Dict[str, str]: The value of each field, or an empty dict if the
+            name does not match the template.
+        """
+        return self._parse_cached(path).copy()
+
+    def parse_many(self, paths: Iterable[str]) -> Dict[str, Any]:
+        """Parse resource names into a column of values per field.
+
+        Args:
+            paths (Iterable[str]): The resource names. A NumPy array of
+                strings is parsed as a whole.
+
+        Returns:
+            Dict[str, Any]: For each field, the list of its values, in the
+            order of ``paths``, with None for names that do not match the
+            template. For a NumPy array, each column is an array of the
+            same shape, of ``object`` dtype.
+        """
+        # Only arrays need NumPy, and whoever passes one has imported it.
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(paths, numpy.ndarray):
+            columns = self.parse_many(paths.ravel().tolist())
+            return {
+                name: numpy.array(column, dtype=object).reshape(paths.shape)
+                for name, column in columns.items()
+            }
+
+        fields = self.fields
+        columns: Dict[str, List[Optional[str]]] = {name: [] for name in fields}
+        appends = [columns[name].append for name in fields]
+        parse = self._parse_cached
+        for path in paths:
+            parsed = parse(path)
+            if parsed:
+                for name, append in zip(fields, appends):
+                    append(parsed[name])
+            else:
+                for append in appends:
+                    append(None)
+        return columns
+
+
+_CODECS: Dict[str, ResourceName] = {}
+_CODECS_LOCK = threading.Lock()
+
+
+def get(template: str) -> ResourceName:
+    """Return the shared :class:`ResourceName` of a template.
+
+    Args:
+        template (str): The template.
+
+    Returns:
+        ResourceName: The same object for every call with the template.
+    """
+    codec = _CODECS.get(template)
+    if codec is None:
+        with _CODECS_LOCK:
+            codec = _CODECS.get(template)
+            if codec is None:
+                codec = _CODECS[template] = ResourceName(template)
+    return codec
+
+
+__all__ = (
+    "ResourceName",
+    "get",
+)
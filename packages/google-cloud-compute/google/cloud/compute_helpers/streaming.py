@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Incremental decoding of large JSON list responses.
+
+A list page normally arrives as one JSON document that is buffered and
+parsed into a single message before the first item can be used, so peak
+memory grows with the page size. :class:`StreamedPage` instead reads the
+response body in chunks and decodes the repeated (or map) field one
+element at a time, keeping only the current element and the page metadata.
+"""
+
+import codecs
+import collections
+import json
+import re
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+from google.protobuf import json_format
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Bytes requested from the HTTP response per read.
+CHUNK_SIZE = 64 * 1024
+
+_END = object()
+
+
+class _JsonReader:
+    """Reads consecutive JSON values from a stream of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self, at_least: int = 1) -> bool:
+        """Append up to ``at_least`` more characters; False if none were added."""
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        start = len(self._buffer)
+        while len(self._buffer) < start + at_least and not self._eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._buffer += self._utf8.decode(b"", final=True)
+                self._eof = True
+            else:
+                self._buffer += self._utf8.decode(chunk)
+        return len(self._buffer) > start
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or ``""`` at EOF."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                "expected one of {!r} at offset {}, got {!r}".format(
+                    chars, self._pos, char
+                )
+            )
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Incomplete value; read geometrically more so that a large
+                # value is not re-scanned once per chunk.
+                if not self._read(max(len(self._buffer) - self._pos, CHUNK_SIZE)):
+                    raise
+                continue
+            if end == len(self._buffer) and not self._eof and self._read():
+                # A number at the end of the buffer may continue in the
+                # next chunk.
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_page(chunks: Iterable[bytes], field: str, metadata: Dict[str, Any]):
+    """Decode a JSON object, streaming the elements of one of its fields.
+
+    Args:
+        chunks (Iterable[bytes]): The raw body of the response.
+        field (str): The JSON name of the field to stream. Arrays yield
+            their elements; objects yield ``(key, value)`` pairs.
+        metadata (Dict[str, Any]): Receives every other top-level member.
+
+    Yields:
+        The decoded JSON elements of ``field``, in document order.
+
+    Raises:
+        ValueError: If the body is not a JSON object.
+    """
+    reader = _JsonReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        opening = reader.peek() if key == field else ""
+        if opening in ("[", "{"):
+            reader.expect(opening)
+            closing = "]" if opening == "[" else "}"
+            if reader.peek() == closing:
+                reader.expect(closing)
+            else:
+                while True:
+                    if opening == "[":
+                        yield reader.value()
+                    else:
+                        entry_key = reader.value()
+                        reader.expect(":")
+                        yield entry_key, reader.value()
+                    if reader.expect("," + closing) == closing:
+                        break
+        else:
+            metadata[key] = reader.value()
+        if reader.expect(",}") == "}":
+            return
+
+
+class StreamedPage:
+    """A list response whose repeated field is decoded as it is iterated.
+
+    The streamed field (for example ``items``) can be iterated once. Every
+    other attribute is read from the page metadata. Those members usually
+    follow the field in the document, so reading one before the streamed
+    field is exhausted reads the rest of the body and keeps the elements
+    not yet iterated, which are then decoded as they are iterated.
+
+    Args:
+        response (requests.Response): A response opened with
+            ``stream=True``.
+        message_type (Type[proto.Message]): The list response type.
+        field (str): The name of the repeated or map field to stream.
+    """
+
+    def __init__(self, response, message_type, field: str):
+        self._response = response
+        self._message_type = message_type
+        self._field = field
+        pb_type = message_type.pb()
+        descriptor = pb_type.DESCRIPTOR.fields_by_name[field]
+        self._pb_type = pb_type
+        self._json_name = descriptor.json_name
+        self._is_map = bool(
+            descriptor.message_type and descriptor.message_type.GetOptions().map_entry
+        )
+        self._metadata: Dict[str, Any] = {}
+        self._message = None
+        self._elements = iter_json_page(
+            response.iter_content(CHUNK_SIZE), self._json_name, self._metadata
+        )
+        # Elements read ahead of the iteration to reach the metadata.
+        self._unread: Deque[Any] = collections.deque()
+        self._started = False
+
+    def _decode(self, element):
+        # Parse through a single-element container so that json_format
+        # applies the field's JSON mapping and proto-plus wraps the result.
+        container = self._pb_type()
+        if self._is_map:
+            key, value = element
+            json_format.ParseDict(
+                {self._json_name: {key: value}}, container, ignore_unknown_fields=True
+            )
+            return key, getattr(self._message_type.wrap(container), self._field)[key]
+        json_format.ParseDict(
+            {self._json_name: [element]}, container, ignore_unknown_fields=True
+        )
+        return getattr(self._message_type.wrap(container), self._field)[0]
+
+    def _iter_elements(self) -> Iterator[Any]:
+        if self._started:
+            raise RuntimeError(
+                "the {!r} field of a streamed page can only be iterated once".format(
+                    self._field
+                )
+            )
+        self._started = True
+        try:
+            while True:
+                if self._unread:
+                    element = self._unread.popleft()
+                else:
+                    element = next(self._elements, _END)
+                    if element is _END:
+                        return
+                yield self._decode(element)
+        finally:
+            self.close()
+
+    def _finish(self):
+        if self._message is None:
+            self._unread.extend(self._elements)
+            self.close()
+            pb = self._pb_type()
+            json_format.ParseDict(self._metadata, pb, ignore_unknown_fields=True)
+            self._message = self._message_type.wrap(pb)
+        return self._message
+
+    def __getattr__(self, name: str) -> Any:
+        if name == self._field:
+            if self._is_map:
+                return _StreamedMap(self)
+            return self._iter_elements()
+        return getattr(self._finish(), name)
+
+    def close(self) -> None:
+        """Release the underlying HTTP connection."""
+        self._response.close()
+
+    def __repr__(self) -> str:
+        return "{0}<{1}>".format(
+            self.__class__.__name__, self._message_type.__qualname__
+        )
+
+
+class _StreamedMap:
+    """The streamed map field of a :class:`StreamedPage`."""
+
+    def __init__(self, page: StreamedPage):
+        self._page = page
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return self._page._iter_elements()
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, _ in self.items())
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Return the value for ``key``, consuming entries until it is found."""
+        for entry_key, value in self.items():
+            if entry_key == key:
+                return value
+        return default
+
+
+__all__ = (
+    "StreamedPage",
+    "iter_json_page",
+)
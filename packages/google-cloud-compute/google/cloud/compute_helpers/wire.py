@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Wire format negotiation for the Compute REST transports.
+
+By default the REST transports exchange JSON. With ``wire_format="proto"``
+requests ask for ``$alt=proto`` and carry binary protobuf bodies, which
+avoids JSON printing and parsing on both ends. Responses are always decoded
+according to their ``Content-Type``, so a server (or proxy) that answers in
+JSON is still understood, and a server that rejects binary request bodies
+with ``415 Unsupported Media Type`` switches the transport back to JSON.
+
+With ``stream_pages=True`` JSON list pages are not buffered: they are
+returned as :class:`~google.cloud.compute_helpers.streaming.StreamedPage`
+objects that decode their items while the pager iterates them.
+
+This module is specific to Compute, which has only REST transports. The
+other packages with helper modules also have gRPC transports, which
+already send binary protobuf; to avoid JSON there, use ``transport="grpc"``
+rather than a REST wire format.
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+
+from google.protobuf import json_format
+from google.protobuf import message as message_lib
+
+from google.cloud.compute_helpers import streaming
+
+JSON = "json"
+PROTO = "proto"
+
+WIRE_FORMATS = (JSON, PROTO)
+
+JSON_CONTENT_TYPE = "application/json"
+PROTO_CONTENT_TYPE = "application/x-protobuf"
+
+_UNSUPPORTED_MEDIA_TYPE = 415
+
+
+class WireCodec:
+    """Encodes requests and decodes responses for one REST transport.
+
+    Args:
+        wire_format (str): Either ``"json"`` (the default) or ``"proto"``.
+        stream_pages (bool): Whether JSON list responses are decoded
+            incrementally instead of being buffered.
+
+    Raises:
+        ValueError: If ``wire_format`` is not a supported format.
+    """
+
+    def __init__(self, wire_format: str = JSON, stream_pages: bool = False):
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(
+                "wire_format must be one of {}, got {!r}".format(
+                    WIRE_FORMATS, wire_format
+                )
+            )
+        self._binary = wire_format == PROTO
+        self.stream_pages = stream_pages
+
+    @property
+    def wire_format(self) -> str:
+        """str: The format currently requested from the server."""
+        return PROTO if self._binary else JSON
+
+    def send(
+        self,
+        send_method: Callable[..., Any],
+        url: str,
+        *,
+        timeout: Optional[float],
+        headers: dict,
+        params: List[Tuple[str, str]],
+        body: Optional[message_lib.Message] = None,
+        stream: bool = False,
+    ):
+        """Send a request in the negotiated wire format.
+
+        Args:
+            send_method (Callable): The session method for the HTTP verb,
+                e.g. ``session.get``.
+            url (str): The full request URL.
+            timeout (Optional[float]): The request timeout.
+            headers (dict): Request headers; ``Content-Type`` is set here.
+            params (List[Tuple[str, str]]): The flattened query params.
+            body (Optional[google.protobuf.message.Message]): The transcoded
+                request body, if the method has one.
+            stream (bool): Whether to leave the response body unread so
+                that it can be consumed incrementally.
+
+        Returns:
+            requests.Response: The HTTP response.
+        """
+        stream_kwargs = {"stream": True} if stream else {}
+        if self._binary:
+            response = send_method(
+                url,
+                timeout=timeout,
+                headers=dict(headers, **{"Content-Type": PROTO_CONTENT_TYPE}),
+                params=list(params) + [("$alt", "proto")],
+                **self._body_kwargs(body, binary=True),
+                **stream_kwargs,
+            )
+            if response.status_code != _UNSUPPORTED_MEDIA_TYPE:
+                return response
+            # The server does not accept protobuf bodies; stay on JSON for
+            # the rest of this transport's lifetime.
+            self._binary = False
+
+        headers["Content-Type"] = JSON_CONTENT_TYPE
+        return send_method(
+            url,
+            timeout=timeout,
+            headers=headers,
+            params=params,
+            **self._body_kwargs(body, binary=False),
+            **stream_kwargs,
+        )
+
+    @staticmethod
+    def _body_kwargs(body, binary):
+        if body is None:
+            return {}
+        if binary:
+            return {"data": body.SerializeToString()}
+        return {
+            "data": json_format.MessageToJson(
+                body,
+                including_default_value_fields=False,
+                use_integers_for_enums=False,
+            )
+        }
+
+    @staticmethod
+    def parse(response, pb_message: message_lib.Message) -> None:
+        """Decode a response body into ``pb_message`` based on its content type.
+
+        Args:
+            response (requests.Response): The HTTP response.
+            pb_message (google.protobuf.message.Message): The raw protobuf
+                message to populate.
+        """
+        if _is_proto(response):
+            pb_message.ParseFromString(response.content)
+        else:
+            json_format.Parse(response.content, pb_message, ignore_unknown_fields=True)
+
+    def parse_page(self, response, message_type, field: str):
+        """Decode a list response.
+
+        Args:
+            response (requests.Response): The HTTP response.
+            message_type (Type[proto.Message]): The list response type.
+            field (str): The name of the field holding the page's items.
+
+        Returns:
+            Union[proto.Message, google.cloud.compute_helpers.streaming.StreamedPage]:
+                A streamed page if pages are streamed and the response is
+                JSON; otherwise the fully decoded ``message_type``.
+        """
+        if self.stream_pages and not _is_proto(response):
+            return streaming.StreamedPage(response, message_type, field)
+        message = message_type()
+        self.parse(response, message_type.pb(message))
+        return message
+
+
+def _is_proto(response) -> bool:
+    content_type = response.headers.get("Content-Type", "")
+    return content_type.split(";", 1)[0].strip() == PROTO_CONTENT_TYPE
+
+
+__all__ = (
+    "JSON",
+    "PROTO",
+    "WIRE_FORMATS",
+    "WireCodec",
+)
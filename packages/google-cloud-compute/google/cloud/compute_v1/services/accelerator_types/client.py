@@ -46,6 +46,7 @@ try:
 except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
+from google.cloud.compute_helpers import fanout, resource_names
 from google.cloud.compute_v1.services.accelerator_types import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -88,7 +89,7 @@ class AcceleratorTypesClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
+class AcceleratorTypesClient(fanout.FanOutMixin, metaclass=AcceleratorTypesClientMeta):
     """Services
 
     The AcceleratorTypes API.
@@ -181,60 +182,50 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -242,16 +233,14 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -17,10 +17,10 @@
 import dataclasses
 import json  # type: ignore
 import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 import warnings
 
-from google.api_core import gapic_v1, path_template, rest_helpers, rest_streaming
+from google.api_core import gapic_v1, rest_helpers, rest_streaming
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
@@ -36,6 +36,7 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_helpers import http_pool, rest_encoding, transcoding, wire
 from google.cloud.compute_v1.types import compute
 
 from .base import AcceleratorTypesTransport
@@ -168,6 +169,7 @@ class AcceleratorTypesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: AcceleratorTypesRestInterceptor
+    _wire: wire.WireCodec
 
 
 class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
@@ -202,6 +204,9 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
         url_scheme: str = "https",
         interceptor: Optional[AcceleratorTypesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        wire_format: str = "json",
+        stream_pages: bool = False,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -238,6 +243,19 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             wire_format (str): The encoding of request and response
+                 bodies. ``"json"`` (the default), or ``"proto"`` to send
+                 binary protobuf and request it with ``$alt=proto``.
+                 Responses are decoded by their content type, so JSON
+                 answers are always accepted.
+             stream_pages (bool): Whether JSON list responses are
+                 decoded while the pager iterates them rather than
+                 buffered whole. Streamed pages hold only the current
+                 item and the page metadata in memory.
+             http_pool_options (Optional[google.cloud.compute_helpers.http_pool.HttpPoolOptions]):
+                 Connection pool settings for the HTTP session, such as
+                 the number of connections kept open per host. If
+                 ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -260,12 +278,21 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or AcceleratorTypesRestInterceptor()
+        self._wire = wire.WireCodec(wire_format, stream_pages=stream_pages)
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(AcceleratorTypesRestStub):
@@ -282,6 +309,15 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/acceleratorTypes",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListAcceleratorTypesRequest,
@@ -308,37 +344,29 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/acceleratorTypes",
-                },
-            ]
             request, metadata = self._interceptor.pre_aggregated_list(request, metadata)
             pb_request = compute.AggregatedListAcceleratorTypesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
+                stream=self._wire.stream_pages,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -347,10 +375,9 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 raise core_exceptions.from_http_response(response)
 
             # Return the response
-            resp = compute.AcceleratorTypeAggregatedList()
-            pb_resp = compute.AcceleratorTypeAggregatedList.pb(resp)
-
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            resp = self._wire.parse_page(
+                response, compute.AcceleratorTypeAggregatedList, "items"
+            )
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -368,6 +395,15 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/acceleratorTypes/{accelerator_type}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.GetAcceleratorTypeRequest,
@@ -402,37 +438,28 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/acceleratorTypes/{accelerator_type}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get(request, metadata)
             pb_request = compute.GetAcceleratorTypeRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -444,7 +471,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             resp = compute.AcceleratorType()
             pb_resp = compute.AcceleratorType.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -462,6 +489,15 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/acceleratorTypes",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.ListAcceleratorTypesRequest,
@@ -488,37 +524,29 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                     Contains a list of accelerator types.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/acceleratorTypes",
-                },
-            ]
             request, metadata = self._interceptor.pre_list(request, metadata)
             pb_request = compute.ListAcceleratorTypesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
+                stream=self._wire.stream_pages,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -527,10 +555,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 raise core_exceptions.from_http_response(response)
 
             # Return the response
-            resp = compute.AcceleratorTypeList()
-            pb_resp = compute.AcceleratorTypeList.pb(resp)
-
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            resp = self._wire.parse_page(response, compute.AcceleratorTypeList, "items")
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -543,7 +568,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def get(
@@ -551,7 +576,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
     ) -> Callable[[compute.GetAcceleratorTypeRequest], compute.AcceleratorType]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def list(
@@ -559,7 +584,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
     ) -> Callable[[compute.ListAcceleratorTypesRequest], compute.AcceleratorTypeList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def kind(self) -> str:
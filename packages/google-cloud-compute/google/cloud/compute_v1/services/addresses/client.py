@@ -49,6 +49,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import extended_operation  # type: ignore
 
+from google.cloud.compute_helpers import fanout, resource_names
 from google.cloud.compute_v1.services.addresses import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -89,7 +90,7 @@ class AddressesClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class AddressesClient(metaclass=AddressesClientMeta):
+class AddressesClient(fanout.FanOutMixin, metaclass=AddressesClientMeta):
     """The Addresses API."""
 
     @staticmethod
@@ -179,60 +180,50 @@ class AddressesClient(metaclass=AddressesClientMeta):
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -240,16 +231,14 @@ class AddressesClient(metaclass=AddressesClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
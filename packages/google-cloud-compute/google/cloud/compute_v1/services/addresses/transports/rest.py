@@ -17,10 +17,10 @@
 import dataclasses
 import json  # type: ignore
 import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 import warnings
 
-from google.api_core import gapic_v1, path_template, rest_helpers, rest_streaming
+from google.api_core import gapic_v1, rest_helpers, rest_streaming
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
@@ -36,6 +36,7 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_helpers import http_pool, rest_encoding, transcoding, wire
 from google.cloud.compute_v1.types import compute
 
 from .base import AddressesTransport
@@ -270,6 +271,7 @@ class AddressesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: AddressesRestInterceptor
+    _wire: wire.WireCodec
 
 
 class AddressesRestTransport(AddressesTransport):
@@ -302,6 +304,9 @@ class AddressesRestTransport(AddressesTransport):
         url_scheme: str = "https",
         interceptor: Optional[AddressesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        wire_format: str = "json",
+        stream_pages: bool = False,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -338,6 +343,19 @@ class AddressesRestTransport(AddressesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             wire_format (str): The encoding of request and response
+                 bodies. ``"json"`` (the default), or ``"proto"`` to send
+                 binary protobuf and request it with ``$alt=proto``.
+                 Responses are decoded by their content type, so JSON
+                 answers are always accepted.
+             stream_pages (bool): Whether JSON list responses are
+                 decoded while the pager iterates them rather than
+                 buffered whole. Streamed pages hold only the current
+                 item and the page metadata in memory.
+             http_pool_options (Optional[google.cloud.compute_helpers.http_pool.HttpPoolOptions]):
+                 Connection pool settings for the HTTP session, such as
+                 the number of connections kept open per host. If
+                 ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -360,12 +378,21 @@ class AddressesRestTransport(AddressesTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or AddressesRestInterceptor()
+        self._wire = wire.WireCodec(wire_format, stream_pages=stream_pages)
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(AddressesRestStub):
@@ -382,6 +409,15 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/addresses",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListAddressesRequest,
@@ -408,37 +444,29 @@ class AddressesRestTransport(AddressesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/addresses",
-                },
-            ]
             request, metadata = self._interceptor.pre_aggregated_list(request, metadata)
             pb_request = compute.AggregatedListAddressesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
+                stream=self._wire.stream_pages,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -447,10 +475,9 @@ class AddressesRestTransport(AddressesTransport):
                 raise core_exceptions.from_http_response(response)
 
             # Return the response
-            resp = compute.AddressAggregatedList()
-            pb_resp = compute.AddressAggregatedList.pb(resp)
-
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            resp = self._wire.parse_page(
+                response, compute.AddressAggregatedList, "items"
+            )
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -468,6 +495,15 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{address}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.DeleteAddressRequest,
@@ -509,37 +545,28 @@ class AddressesRestTransport(AddressesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{address}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete(request, metadata)
             pb_request = compute.DeleteAddressRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -551,7 +578,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -569,6 +596,15 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{address}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.GetAddressRequest,
@@ -601,37 +637,28 @@ class AddressesRestTransport(AddressesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{address}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get(request, metadata)
             pb_request = compute.GetAddressRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -643,7 +670,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.Address()
             pb_resp = compute.Address.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -661,6 +688,16 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses",
+                    "body": "address_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.InsertAddressRequest,
@@ -702,46 +739,29 @@ class AddressesRestTransport(AddressesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses",
-                    "body": "address_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_insert(request, metadata)
             pb_request = compute.InsertAddressRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            # Jsonify the request body
-
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -753,7 +773,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -771,6 +791,15 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.ListAddressesRequest,
@@ -796,37 +825,29 @@ class AddressesRestTransport(AddressesTransport):
                     Contains a list of addresses.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses",
-                },
-            ]
             request, metadata = self._interceptor.pre_list(request, metadata)
             pb_request = compute.ListAddressesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
+                stream=self._wire.stream_pages,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -835,10 +856,7 @@ class AddressesRestTransport(AddressesTransport):
                 raise core_exceptions.from_http_response(response)
 
             # Return the response
-            resp = compute.AddressList()
-            pb_resp = compute.AddressList.pb(resp)
-
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            resp = self._wire.parse_page(response, compute.AddressList, "items")
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -856,6 +874,16 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{address}/move",
+                    "body": "region_addresses_move_request_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.MoveAddressRequest,
@@ -896,46 +924,29 @@ class AddressesRestTransport(AddressesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{address}/move",
-                    "body": "region_addresses_move_request_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_move(request, metadata)
             pb_request = compute.MoveAddressRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -947,7 +958,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_move(resp)
             return resp
 
@@ -965,6 +976,16 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{resource}/setLabels",
+                    "body": "region_set_labels_request_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.SetLabelsAddressRequest,
@@ -1006,46 +1027,29 @@ class AddressesRestTransport(AddressesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{resource}/setLabels",
-                    "body": "region_set_labels_request_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_set_labels(request, metadata)
             pb_request = compute.SetLabelsAddressRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1057,7 +1061,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_set_labels(resp)
             return resp
 
@@ -1069,37 +1073,37 @@ class AddressesRestTransport(AddressesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def delete(self) -> Callable[[compute.DeleteAddressRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def get(self) -> Callable[[compute.GetAddressRequest], compute.Address]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def insert(self) -> Callable[[compute.InsertAddressRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def list(self) -> Callable[[compute.ListAddressesRequest], compute.AddressList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def move(self) -> Callable[[compute.MoveAddressRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Move(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Move(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def set_labels(
@@ -1107,7 +1111,7 @@ class AddressesRestTransport(AddressesTransport):
     ) -> Callable[[compute.SetLabelsAddressRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetLabels(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetLabels(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def kind(self) -> str:
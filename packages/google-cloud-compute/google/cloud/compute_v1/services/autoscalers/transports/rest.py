@@ -17,10 +17,10 @@
 import dataclasses
 import json  # type: ignore
 import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 import warnings
 
-from google.api_core import gapic_v1, path_template, rest_helpers, rest_streaming
+from google.api_core import gapic_v1, rest_helpers, rest_streaming
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
@@ -36,6 +36,7 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_helpers import http_pool, rest_encoding, transcoding, wire
 from google.cloud.compute_v1.types import compute
 
 from .base import AutoscalersTransport
@@ -278,6 +279,7 @@ class AutoscalersRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: AutoscalersRestInterceptor
+    _wire: wire.WireCodec
 
 
 class AutoscalersRestTransport(AutoscalersTransport):
@@ -310,6 +312,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
         url_scheme: str = "https",
         interceptor: Optional[AutoscalersRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        wire_format: str = "json",
+        stream_pages: bool = False,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -346,6 +351,19 @@ class AutoscalersRestTransport(AutoscalersTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             wire_format (str): The encoding of request and response
+                 bodies. ``"json"`` (the default), or ``"proto"`` to send
+                 binary protobuf and request it with ``$alt=proto``.
+                 Responses are decoded by their content type, so JSON
+                 answers are always accepted.
+             stream_pages (bool): Whether JSON list responses are
+                 decoded while the pager iterates them rather than
+                 buffered whole. Streamed pages hold only the current
+                 item and the page metadata in memory.
+             http_pool_options (Optional[google.cloud.compute_helpers.http_pool.HttpPoolOptions]):
+                 Connection pool settings for the HTTP session, such as
+                 the number of connections kept open per host. If
+                 ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -368,12 +386,21 @@ class AutoscalersRestTransport(AutoscalersTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or AutoscalersRestInterceptor()
+        self._wire = wire.WireCodec(wire_format, stream_pages=stream_pages)
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(AutoscalersRestStub):
@@ -390,6 +417,15 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/autoscalers",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListAutoscalersRequest,
@@ -416,37 +452,29 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/autoscalers",
-                },
-            ]
             request, metadata = self._interceptor.pre_aggregated_list(request, metadata)
             pb_request = compute.AggregatedListAutoscalersRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
+                stream=self._wire.stream_pages,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -455,10 +483,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 raise core_exceptions.from_http_response(response)
 
             # Return the response
-            resp = compute.AutoscalerAggregatedList()
-            pb_resp = compute.AutoscalerAggregatedList.pb(resp)
-
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            resp = self._wire.parse_page(
+                response, compute.AutoscalerAggregatedList, "items"
+            )
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -476,6 +503,15 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers/{autoscaler}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.DeleteAutoscalerRequest,
@@ -517,37 +553,28 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers/{autoscaler}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete(request, metadata)
             pb_request = compute.DeleteAutoscalerRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -559,7 +586,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -577,6 +604,15 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers/{autoscaler}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.GetAutoscalerRequest,
@@ -615,37 +651,28 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers/{autoscaler}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get(request, metadata)
             pb_request = compute.GetAutoscalerRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -657,7 +684,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.Autoscaler()
             pb_resp = compute.Autoscaler.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -675,6 +702,16 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                    "body": "autoscaler_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.InsertAutoscalerRequest,
@@ -716,46 +753,29 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
-                    "body": "autoscaler_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_insert(request, metadata)
             pb_request = compute.InsertAutoscalerRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            # Jsonify the request body
-
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -767,7 +787,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -785,6 +805,15 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.ListAutoscalersRequest,
@@ -813,37 +842,29 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
-                },
-            ]
             request, metadata = self._interceptor.pre_list(request, metadata)
             pb_request = compute.ListAutoscalersRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
+                stream=self._wire.stream_pages,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -852,10 +873,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 raise core_exceptions.from_http_response(response)
 
             # Return the response
-            resp = compute.AutoscalerList()
-            pb_resp = compute.AutoscalerList.pb(resp)
-
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            resp = self._wire.parse_page(response, compute.AutoscalerList, "items")
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -873,6 +891,16 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                    "body": "autoscaler_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.PatchAutoscalerRequest,
@@ -914,46 +942,29 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
-                    "body": "autoscaler_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_patch(request, metadata)
             pb_request = compute.PatchAutoscalerRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -965,7 +976,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -983,6 +994,16 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "put",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                    "body": "autoscaler_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.UpdateAutoscalerRequest,
@@ -1024,46 +1045,29 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "put",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
-                    "body": "autoscaler_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_update(request, metadata)
             pb_request = compute.UpdateAutoscalerRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1075,7 +1079,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_update(resp)
             return resp
 
@@ -1087,25 +1091,25 @@ class AutoscalersRestTransport(AutoscalersTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def delete(self) -> Callable[[compute.DeleteAutoscalerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def get(self) -> Callable[[compute.GetAutoscalerRequest], compute.Autoscaler]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def insert(self) -> Callable[[compute.InsertAutoscalerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def list(
@@ -1113,19 +1117,19 @@ class AutoscalersRestTransport(AutoscalersTransport):
     ) -> Callable[[compute.ListAutoscalersRequest], compute.AutoscalerList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def patch(self) -> Callable[[compute.PatchAutoscalerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def update(self) -> Callable[[compute.UpdateAutoscalerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Update(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Update(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -17,10 +17,10 @@
 import dataclasses
 import json  # type: ignore
 import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 import warnings
 
-from google.api_core import gapic_v1, path_template, rest_helpers, rest_streaming
+from google.api_core import gapic_v1, rest_helpers, rest_streaming
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
@@ -36,6 +36,7 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_helpers import http_pool, rest_encoding, transcoding, wire
 from google.cloud.compute_v1.types import compute
 
 from .base import BackendBucketsTransport
@@ -437,6 +438,7 @@ class BackendBucketsRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: BackendBucketsRestInterceptor
+    _wire: wire.WireCodec
 
 
 class BackendBucketsRestTransport(BackendBucketsTransport):
@@ -469,6 +471,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
         url_scheme: str = "https",
         interceptor: Optional[BackendBucketsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        wire_format: str = "json",
+        stream_pages: bool = False,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -505,6 +510,19 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             wire_format (str): The encoding of request and response
+                 bodies. ``"json"`` (the default), or ``"proto"`` to send
+                 binary protobuf and request it with ``$alt=proto``.
+                 Responses are decoded by their content type, so JSON
+                 answers are always accepted.
+             stream_pages (bool): Whether JSON list responses are
+                 decoded while the pager iterates them rather than
+                 buffered whole. Streamed pages hold only the current
+                 item and the page metadata in memory.
+             http_pool_options (Optional[google.cloud.compute_helpers.http_pool.HttpPoolOptions]):
+                 Connection pool settings for the HTTP session, such as
+                 the number of connections kept open per host. If
+                 ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -527,12 +545,21 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or BackendBucketsRestInterceptor()
+        self._wire = wire.WireCodec(wire_format, stream_pages=stream_pages)
         self._prep_wrapped_messages(client_info)
 
     class _AddSignedUrlKey(BackendBucketsRestStub):
@@ -549,6 +576,16 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}/addSignedUrlKey",
+                    "body": "signed_url_key_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.AddSignedUrlKeyBackendBucketRequest,
@@ -590,48 +627,31 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}/addSignedUrlKey",
-                    "body": "signed_url_key_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_add_signed_url_key(
                 request, metadata
             )
             pb_request = compute.AddSignedUrlKeyBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -643,7 +663,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_add_signed_url_key(resp)
             return resp
 
@@ -661,6 +681,15 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.DeleteBackendBucketRequest,
@@ -702,37 +731,28 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete(request, metadata)
             pb_request = compute.DeleteBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -744,7 +764,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -764,6 +784,15 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}/deleteSignedUrlKey",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.DeleteSignedUrlKeyBackendBucketRequest,
@@ -805,39 +834,30 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}/deleteSignedUrlKey",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_signed_url_key(
                 request, metadata
             )
             pb_request = compute.DeleteSignedUrlKeyBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -849,7 +869,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_delete_signed_url_key(resp)
             return resp
 
@@ -867,6 +887,15 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.GetBackendBucketRequest,
@@ -898,37 +927,28 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get(request, metadata)
             pb_request = compute.GetBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -940,7 +960,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.BackendBucket()
             pb_resp = compute.BackendBucket.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -958,6 +978,15 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{resource}/getIamPolicy",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.GetIamPolicyBackendBucketRequest,
@@ -1007,37 +1036,28 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{resource}/getIamPolicy",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_iam_policy(request, metadata)
             pb_request = compute.GetIamPolicyBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1049,7 +1069,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_get_iam_policy(resp)
             return resp
 
@@ -1067,6 +1087,16 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets",
+                    "body": "backend_bucket_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.InsertBackendBucketRequest,
@@ -1108,46 +1138,29 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets",
-                    "body": "backend_bucket_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_insert(request, metadata)
             pb_request = compute.InsertBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1159,7 +1172,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -1177,6 +1190,15 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.ListBackendBucketsRequest,
@@ -1205,37 +1227,29 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets",
-                },
-            ]
             request, metadata = self._interceptor.pre_list(request, metadata)
             pb_request = compute.ListBackendBucketsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
+                stream=self._wire.stream_pages,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1244,10 +1258,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 raise core_exceptions.from_http_response(response)
 
             # Return the response
-            resp = compute.BackendBucketList()
-            pb_resp = compute.BackendBucketList.pb(resp)
-
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            resp = self._wire.parse_page(response, compute.BackendBucketList, "items")
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1265,6 +1276,16 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
+                    "body": "backend_bucket_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.PatchBackendBucketRequest,
@@ -1306,46 +1327,29 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
-                    "body": "backend_bucket_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_patch(request, metadata)
             pb_request = compute.PatchBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1357,7 +1361,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -1375,6 +1379,16 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}/setEdgeSecurityPolicy",
+                    "body": "security_policy_reference_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.SetEdgeSecurityPolicyBackendBucketRequest,
@@ -1416,48 +1430,31 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}/setEdgeSecurityPolicy",
-                    "body": "security_policy_reference_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_set_edge_security_policy(
                 request, metadata
             )
             pb_request = compute.SetEdgeSecurityPolicyBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1469,7 +1466,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_set_edge_security_policy(resp)
             return resp
 
@@ -1487,6 +1484,16 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{resource}/setIamPolicy",
+                    "body": "global_set_policy_request_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.SetIamPolicyBackendBucketRequest,
@@ -1536,46 +1543,29 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{resource}/setIamPolicy",
-                    "body": "global_set_policy_request_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_set_iam_policy(request, metadata)
             pb_request = compute.SetIamPolicyBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1587,7 +1577,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_set_iam_policy(resp)
             return resp
 
@@ -1605,6 +1595,16 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{resource}/testIamPermissions",
+                    "body": "test_permissions_request_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.TestIamPermissionsBackendBucketRequest,
@@ -1631,48 +1631,31 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{resource}/testIamPermissions",
-                    "body": "test_permissions_request_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_test_iam_permissions(
                 request, metadata
             )
             pb_request = compute.TestIamPermissionsBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1684,7 +1667,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.TestPermissionsResponse()
             pb_resp = compute.TestPermissionsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_test_iam_permissions(resp)
             return resp
 
@@ -1702,6 +1685,16 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "put",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
+                    "body": "backend_bucket_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.UpdateBackendBucketRequest,
@@ -1743,46 +1736,29 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "put",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
-                    "body": "backend_bucket_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_update(request, metadata)
             pb_request = compute.UpdateBackendBucketRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1794,7 +1770,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_update(resp)
             return resp
 
@@ -1804,7 +1780,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.AddSignedUrlKeyBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddSignedUrlKey(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddSignedUrlKey(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def delete(
@@ -1812,7 +1788,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.DeleteBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def delete_signed_url_key(
@@ -1820,13 +1796,13 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.DeleteSignedUrlKeyBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DeleteSignedUrlKey(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DeleteSignedUrlKey(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def get(self) -> Callable[[compute.GetBackendBucketRequest], compute.BackendBucket]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def get_iam_policy(
@@ -1834,7 +1810,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.GetIamPolicyBackendBucketRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetIamPolicy(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def insert(
@@ -1842,7 +1818,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.InsertBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def list(
@@ -1850,13 +1826,13 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.ListBackendBucketsRequest], compute.BackendBucketList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def patch(self) -> Callable[[compute.PatchBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def set_edge_security_policy(
@@ -1866,7 +1842,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetEdgeSecurityPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetEdgeSecurityPolicy(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def set_iam_policy(
@@ -1874,7 +1850,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.SetIamPolicyBackendBucketRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetIamPolicy(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def test_iam_permissions(
@@ -1885,7 +1861,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._TestIamPermissions(self._session, self._host, self._interceptor)  # type: ignore
+        return self._TestIamPermissions(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def update(
@@ -1893,7 +1869,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.UpdateBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Update(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Update(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def kind(self) -> str:
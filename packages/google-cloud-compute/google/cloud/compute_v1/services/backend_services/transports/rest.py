@@ -17,10 +17,10 @@
 import dataclasses
 import json  # type: ignore
 import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 import warnings
 
-from google.api_core import gapic_v1, path_template, rest_helpers, rest_streaming
+from google.api_core import gapic_v1, rest_helpers, rest_streaming
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
@@ -36,6 +36,7 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_helpers import http_pool, rest_encoding, transcoding, wire
 from google.cloud.compute_v1.types import compute
 
 from .base import BackendServicesTransport
@@ -563,6 +564,7 @@ class BackendServicesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: BackendServicesRestInterceptor
+    _wire: wire.WireCodec
 
 
 class BackendServicesRestTransport(BackendServicesTransport):
@@ -595,6 +597,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
         url_scheme: str = "https",
         interceptor: Optional[BackendServicesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        wire_format: str = "json",
+        stream_pages: bool = False,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -631,6 +636,19 @@ class BackendServicesRestTransport(BackendServicesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             wire_format (str): The encoding of request and response
+                 bodies. ``"json"`` (the default), or ``"proto"`` to send
+                 binary protobuf and request it with ``$alt=proto``.
+                 Responses are decoded by their content type, so JSON
+                 answers are always accepted.
+             stream_pages (bool): Whether JSON list responses are
+                 decoded while the pager iterates them rather than
+                 buffered whole. Streamed pages hold only the current
+                 item and the page metadata in memory.
+             http_pool_options (Optional[google.cloud.compute_helpers.http_pool.HttpPoolOptions]):
+                 Connection pool settings for the HTTP session, such as
+                 the number of connections kept open per host. If
+                 ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -653,12 +671,21 @@ class BackendServicesRestTransport(BackendServicesTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or BackendServicesRestInterceptor()
+        self._wire = wire.WireCodec(wire_format, stream_pages=stream_pages)
         self._prep_wrapped_messages(client_info)
 
     class _AddSignedUrlKey(BackendServicesRestStub):
@@ -675,6 +702,16 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/addSignedUrlKey",
+                    "body": "signed_url_key_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.AddSignedUrlKeyBackendServiceRequest,
@@ -716,48 +753,31 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/addSignedUrlKey",
-                    "body": "signed_url_key_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_add_signed_url_key(
                 request, metadata
             )
             pb_request = compute.AddSignedUrlKeyBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            # Jsonify the request body
-
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -769,7 +789,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_add_signed_url_key(resp)
             return resp
 
@@ -787,6 +807,15 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/backendServices",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListBackendServicesRequest,
@@ -815,37 +844,29 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/backendServices",
-                },
-            ]
             request, metadata = self._interceptor.pre_aggregated_list(request, metadata)
             pb_request = compute.AggregatedListBackendServicesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
+                stream=self._wire.stream_pages,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -854,10 +875,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 raise core_exceptions.from_http_response(response)
 
             # Return the response
-            resp = compute.BackendServiceAggregatedList()
-            pb_resp = compute.BackendServiceAggregatedList.pb(resp)
-
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            resp = self._wire.parse_page(
+                response, compute.BackendServiceAggregatedList, "items"
+            )
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -875,6 +895,15 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.DeleteBackendServiceRequest,
@@ -916,37 +945,28 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete(request, metadata)
             pb_request = compute.DeleteBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -958,7 +978,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -978,6 +998,15 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/deleteSignedUrlKey",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.DeleteSignedUrlKeyBackendServiceRequest,
@@ -1019,39 +1048,30 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/deleteSignedUrlKey",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_signed_url_key(
                 request, metadata
             )
             pb_request = compute.DeleteSignedUrlKeyBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1063,7 +1083,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_delete_signed_url_key(resp)
             return resp
 
@@ -1081,6 +1101,15 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.GetBackendServiceRequest,
@@ -1122,37 +1151,28 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get(request, metadata)
             pb_request = compute.GetBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1164,7 +1184,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.BackendService()
             pb_resp = compute.BackendService.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -1182,6 +1202,16 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/getHealth",
+                    "body": "resource_group_reference_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.GetHealthBackendServiceRequest,
@@ -1208,46 +1238,29 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/getHealth",
-                    "body": "resource_group_reference_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_health(request, metadata)
             pb_request = compute.GetHealthBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            # Jsonify the request body
-
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1259,7 +1272,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.BackendServiceGroupHealth()
             pb_resp = compute.BackendServiceGroupHealth.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_get_health(resp)
             return resp
 
@@ -1277,6 +1290,15 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{resource}/getIamPolicy",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.GetIamPolicyBackendServiceRequest,
@@ -1326,37 +1348,28 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{resource}/getIamPolicy",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_iam_policy(request, metadata)
             pb_request = compute.GetIamPolicyBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1368,7 +1381,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_get_iam_policy(resp)
             return resp
 
@@ -1386,6 +1399,16 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices",
+                    "body": "backend_service_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.InsertBackendServiceRequest,
@@ -1427,46 +1450,29 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices",
-                    "body": "backend_service_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_insert(request, metadata)
             pb_request = compute.InsertBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1478,7 +1484,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -1496,6 +1502,15 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.ListBackendServicesRequest,
@@ -1524,37 +1539,29 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices",
-                },
-            ]
             request, metadata = self._interceptor.pre_list(request, metadata)
             pb_request = compute.ListBackendServicesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
+                stream=self._wire.stream_pages,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1563,10 +1570,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 raise core_exceptions.from_http_response(response)
 
             # Return the response
-            resp = compute.BackendServiceList()
-            pb_resp = compute.BackendServiceList.pb(resp)
-
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            resp = self._wire.parse_page(response, compute.BackendServiceList, "items")
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1584,6 +1588,15 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/listUsable",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.ListUsableBackendServicesRequest,
@@ -1612,37 +1625,29 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/listUsable",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_usable(request, metadata)
             pb_request = compute.ListUsableBackendServicesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
+                stream=self._wire.stream_pages,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1651,10 +1656,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 raise core_exceptions.from_http_response(response)
 
             # Return the response
-            resp = compute.BackendServiceListUsable()
-            pb_resp = compute.BackendServiceListUsable.pb(resp)
-
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            resp = self._wire.parse_page(
+                response, compute.BackendServiceListUsable, "items"
+            )
             resp = self._interceptor.post_list_usable(resp)
             return resp
 
@@ -1672,6 +1676,16 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
+                    "body": "backend_service_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.PatchBackendServiceRequest,
@@ -1713,46 +1727,29 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
-                    "body": "backend_service_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_patch(request, metadata)
             pb_request = compute.PatchBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1764,7 +1761,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -1782,6 +1779,16 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/setEdgeSecurityPolicy",
+                    "body": "security_policy_reference_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.SetEdgeSecurityPolicyBackendServiceRequest,
@@ -1823,48 +1830,31 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/setEdgeSecurityPolicy",
-                    "body": "security_policy_reference_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_set_edge_security_policy(
                 request, metadata
             )
             pb_request = compute.SetEdgeSecurityPolicyBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
-
-            # Jsonify the request body
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1876,7 +1866,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_set_edge_security_policy(resp)
             return resp
 
@@ -1894,6 +1884,16 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{resource}/setIamPolicy",
+                    "body": "global_set_policy_request_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.SetIamPolicyBackendServiceRequest,
@@ -1943,46 +1943,29 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{resource}/setIamPolicy",
-                    "body": "global_set_policy_request_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_set_iam_policy(request, metadata)
             pb_request = compute.SetIamPolicyBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            # Jsonify the request body
-
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1994,7 +1977,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_set_iam_policy(resp)
             return resp
 
@@ -2012,6 +1995,16 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/setSecurityPolicy",
+                    "body": "security_policy_reference_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.SetSecurityPolicyBackendServiceRequest,
@@ -2053,48 +2046,31 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/setSecurityPolicy",
-                    "body": "security_policy_reference_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_set_security_policy(
                 request, metadata
             )
             pb_request = compute.SetSecurityPolicyBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            # Jsonify the request body
-
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2106,7 +2082,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_set_security_policy(resp)
             return resp
 
@@ -2124,6 +2100,16 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{resource}/testIamPermissions",
+                    "body": "test_permissions_request_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.TestIamPermissionsBackendServiceRequest,
@@ -2150,48 +2136,31 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{resource}/testIamPermissions",
-                    "body": "test_permissions_request_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_test_iam_permissions(
                 request, metadata
             )
             pb_request = compute.TestIamPermissionsBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            # Jsonify the request body
-
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2203,7 +2172,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.TestPermissionsResponse()
             pb_resp = compute.TestPermissionsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_test_iam_permissions(resp)
             return resp
 
@@ -2221,6 +2190,16 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "put",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
+                    "body": "backend_service_resource",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: compute.UpdateBackendServiceRequest,
@@ -2262,46 +2241,29 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "put",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
-                    "body": "backend_service_resource",
-                },
-            ]
             request, metadata = self._interceptor.pre_update(request, metadata)
             pb_request = compute.UpdateBackendServiceRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
-            # Jsonify the request body
-
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
+                use_integers_for_enums=False,
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            # Send the request
+            # Send the request in the negotiated wire format
             headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
+            response = self._wire.send(
+                getattr(self._session, method),
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
-                data=body,
+                params=query_params,
+                body=transcoded_request["body"],
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2313,7 +2275,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._wire.parse(response, pb_resp)
             resp = self._interceptor.post_update(resp)
             return resp
 
@@ -2323,7 +2285,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.AddSignedUrlKeyBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddSignedUrlKey(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddSignedUrlKey(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def aggregated_list(
@@ -2334,7 +2296,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def delete(
@@ -2342,7 +2304,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.DeleteBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def delete_signed_url_key(
@@ -2350,7 +2312,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.DeleteSignedUrlKeyBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DeleteSignedUrlKey(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DeleteSignedUrlKey(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def get(
@@ -2358,7 +2320,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.GetBackendServiceRequest], compute.BackendService]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def get_health(
@@ -2368,7 +2330,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetHealth(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetHealth(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def get_iam_policy(
@@ -2376,7 +2338,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.GetIamPolicyBackendServiceRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetIamPolicy(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def insert(
@@ -2384,7 +2346,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.InsertBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def list(
@@ -2392,7 +2354,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.ListBackendServicesRequest], compute.BackendServiceList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def list_usable(
@@ -2402,7 +2364,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListUsable(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListUsable(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def patch(
@@ -2410,7 +2372,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.PatchBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def set_edge_security_policy(
@@ -2420,7 +2382,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetEdgeSecurityPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetEdgeSecurityPolicy(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def set_iam_policy(
@@ -2428,7 +2390,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.SetIamPolicyBackendServiceRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetIamPolicy(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def set_security_policy(
@@ -2436,7 +2398,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.SetSecurityPolicyBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetSecurityPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetSecurityPolicy(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def test_iam_permissions(
@@ -2447,7 +2409,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._TestIamPermissions(self._session, self._host, self._interceptor)  # type: ignore
+        return self._TestIamPermissions(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def update(
@@ -2455,7 +2417,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.UpdateBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Update(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Update(self._session, self._host, self._interceptor, self._wire)  # type: ignore
 
     @property
     def kind(self) -> str:
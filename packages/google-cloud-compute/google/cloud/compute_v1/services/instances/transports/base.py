@@ -24,6 +24,7 @@ import google.auth  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.compute_helpers import forking, wrapping
 from google.cloud.compute_v1 import gapic_version as package_version
 from google.cloud.compute_v1.services import zone_operations
 from google.cloud.compute_v1.types import compute
@@ -123,246 +124,270 @@ class InstancesTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.add_access_config: gapic_v1.method.wrap_method(
-                self.add_access_config,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.add_resource_policies: gapic_v1.method.wrap_method(
-                self.add_resource_policies,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.aggregated_list: gapic_v1.method.wrap_method(
-                self.aggregated_list,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.attach_disk: gapic_v1.method.wrap_method(
-                self.attach_disk,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.bulk_insert: gapic_v1.method.wrap_method(
-                self.bulk_insert,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete: gapic_v1.method.wrap_method(
-                self.delete,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_access_config: gapic_v1.method.wrap_method(
-                self.delete_access_config,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.detach_disk: gapic_v1.method.wrap_method(
-                self.detach_disk,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get: gapic_v1.method.wrap_method(
-                self.get,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_effective_firewalls: gapic_v1.method.wrap_method(
-                self.get_effective_firewalls,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_guest_attributes: gapic_v1.method.wrap_method(
-                self.get_guest_attributes,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_iam_policy: gapic_v1.method.wrap_method(
-                self.get_iam_policy,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_screenshot: gapic_v1.method.wrap_method(
-                self.get_screenshot,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_serial_port_output: gapic_v1.method.wrap_method(
-                self.get_serial_port_output,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_shielded_instance_identity: gapic_v1.method.wrap_method(
-                self.get_shielded_instance_identity,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.insert: gapic_v1.method.wrap_method(
-                self.insert,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list: gapic_v1.method.wrap_method(
-                self.list,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_referrers: gapic_v1.method.wrap_method(
-                self.list_referrers,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.remove_resource_policies: gapic_v1.method.wrap_method(
-                self.remove_resource_policies,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.reset: gapic_v1.method.wrap_method(
-                self.reset,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.resume: gapic_v1.method.wrap_method(
-                self.resume,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.send_diagnostic_interrupt: gapic_v1.method.wrap_method(
-                self.send_diagnostic_interrupt,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_deletion_protection: gapic_v1.method.wrap_method(
-                self.set_deletion_protection,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_disk_auto_delete: gapic_v1.method.wrap_method(
-                self.set_disk_auto_delete,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_iam_policy: gapic_v1.method.wrap_method(
-                self.set_iam_policy,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_labels: gapic_v1.method.wrap_method(
-                self.set_labels,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_machine_resources: gapic_v1.method.wrap_method(
-                self.set_machine_resources,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_machine_type: gapic_v1.method.wrap_method(
-                self.set_machine_type,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_metadata: gapic_v1.method.wrap_method(
-                self.set_metadata,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_min_cpu_platform: gapic_v1.method.wrap_method(
-                self.set_min_cpu_platform,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_name: gapic_v1.method.wrap_method(
-                self.set_name,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_scheduling: gapic_v1.method.wrap_method(
-                self.set_scheduling,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_security_policy: gapic_v1.method.wrap_method(
-                self.set_security_policy,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_service_account: gapic_v1.method.wrap_method(
-                self.set_service_account,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_shielded_instance_integrity_policy: gapic_v1.method.wrap_method(
-                self.set_shielded_instance_integrity_policy,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_tags: gapic_v1.method.wrap_method(
-                self.set_tags,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.simulate_maintenance_event: gapic_v1.method.wrap_method(
-                self.simulate_maintenance_event,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.start: gapic_v1.method.wrap_method(
-                self.start,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.start_with_encryption_key: gapic_v1.method.wrap_method(
-                self.start_with_encryption_key,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.stop: gapic_v1.method.wrap_method(
-                self.stop,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.suspend: gapic_v1.method.wrap_method(
-                self.suspend,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.test_iam_permissions: gapic_v1.method.wrap_method(
-                self.test_iam_permissions,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update: gapic_v1.method.wrap_method(
-                self.update,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_access_config: gapic_v1.method.wrap_method(
-                self.update_access_config,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_display_device: gapic_v1.method.wrap_method(
-                self.update_display_device,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_network_interface: gapic_v1.method.wrap_method(
-                self.update_network_interface,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_shielded_instance_config: gapic_v1.method.wrap_method(
-                self.update_shielded_instance_config,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "add_access_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "add_resource_policies": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "aggregated_list": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "attach_disk": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "bulk_insert": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_access_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "detach_disk": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_effective_firewalls": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_guest_attributes": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_iam_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_screenshot": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_serial_port_output": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_shielded_instance_identity": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "insert": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_referrers": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "remove_resource_policies": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "reset": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "resume": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "send_diagnostic_interrupt": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_deletion_protection": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_disk_auto_delete": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_iam_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_labels": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_machine_resources": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_machine_type": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_metadata": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_min_cpu_platform": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_name": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_scheduling": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_security_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_service_account": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_shielded_instance_integrity_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_tags": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "simulate_maintenance_event": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "start": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "start_with_encryption_key": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "stop": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "suspend": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "test_iam_permissions": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_access_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_display_device": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_network_interface": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_shielded_instance_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
@@ -24,6 +24,7 @@ import google.auth  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.compute_helpers import forking, wrapping
 from google.cloud.compute_v1 import gapic_version as package_version
 from google.cloud.compute_v1.services import global_operations
 from google.cloud.compute_v1.types import compute
@@ -123,76 +124,100 @@ class ProjectsTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.disable_xpn_host: gapic_v1.method.wrap_method(
-                self.disable_xpn_host,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.disable_xpn_resource: gapic_v1.method.wrap_method(
-                self.disable_xpn_resource,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.enable_xpn_host: gapic_v1.method.wrap_method(
-                self.enable_xpn_host,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.enable_xpn_resource: gapic_v1.method.wrap_method(
-                self.enable_xpn_resource,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get: gapic_v1.method.wrap_method(
-                self.get,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_xpn_host: gapic_v1.method.wrap_method(
-                self.get_xpn_host,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_xpn_resources: gapic_v1.method.wrap_method(
-                self.get_xpn_resources,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_xpn_hosts: gapic_v1.method.wrap_method(
-                self.list_xpn_hosts,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.move_disk: gapic_v1.method.wrap_method(
-                self.move_disk,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.move_instance: gapic_v1.method.wrap_method(
-                self.move_instance,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_common_instance_metadata: gapic_v1.method.wrap_method(
-                self.set_common_instance_metadata,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_default_network_tier: gapic_v1.method.wrap_method(
-                self.set_default_network_tier,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_usage_export_bucket: gapic_v1.method.wrap_method(
-                self.set_usage_export_bucket,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "disable_xpn_host": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "disable_xpn_resource": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "enable_xpn_host": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "enable_xpn_resource": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_xpn_host": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_xpn_resources": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_xpn_hosts": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "move_disk": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "move_instance": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_common_instance_metadata": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_default_network_tier": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_usage_export_bucket": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
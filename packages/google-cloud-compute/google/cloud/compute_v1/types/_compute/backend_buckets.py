@@ -0,0 +1,1235 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_global_set_policy_request
+from google.cloud.compute_v1.types._compute import shared_security_policy_reference
+from google.cloud.compute_v1.types._compute import shared_signed_url_key
+from google.cloud.compute_v1.types._compute import shared_test_permissions_request
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddSignedUrlKeyBackendBucketRequest",
+        "BackendBucket",
+        "BackendBucketCdnPolicy",
+        "BackendBucketCdnPolicyBypassCacheOnRequestHeader",
+        "BackendBucketCdnPolicyCacheKeyPolicy",
+        "BackendBucketCdnPolicyNegativeCachingPolicy",
+        "BackendBucketList",
+        "DeleteBackendBucketRequest",
+        "DeleteSignedUrlKeyBackendBucketRequest",
+        "GetBackendBucketRequest",
+        "GetIamPolicyBackendBucketRequest",
+        "InsertBackendBucketRequest",
+        "ListBackendBucketsRequest",
+        "PatchBackendBucketRequest",
+        "SetEdgeSecurityPolicyBackendBucketRequest",
+        "SetIamPolicyBackendBucketRequest",
+        "TestIamPermissionsBackendBucketRequest",
+        "UpdateBackendBucketRequest",
+    },
+)
+
+
+class AddSignedUrlKeyBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.AddSignedUrlKey. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_bucket (str):
+            Name of the BackendBucket resource to which
+            the Signed URL Key should be added. The name
+            should conform to RFC1035.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        signed_url_key_resource (google.cloud.compute_v1.types.SignedUrlKey):
+            The body resource for this request
+    """
+
+    backend_bucket: str = proto.Field(
+        proto.STRING,
+        number=91714037,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    signed_url_key_resource: shared_signed_url_key.SignedUrlKey = proto.Field(
+        proto.MESSAGE,
+        number=457625985,
+        message=shared_signed_url_key.SignedUrlKey,
+    )
+
+
+class BackendBucket(proto.Message):
+    r"""Represents a Cloud Storage Bucket resource. This Cloud
+    Storage bucket resource is referenced by a URL map of a load
+    balancer. For more information, read Backend Buckets.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        bucket_name (str):
+            Cloud Storage bucket name.
+
+            This field is a member of `oneof`_ ``_bucket_name``.
+        cdn_policy (google.cloud.compute_v1.types.BackendBucketCdnPolicy):
+            Cloud CDN configuration for this
+            BackendBucket.
+
+            This field is a member of `oneof`_ ``_cdn_policy``.
+        compression_mode (str):
+            Compress text responses using Brotli or gzip
+            compression, based on the client's
+            Accept-Encoding header. Check the
+            CompressionMode enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_compression_mode``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        custom_response_headers (MutableSequence[str]):
+            Headers that the Application Load Balancer
+            should add to proxied responses.
+        description (str):
+            An optional textual description of the
+            resource; provided by the client when the
+            resource is created.
+
+            This field is a member of `oneof`_ ``_description``.
+        edge_security_policy (str):
+            [Output Only] The resource URL for the edge security policy
+            associated with this backend bucket.
+
+            This field is a member of `oneof`_ ``_edge_security_policy``.
+        enable_cdn (bool):
+            If true, enable Cloud CDN for this
+            BackendBucket.
+
+            This field is a member of `oneof`_ ``_enable_cdn``.
+        id (int):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            Type of the resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+    """
+
+    class CompressionMode(proto.Enum):
+        r"""Compress text responses using Brotli or gzip compression,
+        based on the client's Accept-Encoding header.
+
+        Values:
+            UNDEFINED_COMPRESSION_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            AUTOMATIC (165298699):
+                Automatically uses the best compression based
+                on the Accept-Encoding header sent by the
+                client.
+            DISABLED (516696700):
+                Disables compression. Existing compressed
+                responses cached by Cloud CDN will not be served
+                to clients.
+        """
+        UNDEFINED_COMPRESSION_MODE = 0
+        AUTOMATIC = 165298699
+        DISABLED = 516696700
+
+    bucket_name: str = proto.Field(
+        proto.STRING,
+        number=283610048,
+        optional=True,
+    )
+    cdn_policy: "BackendBucketCdnPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=213976452,
+        optional=True,
+        message="BackendBucketCdnPolicy",
+    )
+    compression_mode: str = proto.Field(
+        proto.STRING,
+        number=95520988,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    custom_response_headers: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=387539094,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    edge_security_policy: str = proto.Field(
+        proto.STRING,
+        number=41036943,
+        optional=True,
+    )
+    enable_cdn: bool = proto.Field(
+        proto.BOOL,
+        number=282942321,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+
+
+class BackendBucketCdnPolicy(proto.Message):
+    r"""Message containing Cloud CDN configuration for a backend
+    bucket.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        bypass_cache_on_request_headers (MutableSequence[google.cloud.compute_v1.types.BackendBucketCdnPolicyBypassCacheOnRequestHeader]):
+            Bypass the cache when the specified request
+            headers are matched - e.g. Pragma or
+            Authorization headers. Up to 5 headers can be
+            specified. The cache is bypassed for all
+            cdnPolicy.cacheMode settings.
+        cache_key_policy (google.cloud.compute_v1.types.BackendBucketCdnPolicyCacheKeyPolicy):
+            The CacheKeyPolicy for this CdnPolicy.
+
+            This field is a member of `oneof`_ ``_cache_key_policy``.
+        cache_mode (str):
+            Specifies the cache setting for all responses from this
+            backend. The possible values are: USE_ORIGIN_HEADERS
+            Requires the origin to set valid caching headers to cache
+            content. Responses without these headers will not be cached
+            at Google's edge, and will require a full trip to the origin
+            on every request, potentially impacting performance and
+            increasing load on the origin server. FORCE_CACHE_ALL Cache
+            all content, ignoring any "private", "no-store" or
+            "no-cache" directives in Cache-Control response headers.
+            Warning: this may result in Cloud CDN caching private,
+            per-user (user identifiable) content. CACHE_ALL_STATIC
+            Automatically cache static content, including common image
+            formats, media (video and audio), and web assets (JavaScript
+            and CSS). Requests and responses that are marked as
+            uncacheable, as well as dynamic content (including HTML),
+            will not be cached. Check the CacheMode enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_cache_mode``.
+        client_ttl (int):
+            Specifies a separate client (e.g. browser client) maximum
+            TTL. This is used to clamp the max-age (or Expires) value
+            sent to the client. With FORCE_CACHE_ALL, the lesser of
+            client_ttl and default_ttl is used for the response max-age
+            directive, along with a "public" directive. For cacheable
+            content in CACHE_ALL_STATIC mode, client_ttl clamps the
+            max-age from the origin (if specified), or else sets the
+            response max-age directive to the lesser of the client_ttl
+            and default_ttl, and also ensures a "public" cache-control
+            directive is present. If a client TTL is not specified, a
+            default value (1 hour) will be used. The maximum allowed
+            value is 31,622,400s (1 year).
+
+            This field is a member of `oneof`_ ``_client_ttl``.
+        default_ttl (int):
+            Specifies the default TTL for cached content served by this
+            origin for responses that do not have an existing valid TTL
+            (max-age or s-max-age). Setting a TTL of "0" means "always
+            revalidate". The value of defaultTTL cannot be set to a
+            value greater than that of maxTTL, but can be equal. When
+            the cacheMode is set to FORCE_CACHE_ALL, the defaultTTL will
+            overwrite the TTL set in all responses. The maximum allowed
+            value is 31,622,400s (1 year), noting that infrequently
+            accessed objects may be evicted from the cache before the
+            defined TTL.
+
+            This field is a member of `oneof`_ ``_default_ttl``.
+        max_ttl (int):
+            Specifies the maximum allowed TTL for cached
+            content served by this origin. Cache directives
+            that attempt to set a max-age or s-maxage higher
+            than this, or an Expires header more than maxTTL
+            seconds in the future will be capped at the
+            value of maxTTL, as if it were the value of an
+            s-maxage Cache-Control directive. Headers sent
+            to the client will not be modified. Setting a
+            TTL of "0" means "always revalidate". The
+            maximum allowed value is 31,622,400s (1 year),
+            noting that infrequently accessed objects may be
+            evicted from the cache before the defined TTL.
+
+            This field is a member of `oneof`_ ``_max_ttl``.
+        negative_caching (bool):
+            Negative caching allows per-status code TTLs to be set, in
+            order to apply fine-grained caching for common errors or
+            redirects. This can reduce the load on your origin and
+            improve end-user experience by reducing response latency.
+            When the cache mode is set to CACHE_ALL_STATIC or
+            USE_ORIGIN_HEADERS, negative caching applies to responses
+            with the specified response code that lack any
+            Cache-Control, Expires, or Pragma: no-cache directives. When
+            the cache mode is set to FORCE_CACHE_ALL, negative caching
+            applies to all responses with the specified response code,
+            and override any caching headers. By default, Cloud CDN will
+            apply the following default TTLs to these status codes: HTTP
+            300 (Multiple Choice), 301, 308 (Permanent Redirects): 10m
+            HTTP 404 (Not Found), 410 (Gone), 451 (Unavailable For Legal
+            Reasons): 120s HTTP 405 (Method Not Found), 421 (Misdirected
+            Request), 501 (Not Implemented): 60s. These defaults can be
+            overridden in negative_caching_policy.
+
+            This field is a member of `oneof`_ ``_negative_caching``.
+        negative_caching_policy (MutableSequence[google.cloud.compute_v1.types.BackendBucketCdnPolicyNegativeCachingPolicy]):
+            Sets a cache TTL for the specified HTTP status code.
+            negative_caching must be enabled to configure
+            negative_caching_policy. Omitting the policy and leaving
+            negative_caching enabled will use Cloud CDN's default cache
+            TTLs. Note that when specifying an explicit
+            negative_caching_policy, you should take care to specify a
+            cache TTL for all response codes that you wish to cache.
+            Cloud CDN will not apply any default negative caching when a
+            policy exists.
+        request_coalescing (bool):
+            If true then Cloud CDN will combine multiple
+            concurrent cache fill requests into a small
+            number of requests to the origin.
+
+            This field is a member of `oneof`_ ``_request_coalescing``.
+        serve_while_stale (int):
+            Serve existing content from the cache (if
+            available) when revalidating content with the
+            origin, or when an error is encountered when
+            refreshing the cache. This setting defines the
+            default "max-stale" duration for any cached
+            responses that do not specify a max-stale
+            directive. Stale responses that exceed the TTL
+            configured here will not be served. The default
+            limit (max-stale) is 86400s (1 day), which will
+            allow stale content to be served up to this
+            limit beyond the max-age (or s-max-age) of a
+            cached response. The maximum allowed value is
+            604800 (1 week). Set this to zero (0) to disable
+            serve-while-stale.
+
+            This field is a member of `oneof`_ ``_serve_while_stale``.
+        signed_url_cache_max_age_sec (int):
+            Maximum number of seconds the response to a signed URL
+            request will be considered fresh. After this time period,
+            the response will be revalidated before being served.
+            Defaults to 1hr (3600s). When serving responses to signed
+            URL requests, Cloud CDN will internally behave as though all
+            responses from this backend had a "Cache-Control: public,
+            max-age=[TTL]" header, regardless of any existing
+            Cache-Control header. The actual headers served in responses
+            will not be altered.
+
+            This field is a member of `oneof`_ ``_signed_url_cache_max_age_sec``.
+        signed_url_key_names (MutableSequence[str]):
+            [Output Only] Names of the keys for signing request URLs.
+    """
+
+    class CacheMode(proto.Enum):
+        r"""Specifies the cache setting for all responses from this backend. The
+        possible values are: USE_ORIGIN_HEADERS Requires the origin to set
+        valid caching headers to cache content. Responses without these
+        headers will not be cached at Google's edge, and will require a full
+        trip to the origin on every request, potentially impacting
+        performance and increasing load on the origin server.
+        FORCE_CACHE_ALL Cache all content, ignoring any "private",
+        "no-store" or "no-cache" directives in Cache-Control response
+        headers. Warning: this may result in Cloud CDN caching private,
+        per-user (user identifiable) content. CACHE_ALL_STATIC Automatically
+        cache static content, including common image formats, media (video
+        and audio), and web assets (JavaScript and CSS). Requests and
+        responses that are marked as uncacheable, as well as dynamic content
+        (including HTML), will not be cached.
+
+        Values:
+            UNDEFINED_CACHE_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            CACHE_ALL_STATIC (355027945):
+                Automatically cache static content, including
+                common image formats, media (video and audio),
+                and web assets (JavaScript and CSS). Requests
+                and responses that are marked as uncacheable, as
+                well as dynamic content (including HTML), will
+                not be cached.
+            FORCE_CACHE_ALL (486026928):
+                Cache all content, ignoring any "private",
+                "no-store" or "no-cache" directives in
+                Cache-Control response headers. Warning: this
+                may result in Cloud CDN caching private,
+                per-user (user identifiable) content.
+            INVALID_CACHE_MODE (381295560):
+                No description available.
+            USE_ORIGIN_HEADERS (55380261):
+                Requires the origin to set valid caching
+                headers to cache content. Responses without
+                these headers will not be cached at Google's
+                edge, and will require a full trip to the origin
+                on every request, potentially impacting
+                performance and increasing load on the origin
+                server.
+        """
+        UNDEFINED_CACHE_MODE = 0
+        CACHE_ALL_STATIC = 355027945
+        FORCE_CACHE_ALL = 486026928
+        INVALID_CACHE_MODE = 381295560
+        USE_ORIGIN_HEADERS = 55380261
+
+    bypass_cache_on_request_headers: MutableSequence[
+        "BackendBucketCdnPolicyBypassCacheOnRequestHeader"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=486203082,
+        message="BackendBucketCdnPolicyBypassCacheOnRequestHeader",
+    )
+    cache_key_policy: "BackendBucketCdnPolicyCacheKeyPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=159263727,
+        optional=True,
+        message="BackendBucketCdnPolicyCacheKeyPolicy",
+    )
+    cache_mode: str = proto.Field(
+        proto.STRING,
+        number=28877888,
+        optional=True,
+    )
+    client_ttl: int = proto.Field(
+        proto.INT32,
+        number=29034360,
+        optional=True,
+    )
+    default_ttl: int = proto.Field(
+        proto.INT32,
+        number=100253422,
+        optional=True,
+    )
+    max_ttl: int = proto.Field(
+        proto.INT32,
+        number=307578001,
+        optional=True,
+    )
+    negative_caching: bool = proto.Field(
+        proto.BOOL,
+        number=336110005,
+        optional=True,
+    )
+    negative_caching_policy: MutableSequence[
+        "BackendBucketCdnPolicyNegativeCachingPolicy"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=155359996,
+        message="BackendBucketCdnPolicyNegativeCachingPolicy",
+    )
+    request_coalescing: bool = proto.Field(
+        proto.BOOL,
+        number=532808276,
+        optional=True,
+    )
+    serve_while_stale: int = proto.Field(
+        proto.INT32,
+        number=236682203,
+        optional=True,
+    )
+    signed_url_cache_max_age_sec: int = proto.Field(
+        proto.INT64,
+        number=269374534,
+        optional=True,
+    )
+    signed_url_key_names: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=371848885,
+    )
+
+
+class BackendBucketCdnPolicyBypassCacheOnRequestHeader(proto.Message):
+    r"""Bypass the cache when the specified request headers are present,
+    e.g. Pragma or Authorization headers. Values are case insensitive.
+    The presence of such a header overrides the cache_mode setting.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        header_name (str):
+            The header field name to match on when
+            bypassing cache. Values are case-insensitive.
+
+            This field is a member of `oneof`_ ``_header_name``.
+    """
+
+    header_name: str = proto.Field(
+        proto.STRING,
+        number=110223613,
+        optional=True,
+    )
+
+
+class BackendBucketCdnPolicyCacheKeyPolicy(proto.Message):
+    r"""Message containing what to include in the cache key for a
+    request for Cloud CDN.
+
+    Attributes:
+        include_http_headers (MutableSequence[str]):
+            Allows HTTP request headers (by name) to be
+            used in the cache key.
+        query_string_whitelist (MutableSequence[str]):
+            Names of query string parameters to include
+            in cache keys. Default parameters are always
+            included. '&' and '=' will be percent encoded
+            and not treated as delimiters.
+    """
+
+    include_http_headers: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=2489606,
+    )
+    query_string_whitelist: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=52456496,
+    )
+
+
+class BackendBucketCdnPolicyNegativeCachingPolicy(proto.Message):
+    r"""Specify CDN TTLs for response error codes.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        code (int):
+            The HTTP status code to define a TTL against.
+            Only HTTP status codes 300, 301, 302, 307, 308,
+            404, 405, 410, 421, 451 and 501 are can be
+            specified as values, and you cannot specify a
+            status code more than once.
+
+            This field is a member of `oneof`_ ``_code``.
+        ttl (int):
+            The TTL (in seconds) for which to cache
+            responses with the corresponding status code.
+            The maximum allowed value is 1800s (30 minutes),
+            noting that infrequently accessed objects may be
+            evicted from the cache before the defined TTL.
+
+            This field is a member of `oneof`_ ``_ttl``.
+    """
+
+    code: int = proto.Field(
+        proto.INT32,
+        number=3059181,
+        optional=True,
+    )
+    ttl: int = proto.Field(
+        proto.INT32,
+        number=115180,
+        optional=True,
+    )
+
+
+class BackendBucketList(proto.Message):
+    r"""Contains a list of BackendBucket resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.BackendBucket]):
+            A list of BackendBucket resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["BackendBucket"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="BackendBucket",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class DeleteBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_bucket (str):
+            Name of the BackendBucket resource to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    backend_bucket: str = proto.Field(
+        proto.STRING,
+        number=91714037,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class DeleteSignedUrlKeyBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.DeleteSignedUrlKey. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_bucket (str):
+            Name of the BackendBucket resource to which
+            the Signed URL Key should be added. The name
+            should conform to RFC1035.
+        key_name (str):
+            The name of the Signed URL Key to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    backend_bucket: str = proto.Field(
+        proto.STRING,
+        number=91714037,
+    )
+    key_name: str = proto.Field(
+        proto.STRING,
+        number=500938859,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class GetBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.Get. See the method
+    description for details.
+
+    Attributes:
+        backend_bucket (str):
+            Name of the BackendBucket resource to return.
+        project (str):
+            Project ID for this request.
+    """
+
+    backend_bucket: str = proto.Field(
+        proto.STRING,
+        number=91714037,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class GetIamPolicyBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.GetIamPolicy. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version: int = proto.Field(
+        proto.INT32,
+        number=499220029,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class InsertBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_bucket_resource (google.cloud.compute_v1.types.BackendBucket):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    backend_bucket_resource: "BackendBucket" = proto.Field(
+        proto.MESSAGE,
+        number=380757784,
+        message="BackendBucket",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class ListBackendBucketsRequest(proto.Message):
+    r"""A request message for BackendBuckets.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class PatchBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.Patch. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_bucket (str):
+            Name of the BackendBucket resource to patch.
+        backend_bucket_resource (google.cloud.compute_v1.types.BackendBucket):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    backend_bucket: str = proto.Field(
+        proto.STRING,
+        number=91714037,
+    )
+    backend_bucket_resource: "BackendBucket" = proto.Field(
+        proto.MESSAGE,
+        number=380757784,
+        message="BackendBucket",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class SetEdgeSecurityPolicyBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.SetEdgeSecurityPolicy.
+    See the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_bucket (str):
+            Name of the BackendService resource to which
+            the security policy should be set. The name
+            should conform to RFC1035.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        security_policy_reference_resource (google.cloud.compute_v1.types.SecurityPolicyReference):
+            The body resource for this request
+    """
+
+    backend_bucket: str = proto.Field(
+        proto.STRING,
+        number=91714037,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    security_policy_reference_resource: shared_security_policy_reference.SecurityPolicyReference = proto.Field(
+        proto.MESSAGE,
+        number=204135024,
+        message=shared_security_policy_reference.SecurityPolicyReference,
+    )
+
+
+class SetIamPolicyBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.SetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        global_set_policy_request_resource (google.cloud.compute_v1.types.GlobalSetPolicyRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    global_set_policy_request_resource: shared_global_set_policy_request.GlobalSetPolicyRequest = proto.Field(
+        proto.MESSAGE,
+        number=337048498,
+        message=shared_global_set_policy_request.GlobalSetPolicyRequest,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class TestIamPermissionsBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.TestIamPermissions. See
+    the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    test_permissions_request_resource: shared_test_permissions_request.TestPermissionsRequest = proto.Field(
+        proto.MESSAGE,
+        number=439214758,
+        message=shared_test_permissions_request.TestPermissionsRequest,
+    )
+
+
+class UpdateBackendBucketRequest(proto.Message):
+    r"""A request message for BackendBuckets.Update. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_bucket (str):
+            Name of the BackendBucket resource to update.
+        backend_bucket_resource (google.cloud.compute_v1.types.BackendBucket):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    backend_bucket: str = proto.Field(
+        proto.STRING,
+        number=91714037,
+    )
+    backend_bucket_resource: "BackendBucket" = proto.Field(
+        proto.MESSAGE,
+        number=380757784,
+        message="BackendBucket",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,642 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_global_set_labels_request
+from google.cloud.compute_v1.types._compute import shared_test_permissions_request
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteExternalVpnGatewayRequest",
+        "ExternalVpnGateway",
+        "ExternalVpnGatewayInterface",
+        "ExternalVpnGatewayList",
+        "GetExternalVpnGatewayRequest",
+        "InsertExternalVpnGatewayRequest",
+        "ListExternalVpnGatewaysRequest",
+        "SetLabelsExternalVpnGatewayRequest",
+        "TestIamPermissionsExternalVpnGatewayRequest",
+    },
+)
+
+
+class DeleteExternalVpnGatewayRequest(proto.Message):
+    r"""A request message for ExternalVpnGateways.Delete. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        external_vpn_gateway (str):
+            Name of the externalVpnGateways to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    external_vpn_gateway: str = proto.Field(
+        proto.STRING,
+        number=109898629,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class ExternalVpnGateway(proto.Message):
+    r"""Represents an external VPN gateway. External VPN gateway is
+    the on-premises VPN gateway(s) or another cloud provider's VPN
+    gateway that connects to your Google Cloud VPN gateway. To
+    create a highly available VPN from Google Cloud Platform to your
+    VPN gateway or another cloud provider's VPN gateway, you must
+    create a external VPN gateway resource with information about
+    the other gateway. For more information about using external VPN
+    gateways, see Creating an HA VPN gateway and tunnel pair to a
+    peer VPN.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        interfaces (MutableSequence[google.cloud.compute_v1.types.ExternalVpnGatewayInterface]):
+            A list of interfaces for this external VPN
+            gateway. If your peer-side gateway is an
+            on-premises gateway and non-AWS cloud providers'
+            gateway, at most two interfaces can be provided
+            for an external VPN gateway. If your peer side
+            is an AWS virtual private gateway, four
+            interfaces should be provided for an external
+            VPN gateway.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#externalVpnGateway for externalVpnGateways.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this ExternalVpnGateway, which is essentially a
+            hash of the labels set used for optimistic
+            locking. The fingerprint is initially generated
+            by Compute Engine and changes after every
+            request to modify or update labels. You must
+            always provide an up-to-date fingerprint hash in
+            order to update or change labels, otherwise the
+            request will fail with error 412
+            conditionNotMet. To see the latest fingerprint,
+            make a get() request to retrieve an
+            ExternalVpnGateway.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+            Labels for this resource. These can only be
+            added or modified by the setLabels method. Each
+            label key/value pair must comply with RFC1035.
+            Label values may be empty.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        redundancy_type (str):
+            Indicates the user-supplied redundancy type
+            of this external VPN gateway. Check the
+            RedundancyType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_redundancy_type``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+    """
+
+    class RedundancyType(proto.Enum):
+        r"""Indicates the user-supplied redundancy type of this external
+        VPN gateway.
+
+        Values:
+            UNDEFINED_REDUNDANCY_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            FOUR_IPS_REDUNDANCY (520087913):
+                The external VPN gateway has four public IP addresses; at
+                the time of writing this API, the AWS virtual private
+                gateway is an example which has four public IP addresses for
+                high availability connections; there should be two VPN
+                connections in the AWS virtual private gateway , each AWS
+                VPN connection has two public IP addresses; please make sure
+                to put two public IP addresses from one AWS VPN connection
+                into interfaces 0 and 1 of this external VPN gateway, and
+                put the other two public IP addresses from another AWS VPN
+                connection into interfaces 2 and 3 of this external VPN
+                gateway. When displaying highly available configuration
+                status for the VPN tunnels connected to FOUR_IPS_REDUNDANCY
+                external VPN gateway, Google will always detect whether
+                interfaces 0 and 1 are connected on one interface of HA
+                Cloud VPN gateway, and detect whether interfaces 2 and 3 are
+                connected to another interface of the HA Cloud VPN gateway.
+            SINGLE_IP_INTERNALLY_REDUNDANT (133914873):
+                The external VPN gateway has only one public
+                IP address which internally provide redundancy
+                or failover.
+            TWO_IPS_REDUNDANCY (367049635):
+                The external VPN gateway has two public IP
+                addresses which are redundant with each other,
+                the following two types of setup on your
+                on-premises side would have this type of
+                redundancy: (1) Two separate on-premises
+                gateways, each with one public IP address, the
+                two on-premises gateways are redundant with each
+                other. (2) A single on-premise gateway with two
+                public IP addresses that are redundant with
+                eatch other.
+        """
+        UNDEFINED_REDUNDANCY_TYPE = 0
+        FOUR_IPS_REDUNDANCY = 520087913
+        SINGLE_IP_INTERNALLY_REDUNDANT = 133914873
+        TWO_IPS_REDUNDANCY = 367049635
+
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    interfaces: MutableSequence["ExternalVpnGatewayInterface"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=12073562,
+        message="ExternalVpnGatewayInterface",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    redundancy_type: str = proto.Field(
+        proto.STRING,
+        number=271443740,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+
+
+class ExternalVpnGatewayInterface(proto.Message):
+    r"""The interface for the external VPN gateway.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (int):
+            The numeric ID of this interface. The allowed input values
+            for this id for different redundancy types of external VPN
+            gateway: - SINGLE_IP_INTERNALLY_REDUNDANT - 0 -
+            TWO_IPS_REDUNDANCY - 0, 1 - FOUR_IPS_REDUNDANCY - 0, 1, 2, 3
+
+            This field is a member of `oneof`_ ``_id``.
+        ip_address (str):
+            IP address of the interface in the external
+            VPN gateway. Only IPv4 is supported. This IP
+            address can be either from your on-premise
+            gateway or another Cloud provider's VPN gateway,
+            it cannot be an IP address from Google Compute
+            Engine.
+
+            This field is a member of `oneof`_ ``_ip_address``.
+    """
+
+    id: int = proto.Field(
+        proto.UINT32,
+        number=3355,
+        optional=True,
+    )
+    ip_address: str = proto.Field(
+        proto.STRING,
+        number=406272220,
+        optional=True,
+    )
+
+
+class ExternalVpnGatewayList(proto.Message):
+    r"""Response to the list request, and contains a list of
+    externalVpnGateways.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        etag (str):
+
+            This field is a member of `oneof`_ ``_etag``.
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.ExternalVpnGateway]):
+            A list of ExternalVpnGateway resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#externalVpnGatewayList for lists of
+            externalVpnGateways.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    etag: str = proto.Field(
+        proto.STRING,
+        number=3123477,
+        optional=True,
+    )
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["ExternalVpnGateway"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="ExternalVpnGateway",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class GetExternalVpnGatewayRequest(proto.Message):
+    r"""A request message for ExternalVpnGateways.Get. See the method
+    description for details.
+
+    Attributes:
+        external_vpn_gateway (str):
+            Name of the externalVpnGateway to return.
+        project (str):
+            Project ID for this request.
+    """
+
+    external_vpn_gateway: str = proto.Field(
+        proto.STRING,
+        number=109898629,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class InsertExternalVpnGatewayRequest(proto.Message):
+    r"""A request message for ExternalVpnGateways.Insert. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        external_vpn_gateway_resource (google.cloud.compute_v1.types.ExternalVpnGateway):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    external_vpn_gateway_resource: "ExternalVpnGateway" = proto.Field(
+        proto.MESSAGE,
+        number=486813576,
+        message="ExternalVpnGateway",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class ListExternalVpnGatewaysRequest(proto.Message):
+    r"""A request message for ExternalVpnGateways.List. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class SetLabelsExternalVpnGatewayRequest(proto.Message):
+    r"""A request message for ExternalVpnGateways.SetLabels. See the
+    method description for details.
+
+    Attributes:
+        global_set_labels_request_resource (google.cloud.compute_v1.types.GlobalSetLabelsRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    global_set_labels_request_resource: shared_global_set_labels_request.GlobalSetLabelsRequest = proto.Field(
+        proto.MESSAGE,
+        number=319917189,
+        message=shared_global_set_labels_request.GlobalSetLabelsRequest,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class TestIamPermissionsExternalVpnGatewayRequest(proto.Message):
+    r"""A request message for ExternalVpnGateways.TestIamPermissions.
+    See the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    test_permissions_request_resource: shared_test_permissions_request.TestPermissionsRequest = proto.Field(
+        proto.MESSAGE,
+        number=439214758,
+        message=shared_test_permissions_request.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,932 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_binding
+from google.cloud.compute_v1.types._compute import shared_firewall_policy
+from google.cloud.compute_v1.types._compute import shared_firewall_policy_rule
+from google.cloud.compute_v1.types._compute import shared_test_permissions_request
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddAssociationFirewallPolicyRequest",
+        "AddRuleFirewallPolicyRequest",
+        "CloneRulesFirewallPolicyRequest",
+        "DeleteFirewallPolicyRequest",
+        "FirewallPoliciesListAssociationsResponse",
+        "GetAssociationFirewallPolicyRequest",
+        "GetFirewallPolicyRequest",
+        "GetIamPolicyFirewallPolicyRequest",
+        "GetRuleFirewallPolicyRequest",
+        "GlobalOrganizationSetPolicyRequest",
+        "InsertFirewallPolicyRequest",
+        "ListAssociationsFirewallPolicyRequest",
+        "ListFirewallPoliciesRequest",
+        "MoveFirewallPolicyRequest",
+        "PatchFirewallPolicyRequest",
+        "PatchRuleFirewallPolicyRequest",
+        "RemoveAssociationFirewallPolicyRequest",
+        "RemoveRuleFirewallPolicyRequest",
+        "SetIamPolicyFirewallPolicyRequest",
+        "TestIamPermissionsFirewallPolicyRequest",
+    },
+)
+
+
+class AddAssociationFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.AddAssociation. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        firewall_policy_association_resource (google.cloud.compute_v1.types.FirewallPolicyAssociation):
+            The body resource for this request
+        replace_existing_association (bool):
+            Indicates whether or not to replace it if an
+            association of the attachment already exists.
+            This is false by default, in which case an error
+            will be returned if an association already
+            exists.
+
+            This field is a member of `oneof`_ ``_replace_existing_association``.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    firewall_policy_association_resource: shared_firewall_policy.FirewallPolicyAssociation = proto.Field(
+        proto.MESSAGE,
+        number=259546170,
+        message=shared_firewall_policy.FirewallPolicyAssociation,
+    )
+    replace_existing_association: bool = proto.Field(
+        proto.BOOL,
+        number=209541240,
+        optional=True,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class AddRuleFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.AddRule. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        firewall_policy_rule_resource (google.cloud.compute_v1.types.FirewallPolicyRule):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    firewall_policy_rule_resource: shared_firewall_policy_rule.FirewallPolicyRule = (
+        proto.Field(
+            proto.MESSAGE,
+            number=250523523,
+            message=shared_firewall_policy_rule.FirewallPolicyRule,
+        )
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class CloneRulesFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.CloneRules. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        source_firewall_policy (str):
+            The firewall policy from which to copy rules.
+
+            This field is a member of `oneof`_ ``_source_firewall_policy``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    source_firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=25013549,
+        optional=True,
+    )
+
+
+class DeleteFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to delete.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class FirewallPoliciesListAssociationsResponse(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        associations (MutableSequence[google.cloud.compute_v1.types.FirewallPolicyAssociation]):
+            A list of associations.
+        kind (str):
+            [Output Only] Type of firewallPolicy associations. Always
+            compute#FirewallPoliciesListAssociations for lists of
+            firewallPolicy associations.
+
+            This field is a member of `oneof`_ ``_kind``.
+    """
+
+    associations: MutableSequence[
+        shared_firewall_policy.FirewallPolicyAssociation
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=508736530,
+        message=shared_firewall_policy.FirewallPolicyAssociation,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+
+
+class GetAssociationFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.GetAssociation. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to which the
+            queried rule belongs.
+        name (str):
+            The name of the association to get from the
+            firewall policy.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+
+
+class GetFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.Get. See the method
+    description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to get.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+
+
+class GetIamPolicyFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.GetIamPolicy. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version: int = proto.Field(
+        proto.INT32,
+        number=499220029,
+        optional=True,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class GetRuleFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.GetRule. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to which the
+            queried rule belongs.
+        priority (int):
+            The priority of the rule to get from the
+            firewall policy.
+
+            This field is a member of `oneof`_ ``_priority``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    priority: int = proto.Field(
+        proto.INT32,
+        number=445151652,
+        optional=True,
+    )
+
+
+class GlobalOrganizationSetPolicyRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        bindings (MutableSequence[google.cloud.compute_v1.types.Binding]):
+            Flatten Policy to create a backward
+            compatible wire-format. Deprecated. Use 'policy'
+            to specify bindings.
+        etag (str):
+            Flatten Policy to create a backward
+            compatible wire-format. Deprecated. Use 'policy'
+            to specify the etag.
+
+            This field is a member of `oneof`_ ``_etag``.
+        policy (google.cloud.compute_v1.types.Policy):
+            REQUIRED: The complete policy to be applied
+            to the 'resource'. The size of the policy is
+            limited to a few 10s of KB. An empty policy is
+            in general a valid policy but certain services
+            (like Projects) might reject them.
+
+            This field is a member of `oneof`_ ``_policy``.
+    """
+
+    bindings: MutableSequence[shared_binding.Binding] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=403251854,
+        message=shared_binding.Binding,
+    )
+    etag: str = proto.Field(
+        proto.STRING,
+        number=3123477,
+        optional=True,
+    )
+    policy: shared_binding.Policy = proto.Field(
+        proto.MESSAGE,
+        number=91071794,
+        optional=True,
+        message=shared_binding.Policy,
+    )
+
+
+class InsertFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy_resource (google.cloud.compute_v1.types.FirewallPolicy):
+            The body resource for this request
+        parent_id (str):
+            Parent ID for this request. The ID can be either be
+            "folders/[FOLDER_ID]" if the parent is a folder or
+            "organizations/[ORGANIZATION_ID]" if the parent is an
+            organization.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy_resource: shared_firewall_policy.FirewallPolicy = proto.Field(
+        proto.MESSAGE,
+        number=495049532,
+        message=shared_firewall_policy.FirewallPolicy,
+    )
+    parent_id: str = proto.Field(
+        proto.STRING,
+        number=459714768,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class ListAssociationsFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.ListAssociations. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        target_resource (str):
+            The target resource to list associations. It
+            is an organization, or a folder.
+
+            This field is a member of `oneof`_ ``_target_resource``.
+    """
+
+    target_resource: str = proto.Field(
+        proto.STRING,
+        number=467318524,
+        optional=True,
+    )
+
+
+class ListFirewallPoliciesRequest(proto.Message):
+    r"""A request message for FirewallPolicies.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        parent_id (str):
+            Parent ID for this request. The ID can be either be
+            "folders/[FOLDER_ID]" if the parent is a folder or
+            "organizations/[ORGANIZATION_ID]" if the parent is an
+            organization.
+
+            This field is a member of `oneof`_ ``_parent_id``.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    parent_id: str = proto.Field(
+        proto.STRING,
+        number=459714768,
+        optional=True,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class MoveFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.Move. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        parent_id (str):
+            The new parent of the firewall policy. The ID can be either
+            be "folders/[FOLDER_ID]" if the parent is a folder or
+            "organizations/[ORGANIZATION_ID]" if the parent is an
+            organization.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    parent_id: str = proto.Field(
+        proto.STRING,
+        number=459714768,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class PatchFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.Patch. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        firewall_policy_resource (google.cloud.compute_v1.types.FirewallPolicy):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    firewall_policy_resource: shared_firewall_policy.FirewallPolicy = proto.Field(
+        proto.MESSAGE,
+        number=495049532,
+        message=shared_firewall_policy.FirewallPolicy,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class PatchRuleFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.PatchRule. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        firewall_policy_rule_resource (google.cloud.compute_v1.types.FirewallPolicyRule):
+            The body resource for this request
+        priority (int):
+            The priority of the rule to patch.
+
+            This field is a member of `oneof`_ ``_priority``.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    firewall_policy_rule_resource: shared_firewall_policy_rule.FirewallPolicyRule = (
+        proto.Field(
+            proto.MESSAGE,
+            number=250523523,
+            message=shared_firewall_policy_rule.FirewallPolicyRule,
+        )
+    )
+    priority: int = proto.Field(
+        proto.INT32,
+        number=445151652,
+        optional=True,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class RemoveAssociationFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.RemoveAssociation. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        name (str):
+            Name for the attachment that will be removed.
+
+            This field is a member of `oneof`_ ``_name``.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class RemoveRuleFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.RemoveRule. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        priority (int):
+            The priority of the rule to remove from the
+            firewall policy.
+
+            This field is a member of `oneof`_ ``_priority``.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+    )
+    priority: int = proto.Field(
+        proto.INT32,
+        number=445151652,
+        optional=True,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class SetIamPolicyFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.SetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        global_organization_set_policy_request_resource (google.cloud.compute_v1.types.GlobalOrganizationSetPolicyRequest):
+            The body resource for this request
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    global_organization_set_policy_request_resource: "GlobalOrganizationSetPolicyRequest" = proto.Field(
+        proto.MESSAGE,
+        number=177408606,
+        message="GlobalOrganizationSetPolicyRequest",
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class TestIamPermissionsFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.TestIamPermissions.
+    See the method description for details.
+
+    Attributes:
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    test_permissions_request_resource: shared_test_permissions_request.TestPermissionsRequest = proto.Field(
+        proto.MESSAGE,
+        number=439214758,
+        message=shared_test_permissions_request.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,2227 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_per_instance_config
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AbandonInstancesInstanceGroupManagerRequest",
+        "AggregatedListInstanceGroupManagersRequest",
+        "ApplyUpdatesToInstancesInstanceGroupManagerRequest",
+        "CreateInstancesInstanceGroupManagerRequest",
+        "DeleteInstanceGroupManagerRequest",
+        "DeleteInstancesInstanceGroupManagerRequest",
+        "DeletePerInstanceConfigsInstanceGroupManagerRequest",
+        "GetInstanceGroupManagerRequest",
+        "InsertInstanceGroupManagerRequest",
+        "InstanceGroupManagerAggregatedList",
+        "InstanceGroupManagerList",
+        "InstanceGroupManagersAbandonInstancesRequest",
+        "InstanceGroupManagersApplyUpdatesRequest",
+        "InstanceGroupManagersCreateInstancesRequest",
+        "InstanceGroupManagersDeleteInstancesRequest",
+        "InstanceGroupManagersDeletePerInstanceConfigsReq",
+        "InstanceGroupManagersListErrorsResponse",
+        "InstanceGroupManagersListManagedInstancesResponse",
+        "InstanceGroupManagersListPerInstanceConfigsResp",
+        "InstanceGroupManagersPatchPerInstanceConfigsReq",
+        "InstanceGroupManagersRecreateInstancesRequest",
+        "InstanceGroupManagersScopedList",
+        "InstanceGroupManagersSetInstanceTemplateRequest",
+        "InstanceGroupManagersSetTargetPoolsRequest",
+        "InstanceGroupManagersUpdatePerInstanceConfigsReq",
+        "ListErrorsInstanceGroupManagersRequest",
+        "ListInstanceGroupManagersRequest",
+        "ListManagedInstancesInstanceGroupManagersRequest",
+        "ListPerInstanceConfigsInstanceGroupManagersRequest",
+        "PatchInstanceGroupManagerRequest",
+        "PatchPerInstanceConfigsInstanceGroupManagerRequest",
+        "RecreateInstancesInstanceGroupManagerRequest",
+        "ResizeInstanceGroupManagerRequest",
+        "SetInstanceTemplateInstanceGroupManagerRequest",
+        "SetTargetPoolsInstanceGroupManagerRequest",
+        "UpdatePerInstanceConfigsInstanceGroupManagerRequest",
+    },
+)
+
+
+class AbandonInstancesInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.AbandonInstances.
+    See the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group.
+        instance_group_managers_abandon_instances_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersAbandonInstancesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_managers_abandon_instances_request_resource: "InstanceGroupManagersAbandonInstancesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=320929016,
+        message="InstanceGroupManagersAbandonInstancesRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class AggregatedListInstanceGroupManagersRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.AggregatedList.
+    See the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        service_project_number (int):
+
+            This field is a member of `oneof`_ ``_service_project_number``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    include_all_scopes: bool = proto.Field(
+        proto.BOOL,
+        number=391327988,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    service_project_number: int = proto.Field(
+        proto.INT64,
+        number=316757497,
+        optional=True,
+    )
+
+
+class ApplyUpdatesToInstancesInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    InstanceGroupManagers.ApplyUpdatesToInstances. See the method
+    description for details.
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group,
+            should conform to RFC1035.
+        instance_group_managers_apply_updates_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersApplyUpdatesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located. Should conform to
+            RFC1035.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_managers_apply_updates_request_resource: "InstanceGroupManagersApplyUpdatesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=259242835,
+        message="InstanceGroupManagersApplyUpdatesRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class CreateInstancesInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.CreateInstances.
+    See the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group. It
+            should conform to RFC1035.
+        instance_group_managers_create_instances_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersCreateInstancesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. The request ID must be a valid UUID
+            with the exception that zero UUID is not
+            supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located. It should conform to
+            RFC1035.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_managers_create_instances_request_resource: "InstanceGroupManagersCreateInstancesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=24558867,
+        message="InstanceGroupManagersCreateInstancesRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class DeleteInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.Delete. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group to
+            delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class DeleteInstancesInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.DeleteInstances.
+    See the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group.
+        instance_group_managers_delete_instances_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersDeleteInstancesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_managers_delete_instances_request_resource: "InstanceGroupManagersDeleteInstancesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=166421252,
+        message="InstanceGroupManagersDeleteInstancesRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class DeletePerInstanceConfigsInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    InstanceGroupManagers.DeletePerInstanceConfigs. See the method
+    description for details.
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group. It
+            should conform to RFC1035.
+        instance_group_managers_delete_per_instance_configs_req_resource (google.cloud.compute_v1.types.InstanceGroupManagersDeletePerInstanceConfigsReq):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located. It should conform to
+            RFC1035.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_managers_delete_per_instance_configs_req_resource: "InstanceGroupManagersDeletePerInstanceConfigsReq" = proto.Field(
+        proto.MESSAGE,
+        number=362427680,
+        message="InstanceGroupManagersDeletePerInstanceConfigsReq",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class GetInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.Get. See the
+    method description for details.
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class InsertInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.Insert. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager_resource (google.cloud.compute_v1.types.InstanceGroupManager):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where you want to create
+            the managed instance group.
+    """
+
+    instance_group_manager_resource: shared_per_instance_config.InstanceGroupManager = (
+        proto.Field(
+            proto.MESSAGE,
+            number=261063946,
+            message=shared_per_instance_config.InstanceGroupManager,
+        )
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class InstanceGroupManagerAggregatedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableMapping[str, google.cloud.compute_v1.types.InstanceGroupManagersScopedList]):
+            A list of InstanceGroupManagersScopedList
+            resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#instanceGroupManagerAggregatedList for an aggregated
+            list of managed instance groups.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (MutableSequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableMapping[str, "InstanceGroupManagersScopedList"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="InstanceGroupManagersScopedList",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    unreachables: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=243372063,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InstanceGroupManagerList(proto.Message):
+    r"""[Output Only] A list of managed instance groups.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.InstanceGroupManager]):
+            A list of InstanceGroupManager resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#instanceGroupManagerList for a list of managed
+            instance groups.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence[
+        shared_per_instance_config.InstanceGroupManager
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message=shared_per_instance_config.InstanceGroupManager,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InstanceGroupManagersAbandonInstancesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        instances (MutableSequence[str]):
+            The URLs of one or more instances to abandon. This can be a
+            full URL or a partial URL, such as
+            zones/[ZONE]/instances/[INSTANCE_NAME].
+    """
+
+    instances: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=29097598,
+    )
+
+
+class InstanceGroupManagersApplyUpdatesRequest(proto.Message):
+    r"""InstanceGroupManagers.applyUpdatesToInstances
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        all_instances (bool):
+            Flag to update all instances instead of
+            specified list of “instances”. If the flag is
+            set to true then the instances may not be
+            specified in the request.
+
+            This field is a member of `oneof`_ ``_all_instances``.
+        instances (MutableSequence[str]):
+            The list of URLs of one or more instances for which you want
+            to apply updates. Each URL can be a full URL or a partial
+            URL, such as zones/[ZONE]/instances/[INSTANCE_NAME].
+        minimal_action (str):
+            The minimal action that you want to perform
+            on each instance during the update: - REPLACE:
+            At minimum, delete the instance and create it
+            again. - RESTART: Stop the instance and start it
+            again. - REFRESH: Do not stop the instance and
+            limit disruption as much as possible. - NONE: Do
+            not disrupt the instance at all. By default, the
+            minimum action is NONE. If your update requires
+            a more disruptive action than you set with this
+            flag, the necessary action is performed to
+            execute the update. Check the MinimalAction enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_minimal_action``.
+        most_disruptive_allowed_action (str):
+            The most disruptive action that you want to
+            perform on each instance during the update: -
+            REPLACE: Delete the instance and create it
+            again. - RESTART: Stop the instance and start it
+            again. - REFRESH: Do not stop the instance and
+            limit disruption as much as possible. - NONE: Do
+            not disrupt the instance at all. By default, the
+            most disruptive allowed action is REPLACE. If
+            your update requires a more disruptive action
+            than you set with this flag, the update request
+            will fail. Check the MostDisruptiveAllowedAction
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_most_disruptive_allowed_action``.
+    """
+
+    class MinimalAction(proto.Enum):
+        r"""The minimal action that you want to perform on each instance
+        during the update: - REPLACE: At minimum, delete the instance
+        and create it again. - RESTART: Stop the instance and start it
+        again. - REFRESH: Do not stop the instance and limit disruption
+        as much as possible. - NONE: Do not disrupt the instance at all.
+        By default, the minimum action is NONE. If your update requires
+        a more disruptive action than you set with this flag, the
+        necessary action is performed to execute the update. Additional
+        supported values which may be not listed in the enum directly
+        due to technical reasons:
+
+        NONE
+        REFRESH
+        REPLACE
+        RESTART
+
+        Values:
+            UNDEFINED_MINIMAL_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_MINIMAL_ACTION = 0
+
+    class MostDisruptiveAllowedAction(proto.Enum):
+        r"""The most disruptive action that you want to perform on each
+        instance during the update: - REPLACE: Delete the instance and
+        create it again. - RESTART: Stop the instance and start it
+        again. - REFRESH: Do not stop the instance and limit disruption
+        as much as possible. - NONE: Do not disrupt the instance at all.
+        By default, the most disruptive allowed action is REPLACE. If
+        your update requires a more disruptive action than you set with
+        this flag, the update request will fail. Additional supported
+        values which may be not listed in the enum directly due to
+        technical reasons:
+
+        NONE
+        REFRESH
+        REPLACE
+        RESTART
+
+        Values:
+            UNDEFINED_MOST_DISRUPTIVE_ALLOWED_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_MOST_DISRUPTIVE_ALLOWED_ACTION = 0
+
+    all_instances: bool = proto.Field(
+        proto.BOOL,
+        number=403676512,
+        optional=True,
+    )
+    instances: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=29097598,
+    )
+    minimal_action: str = proto.Field(
+        proto.STRING,
+        number=270567060,
+        optional=True,
+    )
+    most_disruptive_allowed_action: str = proto.Field(
+        proto.STRING,
+        number=66103053,
+        optional=True,
+    )
+
+
+class InstanceGroupManagersCreateInstancesRequest(proto.Message):
+    r"""InstanceGroupManagers.createInstances
+
+    Attributes:
+        instances (MutableSequence[google.cloud.compute_v1.types.PerInstanceConfig]):
+            [Required] List of specifications of per-instance configs.
+    """
+
+    instances: MutableSequence[
+        shared_per_instance_config.PerInstanceConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=29097598,
+        message=shared_per_instance_config.PerInstanceConfig,
+    )
+
+
+class InstanceGroupManagersDeleteInstancesRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instances (MutableSequence[str]):
+            The URLs of one or more instances to delete. This can be a
+            full URL or a partial URL, such as
+            zones/[ZONE]/instances/[INSTANCE_NAME]. Queued instances do
+            not have URL and can be deleted only by name. One cannot
+            specify both URLs and names in a single request.
+        skip_instances_on_validation_error (bool):
+            Specifies whether the request should proceed despite the
+            inclusion of instances that are not members of the group or
+            that are already in the process of being deleted or
+            abandoned. If this field is set to ``false`` and such an
+            instance is specified in the request, the operation fails.
+            The operation always fails if the request contains a
+            malformed instance URL or a reference to an instance that
+            exists in a zone or region other than the group's zone or
+            region.
+
+            This field is a member of `oneof`_ ``_skip_instances_on_validation_error``.
+    """
+
+    instances: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=29097598,
+    )
+    skip_instances_on_validation_error: bool = proto.Field(
+        proto.BOOL,
+        number=40631073,
+        optional=True,
+    )
+
+
+class InstanceGroupManagersDeletePerInstanceConfigsReq(proto.Message):
+    r"""InstanceGroupManagers.deletePerInstanceConfigs
+
+    Attributes:
+        names (MutableSequence[str]):
+            The list of instance names for which we want
+            to delete per-instance configs on this managed
+            instance group.
+    """
+
+    names: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=104585032,
+    )
+
+
+class InstanceGroupManagersListErrorsResponse(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        items (MutableSequence[google.cloud.compute_v1.types.InstanceManagedByIgmError]):
+            [Output Only] The list of errors of the managed instance
+            group.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    items: MutableSequence[
+        shared_per_instance_config.InstanceManagedByIgmError
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message=shared_per_instance_config.InstanceManagedByIgmError,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+
+
+class InstanceGroupManagersListManagedInstancesResponse(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        managed_instances (MutableSequence[google.cloud.compute_v1.types.ManagedInstance]):
+            [Output Only] The list of instances in the managed instance
+            group.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    managed_instances: MutableSequence[
+        shared_per_instance_config.ManagedInstance
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=336219614,
+        message=shared_per_instance_config.ManagedInstance,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+
+
+class InstanceGroupManagersListPerInstanceConfigsResp(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        items (MutableSequence[google.cloud.compute_v1.types.PerInstanceConfig]):
+            [Output Only] The list of PerInstanceConfig.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    items: MutableSequence[
+        shared_per_instance_config.PerInstanceConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message=shared_per_instance_config.PerInstanceConfig,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InstanceGroupManagersPatchPerInstanceConfigsReq(proto.Message):
+    r"""InstanceGroupManagers.patchPerInstanceConfigs
+
+    Attributes:
+        per_instance_configs (MutableSequence[google.cloud.compute_v1.types.PerInstanceConfig]):
+            The list of per-instance configurations to
+            insert or patch on this managed instance group.
+    """
+
+    per_instance_configs: MutableSequence[
+        shared_per_instance_config.PerInstanceConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=526265001,
+        message=shared_per_instance_config.PerInstanceConfig,
+    )
+
+
+class InstanceGroupManagersRecreateInstancesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        instances (MutableSequence[str]):
+            The URLs of one or more instances to recreate. This can be a
+            full URL or a partial URL, such as
+            zones/[ZONE]/instances/[INSTANCE_NAME].
+    """
+
+    instances: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=29097598,
+    )
+
+
+class InstanceGroupManagersScopedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_managers (MutableSequence[google.cloud.compute_v1.types.InstanceGroupManager]):
+            [Output Only] The list of managed instance groups that are
+            contained in the specified project and zone.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] The warning that replaces the list of managed
+            instance groups when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    instance_group_managers: MutableSequence[
+        "InstanceGroupManager"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=214072592,
+        message=shared_per_instance_config.InstanceGroupManager,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InstanceGroupManagersSetInstanceTemplateRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_template (str):
+            The URL of the instance template that is
+            specified for this managed instance group. The
+            group uses this template to create all new
+            instances in the managed instance group. The
+            templates for existing instances in the group do
+            not change unless you run recreateInstances, run
+            applyUpdatesToInstances, or set the group's
+            updatePolicy.type to PROACTIVE.
+
+            This field is a member of `oneof`_ ``_instance_template``.
+    """
+
+    instance_template: str = proto.Field(
+        proto.STRING,
+        number=309248228,
+        optional=True,
+    )
+
+
+class InstanceGroupManagersSetTargetPoolsRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        fingerprint (str):
+            The fingerprint of the target pools
+            information. Use this optional property to
+            prevent conflicts when multiple users change the
+            target pools settings concurrently. Obtain the
+            fingerprint with the instanceGroupManagers.get
+            method. Then, include the fingerprint in your
+            request to ensure that you do not overwrite
+            changes that were applied from another
+            concurrent request.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        target_pools (MutableSequence[str]):
+            The list of target pool URLs that instances
+            in this managed instance group belong to. The
+            managed instance group applies these target
+            pools to all of the instances in the group.
+            Existing instances and new instances in the
+            group all receive these target pool settings.
+    """
+
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    target_pools: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=336072617,
+    )
+
+
+class InstanceGroupManagersUpdatePerInstanceConfigsReq(proto.Message):
+    r"""InstanceGroupManagers.updatePerInstanceConfigs
+
+    Attributes:
+        per_instance_configs (MutableSequence[google.cloud.compute_v1.types.PerInstanceConfig]):
+            The list of per-instance configurations to
+            insert or patch on this managed instance group.
+    """
+
+    per_instance_configs: MutableSequence[
+        shared_per_instance_config.PerInstanceConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=526265001,
+        message=shared_per_instance_config.PerInstanceConfig,
+    )
+
+
+class ListErrorsInstanceGroupManagersRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.ListErrors. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        instance_group_manager (str):
+            The name of the managed instance group. It must be a string
+            that meets the requirements in RFC1035, or an unsigned long
+            integer: must match regexp pattern:
+            (?:`a-z <?:[-a-z0-9]{0,61}[a-z0-9]>`__?)|1-9{0,19}.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located. It should conform to
+            RFC1035.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class ListInstanceGroupManagersRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.List. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class ListManagedInstancesInstanceGroupManagersRequest(proto.Message):
+    r"""A request message for
+    InstanceGroupManagers.ListManagedInstances. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        instance_group_manager (str):
+            The name of the managed instance group.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class ListPerInstanceConfigsInstanceGroupManagersRequest(proto.Message):
+    r"""A request message for
+    InstanceGroupManagers.ListPerInstanceConfigs. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        instance_group_manager (str):
+            The name of the managed instance group. It
+            should conform to RFC1035.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located. It should conform to
+            RFC1035.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class PatchInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.Patch. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the instance group manager.
+        instance_group_manager_resource (google.cloud.compute_v1.types.InstanceGroupManager):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where you want to create
+            the managed instance group.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_manager_resource: shared_per_instance_config.InstanceGroupManager = (
+        proto.Field(
+            proto.MESSAGE,
+            number=261063946,
+            message=shared_per_instance_config.InstanceGroupManager,
+        )
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class PatchPerInstanceConfigsInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    InstanceGroupManagers.PatchPerInstanceConfigs. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group. It
+            should conform to RFC1035.
+        instance_group_managers_patch_per_instance_configs_req_resource (google.cloud.compute_v1.types.InstanceGroupManagersPatchPerInstanceConfigsReq):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located. It should conform to
+            RFC1035.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_managers_patch_per_instance_configs_req_resource: "InstanceGroupManagersPatchPerInstanceConfigsReq" = proto.Field(
+        proto.MESSAGE,
+        number=356650495,
+        message="InstanceGroupManagersPatchPerInstanceConfigsReq",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class RecreateInstancesInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    InstanceGroupManagers.RecreateInstances. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group.
+        instance_group_managers_recreate_instances_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersRecreateInstancesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_managers_recreate_instances_request_resource: "InstanceGroupManagersRecreateInstancesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=21405952,
+        message="InstanceGroupManagersRecreateInstancesRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class ResizeInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.Resize. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        size (int):
+            The number of running instances that the
+            managed instance group should maintain at any
+            given time. The group automatically adds or
+            removes instances to maintain the number of
+            instances specified by this parameter.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    size: int = proto.Field(
+        proto.INT32,
+        number=3530753,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetInstanceTemplateInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    InstanceGroupManagers.SetInstanceTemplate. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group.
+        instance_group_managers_set_instance_template_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersSetInstanceTemplateRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_managers_set_instance_template_request_resource: "InstanceGroupManagersSetInstanceTemplateRequest" = proto.Field(
+        proto.MESSAGE,
+        number=9809093,
+        message="InstanceGroupManagersSetInstanceTemplateRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetTargetPoolsInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for InstanceGroupManagers.SetTargetPools.
+    See the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group.
+        instance_group_managers_set_target_pools_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersSetTargetPoolsRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_managers_set_target_pools_request_resource: "InstanceGroupManagersSetTargetPoolsRequest" = proto.Field(
+        proto.MESSAGE,
+        number=281150216,
+        message="InstanceGroupManagersSetTargetPoolsRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class UpdatePerInstanceConfigsInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    InstanceGroupManagers.UpdatePerInstanceConfigs. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group. It
+            should conform to RFC1035.
+        instance_group_managers_update_per_instance_configs_req_resource (google.cloud.compute_v1.types.InstanceGroupManagersUpdatePerInstanceConfigsReq):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone where the managed
+            instance group is located. It should conform to
+            RFC1035.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_managers_update_per_instance_configs_req_resource: "InstanceGroupManagersUpdatePerInstanceConfigsReq" = proto.Field(
+        proto.MESSAGE,
+        number=141402302,
+        message="InstanceGroupManagersUpdatePerInstanceConfigsReq",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,4870 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_accelerator_config
+from google.cloud.compute_v1.types._compute import shared_bulk_insert_instance_resource
+from google.cloud.compute_v1.types._compute import shared_customer_encryption_key
+from google.cloud.compute_v1.types._compute import shared_firewall
+from google.cloud.compute_v1.types._compute import shared_firewall_policy_rule
+from google.cloud.compute_v1.types._compute import shared_metadata
+from google.cloud.compute_v1.types._compute import shared_network_interface
+from google.cloud.compute_v1.types._compute import shared_test_permissions_request
+from google.cloud.compute_v1.types._compute import shared_warning
+from google.cloud.compute_v1.types._compute import shared_zone_set_policy_request
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddAccessConfigInstanceRequest",
+        "AddResourcePoliciesInstanceRequest",
+        "AggregatedListInstancesRequest",
+        "AttachDiskInstanceRequest",
+        "BulkInsertInstanceRequest",
+        "CustomerEncryptionKeyProtectedDisk",
+        "DeleteAccessConfigInstanceRequest",
+        "DeleteInstanceRequest",
+        "DetachDiskInstanceRequest",
+        "DisplayDevice",
+        "GetEffectiveFirewallsInstanceRequest",
+        "GetGuestAttributesInstanceRequest",
+        "GetIamPolicyInstanceRequest",
+        "GetInstanceRequest",
+        "GetScreenshotInstanceRequest",
+        "GetSerialPortOutputInstanceRequest",
+        "GetShieldedInstanceIdentityInstanceRequest",
+        "GuestAttributes",
+        "GuestAttributesEntry",
+        "GuestAttributesValue",
+        "InsertInstanceRequest",
+        "Instance",
+        "InstanceAggregatedList",
+        "InstanceList",
+        "InstanceListReferrers",
+        "InstanceParams",
+        "InstancesAddResourcePoliciesRequest",
+        "InstancesGetEffectiveFirewallsResponse",
+        "InstancesGetEffectiveFirewallsResponseEffectiveFirewallPolicy",
+        "InstancesRemoveResourcePoliciesRequest",
+        "InstancesScopedList",
+        "InstancesSetLabelsRequest",
+        "InstancesSetMachineResourcesRequest",
+        "InstancesSetMachineTypeRequest",
+        "InstancesSetMinCpuPlatformRequest",
+        "InstancesSetNameRequest",
+        "InstancesSetSecurityPolicyRequest",
+        "InstancesSetServiceAccountRequest",
+        "InstancesStartWithEncryptionKeyRequest",
+        "ListInstancesRequest",
+        "ListReferrersInstancesRequest",
+        "Reference",
+        "RemoveResourcePoliciesInstanceRequest",
+        "ResetInstanceRequest",
+        "ResourceStatus",
+        "ResumeInstanceRequest",
+        "Screenshot",
+        "SendDiagnosticInterruptInstanceRequest",
+        "SendDiagnosticInterruptInstanceResponse",
+        "SerialPortOutput",
+        "SetDeletionProtectionInstanceRequest",
+        "SetDiskAutoDeleteInstanceRequest",
+        "SetIamPolicyInstanceRequest",
+        "SetLabelsInstanceRequest",
+        "SetMachineResourcesInstanceRequest",
+        "SetMachineTypeInstanceRequest",
+        "SetMetadataInstanceRequest",
+        "SetMinCpuPlatformInstanceRequest",
+        "SetNameInstanceRequest",
+        "SetSchedulingInstanceRequest",
+        "SetSecurityPolicyInstanceRequest",
+        "SetServiceAccountInstanceRequest",
+        "SetShieldedInstanceIntegrityPolicyInstanceRequest",
+        "SetTagsInstanceRequest",
+        "ShieldedInstanceIdentity",
+        "ShieldedInstanceIdentityEntry",
+        "ShieldedInstanceIntegrityPolicy",
+        "SimulateMaintenanceEventInstanceRequest",
+        "StartInstanceRequest",
+        "StartWithEncryptionKeyInstanceRequest",
+        "StopInstanceRequest",
+        "SuspendInstanceRequest",
+        "TestIamPermissionsInstanceRequest",
+        "UpcomingMaintenance",
+        "UpdateAccessConfigInstanceRequest",
+        "UpdateDisplayDeviceInstanceRequest",
+        "UpdateInstanceRequest",
+        "UpdateNetworkInterfaceInstanceRequest",
+        "UpdateShieldedInstanceConfigInstanceRequest",
+    },
+)
+
+
+class AddAccessConfigInstanceRequest(proto.Message):
+    r"""A request message for Instances.AddAccessConfig. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        access_config_resource (google.cloud.compute_v1.types.AccessConfig):
+            The body resource for this request
+        instance (str):
+            The instance name for this request.
+        network_interface (str):
+            The name of the network interface to add to
+            this instance.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    access_config_resource: shared_network_interface.AccessConfig = proto.Field(
+        proto.MESSAGE,
+        number=387825552,
+        message=shared_network_interface.AccessConfig,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    network_interface: str = proto.Field(
+        proto.STRING,
+        number=365387880,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class AddResourcePoliciesInstanceRequest(proto.Message):
+    r"""A request message for Instances.AddResourcePolicies. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            The instance name for this request.
+        instances_add_resource_policies_request_resource (google.cloud.compute_v1.types.InstancesAddResourcePoliciesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instances_add_resource_policies_request_resource: "InstancesAddResourcePoliciesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=489351963,
+        message="InstancesAddResourcePoliciesRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class AggregatedListInstancesRequest(proto.Message):
+    r"""A request message for Instances.AggregatedList. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        service_project_number (int):
+
+            This field is a member of `oneof`_ ``_service_project_number``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    include_all_scopes: bool = proto.Field(
+        proto.BOOL,
+        number=391327988,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    service_project_number: int = proto.Field(
+        proto.INT64,
+        number=316757497,
+        optional=True,
+    )
+
+
+class AttachDiskInstanceRequest(proto.Message):
+    r"""A request message for Instances.AttachDisk. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        attached_disk_resource (google.cloud.compute_v1.types.AttachedDisk):
+            The body resource for this request
+        force_attach (bool):
+            Whether to force attach the regional disk
+            even if it's currently attached to another
+            instance. If you try to force attach a zonal
+            disk to an instance, you will receive an error.
+
+            This field is a member of `oneof`_ ``_force_attach``.
+        instance (str):
+            The instance name for this request.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    attached_disk_resource: shared_network_interface.AttachedDisk = proto.Field(
+        proto.MESSAGE,
+        number=90605845,
+        message=shared_network_interface.AttachedDisk,
+    )
+    force_attach: bool = proto.Field(
+        proto.BOOL,
+        number=142758425,
+        optional=True,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class BulkInsertInstanceRequest(proto.Message):
+    r"""A request message for Instances.BulkInsert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        bulk_insert_instance_resource_resource (google.cloud.compute_v1.types.BulkInsertInstanceResource):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    bulk_insert_instance_resource_resource: shared_bulk_insert_instance_resource.BulkInsertInstanceResource = proto.Field(
+        proto.MESSAGE,
+        number=41427278,
+        message=shared_bulk_insert_instance_resource.BulkInsertInstanceResource,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class CustomerEncryptionKeyProtectedDisk(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        disk_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            Decrypts data associated with the disk with a
+            customer-supplied encryption key.
+
+            This field is a member of `oneof`_ ``_disk_encryption_key``.
+        source (str):
+            Specifies a valid partial or full URL to an existing
+            Persistent Disk resource. This field is only applicable for
+            persistent disks. For example: "source":
+            "/compute/v1/projects/project_id/zones/zone/disks/ disk_name
+
+            This field is a member of `oneof`_ ``_source``.
+    """
+
+    disk_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = (
+        proto.Field(
+            proto.MESSAGE,
+            number=271660677,
+            optional=True,
+            message=shared_customer_encryption_key.CustomerEncryptionKey,
+        )
+    )
+    source: str = proto.Field(
+        proto.STRING,
+        number=177235995,
+        optional=True,
+    )
+
+
+class DeleteAccessConfigInstanceRequest(proto.Message):
+    r"""A request message for Instances.DeleteAccessConfig. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        access_config (str):
+            The name of the access config to delete.
+        instance (str):
+            The instance name for this request.
+        network_interface (str):
+            The name of the network interface.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    access_config: str = proto.Field(
+        proto.STRING,
+        number=72856189,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    network_interface: str = proto.Field(
+        proto.STRING,
+        number=365387880,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class DeleteInstanceRequest(proto.Message):
+    r"""A request message for Instances.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance resource to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class DetachDiskInstanceRequest(proto.Message):
+    r"""A request message for Instances.DetachDisk. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        device_name (str):
+            The device name of the disk to detach. Make a
+            get() request on the instance to view currently
+            attached disks and device names.
+        instance (str):
+            Instance name for this request.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    device_name: str = proto.Field(
+        proto.STRING,
+        number=67541716,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class DisplayDevice(proto.Message):
+    r"""A set of Display Device options
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enable_display (bool):
+            Defines whether the instance has Display
+            enabled.
+
+            This field is a member of `oneof`_ ``_enable_display``.
+    """
+
+    enable_display: bool = proto.Field(
+        proto.BOOL,
+        number=14266886,
+        optional=True,
+    )
+
+
+class GetEffectiveFirewallsInstanceRequest(proto.Message):
+    r"""A request message for Instances.GetEffectiveFirewalls. See
+    the method description for details.
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        network_interface (str):
+            The name of the network interface to get the
+            effective firewalls.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    network_interface: str = proto.Field(
+        proto.STRING,
+        number=365387880,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class GetGuestAttributesInstanceRequest(proto.Message):
+    r"""A request message for Instances.GetGuestAttributes. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        project (str):
+            Project ID for this request.
+        query_path (str):
+            Specifies the guest attributes path to be
+            queried.
+
+            This field is a member of `oneof`_ ``_query_path``.
+        variable_key (str):
+            Specifies the key for the guest attributes
+            entry.
+
+            This field is a member of `oneof`_ ``_variable_key``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    query_path: str = proto.Field(
+        proto.STRING,
+        number=368591164,
+        optional=True,
+    )
+    variable_key: str = proto.Field(
+        proto.STRING,
+        number=164364828,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class GetIamPolicyInstanceRequest(proto.Message):
+    r"""A request message for Instances.GetIamPolicy. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    options_requested_policy_version: int = proto.Field(
+        proto.INT32,
+        number=499220029,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class GetInstanceRequest(proto.Message):
+    r"""A request message for Instances.Get. See the method
+    description for details.
+
+    Attributes:
+        instance (str):
+            Name of the instance resource to return.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class GetScreenshotInstanceRequest(proto.Message):
+    r"""A request message for Instances.GetScreenshot. See the method
+    description for details.
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class GetSerialPortOutputInstanceRequest(proto.Message):
+    r"""A request message for Instances.GetSerialPortOutput. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance for this request.
+        port (int):
+            Specifies which COM or serial port to
+            retrieve data from.
+
+            This field is a member of `oneof`_ ``_port``.
+        project (str):
+            Project ID for this request.
+        start (int):
+            Specifies the starting byte position of the output to
+            return. To start with the first byte of output to the
+            specified port, omit this field or set it to ``0``. If the
+            output for that byte position is available, this field
+            matches the ``start`` parameter sent with the request. If
+            the amount of serial console output exceeds the size of the
+            buffer (1 MB), the oldest output is discarded and is no
+            longer available. If the requested start position refers to
+            discarded output, the start position is adjusted to the
+            oldest output still available, and the adjusted start
+            position is returned as the ``start`` property value. You
+            can also provide a negative start position, which translates
+            to the most recent number of bytes written to the serial
+            port. For example, -3 is interpreted as the most recent 3
+            bytes written to the serial console.
+
+            This field is a member of `oneof`_ ``_start``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    start: int = proto.Field(
+        proto.INT64,
+        number=109757538,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class GetShieldedInstanceIdentityInstanceRequest(proto.Message):
+    r"""A request message for Instances.GetShieldedInstanceIdentity.
+    See the method description for details.
+
+    Attributes:
+        instance (str):
+            Name or id of the instance scoping this
+            request.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class GuestAttributes(proto.Message):
+    r"""A guest attributes entry.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#guestAttributes for guest attributes entry.
+
+            This field is a member of `oneof`_ ``_kind``.
+        query_path (str):
+            The path to be queried. This can be the
+            default namespace ('') or a nested namespace
+            ('\/') or a specified key ('\/\').
+
+            This field is a member of `oneof`_ ``_query_path``.
+        query_value (google.cloud.compute_v1.types.GuestAttributesValue):
+            [Output Only] The value of the requested queried path.
+
+            This field is a member of `oneof`_ ``_query_value``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        variable_key (str):
+            The key to search for.
+
+            This field is a member of `oneof`_ ``_variable_key``.
+        variable_value (str):
+            [Output Only] The value found for the requested key.
+
+            This field is a member of `oneof`_ ``_variable_value``.
+    """
+
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    query_path: str = proto.Field(
+        proto.STRING,
+        number=368591164,
+        optional=True,
+    )
+    query_value: "GuestAttributesValue" = proto.Field(
+        proto.MESSAGE,
+        number=157570874,
+        optional=True,
+        message="GuestAttributesValue",
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    variable_key: str = proto.Field(
+        proto.STRING,
+        number=164364828,
+        optional=True,
+    )
+    variable_value: str = proto.Field(
+        proto.STRING,
+        number=124582382,
+        optional=True,
+    )
+
+
+class GuestAttributesEntry(proto.Message):
+    r"""A guest attributes namespace/key/value entry.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        key (str):
+            Key for the guest attribute entry.
+
+            This field is a member of `oneof`_ ``_key``.
+        namespace (str):
+            Namespace for the guest attribute entry.
+
+            This field is a member of `oneof`_ ``_namespace``.
+        value (str):
+            Value for the guest attribute entry.
+
+            This field is a member of `oneof`_ ``_value``.
+    """
+
+    key: str = proto.Field(
+        proto.STRING,
+        number=106079,
+        optional=True,
+    )
+    namespace: str = proto.Field(
+        proto.STRING,
+        number=178476379,
+        optional=True,
+    )
+    value: str = proto.Field(
+        proto.STRING,
+        number=111972721,
+        optional=True,
+    )
+
+
+class GuestAttributesValue(proto.Message):
+    r"""Array of guest attribute namespace/key/value tuples.
+
+    Attributes:
+        items (MutableSequence[google.cloud.compute_v1.types.GuestAttributesEntry]):
+
+    """
+
+    items: MutableSequence["GuestAttributesEntry"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="GuestAttributesEntry",
+    )
+
+
+class InsertInstanceRequest(proto.Message):
+    r"""A request message for Instances.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_resource (google.cloud.compute_v1.types.Instance):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        source_instance_template (str):
+            Specifies instance template to create the
+            instance. This field is optional. It can be a
+            full or partial URL. For example, the following
+            are all valid URLs to an instance template: -
+            https://www.googleapis.com/compute/v1/projects/project
+            /global/instanceTemplates/instanceTemplate -
+            projects/project/global/instanceTemplates/instanceTemplate
+            - global/instanceTemplates/instanceTemplate
+
+            This field is a member of `oneof`_ ``_source_instance_template``.
+        source_machine_image (str):
+            Specifies the machine image to use to create
+            the instance. This field is optional. It can be
+            a full or partial URL. For example, the
+            following are all valid URLs to a machine image:
+            -
+            https://www.googleapis.com/compute/v1/projects/project/global/global
+            /machineImages/machineImage -
+            projects/project/global/global/machineImages/machineImage
+            - global/machineImages/machineImage
+
+            This field is a member of `oneof`_ ``_source_machine_image``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance_resource: "Instance" = proto.Field(
+        proto.MESSAGE,
+        number=215988344,
+        message="Instance",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    source_instance_template: str = proto.Field(
+        proto.STRING,
+        number=332423616,
+        optional=True,
+    )
+    source_machine_image: str = proto.Field(
+        proto.STRING,
+        number=21769791,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class Instance(proto.Message):
+    r"""Represents an Instance resource. An instance is a virtual
+    machine that is hosted on Google Cloud Platform. For more
+    information, read Virtual Machine Instances.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        advanced_machine_features (google.cloud.compute_v1.types.AdvancedMachineFeatures):
+            Controls for advanced machine-related
+            behavior features.
+
+            This field is a member of `oneof`_ ``_advanced_machine_features``.
+        can_ip_forward (bool):
+            Allows this instance to send and receive
+            packets with non-matching destination or source
+            IPs. This is required if you plan to use this
+            instance to forward routes. For more
+            information, see Enabling IP Forwarding .
+
+            This field is a member of `oneof`_ ``_can_ip_forward``.
+        confidential_instance_config (google.cloud.compute_v1.types.ConfidentialInstanceConfig):
+
+            This field is a member of `oneof`_ ``_confidential_instance_config``.
+        cpu_platform (str):
+            [Output Only] The CPU platform used by this instance.
+
+            This field is a member of `oneof`_ ``_cpu_platform``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        deletion_protection (bool):
+            Whether the resource should be protected
+            against deletion.
+
+            This field is a member of `oneof`_ ``_deletion_protection``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        disks (MutableSequence[google.cloud.compute_v1.types.AttachedDisk]):
+            Array of disks associated with this instance.
+            Persistent disks must be created before you can
+            assign them.
+        display_device (google.cloud.compute_v1.types.DisplayDevice):
+            Enables display device for the instance.
+
+            This field is a member of `oneof`_ ``_display_device``.
+        fingerprint (str):
+            Specifies a fingerprint for this resource,
+            which is essentially a hash of the instance's
+            contents and used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update the instance. You must always provide
+            an up-to-date fingerprint hash in order to
+            update the instance. To see the latest
+            fingerprint, make get() request to the instance.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        guest_accelerators (MutableSequence[google.cloud.compute_v1.types.AcceleratorConfig]):
+            A list of the type and count of accelerator
+            cards attached to the instance.
+        hostname (str):
+            Specifies the hostname of the instance. The specified
+            hostname must be RFC1035 compliant. If hostname is not
+            specified, the default hostname is
+            [INSTANCE_NAME].c.[PROJECT_ID].internal when using the
+            global DNS, and
+            [INSTANCE_NAME].[ZONE].c.[PROJECT_ID].internal when using
+            zonal DNS.
+
+            This field is a member of `oneof`_ ``_hostname``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        instance_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            Encrypts suspended data for an instance with
+            a customer-managed encryption key. If you are
+            creating a new instance, this field will encrypt
+            the local SSD and in-memory contents of the
+            instance during the suspend operation. If you do
+            not provide an encryption key when creating the
+            instance, then the local SSD and in-memory
+            contents will be encrypted using an
+            automatically generated key during the suspend
+            operation.
+
+            This field is a member of `oneof`_ ``_instance_encryption_key``.
+        key_revocation_action_type (str):
+            KeyRevocationActionType of the instance.
+            Supported options are "STOP" and "NONE". The
+            default value is "NONE" if it is not specified.
+            Check the KeyRevocationActionType enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_key_revocation_action_type``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#instance
+            for instances.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for this request, which is
+            essentially a hash of the label's contents and
+            used for optimistic locking. The fingerprint is
+            initially generated by Compute Engine and
+            changes after every request to modify or update
+            labels. You must always provide an up-to-date
+            fingerprint hash in order to update or change
+            labels. To see the latest fingerprint, make
+            get() request to the instance.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+            Labels to apply to this instance. These can
+            be later modified by the setLabels method.
+        last_start_timestamp (str):
+            [Output Only] Last start timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_last_start_timestamp``.
+        last_stop_timestamp (str):
+            [Output Only] Last stop timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_last_stop_timestamp``.
+        last_suspended_timestamp (str):
+            [Output Only] Last suspended timestamp in RFC3339 text
+            format.
+
+            This field is a member of `oneof`_ ``_last_suspended_timestamp``.
+        machine_type (str):
+            Full or partial URL of the machine type
+            resource to use for this instance, in the
+            format: zones/zone/machineTypes/machine-type.
+            This is provided by the client when the instance
+            is created. For example, the following is a
+            valid partial url to a predefined machine type:
+            zones/us-central1-f/machineTypes/n1-standard-1
+            To create a custom machine type, provide a URL
+            to a machine type in the following format, where
+            CPUS is 1 or an even number up to 32 (2, 4, 6,
+            ... 24, etc), and MEMORY is the total memory for
+            this instance. Memory must be a multiple of 256
+            MB and must be supplied in MB (e.g. 5 GB of
+            memory is 5120 MB):
+            zones/zone/machineTypes/custom-CPUS-MEMORY For
+            example:
+            zones/us-central1-f/machineTypes/custom-4-5120
+            For a full list of restrictions, read the
+            Specifications for custom machine types.
+
+            This field is a member of `oneof`_ ``_machine_type``.
+        metadata (google.cloud.compute_v1.types.Metadata):
+            The metadata key/value pairs assigned to this
+            instance. This includes custom metadata and
+            predefined keys.
+
+            This field is a member of `oneof`_ ``_metadata``.
+        min_cpu_platform (str):
+            Specifies a minimum CPU platform for the VM
+            instance. Applicable values are the friendly
+            names of CPU platforms, such as minCpuPlatform:
+            "Intel Haswell" or minCpuPlatform: "Intel Sandy
+            Bridge".
+
+            This field is a member of `oneof`_ ``_min_cpu_platform``.
+        name (str):
+            The name of the resource, provided by the client when
+            initially creating the resource. The resource name must be
+            1-63 characters long, and comply with RFC1035. Specifically,
+            the name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        network_interfaces (MutableSequence[google.cloud.compute_v1.types.NetworkInterface]):
+            An array of network configurations for this
+            instance. These specify how interfaces are
+            configured to interact with other network
+            services, such as connecting to the internet.
+            Multiple interfaces are supported per instance.
+        network_performance_config (google.cloud.compute_v1.types.NetworkPerformanceConfig):
+
+            This field is a member of `oneof`_ ``_network_performance_config``.
+        params (google.cloud.compute_v1.types.InstanceParams):
+            Input only. [Input Only] Additional params passed with the
+            request, but not persisted as part of resource payload.
+
+            This field is a member of `oneof`_ ``_params``.
+        private_ipv6_google_access (str):
+            The private IPv6 google access type for the VM. If not
+            specified, use INHERIT_FROM_SUBNETWORK as default. Check the
+            PrivateIpv6GoogleAccess enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_private_ipv6_google_access``.
+        reservation_affinity (google.cloud.compute_v1.types.ReservationAffinity):
+            Specifies the reservations that this instance
+            can consume from.
+
+            This field is a member of `oneof`_ ``_reservation_affinity``.
+        resource_policies (MutableSequence[str]):
+            Resource policies applied to this instance.
+        resource_status (google.cloud.compute_v1.types.ResourceStatus):
+            [Output Only] Specifies values set for instance attributes
+            as compared to the values requested by user in the
+            corresponding input only field.
+
+            This field is a member of `oneof`_ ``_resource_status``.
+        satisfies_pzs (bool):
+            [Output Only] Reserved for future use.
+
+            This field is a member of `oneof`_ ``_satisfies_pzs``.
+        scheduling (google.cloud.compute_v1.types.Scheduling):
+            Sets the scheduling options for this
+            instance.
+
+            This field is a member of `oneof`_ ``_scheduling``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        service_accounts (MutableSequence[google.cloud.compute_v1.types.ServiceAccount]):
+            A list of service accounts, with their
+            specified scopes, authorized for this instance.
+            Only one service account per VM instance is
+            supported. Service accounts generate access
+            tokens that can be accessed through the metadata
+            server and used to authenticate applications on
+            the instance. See Service Accounts for more
+            information.
+        shielded_instance_config (google.cloud.compute_v1.types.ShieldedInstanceConfig):
+
+            This field is a member of `oneof`_ ``_shielded_instance_config``.
+        shielded_instance_integrity_policy (google.cloud.compute_v1.types.ShieldedInstanceIntegrityPolicy):
+
+            This field is a member of `oneof`_ ``_shielded_instance_integrity_policy``.
+        source_machine_image (str):
+            Source machine image
+
+            This field is a member of `oneof`_ ``_source_machine_image``.
+        source_machine_image_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            Source machine image encryption key when
+            creating an instance from a machine image.
+
+            This field is a member of `oneof`_ ``_source_machine_image_encryption_key``.
+        start_restricted (bool):
+            [Output Only] Whether a VM has been restricted for start
+            because Compute Engine has detected suspicious activity.
+
+            This field is a member of `oneof`_ ``_start_restricted``.
+        status (str):
+            [Output Only] The status of the instance. One of the
+            following values: PROVISIONING, STAGING, RUNNING, STOPPING,
+            SUSPENDING, SUSPENDED, REPAIRING, and TERMINATED. For more
+            information about the status of the instance, see Instance
+            life cycle. Check the Status enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_status``.
+        status_message (str):
+            [Output Only] An optional, human-readable explanation of the
+            status.
+
+            This field is a member of `oneof`_ ``_status_message``.
+        tags (google.cloud.compute_v1.types.Tags):
+            Tags to apply to this instance. Tags are used
+            to identify valid sources or targets for network
+            firewalls and are specified by the client during
+            instance creation. The tags can be later
+            modified by the setTags method. Each tag within
+            the list must comply with RFC1035. Multiple tags
+            can be specified via the 'tags.items' field.
+
+            This field is a member of `oneof`_ ``_tags``.
+        zone (str):
+            [Output Only] URL of the zone where the instance resides.
+            You must specify this field as part of the HTTP request URL.
+            It is not settable as a field in the request body.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    class KeyRevocationActionType(proto.Enum):
+        r"""KeyRevocationActionType of the instance. Supported options
+        are "STOP" and "NONE". The default value is "NONE" if it is not
+        specified.
+
+        Values:
+            UNDEFINED_KEY_REVOCATION_ACTION_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            KEY_REVOCATION_ACTION_TYPE_UNSPECIFIED (467110106):
+                Default value. This value is unused.
+            NONE (2402104):
+                Indicates user chose no operation.
+            STOP (2555906):
+                Indicates user chose to opt for VM shutdown
+                on key revocation.
+        """
+        UNDEFINED_KEY_REVOCATION_ACTION_TYPE = 0
+        KEY_REVOCATION_ACTION_TYPE_UNSPECIFIED = 467110106
+        NONE = 2402104
+        STOP = 2555906
+
+    class PrivateIpv6GoogleAccess(proto.Enum):
+        r"""The private IPv6 google access type for the VM. If not specified,
+        use INHERIT_FROM_SUBNETWORK as default.
+
+        Values:
+            UNDEFINED_PRIVATE_IPV6_GOOGLE_ACCESS (0):
+                A value indicating that the enum field is not
+                set.
+            ENABLE_BIDIRECTIONAL_ACCESS_TO_GOOGLE (427975994):
+                Bidirectional private IPv6 access to/from
+                Google services. If specified, the subnetwork
+                who is attached to the instance's default
+                network interface will be assigned an internal
+                IPv6 prefix if it doesn't have before.
+            ENABLE_OUTBOUND_VM_ACCESS_TO_GOOGLE (288210263):
+                Outbound private IPv6 access from VMs in this
+                subnet to Google services. If specified, the
+                subnetwork who is attached to the instance's
+                default network interface will be assigned an
+                internal IPv6 prefix if it doesn't have before.
+            INHERIT_FROM_SUBNETWORK (530256959):
+                Each network interface inherits
+                PrivateIpv6GoogleAccess from its subnetwork.
+        """
+        UNDEFINED_PRIVATE_IPV6_GOOGLE_ACCESS = 0
+        ENABLE_BIDIRECTIONAL_ACCESS_TO_GOOGLE = 427975994
+        ENABLE_OUTBOUND_VM_ACCESS_TO_GOOGLE = 288210263
+        INHERIT_FROM_SUBNETWORK = 530256959
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the instance. One of the following
+        values: PROVISIONING, STAGING, RUNNING, STOPPING, SUSPENDING,
+        SUSPENDED, REPAIRING, and TERMINATED. For more information about the
+        status of the instance, see Instance life cycle.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            DEPROVISIONING (428935662):
+                The instance is halted and we are performing
+                tear down tasks like network deprogramming,
+                releasing quota, IP, tearing down disks etc.
+            PROVISIONING (290896621):
+                Resources are being allocated for the
+                instance.
+            REPAIRING (413483285):
+                The instance is in repair.
+            RUNNING (121282975):
+                The instance is running.
+            STAGING (431072283):
+                All required resources have been allocated
+                and the instance is being started.
+            STOPPED (444276141):
+                The instance has stopped successfully.
+            STOPPING (350791796):
+                The instance is currently stopping (either
+                being deleted or killed).
+            SUSPENDED (51223995):
+                The instance has suspended.
+            SUSPENDING (514206246):
+                The instance is suspending.
+            TERMINATED (250018339):
+                The instance has stopped (either by explicit
+                action or underlying failure).
+        """
+        UNDEFINED_STATUS = 0
+        DEPROVISIONING = 428935662
+        PROVISIONING = 290896621
+        REPAIRING = 413483285
+        RUNNING = 121282975
+        STAGING = 431072283
+        STOPPED = 444276141
+        STOPPING = 350791796
+        SUSPENDED = 51223995
+        SUSPENDING = 514206246
+        TERMINATED = 250018339
+
+    advanced_machine_features: shared_network_interface.AdvancedMachineFeatures = (
+        proto.Field(
+            proto.MESSAGE,
+            number=409646002,
+            optional=True,
+            message=shared_network_interface.AdvancedMachineFeatures,
+        )
+    )
+    can_ip_forward: bool = proto.Field(
+        proto.BOOL,
+        number=467731324,
+        optional=True,
+    )
+    confidential_instance_config: shared_network_interface.ConfidentialInstanceConfig = proto.Field(
+        proto.MESSAGE,
+        number=490637685,
+        optional=True,
+        message=shared_network_interface.ConfidentialInstanceConfig,
+    )
+    cpu_platform: str = proto.Field(
+        proto.STRING,
+        number=410285354,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    deletion_protection: bool = proto.Field(
+        proto.BOOL,
+        number=458014698,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    disks: MutableSequence[shared_network_interface.AttachedDisk] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=95594102,
+        message=shared_network_interface.AttachedDisk,
+    )
+    display_device: "DisplayDevice" = proto.Field(
+        proto.MESSAGE,
+        number=258933875,
+        optional=True,
+        message="DisplayDevice",
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    guest_accelerators: MutableSequence[
+        shared_accelerator_config.AcceleratorConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=463595119,
+        message=shared_accelerator_config.AcceleratorConfig,
+    )
+    hostname: str = proto.Field(
+        proto.STRING,
+        number=237067315,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    instance_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = (
+        proto.Field(
+            proto.MESSAGE,
+            number=64741517,
+            optional=True,
+            message=shared_customer_encryption_key.CustomerEncryptionKey,
+        )
+    )
+    key_revocation_action_type: str = proto.Field(
+        proto.STRING,
+        number=235941474,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    last_start_timestamp: str = proto.Field(
+        proto.STRING,
+        number=443830736,
+        optional=True,
+    )
+    last_stop_timestamp: str = proto.Field(
+        proto.STRING,
+        number=412823010,
+        optional=True,
+    )
+    last_suspended_timestamp: str = proto.Field(
+        proto.STRING,
+        number=356275337,
+        optional=True,
+    )
+    machine_type: str = proto.Field(
+        proto.STRING,
+        number=227711026,
+        optional=True,
+    )
+    metadata: shared_metadata.Metadata = proto.Field(
+        proto.MESSAGE,
+        number=86866735,
+        optional=True,
+        message=shared_metadata.Metadata,
+    )
+    min_cpu_platform: str = proto.Field(
+        proto.STRING,
+        number=242912759,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network_interfaces: MutableSequence[
+        shared_network_interface.NetworkInterface
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=52735243,
+        message=shared_network_interface.NetworkInterface,
+    )
+    network_performance_config: shared_network_interface.NetworkPerformanceConfig = (
+        proto.Field(
+            proto.MESSAGE,
+            number=398330850,
+            optional=True,
+            message=shared_network_interface.NetworkPerformanceConfig,
+        )
+    )
+    params: "InstanceParams" = proto.Field(
+        proto.MESSAGE,
+        number=78313862,
+        optional=True,
+        message="InstanceParams",
+    )
+    private_ipv6_google_access: str = proto.Field(
+        proto.STRING,
+        number=48277006,
+        optional=True,
+    )
+    reservation_affinity: shared_network_interface.ReservationAffinity = proto.Field(
+        proto.MESSAGE,
+        number=157850683,
+        optional=True,
+        message=shared_network_interface.ReservationAffinity,
+    )
+    resource_policies: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=22220385,
+    )
+    resource_status: "ResourceStatus" = proto.Field(
+        proto.MESSAGE,
+        number=249429315,
+        optional=True,
+        message="ResourceStatus",
+    )
+    satisfies_pzs: bool = proto.Field(
+        proto.BOOL,
+        number=480964267,
+        optional=True,
+    )
+    scheduling: shared_network_interface.Scheduling = proto.Field(
+        proto.MESSAGE,
+        number=386688404,
+        optional=True,
+        message=shared_network_interface.Scheduling,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    service_accounts: MutableSequence[
+        shared_network_interface.ServiceAccount
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=277537328,
+        message=shared_network_interface.ServiceAccount,
+    )
+    shielded_instance_config: shared_network_interface.ShieldedInstanceConfig = (
+        proto.Field(
+            proto.MESSAGE,
+            number=12862901,
+            optional=True,
+            message=shared_network_interface.ShieldedInstanceConfig,
+        )
+    )
+    shielded_instance_integrity_policy: "ShieldedInstanceIntegrityPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=163696919,
+        optional=True,
+        message="ShieldedInstanceIntegrityPolicy",
+    )
+    source_machine_image: str = proto.Field(
+        proto.STRING,
+        number=21769791,
+        optional=True,
+    )
+    source_machine_image_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = proto.Field(
+        proto.MESSAGE,
+        number=192839075,
+        optional=True,
+        message=shared_customer_encryption_key.CustomerEncryptionKey,
+    )
+    start_restricted: bool = proto.Field(
+        proto.BOOL,
+        number=123693144,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    status_message: str = proto.Field(
+        proto.STRING,
+        number=297428154,
+        optional=True,
+    )
+    tags: shared_network_interface.Tags = proto.Field(
+        proto.MESSAGE,
+        number=3552281,
+        optional=True,
+        message=shared_network_interface.Tags,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+        optional=True,
+    )
+
+
+class InstanceAggregatedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableMapping[str, google.cloud.compute_v1.types.InstancesScopedList]):
+            An object that contains a list of instances
+            scoped by zone.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#instanceAggregatedList for aggregated lists of
+            Instance resources.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (MutableSequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableMapping[str, "InstancesScopedList"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="InstancesScopedList",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    unreachables: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=243372063,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InstanceList(proto.Message):
+    r"""Contains a list of instances.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.Instance]):
+            A list of Instance resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#instanceList
+            for lists of Instance resources.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["Instance"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="Instance",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InstanceListReferrers(proto.Message):
+    r"""Contains a list of instance referrers.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.Reference]):
+            A list of Reference resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#instanceListReferrers for lists of Instance
+            referrers.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["Reference"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="Reference",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InstanceParams(proto.Message):
+    r"""Additional instance params.
+
+    Attributes:
+        resource_manager_tags (MutableMapping[str, str]):
+            Resource manager tags to be bound to the instance. Tag keys
+            and values have the same definition as resource manager
+            tags. Keys must be in the format ``tagKeys/{tag_key_id}``,
+            and values are in the format ``tagValues/456``. The field is
+            ignored (both PUT & PATCH) when empty.
+    """
+
+    resource_manager_tags: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=377671164,
+    )
+
+
+class InstancesAddResourcePoliciesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        resource_policies (MutableSequence[str]):
+            Resource policies to be added to this
+            instance.
+    """
+
+    resource_policies: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=22220385,
+    )
+
+
+class InstancesGetEffectiveFirewallsResponse(proto.Message):
+    r"""
+
+    Attributes:
+        firewall_policys (MutableSequence[google.cloud.compute_v1.types.InstancesGetEffectiveFirewallsResponseEffectiveFirewallPolicy]):
+            Effective firewalls from firewall policies.
+        firewalls (MutableSequence[google.cloud.compute_v1.types.Firewall]):
+            Effective firewalls on the instance.
+    """
+
+    firewall_policys: MutableSequence[
+        "InstancesGetEffectiveFirewallsResponseEffectiveFirewallPolicy"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=410985794,
+        message="InstancesGetEffectiveFirewallsResponseEffectiveFirewallPolicy",
+    )
+    firewalls: MutableSequence[shared_firewall.Firewall] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=272245619,
+        message=shared_firewall.Firewall,
+    )
+
+
+class InstancesGetEffectiveFirewallsResponseEffectiveFirewallPolicy(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        display_name (str):
+            [Output Only] Deprecated, please use short name instead. The
+            display name of the firewall policy.
+
+            This field is a member of `oneof`_ ``_display_name``.
+        name (str):
+            [Output Only] The name of the firewall policy.
+
+            This field is a member of `oneof`_ ``_name``.
+        rules (MutableSequence[google.cloud.compute_v1.types.FirewallPolicyRule]):
+            The rules that apply to the network.
+        short_name (str):
+            [Output Only] The short name of the firewall policy.
+
+            This field is a member of `oneof`_ ``_short_name``.
+        type_ (str):
+            [Output Only] The type of the firewall policy. Can be one of
+            HIERARCHY, NETWORK, NETWORK_REGIONAL. Check the Type enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r"""[Output Only] The type of the firewall policy. Can be one of
+        HIERARCHY, NETWORK, NETWORK_REGIONAL.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            HIERARCHY (69902869):
+                No description available.
+            NETWORK (413984270):
+                No description available.
+            NETWORK_REGIONAL (190804272):
+                No description available.
+            UNSPECIFIED (526786327):
+                No description available.
+        """
+        UNDEFINED_TYPE = 0
+        HIERARCHY = 69902869
+        NETWORK = 413984270
+        NETWORK_REGIONAL = 190804272
+        UNSPECIFIED = 526786327
+
+    display_name: str = proto.Field(
+        proto.STRING,
+        number=4473832,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    rules: MutableSequence[
+        shared_firewall_policy_rule.FirewallPolicyRule
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=108873975,
+        message=shared_firewall_policy_rule.FirewallPolicyRule,
+    )
+    short_name: str = proto.Field(
+        proto.STRING,
+        number=492051566,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+class InstancesRemoveResourcePoliciesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        resource_policies (MutableSequence[str]):
+            Resource policies to be removed from this
+            instance.
+    """
+
+    resource_policies: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=22220385,
+    )
+
+
+class InstancesScopedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instances (MutableSequence[google.cloud.compute_v1.types.Instance]):
+            [Output Only] A list of instances contained in this scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning which replaces the list
+            of instances when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    instances: MutableSequence["Instance"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=29097598,
+        message="Instance",
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InstancesSetLabelsRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        label_fingerprint (str):
+            Fingerprint of the previous set of labels for
+            this resource, used to prevent conflicts.
+            Provide the latest fingerprint value when making
+            a request to add or change labels.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+
+    """
+
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+
+
+class InstancesSetMachineResourcesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        guest_accelerators (MutableSequence[google.cloud.compute_v1.types.AcceleratorConfig]):
+            A list of the type and count of accelerator
+            cards attached to the instance.
+    """
+
+    guest_accelerators: MutableSequence[
+        shared_accelerator_config.AcceleratorConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=463595119,
+        message=shared_accelerator_config.AcceleratorConfig,
+    )
+
+
+class InstancesSetMachineTypeRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        machine_type (str):
+            Full or partial URL of the machine type
+            resource. See Machine Types for a full list of
+            machine types. For example:
+            zones/us-central1-f/machineTypes/n1-standard-1
+
+            This field is a member of `oneof`_ ``_machine_type``.
+    """
+
+    machine_type: str = proto.Field(
+        proto.STRING,
+        number=227711026,
+        optional=True,
+    )
+
+
+class InstancesSetMinCpuPlatformRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        min_cpu_platform (str):
+            Minimum cpu/platform this instance should be
+            started at.
+
+            This field is a member of `oneof`_ ``_min_cpu_platform``.
+    """
+
+    min_cpu_platform: str = proto.Field(
+        proto.STRING,
+        number=242912759,
+        optional=True,
+    )
+
+
+class InstancesSetNameRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        current_name (str):
+            The current name of this resource, used to
+            prevent conflicts. Provide the latest name when
+            making a request to change name.
+
+            This field is a member of `oneof`_ ``_current_name``.
+        name (str):
+            The name to be applied to the instance. Needs
+            to be RFC 1035 compliant.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    current_name: str = proto.Field(
+        proto.STRING,
+        number=394983825,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+
+
+class InstancesSetSecurityPolicyRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        network_interfaces (MutableSequence[str]):
+            The network interfaces that the security
+            policy will be applied to. Network interfaces
+            use the nicN naming format. You can only set a
+            security policy for network interfaces with an
+            access config.
+        security_policy (str):
+            A full or partial URL to a security policy to
+            add to this instance. If this field is set to an
+            empty string it will remove the associated
+            security policy.
+
+            This field is a member of `oneof`_ ``_security_policy``.
+    """
+
+    network_interfaces: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=52735243,
+    )
+    security_policy: str = proto.Field(
+        proto.STRING,
+        number=171082513,
+        optional=True,
+    )
+
+
+class InstancesSetServiceAccountRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        email (str):
+            Email address of the service account.
+
+            This field is a member of `oneof`_ ``_email``.
+        scopes (MutableSequence[str]):
+            The list of scopes to be made available for
+            this service account.
+    """
+
+    email: str = proto.Field(
+        proto.STRING,
+        number=96619420,
+        optional=True,
+    )
+    scopes: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=165973151,
+    )
+
+
+class InstancesStartWithEncryptionKeyRequest(proto.Message):
+    r"""
+
+    Attributes:
+        disks (MutableSequence[google.cloud.compute_v1.types.CustomerEncryptionKeyProtectedDisk]):
+            Array of disks associated with this instance
+            that are protected with a customer-supplied
+            encryption key. In order to start the instance,
+            the disk url and its corresponding key must be
+            provided. If the disk is not protected with a
+            customer-supplied encryption key it should not
+            be specified.
+    """
+
+    disks: MutableSequence["CustomerEncryptionKeyProtectedDisk"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=95594102,
+        message="CustomerEncryptionKeyProtectedDisk",
+    )
+
+
+class ListInstancesRequest(proto.Message):
+    r"""A request message for Instances.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class ListReferrersInstancesRequest(proto.Message):
+    r"""A request message for Instances.ListReferrers. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        instance (str):
+            Name of the target instance scoping this
+            request, or '-' if the request should span over
+            all instances in the container.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class Reference(proto.Message):
+    r"""Represents a reference to a resource.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        kind (str):
+            [Output Only] Type of the resource. Always compute#reference
+            for references.
+
+            This field is a member of `oneof`_ ``_kind``.
+        reference_type (str):
+            A description of the reference type with no implied
+            semantics. Possible values include: 1. MEMBER_OF
+
+            This field is a member of `oneof`_ ``_reference_type``.
+        referrer (str):
+            URL of the resource which refers to the
+            target.
+
+            This field is a member of `oneof`_ ``_referrer``.
+        target (str):
+            URL of the resource to which this reference
+            points.
+
+            This field is a member of `oneof`_ ``_target``.
+    """
+
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    reference_type: str = proto.Field(
+        proto.STRING,
+        number=247521198,
+        optional=True,
+    )
+    referrer: str = proto.Field(
+        proto.STRING,
+        number=351173663,
+        optional=True,
+    )
+    target: str = proto.Field(
+        proto.STRING,
+        number=192835985,
+        optional=True,
+    )
+
+
+class RemoveResourcePoliciesInstanceRequest(proto.Message):
+    r"""A request message for Instances.RemoveResourcePolicies. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            The instance name for this request.
+        instances_remove_resource_policies_request_resource (google.cloud.compute_v1.types.InstancesRemoveResourcePoliciesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instances_remove_resource_policies_request_resource: "InstancesRemoveResourcePoliciesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=49229558,
+        message="InstancesRemoveResourcePoliciesRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class ResetInstanceRequest(proto.Message):
+    r"""A request message for Instances.Reset. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class ResourceStatus(proto.Message):
+    r"""Contains output only fields. Use this sub-message for actual
+    values set on Instance attributes as compared to the value
+    requested by the user (intent) in their instance CRUD calls.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        physical_host (str):
+            [Output Only] An opaque ID of the host on which the VM is
+            running.
+
+            This field is a member of `oneof`_ ``_physical_host``.
+        upcoming_maintenance (google.cloud.compute_v1.types.UpcomingMaintenance):
+
+            This field is a member of `oneof`_ ``_upcoming_maintenance``.
+    """
+
+    physical_host: str = proto.Field(
+        proto.STRING,
+        number=464370704,
+        optional=True,
+    )
+    upcoming_maintenance: "UpcomingMaintenance" = proto.Field(
+        proto.MESSAGE,
+        number=227348592,
+        optional=True,
+        message="UpcomingMaintenance",
+    )
+
+
+class ResumeInstanceRequest(proto.Message):
+    r"""A request message for Instances.Resume. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance resource to resume.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class Screenshot(proto.Message):
+    r"""An instance's screenshot.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        contents (str):
+            [Output Only] The Base64-encoded screenshot data.
+
+            This field is a member of `oneof`_ ``_contents``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#screenshot for the screenshots.
+
+            This field is a member of `oneof`_ ``_kind``.
+    """
+
+    contents: str = proto.Field(
+        proto.STRING,
+        number=506419994,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+
+
+class SendDiagnosticInterruptInstanceRequest(proto.Message):
+    r"""A request message for Instances.SendDiagnosticInterrupt. See
+    the method description for details.
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SendDiagnosticInterruptInstanceResponse(proto.Message):
+    r"""A response message for Instances.SendDiagnosticInterrupt. See
+    the method description for details.
+
+    """
+
+
+class SerialPortOutput(proto.Message):
+    r"""An instance serial console output.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        contents (str):
+            [Output Only] The contents of the console output.
+
+            This field is a member of `oneof`_ ``_contents``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#serialPortOutput for serial port output.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_ (int):
+            [Output Only] The position of the next byte of content,
+            regardless of whether the content exists, following the
+            output returned in the ``contents`` property. Use this value
+            in the next request as the start parameter.
+
+            This field is a member of `oneof`_ ``_next``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        start (int):
+            The starting byte position of the output that was returned.
+            This should match the start parameter sent with the request.
+            If the serial console output exceeds the size of the buffer
+            (1 MB), older output is overwritten by newer content. The
+            output start value will indicate the byte position of the
+            output that was returned, which might be different than the
+            ``start`` value that was specified in the request.
+
+            This field is a member of `oneof`_ ``_start``.
+    """
+
+    contents: str = proto.Field(
+        proto.STRING,
+        number=506419994,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_: int = proto.Field(
+        proto.INT64,
+        number=3377907,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    start: int = proto.Field(
+        proto.INT64,
+        number=109757538,
+        optional=True,
+    )
+
+
+class SetDeletionProtectionInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetDeletionProtection. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        deletion_protection (bool):
+            Whether the resource should be protected
+            against deletion.
+
+            This field is a member of `oneof`_ ``_deletion_protection``.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        resource (str):
+            Name or id of the resource for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    deletion_protection: bool = proto.Field(
+        proto.BOOL,
+        number=458014698,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetDiskAutoDeleteInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetDiskAutoDelete. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_delete (bool):
+            Whether to auto-delete the disk when the
+            instance is deleted.
+        device_name (str):
+            The device name of the disk to modify. Make a
+            get() request on the instance to view currently
+            attached disks and device names.
+        instance (str):
+            The instance name for this request.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    auto_delete: bool = proto.Field(
+        proto.BOOL,
+        number=464761403,
+    )
+    device_name: str = proto.Field(
+        proto.STRING,
+        number=67541716,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetIamPolicyInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetIamPolicy. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        zone (str):
+            The name of the zone for this request.
+        zone_set_policy_request_resource (google.cloud.compute_v1.types.ZoneSetPolicyRequest):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+    zone_set_policy_request_resource: shared_zone_set_policy_request.ZoneSetPolicyRequest = proto.Field(
+        proto.MESSAGE,
+        number=382082107,
+        message=shared_zone_set_policy_request.ZoneSetPolicyRequest,
+    )
+
+
+class SetLabelsInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetLabels. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        instances_set_labels_request_resource (google.cloud.compute_v1.types.InstancesSetLabelsRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instances_set_labels_request_resource: "InstancesSetLabelsRequest" = proto.Field(
+        proto.MESSAGE,
+        number=207749344,
+        message="InstancesSetLabelsRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetMachineResourcesInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetMachineResources. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        instances_set_machine_resources_request_resource (google.cloud.compute_v1.types.InstancesSetMachineResourcesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instances_set_machine_resources_request_resource: "InstancesSetMachineResourcesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=196286318,
+        message="InstancesSetMachineResourcesRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetMachineTypeInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetMachineType. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        instances_set_machine_type_request_resource (google.cloud.compute_v1.types.InstancesSetMachineTypeRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instances_set_machine_type_request_resource: "InstancesSetMachineTypeRequest" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=254157709,
+            message="InstancesSetMachineTypeRequest",
+        )
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetMetadataInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetMetadata. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        metadata_resource (google.cloud.compute_v1.types.Metadata):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    metadata_resource: shared_metadata.Metadata = proto.Field(
+        proto.MESSAGE,
+        number=291086110,
+        message=shared_metadata.Metadata,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetMinCpuPlatformInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetMinCpuPlatform. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        instances_set_min_cpu_platform_request_resource (google.cloud.compute_v1.types.InstancesSetMinCpuPlatformRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instances_set_min_cpu_platform_request_resource: "InstancesSetMinCpuPlatformRequest" = proto.Field(
+        proto.MESSAGE,
+        number=148459368,
+        message="InstancesSetMinCpuPlatformRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetNameInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetName. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            The instance name for this request.
+        instances_set_name_request_resource (google.cloud.compute_v1.types.InstancesSetNameRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instances_set_name_request_resource: "InstancesSetNameRequest" = proto.Field(
+        proto.MESSAGE,
+        number=272080980,
+        message="InstancesSetNameRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetSchedulingInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetScheduling. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Instance name for this request.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        scheduling_resource (google.cloud.compute_v1.types.Scheduling):
+            The body resource for this request
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    scheduling_resource: shared_network_interface.Scheduling = proto.Field(
+        proto.MESSAGE,
+        number=463181401,
+        message=shared_network_interface.Scheduling,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetSecurityPolicyInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetSecurityPolicy. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the Instance resource to which the
+            security policy should be set. The name should
+            conform to RFC1035.
+        instances_set_security_policy_request_resource (google.cloud.compute_v1.types.InstancesSetSecurityPolicyRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            Name of the zone scoping this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instances_set_security_policy_request_resource: "InstancesSetSecurityPolicyRequest" = proto.Field(
+        proto.MESSAGE,
+        number=248424586,
+        message="InstancesSetSecurityPolicyRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetServiceAccountInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetServiceAccount. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance resource to start.
+        instances_set_service_account_request_resource (google.cloud.compute_v1.types.InstancesSetServiceAccountRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instances_set_service_account_request_resource: "InstancesSetServiceAccountRequest" = proto.Field(
+        proto.MESSAGE,
+        number=275550008,
+        message="InstancesSetServiceAccountRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetShieldedInstanceIntegrityPolicyInstanceRequest(proto.Message):
+    r"""A request message for
+    Instances.SetShieldedInstanceIntegrityPolicy. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name or id of the instance scoping this
+            request.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        shielded_instance_integrity_policy_resource (google.cloud.compute_v1.types.ShieldedInstanceIntegrityPolicy):
+            The body resource for this request
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    shielded_instance_integrity_policy_resource: "ShieldedInstanceIntegrityPolicy" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=409169462,
+            message="ShieldedInstanceIntegrityPolicy",
+        )
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetTagsInstanceRequest(proto.Message):
+    r"""A request message for Instances.SetTags. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        tags_resource (google.cloud.compute_v1.types.Tags):
+            The body resource for this request
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    tags_resource: shared_network_interface.Tags = proto.Field(
+        proto.MESSAGE,
+        number=331435380,
+        message=shared_network_interface.Tags,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class ShieldedInstanceIdentity(proto.Message):
+    r"""A Shielded Instance Identity.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        encryption_key (google.cloud.compute_v1.types.ShieldedInstanceIdentityEntry):
+            An Endorsement Key (EK) made by the RSA 2048
+            algorithm issued to the Shielded Instance's
+            vTPM.
+
+            This field is a member of `oneof`_ ``_encryption_key``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#shieldedInstanceIdentity for shielded Instance
+            identity entry.
+
+            This field is a member of `oneof`_ ``_kind``.
+        signing_key (google.cloud.compute_v1.types.ShieldedInstanceIdentityEntry):
+            An Attestation Key (AK) made by the RSA 2048
+            algorithm issued to the Shielded Instance's
+            vTPM.
+
+            This field is a member of `oneof`_ ``_signing_key``.
+    """
+
+    encryption_key: "ShieldedInstanceIdentityEntry" = proto.Field(
+        proto.MESSAGE,
+        number=488268707,
+        optional=True,
+        message="ShieldedInstanceIdentityEntry",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    signing_key: "ShieldedInstanceIdentityEntry" = proto.Field(
+        proto.MESSAGE,
+        number=320948261,
+        optional=True,
+        message="ShieldedInstanceIdentityEntry",
+    )
+
+
+class ShieldedInstanceIdentityEntry(proto.Message):
+    r"""A Shielded Instance Identity Entry.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ek_cert (str):
+            A PEM-encoded X.509 certificate. This field
+            can be empty.
+
+            This field is a member of `oneof`_ ``_ek_cert``.
+        ek_pub (str):
+            A PEM-encoded public key.
+
+            This field is a member of `oneof`_ ``_ek_pub``.
+    """
+
+    ek_cert: str = proto.Field(
+        proto.STRING,
+        number=450178589,
+        optional=True,
+    )
+    ek_pub: str = proto.Field(
+        proto.STRING,
+        number=308947940,
+        optional=True,
+    )
+
+
+class ShieldedInstanceIntegrityPolicy(proto.Message):
+    r"""The policy describes the baseline against which Instance boot
+    integrity is measured.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        update_auto_learn_policy (bool):
+            Updates the integrity policy baseline using
+            the measurements from the VM instance's most
+            recent boot.
+
+            This field is a member of `oneof`_ ``_update_auto_learn_policy``.
+    """
+
+    update_auto_learn_policy: bool = proto.Field(
+        proto.BOOL,
+        number=245490215,
+        optional=True,
+    )
+
+
+class SimulateMaintenanceEventInstanceRequest(proto.Message):
+    r"""A request message for Instances.SimulateMaintenanceEvent. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance scoping this request.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class StartInstanceRequest(proto.Message):
+    r"""A request message for Instances.Start. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance resource to start.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class StartWithEncryptionKeyInstanceRequest(proto.Message):
+    r"""A request message for Instances.StartWithEncryptionKey. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance resource to start.
+        instances_start_with_encryption_key_request_resource (google.cloud.compute_v1.types.InstancesStartWithEncryptionKeyRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instances_start_with_encryption_key_request_resource: "InstancesStartWithEncryptionKeyRequest" = proto.Field(
+        proto.MESSAGE,
+        number=441712511,
+        message="InstancesStartWithEncryptionKeyRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class StopInstanceRequest(proto.Message):
+    r"""A request message for Instances.Stop. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        discard_local_ssd (bool):
+            If true, discard the contents of any attached
+            localSSD partitions. Default value is false.
+
+            This field is a member of `oneof`_ ``_discard_local_ssd``.
+        instance (str):
+            Name of the instance resource to stop.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    discard_local_ssd: bool = proto.Field(
+        proto.BOOL,
+        number=319517903,
+        optional=True,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SuspendInstanceRequest(proto.Message):
+    r"""A request message for Instances.Suspend. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        discard_local_ssd (bool):
+            If true, discard the contents of any attached
+            localSSD partitions. Default value is false.
+
+            This field is a member of `oneof`_ ``_discard_local_ssd``.
+        instance (str):
+            Name of the instance resource to suspend.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    discard_local_ssd: bool = proto.Field(
+        proto.BOOL,
+        number=319517903,
+        optional=True,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class TestIamPermissionsInstanceRequest(proto.Message):
+    r"""A request message for Instances.TestIamPermissions. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    test_permissions_request_resource: shared_test_permissions_request.TestPermissionsRequest = proto.Field(
+        proto.MESSAGE,
+        number=439214758,
+        message=shared_test_permissions_request.TestPermissionsRequest,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class UpcomingMaintenance(proto.Message):
+    r"""Upcoming Maintenance notification information.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        can_reschedule (bool):
+            Indicates if the maintenance can be customer
+            triggered.
+
+            This field is a member of `oneof`_ ``_can_reschedule``.
+        latest_window_start_time (str):
+            The latest time for the planned maintenance
+            window to start. This timestamp value is in
+            RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_latest_window_start_time``.
+        maintenance_status (str):
+            Check the MaintenanceStatus enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_maintenance_status``.
+        type_ (str):
+            Defines the type of maintenance.
+            Check the Type enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_type``.
+        window_end_time (str):
+            The time by which the maintenance disruption
+            will be completed. This timestamp value is in
+            RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_window_end_time``.
+        window_start_time (str):
+            The current start time of the maintenance
+            window. This timestamp value is in RFC3339 text
+            format.
+
+            This field is a member of `oneof`_ ``_window_start_time``.
+    """
+
+    class MaintenanceStatus(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_MAINTENANCE_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            ONGOING (473158491):
+                There is ongoing maintenance on this VM.
+            PENDING (35394935):
+                There is pending maintenance.
+            UNKNOWN (433141802):
+                Unknown maintenance status. Do not use this
+                value.
+        """
+        UNDEFINED_MAINTENANCE_STATUS = 0
+        ONGOING = 473158491
+        PENDING = 35394935
+        UNKNOWN = 433141802
+
+    class Type(proto.Enum):
+        r"""Defines the type of maintenance.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            SCHEDULED (478400653):
+                Scheduled maintenance (e.g. maintenance after
+                uptime guarantee is complete).
+            UNKNOWN_TYPE (490705455):
+                No type specified. Do not use this value.
+            UNSCHEDULED (450077204):
+                Unscheduled maintenance (e.g. emergency
+                maintenance during uptime guarantee).
+        """
+        UNDEFINED_TYPE = 0
+        SCHEDULED = 478400653
+        UNKNOWN_TYPE = 490705455
+        UNSCHEDULED = 450077204
+
+    can_reschedule: bool = proto.Field(
+        proto.BOOL,
+        number=95981977,
+        optional=True,
+    )
+    latest_window_start_time: str = proto.Field(
+        proto.STRING,
+        number=128032129,
+        optional=True,
+    )
+    maintenance_status: str = proto.Field(
+        proto.STRING,
+        number=81645214,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+    window_end_time: str = proto.Field(
+        proto.STRING,
+        number=271816480,
+        optional=True,
+    )
+    window_start_time: str = proto.Field(
+        proto.STRING,
+        number=473061433,
+        optional=True,
+    )
+
+
+class UpdateAccessConfigInstanceRequest(proto.Message):
+    r"""A request message for Instances.UpdateAccessConfig. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        access_config_resource (google.cloud.compute_v1.types.AccessConfig):
+            The body resource for this request
+        instance (str):
+            The instance name for this request.
+        network_interface (str):
+            The name of the network interface where the
+            access config is attached.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    access_config_resource: shared_network_interface.AccessConfig = proto.Field(
+        proto.MESSAGE,
+        number=387825552,
+        message=shared_network_interface.AccessConfig,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    network_interface: str = proto.Field(
+        proto.STRING,
+        number=365387880,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class UpdateDisplayDeviceInstanceRequest(proto.Message):
+    r"""A request message for Instances.UpdateDisplayDevice. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        display_device_resource (google.cloud.compute_v1.types.DisplayDevice):
+            The body resource for this request
+        instance (str):
+            Name of the instance scoping this request.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    display_device_resource: "DisplayDevice" = proto.Field(
+        proto.MESSAGE,
+        number=289686106,
+        message="DisplayDevice",
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class UpdateInstanceRequest(proto.Message):
+    r"""A request message for Instances.Update. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name of the instance resource to update.
+        instance_resource (google.cloud.compute_v1.types.Instance):
+            The body resource for this request
+        minimal_action (str):
+            Specifies the action to take when updating an
+            instance even if the updated properties do not
+            require it. If not specified, then Compute
+            Engine acts based on the minimum action that the
+            updated properties require. Check the
+            MinimalAction enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_minimal_action``.
+        most_disruptive_allowed_action (str):
+            Specifies the most disruptive action that can be taken on
+            the instance as part of the update. Compute Engine returns
+            an error if the instance properties require a more
+            disruptive action as part of the instance update. Valid
+            options from lowest to highest are NO_EFFECT, REFRESH, and
+            RESTART. Check the MostDisruptiveAllowedAction enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_most_disruptive_allowed_action``.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    class MinimalAction(proto.Enum):
+        r"""Specifies the action to take when updating an instance even if the
+        updated properties do not require it. If not specified, then Compute
+        Engine acts based on the minimum action that the updated properties
+        require. Additional supported values which may be not listed in the
+        enum directly due to technical reasons: INVALID NO_EFFECT REFRESH
+        RESTART
+
+        Values:
+            UNDEFINED_MINIMAL_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_MINIMAL_ACTION = 0
+
+    class MostDisruptiveAllowedAction(proto.Enum):
+        r"""Specifies the most disruptive action that can be taken on the
+        instance as part of the update. Compute Engine returns an error if
+        the instance properties require a more disruptive action as part of
+        the instance update. Valid options from lowest to highest are
+        NO_EFFECT, REFRESH, and RESTART. Additional supported values which
+        may be not listed in the enum directly due to technical reasons:
+        INVALID NO_EFFECT REFRESH RESTART
+
+        Values:
+            UNDEFINED_MOST_DISRUPTIVE_ALLOWED_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_MOST_DISRUPTIVE_ALLOWED_ACTION = 0
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    instance_resource: "Instance" = proto.Field(
+        proto.MESSAGE,
+        number=215988344,
+        message="Instance",
+    )
+    minimal_action: str = proto.Field(
+        proto.STRING,
+        number=270567060,
+        optional=True,
+    )
+    most_disruptive_allowed_action: str = proto.Field(
+        proto.STRING,
+        number=66103053,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class UpdateNetworkInterfaceInstanceRequest(proto.Message):
+    r"""A request message for Instances.UpdateNetworkInterface. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            The instance name for this request.
+        network_interface (str):
+            The name of the network interface to update.
+        network_interface_resource (google.cloud.compute_v1.types.NetworkInterface):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    network_interface: str = proto.Field(
+        proto.STRING,
+        number=365387880,
+    )
+    network_interface_resource: shared_network_interface.NetworkInterface = proto.Field(
+        proto.MESSAGE,
+        number=325814789,
+        message=shared_network_interface.NetworkInterface,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class UpdateShieldedInstanceConfigInstanceRequest(proto.Message):
+    r"""A request message for Instances.UpdateShieldedInstanceConfig.
+    See the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance (str):
+            Name or id of the instance scoping this
+            request.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        shielded_instance_config_resource (google.cloud.compute_v1.types.ShieldedInstanceConfig):
+            The body resource for this request
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    shielded_instance_config_resource: shared_network_interface.ShieldedInstanceConfig = proto.Field(
+        proto.MESSAGE,
+        number=272059224,
+        message=shared_network_interface.ShieldedInstanceConfig,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
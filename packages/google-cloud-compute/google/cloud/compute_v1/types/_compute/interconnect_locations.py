@@ -0,0 +1,619 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "GetInterconnectLocationRequest",
+        "InterconnectLocation",
+        "InterconnectLocationList",
+        "InterconnectLocationRegionInfo",
+        "ListInterconnectLocationsRequest",
+    },
+)
+
+
+class GetInterconnectLocationRequest(proto.Message):
+    r"""A request message for InterconnectLocations.Get. See the
+    method description for details.
+
+    Attributes:
+        interconnect_location (str):
+            Name of the interconnect location to return.
+        project (str):
+            Project ID for this request.
+    """
+
+    interconnect_location: str = proto.Field(
+        proto.STRING,
+        number=492235846,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class InterconnectLocation(proto.Message):
+    r"""Represents an Interconnect Attachment (VLAN) Location
+    resource. You can use this resource to find location details
+    about an Interconnect attachment (VLAN). For more information
+    about interconnect attachments, read Creating VLAN Attachments.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        address (str):
+            [Output Only] The postal address of the Point of Presence,
+            each line in the address is separated by a newline
+            character.
+
+            This field is a member of `oneof`_ ``_address``.
+        availability_zone (str):
+            [Output Only] Availability zone for this
+            InterconnectLocation. Within a metropolitan area (metro),
+            maintenance will not be simultaneously scheduled in more
+            than one availability zone. Example: "zone1" or "zone2".
+
+            This field is a member of `oneof`_ ``_availability_zone``.
+        available_features (MutableSequence[str]):
+            [Output only] List of features available at this
+            InterconnectLocation, which can take one of the following
+            values: - MACSEC Check the AvailableFeatures enum for the
+            list of possible values.
+        available_link_types (MutableSequence[str]):
+            [Output only] List of link types available at this
+            InterconnectLocation, which can take one of the following
+            values: - LINK_TYPE_ETHERNET_10G_LR -
+            LINK_TYPE_ETHERNET_100G_LR Check the AvailableLinkTypes enum
+            for the list of possible values.
+        city (str):
+            [Output Only] Metropolitan area designator that indicates
+            which city an interconnect is located. For example:
+            "Chicago, IL", "Amsterdam, Netherlands".
+
+            This field is a member of `oneof`_ ``_city``.
+        continent (str):
+            [Output Only] Continent for this location, which can take
+            one of the following values: - AFRICA - ASIA_PAC - EUROPE -
+            NORTH_AMERICA - SOUTH_AMERICA Check the Continent enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_continent``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            [Output Only] An optional description of the resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        facility_provider (str):
+            [Output Only] The name of the provider for this facility
+            (e.g., EQUINIX).
+
+            This field is a member of `oneof`_ ``_facility_provider``.
+        facility_provider_facility_id (str):
+            [Output Only] A provider-assigned Identifier for this
+            facility (e.g., Ashburn-DC1).
+
+            This field is a member of `oneof`_ ``_facility_provider_facility_id``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#interconnectLocation for interconnect locations.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            [Output Only] Name of the resource.
+
+            This field is a member of `oneof`_ ``_name``.
+        peeringdb_facility_id (str):
+            [Output Only] The peeringdb identifier for this facility
+            (corresponding with a netfac type in peeringdb).
+
+            This field is a member of `oneof`_ ``_peeringdb_facility_id``.
+        region_infos (MutableSequence[google.cloud.compute_v1.types.InterconnectLocationRegionInfo]):
+            [Output Only] A list of InterconnectLocation.RegionInfo
+            objects, that describe parameters pertaining to the relation
+            between this InterconnectLocation and various Google Cloud
+            regions.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        status (str):
+            [Output Only] The status of this InterconnectLocation, which
+            can take one of the following values: - CLOSED: The
+            InterconnectLocation is closed and is unavailable for
+            provisioning new Interconnects. - AVAILABLE: The
+            InterconnectLocation is available for provisioning new
+            Interconnects. Check the Status enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        supports_pzs (bool):
+            [Output Only] Reserved for future use.
+
+            This field is a member of `oneof`_ ``_supports_pzs``.
+    """
+
+    class AvailableFeatures(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_AVAILABLE_FEATURES (0):
+                A value indicating that the enum field is not
+                set.
+            IF_MACSEC (396279300):
+                Media Access Control security (MACsec)
+        """
+        UNDEFINED_AVAILABLE_FEATURES = 0
+        IF_MACSEC = 396279300
+
+    class AvailableLinkTypes(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_AVAILABLE_LINK_TYPES (0):
+                A value indicating that the enum field is not
+                set.
+            LINK_TYPE_ETHERNET_100G_LR (337672551):
+                100G Ethernet, LR Optics.
+            LINK_TYPE_ETHERNET_10G_LR (236739749):
+                10G Ethernet, LR Optics. [(rate_bps) = 10000000000];
+        """
+        UNDEFINED_AVAILABLE_LINK_TYPES = 0
+        LINK_TYPE_ETHERNET_100G_LR = 337672551
+        LINK_TYPE_ETHERNET_10G_LR = 236739749
+
+    class Continent(proto.Enum):
+        r"""[Output Only] Continent for this location, which can take one of the
+        following values: - AFRICA - ASIA_PAC - EUROPE - NORTH_AMERICA -
+        SOUTH_AMERICA
+
+        Values:
+            UNDEFINED_CONTINENT (0):
+                A value indicating that the enum field is not
+                set.
+            AFRICA (317443706):
+                No description available.
+            ASIA_PAC (119782269):
+                No description available.
+            C_AFRICA (71993846):
+                No description available.
+            C_ASIA_PAC (465668089):
+                No description available.
+            C_EUROPE (200369438):
+                No description available.
+            C_NORTH_AMERICA (275697048):
+                No description available.
+            C_SOUTH_AMERICA (397149792):
+                No description available.
+            EUROPE (445819298):
+                No description available.
+            NORTH_AMERICA (448015508):
+                No description available.
+            SOUTH_AMERICA (32597340):
+                No description available.
+        """
+        UNDEFINED_CONTINENT = 0
+        AFRICA = 317443706
+        ASIA_PAC = 119782269
+        C_AFRICA = 71993846
+        C_ASIA_PAC = 465668089
+        C_EUROPE = 200369438
+        C_NORTH_AMERICA = 275697048
+        C_SOUTH_AMERICA = 397149792
+        EUROPE = 445819298
+        NORTH_AMERICA = 448015508
+        SOUTH_AMERICA = 32597340
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of this InterconnectLocation, which can
+        take one of the following values: - CLOSED: The InterconnectLocation
+        is closed and is unavailable for provisioning new Interconnects. -
+        AVAILABLE: The InterconnectLocation is available for provisioning
+        new Interconnects.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            AVAILABLE (442079913):
+                The InterconnectLocation is available for
+                provisioning new Interconnects.
+            CLOSED (380163436):
+                The InterconnectLocation is closed for
+                provisioning new Interconnects.
+        """
+        UNDEFINED_STATUS = 0
+        AVAILABLE = 442079913
+        CLOSED = 380163436
+
+    address: str = proto.Field(
+        proto.STRING,
+        number=462920692,
+        optional=True,
+    )
+    availability_zone: str = proto.Field(
+        proto.STRING,
+        number=158459920,
+        optional=True,
+    )
+    available_features: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=496344307,
+    )
+    available_link_types: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=509504298,
+    )
+    city: str = proto.Field(
+        proto.STRING,
+        number=3053931,
+        optional=True,
+    )
+    continent: str = proto.Field(
+        proto.STRING,
+        number=133442996,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    facility_provider: str = proto.Field(
+        proto.STRING,
+        number=533303309,
+        optional=True,
+    )
+    facility_provider_facility_id: str = proto.Field(
+        proto.STRING,
+        number=87269125,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    peeringdb_facility_id: str = proto.Field(
+        proto.STRING,
+        number=536567094,
+        optional=True,
+    )
+    region_infos: MutableSequence[
+        "InterconnectLocationRegionInfo"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=312194170,
+        message="InterconnectLocationRegionInfo",
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    supports_pzs: bool = proto.Field(
+        proto.BOOL,
+        number=83983214,
+        optional=True,
+    )
+
+
+class InterconnectLocationList(proto.Message):
+    r"""Response to the list request, and contains a list of
+    interconnect locations.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.InterconnectLocation]):
+            A list of InterconnectLocation resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#interconnectLocationList for lists of interconnect
+            locations.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["InterconnectLocation"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="InterconnectLocation",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InterconnectLocationRegionInfo(proto.Message):
+    r"""Information about any potential InterconnectAttachments
+    between an Interconnect at a specific InterconnectLocation, and
+    a specific Cloud Region.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        expected_rtt_ms (int):
+            Expected round-trip time in milliseconds,
+            from this InterconnectLocation to a VM in this
+            region.
+
+            This field is a member of `oneof`_ ``_expected_rtt_ms``.
+        location_presence (str):
+            Identifies the network presence of this
+            location. Check the LocationPresence enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_location_presence``.
+        region (str):
+            URL for the region of this location.
+
+            This field is a member of `oneof`_ ``_region``.
+    """
+
+    class LocationPresence(proto.Enum):
+        r"""Identifies the network presence of this location.
+
+        Values:
+            UNDEFINED_LOCATION_PRESENCE (0):
+                A value indicating that the enum field is not
+                set.
+            GLOBAL (494663587):
+                This region is not in any common network
+                presence with this InterconnectLocation.
+            LOCAL_REGION (403535464):
+                This region shares the same regional network
+                presence as this InterconnectLocation.
+            LP_GLOBAL (429584062):
+                [Deprecated] This region is not in any common network
+                presence with this InterconnectLocation.
+            LP_LOCAL_REGION (488598851):
+                [Deprecated] This region shares the same regional network
+                presence as this InterconnectLocation.
+        """
+        UNDEFINED_LOCATION_PRESENCE = 0
+        GLOBAL = 494663587
+        LOCAL_REGION = 403535464
+        LP_GLOBAL = 429584062
+        LP_LOCAL_REGION = 488598851
+
+    expected_rtt_ms: int = proto.Field(
+        proto.INT64,
+        number=422543866,
+        optional=True,
+    )
+    location_presence: str = proto.Field(
+        proto.STRING,
+        number=101517893,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+
+
+class ListInterconnectLocationsRequest(proto.Message):
+    r"""A request message for InterconnectLocations.List. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,724 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import (
+    shared_interconnect_attachment_configuration_constraints,
+)
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "GetInterconnectRemoteLocationRequest",
+        "InterconnectRemoteLocation",
+        "InterconnectRemoteLocationConstraints",
+        "InterconnectRemoteLocationConstraintsSubnetLengthRange",
+        "InterconnectRemoteLocationList",
+        "InterconnectRemoteLocationPermittedConnections",
+        "ListInterconnectRemoteLocationsRequest",
+    },
+)
+
+
+class GetInterconnectRemoteLocationRequest(proto.Message):
+    r"""A request message for InterconnectRemoteLocations.Get. See
+    the method description for details.
+
+    Attributes:
+        interconnect_remote_location (str):
+            Name of the interconnect remote location to
+            return.
+        project (str):
+            Project ID for this request.
+    """
+
+    interconnect_remote_location: str = proto.Field(
+        proto.STRING,
+        number=290153949,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class InterconnectRemoteLocation(proto.Message):
+    r"""Represents a Cross-Cloud Interconnect Remote Location
+    resource. You can use this resource to find remote location
+    details about an Interconnect attachment (VLAN).
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        address (str):
+            [Output Only] The postal address of the Point of Presence,
+            each line in the address is separated by a newline
+            character.
+
+            This field is a member of `oneof`_ ``_address``.
+        attachment_configuration_constraints (google.cloud.compute_v1.types.InterconnectAttachmentConfigurationConstraints):
+            [Output Only] Subset of fields from InterconnectAttachment's
+            \|configurationConstraints\| field that apply to all
+            attachments for this remote location.
+
+            This field is a member of `oneof`_ ``_attachment_configuration_constraints``.
+        city (str):
+            [Output Only] Metropolitan area designator that indicates
+            which city an interconnect is located. For example:
+            "Chicago, IL", "Amsterdam, Netherlands".
+
+            This field is a member of `oneof`_ ``_city``.
+        constraints (google.cloud.compute_v1.types.InterconnectRemoteLocationConstraints):
+            [Output Only] Constraints on the parameters for creating
+            Cross-Cloud Interconnect and associated
+            InterconnectAttachments.
+
+            This field is a member of `oneof`_ ``_constraints``.
+        continent (str):
+            [Output Only] Continent for this location, which can take
+            one of the following values: - AFRICA - ASIA_PAC - EUROPE -
+            NORTH_AMERICA - SOUTH_AMERICA Check the Continent enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_continent``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            [Output Only] An optional description of the resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        facility_provider (str):
+            [Output Only] The name of the provider for this facility
+            (e.g., EQUINIX).
+
+            This field is a member of `oneof`_ ``_facility_provider``.
+        facility_provider_facility_id (str):
+            [Output Only] A provider-assigned Identifier for this
+            facility (e.g., Ashburn-DC1).
+
+            This field is a member of `oneof`_ ``_facility_provider_facility_id``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#interconnectRemoteLocation for interconnect remote
+            locations.
+
+            This field is a member of `oneof`_ ``_kind``.
+        lacp (str):
+            [Output Only] Link Aggregation Control Protocol (LACP)
+            constraints, which can take one of the following values:
+            LACP_SUPPORTED, LACP_UNSUPPORTED Check the Lacp enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_lacp``.
+        max_lag_size100_gbps (int):
+            [Output Only] The maximum number of 100 Gbps ports supported
+            in a link aggregation group (LAG). When linkType is 100
+            Gbps, requestedLinkCount cannot exceed
+            max_lag_size_100_gbps.
+
+            This field is a member of `oneof`_ ``_max_lag_size100_gbps``.
+        max_lag_size10_gbps (int):
+            [Output Only] The maximum number of 10 Gbps ports supported
+            in a link aggregation group (LAG). When linkType is 10 Gbps,
+            requestedLinkCount cannot exceed max_lag_size_10_gbps.
+
+            This field is a member of `oneof`_ ``_max_lag_size10_gbps``.
+        name (str):
+            [Output Only] Name of the resource.
+
+            This field is a member of `oneof`_ ``_name``.
+        peeringdb_facility_id (str):
+            [Output Only] The peeringdb identifier for this facility
+            (corresponding with a netfac type in peeringdb).
+
+            This field is a member of `oneof`_ ``_peeringdb_facility_id``.
+        permitted_connections (MutableSequence[google.cloud.compute_v1.types.InterconnectRemoteLocationPermittedConnections]):
+            [Output Only] Permitted connections.
+        remote_service (str):
+            [Output Only] Indicates the service provider present at the
+            remote location. Example values: "Amazon Web Services",
+            "Microsoft Azure".
+
+            This field is a member of `oneof`_ ``_remote_service``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        status (str):
+            [Output Only] The status of this InterconnectRemoteLocation,
+            which can take one of the following values: - CLOSED: The
+            InterconnectRemoteLocation is closed and is unavailable for
+            provisioning new Cross-Cloud Interconnects. - AVAILABLE: The
+            InterconnectRemoteLocation is available for provisioning new
+            Cross-Cloud Interconnects. Check the Status enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    class Continent(proto.Enum):
+        r"""[Output Only] Continent for this location, which can take one of the
+        following values: - AFRICA - ASIA_PAC - EUROPE - NORTH_AMERICA -
+        SOUTH_AMERICA
+
+        Values:
+            UNDEFINED_CONTINENT (0):
+                A value indicating that the enum field is not
+                set.
+            AFRICA (317443706):
+                No description available.
+            ASIA_PAC (119782269):
+                No description available.
+            EUROPE (445819298):
+                No description available.
+            NORTH_AMERICA (448015508):
+                No description available.
+            SOUTH_AMERICA (32597340):
+                No description available.
+        """
+        UNDEFINED_CONTINENT = 0
+        AFRICA = 317443706
+        ASIA_PAC = 119782269
+        EUROPE = 445819298
+        NORTH_AMERICA = 448015508
+        SOUTH_AMERICA = 32597340
+
+    class Lacp(proto.Enum):
+        r"""[Output Only] Link Aggregation Control Protocol (LACP) constraints,
+        which can take one of the following values: LACP_SUPPORTED,
+        LACP_UNSUPPORTED
+
+        Values:
+            UNDEFINED_LACP (0):
+                A value indicating that the enum field is not
+                set.
+            LACP_SUPPORTED (339576113):
+                LACP_SUPPORTED: LACP is supported, and enabled by default on
+                the Cross-Cloud Interconnect.
+            LACP_UNSUPPORTED (203930104):
+                LACP_UNSUPPORTED: LACP is not supported and is not be
+                enabled on this port. GetDiagnostics shows
+                bundleAggregationType as "static". GCP does not support LAGs
+                without LACP, so requestedLinkCount must be 1.
+        """
+        UNDEFINED_LACP = 0
+        LACP_SUPPORTED = 339576113
+        LACP_UNSUPPORTED = 203930104
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of this InterconnectRemoteLocation, which
+        can take one of the following values: - CLOSED: The
+        InterconnectRemoteLocation is closed and is unavailable for
+        provisioning new Cross-Cloud Interconnects. - AVAILABLE: The
+        InterconnectRemoteLocation is available for provisioning new
+        Cross-Cloud Interconnects.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            AVAILABLE (442079913):
+                The InterconnectRemoteLocation is available
+                for provisioning new Cross-Cloud Interconnects.
+            CLOSED (380163436):
+                The InterconnectRemoteLocation is closed for
+                provisioning new Cross-Cloud Interconnects.
+        """
+        UNDEFINED_STATUS = 0
+        AVAILABLE = 442079913
+        CLOSED = 380163436
+
+    address: str = proto.Field(
+        proto.STRING,
+        number=462920692,
+        optional=True,
+    )
+    attachment_configuration_constraints: shared_interconnect_attachment_configuration_constraints.InterconnectAttachmentConfigurationConstraints = proto.Field(
+        proto.MESSAGE,
+        number=326825041,
+        optional=True,
+        message=shared_interconnect_attachment_configuration_constraints.InterconnectAttachmentConfigurationConstraints,
+    )
+    city: str = proto.Field(
+        proto.STRING,
+        number=3053931,
+        optional=True,
+    )
+    constraints: "InterconnectRemoteLocationConstraints" = proto.Field(
+        proto.MESSAGE,
+        number=3909174,
+        optional=True,
+        message="InterconnectRemoteLocationConstraints",
+    )
+    continent: str = proto.Field(
+        proto.STRING,
+        number=133442996,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    facility_provider: str = proto.Field(
+        proto.STRING,
+        number=533303309,
+        optional=True,
+    )
+    facility_provider_facility_id: str = proto.Field(
+        proto.STRING,
+        number=87269125,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    lacp: str = proto.Field(
+        proto.STRING,
+        number=3313826,
+        optional=True,
+    )
+    max_lag_size100_gbps: int = proto.Field(
+        proto.INT32,
+        number=245219253,
+        optional=True,
+    )
+    max_lag_size10_gbps: int = proto.Field(
+        proto.INT32,
+        number=294007573,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    peeringdb_facility_id: str = proto.Field(
+        proto.STRING,
+        number=536567094,
+        optional=True,
+    )
+    permitted_connections: MutableSequence[
+        "InterconnectRemoteLocationPermittedConnections"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=442063278,
+        message="InterconnectRemoteLocationPermittedConnections",
+    )
+    remote_service: str = proto.Field(
+        proto.STRING,
+        number=391954364,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+
+
+class InterconnectRemoteLocationConstraints(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        port_pair_remote_location (str):
+            [Output Only] Port pair remote location constraints, which
+            can take one of the following values:
+            PORT_PAIR_UNCONSTRAINED_REMOTE_LOCATION,
+            PORT_PAIR_MATCHING_REMOTE_LOCATION. GCP's API refers only to
+            individual ports, but the UI uses this field when ordering a
+            pair of ports, to prevent users from accidentally ordering
+            something that is incompatible with their cloud provider.
+            Specifically, when ordering a redundant pair of Cross-Cloud
+            Interconnect ports, and one of them uses a remote location
+            with portPairMatchingRemoteLocation set to matching, the UI
+            requires that both ports use the same remote location. Check
+            the PortPairRemoteLocation enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_port_pair_remote_location``.
+        port_pair_vlan (str):
+            [Output Only] Port pair VLAN constraints, which can take one
+            of the following values: PORT_PAIR_UNCONSTRAINED_VLAN,
+            PORT_PAIR_MATCHING_VLAN Check the PortPairVlan enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_port_pair_vlan``.
+        subnet_length_range (google.cloud.compute_v1.types.InterconnectRemoteLocationConstraintsSubnetLengthRange):
+            [Output Only] [min-length, max-length] The minimum and
+            maximum value (inclusive) for the IPv4 subnet length. For
+            example, an interconnectRemoteLocation for Azure has {min:
+            30, max: 30} because Azure requires /30 subnets. This range
+            specifies the values supported by both cloud providers.
+            Interconnect currently supports /29 and /30 IPv4 subnet
+            lengths. If a remote cloud has no constraint on IPv4 subnet
+            length, the range would thus be {min: 29, max: 30}.
+
+            This field is a member of `oneof`_ ``_subnet_length_range``.
+    """
+
+    class PortPairRemoteLocation(proto.Enum):
+        r"""[Output Only] Port pair remote location constraints, which can take
+        one of the following values:
+        PORT_PAIR_UNCONSTRAINED_REMOTE_LOCATION,
+        PORT_PAIR_MATCHING_REMOTE_LOCATION. GCP's API refers only to
+        individual ports, but the UI uses this field when ordering a pair of
+        ports, to prevent users from accidentally ordering something that is
+        incompatible with their cloud provider. Specifically, when ordering
+        a redundant pair of Cross-Cloud Interconnect ports, and one of them
+        uses a remote location with portPairMatchingRemoteLocation set to
+        matching, the UI requires that both ports use the same remote
+        location.
+
+        Values:
+            UNDEFINED_PORT_PAIR_REMOTE_LOCATION (0):
+                A value indicating that the enum field is not
+                set.
+            PORT_PAIR_MATCHING_REMOTE_LOCATION (207291859):
+                If PORT_PAIR_MATCHING_REMOTE_LOCATION, the remote cloud
+                provider allocates ports in pairs, and the user should
+                choose the same remote location for both ports.
+            PORT_PAIR_UNCONSTRAINED_REMOTE_LOCATION (60609829):
+                If PORT_PAIR_UNCONSTRAINED_REMOTE_LOCATION, a user may opt
+                to provision a redundant pair of Cross-Cloud Interconnects
+                using two different remote locations in the same city.
+        """
+        UNDEFINED_PORT_PAIR_REMOTE_LOCATION = 0
+        PORT_PAIR_MATCHING_REMOTE_LOCATION = 207291859
+        PORT_PAIR_UNCONSTRAINED_REMOTE_LOCATION = 60609829
+
+    class PortPairVlan(proto.Enum):
+        r"""[Output Only] Port pair VLAN constraints, which can take one of the
+        following values: PORT_PAIR_UNCONSTRAINED_VLAN,
+        PORT_PAIR_MATCHING_VLAN
+
+        Values:
+            UNDEFINED_PORT_PAIR_VLAN (0):
+                A value indicating that the enum field is not
+                set.
+            PORT_PAIR_MATCHING_VLAN (250295358):
+                If PORT_PAIR_MATCHING_VLAN, the Interconnect for this
+                attachment is part of a pair of ports that should have
+                matching VLAN allocations. This occurs with Cross-Cloud
+                Interconnect to Azure remote locations. While GCP's API does
+                not explicitly group pairs of ports, the UI uses this field
+                to ensure matching VLAN ids when configuring a redundant
+                VLAN pair.
+            PORT_PAIR_UNCONSTRAINED_VLAN (175227948):
+                PORT_PAIR_UNCONSTRAINED_VLAN means there is no constraint.
+        """
+        UNDEFINED_PORT_PAIR_VLAN = 0
+        PORT_PAIR_MATCHING_VLAN = 250295358
+        PORT_PAIR_UNCONSTRAINED_VLAN = 175227948
+
+    port_pair_remote_location: str = proto.Field(
+        proto.STRING,
+        number=495917351,
+        optional=True,
+    )
+    port_pair_vlan: str = proto.Field(
+        proto.STRING,
+        number=478214506,
+        optional=True,
+    )
+    subnet_length_range: "InterconnectRemoteLocationConstraintsSubnetLengthRange" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=184473670,
+            optional=True,
+            message="InterconnectRemoteLocationConstraintsSubnetLengthRange",
+        )
+    )
+
+
+class InterconnectRemoteLocationConstraintsSubnetLengthRange(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        max_ (int):
+
+            This field is a member of `oneof`_ ``_max``.
+        min_ (int):
+
+            This field is a member of `oneof`_ ``_min``.
+    """
+
+    max_: int = proto.Field(
+        proto.INT32,
+        number=107876,
+        optional=True,
+    )
+    min_: int = proto.Field(
+        proto.INT32,
+        number=108114,
+        optional=True,
+    )
+
+
+class InterconnectRemoteLocationList(proto.Message):
+    r"""Response to the list request, and contains a list of
+    interconnect remote locations.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.InterconnectRemoteLocation]):
+            A list of InterconnectRemoteLocation
+            resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#interconnectRemoteLocationList for lists of
+            interconnect remote locations.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token lets you get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["InterconnectRemoteLocation"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="InterconnectRemoteLocation",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InterconnectRemoteLocationPermittedConnections(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        interconnect_location (str):
+            [Output Only] URL of an Interconnect location that is
+            permitted to connect to this Interconnect remote location.
+
+            This field is a member of `oneof`_ ``_interconnect_location``.
+    """
+
+    interconnect_location: str = proto.Field(
+        proto.STRING,
+        number=492235846,
+        optional=True,
+    )
+
+
+class ListInterconnectRemoteLocationsRequest(proto.Message):
+    r"""A request message for InterconnectRemoteLocations.List. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
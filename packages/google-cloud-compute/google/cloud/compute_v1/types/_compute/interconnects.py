@@ -0,0 +1,1877 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_global_set_labels_request
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteInterconnectRequest",
+        "GetDiagnosticsInterconnectRequest",
+        "GetInterconnectRequest",
+        "GetMacsecConfigInterconnectRequest",
+        "InsertInterconnectRequest",
+        "Interconnect",
+        "InterconnectCircuitInfo",
+        "InterconnectDiagnostics",
+        "InterconnectDiagnosticsARPEntry",
+        "InterconnectDiagnosticsLinkLACPStatus",
+        "InterconnectDiagnosticsLinkOpticalPower",
+        "InterconnectDiagnosticsLinkStatus",
+        "InterconnectDiagnosticsMacsecStatus",
+        "InterconnectList",
+        "InterconnectMacsec",
+        "InterconnectMacsecConfig",
+        "InterconnectMacsecConfigPreSharedKey",
+        "InterconnectMacsecPreSharedKey",
+        "InterconnectOutageNotification",
+        "InterconnectsGetDiagnosticsResponse",
+        "InterconnectsGetMacsecConfigResponse",
+        "ListInterconnectsRequest",
+        "PatchInterconnectRequest",
+        "SetLabelsInterconnectRequest",
+    },
+)
+
+
+class DeleteInterconnectRequest(proto.Message):
+    r"""A request message for Interconnects.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        interconnect (str):
+            Name of the interconnect to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    interconnect: str = proto.Field(
+        proto.STRING,
+        number=224601230,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class GetDiagnosticsInterconnectRequest(proto.Message):
+    r"""A request message for Interconnects.GetDiagnostics. See the
+    method description for details.
+
+    Attributes:
+        interconnect (str):
+            Name of the interconnect resource to query.
+        project (str):
+            Project ID for this request.
+    """
+
+    interconnect: str = proto.Field(
+        proto.STRING,
+        number=224601230,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class GetInterconnectRequest(proto.Message):
+    r"""A request message for Interconnects.Get. See the method
+    description for details.
+
+    Attributes:
+        interconnect (str):
+            Name of the interconnect to return.
+        project (str):
+            Project ID for this request.
+    """
+
+    interconnect: str = proto.Field(
+        proto.STRING,
+        number=224601230,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class GetMacsecConfigInterconnectRequest(proto.Message):
+    r"""A request message for Interconnects.GetMacsecConfig. See the
+    method description for details.
+
+    Attributes:
+        interconnect (str):
+            Name of the interconnect resource to query.
+        project (str):
+            Project ID for this request.
+    """
+
+    interconnect: str = proto.Field(
+        proto.STRING,
+        number=224601230,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class InsertInterconnectRequest(proto.Message):
+    r"""A request message for Interconnects.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        interconnect_resource (google.cloud.compute_v1.types.Interconnect):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    interconnect_resource: "Interconnect" = proto.Field(
+        proto.MESSAGE,
+        number=397611167,
+        message="Interconnect",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class Interconnect(proto.Message):
+    r"""Represents an Interconnect resource. An Interconnect resource
+    is a dedicated connection between the Google Cloud network and
+    your on-premises network. For more information, read the
+    Dedicated Interconnect Overview.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        admin_enabled (bool):
+            Administrative status of the interconnect.
+            When this is set to true, the Interconnect is
+            functional and can carry traffic. When set to
+            false, no packets can be carried over the
+            interconnect and no BGP routes are exchanged
+            over it. By default, the status is set to true.
+
+            This field is a member of `oneof`_ ``_admin_enabled``.
+        available_features (MutableSequence[str]):
+            [Output only] List of features available for this
+            Interconnect connection, which can take one of the following
+            values: - MACSEC If present then the Interconnect connection
+            is provisioned on MACsec capable hardware ports. If not
+            present then the Interconnect connection is provisioned on
+            non-MACsec capable ports and MACsec isn't supported and
+            enabling MACsec fails. Check the AvailableFeatures enum for
+            the list of possible values.
+        circuit_infos (MutableSequence[google.cloud.compute_v1.types.InterconnectCircuitInfo]):
+            [Output Only] A list of CircuitInfo objects, that describe
+            the individual circuits in this LAG.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        customer_name (str):
+            Customer name, to put in the Letter of
+            Authorization as the party authorized to request
+            a crossconnect.
+
+            This field is a member of `oneof`_ ``_customer_name``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        expected_outages (MutableSequence[google.cloud.compute_v1.types.InterconnectOutageNotification]):
+            [Output Only] A list of outages expected for this
+            Interconnect.
+        google_ip_address (str):
+            [Output Only] IP address configured on the Google side of
+            the Interconnect link. This can be used only for ping tests.
+
+            This field is a member of `oneof`_ ``_google_ip_address``.
+        google_reference_id (str):
+            [Output Only] Google reference ID to be used when raising
+            support tickets with Google or otherwise to debug backend
+            connectivity issues.
+
+            This field is a member of `oneof`_ ``_google_reference_id``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        interconnect_attachments (MutableSequence[str]):
+            [Output Only] A list of the URLs of all
+            InterconnectAttachments configured to use this Interconnect.
+        interconnect_type (str):
+            Type of interconnect, which can take one of the following
+            values: - PARTNER: A partner-managed interconnection shared
+            between customers though a partner. - DEDICATED: A dedicated
+            physical interconnection with the customer. Note that a
+            value IT_PRIVATE has been deprecated in favor of DEDICATED.
+            Check the InterconnectType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_interconnect_type``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#interconnect for interconnects.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this Interconnect, which is essentially a hash
+            of the labels set used for optimistic locking.
+            The fingerprint is initially generated by
+            Compute Engine and changes after every request
+            to modify or update labels. You must always
+            provide an up-to-date fingerprint hash in order
+            to update or change labels, otherwise the
+            request will fail with error 412
+            conditionNotMet. To see the latest fingerprint,
+            make a get() request to retrieve an
+            Interconnect.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+            Labels for this resource. These can only be
+            added or modified by the setLabels method. Each
+            label key/value pair must comply with RFC1035.
+            Label values may be empty.
+        link_type (str):
+            Type of link requested, which can take one of the following
+            values: - LINK_TYPE_ETHERNET_10G_LR: A 10G Ethernet with LR
+            optics - LINK_TYPE_ETHERNET_100G_LR: A 100G Ethernet with LR
+            optics. Note that this field indicates the speed of each of
+            the links in the bundle, not the speed of the entire bundle.
+            Check the LinkType enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_link_type``.
+        location (str):
+            URL of the InterconnectLocation object that
+            represents where this connection is to be
+            provisioned.
+
+            This field is a member of `oneof`_ ``_location``.
+        macsec (google.cloud.compute_v1.types.InterconnectMacsec):
+            Configuration that enables Media Access
+            Control security (MACsec) on the Cloud
+            Interconnect connection between Google and your
+            on-premises router.
+
+            This field is a member of `oneof`_ ``_macsec``.
+        macsec_enabled (bool):
+            Enable or disable MACsec on this Interconnect
+            connection. MACsec enablement fails if the
+            MACsec object is not specified.
+
+            This field is a member of `oneof`_ ``_macsec_enabled``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        noc_contact_email (str):
+            Email address to contact the customer NOC for
+            operations and maintenance notifications
+            regarding this Interconnect. If specified, this
+            will be used for notifications in addition to
+            all other forms described, such as Cloud
+            Monitoring logs alerting and Cloud
+            Notifications. This field is required for users
+            who sign up for Cloud Interconnect using
+            workforce identity federation.
+
+            This field is a member of `oneof`_ ``_noc_contact_email``.
+        operational_status (str):
+            [Output Only] The current status of this Interconnect's
+            functionality, which can take one of the following values: -
+            OS_ACTIVE: A valid Interconnect, which is turned up and is
+            ready to use. Attachments may be provisioned on this
+            Interconnect. - OS_UNPROVISIONED: An Interconnect that has
+            not completed turnup. No attachments may be provisioned on
+            this Interconnect. - OS_UNDER_MAINTENANCE: An Interconnect
+            that is undergoing internal maintenance. No attachments may
+            be provisioned or updated on this Interconnect. Check the
+            OperationalStatus enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_operational_status``.
+        peer_ip_address (str):
+            [Output Only] IP address configured on the customer side of
+            the Interconnect link. The customer should configure this IP
+            address during turnup when prompted by Google NOC. This can
+            be used only for ping tests.
+
+            This field is a member of `oneof`_ ``_peer_ip_address``.
+        provisioned_link_count (int):
+            [Output Only] Number of links actually provisioned in this
+            interconnect.
+
+            This field is a member of `oneof`_ ``_provisioned_link_count``.
+        remote_location (str):
+            Indicates that this is a Cross-Cloud
+            Interconnect. This field specifies the location
+            outside of Google's network that the
+            interconnect is connected to.
+
+            This field is a member of `oneof`_ ``_remote_location``.
+        requested_features (MutableSequence[str]):
+            Optional. List of features requested for this
+            Interconnect connection, which can take one of
+            the following values: - MACSEC If specified then
+            the connection is created on MACsec capable
+            hardware ports. If not specified, the default
+            value is false, which allocates non-MACsec
+            capable ports first if available. This parameter
+            can be provided only with Interconnect INSERT.
+            It isn't valid for Interconnect PATCH. Check the
+            RequestedFeatures enum for the list of possible
+            values.
+        requested_link_count (int):
+            Target number of physical links in the link
+            bundle, as requested by the customer.
+
+            This field is a member of `oneof`_ ``_requested_link_count``.
+        satisfies_pzs (bool):
+            [Output Only] Reserved for future use.
+
+            This field is a member of `oneof`_ ``_satisfies_pzs``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        state (str):
+            [Output Only] The current state of Interconnect
+            functionality, which can take one of the following values: -
+            ACTIVE: The Interconnect is valid, turned up and ready to
+            use. Attachments may be provisioned on this Interconnect. -
+            UNPROVISIONED: The Interconnect has not completed turnup. No
+            attachments may be provisioned on this Interconnect. -
+            UNDER_MAINTENANCE: The Interconnect is undergoing internal
+            maintenance. No attachments may be provisioned or updated on
+            this Interconnect. Check the State enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+    """
+
+    class AvailableFeatures(proto.Enum):
+        r"""Additional supported values which may be not listed in the enum
+        directly due to technical reasons: IF_MACSEC
+
+        Values:
+            UNDEFINED_AVAILABLE_FEATURES (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_AVAILABLE_FEATURES = 0
+
+    class InterconnectType(proto.Enum):
+        r"""Type of interconnect, which can take one of the following values: -
+        PARTNER: A partner-managed interconnection shared between customers
+        though a partner. - DEDICATED: A dedicated physical interconnection
+        with the customer. Note that a value IT_PRIVATE has been deprecated
+        in favor of DEDICATED.
+
+        Values:
+            UNDEFINED_INTERCONNECT_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            DEDICATED (258411983):
+                A dedicated physical interconnection with the
+                customer.
+            IT_PRIVATE (335677007):
+                [Deprecated] A private, physical interconnection with the
+                customer.
+            PARTNER (461924520):
+                A partner-managed interconnection shared
+                between customers via partner.
+        """
+        UNDEFINED_INTERCONNECT_TYPE = 0
+        DEDICATED = 258411983
+        IT_PRIVATE = 335677007
+        PARTNER = 461924520
+
+    class LinkType(proto.Enum):
+        r"""Type of link requested, which can take one of the following values:
+        - LINK_TYPE_ETHERNET_10G_LR: A 10G Ethernet with LR optics -
+        LINK_TYPE_ETHERNET_100G_LR: A 100G Ethernet with LR optics. Note
+        that this field indicates the speed of each of the links in the
+        bundle, not the speed of the entire bundle.
+
+        Values:
+            UNDEFINED_LINK_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            LINK_TYPE_ETHERNET_100G_LR (337672551):
+                100G Ethernet, LR Optics.
+            LINK_TYPE_ETHERNET_10G_LR (236739749):
+                10G Ethernet, LR Optics. [(rate_bps) = 10000000000];
+        """
+        UNDEFINED_LINK_TYPE = 0
+        LINK_TYPE_ETHERNET_100G_LR = 337672551
+        LINK_TYPE_ETHERNET_10G_LR = 236739749
+
+    class OperationalStatus(proto.Enum):
+        r"""[Output Only] The current status of this Interconnect's
+        functionality, which can take one of the following values: -
+        OS_ACTIVE: A valid Interconnect, which is turned up and is ready to
+        use. Attachments may be provisioned on this Interconnect. -
+        OS_UNPROVISIONED: An Interconnect that has not completed turnup. No
+        attachments may be provisioned on this Interconnect. -
+        OS_UNDER_MAINTENANCE: An Interconnect that is undergoing internal
+        maintenance. No attachments may be provisioned or updated on this
+        Interconnect.
+
+        Values:
+            UNDEFINED_OPERATIONAL_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            OS_ACTIVE (55721409):
+                The interconnect is valid, turned up, and
+                ready to use. Attachments may be provisioned on
+                this interconnect.
+            OS_UNPROVISIONED (239771840):
+                The interconnect has not completed turnup. No
+                attachments may be provisioned on this
+                interconnect.
+        """
+        UNDEFINED_OPERATIONAL_STATUS = 0
+        OS_ACTIVE = 55721409
+        OS_UNPROVISIONED = 239771840
+
+    class RequestedFeatures(proto.Enum):
+        r"""Additional supported values which may be not listed in the enum
+        directly due to technical reasons: IF_MACSEC
+
+        Values:
+            UNDEFINED_REQUESTED_FEATURES (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_REQUESTED_FEATURES = 0
+
+    class State(proto.Enum):
+        r"""[Output Only] The current state of Interconnect functionality, which
+        can take one of the following values: - ACTIVE: The Interconnect is
+        valid, turned up and ready to use. Attachments may be provisioned on
+        this Interconnect. - UNPROVISIONED: The Interconnect has not
+        completed turnup. No attachments may be provisioned on this
+        Interconnect. - UNDER_MAINTENANCE: The Interconnect is undergoing
+        internal maintenance. No attachments may be provisioned or updated
+        on this Interconnect.
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                The interconnect is valid, turned up, and
+                ready to use. Attachments may be provisioned on
+                this interconnect.
+            UNPROVISIONED (517333979):
+                The interconnect has not completed turnup. No
+                attachments may be provisioned on this
+                interconnect.
+        """
+        UNDEFINED_STATE = 0
+        ACTIVE = 314733318
+        UNPROVISIONED = 517333979
+
+    admin_enabled: bool = proto.Field(
+        proto.BOOL,
+        number=445675089,
+        optional=True,
+    )
+    available_features: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=496344307,
+    )
+    circuit_infos: MutableSequence["InterconnectCircuitInfo"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=164839855,
+        message="InterconnectCircuitInfo",
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    customer_name: str = proto.Field(
+        proto.STRING,
+        number=3665484,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    expected_outages: MutableSequence[
+        "InterconnectOutageNotification"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=264484123,
+        message="InterconnectOutageNotification",
+    )
+    google_ip_address: str = proto.Field(
+        proto.STRING,
+        number=443105954,
+        optional=True,
+    )
+    google_reference_id: str = proto.Field(
+        proto.STRING,
+        number=534944469,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    interconnect_attachments: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=425388415,
+    )
+    interconnect_type: str = proto.Field(
+        proto.STRING,
+        number=515165259,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    link_type: str = proto.Field(
+        proto.STRING,
+        number=523207775,
+        optional=True,
+    )
+    location: str = proto.Field(
+        proto.STRING,
+        number=290430901,
+        optional=True,
+    )
+    macsec: "InterconnectMacsec" = proto.Field(
+        proto.MESSAGE,
+        number=528867490,
+        optional=True,
+        message="InterconnectMacsec",
+    )
+    macsec_enabled: bool = proto.Field(
+        proto.BOOL,
+        number=194203812,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    noc_contact_email: str = proto.Field(
+        proto.STRING,
+        number=14072832,
+        optional=True,
+    )
+    operational_status: str = proto.Field(
+        proto.STRING,
+        number=201070847,
+        optional=True,
+    )
+    peer_ip_address: str = proto.Field(
+        proto.STRING,
+        number=207735769,
+        optional=True,
+    )
+    provisioned_link_count: int = proto.Field(
+        proto.INT32,
+        number=410888565,
+        optional=True,
+    )
+    remote_location: str = proto.Field(
+        proto.STRING,
+        number=324388750,
+        optional=True,
+    )
+    requested_features: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=461240814,
+    )
+    requested_link_count: int = proto.Field(
+        proto.INT32,
+        number=45051387,
+        optional=True,
+    )
+    satisfies_pzs: bool = proto.Field(
+        proto.BOOL,
+        number=480964267,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+
+
+class InterconnectCircuitInfo(proto.Message):
+    r"""Describes a single physical circuit between the Customer and
+    Google. CircuitInfo objects are created by Google, so all fields
+    are output only.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        customer_demarc_id (str):
+            Customer-side demarc ID for this circuit.
+
+            This field is a member of `oneof`_ ``_customer_demarc_id``.
+        google_circuit_id (str):
+            Google-assigned unique ID for this circuit.
+            Assigned at circuit turn-up.
+
+            This field is a member of `oneof`_ ``_google_circuit_id``.
+        google_demarc_id (str):
+            Google-side demarc ID for this circuit.
+            Assigned at circuit turn-up and provided by
+            Google to the customer in the LOA.
+
+            This field is a member of `oneof`_ ``_google_demarc_id``.
+    """
+
+    customer_demarc_id: str = proto.Field(
+        proto.STRING,
+        number=28771859,
+        optional=True,
+    )
+    google_circuit_id: str = proto.Field(
+        proto.STRING,
+        number=262014711,
+        optional=True,
+    )
+    google_demarc_id: str = proto.Field(
+        proto.STRING,
+        number=448196270,
+        optional=True,
+    )
+
+
+class InterconnectDiagnostics(proto.Message):
+    r"""Diagnostics information about the Interconnect connection,
+    which contains detailed and current technical information about
+    Google's side of the connection.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        arp_caches (MutableSequence[google.cloud.compute_v1.types.InterconnectDiagnosticsARPEntry]):
+            A list of InterconnectDiagnostics.ARPEntry
+            objects, describing individual neighbors
+            currently seen by the Google router in the ARP
+            cache for the Interconnect. This will be empty
+            when the Interconnect is not bundled.
+        bundle_aggregation_type (str):
+            The aggregation type of the bundle interface.
+            Check the BundleAggregationType enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_bundle_aggregation_type``.
+        bundle_operational_status (str):
+            The operational status of the bundle
+            interface. Check the BundleOperationalStatus
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_bundle_operational_status``.
+        links (MutableSequence[google.cloud.compute_v1.types.InterconnectDiagnosticsLinkStatus]):
+            A list of InterconnectDiagnostics.LinkStatus
+            objects, describing the status for each link on
+            the Interconnect.
+        mac_address (str):
+            The MAC address of the Interconnect's bundle
+            interface.
+
+            This field is a member of `oneof`_ ``_mac_address``.
+    """
+
+    class BundleAggregationType(proto.Enum):
+        r"""The aggregation type of the bundle interface.
+
+        Values:
+            UNDEFINED_BUNDLE_AGGREGATION_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            BUNDLE_AGGREGATION_TYPE_LACP (27758925):
+                LACP is enabled.
+            BUNDLE_AGGREGATION_TYPE_STATIC (50678873):
+                LACP is disabled.
+        """
+        UNDEFINED_BUNDLE_AGGREGATION_TYPE = 0
+        BUNDLE_AGGREGATION_TYPE_LACP = 27758925
+        BUNDLE_AGGREGATION_TYPE_STATIC = 50678873
+
+    class BundleOperationalStatus(proto.Enum):
+        r"""The operational status of the bundle interface.
+
+        Values:
+            UNDEFINED_BUNDLE_OPERATIONAL_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            BUNDLE_OPERATIONAL_STATUS_DOWN (453842693):
+                If bundleAggregationType is LACP: LACP is not
+                established and/or all links in the bundle have
+                DOWN operational status. If
+                bundleAggregationType is STATIC: one or more
+                links in the bundle has DOWN operational status.
+            BUNDLE_OPERATIONAL_STATUS_UP (161366462):
+                If bundleAggregationType is LACP: LACP is
+                established and at least one link in the bundle
+                has UP operational status. If
+                bundleAggregationType is STATIC: all links in
+                the bundle (typically just one) have UP
+                operational status.
+        """
+        UNDEFINED_BUNDLE_OPERATIONAL_STATUS = 0
+        BUNDLE_OPERATIONAL_STATUS_DOWN = 453842693
+        BUNDLE_OPERATIONAL_STATUS_UP = 161366462
+
+    arp_caches: MutableSequence[
+        "InterconnectDiagnosticsARPEntry"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=414591761,
+        message="InterconnectDiagnosticsARPEntry",
+    )
+    bundle_aggregation_type: str = proto.Field(
+        proto.STRING,
+        number=434939028,
+        optional=True,
+    )
+    bundle_operational_status: str = proto.Field(
+        proto.STRING,
+        number=106433500,
+        optional=True,
+    )
+    links: MutableSequence["InterconnectDiagnosticsLinkStatus"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=102977465,
+        message="InterconnectDiagnosticsLinkStatus",
+    )
+    mac_address: str = proto.Field(
+        proto.STRING,
+        number=332540164,
+        optional=True,
+    )
+
+
+class InterconnectDiagnosticsARPEntry(proto.Message):
+    r"""Describing the ARP neighbor entries seen on this link
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ip_address (str):
+            The IP address of this ARP neighbor.
+
+            This field is a member of `oneof`_ ``_ip_address``.
+        mac_address (str):
+            The MAC address of this ARP neighbor.
+
+            This field is a member of `oneof`_ ``_mac_address``.
+    """
+
+    ip_address: str = proto.Field(
+        proto.STRING,
+        number=406272220,
+        optional=True,
+    )
+    mac_address: str = proto.Field(
+        proto.STRING,
+        number=332540164,
+        optional=True,
+    )
+
+
+class InterconnectDiagnosticsLinkLACPStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        google_system_id (str):
+            System ID of the port on Google's side of the
+            LACP exchange.
+
+            This field is a member of `oneof`_ ``_google_system_id``.
+        neighbor_system_id (str):
+            System ID of the port on the neighbor's side
+            of the LACP exchange.
+
+            This field is a member of `oneof`_ ``_neighbor_system_id``.
+        state (str):
+            The state of a LACP link, which can take one
+            of the following values: - ACTIVE: The link is
+            configured and active within the bundle. -
+            DETACHED: The link is not configured within the
+            bundle. This means that the rest of the object
+            should be empty. Check the State enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+    """
+
+    class State(proto.Enum):
+        r"""The state of a LACP link, which can take one of the following
+        values: - ACTIVE: The link is configured and active within the
+        bundle. - DETACHED: The link is not configured within the
+        bundle. This means that the rest of the object should be empty.
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                The link is configured and active within the
+                bundle.
+            DETACHED (216562546):
+                The link is not configured within the bundle,
+                this means the rest of the object should be
+                empty.
+        """
+        UNDEFINED_STATE = 0
+        ACTIVE = 314733318
+        DETACHED = 216562546
+
+    google_system_id: str = proto.Field(
+        proto.STRING,
+        number=91210405,
+        optional=True,
+    )
+    neighbor_system_id: str = proto.Field(
+        proto.STRING,
+        number=343821342,
+        optional=True,
+    )
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+
+
+class InterconnectDiagnosticsLinkOpticalPower(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        state (str):
+            The status of the current value when compared to the warning
+            and alarm levels for the receiving or transmitting
+            transceiver. Possible states include: - OK: The value has
+            not crossed a warning threshold. - LOW_WARNING: The value
+            has crossed below the low warning threshold. - HIGH_WARNING:
+            The value has crossed above the high warning threshold. -
+            LOW_ALARM: The value has crossed below the low alarm
+            threshold. - HIGH_ALARM: The value has crossed above the
+            high alarm threshold. Check the State enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+        value (float):
+            Value of the current receiving or
+            transmitting optical power, read in dBm. Take a
+            known good optical value, give it a 10% margin
+            and trigger warnings relative to that value. In
+            general, a -7dBm warning and a -11dBm alarm are
+            good optical value estimates for most links.
+
+            This field is a member of `oneof`_ ``_value``.
+    """
+
+    class State(proto.Enum):
+        r"""The status of the current value when compared to the warning and
+        alarm levels for the receiving or transmitting transceiver. Possible
+        states include: - OK: The value has not crossed a warning threshold.
+        - LOW_WARNING: The value has crossed below the low warning
+        threshold. - HIGH_WARNING: The value has crossed above the high
+        warning threshold. - LOW_ALARM: The value has crossed below the low
+        alarm threshold. - HIGH_ALARM: The value has crossed above the high
+        alarm threshold.
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            HIGH_ALARM (305363284):
+                The value has crossed above the high alarm
+                threshold.
+            HIGH_WARNING (220984799):
+                The value of the current optical power has
+                crossed above the high warning threshold.
+            LOW_ALARM (316659046):
+                The value of the current optical power has
+                crossed below the low alarm threshold.
+            LOW_WARNING (338793841):
+                The value of the current optical power has
+                crossed below the low warning threshold.
+            OK (2524):
+                The value of the current optical power has
+                not crossed a warning threshold.
+        """
+        UNDEFINED_STATE = 0
+        HIGH_ALARM = 305363284
+        HIGH_WARNING = 220984799
+        LOW_ALARM = 316659046
+        LOW_WARNING = 338793841
+        OK = 2524
+
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+    value: float = proto.Field(
+        proto.FLOAT,
+        number=111972721,
+        optional=True,
+    )
+
+
+class InterconnectDiagnosticsLinkStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        arp_caches (MutableSequence[google.cloud.compute_v1.types.InterconnectDiagnosticsARPEntry]):
+            A list of InterconnectDiagnostics.ARPEntry
+            objects, describing the ARP neighbor entries
+            seen on this link. This will be empty if the
+            link is bundled
+        circuit_id (str):
+            The unique ID for this link assigned during
+            turn up by Google.
+
+            This field is a member of `oneof`_ ``_circuit_id``.
+        google_demarc (str):
+            The Demarc address assigned by Google and
+            provided in the LoA.
+
+            This field is a member of `oneof`_ ``_google_demarc``.
+        lacp_status (google.cloud.compute_v1.types.InterconnectDiagnosticsLinkLACPStatus):
+
+            This field is a member of `oneof`_ ``_lacp_status``.
+        macsec (google.cloud.compute_v1.types.InterconnectDiagnosticsMacsecStatus):
+            Describes the status of MACsec encryption on
+            this link.
+
+            This field is a member of `oneof`_ ``_macsec``.
+        operational_status (str):
+            The operational status of the link.
+            Check the OperationalStatus enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_operational_status``.
+        receiving_optical_power (google.cloud.compute_v1.types.InterconnectDiagnosticsLinkOpticalPower):
+            An InterconnectDiagnostics.LinkOpticalPower
+            object, describing the current value and status
+            of the received light level.
+
+            This field is a member of `oneof`_ ``_receiving_optical_power``.
+        transmitting_optical_power (google.cloud.compute_v1.types.InterconnectDiagnosticsLinkOpticalPower):
+            An InterconnectDiagnostics.LinkOpticalPower
+            object, describing the current value and status
+            of the transmitted light level.
+
+            This field is a member of `oneof`_ ``_transmitting_optical_power``.
+    """
+
+    class OperationalStatus(proto.Enum):
+        r"""The operational status of the link.
+
+        Values:
+            UNDEFINED_OPERATIONAL_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            LINK_OPERATIONAL_STATUS_DOWN (281653885):
+                The interface is unable to communicate with
+                the remote end.
+            LINK_OPERATIONAL_STATUS_UP (305879862):
+                The interface has low level communication
+                with the remote end.
+        """
+        UNDEFINED_OPERATIONAL_STATUS = 0
+        LINK_OPERATIONAL_STATUS_DOWN = 281653885
+        LINK_OPERATIONAL_STATUS_UP = 305879862
+
+    arp_caches: MutableSequence[
+        "InterconnectDiagnosticsARPEntry"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=414591761,
+        message="InterconnectDiagnosticsARPEntry",
+    )
+    circuit_id: str = proto.Field(
+        proto.STRING,
+        number=225180977,
+        optional=True,
+    )
+    google_demarc: str = proto.Field(
+        proto.STRING,
+        number=51084,
+        optional=True,
+    )
+    lacp_status: "InterconnectDiagnosticsLinkLACPStatus" = proto.Field(
+        proto.MESSAGE,
+        number=361210415,
+        optional=True,
+        message="InterconnectDiagnosticsLinkLACPStatus",
+    )
+    macsec: "InterconnectDiagnosticsMacsecStatus" = proto.Field(
+        proto.MESSAGE,
+        number=528867490,
+        optional=True,
+        message="InterconnectDiagnosticsMacsecStatus",
+    )
+    operational_status: str = proto.Field(
+        proto.STRING,
+        number=201070847,
+        optional=True,
+    )
+    receiving_optical_power: "InterconnectDiagnosticsLinkOpticalPower" = proto.Field(
+        proto.MESSAGE,
+        number=244717279,
+        optional=True,
+        message="InterconnectDiagnosticsLinkOpticalPower",
+    )
+    transmitting_optical_power: "InterconnectDiagnosticsLinkOpticalPower" = proto.Field(
+        proto.MESSAGE,
+        number=459431197,
+        optional=True,
+        message="InterconnectDiagnosticsLinkOpticalPower",
+    )
+
+
+class InterconnectDiagnosticsMacsecStatus(proto.Message):
+    r"""Describes the status of MACsec encryption on the link.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ckn (str):
+            Indicates the Connectivity Association Key
+            Name (CKN) currently being used if MACsec is
+            operational.
+
+            This field is a member of `oneof`_ ``_ckn``.
+        operational (bool):
+            Indicates whether or not MACsec is
+            operational on this link.
+
+            This field is a member of `oneof`_ ``_operational``.
+    """
+
+    ckn: str = proto.Field(
+        proto.STRING,
+        number=98566,
+        optional=True,
+    )
+    operational: bool = proto.Field(
+        proto.BOOL,
+        number=129704914,
+        optional=True,
+    )
+
+
+class InterconnectList(proto.Message):
+    r"""Response to the list request, and contains a list of
+    interconnects.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.Interconnect]):
+            A list of Interconnect resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#interconnectList for lists of interconnects.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["Interconnect"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="Interconnect",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class InterconnectMacsec(proto.Message):
+    r"""Configuration information for enabling Media Access Control
+    security (MACsec) on this Cloud Interconnect connection between
+    Google and your on-premises router.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        fail_open (bool):
+            If set to true, the Interconnect connection
+            is configured with a should-secure MACsec
+            security policy, that allows the Google router
+            to fallback to cleartext traffic if the MKA
+            session cannot be established. By default, the
+            Interconnect connection is configured with a
+            must-secure security policy that drops all
+            traffic if the MKA session cannot be established
+            with your router.
+
+            This field is a member of `oneof`_ ``_fail_open``.
+        pre_shared_keys (MutableSequence[google.cloud.compute_v1.types.InterconnectMacsecPreSharedKey]):
+            Required. A keychain placeholder describing a
+            set of named key objects along with their start
+            times. A MACsec CKN/CAK is generated for each
+            key in the key chain. Google router
+            automatically picks the key with the most recent
+            startTime when establishing or re-establishing a
+            MACsec secure link.
+    """
+
+    fail_open: bool = proto.Field(
+        proto.BOOL,
+        number=532597451,
+        optional=True,
+    )
+    pre_shared_keys: MutableSequence[
+        "InterconnectMacsecPreSharedKey"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=420308466,
+        message="InterconnectMacsecPreSharedKey",
+    )
+
+
+class InterconnectMacsecConfig(proto.Message):
+    r"""MACsec configuration information for the Interconnect
+    connection. Contains the generated Connectivity Association Key
+    Name (CKN) and the key (CAK) for this Interconnect connection.
+
+    Attributes:
+        pre_shared_keys (MutableSequence[google.cloud.compute_v1.types.InterconnectMacsecConfigPreSharedKey]):
+            A keychain placeholder describing a set of
+            named key objects along with their start times.
+            A MACsec CKN/CAK is generated for each key in
+            the key chain. Google router automatically picks
+            the key with the most recent startTime when
+            establishing or re-establishing a MACsec secure
+            link.
+    """
+
+    pre_shared_keys: MutableSequence[
+        "InterconnectMacsecConfigPreSharedKey"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=420308466,
+        message="InterconnectMacsecConfigPreSharedKey",
+    )
+
+
+class InterconnectMacsecConfigPreSharedKey(proto.Message):
+    r"""Describes a pre-shared key used to setup MACsec in static
+    connectivity association key (CAK) mode.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        cak (str):
+            An auto-generated Connectivity Association
+            Key (CAK) for this key.
+
+            This field is a member of `oneof`_ ``_cak``.
+        ckn (str):
+            An auto-generated Connectivity Association
+            Key Name (CKN) for this key.
+
+            This field is a member of `oneof`_ ``_ckn``.
+        name (str):
+            User provided name for this pre-shared key.
+
+            This field is a member of `oneof`_ ``_name``.
+        start_time (str):
+            User provided timestamp on or after which
+            this key is valid.
+
+            This field is a member of `oneof`_ ``_start_time``.
+    """
+
+    cak: str = proto.Field(
+        proto.STRING,
+        number=98253,
+        optional=True,
+    )
+    ckn: str = proto.Field(
+        proto.STRING,
+        number=98566,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    start_time: str = proto.Field(
+        proto.STRING,
+        number=37467274,
+        optional=True,
+    )
+
+
+class InterconnectMacsecPreSharedKey(proto.Message):
+    r"""Describes a pre-shared key used to setup MACsec in static
+    connectivity association key (CAK) mode.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            Required. A name for this pre-shared key. The name must be
+            1-63 characters long, and comply with RFC1035. Specifically,
+            the name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        start_time (str):
+            A RFC3339 timestamp on or after which the key
+            is valid. startTime can be in the future. If the
+            keychain has a single key, startTime can be
+            omitted. If the keychain has multiple keys,
+            startTime is mandatory for each key. The start
+            times of keys must be in increasing order. The
+            start times of two consecutive keys must be at
+            least 6 hours apart.
+
+            This field is a member of `oneof`_ ``_start_time``.
+    """
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    start_time: str = proto.Field(
+        proto.STRING,
+        number=37467274,
+        optional=True,
+    )
+
+
+class InterconnectOutageNotification(proto.Message):
+    r"""Description of a planned outage on this Interconnect.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        affected_circuits (MutableSequence[str]):
+            If issue_type is IT_PARTIAL_OUTAGE, a list of the
+            Google-side circuit IDs that will be affected.
+        description (str):
+            A description about the purpose of the
+            outage.
+
+            This field is a member of `oneof`_ ``_description``.
+        end_time (int):
+            Scheduled end time for the outage
+            (milliseconds since Unix epoch).
+
+            This field is a member of `oneof`_ ``_end_time``.
+        issue_type (str):
+            Form this outage is expected to take, which can take one of
+            the following values: - OUTAGE: The Interconnect may be
+            completely out of service for some or all of the specified
+            window. - PARTIAL_OUTAGE: Some circuits comprising the
+            Interconnect as a whole should remain up, but with reduced
+            bandwidth. Note that the versions of this enum prefixed with
+            `IT_` have been deprecated in favor of the unprefixed
+            values. Check the IssueType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_issue_type``.
+        name (str):
+            Unique identifier for this outage
+            notification.
+
+            This field is a member of `oneof`_ ``_name``.
+        source (str):
+            The party that generated this notification, which can take
+            the following value: - GOOGLE: this notification as
+            generated by Google. Note that the value of NSRC_GOOGLE has
+            been deprecated in favor of GOOGLE. Check the Source enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_source``.
+        start_time (int):
+            Scheduled start time for the outage
+            (milliseconds since Unix epoch).
+
+            This field is a member of `oneof`_ ``_start_time``.
+        state (str):
+            State of this notification, which can take one of the
+            following values: - ACTIVE: This outage notification is
+            active. The event could be in the past, present, or future.
+            See start_time and end_time for scheduling. - CANCELLED: The
+            outage associated with this notification was cancelled
+            before the outage was due to start. - COMPLETED: The outage
+            associated with this notification is complete. Note that the
+            versions of this enum prefixed with `NS_` have been
+            deprecated in favor of the unprefixed values. Check the
+            State enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+    """
+
+    class IssueType(proto.Enum):
+        r"""Form this outage is expected to take, which can take one of the
+        following values: - OUTAGE: The Interconnect may be completely out
+        of service for some or all of the specified window. -
+        PARTIAL_OUTAGE: Some circuits comprising the Interconnect as a whole
+        should remain up, but with reduced bandwidth. Note that the versions
+        of this enum prefixed with `IT_` have been deprecated in favor of
+        the unprefixed values.
+
+        Values:
+            UNDEFINED_ISSUE_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            IT_OUTAGE (175779973):
+                [Deprecated] The Interconnect may be completely out of
+                service for some or all of the specified window.
+            IT_PARTIAL_OUTAGE (92103971):
+                [Deprecated] Some circuits comprising the Interconnect will
+                be out of service during the expected window. The
+                interconnect as a whole should remain up, albeit with
+                reduced bandwidth.
+            OUTAGE (195285745):
+                The Interconnect may be completely out of
+                service for some or all of the specified window.
+            PARTIAL_OUTAGE (147053455):
+                Some circuits comprising the Interconnect
+                will be out of service during the expected
+                window. The interconnect as a whole should
+                remain up, albeit with reduced bandwidth.
+        """
+        UNDEFINED_ISSUE_TYPE = 0
+        IT_OUTAGE = 175779973
+        IT_PARTIAL_OUTAGE = 92103971
+        OUTAGE = 195285745
+        PARTIAL_OUTAGE = 147053455
+
+    class Source(proto.Enum):
+        r"""The party that generated this notification, which can take the
+        following value: - GOOGLE: this notification as generated by Google.
+        Note that the value of NSRC_GOOGLE has been deprecated in favor of
+        GOOGLE.
+
+        Values:
+            UNDEFINED_SOURCE (0):
+                A value indicating that the enum field is not
+                set.
+            GOOGLE (497439289):
+                This notification was generated by Google.
+            NSRC_GOOGLE (510574562):
+                [Deprecated] This notification was generated by Google.
+        """
+        UNDEFINED_SOURCE = 0
+        GOOGLE = 497439289
+        NSRC_GOOGLE = 510574562
+
+    class State(proto.Enum):
+        r"""State of this notification, which can take one of the following
+        values: - ACTIVE: This outage notification is active. The event
+        could be in the past, present, or future. See start_time and
+        end_time for scheduling. - CANCELLED: The outage associated with
+        this notification was cancelled before the outage was due to start.
+        - COMPLETED: The outage associated with this notification is
+        complete. Note that the versions of this enum prefixed with `NS_`
+        have been deprecated in favor of the unprefixed values.
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                This outage notification is active. The event could be in
+                the future, present, or past. See start_time and end_time
+                for scheduling.
+            CANCELLED (41957681):
+                The outage associated with this notification
+                was cancelled before the outage was due to
+                start.
+            COMPLETED (309921323):
+                The outage associated with this notification
+                is complete.
+            NS_ACTIVE (252563136):
+                [Deprecated] This outage notification is active. The event
+                could be in the future, present, or past. See start_time and
+                end_time for scheduling.
+            NS_CANCELED (506579411):
+                [Deprecated] The outage associated with this notification
+                was canceled before the outage was due to start.
+        """
+        UNDEFINED_STATE = 0
+        ACTIVE = 314733318
+        CANCELLED = 41957681
+        COMPLETED = 309921323
+        NS_ACTIVE = 252563136
+        NS_CANCELED = 506579411
+
+    affected_circuits: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=177717013,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    end_time: int = proto.Field(
+        proto.INT64,
+        number=114938801,
+        optional=True,
+    )
+    issue_type: str = proto.Field(
+        proto.STRING,
+        number=369639136,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    source: str = proto.Field(
+        proto.STRING,
+        number=177235995,
+        optional=True,
+    )
+    start_time: int = proto.Field(
+        proto.INT64,
+        number=37467274,
+        optional=True,
+    )
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+
+
+class InterconnectsGetDiagnosticsResponse(proto.Message):
+    r"""Response for the InterconnectsGetDiagnosticsRequest.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        result (google.cloud.compute_v1.types.InterconnectDiagnostics):
+
+            This field is a member of `oneof`_ ``_result``.
+    """
+
+    result: "InterconnectDiagnostics" = proto.Field(
+        proto.MESSAGE,
+        number=139315229,
+        optional=True,
+        message="InterconnectDiagnostics",
+    )
+
+
+class InterconnectsGetMacsecConfigResponse(proto.Message):
+    r"""Response for the InterconnectsGetMacsecConfigRequest.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        etag (str):
+            end_interface: MixerGetResponseWithEtagBuilder
+
+            This field is a member of `oneof`_ ``_etag``.
+        result (google.cloud.compute_v1.types.InterconnectMacsecConfig):
+
+            This field is a member of `oneof`_ ``_result``.
+    """
+
+    etag: str = proto.Field(
+        proto.STRING,
+        number=3123477,
+        optional=True,
+    )
+    result: "InterconnectMacsecConfig" = proto.Field(
+        proto.MESSAGE,
+        number=139315229,
+        optional=True,
+        message="InterconnectMacsecConfig",
+    )
+
+
+class ListInterconnectsRequest(proto.Message):
+    r"""A request message for Interconnects.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class PatchInterconnectRequest(proto.Message):
+    r"""A request message for Interconnects.Patch. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        interconnect (str):
+            Name of the interconnect to update.
+        interconnect_resource (google.cloud.compute_v1.types.Interconnect):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    interconnect: str = proto.Field(
+        proto.STRING,
+        number=224601230,
+    )
+    interconnect_resource: "Interconnect" = proto.Field(
+        proto.MESSAGE,
+        number=397611167,
+        message="Interconnect",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class SetLabelsInterconnectRequest(proto.Message):
+    r"""A request message for Interconnects.SetLabels. See the method
+    description for details.
+
+    Attributes:
+        global_set_labels_request_resource (google.cloud.compute_v1.types.GlobalSetLabelsRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    global_set_labels_request_resource: shared_global_set_labels_request.GlobalSetLabelsRequest = proto.Field(
+        proto.MESSAGE,
+        number=319917189,
+        message=shared_global_set_labels_request.GlobalSetLabelsRequest,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,1306 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_accelerator_config
+from google.cloud.compute_v1.types._compute import shared_customer_encryption_key
+from google.cloud.compute_v1.types._compute import shared_global_set_policy_request
+from google.cloud.compute_v1.types._compute import shared_metadata
+from google.cloud.compute_v1.types._compute import shared_network_interface
+from google.cloud.compute_v1.types._compute import shared_test_permissions_request
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteMachineImageRequest",
+        "GetIamPolicyMachineImageRequest",
+        "GetMachineImageRequest",
+        "InsertMachineImageRequest",
+        "ListMachineImagesRequest",
+        "MachineImage",
+        "MachineImageList",
+        "SavedAttachedDisk",
+        "SavedDisk",
+        "SetIamPolicyMachineImageRequest",
+        "SourceDiskEncryptionKey",
+        "SourceInstanceProperties",
+        "TestIamPermissionsMachineImageRequest",
+    },
+)
+
+
+class DeleteMachineImageRequest(proto.Message):
+    r"""A request message for MachineImages.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        machine_image (str):
+            The name of the machine image to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    machine_image: str = proto.Field(
+        proto.STRING,
+        number=69189475,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class GetIamPolicyMachineImageRequest(proto.Message):
+    r"""A request message for MachineImages.GetIamPolicy. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version: int = proto.Field(
+        proto.INT32,
+        number=499220029,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class GetMachineImageRequest(proto.Message):
+    r"""A request message for MachineImages.Get. See the method
+    description for details.
+
+    Attributes:
+        machine_image (str):
+            The name of the machine image.
+        project (str):
+            Project ID for this request.
+    """
+
+    machine_image: str = proto.Field(
+        proto.STRING,
+        number=69189475,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class InsertMachineImageRequest(proto.Message):
+    r"""A request message for MachineImages.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        machine_image_resource (google.cloud.compute_v1.types.MachineImage):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        source_instance (str):
+            Required. Source instance that is used to
+            create the machine image from.
+
+            This field is a member of `oneof`_ ``_source_instance``.
+    """
+
+    machine_image_resource: "MachineImage" = proto.Field(
+        proto.MESSAGE,
+        number=60740970,
+        message="MachineImage",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    source_instance: str = proto.Field(
+        proto.STRING,
+        number=396315705,
+        optional=True,
+    )
+
+
+class ListMachineImagesRequest(proto.Message):
+    r"""A request message for MachineImages.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class MachineImage(proto.Message):
+    r"""Represents a machine image resource. A machine image is a
+    Compute Engine resource that stores all the configuration,
+    metadata, permissions, and data from one or more disks required
+    to create a Virtual machine (VM) instance. For more information,
+    see Machine images.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] The creation timestamp for this machine image
+            in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        guest_flush (bool):
+            [Input Only] Whether to attempt an application consistent
+            machine image by informing the OS to prepare for the
+            snapshot process.
+
+            This field is a member of `oneof`_ ``_guest_flush``.
+        id (int):
+            [Output Only] A unique identifier for this machine image.
+            The server defines this identifier.
+
+            This field is a member of `oneof`_ ``_id``.
+        instance_properties (google.cloud.compute_v1.types.InstanceProperties):
+            [Output Only] Properties of source instance
+
+            This field is a member of `oneof`_ ``_instance_properties``.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#machineImage for machine image.
+
+            This field is a member of `oneof`_ ``_kind``.
+        machine_image_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            Encrypts the machine image using a
+            customer-supplied encryption key. After you
+            encrypt a machine image using a
+            customer-supplied key, you must provide the same
+            key if you use the machine image later. For
+            example, you must provide the encryption key
+            when you create an instance from the encrypted
+            machine image in a future request.
+            Customer-supplied encryption keys do not protect
+            access to metadata of the machine image. If you
+            do not provide an encryption key when creating
+            the machine image, then the machine image will
+            be encrypted using an automatically generated
+            key and you do not need to provide a key to use
+            the machine image later.
+
+            This field is a member of `oneof`_ ``_machine_image_encryption_key``.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        satisfies_pzs (bool):
+            [Output Only] Reserved for future use.
+
+            This field is a member of `oneof`_ ``_satisfies_pzs``.
+        saved_disks (MutableSequence[google.cloud.compute_v1.types.SavedDisk]):
+            An array of Machine Image specific properties
+            for disks attached to the source instance
+        self_link (str):
+            [Output Only] The URL for this machine image. The server
+            defines this URL.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        source_disk_encryption_keys (MutableSequence[google.cloud.compute_v1.types.SourceDiskEncryptionKey]):
+            [Input Only] The customer-supplied encryption key of the
+            disks attached to the source instance. Required if the
+            source disk is protected by a customer-supplied encryption
+            key.
+        source_instance (str):
+            The source instance used to create the
+            machine image. You can provide this as a partial
+            or full URL to the resource. For example, the
+            following are valid values: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /instances/instance -
+            projects/project/zones/zone/instances/instance
+
+            This field is a member of `oneof`_ ``_source_instance``.
+        source_instance_properties (google.cloud.compute_v1.types.SourceInstanceProperties):
+            [Output Only] DEPRECATED: Please use instance_properties
+            instead for source instance related properties. New
+            properties will not be added to this field.
+
+            This field is a member of `oneof`_ ``_source_instance_properties``.
+        status (str):
+            [Output Only] The status of the machine image. One of the
+            following values: INVALID, CREATING, READY, DELETING, and
+            UPLOADING. Check the Status enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_status``.
+        storage_locations (MutableSequence[str]):
+            The regional or multi-regional Cloud Storage
+            bucket location where the machine image is
+            stored.
+        total_storage_bytes (int):
+            [Output Only] Total size of the storage used by the machine
+            image.
+
+            This field is a member of `oneof`_ ``_total_storage_bytes``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the machine image. One of the following
+        values: INVALID, CREATING, READY, DELETING, and UPLOADING.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            CREATING (455564985):
+                No description available.
+            DELETING (528602024):
+                No description available.
+            INVALID (530283991):
+                No description available.
+            READY (77848963):
+                No description available.
+            UPLOADING (267603489):
+                No description available.
+        """
+        UNDEFINED_STATUS = 0
+        CREATING = 455564985
+        DELETING = 528602024
+        INVALID = 530283991
+        READY = 77848963
+        UPLOADING = 267603489
+
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    guest_flush: bool = proto.Field(
+        proto.BOOL,
+        number=385550813,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    instance_properties: shared_network_interface.InstanceProperties = proto.Field(
+        proto.MESSAGE,
+        number=215355165,
+        optional=True,
+        message=shared_network_interface.InstanceProperties,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    machine_image_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = proto.Field(
+        proto.MESSAGE,
+        number=528089087,
+        optional=True,
+        message=shared_customer_encryption_key.CustomerEncryptionKey,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    satisfies_pzs: bool = proto.Field(
+        proto.BOOL,
+        number=480964267,
+        optional=True,
+    )
+    saved_disks: MutableSequence["SavedDisk"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=397424318,
+        message="SavedDisk",
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    source_disk_encryption_keys: MutableSequence[
+        "SourceDiskEncryptionKey"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=370408498,
+        message="SourceDiskEncryptionKey",
+    )
+    source_instance: str = proto.Field(
+        proto.STRING,
+        number=396315705,
+        optional=True,
+    )
+    source_instance_properties: "SourceInstanceProperties" = proto.Field(
+        proto.MESSAGE,
+        number=475195641,
+        optional=True,
+        message="SourceInstanceProperties",
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    storage_locations: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=328005274,
+    )
+    total_storage_bytes: int = proto.Field(
+        proto.INT64,
+        number=81855468,
+        optional=True,
+    )
+
+
+class MachineImageList(proto.Message):
+    r"""A list of machine images.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.MachineImage]):
+            A list of MachineImage resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#machineImagesListResponse for machine image lists.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["MachineImage"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="MachineImage",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class SavedAttachedDisk(proto.Message):
+    r"""DEPRECATED: Please use compute#savedDisk instead. An
+    instance-attached disk resource.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_delete (bool):
+            Specifies whether the disk will be
+            auto-deleted when the instance is deleted (but
+            not when the disk is detached from the
+            instance).
+
+            This field is a member of `oneof`_ ``_auto_delete``.
+        boot (bool):
+            Indicates that this is a boot disk. The
+            virtual machine will use the first partition of
+            the disk for its root filesystem.
+
+            This field is a member of `oneof`_ ``_boot``.
+        device_name (str):
+            Specifies the name of the disk attached to
+            the source instance.
+
+            This field is a member of `oneof`_ ``_device_name``.
+        disk_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The encryption key for the disk.
+
+            This field is a member of `oneof`_ ``_disk_encryption_key``.
+        disk_size_gb (int):
+            The size of the disk in base-2 GB.
+
+            This field is a member of `oneof`_ ``_disk_size_gb``.
+        disk_type (str):
+            [Output Only] URL of the disk type resource. For example:
+            projects/project /zones/zone/diskTypes/pd-standard or pd-ssd
+
+            This field is a member of `oneof`_ ``_disk_type``.
+        guest_os_features (MutableSequence[google.cloud.compute_v1.types.GuestOsFeature]):
+            A list of features to enable on the guest
+            operating system. Applicable only for bootable
+            images. Read Enabling guest operating system
+            features to see a list of available options.
+        index (int):
+            Specifies zero-based index of the disk that
+            is attached to the source instance.
+
+            This field is a member of `oneof`_ ``_index``.
+        interface (str):
+            Specifies the disk interface to use for
+            attaching this disk, which is either SCSI or
+            NVME. Check the Interface enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_interface``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#attachedDisk for attached disks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        licenses (MutableSequence[str]):
+            [Output Only] Any valid publicly visible licenses.
+        mode (str):
+            The mode in which this disk is attached to the source
+            instance, either READ_WRITE or READ_ONLY. Check the Mode
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_mode``.
+        source (str):
+            Specifies a URL of the disk attached to the
+            source instance.
+
+            This field is a member of `oneof`_ ``_source``.
+        storage_bytes (int):
+            [Output Only] A size of the storage used by the disk's
+            snapshot by this machine image.
+
+            This field is a member of `oneof`_ ``_storage_bytes``.
+        storage_bytes_status (str):
+            [Output Only] An indicator whether storageBytes is in a
+            stable state or it is being adjusted as a result of shared
+            storage reallocation. This status can either be UPDATING,
+            meaning the size of the snapshot is being updated, or
+            UP_TO_DATE, meaning the size of the snapshot is up-to-date.
+            Check the StorageBytesStatus enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_storage_bytes_status``.
+        type_ (str):
+            Specifies the type of the attached disk,
+            either SCRATCH or PERSISTENT. Check the Type
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Interface(proto.Enum):
+        r"""Specifies the disk interface to use for attaching this disk,
+        which is either SCSI or NVME.
+
+        Values:
+            UNDEFINED_INTERFACE (0):
+                A value indicating that the enum field is not
+                set.
+            NVME (2408800):
+                No description available.
+            SCSI (2539686):
+                No description available.
+        """
+        UNDEFINED_INTERFACE = 0
+        NVME = 2408800
+        SCSI = 2539686
+
+    class Mode(proto.Enum):
+        r"""The mode in which this disk is attached to the source instance,
+        either READ_WRITE or READ_ONLY.
+
+        Values:
+            UNDEFINED_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            READ_ONLY (91950261):
+                Attaches this disk in read-only mode.
+                Multiple virtual machines can use a disk in
+                read-only mode at a time.
+            READ_WRITE (173607894):
+                *[Default]* Attaches this disk in read-write mode. Only one
+                virtual machine at a time can be attached to a disk in
+                read-write mode.
+        """
+        UNDEFINED_MODE = 0
+        READ_ONLY = 91950261
+        READ_WRITE = 173607894
+
+    class StorageBytesStatus(proto.Enum):
+        r"""[Output Only] An indicator whether storageBytes is in a stable state
+        or it is being adjusted as a result of shared storage reallocation.
+        This status can either be UPDATING, meaning the size of the snapshot
+        is being updated, or UP_TO_DATE, meaning the size of the snapshot is
+        up-to-date.
+
+        Values:
+            UNDEFINED_STORAGE_BYTES_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            UPDATING (494614342):
+                No description available.
+            UP_TO_DATE (101306702):
+                No description available.
+        """
+        UNDEFINED_STORAGE_BYTES_STATUS = 0
+        UPDATING = 494614342
+        UP_TO_DATE = 101306702
+
+    class Type(proto.Enum):
+        r"""Specifies the type of the attached disk, either SCRATCH or
+        PERSISTENT.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            PERSISTENT (460683927):
+                No description available.
+            SCRATCH (496778970):
+                No description available.
+        """
+        UNDEFINED_TYPE = 0
+        PERSISTENT = 460683927
+        SCRATCH = 496778970
+
+    auto_delete: bool = proto.Field(
+        proto.BOOL,
+        number=464761403,
+        optional=True,
+    )
+    boot: bool = proto.Field(
+        proto.BOOL,
+        number=3029746,
+        optional=True,
+    )
+    device_name: str = proto.Field(
+        proto.STRING,
+        number=67541716,
+        optional=True,
+    )
+    disk_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = (
+        proto.Field(
+            proto.MESSAGE,
+            number=271660677,
+            optional=True,
+            message=shared_customer_encryption_key.CustomerEncryptionKey,
+        )
+    )
+    disk_size_gb: int = proto.Field(
+        proto.INT64,
+        number=316263735,
+        optional=True,
+    )
+    disk_type: str = proto.Field(
+        proto.STRING,
+        number=93009052,
+        optional=True,
+    )
+    guest_os_features: MutableSequence[
+        shared_customer_encryption_key.GuestOsFeature
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=79294545,
+        message=shared_customer_encryption_key.GuestOsFeature,
+    )
+    index: int = proto.Field(
+        proto.INT32,
+        number=100346066,
+        optional=True,
+    )
+    interface: str = proto.Field(
+        proto.STRING,
+        number=502623545,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    licenses: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=337642578,
+    )
+    mode: str = proto.Field(
+        proto.STRING,
+        number=3357091,
+        optional=True,
+    )
+    source: str = proto.Field(
+        proto.STRING,
+        number=177235995,
+        optional=True,
+    )
+    storage_bytes: int = proto.Field(
+        proto.INT64,
+        number=424631719,
+        optional=True,
+    )
+    storage_bytes_status: str = proto.Field(
+        proto.STRING,
+        number=490739082,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+class SavedDisk(proto.Message):
+    r"""An instance-attached disk resource.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        architecture (str):
+            [Output Only] The architecture of the attached disk. Check
+            the Architecture enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_architecture``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#savedDisk
+            for attached disks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        source_disk (str):
+            Specifies a URL of the disk attached to the
+            source instance.
+
+            This field is a member of `oneof`_ ``_source_disk``.
+        storage_bytes (int):
+            [Output Only] Size of the individual disk snapshot used by
+            this machine image.
+
+            This field is a member of `oneof`_ ``_storage_bytes``.
+        storage_bytes_status (str):
+            [Output Only] An indicator whether storageBytes is in a
+            stable state or it is being adjusted as a result of shared
+            storage reallocation. This status can either be UPDATING,
+            meaning the size of the snapshot is being updated, or
+            UP_TO_DATE, meaning the size of the snapshot is up-to-date.
+            Check the StorageBytesStatus enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_storage_bytes_status``.
+    """
+
+    class Architecture(proto.Enum):
+        r"""[Output Only] The architecture of the attached disk.
+
+        Values:
+            UNDEFINED_ARCHITECTURE (0):
+                A value indicating that the enum field is not
+                set.
+            ARCHITECTURE_UNSPECIFIED (394750507):
+                Default value indicating Architecture is not
+                set.
+            ARM64 (62547450):
+                Machines with architecture ARM64
+            X86_64 (425300551):
+                Machines with architecture X86_64
+        """
+        UNDEFINED_ARCHITECTURE = 0
+        ARCHITECTURE_UNSPECIFIED = 394750507
+        ARM64 = 62547450
+        X86_64 = 425300551
+
+    class StorageBytesStatus(proto.Enum):
+        r"""[Output Only] An indicator whether storageBytes is in a stable state
+        or it is being adjusted as a result of shared storage reallocation.
+        This status can either be UPDATING, meaning the size of the snapshot
+        is being updated, or UP_TO_DATE, meaning the size of the snapshot is
+        up-to-date.
+
+        Values:
+            UNDEFINED_STORAGE_BYTES_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            UPDATING (494614342):
+                No description available.
+            UP_TO_DATE (101306702):
+                No description available.
+        """
+        UNDEFINED_STORAGE_BYTES_STATUS = 0
+        UPDATING = 494614342
+        UP_TO_DATE = 101306702
+
+    architecture: str = proto.Field(
+        proto.STRING,
+        number=302803283,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    source_disk: str = proto.Field(
+        proto.STRING,
+        number=451753793,
+        optional=True,
+    )
+    storage_bytes: int = proto.Field(
+        proto.INT64,
+        number=424631719,
+        optional=True,
+    )
+    storage_bytes_status: str = proto.Field(
+        proto.STRING,
+        number=490739082,
+        optional=True,
+    )
+
+
+class SetIamPolicyMachineImageRequest(proto.Message):
+    r"""A request message for MachineImages.SetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        global_set_policy_request_resource (google.cloud.compute_v1.types.GlobalSetPolicyRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    global_set_policy_request_resource: shared_global_set_policy_request.GlobalSetPolicyRequest = proto.Field(
+        proto.MESSAGE,
+        number=337048498,
+        message=shared_global_set_policy_request.GlobalSetPolicyRequest,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class SourceDiskEncryptionKey(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        disk_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source disk. Required if the source disk is
+            protected by a customer-supplied encryption key.
+
+            This field is a member of `oneof`_ ``_disk_encryption_key``.
+        source_disk (str):
+            URL of the disk attached to the source
+            instance. This can be a full or valid partial
+            URL. For example, the following are valid
+            values: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /disks/disk -
+            projects/project/zones/zone/disks/disk -
+            zones/zone/disks/disk
+
+            This field is a member of `oneof`_ ``_source_disk``.
+    """
+
+    disk_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = (
+        proto.Field(
+            proto.MESSAGE,
+            number=271660677,
+            optional=True,
+            message=shared_customer_encryption_key.CustomerEncryptionKey,
+        )
+    )
+    source_disk: str = proto.Field(
+        proto.STRING,
+        number=451753793,
+        optional=True,
+    )
+
+
+class SourceInstanceProperties(proto.Message):
+    r"""DEPRECATED: Please use compute#instanceProperties instead.
+    New properties will not be added to this field.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        can_ip_forward (bool):
+            Enables instances created based on this
+            machine image to send packets with source IP
+            addresses other than their own and receive
+            packets with destination IP addresses other than
+            their own. If these instances will be used as an
+            IP gateway or it will be set as the next-hop in
+            a Route resource, specify true. If unsure, leave
+            this set to false. See the Enable IP forwarding
+            documentation for more information.
+
+            This field is a member of `oneof`_ ``_can_ip_forward``.
+        deletion_protection (bool):
+            Whether the instance created from this
+            machine image should be protected against
+            deletion.
+
+            This field is a member of `oneof`_ ``_deletion_protection``.
+        description (str):
+            An optional text description for the
+            instances that are created from this machine
+            image.
+
+            This field is a member of `oneof`_ ``_description``.
+        disks (MutableSequence[google.cloud.compute_v1.types.SavedAttachedDisk]):
+            An array of disks that are associated with
+            the instances that are created from this machine
+            image.
+        guest_accelerators (MutableSequence[google.cloud.compute_v1.types.AcceleratorConfig]):
+            A list of guest accelerator cards' type and
+            count to use for instances created from this
+            machine image.
+        key_revocation_action_type (str):
+            KeyRevocationActionType of the instance.
+            Supported options are "STOP" and "NONE". The
+            default value is "NONE" if it is not specified.
+            Check the KeyRevocationActionType enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_key_revocation_action_type``.
+        labels (MutableMapping[str, str]):
+            Labels to apply to instances that are created
+            from this machine image.
+        machine_type (str):
+            The machine type to use for instances that
+            are created from this machine image.
+
+            This field is a member of `oneof`_ ``_machine_type``.
+        metadata (google.cloud.compute_v1.types.Metadata):
+            The metadata key/value pairs to assign to
+            instances that are created from this machine
+            image. These pairs can consist of custom
+            metadata or predefined keys. See Project and
+            instance metadata for more information.
+
+            This field is a member of `oneof`_ ``_metadata``.
+        min_cpu_platform (str):
+            Minimum cpu/platform to be used by instances
+            created from this machine image. The instance
+            may be scheduled on the specified or newer
+            cpu/platform. Applicable values are the friendly
+            names of CPU platforms, such as minCpuPlatform:
+            "Intel Haswell" or minCpuPlatform: "Intel Sandy
+            Bridge". For more information, read Specifying a
+            Minimum CPU Platform.
+
+            This field is a member of `oneof`_ ``_min_cpu_platform``.
+        network_interfaces (MutableSequence[google.cloud.compute_v1.types.NetworkInterface]):
+            An array of network access configurations for
+            this interface.
+        scheduling (google.cloud.compute_v1.types.Scheduling):
+            Specifies the scheduling options for the
+            instances that are created from this machine
+            image.
+
+            This field is a member of `oneof`_ ``_scheduling``.
+        service_accounts (MutableSequence[google.cloud.compute_v1.types.ServiceAccount]):
+            A list of service accounts with specified
+            scopes. Access tokens for these service accounts
+            are available to the instances that are created
+            from this machine image. Use metadata queries to
+            obtain the access tokens for these instances.
+        tags (google.cloud.compute_v1.types.Tags):
+            A list of tags to apply to the instances that
+            are created from this machine image. The tags
+            identify valid sources or targets for network
+            firewalls. The setTags method can modify this
+            list of tags. Each tag within the list must
+            comply with RFC1035.
+
+            This field is a member of `oneof`_ ``_tags``.
+    """
+
+    class KeyRevocationActionType(proto.Enum):
+        r"""KeyRevocationActionType of the instance. Supported options
+        are "STOP" and "NONE". The default value is "NONE" if it is not
+        specified.
+
+        Values:
+            UNDEFINED_KEY_REVOCATION_ACTION_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            KEY_REVOCATION_ACTION_TYPE_UNSPECIFIED (467110106):
+                Default value. This value is unused.
+            NONE (2402104):
+                Indicates user chose no operation.
+            STOP (2555906):
+                Indicates user chose to opt for VM shutdown
+                on key revocation.
+        """
+        UNDEFINED_KEY_REVOCATION_ACTION_TYPE = 0
+        KEY_REVOCATION_ACTION_TYPE_UNSPECIFIED = 467110106
+        NONE = 2402104
+        STOP = 2555906
+
+    can_ip_forward: bool = proto.Field(
+        proto.BOOL,
+        number=467731324,
+        optional=True,
+    )
+    deletion_protection: bool = proto.Field(
+        proto.BOOL,
+        number=458014698,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    disks: MutableSequence["SavedAttachedDisk"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=95594102,
+        message="SavedAttachedDisk",
+    )
+    guest_accelerators: MutableSequence[
+        shared_accelerator_config.AcceleratorConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=463595119,
+        message=shared_accelerator_config.AcceleratorConfig,
+    )
+    key_revocation_action_type: str = proto.Field(
+        proto.STRING,
+        number=235941474,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    machine_type: str = proto.Field(
+        proto.STRING,
+        number=227711026,
+        optional=True,
+    )
+    metadata: shared_metadata.Metadata = proto.Field(
+        proto.MESSAGE,
+        number=86866735,
+        optional=True,
+        message=shared_metadata.Metadata,
+    )
+    min_cpu_platform: str = proto.Field(
+        proto.STRING,
+        number=242912759,
+        optional=True,
+    )
+    network_interfaces: MutableSequence[
+        shared_network_interface.NetworkInterface
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=52735243,
+        message=shared_network_interface.NetworkInterface,
+    )
+    scheduling: shared_network_interface.Scheduling = proto.Field(
+        proto.MESSAGE,
+        number=386688404,
+        optional=True,
+        message=shared_network_interface.Scheduling,
+    )
+    service_accounts: MutableSequence[
+        shared_network_interface.ServiceAccount
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=277537328,
+        message=shared_network_interface.ServiceAccount,
+    )
+    tags: shared_network_interface.Tags = proto.Field(
+        proto.MESSAGE,
+        number=3552281,
+        optional=True,
+        message=shared_network_interface.Tags,
+    )
+
+
+class TestIamPermissionsMachineImageRequest(proto.Message):
+    r"""A request message for MachineImages.TestIamPermissions. See
+    the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    test_permissions_request_resource: shared_test_permissions_request.TestPermissionsRequest = proto.Field(
+        proto.MESSAGE,
+        number=439214758,
+        message=shared_test_permissions_request.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,1687 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_firewall
+from google.cloud.compute_v1.types._compute import shared_firewall_policy_rule
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddPeeringNetworkRequest",
+        "DeleteNetworkRequest",
+        "ExchangedPeeringRoute",
+        "ExchangedPeeringRoutesList",
+        "GetEffectiveFirewallsNetworkRequest",
+        "GetNetworkRequest",
+        "InsertNetworkRequest",
+        "ListNetworksRequest",
+        "ListPeeringRoutesNetworksRequest",
+        "Network",
+        "NetworkList",
+        "NetworkPeering",
+        "NetworkRoutingConfig",
+        "NetworksAddPeeringRequest",
+        "NetworksGetEffectiveFirewallsResponse",
+        "NetworksGetEffectiveFirewallsResponseEffectiveFirewallPolicy",
+        "NetworksRemovePeeringRequest",
+        "NetworksUpdatePeeringRequest",
+        "PatchNetworkRequest",
+        "RemovePeeringNetworkRequest",
+        "SwitchToCustomModeNetworkRequest",
+        "UpdatePeeringNetworkRequest",
+    },
+)
+
+
+class AddPeeringNetworkRequest(proto.Message):
+    r"""A request message for Networks.AddPeering. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        network (str):
+            Name of the network resource to add peering
+            to.
+        networks_add_peering_request_resource (google.cloud.compute_v1.types.NetworksAddPeeringRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+    )
+    networks_add_peering_request_resource: "NetworksAddPeeringRequest" = proto.Field(
+        proto.MESSAGE,
+        number=388810421,
+        message="NetworksAddPeeringRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class DeleteNetworkRequest(proto.Message):
+    r"""A request message for Networks.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        network (str):
+            Name of the network to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class ExchangedPeeringRoute(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        dest_range (str):
+            The destination range of the route.
+
+            This field is a member of `oneof`_ ``_dest_range``.
+        imported (bool):
+            True if the peering route has been imported
+            from a peer. The actual import happens if the
+            field networkPeering.importCustomRoutes is true
+            for this network, and
+            networkPeering.exportCustomRoutes is true for
+            the peer network, and the import does not result
+            in a route conflict.
+
+            This field is a member of `oneof`_ ``_imported``.
+        next_hop_region (str):
+            The region of peering route next hop, only
+            applies to dynamic routes.
+
+            This field is a member of `oneof`_ ``_next_hop_region``.
+        priority (int):
+            The priority of the peering route.
+
+            This field is a member of `oneof`_ ``_priority``.
+        type_ (str):
+            The type of the peering route.
+            Check the Type enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r"""The type of the peering route.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            DYNAMIC_PEERING_ROUTE (469794858):
+                For routes exported from local network.
+            STATIC_PEERING_ROUTE (473407545):
+                The peering route.
+            SUBNET_PEERING_ROUTE (465782504):
+                The peering route corresponding to subnetwork
+                range.
+        """
+        UNDEFINED_TYPE = 0
+        DYNAMIC_PEERING_ROUTE = 469794858
+        STATIC_PEERING_ROUTE = 473407545
+        SUBNET_PEERING_ROUTE = 465782504
+
+    dest_range: str = proto.Field(
+        proto.STRING,
+        number=381327712,
+        optional=True,
+    )
+    imported: bool = proto.Field(
+        proto.BOOL,
+        number=114502404,
+        optional=True,
+    )
+    next_hop_region: str = proto.Field(
+        proto.STRING,
+        number=122577014,
+        optional=True,
+    )
+    priority: int = proto.Field(
+        proto.UINT32,
+        number=445151652,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+class ExchangedPeeringRoutesList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.ExchangedPeeringRoute]):
+            A list of ExchangedPeeringRoute resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#exchangedPeeringRoutesList for exchanged peering
+            routes lists.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["ExchangedPeeringRoute"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="ExchangedPeeringRoute",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class GetEffectiveFirewallsNetworkRequest(proto.Message):
+    r"""A request message for Networks.GetEffectiveFirewalls. See the
+    method description for details.
+
+    Attributes:
+        network (str):
+            Name of the network for this request.
+        project (str):
+            Project ID for this request.
+    """
+
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class GetNetworkRequest(proto.Message):
+    r"""A request message for Networks.Get. See the method
+    description for details.
+
+    Attributes:
+        network (str):
+            Name of the network to return.
+        project (str):
+            Project ID for this request.
+    """
+
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class InsertNetworkRequest(proto.Message):
+    r"""A request message for Networks.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        network_resource (google.cloud.compute_v1.types.Network):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    network_resource: "Network" = proto.Field(
+        proto.MESSAGE,
+        number=122105599,
+        message="Network",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class ListNetworksRequest(proto.Message):
+    r"""A request message for Networks.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class ListPeeringRoutesNetworksRequest(proto.Message):
+    r"""A request message for Networks.ListPeeringRoutes. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        direction (str):
+            The direction of the exchanged routes.
+            Check the Direction enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_direction``.
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        network (str):
+            Name of the network for this request.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        peering_name (str):
+            The response will show routes exchanged over
+            the given peering connection.
+
+            This field is a member of `oneof`_ ``_peering_name``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The region of the request. The response will
+            include all subnet routes, static routes and
+            dynamic routes in the region.
+
+            This field is a member of `oneof`_ ``_region``.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    class Direction(proto.Enum):
+        r"""The direction of the exchanged routes.
+
+        Values:
+            UNDEFINED_DIRECTION (0):
+                A value indicating that the enum field is not
+                set.
+            INCOMING (338552870):
+                For routes exported from peer network.
+            OUTGOING (307438444):
+                For routes exported from local network.
+        """
+        UNDEFINED_DIRECTION = 0
+        INCOMING = 338552870
+        OUTGOING = 307438444
+
+    direction: str = proto.Field(
+        proto.STRING,
+        number=111150975,
+        optional=True,
+    )
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    peering_name: str = proto.Field(
+        proto.STRING,
+        number=249571370,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class Network(proto.Message):
+    r"""Represents a VPC Network resource. Networks connect resources
+    to each other and to the internet. For more information, read
+    Virtual Private Cloud (VPC) Network.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        I_pv4_range (str):
+            Deprecated in favor of subnet mode networks.
+            The range of internal addresses that are legal
+            on this network. This range is a CIDR
+            specification, for example: 192.168.0.0/16.
+            Provided by the client when the network is
+            created.
+
+            This field is a member of `oneof`_ ``_I_pv4_range``.
+        auto_create_subnetworks (bool):
+            Must be set to create a VPC network. If not
+            set, a legacy network is created. When set to
+            true, the VPC network is created in auto mode.
+            When set to false, the VPC network is created in
+            custom mode. An auto mode VPC network starts
+            with one subnet per region. Each subnet has a
+            predetermined range as described in Auto mode
+            VPC network IP ranges. For custom mode VPC
+            networks, you can add subnets using the
+            subnetworks insert method.
+
+            This field is a member of `oneof`_ ``_auto_create_subnetworks``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this field when you create the resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        enable_ula_internal_ipv6 (bool):
+            Enable ULA internal ipv6 on this network.
+            Enabling this feature will assign a /48 from
+            google defined ULA prefix fd20::/20. .
+
+            This field is a member of `oneof`_ ``_enable_ula_internal_ipv6``.
+        firewall_policy (str):
+            [Output Only] URL of the firewall policy the network is
+            associated with.
+
+            This field is a member of `oneof`_ ``_firewall_policy``.
+        gateway_i_pv4 (str):
+            [Output Only] The gateway address for default routing out of
+            the network, selected by Google Cloud.
+
+            This field is a member of `oneof`_ ``_gateway_i_pv4``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        internal_ipv6_range (str):
+            When enabling ula internal ipv6, caller
+            optionally can specify the /48 range they want
+            from the google defined ULA prefix fd20::/20.
+            The input must be a valid /48 ULA IPv6 address
+            and must be within the fd20::/20. Operation will
+            fail if the speficied /48 is already in used by
+            another resource. If the field is not speficied,
+            then a /48 range will be randomly allocated from
+            fd20::/20 and returned via this field. .
+
+            This field is a member of `oneof`_ ``_internal_ipv6_range``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#network
+            for networks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        mtu (int):
+            Maximum Transmission Unit in bytes. The
+            minimum value for this field is 1300 and the
+            maximum value is 8896. The suggested value is
+            1500, which is the default MTU used on the
+            Internet, or 8896 if you want to use Jumbo
+            frames. If unspecified, the value defaults to
+            1460.
+
+            This field is a member of `oneof`_ ``_mtu``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?``. The first character must be
+            a lowercase letter, and all following characters (except for
+            the last character) must be a dash, lowercase letter, or
+            digit. The last character must be a lowercase letter or
+            digit.
+
+            This field is a member of `oneof`_ ``_name``.
+        network_firewall_policy_enforcement_order (str):
+            The network firewall policy enforcement order. Can be either
+            AFTER_CLASSIC_FIREWALL or BEFORE_CLASSIC_FIREWALL. Defaults
+            to AFTER_CLASSIC_FIREWALL if the field is not specified.
+            Check the NetworkFirewallPolicyEnforcementOrder enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_network_firewall_policy_enforcement_order``.
+        peerings (MutableSequence[google.cloud.compute_v1.types.NetworkPeering]):
+            [Output Only] A list of network peerings for the resource.
+        routing_config (google.cloud.compute_v1.types.NetworkRoutingConfig):
+            The network-level routing configuration for
+            this network. Used by Cloud Router to determine
+            what type of network-wide routing behavior to
+            enforce.
+
+            This field is a member of `oneof`_ ``_routing_config``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        self_link_with_id (str):
+            [Output Only] Server-defined URL for this resource with the
+            resource id.
+
+            This field is a member of `oneof`_ ``_self_link_with_id``.
+        subnetworks (MutableSequence[str]):
+            [Output Only] Server-defined fully-qualified URLs for all
+            subnetworks in this VPC network.
+    """
+
+    class NetworkFirewallPolicyEnforcementOrder(proto.Enum):
+        r"""The network firewall policy enforcement order. Can be either
+        AFTER_CLASSIC_FIREWALL or BEFORE_CLASSIC_FIREWALL. Defaults to
+        AFTER_CLASSIC_FIREWALL if the field is not specified.
+
+        Values:
+            UNDEFINED_NETWORK_FIREWALL_POLICY_ENFORCEMENT_ORDER (0):
+                A value indicating that the enum field is not
+                set.
+            AFTER_CLASSIC_FIREWALL (154582608):
+                No description available.
+            BEFORE_CLASSIC_FIREWALL (338458349):
+                No description available.
+        """
+        UNDEFINED_NETWORK_FIREWALL_POLICY_ENFORCEMENT_ORDER = 0
+        AFTER_CLASSIC_FIREWALL = 154582608
+        BEFORE_CLASSIC_FIREWALL = 338458349
+
+    I_pv4_range: str = proto.Field(
+        proto.STRING,
+        number=59234358,
+        optional=True,
+    )
+    auto_create_subnetworks: bool = proto.Field(
+        proto.BOOL,
+        number=256156690,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    enable_ula_internal_ipv6: bool = proto.Field(
+        proto.BOOL,
+        number=423757720,
+        optional=True,
+    )
+    firewall_policy: str = proto.Field(
+        proto.STRING,
+        number=498173265,
+        optional=True,
+    )
+    gateway_i_pv4: str = proto.Field(
+        proto.STRING,
+        number=178678877,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    internal_ipv6_range: str = proto.Field(
+        proto.STRING,
+        number=277456807,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    mtu: int = proto.Field(
+        proto.INT32,
+        number=108462,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network_firewall_policy_enforcement_order: str = proto.Field(
+        proto.STRING,
+        number=6504784,
+        optional=True,
+    )
+    peerings: MutableSequence["NetworkPeering"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=69883187,
+        message="NetworkPeering",
+    )
+    routing_config: "NetworkRoutingConfig" = proto.Field(
+        proto.MESSAGE,
+        number=523556059,
+        optional=True,
+        message="NetworkRoutingConfig",
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    self_link_with_id: str = proto.Field(
+        proto.STRING,
+        number=44520962,
+        optional=True,
+    )
+    subnetworks: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=415853125,
+    )
+
+
+class NetworkList(proto.Message):
+    r"""Contains a list of networks.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.Network]):
+            A list of Network resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#networkList
+            for lists of networks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["Network"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="Network",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class NetworkPeering(proto.Message):
+    r"""A network peering attached to a network resource. The message
+    includes the peering name, peer network, peering state, and a
+    flag indicating whether Google Compute Engine should
+    automatically create routes for the peering.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_create_routes (bool):
+            This field will be deprecated soon. Use the
+            exchange_subnet_routes field instead. Indicates whether full
+            mesh connectivity is created and managed automatically
+            between peered networks. Currently this field should always
+            be true since Google Compute Engine will automatically
+            create and manage subnetwork routes between two networks
+            when peering state is ACTIVE.
+
+            This field is a member of `oneof`_ ``_auto_create_routes``.
+        exchange_subnet_routes (bool):
+            Indicates whether full mesh connectivity is
+            created and managed automatically between peered
+            networks. Currently this field should always be
+            true since Google Compute Engine will
+            automatically create and manage subnetwork
+            routes between two networks when peering state
+            is ACTIVE.
+
+            This field is a member of `oneof`_ ``_exchange_subnet_routes``.
+        export_custom_routes (bool):
+            Whether to export the custom routes to peer
+            network. The default value is false.
+
+            This field is a member of `oneof`_ ``_export_custom_routes``.
+        export_subnet_routes_with_public_ip (bool):
+            Whether subnet routes with public IP range
+            are exported. The default value is true, all
+            subnet routes are exported. IPv4 special-use
+            ranges are always exported to peers and are not
+            controlled by this field.
+
+            This field is a member of `oneof`_ ``_export_subnet_routes_with_public_ip``.
+        import_custom_routes (bool):
+            Whether to import the custom routes from peer
+            network. The default value is false.
+
+            This field is a member of `oneof`_ ``_import_custom_routes``.
+        import_subnet_routes_with_public_ip (bool):
+            Whether subnet routes with public IP range
+            are imported. The default value is false. IPv4
+            special-use ranges are always imported from
+            peers and are not controlled by this field.
+
+            This field is a member of `oneof`_ ``_import_subnet_routes_with_public_ip``.
+        name (str):
+            Name of this peering. Provided by the client when the
+            peering is created. The name must comply with RFC1035.
+            Specifically, the name must be 1-63 characters long and
+            match regular expression ``[a-z]([-a-z0-9]*[a-z0-9])?``. The
+            first character must be a lowercase letter, and all the
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            The URL of the peer network. It can be either
+            full URL or partial URL. The peer network may
+            belong to a different project. If the partial
+            URL does not contain project, it is assumed that
+            the peer network is in the same project as the
+            current network.
+
+            This field is a member of `oneof`_ ``_network``.
+        peer_mtu (int):
+            Maximum Transmission Unit in bytes.
+
+            This field is a member of `oneof`_ ``_peer_mtu``.
+        stack_type (str):
+            Which IP version(s) of traffic and routes are allowed to be
+            imported or exported between peer networks. The default
+            value is IPV4_ONLY. Check the StackType enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_stack_type``.
+        state (str):
+            [Output Only] State for the peering, either ``ACTIVE`` or
+            ``INACTIVE``. The peering is ``ACTIVE`` when there's a
+            matching configuration in the peer network. Check the State
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+        state_details (str):
+            [Output Only] Details about the current state of the
+            peering.
+
+            This field is a member of `oneof`_ ``_state_details``.
+    """
+
+    class StackType(proto.Enum):
+        r"""Which IP version(s) of traffic and routes are allowed to be imported
+        or exported between peer networks. The default value is IPV4_ONLY.
+
+        Values:
+            UNDEFINED_STACK_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            IPV4_IPV6 (22197249):
+                This Peering will allow IPv4 traffic and routes to be
+                exchanged. Additionally if the matching peering is
+                IPV4_IPV6, IPv6 traffic and routes will be exchanged as
+                well.
+            IPV4_ONLY (22373798):
+                This Peering will only allow IPv4 traffic and routes to be
+                exchanged, even if the matching peering is IPV4_IPV6.
+        """
+        UNDEFINED_STACK_TYPE = 0
+        IPV4_IPV6 = 22197249
+        IPV4_ONLY = 22373798
+
+    class State(proto.Enum):
+        r"""[Output Only] State for the peering, either ``ACTIVE`` or
+        ``INACTIVE``. The peering is ``ACTIVE`` when there's a matching
+        configuration in the peer network.
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                Matching configuration exists on the peer.
+            INACTIVE (270421099):
+                There is no matching configuration on the
+                peer, including the case when peer does not
+                exist.
+        """
+        UNDEFINED_STATE = 0
+        ACTIVE = 314733318
+        INACTIVE = 270421099
+
+    auto_create_routes: bool = proto.Field(
+        proto.BOOL,
+        number=57454941,
+        optional=True,
+    )
+    exchange_subnet_routes: bool = proto.Field(
+        proto.BOOL,
+        number=26322256,
+        optional=True,
+    )
+    export_custom_routes: bool = proto.Field(
+        proto.BOOL,
+        number=60281485,
+        optional=True,
+    )
+    export_subnet_routes_with_public_ip: bool = proto.Field(
+        proto.BOOL,
+        number=97940834,
+        optional=True,
+    )
+    import_custom_routes: bool = proto.Field(
+        proto.BOOL,
+        number=197982398,
+        optional=True,
+    )
+    import_subnet_routes_with_public_ip: bool = proto.Field(
+        proto.BOOL,
+        number=14419729,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    peer_mtu: int = proto.Field(
+        proto.INT32,
+        number=69584721,
+        optional=True,
+    )
+    stack_type: str = proto.Field(
+        proto.STRING,
+        number=425908881,
+        optional=True,
+    )
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+    state_details: str = proto.Field(
+        proto.STRING,
+        number=95566996,
+        optional=True,
+    )
+
+
+class NetworkRoutingConfig(proto.Message):
+    r"""A routing configuration attached to a network resource. The
+    message includes the list of routers associated with the
+    network, and a flag indicating the type of routing behavior to
+    enforce network-wide.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        routing_mode (str):
+            The network-wide routing mode to use. If set
+            to REGIONAL, this network's Cloud Routers will
+            only advertise routes with subnets of this
+            network in the same region as the router. If set
+            to GLOBAL, this network's Cloud Routers will
+            advertise routes with all subnets of this
+            network, across regions. Check the RoutingMode
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_routing_mode``.
+    """
+
+    class RoutingMode(proto.Enum):
+        r"""The network-wide routing mode to use. If set to REGIONAL,
+        this network's Cloud Routers will only advertise routes with
+        subnets of this network in the same region as the router. If set
+        to GLOBAL, this network's Cloud Routers will advertise routes
+        with all subnets of this network, across regions.
+
+        Values:
+            UNDEFINED_ROUTING_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            GLOBAL (494663587):
+                No description available.
+            REGIONAL (92288543):
+                No description available.
+        """
+        UNDEFINED_ROUTING_MODE = 0
+        GLOBAL = 494663587
+        REGIONAL = 92288543
+
+    routing_mode: str = proto.Field(
+        proto.STRING,
+        number=475143548,
+        optional=True,
+    )
+
+
+class NetworksAddPeeringRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_create_routes (bool):
+            This field will be deprecated soon. Use
+            exchange_subnet_routes in network_peering instead. Indicates
+            whether full mesh connectivity is created and managed
+            automatically between peered networks. Currently this field
+            should always be true since Google Compute Engine will
+            automatically create and manage subnetwork routes between
+            two networks when peering state is ACTIVE.
+
+            This field is a member of `oneof`_ ``_auto_create_routes``.
+        name (str):
+            Name of the peering, which should conform to
+            RFC1035.
+
+            This field is a member of `oneof`_ ``_name``.
+        network_peering (google.cloud.compute_v1.types.NetworkPeering):
+            Network peering parameters. In order to specify route
+            policies for peering using import and export custom routes,
+            you must specify all peering related parameters (name, peer
+            network, exchange_subnet_routes) in the network_peering
+            field. The corresponding fields in NetworksAddPeeringRequest
+            will be deprecated soon.
+
+            This field is a member of `oneof`_ ``_network_peering``.
+        peer_network (str):
+            URL of the peer network. It can be either
+            full URL or partial URL. The peer network may
+            belong to a different project. If the partial
+            URL does not contain project, it is assumed that
+            the peer network is in the same project as the
+            current network.
+
+            This field is a member of `oneof`_ ``_peer_network``.
+    """
+
+    auto_create_routes: bool = proto.Field(
+        proto.BOOL,
+        number=57454941,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network_peering: "NetworkPeering" = proto.Field(
+        proto.MESSAGE,
+        number=328926767,
+        optional=True,
+        message="NetworkPeering",
+    )
+    peer_network: str = proto.Field(
+        proto.STRING,
+        number=500625489,
+        optional=True,
+    )
+
+
+class NetworksGetEffectiveFirewallsResponse(proto.Message):
+    r"""
+
+    Attributes:
+        firewall_policys (MutableSequence[google.cloud.compute_v1.types.NetworksGetEffectiveFirewallsResponseEffectiveFirewallPolicy]):
+            Effective firewalls from firewall policy.
+        firewalls (MutableSequence[google.cloud.compute_v1.types.Firewall]):
+            Effective firewalls on the network.
+    """
+
+    firewall_policys: MutableSequence[
+        "NetworksGetEffectiveFirewallsResponseEffectiveFirewallPolicy"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=410985794,
+        message="NetworksGetEffectiveFirewallsResponseEffectiveFirewallPolicy",
+    )
+    firewalls: MutableSequence[shared_firewall.Firewall] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=272245619,
+        message=shared_firewall.Firewall,
+    )
+
+
+class NetworksGetEffectiveFirewallsResponseEffectiveFirewallPolicy(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        display_name (str):
+            [Output Only] Deprecated, please use short name instead. The
+            display name of the firewall policy.
+
+            This field is a member of `oneof`_ ``_display_name``.
+        name (str):
+            [Output Only] The name of the firewall policy.
+
+            This field is a member of `oneof`_ ``_name``.
+        rules (MutableSequence[google.cloud.compute_v1.types.FirewallPolicyRule]):
+            The rules that apply to the network.
+        short_name (str):
+            [Output Only] The short name of the firewall policy.
+
+            This field is a member of `oneof`_ ``_short_name``.
+        type_ (str):
+            [Output Only] The type of the firewall policy. Check the
+            Type enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r"""[Output Only] The type of the firewall policy.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            HIERARCHY (69902869):
+                No description available.
+            NETWORK (413984270):
+                No description available.
+            UNSPECIFIED (526786327):
+                No description available.
+        """
+        UNDEFINED_TYPE = 0
+        HIERARCHY = 69902869
+        NETWORK = 413984270
+        UNSPECIFIED = 526786327
+
+    display_name: str = proto.Field(
+        proto.STRING,
+        number=4473832,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    rules: MutableSequence[
+        shared_firewall_policy_rule.FirewallPolicyRule
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=108873975,
+        message=shared_firewall_policy_rule.FirewallPolicyRule,
+    )
+    short_name: str = proto.Field(
+        proto.STRING,
+        number=492051566,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+class NetworksRemovePeeringRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            Name of the peering, which should conform to
+            RFC1035.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+
+
+class NetworksUpdatePeeringRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        network_peering (google.cloud.compute_v1.types.NetworkPeering):
+
+            This field is a member of `oneof`_ ``_network_peering``.
+    """
+
+    network_peering: "NetworkPeering" = proto.Field(
+        proto.MESSAGE,
+        number=328926767,
+        optional=True,
+        message="NetworkPeering",
+    )
+
+
+class PatchNetworkRequest(proto.Message):
+    r"""A request message for Networks.Patch. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        network (str):
+            Name of the network to update.
+        network_resource (google.cloud.compute_v1.types.Network):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+    )
+    network_resource: "Network" = proto.Field(
+        proto.MESSAGE,
+        number=122105599,
+        message="Network",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class RemovePeeringNetworkRequest(proto.Message):
+    r"""A request message for Networks.RemovePeering. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        network (str):
+            Name of the network resource to remove
+            peering from.
+        networks_remove_peering_request_resource (google.cloud.compute_v1.types.NetworksRemovePeeringRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+    )
+    networks_remove_peering_request_resource: "NetworksRemovePeeringRequest" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=421162494,
+            message="NetworksRemovePeeringRequest",
+        )
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class SwitchToCustomModeNetworkRequest(proto.Message):
+    r"""A request message for Networks.SwitchToCustomMode. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        network (str):
+            Name of the network to be updated.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class UpdatePeeringNetworkRequest(proto.Message):
+    r"""A request message for Networks.UpdatePeering. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        network (str):
+            Name of the network resource which the
+            updated peering is belonging to.
+        networks_update_peering_request_resource (google.cloud.compute_v1.types.NetworksUpdatePeeringRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+    )
+    networks_update_peering_request_resource: "NetworksUpdatePeeringRequest" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=224433497,
+            message="NetworksUpdatePeeringRequest",
+        )
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
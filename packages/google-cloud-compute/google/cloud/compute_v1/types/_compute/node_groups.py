@@ -0,0 +1,1951 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_accelerator_config
+from google.cloud.compute_v1.types._compute import shared_duration
+from google.cloud.compute_v1.types._compute import shared_local_disk
+from google.cloud.compute_v1.types._compute import shared_share_settings
+from google.cloud.compute_v1.types._compute import shared_test_permissions_request
+from google.cloud.compute_v1.types._compute import shared_warning
+from google.cloud.compute_v1.types._compute import shared_zone_set_policy_request
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddNodesNodeGroupRequest",
+        "AggregatedListNodeGroupsRequest",
+        "DeleteNodeGroupRequest",
+        "DeleteNodesNodeGroupRequest",
+        "GetIamPolicyNodeGroupRequest",
+        "GetNodeGroupRequest",
+        "InsertNodeGroupRequest",
+        "InstanceConsumptionData",
+        "InstanceConsumptionInfo",
+        "ListNodeGroupsRequest",
+        "ListNodesNodeGroupsRequest",
+        "NodeGroup",
+        "NodeGroupAggregatedList",
+        "NodeGroupAutoscalingPolicy",
+        "NodeGroupList",
+        "NodeGroupMaintenanceWindow",
+        "NodeGroupNode",
+        "NodeGroupsAddNodesRequest",
+        "NodeGroupsDeleteNodesRequest",
+        "NodeGroupsListNodes",
+        "NodeGroupsScopedList",
+        "NodeGroupsSetNodeTemplateRequest",
+        "NodeGroupsSimulateMaintenanceEventRequest",
+        "PatchNodeGroupRequest",
+        "SetIamPolicyNodeGroupRequest",
+        "SetNodeTemplateNodeGroupRequest",
+        "SimulateMaintenanceEventNodeGroupRequest",
+        "TestIamPermissionsNodeGroupRequest",
+    },
+)
+
+
+class AddNodesNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.AddNodes. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        node_group (str):
+            Name of the NodeGroup resource.
+        node_groups_add_nodes_request_resource (google.cloud.compute_v1.types.NodeGroupsAddNodesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    node_group: str = proto.Field(
+        proto.STRING,
+        number=469958146,
+    )
+    node_groups_add_nodes_request_resource: "NodeGroupsAddNodesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=131263288,
+        message="NodeGroupsAddNodesRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class AggregatedListNodeGroupsRequest(proto.Message):
+    r"""A request message for NodeGroups.AggregatedList. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        service_project_number (int):
+
+            This field is a member of `oneof`_ ``_service_project_number``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    include_all_scopes: bool = proto.Field(
+        proto.BOOL,
+        number=391327988,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    service_project_number: int = proto.Field(
+        proto.INT64,
+        number=316757497,
+        optional=True,
+    )
+
+
+class DeleteNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        node_group (str):
+            Name of the NodeGroup resource to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    node_group: str = proto.Field(
+        proto.STRING,
+        number=469958146,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class DeleteNodesNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.DeleteNodes. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        node_group (str):
+            Name of the NodeGroup resource whose nodes
+            will be deleted.
+        node_groups_delete_nodes_request_resource (google.cloud.compute_v1.types.NodeGroupsDeleteNodesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    node_group: str = proto.Field(
+        proto.STRING,
+        number=469958146,
+    )
+    node_groups_delete_nodes_request_resource: "NodeGroupsDeleteNodesRequest" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=183298962,
+            message="NodeGroupsDeleteNodesRequest",
+        )
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class GetIamPolicyNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.GetIamPolicy. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    options_requested_policy_version: int = proto.Field(
+        proto.INT32,
+        number=499220029,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class GetNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.Get. See the method
+    description for details.
+
+    Attributes:
+        node_group (str):
+            Name of the node group to return.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    node_group: str = proto.Field(
+        proto.STRING,
+        number=469958146,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class InsertNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        initial_node_count (int):
+            Initial count of nodes in the node group.
+        node_group_resource (google.cloud.compute_v1.types.NodeGroup):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    initial_node_count: int = proto.Field(
+        proto.INT32,
+        number=71951469,
+    )
+    node_group_resource: "NodeGroup" = proto.Field(
+        proto.MESSAGE,
+        number=505321899,
+        message="NodeGroup",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class InstanceConsumptionData(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        consumption_info (google.cloud.compute_v1.types.InstanceConsumptionInfo):
+            Resources consumed by the instance.
+
+            This field is a member of `oneof`_ ``_consumption_info``.
+        instance (str):
+            Server-defined URL for the instance.
+
+            This field is a member of `oneof`_ ``_instance``.
+    """
+
+    consumption_info: "InstanceConsumptionInfo" = proto.Field(
+        proto.MESSAGE,
+        number=146354898,
+        optional=True,
+        message="InstanceConsumptionInfo",
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+        optional=True,
+    )
+
+
+class InstanceConsumptionInfo(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        guest_cpus (int):
+            The number of virtual CPUs that are available
+            to the instance.
+
+            This field is a member of `oneof`_ ``_guest_cpus``.
+        local_ssd_gb (int):
+            The amount of local SSD storage available to
+            the instance, defined in GiB.
+
+            This field is a member of `oneof`_ ``_local_ssd_gb``.
+        memory_mb (int):
+            The amount of physical memory available to
+            the instance, defined in MiB.
+
+            This field is a member of `oneof`_ ``_memory_mb``.
+        min_node_cpus (int):
+            The minimal guaranteed number of virtual CPUs
+            that are reserved.
+
+            This field is a member of `oneof`_ ``_min_node_cpus``.
+    """
+
+    guest_cpus: int = proto.Field(
+        proto.INT32,
+        number=393356754,
+        optional=True,
+    )
+    local_ssd_gb: int = proto.Field(
+        proto.INT32,
+        number=329237578,
+        optional=True,
+    )
+    memory_mb: int = proto.Field(
+        proto.INT32,
+        number=116001171,
+        optional=True,
+    )
+    min_node_cpus: int = proto.Field(
+        proto.INT32,
+        number=317231675,
+        optional=True,
+    )
+
+
+class ListNodeGroupsRequest(proto.Message):
+    r"""A request message for NodeGroups.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class ListNodesNodeGroupsRequest(proto.Message):
+    r"""A request message for NodeGroups.ListNodes. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        node_group (str):
+            Name of the NodeGroup resource whose nodes
+            you want to list.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    node_group: str = proto.Field(
+        proto.STRING,
+        number=469958146,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class NodeGroup(proto.Message):
+    r"""Represents a sole-tenant Node Group resource. A sole-tenant
+    node is a physical server that is dedicated to hosting VM
+    instances only for your specific project. Use sole-tenant nodes
+    to keep your instances physically separated from instances in
+    other projects, or to group your instances together on the same
+    host hardware. For more information, read Sole-tenant nodes.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        autoscaling_policy (google.cloud.compute_v1.types.NodeGroupAutoscalingPolicy):
+            Specifies how autoscaling should behave.
+
+            This field is a member of `oneof`_ ``_autoscaling_policy``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        fingerprint (str):
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] The type of the resource. Always
+            compute#nodeGroup for node group.
+
+            This field is a member of `oneof`_ ``_kind``.
+        location_hint (str):
+            An opaque location hint used to place the Node close to
+            other resources. This field is for use by internal tools
+            that use the public API. The location hint here on the
+            NodeGroup overrides any location_hint present in the
+            NodeTemplate.
+
+            This field is a member of `oneof`_ ``_location_hint``.
+        maintenance_policy (str):
+            Specifies how to handle instances when a node in the group
+            undergoes maintenance. Set to one of: DEFAULT,
+            RESTART_IN_PLACE, or MIGRATE_WITHIN_NODE_GROUP. The default
+            value is DEFAULT. For more information, see Maintenance
+            policies. Check the MaintenancePolicy enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_maintenance_policy``.
+        maintenance_window (google.cloud.compute_v1.types.NodeGroupMaintenanceWindow):
+
+            This field is a member of `oneof`_ ``_maintenance_window``.
+        name (str):
+            The name of the resource, provided by the client when
+            initially creating the resource. The resource name must be
+            1-63 characters long, and comply with RFC1035. Specifically,
+            the name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        node_template (str):
+            URL of the node template to create the node
+            group from.
+
+            This field is a member of `oneof`_ ``_node_template``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        share_settings (google.cloud.compute_v1.types.ShareSettings):
+            Share-settings for the node group
+
+            This field is a member of `oneof`_ ``_share_settings``.
+        size (int):
+            [Output Only] The total number of nodes in the node group.
+
+            This field is a member of `oneof`_ ``_size``.
+        status (str):
+            Check the Status enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        zone (str):
+            [Output Only] The name of the zone where the node group
+            resides, such as us-central1-a.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    class MaintenancePolicy(proto.Enum):
+        r"""Specifies how to handle instances when a node in the group undergoes
+        maintenance. Set to one of: DEFAULT, RESTART_IN_PLACE, or
+        MIGRATE_WITHIN_NODE_GROUP. The default value is DEFAULT. For more
+        information, see Maintenance policies.
+
+        Values:
+            UNDEFINED_MAINTENANCE_POLICY (0):
+                A value indicating that the enum field is not
+                set.
+            DEFAULT (115302945):
+                Allow the node and corresponding instances to
+                retain default maintenance behavior.
+            MAINTENANCE_POLICY_UNSPECIFIED (72964182):
+                No description available.
+            MIGRATE_WITHIN_NODE_GROUP (153483394):
+                When maintenance must be done on a node, the
+                instances on that node will be moved to other
+                nodes in the group. Instances with
+                onHostMaintenance = MIGRATE will live migrate to
+                their destinations while instances with
+                onHostMaintenance = TERMINATE will terminate and
+                then restart on their destination nodes if
+                automaticRestart = true.
+            RESTART_IN_PLACE (228647325):
+                Instances in this group will restart on the
+                same node when maintenance has completed.
+                Instances must have onHostMaintenance =
+                TERMINATE, and they will only restart if
+                automaticRestart = true.
+        """
+        UNDEFINED_MAINTENANCE_POLICY = 0
+        DEFAULT = 115302945
+        MAINTENANCE_POLICY_UNSPECIFIED = 72964182
+        MIGRATE_WITHIN_NODE_GROUP = 153483394
+        RESTART_IN_PLACE = 228647325
+
+    class Status(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            CREATING (455564985):
+                No description available.
+            DELETING (528602024):
+                No description available.
+            INVALID (530283991):
+                No description available.
+            READY (77848963):
+                No description available.
+        """
+        UNDEFINED_STATUS = 0
+        CREATING = 455564985
+        DELETING = 528602024
+        INVALID = 530283991
+        READY = 77848963
+
+    autoscaling_policy: "NodeGroupAutoscalingPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=221950041,
+        optional=True,
+        message="NodeGroupAutoscalingPolicy",
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    location_hint: str = proto.Field(
+        proto.STRING,
+        number=350519505,
+        optional=True,
+    )
+    maintenance_policy: str = proto.Field(
+        proto.STRING,
+        number=528327646,
+        optional=True,
+    )
+    maintenance_window: "NodeGroupMaintenanceWindow" = proto.Field(
+        proto.MESSAGE,
+        number=186374812,
+        optional=True,
+        message="NodeGroupMaintenanceWindow",
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    node_template: str = proto.Field(
+        proto.STRING,
+        number=323154455,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    share_settings: shared_share_settings.ShareSettings = proto.Field(
+        proto.MESSAGE,
+        number=266668163,
+        optional=True,
+        message=shared_share_settings.ShareSettings,
+    )
+    size: int = proto.Field(
+        proto.INT32,
+        number=3530753,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+        optional=True,
+    )
+
+
+class NodeGroupAggregatedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableMapping[str, google.cloud.compute_v1.types.NodeGroupsScopedList]):
+            A list of NodeGroupsScopedList resources.
+        kind (str):
+            [Output Only] Type of resource.Always
+            compute#nodeGroupAggregatedList for aggregated lists of node
+            groups.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (MutableSequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableMapping[str, "NodeGroupsScopedList"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="NodeGroupsScopedList",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    unreachables: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=243372063,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class NodeGroupAutoscalingPolicy(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        max_nodes (int):
+            The maximum number of nodes that the group
+            should have. Must be set if autoscaling is
+            enabled. Maximum value allowed is 100.
+
+            This field is a member of `oneof`_ ``_max_nodes``.
+        min_nodes (int):
+            The minimum number of nodes that the group
+            should have.
+
+            This field is a member of `oneof`_ ``_min_nodes``.
+        mode (str):
+            The autoscaling mode. Set to one of: ON, OFF, or
+            ONLY_SCALE_OUT. For more information, see Autoscaler modes.
+            Check the Mode enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_mode``.
+    """
+
+    class Mode(proto.Enum):
+        r"""The autoscaling mode. Set to one of: ON, OFF, or ONLY_SCALE_OUT. For
+        more information, see Autoscaler modes.
+
+        Values:
+            UNDEFINED_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            MODE_UNSPECIFIED (371348091):
+                No description available.
+            OFF (78159):
+                Autoscaling is disabled.
+            ON (2527):
+                Autocaling is fully enabled.
+            ONLY_SCALE_OUT (152713670):
+                Autoscaling will only scale out and will not
+                remove nodes.
+        """
+        UNDEFINED_MODE = 0
+        MODE_UNSPECIFIED = 371348091
+        OFF = 78159
+        ON = 2527
+        ONLY_SCALE_OUT = 152713670
+
+    max_nodes: int = proto.Field(
+        proto.INT32,
+        number=297762838,
+        optional=True,
+    )
+    min_nodes: int = proto.Field(
+        proto.INT32,
+        number=533370500,
+        optional=True,
+    )
+    mode: str = proto.Field(
+        proto.STRING,
+        number=3357091,
+        optional=True,
+    )
+
+
+class NodeGroupList(proto.Message):
+    r"""Contains a list of nodeGroups.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.NodeGroup]):
+            A list of NodeGroup resources.
+        kind (str):
+            [Output Only] Type of resource.Always compute#nodeGroupList
+            for lists of node groups.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["NodeGroup"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="NodeGroup",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class NodeGroupMaintenanceWindow(proto.Message):
+    r"""Time window specified for daily maintenance operations. GCE's
+    internal maintenance will be performed within this window.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        maintenance_duration (google.cloud.compute_v1.types.Duration):
+            [Output only] A predetermined duration for the window,
+            automatically chosen to be the smallest possible in the
+            given scenario.
+
+            This field is a member of `oneof`_ ``_maintenance_duration``.
+        start_time (str):
+            Start time of the window. This must be in UTC
+            format that resolves to one of 00:00, 04:00,
+            08:00, 12:00, 16:00, or 20:00. For example, both
+            13:00-5 and 08:00 are valid.
+
+            This field is a member of `oneof`_ ``_start_time``.
+    """
+
+    maintenance_duration: shared_duration.Duration = proto.Field(
+        proto.MESSAGE,
+        number=525291840,
+        optional=True,
+        message=shared_duration.Duration,
+    )
+    start_time: str = proto.Field(
+        proto.STRING,
+        number=37467274,
+        optional=True,
+    )
+
+
+class NodeGroupNode(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        accelerators (MutableSequence[google.cloud.compute_v1.types.AcceleratorConfig]):
+            Accelerators for this node.
+        consumed_resources (google.cloud.compute_v1.types.InstanceConsumptionInfo):
+            Node resources that are reserved by all
+            instances.
+
+            This field is a member of `oneof`_ ``_consumed_resources``.
+        cpu_overcommit_type (str):
+            CPU overcommit.
+            Check the CpuOvercommitType enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_cpu_overcommit_type``.
+        disks (MutableSequence[google.cloud.compute_v1.types.LocalDisk]):
+            Local disk configurations.
+        instance_consumption_data (MutableSequence[google.cloud.compute_v1.types.InstanceConsumptionData]):
+            Instance data that shows consumed resources
+            on the node.
+        instances (MutableSequence[str]):
+            Instances scheduled on this node.
+        name (str):
+            The name of the node.
+
+            This field is a member of `oneof`_ ``_name``.
+        node_type (str):
+            The type of this node.
+
+            This field is a member of `oneof`_ ``_node_type``.
+        satisfies_pzs (bool):
+            [Output Only] Reserved for future use.
+
+            This field is a member of `oneof`_ ``_satisfies_pzs``.
+        server_binding (google.cloud.compute_v1.types.ServerBinding):
+            Binding properties for the physical server.
+
+            This field is a member of `oneof`_ ``_server_binding``.
+        server_id (str):
+            Server ID associated with this node.
+
+            This field is a member of `oneof`_ ``_server_id``.
+        status (str):
+            Check the Status enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        total_resources (google.cloud.compute_v1.types.InstanceConsumptionInfo):
+            Total amount of available resources on the
+            node.
+
+            This field is a member of `oneof`_ ``_total_resources``.
+    """
+
+    class CpuOvercommitType(proto.Enum):
+        r"""CPU overcommit.
+
+        Values:
+            UNDEFINED_CPU_OVERCOMMIT_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            CPU_OVERCOMMIT_TYPE_UNSPECIFIED (520665615):
+                No description available.
+            ENABLED (182130465):
+                No description available.
+            NONE (2402104):
+                No description available.
+        """
+        UNDEFINED_CPU_OVERCOMMIT_TYPE = 0
+        CPU_OVERCOMMIT_TYPE_UNSPECIFIED = 520665615
+        ENABLED = 182130465
+        NONE = 2402104
+
+    class Status(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            CREATING (455564985):
+                No description available.
+            DELETING (528602024):
+                No description available.
+            INVALID (530283991):
+                No description available.
+            READY (77848963):
+                No description available.
+            REPAIRING (413483285):
+                No description available.
+        """
+        UNDEFINED_STATUS = 0
+        CREATING = 455564985
+        DELETING = 528602024
+        INVALID = 530283991
+        READY = 77848963
+        REPAIRING = 413483285
+
+    accelerators: MutableSequence[
+        shared_accelerator_config.AcceleratorConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=269577064,
+        message=shared_accelerator_config.AcceleratorConfig,
+    )
+    consumed_resources: "InstanceConsumptionInfo" = proto.Field(
+        proto.MESSAGE,
+        number=334527118,
+        optional=True,
+        message="InstanceConsumptionInfo",
+    )
+    cpu_overcommit_type: str = proto.Field(
+        proto.STRING,
+        number=247727959,
+        optional=True,
+    )
+    disks: MutableSequence[shared_local_disk.LocalDisk] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=95594102,
+        message=shared_local_disk.LocalDisk,
+    )
+    instance_consumption_data: MutableSequence[
+        "InstanceConsumptionData"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=84715576,
+        message="InstanceConsumptionData",
+    )
+    instances: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=29097598,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    node_type: str = proto.Field(
+        proto.STRING,
+        number=465832791,
+        optional=True,
+    )
+    satisfies_pzs: bool = proto.Field(
+        proto.BOOL,
+        number=480964267,
+        optional=True,
+    )
+    server_binding: shared_local_disk.ServerBinding = proto.Field(
+        proto.MESSAGE,
+        number=208179593,
+        optional=True,
+        message=shared_local_disk.ServerBinding,
+    )
+    server_id: str = proto.Field(
+        proto.STRING,
+        number=339433367,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    total_resources: "InstanceConsumptionInfo" = proto.Field(
+        proto.MESSAGE,
+        number=97406698,
+        optional=True,
+        message="InstanceConsumptionInfo",
+    )
+
+
+class NodeGroupsAddNodesRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        additional_node_count (int):
+            Count of additional nodes to be added to the
+            node group.
+
+            This field is a member of `oneof`_ ``_additional_node_count``.
+    """
+
+    additional_node_count: int = proto.Field(
+        proto.INT32,
+        number=134997930,
+        optional=True,
+    )
+
+
+class NodeGroupsDeleteNodesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        nodes (MutableSequence[str]):
+            Names of the nodes to delete.
+    """
+
+    nodes: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=104993457,
+    )
+
+
+class NodeGroupsListNodes(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.NodeGroupNode]):
+            A list of Node resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute.nodeGroupsListNodes for the list of nodes in the
+            specified node group.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["NodeGroupNode"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="NodeGroupNode",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class NodeGroupsScopedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        node_groups (MutableSequence[google.cloud.compute_v1.types.NodeGroup]):
+            [Output Only] A list of node groups contained in this scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] An informational warning that appears when the
+            nodeGroup list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    node_groups: MutableSequence["NodeGroup"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=73188017,
+        message="NodeGroup",
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class NodeGroupsSetNodeTemplateRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        node_template (str):
+            Full or partial URL of the node template
+            resource to be updated for this node group.
+
+            This field is a member of `oneof`_ ``_node_template``.
+    """
+
+    node_template: str = proto.Field(
+        proto.STRING,
+        number=323154455,
+        optional=True,
+    )
+
+
+class NodeGroupsSimulateMaintenanceEventRequest(proto.Message):
+    r"""
+
+    Attributes:
+        nodes (MutableSequence[str]):
+            Names of the nodes to go under maintenance
+            simulation.
+    """
+
+    nodes: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=104993457,
+    )
+
+
+class PatchNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.Patch. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        node_group (str):
+            Name of the NodeGroup resource to update.
+        node_group_resource (google.cloud.compute_v1.types.NodeGroup):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    node_group: str = proto.Field(
+        proto.STRING,
+        number=469958146,
+    )
+    node_group_resource: "NodeGroup" = proto.Field(
+        proto.MESSAGE,
+        number=505321899,
+        message="NodeGroup",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SetIamPolicyNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.SetIamPolicy. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        zone (str):
+            The name of the zone for this request.
+        zone_set_policy_request_resource (google.cloud.compute_v1.types.ZoneSetPolicyRequest):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+    zone_set_policy_request_resource: shared_zone_set_policy_request.ZoneSetPolicyRequest = proto.Field(
+        proto.MESSAGE,
+        number=382082107,
+        message=shared_zone_set_policy_request.ZoneSetPolicyRequest,
+    )
+
+
+class SetNodeTemplateNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.SetNodeTemplate. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        node_group (str):
+            Name of the NodeGroup resource to update.
+        node_groups_set_node_template_request_resource (google.cloud.compute_v1.types.NodeGroupsSetNodeTemplateRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    node_group: str = proto.Field(
+        proto.STRING,
+        number=469958146,
+    )
+    node_groups_set_node_template_request_resource: "NodeGroupsSetNodeTemplateRequest" = proto.Field(
+        proto.MESSAGE,
+        number=117382321,
+        message="NodeGroupsSetNodeTemplateRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class SimulateMaintenanceEventNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.SimulateMaintenanceEvent.
+    See the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        node_group (str):
+            Name of the NodeGroup resource whose nodes
+            will go under maintenance simulation.
+        node_groups_simulate_maintenance_event_request_resource (google.cloud.compute_v1.types.NodeGroupsSimulateMaintenanceEventRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    node_group: str = proto.Field(
+        proto.STRING,
+        number=469958146,
+    )
+    node_groups_simulate_maintenance_event_request_resource: "NodeGroupsSimulateMaintenanceEventRequest" = proto.Field(
+        proto.MESSAGE,
+        number=351468764,
+        message="NodeGroupsSimulateMaintenanceEventRequest",
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+class TestIamPermissionsNodeGroupRequest(proto.Message):
+    r"""A request message for NodeGroups.TestIamPermissions. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    test_permissions_request_resource: shared_test_permissions_request.TestPermissionsRequest = proto.Field(
+        proto.MESSAGE,
+        number=439214758,
+        message=shared_test_permissions_request.TestPermissionsRequest,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,852 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AnnouncePublicAdvertisedPrefixeRequest",
+        "DeletePublicAdvertisedPrefixeRequest",
+        "GetPublicAdvertisedPrefixeRequest",
+        "InsertPublicAdvertisedPrefixeRequest",
+        "ListPublicAdvertisedPrefixesRequest",
+        "PatchPublicAdvertisedPrefixeRequest",
+        "PublicAdvertisedPrefix",
+        "PublicAdvertisedPrefixList",
+        "PublicAdvertisedPrefixPublicDelegatedPrefix",
+        "WithdrawPublicAdvertisedPrefixeRequest",
+    },
+)
+
+
+class AnnouncePublicAdvertisedPrefixeRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.Announce. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        public_advertised_prefix (str):
+            The name of the public advertised prefix. It
+            should comply with RFC1035.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    public_advertised_prefix: str = proto.Field(
+        proto.STRING,
+        number=101874590,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class DeletePublicAdvertisedPrefixeRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.Delete. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        public_advertised_prefix (str):
+            Name of the PublicAdvertisedPrefix resource
+            to delete.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    public_advertised_prefix: str = proto.Field(
+        proto.STRING,
+        number=101874590,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class GetPublicAdvertisedPrefixeRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.Get. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        public_advertised_prefix (str):
+            Name of the PublicAdvertisedPrefix resource
+            to return.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    public_advertised_prefix: str = proto.Field(
+        proto.STRING,
+        number=101874590,
+    )
+
+
+class InsertPublicAdvertisedPrefixeRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.Insert. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        public_advertised_prefix_resource (google.cloud.compute_v1.types.PublicAdvertisedPrefix):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    public_advertised_prefix_resource: "PublicAdvertisedPrefix" = proto.Field(
+        proto.MESSAGE,
+        number=233614223,
+        message="PublicAdvertisedPrefix",
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class ListPublicAdvertisedPrefixesRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.List. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class PatchPublicAdvertisedPrefixeRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.Patch. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        public_advertised_prefix (str):
+            Name of the PublicAdvertisedPrefix resource
+            to patch.
+        public_advertised_prefix_resource (google.cloud.compute_v1.types.PublicAdvertisedPrefix):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    public_advertised_prefix: str = proto.Field(
+        proto.STRING,
+        number=101874590,
+    )
+    public_advertised_prefix_resource: "PublicAdvertisedPrefix" = proto.Field(
+        proto.MESSAGE,
+        number=233614223,
+        message="PublicAdvertisedPrefix",
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class PublicAdvertisedPrefix(proto.Message):
+    r"""A public advertised prefix represents an aggregated IP prefix
+    or netblock which customers bring to cloud. The IP prefix is a
+    single unit of route advertisement and is announced globally to
+    the internet.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        byoip_api_version (str):
+            [Output Only] The version of BYOIP API. Check the
+            ByoipApiVersion enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_byoip_api_version``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        dns_verification_ip (str):
+            The address to be used for reverse DNS
+            verification.
+
+            This field is a member of `oneof`_ ``_dns_verification_ip``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a new
+            PublicAdvertisedPrefix. An up-to-date
+            fingerprint must be provided in order to update
+            the PublicAdvertisedPrefix, otherwise the
+            request will fail with error 412
+            conditionNotMet. To see the latest fingerprint,
+            make a get() request to retrieve a
+            PublicAdvertisedPrefix.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource type.
+            The server generates this identifier.
+
+            This field is a member of `oneof`_ ``_id``.
+        ip_cidr_range (str):
+            The address range, in CIDR format,
+            represented by this public advertised prefix.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#publicAdvertisedPrefix for public advertised
+            prefixes.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        pdp_scope (str):
+            Specifies how child public delegated prefix will be scoped.
+            It could be one of following values: - ``REGIONAL``: The
+            public delegated prefix is regional only. The provisioning
+            will take a few minutes. - ``GLOBAL``: The public delegated
+            prefix is global only. The provisioning will take ~4 weeks.
+            - ``GLOBAL_AND_REGIONAL`` [output only]: The public
+            delegated prefixes is BYOIP V1 legacy prefix. This is output
+            only value and no longer supported in BYOIP V2. Check the
+            PdpScope enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_pdp_scope``.
+        public_delegated_prefixs (MutableSequence[google.cloud.compute_v1.types.PublicAdvertisedPrefixPublicDelegatedPrefix]):
+            [Output Only] The list of public delegated prefixes that
+            exist for this public advertised prefix.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        shared_secret (str):
+            [Output Only] The shared secret to be used for reverse DNS
+            verification.
+
+            This field is a member of `oneof`_ ``_shared_secret``.
+        status (str):
+            The status of the public advertised prefix. Possible values
+            include: - ``INITIAL``: RPKI validation is complete. -
+            ``PTR_CONFIGURED``: User has configured the PTR. -
+            ``VALIDATED``: Reverse DNS lookup is successful. -
+            ``REVERSE_DNS_LOOKUP_FAILED``: Reverse DNS lookup failed. -
+            ``PREFIX_CONFIGURATION_IN_PROGRESS``: The prefix is being
+            configured. - ``PREFIX_CONFIGURATION_COMPLETE``: The prefix
+            is fully configured. - ``PREFIX_REMOVAL_IN_PROGRESS``: The
+            prefix is being removed. Check the Status enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    class ByoipApiVersion(proto.Enum):
+        r"""[Output Only] The version of BYOIP API.
+
+        Values:
+            UNDEFINED_BYOIP_API_VERSION (0):
+                A value indicating that the enum field is not
+                set.
+            V1 (2715):
+                This public advertised prefix can be used to
+                create both regional and global public delegated
+                prefixes. It usually takes 4 weeks to create or
+                delete a public delegated prefix. The BGP status
+                cannot be changed.
+            V2 (2716):
+                This public advertised prefix can only be
+                used to create regional public delegated
+                prefixes. Public delegated prefix creation and
+                deletion takes minutes and the BGP status can be
+                modified.
+        """
+        UNDEFINED_BYOIP_API_VERSION = 0
+        V1 = 2715
+        V2 = 2716
+
+    class PdpScope(proto.Enum):
+        r"""Specifies how child public delegated prefix will be scoped. It could
+        be one of following values: - ``REGIONAL``: The public delegated
+        prefix is regional only. The provisioning will take a few minutes. -
+        ``GLOBAL``: The public delegated prefix is global only. The
+        provisioning will take ~4 weeks. - ``GLOBAL_AND_REGIONAL`` [output
+        only]: The public delegated prefixes is BYOIP V1 legacy prefix. This
+        is output only value and no longer supported in BYOIP V2.
+
+        Values:
+            UNDEFINED_PDP_SCOPE (0):
+                A value indicating that the enum field is not
+                set.
+            GLOBAL (494663587):
+                The public delegated prefix is global only.
+                The provisioning will take ~4 weeks.
+            GLOBAL_AND_REGIONAL (318053059):
+                The public delegated prefixes is BYOIP V1
+                legacy prefix. This is output only value and no
+                longer supported in BYOIP V2.
+            REGIONAL (92288543):
+                The public delegated prefix is regional only.
+                The provisioning will take a few minutes.
+        """
+        UNDEFINED_PDP_SCOPE = 0
+        GLOBAL = 494663587
+        GLOBAL_AND_REGIONAL = 318053059
+        REGIONAL = 92288543
+
+    class Status(proto.Enum):
+        r"""The status of the public advertised prefix. Possible values include:
+        - ``INITIAL``: RPKI validation is complete. - ``PTR_CONFIGURED``:
+        User has configured the PTR. - ``VALIDATED``: Reverse DNS lookup is
+        successful. - ``REVERSE_DNS_LOOKUP_FAILED``: Reverse DNS lookup
+        failed. - ``PREFIX_CONFIGURATION_IN_PROGRESS``: The prefix is being
+        configured. - ``PREFIX_CONFIGURATION_COMPLETE``: The prefix is fully
+        configured. - ``PREFIX_REMOVAL_IN_PROGRESS``: The prefix is being
+        removed.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            ANNOUNCED_TO_INTERNET (177880897):
+                The prefix is announced to Internet.
+            INITIAL (518841124):
+                RPKI validation is complete.
+            PREFIX_CONFIGURATION_COMPLETE (480889551):
+                The prefix is fully configured.
+            PREFIX_CONFIGURATION_IN_PROGRESS (378550961):
+                The prefix is being configured.
+            PREFIX_REMOVAL_IN_PROGRESS (284375783):
+                The prefix is being removed.
+            PTR_CONFIGURED (513497167):
+                User has configured the PTR.
+            READY_TO_ANNOUNCE (64641265):
+                The prefix is currently withdrawn but ready
+                to be announced.
+            REVERSE_DNS_LOOKUP_FAILED (295755183):
+                Reverse DNS lookup failed.
+            VALIDATED (66197998):
+                Reverse DNS lookup is successful.
+        """
+        UNDEFINED_STATUS = 0
+        ANNOUNCED_TO_INTERNET = 177880897
+        INITIAL = 518841124
+        PREFIX_CONFIGURATION_COMPLETE = 480889551
+        PREFIX_CONFIGURATION_IN_PROGRESS = 378550961
+        PREFIX_REMOVAL_IN_PROGRESS = 284375783
+        PTR_CONFIGURED = 513497167
+        READY_TO_ANNOUNCE = 64641265
+        REVERSE_DNS_LOOKUP_FAILED = 295755183
+        VALIDATED = 66197998
+
+    byoip_api_version: str = proto.Field(
+        proto.STRING,
+        number=162683283,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    dns_verification_ip: str = proto.Field(
+        proto.STRING,
+        number=241011381,
+        optional=True,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    ip_cidr_range: str = proto.Field(
+        proto.STRING,
+        number=98117322,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    pdp_scope: str = proto.Field(
+        proto.STRING,
+        number=524264785,
+        optional=True,
+    )
+    public_delegated_prefixs: MutableSequence[
+        "PublicAdvertisedPrefixPublicDelegatedPrefix"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=425811723,
+        message="PublicAdvertisedPrefixPublicDelegatedPrefix",
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    shared_secret: str = proto.Field(
+        proto.STRING,
+        number=381932490,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+
+
+class PublicAdvertisedPrefixList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.PublicAdvertisedPrefix]):
+            A list of PublicAdvertisedPrefix resources.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#publicAdvertisedPrefix for public advertised
+            prefixes.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["PublicAdvertisedPrefix"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="PublicAdvertisedPrefix",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class PublicAdvertisedPrefixPublicDelegatedPrefix(proto.Message):
+    r"""Represents a CIDR range which can be used to assign
+    addresses.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ip_range (str):
+            The IP address range of the public delegated
+            prefix
+
+            This field is a member of `oneof`_ ``_ip_range``.
+        name (str):
+            The name of the public delegated prefix
+
+            This field is a member of `oneof`_ ``_name``.
+        project (str):
+            The project number of the public delegated
+            prefix
+
+            This field is a member of `oneof`_ ``_project``.
+        region (str):
+            The region of the public delegated prefix if
+            it is regional. If absent, the prefix is global.
+
+            This field is a member of `oneof`_ ``_region``.
+        status (str):
+            The status of the public delegated prefix.
+            Possible values are: INITIALIZING: The public
+            delegated prefix is being initialized and
+            addresses cannot be created yet. ANNOUNCED: The
+            public delegated prefix is active.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    ip_range: str = proto.Field(
+        proto.STRING,
+        number=145092645,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+
+
+class WithdrawPublicAdvertisedPrefixeRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.Withdraw. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        public_advertised_prefix (str):
+            The name of the public advertised prefix. It
+            should comply with RFC1035.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    public_advertised_prefix: str = proto.Field(
+        proto.STRING,
+        number=101874590,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,1929 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_per_instance_config
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AbandonInstancesRegionInstanceGroupManagerRequest",
+        "ApplyUpdatesToInstancesRegionInstanceGroupManagerRequest",
+        "CreateInstancesRegionInstanceGroupManagerRequest",
+        "DeleteInstancesRegionInstanceGroupManagerRequest",
+        "DeletePerInstanceConfigsRegionInstanceGroupManagerRequest",
+        "DeleteRegionInstanceGroupManagerRequest",
+        "GetRegionInstanceGroupManagerRequest",
+        "InsertRegionInstanceGroupManagerRequest",
+        "ListErrorsRegionInstanceGroupManagersRequest",
+        "ListManagedInstancesRegionInstanceGroupManagersRequest",
+        "ListPerInstanceConfigsRegionInstanceGroupManagersRequest",
+        "ListRegionInstanceGroupManagersRequest",
+        "PatchPerInstanceConfigsRegionInstanceGroupManagerRequest",
+        "PatchRegionInstanceGroupManagerRequest",
+        "RecreateInstancesRegionInstanceGroupManagerRequest",
+        "RegionInstanceGroupManagerDeleteInstanceConfigReq",
+        "RegionInstanceGroupManagerList",
+        "RegionInstanceGroupManagerPatchInstanceConfigReq",
+        "RegionInstanceGroupManagerUpdateInstanceConfigReq",
+        "RegionInstanceGroupManagersAbandonInstancesRequest",
+        "RegionInstanceGroupManagersApplyUpdatesRequest",
+        "RegionInstanceGroupManagersCreateInstancesRequest",
+        "RegionInstanceGroupManagersDeleteInstancesRequest",
+        "RegionInstanceGroupManagersListErrorsResponse",
+        "RegionInstanceGroupManagersListInstanceConfigsResp",
+        "RegionInstanceGroupManagersListInstancesResponse",
+        "RegionInstanceGroupManagersRecreateRequest",
+        "RegionInstanceGroupManagersSetTargetPoolsRequest",
+        "RegionInstanceGroupManagersSetTemplateRequest",
+        "ResizeRegionInstanceGroupManagerRequest",
+        "SetInstanceTemplateRegionInstanceGroupManagerRequest",
+        "SetTargetPoolsRegionInstanceGroupManagerRequest",
+        "UpdatePerInstanceConfigsRegionInstanceGroupManagerRequest",
+    },
+)
+
+
+class AbandonInstancesRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.AbandonInstances. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            Name of the managed instance group.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        region_instance_group_managers_abandon_instances_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersAbandonInstancesRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_instance_group_managers_abandon_instances_request_resource: "RegionInstanceGroupManagersAbandonInstancesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=488499491,
+        message="RegionInstanceGroupManagersAbandonInstancesRequest",
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class ApplyUpdatesToInstancesRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.ApplyUpdatesToInstances. See the
+    method description for details.
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group,
+            should conform to RFC1035.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request,
+            should conform to RFC1035.
+        region_instance_group_managers_apply_updates_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersApplyUpdatesRequest):
+            The body resource for this request
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_instance_group_managers_apply_updates_request_resource: "RegionInstanceGroupManagersApplyUpdatesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=76248318,
+        message="RegionInstanceGroupManagersApplyUpdatesRequest",
+    )
+
+
+class CreateInstancesRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.CreateInstances. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group. It
+            should conform to RFC1035.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region where the managed
+            instance group is located. It should conform to
+            RFC1035.
+        region_instance_group_managers_create_instances_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersCreateInstancesRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. The request ID must be a valid UUID
+            with the exception that zero UUID is not
+            supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_instance_group_managers_create_instances_request_resource: "RegionInstanceGroupManagersCreateInstancesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=359014280,
+        message="RegionInstanceGroupManagersCreateInstancesRequest",
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class DeleteInstancesRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.DeleteInstances. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            Name of the managed instance group.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        region_instance_group_managers_delete_instances_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersDeleteInstancesRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_instance_group_managers_delete_instances_request_resource: "RegionInstanceGroupManagersDeleteInstancesRequest" = proto.Field(
+        proto.MESSAGE,
+        number=500876665,
+        message="RegionInstanceGroupManagersDeleteInstancesRequest",
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class DeletePerInstanceConfigsRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.DeletePerInstanceConfigs. See the
+    method description for details.
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group. It
+            should conform to RFC1035.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request,
+            should conform to RFC1035.
+        region_instance_group_manager_delete_instance_config_req_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagerDeleteInstanceConfigReq):
+            The body resource for this request
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_instance_group_manager_delete_instance_config_req_resource: "RegionInstanceGroupManagerDeleteInstanceConfigReq" = proto.Field(
+        proto.MESSAGE,
+        number=740741,
+        message="RegionInstanceGroupManagerDeleteInstanceConfigReq",
+    )
+
+
+class DeleteRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for RegionInstanceGroupManagers.Delete. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            Name of the managed instance group to delete.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class GetRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for RegionInstanceGroupManagers.Get. See
+    the method description for details.
+
+    Attributes:
+        instance_group_manager (str):
+            Name of the managed instance group to return.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+
+
+class InsertRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for RegionInstanceGroupManagers.Insert. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager_resource (google.cloud.compute_v1.types.InstanceGroupManager):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager_resource: shared_per_instance_config.InstanceGroupManager = (
+        proto.Field(
+            proto.MESSAGE,
+            number=261063946,
+            message=shared_per_instance_config.InstanceGroupManager,
+        )
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class ListErrorsRegionInstanceGroupManagersRequest(proto.Message):
+    r"""A request message for RegionInstanceGroupManagers.ListErrors.
+    See the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        instance_group_manager (str):
+            The name of the managed instance group. It must be a string
+            that meets the requirements in RFC1035, or an unsigned long
+            integer: must match regexp pattern:
+            (?:`a-z <?:[-a-z0-9]{0,61}[a-z0-9]>`__?)|1-9{0,19}.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request. This
+            should conform to RFC1035.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class ListManagedInstancesRegionInstanceGroupManagersRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.ListManagedInstances. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        instance_group_manager (str):
+            The name of the managed instance group.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class ListPerInstanceConfigsRegionInstanceGroupManagersRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.ListPerInstanceConfigs. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        instance_group_manager (str):
+            The name of the managed instance group. It
+            should conform to RFC1035.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request,
+            should conform to RFC1035.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class ListRegionInstanceGroupManagersRequest(proto.Message):
+    r"""A request message for RegionInstanceGroupManagers.List. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class PatchPerInstanceConfigsRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.PatchPerInstanceConfigs. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group. It
+            should conform to RFC1035.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request,
+            should conform to RFC1035.
+        region_instance_group_manager_patch_instance_config_req_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagerPatchInstanceConfigReq):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_instance_group_manager_patch_instance_config_req_resource: "RegionInstanceGroupManagerPatchInstanceConfigReq" = proto.Field(
+        proto.MESSAGE,
+        number=197682890,
+        message="RegionInstanceGroupManagerPatchInstanceConfigReq",
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class PatchRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for RegionInstanceGroupManagers.Patch. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the instance group manager.
+        instance_group_manager_resource (google.cloud.compute_v1.types.InstanceGroupManager):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    instance_group_manager_resource: shared_per_instance_config.InstanceGroupManager = (
+        proto.Field(
+            proto.MESSAGE,
+            number=261063946,
+            message=shared_per_instance_config.InstanceGroupManager,
+        )
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class RecreateInstancesRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.RecreateInstances. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            Name of the managed instance group.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        region_instance_group_managers_recreate_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersRecreateRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_instance_group_managers_recreate_request_resource: "RegionInstanceGroupManagersRecreateRequest" = proto.Field(
+        proto.MESSAGE,
+        number=170999316,
+        message="RegionInstanceGroupManagersRecreateRequest",
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class RegionInstanceGroupManagerDeleteInstanceConfigReq(proto.Message):
+    r"""RegionInstanceGroupManagers.deletePerInstanceConfigs
+
+    Attributes:
+        names (MutableSequence[str]):
+            The list of instance names for which we want
+            to delete per-instance configs on this managed
+            instance group.
+    """
+
+    names: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=104585032,
+    )
+
+
+class RegionInstanceGroupManagerList(proto.Message):
+    r"""Contains a list of managed instance groups.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.InstanceGroupManager]):
+            A list of InstanceGroupManager resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#instanceGroupManagerList for a list of managed
+            instance groups that exist in th regional scope.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence[
+        shared_per_instance_config.InstanceGroupManager
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message=shared_per_instance_config.InstanceGroupManager,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class RegionInstanceGroupManagerPatchInstanceConfigReq(proto.Message):
+    r"""RegionInstanceGroupManagers.patchPerInstanceConfigs
+
+    Attributes:
+        per_instance_configs (MutableSequence[google.cloud.compute_v1.types.PerInstanceConfig]):
+            The list of per-instance configurations to
+            insert or patch on this managed instance group.
+    """
+
+    per_instance_configs: MutableSequence[
+        shared_per_instance_config.PerInstanceConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=526265001,
+        message=shared_per_instance_config.PerInstanceConfig,
+    )
+
+
+class RegionInstanceGroupManagerUpdateInstanceConfigReq(proto.Message):
+    r"""RegionInstanceGroupManagers.updatePerInstanceConfigs
+
+    Attributes:
+        per_instance_configs (MutableSequence[google.cloud.compute_v1.types.PerInstanceConfig]):
+            The list of per-instance configurations to
+            insert or patch on this managed instance group.
+    """
+
+    per_instance_configs: MutableSequence[
+        shared_per_instance_config.PerInstanceConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=526265001,
+        message=shared_per_instance_config.PerInstanceConfig,
+    )
+
+
+class RegionInstanceGroupManagersAbandonInstancesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        instances (MutableSequence[str]):
+            The URLs of one or more instances to abandon. This can be a
+            full URL or a partial URL, such as
+            zones/[ZONE]/instances/[INSTANCE_NAME].
+    """
+
+    instances: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=29097598,
+    )
+
+
+class RegionInstanceGroupManagersApplyUpdatesRequest(proto.Message):
+    r"""RegionInstanceGroupManagers.applyUpdatesToInstances
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        all_instances (bool):
+            Flag to update all instances instead of
+            specified list of “instances”. If the flag is
+            set to true then the instances may not be
+            specified in the request.
+
+            This field is a member of `oneof`_ ``_all_instances``.
+        instances (MutableSequence[str]):
+            The list of URLs of one or more instances for which you want
+            to apply updates. Each URL can be a full URL or a partial
+            URL, such as zones/[ZONE]/instances/[INSTANCE_NAME].
+        minimal_action (str):
+            The minimal action that you want to perform
+            on each instance during the update: - REPLACE:
+            At minimum, delete the instance and create it
+            again. - RESTART: Stop the instance and start it
+            again. - REFRESH: Do not stop the instance and
+            limit disruption as much as possible. - NONE: Do
+            not disrupt the instance at all. By default, the
+            minimum action is NONE. If your update requires
+            a more disruptive action than you set with this
+            flag, the necessary action is performed to
+            execute the update. Check the MinimalAction enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_minimal_action``.
+        most_disruptive_allowed_action (str):
+            The most disruptive action that you want to
+            perform on each instance during the update: -
+            REPLACE: Delete the instance and create it
+            again. - RESTART: Stop the instance and start it
+            again. - REFRESH: Do not stop the instance and
+            limit disruption as much as possible. - NONE: Do
+            not disrupt the instance at all. By default, the
+            most disruptive allowed action is REPLACE. If
+            your update requires a more disruptive action
+            than you set with this flag, the update request
+            will fail. Check the MostDisruptiveAllowedAction
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_most_disruptive_allowed_action``.
+    """
+
+    class MinimalAction(proto.Enum):
+        r"""The minimal action that you want to perform on each instance
+        during the update: - REPLACE: At minimum, delete the instance
+        and create it again. - RESTART: Stop the instance and start it
+        again. - REFRESH: Do not stop the instance and limit disruption
+        as much as possible. - NONE: Do not disrupt the instance at all.
+        By default, the minimum action is NONE. If your update requires
+        a more disruptive action than you set with this flag, the
+        necessary action is performed to execute the update. Additional
+        supported values which may be not listed in the enum directly
+        due to technical reasons:
+
+        NONE
+        REFRESH
+        REPLACE
+        RESTART
+
+        Values:
+            UNDEFINED_MINIMAL_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_MINIMAL_ACTION = 0
+
+    class MostDisruptiveAllowedAction(proto.Enum):
+        r"""The most disruptive action that you want to perform on each
+        instance during the update: - REPLACE: Delete the instance and
+        create it again. - RESTART: Stop the instance and start it
+        again. - REFRESH: Do not stop the instance and limit disruption
+        as much as possible. - NONE: Do not disrupt the instance at all.
+        By default, the most disruptive allowed action is REPLACE. If
+        your update requires a more disruptive action than you set with
+        this flag, the update request will fail. Additional supported
+        values which may be not listed in the enum directly due to
+        technical reasons:
+
+        NONE
+        REFRESH
+        REPLACE
+        RESTART
+
+        Values:
+            UNDEFINED_MOST_DISRUPTIVE_ALLOWED_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_MOST_DISRUPTIVE_ALLOWED_ACTION = 0
+
+    all_instances: bool = proto.Field(
+        proto.BOOL,
+        number=403676512,
+        optional=True,
+    )
+    instances: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=29097598,
+    )
+    minimal_action: str = proto.Field(
+        proto.STRING,
+        number=270567060,
+        optional=True,
+    )
+    most_disruptive_allowed_action: str = proto.Field(
+        proto.STRING,
+        number=66103053,
+        optional=True,
+    )
+
+
+class RegionInstanceGroupManagersCreateInstancesRequest(proto.Message):
+    r"""RegionInstanceGroupManagers.createInstances
+
+    Attributes:
+        instances (MutableSequence[google.cloud.compute_v1.types.PerInstanceConfig]):
+            [Required] List of specifications of per-instance configs.
+    """
+
+    instances: MutableSequence[
+        shared_per_instance_config.PerInstanceConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=29097598,
+        message=shared_per_instance_config.PerInstanceConfig,
+    )
+
+
+class RegionInstanceGroupManagersDeleteInstancesRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instances (MutableSequence[str]):
+            The URLs of one or more instances to delete. This can be a
+            full URL or a partial URL, such as
+            zones/[ZONE]/instances/[INSTANCE_NAME].
+        skip_instances_on_validation_error (bool):
+            Specifies whether the request should proceed despite the
+            inclusion of instances that are not members of the group or
+            that are already in the process of being deleted or
+            abandoned. If this field is set to ``false`` and such an
+            instance is specified in the request, the operation fails.
+            The operation always fails if the request contains a
+            malformed instance URL or a reference to an instance that
+            exists in a zone or region other than the group's zone or
+            region.
+
+            This field is a member of `oneof`_ ``_skip_instances_on_validation_error``.
+    """
+
+    instances: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=29097598,
+    )
+    skip_instances_on_validation_error: bool = proto.Field(
+        proto.BOOL,
+        number=40631073,
+        optional=True,
+    )
+
+
+class RegionInstanceGroupManagersListErrorsResponse(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        items (MutableSequence[google.cloud.compute_v1.types.InstanceManagedByIgmError]):
+            [Output Only] The list of errors of the managed instance
+            group.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    items: MutableSequence[
+        shared_per_instance_config.InstanceManagedByIgmError
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message=shared_per_instance_config.InstanceManagedByIgmError,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+
+
+class RegionInstanceGroupManagersListInstanceConfigsResp(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        items (MutableSequence[google.cloud.compute_v1.types.PerInstanceConfig]):
+            [Output Only] The list of PerInstanceConfig.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    items: MutableSequence[
+        shared_per_instance_config.PerInstanceConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message=shared_per_instance_config.PerInstanceConfig,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class RegionInstanceGroupManagersListInstancesResponse(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        managed_instances (MutableSequence[google.cloud.compute_v1.types.ManagedInstance]):
+            A list of managed instances.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    managed_instances: MutableSequence[
+        shared_per_instance_config.ManagedInstance
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=336219614,
+        message=shared_per_instance_config.ManagedInstance,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+
+
+class RegionInstanceGroupManagersRecreateRequest(proto.Message):
+    r"""
+
+    Attributes:
+        instances (MutableSequence[str]):
+            The URLs of one or more instances to recreate. This can be a
+            full URL or a partial URL, such as
+            zones/[ZONE]/instances/[INSTANCE_NAME].
+    """
+
+    instances: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=29097598,
+    )
+
+
+class RegionInstanceGroupManagersSetTargetPoolsRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        fingerprint (str):
+            Fingerprint of the target pools information,
+            which is a hash of the contents. This field is
+            used for optimistic locking when you update the
+            target pool entries. This field is optional.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        target_pools (MutableSequence[str]):
+            The URL of all TargetPool resources to which
+            instances in the instanceGroup field are added.
+            The target pools automatically apply to all of
+            the instances in the managed instance group.
+    """
+
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    target_pools: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=336072617,
+    )
+
+
+class RegionInstanceGroupManagersSetTemplateRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_template (str):
+            URL of the InstanceTemplate resource from
+            which all new instances will be created.
+
+            This field is a member of `oneof`_ ``_instance_template``.
+    """
+
+    instance_template: str = proto.Field(
+        proto.STRING,
+        number=309248228,
+        optional=True,
+    )
+
+
+class ResizeRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for RegionInstanceGroupManagers.Resize. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            Name of the managed instance group.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        size (int):
+            Number of instances that should exist in this
+            instance group manager.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    size: int = proto.Field(
+        proto.INT32,
+        number=3530753,
+    )
+
+
+class SetInstanceTemplateRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.SetInstanceTemplate. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        region_instance_group_managers_set_template_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersSetTemplateRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_instance_group_managers_set_template_request_resource: "RegionInstanceGroupManagersSetTemplateRequest" = proto.Field(
+        proto.MESSAGE,
+        number=187310412,
+        message="RegionInstanceGroupManagersSetTemplateRequest",
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class SetTargetPoolsRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.SetTargetPools. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            Name of the managed instance group.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        region_instance_group_managers_set_target_pools_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersSetTargetPoolsRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_instance_group_managers_set_target_pools_request_resource: "RegionInstanceGroupManagersSetTargetPoolsRequest" = proto.Field(
+        proto.MESSAGE,
+        number=78734717,
+        message="RegionInstanceGroupManagersSetTargetPoolsRequest",
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+class UpdatePerInstanceConfigsRegionInstanceGroupManagerRequest(proto.Message):
+    r"""A request message for
+    RegionInstanceGroupManagers.UpdatePerInstanceConfigs. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_group_manager (str):
+            The name of the managed instance group. It
+            should conform to RFC1035.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request,
+            should conform to RFC1035.
+        region_instance_group_manager_update_instance_config_req_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagerUpdateInstanceConfigReq):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_group_manager: str = proto.Field(
+        proto.STRING,
+        number=249363395,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_instance_group_manager_update_instance_config_req_resource: "RegionInstanceGroupManagerUpdateInstanceConfigReq" = proto.Field(
+        proto.MESSAGE,
+        number=89036583,
+        message="RegionInstanceGroupManagerUpdateInstanceConfigReq",
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
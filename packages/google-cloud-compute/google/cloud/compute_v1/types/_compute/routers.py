@@ -0,0 +1,4047 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_route
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListRoutersRequest",
+        "BfdPacket",
+        "BfdStatus",
+        "BfdStatusPacketCounts",
+        "DeleteRouterRequest",
+        "GetNatIpInfoRouterRequest",
+        "GetNatMappingInfoRoutersRequest",
+        "GetRouterRequest",
+        "GetRouterStatusRouterRequest",
+        "InsertRouterRequest",
+        "ListRoutersRequest",
+        "NatIpInfo",
+        "NatIpInfoNatIpInfoMapping",
+        "NatIpInfoResponse",
+        "PacketIntervals",
+        "PatchRouterRequest",
+        "PreviewRouterRequest",
+        "Router",
+        "RouterAdvertisedIpRange",
+        "RouterAggregatedList",
+        "RouterBgp",
+        "RouterBgpPeer",
+        "RouterBgpPeerBfd",
+        "RouterBgpPeerCustomLearnedIpRange",
+        "RouterInterface",
+        "RouterList",
+        "RouterMd5AuthenticationKey",
+        "RouterNat",
+        "RouterNatLogConfig",
+        "RouterNatRule",
+        "RouterNatRuleAction",
+        "RouterNatSubnetworkToNat",
+        "RouterStatus",
+        "RouterStatusBgpPeerStatus",
+        "RouterStatusNatStatus",
+        "RouterStatusNatStatusNatRuleStatus",
+        "RouterStatusResponse",
+        "RoutersPreviewResponse",
+        "RoutersScopedList",
+        "UpdateRouterRequest",
+        "VmEndpointNatMappings",
+        "VmEndpointNatMappingsInterfaceNatMappings",
+        "VmEndpointNatMappingsInterfaceNatMappingsNatRuleMappings",
+        "VmEndpointNatMappingsList",
+    },
+)
+
+
+class AggregatedListRoutersRequest(proto.Message):
+    r"""A request message for Routers.AggregatedList. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        service_project_number (int):
+
+            This field is a member of `oneof`_ ``_service_project_number``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    include_all_scopes: bool = proto.Field(
+        proto.BOOL,
+        number=391327988,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    service_project_number: int = proto.Field(
+        proto.INT64,
+        number=316757497,
+        optional=True,
+    )
+
+
+class BfdPacket(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        authentication_present (bool):
+            The Authentication Present bit of the BFD
+            packet. This is specified in section 4.1 of
+            RFC5880
+
+            This field is a member of `oneof`_ ``_authentication_present``.
+        control_plane_independent (bool):
+            The Control Plane Independent bit of the BFD
+            packet. This is specified in section 4.1 of
+            RFC5880
+
+            This field is a member of `oneof`_ ``_control_plane_independent``.
+        demand (bool):
+            The demand bit of the BFD packet. This is
+            specified in section 4.1 of RFC5880
+
+            This field is a member of `oneof`_ ``_demand``.
+        diagnostic (str):
+            The diagnostic code specifies the local
+            system's reason for the last change in session
+            state. This allows remote systems to determine
+            the reason that the previous session failed, for
+            example. These diagnostic codes are specified in
+            section 4.1 of RFC5880 Check the Diagnostic enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_diagnostic``.
+        final (bool):
+            The Final bit of the BFD packet. This is
+            specified in section 4.1 of RFC5880
+
+            This field is a member of `oneof`_ ``_final``.
+        length (int):
+            The length of the BFD Control packet in
+            bytes. This is specified in section 4.1 of
+            RFC5880
+
+            This field is a member of `oneof`_ ``_length``.
+        min_echo_rx_interval_ms (int):
+            The Required Min Echo RX Interval value in
+            the BFD packet. This is specified in section 4.1
+            of RFC5880
+
+            This field is a member of `oneof`_ ``_min_echo_rx_interval_ms``.
+        min_rx_interval_ms (int):
+            The Required Min RX Interval value in the BFD
+            packet. This is specified in section 4.1 of
+            RFC5880
+
+            This field is a member of `oneof`_ ``_min_rx_interval_ms``.
+        min_tx_interval_ms (int):
+            The Desired Min TX Interval value in the BFD
+            packet. This is specified in section 4.1 of
+            RFC5880
+
+            This field is a member of `oneof`_ ``_min_tx_interval_ms``.
+        multiplier (int):
+            The detection time multiplier of the BFD
+            packet. This is specified in section 4.1 of
+            RFC5880
+
+            This field is a member of `oneof`_ ``_multiplier``.
+        multipoint (bool):
+            The multipoint bit of the BFD packet. This is
+            specified in section 4.1 of RFC5880
+
+            This field is a member of `oneof`_ ``_multipoint``.
+        my_discriminator (int):
+            The My Discriminator value in the BFD packet.
+            This is specified in section 4.1 of RFC5880
+
+            This field is a member of `oneof`_ ``_my_discriminator``.
+        poll (bool):
+            The Poll bit of the BFD packet. This is
+            specified in section 4.1 of RFC5880
+
+            This field is a member of `oneof`_ ``_poll``.
+        state (str):
+            The current BFD session state as seen by the
+            transmitting system. These states are specified
+            in section 4.1 of RFC5880 Check the State enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+        version (int):
+            The version number of the BFD protocol, as
+            specified in section 4.1 of RFC5880.
+
+            This field is a member of `oneof`_ ``_version``.
+        your_discriminator (int):
+            The Your Discriminator value in the BFD
+            packet. This is specified in section 4.1 of
+            RFC5880
+
+            This field is a member of `oneof`_ ``_your_discriminator``.
+    """
+
+    class Diagnostic(proto.Enum):
+        r"""The diagnostic code specifies the local system's reason for
+        the last change in session state. This allows remote systems to
+        determine the reason that the previous session failed, for
+        example. These diagnostic codes are specified in section 4.1 of
+        RFC5880
+
+        Values:
+            UNDEFINED_DIAGNOSTIC (0):
+                A value indicating that the enum field is not
+                set.
+            ADMINISTRATIVELY_DOWN (121685798):
+                No description available.
+            CONCATENATED_PATH_DOWN (26186892):
+                No description available.
+            CONTROL_DETECTION_TIME_EXPIRED (135478383):
+                No description available.
+            DIAGNOSTIC_UNSPECIFIED (58720895):
+                No description available.
+            ECHO_FUNCTION_FAILED (220687466):
+                No description available.
+            FORWARDING_PLANE_RESET (19715882):
+                No description available.
+            NEIGHBOR_SIGNALED_SESSION_DOWN (374226742):
+                No description available.
+            NO_DIAGNOSTIC (222503141):
+                No description available.
+            PATH_DOWN (290605180):
+                No description available.
+            REVERSE_CONCATENATED_PATH_DOWN (479337129):
+                No description available.
+        """
+        UNDEFINED_DIAGNOSTIC = 0
+        ADMINISTRATIVELY_DOWN = 121685798
+        CONCATENATED_PATH_DOWN = 26186892
+        CONTROL_DETECTION_TIME_EXPIRED = 135478383
+        DIAGNOSTIC_UNSPECIFIED = 58720895
+        ECHO_FUNCTION_FAILED = 220687466
+        FORWARDING_PLANE_RESET = 19715882
+        NEIGHBOR_SIGNALED_SESSION_DOWN = 374226742
+        NO_DIAGNOSTIC = 222503141
+        PATH_DOWN = 290605180
+        REVERSE_CONCATENATED_PATH_DOWN = 479337129
+
+    class State(proto.Enum):
+        r"""The current BFD session state as seen by the transmitting
+        system. These states are specified in section 4.1 of RFC5880
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            ADMIN_DOWN (128544690):
+                No description available.
+            DOWN (2104482):
+                No description available.
+            INIT (2252048):
+                No description available.
+            STATE_UNSPECIFIED (470755401):
+                No description available.
+            UP (2715):
+                No description available.
+        """
+        UNDEFINED_STATE = 0
+        ADMIN_DOWN = 128544690
+        DOWN = 2104482
+        INIT = 2252048
+        STATE_UNSPECIFIED = 470755401
+        UP = 2715
+
+    authentication_present: bool = proto.Field(
+        proto.BOOL,
+        number=105974260,
+        optional=True,
+    )
+    control_plane_independent: bool = proto.Field(
+        proto.BOOL,
+        number=62363573,
+        optional=True,
+    )
+    demand: bool = proto.Field(
+        proto.BOOL,
+        number=275180107,
+        optional=True,
+    )
+    diagnostic: str = proto.Field(
+        proto.STRING,
+        number=62708647,
+        optional=True,
+    )
+    final: bool = proto.Field(
+        proto.BOOL,
+        number=97436022,
+        optional=True,
+    )
+    length: int = proto.Field(
+        proto.UINT32,
+        number=504249062,
+        optional=True,
+    )
+    min_echo_rx_interval_ms: int = proto.Field(
+        proto.UINT32,
+        number=97286868,
+        optional=True,
+    )
+    min_rx_interval_ms: int = proto.Field(
+        proto.UINT32,
+        number=463399028,
+        optional=True,
+    )
+    min_tx_interval_ms: int = proto.Field(
+        proto.UINT32,
+        number=526023602,
+        optional=True,
+    )
+    multiplier: int = proto.Field(
+        proto.UINT32,
+        number=191331777,
+        optional=True,
+    )
+    multipoint: bool = proto.Field(
+        proto.BOOL,
+        number=191421431,
+        optional=True,
+    )
+    my_discriminator: int = proto.Field(
+        proto.UINT32,
+        number=76663113,
+        optional=True,
+    )
+    poll: bool = proto.Field(
+        proto.BOOL,
+        number=3446719,
+        optional=True,
+    )
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+    version: int = proto.Field(
+        proto.UINT32,
+        number=351608024,
+        optional=True,
+    )
+    your_discriminator: int = proto.Field(
+        proto.UINT32,
+        number=515634064,
+        optional=True,
+    )
+
+
+class BfdStatus(proto.Message):
+    r"""Next free: 15
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        bfd_session_initialization_mode (str):
+            The BFD session initialization mode for this
+            BGP peer. If set to ACTIVE, the Cloud Router
+            will initiate the BFD session for this BGP peer.
+            If set to PASSIVE, the Cloud Router will wait
+            for the peer router to initiate the BFD session
+            for this BGP peer. If set to DISABLED, BFD is
+            disabled for this BGP peer. Check the
+            BfdSessionInitializationMode enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_bfd_session_initialization_mode``.
+        config_update_timestamp_micros (int):
+            Unix timestamp of the most recent config
+            update.
+
+            This field is a member of `oneof`_ ``_config_update_timestamp_micros``.
+        control_packet_counts (google.cloud.compute_v1.types.BfdStatusPacketCounts):
+            Control packet counts for the current BFD
+            session.
+
+            This field is a member of `oneof`_ ``_control_packet_counts``.
+        control_packet_intervals (MutableSequence[google.cloud.compute_v1.types.PacketIntervals]):
+            Inter-packet time interval statistics for
+            control packets.
+        local_diagnostic (str):
+            The diagnostic code specifies the local
+            system's reason for the last change in session
+            state. This allows remote systems to determine
+            the reason that the previous session failed, for
+            example. These diagnostic codes are specified in
+            section 4.1 of RFC5880 Check the LocalDiagnostic
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_local_diagnostic``.
+        local_state (str):
+            The current BFD session state as seen by the
+            transmitting system. These states are specified
+            in section 4.1 of RFC5880 Check the LocalState
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_local_state``.
+        negotiated_local_control_tx_interval_ms (int):
+            Negotiated transmit interval for control
+            packets.
+
+            This field is a member of `oneof`_ ``_negotiated_local_control_tx_interval_ms``.
+        rx_packet (google.cloud.compute_v1.types.BfdPacket):
+            The most recent Rx control packet for this
+            BFD session.
+
+            This field is a member of `oneof`_ ``_rx_packet``.
+        tx_packet (google.cloud.compute_v1.types.BfdPacket):
+            The most recent Tx control packet for this
+            BFD session.
+
+            This field is a member of `oneof`_ ``_tx_packet``.
+        uptime_ms (int):
+            Session uptime in milliseconds. Value will be
+            0 if session is not up.
+
+            This field is a member of `oneof`_ ``_uptime_ms``.
+    """
+
+    class BfdSessionInitializationMode(proto.Enum):
+        r"""The BFD session initialization mode for this BGP peer. If set
+        to ACTIVE, the Cloud Router will initiate the BFD session for
+        this BGP peer. If set to PASSIVE, the Cloud Router will wait for
+        the peer router to initiate the BFD session for this BGP peer.
+        If set to DISABLED, BFD is disabled for this BGP peer.
+
+        Values:
+            UNDEFINED_BFD_SESSION_INITIALIZATION_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                No description available.
+            DISABLED (516696700):
+                No description available.
+            PASSIVE (462813959):
+                No description available.
+        """
+        UNDEFINED_BFD_SESSION_INITIALIZATION_MODE = 0
+        ACTIVE = 314733318
+        DISABLED = 516696700
+        PASSIVE = 462813959
+
+    class LocalDiagnostic(proto.Enum):
+        r"""The diagnostic code specifies the local system's reason for
+        the last change in session state. This allows remote systems to
+        determine the reason that the previous session failed, for
+        example. These diagnostic codes are specified in section 4.1 of
+        RFC5880
+
+        Values:
+            UNDEFINED_LOCAL_DIAGNOSTIC (0):
+                A value indicating that the enum field is not
+                set.
+            ADMINISTRATIVELY_DOWN (121685798):
+                No description available.
+            CONCATENATED_PATH_DOWN (26186892):
+                No description available.
+            CONTROL_DETECTION_TIME_EXPIRED (135478383):
+                No description available.
+            DIAGNOSTIC_UNSPECIFIED (58720895):
+                No description available.
+            ECHO_FUNCTION_FAILED (220687466):
+                No description available.
+            FORWARDING_PLANE_RESET (19715882):
+                No description available.
+            NEIGHBOR_SIGNALED_SESSION_DOWN (374226742):
+                No description available.
+            NO_DIAGNOSTIC (222503141):
+                No description available.
+            PATH_DOWN (290605180):
+                No description available.
+            REVERSE_CONCATENATED_PATH_DOWN (479337129):
+                No description available.
+        """
+        UNDEFINED_LOCAL_DIAGNOSTIC = 0
+        ADMINISTRATIVELY_DOWN = 121685798
+        CONCATENATED_PATH_DOWN = 26186892
+        CONTROL_DETECTION_TIME_EXPIRED = 135478383
+        DIAGNOSTIC_UNSPECIFIED = 58720895
+        ECHO_FUNCTION_FAILED = 220687466
+        FORWARDING_PLANE_RESET = 19715882
+        NEIGHBOR_SIGNALED_SESSION_DOWN = 374226742
+        NO_DIAGNOSTIC = 222503141
+        PATH_DOWN = 290605180
+        REVERSE_CONCATENATED_PATH_DOWN = 479337129
+
+    class LocalState(proto.Enum):
+        r"""The current BFD session state as seen by the transmitting
+        system. These states are specified in section 4.1 of RFC5880
+
+        Values:
+            UNDEFINED_LOCAL_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            ADMIN_DOWN (128544690):
+                No description available.
+            DOWN (2104482):
+                No description available.
+            INIT (2252048):
+                No description available.
+            STATE_UNSPECIFIED (470755401):
+                No description available.
+            UP (2715):
+                No description available.
+        """
+        UNDEFINED_LOCAL_STATE = 0
+        ADMIN_DOWN = 128544690
+        DOWN = 2104482
+        INIT = 2252048
+        STATE_UNSPECIFIED = 470755401
+        UP = 2715
+
+    bfd_session_initialization_mode: str = proto.Field(
+        proto.STRING,
+        number=218156954,
+        optional=True,
+    )
+    config_update_timestamp_micros: int = proto.Field(
+        proto.INT64,
+        number=457195569,
+        optional=True,
+    )
+    control_packet_counts: "BfdStatusPacketCounts" = proto.Field(
+        proto.MESSAGE,
+        number=132573561,
+        optional=True,
+        message="BfdStatusPacketCounts",
+    )
+    control_packet_intervals: MutableSequence["PacketIntervals"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=500806649,
+        message="PacketIntervals",
+    )
+    local_diagnostic: str = proto.Field(
+        proto.STRING,
+        number=463737083,
+        optional=True,
+    )
+    local_state: str = proto.Field(
+        proto.STRING,
+        number=149195453,
+        optional=True,
+    )
+    negotiated_local_control_tx_interval_ms: int = proto.Field(
+        proto.UINT32,
+        number=21768340,
+        optional=True,
+    )
+    rx_packet: "BfdPacket" = proto.Field(
+        proto.MESSAGE,
+        number=505069729,
+        optional=True,
+        message="BfdPacket",
+    )
+    tx_packet: "BfdPacket" = proto.Field(
+        proto.MESSAGE,
+        number=111386275,
+        optional=True,
+        message="BfdPacket",
+    )
+    uptime_ms: int = proto.Field(
+        proto.INT64,
+        number=125398365,
+        optional=True,
+    )
+
+
+class BfdStatusPacketCounts(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        num_rx (int):
+            Number of packets received since the
+            beginning of the current BFD session.
+
+            This field is a member of `oneof`_ ``_num_rx``.
+        num_rx_rejected (int):
+            Number of packets received that were rejected
+            because of errors since the beginning of the
+            current BFD session.
+
+            This field is a member of `oneof`_ ``_num_rx_rejected``.
+        num_rx_successful (int):
+            Number of packets received that were
+            successfully processed since the beginning of
+            the current BFD session.
+
+            This field is a member of `oneof`_ ``_num_rx_successful``.
+        num_tx (int):
+            Number of packets transmitted since the
+            beginning of the current BFD session.
+
+            This field is a member of `oneof`_ ``_num_tx``.
+    """
+
+    num_rx: int = proto.Field(
+        proto.UINT32,
+        number=39375263,
+        optional=True,
+    )
+    num_rx_rejected: int = proto.Field(
+        proto.UINT32,
+        number=281007902,
+        optional=True,
+    )
+    num_rx_successful: int = proto.Field(
+        proto.UINT32,
+        number=455361850,
+        optional=True,
+    )
+    num_tx: int = proto.Field(
+        proto.UINT32,
+        number=39375325,
+        optional=True,
+    )
+
+
+class DeleteRouterRequest(proto.Message):
+    r"""A request message for Routers.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        router (str):
+            Name of the Router resource to delete.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    router: str = proto.Field(
+        proto.STRING,
+        number=148608841,
+    )
+
+
+class GetNatIpInfoRouterRequest(proto.Message):
+    r"""A request message for Routers.GetNatIpInfo. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        nat_name (str):
+            Name of the nat service to filter the NAT IP
+            information. If it is omitted, all nats for this
+            router will be returned. Name should conform to
+            RFC1035.
+
+            This field is a member of `oneof`_ ``_nat_name``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        router (str):
+            Name of the Router resource to query for Nat
+            IP information. The name should conform to
+            RFC1035.
+    """
+
+    nat_name: str = proto.Field(
+        proto.STRING,
+        number=425596649,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    router: str = proto.Field(
+        proto.STRING,
+        number=148608841,
+    )
+
+
+class GetNatMappingInfoRoutersRequest(proto.Message):
+    r"""A request message for Routers.GetNatMappingInfo. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        nat_name (str):
+            Name of the nat service to filter the Nat
+            Mapping information. If it is omitted, all nats
+            for this router will be returned. Name should
+            conform to RFC1035.
+
+            This field is a member of `oneof`_ ``_nat_name``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        router (str):
+            Name of the Router resource to query for Nat
+            Mapping information of VM endpoints.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    nat_name: str = proto.Field(
+        proto.STRING,
+        number=425596649,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    router: str = proto.Field(
+        proto.STRING,
+        number=148608841,
+    )
+
+
+class GetRouterRequest(proto.Message):
+    r"""A request message for Routers.Get. See the method description
+    for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        router (str):
+            Name of the Router resource to return.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    router: str = proto.Field(
+        proto.STRING,
+        number=148608841,
+    )
+
+
+class GetRouterStatusRouterRequest(proto.Message):
+    r"""A request message for Routers.GetRouterStatus. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        router (str):
+            Name of the Router resource to query.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    router: str = proto.Field(
+        proto.STRING,
+        number=148608841,
+    )
+
+
+class InsertRouterRequest(proto.Message):
+    r"""A request message for Routers.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        router_resource (google.cloud.compute_v1.types.Router):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    router_resource: "Router" = proto.Field(
+        proto.MESSAGE,
+        number=155222084,
+        message="Router",
+    )
+
+
+class ListRoutersRequest(proto.Message):
+    r"""A request message for Routers.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class NatIpInfo(proto.Message):
+    r"""Contains NAT IP information of a NAT config (i.e. usage
+    status, mode).
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        nat_ip_info_mappings (MutableSequence[google.cloud.compute_v1.types.NatIpInfoNatIpInfoMapping]):
+            A list of all NAT IPs assigned to this NAT
+            config.
+        nat_name (str):
+            Name of the NAT config which the NAT IP
+            belongs to.
+
+            This field is a member of `oneof`_ ``_nat_name``.
+    """
+
+    nat_ip_info_mappings: MutableSequence[
+        "NatIpInfoNatIpInfoMapping"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=241401884,
+        message="NatIpInfoNatIpInfoMapping",
+    )
+    nat_name: str = proto.Field(
+        proto.STRING,
+        number=425596649,
+        optional=True,
+    )
+
+
+class NatIpInfoNatIpInfoMapping(proto.Message):
+    r"""Contains information of a NAT IP.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        mode (str):
+            Specifies whether NAT IP is auto or manual.
+            Check the Mode enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_mode``.
+        nat_ip (str):
+            NAT IP address. For example: 203.0.113.11.
+
+            This field is a member of `oneof`_ ``_nat_ip``.
+        usage (str):
+            Specifies whether NAT IP is currently serving
+            at least one endpoint or not. Check the Usage
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_usage``.
+    """
+
+    class Mode(proto.Enum):
+        r"""Specifies whether NAT IP is auto or manual.
+
+        Values:
+            UNDEFINED_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            AUTO (2020783):
+                No description available.
+            MANUAL (119397318):
+                No description available.
+        """
+        UNDEFINED_MODE = 0
+        AUTO = 2020783
+        MANUAL = 119397318
+
+    class Usage(proto.Enum):
+        r"""Specifies whether NAT IP is currently serving at least one
+        endpoint or not.
+
+        Values:
+            UNDEFINED_USAGE (0):
+                A value indicating that the enum field is not
+                set.
+            IN_USE (17393485):
+                No description available.
+            UNUSED (360643030):
+                No description available.
+        """
+        UNDEFINED_USAGE = 0
+        IN_USE = 17393485
+        UNUSED = 360643030
+
+    mode: str = proto.Field(
+        proto.STRING,
+        number=3357091,
+        optional=True,
+    )
+    nat_ip: str = proto.Field(
+        proto.STRING,
+        number=21113093,
+        optional=True,
+    )
+    usage: str = proto.Field(
+        proto.STRING,
+        number=111574433,
+        optional=True,
+    )
+
+
+class NatIpInfoResponse(proto.Message):
+    r"""
+
+    Attributes:
+        result (MutableSequence[google.cloud.compute_v1.types.NatIpInfo]):
+            [Output Only] A list of NAT IP information.
+    """
+
+    result: MutableSequence["NatIpInfo"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=139315229,
+        message="NatIpInfo",
+    )
+
+
+class PacketIntervals(proto.Message):
+    r"""Next free: 7
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        avg_ms (int):
+            Average observed inter-packet interval in
+            milliseconds.
+
+            This field is a member of `oneof`_ ``_avg_ms``.
+        duration (str):
+            From how long ago in the past these intervals
+            were observed. Check the Duration enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_duration``.
+        max_ms (int):
+            Maximum observed inter-packet interval in
+            milliseconds.
+
+            This field is a member of `oneof`_ ``_max_ms``.
+        min_ms (int):
+            Minimum observed inter-packet interval in
+            milliseconds.
+
+            This field is a member of `oneof`_ ``_min_ms``.
+        num_intervals (int):
+            Number of inter-packet intervals from which
+            these statistics were derived.
+
+            This field is a member of `oneof`_ ``_num_intervals``.
+        type_ (str):
+            The type of packets for which inter-packet
+            intervals were computed. Check the Type enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Duration(proto.Enum):
+        r"""From how long ago in the past these intervals were observed.
+
+        Values:
+            UNDEFINED_DURATION (0):
+                A value indicating that the enum field is not
+                set.
+            DURATION_UNSPECIFIED (529071340):
+                No description available.
+            HOUR (2223588):
+                No description available.
+            MAX (76100):
+                From BfdSession object creation time.
+            MINUTE (126786068):
+                No description available.
+        """
+        UNDEFINED_DURATION = 0
+        DURATION_UNSPECIFIED = 529071340
+        HOUR = 2223588
+        MAX = 76100
+        MINUTE = 126786068
+
+    class Type(proto.Enum):
+        r"""The type of packets for which inter-packet intervals were
+        computed.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            LOOPBACK (356174219):
+                Only applies to Echo packets. This shows the
+                intervals between sending and receiving the same
+                packet.
+            RECEIVE (189660867):
+                Intervals between received packets.
+            TRANSMIT (452903600):
+                Intervals between transmitted packets.
+            TYPE_UNSPECIFIED (437714322):
+                No description available.
+        """
+        UNDEFINED_TYPE = 0
+        LOOPBACK = 356174219
+        RECEIVE = 189660867
+        TRANSMIT = 452903600
+        TYPE_UNSPECIFIED = 437714322
+
+    avg_ms: int = proto.Field(
+        proto.INT64,
+        number=204811827,
+        optional=True,
+    )
+    duration: str = proto.Field(
+        proto.STRING,
+        number=155471252,
+        optional=True,
+    )
+    max_ms: int = proto.Field(
+        proto.INT64,
+        number=529474145,
+        optional=True,
+    )
+    min_ms: int = proto.Field(
+        proto.INT64,
+        number=536564403,
+        optional=True,
+    )
+    num_intervals: int = proto.Field(
+        proto.INT64,
+        number=186329813,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+class PatchRouterRequest(proto.Message):
+    r"""A request message for Routers.Patch. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        router (str):
+            Name of the Router resource to patch.
+        router_resource (google.cloud.compute_v1.types.Router):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    router: str = proto.Field(
+        proto.STRING,
+        number=148608841,
+    )
+    router_resource: "Router" = proto.Field(
+        proto.MESSAGE,
+        number=155222084,
+        message="Router",
+    )
+
+
+class PreviewRouterRequest(proto.Message):
+    r"""A request message for Routers.Preview. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        router (str):
+            Name of the Router resource to query.
+        router_resource (google.cloud.compute_v1.types.Router):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    router: str = proto.Field(
+        proto.STRING,
+        number=148608841,
+    )
+    router_resource: "Router" = proto.Field(
+        proto.MESSAGE,
+        number=155222084,
+        message="Router",
+    )
+
+
+class Router(proto.Message):
+    r"""Represents a Cloud Router resource. For more information
+    about Cloud Router, read the Cloud Router overview.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        bgp (google.cloud.compute_v1.types.RouterBgp):
+            BGP information specific to this router.
+
+            This field is a member of `oneof`_ ``_bgp``.
+        bgp_peers (MutableSequence[google.cloud.compute_v1.types.RouterBgpPeer]):
+            BGP information that must be configured into
+            the routing stack to establish BGP peering. This
+            information must specify the peer ASN and either
+            the interface name, IP address, or peer IP
+            address. Please refer to RFC4273.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        encrypted_interconnect_router (bool):
+            Indicates if a router is dedicated for use
+            with encrypted VLAN attachments
+            (interconnectAttachments).
+
+            This field is a member of `oneof`_ ``_encrypted_interconnect_router``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        interfaces (MutableSequence[google.cloud.compute_v1.types.RouterInterface]):
+            Router interfaces. To create a BGP peer that
+            uses a router interface, the interface must have
+            one of the following fields specified: -
+            linkedVpnTunnel - linkedInterconnectAttachment -
+            subnetwork You can create a router interface
+            without any of these fields specified. However,
+            you cannot create a BGP peer that uses that
+            interface.
+        kind (str):
+            [Output Only] Type of resource. Always compute#router for
+            routers.
+
+            This field is a member of `oneof`_ ``_kind``.
+        md5_authentication_keys (MutableSequence[google.cloud.compute_v1.types.RouterMd5AuthenticationKey]):
+            Keys used for MD5 authentication.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        nats (MutableSequence[google.cloud.compute_v1.types.RouterNat]):
+            A list of NAT services created in this
+            router.
+        network (str):
+            URI of the network to which this router
+            belongs.
+
+            This field is a member of `oneof`_ ``_network``.
+        region (str):
+            [Output Only] URI of the region where the router resides.
+            You must specify this field as part of the HTTP request URL.
+            It is not settable as a field in the request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+    """
+
+    bgp: "RouterBgp" = proto.Field(
+        proto.MESSAGE,
+        number=97483,
+        optional=True,
+        message="RouterBgp",
+    )
+    bgp_peers: MutableSequence["RouterBgpPeer"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=452695773,
+        message="RouterBgpPeer",
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    encrypted_interconnect_router: bool = proto.Field(
+        proto.BOOL,
+        number=297996575,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    interfaces: MutableSequence["RouterInterface"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=12073562,
+        message="RouterInterface",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    md5_authentication_keys: MutableSequence[
+        "RouterMd5AuthenticationKey"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=71063322,
+        message="RouterMd5AuthenticationKey",
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    nats: MutableSequence["RouterNat"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=3373938,
+        message="RouterNat",
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+
+
+class RouterAdvertisedIpRange(proto.Message):
+    r"""Description-tagged IP ranges for the router to advertise.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        description (str):
+            User-specified description for the IP range.
+
+            This field is a member of `oneof`_ ``_description``.
+        range_ (str):
+            The IP range to advertise. The value must be
+            a CIDR-formatted string.
+
+            This field is a member of `oneof`_ ``_range``.
+    """
+
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    range_: str = proto.Field(
+        proto.STRING,
+        number=108280125,
+        optional=True,
+    )
+
+
+class RouterAggregatedList(proto.Message):
+    r"""Contains a list of routers.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableMapping[str, google.cloud.compute_v1.types.RoutersScopedList]):
+            A list of Router resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (MutableSequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableMapping[str, "RoutersScopedList"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="RoutersScopedList",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    unreachables: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=243372063,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class RouterBgp(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        advertise_mode (str):
+            User-specified flag to indicate which mode to
+            use for advertisement. The options are DEFAULT
+            or CUSTOM. Check the AdvertiseMode enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_advertise_mode``.
+        advertised_groups (MutableSequence[str]):
+            User-specified list of prefix groups to advertise in custom
+            mode. This field can only be populated if advertise_mode is
+            CUSTOM and is advertised to all peers of the router. These
+            groups will be advertised in addition to any specified
+            prefixes. Leave this field blank to advertise no custom
+            groups. Check the AdvertisedGroups enum for the list of
+            possible values.
+        advertised_ip_ranges (MutableSequence[google.cloud.compute_v1.types.RouterAdvertisedIpRange]):
+            User-specified list of individual IP ranges to advertise in
+            custom mode. This field can only be populated if
+            advertise_mode is CUSTOM and is advertised to all peers of
+            the router. These IP ranges will be advertised in addition
+            to any specified groups. Leave this field blank to advertise
+            no custom IP ranges.
+        asn (int):
+            Local BGP Autonomous System Number (ASN).
+            Must be an RFC6996 private ASN, either 16-bit or
+            32-bit. The value will be fixed for this router
+            resource. All VPN tunnels that link to this
+            router will have the same local ASN.
+
+            This field is a member of `oneof`_ ``_asn``.
+        keepalive_interval (int):
+            The interval in seconds between BGP keepalive
+            messages that are sent to the peer. Hold time is
+            three times the interval at which keepalive
+            messages are sent, and the hold time is the
+            maximum number of seconds allowed to elapse
+            between successive keepalive messages that BGP
+            receives from a peer. BGP will use the smaller
+            of either the local hold time value or the
+            peer's hold time value as the hold time for the
+            BGP connection between the two peers. If set,
+            this value must be between 20 and 60. The
+            default is 20.
+
+            This field is a member of `oneof`_ ``_keepalive_interval``.
+    """
+
+    class AdvertiseMode(proto.Enum):
+        r"""User-specified flag to indicate which mode to use for
+        advertisement. The options are DEFAULT or CUSTOM.
+
+        Values:
+            UNDEFINED_ADVERTISE_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            CUSTOM (388595569):
+                No description available.
+            DEFAULT (115302945):
+                No description available.
+        """
+        UNDEFINED_ADVERTISE_MODE = 0
+        CUSTOM = 388595569
+        DEFAULT = 115302945
+
+    class AdvertisedGroups(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_ADVERTISED_GROUPS (0):
+                A value indicating that the enum field is not
+                set.
+            ALL_SUBNETS (3622872):
+                Advertise all available subnets (including
+                peer VPC subnets).
+        """
+        UNDEFINED_ADVERTISED_GROUPS = 0
+        ALL_SUBNETS = 3622872
+
+    advertise_mode: str = proto.Field(
+        proto.STRING,
+        number=312134331,
+        optional=True,
+    )
+    advertised_groups: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=21065526,
+    )
+    advertised_ip_ranges: MutableSequence[
+        "RouterAdvertisedIpRange"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=35449932,
+        message="RouterAdvertisedIpRange",
+    )
+    asn: int = proto.Field(
+        proto.UINT32,
+        number=96892,
+        optional=True,
+    )
+    keepalive_interval: int = proto.Field(
+        proto.UINT32,
+        number=276771516,
+        optional=True,
+    )
+
+
+class RouterBgpPeer(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        advertise_mode (str):
+            User-specified flag to indicate which mode to
+            use for advertisement. Check the AdvertiseMode
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_advertise_mode``.
+        advertised_groups (MutableSequence[str]):
+            User-specified list of prefix groups to advertise in custom
+            mode, which currently supports the following option: -
+            ALL_SUBNETS: Advertises all of the router's own VPC subnets.
+            This excludes any routes learned for subnets that use VPC
+            Network Peering. Note that this field can only be populated
+            if advertise_mode is CUSTOM and overrides the list defined
+            for the router (in the "bgp" message). These groups are
+            advertised in addition to any specified prefixes. Leave this
+            field blank to advertise no custom groups. Check the
+            AdvertisedGroups enum for the list of possible values.
+        advertised_ip_ranges (MutableSequence[google.cloud.compute_v1.types.RouterAdvertisedIpRange]):
+            User-specified list of individual IP ranges to advertise in
+            custom mode. This field can only be populated if
+            advertise_mode is CUSTOM and overrides the list defined for
+            the router (in the "bgp" message). These IP ranges are
+            advertised in addition to any specified groups. Leave this
+            field blank to advertise no custom IP ranges.
+        advertised_route_priority (int):
+            The priority of routes advertised to this BGP
+            peer. Where there is more than one matching
+            route of maximum length, the routes with the
+            lowest priority value win.
+
+            This field is a member of `oneof`_ ``_advertised_route_priority``.
+        bfd (google.cloud.compute_v1.types.RouterBgpPeerBfd):
+            BFD configuration for the BGP peering.
+
+            This field is a member of `oneof`_ ``_bfd``.
+        custom_learned_ip_ranges (MutableSequence[google.cloud.compute_v1.types.RouterBgpPeerCustomLearnedIpRange]):
+            A list of user-defined custom learned route
+            IP address ranges for a BGP session.
+        custom_learned_route_priority (int):
+            The user-defined custom learned route priority for a BGP
+            session. This value is applied to all custom learned route
+            ranges for the session. You can choose a value from ``0`` to
+            ``65335``. If you don't provide a value, Google Cloud
+            assigns a priority of ``100`` to the ranges.
+
+            This field is a member of `oneof`_ ``_custom_learned_route_priority``.
+        enable (str):
+            The status of the BGP peer connection. If set
+            to FALSE, any active session with the peer is
+            terminated and all associated routing
+            information is removed. If set to TRUE, the peer
+            connection can be established with routing
+            information. The default is TRUE. Check the
+            Enable enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_enable``.
+        enable_ipv6 (bool):
+            Enable IPv6 traffic over BGP Peer. If not
+            specified, it is disabled by default.
+
+            This field is a member of `oneof`_ ``_enable_ipv6``.
+        interface_name (str):
+            Name of the interface the BGP peer is
+            associated with.
+
+            This field is a member of `oneof`_ ``_interface_name``.
+        ip_address (str):
+            IP address of the interface inside Google
+            Cloud Platform. Only IPv4 is supported.
+
+            This field is a member of `oneof`_ ``_ip_address``.
+        ipv6_nexthop_address (str):
+            IPv6 address of the interface inside Google
+            Cloud Platform.
+
+            This field is a member of `oneof`_ ``_ipv6_nexthop_address``.
+        management_type (str):
+            [Output Only] The resource that configures and manages this
+            BGP peer. - MANAGED_BY_USER is the default value and can be
+            managed by you or other users - MANAGED_BY_ATTACHMENT is a
+            BGP peer that is configured and managed by Cloud
+            Interconnect, specifically by an InterconnectAttachment of
+            type PARTNER. Google automatically creates, updates, and
+            deletes this type of BGP peer when the PARTNER
+            InterconnectAttachment is created, updated, or deleted.
+            Check the ManagementType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_management_type``.
+        md5_authentication_key_name (str):
+            Present if MD5 authentication is enabled for the peering.
+            Must be the name of one of the entries in the
+            Router.md5_authentication_keys. The field must comply with
+            RFC1035.
+
+            This field is a member of `oneof`_ ``_md5_authentication_key_name``.
+        name (str):
+            Name of this BGP peer. The name must be 1-63 characters
+            long, and comply with RFC1035. Specifically, the name must
+            be 1-63 characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        peer_asn (int):
+            Peer BGP Autonomous System Number (ASN). Each
+            BGP interface may use a different value.
+
+            This field is a member of `oneof`_ ``_peer_asn``.
+        peer_ip_address (str):
+            IP address of the BGP interface outside
+            Google Cloud Platform. Only IPv4 is supported.
+
+            This field is a member of `oneof`_ ``_peer_ip_address``.
+        peer_ipv6_nexthop_address (str):
+            IPv6 address of the BGP interface outside
+            Google Cloud Platform.
+
+            This field is a member of `oneof`_ ``_peer_ipv6_nexthop_address``.
+        router_appliance_instance (str):
+            URI of the VM instance that is used as
+            third-party router appliances such as Next Gen
+            Firewalls, Virtual Routers, or Router
+            Appliances. The VM instance must be located in
+            zones contained in the same region as this Cloud
+            Router. The VM instance is the peer side of the
+            BGP session.
+
+            This field is a member of `oneof`_ ``_router_appliance_instance``.
+    """
+
+    class AdvertiseMode(proto.Enum):
+        r"""User-specified flag to indicate which mode to use for
+        advertisement.
+
+        Values:
+            UNDEFINED_ADVERTISE_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            CUSTOM (388595569):
+                No description available.
+            DEFAULT (115302945):
+                No description available.
+        """
+        UNDEFINED_ADVERTISE_MODE = 0
+        CUSTOM = 388595569
+        DEFAULT = 115302945
+
+    class AdvertisedGroups(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_ADVERTISED_GROUPS (0):
+                A value indicating that the enum field is not
+                set.
+            ALL_SUBNETS (3622872):
+                Advertise all available subnets (including
+                peer VPC subnets).
+        """
+        UNDEFINED_ADVERTISED_GROUPS = 0
+        ALL_SUBNETS = 3622872
+
+    class Enable(proto.Enum):
+        r"""The status of the BGP peer connection. If set to FALSE, any
+        active session with the peer is terminated and all associated
+        routing information is removed. If set to TRUE, the peer
+        connection can be established with routing information. The
+        default is TRUE.
+
+        Values:
+            UNDEFINED_ENABLE (0):
+                A value indicating that the enum field is not
+                set.
+            FALSE (66658563):
+                No description available.
+            TRUE (2583950):
+                No description available.
+        """
+        UNDEFINED_ENABLE = 0
+        FALSE = 66658563
+        TRUE = 2583950
+
+    class ManagementType(proto.Enum):
+        r"""[Output Only] The resource that configures and manages this BGP
+        peer. - MANAGED_BY_USER is the default value and can be managed by
+        you or other users - MANAGED_BY_ATTACHMENT is a BGP peer that is
+        configured and managed by Cloud Interconnect, specifically by an
+        InterconnectAttachment of type PARTNER. Google automatically
+        creates, updates, and deletes this type of BGP peer when the PARTNER
+        InterconnectAttachment is created, updated, or deleted.
+
+        Values:
+            UNDEFINED_MANAGEMENT_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            MANAGED_BY_ATTACHMENT (458926411):
+                The BGP peer is automatically created for
+                PARTNER type InterconnectAttachment; Google will
+                automatically create/delete this BGP peer when
+                the PARTNER InterconnectAttachment is
+                created/deleted, and Google will update the
+                ipAddress and peerIpAddress when the PARTNER
+                InterconnectAttachment is provisioned. This type
+                of BGP peer cannot be created or deleted, but
+                can be modified for all fields except for name,
+                ipAddress and peerIpAddress.
+            MANAGED_BY_USER (317294067):
+                Default value, the BGP peer is manually
+                created and managed by user.
+        """
+        UNDEFINED_MANAGEMENT_TYPE = 0
+        MANAGED_BY_ATTACHMENT = 458926411
+        MANAGED_BY_USER = 317294067
+
+    advertise_mode: str = proto.Field(
+        proto.STRING,
+        number=312134331,
+        optional=True,
+    )
+    advertised_groups: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=21065526,
+    )
+    advertised_ip_ranges: MutableSequence[
+        "RouterAdvertisedIpRange"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=35449932,
+        message="RouterAdvertisedIpRange",
+    )
+    advertised_route_priority: int = proto.Field(
+        proto.UINT32,
+        number=186486332,
+        optional=True,
+    )
+    bfd: "RouterBgpPeerBfd" = proto.Field(
+        proto.MESSAGE,
+        number=97440,
+        optional=True,
+        message="RouterBgpPeerBfd",
+    )
+    custom_learned_ip_ranges: MutableSequence[
+        "RouterBgpPeerCustomLearnedIpRange"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=481363012,
+        message="RouterBgpPeerCustomLearnedIpRange",
+    )
+    custom_learned_route_priority: int = proto.Field(
+        proto.INT32,
+        number=330412356,
+        optional=True,
+    )
+    enable: str = proto.Field(
+        proto.STRING,
+        number=311764355,
+        optional=True,
+    )
+    enable_ipv6: bool = proto.Field(
+        proto.BOOL,
+        number=181467939,
+        optional=True,
+    )
+    interface_name: str = proto.Field(
+        proto.STRING,
+        number=437854673,
+        optional=True,
+    )
+    ip_address: str = proto.Field(
+        proto.STRING,
+        number=406272220,
+        optional=True,
+    )
+    ipv6_nexthop_address: str = proto.Field(
+        proto.STRING,
+        number=27968211,
+        optional=True,
+    )
+    management_type: str = proto.Field(
+        proto.STRING,
+        number=173703606,
+        optional=True,
+    )
+    md5_authentication_key_name: str = proto.Field(
+        proto.STRING,
+        number=281075345,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    peer_asn: int = proto.Field(
+        proto.UINT32,
+        number=69573151,
+        optional=True,
+    )
+    peer_ip_address: str = proto.Field(
+        proto.STRING,
+        number=207735769,
+        optional=True,
+    )
+    peer_ipv6_nexthop_address: str = proto.Field(
+        proto.STRING,
+        number=491486608,
+        optional=True,
+    )
+    router_appliance_instance: str = proto.Field(
+        proto.STRING,
+        number=468312989,
+        optional=True,
+    )
+
+
+class RouterBgpPeerBfd(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        min_receive_interval (int):
+            The minimum interval, in milliseconds,
+            between BFD control packets received from the
+            peer router. The actual value is negotiated
+            between the two routers and is equal to the
+            greater of this value and the transmit interval
+            of the other router. If set, this value must be
+            between 1000 and 30000. The default is 1000.
+
+            This field is a member of `oneof`_ ``_min_receive_interval``.
+        min_transmit_interval (int):
+            The minimum interval, in milliseconds,
+            between BFD control packets transmitted to the
+            peer router. The actual value is negotiated
+            between the two routers and is equal to the
+            greater of this value and the corresponding
+            receive interval of the other router. If set,
+            this value must be between 1000 and 30000. The
+            default is 1000.
+
+            This field is a member of `oneof`_ ``_min_transmit_interval``.
+        multiplier (int):
+            The number of consecutive BFD packets that
+            must be missed before BFD declares that a peer
+            is unavailable. If set, the value must be a
+            value between 5 and 16. The default is 5.
+
+            This field is a member of `oneof`_ ``_multiplier``.
+        session_initialization_mode (str):
+            The BFD session initialization mode for this
+            BGP peer. If set to ACTIVE, the Cloud Router
+            will initiate the BFD session for this BGP peer.
+            If set to PASSIVE, the Cloud Router will wait
+            for the peer router to initiate the BFD session
+            for this BGP peer. If set to DISABLED, BFD is
+            disabled for this BGP peer. The default is
+            DISABLED. Check the SessionInitializationMode
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_session_initialization_mode``.
+    """
+
+    class SessionInitializationMode(proto.Enum):
+        r"""The BFD session initialization mode for this BGP peer. If set
+        to ACTIVE, the Cloud Router will initiate the BFD session for
+        this BGP peer. If set to PASSIVE, the Cloud Router will wait for
+        the peer router to initiate the BFD session for this BGP peer.
+        If set to DISABLED, BFD is disabled for this BGP peer. The
+        default is DISABLED.
+
+        Values:
+            UNDEFINED_SESSION_INITIALIZATION_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                No description available.
+            DISABLED (516696700):
+                No description available.
+            PASSIVE (462813959):
+                No description available.
+        """
+        UNDEFINED_SESSION_INITIALIZATION_MODE = 0
+        ACTIVE = 314733318
+        DISABLED = 516696700
+        PASSIVE = 462813959
+
+    min_receive_interval: int = proto.Field(
+        proto.UINT32,
+        number=186981614,
+        optional=True,
+    )
+    min_transmit_interval: int = proto.Field(
+        proto.UINT32,
+        number=523282631,
+        optional=True,
+    )
+    multiplier: int = proto.Field(
+        proto.UINT32,
+        number=191331777,
+        optional=True,
+    )
+    session_initialization_mode: str = proto.Field(
+        proto.STRING,
+        number=105957049,
+        optional=True,
+    )
+
+
+class RouterBgpPeerCustomLearnedIpRange(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        range_ (str):
+            The custom learned route IP address range. Must be a valid
+            CIDR-formatted prefix. If an IP address is provided without
+            a subnet mask, it is interpreted as, for IPv4, a ``/32``
+            singular IP address range, and, for IPv6, ``/128``.
+
+            This field is a member of `oneof`_ ``_range``.
+    """
+
+    range_: str = proto.Field(
+        proto.STRING,
+        number=108280125,
+        optional=True,
+    )
+
+
+class RouterInterface(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ip_range (str):
+            IP address and range of the interface. The IP
+            range must be in the RFC3927 link-local IP
+            address space. The value must be a
+            CIDR-formatted string, for example:
+            169.254.0.1/30. NOTE: Do not truncate the
+            address as it represents the IP address of the
+            interface.
+
+            This field is a member of `oneof`_ ``_ip_range``.
+        linked_interconnect_attachment (str):
+            URI of the linked Interconnect attachment. It
+            must be in the same region as the router. Each
+            interface can have one linked resource, which
+            can be a VPN tunnel, an Interconnect attachment,
+            or a subnetwork.
+
+            This field is a member of `oneof`_ ``_linked_interconnect_attachment``.
+        linked_vpn_tunnel (str):
+            URI of the linked VPN tunnel, which must be
+            in the same region as the router. Each interface
+            can have one linked resource, which can be a VPN
+            tunnel, an Interconnect attachment, or a
+            subnetwork.
+
+            This field is a member of `oneof`_ ``_linked_vpn_tunnel``.
+        management_type (str):
+            [Output Only] The resource that configures and manages this
+            interface. - MANAGED_BY_USER is the default value and can be
+            managed directly by users. - MANAGED_BY_ATTACHMENT is an
+            interface that is configured and managed by Cloud
+            Interconnect, specifically, by an InterconnectAttachment of
+            type PARTNER. Google automatically creates, updates, and
+            deletes this type of interface when the PARTNER
+            InterconnectAttachment is created, updated, or deleted.
+            Check the ManagementType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_management_type``.
+        name (str):
+            Name of this interface entry. The name must be 1-63
+            characters long, and comply with RFC1035. Specifically, the
+            name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        private_ip_address (str):
+            The regional private internal IP address that
+            is used to establish BGP sessions to a VM
+            instance acting as a third-party Router
+            Appliance, such as a Next Gen Firewall, a
+            Virtual Router, or an SD-WAN VM.
+
+            This field is a member of `oneof`_ ``_private_ip_address``.
+        redundant_interface (str):
+            Name of the interface that will be redundant with the
+            current interface you are creating. The redundantInterface
+            must belong to the same Cloud Router as the interface here.
+            To establish the BGP session to a Router Appliance VM, you
+            must create two BGP peers. The two BGP peers must be
+            attached to two separate interfaces that are redundant with
+            each other. The redundant_interface must be 1-63 characters
+            long, and comply with RFC1035. Specifically, the
+            redundant_interface must be 1-63 characters long and match
+            the regular expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which
+            means the first character must be a lowercase letter, and
+            all following characters must be a dash, lowercase letter,
+            or digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_redundant_interface``.
+        subnetwork (str):
+            The URI of the subnetwork resource that this
+            interface belongs to, which must be in the same
+            region as the Cloud Router. When you establish a
+            BGP session to a VM instance using this
+            interface, the VM instance must belong to the
+            same subnetwork as the subnetwork specified
+            here.
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+    """
+
+    class ManagementType(proto.Enum):
+        r"""[Output Only] The resource that configures and manages this
+        interface. - MANAGED_BY_USER is the default value and can be managed
+        directly by users. - MANAGED_BY_ATTACHMENT is an interface that is
+        configured and managed by Cloud Interconnect, specifically, by an
+        InterconnectAttachment of type PARTNER. Google automatically
+        creates, updates, and deletes this type of interface when the
+        PARTNER InterconnectAttachment is created, updated, or deleted.
+
+        Values:
+            UNDEFINED_MANAGEMENT_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            MANAGED_BY_ATTACHMENT (458926411):
+                The interface is automatically created for
+                PARTNER type InterconnectAttachment, Google will
+                automatically create/update/delete this
+                interface when the PARTNER
+                InterconnectAttachment is
+                created/provisioned/deleted. This type of
+                interface cannot be manually managed by user.
+            MANAGED_BY_USER (317294067):
+                Default value, the interface is manually
+                created and managed by user.
+        """
+        UNDEFINED_MANAGEMENT_TYPE = 0
+        MANAGED_BY_ATTACHMENT = 458926411
+        MANAGED_BY_USER = 317294067
+
+    ip_range: str = proto.Field(
+        proto.STRING,
+        number=145092645,
+        optional=True,
+    )
+    linked_interconnect_attachment: str = proto.Field(
+        proto.STRING,
+        number=501085518,
+        optional=True,
+    )
+    linked_vpn_tunnel: str = proto.Field(
+        proto.STRING,
+        number=352296953,
+        optional=True,
+    )
+    management_type: str = proto.Field(
+        proto.STRING,
+        number=173703606,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    private_ip_address: str = proto.Field(
+        proto.STRING,
+        number=100854040,
+        optional=True,
+    )
+    redundant_interface: str = proto.Field(
+        proto.STRING,
+        number=523187303,
+        optional=True,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+        optional=True,
+    )
+
+
+class RouterList(proto.Message):
+    r"""Contains a list of Router resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.Router]):
+            A list of Router resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#router for
+            routers.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["Router"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="Router",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class RouterMd5AuthenticationKey(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        key (str):
+            [Input only] Value of the key. For patch and update calls,
+            it can be skipped to copy the value from the previous
+            configuration. This is allowed if the key with the same name
+            existed before the operation. Maximum length is 80
+            characters. Can only contain printable ASCII characters.
+
+            This field is a member of `oneof`_ ``_key``.
+        name (str):
+            Name used to identify the key. Must be unique
+            within a router. Must be referenced by exactly
+            one bgpPeer. Must comply with RFC1035.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    key: str = proto.Field(
+        proto.STRING,
+        number=106079,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+
+
+class RouterNat(proto.Message):
+    r"""Represents a Nat resource. It enables the VMs within the
+    specified subnetworks to access Internet without external IP
+    addresses. It specifies a list of subnetworks (and the ranges
+    within) that want to use NAT. Customers can also provide the
+    external IPs that would be used for NAT. GCP would auto-allocate
+    ephemeral IPs if no external IPs are provided.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_network_tier (str):
+            The network tier to use when automatically
+            reserving NAT IP addresses. Must be one of:
+            PREMIUM, STANDARD. If not specified, then the
+            current project-level default tier is used.
+            Check the AutoNetworkTier enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_auto_network_tier``.
+        drain_nat_ips (MutableSequence[str]):
+            A list of URLs of the IP resources to be
+            drained. These IPs must be valid static external
+            IPs that have been assigned to the NAT. These
+            IPs should be used for updating/patching a NAT
+            only.
+        enable_dynamic_port_allocation (bool):
+            Enable Dynamic Port Allocation. If not
+            specified, it is disabled by default. If set to
+            true, - Dynamic Port Allocation will be enabled
+            on this NAT config. -
+            enableEndpointIndependentMapping cannot be set
+            to true. - If minPorts is set, minPortsPerVm
+            must be set to a power of two greater than or
+            equal to 32. If minPortsPerVm is not set, a
+            minimum of 32 ports will be allocated to a VM
+            from this NAT config.
+
+            This field is a member of `oneof`_ ``_enable_dynamic_port_allocation``.
+        enable_endpoint_independent_mapping (bool):
+
+            This field is a member of `oneof`_ ``_enable_endpoint_independent_mapping``.
+        endpoint_types (MutableSequence[str]):
+            List of NAT-ted endpoint types supported by the Nat Gateway.
+            If the list is empty, then it will be equivalent to include
+            ENDPOINT_TYPE_VM Check the EndpointTypes enum for the list
+            of possible values.
+        icmp_idle_timeout_sec (int):
+            Timeout (in seconds) for ICMP connections.
+            Defaults to 30s if not set.
+
+            This field is a member of `oneof`_ ``_icmp_idle_timeout_sec``.
+        log_config (google.cloud.compute_v1.types.RouterNatLogConfig):
+            Configure logging on this NAT.
+
+            This field is a member of `oneof`_ ``_log_config``.
+        max_ports_per_vm (int):
+            Maximum number of ports allocated to a VM
+            from this NAT config when Dynamic Port
+            Allocation is enabled. If Dynamic Port
+            Allocation is not enabled, this field has no
+            effect. If Dynamic Port Allocation is enabled,
+            and this field is set, it must be set to a power
+            of two greater than minPortsPerVm, or 64 if
+            minPortsPerVm is not set. If Dynamic Port
+            Allocation is enabled and this field is not set,
+            a maximum of 65536 ports will be allocated to a
+            VM from this NAT config.
+
+            This field is a member of `oneof`_ ``_max_ports_per_vm``.
+        min_ports_per_vm (int):
+            Minimum number of ports allocated to a VM
+            from this NAT config. If not set, a default
+            number of ports is allocated to a VM. This is
+            rounded up to the nearest power of 2. For
+            example, if the value of this field is 50, at
+            least 64 ports are allocated to a VM.
+
+            This field is a member of `oneof`_ ``_min_ports_per_vm``.
+        name (str):
+            Unique name of this Nat service. The name
+            must be 1-63 characters long and comply with
+            RFC1035.
+
+            This field is a member of `oneof`_ ``_name``.
+        nat_ip_allocate_option (str):
+            Specify the NatIpAllocateOption, which can take one of the
+            following values: - MANUAL_ONLY: Uses only Nat IP addresses
+            provided by customers. When there are not enough specified
+            Nat IPs, the Nat service fails for new VMs. - AUTO_ONLY: Nat
+            IPs are allocated by Google Cloud Platform; customers can't
+            specify any Nat IPs. When choosing AUTO_ONLY, then nat_ip
+            should be empty. Check the NatIpAllocateOption enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_nat_ip_allocate_option``.
+        nat_ips (MutableSequence[str]):
+            A list of URLs of the IP resources used for
+            this Nat service. These IP addresses must be
+            valid static external IP addresses assigned to
+            the project.
+        rules (MutableSequence[google.cloud.compute_v1.types.RouterNatRule]):
+            A list of rules associated with this NAT.
+        source_subnetwork_ip_ranges_to_nat (str):
+            Specify the Nat option, which can take one of the following
+            values: - ALL_SUBNETWORKS_ALL_IP_RANGES: All of the IP
+            ranges in every Subnetwork are allowed to Nat. -
+            ALL_SUBNETWORKS_ALL_PRIMARY_IP_RANGES: All of the primary IP
+            ranges in every Subnetwork are allowed to Nat. -
+            LIST_OF_SUBNETWORKS: A list of Subnetworks are allowed to
+            Nat (specified in the field subnetwork below) The default is
+            SUBNETWORK_IP_RANGE_TO_NAT_OPTION_UNSPECIFIED. Note that if
+            this field contains ALL_SUBNETWORKS_ALL_IP_RANGES then there
+            should not be any other Router.Nat section in any Router for
+            this network in this region. Check the
+            SourceSubnetworkIpRangesToNat enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_source_subnetwork_ip_ranges_to_nat``.
+        subnetworks (MutableSequence[google.cloud.compute_v1.types.RouterNatSubnetworkToNat]):
+            A list of Subnetwork resources whose traffic should be
+            translated by NAT Gateway. It is used only when
+            LIST_OF_SUBNETWORKS is selected for the
+            SubnetworkIpRangeToNatOption above.
+        tcp_established_idle_timeout_sec (int):
+            Timeout (in seconds) for TCP established
+            connections. Defaults to 1200s if not set.
+
+            This field is a member of `oneof`_ ``_tcp_established_idle_timeout_sec``.
+        tcp_time_wait_timeout_sec (int):
+            Timeout (in seconds) for TCP connections that are in
+            TIME_WAIT state. Defaults to 120s if not set.
+
+            This field is a member of `oneof`_ ``_tcp_time_wait_timeout_sec``.
+        tcp_transitory_idle_timeout_sec (int):
+            Timeout (in seconds) for TCP transitory
+            connections. Defaults to 30s if not set.
+
+            This field is a member of `oneof`_ ``_tcp_transitory_idle_timeout_sec``.
+        type_ (str):
+            Indicates whether this NAT is used for public
+            or private IP translation. If unspecified, it
+            defaults to PUBLIC. Check the Type enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+        udp_idle_timeout_sec (int):
+            Timeout (in seconds) for UDP connections.
+            Defaults to 30s if not set.
+
+            This field is a member of `oneof`_ ``_udp_idle_timeout_sec``.
+    """
+
+    class AutoNetworkTier(proto.Enum):
+        r"""The network tier to use when automatically reserving NAT IP
+        addresses. Must be one of: PREMIUM, STANDARD. If not specified,
+        then the current project-level default tier is used.
+
+        Values:
+            UNDEFINED_AUTO_NETWORK_TIER (0):
+                A value indicating that the enum field is not
+                set.
+            FIXED_STANDARD (310464328):
+                Public internet quality with fixed bandwidth.
+            PREMIUM (399530551):
+                High quality, Google-grade network tier,
+                support for all networking products.
+            STANDARD (484642493):
+                Public internet quality, only limited support
+                for other networking products.
+            STANDARD_OVERRIDES_FIXED_STANDARD (465847234):
+                (Output only) Temporary tier for FIXED_STANDARD when fixed
+                standard tier is expired or not configured.
+        """
+        UNDEFINED_AUTO_NETWORK_TIER = 0
+        FIXED_STANDARD = 310464328
+        PREMIUM = 399530551
+        STANDARD = 484642493
+        STANDARD_OVERRIDES_FIXED_STANDARD = 465847234
+
+    class EndpointTypes(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_ENDPOINT_TYPES (0):
+                A value indicating that the enum field is not
+                set.
+            ENDPOINT_TYPE_MANAGED_PROXY_LB (439196930):
+                This is used for regional Application Load
+                Balancers (internal and external) and regional
+                proxy Network Load Balancers (internal and
+                external) endpoints.
+            ENDPOINT_TYPE_SWG (159344456):
+                This is used for Secure Web Gateway
+                endpoints.
+            ENDPOINT_TYPE_VM (57095474):
+                This is the default.
+        """
+        UNDEFINED_ENDPOINT_TYPES = 0
+        ENDPOINT_TYPE_MANAGED_PROXY_LB = 439196930
+        ENDPOINT_TYPE_SWG = 159344456
+        ENDPOINT_TYPE_VM = 57095474
+
+    class NatIpAllocateOption(proto.Enum):
+        r"""Specify the NatIpAllocateOption, which can take one of the following
+        values: - MANUAL_ONLY: Uses only Nat IP addresses provided by
+        customers. When there are not enough specified Nat IPs, the Nat
+        service fails for new VMs. - AUTO_ONLY: Nat IPs are allocated by
+        Google Cloud Platform; customers can't specify any Nat IPs. When
+        choosing AUTO_ONLY, then nat_ip should be empty.
+
+        Values:
+            UNDEFINED_NAT_IP_ALLOCATE_OPTION (0):
+                A value indicating that the enum field is not
+                set.
+            AUTO_ONLY (182333500):
+                Nat IPs are allocated by GCP; customers can
+                not specify any Nat IPs.
+            MANUAL_ONLY (261251205):
+                Only use Nat IPs provided by customers. When
+                specified Nat IPs are not enough then the Nat
+                service fails for new VMs.
+        """
+        UNDEFINED_NAT_IP_ALLOCATE_OPTION = 0
+        AUTO_ONLY = 182333500
+        MANUAL_ONLY = 261251205
+
+    class SourceSubnetworkIpRangesToNat(proto.Enum):
+        r"""Specify the Nat option, which can take one of the following values:
+        - ALL_SUBNETWORKS_ALL_IP_RANGES: All of the IP ranges in every
+        Subnetwork are allowed to Nat. -
+        ALL_SUBNETWORKS_ALL_PRIMARY_IP_RANGES: All of the primary IP ranges
+        in every Subnetwork are allowed to Nat. - LIST_OF_SUBNETWORKS: A
+        list of Subnetworks are allowed to Nat (specified in the field
+        subnetwork below) The default is
+        SUBNETWORK_IP_RANGE_TO_NAT_OPTION_UNSPECIFIED. Note that if this
+        field contains ALL_SUBNETWORKS_ALL_IP_RANGES then there should not
+        be any other Router.Nat section in any Router for this network in
+        this region.
+
+        Values:
+            UNDEFINED_SOURCE_SUBNETWORK_IP_RANGES_TO_NAT (0):
+                A value indicating that the enum field is not
+                set.
+            ALL_SUBNETWORKS_ALL_IP_RANGES (179964376):
+                All the IP ranges in every Subnetwork are
+                allowed to Nat.
+            ALL_SUBNETWORKS_ALL_PRIMARY_IP_RANGES (185573819):
+                All the primary IP ranges in every Subnetwork
+                are allowed to Nat.
+            LIST_OF_SUBNETWORKS (517542270):
+                A list of Subnetworks are allowed to Nat
+                (specified in the field subnetwork below)
+        """
+        UNDEFINED_SOURCE_SUBNETWORK_IP_RANGES_TO_NAT = 0
+        ALL_SUBNETWORKS_ALL_IP_RANGES = 179964376
+        ALL_SUBNETWORKS_ALL_PRIMARY_IP_RANGES = 185573819
+        LIST_OF_SUBNETWORKS = 517542270
+
+    class Type(proto.Enum):
+        r"""Indicates whether this NAT is used for public or private IP
+        translation. If unspecified, it defaults to PUBLIC.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            PRIVATE (403485027):
+                NAT used for private IP translation.
+            PUBLIC (223389289):
+                NAT used for public IP translation. This is
+                the default.
+        """
+        UNDEFINED_TYPE = 0
+        PRIVATE = 403485027
+        PUBLIC = 223389289
+
+    auto_network_tier: str = proto.Field(
+        proto.STRING,
+        number=269770211,
+        optional=True,
+    )
+    drain_nat_ips: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=504078535,
+    )
+    enable_dynamic_port_allocation: bool = proto.Field(
+        proto.BOOL,
+        number=532106402,
+        optional=True,
+    )
+    enable_endpoint_independent_mapping: bool = proto.Field(
+        proto.BOOL,
+        number=259441819,
+        optional=True,
+    )
+    endpoint_types: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=502633807,
+    )
+    icmp_idle_timeout_sec: int = proto.Field(
+        proto.INT32,
+        number=3647562,
+        optional=True,
+    )
+    log_config: "RouterNatLogConfig" = proto.Field(
+        proto.MESSAGE,
+        number=351299741,
+        optional=True,
+        message="RouterNatLogConfig",
+    )
+    max_ports_per_vm: int = proto.Field(
+        proto.INT32,
+        number=250062049,
+        optional=True,
+    )
+    min_ports_per_vm: int = proto.Field(
+        proto.INT32,
+        number=186193587,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    nat_ip_allocate_option: str = proto.Field(
+        proto.STRING,
+        number=429726845,
+        optional=True,
+    )
+    nat_ips: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=117635086,
+    )
+    rules: MutableSequence["RouterNatRule"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=108873975,
+        message="RouterNatRule",
+    )
+    source_subnetwork_ip_ranges_to_nat: str = proto.Field(
+        proto.STRING,
+        number=252213211,
+        optional=True,
+    )
+    subnetworks: MutableSequence["RouterNatSubnetworkToNat"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=415853125,
+        message="RouterNatSubnetworkToNat",
+    )
+    tcp_established_idle_timeout_sec: int = proto.Field(
+        proto.INT32,
+        number=223098349,
+        optional=True,
+    )
+    tcp_time_wait_timeout_sec: int = proto.Field(
+        proto.INT32,
+        number=513596925,
+        optional=True,
+    )
+    tcp_transitory_idle_timeout_sec: int = proto.Field(
+        proto.INT32,
+        number=205028774,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+    udp_idle_timeout_sec: int = proto.Field(
+        proto.INT32,
+        number=64919878,
+        optional=True,
+    )
+
+
+class RouterNatLogConfig(proto.Message):
+    r"""Configuration of logging on a NAT.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enable (bool):
+            Indicates whether or not to export logs. This
+            is false by default.
+
+            This field is a member of `oneof`_ ``_enable``.
+        filter (str):
+            Specify the desired filtering of logs on this NAT. If
+            unspecified, logs are exported for all connections handled
+            by this NAT. This option can take one of the following
+            values: - ERRORS_ONLY: Export logs only for connection
+            failures. - TRANSLATIONS_ONLY: Export logs only for
+            successful connections. - ALL: Export logs for all
+            connections, successful and unsuccessful. Check the Filter
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_filter``.
+    """
+
+    class Filter(proto.Enum):
+        r"""Specify the desired filtering of logs on this NAT. If unspecified,
+        logs are exported for all connections handled by this NAT. This
+        option can take one of the following values: - ERRORS_ONLY: Export
+        logs only for connection failures. - TRANSLATIONS_ONLY: Export logs
+        only for successful connections. - ALL: Export logs for all
+        connections, successful and unsuccessful.
+
+        Values:
+            UNDEFINED_FILTER (0):
+                A value indicating that the enum field is not
+                set.
+            ALL (64897):
+                Export logs for all (successful and
+                unsuccessful) connections.
+            ERRORS_ONLY (307484672):
+                Export logs for connection failures only.
+            TRANSLATIONS_ONLY (357212649):
+                Export logs for successful connections only.
+        """
+        UNDEFINED_FILTER = 0
+        ALL = 64897
+        ERRORS_ONLY = 307484672
+        TRANSLATIONS_ONLY = 357212649
+
+    enable: bool = proto.Field(
+        proto.BOOL,
+        number=311764355,
+        optional=True,
+    )
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+
+
+class RouterNatRule(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        action (google.cloud.compute_v1.types.RouterNatRuleAction):
+            The action to be enforced for traffic that
+            matches this rule.
+
+            This field is a member of `oneof`_ ``_action``.
+        description (str):
+            An optional description of this rule.
+
+            This field is a member of `oneof`_ ``_description``.
+        match (str):
+            CEL expression that specifies the match condition that
+            egress traffic from a VM is evaluated against. If it
+            evaluates to true, the corresponding ``action`` is enforced.
+            The following examples are valid match expressions for
+            public NAT: "inIpRange(destination.ip, '1.1.0.0/16') \|\|
+            inIpRange(destination.ip, '2.2.0.0/16')" "destination.ip ==
+            '1.1.0.1' \|\| destination.ip == '8.8.8.8'" The following
+            example is a valid match expression for private NAT:
+            "nexthop.hub ==
+            '//networkconnectivity.googleapis.com/projects/my-project/locations/global/hubs/hub-1'".
+
+            This field is a member of `oneof`_ ``_match``.
+        rule_number (int):
+            An integer uniquely identifying a rule in the
+            list. The rule number must be a positive value
+            between 0 and 65000, and must be unique among
+            rules within a NAT.
+
+            This field is a member of `oneof`_ ``_rule_number``.
+    """
+
+    action: "RouterNatRuleAction" = proto.Field(
+        proto.MESSAGE,
+        number=187661878,
+        optional=True,
+        message="RouterNatRuleAction",
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    match: str = proto.Field(
+        proto.STRING,
+        number=103668165,
+        optional=True,
+    )
+    rule_number: int = proto.Field(
+        proto.UINT32,
+        number=535211500,
+        optional=True,
+    )
+
+
+class RouterNatRuleAction(proto.Message):
+    r"""
+
+    Attributes:
+        source_nat_active_ips (MutableSequence[str]):
+            A list of URLs of the IP resources used for
+            this NAT rule. These IP addresses must be valid
+            static external IP addresses assigned to the
+            project. This field is used for public NAT.
+        source_nat_active_ranges (MutableSequence[str]):
+            A list of URLs of the subnetworks used as source ranges for
+            this NAT Rule. These subnetworks must have purpose set to
+            PRIVATE_NAT. This field is used for private NAT.
+        source_nat_drain_ips (MutableSequence[str]):
+            A list of URLs of the IP resources to be
+            drained. These IPs must be valid static external
+            IPs that have been assigned to the NAT. These
+            IPs should be used for updating/patching a NAT
+            rule only. This field is used for public NAT.
+        source_nat_drain_ranges (MutableSequence[str]):
+            A list of URLs of subnetworks representing
+            source ranges to be drained. This is only
+            supported on patch/update, and these subnetworks
+            must have previously been used as active ranges
+            in this NAT Rule. This field is used for private
+            NAT.
+    """
+
+    source_nat_active_ips: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=210378229,
+    )
+    source_nat_active_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=190556269,
+    )
+    source_nat_drain_ips: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=340812451,
+    )
+    source_nat_drain_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=84802815,
+    )
+
+
+class RouterNatSubnetworkToNat(proto.Message):
+    r"""Defines the IP ranges that want to use NAT for a subnetwork.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            URL for the subnetwork resource that will use
+            NAT.
+
+            This field is a member of `oneof`_ ``_name``.
+        secondary_ip_range_names (MutableSequence[str]):
+            A list of the secondary ranges of the Subnetwork that are
+            allowed to use NAT. This can be populated only if
+            "LIST_OF_SECONDARY_IP_RANGES" is one of the values in
+            source_ip_ranges_to_nat.
+        source_ip_ranges_to_nat (MutableSequence[str]):
+            Specify the options for NAT ranges in the Subnetwork. All
+            options of a single value are valid except
+            NAT_IP_RANGE_OPTION_UNSPECIFIED. The only valid option with
+            multiple values is: ["PRIMARY_IP_RANGE",
+            "LIST_OF_SECONDARY_IP_RANGES"] Default: [ALL_IP_RANGES]
+            Check the SourceIpRangesToNat enum for the list of possible
+            values.
+    """
+
+    class SourceIpRangesToNat(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_SOURCE_IP_RANGES_TO_NAT (0):
+                A value indicating that the enum field is not
+                set.
+            ALL_IP_RANGES (35608496):
+                The primary and all the secondary ranges are
+                allowed to Nat.
+            LIST_OF_SECONDARY_IP_RANGES (192289308):
+                A list of secondary ranges are allowed to
+                Nat.
+            PRIMARY_IP_RANGE (297109954):
+                The primary range is allowed to Nat.
+        """
+        UNDEFINED_SOURCE_IP_RANGES_TO_NAT = 0
+        ALL_IP_RANGES = 35608496
+        LIST_OF_SECONDARY_IP_RANGES = 192289308
+        PRIMARY_IP_RANGE = 297109954
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    secondary_ip_range_names: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=264315097,
+    )
+    source_ip_ranges_to_nat: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=388310386,
+    )
+
+
+class RouterStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        best_routes (MutableSequence[google.cloud.compute_v1.types.Route]):
+            Best routes for this router's network.
+        best_routes_for_router (MutableSequence[google.cloud.compute_v1.types.Route]):
+            Best routes learned by this router.
+        bgp_peer_status (MutableSequence[google.cloud.compute_v1.types.RouterStatusBgpPeerStatus]):
+
+        nat_status (MutableSequence[google.cloud.compute_v1.types.RouterStatusNatStatus]):
+
+        network (str):
+            URI of the network to which this router
+            belongs.
+
+            This field is a member of `oneof`_ ``_network``.
+    """
+
+    best_routes: MutableSequence[shared_route.Route] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=395826693,
+        message=shared_route.Route,
+    )
+    best_routes_for_router: MutableSequence[shared_route.Route] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=119389689,
+        message=shared_route.Route,
+    )
+    bgp_peer_status: MutableSequence["RouterStatusBgpPeerStatus"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=218459131,
+        message="RouterStatusBgpPeerStatus",
+    )
+    nat_status: MutableSequence["RouterStatusNatStatus"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=63098064,
+        message="RouterStatusNatStatus",
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+
+
+class RouterStatusBgpPeerStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        advertised_routes (MutableSequence[google.cloud.compute_v1.types.Route]):
+            Routes that were advertised to the remote BGP
+            peer
+        bfd_status (google.cloud.compute_v1.types.BfdStatus):
+
+            This field is a member of `oneof`_ ``_bfd_status``.
+        enable_ipv6 (bool):
+            Enable IPv6 traffic over BGP Peer. If not
+            specified, it is disabled by default.
+
+            This field is a member of `oneof`_ ``_enable_ipv6``.
+        ip_address (str):
+            IP address of the local BGP interface.
+
+            This field is a member of `oneof`_ ``_ip_address``.
+        ipv6_nexthop_address (str):
+            IPv6 address of the local BGP interface.
+
+            This field is a member of `oneof`_ ``_ipv6_nexthop_address``.
+        linked_vpn_tunnel (str):
+            URL of the VPN tunnel that this BGP peer
+            controls.
+
+            This field is a member of `oneof`_ ``_linked_vpn_tunnel``.
+        md5_auth_enabled (bool):
+            Informs whether MD5 authentication is enabled
+            on this BGP peer.
+
+            This field is a member of `oneof`_ ``_md5_auth_enabled``.
+        name (str):
+            Name of this BGP peer. Unique within the
+            Routers resource.
+
+            This field is a member of `oneof`_ ``_name``.
+        num_learned_routes (int):
+            Number of routes learned from the remote BGP
+            Peer.
+
+            This field is a member of `oneof`_ ``_num_learned_routes``.
+        peer_ip_address (str):
+            IP address of the remote BGP interface.
+
+            This field is a member of `oneof`_ ``_peer_ip_address``.
+        peer_ipv6_nexthop_address (str):
+            IPv6 address of the remote BGP interface.
+
+            This field is a member of `oneof`_ ``_peer_ipv6_nexthop_address``.
+        router_appliance_instance (str):
+            [Output only] URI of the VM instance that is used as
+            third-party router appliances such as Next Gen Firewalls,
+            Virtual Routers, or Router Appliances. The VM instance is
+            the peer side of the BGP session.
+
+            This field is a member of `oneof`_ ``_router_appliance_instance``.
+        state (str):
+            The state of the BGP session. For a list of
+            possible values for this field, see BGP session
+            states.
+
+            This field is a member of `oneof`_ ``_state``.
+        status (str):
+            Status of the BGP peer: {UP, DOWN}
+            Check the Status enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_status``.
+        status_reason (str):
+            Indicates why particular status was returned.
+            Check the StatusReason enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_status_reason``.
+        uptime (str):
+            Time this session has been up. Format: 14
+            years, 51 weeks, 6 days, 23 hours, 59 minutes,
+            59 seconds
+
+            This field is a member of `oneof`_ ``_uptime``.
+        uptime_seconds (str):
+            Time this session has been up, in seconds.
+            Format: 145
+
+            This field is a member of `oneof`_ ``_uptime_seconds``.
+    """
+
+    class Status(proto.Enum):
+        r"""Status of the BGP peer: {UP, DOWN}
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            DOWN (2104482):
+                No description available.
+            UNKNOWN (433141802):
+                No description available.
+            UP (2715):
+                No description available.
+        """
+        UNDEFINED_STATUS = 0
+        DOWN = 2104482
+        UNKNOWN = 433141802
+        UP = 2715
+
+    class StatusReason(proto.Enum):
+        r"""Indicates why particular status was returned.
+
+        Values:
+            UNDEFINED_STATUS_REASON (0):
+                A value indicating that the enum field is not
+                set.
+            MD5_AUTH_INTERNAL_PROBLEM (140462259):
+                Indicates internal problems with
+                configuration of MD5 authentication. This
+                particular reason can only be returned when
+                md5AuthEnabled is true and status is DOWN.
+            STATUS_REASON_UNSPECIFIED (394331913):
+                No description available.
+        """
+        UNDEFINED_STATUS_REASON = 0
+        MD5_AUTH_INTERNAL_PROBLEM = 140462259
+        STATUS_REASON_UNSPECIFIED = 394331913
+
+    advertised_routes: MutableSequence[shared_route.Route] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=333393068,
+        message=shared_route.Route,
+    )
+    bfd_status: "BfdStatus" = proto.Field(
+        proto.MESSAGE,
+        number=395631729,
+        optional=True,
+        message="BfdStatus",
+    )
+    enable_ipv6: bool = proto.Field(
+        proto.BOOL,
+        number=181467939,
+        optional=True,
+    )
+    ip_address: str = proto.Field(
+        proto.STRING,
+        number=406272220,
+        optional=True,
+    )
+    ipv6_nexthop_address: str = proto.Field(
+        proto.STRING,
+        number=27968211,
+        optional=True,
+    )
+    linked_vpn_tunnel: str = proto.Field(
+        proto.STRING,
+        number=352296953,
+        optional=True,
+    )
+    md5_auth_enabled: bool = proto.Field(
+        proto.BOOL,
+        number=451152075,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    num_learned_routes: int = proto.Field(
+        proto.UINT32,
+        number=135457535,
+        optional=True,
+    )
+    peer_ip_address: str = proto.Field(
+        proto.STRING,
+        number=207735769,
+        optional=True,
+    )
+    peer_ipv6_nexthop_address: str = proto.Field(
+        proto.STRING,
+        number=491486608,
+        optional=True,
+    )
+    router_appliance_instance: str = proto.Field(
+        proto.STRING,
+        number=468312989,
+        optional=True,
+    )
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    status_reason: str = proto.Field(
+        proto.STRING,
+        number=342706993,
+        optional=True,
+    )
+    uptime: str = proto.Field(
+        proto.STRING,
+        number=235379688,
+        optional=True,
+    )
+    uptime_seconds: str = proto.Field(
+        proto.STRING,
+        number=104736040,
+        optional=True,
+    )
+
+
+class RouterStatusNatStatus(proto.Message):
+    r"""Status of a NAT contained in this router.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_allocated_nat_ips (MutableSequence[str]):
+            A list of IPs auto-allocated for NAT. Example: ["1.1.1.1",
+            "129.2.16.89"]
+        drain_auto_allocated_nat_ips (MutableSequence[str]):
+            A list of IPs auto-allocated for NAT that are in drain mode.
+            Example: ["1.1.1.1", "179.12.26.133"].
+        drain_user_allocated_nat_ips (MutableSequence[str]):
+            A list of IPs user-allocated for NAT that are in drain mode.
+            Example: ["1.1.1.1", "179.12.26.133"].
+        min_extra_nat_ips_needed (int):
+            The number of extra IPs to allocate. This will be greater
+            than 0 only if user-specified IPs are NOT enough to allow
+            all configured VMs to use NAT. This value is meaningful only
+            when auto-allocation of NAT IPs is *not* used.
+
+            This field is a member of `oneof`_ ``_min_extra_nat_ips_needed``.
+        name (str):
+            Unique name of this NAT.
+
+            This field is a member of `oneof`_ ``_name``.
+        num_vm_endpoints_with_nat_mappings (int):
+            Number of VM endpoints (i.e., Nics) that can
+            use NAT.
+
+            This field is a member of `oneof`_ ``_num_vm_endpoints_with_nat_mappings``.
+        rule_status (MutableSequence[google.cloud.compute_v1.types.RouterStatusNatStatusNatRuleStatus]):
+            Status of rules in this NAT.
+        user_allocated_nat_ip_resources (MutableSequence[str]):
+            A list of fully qualified URLs of reserved IP
+            address resources.
+        user_allocated_nat_ips (MutableSequence[str]):
+            A list of IPs user-allocated for NAT. They
+            will be raw IP strings like "179.12.26.133".
+    """
+
+    auto_allocated_nat_ips: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=510794246,
+    )
+    drain_auto_allocated_nat_ips: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=309184557,
+    )
+    drain_user_allocated_nat_ips: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=305268553,
+    )
+    min_extra_nat_ips_needed: int = proto.Field(
+        proto.INT32,
+        number=365786338,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    num_vm_endpoints_with_nat_mappings: int = proto.Field(
+        proto.INT32,
+        number=512367468,
+        optional=True,
+    )
+    rule_status: MutableSequence[
+        "RouterStatusNatStatusNatRuleStatus"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=140223125,
+        message="RouterStatusNatStatusNatRuleStatus",
+    )
+    user_allocated_nat_ip_resources: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=212776151,
+    )
+    user_allocated_nat_ips: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=506878242,
+    )
+
+
+class RouterStatusNatStatusNatRuleStatus(proto.Message):
+    r"""Status of a NAT Rule contained in this NAT.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        active_nat_ips (MutableSequence[str]):
+            A list of active IPs for NAT. Example: ["1.1.1.1",
+            "179.12.26.133"].
+        drain_nat_ips (MutableSequence[str]):
+            A list of IPs for NAT that are in drain mode. Example:
+            ["1.1.1.1", "179.12.26.133"].
+        min_extra_ips_needed (int):
+            The number of extra IPs to allocate. This
+            will be greater than 0 only if the existing IPs
+            in this NAT Rule are NOT enough to allow all
+            configured VMs to use NAT.
+
+            This field is a member of `oneof`_ ``_min_extra_ips_needed``.
+        num_vm_endpoints_with_nat_mappings (int):
+            Number of VM endpoints (i.e., NICs) that have
+            NAT Mappings from this NAT Rule.
+
+            This field is a member of `oneof`_ ``_num_vm_endpoints_with_nat_mappings``.
+        rule_number (int):
+            Rule number of the rule.
+
+            This field is a member of `oneof`_ ``_rule_number``.
+    """
+
+    active_nat_ips: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=208517077,
+    )
+    drain_nat_ips: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=504078535,
+    )
+    min_extra_ips_needed: int = proto.Field(
+        proto.INT32,
+        number=353002756,
+        optional=True,
+    )
+    num_vm_endpoints_with_nat_mappings: int = proto.Field(
+        proto.INT32,
+        number=512367468,
+        optional=True,
+    )
+    rule_number: int = proto.Field(
+        proto.INT32,
+        number=535211500,
+        optional=True,
+    )
+
+
+class RouterStatusResponse(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        result (google.cloud.compute_v1.types.RouterStatus):
+
+            This field is a member of `oneof`_ ``_result``.
+    """
+
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    result: "RouterStatus" = proto.Field(
+        proto.MESSAGE,
+        number=139315229,
+        optional=True,
+        message="RouterStatus",
+    )
+
+
+class RoutersPreviewResponse(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        resource (google.cloud.compute_v1.types.Router):
+            Preview of given router.
+
+            This field is a member of `oneof`_ ``_resource``.
+    """
+
+    resource: "Router" = proto.Field(
+        proto.MESSAGE,
+        number=195806222,
+        optional=True,
+        message="Router",
+    )
+
+
+class RoutersScopedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        routers (MutableSequence[google.cloud.compute_v1.types.Router]):
+            A list of routers contained in this scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            Informational warning which replaces the list
+            of routers when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    routers: MutableSequence["Router"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=311906890,
+        message="Router",
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class UpdateRouterRequest(proto.Message):
+    r"""A request message for Routers.Update. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        router (str):
+            Name of the Router resource to update.
+        router_resource (google.cloud.compute_v1.types.Router):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    router: str = proto.Field(
+        proto.STRING,
+        number=148608841,
+    )
+    router_resource: "Router" = proto.Field(
+        proto.MESSAGE,
+        number=155222084,
+        message="Router",
+    )
+
+
+class VmEndpointNatMappings(proto.Message):
+    r"""Contain information of Nat mapping for a VM endpoint (i.e.,
+    NIC).
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_name (str):
+            Name of the VM instance which the endpoint
+            belongs to
+
+            This field is a member of `oneof`_ ``_instance_name``.
+        interface_nat_mappings (MutableSequence[google.cloud.compute_v1.types.VmEndpointNatMappingsInterfaceNatMappings]):
+
+    """
+
+    instance_name: str = proto.Field(
+        proto.STRING,
+        number=227947509,
+        optional=True,
+    )
+    interface_nat_mappings: MutableSequence[
+        "VmEndpointNatMappingsInterfaceNatMappings"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=256196617,
+        message="VmEndpointNatMappingsInterfaceNatMappings",
+    )
+
+
+class VmEndpointNatMappingsInterfaceNatMappings(proto.Message):
+    r"""Contain information of Nat mapping for an interface of this
+    endpoint.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        drain_nat_ip_port_ranges (MutableSequence[str]):
+            List of all drain IP:port-range mappings assigned to this
+            interface. These ranges are inclusive, that is, both the
+            first and the last ports can be used for NAT. Example:
+            ["2.2.2.2:12345-12355", "1.1.1.1:2234-2234"].
+        nat_ip_port_ranges (MutableSequence[str]):
+            A list of all IP:port-range mappings assigned to this
+            interface. These ranges are inclusive, that is, both the
+            first and the last ports can be used for NAT. Example:
+            ["2.2.2.2:12345-12355", "1.1.1.1:2234-2234"].
+        num_total_drain_nat_ports (int):
+            Total number of drain ports across all NAT IPs allocated to
+            this interface. It equals to the aggregated port number in
+            the field drain_nat_ip_port_ranges.
+
+            This field is a member of `oneof`_ ``_num_total_drain_nat_ports``.
+        num_total_nat_ports (int):
+            Total number of ports across all NAT IPs allocated to this
+            interface. It equals to the aggregated port number in the
+            field nat_ip_port_ranges.
+
+            This field is a member of `oneof`_ ``_num_total_nat_ports``.
+        rule_mappings (MutableSequence[google.cloud.compute_v1.types.VmEndpointNatMappingsInterfaceNatMappingsNatRuleMappings]):
+            Information about mappings provided by rules
+            in this NAT.
+        source_alias_ip_range (str):
+            Alias IP range for this interface endpoint.
+            It will be a private (RFC 1918) IP range.
+            Examples: "10.33.4.55/32", or "192.168.5.0/24".
+
+            This field is a member of `oneof`_ ``_source_alias_ip_range``.
+        source_virtual_ip (str):
+            Primary IP of the VM for this NIC.
+
+            This field is a member of `oneof`_ ``_source_virtual_ip``.
+    """
+
+    drain_nat_ip_port_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=395440577,
+    )
+    nat_ip_port_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=531830810,
+    )
+    num_total_drain_nat_ports: int = proto.Field(
+        proto.INT32,
+        number=335532793,
+        optional=True,
+    )
+    num_total_nat_ports: int = proto.Field(
+        proto.INT32,
+        number=299904384,
+        optional=True,
+    )
+    rule_mappings: MutableSequence[
+        "VmEndpointNatMappingsInterfaceNatMappingsNatRuleMappings"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=486192968,
+        message="VmEndpointNatMappingsInterfaceNatMappingsNatRuleMappings",
+    )
+    source_alias_ip_range: str = proto.Field(
+        proto.STRING,
+        number=440340952,
+        optional=True,
+    )
+    source_virtual_ip: str = proto.Field(
+        proto.STRING,
+        number=149836159,
+        optional=True,
+    )
+
+
+class VmEndpointNatMappingsInterfaceNatMappingsNatRuleMappings(proto.Message):
+    r"""Contains information of NAT Mappings provided by a NAT Rule.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        drain_nat_ip_port_ranges (MutableSequence[str]):
+            List of all drain IP:port-range mappings assigned to this
+            interface by this rule. These ranges are inclusive, that is,
+            both the first and the last ports can be used for NAT.
+            Example: ["2.2.2.2:12345-12355", "1.1.1.1:2234-2234"].
+        nat_ip_port_ranges (MutableSequence[str]):
+            A list of all IP:port-range mappings assigned to this
+            interface by this rule. These ranges are inclusive, that is,
+            both the first and the last ports can be used for NAT.
+            Example: ["2.2.2.2:12345-12355", "1.1.1.1:2234-2234"].
+        num_total_drain_nat_ports (int):
+            Total number of drain ports across all NAT IPs allocated to
+            this interface by this rule. It equals the aggregated port
+            number in the field drain_nat_ip_port_ranges.
+
+            This field is a member of `oneof`_ ``_num_total_drain_nat_ports``.
+        num_total_nat_ports (int):
+            Total number of ports across all NAT IPs allocated to this
+            interface by this rule. It equals the aggregated port number
+            in the field nat_ip_port_ranges.
+
+            This field is a member of `oneof`_ ``_num_total_nat_ports``.
+        rule_number (int):
+            Rule number of the NAT Rule.
+
+            This field is a member of `oneof`_ ``_rule_number``.
+    """
+
+    drain_nat_ip_port_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=395440577,
+    )
+    nat_ip_port_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=531830810,
+    )
+    num_total_drain_nat_ports: int = proto.Field(
+        proto.INT32,
+        number=335532793,
+        optional=True,
+    )
+    num_total_nat_ports: int = proto.Field(
+        proto.INT32,
+        number=299904384,
+        optional=True,
+    )
+    rule_number: int = proto.Field(
+        proto.INT32,
+        number=535211500,
+        optional=True,
+    )
+
+
+class VmEndpointNatMappingsList(proto.Message):
+    r"""Contains a list of VmEndpointNatMappings.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#vmEndpointNatMappingsList for lists of Nat mappings
+            of VM endpoints.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        result (MutableSequence[google.cloud.compute_v1.types.VmEndpointNatMappings]):
+            [Output Only] A list of Nat mapping information of VM
+            endpoints.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    result: MutableSequence["VmEndpointNatMappings"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=139315229,
+        message="VmEndpointNatMappings",
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,1221 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_region_set_policy_request
+from google.cloud.compute_v1.types._compute import shared_test_permissions_request
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListServiceAttachmentsRequest",
+        "DeleteServiceAttachmentRequest",
+        "GetIamPolicyServiceAttachmentRequest",
+        "GetServiceAttachmentRequest",
+        "InsertServiceAttachmentRequest",
+        "ListServiceAttachmentsRequest",
+        "PatchServiceAttachmentRequest",
+        "ServiceAttachment",
+        "ServiceAttachmentAggregatedList",
+        "ServiceAttachmentConnectedEndpoint",
+        "ServiceAttachmentConsumerProjectLimit",
+        "ServiceAttachmentList",
+        "ServiceAttachmentsScopedList",
+        "SetIamPolicyServiceAttachmentRequest",
+        "TestIamPermissionsServiceAttachmentRequest",
+        "Uint128",
+    },
+)
+
+
+class AggregatedListServiceAttachmentsRequest(proto.Message):
+    r"""A request message for ServiceAttachments.AggregatedList. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Name of the project scoping this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        service_project_number (int):
+
+            This field is a member of `oneof`_ ``_service_project_number``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    include_all_scopes: bool = proto.Field(
+        proto.BOOL,
+        number=391327988,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    service_project_number: int = proto.Field(
+        proto.INT64,
+        number=316757497,
+        optional=True,
+    )
+
+
+class DeleteServiceAttachmentRequest(proto.Message):
+    r"""A request message for ServiceAttachments.Delete. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region of this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        service_attachment (str):
+            Name of the ServiceAttachment resource to
+            delete.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    service_attachment: str = proto.Field(
+        proto.STRING,
+        number=338957549,
+    )
+
+
+class GetIamPolicyServiceAttachmentRequest(proto.Message):
+    r"""A request message for ServiceAttachments.GetIamPolicy. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version: int = proto.Field(
+        proto.INT32,
+        number=499220029,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class GetServiceAttachmentRequest(proto.Message):
+    r"""A request message for ServiceAttachments.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region of this request.
+        service_attachment (str):
+            Name of the ServiceAttachment resource to
+            return.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    service_attachment: str = proto.Field(
+        proto.STRING,
+        number=338957549,
+    )
+
+
+class InsertServiceAttachmentRequest(proto.Message):
+    r"""A request message for ServiceAttachments.Insert. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region of this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        service_attachment_resource (google.cloud.compute_v1.types.ServiceAttachment):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    service_attachment_resource: "ServiceAttachment" = proto.Field(
+        proto.MESSAGE,
+        number=472980256,
+        message="ServiceAttachment",
+    )
+
+
+class ListServiceAttachmentsRequest(proto.Message):
+    r"""A request message for ServiceAttachments.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region of this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class PatchServiceAttachmentRequest(proto.Message):
+    r"""A request message for ServiceAttachments.Patch. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The region scoping this request and should
+            conform to RFC1035.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        service_attachment (str):
+            The resource id of the ServiceAttachment to
+            patch. It should conform to RFC1035 resource
+            name or be a string form on an unsigned long
+            number.
+        service_attachment_resource (google.cloud.compute_v1.types.ServiceAttachment):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    service_attachment: str = proto.Field(
+        proto.STRING,
+        number=338957549,
+    )
+    service_attachment_resource: "ServiceAttachment" = proto.Field(
+        proto.MESSAGE,
+        number=472980256,
+        message="ServiceAttachment",
+    )
+
+
+class ServiceAttachment(proto.Message):
+    r"""Represents a ServiceAttachment resource. A service attachment
+    represents a service that a producer has exposed. It
+    encapsulates the load balancer which fronts the service runs and
+    a list of NAT IP ranges that the producers uses to represent the
+    consumers connecting to the service.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        connected_endpoints (MutableSequence[google.cloud.compute_v1.types.ServiceAttachmentConnectedEndpoint]):
+            [Output Only] An array of connections for all the consumers
+            connected to this service attachment.
+        connection_preference (str):
+            The connection preference of service attachment. The value
+            can be set to ACCEPT_AUTOMATIC. An ACCEPT_AUTOMATIC service
+            attachment is one that always accepts the connection from
+            consumer forwarding rules. Check the ConnectionPreference
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_connection_preference``.
+        consumer_accept_lists (MutableSequence[google.cloud.compute_v1.types.ServiceAttachmentConsumerProjectLimit]):
+            Projects that are allowed to connect to this
+            service attachment.
+        consumer_reject_lists (MutableSequence[str]):
+            Projects that are not allowed to connect to
+            this service attachment. The project can be
+            specified using its id or number.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        domain_names (MutableSequence[str]):
+            If specified, the domain name will be used
+            during the integration between the PSC connected
+            endpoints and the Cloud DNS. For example, this
+            is a valid domain name: "p.mycompany.com.".
+            Current max number of domain names supported is
+            1.
+        enable_proxy_protocol (bool):
+            If true, enable the proxy protocol which is
+            for supplying client TCP/IP address data in TCP
+            connections that traverse proxies on their way
+            to destination servers.
+
+            This field is a member of `oneof`_ ``_enable_proxy_protocol``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a ServiceAttachment. An
+            up-to-date fingerprint must be provided in order
+            to patch/update the ServiceAttachment;
+            otherwise, the request will fail with error 412
+            conditionNotMet. To see the latest fingerprint,
+            make a get() request to retrieve the
+            ServiceAttachment.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource type.
+            The server generates this identifier.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#serviceAttachment for service attachments.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        nat_subnets (MutableSequence[str]):
+            An array of URLs where each entry is the URL
+            of a subnet provided by the service producer to
+            use for NAT in this service attachment.
+        producer_forwarding_rule (str):
+            The URL of a forwarding rule with loadBalancingScheme
+            INTERNAL\* that is serving the endpoint identified by this
+            service attachment.
+
+            This field is a member of `oneof`_ ``_producer_forwarding_rule``.
+        psc_service_attachment_id (google.cloud.compute_v1.types.Uint128):
+            [Output Only] An 128-bit global unique ID of the PSC service
+            attachment.
+
+            This field is a member of `oneof`_ ``_psc_service_attachment_id``.
+        reconcile_connections (bool):
+            This flag determines whether a consumer
+            accept/reject list change can reconcile the
+            statuses of existing ACCEPTED or REJECTED PSC
+            endpoints. - If false, connection policy update
+            will only affect existing PENDING PSC endpoints.
+            Existing ACCEPTED/REJECTED endpoints will remain
+            untouched regardless how the connection policy
+            is modified . - If true, update will affect both
+            PENDING and ACCEPTED/REJECTED PSC endpoints. For
+            example, an ACCEPTED PSC endpoint will be moved
+            to REJECTED if its project is added to the
+            reject list. For newly created service
+            attachment, this boolean defaults to false.
+
+            This field is a member of `oneof`_ ``_reconcile_connections``.
+        region (str):
+            [Output Only] URL of the region where the service attachment
+            resides. This field applies only to the region resource. You
+            must specify this field as part of the HTTP request URL. It
+            is not settable as a field in the request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        target_service (str):
+            The URL of a service serving the endpoint
+            identified by this service attachment.
+
+            This field is a member of `oneof`_ ``_target_service``.
+    """
+
+    class ConnectionPreference(proto.Enum):
+        r"""The connection preference of service attachment. The value can be
+        set to ACCEPT_AUTOMATIC. An ACCEPT_AUTOMATIC service attachment is
+        one that always accepts the connection from consumer forwarding
+        rules.
+
+        Values:
+            UNDEFINED_CONNECTION_PREFERENCE (0):
+                A value indicating that the enum field is not
+                set.
+            ACCEPT_AUTOMATIC (75250580):
+                No description available.
+            ACCEPT_MANUAL (373061341):
+                No description available.
+            CONNECTION_PREFERENCE_UNSPECIFIED (34590772):
+                No description available.
+        """
+        UNDEFINED_CONNECTION_PREFERENCE = 0
+        ACCEPT_AUTOMATIC = 75250580
+        ACCEPT_MANUAL = 373061341
+        CONNECTION_PREFERENCE_UNSPECIFIED = 34590772
+
+    connected_endpoints: MutableSequence[
+        "ServiceAttachmentConnectedEndpoint"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=72223688,
+        message="ServiceAttachmentConnectedEndpoint",
+    )
+    connection_preference: str = proto.Field(
+        proto.STRING,
+        number=285818076,
+        optional=True,
+    )
+    consumer_accept_lists: MutableSequence[
+        "ServiceAttachmentConsumerProjectLimit"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=402725703,
+        message="ServiceAttachmentConsumerProjectLimit",
+    )
+    consumer_reject_lists: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=204033182,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    domain_names: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=6450189,
+    )
+    enable_proxy_protocol: bool = proto.Field(
+        proto.BOOL,
+        number=363791237,
+        optional=True,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    nat_subnets: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=374785944,
+    )
+    producer_forwarding_rule: str = proto.Field(
+        proto.STRING,
+        number=247927889,
+        optional=True,
+    )
+    psc_service_attachment_id: "Uint128" = proto.Field(
+        proto.MESSAGE,
+        number=527695214,
+        optional=True,
+        message="Uint128",
+    )
+    reconcile_connections: bool = proto.Field(
+        proto.BOOL,
+        number=125493732,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    target_service: str = proto.Field(
+        proto.STRING,
+        number=1293831,
+        optional=True,
+    )
+
+
+class ServiceAttachmentAggregatedList(proto.Message):
+    r"""Contains a list of ServiceAttachmentsScopedList.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableMapping[str, google.cloud.compute_v1.types.ServiceAttachmentsScopedList]):
+            A list of ServiceAttachmentsScopedList
+            resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (MutableSequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableMapping[str, "ServiceAttachmentsScopedList"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="ServiceAttachmentsScopedList",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    unreachables: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=243372063,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class ServiceAttachmentConnectedEndpoint(proto.Message):
+    r"""[Output Only] A connection connected to this service attachment.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        consumer_network (str):
+            The url of the consumer network.
+
+            This field is a member of `oneof`_ ``_consumer_network``.
+        endpoint (str):
+            The url of a connected endpoint.
+
+            This field is a member of `oneof`_ ``_endpoint``.
+        psc_connection_id (int):
+            The PSC connection id of the connected
+            endpoint.
+
+            This field is a member of `oneof`_ ``_psc_connection_id``.
+        status (str):
+            The status of a connected endpoint to this
+            service attachment. Check the Status enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    class Status(proto.Enum):
+        r"""The status of a connected endpoint to this service
+        attachment.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            ACCEPTED (246714279):
+                The connection has been accepted by the
+                producer.
+            CLOSED (380163436):
+                The connection has been closed by the
+                producer.
+            NEEDS_ATTENTION (344491452):
+                The connection has been accepted by the
+                producer, but the producer needs to take further
+                action before the forwarding rule can serve
+                traffic.
+            PENDING (35394935):
+                The connection is pending acceptance by the
+                producer.
+            REJECTED (174130302):
+                The consumer is still connected but not using
+                the connection.
+            STATUS_UNSPECIFIED (42133066):
+                No description available.
+        """
+        UNDEFINED_STATUS = 0
+        ACCEPTED = 246714279
+        CLOSED = 380163436
+        NEEDS_ATTENTION = 344491452
+        PENDING = 35394935
+        REJECTED = 174130302
+        STATUS_UNSPECIFIED = 42133066
+
+    consumer_network: str = proto.Field(
+        proto.STRING,
+        number=254357221,
+        optional=True,
+    )
+    endpoint: str = proto.Field(
+        proto.STRING,
+        number=130489749,
+        optional=True,
+    )
+    psc_connection_id: int = proto.Field(
+        proto.UINT64,
+        number=292082397,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+
+
+class ServiceAttachmentConsumerProjectLimit(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        connection_limit (int):
+            The value of the limit to set.
+
+            This field is a member of `oneof`_ ``_connection_limit``.
+        network_url (str):
+            The network URL for the network to set the
+            limit for.
+
+            This field is a member of `oneof`_ ``_network_url``.
+        project_id_or_num (str):
+            The project id or number for the project to
+            set the limit for.
+
+            This field is a member of `oneof`_ ``_project_id_or_num``.
+    """
+
+    connection_limit: int = proto.Field(
+        proto.UINT32,
+        number=131403546,
+        optional=True,
+    )
+    network_url: str = proto.Field(
+        proto.STRING,
+        number=207194078,
+        optional=True,
+    )
+    project_id_or_num: str = proto.Field(
+        proto.STRING,
+        number=349783336,
+        optional=True,
+    )
+
+
+class ServiceAttachmentList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.ServiceAttachment]):
+            A list of ServiceAttachment resources.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#serviceAttachment for service attachments.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["ServiceAttachment"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="ServiceAttachment",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class ServiceAttachmentsScopedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        service_attachments (MutableSequence[google.cloud.compute_v1.types.ServiceAttachment]):
+            A list of ServiceAttachments contained in
+            this scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            Informational warning which replaces the list
+            of service attachments when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    service_attachments: MutableSequence["ServiceAttachment"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=307136806,
+        message="ServiceAttachment",
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class SetIamPolicyServiceAttachmentRequest(proto.Message):
+    r"""A request message for ServiceAttachments.SetIamPolicy. See
+    the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        region_set_policy_request_resource (google.cloud.compute_v1.types.RegionSetPolicyRequest):
+            The body resource for this request
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_set_policy_request_resource: shared_region_set_policy_request.RegionSetPolicyRequest = proto.Field(
+        proto.MESSAGE,
+        number=276489091,
+        message=shared_region_set_policy_request.RegionSetPolicyRequest,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class TestIamPermissionsServiceAttachmentRequest(proto.Message):
+    r"""A request message for ServiceAttachments.TestIamPermissions.
+    See the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    test_permissions_request_resource: shared_test_permissions_request.TestPermissionsRequest = proto.Field(
+        proto.MESSAGE,
+        number=439214758,
+        message=shared_test_permissions_request.TestPermissionsRequest,
+    )
+
+
+class Uint128(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        high (int):
+
+            This field is a member of `oneof`_ ``_high``.
+        low (int):
+
+            This field is a member of `oneof`_ ``_low``.
+    """
+
+    high: int = proto.Field(
+        proto.UINT64,
+        number=3202466,
+        optional=True,
+    )
+    low: int = proto.Field(
+        proto.UINT64,
+        number=107348,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AcceleratorConfig",
+    },
+)
+
+
+class AcceleratorConfig(proto.Message):
+    r"""A specification of the type and number of accelerator cards
+    attached to the instance.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        accelerator_count (int):
+            The number of the guest accelerator cards
+            exposed to this instance.
+
+            This field is a member of `oneof`_ ``_accelerator_count``.
+        accelerator_type (str):
+            Full or partial URL of the accelerator type
+            resource to attach to this instance. For
+            example:
+            projects/my-project/zones/us-central1-c/acceleratorTypes/nvidia-tesla-p100
+            If you are creating an instance template,
+            specify only the accelerator name. See GPUs on
+            Compute Engine for a full list of accelerator
+            types.
+
+            This field is a member of `oneof`_ ``_accelerator_type``.
+    """
+
+    accelerator_count: int = proto.Field(
+        proto.INT32,
+        number=504879675,
+        optional=True,
+    )
+    accelerator_type: str = proto.Field(
+        proto.STRING,
+        number=138031246,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,560 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "Address",
+        "AddressList",
+    },
+)
+
+
+class Address(proto.Message):
+    r"""Represents an IP Address resource. Google Compute Engine has two IP
+    Address resources: \* `Global (external and
+    internal) <https://cloud.google.com/compute/docs/reference/rest/v1/globalAddresses>`__
+    \* `Regional (external and
+    internal) <https://cloud.google.com/compute/docs/reference/rest/v1/addresses>`__
+    For more information, see Reserving a static external IP address.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        address (str):
+            The static IP address represented by this
+            resource.
+
+            This field is a member of `oneof`_ ``_address``.
+        address_type (str):
+            The type of address to reserve, either
+            INTERNAL or EXTERNAL. If unspecified, defaults
+            to EXTERNAL. Check the AddressType enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_address_type``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this field when you create the resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        ip_version (str):
+            The IP version that will be used by this
+            address. Valid options are IPV4 or IPV6. Check
+            the IpVersion enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_ip_version``.
+        ipv6_endpoint_type (str):
+            The endpoint type of this address, which
+            should be VM or NETLB. This is used for deciding
+            which type of endpoint this address can be used
+            after the external IPv6 address reservation.
+            Check the Ipv6EndpointType enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_ipv6_endpoint_type``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#address
+            for addresses.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this Address, which is essentially a hash of the
+            labels set used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update labels. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change labels, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make a get() request to
+            retrieve an Address.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+            Labels for this resource. These can only be
+            added or modified by the setLabels method. Each
+            label key/value pair must comply with RFC1035.
+            Label values may be empty.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?``. The first character must be
+            a lowercase letter, and all following characters (except for
+            the last character) must be a dash, lowercase letter, or
+            digit. The last character must be a lowercase letter or
+            digit.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            The URL of the network in which to reserve the address. This
+            field can only be used with INTERNAL type with the
+            VPC_PEERING purpose.
+
+            This field is a member of `oneof`_ ``_network``.
+        network_tier (str):
+            This signifies the networking tier used for
+            configuring this address and can only take the
+            following values: PREMIUM or STANDARD. Internal
+            IP addresses are always Premium Tier; global
+            external IP addresses are always Premium Tier;
+            regional external IP addresses can be either
+            Standard or Premium Tier. If this field is not
+            specified, it is assumed to be PREMIUM. Check
+            the NetworkTier enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_network_tier``.
+        prefix_length (int):
+            The prefix length if the resource represents
+            an IP range.
+
+            This field is a member of `oneof`_ ``_prefix_length``.
+        purpose (str):
+            The purpose of this resource, which can be one of the
+            following values: - GCE_ENDPOINT for addresses that are used
+            by VM instances, alias IP ranges, load balancers, and
+            similar resources. - DNS_RESOLVER for a DNS resolver address
+            in a subnetwork for a Cloud DNS inbound forwarder IP
+            addresses (regional internal IP address in a subnet of a VPC
+            network) - VPC_PEERING for global internal IP addresses used
+            for private services access allocated ranges. - NAT_AUTO for
+            the regional external IP addresses used by Cloud NAT when
+            allocating addresses using automatic NAT IP address
+            allocation. - IPSEC_INTERCONNECT for addresses created from
+            a private IP range that are reserved for a VLAN attachment
+            in an *HA VPN over Cloud Interconnect* configuration. These
+            addresses are regional resources. -
+            ``SHARED_LOADBALANCER_VIP`` for an internal IP address that
+            is assigned to multiple internal forwarding rules. -
+            ``PRIVATE_SERVICE_CONNECT`` for a private network address
+            that is used to configure Private Service Connect. Only
+            global internal addresses can use this purpose. Check the
+            Purpose enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_purpose``.
+        region (str):
+            [Output Only] The URL of the region where a regional address
+            resides. For regional addresses, you must specify the region
+            as a path parameter in the HTTP request URL. *This field is
+            not applicable to global addresses.*
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        status (str):
+            [Output Only] The status of the address, which can be one of
+            RESERVING, RESERVED, or IN_USE. An address that is RESERVING
+            is currently in the process of being reserved. A RESERVED
+            address is currently reserved and available to use. An
+            IN_USE address is currently being used by another resource
+            and is not available. Check the Status enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        subnetwork (str):
+            The URL of the subnetwork in which to reserve the address.
+            If an IP address is specified, it must be within the
+            subnetwork's IP range. This field can only be used with
+            INTERNAL type with a GCE_ENDPOINT or DNS_RESOLVER purpose.
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+        users (MutableSequence[str]):
+            [Output Only] The URLs of the resources that are using this
+            address.
+    """
+
+    class AddressType(proto.Enum):
+        r"""The type of address to reserve, either INTERNAL or EXTERNAL.
+        If unspecified, defaults to EXTERNAL.
+
+        Values:
+            UNDEFINED_ADDRESS_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            EXTERNAL (35607499):
+                A publicly visible external IP address.
+            INTERNAL (279295677):
+                A private network IP address, for use with an
+                Instance or Internal Load Balancer forwarding
+                rule.
+            UNSPECIFIED_TYPE (53933922):
+                No description available.
+        """
+        UNDEFINED_ADDRESS_TYPE = 0
+        EXTERNAL = 35607499
+        INTERNAL = 279295677
+        UNSPECIFIED_TYPE = 53933922
+
+    class IpVersion(proto.Enum):
+        r"""The IP version that will be used by this address. Valid
+        options are IPV4 or IPV6.
+
+        Values:
+            UNDEFINED_IP_VERSION (0):
+                A value indicating that the enum field is not
+                set.
+            IPV4 (2254341):
+                No description available.
+            IPV6 (2254343):
+                No description available.
+            UNSPECIFIED_VERSION (21850000):
+                No description available.
+        """
+        UNDEFINED_IP_VERSION = 0
+        IPV4 = 2254341
+        IPV6 = 2254343
+        UNSPECIFIED_VERSION = 21850000
+
+    class Ipv6EndpointType(proto.Enum):
+        r"""The endpoint type of this address, which should be VM or
+        NETLB. This is used for deciding which type of endpoint this
+        address can be used after the external IPv6 address reservation.
+
+        Values:
+            UNDEFINED_IPV6_ENDPOINT_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            NETLB (74173363):
+                Reserved IPv6 address can be used on network
+                load balancer.
+            VM (2743):
+                Reserved IPv6 address can be used on VM.
+        """
+        UNDEFINED_IPV6_ENDPOINT_TYPE = 0
+        NETLB = 74173363
+        VM = 2743
+
+    class NetworkTier(proto.Enum):
+        r"""This signifies the networking tier used for configuring this
+        address and can only take the following values: PREMIUM or
+        STANDARD. Internal IP addresses are always Premium Tier; global
+        external IP addresses are always Premium Tier; regional external
+        IP addresses can be either Standard or Premium Tier. If this
+        field is not specified, it is assumed to be PREMIUM.
+
+        Values:
+            UNDEFINED_NETWORK_TIER (0):
+                A value indicating that the enum field is not
+                set.
+            FIXED_STANDARD (310464328):
+                Public internet quality with fixed bandwidth.
+            PREMIUM (399530551):
+                High quality, Google-grade network tier,
+                support for all networking products.
+            STANDARD (484642493):
+                Public internet quality, only limited support
+                for other networking products.
+            STANDARD_OVERRIDES_FIXED_STANDARD (465847234):
+                (Output only) Temporary tier for FIXED_STANDARD when fixed
+                standard tier is expired or not configured.
+        """
+        UNDEFINED_NETWORK_TIER = 0
+        FIXED_STANDARD = 310464328
+        PREMIUM = 399530551
+        STANDARD = 484642493
+        STANDARD_OVERRIDES_FIXED_STANDARD = 465847234
+
+    class Purpose(proto.Enum):
+        r"""The purpose of this resource, which can be one of the following
+        values: - GCE_ENDPOINT for addresses that are used by VM instances,
+        alias IP ranges, load balancers, and similar resources. -
+        DNS_RESOLVER for a DNS resolver address in a subnetwork for a Cloud
+        DNS inbound forwarder IP addresses (regional internal IP address in
+        a subnet of a VPC network) - VPC_PEERING for global internal IP
+        addresses used for private services access allocated ranges. -
+        NAT_AUTO for the regional external IP addresses used by Cloud NAT
+        when allocating addresses using automatic NAT IP address allocation.
+        - IPSEC_INTERCONNECT for addresses created from a private IP range
+        that are reserved for a VLAN attachment in an *HA VPN over Cloud
+        Interconnect* configuration. These addresses are regional resources.
+        - ``SHARED_LOADBALANCER_VIP`` for an internal IP address that is
+        assigned to multiple internal forwarding rules. -
+        ``PRIVATE_SERVICE_CONNECT`` for a private network address that is
+        used to configure Private Service Connect. Only global internal
+        addresses can use this purpose.
+
+        Values:
+            UNDEFINED_PURPOSE (0):
+                A value indicating that the enum field is not
+                set.
+            DNS_RESOLVER (476114556):
+                DNS resolver address in the subnetwork.
+            GCE_ENDPOINT (230515243):
+                VM internal/alias IP, Internal LB service IP,
+                etc.
+            IPSEC_INTERCONNECT (340437251):
+                A regional internal IP address range reserved
+                for the VLAN attachment that is used in HA VPN
+                over Cloud Interconnect. This regional internal
+                IP address range must not overlap with any IP
+                address range of subnet/route in the VPC network
+                and its peering networks. After the VLAN
+                attachment is created with the reserved IP
+                address range, when creating a new VPN gateway,
+                its interface IP address is allocated from the
+                associated VLAN attachment’s IP address range.
+            NAT_AUTO (163666477):
+                External IP automatically reserved for Cloud
+                NAT.
+            PRIVATE_SERVICE_CONNECT (48134724):
+                A private network IP address that can be used
+                to configure Private Service Connect. This
+                purpose can be specified only for GLOBAL
+                addresses of Type INTERNAL
+            SERVERLESS (270492508):
+                A regional internal IP address range reserved
+                for Serverless.
+            SHARED_LOADBALANCER_VIP (294447572):
+                A private network IP address that can be
+                shared by multiple Internal Load Balancer
+                forwarding rules.
+            VPC_PEERING (400800170):
+                IP range for peer networks.
+        """
+        UNDEFINED_PURPOSE = 0
+        DNS_RESOLVER = 476114556
+        GCE_ENDPOINT = 230515243
+        IPSEC_INTERCONNECT = 340437251
+        NAT_AUTO = 163666477
+        PRIVATE_SERVICE_CONNECT = 48134724
+        SERVERLESS = 270492508
+        SHARED_LOADBALANCER_VIP = 294447572
+        VPC_PEERING = 400800170
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the address, which can be one of
+        RESERVING, RESERVED, or IN_USE. An address that is RESERVING is
+        currently in the process of being reserved. A RESERVED address is
+        currently reserved and available to use. An IN_USE address is
+        currently being used by another resource and is not available.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            IN_USE (17393485):
+                Address is being used by another resource and
+                is not available.
+            RESERVED (432241448):
+                Address is reserved and available to use.
+            RESERVING (514587225):
+                Address is being reserved.
+        """
+        UNDEFINED_STATUS = 0
+        IN_USE = 17393485
+        RESERVED = 432241448
+        RESERVING = 514587225
+
+    address: str = proto.Field(
+        proto.STRING,
+        number=462920692,
+        optional=True,
+    )
+    address_type: str = proto.Field(
+        proto.STRING,
+        number=264307877,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    ip_version: str = proto.Field(
+        proto.STRING,
+        number=294959552,
+        optional=True,
+    )
+    ipv6_endpoint_type: str = proto.Field(
+        proto.STRING,
+        number=97501004,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    network_tier: str = proto.Field(
+        proto.STRING,
+        number=517397843,
+        optional=True,
+    )
+    prefix_length: int = proto.Field(
+        proto.INT32,
+        number=453565747,
+        optional=True,
+    )
+    purpose: str = proto.Field(
+        proto.STRING,
+        number=316407070,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+        optional=True,
+    )
+    users: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=111578632,
+    )
+
+
+class AddressList(proto.Message):
+    r"""Contains a list of addresses.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.Address]):
+            A list of Address resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#addressList
+            for lists of addresses.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["Address"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="Address",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
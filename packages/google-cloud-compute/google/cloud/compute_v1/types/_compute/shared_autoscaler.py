@@ -0,0 +1,1056 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_fixed_or_percent
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "Autoscaler",
+        "AutoscalerStatusDetails",
+        "AutoscalingPolicy",
+        "AutoscalingPolicyCpuUtilization",
+        "AutoscalingPolicyCustomMetricUtilization",
+        "AutoscalingPolicyLoadBalancingUtilization",
+        "AutoscalingPolicyScaleInControl",
+        "AutoscalingPolicyScalingSchedule",
+        "ScalingScheduleStatus",
+    },
+)
+
+
+class Autoscaler(proto.Message):
+    r"""Represents an Autoscaler resource. Google Compute Engine has two
+    Autoscaler resources: \*
+    `Zonal </compute/docs/reference/rest/v1/autoscalers>`__ \*
+    `Regional </compute/docs/reference/rest/v1/regionAutoscalers>`__ Use
+    autoscalers to automatically add or delete instances from a managed
+    instance group according to your defined autoscaling policy. For
+    more information, read Autoscaling Groups of Instances. For zonal
+    managed instance groups resource, use the autoscaler resource. For
+    regional managed instance groups, use the regionAutoscalers
+    resource.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        autoscaling_policy (google.cloud.compute_v1.types.AutoscalingPolicy):
+            The configuration parameters for the
+            autoscaling algorithm. You can define one or
+            more signals for an autoscaler: cpuUtilization,
+            customMetricUtilizations, and
+            loadBalancingUtilization. If none of these are
+            specified, the default will be to autoscale
+            based on cpuUtilization to 0.6 or 60%.
+
+            This field is a member of `oneof`_ ``_autoscaling_policy``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#autoscaler for autoscalers.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        recommended_size (int):
+            [Output Only] Target recommended MIG size (number of
+            instances) computed by autoscaler. Autoscaler calculates the
+            recommended MIG size even when the autoscaling policy mode
+            is different from ON. This field is empty when autoscaler is
+            not connected to an existing managed instance group or
+            autoscaler did not generate its prediction.
+
+            This field is a member of `oneof`_ ``_recommended_size``.
+        region (str):
+            [Output Only] URL of the region where the instance group
+            resides (for autoscalers living in regional scope).
+
+            This field is a member of `oneof`_ ``_region``.
+        scaling_schedule_status (MutableMapping[str, google.cloud.compute_v1.types.ScalingScheduleStatus]):
+            [Output Only] Status information of existing scaling
+            schedules.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        status (str):
+            [Output Only] The status of the autoscaler configuration.
+            Current set of possible values: - PENDING: Autoscaler
+            backend hasn't read new/updated configuration. - DELETING:
+            Configuration is being deleted. - ACTIVE: Configuration is
+            acknowledged to be effective. Some warnings might be present
+            in the statusDetails field. - ERROR: Configuration has
+            errors. Actionable for users. Details are present in the
+            statusDetails field. New values might be added in the
+            future. Check the Status enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_status``.
+        status_details (MutableSequence[google.cloud.compute_v1.types.AutoscalerStatusDetails]):
+            [Output Only] Human-readable details about the current state
+            of the autoscaler. Read the documentation for Commonly
+            returned status messages for examples of status messages you
+            might encounter.
+        target (str):
+            URL of the managed instance group that this
+            autoscaler will scale. This field is required
+            when creating an autoscaler.
+
+            This field is a member of `oneof`_ ``_target``.
+        zone (str):
+            [Output Only] URL of the zone where the instance group
+            resides (for autoscalers living in zonal scope).
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the autoscaler configuration. Current
+        set of possible values: - PENDING: Autoscaler backend hasn't read
+        new/updated configuration. - DELETING: Configuration is being
+        deleted. - ACTIVE: Configuration is acknowledged to be effective.
+        Some warnings might be present in the statusDetails field. - ERROR:
+        Configuration has errors. Actionable for users. Details are present
+        in the statusDetails field. New values might be added in the future.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                Configuration is acknowledged to be effective
+            DELETING (528602024):
+                Configuration is being deleted
+            ERROR (66247144):
+                Configuration has errors. Actionable for
+                users.
+            PENDING (35394935):
+                Autoscaler backend hasn't read new/updated
+                configuration
+        """
+        UNDEFINED_STATUS = 0
+        ACTIVE = 314733318
+        DELETING = 528602024
+        ERROR = 66247144
+        PENDING = 35394935
+
+    autoscaling_policy: "AutoscalingPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=221950041,
+        optional=True,
+        message="AutoscalingPolicy",
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    recommended_size: int = proto.Field(
+        proto.INT32,
+        number=257915749,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    scaling_schedule_status: MutableMapping[
+        str, "ScalingScheduleStatus"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=465950178,
+        message="ScalingScheduleStatus",
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    status_details: MutableSequence["AutoscalerStatusDetails"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=363353845,
+        message="AutoscalerStatusDetails",
+    )
+    target: str = proto.Field(
+        proto.STRING,
+        number=192835985,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+        optional=True,
+    )
+
+
+class AutoscalerStatusDetails(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        message (str):
+            The status message.
+
+            This field is a member of `oneof`_ ``_message``.
+        type_ (str):
+            The type of error, warning, or notice returned. Current set
+            of possible values: - ALL_INSTANCES_UNHEALTHY (WARNING): All
+            instances in the instance group are unhealthy (not in
+            RUNNING state). - BACKEND_SERVICE_DOES_NOT_EXIST (ERROR):
+            There is no backend service attached to the instance group.
+            - CAPPED_AT_MAX_NUM_REPLICAS (WARNING): Autoscaler
+            recommends a size greater than maxNumReplicas. -
+            CUSTOM_METRIC_DATA_POINTS_TOO_SPARSE (WARNING): The custom
+            metric samples are not exported often enough to be a
+            credible base for autoscaling. - CUSTOM_METRIC_INVALID
+            (ERROR): The custom metric that was specified does not exist
+            or does not have the necessary labels. - MIN_EQUALS_MAX
+            (WARNING): The minNumReplicas is equal to maxNumReplicas.
+            This means the autoscaler cannot add or remove instances
+            from the instance group. - MISSING_CUSTOM_METRIC_DATA_POINTS
+            (WARNING): The autoscaler did not receive any data from the
+            custom metric configured for autoscaling. -
+            MISSING_LOAD_BALANCING_DATA_POINTS (WARNING): The autoscaler
+            is configured to scale based on a load balancing signal but
+            the instance group has not received any requests from the
+            load balancer. - MODE_OFF (WARNING): Autoscaling is turned
+            off. The number of instances in the group won't change
+            automatically. The autoscaling configuration is preserved. -
+            MODE_ONLY_UP (WARNING): Autoscaling is in the "Autoscale
+            only out" mode. The autoscaler can add instances but not
+            remove any. - MORE_THAN_ONE_BACKEND_SERVICE (ERROR): The
+            instance group cannot be autoscaled because it has more than
+            one backend service attached to it. -
+            NOT_ENOUGH_QUOTA_AVAILABLE (ERROR): There is insufficient
+            quota for the necessary resources, such as CPU or number of
+            instances. - REGION_RESOURCE_STOCKOUT (ERROR): Shown only
+            for regional autoscalers: there is a resource stockout in
+            the chosen region. - SCALING_TARGET_DOES_NOT_EXIST (ERROR):
+            The target to be scaled does not exist. -
+            UNSUPPORTED_MAX_RATE_LOAD_BALANCING_CONFIGURATION (ERROR):
+            Autoscaling does not work with an HTTP/S load balancer that
+            has been configured for maxRate. - ZONE_RESOURCE_STOCKOUT
+            (ERROR): For zonal autoscalers: there is a resource stockout
+            in the chosen zone. For regional autoscalers: in at least
+            one of the zones you're using there is a resource stockout.
+            New values might be added in the future. Some of the values
+            might not be available in all API versions. Check the Type
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r"""The type of error, warning, or notice returned. Current set of
+        possible values: - ALL_INSTANCES_UNHEALTHY (WARNING): All instances
+        in the instance group are unhealthy (not in RUNNING state). -
+        BACKEND_SERVICE_DOES_NOT_EXIST (ERROR): There is no backend service
+        attached to the instance group. - CAPPED_AT_MAX_NUM_REPLICAS
+        (WARNING): Autoscaler recommends a size greater than maxNumReplicas.
+        - CUSTOM_METRIC_DATA_POINTS_TOO_SPARSE (WARNING): The custom metric
+        samples are not exported often enough to be a credible base for
+        autoscaling. - CUSTOM_METRIC_INVALID (ERROR): The custom metric that
+        was specified does not exist or does not have the necessary labels.
+        - MIN_EQUALS_MAX (WARNING): The minNumReplicas is equal to
+        maxNumReplicas. This means the autoscaler cannot add or remove
+        instances from the instance group. -
+        MISSING_CUSTOM_METRIC_DATA_POINTS (WARNING): The autoscaler did not
+        receive any data from the custom metric configured for autoscaling.
+        - MISSING_LOAD_BALANCING_DATA_POINTS (WARNING): The autoscaler is
+        configured to scale based on a load balancing signal but the
+        instance group has not received any requests from the load balancer.
+        - MODE_OFF (WARNING): Autoscaling is turned off. The number of
+        instances in the group won't change automatically. The autoscaling
+        configuration is preserved. - MODE_ONLY_UP (WARNING): Autoscaling is
+        in the "Autoscale only out" mode. The autoscaler can add instances
+        but not remove any. - MORE_THAN_ONE_BACKEND_SERVICE (ERROR): The
+        instance group cannot be autoscaled because it has more than one
+        backend service attached to it. - NOT_ENOUGH_QUOTA_AVAILABLE
+        (ERROR): There is insufficient quota for the necessary resources,
+        such as CPU or number of instances. - REGION_RESOURCE_STOCKOUT
+        (ERROR): Shown only for regional autoscalers: there is a resource
+        stockout in the chosen region. - SCALING_TARGET_DOES_NOT_EXIST
+        (ERROR): The target to be scaled does not exist. -
+        UNSUPPORTED_MAX_RATE_LOAD_BALANCING_CONFIGURATION (ERROR):
+        Autoscaling does not work with an HTTP/S load balancer that has been
+        configured for maxRate. - ZONE_RESOURCE_STOCKOUT (ERROR): For zonal
+        autoscalers: there is a resource stockout in the chosen zone. For
+        regional autoscalers: in at least one of the zones you're using
+        there is a resource stockout. New values might be added in the
+        future. Some of the values might not be available in all API
+        versions.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            ALL_INSTANCES_UNHEALTHY (404965477):
+                All instances in the instance group are
+                unhealthy (not in RUNNING state).
+            BACKEND_SERVICE_DOES_NOT_EXIST (191417626):
+                There is no backend service attached to the
+                instance group.
+            CAPPED_AT_MAX_NUM_REPLICAS (518617):
+                Autoscaler recommends a size greater than
+                maxNumReplicas.
+            CUSTOM_METRIC_DATA_POINTS_TOO_SPARSE (328964659):
+                The custom metric samples are not exported
+                often enough to be a credible base for
+                autoscaling.
+            CUSTOM_METRIC_INVALID (204430550):
+                The custom metric that was specified does not
+                exist or does not have the necessary labels.
+            MIN_EQUALS_MAX (2821361):
+                The minNumReplicas is equal to
+                maxNumReplicas. This means the autoscaler cannot
+                add or remove instances from the instance group.
+            MISSING_CUSTOM_METRIC_DATA_POINTS (94885086):
+                The autoscaler did not receive any data from
+                the custom metric configured for autoscaling.
+            MISSING_LOAD_BALANCING_DATA_POINTS (509858898):
+                The autoscaler is configured to scale based
+                on a load balancing signal but the instance
+                group has not received any requests from the
+                load balancer.
+            MODE_OFF (164169907):
+                Autoscaling is turned off. The number of
+                instances in the group won't change
+                automatically. The autoscaling configuration is
+                preserved.
+            MODE_ONLY_SCALE_OUT (3840994):
+                Autoscaling is in the "Autoscale only scale
+                out" mode. Instances in the group will be only
+                added.
+            MODE_ONLY_UP (100969842):
+                Autoscaling is in the "Autoscale only out"
+                mode. Instances in the group will be only added.
+            MORE_THAN_ONE_BACKEND_SERVICE (151922141):
+                The instance group cannot be autoscaled
+                because it has more than one backend service
+                attached to it.
+            NOT_ENOUGH_QUOTA_AVAILABLE (403101631):
+                There is insufficient quota for the necessary
+                resources, such as CPU or number of instances.
+            REGION_RESOURCE_STOCKOUT (528622846):
+                Showed only for regional autoscalers: there
+                is a resource stockout in the chosen region.
+            SCALING_TARGET_DOES_NOT_EXIST (122636699):
+                The target to be scaled does not exist.
+            SCHEDULED_INSTANCES_GREATER_THAN_AUTOSCALER_MAX (29275586):
+                For some scaling schedules
+                minRequiredReplicas is greater than
+                maxNumReplicas. Autoscaler always recommends at
+                most maxNumReplicas instances.
+            SCHEDULED_INSTANCES_LESS_THAN_AUTOSCALER_MIN (398287669):
+                For some scaling schedules
+                minRequiredReplicas is less than minNumReplicas.
+                Autoscaler always recommends at least
+                minNumReplicas instances.
+            UNKNOWN (433141802):
+                No description available.
+            UNSUPPORTED_MAX_RATE_LOAD_BALANCING_CONFIGURATION (330845009):
+                Autoscaling does not work with an HTTP/S load
+                balancer that has been configured for maxRate.
+            ZONE_RESOURCE_STOCKOUT (210200502):
+                For zonal autoscalers: there is a resource
+                stockout in the chosen zone. For regional
+                autoscalers: in at least one of the zones you're
+                using there is a resource stockout.
+        """
+        UNDEFINED_TYPE = 0
+        ALL_INSTANCES_UNHEALTHY = 404965477
+        BACKEND_SERVICE_DOES_NOT_EXIST = 191417626
+        CAPPED_AT_MAX_NUM_REPLICAS = 518617
+        CUSTOM_METRIC_DATA_POINTS_TOO_SPARSE = 328964659
+        CUSTOM_METRIC_INVALID = 204430550
+        MIN_EQUALS_MAX = 2821361
+        MISSING_CUSTOM_METRIC_DATA_POINTS = 94885086
+        MISSING_LOAD_BALANCING_DATA_POINTS = 509858898
+        MODE_OFF = 164169907
+        MODE_ONLY_SCALE_OUT = 3840994
+        MODE_ONLY_UP = 100969842
+        MORE_THAN_ONE_BACKEND_SERVICE = 151922141
+        NOT_ENOUGH_QUOTA_AVAILABLE = 403101631
+        REGION_RESOURCE_STOCKOUT = 528622846
+        SCALING_TARGET_DOES_NOT_EXIST = 122636699
+        SCHEDULED_INSTANCES_GREATER_THAN_AUTOSCALER_MAX = 29275586
+        SCHEDULED_INSTANCES_LESS_THAN_AUTOSCALER_MIN = 398287669
+        UNKNOWN = 433141802
+        UNSUPPORTED_MAX_RATE_LOAD_BALANCING_CONFIGURATION = 330845009
+        ZONE_RESOURCE_STOCKOUT = 210200502
+
+    message: str = proto.Field(
+        proto.STRING,
+        number=418054151,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+class AutoscalingPolicy(proto.Message):
+    r"""Cloud Autoscaler policy.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        cool_down_period_sec (int):
+            The number of seconds that your application takes to
+            initialize on a VM instance. This is referred to as the
+            `initialization
+            period </compute/docs/autoscaler#cool_down_period>`__.
+            Specifying an accurate initialization period improves
+            autoscaler decisions. For example, when scaling out, the
+            autoscaler ignores data from VMs that are still initializing
+            because those VMs might not yet represent normal usage of
+            your application. The default initialization period is 60
+            seconds. Initialization periods might vary because of
+            numerous factors. We recommend that you test how long your
+            application takes to initialize. To do this, create a VM and
+            time your application's startup process.
+
+            This field is a member of `oneof`_ ``_cool_down_period_sec``.
+        cpu_utilization (google.cloud.compute_v1.types.AutoscalingPolicyCpuUtilization):
+            Defines the CPU utilization policy that
+            allows the autoscaler to scale based on the
+            average CPU utilization of a managed instance
+            group.
+
+            This field is a member of `oneof`_ ``_cpu_utilization``.
+        custom_metric_utilizations (MutableSequence[google.cloud.compute_v1.types.AutoscalingPolicyCustomMetricUtilization]):
+            Configuration parameters of autoscaling based
+            on a custom metric.
+        load_balancing_utilization (google.cloud.compute_v1.types.AutoscalingPolicyLoadBalancingUtilization):
+            Configuration parameters of autoscaling based
+            on load balancer.
+
+            This field is a member of `oneof`_ ``_load_balancing_utilization``.
+        max_num_replicas (int):
+            The maximum number of instances that the
+            autoscaler can scale out to. This is required
+            when creating or updating an autoscaler. The
+            maximum number of replicas must not be lower
+            than minimal number of replicas.
+
+            This field is a member of `oneof`_ ``_max_num_replicas``.
+        min_num_replicas (int):
+            The minimum number of replicas that the
+            autoscaler can scale in to. This cannot be less
+            than 0. If not provided, autoscaler chooses a
+            default value depending on maximum number of
+            instances allowed.
+
+            This field is a member of `oneof`_ ``_min_num_replicas``.
+        mode (str):
+            Defines the operating mode for this policy. The following
+            modes are available: - OFF: Disables the autoscaler but
+            maintains its configuration. - ONLY_SCALE_OUT: Restricts the
+            autoscaler to add VM instances only. - ON: Enables all
+            autoscaler activities according to its policy. For more
+            information, see "Turning off or restricting an autoscaler"
+            Check the Mode enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_mode``.
+        scale_in_control (google.cloud.compute_v1.types.AutoscalingPolicyScaleInControl):
+
+            This field is a member of `oneof`_ ``_scale_in_control``.
+        scaling_schedules (MutableMapping[str, google.cloud.compute_v1.types.AutoscalingPolicyScalingSchedule]):
+            Scaling schedules defined for an autoscaler. Multiple
+            schedules can be set on an autoscaler, and they can overlap.
+            During overlapping periods the greatest
+            min_required_replicas of all scaling schedules is applied.
+            Up to 128 scaling schedules are allowed.
+    """
+
+    class Mode(proto.Enum):
+        r"""Defines the operating mode for this policy. The following modes are
+        available: - OFF: Disables the autoscaler but maintains its
+        configuration. - ONLY_SCALE_OUT: Restricts the autoscaler to add VM
+        instances only. - ON: Enables all autoscaler activities according to
+        its policy. For more information, see "Turning off or restricting an
+        autoscaler"
+
+        Values:
+            UNDEFINED_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            OFF (78159):
+                Do not automatically scale the MIG in or out. The
+                recommended_size field contains the size of MIG that would
+                be set if the actuation mode was enabled.
+            ON (2527):
+                Automatically scale the MIG in and out
+                according to the policy.
+            ONLY_SCALE_OUT (152713670):
+                Automatically create VMs according to the
+                policy, but do not scale the MIG in.
+            ONLY_UP (478095374):
+                Automatically create VMs according to the
+                policy, but do not scale the MIG in.
+        """
+        UNDEFINED_MODE = 0
+        OFF = 78159
+        ON = 2527
+        ONLY_SCALE_OUT = 152713670
+        ONLY_UP = 478095374
+
+    cool_down_period_sec: int = proto.Field(
+        proto.INT32,
+        number=107692954,
+        optional=True,
+    )
+    cpu_utilization: "AutoscalingPolicyCpuUtilization" = proto.Field(
+        proto.MESSAGE,
+        number=381211147,
+        optional=True,
+        message="AutoscalingPolicyCpuUtilization",
+    )
+    custom_metric_utilizations: MutableSequence[
+        "AutoscalingPolicyCustomMetricUtilization"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=131972850,
+        message="AutoscalingPolicyCustomMetricUtilization",
+    )
+    load_balancing_utilization: "AutoscalingPolicyLoadBalancingUtilization" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=429746403,
+            optional=True,
+            message="AutoscalingPolicyLoadBalancingUtilization",
+        )
+    )
+    max_num_replicas: int = proto.Field(
+        proto.INT32,
+        number=62327375,
+        optional=True,
+    )
+    min_num_replicas: int = proto.Field(
+        proto.INT32,
+        number=535329825,
+        optional=True,
+    )
+    mode: str = proto.Field(
+        proto.STRING,
+        number=3357091,
+        optional=True,
+    )
+    scale_in_control: "AutoscalingPolicyScaleInControl" = proto.Field(
+        proto.MESSAGE,
+        number=527670872,
+        optional=True,
+        message="AutoscalingPolicyScaleInControl",
+    )
+    scaling_schedules: MutableMapping[
+        str, "AutoscalingPolicyScalingSchedule"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=355416580,
+        message="AutoscalingPolicyScalingSchedule",
+    )
+
+
+class AutoscalingPolicyCpuUtilization(proto.Message):
+    r"""CPU utilization policy.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        predictive_method (str):
+            Indicates whether predictive autoscaling based on CPU metric
+            is enabled. Valid values are: \* NONE (default). No
+            predictive method is used. The autoscaler scales the group
+            to meet current demand based on real-time metrics. \*
+            OPTIMIZE_AVAILABILITY. Predictive autoscaling improves
+            availability by monitoring daily and weekly load patterns
+            and scaling out ahead of anticipated demand. Check the
+            PredictiveMethod enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_predictive_method``.
+        utilization_target (float):
+            The target CPU utilization that the autoscaler maintains.
+            Must be a float value in the range (0, 1]. If not specified,
+            the default is 0.6. If the CPU level is below the target
+            utilization, the autoscaler scales in the number of
+            instances until it reaches the minimum number of instances
+            you specified or until the average CPU of your instances
+            reaches the target utilization. If the average CPU is above
+            the target utilization, the autoscaler scales out until it
+            reaches the maximum number of instances you specified or
+            until the average utilization reaches the target
+            utilization.
+
+            This field is a member of `oneof`_ ``_utilization_target``.
+    """
+
+    class PredictiveMethod(proto.Enum):
+        r"""Indicates whether predictive autoscaling based on CPU metric is
+        enabled. Valid values are: \* NONE (default). No predictive method
+        is used. The autoscaler scales the group to meet current demand
+        based on real-time metrics. \* OPTIMIZE_AVAILABILITY. Predictive
+        autoscaling improves availability by monitoring daily and weekly
+        load patterns and scaling out ahead of anticipated demand.
+
+        Values:
+            UNDEFINED_PREDICTIVE_METHOD (0):
+                A value indicating that the enum field is not
+                set.
+            NONE (2402104):
+                No predictive method is used. The autoscaler
+                scales the group to meet current demand based on
+                real-time metrics
+            OPTIMIZE_AVAILABILITY (11629437):
+                Predictive autoscaling improves availability
+                by monitoring daily and weekly load patterns and
+                scaling out ahead of anticipated demand.
+        """
+        UNDEFINED_PREDICTIVE_METHOD = 0
+        NONE = 2402104
+        OPTIMIZE_AVAILABILITY = 11629437
+
+    predictive_method: str = proto.Field(
+        proto.STRING,
+        number=390220737,
+        optional=True,
+    )
+    utilization_target: float = proto.Field(
+        proto.DOUBLE,
+        number=215905870,
+        optional=True,
+    )
+
+
+class AutoscalingPolicyCustomMetricUtilization(proto.Message):
+    r"""Custom utilization metric policy.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter string, compatible with a Stackdriver Monitoring
+            filter string for TimeSeries.list API call. This filter is
+            used to select a specific TimeSeries for the purpose of
+            autoscaling and to determine whether the metric is exporting
+            per-instance or per-group data. For the filter to be valid
+            for autoscaling purposes, the following rules apply: - You
+            can only use the AND operator for joining selectors. - You
+            can only use direct equality comparison operator (=) without
+            any functions for each selector. - You can specify the
+            metric in both the filter string and in the metric field.
+            However, if specified in both places, the metric must be
+            identical. - The monitored resource type determines what
+            kind of values are expected for the metric. If it is a
+            gce_instance, the autoscaler expects the metric to include a
+            separate TimeSeries for each instance in a group. In such a
+            case, you cannot filter on resource labels. If the resource
+            type is any other value, the autoscaler expects this metric
+            to contain values that apply to the entire autoscaled
+            instance group and resource label filtering can be performed
+            to point autoscaler at the correct TimeSeries to scale upon.
+            This is called a *per-group metric* for the purpose of
+            autoscaling. If not specified, the type defaults to
+            gce_instance. Try to provide a filter that is selective
+            enough to pick just one TimeSeries for the autoscaled group
+            or for each of the instances (if you are using gce_instance
+            resource type). If multiple TimeSeries are returned upon the
+            query execution, the autoscaler will sum their respective
+            values to obtain its scaling value.
+
+            This field is a member of `oneof`_ ``_filter``.
+        metric (str):
+            The identifier (type) of the Stackdriver
+            Monitoring metric. The metric cannot have
+            negative values. The metric must have a value
+            type of INT64 or DOUBLE.
+
+            This field is a member of `oneof`_ ``_metric``.
+        single_instance_assignment (float):
+            If scaling is based on a per-group metric value that
+            represents the total amount of work to be done or resource
+            usage, set this value to an amount assigned for a single
+            instance of the scaled group. Autoscaler keeps the number of
+            instances proportional to the value of this metric. The
+            metric itself does not change value due to group resizing. A
+            good metric to use with the target is for example
+            pubsub.googleapis.com/subscription/num_undelivered_messages
+            or a custom metric exporting the total number of requests
+            coming to your instances. A bad example would be a metric
+            exporting an average or median latency, since this value
+            can't include a chunk assignable to a single instance, it
+            could be better used with utilization_target instead.
+
+            This field is a member of `oneof`_ ``_single_instance_assignment``.
+        utilization_target (float):
+            The target value of the metric that autoscaler maintains.
+            This must be a positive value. A utilization metric scales
+            number of virtual machines handling requests to increase or
+            decrease proportionally to the metric. For example, a good
+            metric to use as a utilization_target is
+            https://www.googleapis.com/compute/v1/instance/network/received_bytes_count.
+            The autoscaler works to keep this value constant for each of
+            the instances.
+
+            This field is a member of `oneof`_ ``_utilization_target``.
+        utilization_target_type (str):
+            Defines how target utilization value is expressed for a
+            Stackdriver Monitoring metric. Either GAUGE,
+            DELTA_PER_SECOND, or DELTA_PER_MINUTE. Check the
+            UtilizationTargetType enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_utilization_target_type``.
+    """
+
+    class UtilizationTargetType(proto.Enum):
+        r"""Defines how target utilization value is expressed for a Stackdriver
+        Monitoring metric. Either GAUGE, DELTA_PER_SECOND, or
+        DELTA_PER_MINUTE.
+
+        Values:
+            UNDEFINED_UTILIZATION_TARGET_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            DELTA_PER_MINUTE (87432861):
+                Sets the utilization target value for a
+                cumulative or delta metric, expressed as the
+                rate of growth per minute.
+            DELTA_PER_SECOND (255180029):
+                Sets the utilization target value for a
+                cumulative or delta metric, expressed as the
+                rate of growth per second.
+            GAUGE (67590361):
+                Sets the utilization target value for a gauge
+                metric. The autoscaler will collect the average
+                utilization of the virtual machines from the
+                last couple of minutes, and compare the value to
+                the utilization target value to perform
+                autoscaling.
+        """
+        UNDEFINED_UTILIZATION_TARGET_TYPE = 0
+        DELTA_PER_MINUTE = 87432861
+        DELTA_PER_SECOND = 255180029
+        GAUGE = 67590361
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    metric: str = proto.Field(
+        proto.STRING,
+        number=533067184,
+        optional=True,
+    )
+    single_instance_assignment: float = proto.Field(
+        proto.DOUBLE,
+        number=504768064,
+        optional=True,
+    )
+    utilization_target: float = proto.Field(
+        proto.DOUBLE,
+        number=215905870,
+        optional=True,
+    )
+    utilization_target_type: str = proto.Field(
+        proto.STRING,
+        number=340169355,
+        optional=True,
+    )
+
+
+class AutoscalingPolicyLoadBalancingUtilization(proto.Message):
+    r"""Configuration parameters of autoscaling based on load
+    balancing.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        utilization_target (float):
+            Fraction of backend capacity utilization (set
+            in HTTP(S) load balancing configuration) that
+            the autoscaler maintains. Must be a positive
+            float value. If not defined, the default is 0.8.
+
+            This field is a member of `oneof`_ ``_utilization_target``.
+    """
+
+    utilization_target: float = proto.Field(
+        proto.DOUBLE,
+        number=215905870,
+        optional=True,
+    )
+
+
+class AutoscalingPolicyScaleInControl(proto.Message):
+    r"""Configuration that allows for slower scale in so that even if
+    Autoscaler recommends an abrupt scale in of a MIG, it will be
+    throttled as specified by the parameters below.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        max_scaled_in_replicas (google.cloud.compute_v1.types.FixedOrPercent):
+            Maximum allowed number (or %) of VMs that can
+            be deducted from the peak recommendation during
+            the window autoscaler looks at when computing
+            recommendations. Possibly all these VMs can be
+            deleted at once so user service needs to be
+            prepared to lose that many VMs in one step.
+
+            This field is a member of `oneof`_ ``_max_scaled_in_replicas``.
+        time_window_sec (int):
+            How far back autoscaling looks when computing
+            recommendations to include directives regarding
+            slower scale in, as described above.
+
+            This field is a member of `oneof`_ ``_time_window_sec``.
+    """
+
+    max_scaled_in_replicas: shared_fixed_or_percent.FixedOrPercent = proto.Field(
+        proto.MESSAGE,
+        number=180710123,
+        optional=True,
+        message=shared_fixed_or_percent.FixedOrPercent,
+    )
+    time_window_sec: int = proto.Field(
+        proto.INT32,
+        number=36405300,
+        optional=True,
+    )
+
+
+class AutoscalingPolicyScalingSchedule(proto.Message):
+    r"""Scaling based on user-defined schedule. The message describes
+    a single scaling schedule. A scaling schedule changes the
+    minimum number of VM instances an autoscaler can recommend,
+    which can trigger scaling out.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        description (str):
+            A description of a scaling schedule.
+
+            This field is a member of `oneof`_ ``_description``.
+        disabled (bool):
+            A boolean value that specifies whether a
+            scaling schedule can influence autoscaler
+            recommendations. If set to true, then a scaling
+            schedule has no effect. This field is optional,
+            and its value is false by default.
+
+            This field is a member of `oneof`_ ``_disabled``.
+        duration_sec (int):
+            The duration of time intervals, in seconds,
+            for which this scaling schedule is to run. The
+            minimum allowed value is 300. This field is
+            required.
+
+            This field is a member of `oneof`_ ``_duration_sec``.
+        min_required_replicas (int):
+            The minimum number of VM instances that the
+            autoscaler will recommend in time intervals
+            starting according to schedule. This field is
+            required.
+
+            This field is a member of `oneof`_ ``_min_required_replicas``.
+        schedule (str):
+            The start timestamps of time intervals when this scaling
+            schedule is to provide a scaling signal. This field uses the
+            extended cron format (with an optional year field). The
+            expression can describe a single timestamp if the optional
+            year is set, in which case the scaling schedule runs once.
+            The schedule is interpreted with respect to time_zone. This
+            field is required. Note: These timestamps only describe when
+            autoscaler starts providing the scaling signal. The VMs need
+            additional time to become serving.
+
+            This field is a member of `oneof`_ ``_schedule``.
+        time_zone (str):
+            The time zone to use when interpreting the schedule. The
+            value of this field must be a time zone name from the tz
+            database: https://en.wikipedia.org/wiki/Tz_database. This
+            field is assigned a default value of "UTC" if left empty.
+
+            This field is a member of `oneof`_ ``_time_zone``.
+    """
+
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    disabled: bool = proto.Field(
+        proto.BOOL,
+        number=270940796,
+        optional=True,
+    )
+    duration_sec: int = proto.Field(
+        proto.INT32,
+        number=212356902,
+        optional=True,
+    )
+    min_required_replicas: int = proto.Field(
+        proto.INT32,
+        number=365514414,
+        optional=True,
+    )
+    schedule: str = proto.Field(
+        proto.STRING,
+        number=375820951,
+        optional=True,
+    )
+    time_zone: str = proto.Field(
+        proto.STRING,
+        number=36848094,
+        optional=True,
+    )
+
+
+class ScalingScheduleStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        last_start_time (str):
+            [Output Only] The last time the scaling schedule became
+            active. Note: this is a timestamp when a schedule actually
+            became active, not when it was planned to do so. The
+            timestamp is in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_last_start_time``.
+        next_start_time (str):
+            [Output Only] The next time the scaling schedule is to
+            become active. Note: this is a timestamp when a schedule is
+            planned to run, but the actual time might be slightly
+            different. The timestamp is in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_next_start_time``.
+        state (str):
+            [Output Only] The current state of a scaling schedule. Check
+            the State enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+    """
+
+    class State(proto.Enum):
+        r"""[Output Only] The current state of a scaling schedule.
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                The current autoscaling recommendation is
+                influenced by this scaling schedule.
+            DISABLED (516696700):
+                This scaling schedule has been disabled by
+                the user.
+            OBSOLETE (66532761):
+                This scaling schedule will never become
+                active again.
+            READY (77848963):
+                The current autoscaling recommendation is not
+                influenced by this scaling schedule.
+        """
+        UNDEFINED_STATE = 0
+        ACTIVE = 314733318
+        DISABLED = 516696700
+        OBSOLETE = 66532761
+        READY = 77848963
+
+    last_start_time: str = proto.Field(
+        proto.STRING,
+        number=34545107,
+        optional=True,
+    )
+    next_start_time: str = proto.Field(
+        proto.STRING,
+        number=97270102,
+        optional=True,
+    )
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,2836 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_duration
+from google.cloud.compute_v1.types._compute import shared_health_status
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AWSV4Signature",
+        "Backend",
+        "BackendService",
+        "BackendServiceCdnPolicy",
+        "BackendServiceCdnPolicyBypassCacheOnRequestHeader",
+        "BackendServiceCdnPolicyNegativeCachingPolicy",
+        "BackendServiceConnectionTrackingPolicy",
+        "BackendServiceFailoverPolicy",
+        "BackendServiceGroupHealth",
+        "BackendServiceIAP",
+        "BackendServiceList",
+        "BackendServiceListUsable",
+        "BackendServiceLocalityLoadBalancingPolicyConfig",
+        "BackendServiceLocalityLoadBalancingPolicyConfigCustomPolicy",
+        "BackendServiceLocalityLoadBalancingPolicyConfigPolicy",
+        "BackendServiceLogConfig",
+        "BackendServiceUsedBy",
+        "CacheKeyPolicy",
+        "CircuitBreakers",
+        "ConnectionDraining",
+        "ConsistentHashLoadBalancerSettings",
+        "ConsistentHashLoadBalancerSettingsHttpCookie",
+        "OutlierDetection",
+        "ResourceGroupReference",
+        "SecuritySettings",
+        "Subsetting",
+    },
+)
+
+
+class AWSV4Signature(proto.Message):
+    r"""Messages
+
+    Contains the configurations necessary to generate a signature
+    for access to private storage buckets that support Signature
+    Version 4 for authentication. The service name for generating
+    the authentication header will always default to 's3'.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        access_key (str):
+            The access key used for s3 bucket
+            authentication. Required for updating or
+            creating a backend that uses AWS v4 signature
+            authentication, but will not be returned as part
+            of the configuration when queried with a REST
+            API GET request. @InputOnly
+
+            This field is a member of `oneof`_ ``_access_key``.
+        access_key_id (str):
+            The identifier of an access key used for s3
+            bucket authentication.
+
+            This field is a member of `oneof`_ ``_access_key_id``.
+        access_key_version (str):
+            The optional version identifier for the
+            access key. You can use this to keep track of
+            different iterations of your access key.
+
+            This field is a member of `oneof`_ ``_access_key_version``.
+        origin_region (str):
+            The name of the cloud region of your origin.
+            This is a free-form field with the name of the
+            region your cloud uses to host your origin. For
+            example, "us-east-1" for AWS or "us-ashburn-1"
+            for OCI.
+
+            This field is a member of `oneof`_ ``_origin_region``.
+    """
+
+    access_key: str = proto.Field(
+        proto.STRING,
+        number=468922628,
+        optional=True,
+    )
+    access_key_id: str = proto.Field(
+        proto.STRING,
+        number=292975158,
+        optional=True,
+    )
+    access_key_version: str = proto.Field(
+        proto.STRING,
+        number=80261277,
+        optional=True,
+    )
+    origin_region: str = proto.Field(
+        proto.STRING,
+        number=265305645,
+        optional=True,
+    )
+
+
+class Backend(proto.Message):
+    r"""Message containing information of one individual backend.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        balancing_mode (str):
+            Specifies how to determine whether the
+            backend of a load balancer can handle additional
+            traffic or is fully loaded. For usage
+            guidelines, see Connection balancing mode.
+            Backends must use compatible balancing modes.
+            For more information, see Supported balancing
+            modes and target capacity settings and
+            Restrictions and guidance for instance groups.
+            Note: Currently, if you use the API to configure
+            incompatible balancing modes, the configuration
+            might be accepted even though it has no impact
+            and is ignored. Specifically,
+            Backend.maxUtilization is ignored when
+            Backend.balancingMode is RATE. In the future,
+            this incompatible combination will be rejected.
+            Check the BalancingMode enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_balancing_mode``.
+        capacity_scaler (float):
+            A multiplier applied to the backend's target capacity of its
+            balancing mode. The default value is 1, which means the
+            group serves up to 100% of its configured capacity
+            (depending on balancingMode). A setting of 0 means the group
+            is completely drained, offering 0% of its available
+            capacity. The valid ranges are 0.0 and [0.1,1.0]. You cannot
+            configure a setting larger than 0 and smaller than 0.1. You
+            cannot configure a setting of 0 when there is only one
+            backend attached to the backend service. Not available with
+            backends that don't support using a balancingMode. This
+            includes backends such as global internet NEGs, regional
+            serverless NEGs, and PSC NEGs.
+
+            This field is a member of `oneof`_ ``_capacity_scaler``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        failover (bool):
+            This field designates whether this is a
+            failover backend. More than one failover backend
+            can be configured for a given BackendService.
+
+            This field is a member of `oneof`_ ``_failover``.
+        group (str):
+            The fully-qualified URL of an instance group or network
+            endpoint group (NEG) resource. To determine what types of
+            backends a load balancer supports, see the `Backend services
+            overview <https://cloud.google.com/load-balancing/docs/backend-service#backends>`__.
+            You must use the *fully-qualified* URL (starting with
+            https://www.googleapis.com/) to specify the instance group
+            or NEG. Partial URLs are not supported.
+
+            This field is a member of `oneof`_ ``_group``.
+        max_connections (int):
+            Defines a target maximum number of
+            simultaneous connections. For usage guidelines,
+            see Connection balancing mode and Utilization
+            balancing mode. Not available if the backend's
+            balancingMode is RATE.
+
+            This field is a member of `oneof`_ ``_max_connections``.
+        max_connections_per_endpoint (int):
+            Defines a target maximum number of
+            simultaneous connections. For usage guidelines,
+            see Connection balancing mode and Utilization
+            balancing mode. Not available if the backend's
+            balancingMode is RATE.
+
+            This field is a member of `oneof`_ ``_max_connections_per_endpoint``.
+        max_connections_per_instance (int):
+            Defines a target maximum number of
+            simultaneous connections. For usage guidelines,
+            see Connection balancing mode and Utilization
+            balancing mode. Not available if the backend's
+            balancingMode is RATE.
+
+            This field is a member of `oneof`_ ``_max_connections_per_instance``.
+        max_rate (int):
+            Defines a maximum number of HTTP requests per
+            second (RPS). For usage guidelines, see Rate
+            balancing mode and Utilization balancing mode.
+            Not available if the backend's balancingMode is
+            CONNECTION.
+
+            This field is a member of `oneof`_ ``_max_rate``.
+        max_rate_per_endpoint (float):
+            Defines a maximum target for requests per
+            second (RPS). For usage guidelines, see Rate
+            balancing mode and Utilization balancing mode.
+            Not available if the backend's balancingMode is
+            CONNECTION.
+
+            This field is a member of `oneof`_ ``_max_rate_per_endpoint``.
+        max_rate_per_instance (float):
+            Defines a maximum target for requests per
+            second (RPS). For usage guidelines, see Rate
+            balancing mode and Utilization balancing mode.
+            Not available if the backend's balancingMode is
+            CONNECTION.
+
+            This field is a member of `oneof`_ ``_max_rate_per_instance``.
+        max_utilization (float):
+            Optional parameter to define a target capacity for the
+            UTILIZATION balancing mode. The valid range is [0.0, 1.0].
+            For usage guidelines, see Utilization balancing mode.
+
+            This field is a member of `oneof`_ ``_max_utilization``.
+    """
+
+    class BalancingMode(proto.Enum):
+        r"""Specifies how to determine whether the backend of a load
+        balancer can handle additional traffic or is fully loaded. For
+        usage guidelines, see Connection balancing mode. Backends must
+        use compatible balancing modes. For more information, see
+        Supported balancing modes and target capacity settings and
+        Restrictions and guidance for instance groups. Note: Currently,
+        if you use the API to configure incompatible balancing modes,
+        the configuration might be accepted even though it has no impact
+        and is ignored. Specifically, Backend.maxUtilization is ignored
+        when Backend.balancingMode is RATE. In the future, this
+        incompatible combination will be rejected.
+
+        Values:
+            UNDEFINED_BALANCING_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            CONNECTION (246311646):
+                Balance based on the number of simultaneous
+                connections.
+            RATE (2508000):
+                Balance based on requests per second (RPS).
+            UTILIZATION (157008386):
+                Balance based on the backend utilization.
+        """
+        UNDEFINED_BALANCING_MODE = 0
+        CONNECTION = 246311646
+        RATE = 2508000
+        UTILIZATION = 157008386
+
+    balancing_mode: str = proto.Field(
+        proto.STRING,
+        number=430286217,
+        optional=True,
+    )
+    capacity_scaler: float = proto.Field(
+        proto.FLOAT,
+        number=315958157,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    failover: bool = proto.Field(
+        proto.BOOL,
+        number=138892530,
+        optional=True,
+    )
+    group: str = proto.Field(
+        proto.STRING,
+        number=98629247,
+        optional=True,
+    )
+    max_connections: int = proto.Field(
+        proto.INT32,
+        number=110652154,
+        optional=True,
+    )
+    max_connections_per_endpoint: int = proto.Field(
+        proto.INT32,
+        number=216904604,
+        optional=True,
+    )
+    max_connections_per_instance: int = proto.Field(
+        proto.INT32,
+        number=104671900,
+        optional=True,
+    )
+    max_rate: int = proto.Field(
+        proto.INT32,
+        number=408035035,
+        optional=True,
+    )
+    max_rate_per_endpoint: float = proto.Field(
+        proto.FLOAT,
+        number=129832283,
+        optional=True,
+    )
+    max_rate_per_instance: float = proto.Field(
+        proto.FLOAT,
+        number=17599579,
+        optional=True,
+    )
+    max_utilization: float = proto.Field(
+        proto.FLOAT,
+        number=148192199,
+        optional=True,
+    )
+
+
+class BackendService(proto.Message):
+    r"""Represents a Backend Service resource. A backend service defines how
+    Google Cloud load balancers distribute traffic. The backend service
+    configuration contains a set of values, such as the protocol used to
+    connect to backends, various distribution and session settings,
+    health checks, and timeouts. These settings provide fine-grained
+    control over how your load balancer behaves. Most of the settings
+    have default values that allow for easy configuration if you need to
+    get started quickly. Backend services in Google Compute Engine can
+    be either regionally or globally scoped. \*
+    `Global <https://cloud.google.com/compute/docs/reference/rest/v1/backendServices>`__
+    \*
+    `Regional <https://cloud.google.com/compute/docs/reference/rest/v1/regionBackendServices>`__
+    For more information, see Backend Services.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        affinity_cookie_ttl_sec (int):
+            Lifetime of cookies in seconds. This setting is applicable
+            to external and internal HTTP(S) load balancers and Traffic
+            Director and requires GENERATED_COOKIE or HTTP_COOKIE
+            session affinity. If set to 0, the cookie is non-persistent
+            and lasts only until the end of the browser session (or
+            equivalent). The maximum allowed value is two weeks
+            (1,209,600). Not supported when the backend service is
+            referenced by a URL map that is bound to target gRPC proxy
+            that has validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_affinity_cookie_ttl_sec``.
+        backends (MutableSequence[google.cloud.compute_v1.types.Backend]):
+            The list of backends that serve this
+            BackendService.
+        cdn_policy (google.cloud.compute_v1.types.BackendServiceCdnPolicy):
+            Cloud CDN configuration for this
+            BackendService. Only available for specified
+            load balancer types.
+
+            This field is a member of `oneof`_ ``_cdn_policy``.
+        circuit_breakers (google.cloud.compute_v1.types.CircuitBreakers):
+
+            This field is a member of `oneof`_ ``_circuit_breakers``.
+        compression_mode (str):
+            Compress text responses using Brotli or gzip
+            compression, based on the client's
+            Accept-Encoding header. Check the
+            CompressionMode enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_compression_mode``.
+        connection_draining (google.cloud.compute_v1.types.ConnectionDraining):
+
+            This field is a member of `oneof`_ ``_connection_draining``.
+        connection_tracking_policy (google.cloud.compute_v1.types.BackendServiceConnectionTrackingPolicy):
+            Connection Tracking configuration for this
+            BackendService. Connection tracking policy
+            settings are only available for Network Load
+            Balancing and Internal TCP/UDP Load Balancing.
+
+            This field is a member of `oneof`_ ``_connection_tracking_policy``.
+        consistent_hash (google.cloud.compute_v1.types.ConsistentHashLoadBalancerSettings):
+            Consistent Hash-based load balancing can be used to provide
+            soft session affinity based on HTTP headers, cookies or
+            other properties. This load balancing policy is applicable
+            only for HTTP connections. The affinity to a particular
+            destination host will be lost when one or more hosts are
+            added/removed from the destination service. This field
+            specifies parameters that control consistent hashing. This
+            field is only applicable when localityLbPolicy is set to
+            MAGLEV or RING_HASH. This field is applicable to either: - A
+            regional backend service with the service_protocol set to
+            HTTP, HTTPS, or HTTP2, and load_balancing_scheme set to
+            INTERNAL_MANAGED. - A global backend service with the
+            load_balancing_scheme set to INTERNAL_SELF_MANAGED.
+
+            This field is a member of `oneof`_ ``_consistent_hash``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        custom_request_headers (MutableSequence[str]):
+            Headers that the load balancer adds to proxied requests. See
+            `Creating custom
+            headers <https://cloud.google.com/load-balancing/docs/custom-headers>`__.
+        custom_response_headers (MutableSequence[str]):
+            Headers that the load balancer adds to proxied responses.
+            See `Creating custom
+            headers <https://cloud.google.com/load-balancing/docs/custom-headers>`__.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        edge_security_policy (str):
+            [Output Only] The resource URL for the edge security policy
+            associated with this backend service.
+
+            This field is a member of `oneof`_ ``_edge_security_policy``.
+        enable_c_d_n (bool):
+            If true, enables Cloud CDN for the backend
+            service of an external HTTP(S) load balancer.
+
+            This field is a member of `oneof`_ ``_enable_c_d_n``.
+        failover_policy (google.cloud.compute_v1.types.BackendServiceFailoverPolicy):
+            Requires at least one backend instance group to be defined
+            as a backup (failover) backend. For load balancers that have
+            configurable failover: `Internal TCP/UDP Load
+            Balancing <https://cloud.google.com/load-balancing/docs/internal/failover-overview>`__
+            and `external TCP/UDP Load
+            Balancing <https://cloud.google.com/load-balancing/docs/network/networklb-failover-overview>`__.
+
+            This field is a member of `oneof`_ ``_failover_policy``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a BackendService. An
+            up-to-date fingerprint must be provided in order
+            to update the BackendService, otherwise the
+            request will fail with error 412
+            conditionNotMet. To see the latest fingerprint,
+            make a get() request to retrieve a
+            BackendService.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        health_checks (MutableSequence[str]):
+            The list of URLs to the healthChecks,
+            httpHealthChecks (legacy), or httpsHealthChecks
+            (legacy) resource for health checking this
+            backend service. Not all backend services
+            support legacy health checks. See Load balancer
+            guide. Currently, at most one health check can
+            be specified for each backend service. Backend
+            services with instance group or zonal NEG
+            backends must have a health check. Backend
+            services with internet or serverless NEG
+            backends must not have a health check.
+        iap (google.cloud.compute_v1.types.BackendServiceIAP):
+            The configurations for Identity-Aware Proxy
+            on this resource. Not available for Internal
+            TCP/UDP Load Balancing and Network Load
+            Balancing.
+
+            This field is a member of `oneof`_ ``_iap``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#backendService for backend services.
+
+            This field is a member of `oneof`_ ``_kind``.
+        load_balancing_scheme (str):
+            Specifies the load balancer type. A backend
+            service created for one type of load balancer
+            cannot be used with another. For more
+            information, refer to Choosing a load balancer.
+            Check the LoadBalancingScheme enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_load_balancing_scheme``.
+        locality_lb_policies (MutableSequence[google.cloud.compute_v1.types.BackendServiceLocalityLoadBalancingPolicyConfig]):
+            A list of locality load-balancing policies to be used in
+            order of preference. When you use localityLbPolicies, you
+            must set at least one value for either the
+            localityLbPolicies[].policy or the
+            localityLbPolicies[].customPolicy field. localityLbPolicies
+            overrides any value set in the localityLbPolicy field. For
+            an example of how to use this field, see Define a list of
+            preferred policies. Caution: This field and its children are
+            intended for use in a service mesh that includes gRPC
+            clients only. Envoy proxies can't use backend services that
+            have this configuration.
+        locality_lb_policy (str):
+            The load balancing algorithm used within the scope of the
+            locality. The possible values are: - ROUND_ROBIN: This is a
+            simple policy in which each healthy backend is selected in
+            round robin order. This is the default. - LEAST_REQUEST: An
+            O(1) algorithm which selects two random healthy hosts and
+            picks the host which has fewer active requests. - RING_HASH:
+            The ring/modulo hash load balancer implements consistent
+            hashing to backends. The algorithm has the property that the
+            addition/removal of a host from a set of N hosts only
+            affects 1/N of the requests. - RANDOM: The load balancer
+            selects a random healthy host. - ORIGINAL_DESTINATION:
+            Backend host is selected based on the client connection
+            metadata, i.e., connections are opened to the same address
+            as the destination address of the incoming connection before
+            the connection was redirected to the load balancer. -
+            MAGLEV: used as a drop in replacement for the ring hash load
+            balancer. Maglev is not as stable as ring hash but has
+            faster table lookup build times and host selection times.
+            For more information about Maglev, see
+            https://ai.google/research/pubs/pub44824 This field is
+            applicable to either: - A regional backend service with the
+            service_protocol set to HTTP, HTTPS, or HTTP2, and
+            load_balancing_scheme set to INTERNAL_MANAGED. - A global
+            backend service with the load_balancing_scheme set to
+            INTERNAL_SELF_MANAGED, INTERNAL_MANAGED, or
+            EXTERNAL_MANAGED. If sessionAffinity is not NONE, and this
+            field is not set to MAGLEV or RING_HASH, session affinity
+            settings will not take effect. Only ROUND_ROBIN and
+            RING_HASH are supported when the backend service is
+            referenced by a URL map that is bound to target gRPC proxy
+            that has validateForProxyless field set to true. Check the
+            LocalityLbPolicy enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_locality_lb_policy``.
+        log_config (google.cloud.compute_v1.types.BackendServiceLogConfig):
+            This field denotes the logging options for
+            the load balancer traffic served by this backend
+            service. If logging is enabled, logs will be
+            exported to Stackdriver.
+
+            This field is a member of `oneof`_ ``_log_config``.
+        max_stream_duration (google.cloud.compute_v1.types.Duration):
+            Specifies the default maximum duration (timeout) for streams
+            to this service. Duration is computed from the beginning of
+            the stream until the response has been completely processed,
+            including all retries. A stream that does not complete in
+            this duration is closed. If not specified, there will be no
+            timeout limit, i.e. the maximum duration is infinite. This
+            value can be overridden in the PathMatcher configuration of
+            the UrlMap that references this backend service. This field
+            is only allowed when the loadBalancingScheme of the backend
+            service is INTERNAL_SELF_MANAGED.
+
+            This field is a member of `oneof`_ ``_max_stream_duration``.
+        metadatas (MutableMapping[str, str]):
+            Deployment metadata associated with the
+            resource to be set by a GKE hub controller and
+            read by the backend RCTH
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            The URL of the network to which this backend
+            service belongs. This field can only be
+            specified when the load balancing scheme is set
+            to INTERNAL.
+
+            This field is a member of `oneof`_ ``_network``.
+        outlier_detection (google.cloud.compute_v1.types.OutlierDetection):
+            Settings controlling the ejection of unhealthy backend
+            endpoints from the load balancing pool of each individual
+            proxy instance that processes the traffic for the given
+            backend service. If not set, this feature is considered
+            disabled. Results of the outlier detection algorithm
+            (ejection of endpoints from the load balancing pool and
+            returning them back to the pool) are executed independently
+            by each proxy instance of the load balancer. In most cases,
+            more than one proxy instance handles the traffic received by
+            a backend service. Thus, it is possible that an unhealthy
+            endpoint is detected and ejected by only some of the
+            proxies, and while this happens, other proxies may continue
+            to send requests to the same unhealthy endpoint until they
+            detect and eject the unhealthy endpoint. Applicable backend
+            endpoints can be: - VM instances in an Instance Group -
+            Endpoints in a Zonal NEG (GCE_VM_IP, GCE_VM_IP_PORT) -
+            Endpoints in a Hybrid Connectivity NEG
+            (NON_GCP_PRIVATE_IP_PORT) - Serverless NEGs, that resolve to
+            Cloud Run, App Engine, or Cloud Functions Services - Private
+            Service Connect NEGs, that resolve to Google-managed
+            regional API endpoints or managed services published using
+            Private Service Connect Applicable backend service types can
+            be: - A global backend service with the loadBalancingScheme
+            set to INTERNAL_SELF_MANAGED or EXTERNAL_MANAGED. - A
+            regional backend service with the serviceProtocol set to
+            HTTP, HTTPS, or HTTP2, and loadBalancingScheme set to
+            INTERNAL_MANAGED or EXTERNAL_MANAGED. Not supported for
+            Serverless NEGs. Not supported when the backend service is
+            referenced by a URL map that is bound to target gRPC proxy
+            that has validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_outlier_detection``.
+        port (int):
+            Deprecated in favor of portName. The TCP port
+            to connect on the backend. The default value is
+            80. For Internal TCP/UDP Load Balancing and
+            Network Load Balancing, omit port.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            A named port on a backend instance group representing the
+            port for communication to the backend VMs in that group. The
+            named port must be `defined on each backend instance
+            group <https://cloud.google.com/load-balancing/docs/backend-service#named_ports>`__.
+            This parameter has no meaning if the backends are NEGs. For
+            Internal TCP/UDP Load Balancing and Network Load Balancing,
+            omit port_name.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        protocol (str):
+            The protocol this BackendService uses to
+            communicate with backends. Possible values are
+            HTTP, HTTPS, HTTP2, TCP, SSL, UDP or GRPC.
+            depending on the chosen load balancer or Traffic
+            Director configuration. Refer to the
+            documentation for the load balancers or for
+            Traffic Director for more information. Must be
+            set to GRPC when the backend service is
+            referenced by a URL map that is bound to target
+            gRPC proxy. Check the Protocol enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_protocol``.
+        region (str):
+            [Output Only] URL of the region where the regional backend
+            service resides. This field is not applicable to global
+            backend services. You must specify this field as part of the
+            HTTP request URL. It is not settable as a field in the
+            request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        security_policy (str):
+            [Output Only] The resource URL for the security policy
+            associated with this backend service.
+
+            This field is a member of `oneof`_ ``_security_policy``.
+        security_settings (google.cloud.compute_v1.types.SecuritySettings):
+            This field specifies the security settings that apply to
+            this backend service. This field is applicable to a global
+            backend service with the load_balancing_scheme set to
+            INTERNAL_SELF_MANAGED.
+
+            This field is a member of `oneof`_ ``_security_settings``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        service_bindings (MutableSequence[str]):
+            URLs of networkservices.ServiceBinding resources. Can only
+            be set if load balancing scheme is INTERNAL_SELF_MANAGED. If
+            set, lists of backends and health checks must be both empty.
+        session_affinity (str):
+            Type of session affinity to use. The default is NONE. Only
+            NONE and HEADER_FIELD are supported when the backend service
+            is referenced by a URL map that is bound to target gRPC
+            proxy that has validateForProxyless field set to true. For
+            more details, see: `Session
+            Affinity <https://cloud.google.com/load-balancing/docs/backend-service#session_affinity>`__.
+            Check the SessionAffinity enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_session_affinity``.
+        subsetting (google.cloud.compute_v1.types.Subsetting):
+
+            This field is a member of `oneof`_ ``_subsetting``.
+        timeout_sec (int):
+            The backend service timeout has a different
+            meaning depending on the type of load balancer.
+            For more information see, Backend service
+            settings. The default is 30 seconds. The full
+            range of timeout values allowed goes from 1
+            through 2,147,483,647 seconds. This value can be
+            overridden in the PathMatcher configuration of
+            the UrlMap that references this backend service.
+            Not supported when the backend service is
+            referenced by a URL map that is bound to target
+            gRPC proxy that has validateForProxyless field
+            set to true. Instead, use maxStreamDuration.
+
+            This field is a member of `oneof`_ ``_timeout_sec``.
+        used_by (MutableSequence[google.cloud.compute_v1.types.BackendServiceUsedBy]):
+
+    """
+
+    class CompressionMode(proto.Enum):
+        r"""Compress text responses using Brotli or gzip compression,
+        based on the client's Accept-Encoding header.
+
+        Values:
+            UNDEFINED_COMPRESSION_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            AUTOMATIC (165298699):
+                Automatically uses the best compression based
+                on the Accept-Encoding header sent by the
+                client.
+            DISABLED (516696700):
+                Disables compression. Existing compressed
+                responses cached by Cloud CDN will not be served
+                to clients.
+        """
+        UNDEFINED_COMPRESSION_MODE = 0
+        AUTOMATIC = 165298699
+        DISABLED = 516696700
+
+    class LoadBalancingScheme(proto.Enum):
+        r"""Specifies the load balancer type. A backend service created
+        for one type of load balancer cannot be used with another. For
+        more information, refer to Choosing a load balancer.
+
+        Values:
+            UNDEFINED_LOAD_BALANCING_SCHEME (0):
+                A value indicating that the enum field is not
+                set.
+            EXTERNAL (35607499):
+                Signifies that this will be used for external
+                HTTP(S), SSL Proxy, TCP Proxy, or Network Load
+                Balancing
+            EXTERNAL_MANAGED (512006923):
+                Signifies that this will be used for External
+                Managed HTTP(S) Load Balancing.
+            INTERNAL (279295677):
+                Signifies that this will be used for Internal
+                TCP/UDP Load Balancing.
+            INTERNAL_MANAGED (37350397):
+                Signifies that this will be used for Internal
+                HTTP(S) Load Balancing.
+            INTERNAL_SELF_MANAGED (236211150):
+                Signifies that this will be used by Traffic
+                Director.
+            INVALID_LOAD_BALANCING_SCHEME (275352060):
+                No description available.
+        """
+        UNDEFINED_LOAD_BALANCING_SCHEME = 0
+        EXTERNAL = 35607499
+        EXTERNAL_MANAGED = 512006923
+        INTERNAL = 279295677
+        INTERNAL_MANAGED = 37350397
+        INTERNAL_SELF_MANAGED = 236211150
+        INVALID_LOAD_BALANCING_SCHEME = 275352060
+
+    class LocalityLbPolicy(proto.Enum):
+        r"""The load balancing algorithm used within the scope of the locality.
+        The possible values are: - ROUND_ROBIN: This is a simple policy in
+        which each healthy backend is selected in round robin order. This is
+        the default. - LEAST_REQUEST: An O(1) algorithm which selects two
+        random healthy hosts and picks the host which has fewer active
+        requests. - RING_HASH: The ring/modulo hash load balancer implements
+        consistent hashing to backends. The algorithm has the property that
+        the addition/removal of a host from a set of N hosts only affects
+        1/N of the requests. - RANDOM: The load balancer selects a random
+        healthy host. - ORIGINAL_DESTINATION: Backend host is selected based
+        on the client connection metadata, i.e., connections are opened to
+        the same address as the destination address of the incoming
+        connection before the connection was redirected to the load
+        balancer. - MAGLEV: used as a drop in replacement for the ring hash
+        load balancer. Maglev is not as stable as ring hash but has faster
+        table lookup build times and host selection times. For more
+        information about Maglev, see
+        https://ai.google/research/pubs/pub44824 This field is applicable to
+        either: - A regional backend service with the service_protocol set
+        to HTTP, HTTPS, or HTTP2, and load_balancing_scheme set to
+        INTERNAL_MANAGED. - A global backend service with the
+        load_balancing_scheme set to INTERNAL_SELF_MANAGED,
+        INTERNAL_MANAGED, or EXTERNAL_MANAGED. If sessionAffinity is not
+        NONE, and this field is not set to MAGLEV or RING_HASH, session
+        affinity settings will not take effect. Only ROUND_ROBIN and
+        RING_HASH are supported when the backend service is referenced by a
+        URL map that is bound to target gRPC proxy that has
+        validateForProxyless field set to true.
+
+        Values:
+            UNDEFINED_LOCALITY_LB_POLICY (0):
+                A value indicating that the enum field is not
+                set.
+            INVALID_LB_POLICY (323318707):
+                No description available.
+            LEAST_REQUEST (46604921):
+                An O(1) algorithm which selects two random
+                healthy hosts and picks the host which has fewer
+                active requests.
+            MAGLEV (119180266):
+                This algorithm implements consistent hashing
+                to backends. Maglev can be used as a drop in
+                replacement for the ring hash load balancer.
+                Maglev is not as stable as ring hash but has
+                faster table lookup build times and host
+                selection times. For more information about
+                Maglev, see
+                https://ai.google/research/pubs/pub44824
+            ORIGINAL_DESTINATION (166297216):
+                Backend host is selected based on the client
+                connection metadata, i.e., connections are
+                opened to the same address as the destination
+                address of the incoming connection before the
+                connection was redirected to the load balancer.
+            RANDOM (262527171):
+                The load balancer selects a random healthy
+                host.
+            RING_HASH (432795069):
+                The ring/modulo hash load balancer implements
+                consistent hashing to backends. The algorithm
+                has the property that the addition/removal of a
+                host from a set of N hosts only affects 1/N of
+                the requests.
+            ROUND_ROBIN (153895801):
+                This is a simple policy in which each healthy
+                backend is selected in round robin order. This
+                is the default.
+            WEIGHTED_MAGLEV (254930962):
+                Per-instance weighted Load Balancing via health check
+                reported weights. If set, the Backend Service must configure
+                a non legacy HTTP-based Health Check, and health check
+                replies are expected to contain non-standard HTTP response
+                header field X-Load-Balancing-Endpoint-Weight to specify the
+                per-instance weights. If set, Load Balancing is weighted
+                based on the per-instance weights reported in the last
+                processed health check replies, as long as every instance
+                either reported a valid weight or had UNAVAILABLE_WEIGHT.
+                Otherwise, Load Balancing remains equal-weight. This option
+                is only supported in Network Load Balancing.
+        """
+        UNDEFINED_LOCALITY_LB_POLICY = 0
+        INVALID_LB_POLICY = 323318707
+        LEAST_REQUEST = 46604921
+        MAGLEV = 119180266
+        ORIGINAL_DESTINATION = 166297216
+        RANDOM = 262527171
+        RING_HASH = 432795069
+        ROUND_ROBIN = 153895801
+        WEIGHTED_MAGLEV = 254930962
+
+    class Protocol(proto.Enum):
+        r"""The protocol this BackendService uses to communicate with
+        backends. Possible values are HTTP, HTTPS, HTTP2, TCP, SSL, UDP
+        or GRPC. depending on the chosen load balancer or Traffic
+        Director configuration. Refer to the documentation for the load
+        balancers or for Traffic Director for more information. Must be
+        set to GRPC when the backend service is referenced by a URL map
+        that is bound to target gRPC proxy.
+
+        Values:
+            UNDEFINED_PROTOCOL (0):
+                A value indicating that the enum field is not
+                set.
+            GRPC (2196510):
+                gRPC (available for Traffic Director).
+            HTTP (2228360):
+                No description available.
+            HTTP2 (69079210):
+                HTTP/2 with SSL.
+            HTTPS (69079243):
+                No description available.
+            SSL (82412):
+                TCP proxying with SSL.
+            TCP (82881):
+                TCP proxying or TCP pass-through.
+            UDP (83873):
+                UDP.
+            UNSPECIFIED (526786327):
+                If a Backend Service has UNSPECIFIED as its
+                protocol, it can be used with any L3/L4
+                Forwarding Rules.
+        """
+        UNDEFINED_PROTOCOL = 0
+        GRPC = 2196510
+        HTTP = 2228360
+        HTTP2 = 69079210
+        HTTPS = 69079243
+        SSL = 82412
+        TCP = 82881
+        UDP = 83873
+        UNSPECIFIED = 526786327
+
+    class SessionAffinity(proto.Enum):
+        r"""Type of session affinity to use. The default is NONE. Only NONE and
+        HEADER_FIELD are supported when the backend service is referenced by
+        a URL map that is bound to target gRPC proxy that has
+        validateForProxyless field set to true. For more details, see:
+        `Session
+        Affinity <https://cloud.google.com/load-balancing/docs/backend-service#session_affinity>`__.
+
+        Values:
+            UNDEFINED_SESSION_AFFINITY (0):
+                A value indicating that the enum field is not
+                set.
+            CLIENT_IP (345665051):
+                2-tuple hash on packet's source and
+                destination IP addresses. Connections from the
+                same source IP address to the same destination
+                IP address will be served by the same backend VM
+                while that VM remains healthy.
+            CLIENT_IP_NO_DESTINATION (106122516):
+                1-tuple hash only on packet's source IP
+                address. Connections from the same source IP
+                address will be served by the same backend VM
+                while that VM remains healthy. This option can
+                only be used for Internal TCP/UDP Load
+                Balancing.
+            CLIENT_IP_PORT_PROTO (221722926):
+                5-tuple hash on packet's source and
+                destination IP addresses, IP protocol, and
+                source and destination ports. Connections for
+                the same IP protocol from the same source IP
+                address and port to the same destination IP
+                address and port will be served by the same
+                backend VM while that VM remains healthy. This
+                option cannot be used for HTTP(S) load
+                balancing.
+            CLIENT_IP_PROTO (25322148):
+                3-tuple hash on packet's source and
+                destination IP addresses, and IP protocol.
+                Connections for the same IP protocol from the
+                same source IP address to the same destination
+                IP address will be served by the same backend VM
+                while that VM remains healthy. This option
+                cannot be used for HTTP(S) load balancing.
+            GENERATED_COOKIE (370321204):
+                Hash based on a cookie generated by the L7
+                loadbalancer. Only valid for HTTP(S) load
+                balancing.
+            HEADER_FIELD (200737960):
+                The hash is based on a user specified header
+                field.
+            HTTP_COOKIE (494981627):
+                The hash is based on a user provided cookie.
+            NONE (2402104):
+                No session affinity. Connections from the
+                same client IP may go to any instance in the
+                pool.
+        """
+        UNDEFINED_SESSION_AFFINITY = 0
+        CLIENT_IP = 345665051
+        CLIENT_IP_NO_DESTINATION = 106122516
+        CLIENT_IP_PORT_PROTO = 221722926
+        CLIENT_IP_PROTO = 25322148
+        GENERATED_COOKIE = 370321204
+        HEADER_FIELD = 200737960
+        HTTP_COOKIE = 494981627
+        NONE = 2402104
+
+    affinity_cookie_ttl_sec: int = proto.Field(
+        proto.INT32,
+        number=369996954,
+        optional=True,
+    )
+    backends: MutableSequence["Backend"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=510839903,
+        message="Backend",
+    )
+    cdn_policy: "BackendServiceCdnPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=213976452,
+        optional=True,
+        message="BackendServiceCdnPolicy",
+    )
+    circuit_breakers: "CircuitBreakers" = proto.Field(
+        proto.MESSAGE,
+        number=421340061,
+        optional=True,
+        message="CircuitBreakers",
+    )
+    compression_mode: str = proto.Field(
+        proto.STRING,
+        number=95520988,
+        optional=True,
+    )
+    connection_draining: "ConnectionDraining" = proto.Field(
+        proto.MESSAGE,
+        number=461096747,
+        optional=True,
+        message="ConnectionDraining",
+    )
+    connection_tracking_policy: "BackendServiceConnectionTrackingPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=143994969,
+        optional=True,
+        message="BackendServiceConnectionTrackingPolicy",
+    )
+    consistent_hash: "ConsistentHashLoadBalancerSettings" = proto.Field(
+        proto.MESSAGE,
+        number=905883,
+        optional=True,
+        message="ConsistentHashLoadBalancerSettings",
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    custom_request_headers: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=27977992,
+    )
+    custom_response_headers: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=387539094,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    edge_security_policy: str = proto.Field(
+        proto.STRING,
+        number=41036943,
+        optional=True,
+    )
+    enable_c_d_n: bool = proto.Field(
+        proto.BOOL,
+        number=250733499,
+        optional=True,
+    )
+    failover_policy: "BackendServiceFailoverPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=105658655,
+        optional=True,
+        message="BackendServiceFailoverPolicy",
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    health_checks: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=448370606,
+    )
+    iap: "BackendServiceIAP" = proto.Field(
+        proto.MESSAGE,
+        number=104024,
+        optional=True,
+        message="BackendServiceIAP",
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    load_balancing_scheme: str = proto.Field(
+        proto.STRING,
+        number=363890244,
+        optional=True,
+    )
+    locality_lb_policies: MutableSequence[
+        "BackendServiceLocalityLoadBalancingPolicyConfig"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=140982557,
+        message="BackendServiceLocalityLoadBalancingPolicyConfig",
+    )
+    locality_lb_policy: str = proto.Field(
+        proto.STRING,
+        number=131431487,
+        optional=True,
+    )
+    log_config: "BackendServiceLogConfig" = proto.Field(
+        proto.MESSAGE,
+        number=351299741,
+        optional=True,
+        message="BackendServiceLogConfig",
+    )
+    max_stream_duration: shared_duration.Duration = proto.Field(
+        proto.MESSAGE,
+        number=61428376,
+        optional=True,
+        message=shared_duration.Duration,
+    )
+    metadatas: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=8514340,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    outlier_detection: "OutlierDetection" = proto.Field(
+        proto.MESSAGE,
+        number=354625086,
+        optional=True,
+        message="OutlierDetection",
+    )
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+    port_name: str = proto.Field(
+        proto.STRING,
+        number=41534345,
+        optional=True,
+    )
+    protocol: str = proto.Field(
+        proto.STRING,
+        number=84577944,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    security_policy: str = proto.Field(
+        proto.STRING,
+        number=171082513,
+        optional=True,
+    )
+    security_settings: "SecuritySettings" = proto.Field(
+        proto.MESSAGE,
+        number=478649922,
+        optional=True,
+        message="SecuritySettings",
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    service_bindings: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=133581016,
+    )
+    session_affinity: str = proto.Field(
+        proto.STRING,
+        number=463888561,
+        optional=True,
+    )
+    subsetting: "Subsetting" = proto.Field(
+        proto.MESSAGE,
+        number=450283536,
+        optional=True,
+        message="Subsetting",
+    )
+    timeout_sec: int = proto.Field(
+        proto.INT32,
+        number=79994995,
+        optional=True,
+    )
+    used_by: MutableSequence["BackendServiceUsedBy"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=389320729,
+        message="BackendServiceUsedBy",
+    )
+
+
+class BackendServiceCdnPolicy(proto.Message):
+    r"""Message containing Cloud CDN configuration for a backend
+    service.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        bypass_cache_on_request_headers (MutableSequence[google.cloud.compute_v1.types.BackendServiceCdnPolicyBypassCacheOnRequestHeader]):
+            Bypass the cache when the specified request
+            headers are matched - e.g. Pragma or
+            Authorization headers. Up to 5 headers can be
+            specified. The cache is bypassed for all
+            cdnPolicy.cacheMode settings.
+        cache_key_policy (google.cloud.compute_v1.types.CacheKeyPolicy):
+            The CacheKeyPolicy for this CdnPolicy.
+
+            This field is a member of `oneof`_ ``_cache_key_policy``.
+        cache_mode (str):
+            Specifies the cache setting for all responses from this
+            backend. The possible values are: USE_ORIGIN_HEADERS
+            Requires the origin to set valid caching headers to cache
+            content. Responses without these headers will not be cached
+            at Google's edge, and will require a full trip to the origin
+            on every request, potentially impacting performance and
+            increasing load on the origin server. FORCE_CACHE_ALL Cache
+            all content, ignoring any "private", "no-store" or
+            "no-cache" directives in Cache-Control response headers.
+            Warning: this may result in Cloud CDN caching private,
+            per-user (user identifiable) content. CACHE_ALL_STATIC
+            Automatically cache static content, including common image
+            formats, media (video and audio), and web assets (JavaScript
+            and CSS). Requests and responses that are marked as
+            uncacheable, as well as dynamic content (including HTML),
+            will not be cached. Check the CacheMode enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_cache_mode``.
+        client_ttl (int):
+            Specifies a separate client (e.g. browser client) maximum
+            TTL. This is used to clamp the max-age (or Expires) value
+            sent to the client. With FORCE_CACHE_ALL, the lesser of
+            client_ttl and default_ttl is used for the response max-age
+            directive, along with a "public" directive. For cacheable
+            content in CACHE_ALL_STATIC mode, client_ttl clamps the
+            max-age from the origin (if specified), or else sets the
+            response max-age directive to the lesser of the client_ttl
+            and default_ttl, and also ensures a "public" cache-control
+            directive is present. If a client TTL is not specified, a
+            default value (1 hour) will be used. The maximum allowed
+            value is 31,622,400s (1 year).
+
+            This field is a member of `oneof`_ ``_client_ttl``.
+        default_ttl (int):
+            Specifies the default TTL for cached content served by this
+            origin for responses that do not have an existing valid TTL
+            (max-age or s-max-age). Setting a TTL of "0" means "always
+            revalidate". The value of defaultTTL cannot be set to a
+            value greater than that of maxTTL, but can be equal. When
+            the cacheMode is set to FORCE_CACHE_ALL, the defaultTTL will
+            overwrite the TTL set in all responses. The maximum allowed
+            value is 31,622,400s (1 year), noting that infrequently
+            accessed objects may be evicted from the cache before the
+            defined TTL.
+
+            This field is a member of `oneof`_ ``_default_ttl``.
+        max_ttl (int):
+            Specifies the maximum allowed TTL for cached
+            content served by this origin. Cache directives
+            that attempt to set a max-age or s-maxage higher
+            than this, or an Expires header more than maxTTL
+            seconds in the future will be capped at the
+            value of maxTTL, as if it were the value of an
+            s-maxage Cache-Control directive. Headers sent
+            to the client will not be modified. Setting a
+            TTL of "0" means "always revalidate". The
+            maximum allowed value is 31,622,400s (1 year),
+            noting that infrequently accessed objects may be
+            evicted from the cache before the defined TTL.
+
+            This field is a member of `oneof`_ ``_max_ttl``.
+        negative_caching (bool):
+            Negative caching allows per-status code TTLs to be set, in
+            order to apply fine-grained caching for common errors or
+            redirects. This can reduce the load on your origin and
+            improve end-user experience by reducing response latency.
+            When the cache mode is set to CACHE_ALL_STATIC or
+            USE_ORIGIN_HEADERS, negative caching applies to responses
+            with the specified response code that lack any
+            Cache-Control, Expires, or Pragma: no-cache directives. When
+            the cache mode is set to FORCE_CACHE_ALL, negative caching
+            applies to all responses with the specified response code,
+            and override any caching headers. By default, Cloud CDN will
+            apply the following default TTLs to these status codes: HTTP
+            300 (Multiple Choice), 301, 308 (Permanent Redirects): 10m
+            HTTP 404 (Not Found), 410 (Gone), 451 (Unavailable For Legal
+            Reasons): 120s HTTP 405 (Method Not Found), 421 (Misdirected
+            Request), 501 (Not Implemented): 60s. These defaults can be
+            overridden in negative_caching_policy.
+
+            This field is a member of `oneof`_ ``_negative_caching``.
+        negative_caching_policy (MutableSequence[google.cloud.compute_v1.types.BackendServiceCdnPolicyNegativeCachingPolicy]):
+            Sets a cache TTL for the specified HTTP status code.
+            negative_caching must be enabled to configure
+            negative_caching_policy. Omitting the policy and leaving
+            negative_caching enabled will use Cloud CDN's default cache
+            TTLs. Note that when specifying an explicit
+            negative_caching_policy, you should take care to specify a
+            cache TTL for all response codes that you wish to cache.
+            Cloud CDN will not apply any default negative caching when a
+            policy exists.
+        request_coalescing (bool):
+            If true then Cloud CDN will combine multiple
+            concurrent cache fill requests into a small
+            number of requests to the origin.
+
+            This field is a member of `oneof`_ ``_request_coalescing``.
+        serve_while_stale (int):
+            Serve existing content from the cache (if
+            available) when revalidating content with the
+            origin, or when an error is encountered when
+            refreshing the cache. This setting defines the
+            default "max-stale" duration for any cached
+            responses that do not specify a max-stale
+            directive. Stale responses that exceed the TTL
+            configured here will not be served. The default
+            limit (max-stale) is 86400s (1 day), which will
+            allow stale content to be served up to this
+            limit beyond the max-age (or s-max-age) of a
+            cached response. The maximum allowed value is
+            604800 (1 week). Set this to zero (0) to disable
+            serve-while-stale.
+
+            This field is a member of `oneof`_ ``_serve_while_stale``.
+        signed_url_cache_max_age_sec (int):
+            Maximum number of seconds the response to a signed URL
+            request will be considered fresh. After this time period,
+            the response will be revalidated before being served.
+            Defaults to 1hr (3600s). When serving responses to signed
+            URL requests, Cloud CDN will internally behave as though all
+            responses from this backend had a "Cache-Control: public,
+            max-age=[TTL]" header, regardless of any existing
+            Cache-Control header. The actual headers served in responses
+            will not be altered.
+
+            This field is a member of `oneof`_ ``_signed_url_cache_max_age_sec``.
+        signed_url_key_names (MutableSequence[str]):
+            [Output Only] Names of the keys for signing request URLs.
+    """
+
+    class CacheMode(proto.Enum):
+        r"""Specifies the cache setting for all responses from this backend. The
+        possible values are: USE_ORIGIN_HEADERS Requires the origin to set
+        valid caching headers to cache content. Responses without these
+        headers will not be cached at Google's edge, and will require a full
+        trip to the origin on every request, potentially impacting
+        performance and increasing load on the origin server.
+        FORCE_CACHE_ALL Cache all content, ignoring any "private",
+        "no-store" or "no-cache" directives in Cache-Control response
+        headers. Warning: this may result in Cloud CDN caching private,
+        per-user (user identifiable) content. CACHE_ALL_STATIC Automatically
+        cache static content, including common image formats, media (video
+        and audio), and web assets (JavaScript and CSS). Requests and
+        responses that are marked as uncacheable, as well as dynamic content
+        (including HTML), will not be cached.
+
+        Values:
+            UNDEFINED_CACHE_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            CACHE_ALL_STATIC (355027945):
+                Automatically cache static content, including
+                common image formats, media (video and audio),
+                and web assets (JavaScript and CSS). Requests
+                and responses that are marked as uncacheable, as
+                well as dynamic content (including HTML), will
+                not be cached.
+            FORCE_CACHE_ALL (486026928):
+                Cache all content, ignoring any "private",
+                "no-store" or "no-cache" directives in
+                Cache-Control response headers. Warning: this
+                may result in Cloud CDN caching private,
+                per-user (user identifiable) content.
+            INVALID_CACHE_MODE (381295560):
+                No description available.
+            USE_ORIGIN_HEADERS (55380261):
+                Requires the origin to set valid caching
+                headers to cache content. Responses without
+                these headers will not be cached at Google's
+                edge, and will require a full trip to the origin
+                on every request, potentially impacting
+                performance and increasing load on the origin
+                server.
+        """
+        UNDEFINED_CACHE_MODE = 0
+        CACHE_ALL_STATIC = 355027945
+        FORCE_CACHE_ALL = 486026928
+        INVALID_CACHE_MODE = 381295560
+        USE_ORIGIN_HEADERS = 55380261
+
+    bypass_cache_on_request_headers: MutableSequence[
+        "BackendServiceCdnPolicyBypassCacheOnRequestHeader"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=486203082,
+        message="BackendServiceCdnPolicyBypassCacheOnRequestHeader",
+    )
+    cache_key_policy: "CacheKeyPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=159263727,
+        optional=True,
+        message="CacheKeyPolicy",
+    )
+    cache_mode: str = proto.Field(
+        proto.STRING,
+        number=28877888,
+        optional=True,
+    )
+    client_ttl: int = proto.Field(
+        proto.INT32,
+        number=29034360,
+        optional=True,
+    )
+    default_ttl: int = proto.Field(
+        proto.INT32,
+        number=100253422,
+        optional=True,
+    )
+    max_ttl: int = proto.Field(
+        proto.INT32,
+        number=307578001,
+        optional=True,
+    )
+    negative_caching: bool = proto.Field(
+        proto.BOOL,
+        number=336110005,
+        optional=True,
+    )
+    negative_caching_policy: MutableSequence[
+        "BackendServiceCdnPolicyNegativeCachingPolicy"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=155359996,
+        message="BackendServiceCdnPolicyNegativeCachingPolicy",
+    )
+    request_coalescing: bool = proto.Field(
+        proto.BOOL,
+        number=532808276,
+        optional=True,
+    )
+    serve_while_stale: int = proto.Field(
+        proto.INT32,
+        number=236682203,
+        optional=True,
+    )
+    signed_url_cache_max_age_sec: int = proto.Field(
+        proto.INT64,
+        number=269374534,
+        optional=True,
+    )
+    signed_url_key_names: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=371848885,
+    )
+
+
+class BackendServiceCdnPolicyBypassCacheOnRequestHeader(proto.Message):
+    r"""Bypass the cache when the specified request headers are present,
+    e.g. Pragma or Authorization headers. Values are case insensitive.
+    The presence of such a header overrides the cache_mode setting.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        header_name (str):
+            The header field name to match on when
+            bypassing cache. Values are case-insensitive.
+
+            This field is a member of `oneof`_ ``_header_name``.
+    """
+
+    header_name: str = proto.Field(
+        proto.STRING,
+        number=110223613,
+        optional=True,
+    )
+
+
+class BackendServiceCdnPolicyNegativeCachingPolicy(proto.Message):
+    r"""Specify CDN TTLs for response error codes.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        code (int):
+            The HTTP status code to define a TTL against.
+            Only HTTP status codes 300, 301, 302, 307, 308,
+            404, 405, 410, 421, 451 and 501 are can be
+            specified as values, and you cannot specify a
+            status code more than once.
+
+            This field is a member of `oneof`_ ``_code``.
+        ttl (int):
+            The TTL (in seconds) for which to cache
+            responses with the corresponding status code.
+            The maximum allowed value is 1800s (30 minutes),
+            noting that infrequently accessed objects may be
+            evicted from the cache before the defined TTL.
+
+            This field is a member of `oneof`_ ``_ttl``.
+    """
+
+    code: int = proto.Field(
+        proto.INT32,
+        number=3059181,
+        optional=True,
+    )
+    ttl: int = proto.Field(
+        proto.INT32,
+        number=115180,
+        optional=True,
+    )
+
+
+class BackendServiceConnectionTrackingPolicy(proto.Message):
+    r"""Connection Tracking configuration for this BackendService.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        connection_persistence_on_unhealthy_backends (str):
+            Specifies connection persistence when backends are
+            unhealthy. The default value is DEFAULT_FOR_PROTOCOL. If set
+            to DEFAULT_FOR_PROTOCOL, the existing connections persist on
+            unhealthy backends only for connection-oriented protocols
+            (TCP and SCTP) and only if the Tracking Mode is
+            PER_CONNECTION (default tracking mode) or the Session
+            Affinity is configured for 5-tuple. They do not persist for
+            UDP. If set to NEVER_PERSIST, after a backend becomes
+            unhealthy, the existing connections on the unhealthy backend
+            are never persisted on the unhealthy backend. They are
+            always diverted to newly selected healthy backends (unless
+            all backends are unhealthy). If set to ALWAYS_PERSIST,
+            existing connections always persist on unhealthy backends
+            regardless of protocol and session affinity. It is generally
+            not recommended to use this mode overriding the default. For
+            more details, see `Connection Persistence for Network Load
+            Balancing <https://cloud.google.com/load-balancing/docs/network/networklb-backend-service#connection-persistence>`__
+            and `Connection Persistence for Internal TCP/UDP Load
+            Balancing <https://cloud.google.com/load-balancing/docs/internal#connection-persistence>`__.
+            Check the ConnectionPersistenceOnUnhealthyBackends enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_connection_persistence_on_unhealthy_backends``.
+        enable_strong_affinity (bool):
+            Enable Strong Session Affinity for Network
+            Load Balancing. This option is not available
+            publicly.
+
+            This field is a member of `oneof`_ ``_enable_strong_affinity``.
+        idle_timeout_sec (int):
+            Specifies how long to keep a Connection Tracking entry while
+            there is no matching traffic (in seconds). For Internal
+            TCP/UDP Load Balancing: - The minimum (default) is 10
+            minutes and the maximum is 16 hours. - It can be set only if
+            Connection Tracking is less than 5-tuple (i.e. Session
+            Affinity is CLIENT_IP_NO_DESTINATION, CLIENT_IP or
+            CLIENT_IP_PROTO, and Tracking Mode is PER_SESSION). For
+            Network Load Balancer the default is 60 seconds. This option
+            is not available publicly.
+
+            This field is a member of `oneof`_ ``_idle_timeout_sec``.
+        tracking_mode (str):
+            Specifies the key used for connection tracking. There are
+            two options: - PER_CONNECTION: This is the default mode. The
+            Connection Tracking is performed as per the Connection Key
+            (default Hash Method) for the specific protocol. -
+            PER_SESSION: The Connection Tracking is performed as per the
+            configured Session Affinity. It matches the configured
+            Session Affinity. For more details, see `Tracking Mode for
+            Network Load
+            Balancing <https://cloud.google.com/load-balancing/docs/network/networklb-backend-service#tracking-mode>`__
+            and `Tracking Mode for Internal TCP/UDP Load
+            Balancing <https://cloud.google.com/load-balancing/docs/internal#tracking-mode>`__.
+            Check the TrackingMode enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_tracking_mode``.
+    """
+
+    class ConnectionPersistenceOnUnhealthyBackends(proto.Enum):
+        r"""Specifies connection persistence when backends are unhealthy. The
+        default value is DEFAULT_FOR_PROTOCOL. If set to
+        DEFAULT_FOR_PROTOCOL, the existing connections persist on unhealthy
+        backends only for connection-oriented protocols (TCP and SCTP) and
+        only if the Tracking Mode is PER_CONNECTION (default tracking mode)
+        or the Session Affinity is configured for 5-tuple. They do not
+        persist for UDP. If set to NEVER_PERSIST, after a backend becomes
+        unhealthy, the existing connections on the unhealthy backend are
+        never persisted on the unhealthy backend. They are always diverted
+        to newly selected healthy backends (unless all backends are
+        unhealthy). If set to ALWAYS_PERSIST, existing connections always
+        persist on unhealthy backends regardless of protocol and session
+        affinity. It is generally not recommended to use this mode
+        overriding the default. For more details, see `Connection
+        Persistence for Network Load
+        Balancing <https://cloud.google.com/load-balancing/docs/network/networklb-backend-service#connection-persistence>`__
+        and `Connection Persistence for Internal TCP/UDP Load
+        Balancing <https://cloud.google.com/load-balancing/docs/internal#connection-persistence>`__.
+
+        Values:
+            UNDEFINED_CONNECTION_PERSISTENCE_ON_UNHEALTHY_BACKENDS (0):
+                A value indicating that the enum field is not
+                set.
+            ALWAYS_PERSIST (38400900):
+                No description available.
+            DEFAULT_FOR_PROTOCOL (145265356):
+                No description available.
+            NEVER_PERSIST (138646241):
+                No description available.
+        """
+        UNDEFINED_CONNECTION_PERSISTENCE_ON_UNHEALTHY_BACKENDS = 0
+        ALWAYS_PERSIST = 38400900
+        DEFAULT_FOR_PROTOCOL = 145265356
+        NEVER_PERSIST = 138646241
+
+    class TrackingMode(proto.Enum):
+        r"""Specifies the key used for connection tracking. There are two
+        options: - PER_CONNECTION: This is the default mode. The Connection
+        Tracking is performed as per the Connection Key (default Hash
+        Method) for the specific protocol. - PER_SESSION: The Connection
+        Tracking is performed as per the configured Session Affinity. It
+        matches the configured Session Affinity. For more details, see
+        `Tracking Mode for Network Load
+        Balancing <https://cloud.google.com/load-balancing/docs/network/networklb-backend-service#tracking-mode>`__
+        and `Tracking Mode for Internal TCP/UDP Load
+        Balancing <https://cloud.google.com/load-balancing/docs/internal#tracking-mode>`__.
+
+        Values:
+            UNDEFINED_TRACKING_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            INVALID_TRACKING_MODE (49234371):
+                No description available.
+            PER_CONNECTION (85162848):
+                No description available.
+            PER_SESSION (182099252):
+                No description available.
+        """
+        UNDEFINED_TRACKING_MODE = 0
+        INVALID_TRACKING_MODE = 49234371
+        PER_CONNECTION = 85162848
+        PER_SESSION = 182099252
+
+    connection_persistence_on_unhealthy_backends: str = proto.Field(
+        proto.STRING,
+        number=152439033,
+        optional=True,
+    )
+    enable_strong_affinity: bool = proto.Field(
+        proto.BOOL,
+        number=24539924,
+        optional=True,
+    )
+    idle_timeout_sec: int = proto.Field(
+        proto.INT32,
+        number=24977544,
+        optional=True,
+    )
+    tracking_mode: str = proto.Field(
+        proto.STRING,
+        number=127757867,
+        optional=True,
+    )
+
+
+class BackendServiceFailoverPolicy(proto.Message):
+    r"""For load balancers that have configurable failover: `Internal
+    TCP/UDP Load
+    Balancing <https://cloud.google.com/load-balancing/docs/internal/failover-overview>`__
+    and `external TCP/UDP Load
+    Balancing <https://cloud.google.com/load-balancing/docs/network/networklb-failover-overview>`__.
+    On failover or failback, this field indicates whether connection
+    draining will be honored. Google Cloud has a fixed connection
+    draining timeout of 10 minutes. A setting of true terminates
+    existing TCP connections to the active pool during failover and
+    failback, immediately draining traffic. A setting of false allows
+    existing TCP connections to persist, even on VMs no longer in the
+    active pool, for up to the duration of the connection draining
+    timeout (10 minutes).
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        disable_connection_drain_on_failover (bool):
+            This can be set to true only if the protocol
+            is TCP. The default is false.
+
+            This field is a member of `oneof`_ ``_disable_connection_drain_on_failover``.
+        drop_traffic_if_unhealthy (bool):
+            If set to true, connections to the load balancer are dropped
+            when all primary and all backup backend VMs are unhealthy.If
+            set to false, connections are distributed among all primary
+            VMs when all primary and all backup backend VMs are
+            unhealthy. For load balancers that have configurable
+            failover: `Internal TCP/UDP Load
+            Balancing <https://cloud.google.com/load-balancing/docs/internal/failover-overview>`__
+            and `external TCP/UDP Load
+            Balancing <https://cloud.google.com/load-balancing/docs/network/networklb-failover-overview>`__.
+            The default is false.
+
+            This field is a member of `oneof`_ ``_drop_traffic_if_unhealthy``.
+        failover_ratio (float):
+            The value of the field must be in the range [0, 1]. If the
+            value is 0, the load balancer performs a failover when the
+            number of healthy primary VMs equals zero. For all other
+            values, the load balancer performs a failover when the total
+            number of healthy primary VMs is less than this ratio. For
+            load balancers that have configurable failover: `Internal
+            TCP/UDP Load
+            Balancing <https://cloud.google.com/load-balancing/docs/internal/failover-overview>`__
+            and `external TCP/UDP Load
+            Balancing <https://cloud.google.com/load-balancing/docs/network/networklb-failover-overview>`__.
+
+            This field is a member of `oneof`_ ``_failover_ratio``.
+    """
+
+    disable_connection_drain_on_failover: bool = proto.Field(
+        proto.BOOL,
+        number=182150753,
+        optional=True,
+    )
+    drop_traffic_if_unhealthy: bool = proto.Field(
+        proto.BOOL,
+        number=112289428,
+        optional=True,
+    )
+    failover_ratio: float = proto.Field(
+        proto.FLOAT,
+        number=212667006,
+        optional=True,
+    )
+
+
+class BackendServiceGroupHealth(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        annotations (MutableMapping[str, str]):
+            Metadata defined as annotations on the
+            network endpoint group.
+        health_status (MutableSequence[google.cloud.compute_v1.types.HealthStatus]):
+            Health state of the backend instances or
+            endpoints in requested instance or network
+            endpoint group, determined based on configured
+            health checks.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#backendServiceGroupHealth for the health of backend
+            services.
+
+            This field is a member of `oneof`_ ``_kind``.
+    """
+
+    annotations: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=112032548,
+    )
+    health_status: MutableSequence[
+        shared_health_status.HealthStatus
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=380545845,
+        message=shared_health_status.HealthStatus,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+
+
+class BackendServiceIAP(proto.Message):
+    r"""Identity-Aware Proxy
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enabled (bool):
+            Whether the serving infrastructure will
+            authenticate and authorize all incoming
+            requests.
+
+            This field is a member of `oneof`_ ``_enabled``.
+        oauth2_client_id (str):
+            OAuth2 client ID to use for the
+            authentication flow.
+
+            This field is a member of `oneof`_ ``_oauth2_client_id``.
+        oauth2_client_secret (str):
+            OAuth2 client secret to use for the
+            authentication flow. For security reasons, this
+            value cannot be retrieved via the API. Instead,
+            the SHA-256 hash of the value is returned in the
+            oauth2ClientSecretSha256 field. @InputOnly
+
+            This field is a member of `oneof`_ ``_oauth2_client_secret``.
+        oauth2_client_secret_sha256 (str):
+            [Output Only] SHA256 hash value for the field
+            oauth2_client_secret above.
+
+            This field is a member of `oneof`_ ``_oauth2_client_secret_sha256``.
+    """
+
+    enabled: bool = proto.Field(
+        proto.BOOL,
+        number=1018689,
+        optional=True,
+    )
+    oauth2_client_id: str = proto.Field(
+        proto.STRING,
+        number=314017611,
+        optional=True,
+    )
+    oauth2_client_secret: str = proto.Field(
+        proto.STRING,
+        number=50999520,
+        optional=True,
+    )
+    oauth2_client_secret_sha256: str = proto.Field(
+        proto.STRING,
+        number=112903782,
+        optional=True,
+    )
+
+
+class BackendServiceList(proto.Message):
+    r"""Contains a list of BackendService resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.BackendService]):
+            A list of BackendService resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#backendServiceList for lists of backend services.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["BackendService"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="BackendService",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class BackendServiceListUsable(proto.Message):
+    r"""Contains a list of usable BackendService resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.BackendService]):
+            A list of BackendService resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#usableBackendServiceList for lists of usable backend
+            services.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["BackendService"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="BackendService",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class BackendServiceLocalityLoadBalancingPolicyConfig(proto.Message):
+    r"""Container for either a built-in LB policy supported by gRPC
+    or Envoy or a custom one implemented by the end user.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        custom_policy (google.cloud.compute_v1.types.BackendServiceLocalityLoadBalancingPolicyConfigCustomPolicy):
+
+            This field is a member of `oneof`_ ``_custom_policy``.
+        policy (google.cloud.compute_v1.types.BackendServiceLocalityLoadBalancingPolicyConfigPolicy):
+
+            This field is a member of `oneof`_ ``_policy``.
+    """
+
+    custom_policy: "BackendServiceLocalityLoadBalancingPolicyConfigCustomPolicy" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=4818368,
+            optional=True,
+            message="BackendServiceLocalityLoadBalancingPolicyConfigCustomPolicy",
+        )
+    )
+    policy: "BackendServiceLocalityLoadBalancingPolicyConfigPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=91071794,
+        optional=True,
+        message="BackendServiceLocalityLoadBalancingPolicyConfigPolicy",
+    )
+
+
+class BackendServiceLocalityLoadBalancingPolicyConfigCustomPolicy(proto.Message):
+    r"""The configuration for a custom policy implemented by the user
+    and deployed with the client.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        data (str):
+            An optional, arbitrary JSON object with
+            configuration data, understood by a locally
+            installed custom policy implementation.
+
+            This field is a member of `oneof`_ ``_data``.
+        name (str):
+            Identifies the custom policy. The value
+            should match the name of a custom implementation
+            registered on the gRPC clients. It should follow
+            protocol buffer message naming conventions and
+            include the full path (for example,
+            myorg.CustomLbPolicy). The maximum length is 256
+            characters. Do not specify the same custom
+            policy more than once for a backend. If you do,
+            the configuration is rejected. For an example of
+            how to use this field, see Use a custom policy.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    data: str = proto.Field(
+        proto.STRING,
+        number=3076010,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+
+
+class BackendServiceLocalityLoadBalancingPolicyConfigPolicy(proto.Message):
+    r"""The configuration for a built-in load balancing policy.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            The name of a locality load-balancing policy. Valid values
+            include ROUND_ROBIN and, for Java clients, LEAST_REQUEST.
+            For information about these values, see the description of
+            localityLbPolicy. Do not specify the same policy more than
+            once for a backend. If you do, the configuration is
+            rejected. Check the Name enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    class Name(proto.Enum):
+        r"""The name of a locality load-balancing policy. Valid values include
+        ROUND_ROBIN and, for Java clients, LEAST_REQUEST. For information
+        about these values, see the description of localityLbPolicy. Do not
+        specify the same policy more than once for a backend. If you do, the
+        configuration is rejected.
+
+        Values:
+            UNDEFINED_NAME (0):
+                A value indicating that the enum field is not
+                set.
+            INVALID_LB_POLICY (323318707):
+                No description available.
+            LEAST_REQUEST (46604921):
+                An O(1) algorithm which selects two random
+                healthy hosts and picks the host which has fewer
+                active requests.
+            MAGLEV (119180266):
+                This algorithm implements consistent hashing
+                to backends. Maglev can be used as a drop in
+                replacement for the ring hash load balancer.
+                Maglev is not as stable as ring hash but has
+                faster table lookup build times and host
+                selection times. For more information about
+                Maglev, see
+                https://ai.google/research/pubs/pub44824
+            ORIGINAL_DESTINATION (166297216):
+                Backend host is selected based on the client
+                connection metadata, i.e., connections are
+                opened to the same address as the destination
+                address of the incoming connection before the
+                connection was redirected to the load balancer.
+            RANDOM (262527171):
+                The load balancer selects a random healthy
+                host.
+            RING_HASH (432795069):
+                The ring/modulo hash load balancer implements
+                consistent hashing to backends. The algorithm
+                has the property that the addition/removal of a
+                host from a set of N hosts only affects 1/N of
+                the requests.
+            ROUND_ROBIN (153895801):
+                This is a simple policy in which each healthy
+                backend is selected in round robin order. This
+                is the default.
+            WEIGHTED_MAGLEV (254930962):
+                Per-instance weighted Load Balancing via health check
+                reported weights. If set, the Backend Service must configure
+                a non legacy HTTP-based Health Check, and health check
+                replies are expected to contain non-standard HTTP response
+                header field X-Load-Balancing-Endpoint-Weight to specify the
+                per-instance weights. If set, Load Balancing is weighted
+                based on the per-instance weights reported in the last
+                processed health check replies, as long as every instance
+                either reported a valid weight or had UNAVAILABLE_WEIGHT.
+                Otherwise, Load Balancing remains equal-weight. This option
+                is only supported in Network Load Balancing.
+        """
+        UNDEFINED_NAME = 0
+        INVALID_LB_POLICY = 323318707
+        LEAST_REQUEST = 46604921
+        MAGLEV = 119180266
+        ORIGINAL_DESTINATION = 166297216
+        RANDOM = 262527171
+        RING_HASH = 432795069
+        ROUND_ROBIN = 153895801
+        WEIGHTED_MAGLEV = 254930962
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+
+
+class BackendServiceLogConfig(proto.Message):
+    r"""The available logging options for the load balancer traffic
+    served by this backend service.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enable (bool):
+            Denotes whether to enable logging for the
+            load balancer traffic served by this backend
+            service. The default value is false.
+
+            This field is a member of `oneof`_ ``_enable``.
+        optional_fields (MutableSequence[str]):
+            This field can only be specified if logging
+            is enabled for this backend service and
+            "logConfig.optionalMode" was set to CUSTOM.
+            Contains a list of optional fields you want to
+            include in the logs. For example:
+            serverInstance, serverGkeDetails.cluster,
+            serverGkeDetails.pod.podNamespace
+        optional_mode (str):
+            This field can only be specified if logging is enabled for
+            this backend service. Configures whether all, none or a
+            subset of optional fields should be added to the reported
+            logs. One of [INCLUDE_ALL_OPTIONAL, EXCLUDE_ALL_OPTIONAL,
+            CUSTOM]. Default is EXCLUDE_ALL_OPTIONAL. Check the
+            OptionalMode enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_optional_mode``.
+        sample_rate (float):
+            This field can only be specified if logging is enabled for
+            this backend service. The value of the field must be in [0,
+            1]. This configures the sampling rate of requests to the
+            load balancer where 1.0 means all logged requests are
+            reported and 0.0 means no logged requests are reported. The
+            default value is 1.0.
+
+            This field is a member of `oneof`_ ``_sample_rate``.
+    """
+
+    class OptionalMode(proto.Enum):
+        r"""This field can only be specified if logging is enabled for this
+        backend service. Configures whether all, none or a subset of
+        optional fields should be added to the reported logs. One of
+        [INCLUDE_ALL_OPTIONAL, EXCLUDE_ALL_OPTIONAL, CUSTOM]. Default is
+        EXCLUDE_ALL_OPTIONAL.
+
+        Values:
+            UNDEFINED_OPTIONAL_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            CUSTOM (388595569):
+                A subset of optional fields.
+            EXCLUDE_ALL_OPTIONAL (168636099):
+                None optional fields.
+            INCLUDE_ALL_OPTIONAL (535606965):
+                All optional fields.
+        """
+        UNDEFINED_OPTIONAL_MODE = 0
+        CUSTOM = 388595569
+        EXCLUDE_ALL_OPTIONAL = 168636099
+        INCLUDE_ALL_OPTIONAL = 535606965
+
+    enable: bool = proto.Field(
+        proto.BOOL,
+        number=311764355,
+        optional=True,
+    )
+    optional_fields: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=528589944,
+    )
+    optional_mode: str = proto.Field(
+        proto.STRING,
+        number=128697122,
+        optional=True,
+    )
+    sample_rate: float = proto.Field(
+        proto.FLOAT,
+        number=153193045,
+        optional=True,
+    )
+
+
+class BackendServiceUsedBy(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        reference (str):
+
+            This field is a member of `oneof`_ ``_reference``.
+    """
+
+    reference: str = proto.Field(
+        proto.STRING,
+        number=148586315,
+        optional=True,
+    )
+
+
+class CacheKeyPolicy(proto.Message):
+    r"""Message containing what to include in the cache key for a
+    request for Cloud CDN.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        include_host (bool):
+            If true, requests to different hosts will be
+            cached separately.
+
+            This field is a member of `oneof`_ ``_include_host``.
+        include_http_headers (MutableSequence[str]):
+            Allows HTTP request headers (by name) to be
+            used in the cache key.
+        include_named_cookies (MutableSequence[str]):
+            Allows HTTP cookies (by name) to be used in
+            the cache key. The name=value pair will be used
+            in the cache key Cloud CDN generates.
+        include_protocol (bool):
+            If true, http and https requests will be
+            cached separately.
+
+            This field is a member of `oneof`_ ``_include_protocol``.
+        include_query_string (bool):
+            If true, include query string parameters in the cache key
+            according to query_string_whitelist and
+            query_string_blacklist. If neither is set, the entire query
+            string will be included. If false, the query string will be
+            excluded from the cache key entirely.
+
+            This field is a member of `oneof`_ ``_include_query_string``.
+        query_string_blacklist (MutableSequence[str]):
+            Names of query string parameters to exclude in cache keys.
+            All other parameters will be included. Either specify
+            query_string_whitelist or query_string_blacklist, not both.
+            '&' and '=' will be percent encoded and not treated as
+            delimiters.
+        query_string_whitelist (MutableSequence[str]):
+            Names of query string parameters to include in cache keys.
+            All other parameters will be excluded. Either specify
+            query_string_whitelist or query_string_blacklist, not both.
+            '&' and '=' will be percent encoded and not treated as
+            delimiters.
+    """
+
+    include_host: bool = proto.Field(
+        proto.BOOL,
+        number=486867679,
+        optional=True,
+    )
+    include_http_headers: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=2489606,
+    )
+    include_named_cookies: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=87316530,
+    )
+    include_protocol: bool = proto.Field(
+        proto.BOOL,
+        number=303507535,
+        optional=True,
+    )
+    include_query_string: bool = proto.Field(
+        proto.BOOL,
+        number=474036639,
+        optional=True,
+    )
+    query_string_blacklist: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=354964742,
+    )
+    query_string_whitelist: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=52456496,
+    )
+
+
+class CircuitBreakers(proto.Message):
+    r"""Settings controlling the volume of requests, connections and
+    retries to this backend service.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        max_connections (int):
+            The maximum number of connections to the
+            backend service. If not specified, there is no
+            limit. Not supported when the backend service is
+            referenced by a URL map that is bound to target
+            gRPC proxy that has validateForProxyless field
+            set to true.
+
+            This field is a member of `oneof`_ ``_max_connections``.
+        max_pending_requests (int):
+            The maximum number of pending requests
+            allowed to the backend service. If not
+            specified, there is no limit. Not supported when
+            the backend service is referenced by a URL map
+            that is bound to target gRPC proxy that has
+            validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_max_pending_requests``.
+        max_requests (int):
+            The maximum number of parallel requests that
+            allowed to the backend service. If not
+            specified, there is no limit.
+
+            This field is a member of `oneof`_ ``_max_requests``.
+        max_requests_per_connection (int):
+            Maximum requests for a single connection to
+            the backend service. This parameter is respected
+            by both the HTTP/1.1 and HTTP/2 implementations.
+            If not specified, there is no limit. Setting
+            this parameter to 1 will effectively disable
+            keep alive. Not supported when the backend
+            service is referenced by a URL map that is bound
+            to target gRPC proxy that has
+            validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_max_requests_per_connection``.
+        max_retries (int):
+            The maximum number of parallel retries
+            allowed to the backend cluster. If not
+            specified, the default is 1. Not supported when
+            the backend service is referenced by a URL map
+            that is bound to target gRPC proxy that has
+            validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_max_retries``.
+    """
+
+    max_connections: int = proto.Field(
+        proto.INT32,
+        number=110652154,
+        optional=True,
+    )
+    max_pending_requests: int = proto.Field(
+        proto.INT32,
+        number=375558887,
+        optional=True,
+    )
+    max_requests: int = proto.Field(
+        proto.INT32,
+        number=28097599,
+        optional=True,
+    )
+    max_requests_per_connection: int = proto.Field(
+        proto.INT32,
+        number=361630528,
+        optional=True,
+    )
+    max_retries: int = proto.Field(
+        proto.INT32,
+        number=55546219,
+        optional=True,
+    )
+
+
+class ConnectionDraining(proto.Message):
+    r"""Message containing connection draining configuration.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        draining_timeout_sec (int):
+            Configures a duration timeout for existing
+            requests on a removed backend instance. For
+            supported load balancers and protocols, as
+            described in Enabling connection draining.
+
+            This field is a member of `oneof`_ ``_draining_timeout_sec``.
+    """
+
+    draining_timeout_sec: int = proto.Field(
+        proto.INT32,
+        number=225127070,
+        optional=True,
+    )
+
+
+class ConsistentHashLoadBalancerSettings(proto.Message):
+    r"""This message defines settings for a consistent hash style
+    load balancer.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        http_cookie (google.cloud.compute_v1.types.ConsistentHashLoadBalancerSettingsHttpCookie):
+            Hash is based on HTTP Cookie. This field describes a HTTP
+            cookie that will be used as the hash key for the consistent
+            hash load balancer. If the cookie is not present, it will be
+            generated. This field is applicable if the sessionAffinity
+            is set to HTTP_COOKIE. Not supported when the backend
+            service is referenced by a URL map that is bound to target
+            gRPC proxy that has validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_http_cookie``.
+        http_header_name (str):
+            The hash based on the value of the specified header field.
+            This field is applicable if the sessionAffinity is set to
+            HEADER_FIELD.
+
+            This field is a member of `oneof`_ ``_http_header_name``.
+        minimum_ring_size (int):
+            The minimum number of virtual nodes to use
+            for the hash ring. Defaults to 1024. Larger ring
+            sizes result in more granular load
+            distributions. If the number of hosts in the
+            load balancing pool is larger than the ring
+            size, each host will be assigned a single
+            virtual node.
+
+            This field is a member of `oneof`_ ``_minimum_ring_size``.
+    """
+
+    http_cookie: "ConsistentHashLoadBalancerSettingsHttpCookie" = proto.Field(
+        proto.MESSAGE,
+        number=6673915,
+        optional=True,
+        message="ConsistentHashLoadBalancerSettingsHttpCookie",
+    )
+    http_header_name: str = proto.Field(
+        proto.STRING,
+        number=234798022,
+        optional=True,
+    )
+    minimum_ring_size: int = proto.Field(
+        proto.INT64,
+        number=234380735,
+        optional=True,
+    )
+
+
+class ConsistentHashLoadBalancerSettingsHttpCookie(proto.Message):
+    r"""The information about the HTTP Cookie on which the hash
+    function is based for load balancing policies that use a
+    consistent hash.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            Name of the cookie.
+
+            This field is a member of `oneof`_ ``_name``.
+        path (str):
+            Path to set for the cookie.
+
+            This field is a member of `oneof`_ ``_path``.
+        ttl (google.cloud.compute_v1.types.Duration):
+            Lifetime of the cookie.
+
+            This field is a member of `oneof`_ ``_ttl``.
+    """
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    path: str = proto.Field(
+        proto.STRING,
+        number=3433509,
+        optional=True,
+    )
+    ttl: shared_duration.Duration = proto.Field(
+        proto.MESSAGE,
+        number=115180,
+        optional=True,
+        message=shared_duration.Duration,
+    )
+
+
+class OutlierDetection(proto.Message):
+    r"""Settings controlling the eviction of unhealthy hosts from the
+    load balancing pool for the backend service.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        base_ejection_time (google.cloud.compute_v1.types.Duration):
+            The base time that a backend endpoint is
+            ejected for. Defaults to 30000ms or 30s. After a
+            backend endpoint is returned back to the load
+            balancing pool, it can be ejected again in
+            another ejection analysis. Thus, the total
+            ejection time is equal to the base ejection time
+            multiplied by the number of times the backend
+            endpoint has been ejected. Defaults to 30000ms
+            or 30s.
+
+            This field is a member of `oneof`_ ``_base_ejection_time``.
+        consecutive_errors (int):
+            Number of consecutive errors before a backend
+            endpoint is ejected from the load balancing
+            pool. When the backend endpoint is accessed over
+            HTTP, a 5xx return code qualifies as an error.
+            Defaults to 5.
+
+            This field is a member of `oneof`_ ``_consecutive_errors``.
+        consecutive_gateway_failure (int):
+            The number of consecutive gateway failures
+            (502, 503, 504 status or connection errors that
+            are mapped to one of those status codes) before
+            a consecutive gateway failure ejection occurs.
+            Defaults to 3.
+
+            This field is a member of `oneof`_ ``_consecutive_gateway_failure``.
+        enforcing_consecutive_errors (int):
+            The percentage chance that a backend endpoint
+            will be ejected when an outlier status is
+            detected through consecutive 5xx. This setting
+            can be used to disable ejection or to ramp it up
+            slowly. Defaults to 0.
+
+            This field is a member of `oneof`_ ``_enforcing_consecutive_errors``.
+        enforcing_consecutive_gateway_failure (int):
+            The percentage chance that a backend endpoint
+            will be ejected when an outlier status is
+            detected through consecutive gateway failures.
+            This setting can be used to disable ejection or
+            to ramp it up slowly. Defaults to 100.
+
+            This field is a member of `oneof`_ ``_enforcing_consecutive_gateway_failure``.
+        enforcing_success_rate (int):
+            The percentage chance that a backend endpoint
+            will be ejected when an outlier status is
+            detected through success rate statistics. This
+            setting can be used to disable ejection or to
+            ramp it up slowly. Defaults to 100. Not
+            supported when the backend service uses
+            Serverless NEG.
+
+            This field is a member of `oneof`_ ``_enforcing_success_rate``.
+        interval (google.cloud.compute_v1.types.Duration):
+            Time interval between ejection analysis
+            sweeps. This can result in both new ejections
+            and backend endpoints being returned to service.
+            The interval is equal to the number of seconds
+            as defined in outlierDetection.interval.seconds
+            plus the number of nanoseconds as defined in
+            outlierDetection.interval.nanos. Defaults to 1
+            second.
+
+            This field is a member of `oneof`_ ``_interval``.
+        max_ejection_percent (int):
+            Maximum percentage of backend endpoints in
+            the load balancing pool for the backend service
+            that can be ejected if the ejection conditions
+            are met. Defaults to 50%.
+
+            This field is a member of `oneof`_ ``_max_ejection_percent``.
+        success_rate_minimum_hosts (int):
+            The number of backend endpoints in the load
+            balancing pool that must have enough request
+            volume to detect success rate outliers. If the
+            number of backend endpoints is fewer than this
+            setting, outlier detection via success rate
+            statistics is not performed for any backend
+            endpoint in the load balancing pool. Defaults to
+            5. Not supported when the backend service uses
+            Serverless NEG.
+
+            This field is a member of `oneof`_ ``_success_rate_minimum_hosts``.
+        success_rate_request_volume (int):
+            The minimum number of total requests that
+            must be collected in one interval (as defined by
+            the interval duration above) to include this
+            backend endpoint in success rate based outlier
+            detection. If the volume is lower than this
+            setting, outlier detection via success rate
+            statistics is not performed for that backend
+            endpoint. Defaults to 100. Not supported when
+            the backend service uses Serverless NEG.
+
+            This field is a member of `oneof`_ ``_success_rate_request_volume``.
+        success_rate_stdev_factor (int):
+            This factor is used to determine the ejection threshold for
+            success rate outlier ejection. The ejection threshold is the
+            difference between the mean success rate, and the product of
+            this factor and the standard deviation of the mean success
+            rate: mean - (stdev \* successRateStdevFactor). This factor
+            is divided by a thousand to get a double. That is, if the
+            desired factor is 1.9, the runtime value should be 1900.
+            Defaults to 1900. Not supported when the backend service
+            uses Serverless NEG.
+
+            This field is a member of `oneof`_ ``_success_rate_stdev_factor``.
+    """
+
+    base_ejection_time: shared_duration.Duration = proto.Field(
+        proto.MESSAGE,
+        number=80997255,
+        optional=True,
+        message=shared_duration.Duration,
+    )
+    consecutive_errors: int = proto.Field(
+        proto.INT32,
+        number=387193248,
+        optional=True,
+    )
+    consecutive_gateway_failure: int = proto.Field(
+        proto.INT32,
+        number=417504250,
+        optional=True,
+    )
+    enforcing_consecutive_errors: int = proto.Field(
+        proto.INT32,
+        number=213133760,
+        optional=True,
+    )
+    enforcing_consecutive_gateway_failure: int = proto.Field(
+        proto.INT32,
+        number=394440666,
+        optional=True,
+    )
+    enforcing_success_rate: int = proto.Field(
+        proto.INT32,
+        number=194508732,
+        optional=True,
+    )
+    interval: shared_duration.Duration = proto.Field(
+        proto.MESSAGE,
+        number=33547461,
+        optional=True,
+        message=shared_duration.Duration,
+    )
+    max_ejection_percent: int = proto.Field(
+        proto.INT32,
+        number=18436888,
+        optional=True,
+    )
+    success_rate_minimum_hosts: int = proto.Field(
+        proto.INT32,
+        number=525766903,
+        optional=True,
+    )
+    success_rate_request_volume: int = proto.Field(
+        proto.INT32,
+        number=281425357,
+        optional=True,
+    )
+    success_rate_stdev_factor: int = proto.Field(
+        proto.INT32,
+        number=174735773,
+        optional=True,
+    )
+
+
+class ResourceGroupReference(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        group (str):
+            A URI referencing one of the instance groups
+            or network endpoint groups listed in the backend
+            service.
+
+            This field is a member of `oneof`_ ``_group``.
+    """
+
+    group: str = proto.Field(
+        proto.STRING,
+        number=98629247,
+        optional=True,
+    )
+
+
+class SecuritySettings(proto.Message):
+    r"""The authentication and authorization settings for a
+    BackendService.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        aws_v4_authentication (google.cloud.compute_v1.types.AWSV4Signature):
+            The configuration needed to generate a signature for access
+            to private storage buckets that support AWS's Signature
+            Version 4 for authentication. Allowed only for
+            INTERNET_IP_PORT and INTERNET_FQDN_PORT NEG backends.
+
+            This field is a member of `oneof`_ ``_aws_v4_authentication``.
+        client_tls_policy (str):
+            Optional. A URL referring to a
+            networksecurity.ClientTlsPolicy resource that describes how
+            clients should authenticate with this service's backends.
+            clientTlsPolicy only applies to a global BackendService with
+            the loadBalancingScheme set to INTERNAL_SELF_MANAGED. If
+            left blank, communications are not encrypted.
+
+            This field is a member of `oneof`_ ``_client_tls_policy``.
+        subject_alt_names (MutableSequence[str]):
+            Optional. A list of Subject Alternative Names (SANs) that
+            the client verifies during a mutual TLS handshake with an
+            server/endpoint for this BackendService. When the server
+            presents its X.509 certificate to the client, the client
+            inspects the certificate's subjectAltName field. If the
+            field contains one of the specified values, the
+            communication continues. Otherwise, it fails. This
+            additional check enables the client to verify that the
+            server is authorized to run the requested service. Note that
+            the contents of the server certificate's subjectAltName
+            field are configured by the Public Key Infrastructure which
+            provisions server identities. Only applies to a global
+            BackendService with loadBalancingScheme set to
+            INTERNAL_SELF_MANAGED. Only applies when BackendService has
+            an attached clientTlsPolicy with clientCertificate (mTLS
+            mode).
+    """
+
+    aws_v4_authentication: "AWSV4Signature" = proto.Field(
+        proto.MESSAGE,
+        number=433993111,
+        optional=True,
+        message="AWSV4Signature",
+    )
+    client_tls_policy: str = proto.Field(
+        proto.STRING,
+        number=462325226,
+        optional=True,
+    )
+    subject_alt_names: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=330029535,
+    )
+
+
+class Subsetting(proto.Message):
+    r"""Subsetting configuration for this BackendService. Currently
+    this is applicable only for Internal TCP/UDP load balancing,
+    Internal HTTP(S) load balancing and Traffic Director.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        policy (str):
+            Check the Policy enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_policy``.
+    """
+
+    class Policy(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_POLICY (0):
+                A value indicating that the enum field is not
+                set.
+            CONSISTENT_HASH_SUBSETTING (108989492):
+                Subsetting based on consistent hashing. For Traffic
+                Director, the number of backends per backend group (the
+                subset size) is based on the ``subset_size`` parameter. For
+                Internal HTTP(S) load balancing, the number of backends per
+                backend group (the subset size) is dynamically adjusted in
+                two cases: - As the number of proxy instances participating
+                in Internal HTTP(S) load balancing increases, the subset
+                size decreases. - When the total number of backends in a
+                network exceeds the capacity of a single proxy instance,
+                subset sizes are reduced automatically for each service that
+                has backend subsetting enabled.
+            NONE (2402104):
+                No Subsetting. Clients may open connections
+                and send traffic to all backends of this backend
+                service. This can lead to performance issues if
+                there is substantial imbalance in the count of
+                clients and backends.
+        """
+        UNDEFINED_POLICY = 0
+        CONSISTENT_HASH_SUBSETTING = 108989492
+        NONE = 2402104
+
+    policy: str = proto.Field(
+        proto.STRING,
+        number=91071794,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_network_interface
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "BulkInsertInstanceResource",
+        "BulkInsertInstanceResourcePerInstanceProperties",
+        "LocationPolicy",
+        "LocationPolicyLocation",
+        "LocationPolicyLocationConstraints",
+    },
+)
+
+
+class BulkInsertInstanceResource(proto.Message):
+    r"""A transient resource used in compute.instances.bulkInsert and
+    compute.regionInstances.bulkInsert . This resource is not
+    persisted anywhere, it is used only for processing the requests.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        count (int):
+            The maximum number of instances to create.
+
+            This field is a member of `oneof`_ ``_count``.
+        instance_properties (google.cloud.compute_v1.types.InstanceProperties):
+            The instance properties defining the VM
+            instances to be created. Required if
+            sourceInstanceTemplate is not provided.
+
+            This field is a member of `oneof`_ ``_instance_properties``.
+        location_policy (google.cloud.compute_v1.types.LocationPolicy):
+            Policy for chosing target zone. For more
+            information, see Create VMs in bulk .
+
+            This field is a member of `oneof`_ ``_location_policy``.
+        min_count (int):
+            The minimum number of instances to create. If no min_count
+            is specified then count is used as the default value. If
+            min_count instances cannot be created, then no instances
+            will be created and instances already created will be
+            deleted.
+
+            This field is a member of `oneof`_ ``_min_count``.
+        name_pattern (str):
+            The string pattern used for the names of the VMs. Either
+            name_pattern or per_instance_properties must be set. The
+            pattern must contain one continuous sequence of placeholder
+            hash characters (#) with each character corresponding to one
+            digit of the generated instance name. Example: a
+            name_pattern of inst-#### generates instance names such as
+            inst-0001 and inst-0002. If existing instances in the same
+            project and zone have names that match the name pattern then
+            the generated instance numbers start after the biggest
+            existing number. For example, if there exists an instance
+            with name inst-0050, then instance names generated using the
+            pattern inst-#### begin with inst-0051. The name pattern
+            placeholder #...# can contain up to 18 characters.
+
+            This field is a member of `oneof`_ ``_name_pattern``.
+        per_instance_properties (MutableMapping[str, google.cloud.compute_v1.types.BulkInsertInstanceResourcePerInstanceProperties]):
+            Per-instance properties to be set on individual instances.
+            Keys of this map specify requested instance names. Can be
+            empty if name_pattern is used.
+        source_instance_template (str):
+            Specifies the instance template from which to
+            create instances. You may combine
+            sourceInstanceTemplate with instanceProperties
+            to override specific values from an existing
+            instance template. Bulk API follows the
+            semantics of JSON Merge Patch described by RFC
+            7396. It can be a full or partial URL. For
+            example, the following are all valid URLs to an
+            instance template: -
+            https://www.googleapis.com/compute/v1/projects/project
+            /global/instanceTemplates/instanceTemplate -
+            projects/project/global/instanceTemplates/instanceTemplate
+            - global/instanceTemplates/instanceTemplate This
+            field is optional.
+
+            This field is a member of `oneof`_ ``_source_instance_template``.
+    """
+
+    count: int = proto.Field(
+        proto.INT64,
+        number=94851343,
+        optional=True,
+    )
+    instance_properties: shared_network_interface.InstanceProperties = proto.Field(
+        proto.MESSAGE,
+        number=215355165,
+        optional=True,
+        message=shared_network_interface.InstanceProperties,
+    )
+    location_policy: "LocationPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=465689852,
+        optional=True,
+        message="LocationPolicy",
+    )
+    min_count: int = proto.Field(
+        proto.INT64,
+        number=523228386,
+        optional=True,
+    )
+    name_pattern: str = proto.Field(
+        proto.STRING,
+        number=413815260,
+        optional=True,
+    )
+    per_instance_properties: MutableMapping[
+        str, "BulkInsertInstanceResourcePerInstanceProperties"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=108502267,
+        message="BulkInsertInstanceResourcePerInstanceProperties",
+    )
+    source_instance_template: str = proto.Field(
+        proto.STRING,
+        number=332423616,
+        optional=True,
+    )
+
+
+class BulkInsertInstanceResourcePerInstanceProperties(proto.Message):
+    r"""Per-instance properties to be set on individual instances. To
+    be extended in the future.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        hostname (str):
+            Specifies the hostname of the instance. More details in:
+            https://cloud.google.com/compute/docs/instances/custom-hostname-vm#naming_convention
+
+            This field is a member of `oneof`_ ``_hostname``.
+        name (str):
+            This field is only temporary. It will be
+            removed. Do not use it.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    hostname: str = proto.Field(
+        proto.STRING,
+        number=237067315,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+
+
+class LocationPolicy(proto.Message):
+    r"""Configuration for location policy among multiple possible
+    locations (e.g. preferences for zone selection among zones in a
+    single region).
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        locations (MutableMapping[str, google.cloud.compute_v1.types.LocationPolicyLocation]):
+            Location configurations mapped by location
+            name. Currently only zone names are supported
+            and must be represented as valid internal URLs,
+            such as zones/us-central1-a.
+        target_shape (str):
+            Strategy for distributing VMs across zones in
+            a region. Check the TargetShape enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_target_shape``.
+    """
+
+    class TargetShape(proto.Enum):
+        r"""Strategy for distributing VMs across zones in a region.
+
+        Values:
+            UNDEFINED_TARGET_SHAPE (0):
+                A value indicating that the enum field is not
+                set.
+            ANY (64972):
+                GCE picks zones for creating VM instances to
+                fulfill the requested number of VMs within
+                present resource constraints and to maximize
+                utilization of unused zonal reservations.
+                Recommended for batch workloads that do not
+                require high availability.
+            ANY_SINGLE_ZONE (61100880):
+                GCE always selects a single zone for all the
+                VMs, optimizing for resource quotas, available
+                reservations and general capacity. Recommended
+                for batch workloads that cannot tollerate
+                distribution over multiple zones. This the
+                default shape in Bulk Insert and Capacity
+                Advisor APIs.
+            BALANCED (468409608):
+                GCE prioritizes acquisition of resources,
+                scheduling VMs in zones where resources are
+                available while distributing VMs as evenly as
+                possible across allowed zones to minimize the
+                impact of zonal failure. Recommended for highly
+                available serving workloads.
+        """
+        UNDEFINED_TARGET_SHAPE = 0
+        ANY = 64972
+        ANY_SINGLE_ZONE = 61100880
+        BALANCED = 468409608
+
+    locations: MutableMapping[str, "LocationPolicyLocation"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=413423454,
+        message="LocationPolicyLocation",
+    )
+    target_shape: str = proto.Field(
+        proto.STRING,
+        number=338621299,
+        optional=True,
+    )
+
+
+class LocationPolicyLocation(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        constraints (google.cloud.compute_v1.types.LocationPolicyLocationConstraints):
+            Constraints that the caller requires on the
+            result distribution in this zone.
+
+            This field is a member of `oneof`_ ``_constraints``.
+        preference (str):
+            Preference for a given location. Set to
+            either ALLOW or DENY. Check the Preference enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_preference``.
+    """
+
+    class Preference(proto.Enum):
+        r"""Preference for a given location. Set to either ALLOW or DENY.
+
+        Values:
+            UNDEFINED_PREFERENCE (0):
+                A value indicating that the enum field is not
+                set.
+            ALLOW (62368553):
+                Location is allowed for use.
+            DENY (2094604):
+                Location is prohibited.
+            PREFERENCE_UNSPECIFIED (496219571):
+                Default value, unused.
+        """
+        UNDEFINED_PREFERENCE = 0
+        ALLOW = 62368553
+        DENY = 2094604
+        PREFERENCE_UNSPECIFIED = 496219571
+
+    constraints: "LocationPolicyLocationConstraints" = proto.Field(
+        proto.MESSAGE,
+        number=3909174,
+        optional=True,
+        message="LocationPolicyLocationConstraints",
+    )
+    preference: str = proto.Field(
+        proto.STRING,
+        number=150781147,
+        optional=True,
+    )
+
+
+class LocationPolicyLocationConstraints(proto.Message):
+    r"""Per-zone constraints on location policy for this zone.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        max_count (int):
+            Maximum number of items that are allowed to
+            be placed in this zone. The value must be
+            non-negative.
+
+            This field is a member of `oneof`_ ``_max_count``.
+    """
+
+    max_count: int = proto.Field(
+        proto.INT32,
+        number=287620724,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "CustomerEncryptionKey",
+        "GuestOsFeature",
+    },
+)
+
+
+class CustomerEncryptionKey(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        kms_key_name (str):
+            The name of the encryption key that is stored in Google
+            Cloud KMS. For example: "kmsKeyName":
+            "projects/kms_project_id/locations/region/keyRings/
+            key_region/cryptoKeys/key The fully-qualifed key name may be
+            returned for resource GET requests. For example:
+            "kmsKeyName":
+            "projects/kms_project_id/locations/region/keyRings/
+            key_region/cryptoKeys/key /cryptoKeyVersions/1
+
+            This field is a member of `oneof`_ ``_kms_key_name``.
+        kms_key_service_account (str):
+            The service account being used for the encryption request
+            for the given KMS key. If absent, the Compute Engine default
+            service account is used. For example:
+            "kmsKeyServiceAccount":
+            "name@project_id.iam.gserviceaccount.com/
+
+            This field is a member of `oneof`_ ``_kms_key_service_account``.
+        raw_key (str):
+            Specifies a 256-bit customer-supplied
+            encryption key, encoded in RFC 4648 base64 to
+            either encrypt or decrypt this resource. You can
+            provide either the rawKey or the
+            rsaEncryptedKey. For example: "rawKey":
+            "SGVsbG8gZnJvbSBHb29nbGUgQ2xvdWQgUGxhdGZvcm0=".
+
+            This field is a member of `oneof`_ ``_raw_key``.
+        rsa_encrypted_key (str):
+            Specifies an RFC 4648 base64 encoded,
+            RSA-wrapped 2048-bit customer-supplied
+            encryption key to either encrypt or decrypt this
+            resource. You can provide either the rawKey or
+            the rsaEncryptedKey. For example:
+            "rsaEncryptedKey":
+            "ieCx/NcW06PcT7Ep1X6LUTc/hLvUDYyzSZPPVCVPTVEohpeHASqC8uw5TzyO9U+Fka9JFH
+            z0mBibXUInrC/jEk014kCK/NPjYgEMOyssZ4ZINPKxlUh2zn1bV+MCaTICrdmuSBTWlUUiFoD
+            D6PYznLwh8ZNdaheCeZ8ewEXgFQ8V+sDroLaN3Xs3MDTXQEMMoNUXMCZEIpg9Vtp9x2oe=="
+            The key must meet the following requirements
+            before you can provide it to Compute Engine: 1.
+            The key is wrapped using a RSA public key
+            certificate provided by Google. 2. After being
+            wrapped, the key must be encoded in RFC 4648
+            base64 encoding. Gets the RSA public key
+            certificate provided by Google at:
+            https://cloud-certs.storage.googleapis.com/google-cloud-csek-ingress.pem
+
+            This field is a member of `oneof`_ ``_rsa_encrypted_key``.
+        sha256 (str):
+            [Output only] The RFC 4648 base64 encoded SHA-256 hash of
+            the customer-supplied encryption key that protects this
+            resource.
+
+            This field is a member of `oneof`_ ``_sha256``.
+    """
+
+    kms_key_name: str = proto.Field(
+        proto.STRING,
+        number=484373913,
+        optional=True,
+    )
+    kms_key_service_account: str = proto.Field(
+        proto.STRING,
+        number=209986261,
+        optional=True,
+    )
+    raw_key: str = proto.Field(
+        proto.STRING,
+        number=449196488,
+        optional=True,
+    )
+    rsa_encrypted_key: str = proto.Field(
+        proto.STRING,
+        number=335487397,
+        optional=True,
+    )
+    sha256: str = proto.Field(
+        proto.STRING,
+        number=170112551,
+        optional=True,
+    )
+
+
+class GuestOsFeature(proto.Message):
+    r"""Guest OS features.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        type_ (str):
+            The ID of a supported feature. To add multiple values, use
+            commas to separate values. Set to one or more of the
+            following values: - VIRTIO_SCSI_MULTIQUEUE - WINDOWS -
+            MULTI_IP_SUBNET - UEFI_COMPATIBLE - GVNIC - SEV_CAPABLE -
+            SUSPEND_RESUME_COMPATIBLE - SEV_LIVE_MIGRATABLE -
+            SEV_SNP_CAPABLE For more information, see Enabling guest
+            operating system features. Check the Type enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r"""The ID of a supported feature. To add multiple values, use commas to
+        separate values. Set to one or more of the following values: -
+        VIRTIO_SCSI_MULTIQUEUE - WINDOWS - MULTI_IP_SUBNET - UEFI_COMPATIBLE
+        - GVNIC - SEV_CAPABLE - SUSPEND_RESUME_COMPATIBLE -
+        SEV_LIVE_MIGRATABLE - SEV_SNP_CAPABLE For more information, see
+        Enabling guest operating system features.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            FEATURE_TYPE_UNSPECIFIED (531767259):
+                No description available.
+            GVNIC (68209305):
+                No description available.
+            MULTI_IP_SUBNET (151776719):
+                No description available.
+            SECURE_BOOT (376811194):
+                No description available.
+            SEV_CAPABLE (87083793):
+                No description available.
+            SEV_LIVE_MIGRATABLE (392039820):
+                No description available.
+            SEV_LIVE_MIGRATABLE_V2 (168551983):
+                No description available.
+            SEV_SNP_CAPABLE (426919):
+                No description available.
+            UEFI_COMPATIBLE (195865408):
+                No description available.
+            VIRTIO_SCSI_MULTIQUEUE (201597069):
+                No description available.
+            WINDOWS (456863331):
+                No description available.
+        """
+        UNDEFINED_TYPE = 0
+        FEATURE_TYPE_UNSPECIFIED = 531767259
+        GVNIC = 68209305
+        MULTI_IP_SUBNET = 151776719
+        SECURE_BOOT = 376811194
+        SEV_CAPABLE = 87083793
+        SEV_LIVE_MIGRATABLE = 392039820
+        SEV_LIVE_MIGRATABLE_V2 = 168551983
+        SEV_SNP_CAPABLE = 426919
+        UEFI_COMPATIBLE = 195865408
+        VIRTIO_SCSI_MULTIQUEUE = 201597069
+        WINDOWS = 456863331
+
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "Data",
+    },
+)
+
+
+class Data(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        key (str):
+            [Output Only] A key that provides more detail on the warning
+            being returned. For example, for warnings where there are no
+            results in a list request for a particular zone, this key
+            might be scope and the key value might be the zone name.
+            Other examples might be a key indicating a deprecated
+            resource and a suggested replacement, or a warning about
+            invalid network settings (for example, if an instance
+            attempts to perform IP forwarding but is not enabled for IP
+            forwarding).
+
+            This field is a member of `oneof`_ ``_key``.
+        value (str):
+            [Output Only] A warning data value corresponding to the key.
+
+            This field is a member of `oneof`_ ``_value``.
+    """
+
+    key: str = proto.Field(
+        proto.STRING,
+        number=106079,
+        optional=True,
+    )
+    value: str = proto.Field(
+        proto.STRING,
+        number=111972721,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,966 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_customer_encryption_key
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "BulkInsertDiskResource",
+        "Disk",
+        "DiskAsyncReplication",
+        "DiskAsyncReplicationList",
+        "DiskList",
+        "DiskParams",
+        "DiskResourceStatus",
+        "DiskResourceStatusAsyncReplicationStatus",
+        "DisksStopGroupAsyncReplicationResource",
+    },
+)
+
+
+class BulkInsertDiskResource(proto.Message):
+    r"""A transient resource used in compute.disks.bulkInsert and
+    compute.regionDisks.bulkInsert. It is only used to process
+    requests and is not persisted.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        source_consistency_group_policy (str):
+            The URL of the DiskConsistencyGroupPolicy for
+            the group of disks to clone. This may be a full
+            or partial URL, such as: -
+            https://www.googleapis.com/compute/v1/projects/project/regions/region
+            /resourcePolicies/resourcePolicy -
+            projects/project/regions/region/resourcePolicies/resourcePolicy
+            - regions/region/resourcePolicies/resourcePolicy
+
+            This field is a member of `oneof`_ ``_source_consistency_group_policy``.
+    """
+
+    source_consistency_group_policy: str = proto.Field(
+        proto.STRING,
+        number=19616093,
+        optional=True,
+    )
+
+
+class Disk(proto.Message):
+    r"""Represents a Persistent Disk resource. Google Compute Engine has two
+    Disk resources: \* `Zonal </compute/docs/reference/rest/v1/disks>`__
+    \* `Regional </compute/docs/reference/rest/v1/regionDisks>`__
+    Persistent disks are required for running your VM instances. Create
+    both boot and non-boot (data) persistent disks. For more
+    information, read Persistent Disks. For more storage options, read
+    Storage options. The disks resource represents a zonal persistent
+    disk. For more information, read Zonal persistent disks. The
+    regionDisks resource represents a regional persistent disk. For more
+    information, read Regional resources.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        architecture (str):
+            The architecture of the disk. Valid values are ARM64 or
+            X86_64. Check the Architecture enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_architecture``.
+        async_primary_disk (google.cloud.compute_v1.types.DiskAsyncReplication):
+            Disk asynchronously replicated into this
+            disk.
+
+            This field is a member of `oneof`_ ``_async_primary_disk``.
+        async_secondary_disks (MutableMapping[str, google.cloud.compute_v1.types.DiskAsyncReplicationList]):
+            [Output Only] A list of disks this disk is asynchronously
+            replicated to.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        disk_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            Encrypts the disk using a customer-supplied encryption key
+            or a customer-managed encryption key. Encryption keys do not
+            protect access to metadata of the disk. After you encrypt a
+            disk with a customer-supplied key, you must provide the same
+            key if you use the disk later. For example, to create a disk
+            snapshot, to create a disk image, to create a machine image,
+            or to attach the disk to a virtual machine. After you
+            encrypt a disk with a customer-managed key, the
+            diskEncryptionKey.kmsKeyName is set to a key *version* name
+            once the disk is created. The disk is encrypted with this
+            version of the key. In the response,
+            diskEncryptionKey.kmsKeyName appears in the following
+            format: "diskEncryptionKey.kmsKeyName":
+            "projects/kms_project_id/locations/region/keyRings/
+            key_region/cryptoKeys/key /cryptoKeysVersions/version If you
+            do not provide an encryption key when creating the disk,
+            then the disk is encrypted using an automatically generated
+            key and you don't need to provide a key to use the disk
+            later.
+
+            This field is a member of `oneof`_ ``_disk_encryption_key``.
+        guest_os_features (MutableSequence[google.cloud.compute_v1.types.GuestOsFeature]):
+            A list of features to enable on the guest
+            operating system. Applicable only for bootable
+            images. Read Enabling guest operating system
+            features to see a list of available options.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#disk for
+            disks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this disk, which is essentially a hash of the
+            labels set used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update labels. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change labels, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make a get() request to
+            retrieve a disk.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+            Labels to apply to this disk. These can be
+            later modified by the setLabels method.
+        last_attach_timestamp (str):
+            [Output Only] Last attach timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_last_attach_timestamp``.
+        last_detach_timestamp (str):
+            [Output Only] Last detach timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_last_detach_timestamp``.
+        license_codes (MutableSequence[int]):
+            Integer license codes indicating which
+            licenses are attached to this disk.
+        licenses (MutableSequence[str]):
+            A list of publicly visible licenses. Reserved
+            for Google's use.
+        location_hint (str):
+            An opaque location hint used to place the
+            disk close to other resources. This field is for
+            use by internal tools that use the public API.
+
+            This field is a member of `oneof`_ ``_location_hint``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        options (str):
+            Internal use only.
+
+            This field is a member of `oneof`_ ``_options``.
+        params (google.cloud.compute_v1.types.DiskParams):
+            Input only. [Input Only] Additional params passed with the
+            request, but not persisted as part of resource payload.
+
+            This field is a member of `oneof`_ ``_params``.
+        physical_block_size_bytes (int):
+            Physical block size of the persistent disk,
+            in bytes. If not present in a request, a default
+            value is used. The currently supported size is
+            4096, other sizes may be added in the future. If
+            an unsupported value is requested, the error
+            message will list the supported values for the
+            caller's project.
+
+            This field is a member of `oneof`_ ``_physical_block_size_bytes``.
+        provisioned_iops (int):
+            Indicates how many IOPS to provision for the
+            disk. This sets the number of I/O operations per
+            second that the disk can handle. Values must be
+            between 10,000 and 120,000. For more details,
+            see the Extreme persistent disk documentation.
+
+            This field is a member of `oneof`_ ``_provisioned_iops``.
+        provisioned_throughput (int):
+            Indicates how much throughput to provision
+            for the disk. This sets the number of throughput
+            mb per second that the disk can handle. Values
+            must be between 1 and 7,124.
+
+            This field is a member of `oneof`_ ``_provisioned_throughput``.
+        region (str):
+            [Output Only] URL of the region where the disk resides. Only
+            applicable for regional resources. You must specify this
+            field as part of the HTTP request URL. It is not settable as
+            a field in the request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        replica_zones (MutableSequence[str]):
+            URLs of the zones where the disk should be
+            replicated to. Only applicable for regional
+            resources.
+        resource_policies (MutableSequence[str]):
+            Resource policies applied to this disk for
+            automatic snapshot creations.
+        resource_status (google.cloud.compute_v1.types.DiskResourceStatus):
+            [Output Only] Status information for the disk resource.
+
+            This field is a member of `oneof`_ ``_resource_status``.
+        satisfies_pzs (bool):
+            [Output Only] Reserved for future use.
+
+            This field is a member of `oneof`_ ``_satisfies_pzs``.
+        self_link (str):
+            [Output Only] Server-defined fully-qualified URL for this
+            resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        size_gb (int):
+            Size, in GB, of the persistent disk. You can
+            specify this field when creating a persistent
+            disk using the sourceImage, sourceSnapshot, or
+            sourceDisk parameter, or specify it alone to
+            create an empty persistent disk. If you specify
+            this field along with a source, the value of
+            sizeGb must not be less than the size of the
+            source. Acceptable values are greater than 0.
+
+            This field is a member of `oneof`_ ``_size_gb``.
+        source_consistency_group_policy (str):
+            [Output Only] URL of the DiskConsistencyGroupPolicy for a
+            secondary disk that was created using a consistency group.
+
+            This field is a member of `oneof`_ ``_source_consistency_group_policy``.
+        source_consistency_group_policy_id (str):
+            [Output Only] ID of the DiskConsistencyGroupPolicy for a
+            secondary disk that was created using a consistency group.
+
+            This field is a member of `oneof`_ ``_source_consistency_group_policy_id``.
+        source_disk (str):
+            The source disk used to create this disk. You
+            can provide this as a partial or full URL to the
+            resource. For example, the following are valid
+            values: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /disks/disk -
+            https://www.googleapis.com/compute/v1/projects/project/regions/region
+            /disks/disk -
+            projects/project/zones/zone/disks/disk -
+            projects/project/regions/region/disks/disk -
+            zones/zone/disks/disk -
+            regions/region/disks/disk
+
+            This field is a member of `oneof`_ ``_source_disk``.
+        source_disk_id (str):
+            [Output Only] The unique ID of the disk used to create this
+            disk. This value identifies the exact disk that was used to
+            create this persistent disk. For example, if you created the
+            persistent disk from a disk that was later deleted and
+            recreated under the same name, the source disk ID would
+            identify the exact version of the disk that was used.
+
+            This field is a member of `oneof`_ ``_source_disk_id``.
+        source_image (str):
+            The source image used to create this disk. If
+            the source image is deleted, this field will not
+            be set. To create a disk with one of the public
+            operating system images, specify the image by
+            its family name. For example, specify
+            family/debian-9 to use the latest Debian 9
+            image:
+            projects/debian-cloud/global/images/family/debian-9
+            Alternatively, use a specific version of a
+            public operating system image:
+            projects/debian-cloud/global/images/debian-9-stretch-vYYYYMMDD
+            To create a disk with a custom image that you
+            created, specify the image name in the following
+            format: global/images/my-custom-image You can
+            also specify a custom image by its image family,
+            which returns the latest version of the image in
+            that family. Replace the image name with
+            family/family-name:
+            global/images/family/my-image-family
+
+            This field is a member of `oneof`_ ``_source_image``.
+        source_image_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source image. Required if the source image is
+            protected by a customer-supplied encryption key.
+
+            This field is a member of `oneof`_ ``_source_image_encryption_key``.
+        source_image_id (str):
+            [Output Only] The ID value of the image used to create this
+            disk. This value identifies the exact image that was used to
+            create this persistent disk. For example, if you created the
+            persistent disk from an image that was later deleted and
+            recreated under the same name, the source image ID would
+            identify the exact version of the image that was used.
+
+            This field is a member of `oneof`_ ``_source_image_id``.
+        source_snapshot (str):
+            The source snapshot used to create this disk.
+            You can provide this as a partial or full URL to
+            the resource. For example, the following are
+            valid values: -
+            https://www.googleapis.com/compute/v1/projects/project
+            /global/snapshots/snapshot -
+            projects/project/global/snapshots/snapshot -
+            global/snapshots/snapshot
+
+            This field is a member of `oneof`_ ``_source_snapshot``.
+        source_snapshot_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source snapshot. Required if the source snapshot
+            is protected by a customer-supplied encryption
+            key.
+
+            This field is a member of `oneof`_ ``_source_snapshot_encryption_key``.
+        source_snapshot_id (str):
+            [Output Only] The unique ID of the snapshot used to create
+            this disk. This value identifies the exact snapshot that was
+            used to create this persistent disk. For example, if you
+            created the persistent disk from a snapshot that was later
+            deleted and recreated under the same name, the source
+            snapshot ID would identify the exact version of the snapshot
+            that was used.
+
+            This field is a member of `oneof`_ ``_source_snapshot_id``.
+        source_storage_object (str):
+            The full Google Cloud Storage URI where the
+            disk image is stored. This file must be a
+            gzip-compressed tarball whose name ends in
+            .tar.gz or virtual machine disk whose name ends
+            in vmdk. Valid URIs may start with gs:// or
+            https://storage.googleapis.com/. This flag is
+            not optimized for creating multiple disks from a
+            source storage object. To create many disks from
+            a source storage object, use gcloud compute
+            images import instead.
+
+            This field is a member of `oneof`_ ``_source_storage_object``.
+        status (str):
+            [Output Only] The status of disk creation. - CREATING: Disk
+            is provisioning. - RESTORING: Source data is being copied
+            into the disk. - FAILED: Disk creation failed. - READY: Disk
+            is ready for use. - DELETING: Disk is deleting. Check the
+            Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        type_ (str):
+            URL of the disk type resource describing
+            which disk type to use to create the disk.
+            Provide this when creating the disk. For
+            example: projects/project
+            /zones/zone/diskTypes/pd-ssd . See Persistent
+            disk types.
+
+            This field is a member of `oneof`_ ``_type``.
+        users (MutableSequence[str]):
+            [Output Only] Links to the users of the disk (attached
+            instances) in form:
+            projects/project/zones/zone/instances/instance
+        zone (str):
+            [Output Only] URL of the zone where the disk resides. You
+            must specify this field as part of the HTTP request URL. It
+            is not settable as a field in the request body.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    class Architecture(proto.Enum):
+        r"""The architecture of the disk. Valid values are ARM64 or X86_64.
+
+        Values:
+            UNDEFINED_ARCHITECTURE (0):
+                A value indicating that the enum field is not
+                set.
+            ARCHITECTURE_UNSPECIFIED (394750507):
+                Default value indicating Architecture is not
+                set.
+            ARM64 (62547450):
+                Machines with architecture ARM64
+            X86_64 (425300551):
+                Machines with architecture X86_64
+        """
+        UNDEFINED_ARCHITECTURE = 0
+        ARCHITECTURE_UNSPECIFIED = 394750507
+        ARM64 = 62547450
+        X86_64 = 425300551
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of disk creation. - CREATING: Disk is
+        provisioning. - RESTORING: Source data is being copied into the
+        disk. - FAILED: Disk creation failed. - READY: Disk is ready for
+        use. - DELETING: Disk is deleting.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            CREATING (455564985):
+                Disk is provisioning
+            DELETING (528602024):
+                Disk is deleting.
+            FAILED (455706685):
+                Disk creation failed.
+            READY (77848963):
+                Disk is ready for use.
+            RESTORING (404263851):
+                Source data is being copied into the disk.
+        """
+        UNDEFINED_STATUS = 0
+        CREATING = 455564985
+        DELETING = 528602024
+        FAILED = 455706685
+        READY = 77848963
+        RESTORING = 404263851
+
+    architecture: str = proto.Field(
+        proto.STRING,
+        number=302803283,
+        optional=True,
+    )
+    async_primary_disk: "DiskAsyncReplication" = proto.Field(
+        proto.MESSAGE,
+        number=180517533,
+        optional=True,
+        message="DiskAsyncReplication",
+    )
+    async_secondary_disks: MutableMapping[
+        str, "DiskAsyncReplicationList"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=322925608,
+        message="DiskAsyncReplicationList",
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    disk_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = (
+        proto.Field(
+            proto.MESSAGE,
+            number=271660677,
+            optional=True,
+            message=shared_customer_encryption_key.CustomerEncryptionKey,
+        )
+    )
+    guest_os_features: MutableSequence[
+        shared_customer_encryption_key.GuestOsFeature
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=79294545,
+        message=shared_customer_encryption_key.GuestOsFeature,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    last_attach_timestamp: str = proto.Field(
+        proto.STRING,
+        number=42159653,
+        optional=True,
+    )
+    last_detach_timestamp: str = proto.Field(
+        proto.STRING,
+        number=56471027,
+        optional=True,
+    )
+    license_codes: MutableSequence[int] = proto.RepeatedField(
+        proto.INT64,
+        number=45482664,
+    )
+    licenses: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=337642578,
+    )
+    location_hint: str = proto.Field(
+        proto.STRING,
+        number=350519505,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    options: str = proto.Field(
+        proto.STRING,
+        number=361137822,
+        optional=True,
+    )
+    params: "DiskParams" = proto.Field(
+        proto.MESSAGE,
+        number=78313862,
+        optional=True,
+        message="DiskParams",
+    )
+    physical_block_size_bytes: int = proto.Field(
+        proto.INT64,
+        number=420007943,
+        optional=True,
+    )
+    provisioned_iops: int = proto.Field(
+        proto.INT64,
+        number=186769108,
+        optional=True,
+    )
+    provisioned_throughput: int = proto.Field(
+        proto.INT64,
+        number=526524181,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    replica_zones: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=48438272,
+    )
+    resource_policies: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=22220385,
+    )
+    resource_status: "DiskResourceStatus" = proto.Field(
+        proto.MESSAGE,
+        number=249429315,
+        optional=True,
+        message="DiskResourceStatus",
+    )
+    satisfies_pzs: bool = proto.Field(
+        proto.BOOL,
+        number=480964267,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    size_gb: int = proto.Field(
+        proto.INT64,
+        number=494929369,
+        optional=True,
+    )
+    source_consistency_group_policy: str = proto.Field(
+        proto.STRING,
+        number=19616093,
+        optional=True,
+    )
+    source_consistency_group_policy_id: str = proto.Field(
+        proto.STRING,
+        number=267568957,
+        optional=True,
+    )
+    source_disk: str = proto.Field(
+        proto.STRING,
+        number=451753793,
+        optional=True,
+    )
+    source_disk_id: str = proto.Field(
+        proto.STRING,
+        number=454190809,
+        optional=True,
+    )
+    source_image: str = proto.Field(
+        proto.STRING,
+        number=50443319,
+        optional=True,
+    )
+    source_image_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = proto.Field(
+        proto.MESSAGE,
+        number=381503659,
+        optional=True,
+        message=shared_customer_encryption_key.CustomerEncryptionKey,
+    )
+    source_image_id: str = proto.Field(
+        proto.STRING,
+        number=55328291,
+        optional=True,
+    )
+    source_snapshot: str = proto.Field(
+        proto.STRING,
+        number=126061928,
+        optional=True,
+    )
+    source_snapshot_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = proto.Field(
+        proto.MESSAGE,
+        number=303679322,
+        optional=True,
+        message=shared_customer_encryption_key.CustomerEncryptionKey,
+    )
+    source_snapshot_id: str = proto.Field(
+        proto.STRING,
+        number=98962258,
+        optional=True,
+    )
+    source_storage_object: str = proto.Field(
+        proto.STRING,
+        number=233052711,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+    users: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=111578632,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+        optional=True,
+    )
+
+
+class DiskAsyncReplication(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        consistency_group_policy (str):
+            [Output Only] URL of the DiskConsistencyGroupPolicy if
+            replication was started on the disk as a member of a group.
+
+            This field is a member of `oneof`_ ``_consistency_group_policy``.
+        consistency_group_policy_id (str):
+            [Output Only] ID of the DiskConsistencyGroupPolicy if
+            replication was started on the disk as a member of a group.
+
+            This field is a member of `oneof`_ ``_consistency_group_policy_id``.
+        disk (str):
+            The other disk asynchronously replicated to
+            or from the current disk. You can provide this
+            as a partial or full URL to the resource. For
+            example, the following are valid values: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /disks/disk -
+            projects/project/zones/zone/disks/disk -
+            zones/zone/disks/disk
+
+            This field is a member of `oneof`_ ``_disk``.
+        disk_id (str):
+            [Output Only] The unique ID of the other disk asynchronously
+            replicated to or from the current disk. This value
+            identifies the exact disk that was used to create this
+            replication. For example, if you started replicating the
+            persistent disk from a disk that was later deleted and
+            recreated under the same name, the disk ID would identify
+            the exact version of the disk that was used.
+
+            This field is a member of `oneof`_ ``_disk_id``.
+    """
+
+    consistency_group_policy: str = proto.Field(
+        proto.STRING,
+        number=1991097,
+        optional=True,
+    )
+    consistency_group_policy_id: str = proto.Field(
+        proto.STRING,
+        number=261065057,
+        optional=True,
+    )
+    disk: str = proto.Field(
+        proto.STRING,
+        number=3083677,
+        optional=True,
+    )
+    disk_id: str = proto.Field(
+        proto.STRING,
+        number=60990205,
+        optional=True,
+    )
+
+
+class DiskAsyncReplicationList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        async_replication_disk (google.cloud.compute_v1.types.DiskAsyncReplication):
+
+            This field is a member of `oneof`_ ``_async_replication_disk``.
+    """
+
+    async_replication_disk: "DiskAsyncReplication" = proto.Field(
+        proto.MESSAGE,
+        number=231794067,
+        optional=True,
+        message="DiskAsyncReplication",
+    )
+
+
+class DiskList(proto.Message):
+    r"""A list of Disk resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.Disk]):
+            A list of Disk resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#diskList for
+            lists of disks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["Disk"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="Disk",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class DiskParams(proto.Message):
+    r"""Additional disk params.
+
+    Attributes:
+        resource_manager_tags (MutableMapping[str, str]):
+            Resource manager tags to be bound to the disk. Tag keys and
+            values have the same definition as resource manager tags.
+            Keys must be in the format ``tagKeys/{tag_key_id}``, and
+            values are in the format ``tagValues/456``. The field is
+            ignored (both PUT & PATCH) when empty.
+    """
+
+    resource_manager_tags: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=377671164,
+    )
+
+
+class DiskResourceStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        async_primary_disk (google.cloud.compute_v1.types.DiskResourceStatusAsyncReplicationStatus):
+
+            This field is a member of `oneof`_ ``_async_primary_disk``.
+        async_secondary_disks (MutableMapping[str, google.cloud.compute_v1.types.DiskResourceStatusAsyncReplicationStatus]):
+            Key: disk, value: AsyncReplicationStatus
+            message
+    """
+
+    async_primary_disk: "DiskResourceStatusAsyncReplicationStatus" = proto.Field(
+        proto.MESSAGE,
+        number=180517533,
+        optional=True,
+        message="DiskResourceStatusAsyncReplicationStatus",
+    )
+    async_secondary_disks: MutableMapping[
+        str, "DiskResourceStatusAsyncReplicationStatus"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=322925608,
+        message="DiskResourceStatusAsyncReplicationStatus",
+    )
+
+
+class DiskResourceStatusAsyncReplicationStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        state (str):
+            Check the State enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_state``.
+    """
+
+    class State(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                Replication is active.
+            CREATED (135924424):
+                Secondary disk is created and is waiting for
+                replication to start.
+            STARTING (488820800):
+                Replication is starting.
+            STATE_UNSPECIFIED (470755401):
+                No description available.
+            STOPPED (444276141):
+                Replication is stopped.
+            STOPPING (350791796):
+                Replication is stopping.
+        """
+        UNDEFINED_STATE = 0
+        ACTIVE = 314733318
+        CREATED = 135924424
+        STARTING = 488820800
+        STATE_UNSPECIFIED = 470755401
+        STOPPED = 444276141
+        STOPPING = 350791796
+
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+
+
+class DisksStopGroupAsyncReplicationResource(proto.Message):
+    r"""A transient resource used in
+    compute.disks.stopGroupAsyncReplication and
+    compute.regionDisks.stopGroupAsyncReplication. It is only used
+    to process requests and is not persisted.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        resource_policy (str):
+            The URL of the DiskConsistencyGroupPolicy for
+            the group of disks to stop. This may be a full
+            or partial URL, such as: -
+            https://www.googleapis.com/compute/v1/projects/project/regions/region
+            /resourcePolicies/resourcePolicy -
+            projects/project/regions/region/resourcePolicies/resourcePolicy
+            - regions/region/resourcePolicies/resourcePolicy
+
+            This field is a member of `oneof`_ ``_resource_policy``.
+    """
+
+    resource_policy: str = proto.Field(
+        proto.STRING,
+        number=159240835,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "Expr",
+    },
+)
+
+
+class Expr(proto.Message):
+    r"""Represents a textual expression in the Common Expression Language
+    (CEL) syntax. CEL is a C-like expression language. The syntax and
+    semantics of CEL are documented at
+    https://github.com/google/cel-spec. Example (Comparison): title:
+    "Summary size limit" description: "Determines if a summary is less
+    than 100 chars" expression: "document.summary.size() < 100" Example
+    (Equality): title: "Requestor is owner" description: "Determines if
+    requestor is the document owner" expression: "document.owner ==
+    request.auth.claims.email" Example (Logic): title: "Public
+    documents" description: "Determine whether the document should be
+    publicly visible" expression: "document.type != 'private' &&
+    document.type != 'internal'" Example (Data Manipulation): title:
+    "Notification string" description: "Create a notification string
+    with a timestamp." expression: "'New message received at ' +
+    string(document.create_time)" The exact variables and functions that
+    may be referenced within an expression are determined by the service
+    that evaluates it. See the service documentation for additional
+    information.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        description (str):
+            Optional. Description of the expression. This
+            is a longer text which describes the expression,
+            e.g. when hovered over it in a UI.
+
+            This field is a member of `oneof`_ ``_description``.
+        expression (str):
+            Textual representation of an expression in
+            Common Expression Language syntax.
+
+            This field is a member of `oneof`_ ``_expression``.
+        location (str):
+            Optional. String indicating the location of
+            the expression for error reporting, e.g. a file
+            name and a position in the file.
+
+            This field is a member of `oneof`_ ``_location``.
+        title (str):
+            Optional. Title for the expression, i.e. a
+            short string describing its purpose. This can be
+            used e.g. in UIs which allow to enter the
+            expression.
+
+            This field is a member of `oneof`_ ``_title``.
+    """
+
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    expression: str = proto.Field(
+        proto.STRING,
+        number=352031384,
+        optional=True,
+    )
+    location: str = proto.Field(
+        proto.STRING,
+        number=290430901,
+        optional=True,
+    )
+    title: str = proto.Field(
+        proto.STRING,
+        number=110371416,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
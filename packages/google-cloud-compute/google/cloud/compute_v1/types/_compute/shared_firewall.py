@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "Allowed",
+        "Denied",
+        "Firewall",
+        "FirewallLogConfig",
+    },
+)
+
+
+class Allowed(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        I_p_protocol (str):
+            The IP protocol to which this rule applies.
+            The protocol type is required when creating a
+            firewall rule. This value can either be one of
+            the following well known protocol strings (tcp,
+            udp, icmp, esp, ah, ipip, sctp) or the IP
+            protocol number.
+
+            This field is a member of `oneof`_ ``_I_p_protocol``.
+        ports (MutableSequence[str]):
+            An optional list of ports to which this rule applies. This
+            field is only applicable for the UDP or TCP protocol. Each
+            entry must be either an integer or a range. If not
+            specified, this rule applies to connections through any
+            port. Example inputs include: ["22"], ["80","443"], and
+            ["12345-12349"].
+    """
+
+    I_p_protocol: str = proto.Field(
+        proto.STRING,
+        number=488094525,
+        optional=True,
+    )
+    ports: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=106854418,
+    )
+
+
+class Denied(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        I_p_protocol (str):
+            The IP protocol to which this rule applies.
+            The protocol type is required when creating a
+            firewall rule. This value can either be one of
+            the following well known protocol strings (tcp,
+            udp, icmp, esp, ah, ipip, sctp) or the IP
+            protocol number.
+
+            This field is a member of `oneof`_ ``_I_p_protocol``.
+        ports (MutableSequence[str]):
+            An optional list of ports to which this rule applies. This
+            field is only applicable for the UDP or TCP protocol. Each
+            entry must be either an integer or a range. If not
+            specified, this rule applies to connections through any
+            port. Example inputs include: ["22"], ["80","443"], and
+            ["12345-12349"].
+    """
+
+    I_p_protocol: str = proto.Field(
+        proto.STRING,
+        number=488094525,
+        optional=True,
+    )
+    ports: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=106854418,
+    )
+
+
+class Firewall(proto.Message):
+    r"""Represents a Firewall Rule resource. Firewall rules allow or
+    deny ingress traffic to, and egress traffic from your instances.
+    For more information, read Firewall rules.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        allowed (MutableSequence[google.cloud.compute_v1.types.Allowed]):
+            The list of ALLOW rules specified by this
+            firewall. Each rule specifies a protocol and
+            port-range tuple that describes a permitted
+            connection.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        denied (MutableSequence[google.cloud.compute_v1.types.Denied]):
+            The list of DENY rules specified by this
+            firewall. Each rule specifies a protocol and
+            port-range tuple that describes a denied
+            connection.
+        description (str):
+            An optional description of this resource.
+            Provide this field when you create the resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        destination_ranges (MutableSequence[str]):
+            If destination ranges are specified, the
+            firewall rule applies only to traffic that has
+            destination IP address in these ranges. These
+            ranges must be expressed in CIDR format. Both
+            IPv4 and IPv6 are supported.
+        direction (str):
+            Direction of traffic to which this firewall applies, either
+            ``INGRESS`` or ``EGRESS``. The default is ``INGRESS``. For
+            ``EGRESS`` traffic, you cannot specify the sourceTags
+            fields. Check the Direction enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_direction``.
+        disabled (bool):
+            Denotes whether the firewall rule is
+            disabled. When set to true, the firewall rule is
+            not enforced and the network behaves as if it
+            did not exist. If this is unspecified, the
+            firewall rule will be enabled.
+
+            This field is a member of `oneof`_ ``_disabled``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#firewall
+            for firewall rules.
+
+            This field is a member of `oneof`_ ``_kind``.
+        log_config (google.cloud.compute_v1.types.FirewallLogConfig):
+            This field denotes the logging options for a
+            particular firewall rule. If logging is enabled,
+            logs will be exported to Cloud Logging.
+
+            This field is a member of `oneof`_ ``_log_config``.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?``. The first character must be
+            a lowercase letter, and all following characters (except for
+            the last character) must be a dash, lowercase letter, or
+            digit. The last character must be a lowercase letter or
+            digit.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            URL of the network resource for this firewall
+            rule. If not specified when creating a firewall
+            rule, the default network is used:
+            global/networks/default If you choose to specify
+            this field, you can specify the network as a
+            full or partial URL. For example, the following
+            are all valid URLs: -
+            https://www.googleapis.com/compute/v1/projects/myproject/global/networks/my-network
+            - projects/myproject/global/networks/my-network
+            - global/networks/default
+
+            This field is a member of `oneof`_ ``_network``.
+        priority (int):
+            Priority for this rule. This is an integer between ``0`` and
+            ``65535``, both inclusive. The default value is ``1000``.
+            Relative priorities determine which rule takes effect if
+            multiple rules apply. Lower values indicate higher priority.
+            For example, a rule with priority ``0`` has higher
+            precedence than a rule with priority ``1``. DENY rules take
+            precedence over ALLOW rules if they have equal priority.
+            Note that VPC networks have implied rules with a priority of
+            ``65535``. To avoid conflicts with the implied rules, use a
+            priority number less than ``65535``.
+
+            This field is a member of `oneof`_ ``_priority``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        source_ranges (MutableSequence[str]):
+            If source ranges are specified, the firewall
+            rule applies only to traffic that has a source
+            IP address in these ranges. These ranges must be
+            expressed in CIDR format. One or both of
+            sourceRanges and sourceTags may be set. If both
+            fields are set, the rule applies to traffic that
+            has a source IP address within sourceRanges OR a
+            source IP from a resource with a matching tag
+            listed in the sourceTags field. The connection
+            does not need to match both fields for the rule
+            to apply. Both IPv4 and IPv6 are supported.
+        source_service_accounts (MutableSequence[str]):
+            If source service accounts are specified, the
+            firewall rules apply only to traffic originating
+            from an instance with a service account in this
+            list. Source service accounts cannot be used to
+            control traffic to an instance's external IP
+            address because service accounts are associated
+            with an instance, not an IP address.
+            sourceRanges can be set at the same time as
+            sourceServiceAccounts. If both are set, the
+            firewall applies to traffic that has a source IP
+            address within the sourceRanges OR a source IP
+            that belongs to an instance with service account
+            listed in sourceServiceAccount. The connection
+            does not need to match both fields for the
+            firewall to apply. sourceServiceAccounts cannot
+            be used at the same time as sourceTags or
+            targetTags.
+        source_tags (MutableSequence[str]):
+            If source tags are specified, the firewall
+            rule applies only to traffic with source IPs
+            that match the primary network interfaces of VM
+            instances that have the tag and are in the same
+            VPC network. Source tags cannot be used to
+            control traffic to an instance's external IP
+            address, it only applies to traffic between
+            instances in the same virtual network. Because
+            tags are associated with instances, not IP
+            addresses. One or both of sourceRanges and
+            sourceTags may be set. If both fields are set,
+            the firewall applies to traffic that has a
+            source IP address within sourceRanges OR a
+            source IP from a resource with a matching tag
+            listed in the sourceTags field. The connection
+            does not need to match both fields for the
+            firewall to apply.
+        target_service_accounts (MutableSequence[str]):
+            A list of service accounts indicating sets of instances
+            located in the network that may make network connections as
+            specified in allowed[]. targetServiceAccounts cannot be used
+            at the same time as targetTags or sourceTags. If neither
+            targetServiceAccounts nor targetTags are specified, the
+            firewall rule applies to all instances on the specified
+            network.
+        target_tags (MutableSequence[str]):
+            A list of tags that controls which instances
+            the firewall rule applies to. If targetTags are
+            specified, then the firewall rule applies only
+            to instances in the VPC network that have one of
+            those tags. If no targetTags are specified, the
+            firewall rule applies to all instances on the
+            specified network.
+    """
+
+    class Direction(proto.Enum):
+        r"""Direction of traffic to which this firewall applies, either
+        ``INGRESS`` or ``EGRESS``. The default is ``INGRESS``. For
+        ``EGRESS`` traffic, you cannot specify the sourceTags fields.
+
+        Values:
+            UNDEFINED_DIRECTION (0):
+                A value indicating that the enum field is not
+                set.
+            EGRESS (432880501):
+                Indicates that firewall should apply to
+                outgoing traffic.
+            INGRESS (516931221):
+                Indicates that firewall should apply to
+                incoming traffic.
+        """
+        UNDEFINED_DIRECTION = 0
+        EGRESS = 432880501
+        INGRESS = 516931221
+
+    allowed: MutableSequence["Allowed"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=162398632,
+        message="Allowed",
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    denied: MutableSequence["Denied"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=275217307,
+        message="Denied",
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    destination_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=305699879,
+    )
+    direction: str = proto.Field(
+        proto.STRING,
+        number=111150975,
+        optional=True,
+    )
+    disabled: bool = proto.Field(
+        proto.BOOL,
+        number=270940796,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    log_config: "FirewallLogConfig" = proto.Field(
+        proto.MESSAGE,
+        number=351299741,
+        optional=True,
+        message="FirewallLogConfig",
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    priority: int = proto.Field(
+        proto.INT32,
+        number=445151652,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    source_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=200097658,
+    )
+    source_service_accounts: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=105100756,
+    )
+    source_tags: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=452222397,
+    )
+    target_service_accounts: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=457639710,
+    )
+    target_tags: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=62901767,
+    )
+
+
+class FirewallLogConfig(proto.Message):
+    r"""The available logging options for a firewall rule.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enable (bool):
+            This field denotes whether to enable logging
+            for a particular firewall rule.
+
+            This field is a member of `oneof`_ ``_enable``.
+        metadata (str):
+            This field can only be specified for a
+            particular firewall rule if logging is enabled
+            for that rule. This field denotes whether to
+            include or exclude metadata for firewall logs.
+            Check the Metadata enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_metadata``.
+    """
+
+    class Metadata(proto.Enum):
+        r"""This field can only be specified for a particular firewall
+        rule if logging is enabled for that rule. This field denotes
+        whether to include or exclude metadata for firewall logs.
+
+        Values:
+            UNDEFINED_METADATA (0):
+                A value indicating that the enum field is not
+                set.
+            EXCLUDE_ALL_METADATA (334519954):
+                No description available.
+            INCLUDE_ALL_METADATA (164619908):
+                No description available.
+        """
+        UNDEFINED_METADATA = 0
+        EXCLUDE_ALL_METADATA = 334519954
+        INCLUDE_ALL_METADATA = 164619908
+
+    enable: bool = proto.Field(
+        proto.BOOL,
+        number=311764355,
+        optional=True,
+    )
+    metadata: str = proto.Field(
+        proto.STRING,
+        number=86866735,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_firewall_policy_rule
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "FirewallPolicy",
+        "FirewallPolicyAssociation",
+        "FirewallPolicyList",
+    },
+)
+
+
+class FirewallPolicy(proto.Message):
+    r"""Represents a Firewall Policy resource.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        associations (MutableSequence[google.cloud.compute_v1.types.FirewallPolicyAssociation]):
+            A list of associations that belong to this
+            firewall policy.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        display_name (str):
+            Deprecated, please use short name instead. User-provided
+            name of the Organization firewall policy. The name should be
+            unique in the organization in which the firewall policy is
+            created. This field is not applicable to network firewall
+            policies. This name must be set on creation and cannot be
+            changed. The name must be 1-63 characters long, and comply
+            with RFC1035. Specifically, the name must be 1-63 characters
+            long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_display_name``.
+        fingerprint (str):
+            Specifies a fingerprint for this resource,
+            which is essentially a hash of the metadata's
+            contents and used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update metadata. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change metadata, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make get() request to the
+            firewall policy.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#firewallPolicyfor firewall policies
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. For Organization Firewall Policies
+            it's a [Output Only] numeric ID allocated by Google Cloud
+            which uniquely identifies the Organization Firewall Policy.
+
+            This field is a member of `oneof`_ ``_name``.
+        parent (str):
+            [Output Only] The parent of the firewall policy. This field
+            is not applicable to network firewall policies.
+
+            This field is a member of `oneof`_ ``_parent``.
+        region (str):
+            [Output Only] URL of the region where the regional firewall
+            policy resides. This field is not applicable to global
+            firewall policies. You must specify this field as part of
+            the HTTP request URL. It is not settable as a field in the
+            request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        rule_tuple_count (int):
+            [Output Only] Total count of all firewall policy rule
+            tuples. A firewall policy can not exceed a set number of
+            tuples.
+
+            This field is a member of `oneof`_ ``_rule_tuple_count``.
+        rules (MutableSequence[google.cloud.compute_v1.types.FirewallPolicyRule]):
+            A list of rules that belong to this policy. There must
+            always be a default rule (rule with priority 2147483647 and
+            match "*"). If no rules are provided when creating a
+            firewall policy, a default rule with action "allow" will be
+            added.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        self_link_with_id (str):
+            [Output Only] Server-defined URL for this resource with the
+            resource id.
+
+            This field is a member of `oneof`_ ``_self_link_with_id``.
+        short_name (str):
+            User-provided name of the Organization firewall policy. The
+            name should be unique in the organization in which the
+            firewall policy is created. This field is not applicable to
+            network firewall policies. This name must be set on creation
+            and cannot be changed. The name must be 1-63 characters
+            long, and comply with RFC1035. Specifically, the name must
+            be 1-63 characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_short_name``.
+    """
+
+    associations: MutableSequence["FirewallPolicyAssociation"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=508736530,
+        message="FirewallPolicyAssociation",
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    display_name: str = proto.Field(
+        proto.STRING,
+        number=4473832,
+        optional=True,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    parent: str = proto.Field(
+        proto.STRING,
+        number=78317738,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    rule_tuple_count: int = proto.Field(
+        proto.INT32,
+        number=388342037,
+        optional=True,
+    )
+    rules: MutableSequence[
+        shared_firewall_policy_rule.FirewallPolicyRule
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=108873975,
+        message=shared_firewall_policy_rule.FirewallPolicyRule,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    self_link_with_id: str = proto.Field(
+        proto.STRING,
+        number=44520962,
+        optional=True,
+    )
+    short_name: str = proto.Field(
+        proto.STRING,
+        number=492051566,
+        optional=True,
+    )
+
+
+class FirewallPolicyAssociation(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        attachment_target (str):
+            The target that the firewall policy is
+            attached to.
+
+            This field is a member of `oneof`_ ``_attachment_target``.
+        display_name (str):
+            [Output Only] Deprecated, please use short name instead. The
+            display name of the firewall policy of the association.
+
+            This field is a member of `oneof`_ ``_display_name``.
+        firewall_policy_id (str):
+            [Output Only] The firewall policy ID of the association.
+
+            This field is a member of `oneof`_ ``_firewall_policy_id``.
+        name (str):
+            The name for an association.
+
+            This field is a member of `oneof`_ ``_name``.
+        short_name (str):
+            [Output Only] The short name of the firewall policy of the
+            association.
+
+            This field is a member of `oneof`_ ``_short_name``.
+    """
+
+    attachment_target: str = proto.Field(
+        proto.STRING,
+        number=175773741,
+        optional=True,
+    )
+    display_name: str = proto.Field(
+        proto.STRING,
+        number=4473832,
+        optional=True,
+    )
+    firewall_policy_id: str = proto.Field(
+        proto.STRING,
+        number=357211849,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    short_name: str = proto.Field(
+        proto.STRING,
+        number=492051566,
+        optional=True,
+    )
+
+
+class FirewallPolicyList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.FirewallPolicy]):
+            A list of FirewallPolicy resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#firewallPolicyList for listsof FirewallPolicies
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["FirewallPolicy"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="FirewallPolicy",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "FirewallPolicyRule",
+        "FirewallPolicyRuleMatcher",
+        "FirewallPolicyRuleMatcherLayer4Config",
+        "FirewallPolicyRuleSecureTag",
+    },
+)
+
+
+class FirewallPolicyRule(proto.Message):
+    r"""Represents a rule that describes one or more match conditions
+    along with the action to be taken when traffic matches this
+    condition (allow or deny).
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        action (str):
+            The Action to perform when the client connection triggers
+            the rule. Valid actions are "allow", "deny" and "goto_next".
+
+            This field is a member of `oneof`_ ``_action``.
+        description (str):
+            An optional description for this resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        direction (str):
+            The direction in which this rule applies.
+            Check the Direction enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_direction``.
+        disabled (bool):
+            Denotes whether the firewall policy rule is
+            disabled. When set to true, the firewall policy
+            rule is not enforced and traffic behaves as if
+            it did not exist. If this is unspecified, the
+            firewall policy rule will be enabled.
+
+            This field is a member of `oneof`_ ``_disabled``.
+        enable_logging (bool):
+            Denotes whether to enable logging for a particular rule. If
+            logging is enabled, logs will be exported to the configured
+            export destination in Stackdriver. Logs may be exported to
+            BigQuery or Pub/Sub. Note: you cannot enable logging on
+            "goto_next" rules.
+
+            This field is a member of `oneof`_ ``_enable_logging``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#firewallPolicyRule for firewall policy rules
+
+            This field is a member of `oneof`_ ``_kind``.
+        match (google.cloud.compute_v1.types.FirewallPolicyRuleMatcher):
+            A match condition that incoming traffic is
+            evaluated against. If it evaluates to true, the
+            corresponding 'action' is enforced.
+
+            This field is a member of `oneof`_ ``_match``.
+        priority (int):
+            An integer indicating the priority of a rule
+            in the list. The priority must be a positive
+            value between 0 and 2147483647. Rules are
+            evaluated from highest to lowest priority where
+            0 is the highest priority and 2147483647 is the
+            lowest prority.
+
+            This field is a member of `oneof`_ ``_priority``.
+        rule_name (str):
+            An optional name for the rule. This field is
+            not a unique identifier and can be updated.
+
+            This field is a member of `oneof`_ ``_rule_name``.
+        rule_tuple_count (int):
+            [Output Only] Calculation of the complexity of a single
+            firewall policy rule.
+
+            This field is a member of `oneof`_ ``_rule_tuple_count``.
+        target_resources (MutableSequence[str]):
+            A list of network resource URLs to which this
+            rule applies. This field allows you to control
+            which network's VMs get this rule. If this field
+            is left blank, all VMs within the organization
+            will receive the rule.
+        target_secure_tags (MutableSequence[google.cloud.compute_v1.types.FirewallPolicyRuleSecureTag]):
+            A list of secure tags that controls which instances the
+            firewall rule applies to. If targetSecureTag are specified,
+            then the firewall rule applies only to instances in the VPC
+            network that have one of those EFFECTIVE secure tags, if all
+            the target_secure_tag are in INEFFECTIVE state, then this
+            rule will be ignored. targetSecureTag may not be set at the
+            same time as targetServiceAccounts. If neither
+            targetServiceAccounts nor targetSecureTag are specified, the
+            firewall rule applies to all instances on the specified
+            network. Maximum number of target label tags allowed is 256.
+        target_service_accounts (MutableSequence[str]):
+            A list of service accounts indicating the
+            sets of instances that are applied with this
+            rule.
+    """
+
+    class Direction(proto.Enum):
+        r"""The direction in which this rule applies.
+
+        Values:
+            UNDEFINED_DIRECTION (0):
+                A value indicating that the enum field is not
+                set.
+            EGRESS (432880501):
+                No description available.
+            INGRESS (516931221):
+                No description available.
+        """
+        UNDEFINED_DIRECTION = 0
+        EGRESS = 432880501
+        INGRESS = 516931221
+
+    action: str = proto.Field(
+        proto.STRING,
+        number=187661878,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    direction: str = proto.Field(
+        proto.STRING,
+        number=111150975,
+        optional=True,
+    )
+    disabled: bool = proto.Field(
+        proto.BOOL,
+        number=270940796,
+        optional=True,
+    )
+    enable_logging: bool = proto.Field(
+        proto.BOOL,
+        number=295396515,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    match: "FirewallPolicyRuleMatcher" = proto.Field(
+        proto.MESSAGE,
+        number=103668165,
+        optional=True,
+        message="FirewallPolicyRuleMatcher",
+    )
+    priority: int = proto.Field(
+        proto.INT32,
+        number=445151652,
+        optional=True,
+    )
+    rule_name: str = proto.Field(
+        proto.STRING,
+        number=55286254,
+        optional=True,
+    )
+    rule_tuple_count: int = proto.Field(
+        proto.INT32,
+        number=388342037,
+        optional=True,
+    )
+    target_resources: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=528230647,
+    )
+    target_secure_tags: MutableSequence[
+        "FirewallPolicyRuleSecureTag"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=468132403,
+        message="FirewallPolicyRuleSecureTag",
+    )
+    target_service_accounts: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=457639710,
+    )
+
+
+class FirewallPolicyRuleMatcher(proto.Message):
+    r"""Represents a match condition that incoming traffic is
+    evaluated against. Exactly one field must be specified.
+
+    Attributes:
+        dest_address_groups (MutableSequence[str]):
+            Address groups which should be matched
+            against the traffic destination. Maximum number
+            of destination address groups is 10.
+        dest_fqdns (MutableSequence[str]):
+            Fully Qualified Domain Name (FQDN) which
+            should be matched against traffic destination.
+            Maximum number of destination fqdn allowed is
+            100.
+        dest_ip_ranges (MutableSequence[str]):
+            CIDR IP address range. Maximum number of
+            destination CIDR IP ranges allowed is 5000.
+        dest_region_codes (MutableSequence[str]):
+            Region codes whose IP addresses will be used
+            to match for destination of traffic. Should be
+            specified as 2 letter country code defined as
+            per ISO 3166 alpha-2 country codes. ex."US"
+            Maximum number of dest region codes allowed is
+            5000.
+        dest_threat_intelligences (MutableSequence[str]):
+            Names of Network Threat Intelligence lists.
+            The IPs in these lists will be matched against
+            traffic destination.
+        layer4_configs (MutableSequence[google.cloud.compute_v1.types.FirewallPolicyRuleMatcherLayer4Config]):
+            Pairs of IP protocols and ports that the rule
+            should match.
+        src_address_groups (MutableSequence[str]):
+            Address groups which should be matched
+            against the traffic source. Maximum number of
+            source address groups is 10.
+        src_fqdns (MutableSequence[str]):
+            Fully Qualified Domain Name (FQDN) which
+            should be matched against traffic source.
+            Maximum number of source fqdn allowed is 100.
+        src_ip_ranges (MutableSequence[str]):
+            CIDR IP address range. Maximum number of
+            source CIDR IP ranges allowed is 5000.
+        src_region_codes (MutableSequence[str]):
+            Region codes whose IP addresses will be used
+            to match for source of traffic. Should be
+            specified as 2 letter country code defined as
+            per ISO 3166 alpha-2 country codes. ex."US"
+            Maximum number of source region codes allowed is
+            5000.
+        src_secure_tags (MutableSequence[google.cloud.compute_v1.types.FirewallPolicyRuleSecureTag]):
+            List of secure tag values, which should be
+            matched at the source of the traffic. For
+            INGRESS rule, if all the srcSecureTag are
+            INEFFECTIVE, and there is no srcIpRange, this
+            rule will be ignored. Maximum number of source
+            tag values allowed is 256.
+        src_threat_intelligences (MutableSequence[str]):
+            Names of Network Threat Intelligence lists.
+            The IPs in these lists will be matched against
+            traffic source.
+    """
+
+    dest_address_groups: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=468760508,
+    )
+    dest_fqdns: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=370712737,
+    )
+    dest_ip_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=337357713,
+    )
+    dest_region_codes: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=199120280,
+    )
+    dest_threat_intelligences: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=119896492,
+    )
+    layer4_configs: MutableSequence[
+        "FirewallPolicyRuleMatcherLayer4Config"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=373534261,
+        message="FirewallPolicyRuleMatcherLayer4Config",
+    )
+    src_address_groups: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=436423738,
+    )
+    src_fqdns: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=435906147,
+    )
+    src_ip_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=432128083,
+    )
+    src_region_codes: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=99086742,
+    )
+    src_secure_tags: MutableSequence[
+        "FirewallPolicyRuleSecureTag"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=508791302,
+        message="FirewallPolicyRuleSecureTag",
+    )
+    src_threat_intelligences: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=323631018,
+    )
+
+
+class FirewallPolicyRuleMatcherLayer4Config(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ip_protocol (str):
+            The IP protocol to which this rule applies.
+            The protocol type is required when creating a
+            firewall rule. This value can either be one of
+            the following well known protocol strings (tcp,
+            udp, icmp, esp, ah, ipip, sctp), or the IP
+            protocol number.
+
+            This field is a member of `oneof`_ ``_ip_protocol``.
+        ports (MutableSequence[str]):
+            An optional list of ports to which this rule applies. This
+            field is only applicable for UDP or TCP protocol. Each entry
+            must be either an integer or a range. If not specified, this
+            rule applies to connections through any port. Example inputs
+            include: ["22"], ["80","443"], and ["12345-12349"].
+    """
+
+    ip_protocol: str = proto.Field(
+        proto.STRING,
+        number=475958960,
+        optional=True,
+    )
+    ports: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=106854418,
+    )
+
+
+class FirewallPolicyRuleSecureTag(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            Name of the secure tag, created with
+            TagManager's TagValue API.
+
+            This field is a member of `oneof`_ ``_name``.
+        state (str):
+            [Output Only] State of the secure tag, either ``EFFECTIVE``
+            or ``INEFFECTIVE``. A secure tag is ``INEFFECTIVE`` when it
+            is deleted or its network is deleted. Check the State enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+    """
+
+    class State(proto.Enum):
+        r"""[Output Only] State of the secure tag, either ``EFFECTIVE`` or
+        ``INEFFECTIVE``. A secure tag is ``INEFFECTIVE`` when it is deleted
+        or its network is deleted.
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            EFFECTIVE (244201863):
+                No description available.
+            INEFFECTIVE (304458242):
+                No description available.
+        """
+        UNDEFINED_STATE = 0
+        EFFECTIVE = 244201863
+        INEFFECTIVE = 304458242
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,866 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_metadata_filter
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "ForwardingRule",
+        "ForwardingRuleList",
+        "ForwardingRuleServiceDirectoryRegistration",
+    },
+)
+
+
+class ForwardingRule(proto.Message):
+    r"""Represents a Forwarding Rule resource. Forwarding rule resources in
+    Google Cloud can be either regional or global in scope: \*
+    `Global <https://cloud.google.com/compute/docs/reference/rest/v1/globalForwardingRules>`__
+    \*
+    `Regional <https://cloud.google.com/compute/docs/reference/rest/v1/forwardingRules>`__
+    A forwarding rule and its corresponding IP address represent the
+    frontend configuration of a Google Cloud Platform load balancer.
+    Forwarding rules can also reference target instances and Cloud VPN
+    Classic gateways (targetVpnGateway). For more information, read
+    Forwarding rule concepts and Using protocol forwarding.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        I_p_address (str):
+            IP address for which this forwarding rule accepts traffic.
+            When a client sends traffic to this IP address, the
+            forwarding rule directs the traffic to the referenced target
+            or backendService. While creating a forwarding rule,
+            specifying an IPAddress is required under the following
+            circumstances: - When the target is set to targetGrpcProxy
+            and validateForProxyless is set to true, the IPAddress
+            should be set to 0.0.0.0. - When the target is a Private
+            Service Connect Google APIs bundle, you must specify an
+            IPAddress. Otherwise, you can optionally specify an IP
+            address that references an existing static (reserved) IP
+            address resource. When omitted, Google Cloud assigns an
+            ephemeral IP address. Use one of the following formats to
+            specify an IP address while creating a forwarding rule: \*
+            IP address number, as in ``100.1.2.3`` \* IPv6 address
+            range, as in ``2600:1234::/96`` \* Full resource URL, as in
+            https://www.googleapis.com/compute/v1/projects/
+            project_id/regions/region/addresses/address-name \* Partial
+            URL or by name, as in: -
+            projects/project_id/regions/region/addresses/address-name -
+            regions/region/addresses/address-name -
+            global/addresses/address-name - address-name The forwarding
+            rule's target or backendService, and in most cases, also the
+            loadBalancingScheme, determine the type of IP address that
+            you can use. For detailed information, see `IP address
+            specifications <https://cloud.google.com/load-balancing/docs/forwarding-rule-concepts#ip_address_specifications>`__.
+            When reading an IPAddress, the API always returns the IP
+            address number.
+
+            This field is a member of `oneof`_ ``_I_p_address``.
+        I_p_protocol (str):
+            The IP protocol to which this rule applies. For protocol
+            forwarding, valid options are TCP, UDP, ESP, AH, SCTP, ICMP
+            and L3_DEFAULT. The valid IP protocols are different for
+            different load balancing products as described in `Load
+            balancing
+            features <https://cloud.google.com/load-balancing/docs/features#protocols_from_the_load_balancer_to_the_backends>`__.
+            Check the IPProtocolEnum enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_I_p_protocol``.
+        all_ports (bool):
+            The ports, portRange, and allPorts fields are mutually
+            exclusive. Only packets addressed to ports in the specified
+            range will be forwarded to the backends configured with this
+            forwarding rule. The allPorts field has the following
+            limitations: - It requires that the forwarding rule
+            IPProtocol be TCP, UDP, SCTP, or L3_DEFAULT. - It's
+            applicable only to the following products: internal
+            passthrough Network Load Balancers, backend service-based
+            external passthrough Network Load Balancers, and internal
+            and external protocol forwarding. - Set this field to true
+            to allow packets addressed to any port or packets lacking
+            destination port information (for example, UDP fragments
+            after the first fragment) to be forwarded to the backends
+            configured with this forwarding rule. The L3_DEFAULT
+            protocol requires allPorts be set to true.
+
+            This field is a member of `oneof`_ ``_all_ports``.
+        allow_global_access (bool):
+            This field is used along with the backend_service field for
+            internal load balancing or with the target field for
+            internal TargetInstance. If set to true, clients can access
+            the Internal TCP/UDP Load Balancer, Internal HTTP(S) and TCP
+            Proxy Load Balancer from all regions. If false, only allows
+            access from the local region the load balancer is located
+            at. Note that for INTERNAL_MANAGED forwarding rules, this
+            field cannot be changed after the forwarding rule is
+            created.
+
+            This field is a member of `oneof`_ ``_allow_global_access``.
+        allow_psc_global_access (bool):
+            This is used in PSC consumer ForwardingRule
+            to control whether the PSC endpoint can be
+            accessed from another region.
+
+            This field is a member of `oneof`_ ``_allow_psc_global_access``.
+        backend_service (str):
+            Identifies the backend service to which the
+            forwarding rule sends traffic. Required for
+            Internal TCP/UDP Load Balancing and Network Load
+            Balancing; must be omitted for all other load
+            balancer types.
+
+            This field is a member of `oneof`_ ``_backend_service``.
+        base_forwarding_rule (str):
+            [Output Only] The URL for the corresponding base Forwarding
+            Rule. By base Forwarding Rule, we mean the Forwarding Rule
+            that has the same IP address, protocol, and port settings
+            with the current Forwarding Rule, but without sourceIPRanges
+            specified. Always empty if the current Forwarding Rule does
+            not have sourceIPRanges specified.
+
+            This field is a member of `oneof`_ ``_base_forwarding_rule``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a ForwardingRule. Include
+            the fingerprint in patch request to ensure that
+            you do not overwrite changes that were applied
+            from another concurrent request. To see the
+            latest fingerprint, make a get() request to
+            retrieve a ForwardingRule.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        ip_version (str):
+            The IP Version that will be used by this
+            forwarding rule. Valid options are IPV4 or IPV6.
+            Check the IpVersion enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_ip_version``.
+        is_mirroring_collector (bool):
+            Indicates whether or not this load balancer
+            can be used as a collector for packet mirroring.
+            To prevent mirroring loops, instances behind
+            this load balancer will not have their traffic
+            mirrored even if a PacketMirroring rule applies
+            to them. This can only be set to true for load
+            balancers that have their loadBalancingScheme
+            set to INTERNAL.
+
+            This field is a member of `oneof`_ ``_is_mirroring_collector``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#forwardingRule for Forwarding Rule resources.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this resource, which is essentially a hash of
+            the labels set used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update labels. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change labels, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make a get() request to
+            retrieve a ForwardingRule.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+            Labels for this resource. These can only be
+            added or modified by the setLabels method. Each
+            label key/value pair must comply with RFC1035.
+            Label values may be empty.
+        load_balancing_scheme (str):
+            Specifies the forwarding rule type. For more
+            information about forwarding rules, refer to
+            Forwarding rule concepts. Check the
+            LoadBalancingScheme enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_load_balancing_scheme``.
+        metadata_filters (MutableSequence[google.cloud.compute_v1.types.MetadataFilter]):
+            Opaque filter criteria used by load balancer to restrict
+            routing configuration to a limited set of xDS compliant
+            clients. In their xDS requests to load balancer, xDS clients
+            present node metadata. When there is a match, the relevant
+            configuration is made available to those proxies. Otherwise,
+            all the resources (e.g. TargetHttpProxy, UrlMap) referenced
+            by the ForwardingRule are not visible to those proxies. For
+            each metadataFilter in this list, if its filterMatchCriteria
+            is set to MATCH_ANY, at least one of the filterLabels must
+            match the corresponding label provided in the metadata. If
+            its filterMatchCriteria is set to MATCH_ALL, then all of its
+            filterLabels must match with corresponding labels provided
+            in the metadata. If multiple metadataFilters are specified,
+            all of them need to be satisfied in order to be considered a
+            match. metadataFilters specified here will be applifed
+            before those specified in the UrlMap that this
+            ForwardingRule references. metadataFilters only applies to
+            Loadbalancers that have their loadBalancingScheme set to
+            INTERNAL_SELF_MANAGED.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash. For
+            Private Service Connect forwarding rules that forward
+            traffic to Google APIs, the forwarding rule name must be a
+            1-20 characters string with lowercase letters and numbers
+            and must start with a letter.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            This field is not used for global external
+            load balancing. For Internal TCP/UDP Load
+            Balancing, this field identifies the network
+            that the load balanced IP should belong to for
+            this Forwarding Rule. If the subnetwork is
+            specified, the network of the subnetwork will be
+            used. If neither subnetwork nor this field is
+            specified, the default network will be used. For
+            Private Service Connect forwarding rules that
+            forward traffic to Google APIs, a network must
+            be provided.
+
+            This field is a member of `oneof`_ ``_network``.
+        network_tier (str):
+            This signifies the networking tier used for
+            configuring this load balancer and can only take
+            the following values: PREMIUM, STANDARD. For
+            regional ForwardingRule, the valid values are
+            PREMIUM and STANDARD. For GlobalForwardingRule,
+            the valid value is PREMIUM. If this field is not
+            specified, it is assumed to be PREMIUM. If
+            IPAddress is specified, this value must be equal
+            to the networkTier of the Address. Check the
+            NetworkTier enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_network_tier``.
+        no_automate_dns_zone (bool):
+            This is used in PSC consumer ForwardingRule
+            to control whether it should try to
+            auto-generate a DNS zone or not. Non-PSC
+            forwarding rules do not use this field. Once
+            set, this field is not mutable.
+
+            This field is a member of `oneof`_ ``_no_automate_dns_zone``.
+        port_range (str):
+            The ports, portRange, and allPorts fields are mutually
+            exclusive. Only packets addressed to ports in the specified
+            range will be forwarded to the backends configured with this
+            forwarding rule. The portRange field has the following
+            limitations: - It requires that the forwarding rule
+            IPProtocol be TCP, UDP, or SCTP, and - It's applicable only
+            to the following products: external passthrough Network Load
+            Balancers, internal and external proxy Network Load
+            Balancers, internal and external Application Load Balancers,
+            external protocol forwarding, and Classic VPN. - Some
+            products have restrictions on what ports can be used. See
+            port specifications for details. For external forwarding
+            rules, two or more forwarding rules cannot use the same
+            [IPAddress, IPProtocol] pair, and cannot have overlapping
+            portRanges. For internal forwarding rules within the same
+            VPC network, two or more forwarding rules cannot use the
+            same [IPAddress, IPProtocol] pair, and cannot have
+            overlapping portRanges. @pattern: \\d+(?:-\d+)?
+
+            This field is a member of `oneof`_ ``_port_range``.
+        ports (MutableSequence[str]):
+            The ports, portRange, and allPorts fields are mutually
+            exclusive. Only packets addressed to ports in the specified
+            range will be forwarded to the backends configured with this
+            forwarding rule. The ports field has the following
+            limitations: - It requires that the forwarding rule
+            IPProtocol be TCP, UDP, or SCTP, and - It's applicable only
+            to the following products: internal passthrough Network Load
+            Balancers, backend service-based external passthrough
+            Network Load Balancers, and internal protocol forwarding. -
+            You can specify a list of up to five ports by number,
+            separated by commas. The ports can be contiguous or
+            discontiguous. For external forwarding rules, two or more
+            forwarding rules cannot use the same [IPAddress, IPProtocol]
+            pair if they share at least one port number. For internal
+            forwarding rules within the same VPC network, two or more
+            forwarding rules cannot use the same [IPAddress, IPProtocol]
+            pair if they share at least one port number. @pattern:
+            \\d+(?:-\d+)?
+        psc_connection_id (int):
+            [Output Only] The PSC connection id of the PSC Forwarding
+            Rule.
+
+            This field is a member of `oneof`_ ``_psc_connection_id``.
+        psc_connection_status (str):
+            Check the PscConnectionStatus enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_psc_connection_status``.
+        region (str):
+            [Output Only] URL of the region where the regional
+            forwarding rule resides. This field is not applicable to
+            global forwarding rules. You must specify this field as part
+            of the HTTP request URL. It is not settable as a field in
+            the request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        service_directory_registrations (MutableSequence[google.cloud.compute_v1.types.ForwardingRuleServiceDirectoryRegistration]):
+            Service Directory resources to register this
+            forwarding rule with. Currently, only supports a
+            single Service Directory resource.
+        service_label (str):
+            An optional prefix to the service name for this Forwarding
+            Rule. If specified, the prefix is the first label of the
+            fully qualified service name. The label must be 1-63
+            characters long, and comply with RFC1035. Specifically, the
+            label must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+            This field is only used for internal load balancing.
+
+            This field is a member of `oneof`_ ``_service_label``.
+        service_name (str):
+            [Output Only] The internal fully qualified service name for
+            this Forwarding Rule. This field is only used for internal
+            load balancing.
+
+            This field is a member of `oneof`_ ``_service_name``.
+        source_ip_ranges (MutableSequence[str]):
+            If not empty, this Forwarding Rule will only forward the
+            traffic when the source IP address matches one of the IP
+            addresses or CIDR ranges set here. Note that a Forwarding
+            Rule can only have up to 64 source IP ranges, and this field
+            can only be used with a regional Forwarding Rule whose
+            scheme is EXTERNAL. Each source_ip_range entry should be
+            either an IP address (for example, 1.2.3.4) or a CIDR range
+            (for example, 1.2.3.0/24).
+        subnetwork (str):
+            This field identifies the subnetwork that the
+            load balanced IP should belong to for this
+            Forwarding Rule, used in internal load balancing
+            and network load balancing with IPv6. If the
+            network specified is in auto subnet mode, this
+            field is optional. However, a subnetwork must be
+            specified if the network is in custom subnet
+            mode or when creating external forwarding rule
+            with IPv6.
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+        target (str):
+            The URL of the target resource to receive the matched
+            traffic. For regional forwarding rules, this target must be
+            in the same region as the forwarding rule. For global
+            forwarding rules, this target must be a global load
+            balancing resource. The forwarded traffic must be of a type
+            appropriate to the target object. - For load balancers, see
+            the "Target" column in `Port
+            specifications <https://cloud.google.com/load-balancing/docs/forwarding-rule-concepts#ip_address_specifications>`__.
+            - For Private Service Connect forwarding rules that forward
+            traffic to Google APIs, provide the name of a supported
+            Google API bundle: - vpc-sc - APIs that support VPC Service
+            Controls. - all-apis - All supported Google APIs. - For
+            Private Service Connect forwarding rules that forward
+            traffic to managed services, the target must be a service
+            attachment. The target is not mutable once set as a service
+            attachment.
+
+            This field is a member of `oneof`_ ``_target``.
+    """
+
+    class IPProtocolEnum(proto.Enum):
+        r"""The IP protocol to which this rule applies. For protocol forwarding,
+        valid options are TCP, UDP, ESP, AH, SCTP, ICMP and L3_DEFAULT. The
+        valid IP protocols are different for different load balancing
+        products as described in `Load balancing
+        features <https://cloud.google.com/load-balancing/docs/features#protocols_from_the_load_balancer_to_the_backends>`__.
+
+        Values:
+            UNDEFINED_I_P_PROTOCOL_ENUM (0):
+                A value indicating that the enum field is not
+                set.
+            AH (2087):
+                No description available.
+            ESP (68962):
+                No description available.
+            ICMP (2241597):
+                No description available.
+            L3_DEFAULT (48151369):
+                No description available.
+            SCTP (2539724):
+                No description available.
+            TCP (82881):
+                No description available.
+            UDP (83873):
+                No description available.
+        """
+        UNDEFINED_I_P_PROTOCOL_ENUM = 0
+        AH = 2087
+        ESP = 68962
+        ICMP = 2241597
+        L3_DEFAULT = 48151369
+        SCTP = 2539724
+        TCP = 82881
+        UDP = 83873
+
+    class IpVersion(proto.Enum):
+        r"""The IP Version that will be used by this forwarding rule.
+        Valid options are IPV4 or IPV6.
+
+        Values:
+            UNDEFINED_IP_VERSION (0):
+                A value indicating that the enum field is not
+                set.
+            IPV4 (2254341):
+                No description available.
+            IPV6 (2254343):
+                No description available.
+            UNSPECIFIED_VERSION (21850000):
+                No description available.
+        """
+        UNDEFINED_IP_VERSION = 0
+        IPV4 = 2254341
+        IPV6 = 2254343
+        UNSPECIFIED_VERSION = 21850000
+
+    class LoadBalancingScheme(proto.Enum):
+        r"""Specifies the forwarding rule type. For more information
+        about forwarding rules, refer to Forwarding rule concepts.
+
+        Values:
+            UNDEFINED_LOAD_BALANCING_SCHEME (0):
+                A value indicating that the enum field is not
+                set.
+            EXTERNAL (35607499):
+                No description available.
+            EXTERNAL_MANAGED (512006923):
+                No description available.
+            INTERNAL (279295677):
+                No description available.
+            INTERNAL_MANAGED (37350397):
+                No description available.
+            INTERNAL_SELF_MANAGED (236211150):
+                No description available.
+            INVALID (530283991):
+                No description available.
+        """
+        UNDEFINED_LOAD_BALANCING_SCHEME = 0
+        EXTERNAL = 35607499
+        EXTERNAL_MANAGED = 512006923
+        INTERNAL = 279295677
+        INTERNAL_MANAGED = 37350397
+        INTERNAL_SELF_MANAGED = 236211150
+        INVALID = 530283991
+
+    class NetworkTier(proto.Enum):
+        r"""This signifies the networking tier used for configuring this
+        load balancer and can only take the following values: PREMIUM,
+        STANDARD. For regional ForwardingRule, the valid values are
+        PREMIUM and STANDARD. For GlobalForwardingRule, the valid value
+        is PREMIUM. If this field is not specified, it is assumed to be
+        PREMIUM. If IPAddress is specified, this value must be equal to
+        the networkTier of the Address.
+
+        Values:
+            UNDEFINED_NETWORK_TIER (0):
+                A value indicating that the enum field is not
+                set.
+            FIXED_STANDARD (310464328):
+                Public internet quality with fixed bandwidth.
+            PREMIUM (399530551):
+                High quality, Google-grade network tier,
+                support for all networking products.
+            STANDARD (484642493):
+                Public internet quality, only limited support
+                for other networking products.
+            STANDARD_OVERRIDES_FIXED_STANDARD (465847234):
+                (Output only) Temporary tier for FIXED_STANDARD when fixed
+                standard tier is expired or not configured.
+        """
+        UNDEFINED_NETWORK_TIER = 0
+        FIXED_STANDARD = 310464328
+        PREMIUM = 399530551
+        STANDARD = 484642493
+        STANDARD_OVERRIDES_FIXED_STANDARD = 465847234
+
+    class PscConnectionStatus(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_PSC_CONNECTION_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            ACCEPTED (246714279):
+                The connection has been accepted by the
+                producer.
+            CLOSED (380163436):
+                The connection has been closed by the
+                producer and will not serve traffic going
+                forward.
+            NEEDS_ATTENTION (344491452):
+                The connection has been accepted by the
+                producer, but the producer needs to take further
+                action before the forwarding rule can serve
+                traffic.
+            PENDING (35394935):
+                The connection is pending acceptance by the
+                producer.
+            REJECTED (174130302):
+                The connection has been rejected by the
+                producer.
+            STATUS_UNSPECIFIED (42133066):
+                No description available.
+        """
+        UNDEFINED_PSC_CONNECTION_STATUS = 0
+        ACCEPTED = 246714279
+        CLOSED = 380163436
+        NEEDS_ATTENTION = 344491452
+        PENDING = 35394935
+        REJECTED = 174130302
+        STATUS_UNSPECIFIED = 42133066
+
+    I_p_address: str = proto.Field(
+        proto.STRING,
+        number=42976943,
+        optional=True,
+    )
+    I_p_protocol: str = proto.Field(
+        proto.STRING,
+        number=488094525,
+        optional=True,
+    )
+    all_ports: bool = proto.Field(
+        proto.BOOL,
+        number=445175796,
+        optional=True,
+    )
+    allow_global_access: bool = proto.Field(
+        proto.BOOL,
+        number=499409674,
+        optional=True,
+    )
+    allow_psc_global_access: bool = proto.Field(
+        proto.BOOL,
+        number=263471819,
+        optional=True,
+    )
+    backend_service: str = proto.Field(
+        proto.STRING,
+        number=306946058,
+        optional=True,
+    )
+    base_forwarding_rule: str = proto.Field(
+        proto.STRING,
+        number=524873104,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    ip_version: str = proto.Field(
+        proto.STRING,
+        number=294959552,
+        optional=True,
+    )
+    is_mirroring_collector: bool = proto.Field(
+        proto.BOOL,
+        number=119255164,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    load_balancing_scheme: str = proto.Field(
+        proto.STRING,
+        number=363890244,
+        optional=True,
+    )
+    metadata_filters: MutableSequence[
+        shared_metadata_filter.MetadataFilter
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=464725739,
+        message=shared_metadata_filter.MetadataFilter,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    network_tier: str = proto.Field(
+        proto.STRING,
+        number=517397843,
+        optional=True,
+    )
+    no_automate_dns_zone: bool = proto.Field(
+        proto.BOOL,
+        number=64546991,
+        optional=True,
+    )
+    port_range: str = proto.Field(
+        proto.STRING,
+        number=217518079,
+        optional=True,
+    )
+    ports: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=106854418,
+    )
+    psc_connection_id: int = proto.Field(
+        proto.UINT64,
+        number=292082397,
+        optional=True,
+    )
+    psc_connection_status: str = proto.Field(
+        proto.STRING,
+        number=184149172,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    service_directory_registrations: MutableSequence[
+        "ForwardingRuleServiceDirectoryRegistration"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=223549694,
+        message="ForwardingRuleServiceDirectoryRegistration",
+    )
+    service_label: str = proto.Field(
+        proto.STRING,
+        number=417008874,
+        optional=True,
+    )
+    service_name: str = proto.Field(
+        proto.STRING,
+        number=359880149,
+        optional=True,
+    )
+    source_ip_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=111563210,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+        optional=True,
+    )
+    target: str = proto.Field(
+        proto.STRING,
+        number=192835985,
+        optional=True,
+    )
+
+
+class ForwardingRuleList(proto.Message):
+    r"""Contains a list of ForwardingRule resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.ForwardingRule]):
+            A list of ForwardingRule resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["ForwardingRule"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="ForwardingRule",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class ForwardingRuleServiceDirectoryRegistration(proto.Message):
+    r"""Describes the auto-registration of the Forwarding Rule to
+    Service Directory. The region and project of the Service
+    Directory resource generated from this registration will be the
+    same as this Forwarding Rule.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        namespace (str):
+            Service Directory namespace to register the
+            forwarding rule under.
+
+            This field is a member of `oneof`_ ``_namespace``.
+        service (str):
+            Service Directory service to register the
+            forwarding rule under.
+
+            This field is a member of `oneof`_ ``_service``.
+        service_directory_region (str):
+            [Optional] Service Directory region to register this global
+            forwarding rule under. Default to "us-central1". Only used
+            for PSC for Google APIs. All PSC for Google APIs Forwarding
+            Rules on the same network should use the same Service
+            Directory region.
+
+            This field is a member of `oneof`_ ``_service_directory_region``.
+    """
+
+    namespace: str = proto.Field(
+        proto.STRING,
+        number=178476379,
+        optional=True,
+    )
+    service: str = proto.Field(
+        proto.STRING,
+        number=373540533,
+        optional=True,
+    )
+    service_directory_region: str = proto.Field(
+        proto.STRING,
+        number=74030416,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "GetGlobalOrganizationOperationRequest",
+    },
+)
+
+
+class GetGlobalOrganizationOperationRequest(proto.Message):
+    r"""A request message for GlobalOrganizationOperations.Get. See
+    the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        operation (str):
+            Name of the Operations resource to return.
+        parent_id (str):
+            Parent ID for this request.
+
+            This field is a member of `oneof`_ ``_parent_id``.
+    """
+
+    operation: str = proto.Field(
+        proto.STRING,
+        number=52090215,
+    )
+    parent_id: str = proto.Field(
+        proto.STRING,
+        number=459714768,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
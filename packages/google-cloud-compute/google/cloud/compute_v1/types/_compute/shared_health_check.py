@@ -0,0 +1,1388 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "GRPCHealthCheck",
+        "HTTP2HealthCheck",
+        "HTTPHealthCheck",
+        "HTTPSHealthCheck",
+        "HealthCheck",
+        "HealthCheckList",
+        "HealthCheckLogConfig",
+        "SSLHealthCheck",
+        "TCPHealthCheck",
+    },
+)
+
+
+class GRPCHealthCheck(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        grpc_service_name (str):
+            The gRPC service name for the health check. This field is
+            optional. The value of grpc_service_name has the following
+            meanings by convention: - Empty service_name means the
+            overall status of all services at the backend. - Non-empty
+            service_name means the health of that gRPC service, as
+            defined by the owner of the service. The grpc_service_name
+            can only be ASCII.
+
+            This field is a member of `oneof`_ ``_grpc_service_name``.
+        port (int):
+            The TCP port number to which the health check
+            prober sends packets. Valid values are 1 through
+            65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Not supported.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how a port is selected for health checking. Can be
+            one of the following values: USE_FIXED_PORT: Specifies a
+            port number explicitly using the port field in the health
+            check. Supported by backend services for pass-through load
+            balancers and backend services for proxy load balancers. Not
+            supported by target pools. The health check supports all
+            backends supported by the backend service provided the
+            backend can be health checked. For example, GCE_VM_IP
+            network endpoint groups, GCE_VM_IP_PORT network endpoint
+            groups, and instance group backends. USE_NAMED_PORT: Not
+            supported. USE_SERVING_PORT: Provides an indirect method of
+            specifying the health check port by referring to the backend
+            service. Only supported by backend services for proxy load
+            balancers. Not supported by target pools. Not supported by
+            backend services for pass-through load balancers. Supports
+            all backends that can be health checked; for example,
+            GCE_VM_IP_PORT network endpoint groups and instance group
+            backends. For GCE_VM_IP_PORT network endpoint group
+            backends, the health check uses the port number specified
+            for each endpoint in the network endpoint group. For
+            instance group backends, the health check uses the port
+            number determined by looking up the backend service's named
+            port in the instance group's list of named ports. Check the
+            PortSpecification enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how a port is selected for health checking. Can be one of
+        the following values: USE_FIXED_PORT: Specifies a port number
+        explicitly using the port field in the health check. Supported by
+        backend services for pass-through load balancers and backend
+        services for proxy load balancers. Not supported by target pools.
+        The health check supports all backends supported by the backend
+        service provided the backend can be health checked. For example,
+        GCE_VM_IP network endpoint groups, GCE_VM_IP_PORT network endpoint
+        groups, and instance group backends. USE_NAMED_PORT: Not supported.
+        USE_SERVING_PORT: Provides an indirect method of specifying the
+        health check port by referring to the backend service. Only
+        supported by backend services for proxy load balancers. Not
+        supported by target pools. Not supported by backend services for
+        pass-through load balancers. Supports all backends that can be
+        health checked; for example, GCE_VM_IP_PORT network endpoint groups
+        and instance group backends. For GCE_VM_IP_PORT network endpoint
+        group backends, the health check uses the port number specified for
+        each endpoint in the network endpoint group. For instance group
+        backends, the health check uses the port number determined by
+        looking up the backend service's named port in the instance group's
+        list of named ports.
+
+        Values:
+            UNDEFINED_PORT_SPECIFICATION (0):
+                A value indicating that the enum field is not
+                set.
+            USE_FIXED_PORT (190235748):
+                The port number in the health check's port is
+                used for health checking. Applies to network
+                endpoint group and instance group backends.
+            USE_NAMED_PORT (349300671):
+                Not supported.
+            USE_SERVING_PORT (362637516):
+                For network endpoint group backends, the
+                health check uses the port number specified on
+                each endpoint in the network endpoint group. For
+                instance group backends, the health check uses
+                the port number specified for the backend
+                service's named port defined in the instance
+                group's named ports.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    grpc_service_name: str = proto.Field(
+        proto.STRING,
+        number=136533078,
+        optional=True,
+    )
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+    port_name: str = proto.Field(
+        proto.STRING,
+        number=41534345,
+        optional=True,
+    )
+    port_specification: str = proto.Field(
+        proto.STRING,
+        number=51590597,
+        optional=True,
+    )
+
+
+class HTTP2HealthCheck(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        host (str):
+            The value of the host header in the HTTP/2
+            health check request. If left empty (default
+            value), the host header is set to the
+            destination IP address to which health check
+            packets are sent. The destination IP address
+            depends on the type of load balancer. For
+            details, see:
+            https://cloud.google.com/load-balancing/docs/health-check-concepts#hc-packet-dest
+
+            This field is a member of `oneof`_ ``_host``.
+        port (int):
+            The TCP port number to which the health check
+            prober sends packets. The default value is 443.
+            Valid values are 1 through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Not supported.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how a port is selected for health checking. Can be
+            one of the following values: USE_FIXED_PORT: Specifies a
+            port number explicitly using the port field in the health
+            check. Supported by backend services for pass-through load
+            balancers and backend services for proxy load balancers. Not
+            supported by target pools. The health check supports all
+            backends supported by the backend service provided the
+            backend can be health checked. For example, GCE_VM_IP
+            network endpoint groups, GCE_VM_IP_PORT network endpoint
+            groups, and instance group backends. USE_NAMED_PORT: Not
+            supported. USE_SERVING_PORT: Provides an indirect method of
+            specifying the health check port by referring to the backend
+            service. Only supported by backend services for proxy load
+            balancers. Not supported by target pools. Not supported by
+            backend services for pass-through load balancers. Supports
+            all backends that can be health checked; for example,
+            GCE_VM_IP_PORT network endpoint groups and instance group
+            backends. For GCE_VM_IP_PORT network endpoint group
+            backends, the health check uses the port number specified
+            for each endpoint in the network endpoint group. For
+            instance group backends, the health check uses the port
+            number determined by looking up the backend service's named
+            port in the instance group's list of named ports. Check the
+            PortSpecification enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        request_path (str):
+            The request path of the HTTP/2 health check
+            request. The default value is /.
+
+            This field is a member of `oneof`_ ``_request_path``.
+        response (str):
+            Creates a content-based HTTP/2 health check.
+            In addition to the required HTTP 200 (OK) status
+            code, you can configure the health check to pass
+            only when the backend sends this specific ASCII
+            response string within the first 1024 bytes of
+            the HTTP response body. For details, see:
+            https://cloud.google.com/load-balancing/docs/health-check-concepts#criteria-protocol-http
+
+            This field is a member of `oneof`_ ``_response``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how a port is selected for health checking. Can be one of
+        the following values: USE_FIXED_PORT: Specifies a port number
+        explicitly using the port field in the health check. Supported by
+        backend services for pass-through load balancers and backend
+        services for proxy load balancers. Not supported by target pools.
+        The health check supports all backends supported by the backend
+        service provided the backend can be health checked. For example,
+        GCE_VM_IP network endpoint groups, GCE_VM_IP_PORT network endpoint
+        groups, and instance group backends. USE_NAMED_PORT: Not supported.
+        USE_SERVING_PORT: Provides an indirect method of specifying the
+        health check port by referring to the backend service. Only
+        supported by backend services for proxy load balancers. Not
+        supported by target pools. Not supported by backend services for
+        pass-through load balancers. Supports all backends that can be
+        health checked; for example, GCE_VM_IP_PORT network endpoint groups
+        and instance group backends. For GCE_VM_IP_PORT network endpoint
+        group backends, the health check uses the port number specified for
+        each endpoint in the network endpoint group. For instance group
+        backends, the health check uses the port number determined by
+        looking up the backend service's named port in the instance group's
+        list of named ports.
+
+        Values:
+            UNDEFINED_PORT_SPECIFICATION (0):
+                A value indicating that the enum field is not
+                set.
+            USE_FIXED_PORT (190235748):
+                The port number in the health check's port is
+                used for health checking. Applies to network
+                endpoint group and instance group backends.
+            USE_NAMED_PORT (349300671):
+                Not supported.
+            USE_SERVING_PORT (362637516):
+                For network endpoint group backends, the
+                health check uses the port number specified on
+                each endpoint in the network endpoint group. For
+                instance group backends, the health check uses
+                the port number specified for the backend
+                service's named port defined in the instance
+                group's named ports.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+
+        Values:
+            UNDEFINED_PROXY_HEADER (0):
+                A value indicating that the enum field is not
+                set.
+            NONE (2402104):
+                No description available.
+            PROXY_V1 (334352940):
+                No description available.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    host: str = proto.Field(
+        proto.STRING,
+        number=3208616,
+        optional=True,
+    )
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+    port_name: str = proto.Field(
+        proto.STRING,
+        number=41534345,
+        optional=True,
+    )
+    port_specification: str = proto.Field(
+        proto.STRING,
+        number=51590597,
+        optional=True,
+    )
+    proxy_header: str = proto.Field(
+        proto.STRING,
+        number=160374142,
+        optional=True,
+    )
+    request_path: str = proto.Field(
+        proto.STRING,
+        number=229403605,
+        optional=True,
+    )
+    response: str = proto.Field(
+        proto.STRING,
+        number=196547649,
+        optional=True,
+    )
+
+
+class HTTPHealthCheck(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        host (str):
+            The value of the host header in the HTTP
+            health check request. If left empty (default
+            value), the host header is set to the
+            destination IP address to which health check
+            packets are sent. The destination IP address
+            depends on the type of load balancer. For
+            details, see:
+            https://cloud.google.com/load-balancing/docs/health-check-concepts#hc-packet-dest
+
+            This field is a member of `oneof`_ ``_host``.
+        port (int):
+            The TCP port number to which the health check
+            prober sends packets. The default value is 80.
+            Valid values are 1 through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Not supported.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how a port is selected for health checking. Can be
+            one of the following values: USE_FIXED_PORT: Specifies a
+            port number explicitly using the port field in the health
+            check. Supported by backend services for pass-through load
+            balancers and backend services for proxy load balancers.
+            Also supported in legacy HTTP health checks for target
+            pools. The health check supports all backends supported by
+            the backend service provided the backend can be health
+            checked. For example, GCE_VM_IP network endpoint groups,
+            GCE_VM_IP_PORT network endpoint groups, and instance group
+            backends. USE_NAMED_PORT: Not supported. USE_SERVING_PORT:
+            Provides an indirect method of specifying the health check
+            port by referring to the backend service. Only supported by
+            backend services for proxy load balancers. Not supported by
+            target pools. Not supported by backend services for
+            pass-through load balancers. Supports all backends that can
+            be health checked; for example, GCE_VM_IP_PORT network
+            endpoint groups and instance group backends. For
+            GCE_VM_IP_PORT network endpoint group backends, the health
+            check uses the port number specified for each endpoint in
+            the network endpoint group. For instance group backends, the
+            health check uses the port number determined by looking up
+            the backend service's named port in the instance group's
+            list of named ports. Check the PortSpecification enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        request_path (str):
+            The request path of the HTTP health check
+            request. The default value is /.
+
+            This field is a member of `oneof`_ ``_request_path``.
+        response (str):
+            Creates a content-based HTTP health check. In
+            addition to the required HTTP 200 (OK) status
+            code, you can configure the health check to pass
+            only when the backend sends this specific ASCII
+            response string within the first 1024 bytes of
+            the HTTP response body. For details, see:
+            https://cloud.google.com/load-balancing/docs/health-check-concepts#criteria-protocol-http
+
+            This field is a member of `oneof`_ ``_response``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how a port is selected for health checking. Can be one of
+        the following values: USE_FIXED_PORT: Specifies a port number
+        explicitly using the port field in the health check. Supported by
+        backend services for pass-through load balancers and backend
+        services for proxy load balancers. Also supported in legacy HTTP
+        health checks for target pools. The health check supports all
+        backends supported by the backend service provided the backend can
+        be health checked. For example, GCE_VM_IP network endpoint groups,
+        GCE_VM_IP_PORT network endpoint groups, and instance group backends.
+        USE_NAMED_PORT: Not supported. USE_SERVING_PORT: Provides an
+        indirect method of specifying the health check port by referring to
+        the backend service. Only supported by backend services for proxy
+        load balancers. Not supported by target pools. Not supported by
+        backend services for pass-through load balancers. Supports all
+        backends that can be health checked; for example, GCE_VM_IP_PORT
+        network endpoint groups and instance group backends. For
+        GCE_VM_IP_PORT network endpoint group backends, the health check
+        uses the port number specified for each endpoint in the network
+        endpoint group. For instance group backends, the health check uses
+        the port number determined by looking up the backend service's named
+        port in the instance group's list of named ports.
+
+        Values:
+            UNDEFINED_PORT_SPECIFICATION (0):
+                A value indicating that the enum field is not
+                set.
+            USE_FIXED_PORT (190235748):
+                The port number in the health check's port is
+                used for health checking. Applies to network
+                endpoint group and instance group backends.
+            USE_NAMED_PORT (349300671):
+                Not supported.
+            USE_SERVING_PORT (362637516):
+                For network endpoint group backends, the
+                health check uses the port number specified on
+                each endpoint in the network endpoint group. For
+                instance group backends, the health check uses
+                the port number specified for the backend
+                service's named port defined in the instance
+                group's named ports.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+
+        Values:
+            UNDEFINED_PROXY_HEADER (0):
+                A value indicating that the enum field is not
+                set.
+            NONE (2402104):
+                No description available.
+            PROXY_V1 (334352940):
+                No description available.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    host: str = proto.Field(
+        proto.STRING,
+        number=3208616,
+        optional=True,
+    )
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+    port_name: str = proto.Field(
+        proto.STRING,
+        number=41534345,
+        optional=True,
+    )
+    port_specification: str = proto.Field(
+        proto.STRING,
+        number=51590597,
+        optional=True,
+    )
+    proxy_header: str = proto.Field(
+        proto.STRING,
+        number=160374142,
+        optional=True,
+    )
+    request_path: str = proto.Field(
+        proto.STRING,
+        number=229403605,
+        optional=True,
+    )
+    response: str = proto.Field(
+        proto.STRING,
+        number=196547649,
+        optional=True,
+    )
+
+
+class HTTPSHealthCheck(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        host (str):
+            The value of the host header in the HTTPS
+            health check request. If left empty (default
+            value), the host header is set to the
+            destination IP address to which health check
+            packets are sent. The destination IP address
+            depends on the type of load balancer. For
+            details, see:
+            https://cloud.google.com/load-balancing/docs/health-check-concepts#hc-packet-dest
+
+            This field is a member of `oneof`_ ``_host``.
+        port (int):
+            The TCP port number to which the health check
+            prober sends packets. The default value is 443.
+            Valid values are 1 through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Not supported.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how a port is selected for health checking. Can be
+            one of the following values: USE_FIXED_PORT: Specifies a
+            port number explicitly using the port field in the health
+            check. Supported by backend services for pass-through load
+            balancers and backend services for proxy load balancers. Not
+            supported by target pools. The health check supports all
+            backends supported by the backend service provided the
+            backend can be health checked. For example, GCE_VM_IP
+            network endpoint groups, GCE_VM_IP_PORT network endpoint
+            groups, and instance group backends. USE_NAMED_PORT: Not
+            supported. USE_SERVING_PORT: Provides an indirect method of
+            specifying the health check port by referring to the backend
+            service. Only supported by backend services for proxy load
+            balancers. Not supported by target pools. Not supported by
+            backend services for pass-through load balancers. Supports
+            all backends that can be health checked; for example,
+            GCE_VM_IP_PORT network endpoint groups and instance group
+            backends. For GCE_VM_IP_PORT network endpoint group
+            backends, the health check uses the port number specified
+            for each endpoint in the network endpoint group. For
+            instance group backends, the health check uses the port
+            number determined by looking up the backend service's named
+            port in the instance group's list of named ports. Check the
+            PortSpecification enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        request_path (str):
+            The request path of the HTTPS health check
+            request. The default value is /.
+
+            This field is a member of `oneof`_ ``_request_path``.
+        response (str):
+            Creates a content-based HTTPS health check.
+            In addition to the required HTTP 200 (OK) status
+            code, you can configure the health check to pass
+            only when the backend sends this specific ASCII
+            response string within the first 1024 bytes of
+            the HTTP response body. For details, see:
+            https://cloud.google.com/load-balancing/docs/health-check-concepts#criteria-protocol-http
+
+            This field is a member of `oneof`_ ``_response``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how a port is selected for health checking. Can be one of
+        the following values: USE_FIXED_PORT: Specifies a port number
+        explicitly using the port field in the health check. Supported by
+        backend services for pass-through load balancers and backend
+        services for proxy load balancers. Not supported by target pools.
+        The health check supports all backends supported by the backend
+        service provided the backend can be health checked. For example,
+        GCE_VM_IP network endpoint groups, GCE_VM_IP_PORT network endpoint
+        groups, and instance group backends. USE_NAMED_PORT: Not supported.
+        USE_SERVING_PORT: Provides an indirect method of specifying the
+        health check port by referring to the backend service. Only
+        supported by backend services for proxy load balancers. Not
+        supported by target pools. Not supported by backend services for
+        pass-through load balancers. Supports all backends that can be
+        health checked; for example, GCE_VM_IP_PORT network endpoint groups
+        and instance group backends. For GCE_VM_IP_PORT network endpoint
+        group backends, the health check uses the port number specified for
+        each endpoint in the network endpoint group. For instance group
+        backends, the health check uses the port number determined by
+        looking up the backend service's named port in the instance group's
+        list of named ports.
+
+        Values:
+            UNDEFINED_PORT_SPECIFICATION (0):
+                A value indicating that the enum field is not
+                set.
+            USE_FIXED_PORT (190235748):
+                The port number in the health check's port is
+                used for health checking. Applies to network
+                endpoint group and instance group backends.
+            USE_NAMED_PORT (349300671):
+                Not supported.
+            USE_SERVING_PORT (362637516):
+                For network endpoint group backends, the
+                health check uses the port number specified on
+                each endpoint in the network endpoint group. For
+                instance group backends, the health check uses
+                the port number specified for the backend
+                service's named port defined in the instance
+                group's named ports.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+
+        Values:
+            UNDEFINED_PROXY_HEADER (0):
+                A value indicating that the enum field is not
+                set.
+            NONE (2402104):
+                No description available.
+            PROXY_V1 (334352940):
+                No description available.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    host: str = proto.Field(
+        proto.STRING,
+        number=3208616,
+        optional=True,
+    )
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+    port_name: str = proto.Field(
+        proto.STRING,
+        number=41534345,
+        optional=True,
+    )
+    port_specification: str = proto.Field(
+        proto.STRING,
+        number=51590597,
+        optional=True,
+    )
+    proxy_header: str = proto.Field(
+        proto.STRING,
+        number=160374142,
+        optional=True,
+    )
+    request_path: str = proto.Field(
+        proto.STRING,
+        number=229403605,
+        optional=True,
+    )
+    response: str = proto.Field(
+        proto.STRING,
+        number=196547649,
+        optional=True,
+    )
+
+
+class HealthCheck(proto.Message):
+    r"""Represents a health check resource. Google Compute Engine has two
+    health check resources: \*
+    `Regional </compute/docs/reference/rest/v1/regionHealthChecks>`__ \*
+    `Global </compute/docs/reference/rest/v1/healthChecks>`__ These
+    health check resources can be used for load balancing and for
+    autohealing VMs in a managed instance group (MIG). **Load
+    balancing** The following load balancer can use either regional or
+    global health check: \* Internal TCP/UDP load balancer The following
+    load balancers require regional health check: \* Internal HTTP(S)
+    load balancer \* Backend service-based network load balancer Traffic
+    Director and the following load balancers require global health
+    check: \* External HTTP(S) load balancer \* TCP proxy load balancer
+    \* SSL proxy load balancer The following load balancer require
+    `legacy HTTP health
+    checks </compute/docs/reference/rest/v1/httpHealthChecks>`__: \*
+    Target pool-based network load balancer **Autohealing in MIGs** The
+    health checks that you use for autohealing VMs in a MIG can be
+    either regional or global. For more information, see Set up an
+    application health check and autohealing. For more information, see
+    Health checks overview.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        check_interval_sec (int):
+            How often (in seconds) to send a health
+            check. The default value is 5 seconds.
+
+            This field is a member of `oneof`_ ``_check_interval_sec``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in 3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        grpc_health_check (google.cloud.compute_v1.types.GRPCHealthCheck):
+
+            This field is a member of `oneof`_ ``_grpc_health_check``.
+        healthy_threshold (int):
+            A so-far unhealthy instance will be marked
+            healthy after this many consecutive successes.
+            The default value is 2.
+
+            This field is a member of `oneof`_ ``_healthy_threshold``.
+        http2_health_check (google.cloud.compute_v1.types.HTTP2HealthCheck):
+
+            This field is a member of `oneof`_ ``_http2_health_check``.
+        http_health_check (google.cloud.compute_v1.types.HTTPHealthCheck):
+
+            This field is a member of `oneof`_ ``_http_health_check``.
+        https_health_check (google.cloud.compute_v1.types.HTTPSHealthCheck):
+
+            This field is a member of `oneof`_ ``_https_health_check``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            Type of the resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        log_config (google.cloud.compute_v1.types.HealthCheckLogConfig):
+            Configure logging on this health check.
+
+            This field is a member of `oneof`_ ``_log_config``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. For example, a name that is 1-63
+            characters long, matches the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?``, and otherwise complies with
+            RFC1035. This regular expression describes a name where the
+            first character is a lowercase letter, and all following
+            characters are a dash, lowercase letter, or digit, except
+            the last character, which isn't a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        region (str):
+            [Output Only] Region where the health check resides. Not
+            applicable to global health checks.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        ssl_health_check (google.cloud.compute_v1.types.SSLHealthCheck):
+
+            This field is a member of `oneof`_ ``_ssl_health_check``.
+        tcp_health_check (google.cloud.compute_v1.types.TCPHealthCheck):
+
+            This field is a member of `oneof`_ ``_tcp_health_check``.
+        timeout_sec (int):
+            How long (in seconds) to wait before claiming
+            failure. The default value is 5 seconds. It is
+            invalid for timeoutSec to have greater value
+            than checkIntervalSec.
+
+            This field is a member of `oneof`_ ``_timeout_sec``.
+        type_ (str):
+            Specifies the type of the healthCheck, either
+            TCP, SSL, HTTP, HTTPS, HTTP2 or GRPC. Exactly
+            one of the protocol-specific health check fields
+            must be specified, which must match type field.
+            Check the Type enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_type``.
+        unhealthy_threshold (int):
+            A so-far healthy instance will be marked
+            unhealthy after this many consecutive failures.
+            The default value is 2.
+
+            This field is a member of `oneof`_ ``_unhealthy_threshold``.
+    """
+
+    class Type(proto.Enum):
+        r"""Specifies the type of the healthCheck, either TCP, SSL, HTTP,
+        HTTPS, HTTP2 or GRPC. Exactly one of the protocol-specific
+        health check fields must be specified, which must match type
+        field.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            GRPC (2196510):
+                No description available.
+            HTTP (2228360):
+                No description available.
+            HTTP2 (69079210):
+                No description available.
+            HTTPS (69079243):
+                No description available.
+            INVALID (530283991):
+                No description available.
+            SSL (82412):
+                No description available.
+            TCP (82881):
+                No description available.
+        """
+        UNDEFINED_TYPE = 0
+        GRPC = 2196510
+        HTTP = 2228360
+        HTTP2 = 69079210
+        HTTPS = 69079243
+        INVALID = 530283991
+        SSL = 82412
+        TCP = 82881
+
+    check_interval_sec: int = proto.Field(
+        proto.INT32,
+        number=345561006,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    grpc_health_check: "GRPCHealthCheck" = proto.Field(
+        proto.MESSAGE,
+        number=85529574,
+        optional=True,
+        message="GRPCHealthCheck",
+    )
+    healthy_threshold: int = proto.Field(
+        proto.INT32,
+        number=403212361,
+        optional=True,
+    )
+    http2_health_check: "HTTP2HealthCheck" = proto.Field(
+        proto.MESSAGE,
+        number=11360986,
+        optional=True,
+        message="HTTP2HealthCheck",
+    )
+    http_health_check: "HTTPHealthCheck" = proto.Field(
+        proto.MESSAGE,
+        number=412586940,
+        optional=True,
+        message="HTTPHealthCheck",
+    )
+    https_health_check: "HTTPSHealthCheck" = proto.Field(
+        proto.MESSAGE,
+        number=436046905,
+        optional=True,
+        message="HTTPSHealthCheck",
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    log_config: "HealthCheckLogConfig" = proto.Field(
+        proto.MESSAGE,
+        number=351299741,
+        optional=True,
+        message="HealthCheckLogConfig",
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    ssl_health_check: "SSLHealthCheck" = proto.Field(
+        proto.MESSAGE,
+        number=280032440,
+        optional=True,
+        message="SSLHealthCheck",
+    )
+    tcp_health_check: "TCPHealthCheck" = proto.Field(
+        proto.MESSAGE,
+        number=469980419,
+        optional=True,
+        message="TCPHealthCheck",
+    )
+    timeout_sec: int = proto.Field(
+        proto.INT32,
+        number=79994995,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+    unhealthy_threshold: int = proto.Field(
+        proto.INT32,
+        number=227958480,
+        optional=True,
+    )
+
+
+class HealthCheckList(proto.Message):
+    r"""Contains a list of HealthCheck resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.HealthCheck]):
+            A list of HealthCheck resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["HealthCheck"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="HealthCheck",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class HealthCheckLogConfig(proto.Message):
+    r"""Configuration of logging on a health check. If logging is
+    enabled, logs will be exported to Stackdriver.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enable (bool):
+            Indicates whether or not to export logs. This
+            is false by default, which means no health check
+            logging will be done.
+
+            This field is a member of `oneof`_ ``_enable``.
+    """
+
+    enable: bool = proto.Field(
+        proto.BOOL,
+        number=311764355,
+        optional=True,
+    )
+
+
+class SSLHealthCheck(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        port (int):
+            The TCP port number to which the health check
+            prober sends packets. The default value is 443.
+            Valid values are 1 through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Not supported.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how a port is selected for health checking. Can be
+            one of the following values: USE_FIXED_PORT: Specifies a
+            port number explicitly using the port field in the health
+            check. Supported by backend services for pass-through load
+            balancers and backend services for proxy load balancers. Not
+            supported by target pools. The health check supports all
+            backends supported by the backend service provided the
+            backend can be health checked. For example, GCE_VM_IP
+            network endpoint groups, GCE_VM_IP_PORT network endpoint
+            groups, and instance group backends. USE_NAMED_PORT: Not
+            supported. USE_SERVING_PORT: Provides an indirect method of
+            specifying the health check port by referring to the backend
+            service. Only supported by backend services for proxy load
+            balancers. Not supported by target pools. Not supported by
+            backend services for pass-through load balancers. Supports
+            all backends that can be health checked; for example,
+            GCE_VM_IP_PORT network endpoint groups and instance group
+            backends. For GCE_VM_IP_PORT network endpoint group
+            backends, the health check uses the port number specified
+            for each endpoint in the network endpoint group. For
+            instance group backends, the health check uses the port
+            number determined by looking up the backend service's named
+            port in the instance group's list of named ports. Check the
+            PortSpecification enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        request (str):
+            Instructs the health check prober to send
+            this exact ASCII string, up to 1024 bytes in
+            length, after establishing the TCP connection
+            and SSL handshake.
+
+            This field is a member of `oneof`_ ``_request``.
+        response (str):
+            Creates a content-based SSL health check. In
+            addition to establishing a TCP connection and
+            the TLS handshake, you can configure the health
+            check to pass only when the backend sends this
+            exact response ASCII string, up to 1024 bytes in
+            length. For details, see:
+            https://cloud.google.com/load-balancing/docs/health-check-concepts#criteria-protocol-ssl-tcp
+
+            This field is a member of `oneof`_ ``_response``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how a port is selected for health checking. Can be one of
+        the following values: USE_FIXED_PORT: Specifies a port number
+        explicitly using the port field in the health check. Supported by
+        backend services for pass-through load balancers and backend
+        services for proxy load balancers. Not supported by target pools.
+        The health check supports all backends supported by the backend
+        service provided the backend can be health checked. For example,
+        GCE_VM_IP network endpoint groups, GCE_VM_IP_PORT network endpoint
+        groups, and instance group backends. USE_NAMED_PORT: Not supported.
+        USE_SERVING_PORT: Provides an indirect method of specifying the
+        health check port by referring to the backend service. Only
+        supported by backend services for proxy load balancers. Not
+        supported by target pools. Not supported by backend services for
+        pass-through load balancers. Supports all backends that can be
+        health checked; for example, GCE_VM_IP_PORT network endpoint groups
+        and instance group backends. For GCE_VM_IP_PORT network endpoint
+        group backends, the health check uses the port number specified for
+        each endpoint in the network endpoint group. For instance group
+        backends, the health check uses the port number determined by
+        looking up the backend service's named port in the instance group's
+        list of named ports.
+
+        Values:
+            UNDEFINED_PORT_SPECIFICATION (0):
+                A value indicating that the enum field is not
+                set.
+            USE_FIXED_PORT (190235748):
+                The port number in the health check's port is
+                used for health checking. Applies to network
+                endpoint group and instance group backends.
+            USE_NAMED_PORT (349300671):
+                Not supported.
+            USE_SERVING_PORT (362637516):
+                For network endpoint group backends, the
+                health check uses the port number specified on
+                each endpoint in the network endpoint group. For
+                instance group backends, the health check uses
+                the port number specified for the backend
+                service's named port defined in the instance
+                group's named ports.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+
+        Values:
+            UNDEFINED_PROXY_HEADER (0):
+                A value indicating that the enum field is not
+                set.
+            NONE (2402104):
+                No description available.
+            PROXY_V1 (334352940):
+                No description available.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+    port_name: str = proto.Field(
+        proto.STRING,
+        number=41534345,
+        optional=True,
+    )
+    port_specification: str = proto.Field(
+        proto.STRING,
+        number=51590597,
+        optional=True,
+    )
+    proxy_header: str = proto.Field(
+        proto.STRING,
+        number=160374142,
+        optional=True,
+    )
+    request: str = proto.Field(
+        proto.STRING,
+        number=21951119,
+        optional=True,
+    )
+    response: str = proto.Field(
+        proto.STRING,
+        number=196547649,
+        optional=True,
+    )
+
+
+class TCPHealthCheck(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        port (int):
+            The TCP port number to which the health check
+            prober sends packets. The default value is 80.
+            Valid values are 1 through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Not supported.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how a port is selected for health checking. Can be
+            one of the following values: USE_FIXED_PORT: Specifies a
+            port number explicitly using the port field in the health
+            check. Supported by backend services for pass-through load
+            balancers and backend services for proxy load balancers. Not
+            supported by target pools. The health check supports all
+            backends supported by the backend service provided the
+            backend can be health checked. For example, GCE_VM_IP
+            network endpoint groups, GCE_VM_IP_PORT network endpoint
+            groups, and instance group backends. USE_NAMED_PORT: Not
+            supported. USE_SERVING_PORT: Provides an indirect method of
+            specifying the health check port by referring to the backend
+            service. Only supported by backend services for proxy load
+            balancers. Not supported by target pools. Not supported by
+            backend services for pass-through load balancers. Supports
+            all backends that can be health checked; for example,
+            GCE_VM_IP_PORT network endpoint groups and instance group
+            backends. For GCE_VM_IP_PORT network endpoint group
+            backends, the health check uses the port number specified
+            for each endpoint in the network endpoint group. For
+            instance group backends, the health check uses the port
+            number determined by looking up the backend service's named
+            port in the instance group's list of named ports. Check the
+            PortSpecification enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        request (str):
+            Instructs the health check prober to send
+            this exact ASCII string, up to 1024 bytes in
+            length, after establishing the TCP connection.
+
+            This field is a member of `oneof`_ ``_request``.
+        response (str):
+            Creates a content-based TCP health check. In
+            addition to establishing a TCP connection, you
+            can configure the health check to pass only when
+            the backend sends this exact response ASCII
+            string, up to 1024 bytes in length. For details,
+            see:
+            https://cloud.google.com/load-balancing/docs/health-check-concepts#criteria-protocol-ssl-tcp
+
+            This field is a member of `oneof`_ ``_response``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how a port is selected for health checking. Can be one of
+        the following values: USE_FIXED_PORT: Specifies a port number
+        explicitly using the port field in the health check. Supported by
+        backend services for pass-through load balancers and backend
+        services for proxy load balancers. Not supported by target pools.
+        The health check supports all backends supported by the backend
+        service provided the backend can be health checked. For example,
+        GCE_VM_IP network endpoint groups, GCE_VM_IP_PORT network endpoint
+        groups, and instance group backends. USE_NAMED_PORT: Not supported.
+        USE_SERVING_PORT: Provides an indirect method of specifying the
+        health check port by referring to the backend service. Only
+        supported by backend services for proxy load balancers. Not
+        supported by target pools. Not supported by backend services for
+        pass-through load balancers. Supports all backends that can be
+        health checked; for example, GCE_VM_IP_PORT network endpoint groups
+        and instance group backends. For GCE_VM_IP_PORT network endpoint
+        group backends, the health check uses the port number specified for
+        each endpoint in the network endpoint group. For instance group
+        backends, the health check uses the port number determined by
+        looking up the backend service's named port in the instance group's
+        list of named ports.
+
+        Values:
+            UNDEFINED_PORT_SPECIFICATION (0):
+                A value indicating that the enum field is not
+                set.
+            USE_FIXED_PORT (190235748):
+                The port number in the health check's port is
+                used for health checking. Applies to network
+                endpoint group and instance group backends.
+            USE_NAMED_PORT (349300671):
+                Not supported.
+            USE_SERVING_PORT (362637516):
+                For network endpoint group backends, the
+                health check uses the port number specified on
+                each endpoint in the network endpoint group. For
+                instance group backends, the health check uses
+                the port number specified for the backend
+                service's named port defined in the instance
+                group's named ports.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+
+        Values:
+            UNDEFINED_PROXY_HEADER (0):
+                A value indicating that the enum field is not
+                set.
+            NONE (2402104):
+                No description available.
+            PROXY_V1 (334352940):
+                No description available.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+    port_name: str = proto.Field(
+        proto.STRING,
+        number=41534345,
+        optional=True,
+    )
+    port_specification: str = proto.Field(
+        proto.STRING,
+        number=51590597,
+        optional=True,
+    )
+    proxy_header: str = proto.Field(
+        proto.STRING,
+        number=160374142,
+        optional=True,
+    )
+    request: str = proto.Field(
+        proto.STRING,
+        number=21951119,
+        optional=True,
+    )
+    response: str = proto.Field(
+        proto.STRING,
+        number=196547649,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
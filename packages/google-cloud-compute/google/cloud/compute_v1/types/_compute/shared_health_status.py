@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "HealthStatus",
+    },
+)
+
+
+class HealthStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        annotations (MutableMapping[str, str]):
+            Metadata defined as annotations for network
+            endpoint.
+        forwarding_rule (str):
+            URL of the forwarding rule associated with
+            the health status of the instance.
+
+            This field is a member of `oneof`_ ``_forwarding_rule``.
+        forwarding_rule_ip (str):
+            A forwarding rule IP address assigned to this
+            instance.
+
+            This field is a member of `oneof`_ ``_forwarding_rule_ip``.
+        health_state (str):
+            Health state of the IPv4 address of the
+            instance. Check the HealthState enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_health_state``.
+        instance (str):
+            URL of the instance resource.
+
+            This field is a member of `oneof`_ ``_instance``.
+        ip_address (str):
+            For target pool based Network Load Balancing,
+            it indicates the forwarding rule's IP address
+            assigned to this instance. For other types of
+            load balancing, the field indicates VM internal
+            ip.
+
+            This field is a member of `oneof`_ ``_ip_address``.
+        port (int):
+            The named port of the instance group, not
+            necessarily the port that is health-checked.
+
+            This field is a member of `oneof`_ ``_port``.
+        weight (str):
+
+            This field is a member of `oneof`_ ``_weight``.
+        weight_error (str):
+            Check the WeightError enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_weight_error``.
+    """
+
+    class HealthState(proto.Enum):
+        r"""Health state of the IPv4 address of the instance.
+
+        Values:
+            UNDEFINED_HEALTH_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            HEALTHY (439801213):
+                No description available.
+            UNHEALTHY (462118084):
+                No description available.
+        """
+        UNDEFINED_HEALTH_STATE = 0
+        HEALTHY = 439801213
+        UNHEALTHY = 462118084
+
+    class WeightError(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_WEIGHT_ERROR (0):
+                A value indicating that the enum field is not
+                set.
+            INVALID_WEIGHT (383698400):
+                The response to a Health Check probe had the
+                HTTP response header field
+                X-Load-Balancing-Endpoint-Weight, but its
+                content was invalid (i.e., not a non-negative
+                single-precision floating-point number in
+                decimal string representation).
+            MISSING_WEIGHT (384027537):
+                The response to a Health Check probe did not
+                have the HTTP response header field
+                X-Load-Balancing-Endpoint-Weight.
+            UNAVAILABLE_WEIGHT (439464295):
+                This is the value when the accompanied health
+                status is either TIMEOUT (i.e.,the Health Check
+                probe was not able to get a response in time) or
+                UNKNOWN. For the latter, it should be typically
+                because there has not been sufficient time to
+                parse and report the weight for a new backend
+                (which is with 0.0.0.0 ip address). However, it
+                can be also due to an outage case for which the
+                health status is explicitly reset to UNKNOWN.
+            WEIGHT_NONE (502428831):
+                This is the default value when WeightReportMode is DISABLE,
+                and is also the initial value when WeightReportMode has just
+                updated to ENABLE or DRY_RUN and there has not been
+                sufficient time to parse and report the backend weight.
+        """
+        UNDEFINED_WEIGHT_ERROR = 0
+        INVALID_WEIGHT = 383698400
+        MISSING_WEIGHT = 384027537
+        UNAVAILABLE_WEIGHT = 439464295
+        WEIGHT_NONE = 502428831
+
+    annotations: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=112032548,
+    )
+    forwarding_rule: str = proto.Field(
+        proto.STRING,
+        number=269964030,
+        optional=True,
+    )
+    forwarding_rule_ip: str = proto.Field(
+        proto.STRING,
+        number=172250632,
+        optional=True,
+    )
+    health_state: str = proto.Field(
+        proto.STRING,
+        number=324007150,
+        optional=True,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+        optional=True,
+    )
+    ip_address: str = proto.Field(
+        proto.STRING,
+        number=406272220,
+        optional=True,
+    )
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+    weight: str = proto.Field(
+        proto.STRING,
+        number=282149496,
+        optional=True,
+    )
+    weight_error: str = proto.Field(
+        proto.STRING,
+        number=522501505,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
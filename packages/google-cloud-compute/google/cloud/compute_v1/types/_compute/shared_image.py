@@ -0,0 +1,567 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_customer_encryption_key
+from google.cloud.compute_v1.types._compute import shared_deprecation_status
+from google.cloud.compute_v1.types._compute import shared_initial_state_config
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "Image",
+        "RawDisk",
+    },
+)
+
+
+class Image(proto.Message):
+    r"""Represents an Image resource. You can use images to create
+    boot disks for your VM instances. For more information, read
+    Images.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        architecture (str):
+            The architecture of the image. Valid values are ARM64 or
+            X86_64. Check the Architecture enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_architecture``.
+        archive_size_bytes (int):
+            Size of the image tar.gz archive stored in
+            Google Cloud Storage (in bytes).
+
+            This field is a member of `oneof`_ ``_archive_size_bytes``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        deprecated (google.cloud.compute_v1.types.DeprecationStatus):
+            The deprecation status associated with this
+            image.
+
+            This field is a member of `oneof`_ ``_deprecated``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        disk_size_gb (int):
+            Size of the image when restored onto a
+            persistent disk (in GB).
+
+            This field is a member of `oneof`_ ``_disk_size_gb``.
+        family (str):
+            The name of the image family to which this
+            image belongs. The image family name can be from
+            a publicly managed image family provided by
+            Compute Engine, or from a custom image family
+            you create. For example, centos-stream-9 is a
+            publicly available image family. For more
+            information, see Image family best practices.
+            When creating disks, you can specify an image
+            family instead of a specific image name. The
+            image family always returns its latest image
+            that is not deprecated. The name of the image
+            family must comply with RFC1035.
+
+            This field is a member of `oneof`_ ``_family``.
+        guest_os_features (MutableSequence[google.cloud.compute_v1.types.GuestOsFeature]):
+            A list of features to enable on the guest operating system.
+            Applicable only for bootable images. To see a list of
+            available options, see the guestOSfeatures[].type parameter.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        image_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            Encrypts the image using a customer-supplied
+            encryption key. After you encrypt an image with
+            a customer-supplied key, you must provide the
+            same key if you use the image later (e.g. to
+            create a disk from the image). Customer-supplied
+            encryption keys do not protect access to
+            metadata of the disk. If you do not provide an
+            encryption key when creating the image, then the
+            disk will be encrypted using an automatically
+            generated key and you do not need to provide a
+            key to use the image later.
+
+            This field is a member of `oneof`_ ``_image_encryption_key``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#image for
+            images.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this image, which is essentially a hash of the
+            labels used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update labels. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change labels, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make a get() request to
+            retrieve an image.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+            Labels to apply to this image. These can be
+            later modified by the setLabels method.
+        license_codes (MutableSequence[int]):
+            Integer license codes indicating which
+            licenses are attached to this image.
+        licenses (MutableSequence[str]):
+            Any applicable license URI.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        raw_disk (google.cloud.compute_v1.types.RawDisk):
+            The parameters of the raw disk image.
+
+            This field is a member of `oneof`_ ``_raw_disk``.
+        satisfies_pzs (bool):
+            [Output Only] Reserved for future use.
+
+            This field is a member of `oneof`_ ``_satisfies_pzs``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        shielded_instance_initial_state (google.cloud.compute_v1.types.InitialStateConfig):
+            Set the secure boot keys of shielded
+            instance.
+
+            This field is a member of `oneof`_ ``_shielded_instance_initial_state``.
+        source_disk (str):
+            URL of the source disk used to create this
+            image. For example, the following are valid
+            values: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /disks/disk -
+            projects/project/zones/zone/disks/disk -
+            zones/zone/disks/disk In order to create an
+            image, you must provide the full or partial URL
+            of one of the following: - The rawDisk.source
+            URL - The sourceDisk URL - The sourceImage URL -
+            The sourceSnapshot URL
+
+            This field is a member of `oneof`_ ``_source_disk``.
+        source_disk_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source disk. Required if the source disk is
+            protected by a customer-supplied encryption key.
+
+            This field is a member of `oneof`_ ``_source_disk_encryption_key``.
+        source_disk_id (str):
+            [Output Only] The ID value of the disk used to create this
+            image. This value may be used to determine whether the image
+            was taken from the current or a previous instance of a given
+            disk name.
+
+            This field is a member of `oneof`_ ``_source_disk_id``.
+        source_image (str):
+            URL of the source image used to create this image. The
+            following are valid formats for the URL: -
+            https://www.googleapis.com/compute/v1/projects/project_id/global/
+            images/image_name -
+            projects/project_id/global/images/image_name In order to
+            create an image, you must provide the full or partial URL of
+            one of the following: - The rawDisk.source URL - The
+            sourceDisk URL - The sourceImage URL - The sourceSnapshot
+            URL
+
+            This field is a member of `oneof`_ ``_source_image``.
+        source_image_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source image. Required if the source image is
+            protected by a customer-supplied encryption key.
+
+            This field is a member of `oneof`_ ``_source_image_encryption_key``.
+        source_image_id (str):
+            [Output Only] The ID value of the image used to create this
+            image. This value may be used to determine whether the image
+            was taken from the current or a previous instance of a given
+            image name.
+
+            This field is a member of `oneof`_ ``_source_image_id``.
+        source_snapshot (str):
+            URL of the source snapshot used to create this image. The
+            following are valid formats for the URL: -
+            https://www.googleapis.com/compute/v1/projects/project_id/global/
+            snapshots/snapshot_name -
+            projects/project_id/global/snapshots/snapshot_name In order
+            to create an image, you must provide the full or partial URL
+            of one of the following: - The rawDisk.source URL - The
+            sourceDisk URL - The sourceImage URL - The sourceSnapshot
+            URL
+
+            This field is a member of `oneof`_ ``_source_snapshot``.
+        source_snapshot_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source snapshot. Required if the source snapshot
+            is protected by a customer-supplied encryption
+            key.
+
+            This field is a member of `oneof`_ ``_source_snapshot_encryption_key``.
+        source_snapshot_id (str):
+            [Output Only] The ID value of the snapshot used to create
+            this image. This value may be used to determine whether the
+            snapshot was taken from the current or a previous instance
+            of a given snapshot name.
+
+            This field is a member of `oneof`_ ``_source_snapshot_id``.
+        source_type (str):
+            The type of the image used to create this
+            disk. The default and only valid value is RAW.
+            Check the SourceType enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_source_type``.
+        status (str):
+            [Output Only] The status of the image. An image can be used
+            to create other resources, such as instances, only after the
+            image has been successfully created and the status is set to
+            READY. Possible values are FAILED, PENDING, or READY. Check
+            the Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        storage_locations (MutableSequence[str]):
+            Cloud Storage bucket storage location of the
+            image (regional or multi-regional).
+    """
+
+    class Architecture(proto.Enum):
+        r"""The architecture of the image. Valid values are ARM64 or X86_64.
+
+        Values:
+            UNDEFINED_ARCHITECTURE (0):
+                A value indicating that the enum field is not
+                set.
+            ARCHITECTURE_UNSPECIFIED (394750507):
+                Default value indicating Architecture is not
+                set.
+            ARM64 (62547450):
+                Machines with architecture ARM64
+            X86_64 (425300551):
+                Machines with architecture X86_64
+        """
+        UNDEFINED_ARCHITECTURE = 0
+        ARCHITECTURE_UNSPECIFIED = 394750507
+        ARM64 = 62547450
+        X86_64 = 425300551
+
+    class SourceType(proto.Enum):
+        r"""The type of the image used to create this disk. The default
+        and only valid value is RAW.
+
+        Values:
+            UNDEFINED_SOURCE_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            RAW (80904):
+                No description available.
+        """
+        UNDEFINED_SOURCE_TYPE = 0
+        RAW = 80904
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the image. An image can be used to
+        create other resources, such as instances, only after the image has
+        been successfully created and the status is set to READY. Possible
+        values are FAILED, PENDING, or READY.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            DELETING (528602024):
+                Image is deleting.
+            FAILED (455706685):
+                Image creation failed due to an error.
+            PENDING (35394935):
+                Image hasn't been created as yet.
+            READY (77848963):
+                Image has been successfully created.
+        """
+        UNDEFINED_STATUS = 0
+        DELETING = 528602024
+        FAILED = 455706685
+        PENDING = 35394935
+        READY = 77848963
+
+    architecture: str = proto.Field(
+        proto.STRING,
+        number=302803283,
+        optional=True,
+    )
+    archive_size_bytes: int = proto.Field(
+        proto.INT64,
+        number=381093450,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    deprecated: shared_deprecation_status.DeprecationStatus = proto.Field(
+        proto.MESSAGE,
+        number=515138995,
+        optional=True,
+        message=shared_deprecation_status.DeprecationStatus,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    disk_size_gb: int = proto.Field(
+        proto.INT64,
+        number=316263735,
+        optional=True,
+    )
+    family: str = proto.Field(
+        proto.STRING,
+        number=328751972,
+        optional=True,
+    )
+    guest_os_features: MutableSequence[
+        shared_customer_encryption_key.GuestOsFeature
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=79294545,
+        message=shared_customer_encryption_key.GuestOsFeature,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    image_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = (
+        proto.Field(
+            proto.MESSAGE,
+            number=379512583,
+            optional=True,
+            message=shared_customer_encryption_key.CustomerEncryptionKey,
+        )
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    license_codes: MutableSequence[int] = proto.RepeatedField(
+        proto.INT64,
+        number=45482664,
+    )
+    licenses: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=337642578,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    raw_disk: "RawDisk" = proto.Field(
+        proto.MESSAGE,
+        number=503113556,
+        optional=True,
+        message="RawDisk",
+    )
+    satisfies_pzs: bool = proto.Field(
+        proto.BOOL,
+        number=480964267,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    shielded_instance_initial_state: shared_initial_state_config.InitialStateConfig = (
+        proto.Field(
+            proto.MESSAGE,
+            number=192356867,
+            optional=True,
+            message=shared_initial_state_config.InitialStateConfig,
+        )
+    )
+    source_disk: str = proto.Field(
+        proto.STRING,
+        number=451753793,
+        optional=True,
+    )
+    source_disk_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = (
+        proto.Field(
+            proto.MESSAGE,
+            number=531501153,
+            optional=True,
+            message=shared_customer_encryption_key.CustomerEncryptionKey,
+        )
+    )
+    source_disk_id: str = proto.Field(
+        proto.STRING,
+        number=454190809,
+        optional=True,
+    )
+    source_image: str = proto.Field(
+        proto.STRING,
+        number=50443319,
+        optional=True,
+    )
+    source_image_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = proto.Field(
+        proto.MESSAGE,
+        number=381503659,
+        optional=True,
+        message=shared_customer_encryption_key.CustomerEncryptionKey,
+    )
+    source_image_id: str = proto.Field(
+        proto.STRING,
+        number=55328291,
+        optional=True,
+    )
+    source_snapshot: str = proto.Field(
+        proto.STRING,
+        number=126061928,
+        optional=True,
+    )
+    source_snapshot_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = proto.Field(
+        proto.MESSAGE,
+        number=303679322,
+        optional=True,
+        message=shared_customer_encryption_key.CustomerEncryptionKey,
+    )
+    source_snapshot_id: str = proto.Field(
+        proto.STRING,
+        number=98962258,
+        optional=True,
+    )
+    source_type: str = proto.Field(
+        proto.STRING,
+        number=452245726,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    storage_locations: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=328005274,
+    )
+
+
+class RawDisk(proto.Message):
+    r"""The parameters of the raw disk image.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        container_type (str):
+            The format used to encode and transmit the
+            block device, which should be TAR. This is just
+            a container and transmission format and not a
+            runtime format. Provided by the client when the
+            disk image is created. Check the ContainerType
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_container_type``.
+        sha1_checksum (str):
+            [Deprecated] This field is deprecated. An optional SHA1
+            checksum of the disk image before unpackaging provided by
+            the client when the disk image is created.
+
+            This field is a member of `oneof`_ ``_sha1_checksum``.
+        source (str):
+            The full Google Cloud Storage URL where the raw disk image
+            archive is stored. The following are valid formats for the
+            URL: -
+            https://storage.googleapis.com/bucket_name/image_archive_name
+            - https://storage.googleapis.com/bucket_name/folder_name/
+            image_archive_name In order to create an image, you must
+            provide the full or partial URL of one of the following: -
+            The rawDisk.source URL - The sourceDisk URL - The
+            sourceImage URL - The sourceSnapshot URL
+
+            This field is a member of `oneof`_ ``_source``.
+    """
+
+    class ContainerType(proto.Enum):
+        r"""The format used to encode and transmit the block device,
+        which should be TAR. This is just a container and transmission
+        format and not a runtime format. Provided by the client when the
+        disk image is created.
+
+        Values:
+            UNDEFINED_CONTAINER_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            TAR (82821):
+                No description available.
+        """
+        UNDEFINED_CONTAINER_TYPE = 0
+        TAR = 82821
+
+    container_type: str = proto.Field(
+        proto.STRING,
+        number=318809144,
+        optional=True,
+    )
+    sha1_checksum: str = proto.Field(
+        proto.STRING,
+        number=314444349,
+        optional=True,
+    )
+    source: str = proto.Field(
+        proto.STRING,
+        number=177235995,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "FileContentBuffer",
+        "InitialStateConfig",
+    },
+)
+
+
+class FileContentBuffer(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        content (str):
+            The raw content in the secure keys file.
+
+            This field is a member of `oneof`_ ``_content``.
+        file_type (str):
+            The file type of source file.
+            Check the FileType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_file_type``.
+    """
+
+    class FileType(proto.Enum):
+        r"""The file type of source file.
+
+        Values:
+            UNDEFINED_FILE_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            BIN (65767):
+                No description available.
+            UNDEFINED (137851184):
+                No description available.
+            X509 (2674086):
+                No description available.
+        """
+        UNDEFINED_FILE_TYPE = 0
+        BIN = 65767
+        UNDEFINED = 137851184
+        X509 = 2674086
+
+    content: str = proto.Field(
+        proto.STRING,
+        number=414659705,
+        optional=True,
+    )
+    file_type: str = proto.Field(
+        proto.STRING,
+        number=294346781,
+        optional=True,
+    )
+
+
+class InitialStateConfig(proto.Message):
+    r"""Initial State for shielded instance, these are public keys
+    which are safe to store in public
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        dbs (MutableSequence[google.cloud.compute_v1.types.FileContentBuffer]):
+            The Key Database (db).
+        dbxs (MutableSequence[google.cloud.compute_v1.types.FileContentBuffer]):
+            The forbidden key database (dbx).
+        keks (MutableSequence[google.cloud.compute_v1.types.FileContentBuffer]):
+            The Key Exchange Key (KEK).
+        pk (google.cloud.compute_v1.types.FileContentBuffer):
+            The Platform Key (PK).
+
+            This field is a member of `oneof`_ ``_pk``.
+    """
+
+    dbs: MutableSequence["FileContentBuffer"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=99253,
+        message="FileContentBuffer",
+    )
+    dbxs: MutableSequence["FileContentBuffer"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=3077113,
+        message="FileContentBuffer",
+    )
+    keks: MutableSequence["FileContentBuffer"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=3288130,
+        message="FileContentBuffer",
+    )
+    pk: "FileContentBuffer" = proto.Field(
+        proto.MESSAGE,
+        number=3579,
+        optional=True,
+        message="FileContentBuffer",
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,404 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_network_interface
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DiskInstantiationConfig",
+        "InstanceTemplate",
+        "InstanceTemplateList",
+        "SourceInstanceParams",
+    },
+)
+
+
+class DiskInstantiationConfig(proto.Message):
+    r"""A specification of the desired way to instantiate a disk in
+    the instance template when its created from a source instance.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_delete (bool):
+            Specifies whether the disk will be
+            auto-deleted when the instance is deleted (but
+            not when the disk is detached from the
+            instance).
+
+            This field is a member of `oneof`_ ``_auto_delete``.
+        custom_image (str):
+            The custom source image to be used to restore
+            this disk when instantiating this instance
+            template.
+
+            This field is a member of `oneof`_ ``_custom_image``.
+        device_name (str):
+            Specifies the device name of the disk to
+            which the configurations apply to.
+
+            This field is a member of `oneof`_ ``_device_name``.
+        instantiate_from (str):
+            Specifies whether to include the disk and
+            what image to use. Possible values are: -
+            source-image: to use the same image that was
+            used to create the source instance's
+            corresponding disk. Applicable to the boot disk
+            and additional read-write disks. -
+            source-image-family: to use the same image
+            family that was used to create the source
+            instance's corresponding disk. Applicable to the
+            boot disk and additional read-write disks. -
+            custom-image: to use a user-provided image url
+            for disk creation. Applicable to the boot disk
+            and additional read-write disks. -
+            attach-read-only: to attach a read-only disk.
+            Applicable to read-only disks. - do-not-include:
+            to exclude a disk from the template. Applicable
+            to additional read-write disks, local SSDs, and
+            read-only disks. Check the InstantiateFrom enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_instantiate_from``.
+    """
+
+    class InstantiateFrom(proto.Enum):
+        r"""Specifies whether to include the disk and what image to use.
+        Possible values are: - source-image: to use the same image that
+        was used to create the source instance's corresponding disk.
+        Applicable to the boot disk and additional read-write disks. -
+        source-image-family: to use the same image family that was used
+        to create the source instance's corresponding disk. Applicable
+        to the boot disk and additional read-write disks. -
+        custom-image: to use a user-provided image url for disk
+        creation. Applicable to the boot disk and additional read-write
+        disks. - attach-read-only: to attach a read-only disk.
+        Applicable to read-only disks. - do-not-include: to exclude a
+        disk from the template. Applicable to additional read-write
+        disks, local SSDs, and read-only disks.
+
+        Values:
+            UNDEFINED_INSTANTIATE_FROM (0):
+                A value indicating that the enum field is not
+                set.
+            ATTACH_READ_ONLY (513775419):
+                Attach the existing disk in read-only mode.
+                The request will fail if the disk was attached
+                in read-write mode on the source instance.
+                Applicable to: read-only disks.
+            BLANK (63281460):
+                Create a blank disk. The disk will be created
+                unformatted. Applicable to: additional
+                read-write disks, local SSDs.
+            CUSTOM_IMAGE (196311789):
+                Use the custom image specified in the custom_image field.
+                Applicable to: boot disk, additional read-write disks.
+            DEFAULT (115302945):
+                Use the default instantiation option for the
+                corresponding type of disk. For boot disk and
+                any other R/W disks, new custom images will be
+                created from each disk. For read-only disks,
+                they will be attached in read-only mode. Local
+                SSD disks will be created as blank volumes.
+            DO_NOT_INCLUDE (104218952):
+                Do not include the disk in the instance
+                template. Applicable to: additional read-write
+                disks, local SSDs, read-only disks.
+            SOURCE_IMAGE (62631959):
+                Use the same source image used for creation
+                of the source instance's corresponding disk. The
+                request will fail if the source VM's disk was
+                created from a snapshot. Applicable to: boot
+                disk, additional read-write disks.
+            SOURCE_IMAGE_FAMILY (76850316):
+                Use the same source image family used for
+                creation of the source instance's corresponding
+                disk. The request will fail if the source image
+                of the source disk does not belong to any image
+                family. Applicable to: boot disk, additional
+                read-write disks.
+        """
+        UNDEFINED_INSTANTIATE_FROM = 0
+        ATTACH_READ_ONLY = 513775419
+        BLANK = 63281460
+        CUSTOM_IMAGE = 196311789
+        DEFAULT = 115302945
+        DO_NOT_INCLUDE = 104218952
+        SOURCE_IMAGE = 62631959
+        SOURCE_IMAGE_FAMILY = 76850316
+
+    auto_delete: bool = proto.Field(
+        proto.BOOL,
+        number=464761403,
+        optional=True,
+    )
+    custom_image: str = proto.Field(
+        proto.STRING,
+        number=184123149,
+        optional=True,
+    )
+    device_name: str = proto.Field(
+        proto.STRING,
+        number=67541716,
+        optional=True,
+    )
+    instantiate_from: str = proto.Field(
+        proto.STRING,
+        number=393383903,
+        optional=True,
+    )
+
+
+class InstanceTemplate(proto.Message):
+    r"""Represents an Instance Template resource. Google Compute Engine has
+    two Instance Template resources: \*
+    `Global </compute/docs/reference/rest/v1/instanceTemplates>`__ \*
+    `Regional </compute/docs/reference/rest/v1/regionInstanceTemplates>`__
+    You can reuse a global instance template in different regions
+    whereas you can use a regional instance template in a specified
+    region only. If you want to reduce cross-region dependency or
+    achieve data residency, use a regional instance template. To create
+    VMs, managed instance groups, and reservations, you can use either
+    global or regional instance templates. For more information, read
+    Instance Templates.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] The creation timestamp for this instance
+            template in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] A unique identifier for this instance
+            template. The server defines this identifier.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#instanceTemplate for instance templates.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        properties (google.cloud.compute_v1.types.InstanceProperties):
+            The instance properties for this instance
+            template.
+
+            This field is a member of `oneof`_ ``_properties``.
+        region (str):
+            [Output Only] URL of the region where the instance template
+            resides. Only applicable for regional resources.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] The URL for this instance template. The server
+            defines this URL.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        source_instance (str):
+            The source instance used to create the
+            template. You can provide this as a partial or
+            full URL to the resource. For example, the
+            following are valid values: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /instances/instance -
+            projects/project/zones/zone/instances/instance
+
+            This field is a member of `oneof`_ ``_source_instance``.
+        source_instance_params (google.cloud.compute_v1.types.SourceInstanceParams):
+            The source instance params to use to create
+            this instance template.
+
+            This field is a member of `oneof`_ ``_source_instance_params``.
+    """
+
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    properties: shared_network_interface.InstanceProperties = proto.Field(
+        proto.MESSAGE,
+        number=147688755,
+        optional=True,
+        message=shared_network_interface.InstanceProperties,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    source_instance: str = proto.Field(
+        proto.STRING,
+        number=396315705,
+        optional=True,
+    )
+    source_instance_params: "SourceInstanceParams" = proto.Field(
+        proto.MESSAGE,
+        number=135342156,
+        optional=True,
+        message="SourceInstanceParams",
+    )
+
+
+class InstanceTemplateList(proto.Message):
+    r"""A list of instance templates.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.InstanceTemplate]):
+            A list of InstanceTemplate resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#instanceTemplatesListResponse for instance template
+            lists.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["InstanceTemplate"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="InstanceTemplate",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class SourceInstanceParams(proto.Message):
+    r"""A specification of the parameters to use when creating the
+    instance template from a source instance.
+
+    Attributes:
+        disk_configs (MutableSequence[google.cloud.compute_v1.types.DiskInstantiationConfig]):
+            Attached disks configuration. If not
+            provided, defaults are applied: For boot disk
+            and any other R/W disks, the source images for
+            each disk will be used. For read-only disks,
+            they will be attached in read-only mode. Local
+            SSD disks will be created as blank volumes.
+    """
+
+    disk_configs: MutableSequence["DiskInstantiationConfig"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=235580623,
+        message="DiskInstantiationConfig",
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "InterconnectAttachmentConfigurationConstraints",
+        "InterconnectAttachmentConfigurationConstraintsBgpPeerASNRange",
+    },
+)
+
+
+class InterconnectAttachmentConfigurationConstraints(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        bgp_md5 (str):
+            [Output Only] Whether the attachment's BGP session
+            requires/allows/disallows BGP MD5 authentication. This can
+            take one of the following values: MD5_OPTIONAL,
+            MD5_REQUIRED, MD5_UNSUPPORTED. For example, a Cross-Cloud
+            Interconnect connection to a remote cloud provider that
+            requires BGP MD5 authentication has the
+            interconnectRemoteLocation
+            attachment_configuration_constraints.bgp_md5 field set to
+            MD5_REQUIRED, and that property is propagated to the
+            attachment. Similarly, if BGP MD5 is MD5_UNSUPPORTED, an
+            error is returned if MD5 is requested. Check the BgpMd5 enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_bgp_md5``.
+        bgp_peer_asn_ranges (MutableSequence[google.cloud.compute_v1.types.InterconnectAttachmentConfigurationConstraintsBgpPeerASNRange]):
+            [Output Only] List of ASN ranges that the remote location is
+            known to support. Formatted as an array of inclusive ranges
+            {min: min-value, max: max-value}. For example, [{min: 123,
+            max: 123}, {min: 64512, max: 65534}] allows the peer ASN to
+            be 123 or anything in the range 64512-65534. This field is
+            only advisory. Although the API accepts other ranges, these
+            are the ranges that we recommend.
+    """
+
+    class BgpMd5(proto.Enum):
+        r"""[Output Only] Whether the attachment's BGP session
+        requires/allows/disallows BGP MD5 authentication. This can take one
+        of the following values: MD5_OPTIONAL, MD5_REQUIRED,
+        MD5_UNSUPPORTED. For example, a Cross-Cloud Interconnect connection
+        to a remote cloud provider that requires BGP MD5 authentication has
+        the interconnectRemoteLocation
+        attachment_configuration_constraints.bgp_md5 field set to
+        MD5_REQUIRED, and that property is propagated to the attachment.
+        Similarly, if BGP MD5 is MD5_UNSUPPORTED, an error is returned if
+        MD5 is requested.
+
+        Values:
+            UNDEFINED_BGP_MD5 (0):
+                A value indicating that the enum field is not
+                set.
+            MD5_OPTIONAL (532156673):
+                MD5_OPTIONAL: BGP MD5 authentication is supported and can
+                optionally be configured.
+            MD5_REQUIRED (218034496):
+                MD5_REQUIRED: BGP MD5 authentication must be configured.
+            MD5_UNSUPPORTED (86962388):
+                MD5_UNSUPPORTED: BGP MD5 authentication must not be
+                configured
+        """
+        UNDEFINED_BGP_MD5 = 0
+        MD5_OPTIONAL = 532156673
+        MD5_REQUIRED = 218034496
+        MD5_UNSUPPORTED = 86962388
+
+    bgp_md5: str = proto.Field(
+        proto.STRING,
+        number=373093386,
+        optional=True,
+    )
+    bgp_peer_asn_ranges: MutableSequence[
+        "InterconnectAttachmentConfigurationConstraintsBgpPeerASNRange"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=475946370,
+        message="InterconnectAttachmentConfigurationConstraintsBgpPeerASNRange",
+    )
+
+
+class InterconnectAttachmentConfigurationConstraintsBgpPeerASNRange(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        max_ (int):
+
+            This field is a member of `oneof`_ ``_max``.
+        min_ (int):
+
+            This field is a member of `oneof`_ ``_min``.
+    """
+
+    max_: int = proto.Field(
+        proto.UINT32,
+        number=107876,
+        optional=True,
+    )
+    min_: int = proto.Field(
+        proto.UINT32,
+        number=108114,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "MetadataFilter",
+        "MetadataFilterLabelMatch",
+    },
+)
+
+
+class MetadataFilter(proto.Message):
+    r"""Opaque filter criteria used by load balancers to restrict routing
+    configuration to a limited set of load balancing proxies. Proxies
+    and sidecars involved in load balancing would typically present
+    metadata to the load balancers that need to match criteria specified
+    here. If a match takes place, the relevant configuration is made
+    available to those proxies. For each metadataFilter in this list, if
+    its filterMatchCriteria is set to MATCH_ANY, at least one of the
+    filterLabels must match the corresponding label provided in the
+    metadata. If its filterMatchCriteria is set to MATCH_ALL, then all
+    of its filterLabels must match with corresponding labels provided in
+    the metadata. An example for using metadataFilters would be: if load
+    balancing involves Envoys, they receive routing configuration when
+    values in metadataFilters match values supplied in of their XDS
+    requests to loadbalancers.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter_labels (MutableSequence[google.cloud.compute_v1.types.MetadataFilterLabelMatch]):
+            The list of label value pairs that must match
+            labels in the provided metadata based on
+            filterMatchCriteria This list must not be empty
+            and can have at the most 64 entries.
+        filter_match_criteria (str):
+            Specifies how individual filter label matches within the
+            list of filterLabels and contributes toward the overall
+            metadataFilter match. Supported values are: - MATCH_ANY: at
+            least one of the filterLabels must have a matching label in
+            the provided metadata. - MATCH_ALL: all filterLabels must
+            have matching labels in the provided metadata. Check the
+            FilterMatchCriteria enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_filter_match_criteria``.
+    """
+
+    class FilterMatchCriteria(proto.Enum):
+        r"""Specifies how individual filter label matches within the list of
+        filterLabels and contributes toward the overall metadataFilter
+        match. Supported values are: - MATCH_ANY: at least one of the
+        filterLabels must have a matching label in the provided metadata. -
+        MATCH_ALL: all filterLabels must have matching labels in the
+        provided metadata.
+
+        Values:
+            UNDEFINED_FILTER_MATCH_CRITERIA (0):
+                A value indicating that the enum field is not
+                set.
+            MATCH_ALL (180663271):
+                Specifies that all filterLabels must match
+                for the metadataFilter to be considered a match.
+            MATCH_ANY (180663346):
+                Specifies that any filterLabel must match for
+                the metadataFilter to be considered a match.
+            NOT_SET (163646646):
+                Indicates that the match criteria was not
+                set. A metadataFilter must never be created with
+                this value.
+        """
+        UNDEFINED_FILTER_MATCH_CRITERIA = 0
+        MATCH_ALL = 180663271
+        MATCH_ANY = 180663346
+        NOT_SET = 163646646
+
+    filter_labels: MutableSequence["MetadataFilterLabelMatch"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=307903142,
+        message="MetadataFilterLabelMatch",
+    )
+    filter_match_criteria: str = proto.Field(
+        proto.STRING,
+        number=239970368,
+        optional=True,
+    )
+
+
+class MetadataFilterLabelMatch(proto.Message):
+    r"""MetadataFilter label name value pairs that are expected to
+    match corresponding labels presented as metadata to the load
+    balancer.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            Name of metadata label. The name can have a
+            maximum length of 1024 characters and must be at
+            least 1 character long.
+
+            This field is a member of `oneof`_ ``_name``.
+        value (str):
+            The value of the label must match the
+            specified value. value can have a maximum length
+            of 1024 characters.
+
+            This field is a member of `oneof`_ ``_value``.
+    """
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    value: str = proto.Field(
+        proto.STRING,
+        number=111972721,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "NamedPort",
+    },
+)
+
+
+class NamedPort(proto.Message):
+    r"""The named port. For example: <"http", 80>.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            The name for this named port. The name must
+            be 1-63 characters long, and comply with
+            RFC1035.
+
+            This field is a member of `oneof`_ ``_name``.
+        port (int):
+            The port number, which can be a value between
+            1 and 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+    """
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
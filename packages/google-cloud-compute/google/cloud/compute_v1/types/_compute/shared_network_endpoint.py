@@ -0,0 +1,939 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_health_check_reference
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "BackendServiceReference",
+        "ForwardingRuleReference",
+        "HealthCheckServiceReference",
+        "HealthStatusForNetworkEndpoint",
+        "NetworkEndpoint",
+        "NetworkEndpointGroup",
+        "NetworkEndpointGroupAppEngine",
+        "NetworkEndpointGroupCloudFunction",
+        "NetworkEndpointGroupCloudRun",
+        "NetworkEndpointGroupList",
+        "NetworkEndpointGroupPscData",
+        "NetworkEndpointGroupsListNetworkEndpoints",
+        "NetworkEndpointWithHealthStatus",
+    },
+)
+
+
+class BackendServiceReference(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_service (str):
+
+            This field is a member of `oneof`_ ``_backend_service``.
+    """
+
+    backend_service: str = proto.Field(
+        proto.STRING,
+        number=306946058,
+        optional=True,
+    )
+
+
+class ForwardingRuleReference(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        forwarding_rule (str):
+
+            This field is a member of `oneof`_ ``_forwarding_rule``.
+    """
+
+    forwarding_rule: str = proto.Field(
+        proto.STRING,
+        number=269964030,
+        optional=True,
+    )
+
+
+class HealthCheckServiceReference(proto.Message):
+    r"""A full or valid partial URL to a health check service. For
+    example, the following are valid URLs: -
+    https://www.googleapis.com/compute/beta/projects/project-id/regions/us-west1/healthCheckServices/health-check-service
+    -
+    projects/project-id/regions/us-west1/healthCheckServices/health-check-service
+    - regions/us-west1/healthCheckServices/health-check-service
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        health_check_service (str):
+
+            This field is a member of `oneof`_ ``_health_check_service``.
+    """
+
+    health_check_service: str = proto.Field(
+        proto.STRING,
+        number=408374747,
+        optional=True,
+    )
+
+
+class HealthStatusForNetworkEndpoint(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_service (google.cloud.compute_v1.types.BackendServiceReference):
+            URL of the backend service associated with
+            the health state of the network endpoint.
+
+            This field is a member of `oneof`_ ``_backend_service``.
+        forwarding_rule (google.cloud.compute_v1.types.ForwardingRuleReference):
+            URL of the forwarding rule associated with
+            the health state of the network endpoint.
+
+            This field is a member of `oneof`_ ``_forwarding_rule``.
+        health_check (google.cloud.compute_v1.types.HealthCheckReference):
+            URL of the health check associated with the
+            health state of the network endpoint.
+
+            This field is a member of `oneof`_ ``_health_check``.
+        health_check_service (google.cloud.compute_v1.types.HealthCheckServiceReference):
+            URL of the health check service associated
+            with the health state of the network endpoint.
+
+            This field is a member of `oneof`_ ``_health_check_service``.
+        health_state (str):
+            Health state of the network endpoint
+            determined based on the health checks
+            configured. Check the HealthState enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_health_state``.
+    """
+
+    class HealthState(proto.Enum):
+        r"""Health state of the network endpoint determined based on the
+        health checks configured.
+
+        Values:
+            UNDEFINED_HEALTH_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            DRAINING (480455402):
+                Endpoint is being drained.
+            HEALTHY (439801213):
+                Endpoint is healthy.
+            UNHEALTHY (462118084):
+                Endpoint is unhealthy.
+            UNKNOWN (433141802):
+                Health status of the endpoint is unknown.
+        """
+        UNDEFINED_HEALTH_STATE = 0
+        DRAINING = 480455402
+        HEALTHY = 439801213
+        UNHEALTHY = 462118084
+        UNKNOWN = 433141802
+
+    backend_service: "BackendServiceReference" = proto.Field(
+        proto.MESSAGE,
+        number=306946058,
+        optional=True,
+        message="BackendServiceReference",
+    )
+    forwarding_rule: "ForwardingRuleReference" = proto.Field(
+        proto.MESSAGE,
+        number=269964030,
+        optional=True,
+        message="ForwardingRuleReference",
+    )
+    health_check: shared_health_check_reference.HealthCheckReference = proto.Field(
+        proto.MESSAGE,
+        number=308876645,
+        optional=True,
+        message=shared_health_check_reference.HealthCheckReference,
+    )
+    health_check_service: "HealthCheckServiceReference" = proto.Field(
+        proto.MESSAGE,
+        number=408374747,
+        optional=True,
+        message="HealthCheckServiceReference",
+    )
+    health_state: str = proto.Field(
+        proto.STRING,
+        number=324007150,
+        optional=True,
+    )
+
+
+class NetworkEndpoint(proto.Message):
+    r"""The network endpoint.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        annotations (MutableMapping[str, str]):
+            Metadata defined as annotations on the
+            network endpoint.
+        fqdn (str):
+            Optional fully qualified domain name of network endpoint.
+            This can only be specified when
+            NetworkEndpointGroup.network_endpoint_type is
+            NON_GCP_FQDN_PORT.
+
+            This field is a member of `oneof`_ ``_fqdn``.
+        instance (str):
+            The name for a specific VM instance that the IP address
+            belongs to. This is required for network endpoints of type
+            GCE_VM_IP_PORT. The instance must be in the same zone of
+            network endpoint group. The name must be 1-63 characters
+            long, and comply with RFC1035.
+
+            This field is a member of `oneof`_ ``_instance``.
+        ip_address (str):
+            Optional IPv4 address of network endpoint.
+            The IP address must belong to a VM in Compute
+            Engine (either the primary IP or as part of an
+            aliased IP range). If the IP address is not
+            specified, then the primary IP address for the
+            VM instance in the network that the network
+            endpoint group belongs to will be used.
+
+            This field is a member of `oneof`_ ``_ip_address``.
+        port (int):
+            Optional port number of network endpoint. If
+            not specified, the defaultPort for the network
+            endpoint group will be used.
+
+            This field is a member of `oneof`_ ``_port``.
+    """
+
+    annotations: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=112032548,
+    )
+    fqdn: str = proto.Field(
+        proto.STRING,
+        number=3150485,
+        optional=True,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+        optional=True,
+    )
+    ip_address: str = proto.Field(
+        proto.STRING,
+        number=406272220,
+        optional=True,
+    )
+    port: int = proto.Field(
+        proto.INT32,
+        number=3446913,
+        optional=True,
+    )
+
+
+class NetworkEndpointGroup(proto.Message):
+    r"""Represents a collection of network endpoints. A network
+    endpoint group (NEG) defines how a set of endpoints should be
+    reached, whether they are reachable, and where they are located.
+    For more information about using NEGs for different use cases,
+    see Network endpoint groups overview.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        annotations (MutableMapping[str, str]):
+            Metadata defined as annotations on the
+            network endpoint group.
+        app_engine (google.cloud.compute_v1.types.NetworkEndpointGroupAppEngine):
+            Only valid when networkEndpointType is
+            "SERVERLESS". Only one of cloudRun, appEngine or
+            cloudFunction may be set.
+
+            This field is a member of `oneof`_ ``_app_engine``.
+        cloud_function (google.cloud.compute_v1.types.NetworkEndpointGroupCloudFunction):
+            Only valid when networkEndpointType is
+            "SERVERLESS". Only one of cloudRun, appEngine or
+            cloudFunction may be set.
+
+            This field is a member of `oneof`_ ``_cloud_function``.
+        cloud_run (google.cloud.compute_v1.types.NetworkEndpointGroupCloudRun):
+            Only valid when networkEndpointType is
+            "SERVERLESS". Only one of cloudRun, appEngine or
+            cloudFunction may be set.
+
+            This field is a member of `oneof`_ ``_cloud_run``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        default_port (int):
+            The default port used if the port number is
+            not specified in the network endpoint.
+
+            This field is a member of `oneof`_ ``_default_port``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#networkEndpointGroup for network endpoint group.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            The URL of the network to which all network
+            endpoints in the NEG belong. Uses "default"
+            project network if unspecified.
+
+            This field is a member of `oneof`_ ``_network``.
+        network_endpoint_type (str):
+            Type of network endpoints in this network endpoint group.
+            Can be one of GCE_VM_IP, GCE_VM_IP_PORT,
+            NON_GCP_PRIVATE_IP_PORT, INTERNET_FQDN_PORT,
+            INTERNET_IP_PORT, SERVERLESS, PRIVATE_SERVICE_CONNECT. Check
+            the NetworkEndpointType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_network_endpoint_type``.
+        psc_data (google.cloud.compute_v1.types.NetworkEndpointGroupPscData):
+
+            This field is a member of `oneof`_ ``_psc_data``.
+        psc_target_service (str):
+            The target service url used to set up private
+            service connection to a Google API or a PSC
+            Producer Service Attachment. An example value
+            is: "asia-northeast3-cloudkms.googleapis.com".
+
+            This field is a member of `oneof`_ ``_psc_target_service``.
+        region (str):
+            [Output Only] The URL of the region where the network
+            endpoint group is located.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        size (int):
+            [Output only] Number of network endpoints in the network
+            endpoint group.
+
+            This field is a member of `oneof`_ ``_size``.
+        subnetwork (str):
+            Optional URL of the subnetwork to which all
+            network endpoints in the NEG belong.
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+        zone (str):
+            [Output Only] The URL of the zone where the network endpoint
+            group is located.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    class NetworkEndpointType(proto.Enum):
+        r"""Type of network endpoints in this network endpoint group. Can be one
+        of GCE_VM_IP, GCE_VM_IP_PORT, NON_GCP_PRIVATE_IP_PORT,
+        INTERNET_FQDN_PORT, INTERNET_IP_PORT, SERVERLESS,
+        PRIVATE_SERVICE_CONNECT.
+
+        Values:
+            UNDEFINED_NETWORK_ENDPOINT_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            GCE_VM_IP (401880793):
+                The network endpoint is represented by an IP
+                address.
+            GCE_VM_IP_PORT (501838375):
+                The network endpoint is represented by IP
+                address and port pair.
+            INTERNET_FQDN_PORT (404154477):
+                The network endpoint is represented by fully
+                qualified domain name and port.
+            INTERNET_IP_PORT (477719963):
+                The network endpoint is represented by an
+                internet IP address and port.
+            NON_GCP_PRIVATE_IP_PORT (336447968):
+                The network endpoint is represented by an IP
+                address and port. The endpoint belongs to a VM
+                or pod running in a customer's on-premises.
+            PRIVATE_SERVICE_CONNECT (48134724):
+                The network endpoint is either public Google
+                APIs or services exposed by other GCP Project
+                with a Service Attachment. The connection is set
+                up by private service connect
+            SERVERLESS (270492508):
+                The network endpoint is handled by specified
+                serverless infrastructure.
+        """
+        UNDEFINED_NETWORK_ENDPOINT_TYPE = 0
+        GCE_VM_IP = 401880793
+        GCE_VM_IP_PORT = 501838375
+        INTERNET_FQDN_PORT = 404154477
+        INTERNET_IP_PORT = 477719963
+        NON_GCP_PRIVATE_IP_PORT = 336447968
+        PRIVATE_SERVICE_CONNECT = 48134724
+        SERVERLESS = 270492508
+
+    annotations: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=112032548,
+    )
+    app_engine: "NetworkEndpointGroupAppEngine" = proto.Field(
+        proto.MESSAGE,
+        number=340788768,
+        optional=True,
+        message="NetworkEndpointGroupAppEngine",
+    )
+    cloud_function: "NetworkEndpointGroupCloudFunction" = proto.Field(
+        proto.MESSAGE,
+        number=519893666,
+        optional=True,
+        message="NetworkEndpointGroupCloudFunction",
+    )
+    cloud_run: "NetworkEndpointGroupCloudRun" = proto.Field(
+        proto.MESSAGE,
+        number=111060353,
+        optional=True,
+        message="NetworkEndpointGroupCloudRun",
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    default_port: int = proto.Field(
+        proto.INT32,
+        number=423377855,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    network_endpoint_type: str = proto.Field(
+        proto.STRING,
+        number=118301523,
+        optional=True,
+    )
+    psc_data: "NetworkEndpointGroupPscData" = proto.Field(
+        proto.MESSAGE,
+        number=71937481,
+        optional=True,
+        message="NetworkEndpointGroupPscData",
+    )
+    psc_target_service: str = proto.Field(
+        proto.STRING,
+        number=269132134,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    size: int = proto.Field(
+        proto.INT32,
+        number=3530753,
+        optional=True,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+        optional=True,
+    )
+
+
+class NetworkEndpointGroupAppEngine(proto.Message):
+    r"""Configuration for an App Engine network endpoint group (NEG).
+    The service is optional, may be provided explicitly or in the
+    URL mask. The version is optional and can only be provided
+    explicitly or in the URL mask when service is present. Note: App
+    Engine service must be in the same project and located in the
+    same region as the Serverless NEG.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        service (str):
+            Optional serving service. The service name is
+            case-sensitive and must be 1-63 characters long.
+            Example value: "default", "my-service".
+
+            This field is a member of `oneof`_ ``_service``.
+        url_mask (str):
+            A template to parse service and version
+            fields from a request URL. URL mask allows for
+            routing to multiple App Engine services without
+            having to create multiple Network Endpoint
+            Groups and backend services. For example, the
+            request URLs "foo1-dot-appname.appspot.com/v1"
+            and "foo1-dot-appname.appspot.com/v2" can be
+            backed by the same Serverless NEG with URL mask
+            "<service>-dot-appname.appspot.com/<version>".
+            The URL mask will parse them to { service =
+            "foo1", version = "v1" } and { service = "foo1",
+            version = "v2" } respectively.
+
+            This field is a member of `oneof`_ ``_url_mask``.
+        version (str):
+            Optional serving version. The version name is
+            case-sensitive and must be 1-100 characters
+            long. Example value: "v1", "v2".
+
+            This field is a member of `oneof`_ ``_version``.
+    """
+
+    service: str = proto.Field(
+        proto.STRING,
+        number=373540533,
+        optional=True,
+    )
+    url_mask: str = proto.Field(
+        proto.STRING,
+        number=103352252,
+        optional=True,
+    )
+    version: str = proto.Field(
+        proto.STRING,
+        number=351608024,
+        optional=True,
+    )
+
+
+class NetworkEndpointGroupCloudFunction(proto.Message):
+    r"""Configuration for a Cloud Function network endpoint group
+    (NEG). The function must be provided explicitly or in the URL
+    mask. Note: Cloud Function must be in the same project and
+    located in the same region as the Serverless NEG.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        function (str):
+            A user-defined name of the Cloud Function.
+            The function name is case-sensitive and must be
+            1-63 characters long. Example value: "func1".
+
+            This field is a member of `oneof`_ ``_function``.
+        url_mask (str):
+            A template to parse function field from a
+            request URL. URL mask allows for routing to
+            multiple Cloud Functions without having to
+            create multiple Network Endpoint Groups and
+            backend services. For example, request URLs "
+            mydomain.com/function1" and
+            "mydomain.com/function2" can be backed by the
+            same Serverless NEG with URL mask "/<function>".
+            The URL mask will parse them to { function =
+            "function1" } and { function = "function2" }
+            respectively.
+
+            This field is a member of `oneof`_ ``_url_mask``.
+    """
+
+    function: str = proto.Field(
+        proto.STRING,
+        number=307196888,
+        optional=True,
+    )
+    url_mask: str = proto.Field(
+        proto.STRING,
+        number=103352252,
+        optional=True,
+    )
+
+
+class NetworkEndpointGroupCloudRun(proto.Message):
+    r"""Configuration for a Cloud Run network endpoint group (NEG).
+    The service must be provided explicitly or in the URL mask. The
+    tag is optional, may be provided explicitly or in the URL mask.
+    Note: Cloud Run service must be in the same project and located
+    in the same region as the Serverless NEG.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        service (str):
+            Cloud Run service is the main resource of
+            Cloud Run. The service must be 1-63 characters
+            long, and comply with RFC1035. Example value:
+            "run-service".
+
+            This field is a member of `oneof`_ ``_service``.
+        tag (str):
+            Optional Cloud Run tag represents the
+            "named-revision" to provide additional
+            fine-grained traffic routing information. The
+            tag must be 1-63 characters long, and comply
+            with RFC1035. Example value: "revision-0010".
+
+            This field is a member of `oneof`_ ``_tag``.
+        url_mask (str):
+            A template to parse <service> and <tag>
+            fields from a request URL. URL mask allows for
+            routing to multiple Run services without having
+            to create multiple network endpoint groups and
+            backend services. For example, request URLs
+            "foo1.domain.com/bar1" and
+            "foo1.domain.com/bar2" can be backed by the same
+            Serverless Network Endpoint Group (NEG) with URL
+            mask "<tag>.domain.com/<service>". The URL mask
+            will parse them to { service="bar1", tag="foo1"
+            } and { service="bar2", tag="foo2" }
+            respectively.
+
+            This field is a member of `oneof`_ ``_url_mask``.
+    """
+
+    service: str = proto.Field(
+        proto.STRING,
+        number=373540533,
+        optional=True,
+    )
+    tag: str = proto.Field(
+        proto.STRING,
+        number=114586,
+        optional=True,
+    )
+    url_mask: str = proto.Field(
+        proto.STRING,
+        number=103352252,
+        optional=True,
+    )
+
+
+class NetworkEndpointGroupList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.NetworkEndpointGroup]):
+            A list of NetworkEndpointGroup resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#networkEndpointGroupList for network endpoint group
+            lists.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["NetworkEndpointGroup"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="NetworkEndpointGroup",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class NetworkEndpointGroupPscData(proto.Message):
+    r"""All data that is specifically relevant to only network endpoint
+    groups of type PRIVATE_SERVICE_CONNECT.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        consumer_psc_address (str):
+            [Output Only] Address allocated from given subnetwork for
+            PSC. This IP address acts as a VIP for a PSC NEG, allowing
+            it to act as an endpoint in L7 PSC-XLB.
+
+            This field is a member of `oneof`_ ``_consumer_psc_address``.
+        psc_connection_id (int):
+            [Output Only] The PSC connection id of the PSC Network
+            Endpoint Group Consumer.
+
+            This field is a member of `oneof`_ ``_psc_connection_id``.
+        psc_connection_status (str):
+            [Output Only] The connection status of the PSC Forwarding
+            Rule. Check the PscConnectionStatus enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_psc_connection_status``.
+    """
+
+    class PscConnectionStatus(proto.Enum):
+        r"""[Output Only] The connection status of the PSC Forwarding Rule.
+
+        Values:
+            UNDEFINED_PSC_CONNECTION_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            ACCEPTED (246714279):
+                The connection has been accepted by the
+                producer.
+            CLOSED (380163436):
+                The connection has been closed by the
+                producer and will not serve traffic going
+                forward.
+            NEEDS_ATTENTION (344491452):
+                The connection has been accepted by the
+                producer, but the producer needs to take further
+                action before the forwarding rule can serve
+                traffic.
+            PENDING (35394935):
+                The connection is pending acceptance by the
+                producer.
+            REJECTED (174130302):
+                The connection has been rejected by the
+                producer.
+            STATUS_UNSPECIFIED (42133066):
+                No description available.
+        """
+        UNDEFINED_PSC_CONNECTION_STATUS = 0
+        ACCEPTED = 246714279
+        CLOSED = 380163436
+        NEEDS_ATTENTION = 344491452
+        PENDING = 35394935
+        REJECTED = 174130302
+        STATUS_UNSPECIFIED = 42133066
+
+    consumer_psc_address: str = proto.Field(
+        proto.STRING,
+        number=452646572,
+        optional=True,
+    )
+    psc_connection_id: int = proto.Field(
+        proto.UINT64,
+        number=292082397,
+        optional=True,
+    )
+    psc_connection_status: str = proto.Field(
+        proto.STRING,
+        number=184149172,
+        optional=True,
+    )
+
+
+class NetworkEndpointGroupsListNetworkEndpoints(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.NetworkEndpointWithHealthStatus]):
+            A list of NetworkEndpointWithHealthStatus
+            resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#networkEndpointGroupsListNetworkEndpoints for the
+            list of network endpoints in the specified network endpoint
+            group.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["NetworkEndpointWithHealthStatus"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="NetworkEndpointWithHealthStatus",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class NetworkEndpointWithHealthStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        healths (MutableSequence[google.cloud.compute_v1.types.HealthStatusForNetworkEndpoint]):
+            [Output only] The health status of network endpoint;
+        network_endpoint (google.cloud.compute_v1.types.NetworkEndpoint):
+            [Output only] The network endpoint;
+
+            This field is a member of `oneof`_ ``_network_endpoint``.
+    """
+
+    healths: MutableSequence["HealthStatusForNetworkEndpoint"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=258689431,
+        message="HealthStatusForNetworkEndpoint",
+    )
+    network_endpoint: "NetworkEndpoint" = proto.Field(
+        proto.MESSAGE,
+        number=56789126,
+        optional=True,
+        message="NetworkEndpoint",
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,2077 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_accelerator_config
+from google.cloud.compute_v1.types._compute import shared_customer_encryption_key
+from google.cloud.compute_v1.types._compute import shared_duration
+from google.cloud.compute_v1.types._compute import shared_initial_state_config
+from google.cloud.compute_v1.types._compute import shared_metadata
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AccessConfig",
+        "AdvancedMachineFeatures",
+        "AliasIpRange",
+        "AttachedDisk",
+        "AttachedDiskInitializeParams",
+        "ConfidentialInstanceConfig",
+        "InstanceProperties",
+        "NetworkInterface",
+        "NetworkPerformanceConfig",
+        "ReservationAffinity",
+        "Scheduling",
+        "SchedulingNodeAffinity",
+        "ServiceAccount",
+        "ShieldedInstanceConfig",
+        "Tags",
+    },
+)
+
+
+class AccessConfig(proto.Message):
+    r"""An access configuration attached to an instance's network
+    interface. Only one access config per instance is supported.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        external_ipv6 (str):
+            Applies to ipv6AccessConfigs only. The first
+            IPv6 address of the external IPv6 range
+            associated with this instance, prefix length is
+            stored in externalIpv6PrefixLength in
+            ipv6AccessConfig. To use a static external IP
+            address, it must be unused and in the same
+            region as the instance's zone. If not specified,
+            Google Cloud will automatically assign an
+            external IPv6 address from the instance's
+            subnetwork.
+
+            This field is a member of `oneof`_ ``_external_ipv6``.
+        external_ipv6_prefix_length (int):
+            Applies to ipv6AccessConfigs only. The prefix
+            length of the external IPv6 range.
+
+            This field is a member of `oneof`_ ``_external_ipv6_prefix_length``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#accessConfig for access configs.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            The name of this access configuration. In
+            accessConfigs (IPv4), the default and
+            recommended name is External NAT, but you can
+            use any arbitrary string, such as My external IP
+            or Network Access. In ipv6AccessConfigs, the
+            recommend name is External IPv6.
+
+            This field is a member of `oneof`_ ``_name``.
+        nat_i_p (str):
+            Applies to accessConfigs (IPv4) only. An
+            external IP address associated with this
+            instance. Specify an unused static external IP
+            address available to the project or leave this
+            field undefined to use an IP from a shared
+            ephemeral IP address pool. If you specify a
+            static external IP address, it must live in the
+            same region as the zone of the instance.
+
+            This field is a member of `oneof`_ ``_nat_i_p``.
+        network_tier (str):
+            This signifies the networking tier used for
+            configuring this access configuration and can
+            only take the following values: PREMIUM,
+            STANDARD. If an AccessConfig is specified
+            without a valid external IP address, an
+            ephemeral IP will be created with this
+            networkTier. If an AccessConfig with a valid
+            external IP address is specified, it must match
+            that of the networkTier associated with the
+            Address resource owning that IP. Check the
+            NetworkTier enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_network_tier``.
+        public_ptr_domain_name (str):
+            The DNS domain name for the public PTR record. You can set
+            this field only if the ``setPublicPtr`` field is enabled in
+            accessConfig. If this field is unspecified in
+            ipv6AccessConfig, a default PTR record will be createc for
+            first IP in associated external IPv6 range.
+
+            This field is a member of `oneof`_ ``_public_ptr_domain_name``.
+        security_policy (str):
+            [Output Only] The resource URL for the security policy
+            associated with this access config.
+
+            This field is a member of `oneof`_ ``_security_policy``.
+        set_public_ptr (bool):
+            Specifies whether a public DNS 'PTR' record
+            should be created to map the external IP address
+            of the instance to a DNS domain name. This field
+            is not used in ipv6AccessConfig. A default PTR
+            record will be created if the VM has external
+            IPv6 range associated.
+
+            This field is a member of `oneof`_ ``_set_public_ptr``.
+        type_ (str):
+            The type of configuration. In accessConfigs (IPv4), the
+            default and only option is ONE_TO_ONE_NAT. In
+            ipv6AccessConfigs, the default and only option is
+            DIRECT_IPV6. Check the Type enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class NetworkTier(proto.Enum):
+        r"""This signifies the networking tier used for configuring this
+        access configuration and can only take the following values:
+        PREMIUM, STANDARD. If an AccessConfig is specified without a
+        valid external IP address, an ephemeral IP will be created with
+        this networkTier. If an AccessConfig with a valid external IP
+        address is specified, it must match that of the networkTier
+        associated with the Address resource owning that IP.
+
+        Values:
+            UNDEFINED_NETWORK_TIER (0):
+                A value indicating that the enum field is not
+                set.
+            FIXED_STANDARD (310464328):
+                Public internet quality with fixed bandwidth.
+            PREMIUM (399530551):
+                High quality, Google-grade network tier,
+                support for all networking products.
+            STANDARD (484642493):
+                Public internet quality, only limited support
+                for other networking products.
+            STANDARD_OVERRIDES_FIXED_STANDARD (465847234):
+                (Output only) Temporary tier for FIXED_STANDARD when fixed
+                standard tier is expired or not configured.
+        """
+        UNDEFINED_NETWORK_TIER = 0
+        FIXED_STANDARD = 310464328
+        PREMIUM = 399530551
+        STANDARD = 484642493
+        STANDARD_OVERRIDES_FIXED_STANDARD = 465847234
+
+    class Type(proto.Enum):
+        r"""The type of configuration. In accessConfigs (IPv4), the default and
+        only option is ONE_TO_ONE_NAT. In ipv6AccessConfigs, the default and
+        only option is DIRECT_IPV6.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            DIRECT_IPV6 (4397213):
+                No description available.
+            ONE_TO_ONE_NAT (84090205):
+                No description available.
+        """
+        UNDEFINED_TYPE = 0
+        DIRECT_IPV6 = 4397213
+        ONE_TO_ONE_NAT = 84090205
+
+    external_ipv6: str = proto.Field(
+        proto.STRING,
+        number=532703707,
+        optional=True,
+    )
+    external_ipv6_prefix_length: int = proto.Field(
+        proto.INT32,
+        number=425672143,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    nat_i_p: str = proto.Field(
+        proto.STRING,
+        number=117634556,
+        optional=True,
+    )
+    network_tier: str = proto.Field(
+        proto.STRING,
+        number=517397843,
+        optional=True,
+    )
+    public_ptr_domain_name: str = proto.Field(
+        proto.STRING,
+        number=316599167,
+        optional=True,
+    )
+    security_policy: str = proto.Field(
+        proto.STRING,
+        number=171082513,
+        optional=True,
+    )
+    set_public_ptr: bool = proto.Field(
+        proto.BOOL,
+        number=523870229,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+class AdvancedMachineFeatures(proto.Message):
+    r"""Specifies options for controlling advanced machine features.
+    Options that would traditionally be configured in a BIOS belong
+    here. Features that require operating system support may have
+    corresponding entries in the GuestOsFeatures of an Image (e.g.,
+    whether or not the OS in the Image supports nested
+    virtualization being enabled or disabled).
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enable_nested_virtualization (bool):
+            Whether to enable nested virtualization or
+            not (default is false).
+
+            This field is a member of `oneof`_ ``_enable_nested_virtualization``.
+        enable_uefi_networking (bool):
+            Whether to enable UEFI networking for
+            instance creation.
+
+            This field is a member of `oneof`_ ``_enable_uefi_networking``.
+        threads_per_core (int):
+            The number of threads per physical core. To
+            disable simultaneous multithreading (SMT) set
+            this to 1. If unset, the maximum number of
+            threads supported per core by the underlying
+            processor is assumed.
+
+            This field is a member of `oneof`_ ``_threads_per_core``.
+        visible_core_count (int):
+            The number of physical cores to expose to an
+            instance. Multiply by the number of threads per
+            core to compute the total number of virtual CPUs
+            to expose to the instance. If unset, the number
+            of cores is inferred from the instance's nominal
+            CPU count and the underlying platform's SMT
+            width.
+
+            This field is a member of `oneof`_ ``_visible_core_count``.
+    """
+
+    enable_nested_virtualization: bool = proto.Field(
+        proto.BOOL,
+        number=16639365,
+        optional=True,
+    )
+    enable_uefi_networking: bool = proto.Field(
+        proto.BOOL,
+        number=334485668,
+        optional=True,
+    )
+    threads_per_core: int = proto.Field(
+        proto.INT32,
+        number=352611671,
+        optional=True,
+    )
+    visible_core_count: int = proto.Field(
+        proto.INT32,
+        number=193198684,
+        optional=True,
+    )
+
+
+class AliasIpRange(proto.Message):
+    r"""An alias IP range attached to an instance's network
+    interface.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ip_cidr_range (str):
+            The IP alias ranges to allocate for this
+            interface. This IP CIDR range must belong to the
+            specified subnetwork and cannot contain IP
+            addresses reserved by system or used by other
+            network interfaces. This range may be a single
+            IP address (such as 10.2.3.4), a netmask (such
+            as /24) or a CIDR-formatted string (such as
+            10.1.2.0/24).
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        subnetwork_range_name (str):
+            The name of a subnetwork secondary IP range
+            from which to allocate an IP alias range. If not
+            specified, the primary range of the subnetwork
+            is used.
+
+            This field is a member of `oneof`_ ``_subnetwork_range_name``.
+    """
+
+    ip_cidr_range: str = proto.Field(
+        proto.STRING,
+        number=98117322,
+        optional=True,
+    )
+    subnetwork_range_name: str = proto.Field(
+        proto.STRING,
+        number=387995966,
+        optional=True,
+    )
+
+
+class AttachedDisk(proto.Message):
+    r"""An instance-attached disk resource.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        architecture (str):
+            [Output Only] The architecture of the attached disk. Valid
+            values are ARM64 or X86_64. Check the Architecture enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_architecture``.
+        auto_delete (bool):
+            Specifies whether the disk will be
+            auto-deleted when the instance is deleted (but
+            not when the disk is detached from the
+            instance).
+
+            This field is a member of `oneof`_ ``_auto_delete``.
+        boot (bool):
+            Indicates that this is a boot disk. The
+            virtual machine will use the first partition of
+            the disk for its root filesystem.
+
+            This field is a member of `oneof`_ ``_boot``.
+        device_name (str):
+            Specifies a unique device name of your choice that is
+            reflected into the /dev/disk/by-id/google-\* tree of a Linux
+            operating system running within the instance. This name can
+            be used to reference the device for mounting, resizing, and
+            so on, from within the instance. If not specified, the
+            server chooses a default device name to apply to this disk,
+            in the form persistent-disk-x, where x is a number assigned
+            by Google Compute Engine. This field is only applicable for
+            persistent disks.
+
+            This field is a member of `oneof`_ ``_device_name``.
+        disk_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            Encrypts or decrypts a disk using a
+            customer-supplied encryption key. If you are
+            creating a new disk, this field encrypts the new
+            disk using an encryption key that you provide.
+            If you are attaching an existing disk that is
+            already encrypted, this field decrypts the disk
+            using the customer-supplied encryption key. If
+            you encrypt a disk using a customer-supplied
+            key, you must provide the same key again when
+            you attempt to use this resource at a later
+            time. For example, you must provide the key when
+            you create a snapshot or an image from the disk
+            or when you attach the disk to a virtual machine
+            instance. If you do not provide an encryption
+            key, then the disk will be encrypted using an
+            automatically generated key and you do not need
+            to provide a key to use the disk later. Instance
+            templates do not store customer-supplied
+            encryption keys, so you cannot use your own keys
+            to encrypt disks in a managed instance group.
+
+            This field is a member of `oneof`_ ``_disk_encryption_key``.
+        disk_size_gb (int):
+            The size of the disk in GB.
+
+            This field is a member of `oneof`_ ``_disk_size_gb``.
+        force_attach (bool):
+            [Input Only] Whether to force attach the regional disk even
+            if it's currently attached to another instance. If you try
+            to force attach a zonal disk to an instance, you will
+            receive an error.
+
+            This field is a member of `oneof`_ ``_force_attach``.
+        guest_os_features (MutableSequence[google.cloud.compute_v1.types.GuestOsFeature]):
+            A list of features to enable on the guest
+            operating system. Applicable only for bootable
+            images. Read Enabling guest operating system
+            features to see a list of available options.
+        index (int):
+            [Output Only] A zero-based index to this disk, where 0 is
+            reserved for the boot disk. If you have many disks attached
+            to an instance, each disk would have a unique index number.
+
+            This field is a member of `oneof`_ ``_index``.
+        initialize_params (google.cloud.compute_v1.types.AttachedDiskInitializeParams):
+            [Input Only] Specifies the parameters for a new disk that
+            will be created alongside the new instance. Use
+            initialization parameters to create boot disks or local SSDs
+            attached to the new instance. This property is mutually
+            exclusive with the source property; you can only define one
+            or the other, but not both.
+
+            This field is a member of `oneof`_ ``_initialize_params``.
+        interface (str):
+            Specifies the disk interface to use for
+            attaching this disk, which is either SCSI or
+            NVME. For most machine types, the default is
+            SCSI. Local SSDs can use either NVME or SCSI. In
+            certain configurations, persistent disks can use
+            NVMe. For more information, see About persistent
+            disks. Check the Interface enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_interface``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#attachedDisk for attached disks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        licenses (MutableSequence[str]):
+            [Output Only] Any valid publicly visible licenses.
+        mode (str):
+            The mode in which to attach this disk, either READ_WRITE or
+            READ_ONLY. If not specified, the default is to attach the
+            disk in READ_WRITE mode. Check the Mode enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_mode``.
+        saved_state (str):
+            For LocalSSD disks on VM Instances in STOPPED or SUSPENDED
+            state, this field is set to PRESERVED if the LocalSSD data
+            has been saved to a persistent location by customer request.
+            (see the discard_local_ssd option on Stop/Suspend).
+            Read-only in the api. Check the SavedState enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_saved_state``.
+        shielded_instance_initial_state (google.cloud.compute_v1.types.InitialStateConfig):
+            [Output Only] shielded vm initial state stored on disk
+
+            This field is a member of `oneof`_ ``_shielded_instance_initial_state``.
+        source (str):
+            Specifies a valid partial or full URL to an
+            existing Persistent Disk resource. When creating
+            a new instance, one of
+            initializeParams.sourceImage or
+            initializeParams.sourceSnapshot or disks.source
+            is required except for local SSD. If desired,
+            you can also attach existing non-root persistent
+            disks using this property. This field is only
+            applicable for persistent disks. Note that for
+            InstanceTemplate, specify the disk name for
+            zonal disk, and the URL for regional disk.
+
+            This field is a member of `oneof`_ ``_source``.
+        type_ (str):
+            Specifies the type of the disk, either
+            SCRATCH or PERSISTENT. If not specified, the
+            default is PERSISTENT. Check the Type enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Architecture(proto.Enum):
+        r"""[Output Only] The architecture of the attached disk. Valid values
+        are ARM64 or X86_64.
+
+        Values:
+            UNDEFINED_ARCHITECTURE (0):
+                A value indicating that the enum field is not
+                set.
+            ARCHITECTURE_UNSPECIFIED (394750507):
+                Default value indicating Architecture is not
+                set.
+            ARM64 (62547450):
+                Machines with architecture ARM64
+            X86_64 (425300551):
+                Machines with architecture X86_64
+        """
+        UNDEFINED_ARCHITECTURE = 0
+        ARCHITECTURE_UNSPECIFIED = 394750507
+        ARM64 = 62547450
+        X86_64 = 425300551
+
+    class Interface(proto.Enum):
+        r"""Specifies the disk interface to use for attaching this disk,
+        which is either SCSI or NVME. For most machine types, the
+        default is SCSI. Local SSDs can use either NVME or SCSI. In
+        certain configurations, persistent disks can use NVMe. For more
+        information, see About persistent disks.
+
+        Values:
+            UNDEFINED_INTERFACE (0):
+                A value indicating that the enum field is not
+                set.
+            NVME (2408800):
+                No description available.
+            SCSI (2539686):
+                No description available.
+        """
+        UNDEFINED_INTERFACE = 0
+        NVME = 2408800
+        SCSI = 2539686
+
+    class Mode(proto.Enum):
+        r"""The mode in which to attach this disk, either READ_WRITE or
+        READ_ONLY. If not specified, the default is to attach the disk in
+        READ_WRITE mode.
+
+        Values:
+            UNDEFINED_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            READ_ONLY (91950261):
+                Attaches this disk in read-only mode.
+                Multiple virtual machines can use a disk in
+                read-only mode at a time.
+            READ_WRITE (173607894):
+                *[Default]* Attaches this disk in read-write mode. Only one
+                virtual machine at a time can be attached to a disk in
+                read-write mode.
+        """
+        UNDEFINED_MODE = 0
+        READ_ONLY = 91950261
+        READ_WRITE = 173607894
+
+    class SavedState(proto.Enum):
+        r"""For LocalSSD disks on VM Instances in STOPPED or SUSPENDED state,
+        this field is set to PRESERVED if the LocalSSD data has been saved
+        to a persistent location by customer request. (see the
+        discard_local_ssd option on Stop/Suspend). Read-only in the api.
+
+        Values:
+            UNDEFINED_SAVED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            DISK_SAVED_STATE_UNSPECIFIED (391290831):
+                *[Default]* Disk state has not been preserved.
+            PRESERVED (254159736):
+                Disk state has been preserved.
+        """
+        UNDEFINED_SAVED_STATE = 0
+        DISK_SAVED_STATE_UNSPECIFIED = 391290831
+        PRESERVED = 254159736
+
+    class Type(proto.Enum):
+        r"""Specifies the type of the disk, either SCRATCH or PERSISTENT.
+        If not specified, the default is PERSISTENT.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            PERSISTENT (460683927):
+                No description available.
+            SCRATCH (496778970):
+                No description available.
+        """
+        UNDEFINED_TYPE = 0
+        PERSISTENT = 460683927
+        SCRATCH = 496778970
+
+    architecture: str = proto.Field(
+        proto.STRING,
+        number=302803283,
+        optional=True,
+    )
+    auto_delete: bool = proto.Field(
+        proto.BOOL,
+        number=464761403,
+        optional=True,
+    )
+    boot: bool = proto.Field(
+        proto.BOOL,
+        number=3029746,
+        optional=True,
+    )
+    device_name: str = proto.Field(
+        proto.STRING,
+        number=67541716,
+        optional=True,
+    )
+    disk_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = (
+        proto.Field(
+            proto.MESSAGE,
+            number=271660677,
+            optional=True,
+            message=shared_customer_encryption_key.CustomerEncryptionKey,
+        )
+    )
+    disk_size_gb: int = proto.Field(
+        proto.INT64,
+        number=316263735,
+        optional=True,
+    )
+    force_attach: bool = proto.Field(
+        proto.BOOL,
+        number=142758425,
+        optional=True,
+    )
+    guest_os_features: MutableSequence[
+        shared_customer_encryption_key.GuestOsFeature
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=79294545,
+        message=shared_customer_encryption_key.GuestOsFeature,
+    )
+    index: int = proto.Field(
+        proto.INT32,
+        number=100346066,
+        optional=True,
+    )
+    initialize_params: "AttachedDiskInitializeParams" = proto.Field(
+        proto.MESSAGE,
+        number=17697045,
+        optional=True,
+        message="AttachedDiskInitializeParams",
+    )
+    interface: str = proto.Field(
+        proto.STRING,
+        number=502623545,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    licenses: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=337642578,
+    )
+    mode: str = proto.Field(
+        proto.STRING,
+        number=3357091,
+        optional=True,
+    )
+    saved_state: str = proto.Field(
+        proto.STRING,
+        number=411587801,
+        optional=True,
+    )
+    shielded_instance_initial_state: shared_initial_state_config.InitialStateConfig = (
+        proto.Field(
+            proto.MESSAGE,
+            number=192356867,
+            optional=True,
+            message=shared_initial_state_config.InitialStateConfig,
+        )
+    )
+    source: str = proto.Field(
+        proto.STRING,
+        number=177235995,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+class AttachedDiskInitializeParams(proto.Message):
+    r"""[Input Only] Specifies the parameters for a new disk that will be
+    created alongside the new instance. Use initialization parameters to
+    create boot disks or local SSDs attached to the new instance. This
+    field is persisted and returned for instanceTemplate and not
+    returned in the context of instance. This property is mutually
+    exclusive with the source property; you can only define one or the
+    other, but not both.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        architecture (str):
+            The architecture of the attached disk. Valid values are
+            arm64 or x86_64. Check the Architecture enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_architecture``.
+        description (str):
+            An optional description. Provide this
+            property when creating the disk.
+
+            This field is a member of `oneof`_ ``_description``.
+        disk_name (str):
+            Specifies the disk name. If not specified,
+            the default is to use the name of the instance.
+            If a disk with the same name already exists in
+            the given region, the existing disk is attached
+            to the new instance and the new disk is not
+            created.
+
+            This field is a member of `oneof`_ ``_disk_name``.
+        disk_size_gb (int):
+            Specifies the size of the disk in base-2 GB.
+            The size must be at least 10 GB. If you specify
+            a sourceImage, which is required for boot disks,
+            the default size is the size of the sourceImage.
+            If you do not specify a sourceImage, the default
+            disk size is 500 GB.
+
+            This field is a member of `oneof`_ ``_disk_size_gb``.
+        disk_type (str):
+            Specifies the disk type to use to create the
+            instance. If not specified, the default is
+            pd-standard, specified using the full URL. For
+            example:
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /diskTypes/pd-standard For a full list of
+            acceptable values, see Persistent disk types. If
+            you specify this field when creating a VM, you
+            can provide either the full or partial URL. For
+            example, the following values are valid: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /diskTypes/diskType -
+            projects/project/zones/zone/diskTypes/diskType -
+            zones/zone/diskTypes/diskType If you specify
+            this field when creating or updating an instance
+            template or all-instances configuration, specify
+            the type of the disk, not the URL. For example:
+            pd-standard.
+
+            This field is a member of `oneof`_ ``_disk_type``.
+        labels (MutableMapping[str, str]):
+            Labels to apply to this disk. These can be
+            later modified by the disks.setLabels method.
+            This field is only applicable for persistent
+            disks.
+        licenses (MutableSequence[str]):
+            A list of publicly visible licenses. Reserved
+            for Google's use.
+        on_update_action (str):
+            Specifies which action to take on instance
+            update with this disk. Default is to use the
+            existing disk. Check the OnUpdateAction enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_on_update_action``.
+        provisioned_iops (int):
+            Indicates how many IOPS to provision for the
+            disk. This sets the number of I/O operations per
+            second that the disk can handle. Values must be
+            between 10,000 and 120,000. For more details,
+            see the Extreme persistent disk documentation.
+
+            This field is a member of `oneof`_ ``_provisioned_iops``.
+        provisioned_throughput (int):
+            Indicates how much throughput to provision
+            for the disk. This sets the number of throughput
+            mb per second that the disk can handle. Values
+            must be between 1 and 7,124.
+
+            This field is a member of `oneof`_ ``_provisioned_throughput``.
+        replica_zones (MutableSequence[str]):
+            Required for each regional disk associated
+            with the instance. Specify the URLs of the zones
+            where the disk should be replicated to. You must
+            provide exactly two replica zones, and one zone
+            must be the same as the instance zone.
+        resource_manager_tags (MutableMapping[str, str]):
+            Resource manager tags to be bound to the disk. Tag keys and
+            values have the same definition as resource manager tags.
+            Keys must be in the format ``tagKeys/{tag_key_id}``, and
+            values are in the format ``tagValues/456``. The field is
+            ignored (both PUT & PATCH) when empty.
+        resource_policies (MutableSequence[str]):
+            Resource policies applied to this disk for
+            automatic snapshot creations. Specified using
+            the full or partial URL. For instance template,
+            specify only the resource policy name.
+        source_image (str):
+            The source image to create this disk. When
+            creating a new instance, one of
+            initializeParams.sourceImage or
+            initializeParams.sourceSnapshot or disks.source
+            is required except for local SSD. To create a
+            disk with one of the public operating system
+            images, specify the image by its family name.
+            For example, specify family/debian-9 to use the
+            latest Debian 9 image:
+            projects/debian-cloud/global/images/family/debian-9
+            Alternatively, use a specific version of a
+            public operating system image:
+            projects/debian-cloud/global/images/debian-9-stretch-vYYYYMMDD
+            To create a disk with a custom image that you
+            created, specify the image name in the following
+            format: global/images/my-custom-image You can
+            also specify a custom image by its image family,
+            which returns the latest version of the image in
+            that family. Replace the image name with
+            family/family-name:
+            global/images/family/my-image-family If the
+            source image is deleted later, this field will
+            not be set.
+
+            This field is a member of `oneof`_ ``_source_image``.
+        source_image_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source image. Required if the source image is
+            protected by a customer-supplied encryption key.
+            InstanceTemplate and InstancePropertiesPatch do
+            not store customer-supplied encryption keys, so
+            you cannot create disks for instances in a
+            managed instance group if the source images are
+            encrypted with your own keys.
+
+            This field is a member of `oneof`_ ``_source_image_encryption_key``.
+        source_snapshot (str):
+            The source snapshot to create this disk. When
+            creating a new instance, one of
+            initializeParams.sourceSnapshot or
+            initializeParams.sourceImage or disks.source is
+            required except for local SSD. To create a disk
+            with a snapshot that you created, specify the
+            snapshot name in the following format:
+            global/snapshots/my-backup If the source
+            snapshot is deleted later, this field will not
+            be set.
+
+            This field is a member of `oneof`_ ``_source_snapshot``.
+        source_snapshot_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source snapshot.
+
+            This field is a member of `oneof`_ ``_source_snapshot_encryption_key``.
+    """
+
+    class Architecture(proto.Enum):
+        r"""The architecture of the attached disk. Valid values are arm64 or
+        x86_64.
+
+        Values:
+            UNDEFINED_ARCHITECTURE (0):
+                A value indicating that the enum field is not
+                set.
+            ARCHITECTURE_UNSPECIFIED (394750507):
+                Default value indicating Architecture is not
+                set.
+            ARM64 (62547450):
+                Machines with architecture ARM64
+            X86_64 (425300551):
+                Machines with architecture X86_64
+        """
+        UNDEFINED_ARCHITECTURE = 0
+        ARCHITECTURE_UNSPECIFIED = 394750507
+        ARM64 = 62547450
+        X86_64 = 425300551
+
+    class OnUpdateAction(proto.Enum):
+        r"""Specifies which action to take on instance update with this
+        disk. Default is to use the existing disk.
+
+        Values:
+            UNDEFINED_ON_UPDATE_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+            RECREATE_DISK (494767853):
+                Always recreate the disk.
+            RECREATE_DISK_IF_SOURCE_CHANGED (398099712):
+                Recreate the disk if source (image, snapshot)
+                of this disk is different from source of
+                existing disk.
+            USE_EXISTING_DISK (232682233):
+                Use the existing disk, this is the default
+                behaviour.
+        """
+        UNDEFINED_ON_UPDATE_ACTION = 0
+        RECREATE_DISK = 494767853
+        RECREATE_DISK_IF_SOURCE_CHANGED = 398099712
+        USE_EXISTING_DISK = 232682233
+
+    architecture: str = proto.Field(
+        proto.STRING,
+        number=302803283,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    disk_name: str = proto.Field(
+        proto.STRING,
+        number=92807149,
+        optional=True,
+    )
+    disk_size_gb: int = proto.Field(
+        proto.INT64,
+        number=316263735,
+        optional=True,
+    )
+    disk_type: str = proto.Field(
+        proto.STRING,
+        number=93009052,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    licenses: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=337642578,
+    )
+    on_update_action: str = proto.Field(
+        proto.STRING,
+        number=202451980,
+        optional=True,
+    )
+    provisioned_iops: int = proto.Field(
+        proto.INT64,
+        number=186769108,
+        optional=True,
+    )
+    provisioned_throughput: int = proto.Field(
+        proto.INT64,
+        number=526524181,
+        optional=True,
+    )
+    replica_zones: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=48438272,
+    )
+    resource_manager_tags: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=377671164,
+    )
+    resource_policies: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=22220385,
+    )
+    source_image: str = proto.Field(
+        proto.STRING,
+        number=50443319,
+        optional=True,
+    )
+    source_image_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = proto.Field(
+        proto.MESSAGE,
+        number=381503659,
+        optional=True,
+        message=shared_customer_encryption_key.CustomerEncryptionKey,
+    )
+    source_snapshot: str = proto.Field(
+        proto.STRING,
+        number=126061928,
+        optional=True,
+    )
+    source_snapshot_encryption_key: shared_customer_encryption_key.CustomerEncryptionKey = proto.Field(
+        proto.MESSAGE,
+        number=303679322,
+        optional=True,
+        message=shared_customer_encryption_key.CustomerEncryptionKey,
+    )
+
+
+class ConfidentialInstanceConfig(proto.Message):
+    r"""A set of Confidential Instance options.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enable_confidential_compute (bool):
+            Defines whether the instance should have
+            confidential compute enabled.
+
+            This field is a member of `oneof`_ ``_enable_confidential_compute``.
+    """
+
+    enable_confidential_compute: bool = proto.Field(
+        proto.BOOL,
+        number=102135228,
+        optional=True,
+    )
+
+
+class InstanceProperties(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        advanced_machine_features (google.cloud.compute_v1.types.AdvancedMachineFeatures):
+            Controls for advanced machine-related
+            behavior features. Note that for MachineImage,
+            this is not supported yet.
+
+            This field is a member of `oneof`_ ``_advanced_machine_features``.
+        can_ip_forward (bool):
+            Enables instances created based on these
+            properties to send packets with source IP
+            addresses other than their own and receive
+            packets with destination IP addresses other than
+            their own. If these instances will be used as an
+            IP gateway or it will be set as the next-hop in
+            a Route resource, specify true. If unsure, leave
+            this set to false. See the Enable IP forwarding
+            documentation for more information.
+
+            This field is a member of `oneof`_ ``_can_ip_forward``.
+        confidential_instance_config (google.cloud.compute_v1.types.ConfidentialInstanceConfig):
+            Specifies the Confidential Instance options.
+            Note that for MachineImage, this is not
+            supported yet.
+
+            This field is a member of `oneof`_ ``_confidential_instance_config``.
+        description (str):
+            An optional text description for the
+            instances that are created from these
+            properties.
+
+            This field is a member of `oneof`_ ``_description``.
+        disks (MutableSequence[google.cloud.compute_v1.types.AttachedDisk]):
+            An array of disks that are associated with
+            the instances that are created from these
+            properties.
+        guest_accelerators (MutableSequence[google.cloud.compute_v1.types.AcceleratorConfig]):
+            A list of guest accelerator cards' type and
+            count to use for instances created from these
+            properties.
+        key_revocation_action_type (str):
+            KeyRevocationActionType of the instance.
+            Supported options are "STOP" and "NONE". The
+            default value is "NONE" if it is not specified.
+            Check the KeyRevocationActionType enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_key_revocation_action_type``.
+        labels (MutableMapping[str, str]):
+            Labels to apply to instances that are created
+            from these properties.
+        machine_type (str):
+            The machine type to use for instances that
+            are created from these properties.
+
+            This field is a member of `oneof`_ ``_machine_type``.
+        metadata (google.cloud.compute_v1.types.Metadata):
+            The metadata key/value pairs to assign to
+            instances that are created from these
+            properties. These pairs can consist of custom
+            metadata or predefined keys. See Project and
+            instance metadata for more information.
+
+            This field is a member of `oneof`_ ``_metadata``.
+        min_cpu_platform (str):
+            Minimum cpu/platform to be used by instances.
+            The instance may be scheduled on the specified
+            or newer cpu/platform. Applicable values are the
+            friendly names of CPU platforms, such as
+            minCpuPlatform: "Intel Haswell" or
+            minCpuPlatform: "Intel Sandy Bridge". For more
+            information, read Specifying a Minimum CPU
+            Platform.
+
+            This field is a member of `oneof`_ ``_min_cpu_platform``.
+        network_interfaces (MutableSequence[google.cloud.compute_v1.types.NetworkInterface]):
+            An array of network access configurations for
+            this interface.
+        network_performance_config (google.cloud.compute_v1.types.NetworkPerformanceConfig):
+            Note that for MachineImage, this is not
+            supported yet.
+
+            This field is a member of `oneof`_ ``_network_performance_config``.
+        private_ipv6_google_access (str):
+            The private IPv6 google access type for VMs. If not
+            specified, use INHERIT_FROM_SUBNETWORK as default. Note that
+            for MachineImage, this is not supported yet. Check the
+            PrivateIpv6GoogleAccess enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_private_ipv6_google_access``.
+        reservation_affinity (google.cloud.compute_v1.types.ReservationAffinity):
+            Specifies the reservations that instances can
+            consume from. Note that for MachineImage, this
+            is not supported yet.
+
+            This field is a member of `oneof`_ ``_reservation_affinity``.
+        resource_manager_tags (MutableMapping[str, str]):
+            Resource manager tags to be bound to the instance. Tag keys
+            and values have the same definition as resource manager
+            tags. Keys must be in the format ``tagKeys/{tag_key_id}``,
+            and values are in the format ``tagValues/456``. The field is
+            ignored (both PUT & PATCH) when empty.
+        resource_policies (MutableSequence[str]):
+            Resource policies (names, not URLs) applied
+            to instances created from these properties. Note
+            that for MachineImage, this is not supported
+            yet.
+        scheduling (google.cloud.compute_v1.types.Scheduling):
+            Specifies the scheduling options for the
+            instances that are created from these
+            properties.
+
+            This field is a member of `oneof`_ ``_scheduling``.
+        service_accounts (MutableSequence[google.cloud.compute_v1.types.ServiceAccount]):
+            A list of service accounts with specified
+            scopes. Access tokens for these service accounts
+            are available to the instances that are created
+            from these properties. Use metadata queries to
+            obtain the access tokens for these instances.
+        shielded_instance_config (google.cloud.compute_v1.types.ShieldedInstanceConfig):
+            Note that for MachineImage, this is not
+            supported yet.
+
+            This field is a member of `oneof`_ ``_shielded_instance_config``.
+        tags (google.cloud.compute_v1.types.Tags):
+            A list of tags to apply to the instances that
+            are created from these properties. The tags
+            identify valid sources or targets for network
+            firewalls. The setTags method can modify this
+            list of tags. Each tag within the list must
+            comply with RFC1035.
+
+            This field is a member of `oneof`_ ``_tags``.
+    """
+
+    class KeyRevocationActionType(proto.Enum):
+        r"""KeyRevocationActionType of the instance. Supported options
+        are "STOP" and "NONE". The default value is "NONE" if it is not
+        specified.
+
+        Values:
+            UNDEFINED_KEY_REVOCATION_ACTION_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            KEY_REVOCATION_ACTION_TYPE_UNSPECIFIED (467110106):
+                Default value. This value is unused.
+            NONE (2402104):
+                Indicates user chose no operation.
+            STOP (2555906):
+                Indicates user chose to opt for VM shutdown
+                on key revocation.
+        """
+        UNDEFINED_KEY_REVOCATION_ACTION_TYPE = 0
+        KEY_REVOCATION_ACTION_TYPE_UNSPECIFIED = 467110106
+        NONE = 2402104
+        STOP = 2555906
+
+    class PrivateIpv6GoogleAccess(proto.Enum):
+        r"""The private IPv6 google access type for VMs. If not specified, use
+        INHERIT_FROM_SUBNETWORK as default. Note that for MachineImage, this
+        is not supported yet.
+
+        Values:
+            UNDEFINED_PRIVATE_IPV6_GOOGLE_ACCESS (0):
+                A value indicating that the enum field is not
+                set.
+            ENABLE_BIDIRECTIONAL_ACCESS_TO_GOOGLE (427975994):
+                Bidirectional private IPv6 access to/from
+                Google services. If specified, the subnetwork
+                who is attached to the instance's default
+                network interface will be assigned an internal
+                IPv6 prefix if it doesn't have before.
+            ENABLE_OUTBOUND_VM_ACCESS_TO_GOOGLE (288210263):
+                Outbound private IPv6 access from VMs in this
+                subnet to Google services. If specified, the
+                subnetwork who is attached to the instance's
+                default network interface will be assigned an
+                internal IPv6 prefix if it doesn't have before.
+            INHERIT_FROM_SUBNETWORK (530256959):
+                Each network interface inherits
+                PrivateIpv6GoogleAccess from its subnetwork.
+        """
+        UNDEFINED_PRIVATE_IPV6_GOOGLE_ACCESS = 0
+        ENABLE_BIDIRECTIONAL_ACCESS_TO_GOOGLE = 427975994
+        ENABLE_OUTBOUND_VM_ACCESS_TO_GOOGLE = 288210263
+        INHERIT_FROM_SUBNETWORK = 530256959
+
+    advanced_machine_features: "AdvancedMachineFeatures" = proto.Field(
+        proto.MESSAGE,
+        number=409646002,
+        optional=True,
+        message="AdvancedMachineFeatures",
+    )
+    can_ip_forward: bool = proto.Field(
+        proto.BOOL,
+        number=467731324,
+        optional=True,
+    )
+    confidential_instance_config: "ConfidentialInstanceConfig" = proto.Field(
+        proto.MESSAGE,
+        number=490637685,
+        optional=True,
+        message="ConfidentialInstanceConfig",
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    disks: MutableSequence["AttachedDisk"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=95594102,
+        message="AttachedDisk",
+    )
+    guest_accelerators: MutableSequence[
+        shared_accelerator_config.AcceleratorConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=463595119,
+        message=shared_accelerator_config.AcceleratorConfig,
+    )
+    key_revocation_action_type: str = proto.Field(
+        proto.STRING,
+        number=235941474,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    machine_type: str = proto.Field(
+        proto.STRING,
+        number=227711026,
+        optional=True,
+    )
+    metadata: shared_metadata.Metadata = proto.Field(
+        proto.MESSAGE,
+        number=86866735,
+        optional=True,
+        message=shared_metadata.Metadata,
+    )
+    min_cpu_platform: str = proto.Field(
+        proto.STRING,
+        number=242912759,
+        optional=True,
+    )
+    network_interfaces: MutableSequence["NetworkInterface"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=52735243,
+        message="NetworkInterface",
+    )
+    network_performance_config: "NetworkPerformanceConfig" = proto.Field(
+        proto.MESSAGE,
+        number=398330850,
+        optional=True,
+        message="NetworkPerformanceConfig",
+    )
+    private_ipv6_google_access: str = proto.Field(
+        proto.STRING,
+        number=48277006,
+        optional=True,
+    )
+    reservation_affinity: "ReservationAffinity" = proto.Field(
+        proto.MESSAGE,
+        number=157850683,
+        optional=True,
+        message="ReservationAffinity",
+    )
+    resource_manager_tags: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=377671164,
+    )
+    resource_policies: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=22220385,
+    )
+    scheduling: "Scheduling" = proto.Field(
+        proto.MESSAGE,
+        number=386688404,
+        optional=True,
+        message="Scheduling",
+    )
+    service_accounts: MutableSequence["ServiceAccount"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=277537328,
+        message="ServiceAccount",
+    )
+    shielded_instance_config: "ShieldedInstanceConfig" = proto.Field(
+        proto.MESSAGE,
+        number=12862901,
+        optional=True,
+        message="ShieldedInstanceConfig",
+    )
+    tags: "Tags" = proto.Field(
+        proto.MESSAGE,
+        number=3552281,
+        optional=True,
+        message="Tags",
+    )
+
+
+class NetworkInterface(proto.Message):
+    r"""A network interface resource attached to an instance.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        access_configs (MutableSequence[google.cloud.compute_v1.types.AccessConfig]):
+            An array of configurations for this interface. Currently,
+            only one access config, ONE_TO_ONE_NAT, is supported. If
+            there are no accessConfigs specified, then this instance
+            will have no external internet access.
+        alias_ip_ranges (MutableSequence[google.cloud.compute_v1.types.AliasIpRange]):
+            An array of alias IP ranges for this network
+            interface. You can only specify this field for
+            network interfaces in VPC networks.
+        fingerprint (str):
+            Fingerprint hash of contents stored in this
+            network interface. This field will be ignored
+            when inserting an Instance or adding a
+            NetworkInterface. An up-to-date fingerprint must
+            be provided in order to update the
+            NetworkInterface. The request will fail with
+            error 400 Bad Request if the fingerprint is not
+            provided, or 412 Precondition Failed if the
+            fingerprint is out of date.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        internal_ipv6_prefix_length (int):
+            The prefix length of the primary internal
+            IPv6 range.
+
+            This field is a member of `oneof`_ ``_internal_ipv6_prefix_length``.
+        ipv6_access_configs (MutableSequence[google.cloud.compute_v1.types.AccessConfig]):
+            An array of IPv6 access configurations for this interface.
+            Currently, only one IPv6 access config, DIRECT_IPV6, is
+            supported. If there is no ipv6AccessConfig specified, then
+            this instance will have no external IPv6 Internet access.
+        ipv6_access_type (str):
+            [Output Only] One of EXTERNAL, INTERNAL to indicate whether
+            the IP can be accessed from the Internet. This field is
+            always inherited from its subnetwork. Valid only if
+            stackType is IPV4_IPV6. Check the Ipv6AccessType enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_ipv6_access_type``.
+        ipv6_address (str):
+            An IPv6 internal network address for this
+            network interface. To use a static internal IP
+            address, it must be unused and in the same
+            region as the instance's zone. If not specified,
+            Google Cloud will automatically assign an
+            internal IPv6 address from the instance's
+            subnetwork.
+
+            This field is a member of `oneof`_ ``_ipv6_address``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#networkInterface for network interfaces.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            [Output Only] The name of the network interface, which is
+            generated by the server. For a VM, the network interface
+            uses the nicN naming format. Where N is a value between 0
+            and 7. The default interface value is nic0.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            URL of the VPC network resource for this
+            instance. When creating an instance, if neither
+            the network nor the subnetwork is specified, the
+            default network global/networks/default is used.
+            If the selected project doesn't have the default
+            network, you must specify a network or subnet.
+            If the network is not specified but the
+            subnetwork is specified, the network is
+            inferred. If you specify this property, you can
+            specify the network as a full or partial URL.
+            For example, the following are all valid URLs: -
+            https://www.googleapis.com/compute/v1/projects/project/global/networks/
+            network -
+            projects/project/global/networks/network -
+            global/networks/default
+
+            This field is a member of `oneof`_ ``_network``.
+        network_attachment (str):
+            The URL of the network attachment that this interface should
+            connect to in the following format:
+            projects/{project_number}/regions/{region_name}/networkAttachments/{network_attachment_name}.
+
+            This field is a member of `oneof`_ ``_network_attachment``.
+        network_i_p (str):
+            An IPv4 internal IP address to assign to the
+            instance for this network interface. If not
+            specified by the user, an unused internal IP is
+            assigned by the system.
+
+            This field is a member of `oneof`_ ``_network_i_p``.
+        nic_type (str):
+            The type of vNIC to be used on this
+            interface. This may be gVNIC or VirtioNet. Check
+            the NicType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_nic_type``.
+        queue_count (int):
+            The networking queue count that's specified
+            by users for the network interface. Both Rx and
+            Tx queues will be set to this number. It'll be
+            empty if not specified by the users.
+
+            This field is a member of `oneof`_ ``_queue_count``.
+        stack_type (str):
+            The stack type for this network interface. To assign only
+            IPv4 addresses, use IPV4_ONLY. To assign both IPv4 and IPv6
+            addresses, use IPV4_IPV6. If not specified, IPV4_ONLY is
+            used. This field can be both set at instance creation and
+            update network interface operations. Check the StackType
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_stack_type``.
+        subnetwork (str):
+            The URL of the Subnetwork resource for this
+            instance. If the network resource is in legacy
+            mode, do not specify this field. If the network
+            is in auto subnet mode, specifying the
+            subnetwork is optional. If the network is in
+            custom subnet mode, specifying the subnetwork is
+            required. If you specify this field, you can
+            specify the subnetwork as a full or partial URL.
+            For example, the following are all valid URLs: -
+            https://www.googleapis.com/compute/v1/projects/project/regions/region
+            /subnetworks/subnetwork -
+            regions/region/subnetworks/subnetwork
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+    """
+
+    class Ipv6AccessType(proto.Enum):
+        r"""[Output Only] One of EXTERNAL, INTERNAL to indicate whether the IP
+        can be accessed from the Internet. This field is always inherited
+        from its subnetwork. Valid only if stackType is IPV4_IPV6.
+
+        Values:
+            UNDEFINED_IPV6_ACCESS_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            EXTERNAL (35607499):
+                This network interface can have external
+                IPv6.
+            INTERNAL (279295677):
+                This network interface can have internal
+                IPv6.
+            UNSPECIFIED_IPV6_ACCESS_TYPE (313080613):
+                No description available.
+        """
+        UNDEFINED_IPV6_ACCESS_TYPE = 0
+        EXTERNAL = 35607499
+        INTERNAL = 279295677
+        UNSPECIFIED_IPV6_ACCESS_TYPE = 313080613
+
+    class NicType(proto.Enum):
+        r"""The type of vNIC to be used on this interface. This may be
+        gVNIC or VirtioNet.
+
+        Values:
+            UNDEFINED_NIC_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            GVNIC (68209305):
+                GVNIC
+            UNSPECIFIED_NIC_TYPE (67411801):
+                No type specified.
+            VIRTIO_NET (452123481):
+                VIRTIO
+        """
+        UNDEFINED_NIC_TYPE = 0
+        GVNIC = 68209305
+        UNSPECIFIED_NIC_TYPE = 67411801
+        VIRTIO_NET = 452123481
+
+    class StackType(proto.Enum):
+        r"""The stack type for this network interface. To assign only IPv4
+        addresses, use IPV4_ONLY. To assign both IPv4 and IPv6 addresses,
+        use IPV4_IPV6. If not specified, IPV4_ONLY is used. This field can
+        be both set at instance creation and update network interface
+        operations.
+
+        Values:
+            UNDEFINED_STACK_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            IPV4_IPV6 (22197249):
+                The network interface can have both IPv4 and
+                IPv6 addresses.
+            IPV4_ONLY (22373798):
+                The network interface will be assigned IPv4
+                address.
+            UNSPECIFIED_STACK_TYPE (298084569):
+                No description available.
+        """
+        UNDEFINED_STACK_TYPE = 0
+        IPV4_IPV6 = 22197249
+        IPV4_ONLY = 22373798
+        UNSPECIFIED_STACK_TYPE = 298084569
+
+    access_configs: MutableSequence["AccessConfig"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=111058326,
+        message="AccessConfig",
+    )
+    alias_ip_ranges: MutableSequence["AliasIpRange"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=165085631,
+        message="AliasIpRange",
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    internal_ipv6_prefix_length: int = proto.Field(
+        proto.INT32,
+        number=203833757,
+        optional=True,
+    )
+    ipv6_access_configs: MutableSequence["AccessConfig"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=483472110,
+        message="AccessConfig",
+    )
+    ipv6_access_type: str = proto.Field(
+        proto.STRING,
+        number=504658653,
+        optional=True,
+    )
+    ipv6_address: str = proto.Field(
+        proto.STRING,
+        number=341563804,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    network_attachment: str = proto.Field(
+        proto.STRING,
+        number=224644052,
+        optional=True,
+    )
+    network_i_p: str = proto.Field(
+        proto.STRING,
+        number=207181961,
+        optional=True,
+    )
+    nic_type: str = proto.Field(
+        proto.STRING,
+        number=59810577,
+        optional=True,
+    )
+    queue_count: int = proto.Field(
+        proto.INT32,
+        number=503708769,
+        optional=True,
+    )
+    stack_type: str = proto.Field(
+        proto.STRING,
+        number=425908881,
+        optional=True,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+        optional=True,
+    )
+
+
+class NetworkPerformanceConfig(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        total_egress_bandwidth_tier (str):
+            Check the TotalEgressBandwidthTier enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_total_egress_bandwidth_tier``.
+    """
+
+    class TotalEgressBandwidthTier(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_TOTAL_EGRESS_BANDWIDTH_TIER (0):
+                A value indicating that the enum field is not
+                set.
+            DEFAULT (115302945):
+                No description available.
+            TIER_1 (326919444):
+                No description available.
+        """
+        UNDEFINED_TOTAL_EGRESS_BANDWIDTH_TIER = 0
+        DEFAULT = 115302945
+        TIER_1 = 326919444
+
+    total_egress_bandwidth_tier: str = proto.Field(
+        proto.STRING,
+        number=130109439,
+        optional=True,
+    )
+
+
+class ReservationAffinity(proto.Message):
+    r"""Specifies the reservations that this instance can consume
+    from.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        consume_reservation_type (str):
+            Specifies the type of reservation from which this instance
+            can consume resources: ANY_RESERVATION (default),
+            SPECIFIC_RESERVATION, or NO_RESERVATION. See Consuming
+            reserved instances for examples. Check the
+            ConsumeReservationType enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_consume_reservation_type``.
+        key (str):
+            Corresponds to the label key of a reservation resource. To
+            target a SPECIFIC_RESERVATION by name, specify
+            googleapis.com/reservation-name as the key and specify the
+            name of your reservation as its value.
+
+            This field is a member of `oneof`_ ``_key``.
+        values (MutableSequence[str]):
+            Corresponds to the label values of a
+            reservation resource. This can be either a name
+            to a reservation in the same project or
+            "projects/different-project/reservations/some-reservation-name"
+            to target a shared reservation in the same zone
+            but in a different project.
+    """
+
+    class ConsumeReservationType(proto.Enum):
+        r"""Specifies the type of reservation from which this instance can
+        consume resources: ANY_RESERVATION (default), SPECIFIC_RESERVATION,
+        or NO_RESERVATION. See Consuming reserved instances for examples.
+
+        Values:
+            UNDEFINED_CONSUME_RESERVATION_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            ANY_RESERVATION (200008121):
+                Consume any allocation available.
+            NO_RESERVATION (169322030):
+                Do not consume from any allocated capacity.
+            SPECIFIC_RESERVATION (229889055):
+                Must consume from a specific reservation.
+                Must specify key value fields for specifying the
+                reservations.
+            UNSPECIFIED (526786327):
+                No description available.
+        """
+        UNDEFINED_CONSUME_RESERVATION_TYPE = 0
+        ANY_RESERVATION = 200008121
+        NO_RESERVATION = 169322030
+        SPECIFIC_RESERVATION = 229889055
+        UNSPECIFIED = 526786327
+
+    consume_reservation_type: str = proto.Field(
+        proto.STRING,
+        number=300736944,
+        optional=True,
+    )
+    key: str = proto.Field(
+        proto.STRING,
+        number=106079,
+        optional=True,
+    )
+    values: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=249928994,
+    )
+
+
+class Scheduling(proto.Message):
+    r"""Sets the scheduling options for an Instance.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        automatic_restart (bool):
+            Specifies whether the instance should be
+            automatically restarted if it is terminated by
+            Compute Engine (not terminated by a user). You
+            can only set the automatic restart option for
+            standard instances. Preemptible instances cannot
+            be automatically restarted. By default, this is
+            set to true so an instance is automatically
+            restarted if it is terminated by Compute Engine.
+
+            This field is a member of `oneof`_ ``_automatic_restart``.
+        instance_termination_action (str):
+            Specifies the termination action for the
+            instance. Check the InstanceTerminationAction
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_instance_termination_action``.
+        local_ssd_recovery_timeout (google.cloud.compute_v1.types.Duration):
+            Specifies the maximum amount of time a Local
+            Ssd Vm should wait while recovery of the Local
+            Ssd state is attempted. Its value should be in
+            between 0 and 168 hours with hour granularity
+            and the default value being 1 hour.
+
+            This field is a member of `oneof`_ ``_local_ssd_recovery_timeout``.
+        location_hint (str):
+            An opaque location hint used to place the
+            instance close to other resources. This field is
+            for use by internal tools that use the public
+            API.
+
+            This field is a member of `oneof`_ ``_location_hint``.
+        min_node_cpus (int):
+            The minimum number of virtual CPUs this
+            instance will consume when running on a
+            sole-tenant node.
+
+            This field is a member of `oneof`_ ``_min_node_cpus``.
+        node_affinities (MutableSequence[google.cloud.compute_v1.types.SchedulingNodeAffinity]):
+            A set of node affinity and anti-affinity
+            configurations. Refer to Configuring node
+            affinity for more information. Overrides
+            reservationAffinity.
+        on_host_maintenance (str):
+            Defines the maintenance behavior for this
+            instance. For standard instances, the default
+            behavior is MIGRATE. For preemptible instances,
+            the default and only possible behavior is
+            TERMINATE. For more information, see Set VM host
+            maintenance policy. Check the OnHostMaintenance
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_on_host_maintenance``.
+        preemptible (bool):
+            Defines whether the instance is preemptible. This can only
+            be set during instance creation or while the instance is
+            stopped and therefore, in a ``TERMINATED`` state. See
+            Instance Life Cycle for more information on the possible
+            instance states.
+
+            This field is a member of `oneof`_ ``_preemptible``.
+        provisioning_model (str):
+            Specifies the provisioning model of the
+            instance. Check the ProvisioningModel enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_provisioning_model``.
+    """
+
+    class InstanceTerminationAction(proto.Enum):
+        r"""Specifies the termination action for the instance.
+
+        Values:
+            UNDEFINED_INSTANCE_TERMINATION_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+            DELETE (402225579):
+                Delete the VM.
+            INSTANCE_TERMINATION_ACTION_UNSPECIFIED (92954803):
+                Default value. This value is unused.
+            STOP (2555906):
+                Stop the VM without storing in-memory
+                content. default action.
+        """
+        UNDEFINED_INSTANCE_TERMINATION_ACTION = 0
+        DELETE = 402225579
+        INSTANCE_TERMINATION_ACTION_UNSPECIFIED = 92954803
+        STOP = 2555906
+
+    class OnHostMaintenance(proto.Enum):
+        r"""Defines the maintenance behavior for this instance. For
+        standard instances, the default behavior is MIGRATE. For
+        preemptible instances, the default and only possible behavior is
+        TERMINATE. For more information, see Set VM host maintenance
+        policy.
+
+        Values:
+            UNDEFINED_ON_HOST_MAINTENANCE (0):
+                A value indicating that the enum field is not
+                set.
+            MIGRATE (165699979):
+                *[Default]* Allows Compute Engine to automatically migrate
+                instances out of the way of maintenance events.
+            TERMINATE (527617601):
+                Tells Compute Engine to terminate and
+                (optionally) restart the instance away from the
+                maintenance activity. If you would like your
+                instance to be restarted, set the
+                automaticRestart flag to true. Your instance may
+                be restarted more than once, and it may be
+                restarted outside the window of maintenance
+                events.
+        """
+        UNDEFINED_ON_HOST_MAINTENANCE = 0
+        MIGRATE = 165699979
+        TERMINATE = 527617601
+
+    class ProvisioningModel(proto.Enum):
+        r"""Specifies the provisioning model of the instance.
+
+        Values:
+            UNDEFINED_PROVISIONING_MODEL (0):
+                A value indicating that the enum field is not
+                set.
+            SPOT (2552066):
+                Heavily discounted, no guaranteed runtime.
+            STANDARD (484642493):
+                Standard provisioning with user controlled
+                runtime, no discounts.
+        """
+        UNDEFINED_PROVISIONING_MODEL = 0
+        SPOT = 2552066
+        STANDARD = 484642493
+
+    automatic_restart: bool = proto.Field(
+        proto.BOOL,
+        number=350821371,
+        optional=True,
+    )
+    instance_termination_action: str = proto.Field(
+        proto.STRING,
+        number=107380667,
+        optional=True,
+    )
+    local_ssd_recovery_timeout: shared_duration.Duration = proto.Field(
+        proto.MESSAGE,
+        number=268015590,
+        optional=True,
+        message=shared_duration.Duration,
+    )
+    location_hint: str = proto.Field(
+        proto.STRING,
+        number=350519505,
+        optional=True,
+    )
+    min_node_cpus: int = proto.Field(
+        proto.INT32,
+        number=317231675,
+        optional=True,
+    )
+    node_affinities: MutableSequence["SchedulingNodeAffinity"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=461799971,
+        message="SchedulingNodeAffinity",
+    )
+    on_host_maintenance: str = proto.Field(
+        proto.STRING,
+        number=64616796,
+        optional=True,
+    )
+    preemptible: bool = proto.Field(
+        proto.BOOL,
+        number=324203169,
+        optional=True,
+    )
+    provisioning_model: str = proto.Field(
+        proto.STRING,
+        number=494423,
+        optional=True,
+    )
+
+
+class SchedulingNodeAffinity(proto.Message):
+    r"""Node Affinity: the configuration of desired nodes onto which
+    this Instance could be scheduled.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        key (str):
+            Corresponds to the label key of Node
+            resource.
+
+            This field is a member of `oneof`_ ``_key``.
+        operator (str):
+            Defines the operation of node selection. Valid operators are
+            IN for affinity and NOT_IN for anti-affinity. Check the
+            Operator enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_operator``.
+        values (MutableSequence[str]):
+            Corresponds to the label values of Node
+            resource.
+    """
+
+    class Operator(proto.Enum):
+        r"""Defines the operation of node selection. Valid operators are IN for
+        affinity and NOT_IN for anti-affinity.
+
+        Values:
+            UNDEFINED_OPERATOR (0):
+                A value indicating that the enum field is not
+                set.
+            IN (2341):
+                Requires Compute Engine to seek for matched
+                nodes.
+            NOT_IN (161144369):
+                Requires Compute Engine to avoid certain
+                nodes.
+            OPERATOR_UNSPECIFIED (128892924):
+                No description available.
+        """
+        UNDEFINED_OPERATOR = 0
+        IN = 2341
+        NOT_IN = 161144369
+        OPERATOR_UNSPECIFIED = 128892924
+
+    key: str = proto.Field(
+        proto.STRING,
+        number=106079,
+        optional=True,
+    )
+    operator: str = proto.Field(
+        proto.STRING,
+        number=36317348,
+        optional=True,
+    )
+    values: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=249928994,
+    )
+
+
+class ServiceAccount(proto.Message):
+    r"""A service account.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        email (str):
+            Email address of the service account.
+
+            This field is a member of `oneof`_ ``_email``.
+        scopes (MutableSequence[str]):
+            The list of scopes to be made available for
+            this service account.
+    """
+
+    email: str = proto.Field(
+        proto.STRING,
+        number=96619420,
+        optional=True,
+    )
+    scopes: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=165973151,
+    )
+
+
+class ShieldedInstanceConfig(proto.Message):
+    r"""A set of Shielded Instance options.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enable_integrity_monitoring (bool):
+            Defines whether the instance has integrity
+            monitoring enabled. Enabled by default.
+
+            This field is a member of `oneof`_ ``_enable_integrity_monitoring``.
+        enable_secure_boot (bool):
+            Defines whether the instance has Secure Boot
+            enabled. Disabled by default.
+
+            This field is a member of `oneof`_ ``_enable_secure_boot``.
+        enable_vtpm (bool):
+            Defines whether the instance has the vTPM
+            enabled. Enabled by default.
+
+            This field is a member of `oneof`_ ``_enable_vtpm``.
+    """
+
+    enable_integrity_monitoring: bool = proto.Field(
+        proto.BOOL,
+        number=409071030,
+        optional=True,
+    )
+    enable_secure_boot: bool = proto.Field(
+        proto.BOOL,
+        number=123568638,
+        optional=True,
+    )
+    enable_vtpm: bool = proto.Field(
+        proto.BOOL,
+        number=181858935,
+        optional=True,
+    )
+
+
+class Tags(proto.Message):
+    r"""A set of instance tags.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        fingerprint (str):
+            Specifies a fingerprint for this request,
+            which is essentially a hash of the tags'
+            contents and used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update tags. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change tags. To see the latest fingerprint,
+            make get() request to the instance.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        items (MutableSequence[str]):
+            An array of tags. Each tag must be 1-63
+            characters long, and comply with RFC1035.
+    """
+
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    items: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=100526016,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,2271 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_fixed_or_percent
+from google.cloud.compute_v1.types._compute import shared_named_port
+from google.cloud.compute_v1.types._compute import shared_warnings
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DistributionPolicy",
+        "DistributionPolicyZoneConfiguration",
+        "InstanceGroupManager",
+        "InstanceGroupManagerActionsSummary",
+        "InstanceGroupManagerAutoHealingPolicy",
+        "InstanceGroupManagerInstanceLifecyclePolicy",
+        "InstanceGroupManagerStatus",
+        "InstanceGroupManagerStatusStateful",
+        "InstanceGroupManagerStatusStatefulPerInstanceConfigs",
+        "InstanceGroupManagerStatusVersionTarget",
+        "InstanceGroupManagerUpdatePolicy",
+        "InstanceGroupManagerVersion",
+        "InstanceManagedByIgmError",
+        "InstanceManagedByIgmErrorInstanceActionDetails",
+        "InstanceManagedByIgmErrorManagedInstanceError",
+        "ManagedInstance",
+        "ManagedInstanceInstanceHealth",
+        "ManagedInstanceLastAttempt",
+        "ManagedInstanceVersion",
+        "PerInstanceConfig",
+        "PreservedState",
+        "PreservedStatePreservedDisk",
+        "PreservedStatePreservedNetworkIp",
+        "PreservedStatePreservedNetworkIpIpAddress",
+        "StatefulPolicy",
+        "StatefulPolicyPreservedState",
+        "StatefulPolicyPreservedStateDiskDevice",
+        "StatefulPolicyPreservedStateNetworkIp",
+    },
+)
+
+
+class DistributionPolicy(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        target_shape (str):
+            The distribution shape to which the group
+            converges either proactively or on resize events
+            (depending on the value set in
+            updatePolicy.instanceRedistributionType). Check
+            the TargetShape enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_target_shape``.
+        zones (MutableSequence[google.cloud.compute_v1.types.DistributionPolicyZoneConfiguration]):
+            Zones where the regional managed instance
+            group will create and manage its instances.
+    """
+
+    class TargetShape(proto.Enum):
+        r"""The distribution shape to which the group converges either
+        proactively or on resize events (depending on the value set in
+        updatePolicy.instanceRedistributionType).
+
+        Values:
+            UNDEFINED_TARGET_SHAPE (0):
+                A value indicating that the enum field is not
+                set.
+            ANY (64972):
+                The group picks zones for creating VM
+                instances to fulfill the requested number of VMs
+                within present resource constraints and to
+                maximize utilization of unused zonal
+                reservations. Recommended for batch workloads
+                that do not require high availability.
+            ANY_SINGLE_ZONE (61100880):
+                The group creates all VM instances within a
+                single zone. The zone is selected based on the
+                present resource constraints and to maximize
+                utilization of unused zonal reservations.
+                Recommended for batch workloads with heavy
+                interprocess communication.
+            BALANCED (468409608):
+                The group prioritizes acquisition of
+                resources, scheduling VMs in zones where
+                resources are available while distributing VMs
+                as evenly as possible across selected zones to
+                minimize the impact of zonal failure.
+                Recommended for highly available serving
+                workloads.
+            EVEN (2140442):
+                The group schedules VM instance creation and
+                deletion to achieve and maintain an even number
+                of managed instances across the selected zones.
+                The distribution is even when the number of
+                managed instances does not differ by more than 1
+                between any two zones. Recommended for highly
+                available serving workloads.
+        """
+        UNDEFINED_TARGET_SHAPE = 0
+        ANY = 64972
+        ANY_SINGLE_ZONE = 61100880
+        BALANCED = 468409608
+        EVEN = 2140442
+
+    target_shape: str = proto.Field(
+        proto.STRING,
+        number=338621299,
+        optional=True,
+    )
+    zones: MutableSequence["DistributionPolicyZoneConfiguration"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=116085319,
+        message="DistributionPolicyZoneConfiguration",
+    )
+
+
+class DistributionPolicyZoneConfiguration(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        zone (str):
+            The URL of the zone. The zone must exist in
+            the region where the managed instance group is
+            located.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+        optional=True,
+    )
+
+
+class InstanceGroupManager(proto.Message):
+    r"""Represents a Managed Instance Group resource. An instance
+    group is a collection of VM instances that you can manage as a
+    single entity. For more information, read Instance groups. For
+    zonal Managed Instance Group, use the instanceGroupManagers
+    resource. For regional Managed Instance Group, use the
+    regionInstanceGroupManagers resource.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_healing_policies (MutableSequence[google.cloud.compute_v1.types.InstanceGroupManagerAutoHealingPolicy]):
+            The autohealing policy for this managed
+            instance group. You can specify only one value.
+        base_instance_name (str):
+            The base instance name to use for instances
+            in this group. The value must be 1-58 characters
+            long. Instances are named by appending a hyphen
+            and a random four-character string to the base
+            instance name. The base instance name must
+            comply with RFC1035.
+
+            This field is a member of `oneof`_ ``_base_instance_name``.
+        creation_timestamp (str):
+            [Output Only] The creation timestamp for this managed
+            instance group in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        current_actions (google.cloud.compute_v1.types.InstanceGroupManagerActionsSummary):
+            [Output Only] The list of instance actions and the number of
+            instances in this managed instance group that are scheduled
+            for each of those actions.
+
+            This field is a member of `oneof`_ ``_current_actions``.
+        description (str):
+            An optional description of this resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        distribution_policy (google.cloud.compute_v1.types.DistributionPolicy):
+            Policy specifying the intended distribution
+            of managed instances across zones in a regional
+            managed instance group.
+
+            This field is a member of `oneof`_ ``_distribution_policy``.
+        fingerprint (str):
+            Fingerprint of this resource. This field may
+            be used in optimistic locking. It will be
+            ignored when inserting an InstanceGroupManager.
+            An up-to-date fingerprint must be provided in
+            order to update the InstanceGroupManager,
+            otherwise the request will fail with error 412
+            conditionNotMet. To see the latest fingerprint,
+            make a get() request to retrieve an
+            InstanceGroupManager.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] A unique identifier for this resource type.
+            The server generates this identifier.
+
+            This field is a member of `oneof`_ ``_id``.
+        instance_group (str):
+            [Output Only] The URL of the Instance Group resource.
+
+            This field is a member of `oneof`_ ``_instance_group``.
+        instance_lifecycle_policy (google.cloud.compute_v1.types.InstanceGroupManagerInstanceLifecyclePolicy):
+            The repair policy for this managed instance
+            group.
+
+            This field is a member of `oneof`_ ``_instance_lifecycle_policy``.
+        instance_template (str):
+            The URL of the instance template that is
+            specified for this managed instance group. The
+            group uses this template to create all new
+            instances in the managed instance group. The
+            templates for existing instances in the group do
+            not change unless you run recreateInstances, run
+            applyUpdatesToInstances, or set the group's
+            updatePolicy.type to PROACTIVE.
+
+            This field is a member of `oneof`_ ``_instance_template``.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#instanceGroupManager for managed instance groups.
+
+            This field is a member of `oneof`_ ``_kind``.
+        list_managed_instances_results (str):
+            Pagination behavior of the
+            listManagedInstances API method for this managed
+            instance group. Check the
+            ListManagedInstancesResults enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_list_managed_instances_results``.
+        name (str):
+            The name of the managed instance group. The
+            name must be 1-63 characters long, and comply
+            with RFC1035.
+
+            This field is a member of `oneof`_ ``_name``.
+        named_ports (MutableSequence[google.cloud.compute_v1.types.NamedPort]):
+            Named ports configured for the Instance
+            Groups complementary to this Instance Group
+            Manager.
+        region (str):
+            [Output Only] The URL of the region where the managed
+            instance group resides (for regional resources).
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] The URL for this managed instance group. The
+            server defines this URL.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        stateful_policy (google.cloud.compute_v1.types.StatefulPolicy):
+            Stateful configuration for this Instanced
+            Group Manager
+
+            This field is a member of `oneof`_ ``_stateful_policy``.
+        status (google.cloud.compute_v1.types.InstanceGroupManagerStatus):
+            [Output Only] The status of this managed instance group.
+
+            This field is a member of `oneof`_ ``_status``.
+        target_pools (MutableSequence[str]):
+            The URLs for all TargetPool resources to
+            which instances in the instanceGroup field are
+            added. The target pools automatically apply to
+            all of the instances in the managed instance
+            group.
+        target_size (int):
+            The target number of running instances for
+            this managed instance group. You can reduce this
+            number by using the instanceGroupManager
+            deleteInstances or abandonInstances methods.
+            Resizing the group also changes this number.
+
+            This field is a member of `oneof`_ ``_target_size``.
+        update_policy (google.cloud.compute_v1.types.InstanceGroupManagerUpdatePolicy):
+            The update policy for this managed instance
+            group.
+
+            This field is a member of `oneof`_ ``_update_policy``.
+        versions (MutableSequence[google.cloud.compute_v1.types.InstanceGroupManagerVersion]):
+            Specifies the instance templates used by this
+            managed instance group to create instances. Each
+            version is defined by an instanceTemplate and a
+            name. Every version can appear at most once per
+            instance group. This field overrides the
+            top-level instanceTemplate field. Read more
+            about the relationships between these fields.
+            Exactly one version must leave the targetSize
+            field unset. That version will be applied to all
+            remaining instances. For more information, read
+            about canary updates.
+        zone (str):
+            [Output Only] The URL of a zone where the managed instance
+            group is located (for zonal resources).
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    class ListManagedInstancesResults(proto.Enum):
+        r"""Pagination behavior of the listManagedInstances API method
+        for this managed instance group.
+
+        Values:
+            UNDEFINED_LIST_MANAGED_INSTANCES_RESULTS (0):
+                A value indicating that the enum field is not
+                set.
+            PAGELESS (32183464):
+                (Default) Pagination is disabled for the
+                group's listManagedInstances API method.
+                maxResults and pageToken query parameters are
+                ignored and all instances are returned in a
+                single response.
+            PAGINATED (40190637):
+                Pagination is enabled for the group's
+                listManagedInstances API method. maxResults and
+                pageToken query parameters are respected.
+        """
+        UNDEFINED_LIST_MANAGED_INSTANCES_RESULTS = 0
+        PAGELESS = 32183464
+        PAGINATED = 40190637
+
+    auto_healing_policies: MutableSequence[
+        "InstanceGroupManagerAutoHealingPolicy"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=456799109,
+        message="InstanceGroupManagerAutoHealingPolicy",
+    )
+    base_instance_name: str = proto.Field(
+        proto.STRING,
+        number=389106439,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    current_actions: "InstanceGroupManagerActionsSummary" = proto.Field(
+        proto.MESSAGE,
+        number=164045879,
+        optional=True,
+        message="InstanceGroupManagerActionsSummary",
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    distribution_policy: "DistributionPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=534558541,
+        optional=True,
+        message="DistributionPolicy",
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    instance_group: str = proto.Field(
+        proto.STRING,
+        number=81095253,
+        optional=True,
+    )
+    instance_lifecycle_policy: "InstanceGroupManagerInstanceLifecyclePolicy" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=447961617,
+            optional=True,
+            message="InstanceGroupManagerInstanceLifecyclePolicy",
+        )
+    )
+    instance_template: str = proto.Field(
+        proto.STRING,
+        number=309248228,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    list_managed_instances_results: str = proto.Field(
+        proto.STRING,
+        number=296047156,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    named_ports: MutableSequence[shared_named_port.NamedPort] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=427598732,
+        message=shared_named_port.NamedPort,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    stateful_policy: "StatefulPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=47538565,
+        optional=True,
+        message="StatefulPolicy",
+    )
+    status: "InstanceGroupManagerStatus" = proto.Field(
+        proto.MESSAGE,
+        number=181260274,
+        optional=True,
+        message="InstanceGroupManagerStatus",
+    )
+    target_pools: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=336072617,
+    )
+    target_size: int = proto.Field(
+        proto.INT32,
+        number=62880239,
+        optional=True,
+    )
+    update_policy: "InstanceGroupManagerUpdatePolicy" = proto.Field(
+        proto.MESSAGE,
+        number=175809896,
+        optional=True,
+        message="InstanceGroupManagerUpdatePolicy",
+    )
+    versions: MutableSequence["InstanceGroupManagerVersion"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=162430619,
+        message="InstanceGroupManagerVersion",
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+        optional=True,
+    )
+
+
+class InstanceGroupManagerActionsSummary(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        abandoning (int):
+            [Output Only] The total number of instances in the managed
+            instance group that are scheduled to be abandoned.
+            Abandoning an instance removes it from the managed instance
+            group without deleting it.
+
+            This field is a member of `oneof`_ ``_abandoning``.
+        creating (int):
+            [Output Only] The number of instances in the managed
+            instance group that are scheduled to be created or are
+            currently being created. If the group fails to create any of
+            these instances, it tries again until it creates the
+            instance successfully. If you have disabled creation
+            retries, this field will not be populated; instead, the
+            creatingWithoutRetries field will be populated.
+
+            This field is a member of `oneof`_ ``_creating``.
+        creating_without_retries (int):
+            [Output Only] The number of instances that the managed
+            instance group will attempt to create. The group attempts to
+            create each instance only once. If the group fails to create
+            any of these instances, it decreases the group's targetSize
+            value accordingly.
+
+            This field is a member of `oneof`_ ``_creating_without_retries``.
+        deleting (int):
+            [Output Only] The number of instances in the managed
+            instance group that are scheduled to be deleted or are
+            currently being deleted.
+
+            This field is a member of `oneof`_ ``_deleting``.
+        none (int):
+            [Output Only] The number of instances in the managed
+            instance group that are running and have no scheduled
+            actions.
+
+            This field is a member of `oneof`_ ``_none``.
+        recreating (int):
+            [Output Only] The number of instances in the managed
+            instance group that are scheduled to be recreated or are
+            currently being being recreated. Recreating an instance
+            deletes the existing root persistent disk and creates a new
+            disk from the image that is defined in the instance
+            template.
+
+            This field is a member of `oneof`_ ``_recreating``.
+        refreshing (int):
+            [Output Only] The number of instances in the managed
+            instance group that are being reconfigured with properties
+            that do not require a restart or a recreate action. For
+            example, setting or removing target pools for the instance.
+
+            This field is a member of `oneof`_ ``_refreshing``.
+        restarting (int):
+            [Output Only] The number of instances in the managed
+            instance group that are scheduled to be restarted or are
+            currently being restarted.
+
+            This field is a member of `oneof`_ ``_restarting``.
+        resuming (int):
+            [Output Only] The number of instances in the managed
+            instance group that are scheduled to be resumed or are
+            currently being resumed.
+
+            This field is a member of `oneof`_ ``_resuming``.
+        starting (int):
+            [Output Only] The number of instances in the managed
+            instance group that are scheduled to be started or are
+            currently being started.
+
+            This field is a member of `oneof`_ ``_starting``.
+        stopping (int):
+            [Output Only] The number of instances in the managed
+            instance group that are scheduled to be stopped or are
+            currently being stopped.
+
+            This field is a member of `oneof`_ ``_stopping``.
+        suspending (int):
+            [Output Only] The number of instances in the managed
+            instance group that are scheduled to be suspended or are
+            currently being suspended.
+
+            This field is a member of `oneof`_ ``_suspending``.
+        verifying (int):
+            [Output Only] The number of instances in the managed
+            instance group that are being verified. See the
+            managedInstances[].currentAction property in the
+            listManagedInstances method documentation.
+
+            This field is a member of `oneof`_ ``_verifying``.
+    """
+
+    abandoning: int = proto.Field(
+        proto.INT32,
+        number=440023373,
+        optional=True,
+    )
+    creating: int = proto.Field(
+        proto.INT32,
+        number=209809081,
+        optional=True,
+    )
+    creating_without_retries: int = proto.Field(
+        proto.INT32,
+        number=369916745,
+        optional=True,
+    )
+    deleting: int = proto.Field(
+        proto.INT32,
+        number=282846120,
+        optional=True,
+    )
+    none: int = proto.Field(
+        proto.INT32,
+        number=3387192,
+        optional=True,
+    )
+    recreating: int = proto.Field(
+        proto.INT32,
+        number=339057132,
+        optional=True,
+    )
+    refreshing: int = proto.Field(
+        proto.INT32,
+        number=215044903,
+        optional=True,
+    )
+    restarting: int = proto.Field(
+        proto.INT32,
+        number=372312947,
+        optional=True,
+    )
+    resuming: int = proto.Field(
+        proto.INT32,
+        number=201100714,
+        optional=True,
+    )
+    starting: int = proto.Field(
+        proto.INT32,
+        number=243064896,
+        optional=True,
+    )
+    stopping: int = proto.Field(
+        proto.INT32,
+        number=105035892,
+        optional=True,
+    )
+    suspending: int = proto.Field(
+        proto.INT32,
+        number=29113894,
+        optional=True,
+    )
+    verifying: int = proto.Field(
+        proto.INT32,
+        number=451612873,
+        optional=True,
+    )
+
+
+class InstanceGroupManagerAutoHealingPolicy(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        health_check (str):
+            The URL for the health check that signals
+            autohealing.
+
+            This field is a member of `oneof`_ ``_health_check``.
+        initial_delay_sec (int):
+            The initial delay is the number of seconds
+            that a new VM takes to initialize and run its
+            startup script. During a VM's initial delay
+            period, the MIG ignores unsuccessful health
+            checks because the VM might be in the startup
+            process. This prevents the MIG from prematurely
+            recreating a VM. If the health check receives a
+            healthy response during the initial delay, it
+            indicates that the startup process is complete
+            and the VM is ready. The value of initial delay
+            must be between 0 and 3600 seconds. The default
+            value is 0.
+
+            This field is a member of `oneof`_ ``_initial_delay_sec``.
+    """
+
+    health_check: str = proto.Field(
+        proto.STRING,
+        number=308876645,
+        optional=True,
+    )
+    initial_delay_sec: int = proto.Field(
+        proto.INT32,
+        number=263207002,
+        optional=True,
+    )
+
+
+class InstanceGroupManagerInstanceLifecyclePolicy(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        force_update_on_repair (str):
+            A bit indicating whether to forcefully apply
+            the group's latest configuration when repairing
+            a VM. Valid options are: - NO (default): If
+            configuration updates are available, they are
+            not forcefully applied during repair. Instead,
+            configuration updates are applied according to
+            the group's update policy. - YES: If
+            configuration updates are available, they are
+            applied during repair. Check the
+            ForceUpdateOnRepair enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_force_update_on_repair``.
+    """
+
+    class ForceUpdateOnRepair(proto.Enum):
+        r"""A bit indicating whether to forcefully apply the group's
+        latest configuration when repairing a VM. Valid options are: -
+        NO (default): If configuration updates are available, they are
+        not forcefully applied during repair. Instead, configuration
+        updates are applied according to the group's update policy. -
+        YES: If configuration updates are available, they are applied
+        during repair.
+
+        Values:
+            UNDEFINED_FORCE_UPDATE_ON_REPAIR (0):
+                A value indicating that the enum field is not
+                set.
+            NO (2497):
+                No description available.
+            YES (87751):
+                No description available.
+        """
+        UNDEFINED_FORCE_UPDATE_ON_REPAIR = 0
+        NO = 2497
+        YES = 87751
+
+    force_update_on_repair: str = proto.Field(
+        proto.STRING,
+        number=356302027,
+        optional=True,
+    )
+
+
+class InstanceGroupManagerStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        autoscaler (str):
+            [Output Only] The URL of the Autoscaler that targets this
+            instance group manager.
+
+            This field is a member of `oneof`_ ``_autoscaler``.
+        is_stable (bool):
+            [Output Only] A bit indicating whether the managed instance
+            group is in a stable state. A stable state means that: none
+            of the instances in the managed instance group is currently
+            undergoing any type of change (for example, creation,
+            restart, or deletion); no future changes are scheduled for
+            instances in the managed instance group; and the managed
+            instance group itself is not being modified.
+
+            This field is a member of `oneof`_ ``_is_stable``.
+        stateful (google.cloud.compute_v1.types.InstanceGroupManagerStatusStateful):
+            [Output Only] Stateful status of the given Instance Group
+            Manager.
+
+            This field is a member of `oneof`_ ``_stateful``.
+        version_target (google.cloud.compute_v1.types.InstanceGroupManagerStatusVersionTarget):
+            [Output Only] A status of consistency of Instances' versions
+            with their target version specified by version field on
+            Instance Group Manager.
+
+            This field is a member of `oneof`_ ``_version_target``.
+    """
+
+    autoscaler: str = proto.Field(
+        proto.STRING,
+        number=517258967,
+        optional=True,
+    )
+    is_stable: bool = proto.Field(
+        proto.BOOL,
+        number=108410864,
+        optional=True,
+    )
+    stateful: "InstanceGroupManagerStatusStateful" = proto.Field(
+        proto.MESSAGE,
+        number=244462412,
+        optional=True,
+        message="InstanceGroupManagerStatusStateful",
+    )
+    version_target: "InstanceGroupManagerStatusVersionTarget" = proto.Field(
+        proto.MESSAGE,
+        number=289386200,
+        optional=True,
+        message="InstanceGroupManagerStatusVersionTarget",
+    )
+
+
+class InstanceGroupManagerStatusStateful(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        has_stateful_config (bool):
+            [Output Only] A bit indicating whether the managed instance
+            group has stateful configuration, that is, if you have
+            configured any items in a stateful policy or in per-instance
+            configs. The group might report that it has no stateful
+            configuration even when there is still some preserved state
+            on a managed instance, for example, if you have deleted all
+            PICs but not yet applied those deletions.
+
+            This field is a member of `oneof`_ ``_has_stateful_config``.
+        per_instance_configs (google.cloud.compute_v1.types.InstanceGroupManagerStatusStatefulPerInstanceConfigs):
+            [Output Only] Status of per-instance configurations on the
+            instance.
+
+            This field is a member of `oneof`_ ``_per_instance_configs``.
+    """
+
+    has_stateful_config: bool = proto.Field(
+        proto.BOOL,
+        number=110474224,
+        optional=True,
+    )
+    per_instance_configs: "InstanceGroupManagerStatusStatefulPerInstanceConfigs" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=526265001,
+            optional=True,
+            message="InstanceGroupManagerStatusStatefulPerInstanceConfigs",
+        )
+    )
+
+
+class InstanceGroupManagerStatusStatefulPerInstanceConfigs(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        all_effective (bool):
+            A bit indicating if all of the group's
+            per-instance configurations (listed in the
+            output of a listPerInstanceConfigs API call)
+            have status EFFECTIVE or there are no
+            per-instance-configs.
+
+            This field is a member of `oneof`_ ``_all_effective``.
+    """
+
+    all_effective: bool = proto.Field(
+        proto.BOOL,
+        number=516540553,
+        optional=True,
+    )
+
+
+class InstanceGroupManagerStatusVersionTarget(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        is_reached (bool):
+            [Output Only] A bit indicating whether version target has
+            been reached in this managed instance group, i.e. all
+            instances are in their target version. Instances' target
+            version are specified by version field on Instance Group
+            Manager.
+
+            This field is a member of `oneof`_ ``_is_reached``.
+    """
+
+    is_reached: bool = proto.Field(
+        proto.BOOL,
+        number=433209149,
+        optional=True,
+    )
+
+
+class InstanceGroupManagerUpdatePolicy(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_redistribution_type (str):
+            The instance redistribution policy for
+            regional managed instance groups. Valid values
+            are: - PROACTIVE (default): The group attempts
+            to maintain an even distribution of VM instances
+            across zones in the region. - NONE: For
+            non-autoscaled groups, proactive redistribution
+            is disabled. Check the
+            InstanceRedistributionType enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_instance_redistribution_type``.
+        max_surge (google.cloud.compute_v1.types.FixedOrPercent):
+            The maximum number of instances that can be
+            created above the specified targetSize during
+            the update process. This value can be either a
+            fixed number or, if the group has 10 or more
+            instances, a percentage. If you set a
+            percentage, the number of instances is rounded
+            if necessary. The default value for maxSurge is
+            a fixed value equal to the number of zones in
+            which the managed instance group operates. At
+            least one of either maxSurge or maxUnavailable
+            must be greater than 0. Learn more about
+            maxSurge.
+
+            This field is a member of `oneof`_ ``_max_surge``.
+        max_unavailable (google.cloud.compute_v1.types.FixedOrPercent):
+            The maximum number of instances that can be
+            unavailable during the update process. An
+            instance is considered available if all of the
+            following conditions are satisfied: - The
+            instance's status is RUNNING. - If there is a
+            health check on the instance group, the
+            instance's health check status must be HEALTHY
+            at least once. If there is no health check on
+            the group, then the instance only needs to have
+            a status of RUNNING to be considered available.
+            This value can be either a fixed number or, if
+            the group has 10 or more instances, a
+            percentage. If you set a percentage, the number
+            of instances is rounded if necessary. The
+            default value for maxUnavailable is a fixed
+            value equal to the number of zones in which the
+            managed instance group operates. At least one of
+            either maxSurge or maxUnavailable must be
+            greater than 0. Learn more about maxUnavailable.
+
+            This field is a member of `oneof`_ ``_max_unavailable``.
+        minimal_action (str):
+            Minimal action to be taken on an instance.
+            Use this option to minimize disruption as much
+            as possible or to apply a more disruptive action
+            than is necessary. - To limit disruption as much
+            as possible, set the minimal action to REFRESH.
+            If your update requires a more disruptive
+            action, Compute Engine performs the necessary
+            action to execute the update. - To apply a more
+            disruptive action than is strictly necessary,
+            set the minimal action to RESTART or REPLACE.
+            For example, Compute Engine does not need to
+            restart a VM to change its metadata. But if your
+            application reads instance metadata only when a
+            VM is restarted, you can set the minimal action
+            to RESTART in order to pick up metadata changes.
+            Check the MinimalAction enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_minimal_action``.
+        most_disruptive_allowed_action (str):
+            Most disruptive action that is allowed to be
+            taken on an instance. You can specify either
+            NONE to forbid any actions, REFRESH to avoid
+            restarting the VM and to limit disruption as
+            much as possible. RESTART to allow actions that
+            can be applied without instance replacing or
+            REPLACE to allow all possible actions. If the
+            Updater determines that the minimal update
+            action needed is more disruptive than most
+            disruptive allowed action you specify it will
+            not perform the update at all. Check the
+            MostDisruptiveAllowedAction enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_most_disruptive_allowed_action``.
+        replacement_method (str):
+            What action should be used to replace instances. See
+            minimal_action.REPLACE Check the ReplacementMethod enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_replacement_method``.
+        type_ (str):
+            The type of update process. You can specify
+            either PROACTIVE so that the MIG automatically
+            updates VMs to the latest configurations or
+            OPPORTUNISTIC so that you can select the VMs
+            that you want to update. Check the Type enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class InstanceRedistributionType(proto.Enum):
+        r"""The instance redistribution policy for regional managed
+        instance groups. Valid values are: - PROACTIVE (default): The
+        group attempts to maintain an even distribution of VM instances
+        across zones in the region. - NONE: For non-autoscaled groups,
+        proactive redistribution is disabled. Additional supported
+        values which may be not listed in the enum directly due to
+        technical reasons:
+
+        NONE
+        PROACTIVE
+
+        Values:
+            UNDEFINED_INSTANCE_REDISTRIBUTION_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_INSTANCE_REDISTRIBUTION_TYPE = 0
+
+    class MinimalAction(proto.Enum):
+        r"""Minimal action to be taken on an instance. Use this option to
+        minimize disruption as much as possible or to apply a more
+        disruptive action than is necessary. - To limit disruption as
+        much as possible, set the minimal action to REFRESH. If your
+        update requires a more disruptive action, Compute Engine
+        performs the necessary action to execute the update. - To apply
+        a more disruptive action than is strictly necessary, set the
+        minimal action to RESTART or REPLACE. For example, Compute
+        Engine does not need to restart a VM to change its metadata. But
+        if your application reads instance metadata only when a VM is
+        restarted, you can set the minimal action to RESTART in order to
+        pick up metadata changes. Additional supported values which may
+        be not listed in the enum directly due to technical reasons:
+
+        NONE
+        REFRESH
+        REPLACE
+        RESTART
+
+        Values:
+            UNDEFINED_MINIMAL_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_MINIMAL_ACTION = 0
+
+    class MostDisruptiveAllowedAction(proto.Enum):
+        r"""Most disruptive action that is allowed to be taken on an
+        instance. You can specify either NONE to forbid any actions,
+        REFRESH to avoid restarting the VM and to limit disruption as
+        much as possible. RESTART to allow actions that can be applied
+        without instance replacing or REPLACE to allow all possible
+        actions. If the Updater determines that the minimal update
+        action needed is more disruptive than most disruptive allowed
+        action you specify it will not perform the update at all.
+        Additional supported values which may be not listed in the enum
+        directly due to technical reasons:
+
+        NONE
+        REFRESH
+        REPLACE
+        RESTART
+
+        Values:
+            UNDEFINED_MOST_DISRUPTIVE_ALLOWED_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+        """
+        UNDEFINED_MOST_DISRUPTIVE_ALLOWED_ACTION = 0
+
+    class ReplacementMethod(proto.Enum):
+        r"""What action should be used to replace instances. See
+        minimal_action.REPLACE
+
+        Values:
+            UNDEFINED_REPLACEMENT_METHOD (0):
+                A value indicating that the enum field is not
+                set.
+            RECREATE (522644719):
+                Instances will be recreated (with the same
+                name)
+            SUBSTITUTE (280924314):
+                Default option: instances will be deleted and
+                created (with a new name)
+        """
+        UNDEFINED_REPLACEMENT_METHOD = 0
+        RECREATE = 522644719
+        SUBSTITUTE = 280924314
+
+    class Type(proto.Enum):
+        r"""The type of update process. You can specify either PROACTIVE
+        so that the MIG automatically updates VMs to the latest
+        configurations or OPPORTUNISTIC so that you can select the VMs
+        that you want to update. Additional supported values which may
+        be not listed in the enum directly due to technical reasons:
+
+        PROACTIVE
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            OPPORTUNISTIC (429530089):
+                MIG will apply new configurations to existing
+                VMs only when you selectively target specific or
+                all VMs to be updated.
+        """
+        UNDEFINED_TYPE = 0
+        OPPORTUNISTIC = 429530089
+
+    instance_redistribution_type: str = proto.Field(
+        proto.STRING,
+        number=292630424,
+        optional=True,
+    )
+    max_surge: shared_fixed_or_percent.FixedOrPercent = proto.Field(
+        proto.MESSAGE,
+        number=302572691,
+        optional=True,
+        message=shared_fixed_or_percent.FixedOrPercent,
+    )
+    max_unavailable: shared_fixed_or_percent.FixedOrPercent = proto.Field(
+        proto.MESSAGE,
+        number=404940277,
+        optional=True,
+        message=shared_fixed_or_percent.FixedOrPercent,
+    )
+    minimal_action: str = proto.Field(
+        proto.STRING,
+        number=270567060,
+        optional=True,
+    )
+    most_disruptive_allowed_action: str = proto.Field(
+        proto.STRING,
+        number=66103053,
+        optional=True,
+    )
+    replacement_method: str = proto.Field(
+        proto.STRING,
+        number=505931694,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+class InstanceGroupManagerVersion(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_template (str):
+            The URL of the instance template that is specified for this
+            managed instance group. The group uses this template to
+            create new instances in the managed instance group until the
+            ``targetSize`` for this version is reached. The templates
+            for existing instances in the group do not change unless you
+            run recreateInstances, run applyUpdatesToInstances, or set
+            the group's updatePolicy.type to PROACTIVE; in those cases,
+            existing instances are updated until the ``targetSize`` for
+            this version is reached.
+
+            This field is a member of `oneof`_ ``_instance_template``.
+        name (str):
+            Name of the version. Unique among all
+            versions in the scope of this managed instance
+            group.
+
+            This field is a member of `oneof`_ ``_name``.
+        target_size (google.cloud.compute_v1.types.FixedOrPercent):
+            Specifies the intended number of instances to be created
+            from the instanceTemplate. The final number of instances
+            created from the template will be equal to: - If expressed
+            as a fixed number, the minimum of either targetSize.fixed or
+            instanceGroupManager.targetSize is used. - if expressed as a
+            percent, the targetSize would be (targetSize.percent/100 \*
+            InstanceGroupManager.targetSize) If there is a remainder,
+            the number is rounded. If unset, this version will update
+            any remaining instances not updated by another version. Read
+            Starting a canary update for more information.
+
+            This field is a member of `oneof`_ ``_target_size``.
+    """
+
+    instance_template: str = proto.Field(
+        proto.STRING,
+        number=309248228,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    target_size: shared_fixed_or_percent.FixedOrPercent = proto.Field(
+        proto.MESSAGE,
+        number=62880239,
+        optional=True,
+        message=shared_fixed_or_percent.FixedOrPercent,
+    )
+
+
+class InstanceManagedByIgmError(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        error (google.cloud.compute_v1.types.InstanceManagedByIgmErrorManagedInstanceError):
+            [Output Only] Contents of the error.
+
+            This field is a member of `oneof`_ ``_error``.
+        instance_action_details (google.cloud.compute_v1.types.InstanceManagedByIgmErrorInstanceActionDetails):
+            [Output Only] Details of the instance action that triggered
+            this error. May be null, if the error was not caused by an
+            action on an instance. This field is optional.
+
+            This field is a member of `oneof`_ ``_instance_action_details``.
+        timestamp (str):
+            [Output Only] The time that this error occurred. This value
+            is in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_timestamp``.
+    """
+
+    error: "InstanceManagedByIgmErrorManagedInstanceError" = proto.Field(
+        proto.MESSAGE,
+        number=96784904,
+        optional=True,
+        message="InstanceManagedByIgmErrorManagedInstanceError",
+    )
+    instance_action_details: "InstanceManagedByIgmErrorInstanceActionDetails" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=292224547,
+            optional=True,
+            message="InstanceManagedByIgmErrorInstanceActionDetails",
+        )
+    )
+    timestamp: str = proto.Field(
+        proto.STRING,
+        number=55126294,
+        optional=True,
+    )
+
+
+class InstanceManagedByIgmErrorInstanceActionDetails(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        action (str):
+            [Output Only] Action that managed instance group was
+            executing on the instance when the error occurred. Possible
+            values: Check the Action enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_action``.
+        instance (str):
+            [Output Only] The URL of the instance. The URL can be set
+            even if the instance has not yet been created.
+
+            This field is a member of `oneof`_ ``_instance``.
+        version (google.cloud.compute_v1.types.ManagedInstanceVersion):
+            [Output Only] Version this instance was created from, or was
+            being created from, but the creation failed. Corresponds to
+            one of the versions that were set on the Instance Group
+            Manager resource at the time this instance was being
+            created.
+
+            This field is a member of `oneof`_ ``_version``.
+    """
+
+    class Action(proto.Enum):
+        r"""[Output Only] Action that managed instance group was executing on
+        the instance when the error occurred. Possible values:
+
+        Values:
+            UNDEFINED_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+            ABANDONING (388244813):
+                The managed instance group is abandoning this
+                instance. The instance will be removed from the
+                instance group and from any target pools that
+                are associated with this group.
+            CREATING (455564985):
+                The managed instance group is creating this
+                instance. If the group fails to create this
+                instance, it will try again until it is
+                successful.
+            CREATING_WITHOUT_RETRIES (428843785):
+                The managed instance group is attempting to
+                create this instance only once. If the group
+                fails to create this instance, it does not try
+                again and the group's targetSize value is
+                decreased.
+            DELETING (528602024):
+                The managed instance group is permanently
+                deleting this instance.
+            NONE (2402104):
+                The managed instance group has not scheduled
+                any actions for this instance.
+            RECREATING (287278572):
+                The managed instance group is recreating this
+                instance.
+            REFRESHING (163266343):
+                The managed instance group is applying
+                configuration changes to the instance without
+                stopping it. For example, the group can update
+                the target pool list for an instance without
+                stopping that instance.
+            RESTARTING (320534387):
+                The managed instance group is restarting this
+                instance.
+            RESUMING (446856618):
+                The managed instance group is resuming this
+                instance.
+            STARTING (488820800):
+                The managed instance group is starting this
+                instance.
+            STOPPING (350791796):
+                The managed instance group is stopping this
+                instance.
+            SUSPENDING (514206246):
+                The managed instance group is suspending this
+                instance.
+            VERIFYING (16982185):
+                The managed instance group is verifying this
+                already created instance. Verification happens
+                every time the instance is (re)created or
+                restarted and consists of: 1. Waiting until
+                health check specified as part of this managed
+                instance group's autohealing policy reports
+                HEALTHY. Note: Applies only if autohealing
+                policy has a health check specified 2. Waiting
+                for addition verification steps performed as
+                post-instance creation (subject to future
+                extensions).
+        """
+        UNDEFINED_ACTION = 0
+        ABANDONING = 388244813
+        CREATING = 455564985
+        CREATING_WITHOUT_RETRIES = 428843785
+        DELETING = 528602024
+        NONE = 2402104
+        RECREATING = 287278572
+        REFRESHING = 163266343
+        RESTARTING = 320534387
+        RESUMING = 446856618
+        STARTING = 488820800
+        STOPPING = 350791796
+        SUSPENDING = 514206246
+        VERIFYING = 16982185
+
+    action: str = proto.Field(
+        proto.STRING,
+        number=187661878,
+        optional=True,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+        optional=True,
+    )
+    version: "ManagedInstanceVersion" = proto.Field(
+        proto.MESSAGE,
+        number=351608024,
+        optional=True,
+        message="ManagedInstanceVersion",
+    )
+
+
+class InstanceManagedByIgmErrorManagedInstanceError(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        code (str):
+            [Output Only] Error code.
+
+            This field is a member of `oneof`_ ``_code``.
+        message (str):
+            [Output Only] Error message.
+
+            This field is a member of `oneof`_ ``_message``.
+    """
+
+    code: str = proto.Field(
+        proto.STRING,
+        number=3059181,
+        optional=True,
+    )
+    message: str = proto.Field(
+        proto.STRING,
+        number=418054151,
+        optional=True,
+    )
+
+
+class ManagedInstance(proto.Message):
+    r"""A Managed Instance resource.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        current_action (str):
+            [Output Only] The current action that the managed instance
+            group has scheduled for the instance. Possible values: -
+            NONE The instance is running, and the managed instance group
+            does not have any scheduled actions for this instance. -
+            CREATING The managed instance group is creating this
+            instance. If the group fails to create this instance, it
+            will try again until it is successful. -
+            CREATING_WITHOUT_RETRIES The managed instance group is
+            attempting to create this instance only once. If the group
+            fails to create this instance, it does not try again and the
+            group's targetSize value is decreased instead. - RECREATING
+            The managed instance group is recreating this instance. -
+            DELETING The managed instance group is permanently deleting
+            this instance. - ABANDONING The managed instance group is
+            abandoning this instance. The instance will be removed from
+            the instance group and from any target pools that are
+            associated with this group. - RESTARTING The managed
+            instance group is restarting the instance. - REFRESHING The
+            managed instance group is applying configuration changes to
+            the instance without stopping it. For example, the group can
+            update the target pool list for an instance without stopping
+            that instance. - VERIFYING The managed instance group has
+            created the instance and it is in the process of being
+            verified. Check the CurrentAction enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_current_action``.
+        id (int):
+            [Output only] The unique identifier for this resource. This
+            field is empty when instance does not exist.
+
+            This field is a member of `oneof`_ ``_id``.
+        instance (str):
+            [Output Only] The URL of the instance. The URL can exist
+            even if the instance has not yet been created.
+
+            This field is a member of `oneof`_ ``_instance``.
+        instance_health (MutableSequence[google.cloud.compute_v1.types.ManagedInstanceInstanceHealth]):
+            [Output Only] Health state of the instance per health-check.
+        instance_status (str):
+            [Output Only] The status of the instance. This field is
+            empty when the instance does not exist. Check the
+            InstanceStatus enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_instance_status``.
+        last_attempt (google.cloud.compute_v1.types.ManagedInstanceLastAttempt):
+            [Output Only] Information about the last attempt to create
+            or delete the instance.
+
+            This field is a member of `oneof`_ ``_last_attempt``.
+        name (str):
+            [Output Only] The name of the instance. The name always
+            exists even if the instance has not yet been created.
+
+            This field is a member of `oneof`_ ``_name``.
+        preserved_state_from_config (google.cloud.compute_v1.types.PreservedState):
+            [Output Only] Preserved state applied from per-instance
+            config for this instance.
+
+            This field is a member of `oneof`_ ``_preserved_state_from_config``.
+        preserved_state_from_policy (google.cloud.compute_v1.types.PreservedState):
+            [Output Only] Preserved state generated based on stateful
+            policy for this instance.
+
+            This field is a member of `oneof`_ ``_preserved_state_from_policy``.
+        version (google.cloud.compute_v1.types.ManagedInstanceVersion):
+            [Output Only] Intended version of this instance.
+
+            This field is a member of `oneof`_ ``_version``.
+    """
+
+    class CurrentAction(proto.Enum):
+        r"""[Output Only] The current action that the managed instance group has
+        scheduled for the instance. Possible values: - NONE The instance is
+        running, and the managed instance group does not have any scheduled
+        actions for this instance. - CREATING The managed instance group is
+        creating this instance. If the group fails to create this instance,
+        it will try again until it is successful. - CREATING_WITHOUT_RETRIES
+        The managed instance group is attempting to create this instance
+        only once. If the group fails to create this instance, it does not
+        try again and the group's targetSize value is decreased instead. -
+        RECREATING The managed instance group is recreating this instance. -
+        DELETING The managed instance group is permanently deleting this
+        instance. - ABANDONING The managed instance group is abandoning this
+        instance. The instance will be removed from the instance group and
+        from any target pools that are associated with this group. -
+        RESTARTING The managed instance group is restarting the instance. -
+        REFRESHING The managed instance group is applying configuration
+        changes to the instance without stopping it. For example, the group
+        can update the target pool list for an instance without stopping
+        that instance. - VERIFYING The managed instance group has created
+        the instance and it is in the process of being verified. Additional
+        supported values which may be not listed in the enum directly due to
+        technical reasons: STOPPING SUSPENDING
+
+        Values:
+            UNDEFINED_CURRENT_ACTION (0):
+                A value indicating that the enum field is not
+                set.
+            ABANDONING (388244813):
+                The managed instance group is abandoning this
+                instance. The instance will be removed from the
+                instance group and from any target pools that
+                are associated with this group.
+            CREATING (455564985):
+                The managed instance group is creating this
+                instance. If the group fails to create this
+                instance, it will try again until it is
+                successful.
+            CREATING_WITHOUT_RETRIES (428843785):
+                The managed instance group is attempting to
+                create this instance only once. If the group
+                fails to create this instance, it does not try
+                again and the group's targetSize value is
+                decreased.
+            DELETING (528602024):
+                The managed instance group is permanently
+                deleting this instance.
+            NONE (2402104):
+                The managed instance group has not scheduled
+                any actions for this instance.
+            RECREATING (287278572):
+                The managed instance group is recreating this
+                instance.
+            REFRESHING (163266343):
+                The managed instance group is applying
+                configuration changes to the instance without
+                stopping it. For example, the group can update
+                the target pool list for an instance without
+                stopping that instance.
+            RESTARTING (320534387):
+                The managed instance group is restarting this
+                instance.
+            RESUMING (446856618):
+                The managed instance group is resuming this
+                instance.
+            STARTING (488820800):
+                The managed instance group is starting this
+                instance.
+            VERIFYING (16982185):
+                The managed instance group is verifying this
+                already created instance. Verification happens
+                every time the instance is (re)created or
+                restarted and consists of: 1. Waiting until
+                health check specified as part of this managed
+                instance group's autohealing policy reports
+                HEALTHY. Note: Applies only if autohealing
+                policy has a health check specified 2. Waiting
+                for addition verification steps performed as
+                post-instance creation (subject to future
+                extensions).
+        """
+        UNDEFINED_CURRENT_ACTION = 0
+        ABANDONING = 388244813
+        CREATING = 455564985
+        CREATING_WITHOUT_RETRIES = 428843785
+        DELETING = 528602024
+        NONE = 2402104
+        RECREATING = 287278572
+        REFRESHING = 163266343
+        RESTARTING = 320534387
+        RESUMING = 446856618
+        STARTING = 488820800
+        VERIFYING = 16982185
+
+    class InstanceStatus(proto.Enum):
+        r"""[Output Only] The status of the instance. This field is empty when
+        the instance does not exist. Additional supported values which may
+        be not listed in the enum directly due to technical reasons:
+        STOPPING SUSPENDING
+
+        Values:
+            UNDEFINED_INSTANCE_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            DEPROVISIONING (428935662):
+                The instance is halted and we are performing
+                tear down tasks like network deprogramming,
+                releasing quota, IP, tearing down disks etc.
+            PROVISIONING (290896621):
+                Resources are being allocated for the
+                instance.
+            REPAIRING (413483285):
+                The instance is in repair.
+            RUNNING (121282975):
+                The instance is running.
+            STAGING (431072283):
+                All required resources have been allocated
+                and the instance is being started.
+            STOPPED (444276141):
+                The instance has stopped successfully.
+            STOPPING (350791796):
+                No description available.
+            SUSPENDED (51223995):
+                The instance has suspended.
+            SUSPENDING (514206246):
+                No description available.
+            TERMINATED (250018339):
+                The instance has stopped (either by explicit
+                action or underlying failure).
+        """
+        UNDEFINED_INSTANCE_STATUS = 0
+        DEPROVISIONING = 428935662
+        PROVISIONING = 290896621
+        REPAIRING = 413483285
+        RUNNING = 121282975
+        STAGING = 431072283
+        STOPPED = 444276141
+        STOPPING = 350791796
+        SUSPENDED = 51223995
+        SUSPENDING = 514206246
+        TERMINATED = 250018339
+
+    current_action: str = proto.Field(
+        proto.STRING,
+        number=178475964,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    instance: str = proto.Field(
+        proto.STRING,
+        number=18257045,
+        optional=True,
+    )
+    instance_health: MutableSequence[
+        "ManagedInstanceInstanceHealth"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=382667078,
+        message="ManagedInstanceInstanceHealth",
+    )
+    instance_status: str = proto.Field(
+        proto.STRING,
+        number=174577372,
+        optional=True,
+    )
+    last_attempt: "ManagedInstanceLastAttempt" = proto.Field(
+        proto.MESSAGE,
+        number=434771492,
+        optional=True,
+        message="ManagedInstanceLastAttempt",
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    preserved_state_from_config: "PreservedState" = proto.Field(
+        proto.MESSAGE,
+        number=98661858,
+        optional=True,
+        message="PreservedState",
+    )
+    preserved_state_from_policy: "PreservedState" = proto.Field(
+        proto.MESSAGE,
+        number=470783954,
+        optional=True,
+        message="PreservedState",
+    )
+    version: "ManagedInstanceVersion" = proto.Field(
+        proto.MESSAGE,
+        number=351608024,
+        optional=True,
+        message="ManagedInstanceVersion",
+    )
+
+
+class ManagedInstanceInstanceHealth(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        detailed_health_state (str):
+            [Output Only] The current detailed instance health state.
+            Check the DetailedHealthState enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_detailed_health_state``.
+        health_check (str):
+            [Output Only] The URL for the health check that verifies
+            whether the instance is healthy.
+
+            This field is a member of `oneof`_ ``_health_check``.
+    """
+
+    class DetailedHealthState(proto.Enum):
+        r"""[Output Only] The current detailed instance health state.
+
+        Values:
+            UNDEFINED_DETAILED_HEALTH_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            DRAINING (480455402):
+                The instance is being drained. The existing
+                connections to the instance have time to
+                complete, but the new ones are being refused.
+            HEALTHY (439801213):
+                The instance is reachable i.e. a connection
+                to the application health checking endpoint can
+                be established, and conforms to the requirements
+                defined by the health check.
+            TIMEOUT (477813057):
+                The instance is unreachable i.e. a connection
+                to the application health checking endpoint
+                cannot be established, or the server does not
+                respond within the specified timeout.
+            UNHEALTHY (462118084):
+                The instance is reachable, but does not
+                conform to the requirements defined by the
+                health check.
+            UNKNOWN (433141802):
+                The health checking system is aware of the
+                instance but its health is not known at the
+                moment.
+        """
+        UNDEFINED_DETAILED_HEALTH_STATE = 0
+        DRAINING = 480455402
+        HEALTHY = 439801213
+        TIMEOUT = 477813057
+        UNHEALTHY = 462118084
+        UNKNOWN = 433141802
+
+    detailed_health_state: str = proto.Field(
+        proto.STRING,
+        number=510470173,
+        optional=True,
+    )
+    health_check: str = proto.Field(
+        proto.STRING,
+        number=308876645,
+        optional=True,
+    )
+
+
+class ManagedInstanceLastAttempt(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        errors (google.cloud.compute_v1.types.Errors):
+            [Output Only] Encountered errors during the last attempt to
+            create or delete the instance.
+
+            This field is a member of `oneof`_ ``_errors``.
+    """
+
+    errors: shared_warnings.Errors = proto.Field(
+        proto.MESSAGE,
+        number=315977579,
+        optional=True,
+        message=shared_warnings.Errors,
+    )
+
+
+class ManagedInstanceVersion(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        instance_template (str):
+            [Output Only] The intended template of the instance. This
+            field is empty when current_action is one of { DELETING,
+            ABANDONING }.
+
+            This field is a member of `oneof`_ ``_instance_template``.
+        name (str):
+            [Output Only] Name of the version.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    instance_template: str = proto.Field(
+        proto.STRING,
+        number=309248228,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+
+
+class PerInstanceConfig(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        fingerprint (str):
+            Fingerprint of this per-instance config. This
+            field can be used in optimistic locking. It is
+            ignored when inserting a per-instance config. An
+            up-to-date fingerprint must be provided in order
+            to update an existing per-instance configuration
+            or the field needs to be unset.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        name (str):
+            The name of a per-instance configuration and
+            its corresponding instance. Serves as a merge
+            key during UpdatePerInstanceConfigs operations,
+            that is, if a per-instance configuration with
+            the same name exists then it will be updated,
+            otherwise a new one will be created for the VM
+            instance with the same name. An attempt to
+            create a per-instance configconfiguration for a
+            VM instance that either doesn't exist or is not
+            part of the group will result in an error.
+
+            This field is a member of `oneof`_ ``_name``.
+        preserved_state (google.cloud.compute_v1.types.PreservedState):
+            The intended preserved state for the given
+            instance. Does not contain preserved state
+            generated from a stateful policy.
+
+            This field is a member of `oneof`_ ``_preserved_state``.
+        status (str):
+            The status of applying this per-instance
+            configuration on the corresponding managed
+            instance. Check the Status enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    class Status(proto.Enum):
+        r"""The status of applying this per-instance configuration on the
+        corresponding managed instance.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            APPLYING (352003508):
+                The per-instance configuration is being
+                applied to the instance, but is not yet
+                effective, possibly waiting for the instance to,
+                for example, REFRESH.
+            DELETING (528602024):
+                The per-instance configuration deletion is
+                being applied on the instance, possibly waiting
+                for the instance to, for example, REFRESH.
+            EFFECTIVE (244201863):
+                The per-instance configuration is effective
+                on the instance, meaning that all disks, ips and
+                metadata specified in this configuration are
+                attached or set on the instance.
+            NONE (2402104):
+                *[Default]* The default status, when no per-instance
+                configuration exists.
+            UNAPPLIED (483935140):
+                The per-instance configuration is set on an
+                instance but not been applied yet.
+            UNAPPLIED_DELETION (313956873):
+                The per-instance configuration has been
+                deleted, but the deletion is not yet applied.
+        """
+        UNDEFINED_STATUS = 0
+        APPLYING = 352003508
+        DELETING = 528602024
+        EFFECTIVE = 244201863
+        NONE = 2402104
+        UNAPPLIED = 483935140
+        UNAPPLIED_DELETION = 313956873
+
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    preserved_state: "PreservedState" = proto.Field(
+        proto.MESSAGE,
+        number=2634026,
+        optional=True,
+        message="PreservedState",
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+
+
+class PreservedState(proto.Message):
+    r"""Preserved state for a given instance.
+
+    Attributes:
+        disks (MutableMapping[str, google.cloud.compute_v1.types.PreservedStatePreservedDisk]):
+            Preserved disks defined for this instance.
+            This map is keyed with the device names of the
+            disks.
+        external_i_ps (MutableMapping[str, google.cloud.compute_v1.types.PreservedStatePreservedNetworkIp]):
+            Preserved external IPs defined for this
+            instance. This map is keyed with the name of the
+            network interface.
+        internal_i_ps (MutableMapping[str, google.cloud.compute_v1.types.PreservedStatePreservedNetworkIp]):
+            Preserved internal IPs defined for this
+            instance. This map is keyed with the name of the
+            network interface.
+        metadata (MutableMapping[str, str]):
+            Preserved metadata defined for this instance.
+    """
+
+    disks: MutableMapping[str, "PreservedStatePreservedDisk"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=95594102,
+        message="PreservedStatePreservedDisk",
+    )
+    external_i_ps: MutableMapping[
+        str, "PreservedStatePreservedNetworkIp"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=532687245,
+        message="PreservedStatePreservedNetworkIp",
+    )
+    internal_i_ps: MutableMapping[
+        str, "PreservedStatePreservedNetworkIp"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=215731675,
+        message="PreservedStatePreservedNetworkIp",
+    )
+    metadata: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=86866735,
+    )
+
+
+class PreservedStatePreservedDisk(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_delete (str):
+            These stateful disks will never be deleted during
+            autohealing, update, instance recreate operations. This flag
+            is used to configure if the disk should be deleted after it
+            is no longer used by the group, e.g. when the given instance
+            or the whole MIG is deleted. Note: disks attached in
+            READ_ONLY mode cannot be auto-deleted. Check the AutoDelete
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_auto_delete``.
+        mode (str):
+            The mode in which to attach this disk, either READ_WRITE or
+            READ_ONLY. If not specified, the default is to attach the
+            disk in READ_WRITE mode. Check the Mode enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_mode``.
+        source (str):
+            The URL of the disk resource that is stateful
+            and should be attached to the VM instance.
+
+            This field is a member of `oneof`_ ``_source``.
+    """
+
+    class AutoDelete(proto.Enum):
+        r"""These stateful disks will never be deleted during autohealing,
+        update, instance recreate operations. This flag is used to configure
+        if the disk should be deleted after it is no longer used by the
+        group, e.g. when the given instance or the whole MIG is deleted.
+        Note: disks attached in READ_ONLY mode cannot be auto-deleted.
+
+        Values:
+            UNDEFINED_AUTO_DELETE (0):
+                A value indicating that the enum field is not
+                set.
+            NEVER (74175084):
+                No description available.
+            ON_PERMANENT_INSTANCE_DELETION (95727719):
+                No description available.
+        """
+        UNDEFINED_AUTO_DELETE = 0
+        NEVER = 74175084
+        ON_PERMANENT_INSTANCE_DELETION = 95727719
+
+    class Mode(proto.Enum):
+        r"""The mode in which to attach this disk, either READ_WRITE or
+        READ_ONLY. If not specified, the default is to attach the disk in
+        READ_WRITE mode.
+
+        Values:
+            UNDEFINED_MODE (0):
+                A value indicating that the enum field is not
+                set.
+            READ_ONLY (91950261):
+                Attaches this disk in read-only mode. Multiple VM instances
+                can use a disk in READ_ONLY mode at a time.
+            READ_WRITE (173607894):
+                *[Default]* Attaches this disk in READ_WRITE mode. Only one
+                VM instance at a time can be attached to a disk in
+                READ_WRITE mode.
+        """
+        UNDEFINED_MODE = 0
+        READ_ONLY = 91950261
+        READ_WRITE = 173607894
+
+    auto_delete: str = proto.Field(
+        proto.STRING,
+        number=464761403,
+        optional=True,
+    )
+    mode: str = proto.Field(
+        proto.STRING,
+        number=3357091,
+        optional=True,
+    )
+    source: str = proto.Field(
+        proto.STRING,
+        number=177235995,
+        optional=True,
+    )
+
+
+class PreservedStatePreservedNetworkIp(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_delete (str):
+            These stateful IPs will never be released
+            during autohealing, update or VM instance
+            recreate operations. This flag is used to
+            configure if the IP reservation should be
+            deleted after it is no longer used by the group,
+            e.g. when the given instance or the whole group
+            is deleted. Check the AutoDelete enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_auto_delete``.
+        ip_address (google.cloud.compute_v1.types.PreservedStatePreservedNetworkIpIpAddress):
+            Ip address representation
+
+            This field is a member of `oneof`_ ``_ip_address``.
+    """
+
+    class AutoDelete(proto.Enum):
+        r"""These stateful IPs will never be released during autohealing,
+        update or VM instance recreate operations. This flag is used to
+        configure if the IP reservation should be deleted after it is no
+        longer used by the group, e.g. when the given instance or the
+        whole group is deleted.
+
+        Values:
+            UNDEFINED_AUTO_DELETE (0):
+                A value indicating that the enum field is not
+                set.
+            NEVER (74175084):
+                No description available.
+            ON_PERMANENT_INSTANCE_DELETION (95727719):
+                No description available.
+        """
+        UNDEFINED_AUTO_DELETE = 0
+        NEVER = 74175084
+        ON_PERMANENT_INSTANCE_DELETION = 95727719
+
+    auto_delete: str = proto.Field(
+        proto.STRING,
+        number=464761403,
+        optional=True,
+    )
+    ip_address: "PreservedStatePreservedNetworkIpIpAddress" = proto.Field(
+        proto.MESSAGE,
+        number=406272220,
+        optional=True,
+        message="PreservedStatePreservedNetworkIpIpAddress",
+    )
+
+
+class PreservedStatePreservedNetworkIpIpAddress(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        address (str):
+            The URL of the reservation for this IP
+            address.
+
+            This field is a member of `oneof`_ ``_address``.
+        literal (str):
+            An IPv4 internal network address to assign to
+            the instance for this network interface.
+
+            This field is a member of `oneof`_ ``_literal``.
+    """
+
+    address: str = proto.Field(
+        proto.STRING,
+        number=462920692,
+        optional=True,
+    )
+    literal: str = proto.Field(
+        proto.STRING,
+        number=182460591,
+        optional=True,
+    )
+
+
+class StatefulPolicy(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        preserved_state (google.cloud.compute_v1.types.StatefulPolicyPreservedState):
+
+            This field is a member of `oneof`_ ``_preserved_state``.
+    """
+
+    preserved_state: "StatefulPolicyPreservedState" = proto.Field(
+        proto.MESSAGE,
+        number=2634026,
+        optional=True,
+        message="StatefulPolicyPreservedState",
+    )
+
+
+class StatefulPolicyPreservedState(proto.Message):
+    r"""Configuration of preserved resources.
+
+    Attributes:
+        disks (MutableMapping[str, google.cloud.compute_v1.types.StatefulPolicyPreservedStateDiskDevice]):
+            Disks created on the instances that will be
+            preserved on instance delete, update, etc. This
+            map is keyed with the device names of the disks.
+        external_i_ps (MutableMapping[str, google.cloud.compute_v1.types.StatefulPolicyPreservedStateNetworkIp]):
+            External network IPs assigned to the
+            instances that will be preserved on instance
+            delete, update, etc. This map is keyed with the
+            network interface name.
+        internal_i_ps (MutableMapping[str, google.cloud.compute_v1.types.StatefulPolicyPreservedStateNetworkIp]):
+            Internal network IPs assigned to the
+            instances that will be preserved on instance
+            delete, update, etc. This map is keyed with the
+            network interface name.
+    """
+
+    disks: MutableMapping[
+        str, "StatefulPolicyPreservedStateDiskDevice"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=95594102,
+        message="StatefulPolicyPreservedStateDiskDevice",
+    )
+    external_i_ps: MutableMapping[
+        str, "StatefulPolicyPreservedStateNetworkIp"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=532687245,
+        message="StatefulPolicyPreservedStateNetworkIp",
+    )
+    internal_i_ps: MutableMapping[
+        str, "StatefulPolicyPreservedStateNetworkIp"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=215731675,
+        message="StatefulPolicyPreservedStateNetworkIp",
+    )
+
+
+class StatefulPolicyPreservedStateDiskDevice(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_delete (str):
+            These stateful disks will never be deleted during
+            autohealing, update or VM instance recreate operations. This
+            flag is used to configure if the disk should be deleted
+            after it is no longer used by the group, e.g. when the given
+            instance or the whole group is deleted. Note: disks attached
+            in READ_ONLY mode cannot be auto-deleted. Check the
+            AutoDelete enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_auto_delete``.
+    """
+
+    class AutoDelete(proto.Enum):
+        r"""These stateful disks will never be deleted during autohealing,
+        update or VM instance recreate operations. This flag is used to
+        configure if the disk should be deleted after it is no longer used
+        by the group, e.g. when the given instance or the whole group is
+        deleted. Note: disks attached in READ_ONLY mode cannot be
+        auto-deleted.
+
+        Values:
+            UNDEFINED_AUTO_DELETE (0):
+                A value indicating that the enum field is not
+                set.
+            NEVER (74175084):
+                No description available.
+            ON_PERMANENT_INSTANCE_DELETION (95727719):
+                No description available.
+        """
+        UNDEFINED_AUTO_DELETE = 0
+        NEVER = 74175084
+        ON_PERMANENT_INSTANCE_DELETION = 95727719
+
+    auto_delete: str = proto.Field(
+        proto.STRING,
+        number=464761403,
+        optional=True,
+    )
+
+
+class StatefulPolicyPreservedStateNetworkIp(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_delete (str):
+            These stateful IPs will never be released
+            during autohealing, update or VM instance
+            recreate operations. This flag is used to
+            configure if the IP reservation should be
+            deleted after it is no longer used by the group,
+            e.g. when the given instance or the whole group
+            is deleted. Check the AutoDelete enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_auto_delete``.
+    """
+
+    class AutoDelete(proto.Enum):
+        r"""These stateful IPs will never be released during autohealing,
+        update or VM instance recreate operations. This flag is used to
+        configure if the IP reservation should be deleted after it is no
+        longer used by the group, e.g. when the given instance or the
+        whole group is deleted.
+
+        Values:
+            UNDEFINED_AUTO_DELETE (0):
+                A value indicating that the enum field is not
+                set.
+            NEVER (74175084):
+                No description available.
+            ON_PERMANENT_INSTANCE_DELETION (95727719):
+                No description available.
+        """
+        UNDEFINED_AUTO_DELETE = 0
+        NEVER = 74175084
+        ON_PERMANENT_INSTANCE_DELETION = 95727719
+
+    auto_delete: str = proto.Field(
+        proto.STRING,
+        number=464761403,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "PublicDelegatedPrefix",
+        "PublicDelegatedPrefixList",
+        "PublicDelegatedPrefixPublicDelegatedSubPrefix",
+    },
+)
+
+
+class PublicDelegatedPrefix(proto.Message):
+    r"""A PublicDelegatedPrefix resource represents an IP block
+    within a PublicAdvertisedPrefix that is configured within a
+    single cloud scope (global or region). IPs in the block can be
+    allocated to resources within that scope. Public delegated
+    prefixes may be further broken up into smaller IP blocks in the
+    same scope as the parent block.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        byoip_api_version (str):
+            [Output Only] The version of BYOIP API. Check the
+            ByoipApiVersion enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_byoip_api_version``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a new
+            PublicDelegatedPrefix. An up-to-date fingerprint
+            must be provided in order to update the
+            PublicDelegatedPrefix, otherwise the request
+            will fail with error 412 conditionNotMet. To see
+            the latest fingerprint, make a get() request to
+            retrieve a PublicDelegatedPrefix.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource type.
+            The server generates this identifier.
+
+            This field is a member of `oneof`_ ``_id``.
+        ip_cidr_range (str):
+            The IP address range, in CIDR format,
+            represented by this public delegated prefix.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        is_live_migration (bool):
+            If true, the prefix will be live migrated.
+
+            This field is a member of `oneof`_ ``_is_live_migration``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#publicDelegatedPrefix for public delegated prefixes.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        parent_prefix (str):
+            The URL of parent prefix. Either
+            PublicAdvertisedPrefix or PublicDelegatedPrefix.
+
+            This field is a member of `oneof`_ ``_parent_prefix``.
+        public_delegated_sub_prefixs (MutableSequence[google.cloud.compute_v1.types.PublicDelegatedPrefixPublicDelegatedSubPrefix]):
+            The list of sub public delegated prefixes
+            that exist for this public delegated prefix.
+        region (str):
+            [Output Only] URL of the region where the public delegated
+            prefix resides. This field applies only to the region
+            resource. You must specify this field as part of the HTTP
+            request URL. It is not settable as a field in the request
+            body.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        status (str):
+            [Output Only] The status of the public delegated prefix,
+            which can be one of following values: - ``INITIALIZING`` The
+            public delegated prefix is being initialized and addresses
+            cannot be created yet. - ``READY_TO_ANNOUNCE`` The public
+            delegated prefix is a live migration prefix and is active. -
+            ``ANNOUNCED`` The public delegated prefix is active. -
+            ``DELETING`` The public delegated prefix is being
+            deprovsioned. Check the Status enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    class ByoipApiVersion(proto.Enum):
+        r"""[Output Only] The version of BYOIP API.
+
+        Values:
+            UNDEFINED_BYOIP_API_VERSION (0):
+                A value indicating that the enum field is not
+                set.
+            V1 (2715):
+                This public delegated prefix usually takes 4
+                weeks to delete, and the BGP status cannot be
+                changed. Announce and Withdraw APIs can not be
+                used on this prefix.
+            V2 (2716):
+                This public delegated prefix takes minutes to
+                delete. Announce and Withdraw APIs can be used
+                on this prefix to change the BGP status.
+        """
+        UNDEFINED_BYOIP_API_VERSION = 0
+        V1 = 2715
+        V2 = 2716
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the public delegated prefix, which can
+        be one of following values: - ``INITIALIZING`` The public delegated
+        prefix is being initialized and addresses cannot be created yet. -
+        ``READY_TO_ANNOUNCE`` The public delegated prefix is a live
+        migration prefix and is active. - ``ANNOUNCED`` The public delegated
+        prefix is active. - ``DELETING`` The public delegated prefix is
+        being deprovsioned.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            ANNOUNCED (365103355):
+                The public delegated prefix is active.
+            ANNOUNCED_TO_GOOGLE (454875705):
+                The prefix is announced within Google
+                network.
+            ANNOUNCED_TO_INTERNET (177880897):
+                The prefix is announced to Internet and
+                within Google.
+            DELETING (528602024):
+                The public delegated prefix is being
+                deprovsioned.
+            INITIALIZING (306588749):
+                The public delegated prefix is being
+                initialized and addresses cannot be created yet.
+            READY_TO_ANNOUNCE (64641265):
+                The public delegated prefix is currently
+                withdrawn but ready to be announced.
+        """
+        UNDEFINED_STATUS = 0
+        ANNOUNCED = 365103355
+        ANNOUNCED_TO_GOOGLE = 454875705
+        ANNOUNCED_TO_INTERNET = 177880897
+        DELETING = 528602024
+        INITIALIZING = 306588749
+        READY_TO_ANNOUNCE = 64641265
+
+    byoip_api_version: str = proto.Field(
+        proto.STRING,
+        number=162683283,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    ip_cidr_range: str = proto.Field(
+        proto.STRING,
+        number=98117322,
+        optional=True,
+    )
+    is_live_migration: bool = proto.Field(
+        proto.BOOL,
+        number=511823856,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    parent_prefix: str = proto.Field(
+        proto.STRING,
+        number=15233991,
+        optional=True,
+    )
+    public_delegated_sub_prefixs: MutableSequence[
+        "PublicDelegatedPrefixPublicDelegatedSubPrefix"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=188940044,
+        message="PublicDelegatedPrefixPublicDelegatedSubPrefix",
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+
+
+class PublicDelegatedPrefixList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.PublicDelegatedPrefix]):
+            A list of PublicDelegatedPrefix resources.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#publicDelegatedPrefixList for public delegated
+            prefixes.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["PublicDelegatedPrefix"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="PublicDelegatedPrefix",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class PublicDelegatedPrefixPublicDelegatedSubPrefix(proto.Message):
+    r"""Represents a sub PublicDelegatedPrefix.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        delegatee_project (str):
+            Name of the project scoping this
+            PublicDelegatedSubPrefix.
+
+            This field is a member of `oneof`_ ``_delegatee_project``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        ip_cidr_range (str):
+            The IP address range, in CIDR format,
+            represented by this sub public delegated prefix.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        is_address (bool):
+            Whether the sub prefix is delegated to create
+            Address resources in the delegatee project.
+
+            This field is a member of `oneof`_ ``_is_address``.
+        name (str):
+            The name of the sub public delegated prefix.
+
+            This field is a member of `oneof`_ ``_name``.
+        region (str):
+            [Output Only] The region of the sub public delegated prefix
+            if it is regional. If absent, the sub prefix is global.
+
+            This field is a member of `oneof`_ ``_region``.
+        status (str):
+            [Output Only] The status of the sub public delegated prefix.
+            Check the Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the sub public delegated prefix.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                No description available.
+            INACTIVE (270421099):
+                No description available.
+        """
+        UNDEFINED_STATUS = 0
+        ACTIVE = 314733318
+        INACTIVE = 270421099
+
+    delegatee_project: str = proto.Field(
+        proto.STRING,
+        number=414860634,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    ip_cidr_range: str = proto.Field(
+        proto.STRING,
+        number=98117322,
+        optional=True,
+    )
+    is_address: bool = proto.Field(
+        proto.BOOL,
+        number=352617951,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,534 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "Quota",
+    },
+)
+
+
+class Quota(proto.Message):
+    r"""A quotas entry.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        limit (float):
+            [Output Only] Quota limit for this metric.
+
+            This field is a member of `oneof`_ ``_limit``.
+        metric (str):
+            [Output Only] Name of the quota metric. Check the Metric
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_metric``.
+        owner (str):
+            [Output Only] Owning resource. This is the resource on which
+            this quota is applied.
+
+            This field is a member of `oneof`_ ``_owner``.
+        usage (float):
+            [Output Only] Current usage of this metric.
+
+            This field is a member of `oneof`_ ``_usage``.
+    """
+
+    class Metric(proto.Enum):
+        r"""[Output Only] Name of the quota metric.
+
+        Values:
+            UNDEFINED_METRIC (0):
+                A value indicating that the enum field is not
+                set.
+            A2_CPUS (153206585):
+                No description available.
+            AFFINITY_GROUPS (108303563):
+                No description available.
+            AUTOSCALERS (471248988):
+                No description available.
+            BACKEND_BUCKETS (137626846):
+                No description available.
+            BACKEND_SERVICES (269623753):
+                No description available.
+            C2D_CPUS (508182517):
+                No description available.
+            C2_CPUS (317601211):
+                No description available.
+            C3_CPUS (346230362):
+                No description available.
+            COMMITMENTS (456141790):
+                No description available.
+            COMMITTED_A2_CPUS (59330902):
+                No description available.
+            COMMITTED_C2D_CPUS (282390904):
+                No description available.
+            COMMITTED_C2_CPUS (223725528):
+                No description available.
+            COMMITTED_C3_CPUS (252354679):
+                No description available.
+            COMMITTED_CPUS (292394702):
+                No description available.
+            COMMITTED_E2_CPUS (388120154):
+                No description available.
+            COMMITTED_LICENSES (357606869):
+                No description available.
+            COMMITTED_LOCAL_SSD_TOTAL_GB (308393480):
+                No description available.
+            COMMITTED_M3_CPUS (585985):
+                No description available.
+            COMMITTED_MEMORY_OPTIMIZED_CPUS (489057886):
+                No description available.
+            COMMITTED_N2A_CPUS (40064304):
+                No description available.
+            COMMITTED_N2D_CPUS (125951757):
+                No description available.
+            COMMITTED_N2_CPUS (322589603):
+                No description available.
+            COMMITTED_NVIDIA_A100_80GB_GPUS (464326565):
+                No description available.
+            COMMITTED_NVIDIA_A100_GPUS (375799445):
+                No description available.
+            COMMITTED_NVIDIA_K80_GPUS (3857188):
+                No description available.
+            COMMITTED_NVIDIA_L4_GPUS (19163645):
+                No description available.
+            COMMITTED_NVIDIA_P100_GPUS (107528100):
+                No description available.
+            COMMITTED_NVIDIA_P4_GPUS (347952897):
+                No description available.
+            COMMITTED_NVIDIA_T4_GPUS (139871237):
+                No description available.
+            COMMITTED_NVIDIA_V100_GPUS (219562):
+                No description available.
+            COMMITTED_T2A_CPUS (296378986):
+                No description available.
+            COMMITTED_T2D_CPUS (382266439):
+                No description available.
+            CPUS (2075595):
+                Guest CPUs
+            CPUS_ALL_REGIONS (470911149):
+                No description available.
+            DISKS_TOTAL_GB (353520543):
+                No description available.
+            E2_CPUS (481995837):
+                No description available.
+            EXTERNAL_MANAGED_FORWARDING_RULES (150790089):
+                No description available.
+            EXTERNAL_NETWORK_LB_FORWARDING_RULES (374298265):
+                No description available.
+            EXTERNAL_PROTOCOL_FORWARDING_RULES (63478888):
+                No description available.
+            EXTERNAL_VPN_GATEWAYS (272457134):
+                No description available.
+            FIREWALLS (374485843):
+                No description available.
+            FORWARDING_RULES (432668949):
+                No description available.
+            GLOBAL_EXTERNAL_MANAGED_BACKEND_SERVICES (164566753):
+                No description available.
+            GLOBAL_EXTERNAL_MANAGED_FORWARDING_RULES (327611949):
+                No description available.
+            GLOBAL_EXTERNAL_PROXY_LB_BACKEND_SERVICES (400256169):
+                No description available.
+            GLOBAL_INTERNAL_ADDRESSES (42738332):
+                No description available.
+            GLOBAL_INTERNAL_MANAGED_BACKEND_SERVICES (256608303):
+                No description available.
+            GLOBAL_INTERNAL_TRAFFIC_DIRECTOR_BACKEND_SERVICES (323514196):
+                No description available.
+            GPUS_ALL_REGIONS (39387177):
+                No description available.
+            HEALTH_CHECKS (289347502):
+                No description available.
+            IMAGES (15562360):
+                No description available.
+            INSTANCES (131337822):
+                No description available.
+            INSTANCE_GROUPS (355919038):
+                No description available.
+            INSTANCE_GROUP_MANAGERS (101798192):
+                No description available.
+            INSTANCE_TEMPLATES (226188271):
+                No description available.
+            INTERCONNECTS (415204741):
+                No description available.
+            INTERCONNECT_ATTACHMENTS_PER_REGION (159968086):
+                No description available.
+            INTERCONNECT_ATTACHMENTS_TOTAL_MBPS (425090419):
+                No description available.
+            INTERCONNECT_TOTAL_GBPS (285341866):
+                No description available.
+            INTERNAL_ADDRESSES (197899392):
+                No description available.
+            INTERNAL_TRAFFIC_DIRECTOR_FORWARDING_RULES (266433668):
+                No description available.
+            IN_PLACE_SNAPSHOTS (151359133):
+                No description available.
+            IN_USE_ADDRESSES (402125072):
+                No description available.
+            IN_USE_BACKUP_SCHEDULES (32786705):
+                No description available.
+            IN_USE_SNAPSHOT_SCHEDULES (462104083):
+                No description available.
+            LOCAL_SSD_TOTAL_GB (330878021):
+                No description available.
+            M1_CPUS (37203366):
+                No description available.
+            M2_CPUS (65832517):
+                No description available.
+            M3_CPUS (94461668):
+                No description available.
+            MACHINE_IMAGES (446986640):
+                No description available.
+            N2A_CPUS (265855917):
+                No description available.
+            N2D_CPUS (351743370):
+                No description available.
+            N2_CPUS (416465286):
+                No description available.
+            NETWORKS (485481477):
+                No description available.
+            NETWORK_ATTACHMENTS (149028575):
+                No description available.
+            NETWORK_ENDPOINT_GROUPS (102144909):
+                No description available.
+            NETWORK_FIREWALL_POLICIES (101117374):
+                No description available.
+            NET_LB_SECURITY_POLICIES_PER_REGION (157892269):
+                No description available.
+            NET_LB_SECURITY_POLICY_RULES_PER_REGION (356090931):
+                No description available.
+            NET_LB_SECURITY_POLICY_RULE_ATTRIBUTES_PER_REGION (311243888):
+                No description available.
+            NODE_GROUPS (24624817):
+                No description available.
+            NODE_TEMPLATES (474896668):
+                No description available.
+            NVIDIA_A100_80GB_GPUS (286389320):
+                No description available.
+            NVIDIA_A100_GPUS (504872978):
+                No description available.
+            NVIDIA_K80_GPUS (163886599):
+                No description available.
+            NVIDIA_L4_GPUS (491923130):
+                No description available.
+            NVIDIA_P100_GPUS (236601633):
+                No description available.
+            NVIDIA_P100_VWS_GPUS (213970574):
+                No description available.
+            NVIDIA_P4_GPUS (283841470):
+                No description available.
+            NVIDIA_P4_VWS_GPUS (528296619):
+                No description available.
+            NVIDIA_T4_GPUS (75759810):
+                No description available.
+            NVIDIA_T4_VWS_GPUS (319813039):
+                No description available.
+            NVIDIA_V100_GPUS (129293095):
+                No description available.
+            PACKET_MIRRORINGS (15578407):
+                No description available.
+            PD_EXTREME_TOTAL_PROVISIONED_IOPS (69593965):
+                No description available.
+            PREEMPTIBLE_CPUS (251184841):
+                No description available.
+            PREEMPTIBLE_LOCAL_SSD_GB (260819336):
+                No description available.
+            PREEMPTIBLE_NVIDIA_A100_80GB_GPUS (151942410):
+                No description available.
+            PREEMPTIBLE_NVIDIA_A100_GPUS (68832784):
+                No description available.
+            PREEMPTIBLE_NVIDIA_K80_GPUS (374960201):
+                No description available.
+            PREEMPTIBLE_NVIDIA_L4_GPUS (100408376):
+                No description available.
+            PREEMPTIBLE_NVIDIA_P100_GPUS (337432351):
+                No description available.
+            PREEMPTIBLE_NVIDIA_P100_VWS_GPUS (313544076):
+                No description available.
+            PREEMPTIBLE_NVIDIA_P4_GPUS (429197628):
+                No description available.
+            PREEMPTIBLE_NVIDIA_P4_VWS_GPUS (252981545):
+                No description available.
+            PREEMPTIBLE_NVIDIA_T4_GPUS (221115968):
+                No description available.
+            PREEMPTIBLE_NVIDIA_T4_VWS_GPUS (44497965):
+                No description available.
+            PREEMPTIBLE_NVIDIA_V100_GPUS (230123813):
+                No description available.
+            PSC_ILB_CONSUMER_FORWARDING_RULES_PER_PRODUCER_NETWORK (231164291):
+                No description available.
+            PSC_INTERNAL_LB_FORWARDING_RULES (169005435):
+                No description available.
+            PUBLIC_ADVERTISED_PREFIXES (471371980):
+                No description available.
+            PUBLIC_DELEGATED_PREFIXES (532465974):
+                No description available.
+            REGIONAL_AUTOSCALERS (29363772):
+                No description available.
+            REGIONAL_EXTERNAL_MANAGED_BACKEND_SERVICES (4240989):
+                No description available.
+            REGIONAL_EXTERNAL_NETWORK_LB_BACKEND_SERVICES (409564525):
+                No description available.
+            REGIONAL_INSTANCE_GROUP_MANAGERS (37543696):
+                No description available.
+            REGIONAL_INTERNAL_LB_BACKEND_SERVICES (137983760):
+                No description available.
+            REGIONAL_INTERNAL_MANAGED_BACKEND_SERVICES (96282539):
+                No description available.
+            RESERVATIONS (32644647):
+                No description available.
+            RESOURCE_POLICIES (83955297):
+                No description available.
+            ROUTERS (493018666):
+                No description available.
+            ROUTES (275680074):
+                No description available.
+            SECURITY_POLICIES (189518703):
+                No description available.
+            SECURITY_POLICIES_PER_REGION (249041734):
+                No description available.
+            SECURITY_POLICY_ADVANCED_RULES_PER_REGION (371815341):
+                No description available.
+            SECURITY_POLICY_CEVAL_RULES (470815689):
+                No description available.
+            SECURITY_POLICY_RULES (203549225):
+                No description available.
+            SECURITY_POLICY_RULES_PER_REGION (126510156):
+                No description available.
+            SERVICE_ATTACHMENTS (471521510):
+                No description available.
+            SNAPSHOTS (343405327):
+                The total number of snapshots allowed for a
+                single project.
+            SSD_TOTAL_GB (161732561):
+                No description available.
+            SSL_CERTIFICATES (378372399):
+                No description available.
+            STATIC_ADDRESSES (93624049):
+                No description available.
+            STATIC_BYOIP_ADDRESSES (275809649):
+                No description available.
+            STATIC_EXTERNAL_IPV6_ADDRESS_RANGES (472346774):
+                No description available.
+            SUBNETWORKS (421330469):
+                No description available.
+            T2A_CPUS (522170599):
+                No description available.
+            T2D_CPUS (71187140):
+                No description available.
+            TARGET_HTTPS_PROXIES (219522506):
+                No description available.
+            TARGET_HTTP_PROXIES (164117155):
+                No description available.
+            TARGET_INSTANCES (284519728):
+                No description available.
+            TARGET_POOLS (348261257):
+                No description available.
+            TARGET_SSL_PROXIES (159216235):
+                No description available.
+            TARGET_TCP_PROXIES (182243136):
+                No description available.
+            TARGET_VPN_GATEWAYS (75029928):
+                No description available.
+            URL_MAPS (378660743):
+                No description available.
+            VPN_GATEWAYS (35620282):
+                No description available.
+            VPN_TUNNELS (104327296):
+                No description available.
+            XPN_SERVICE_PROJECTS (95191981):
+                No description available.
+        """
+        UNDEFINED_METRIC = 0
+        A2_CPUS = 153206585
+        AFFINITY_GROUPS = 108303563
+        AUTOSCALERS = 471248988
+        BACKEND_BUCKETS = 137626846
+        BACKEND_SERVICES = 269623753
+        C2D_CPUS = 508182517
+        C2_CPUS = 317601211
+        C3_CPUS = 346230362
+        COMMITMENTS = 456141790
+        COMMITTED_A2_CPUS = 59330902
+        COMMITTED_C2D_CPUS = 282390904
+        COMMITTED_C2_CPUS = 223725528
+        COMMITTED_C3_CPUS = 252354679
+        COMMITTED_CPUS = 292394702
+        COMMITTED_E2_CPUS = 388120154
+        COMMITTED_LICENSES = 357606869
+        COMMITTED_LOCAL_SSD_TOTAL_GB = 308393480
+        COMMITTED_M3_CPUS = 585985
+        COMMITTED_MEMORY_OPTIMIZED_CPUS = 489057886
+        COMMITTED_N2A_CPUS = 40064304
+        COMMITTED_N2D_CPUS = 125951757
+        COMMITTED_N2_CPUS = 322589603
+        COMMITTED_NVIDIA_A100_80GB_GPUS = 464326565
+        COMMITTED_NVIDIA_A100_GPUS = 375799445
+        COMMITTED_NVIDIA_K80_GPUS = 3857188
+        COMMITTED_NVIDIA_L4_GPUS = 19163645
+        COMMITTED_NVIDIA_P100_GPUS = 107528100
+        COMMITTED_NVIDIA_P4_GPUS = 347952897
+        COMMITTED_NVIDIA_T4_GPUS = 139871237
+        COMMITTED_NVIDIA_V100_GPUS = 219562
+        COMMITTED_T2A_CPUS = 296378986
+        COMMITTED_T2D_CPUS = 382266439
+        CPUS = 2075595
+        CPUS_ALL_REGIONS = 470911149
+        DISKS_TOTAL_GB = 353520543
+        E2_CPUS = 481995837
+        EXTERNAL_MANAGED_FORWARDING_RULES = 150790089
+        EXTERNAL_NETWORK_LB_FORWARDING_RULES = 374298265
+        EXTERNAL_PROTOCOL_FORWARDING_RULES = 63478888
+        EXTERNAL_VPN_GATEWAYS = 272457134
+        FIREWALLS = 374485843
+        FORWARDING_RULES = 432668949
+        GLOBAL_EXTERNAL_MANAGED_BACKEND_SERVICES = 164566753
+        GLOBAL_EXTERNAL_MANAGED_FORWARDING_RULES = 327611949
+        GLOBAL_EXTERNAL_PROXY_LB_BACKEND_SERVICES = 400256169
+        GLOBAL_INTERNAL_ADDRESSES = 42738332
+        GLOBAL_INTERNAL_MANAGED_BACKEND_SERVICES = 256608303
+        GLOBAL_INTERNAL_TRAFFIC_DIRECTOR_BACKEND_SERVICES = 323514196
+        GPUS_ALL_REGIONS = 39387177
+        HEALTH_CHECKS = 289347502
+        IMAGES = 15562360
+        INSTANCES = 131337822
+        INSTANCE_GROUPS = 355919038
+        INSTANCE_GROUP_MANAGERS = 101798192
+        INSTANCE_TEMPLATES = 226188271
+        INTERCONNECTS = 415204741
+        INTERCONNECT_ATTACHMENTS_PER_REGION = 159968086
+        INTERCONNECT_ATTACHMENTS_TOTAL_MBPS = 425090419
+        INTERCONNECT_TOTAL_GBPS = 285341866
+        INTERNAL_ADDRESSES = 197899392
+        INTERNAL_TRAFFIC_DIRECTOR_FORWARDING_RULES = 266433668
+        IN_PLACE_SNAPSHOTS = 151359133
+        IN_USE_ADDRESSES = 402125072
+        IN_USE_BACKUP_SCHEDULES = 32786705
+        IN_USE_SNAPSHOT_SCHEDULES = 462104083
+        LOCAL_SSD_TOTAL_GB = 330878021
+        M1_CPUS = 37203366
+        M2_CPUS = 65832517
+        M3_CPUS = 94461668
+        MACHINE_IMAGES = 446986640
+        N2A_CPUS = 265855917
+        N2D_CPUS = 351743370
+        N2_CPUS = 416465286
+        NETWORKS = 485481477
+        NETWORK_ATTACHMENTS = 149028575
+        NETWORK_ENDPOINT_GROUPS = 102144909
+        NETWORK_FIREWALL_POLICIES = 101117374
+        NET_LB_SECURITY_POLICIES_PER_REGION = 157892269
+        NET_LB_SECURITY_POLICY_RULES_PER_REGION = 356090931
+        NET_LB_SECURITY_POLICY_RULE_ATTRIBUTES_PER_REGION = 311243888
+        NODE_GROUPS = 24624817
+        NODE_TEMPLATES = 474896668
+        NVIDIA_A100_80GB_GPUS = 286389320
+        NVIDIA_A100_GPUS = 504872978
+        NVIDIA_K80_GPUS = 163886599
+        NVIDIA_L4_GPUS = 491923130
+        NVIDIA_P100_GPUS = 236601633
+        NVIDIA_P100_VWS_GPUS = 213970574
+        NVIDIA_P4_GPUS = 283841470
+        NVIDIA_P4_VWS_GPUS = 528296619
+        NVIDIA_T4_GPUS = 75759810
+        NVIDIA_T4_VWS_GPUS = 319813039
+        NVIDIA_V100_GPUS = 129293095
+        PACKET_MIRRORINGS = 15578407
+        PD_EXTREME_TOTAL_PROVISIONED_IOPS = 69593965
+        PREEMPTIBLE_CPUS = 251184841
+        PREEMPTIBLE_LOCAL_SSD_GB = 260819336
+        PREEMPTIBLE_NVIDIA_A100_80GB_GPUS = 151942410
+        PREEMPTIBLE_NVIDIA_A100_GPUS = 68832784
+        PREEMPTIBLE_NVIDIA_K80_GPUS = 374960201
+        PREEMPTIBLE_NVIDIA_L4_GPUS = 100408376
+        PREEMPTIBLE_NVIDIA_P100_GPUS = 337432351
+        PREEMPTIBLE_NVIDIA_P100_VWS_GPUS = 313544076
+        PREEMPTIBLE_NVIDIA_P4_GPUS = 429197628
+        PREEMPTIBLE_NVIDIA_P4_VWS_GPUS = 252981545
+        PREEMPTIBLE_NVIDIA_T4_GPUS = 221115968
+        PREEMPTIBLE_NVIDIA_T4_VWS_GPUS = 44497965
+        PREEMPTIBLE_NVIDIA_V100_GPUS = 230123813
+        PSC_ILB_CONSUMER_FORWARDING_RULES_PER_PRODUCER_NETWORK = 231164291
+        PSC_INTERNAL_LB_FORWARDING_RULES = 169005435
+        PUBLIC_ADVERTISED_PREFIXES = 471371980
+        PUBLIC_DELEGATED_PREFIXES = 532465974
+        REGIONAL_AUTOSCALERS = 29363772
+        REGIONAL_EXTERNAL_MANAGED_BACKEND_SERVICES = 4240989
+        REGIONAL_EXTERNAL_NETWORK_LB_BACKEND_SERVICES = 409564525
+        REGIONAL_INSTANCE_GROUP_MANAGERS = 37543696
+        REGIONAL_INTERNAL_LB_BACKEND_SERVICES = 137983760
+        REGIONAL_INTERNAL_MANAGED_BACKEND_SERVICES = 96282539
+        RESERVATIONS = 32644647
+        RESOURCE_POLICIES = 83955297
+        ROUTERS = 493018666
+        ROUTES = 275680074
+        SECURITY_POLICIES = 189518703
+        SECURITY_POLICIES_PER_REGION = 249041734
+        SECURITY_POLICY_ADVANCED_RULES_PER_REGION = 371815341
+        SECURITY_POLICY_CEVAL_RULES = 470815689
+        SECURITY_POLICY_RULES = 203549225
+        SECURITY_POLICY_RULES_PER_REGION = 126510156
+        SERVICE_ATTACHMENTS = 471521510
+        SNAPSHOTS = 343405327
+        SSD_TOTAL_GB = 161732561
+        SSL_CERTIFICATES = 378372399
+        STATIC_ADDRESSES = 93624049
+        STATIC_BYOIP_ADDRESSES = 275809649
+        STATIC_EXTERNAL_IPV6_ADDRESS_RANGES = 472346774
+        SUBNETWORKS = 421330469
+        T2A_CPUS = 522170599
+        T2D_CPUS = 71187140
+        TARGET_HTTPS_PROXIES = 219522506
+        TARGET_HTTP_PROXIES = 164117155
+        TARGET_INSTANCES = 284519728
+        TARGET_POOLS = 348261257
+        TARGET_SSL_PROXIES = 159216235
+        TARGET_TCP_PROXIES = 182243136
+        TARGET_VPN_GATEWAYS = 75029928
+        URL_MAPS = 378660743
+        VPN_GATEWAYS = 35620282
+        VPN_TUNNELS = 104327296
+        XPN_SERVICE_PROJECTS = 95191981
+
+    limit: float = proto.Field(
+        proto.DOUBLE,
+        number=102976443,
+        optional=True,
+    )
+    metric: str = proto.Field(
+        proto.STRING,
+        number=533067184,
+        optional=True,
+    )
+    owner: str = proto.Field(
+        proto.STRING,
+        number=106164915,
+        optional=True,
+    )
+    usage: float = proto.Field(
+        proto.DOUBLE,
+        number=111574433,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_accelerator_config
+from google.cloud.compute_v1.types._compute import shared_share_settings
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AllocationResourceStatus",
+        "AllocationResourceStatusSpecificSKUAllocation",
+        "AllocationSpecificSKUAllocationAllocatedInstancePropertiesReservedDisk",
+        "AllocationSpecificSKUAllocationReservedInstanceProperties",
+        "AllocationSpecificSKUReservation",
+        "Reservation",
+    },
+)
+
+
+class AllocationResourceStatus(proto.Message):
+    r"""[Output Only] Contains output only fields.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        specific_sku_allocation (google.cloud.compute_v1.types.AllocationResourceStatusSpecificSKUAllocation):
+            Allocation Properties of this reservation.
+
+            This field is a member of `oneof`_ ``_specific_sku_allocation``.
+    """
+
+    specific_sku_allocation: "AllocationResourceStatusSpecificSKUAllocation" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=196231151,
+            optional=True,
+            message="AllocationResourceStatusSpecificSKUAllocation",
+        )
+    )
+
+
+class AllocationResourceStatusSpecificSKUAllocation(proto.Message):
+    r"""Contains Properties set for the reservation.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        source_instance_template_id (str):
+            ID of the instance template used to populate
+            reservation properties.
+
+            This field is a member of `oneof`_ ``_source_instance_template_id``.
+    """
+
+    source_instance_template_id: str = proto.Field(
+        proto.STRING,
+        number=111196154,
+        optional=True,
+    )
+
+
+class AllocationSpecificSKUAllocationAllocatedInstancePropertiesReservedDisk(
+    proto.Message
+):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        disk_size_gb (int):
+            Specifies the size of the disk in base-2 GB.
+
+            This field is a member of `oneof`_ ``_disk_size_gb``.
+        interface (str):
+            Specifies the disk interface to use for
+            attaching this disk, which is either SCSI or
+            NVME. The default is SCSI. For performance
+            characteristics of SCSI over NVMe, see Local SSD
+            performance. Check the Interface enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_interface``.
+    """
+
+    class Interface(proto.Enum):
+        r"""Specifies the disk interface to use for attaching this disk,
+        which is either SCSI or NVME. The default is SCSI. For
+        performance characteristics of SCSI over NVMe, see Local SSD
+        performance.
+
+        Values:
+            UNDEFINED_INTERFACE (0):
+                A value indicating that the enum field is not
+                set.
+            NVME (2408800):
+                No description available.
+            SCSI (2539686):
+                No description available.
+        """
+        UNDEFINED_INTERFACE = 0
+        NVME = 2408800
+        SCSI = 2539686
+
+    disk_size_gb: int = proto.Field(
+        proto.INT64,
+        number=316263735,
+        optional=True,
+    )
+    interface: str = proto.Field(
+        proto.STRING,
+        number=502623545,
+        optional=True,
+    )
+
+
+class AllocationSpecificSKUAllocationReservedInstanceProperties(proto.Message):
+    r"""Properties of the SKU instances being reserved. Next ID: 9
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        guest_accelerators (MutableSequence[google.cloud.compute_v1.types.AcceleratorConfig]):
+            Specifies accelerator type and count.
+        local_ssds (MutableSequence[google.cloud.compute_v1.types.AllocationSpecificSKUAllocationAllocatedInstancePropertiesReservedDisk]):
+            Specifies amount of local ssd to reserve with
+            each instance. The type of disk is local-ssd.
+        location_hint (str):
+            An opaque location hint used to place the
+            allocation close to other resources. This field
+            is for use by internal tools that use the public
+            API.
+
+            This field is a member of `oneof`_ ``_location_hint``.
+        machine_type (str):
+            Specifies type of machine (name only) which has fixed number
+            of vCPUs and fixed amount of memory. This also includes
+            specifying custom machine type following
+            custom-NUMBER_OF_CPUS-AMOUNT_OF_MEMORY pattern.
+
+            This field is a member of `oneof`_ ``_machine_type``.
+        min_cpu_platform (str):
+            Minimum cpu platform the reservation.
+
+            This field is a member of `oneof`_ ``_min_cpu_platform``.
+    """
+
+    guest_accelerators: MutableSequence[
+        shared_accelerator_config.AcceleratorConfig
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=463595119,
+        message=shared_accelerator_config.AcceleratorConfig,
+    )
+    local_ssds: MutableSequence[
+        "AllocationSpecificSKUAllocationAllocatedInstancePropertiesReservedDisk"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=229951299,
+        message="AllocationSpecificSKUAllocationAllocatedInstancePropertiesReservedDisk",
+    )
+    location_hint: str = proto.Field(
+        proto.STRING,
+        number=350519505,
+        optional=True,
+    )
+    machine_type: str = proto.Field(
+        proto.STRING,
+        number=227711026,
+        optional=True,
+    )
+    min_cpu_platform: str = proto.Field(
+        proto.STRING,
+        number=242912759,
+        optional=True,
+    )
+
+
+class AllocationSpecificSKUReservation(proto.Message):
+    r"""This reservation type allows to pre allocate specific
+    instance configuration. Next ID: 6
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        assured_count (int):
+            [Output Only] Indicates how many instances are actually
+            usable currently.
+
+            This field is a member of `oneof`_ ``_assured_count``.
+        count (int):
+            Specifies the number of resources that are
+            allocated.
+
+            This field is a member of `oneof`_ ``_count``.
+        in_use_count (int):
+            [Output Only] Indicates how many instances are in use.
+
+            This field is a member of `oneof`_ ``_in_use_count``.
+        instance_properties (google.cloud.compute_v1.types.AllocationSpecificSKUAllocationReservedInstanceProperties):
+            The instance properties for the reservation.
+
+            This field is a member of `oneof`_ ``_instance_properties``.
+        source_instance_template (str):
+            Specifies the instance template to create the
+            reservation. If you use this field, you must
+            exclude the instanceProperties field. This field
+            is optional, and it can be a full or partial
+            URL. For example, the following are all valid
+            URLs to an instance template: -
+            https://www.googleapis.com/compute/v1/projects/project
+            /global/instanceTemplates/instanceTemplate -
+            projects/project/global/instanceTemplates/instanceTemplate
+            - global/instanceTemplates/instanceTemplate
+
+            This field is a member of `oneof`_ ``_source_instance_template``.
+    """
+
+    assured_count: int = proto.Field(
+        proto.INT64,
+        number=281197645,
+        optional=True,
+    )
+    count: int = proto.Field(
+        proto.INT64,
+        number=94851343,
+        optional=True,
+    )
+    in_use_count: int = proto.Field(
+        proto.INT64,
+        number=493458877,
+        optional=True,
+    )
+    instance_properties: "AllocationSpecificSKUAllocationReservedInstanceProperties" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=215355165,
+            optional=True,
+            message="AllocationSpecificSKUAllocationReservedInstanceProperties",
+        )
+    )
+    source_instance_template: str = proto.Field(
+        proto.STRING,
+        number=332423616,
+        optional=True,
+    )
+
+
+class Reservation(proto.Message):
+    r"""Represents a reservation resource. A reservation ensures that
+    capacity is held in a specific zone even if the reserved VMs are
+    not running. For more information, read Reserving zonal
+    resources.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        commitment (str):
+            [Output Only] Full or partial URL to a parent commitment.
+            This field displays for reservations that are tied to a
+            commitment.
+
+            This field is a member of `oneof`_ ``_commitment``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#reservations for reservations.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            The name of the resource, provided by the client when
+            initially creating the resource. The resource name must be
+            1-63 characters long, and comply with RFC1035. Specifically,
+            the name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        resource_policies (MutableMapping[str, str]):
+            Resource policies to be added to this
+            reservation. The key is defined by user, and the
+            value is resource policy url. This is to define
+            placement policy with reservation.
+        resource_status (google.cloud.compute_v1.types.AllocationResourceStatus):
+            [Output Only] Status information for Reservation resource.
+
+            This field is a member of `oneof`_ ``_resource_status``.
+        satisfies_pzs (bool):
+            [Output Only] Reserved for future use.
+
+            This field is a member of `oneof`_ ``_satisfies_pzs``.
+        self_link (str):
+            [Output Only] Server-defined fully-qualified URL for this
+            resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        share_settings (google.cloud.compute_v1.types.ShareSettings):
+            Specify share-settings to create a shared
+            reservation. This property is optional. For more
+            information about the syntax and options for
+            this field and its subfields, see the guide for
+            creating a shared reservation.
+
+            This field is a member of `oneof`_ ``_share_settings``.
+        specific_reservation (google.cloud.compute_v1.types.AllocationSpecificSKUReservation):
+            Reservation for instances with specific
+            machine shapes.
+
+            This field is a member of `oneof`_ ``_specific_reservation``.
+        specific_reservation_required (bool):
+            Indicates whether the reservation can be
+            consumed by VMs with affinity for "any"
+            reservation. If the field is set, then only VMs
+            that target the reservation by name can consume
+            from this reservation.
+
+            This field is a member of `oneof`_ ``_specific_reservation_required``.
+        status (str):
+            [Output Only] The status of the reservation. Check the
+            Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        zone (str):
+            Zone in which the reservation resides. A zone
+            must be provided if the reservation is created
+            within a commitment.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the reservation.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            CREATING (455564985):
+                Resources are being allocated for the
+                reservation.
+            DELETING (528602024):
+                Reservation is currently being deleted.
+            INVALID (530283991):
+                No description available.
+            READY (77848963):
+                Reservation has allocated all its resources.
+            UPDATING (494614342):
+                Reservation is currently being resized.
+        """
+        UNDEFINED_STATUS = 0
+        CREATING = 455564985
+        DELETING = 528602024
+        INVALID = 530283991
+        READY = 77848963
+        UPDATING = 494614342
+
+    commitment: str = proto.Field(
+        proto.STRING,
+        number=482134805,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    resource_policies: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=22220385,
+    )
+    resource_status: "AllocationResourceStatus" = proto.Field(
+        proto.MESSAGE,
+        number=249429315,
+        optional=True,
+        message="AllocationResourceStatus",
+    )
+    satisfies_pzs: bool = proto.Field(
+        proto.BOOL,
+        number=480964267,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    share_settings: shared_share_settings.ShareSettings = proto.Field(
+        proto.MESSAGE,
+        number=266668163,
+        optional=True,
+        message=shared_share_settings.ShareSettings,
+    )
+    specific_reservation: "AllocationSpecificSKUReservation" = proto.Field(
+        proto.MESSAGE,
+        number=404901951,
+        optional=True,
+        message="AllocationSpecificSKUReservation",
+    )
+    specific_reservation_required: bool = proto.Field(
+        proto.BOOL,
+        number=226550687,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
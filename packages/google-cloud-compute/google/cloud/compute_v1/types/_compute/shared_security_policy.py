@@ -0,0 +1,1766 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_expr
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "SecurityPolicy",
+        "SecurityPolicyAdaptiveProtectionConfig",
+        "SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfig",
+        "SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfigThresholdConfig",
+        "SecurityPolicyAdvancedOptionsConfig",
+        "SecurityPolicyAdvancedOptionsConfigJsonCustomConfig",
+        "SecurityPolicyDdosProtectionConfig",
+        "SecurityPolicyList",
+        "SecurityPolicyRecaptchaOptionsConfig",
+        "SecurityPolicyRule",
+        "SecurityPolicyRuleHttpHeaderAction",
+        "SecurityPolicyRuleHttpHeaderActionHttpHeaderOption",
+        "SecurityPolicyRuleMatcher",
+        "SecurityPolicyRuleMatcherConfig",
+        "SecurityPolicyRuleNetworkMatcher",
+        "SecurityPolicyRuleNetworkMatcherUserDefinedFieldMatch",
+        "SecurityPolicyRulePreconfiguredWafConfig",
+        "SecurityPolicyRulePreconfiguredWafConfigExclusion",
+        "SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams",
+        "SecurityPolicyRuleRateLimitOptions",
+        "SecurityPolicyRuleRateLimitOptionsEnforceOnKeyConfig",
+        "SecurityPolicyRuleRateLimitOptionsThreshold",
+        "SecurityPolicyRuleRedirectOptions",
+        "SecurityPolicyUserDefinedField",
+    },
+)
+
+
+class SecurityPolicy(proto.Message):
+    r"""Represents a Google Cloud Armor security policy resource.
+    Only external backend services that use load balancers can
+    reference a security policy. For more information, see Google
+    Cloud Armor security policy overview.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        adaptive_protection_config (google.cloud.compute_v1.types.SecurityPolicyAdaptiveProtectionConfig):
+
+            This field is a member of `oneof`_ ``_adaptive_protection_config``.
+        advanced_options_config (google.cloud.compute_v1.types.SecurityPolicyAdvancedOptionsConfig):
+
+            This field is a member of `oneof`_ ``_advanced_options_config``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        ddos_protection_config (google.cloud.compute_v1.types.SecurityPolicyDdosProtectionConfig):
+
+            This field is a member of `oneof`_ ``_ddos_protection_config``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        fingerprint (str):
+            Specifies a fingerprint for this resource,
+            which is essentially a hash of the metadata's
+            contents and used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update metadata. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change metadata, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make get() request to the
+            security policy.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#securityPolicyfor security policies
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this security policy, which is essentially a
+            hash of the labels set used for optimistic
+            locking. The fingerprint is initially generated
+            by Compute Engine and changes after every
+            request to modify or update labels. You must
+            always provide an up-to-date fingerprint hash in
+            order to update or change labels. To see the
+            latest fingerprint, make get() request to the
+            security policy.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+            Labels for this resource. These can only be
+            added or modified by the setLabels method. Each
+            label key/value pair must comply with RFC1035.
+            Label values may be empty.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        recaptcha_options_config (google.cloud.compute_v1.types.SecurityPolicyRecaptchaOptionsConfig):
+
+            This field is a member of `oneof`_ ``_recaptcha_options_config``.
+        region (str):
+            [Output Only] URL of the region where the regional security
+            policy resides. This field is not applicable to global
+            security policies.
+
+            This field is a member of `oneof`_ ``_region``.
+        rules (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyRule]):
+            A list of rules that belong to this policy. There must
+            always be a default rule which is a rule with priority
+            2147483647 and match all condition (for the match condition
+            this means match "*" for srcIpRanges and for the
+            networkMatch condition every field must be either match "*"
+            or not set). If no rules are provided when creating a
+            security policy, a default rule with action "allow" will be
+            added.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        type_ (str):
+            The type indicates the intended use of the security policy.
+            - CLOUD_ARMOR: Cloud Armor backend security policies can be
+            configured to filter incoming HTTP requests targeting
+            backend services. They filter requests before they hit the
+            origin servers. - CLOUD_ARMOR_EDGE: Cloud Armor edge
+            security policies can be configured to filter incoming HTTP
+            requests targeting backend services (including Cloud
+            CDN-enabled) as well as backend buckets (Cloud Storage).
+            They filter requests before the request is served from
+            Google's cache. - CLOUD_ARMOR_INTERNAL_SERVICE: Cloud Armor
+            internal service policies can be configured to filter HTTP
+            requests targeting services managed by Traffic Director in a
+            service mesh. They filter requests before the request is
+            served from the application. - CLOUD_ARMOR_NETWORK: Cloud
+            Armor network policies can be configured to filter packets
+            targeting network load balancing resources such as backend
+            services, target pools, target instances, and instances with
+            external IPs. They filter requests before the request is
+            served from the application. This field can be set only at
+            resource creation time. Check the Type enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+        user_defined_fields (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyUserDefinedField]):
+            Definitions of user-defined fields for CLOUD_ARMOR_NETWORK
+            policies. A user-defined field consists of up to 4 bytes
+            extracted from a fixed offset in the packet, relative to the
+            IPv4, IPv6, TCP, or UDP header, with an optional mask to
+            select certain bits. Rules may then specify matching values
+            for these fields. Example: userDefinedFields: - name:
+            "ipv4_fragment_offset" base: IPV4 offset: 6 size: 2 mask:
+            "0x1fff".
+    """
+
+    class Type(proto.Enum):
+        r"""The type indicates the intended use of the security policy. -
+        CLOUD_ARMOR: Cloud Armor backend security policies can be configured
+        to filter incoming HTTP requests targeting backend services. They
+        filter requests before they hit the origin servers. -
+        CLOUD_ARMOR_EDGE: Cloud Armor edge security policies can be
+        configured to filter incoming HTTP requests targeting backend
+        services (including Cloud CDN-enabled) as well as backend buckets
+        (Cloud Storage). They filter requests before the request is served
+        from Google's cache. - CLOUD_ARMOR_INTERNAL_SERVICE: Cloud Armor
+        internal service policies can be configured to filter HTTP requests
+        targeting services managed by Traffic Director in a service mesh.
+        They filter requests before the request is served from the
+        application. - CLOUD_ARMOR_NETWORK: Cloud Armor network policies can
+        be configured to filter packets targeting network load balancing
+        resources such as backend services, target pools, target instances,
+        and instances with external IPs. They filter requests before the
+        request is served from the application. This field can be set only
+        at resource creation time.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            CLOUD_ARMOR (260640373):
+                No description available.
+            CLOUD_ARMOR_EDGE (250728775):
+                No description available.
+            CLOUD_ARMOR_NETWORK (488527428):
+                No description available.
+        """
+        UNDEFINED_TYPE = 0
+        CLOUD_ARMOR = 260640373
+        CLOUD_ARMOR_EDGE = 250728775
+        CLOUD_ARMOR_NETWORK = 488527428
+
+    adaptive_protection_config: "SecurityPolicyAdaptiveProtectionConfig" = proto.Field(
+        proto.MESSAGE,
+        number=150240735,
+        optional=True,
+        message="SecurityPolicyAdaptiveProtectionConfig",
+    )
+    advanced_options_config: "SecurityPolicyAdvancedOptionsConfig" = proto.Field(
+        proto.MESSAGE,
+        number=449276352,
+        optional=True,
+        message="SecurityPolicyAdvancedOptionsConfig",
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    ddos_protection_config: "SecurityPolicyDdosProtectionConfig" = proto.Field(
+        proto.MESSAGE,
+        number=50315853,
+        optional=True,
+        message="SecurityPolicyDdosProtectionConfig",
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    recaptcha_options_config: "SecurityPolicyRecaptchaOptionsConfig" = proto.Field(
+        proto.MESSAGE,
+        number=519006811,
+        optional=True,
+        message="SecurityPolicyRecaptchaOptionsConfig",
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    rules: MutableSequence["SecurityPolicyRule"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=108873975,
+        message="SecurityPolicyRule",
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+    user_defined_fields: MutableSequence[
+        "SecurityPolicyUserDefinedField"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=28312739,
+        message="SecurityPolicyUserDefinedField",
+    )
+
+
+class SecurityPolicyAdaptiveProtectionConfig(proto.Message):
+    r"""Configuration options for Cloud Armor Adaptive Protection
+    (CAAP).
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        layer7_ddos_defense_config (google.cloud.compute_v1.types.SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfig):
+            If set to true, enables Cloud Armor Machine
+            Learning.
+
+            This field is a member of `oneof`_ ``_layer7_ddos_defense_config``.
+    """
+
+    layer7_ddos_defense_config: "SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfig" = proto.Field(
+        proto.MESSAGE,
+        number=437316771,
+        optional=True,
+        message="SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfig",
+    )
+
+
+class SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfig(proto.Message):
+    r"""Configuration options for L7 DDoS detection. This field is only
+    supported in Global Security Policies of type CLOUD_ARMOR.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enable (bool):
+            If set to true, enables CAAP for L7 DDoS detection. This
+            field is only supported in Global Security Policies of type
+            CLOUD_ARMOR.
+
+            This field is a member of `oneof`_ ``_enable``.
+        rule_visibility (str):
+            Rule visibility can be one of the following: STANDARD -
+            opaque rules. (default) PREMIUM - transparent rules. This
+            field is only supported in Global Security Policies of type
+            CLOUD_ARMOR. Check the RuleVisibility enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_rule_visibility``.
+        threshold_configs (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfigThresholdConfig]):
+            Configuration options for layer7 adaptive
+            protection for various customizable thresholds.
+    """
+
+    class RuleVisibility(proto.Enum):
+        r"""Rule visibility can be one of the following: STANDARD - opaque
+        rules. (default) PREMIUM - transparent rules. This field is only
+        supported in Global Security Policies of type CLOUD_ARMOR.
+
+        Values:
+            UNDEFINED_RULE_VISIBILITY (0):
+                A value indicating that the enum field is not
+                set.
+            PREMIUM (399530551):
+                No description available.
+            STANDARD (484642493):
+                No description available.
+        """
+        UNDEFINED_RULE_VISIBILITY = 0
+        PREMIUM = 399530551
+        STANDARD = 484642493
+
+    enable: bool = proto.Field(
+        proto.BOOL,
+        number=311764355,
+        optional=True,
+    )
+    rule_visibility: str = proto.Field(
+        proto.STRING,
+        number=453258293,
+        optional=True,
+    )
+    threshold_configs: MutableSequence[
+        "SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfigThresholdConfig"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=60347805,
+        message="SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfigThresholdConfig",
+    )
+
+
+class SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfigThresholdConfig(
+    proto.Message
+):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        auto_deploy_confidence_threshold (float):
+
+            This field is a member of `oneof`_ ``_auto_deploy_confidence_threshold``.
+        auto_deploy_expiration_sec (int):
+
+            This field is a member of `oneof`_ ``_auto_deploy_expiration_sec``.
+        auto_deploy_impacted_baseline_threshold (float):
+
+            This field is a member of `oneof`_ ``_auto_deploy_impacted_baseline_threshold``.
+        auto_deploy_load_threshold (float):
+
+            This field is a member of `oneof`_ ``_auto_deploy_load_threshold``.
+        name (str):
+            The name must be 1-63 characters long, and
+            comply with RFC1035. The name must be unique
+            within the security policy.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    auto_deploy_confidence_threshold: float = proto.Field(
+        proto.FLOAT,
+        number=84309694,
+        optional=True,
+    )
+    auto_deploy_expiration_sec: int = proto.Field(
+        proto.INT32,
+        number=69638793,
+        optional=True,
+    )
+    auto_deploy_impacted_baseline_threshold: float = proto.Field(
+        proto.FLOAT,
+        number=292441667,
+        optional=True,
+    )
+    auto_deploy_load_threshold: float = proto.Field(
+        proto.FLOAT,
+        number=522227738,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+
+
+class SecurityPolicyAdvancedOptionsConfig(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        json_custom_config (google.cloud.compute_v1.types.SecurityPolicyAdvancedOptionsConfigJsonCustomConfig):
+            Custom configuration to apply the JSON parsing. Only
+            applicable when json_parsing is set to STANDARD.
+
+            This field is a member of `oneof`_ ``_json_custom_config``.
+        json_parsing (str):
+            Check the JsonParsing enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_json_parsing``.
+        log_level (str):
+            Check the LogLevel enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_log_level``.
+        user_ip_request_headers (MutableSequence[str]):
+            An optional list of case-insensitive request
+            header names to use for resolving the callers
+            client IP address.
+    """
+
+    class JsonParsing(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_JSON_PARSING (0):
+                A value indicating that the enum field is not
+                set.
+            DISABLED (516696700):
+                No description available.
+            STANDARD (484642493):
+                No description available.
+            STANDARD_WITH_GRAPHQL (106979218):
+                No description available.
+        """
+        UNDEFINED_JSON_PARSING = 0
+        DISABLED = 516696700
+        STANDARD = 484642493
+        STANDARD_WITH_GRAPHQL = 106979218
+
+    class LogLevel(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_LOG_LEVEL (0):
+                A value indicating that the enum field is not
+                set.
+            NORMAL (161067239):
+                No description available.
+            VERBOSE (532219234):
+                No description available.
+        """
+        UNDEFINED_LOG_LEVEL = 0
+        NORMAL = 161067239
+        VERBOSE = 532219234
+
+    json_custom_config: "SecurityPolicyAdvancedOptionsConfigJsonCustomConfig" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=111570105,
+            optional=True,
+            message="SecurityPolicyAdvancedOptionsConfigJsonCustomConfig",
+        )
+    )
+    json_parsing: str = proto.Field(
+        proto.STRING,
+        number=282493529,
+        optional=True,
+    )
+    log_level: str = proto.Field(
+        proto.STRING,
+        number=140582601,
+        optional=True,
+    )
+    user_ip_request_headers: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=421050290,
+    )
+
+
+class SecurityPolicyAdvancedOptionsConfigJsonCustomConfig(proto.Message):
+    r"""
+
+    Attributes:
+        content_types (MutableSequence[str]):
+            A list of custom Content-Type header values to apply the
+            JSON parsing. As per RFC 1341, a Content-Type header value
+            has the following format: Content-Type := type "/" subtype
+            \*[";" parameter] When configuring a custom Content-Type
+            header value, only the type/subtype needs to be specified,
+            and the parameters should be excluded.
+    """
+
+    content_types: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=17428787,
+    )
+
+
+class SecurityPolicyDdosProtectionConfig(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ddos_protection (str):
+            Check the DdosProtection enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_ddos_protection``.
+    """
+
+    class DdosProtection(proto.Enum):
+        r"""
+
+        Values:
+            UNDEFINED_DDOS_PROTECTION (0):
+                A value indicating that the enum field is not
+                set.
+            ADVANCED (63789090):
+                No description available.
+            STANDARD (484642493):
+                No description available.
+        """
+        UNDEFINED_DDOS_PROTECTION = 0
+        ADVANCED = 63789090
+        STANDARD = 484642493
+
+    ddos_protection: str = proto.Field(
+        proto.STRING,
+        number=275173268,
+        optional=True,
+    )
+
+
+class SecurityPolicyList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.SecurityPolicy]):
+            A list of SecurityPolicy resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#securityPolicyList for listsof securityPolicies
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["SecurityPolicy"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="SecurityPolicy",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class SecurityPolicyRecaptchaOptionsConfig(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        redirect_site_key (str):
+            An optional field to supply a reCAPTCHA site key to be used
+            for all the rules using the redirect action with the type of
+            GOOGLE_RECAPTCHA under the security policy. The specified
+            site key needs to be created from the reCAPTCHA API. The
+            user is responsible for the validity of the specified site
+            key. If not specified, a Google-managed site key is used.
+            This field is only supported in Global Security Policies of
+            type CLOUD_ARMOR.
+
+            This field is a member of `oneof`_ ``_redirect_site_key``.
+    """
+
+    redirect_site_key: str = proto.Field(
+        proto.STRING,
+        number=447677034,
+        optional=True,
+    )
+
+
+class SecurityPolicyRule(proto.Message):
+    r"""Represents a rule that describes one or more match conditions
+    along with the action to be taken when traffic matches this
+    condition (allow or deny).
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        action (str):
+            The Action to perform when the rule is matched. The
+            following are the valid actions: - allow: allow access to
+            target. - deny(STATUS): deny access to target, returns the
+            HTTP response code specified. Valid values for ``STATUS``
+            are 403, 404, and 502. - rate_based_ban: limit client
+            traffic to the configured threshold and ban the client if
+            the traffic exceeds the threshold. Configure parameters for
+            this action in RateLimitOptions. Requires rate_limit_options
+            to be set. - redirect: redirect to a different target. This
+            can either be an internal reCAPTCHA redirect, or an external
+            URL-based redirect via a 302 response. Parameters for this
+            action can be configured via redirectOptions. This action is
+            only supported in Global Security Policies of type
+            CLOUD_ARMOR. - throttle: limit client traffic to the
+            configured threshold. Configure parameters for this action
+            in rateLimitOptions. Requires rate_limit_options to be set
+            for this.
+
+            This field is a member of `oneof`_ ``_action``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        header_action (google.cloud.compute_v1.types.SecurityPolicyRuleHttpHeaderAction):
+            Optional, additional actions that are performed on headers.
+            This field is only supported in Global Security Policies of
+            type CLOUD_ARMOR.
+
+            This field is a member of `oneof`_ ``_header_action``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#securityPolicyRule for security policy rules
+
+            This field is a member of `oneof`_ ``_kind``.
+        match (google.cloud.compute_v1.types.SecurityPolicyRuleMatcher):
+            A match condition that incoming traffic is
+            evaluated against. If it evaluates to true, the
+            corresponding 'action' is enforced.
+
+            This field is a member of `oneof`_ ``_match``.
+        network_match (google.cloud.compute_v1.types.SecurityPolicyRuleNetworkMatcher):
+            A match condition that incoming packets are evaluated
+            against for CLOUD_ARMOR_NETWORK security policies. If it
+            matches, the corresponding 'action' is enforced. The match
+            criteria for a rule consists of built-in match fields (like
+            'srcIpRanges') and potentially multiple user-defined match
+            fields ('userDefinedFields'). Field values may be extracted
+            directly from the packet or derived from it (e.g.
+            'srcRegionCodes'). Some fields may not be present in every
+            packet (e.g. 'srcPorts'). A user-defined field is only
+            present if the base header is found in the packet and the
+            entire field is in bounds. Each match field may specify
+            which values can match it, listing one or more ranges,
+            prefixes, or exact values that are considered a match for
+            the field. A field value must be present in order to match a
+            specified match field. If no match values are specified for
+            a match field, then any field value is considered to match
+            it, and it's not required to be present. For strings
+            specifying '*' is also equivalent to match all. For a packet
+            to match a rule, all specified match fields must match the
+            corresponding field values derived from the packet. Example:
+            networkMatch: srcIpRanges: - "192.0.2.0/24" -
+            "198.51.100.0/24" userDefinedFields: - name:
+            "ipv4_fragment_offset" values: - "1-0x1fff" The above match
+            condition matches packets with a source IP in 192.0.2.0/24
+            or 198.51.100.0/24 and a user-defined field named
+            "ipv4_fragment_offset" with a value between 1 and 0x1fff
+            inclusive.
+
+            This field is a member of `oneof`_ ``_network_match``.
+        preconfigured_waf_config (google.cloud.compute_v1.types.SecurityPolicyRulePreconfiguredWafConfig):
+            Preconfigured WAF configuration to be applied
+            for the rule. If the rule does not evaluate
+            preconfigured WAF rules, i.e., if
+            evaluatePreconfiguredWaf() is not used, this
+            field will have no effect.
+
+            This field is a member of `oneof`_ ``_preconfigured_waf_config``.
+        preview (bool):
+            If set to true, the specified action is not
+            enforced.
+
+            This field is a member of `oneof`_ ``_preview``.
+        priority (int):
+            An integer indicating the priority of a rule
+            in the list. The priority must be a positive
+            value between 0 and 2147483647. Rules are
+            evaluated from highest to lowest priority where
+            0 is the highest priority and 2147483647 is the
+            lowest priority.
+
+            This field is a member of `oneof`_ ``_priority``.
+        rate_limit_options (google.cloud.compute_v1.types.SecurityPolicyRuleRateLimitOptions):
+            Must be specified if the action is "rate_based_ban" or
+            "throttle". Cannot be specified for any other actions.
+
+            This field is a member of `oneof`_ ``_rate_limit_options``.
+        redirect_options (google.cloud.compute_v1.types.SecurityPolicyRuleRedirectOptions):
+            Parameters defining the redirect action. Cannot be specified
+            for any other actions. This field is only supported in
+            Global Security Policies of type CLOUD_ARMOR.
+
+            This field is a member of `oneof`_ ``_redirect_options``.
+    """
+
+    action: str = proto.Field(
+        proto.STRING,
+        number=187661878,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    header_action: "SecurityPolicyRuleHttpHeaderAction" = proto.Field(
+        proto.MESSAGE,
+        number=328077352,
+        optional=True,
+        message="SecurityPolicyRuleHttpHeaderAction",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    match: "SecurityPolicyRuleMatcher" = proto.Field(
+        proto.MESSAGE,
+        number=103668165,
+        optional=True,
+        message="SecurityPolicyRuleMatcher",
+    )
+    network_match: "SecurityPolicyRuleNetworkMatcher" = proto.Field(
+        proto.MESSAGE,
+        number=463387764,
+        optional=True,
+        message="SecurityPolicyRuleNetworkMatcher",
+    )
+    preconfigured_waf_config: "SecurityPolicyRulePreconfiguredWafConfig" = proto.Field(
+        proto.MESSAGE,
+        number=117805027,
+        optional=True,
+        message="SecurityPolicyRulePreconfiguredWafConfig",
+    )
+    preview: bool = proto.Field(
+        proto.BOOL,
+        number=218686408,
+        optional=True,
+    )
+    priority: int = proto.Field(
+        proto.INT32,
+        number=445151652,
+        optional=True,
+    )
+    rate_limit_options: "SecurityPolicyRuleRateLimitOptions" = proto.Field(
+        proto.MESSAGE,
+        number=67544315,
+        optional=True,
+        message="SecurityPolicyRuleRateLimitOptions",
+    )
+    redirect_options: "SecurityPolicyRuleRedirectOptions" = proto.Field(
+        proto.MESSAGE,
+        number=163285307,
+        optional=True,
+        message="SecurityPolicyRuleRedirectOptions",
+    )
+
+
+class SecurityPolicyRuleHttpHeaderAction(proto.Message):
+    r"""
+
+    Attributes:
+        request_headers_to_adds (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyRuleHttpHeaderActionHttpHeaderOption]):
+            The list of request headers to add or
+            overwrite if they're already present.
+    """
+
+    request_headers_to_adds: MutableSequence[
+        "SecurityPolicyRuleHttpHeaderActionHttpHeaderOption"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=87987661,
+        message="SecurityPolicyRuleHttpHeaderActionHttpHeaderOption",
+    )
+
+
+class SecurityPolicyRuleHttpHeaderActionHttpHeaderOption(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        header_name (str):
+            The name of the header to set.
+
+            This field is a member of `oneof`_ ``_header_name``.
+        header_value (str):
+            The value to set the named header to.
+
+            This field is a member of `oneof`_ ``_header_value``.
+    """
+
+    header_name: str = proto.Field(
+        proto.STRING,
+        number=110223613,
+        optional=True,
+    )
+    header_value: str = proto.Field(
+        proto.STRING,
+        number=203094335,
+        optional=True,
+    )
+
+
+class SecurityPolicyRuleMatcher(proto.Message):
+    r"""Represents a match condition that incoming traffic is
+    evaluated against. Exactly one field must be specified.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        config (google.cloud.compute_v1.types.SecurityPolicyRuleMatcherConfig):
+            The configuration options available when specifying
+            versioned_expr. This field must be specified if
+            versioned_expr is specified and cannot be specified if
+            versioned_expr is not specified.
+
+            This field is a member of `oneof`_ ``_config``.
+        expr (google.cloud.compute_v1.types.Expr):
+            User defined CEVAL expression. A CEVAL expression is used to
+            specify match criteria such as origin.ip, source.region_code
+            and contents in the request header. Expressions containing
+            ``evaluateThreatIntelligence`` require Cloud Armor Managed
+            Protection Plus tier and are not supported in Edge Policies
+            nor in Regional Policies. Expressions containing
+            ``evaluatePreconfiguredExpr('sourceiplist-*')`` require
+            Cloud Armor Managed Protection Plus tier and are only
+            supported in Global Security Policies.
+
+            This field is a member of `oneof`_ ``_expr``.
+        versioned_expr (str):
+            Preconfigured versioned expression. If this field is
+            specified, config must also be specified. Available
+            preconfigured expressions along with their requirements are:
+            SRC_IPS_V1 - must specify the corresponding src_ip_range
+            field in config. Check the VersionedExpr enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_versioned_expr``.
+    """
+
+    class VersionedExpr(proto.Enum):
+        r"""Preconfigured versioned expression. If this field is specified,
+        config must also be specified. Available preconfigured expressions
+        along with their requirements are: SRC_IPS_V1 - must specify the
+        corresponding src_ip_range field in config.
+
+        Values:
+            UNDEFINED_VERSIONED_EXPR (0):
+                A value indicating that the enum field is not
+                set.
+            SRC_IPS_V1 (70925961):
+                Matches the source IP address of a request to
+                the IP ranges supplied in config.
+        """
+        UNDEFINED_VERSIONED_EXPR = 0
+        SRC_IPS_V1 = 70925961
+
+    config: "SecurityPolicyRuleMatcherConfig" = proto.Field(
+        proto.MESSAGE,
+        number=255820610,
+        optional=True,
+        message="SecurityPolicyRuleMatcherConfig",
+    )
+    expr: shared_expr.Expr = proto.Field(
+        proto.MESSAGE,
+        number=3127797,
+        optional=True,
+        message=shared_expr.Expr,
+    )
+    versioned_expr: str = proto.Field(
+        proto.STRING,
+        number=322286013,
+        optional=True,
+    )
+
+
+class SecurityPolicyRuleMatcherConfig(proto.Message):
+    r"""
+
+    Attributes:
+        src_ip_ranges (MutableSequence[str]):
+            CIDR IP address range. Maximum number of src_ip_ranges
+            allowed is 10.
+    """
+
+    src_ip_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=432128083,
+    )
+
+
+class SecurityPolicyRuleNetworkMatcher(proto.Message):
+    r"""Represents a match condition that incoming network traffic is
+    evaluated against.
+
+    Attributes:
+        dest_ip_ranges (MutableSequence[str]):
+            Destination IPv4/IPv6 addresses or CIDR
+            prefixes, in standard text format.
+        dest_ports (MutableSequence[str]):
+            Destination port numbers for TCP/UDP/SCTP.
+            Each element can be a 16-bit unsigned decimal
+            number (e.g. "80") or range (e.g. "0-1023").
+        ip_protocols (MutableSequence[str]):
+            IPv4 protocol / IPv6 next header (after
+            extension headers). Each element can be an 8-bit
+            unsigned decimal number (e.g. "6"), range (e.g.
+            "253-254"), or one of the following protocol
+            names: "tcp", "udp", "icmp", "esp", "ah",
+            "ipip", or "sctp".
+        src_asns (MutableSequence[int]):
+            BGP Autonomous System Number associated with
+            the source IP address.
+        src_ip_ranges (MutableSequence[str]):
+            Source IPv4/IPv6 addresses or CIDR prefixes,
+            in standard text format.
+        src_ports (MutableSequence[str]):
+            Source port numbers for TCP/UDP/SCTP. Each
+            element can be a 16-bit unsigned decimal number
+            (e.g. "80") or range (e.g. "0-1023").
+        src_region_codes (MutableSequence[str]):
+            Two-letter ISO 3166-1 alpha-2 country code
+            associated with the source IP address.
+        user_defined_fields (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyRuleNetworkMatcherUserDefinedFieldMatch]):
+            User-defined fields. Each element names a
+            defined field and lists the matching values for
+            that field.
+    """
+
+    dest_ip_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=337357713,
+    )
+    dest_ports: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=379902005,
+    )
+    ip_protocols: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=259213251,
+    )
+    src_asns: MutableSequence[int] = proto.RepeatedField(
+        proto.UINT32,
+        number=117825266,
+    )
+    src_ip_ranges: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=432128083,
+    )
+    src_ports: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=445095415,
+    )
+    src_region_codes: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=99086742,
+    )
+    user_defined_fields: MutableSequence[
+        "SecurityPolicyRuleNetworkMatcherUserDefinedFieldMatch"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=28312739,
+        message="SecurityPolicyRuleNetworkMatcherUserDefinedFieldMatch",
+    )
+
+
+class SecurityPolicyRuleNetworkMatcherUserDefinedFieldMatch(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            Name of the user-defined field, as given in
+            the definition.
+
+            This field is a member of `oneof`_ ``_name``.
+        values (MutableSequence[str]):
+            Matching values of the field. Each element
+            can be a 32-bit unsigned decimal or hexadecimal
+            (starting with "0x") number (e.g. "64") or range
+            (e.g. "0x400-0x7ff").
+    """
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    values: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=249928994,
+    )
+
+
+class SecurityPolicyRulePreconfiguredWafConfig(proto.Message):
+    r"""
+
+    Attributes:
+        exclusions (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyRulePreconfiguredWafConfigExclusion]):
+            A list of exclusions to apply during
+            preconfigured WAF evaluation.
+    """
+
+    exclusions: MutableSequence[
+        "SecurityPolicyRulePreconfiguredWafConfigExclusion"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=208665701,
+        message="SecurityPolicyRulePreconfiguredWafConfigExclusion",
+    )
+
+
+class SecurityPolicyRulePreconfiguredWafConfigExclusion(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        request_cookies_to_exclude (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams]):
+            A list of request cookie names whose value
+            will be excluded from inspection during
+            preconfigured WAF evaluation.
+        request_headers_to_exclude (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams]):
+            A list of request header names whose value
+            will be excluded from inspection during
+            preconfigured WAF evaluation.
+        request_query_params_to_exclude (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams]):
+            A list of request query parameter names whose
+            value will be excluded from inspection during
+            preconfigured WAF evaluation. Note that the
+            parameter can be in the query string or in the
+            POST body.
+        request_uris_to_exclude (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams]):
+            A list of request URIs from the request line
+            to be excluded from inspection during
+            preconfigured WAF evaluation. When specifying
+            this field, the query or fragment part should be
+            excluded.
+        target_rule_ids (MutableSequence[str]):
+            A list of target rule IDs under the WAF rule
+            set to apply the preconfigured WAF exclusion. If
+            omitted, it refers to all the rule IDs under the
+            WAF rule set.
+        target_rule_set (str):
+            Target WAF rule set to apply the
+            preconfigured WAF exclusion.
+
+            This field is a member of `oneof`_ ``_target_rule_set``.
+    """
+
+    request_cookies_to_exclude: MutableSequence[
+        "SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=156757878,
+        message="SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams",
+    )
+    request_headers_to_exclude: MutableSequence[
+        "SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=63230495,
+        message="SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams",
+    )
+    request_query_params_to_exclude: MutableSequence[
+        "SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=340692744,
+        message="SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams",
+    )
+    request_uris_to_exclude: MutableSequence[
+        "SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=90690846,
+        message="SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams",
+    )
+    target_rule_ids: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=498430435,
+    )
+    target_rule_set: str = proto.Field(
+        proto.STRING,
+        number=498440077,
+        optional=True,
+    )
+
+
+class SecurityPolicyRulePreconfiguredWafConfigExclusionFieldParams(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        op (str):
+            The match operator for the field.
+            Check the Op enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_op``.
+        val (str):
+            The value of the field.
+
+            This field is a member of `oneof`_ ``_val``.
+    """
+
+    class Op(proto.Enum):
+        r"""The match operator for the field.
+
+        Values:
+            UNDEFINED_OP (0):
+                A value indicating that the enum field is not
+                set.
+            CONTAINS (215180831):
+                The operator matches if the field value
+                contains the specified value.
+            ENDS_WITH (490402221):
+                The operator matches if the field value ends
+                with the specified value.
+            EQUALS (442201023):
+                The operator matches if the field value
+                equals the specified value.
+            EQUALS_ANY (337226060):
+                The operator matches if the field value is
+                any value.
+            STARTS_WITH (139505652):
+                The operator matches if the field value
+                starts with the specified value.
+        """
+        UNDEFINED_OP = 0
+        CONTAINS = 215180831
+        ENDS_WITH = 490402221
+        EQUALS = 442201023
+        EQUALS_ANY = 337226060
+        STARTS_WITH = 139505652
+
+    op: str = proto.Field(
+        proto.STRING,
+        number=3553,
+        optional=True,
+    )
+    val: str = proto.Field(
+        proto.STRING,
+        number=116513,
+        optional=True,
+    )
+
+
+class SecurityPolicyRuleRateLimitOptions(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ban_duration_sec (int):
+            Can only be specified if the action for the rule is
+            "rate_based_ban". If specified, determines the time (in
+            seconds) the traffic will continue to be banned by the rate
+            limit after the rate falls below the threshold.
+
+            This field is a member of `oneof`_ ``_ban_duration_sec``.
+        ban_threshold (google.cloud.compute_v1.types.SecurityPolicyRuleRateLimitOptionsThreshold):
+            Can only be specified if the action for the rule is
+            "rate_based_ban". If specified, the key will be banned for
+            the configured 'ban_duration_sec' when the number of
+            requests that exceed the 'rate_limit_threshold' also exceed
+            this 'ban_threshold'.
+
+            This field is a member of `oneof`_ ``_ban_threshold``.
+        conform_action (str):
+            Action to take for requests that are under
+            the configured rate limit threshold. Valid
+            option is "allow" only.
+
+            This field is a member of `oneof`_ ``_conform_action``.
+        enforce_on_key (str):
+            Determines the key to enforce the rate_limit_threshold on.
+            Possible values are: - ALL: A single rate limit threshold is
+            applied to all the requests matching this rule. This is the
+            default value if "enforceOnKey" is not configured. - IP: The
+            source IP address of the request is the key. Each IP has
+            this limit enforced separately. - HTTP_HEADER: The value of
+            the HTTP header whose name is configured under
+            "enforceOnKeyName". The key value is truncated to the first
+            128 bytes of the header value. If no such header is present
+            in the request, the key type defaults to ALL. - XFF_IP: The
+            first IP address (i.e. the originating client IP address)
+            specified in the list of IPs under X-Forwarded-For HTTP
+            header. If no such header is present or the value is not a
+            valid IP, the key defaults to the source IP address of the
+            request i.e. key type IP. - HTTP_COOKIE: The value of the
+            HTTP cookie whose name is configured under
+            "enforceOnKeyName". The key value is truncated to the first
+            128 bytes of the cookie value. If no such cookie is present
+            in the request, the key type defaults to ALL. - HTTP_PATH:
+            The URL path of the HTTP request. The key value is truncated
+            to the first 128 bytes. - SNI: Server name indication in the
+            TLS session of the HTTPS request. The key value is truncated
+            to the first 128 bytes. The key type defaults to ALL on a
+            HTTP session. - REGION_CODE: The country/region from which
+            the request originates. Check the EnforceOnKey enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_enforce_on_key``.
+        enforce_on_key_configs (MutableSequence[google.cloud.compute_v1.types.SecurityPolicyRuleRateLimitOptionsEnforceOnKeyConfig]):
+            If specified, any combination of values of
+            enforce_on_key_type/enforce_on_key_name is treated as the
+            key on which ratelimit threshold/action is enforced. You can
+            specify up to 3 enforce_on_key_configs. If
+            enforce_on_key_configs is specified, enforce_on_key must not
+            be specified.
+        enforce_on_key_name (str):
+            Rate limit key name applicable only for the following key
+            types: HTTP_HEADER -- Name of the HTTP header whose value is
+            taken as the key value. HTTP_COOKIE -- Name of the HTTP
+            cookie whose value is taken as the key value.
+
+            This field is a member of `oneof`_ ``_enforce_on_key_name``.
+        exceed_action (str):
+            Action to take for requests that are above the configured
+            rate limit threshold, to either deny with a specified HTTP
+            response code, or redirect to a different endpoint. Valid
+            options are ``deny(STATUS)``, where valid values for
+            ``STATUS`` are 403, 404, 429, and 502, and ``redirect``,
+            where the redirect parameters come from
+            ``exceedRedirectOptions`` below. The ``redirect`` action is
+            only supported in Global Security Policies of type
+            CLOUD_ARMOR.
+
+            This field is a member of `oneof`_ ``_exceed_action``.
+        exceed_redirect_options (google.cloud.compute_v1.types.SecurityPolicyRuleRedirectOptions):
+            Parameters defining the redirect action that is used as the
+            exceed action. Cannot be specified if the exceed action is
+            not redirect. This field is only supported in Global
+            Security Policies of type CLOUD_ARMOR.
+
+            This field is a member of `oneof`_ ``_exceed_redirect_options``.
+        rate_limit_threshold (google.cloud.compute_v1.types.SecurityPolicyRuleRateLimitOptionsThreshold):
+            Threshold at which to begin ratelimiting.
+
+            This field is a member of `oneof`_ ``_rate_limit_threshold``.
+    """
+
+    class EnforceOnKey(proto.Enum):
+        r"""Determines the key to enforce the rate_limit_threshold on. Possible
+        values are: - ALL: A single rate limit threshold is applied to all
+        the requests matching this rule. This is the default value if
+        "enforceOnKey" is not configured. - IP: The source IP address of the
+        request is the key. Each IP has this limit enforced separately. -
+        HTTP_HEADER: The value of the HTTP header whose name is configured
+        under "enforceOnKeyName". The key value is truncated to the first
+        128 bytes of the header value. If no such header is present in the
+        request, the key type defaults to ALL. - XFF_IP: The first IP
+        address (i.e. the originating client IP address) specified in the
+        list of IPs under X-Forwarded-For HTTP header. If no such header is
+        present or the value is not a valid IP, the key defaults to the
+        source IP address of the request i.e. key type IP. - HTTP_COOKIE:
+        The value of the HTTP cookie whose name is configured under
+        "enforceOnKeyName". The key value is truncated to the first 128
+        bytes of the cookie value. If no such cookie is present in the
+        request, the key type defaults to ALL. - HTTP_PATH: The URL path of
+        the HTTP request. The key value is truncated to the first 128 bytes.
+        - SNI: Server name indication in the TLS session of the HTTPS
+        request. The key value is truncated to the first 128 bytes. The key
+        type defaults to ALL on a HTTP session. - REGION_CODE: The
+        country/region from which the request originates.
+
+        Values:
+            UNDEFINED_ENFORCE_ON_KEY (0):
+                A value indicating that the enum field is not
+                set.
+            ALL (64897):
+                No description available.
+            HTTP_COOKIE (494981627):
+                No description available.
+            HTTP_HEADER (91597348):
+                No description available.
+            HTTP_PATH (311503228):
+                No description available.
+            IP (2343):
+                No description available.
+            REGION_CODE (79559768):
+                No description available.
+            SNI (82254):
+                No description available.
+            XFF_IP (438707118):
+                No description available.
+        """
+        UNDEFINED_ENFORCE_ON_KEY = 0
+        ALL = 64897
+        HTTP_COOKIE = 494981627
+        HTTP_HEADER = 91597348
+        HTTP_PATH = 311503228
+        IP = 2343
+        REGION_CODE = 79559768
+        SNI = 82254
+        XFF_IP = 438707118
+
+    ban_duration_sec: int = proto.Field(
+        proto.INT32,
+        number=42896726,
+        optional=True,
+    )
+    ban_threshold: "SecurityPolicyRuleRateLimitOptionsThreshold" = proto.Field(
+        proto.MESSAGE,
+        number=501208123,
+        optional=True,
+        message="SecurityPolicyRuleRateLimitOptionsThreshold",
+    )
+    conform_action: str = proto.Field(
+        proto.STRING,
+        number=517612367,
+        optional=True,
+    )
+    enforce_on_key: str = proto.Field(
+        proto.STRING,
+        number=416648956,
+        optional=True,
+    )
+    enforce_on_key_configs: MutableSequence[
+        "SecurityPolicyRuleRateLimitOptionsEnforceOnKeyConfig"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=33906478,
+        message="SecurityPolicyRuleRateLimitOptionsEnforceOnKeyConfig",
+    )
+    enforce_on_key_name: str = proto.Field(
+        proto.STRING,
+        number=132555246,
+        optional=True,
+    )
+    exceed_action: str = proto.Field(
+        proto.STRING,
+        number=167159073,
+        optional=True,
+    )
+    exceed_redirect_options: "SecurityPolicyRuleRedirectOptions" = proto.Field(
+        proto.MESSAGE,
+        number=473646694,
+        optional=True,
+        message="SecurityPolicyRuleRedirectOptions",
+    )
+    rate_limit_threshold: "SecurityPolicyRuleRateLimitOptionsThreshold" = proto.Field(
+        proto.MESSAGE,
+        number=315875208,
+        optional=True,
+        message="SecurityPolicyRuleRateLimitOptionsThreshold",
+    )
+
+
+class SecurityPolicyRuleRateLimitOptionsEnforceOnKeyConfig(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        enforce_on_key_name (str):
+            Rate limit key name applicable only for the following key
+            types: HTTP_HEADER -- Name of the HTTP header whose value is
+            taken as the key value. HTTP_COOKIE -- Name of the HTTP
+            cookie whose value is taken as the key value.
+
+            This field is a member of `oneof`_ ``_enforce_on_key_name``.
+        enforce_on_key_type (str):
+            Determines the key to enforce the rate_limit_threshold on.
+            Possible values are: - ALL: A single rate limit threshold is
+            applied to all the requests matching this rule. This is the
+            default value if "enforceOnKeyConfigs" is not configured. -
+            IP: The source IP address of the request is the key. Each IP
+            has this limit enforced separately. - HTTP_HEADER: The value
+            of the HTTP header whose name is configured under
+            "enforceOnKeyName". The key value is truncated to the first
+            128 bytes of the header value. If no such header is present
+            in the request, the key type defaults to ALL. - XFF_IP: The
+            first IP address (i.e. the originating client IP address)
+            specified in the list of IPs under X-Forwarded-For HTTP
+            header. If no such header is present or the value is not a
+            valid IP, the key defaults to the source IP address of the
+            request i.e. key type IP. - HTTP_COOKIE: The value of the
+            HTTP cookie whose name is configured under
+            "enforceOnKeyName". The key value is truncated to the first
+            128 bytes of the cookie value. If no such cookie is present
+            in the request, the key type defaults to ALL. - HTTP_PATH:
+            The URL path of the HTTP request. The key value is truncated
+            to the first 128 bytes. - SNI: Server name indication in the
+            TLS session of the HTTPS request. The key value is truncated
+            to the first 128 bytes. The key type defaults to ALL on a
+            HTTP session. - REGION_CODE: The country/region from which
+            the request originates. Check the EnforceOnKeyType enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_enforce_on_key_type``.
+    """
+
+    class EnforceOnKeyType(proto.Enum):
+        r"""Determines the key to enforce the rate_limit_threshold on. Possible
+        values are: - ALL: A single rate limit threshold is applied to all
+        the requests matching this rule. This is the default value if
+        "enforceOnKeyConfigs" is not configured. - IP: The source IP address
+        of the request is the key. Each IP has this limit enforced
+        separately. - HTTP_HEADER: The value of the HTTP header whose name
+        is configured under "enforceOnKeyName". The key value is truncated
+        to the first 128 bytes of the header value. If no such header is
+        present in the request, the key type defaults to ALL. - XFF_IP: The
+        first IP address (i.e. the originating client IP address) specified
+        in the list of IPs under X-Forwarded-For HTTP header. If no such
+        header is present or the value is not a valid IP, the key defaults
+        to the source IP address of the request i.e. key type IP. -
+        HTTP_COOKIE: The value of the HTTP cookie whose name is configured
+        under "enforceOnKeyName". The key value is truncated to the first
+        128 bytes of the cookie value. If no such cookie is present in the
+        request, the key type defaults to ALL. - HTTP_PATH: The URL path of
+        the HTTP request. The key value is truncated to the first 128 bytes.
+        - SNI: Server name indication in the TLS session of the HTTPS
+        request. The key value is truncated to the first 128 bytes. The key
+        type defaults to ALL on a HTTP session. - REGION_CODE: The
+        country/region from which the request originates.
+
+        Values:
+            UNDEFINED_ENFORCE_ON_KEY_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            ALL (64897):
+                No description available.
+            HTTP_COOKIE (494981627):
+                No description available.
+            HTTP_HEADER (91597348):
+                No description available.
+            HTTP_PATH (311503228):
+                No description available.
+            IP (2343):
+                No description available.
+            REGION_CODE (79559768):
+                No description available.
+            SNI (82254):
+                No description available.
+            XFF_IP (438707118):
+                No description available.
+        """
+        UNDEFINED_ENFORCE_ON_KEY_TYPE = 0
+        ALL = 64897
+        HTTP_COOKIE = 494981627
+        HTTP_HEADER = 91597348
+        HTTP_PATH = 311503228
+        IP = 2343
+        REGION_CODE = 79559768
+        SNI = 82254
+        XFF_IP = 438707118
+
+    enforce_on_key_name: str = proto.Field(
+        proto.STRING,
+        number=132555246,
+        optional=True,
+    )
+    enforce_on_key_type: str = proto.Field(
+        proto.STRING,
+        number=132757149,
+        optional=True,
+    )
+
+
+class SecurityPolicyRuleRateLimitOptionsThreshold(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        count (int):
+            Number of HTTP(S) requests for calculating
+            the threshold.
+
+            This field is a member of `oneof`_ ``_count``.
+        interval_sec (int):
+            Interval over which the threshold is
+            computed.
+
+            This field is a member of `oneof`_ ``_interval_sec``.
+    """
+
+    count: int = proto.Field(
+        proto.INT32,
+        number=94851343,
+        optional=True,
+    )
+    interval_sec: int = proto.Field(
+        proto.INT32,
+        number=41084375,
+        optional=True,
+    )
+
+
+class SecurityPolicyRuleRedirectOptions(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        target (str):
+            Target for the redirect action. This is required if the type
+            is EXTERNAL_302 and cannot be specified for
+            GOOGLE_RECAPTCHA.
+
+            This field is a member of `oneof`_ ``_target``.
+        type_ (str):
+            Type of the redirect action.
+            Check the Type enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r"""Type of the redirect action.
+
+        Values:
+            UNDEFINED_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            EXTERNAL_302 (395733761):
+                No description available.
+            GOOGLE_RECAPTCHA (518803009):
+                No description available.
+        """
+        UNDEFINED_TYPE = 0
+        EXTERNAL_302 = 395733761
+        GOOGLE_RECAPTCHA = 518803009
+
+    target: str = proto.Field(
+        proto.STRING,
+        number=192835985,
+        optional=True,
+    )
+    type_: str = proto.Field(
+        proto.STRING,
+        number=3575610,
+        optional=True,
+    )
+
+
+class SecurityPolicyUserDefinedField(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        base (str):
+            The base relative to which 'offset' is
+            measured. Possible values are: - IPV4: Points to
+            the beginning of the IPv4 header. - IPV6: Points
+            to the beginning of the IPv6 header. - TCP:
+            Points to the beginning of the TCP header,
+            skipping over any IPv4 options or IPv6 extension
+            headers. Not present for non-first fragments. -
+            UDP: Points to the beginning of the UDP header,
+            skipping over any IPv4 options or IPv6 extension
+            headers. Not present for non-first fragments.
+            required Check the Base enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_base``.
+        mask (str):
+            If specified, apply this mask (bitwise AND)
+            to the field to ignore bits before matching.
+            Encoded as a hexadecimal number (starting with
+            "0x"). The last byte of the field (in network
+            byte order) corresponds to the least significant
+            byte of the mask.
+
+            This field is a member of `oneof`_ ``_mask``.
+        name (str):
+            The name of this field. Must be unique within
+            the policy.
+
+            This field is a member of `oneof`_ ``_name``.
+        offset (int):
+            Offset of the first byte of the field (in
+            network byte order) relative to 'base'.
+
+            This field is a member of `oneof`_ ``_offset``.
+        size (int):
+            Size of the field in bytes. Valid values:
+            1-4.
+
+            This field is a member of `oneof`_ ``_size``.
+    """
+
+    class Base(proto.Enum):
+        r"""The base relative to which 'offset' is measured. Possible
+        values are: - IPV4: Points to the beginning of the IPv4 header.
+        - IPV6: Points to the beginning of the IPv6 header. - TCP:
+        Points to the beginning of the TCP header, skipping over any
+        IPv4 options or IPv6 extension headers. Not present for
+        non-first fragments. - UDP: Points to the beginning of the UDP
+        header, skipping over any IPv4 options or IPv6 extension
+        headers. Not present for non-first fragments. required
+
+        Values:
+            UNDEFINED_BASE (0):
+                A value indicating that the enum field is not
+                set.
+            IPV4 (2254341):
+                No description available.
+            IPV6 (2254343):
+                No description available.
+            TCP (82881):
+                No description available.
+            UDP (83873):
+                No description available.
+        """
+        UNDEFINED_BASE = 0
+        IPV4 = 2254341
+        IPV6 = 2254343
+        TCP = 82881
+        UDP = 83873
+
+    base: str = proto.Field(
+        proto.STRING,
+        number=3016401,
+        optional=True,
+    )
+    mask: str = proto.Field(
+        proto.STRING,
+        number=3344108,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    offset: int = proto.Field(
+        proto.INT32,
+        number=53961875,
+        optional=True,
+    )
+    size: int = proto.Field(
+        proto.INT32,
+        number=3530753,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
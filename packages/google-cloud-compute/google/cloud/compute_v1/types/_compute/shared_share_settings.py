@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "ShareSettings",
+        "ShareSettingsProjectConfig",
+    },
+)
+
+
+class ShareSettings(proto.Message):
+    r"""The share setting for reservations and sole tenancy node
+    groups.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project_map (MutableMapping[str, google.cloud.compute_v1.types.ShareSettingsProjectConfig]):
+            A map of project id and project config. This is only valid
+            when share_type's value is SPECIFIC_PROJECTS.
+        share_type (str):
+            Type of sharing for this shared-reservation
+            Check the ShareType enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_share_type``.
+    """
+
+    class ShareType(proto.Enum):
+        r"""Type of sharing for this shared-reservation
+
+        Values:
+            UNDEFINED_SHARE_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            LOCAL (72607563):
+                Default value.
+            ORGANIZATION (274978099):
+                Shared-reservation is open to entire
+                Organization
+            SHARE_TYPE_UNSPECIFIED (494771730):
+                Default value. This value is unused.
+            SPECIFIC_PROJECTS (347838695):
+                Shared-reservation is open to specific
+                projects
+        """
+        UNDEFINED_SHARE_TYPE = 0
+        LOCAL = 72607563
+        ORGANIZATION = 274978099
+        SHARE_TYPE_UNSPECIFIED = 494771730
+        SPECIFIC_PROJECTS = 347838695
+
+    project_map: MutableMapping[str, "ShareSettingsProjectConfig"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=134212406,
+        message="ShareSettingsProjectConfig",
+    )
+    share_type: str = proto.Field(
+        proto.STRING,
+        number=359533466,
+        optional=True,
+    )
+
+
+class ShareSettingsProjectConfig(proto.Message):
+    r"""Config for each project in the share settings.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project_id (str):
+            The project ID, should be same as the key of
+            this project config in the parent map.
+
+            This field is a member of `oneof`_ ``_project_id``.
+    """
+
+    project_id: str = proto.Field(
+        proto.STRING,
+        number=177513473,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "SignedUrlKey",
+    },
+)
+
+
+class SignedUrlKey(proto.Message):
+    r"""Represents a customer-supplied Signing Key used by Cloud CDN
+    Signed URLs
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        key_name (str):
+            Name of the key. The name must be 1-63 characters long, and
+            comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_key_name``.
+        key_value (str):
+            128-bit key value used for signing the URL.
+            The key value must be a valid RFC 4648 Section 5
+            base64url encoded string.
+
+            This field is a member of `oneof`_ ``_key_value``.
+    """
+
+    key_name: str = proto.Field(
+        proto.STRING,
+        number=500938859,
+        optional=True,
+    )
+    key_value: str = proto.Field(
+        proto.STRING,
+        number=504106897,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
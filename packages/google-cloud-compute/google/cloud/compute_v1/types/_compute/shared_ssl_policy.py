@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_warning
+from google.cloud.compute_v1.types._compute import shared_warnings
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "SslPoliciesList",
+        "SslPoliciesListAvailableFeaturesResponse",
+        "SslPolicy",
+    },
+)
+
+
+class SslPoliciesList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.SslPolicy]):
+            A list of SslPolicy resources.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#sslPoliciesList for lists of sslPolicies.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["SslPolicy"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="SslPolicy",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class SslPoliciesListAvailableFeaturesResponse(proto.Message):
+    r"""
+
+    Attributes:
+        features (MutableSequence[str]):
+
+    """
+
+    features: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=246211645,
+    )
+
+
+class SslPolicy(proto.Message):
+    r"""Represents an SSL Policy resource. Use SSL policies to
+    control the SSL features, such as versions and cipher suites,
+    offered by an HTTPS or SSL Proxy load balancer. For more
+    information, read SSL Policy Concepts.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        custom_features (MutableSequence[str]):
+            A list of features enabled when the selected
+            profile is CUSTOM. The method returns the set of
+            features that can be specified in this list.
+            This field must be empty if the profile is not
+            CUSTOM.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        enabled_features (MutableSequence[str]):
+            [Output Only] The list of features enabled in the SSL
+            policy.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a SslPolicy. An
+            up-to-date fingerprint must be provided in order
+            to update the SslPolicy, otherwise the request
+            will fail with error 412 conditionNotMet. To see
+            the latest fingerprint, make a get() request to
+            retrieve an SslPolicy.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#sslPolicyfor SSL policies.
+
+            This field is a member of `oneof`_ ``_kind``.
+        min_tls_version (str):
+            The minimum version of SSL protocol that can be used by the
+            clients to establish a connection with the load balancer.
+            This can be one of TLS_1_0, TLS_1_1, TLS_1_2. Check the
+            MinTlsVersion enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_min_tls_version``.
+        name (str):
+            Name of the resource. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        profile (str):
+            Profile specifies the set of SSL features
+            that can be used by the load balancer when
+            negotiating SSL with clients. This can be one of
+            COMPATIBLE, MODERN, RESTRICTED, or CUSTOM. If
+            using CUSTOM, the set of SSL features to enable
+            must be specified in the customFeatures field.
+            Check the Profile enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_profile``.
+        region (str):
+            [Output Only] URL of the region where the regional SSL
+            policy resides. This field is not applicable to global SSL
+            policies.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warnings (MutableSequence[google.cloud.compute_v1.types.Warnings]):
+            [Output Only] If potential misconfigurations are detected
+            for this SSL policy, this field will be populated with
+            warning messages.
+    """
+
+    class MinTlsVersion(proto.Enum):
+        r"""The minimum version of SSL protocol that can be used by the clients
+        to establish a connection with the load balancer. This can be one of
+        TLS_1_0, TLS_1_1, TLS_1_2.
+
+        Values:
+            UNDEFINED_MIN_TLS_VERSION (0):
+                A value indicating that the enum field is not
+                set.
+            TLS_1_0 (33116734):
+                TLS 1.0
+            TLS_1_1 (33116735):
+                TLS 1.1
+            TLS_1_2 (33116736):
+                TLS 1.2
+        """
+        UNDEFINED_MIN_TLS_VERSION = 0
+        TLS_1_0 = 33116734
+        TLS_1_1 = 33116735
+        TLS_1_2 = 33116736
+
+    class Profile(proto.Enum):
+        r"""Profile specifies the set of SSL features that can be used by
+        the load balancer when negotiating SSL with clients. This can be
+        one of COMPATIBLE, MODERN, RESTRICTED, or CUSTOM. If using
+        CUSTOM, the set of SSL features to enable must be specified in
+        the customFeatures field.
+
+        Values:
+            UNDEFINED_PROFILE (0):
+                A value indicating that the enum field is not
+                set.
+            COMPATIBLE (179357396):
+                Compatible profile. Allows the broadset set
+                of clients, even those which support only
+                out-of-date SSL features to negotiate with the
+                load balancer.
+            CUSTOM (388595569):
+                Custom profile. Allow only the set of allowed
+                SSL features specified in the customFeatures
+                field.
+            MODERN (132013855):
+                Modern profile. Supports a wide set of SSL
+                features, allowing modern clients to negotiate
+                SSL with the load balancer.
+            RESTRICTED (261551195):
+                Restricted profile. Supports a reduced set of
+                SSL features, intended to meet stricter
+                compliance requirements.
+        """
+        UNDEFINED_PROFILE = 0
+        COMPATIBLE = 179357396
+        CUSTOM = 388595569
+        MODERN = 132013855
+        RESTRICTED = 261551195
+
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    custom_features: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=34789707,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    enabled_features: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=469017467,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    min_tls_version: str = proto.Field(
+        proto.STRING,
+        number=8155943,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    profile: str = proto.Field(
+        proto.STRING,
+        number=227445161,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warnings: MutableSequence[shared_warnings.Warnings] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=498091095,
+        message=shared_warnings.Warnings,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
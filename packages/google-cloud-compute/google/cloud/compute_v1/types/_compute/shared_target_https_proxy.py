@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "TargetHttpsProxy",
+        "TargetHttpsProxyList",
+    },
+)
+
+
+class TargetHttpsProxy(proto.Message):
+    r"""Represents a Target HTTPS Proxy resource. Google Compute Engine has
+    two Target HTTPS Proxy resources: \*
+    `Global </compute/docs/reference/rest/v1/targetHttpsProxies>`__ \*
+    `Regional </compute/docs/reference/rest/v1/regionTargetHttpsProxies>`__
+    A target HTTPS proxy is a component of GCP HTTPS load balancers. \*
+    targetHttpProxies are used by global external Application Load
+    Balancers, classic Application Load Balancers, cross-region internal
+    Application Load Balancers, and Traffic Director. \*
+    regionTargetHttpProxies are used by regional internal Application
+    Load Balancers and regional external Application Load Balancers.
+    Forwarding rules reference a target HTTPS proxy, and the target
+    proxy then references a URL map. For more information, read Using
+    Target Proxies and Forwarding rule concepts.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        authorization_policy (str):
+            Optional. A URL referring to a
+            networksecurity.AuthorizationPolicy resource that describes
+            how the proxy should authorize inbound traffic. If left
+            blank, access will not be restricted by an authorization
+            policy. Refer to the AuthorizationPolicy resource for
+            additional details. authorizationPolicy only applies to a
+            global TargetHttpsProxy attached to globalForwardingRules
+            with the loadBalancingScheme set to INTERNAL_SELF_MANAGED.
+            Note: This field currently has no impact.
+
+            This field is a member of `oneof`_ ``_authorization_policy``.
+        certificate_map (str):
+            URL of a certificate map that identifies a
+            certificate map associated with the given target
+            proxy. This field can only be set for global
+            target proxies. If set, sslCertificates will be
+            ignored. Accepted format is
+            //certificatemanager.googleapis.com/projects/{project
+            }/locations/{location}/certificateMaps/{resourceName}.
+
+            This field is a member of `oneof`_ ``_certificate_map``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a TargetHttpsProxy. An
+            up-to-date fingerprint must be provided in order
+            to patch the TargetHttpsProxy; otherwise, the
+            request will fail with error 412
+            conditionNotMet. To see the latest fingerprint,
+            make a get() request to retrieve the
+            TargetHttpsProxy.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        http_keep_alive_timeout_sec (int):
+            Specifies how long to keep a connection open,
+            after completing a response, while there is no
+            matching traffic (in seconds). If an HTTP
+            keep-alive is not specified, a default value
+            (610 seconds) will be used. For global external
+            Application Load Balancers, the minimum allowed
+            value is 5 seconds and the maximum allowed value
+            is 1200 seconds. For classic Application Load
+            Balancers, this option is not supported.
+
+            This field is a member of `oneof`_ ``_http_keep_alive_timeout_sec``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#targetHttpsProxy for target HTTPS proxies.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        proxy_bind (bool):
+            This field only applies when the forwarding rule that
+            references this target proxy has a loadBalancingScheme set
+            to INTERNAL_SELF_MANAGED. When this field is set to true,
+            Envoy proxies set up inbound traffic interception and bind
+            to the IP address and port specified in the forwarding rule.
+            This is generally useful when using Traffic Director to
+            configure Envoy as a gateway or middle proxy (in other
+            words, not a sidecar proxy). The Envoy proxy listens for
+            inbound requests and handles requests when it receives them.
+            The default is false.
+
+            This field is a member of `oneof`_ ``_proxy_bind``.
+        quic_override (str):
+            Specifies the QUIC override policy for this
+            TargetHttpsProxy resource. This setting
+            determines whether the load balancer attempts to
+            negotiate QUIC with clients. You can specify
+            NONE, ENABLE, or DISABLE. - When quic-override
+            is set to NONE, Google manages whether QUIC is
+            used. - When quic-override is set to ENABLE, the
+            load balancer uses QUIC when possible. - When
+            quic-override is set to DISABLE, the load
+            balancer doesn't use QUIC. - If the
+            quic-override flag is not specified, NONE is
+            implied. Check the QuicOverride enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_quic_override``.
+        region (str):
+            [Output Only] URL of the region where the regional
+            TargetHttpsProxy resides. This field is not applicable to
+            global TargetHttpsProxies.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        server_tls_policy (str):
+            Optional. A URL referring to a
+            networksecurity.ServerTlsPolicy resource that describes how
+            the proxy should authenticate inbound traffic.
+            serverTlsPolicy only applies to a global TargetHttpsProxy
+            attached to globalForwardingRules with the
+            loadBalancingScheme set to INTERNAL_SELF_MANAGED or EXTERNAL
+            or EXTERNAL_MANAGED. For details which ServerTlsPolicy
+            resources are accepted with INTERNAL_SELF_MANAGED and which
+            with EXTERNAL, EXTERNAL_MANAGED loadBalancingScheme consult
+            ServerTlsPolicy documentation. If left blank, communications
+            are not encrypted.
+
+            This field is a member of `oneof`_ ``_server_tls_policy``.
+        ssl_certificates (MutableSequence[str]):
+            URLs to SslCertificate resources that are used to
+            authenticate connections between users and the load
+            balancer. At least one SSL certificate must be specified.
+            Currently, you may specify up to 15 SSL certificates.
+            sslCertificates do not apply when the load balancing scheme
+            is set to INTERNAL_SELF_MANAGED.
+        ssl_policy (str):
+            URL of SslPolicy resource that will be
+            associated with the TargetHttpsProxy resource.
+            If not set, the TargetHttpsProxy resource has no
+            SSL policy configured.
+
+            This field is a member of `oneof`_ ``_ssl_policy``.
+        url_map (str):
+            A fully-qualified or valid partial URL to the
+            UrlMap resource that defines the mapping from
+            URL to the BackendService. For example, the
+            following are all valid URLs for specifying a
+            URL map: -
+            https://www.googleapis.compute/v1/projects/project/global/urlMaps/
+            url-map -
+            projects/project/global/urlMaps/url-map -
+            global/urlMaps/url-map
+
+            This field is a member of `oneof`_ ``_url_map``.
+    """
+
+    class QuicOverride(proto.Enum):
+        r"""Specifies the QUIC override policy for this TargetHttpsProxy
+        resource. This setting determines whether the load balancer
+        attempts to negotiate QUIC with clients. You can specify NONE,
+        ENABLE, or DISABLE. - When quic-override is set to NONE, Google
+        manages whether QUIC is used. - When quic-override is set to
+        ENABLE, the load balancer uses QUIC when possible. - When
+        quic-override is set to DISABLE, the load balancer doesn't use
+        QUIC. - If the quic-override flag is not specified, NONE is
+        implied.
+
+        Values:
+            UNDEFINED_QUIC_OVERRIDE (0):
+                A value indicating that the enum field is not
+                set.
+            DISABLE (241807048):
+                The load balancer will not attempt to
+                negotiate QUIC with clients.
+            ENABLE (438835587):
+                The load balancer will attempt to negotiate
+                QUIC with clients.
+            NONE (2402104):
+                No overrides to the default QUIC policy. This
+                option is implicit if no QUIC override has been
+                specified in the request.
+        """
+        UNDEFINED_QUIC_OVERRIDE = 0
+        DISABLE = 241807048
+        ENABLE = 438835587
+        NONE = 2402104
+
+    authorization_policy: str = proto.Field(
+        proto.STRING,
+        number=33945528,
+        optional=True,
+    )
+    certificate_map: str = proto.Field(
+        proto.STRING,
+        number=156463796,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    http_keep_alive_timeout_sec: int = proto.Field(
+        proto.INT32,
+        number=447326046,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    proxy_bind: bool = proto.Field(
+        proto.BOOL,
+        number=286025582,
+        optional=True,
+    )
+    quic_override: str = proto.Field(
+        proto.STRING,
+        number=456577197,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    server_tls_policy: str = proto.Field(
+        proto.STRING,
+        number=295825266,
+        optional=True,
+    )
+    ssl_certificates: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=366006543,
+    )
+    ssl_policy: str = proto.Field(
+        proto.STRING,
+        number=295190213,
+        optional=True,
+    )
+    url_map: str = proto.Field(
+        proto.STRING,
+        number=367020684,
+        optional=True,
+    )
+
+
+class TargetHttpsProxyList(proto.Message):
+    r"""Contains a list of TargetHttpsProxy resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.TargetHttpsProxy]):
+            A list of TargetHttpsProxy resources.
+        kind (str):
+            Type of resource. Always
+            compute#targetHttpsProxyList for lists of target
+            HTTPS proxies.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["TargetHttpsProxy"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="TargetHttpsProxy",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "TestPermissionsRequest",
+        "TestPermissionsResponse",
+    },
+)
+
+
+class TestPermissionsRequest(proto.Message):
+    r"""
+
+    Attributes:
+        permissions (MutableSequence[str]):
+            The set of permissions to check for the 'resource'.
+            Permissions with wildcards (such as '*' or 'storage.*') are
+            not allowed.
+    """
+
+    permissions: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=59962500,
+    )
+
+
+class TestPermissionsResponse(proto.Message):
+    r"""
+
+    Attributes:
+        permissions (MutableSequence[str]):
+            A subset of ``TestPermissionsRequest.permissions`` that the
+            caller is allowed.
+    """
+
+    permissions: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=59962500,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
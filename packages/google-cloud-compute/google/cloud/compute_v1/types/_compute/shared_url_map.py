@@ -0,0 +1,2236 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_duration
+from google.cloud.compute_v1.types._compute import shared_metadata_filter
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "CorsPolicy",
+        "HostRule",
+        "HttpFaultAbort",
+        "HttpFaultDelay",
+        "HttpFaultInjection",
+        "HttpHeaderAction",
+        "HttpHeaderMatch",
+        "HttpHeaderOption",
+        "HttpQueryParameterMatch",
+        "HttpRedirectAction",
+        "HttpRetryPolicy",
+        "HttpRouteAction",
+        "HttpRouteRule",
+        "HttpRouteRuleMatch",
+        "Int64RangeMatch",
+        "PathMatcher",
+        "PathRule",
+        "RequestMirrorPolicy",
+        "TestFailure",
+        "UrlMap",
+        "UrlMapList",
+        "UrlMapTest",
+        "UrlMapTestHeader",
+        "UrlMapValidationResult",
+        "UrlMapsValidateResponse",
+        "UrlRewrite",
+        "WeightedBackendService",
+    },
+)
+
+
+class CorsPolicy(proto.Message):
+    r"""The specification for allowing client-side cross-origin
+    requests. For more information about the W3C recommendation for
+    cross-origin resource sharing (CORS), see Fetch API Living
+    Standard.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        allow_credentials (bool):
+            In response to a preflight request, setting
+            this to true indicates that the actual request
+            can include user credentials. This field
+            translates to the
+            Access-Control-Allow-Credentials header. Default
+            is false.
+
+            This field is a member of `oneof`_ ``_allow_credentials``.
+        allow_headers (MutableSequence[str]):
+            Specifies the content for the
+            Access-Control-Allow-Headers header.
+        allow_methods (MutableSequence[str]):
+            Specifies the content for the
+            Access-Control-Allow-Methods header.
+        allow_origin_regexes (MutableSequence[str]):
+            Specifies a regular expression that matches allowed origins.
+            For more information about the regular expression syntax,
+            see Syntax. An origin is allowed if it matches either an
+            item in allowOrigins or an item in allowOriginRegexes.
+            Regular expressions can only be used when the
+            loadBalancingScheme is set to INTERNAL_SELF_MANAGED.
+        allow_origins (MutableSequence[str]):
+            Specifies the list of origins that is allowed
+            to do CORS requests. An origin is allowed if it
+            matches either an item in allowOrigins or an
+            item in allowOriginRegexes.
+        disabled (bool):
+            If true, the setting specifies the CORS
+            policy is disabled. The default value of false,
+            which indicates that the CORS policy is in
+            effect.
+
+            This field is a member of `oneof`_ ``_disabled``.
+        expose_headers (MutableSequence[str]):
+            Specifies the content for the
+            Access-Control-Expose-Headers header.
+        max_age (int):
+            Specifies how long results of a preflight
+            request can be cached in seconds. This field
+            translates to the Access-Control-Max-Age header.
+
+            This field is a member of `oneof`_ ``_max_age``.
+    """
+
+    allow_credentials: bool = proto.Field(
+        proto.BOOL,
+        number=481263366,
+        optional=True,
+    )
+    allow_headers: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=45179024,
+    )
+    allow_methods: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=205405372,
+    )
+    allow_origin_regexes: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=215385810,
+    )
+    allow_origins: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=194914071,
+    )
+    disabled: bool = proto.Field(
+        proto.BOOL,
+        number=270940796,
+        optional=True,
+    )
+    expose_headers: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=247604747,
+    )
+    max_age: int = proto.Field(
+        proto.INT32,
+        number=307559332,
+        optional=True,
+    )
+
+
+class HostRule(proto.Message):
+    r"""UrlMaps A host-matching rule for a URL. If matched, will use
+    the named PathMatcher to select the BackendService.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        hosts (MutableSequence[str]):
+            The list of host patterns to match. They must be valid
+            hostnames with optional port numbers in the format
+            host:port. \* matches any string of ([a-z0-9-.]*). In that
+            case, \* must be the first character, and if followed by
+            anything, the immediate following character must be either -
+            or .. \* based matching is not supported when the URL map is
+            bound to a target gRPC proxy that has the
+            validateForProxyless field set to true.
+        path_matcher (str):
+            The name of the PathMatcher to use to match
+            the path portion of the URL if the hostRule
+            matches the URL's host portion.
+
+            This field is a member of `oneof`_ ``_path_matcher``.
+    """
+
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    hosts: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=99467211,
+    )
+    path_matcher: str = proto.Field(
+        proto.STRING,
+        number=337813272,
+        optional=True,
+    )
+
+
+class HttpFaultAbort(proto.Message):
+    r"""Specification for how requests are aborted as part of fault
+    injection.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        http_status (int):
+            The HTTP status code used to abort the
+            request. The value must be from 200 to 599
+            inclusive. For gRPC protocol, the gRPC status
+            code is mapped to HTTP status code according to
+            this mapping table. HTTP status 200 is mapped to
+            gRPC status UNKNOWN. Injecting an OK status is
+            currently not supported by Traffic Director.
+
+            This field is a member of `oneof`_ ``_http_status``.
+        percentage (float):
+            The percentage of traffic for connections,
+            operations, or requests that is aborted as part
+            of fault injection. The value must be from 0.0
+            to 100.0 inclusive.
+
+            This field is a member of `oneof`_ ``_percentage``.
+    """
+
+    http_status: int = proto.Field(
+        proto.UINT32,
+        number=468949897,
+        optional=True,
+    )
+    percentage: float = proto.Field(
+        proto.DOUBLE,
+        number=151909018,
+        optional=True,
+    )
+
+
+class HttpFaultDelay(proto.Message):
+    r"""Specifies the delay introduced by the load balancer before
+    forwarding the request to the backend service as part of fault
+    injection.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        fixed_delay (google.cloud.compute_v1.types.Duration):
+            Specifies the value of the fixed delay
+            interval.
+
+            This field is a member of `oneof`_ ``_fixed_delay``.
+        percentage (float):
+            The percentage of traffic for connections,
+            operations, or requests for which a delay is
+            introduced as part of fault injection. The value
+            must be from 0.0 to 100.0 inclusive.
+
+            This field is a member of `oneof`_ ``_percentage``.
+    """
+
+    fixed_delay: shared_duration.Duration = proto.Field(
+        proto.MESSAGE,
+        number=317037816,
+        optional=True,
+        message=shared_duration.Duration,
+    )
+    percentage: float = proto.Field(
+        proto.DOUBLE,
+        number=151909018,
+        optional=True,
+    )
+
+
+class HttpFaultInjection(proto.Message):
+    r"""The specification for fault injection introduced into traffic
+    to test the resiliency of clients to backend service failure. As
+    part of fault injection, when clients send requests to a backend
+    service, delays can be introduced by the load balancer on a
+    percentage of requests before sending those request to the
+    backend service. Similarly requests from clients can be aborted
+    by the load balancer for a percentage of requests.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        abort (google.cloud.compute_v1.types.HttpFaultAbort):
+            The specification for how client requests are
+            aborted as part of fault injection.
+
+            This field is a member of `oneof`_ ``_abort``.
+        delay (google.cloud.compute_v1.types.HttpFaultDelay):
+            The specification for how client requests are
+            delayed as part of fault injection, before being
+            sent to a backend service.
+
+            This field is a member of `oneof`_ ``_delay``.
+    """
+
+    abort: "HttpFaultAbort" = proto.Field(
+        proto.MESSAGE,
+        number=92611376,
+        optional=True,
+        message="HttpFaultAbort",
+    )
+    delay: "HttpFaultDelay" = proto.Field(
+        proto.MESSAGE,
+        number=95467907,
+        optional=True,
+        message="HttpFaultDelay",
+    )
+
+
+class HttpHeaderAction(proto.Message):
+    r"""The request and response header transformations that take
+    effect before the request is passed along to the selected
+    backendService.
+
+    Attributes:
+        request_headers_to_add (MutableSequence[google.cloud.compute_v1.types.HttpHeaderOption]):
+            Headers to add to a matching request before
+            forwarding the request to the backendService.
+        request_headers_to_remove (MutableSequence[str]):
+            A list of header names for headers that need
+            to be removed from the request before forwarding
+            the request to the backendService.
+        response_headers_to_add (MutableSequence[google.cloud.compute_v1.types.HttpHeaderOption]):
+            Headers to add the response before sending
+            the response back to the client.
+        response_headers_to_remove (MutableSequence[str]):
+            A list of header names for headers that need
+            to be removed from the response before sending
+            the response back to the client.
+    """
+
+    request_headers_to_add: MutableSequence["HttpHeaderOption"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=72111974,
+        message="HttpHeaderOption",
+    )
+    request_headers_to_remove: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=218425247,
+    )
+    response_headers_to_add: MutableSequence["HttpHeaderOption"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=32136052,
+        message="HttpHeaderOption",
+    )
+    response_headers_to_remove: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=75415761,
+    )
+
+
+class HttpHeaderMatch(proto.Message):
+    r"""matchRule criteria for request header matches.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        exact_match (str):
+            The value should exactly match contents of
+            exactMatch. Only one of exactMatch, prefixMatch,
+            suffixMatch, regexMatch, presentMatch or
+            rangeMatch must be set.
+
+            This field is a member of `oneof`_ ``_exact_match``.
+        header_name (str):
+            The name of the HTTP header to match. For matching against
+            the HTTP request's authority, use a headerMatch with the
+            header name ":authority". For matching a request's method,
+            use the headerName ":method". When the URL map is bound to a
+            target gRPC proxy that has the validateForProxyless field
+            set to true, only non-binary user-specified custom metadata
+            and the ``content-type`` header are supported. The following
+            transport-level headers cannot be used in header matching
+            rules: ``:authority``, ``:method``, ``:path``, ``:scheme``,
+            ``user-agent``, ``accept-encoding``, ``content-encoding``,
+            ``grpc-accept-encoding``, ``grpc-encoding``,
+            ``grpc-previous-rpc-attempts``, ``grpc-tags-bin``,
+            ``grpc-timeout`` and ``grpc-trace-bin``.
+
+            This field is a member of `oneof`_ ``_header_name``.
+        invert_match (bool):
+            If set to false, the headerMatch is
+            considered a match if the preceding match
+            criteria are met. If set to true, the
+            headerMatch is considered a match if the
+            preceding match criteria are NOT met. The
+            default setting is false.
+
+            This field is a member of `oneof`_ ``_invert_match``.
+        prefix_match (str):
+            The value of the header must start with the
+            contents of prefixMatch. Only one of exactMatch,
+            prefixMatch, suffixMatch, regexMatch,
+            presentMatch or rangeMatch must be set.
+
+            This field is a member of `oneof`_ ``_prefix_match``.
+        present_match (bool):
+            A header with the contents of headerName must
+            exist. The match takes place whether or not the
+            request's header has a value. Only one of
+            exactMatch, prefixMatch, suffixMatch,
+            regexMatch, presentMatch or rangeMatch must be
+            set.
+
+            This field is a member of `oneof`_ ``_present_match``.
+        range_match (google.cloud.compute_v1.types.Int64RangeMatch):
+            The header value must be an integer and its value must be in
+            the range specified in rangeMatch. If the header does not
+            contain an integer, number or is empty, the match fails. For
+            example for a range [-5, 0] - -3 will match. - 0 will not
+            match. - 0.25 will not match. - -3someString will not match.
+            Only one of exactMatch, prefixMatch, suffixMatch,
+            regexMatch, presentMatch or rangeMatch must be set.
+            rangeMatch is not supported for load balancers that have
+            loadBalancingScheme set to EXTERNAL.
+
+            This field is a member of `oneof`_ ``_range_match``.
+        regex_match (str):
+            The value of the header must match the regular expression
+            specified in regexMatch. For more information about regular
+            expression syntax, see Syntax. For matching against a port
+            specified in the HTTP request, use a headerMatch with
+            headerName set to PORT and a regular expression that
+            satisfies the RFC2616 Host header's port specifier. Only one
+            of exactMatch, prefixMatch, suffixMatch, regexMatch,
+            presentMatch or rangeMatch must be set. Regular expressions
+            can only be used when the loadBalancingScheme is set to
+            INTERNAL_SELF_MANAGED.
+
+            This field is a member of `oneof`_ ``_regex_match``.
+        suffix_match (str):
+            The value of the header must end with the
+            contents of suffixMatch. Only one of exactMatch,
+            prefixMatch, suffixMatch, regexMatch,
+            presentMatch or rangeMatch must be set.
+
+            This field is a member of `oneof`_ ``_suffix_match``.
+    """
+
+    exact_match: str = proto.Field(
+        proto.STRING,
+        number=457641093,
+        optional=True,
+    )
+    header_name: str = proto.Field(
+        proto.STRING,
+        number=110223613,
+        optional=True,
+    )
+    invert_match: bool = proto.Field(
+        proto.BOOL,
+        number=501130268,
+        optional=True,
+    )
+    prefix_match: str = proto.Field(
+        proto.STRING,
+        number=257898968,
+        optional=True,
+    )
+    present_match: bool = proto.Field(
+        proto.BOOL,
+        number=67435841,
+        optional=True,
+    )
+    range_match: "Int64RangeMatch" = proto.Field(
+        proto.MESSAGE,
+        number=97244227,
+        optional=True,
+        message="Int64RangeMatch",
+    )
+    regex_match: str = proto.Field(
+        proto.STRING,
+        number=107387853,
+        optional=True,
+    )
+    suffix_match: str = proto.Field(
+        proto.STRING,
+        number=426488663,
+        optional=True,
+    )
+
+
+class HttpHeaderOption(proto.Message):
+    r"""Specification determining how headers are added to requests
+    or responses.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        header_name (str):
+            The name of the header.
+
+            This field is a member of `oneof`_ ``_header_name``.
+        header_value (str):
+            The value of the header to add.
+
+            This field is a member of `oneof`_ ``_header_value``.
+        replace (bool):
+            If false, headerValue is appended to any
+            values that already exist for the header. If
+            true, headerValue is set for the header,
+            discarding any values that were set for that
+            header. The default value is false.
+
+            This field is a member of `oneof`_ ``_replace``.
+    """
+
+    header_name: str = proto.Field(
+        proto.STRING,
+        number=110223613,
+        optional=True,
+    )
+    header_value: str = proto.Field(
+        proto.STRING,
+        number=203094335,
+        optional=True,
+    )
+    replace: bool = proto.Field(
+        proto.BOOL,
+        number=20755124,
+        optional=True,
+    )
+
+
+class HttpQueryParameterMatch(proto.Message):
+    r"""HttpRouteRuleMatch criteria for a request's query parameter.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        exact_match (str):
+            The queryParameterMatch matches if the value
+            of the parameter exactly matches the contents of
+            exactMatch. Only one of presentMatch,
+            exactMatch, or regexMatch must be set.
+
+            This field is a member of `oneof`_ ``_exact_match``.
+        name (str):
+            The name of the query parameter to match. The
+            query parameter must exist in the request, in
+            the absence of which the request match fails.
+
+            This field is a member of `oneof`_ ``_name``.
+        present_match (bool):
+            Specifies that the queryParameterMatch
+            matches if the request contains the query
+            parameter, irrespective of whether the parameter
+            has a value or not. Only one of presentMatch,
+            exactMatch, or regexMatch must be set.
+
+            This field is a member of `oneof`_ ``_present_match``.
+        regex_match (str):
+            The queryParameterMatch matches if the value of the
+            parameter matches the regular expression specified by
+            regexMatch. For more information about regular expression
+            syntax, see Syntax. Only one of presentMatch, exactMatch, or
+            regexMatch must be set. Regular expressions can only be used
+            when the loadBalancingScheme is set to
+            INTERNAL_SELF_MANAGED.
+
+            This field is a member of `oneof`_ ``_regex_match``.
+    """
+
+    exact_match: str = proto.Field(
+        proto.STRING,
+        number=457641093,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    present_match: bool = proto.Field(
+        proto.BOOL,
+        number=67435841,
+        optional=True,
+    )
+    regex_match: str = proto.Field(
+        proto.STRING,
+        number=107387853,
+        optional=True,
+    )
+
+
+class HttpRedirectAction(proto.Message):
+    r"""Specifies settings for an HTTP redirect.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        host_redirect (str):
+            The host that is used in the redirect
+            response instead of the one that was supplied in
+            the request. The value must be from 1 to 255
+            characters.
+
+            This field is a member of `oneof`_ ``_host_redirect``.
+        https_redirect (bool):
+            If set to true, the URL scheme in the
+            redirected request is set to HTTPS. If set to
+            false, the URL scheme of the redirected request
+            remains the same as that of the request. This
+            must only be set for URL maps used in
+            TargetHttpProxys. Setting this true for
+            TargetHttpsProxy is not permitted. The default
+            is set to false.
+
+            This field is a member of `oneof`_ ``_https_redirect``.
+        path_redirect (str):
+            The path that is used in the redirect
+            response instead of the one that was supplied in
+            the request. pathRedirect cannot be supplied
+            together with prefixRedirect. Supply one alone
+            or neither. If neither is supplied, the path of
+            the original request is used for the redirect.
+            The value must be from 1 to 1024 characters.
+
+            This field is a member of `oneof`_ ``_path_redirect``.
+        prefix_redirect (str):
+            The prefix that replaces the prefixMatch
+            specified in the HttpRouteRuleMatch, retaining
+            the remaining portion of the URL before
+            redirecting the request. prefixRedirect cannot
+            be supplied together with pathRedirect. Supply
+            one alone or neither. If neither is supplied,
+            the path of the original request is used for the
+            redirect. The value must be from 1 to 1024
+            characters.
+
+            This field is a member of `oneof`_ ``_prefix_redirect``.
+        redirect_response_code (str):
+            The HTTP Status code to use for this RedirectAction.
+            Supported values are: - MOVED_PERMANENTLY_DEFAULT, which is
+            the default value and corresponds to 301. - FOUND, which
+            corresponds to 302. - SEE_OTHER which corresponds to 303. -
+            TEMPORARY_REDIRECT, which corresponds to 307. In this case,
+            the request method is retained. - PERMANENT_REDIRECT, which
+            corresponds to 308. In this case, the request method is
+            retained. Check the RedirectResponseCode enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_redirect_response_code``.
+        strip_query (bool):
+            If set to true, any accompanying query
+            portion of the original URL is removed before
+            redirecting the request. If set to false, the
+            query portion of the original URL is retained.
+            The default is set to false.
+
+            This field is a member of `oneof`_ ``_strip_query``.
+    """
+
+    class RedirectResponseCode(proto.Enum):
+        r"""The HTTP Status code to use for this RedirectAction. Supported
+        values are: - MOVED_PERMANENTLY_DEFAULT, which is the default value
+        and corresponds to 301. - FOUND, which corresponds to 302. -
+        SEE_OTHER which corresponds to 303. - TEMPORARY_REDIRECT, which
+        corresponds to 307. In this case, the request method is retained. -
+        PERMANENT_REDIRECT, which corresponds to 308. In this case, the
+        request method is retained.
+
+        Values:
+            UNDEFINED_REDIRECT_RESPONSE_CODE (0):
+                A value indicating that the enum field is not
+                set.
+            FOUND (67084130):
+                Http Status Code 302 - Found.
+            MOVED_PERMANENTLY_DEFAULT (386698449):
+                Http Status Code 301 - Moved Permanently.
+            PERMANENT_REDIRECT (382006381):
+                Http Status Code 308 - Permanent Redirect
+                maintaining HTTP method.
+            SEE_OTHER (445380580):
+                Http Status Code 303 - See Other.
+            TEMPORARY_REDIRECT (489550378):
+                Http Status Code 307 - Temporary Redirect
+                maintaining HTTP method.
+        """
+        UNDEFINED_REDIRECT_RESPONSE_CODE = 0
+        FOUND = 67084130
+        MOVED_PERMANENTLY_DEFAULT = 386698449
+        PERMANENT_REDIRECT = 382006381
+        SEE_OTHER = 445380580
+        TEMPORARY_REDIRECT = 489550378
+
+    host_redirect: str = proto.Field(
+        proto.STRING,
+        number=107417747,
+        optional=True,
+    )
+    https_redirect: bool = proto.Field(
+        proto.BOOL,
+        number=170260656,
+        optional=True,
+    )
+    path_redirect: str = proto.Field(
+        proto.STRING,
+        number=272342710,
+        optional=True,
+    )
+    prefix_redirect: str = proto.Field(
+        proto.STRING,
+        number=446184169,
+        optional=True,
+    )
+    redirect_response_code: str = proto.Field(
+        proto.STRING,
+        number=436710408,
+        optional=True,
+    )
+    strip_query: bool = proto.Field(
+        proto.BOOL,
+        number=52284641,
+        optional=True,
+    )
+
+
+class HttpRetryPolicy(proto.Message):
+    r"""The retry policy associates with HttpRouteRule
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        num_retries (int):
+            Specifies the allowed number retries. This
+            number must be > 0. If not specified, defaults
+            to 1.
+
+            This field is a member of `oneof`_ ``_num_retries``.
+        per_try_timeout (google.cloud.compute_v1.types.Duration):
+            Specifies a non-zero timeout per retry
+            attempt. If not specified, will use the timeout
+            set in the HttpRouteAction field. If timeout in
+            the HttpRouteAction field is not set, this field
+            uses the largest timeout among all backend
+            services associated with the route. Not
+            supported when the URL map is bound to a target
+            gRPC proxy that has the validateForProxyless
+            field set to true.
+
+            This field is a member of `oneof`_ ``_per_try_timeout``.
+        retry_conditions (MutableSequence[str]):
+            Specifies one or more conditions when this retry policy
+            applies. Valid values are: - 5xx: retry is attempted if the
+            instance or endpoint responds with any 5xx response code, or
+            if the instance or endpoint does not respond at all. For
+            example, disconnects, reset, read timeout, connection
+            failure, and refused streams. - gateway-error: Similar to
+            5xx, but only applies to response codes 502, 503 or 504. -
+            connect-failure: a retry is attempted on failures connecting
+            to the instance or endpoint. For example, connection
+            timeouts. - retriable-4xx: a retry is attempted if the
+            instance or endpoint responds with a 4xx response code. The
+            only error that you can retry is error code 409. -
+            refused-stream: a retry is attempted if the instance or
+            endpoint resets the stream with a REFUSED_STREAM error code.
+            This reset type indicates that it is safe to retry. -
+            cancelled: a retry is attempted if the gRPC status code in
+            the response header is set to cancelled. -
+            deadline-exceeded: a retry is attempted if the gRPC status
+            code in the response header is set to deadline-exceeded. -
+            internal: a retry is attempted if the gRPC status code in
+            the response header is set to internal. -
+            resource-exhausted: a retry is attempted if the gRPC status
+            code in the response header is set to resource-exhausted. -
+            unavailable: a retry is attempted if the gRPC status code in
+            the response header is set to unavailable. Only the
+            following codes are supported when the URL map is bound to
+            target gRPC proxy that has validateForProxyless field set to
+            true. - cancelled - deadline-exceeded - internal -
+            resource-exhausted - unavailable
+    """
+
+    num_retries: int = proto.Field(
+        proto.UINT32,
+        number=251680141,
+        optional=True,
+    )
+    per_try_timeout: shared_duration.Duration = proto.Field(
+        proto.MESSAGE,
+        number=280041147,
+        optional=True,
+        message=shared_duration.Duration,
+    )
+    retry_conditions: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=28815535,
+    )
+
+
+class HttpRouteAction(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        cors_policy (google.cloud.compute_v1.types.CorsPolicy):
+            The specification for allowing client-side
+            cross-origin requests. For more information
+            about the W3C recommendation for cross-origin
+            resource sharing (CORS), see Fetch API Living
+            Standard. Not supported when the URL map is
+            bound to a target gRPC proxy.
+
+            This field is a member of `oneof`_ ``_cors_policy``.
+        fault_injection_policy (google.cloud.compute_v1.types.HttpFaultInjection):
+            The specification for fault injection introduced into
+            traffic to test the resiliency of clients to backend service
+            failure. As part of fault injection, when clients send
+            requests to a backend service, delays can be introduced by a
+            load balancer on a percentage of requests before sending
+            those requests to the backend service. Similarly requests
+            from clients can be aborted by the load balancer for a
+            percentage of requests. timeout and retry_policy is ignored
+            by clients that are configured with a fault_injection_policy
+            if: 1. The traffic is generated by fault injection AND 2.
+            The fault injection is not a delay fault injection. Fault
+            injection is not supported with the classic Application Load
+            Balancer . To see which load balancers support fault
+            injection, see Load balancing: Routing and traffic
+            management features.
+
+            This field is a member of `oneof`_ ``_fault_injection_policy``.
+        max_stream_duration (google.cloud.compute_v1.types.Duration):
+            Specifies the maximum duration (timeout) for streams on the
+            selected route. Unlike the timeout field where the timeout
+            duration starts from the time the request has been fully
+            processed (known as *end-of-stream*), the duration in this
+            field is computed from the beginning of the stream until the
+            response has been processed, including all retries. A stream
+            that does not complete in this duration is closed. If not
+            specified, this field uses the maximum maxStreamDuration
+            value among all backend services associated with the route.
+            This field is only allowed if the Url map is used with
+            backend services with loadBalancingScheme set to
+            INTERNAL_SELF_MANAGED.
+
+            This field is a member of `oneof`_ ``_max_stream_duration``.
+        request_mirror_policy (google.cloud.compute_v1.types.RequestMirrorPolicy):
+            Specifies the policy on how requests intended
+            for the route's backends are shadowed to a
+            separate mirrored backend service. The load
+            balancer does not wait for responses from the
+            shadow service. Before sending traffic to the
+            shadow service, the host / authority header is
+            suffixed with -shadow. Not supported when the
+            URL map is bound to a target gRPC proxy that has
+            the validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_request_mirror_policy``.
+        retry_policy (google.cloud.compute_v1.types.HttpRetryPolicy):
+            Specifies the retry policy associated with
+            this route.
+
+            This field is a member of `oneof`_ ``_retry_policy``.
+        timeout (google.cloud.compute_v1.types.Duration):
+            Specifies the timeout for the selected route. Timeout is
+            computed from the time the request has been fully processed
+            (known as *end-of-stream*) up until the response has been
+            processed. Timeout includes all retries. If not specified,
+            this field uses the largest timeout among all backend
+            services associated with the route. Not supported when the
+            URL map is bound to a target gRPC proxy that has
+            validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_timeout``.
+        url_rewrite (google.cloud.compute_v1.types.UrlRewrite):
+            The spec to modify the URL of the request,
+            before forwarding the request to the matched
+            service. urlRewrite is the only action supported
+            in UrlMaps for classic Application Load
+            Balancers. Not supported when the URL map is
+            bound to a target gRPC proxy that has the
+            validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_url_rewrite``.
+        weighted_backend_services (MutableSequence[google.cloud.compute_v1.types.WeightedBackendService]):
+            A list of weighted backend services to send
+            traffic to when a route match occurs. The
+            weights determine the fraction of traffic that
+            flows to their corresponding backend service. If
+            all traffic needs to go to a single backend
+            service, there must be one
+            weightedBackendService with weight set to a
+            non-zero number. After a backend service is
+            identified and before forwarding the request to
+            the backend service, advanced routing actions
+            such as URL rewrites and header transformations
+            are applied depending on additional settings
+            specified in this HttpRouteAction.
+    """
+
+    cors_policy: "CorsPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=398943748,
+        optional=True,
+        message="CorsPolicy",
+    )
+    fault_injection_policy: "HttpFaultInjection" = proto.Field(
+        proto.MESSAGE,
+        number=412781079,
+        optional=True,
+        message="HttpFaultInjection",
+    )
+    max_stream_duration: shared_duration.Duration = proto.Field(
+        proto.MESSAGE,
+        number=61428376,
+        optional=True,
+        message=shared_duration.Duration,
+    )
+    request_mirror_policy: "RequestMirrorPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=220196866,
+        optional=True,
+        message="RequestMirrorPolicy",
+    )
+    retry_policy: "HttpRetryPolicy" = proto.Field(
+        proto.MESSAGE,
+        number=56799913,
+        optional=True,
+        message="HttpRetryPolicy",
+    )
+    timeout: shared_duration.Duration = proto.Field(
+        proto.MESSAGE,
+        number=296701281,
+        optional=True,
+        message=shared_duration.Duration,
+    )
+    url_rewrite: "UrlRewrite" = proto.Field(
+        proto.MESSAGE,
+        number=273333948,
+        optional=True,
+        message="UrlRewrite",
+    )
+    weighted_backend_services: MutableSequence[
+        "WeightedBackendService"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=337028049,
+        message="WeightedBackendService",
+    )
+
+
+class HttpRouteRule(proto.Message):
+    r"""The HttpRouteRule setting specifies how to match an HTTP
+    request and the corresponding routing action that load balancing
+    proxies perform.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        description (str):
+            The short description conveying the intent of
+            this routeRule. The description can have a
+            maximum length of 1024 characters.
+
+            This field is a member of `oneof`_ ``_description``.
+        header_action (google.cloud.compute_v1.types.HttpHeaderAction):
+            Specifies changes to request and response headers that need
+            to take effect for the selected backendService. The
+            headerAction value specified here is applied before the
+            matching pathMatchers[].headerAction and after
+            pathMatchers[].routeRules[].routeAction.weightedBackendService.backendServiceWeightAction[].headerAction
+            HeaderAction is not supported for load balancers that have
+            their loadBalancingScheme set to EXTERNAL. Not supported
+            when the URL map is bound to a target gRPC proxy that has
+            validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_header_action``.
+        match_rules (MutableSequence[google.cloud.compute_v1.types.HttpRouteRuleMatch]):
+            The list of criteria for matching attributes
+            of a request to this routeRule. This list has OR
+            semantics: the request matches this routeRule
+            when any of the matchRules are satisfied.
+            However predicates within a given matchRule have
+            AND semantics. All predicates within a matchRule
+            must match for the request to match the rule.
+        priority (int):
+            For routeRules within a given pathMatcher,
+            priority determines the order in which a load
+            balancer interprets routeRules. RouteRules are
+            evaluated in order of priority, from the lowest
+            to highest number. The priority of a rule
+            decreases as its number increases (1, 2, 3,
+            N+1). The first rule that matches the request is
+            applied. You cannot configure two or more
+            routeRules with the same priority. Priority for
+            each rule must be set to a number from 0 to
+            2147483647 inclusive. Priority numbers can have
+            gaps, which enable you to add or remove rules in
+            the future without affecting the rest of the
+            rules. For example, 1, 2, 3, 4, 5, 9, 12, 16 is
+            a valid series of priority numbers to which you
+            could add rules numbered from 6 to 8, 10 to 11,
+            and 13 to 15 in the future without any impact on
+            existing rules.
+
+            This field is a member of `oneof`_ ``_priority``.
+        route_action (google.cloud.compute_v1.types.HttpRouteAction):
+            In response to a matching matchRule, the load
+            balancer performs advanced routing actions, such
+            as URL rewrites and header transformations,
+            before forwarding the request to the selected
+            backend. If routeAction specifies any
+            weightedBackendServices, service must not be
+            set. Conversely if service is set, routeAction
+            cannot contain any weightedBackendServices. Only
+            one of urlRedirect, service or
+            routeAction.weightedBackendService must be set.
+            URL maps for classic Application Load Balancers
+            only support the urlRewrite action within a
+            route rule's routeAction.
+
+            This field is a member of `oneof`_ ``_route_action``.
+        service (str):
+            The full or partial URL of the backend
+            service resource to which traffic is directed if
+            this rule is matched. If routeAction is also
+            specified, advanced routing actions, such as URL
+            rewrites, take effect before sending the request
+            to the backend. However, if service is
+            specified, routeAction cannot contain any
+            weightedBackendServices. Conversely, if
+            routeAction specifies any
+            weightedBackendServices, service must not be
+            specified. Only one of urlRedirect, service or
+            routeAction.weightedBackendService must be set.
+
+            This field is a member of `oneof`_ ``_service``.
+        url_redirect (google.cloud.compute_v1.types.HttpRedirectAction):
+            When this rule is matched, the request is
+            redirected to a URL specified by urlRedirect. If
+            urlRedirect is specified, service or routeAction
+            must not be set. Not supported when the URL map
+            is bound to a target gRPC proxy.
+
+            This field is a member of `oneof`_ ``_url_redirect``.
+    """
+
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    header_action: "HttpHeaderAction" = proto.Field(
+        proto.MESSAGE,
+        number=328077352,
+        optional=True,
+        message="HttpHeaderAction",
+    )
+    match_rules: MutableSequence["HttpRouteRuleMatch"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=376200701,
+        message="HttpRouteRuleMatch",
+    )
+    priority: int = proto.Field(
+        proto.INT32,
+        number=445151652,
+        optional=True,
+    )
+    route_action: "HttpRouteAction" = proto.Field(
+        proto.MESSAGE,
+        number=424563948,
+        optional=True,
+        message="HttpRouteAction",
+    )
+    service: str = proto.Field(
+        proto.STRING,
+        number=373540533,
+        optional=True,
+    )
+    url_redirect: "HttpRedirectAction" = proto.Field(
+        proto.MESSAGE,
+        number=405147820,
+        optional=True,
+        message="HttpRedirectAction",
+    )
+
+
+class HttpRouteRuleMatch(proto.Message):
+    r"""HttpRouteRuleMatch specifies a set of criteria for matching
+    requests to an HttpRouteRule. All specified criteria must be
+    satisfied for a match to occur.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        full_path_match (str):
+            For satisfying the matchRule condition, the
+            path of the request must exactly match the value
+            specified in fullPathMatch after removing any
+            query parameters and anchor that may be part of
+            the original URL. fullPathMatch must be from 1
+            to 1024 characters. Only one of prefixMatch,
+            fullPathMatch or regexMatch must be specified.
+
+            This field is a member of `oneof`_ ``_full_path_match``.
+        header_matches (MutableSequence[google.cloud.compute_v1.types.HttpHeaderMatch]):
+            Specifies a list of header match criteria,
+            all of which must match corresponding headers in
+            the request.
+        ignore_case (bool):
+            Specifies that prefixMatch and fullPathMatch
+            matches are case sensitive. The default value is
+            false. ignoreCase must not be used with
+            regexMatch. Not supported when the URL map is
+            bound to a target gRPC proxy.
+
+            This field is a member of `oneof`_ ``_ignore_case``.
+        metadata_filters (MutableSequence[google.cloud.compute_v1.types.MetadataFilter]):
+            Opaque filter criteria used by the load balancer to restrict
+            routing configuration to a limited set of xDS compliant
+            clients. In their xDS requests to the load balancer, xDS
+            clients present node metadata. When there is a match, the
+            relevant routing configuration is made available to those
+            proxies. For each metadataFilter in this list, if its
+            filterMatchCriteria is set to MATCH_ANY, at least one of the
+            filterLabels must match the corresponding label provided in
+            the metadata. If its filterMatchCriteria is set to
+            MATCH_ALL, then all of its filterLabels must match with
+            corresponding labels provided in the metadata. If multiple
+            metadata filters are specified, all of them need to be
+            satisfied in order to be considered a match. metadataFilters
+            specified here is applied after those specified in
+            ForwardingRule that refers to the UrlMap this
+            HttpRouteRuleMatch belongs to. metadataFilters only applies
+            to load balancers that have loadBalancingScheme set to
+            INTERNAL_SELF_MANAGED. Not supported when the URL map is
+            bound to a target gRPC proxy that has validateForProxyless
+            field set to true.
+        path_template_match (str):
+            If specified, the route is a pattern match expression that
+            must match the :path header once the query string is
+            removed. A pattern match allows you to match - The value
+            must be between 1 and 1024 characters - The pattern must
+            start with a leading slash ("/") - There may be no more than
+            5 operators in pattern Precisely one of prefix_match,
+            full_path_match, regex_match or path_template_match must be
+            set.
+
+            This field is a member of `oneof`_ ``_path_template_match``.
+        prefix_match (str):
+            For satisfying the matchRule condition, the
+            request's path must begin with the specified
+            prefixMatch. prefixMatch must begin with a /.
+            The value must be from 1 to 1024 characters.
+            Only one of prefixMatch, fullPathMatch or
+            regexMatch must be specified.
+
+            This field is a member of `oneof`_ ``_prefix_match``.
+        query_parameter_matches (MutableSequence[google.cloud.compute_v1.types.HttpQueryParameterMatch]):
+            Specifies a list of query parameter match
+            criteria, all of which must match corresponding
+            query parameters in the request. Not supported
+            when the URL map is bound to a target gRPC
+            proxy.
+        regex_match (str):
+            For satisfying the matchRule condition, the path of the
+            request must satisfy the regular expression specified in
+            regexMatch after removing any query parameters and anchor
+            supplied with the original URL. For more information about
+            regular expression syntax, see Syntax. Only one of
+            prefixMatch, fullPathMatch or regexMatch must be specified.
+            Regular expressions can only be used when the
+            loadBalancingScheme is set to INTERNAL_SELF_MANAGED.
+
+            This field is a member of `oneof`_ ``_regex_match``.
+    """
+
+    full_path_match: str = proto.Field(
+        proto.STRING,
+        number=214598875,
+        optional=True,
+    )
+    header_matches: MutableSequence["HttpHeaderMatch"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=361903489,
+        message="HttpHeaderMatch",
+    )
+    ignore_case: bool = proto.Field(
+        proto.BOOL,
+        number=464324989,
+        optional=True,
+    )
+    metadata_filters: MutableSequence[
+        shared_metadata_filter.MetadataFilter
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=464725739,
+        message=shared_metadata_filter.MetadataFilter,
+    )
+    path_template_match: str = proto.Field(
+        proto.STRING,
+        number=292348186,
+        optional=True,
+    )
+    prefix_match: str = proto.Field(
+        proto.STRING,
+        number=257898968,
+        optional=True,
+    )
+    query_parameter_matches: MutableSequence[
+        "HttpQueryParameterMatch"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=286231270,
+        message="HttpQueryParameterMatch",
+    )
+    regex_match: str = proto.Field(
+        proto.STRING,
+        number=107387853,
+        optional=True,
+    )
+
+
+class Int64RangeMatch(proto.Message):
+    r"""HttpRouteRuleMatch criteria for field values that must stay
+    within the specified integer range.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        range_end (int):
+            The end of the range (exclusive) in signed
+            long integer format.
+
+            This field is a member of `oneof`_ ``_range_end``.
+        range_start (int):
+            The start of the range (inclusive) in signed
+            long integer format.
+
+            This field is a member of `oneof`_ ``_range_start``.
+    """
+
+    range_end: int = proto.Field(
+        proto.INT64,
+        number=322439897,
+        optional=True,
+    )
+    range_start: int = proto.Field(
+        proto.INT64,
+        number=103333600,
+        optional=True,
+    )
+
+
+class PathMatcher(proto.Message):
+    r"""A matcher for the path portion of the URL. The BackendService
+    from the longest-matched rule will serve the URL. If no rule was
+    matched, the default service is used.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        default_route_action (google.cloud.compute_v1.types.HttpRouteAction):
+            defaultRouteAction takes effect when none of
+            the pathRules or routeRules match. The load
+            balancer performs advanced routing actions, such
+            as URL rewrites and header transformations,
+            before forwarding the request to the selected
+            backend. If defaultRouteAction specifies any
+            weightedBackendServices, defaultService must not
+            be set. Conversely if defaultService is set,
+            defaultRouteAction cannot contain any
+            weightedBackendServices. Only one of
+            defaultRouteAction or defaultUrlRedirect must be
+            set. URL maps for classic Application Load
+            Balancers only support the urlRewrite action
+            within a path matcher's defaultRouteAction.
+
+            This field is a member of `oneof`_ ``_default_route_action``.
+        default_service (str):
+            The full or partial URL to the BackendService resource. This
+            URL is used if none of the pathRules or routeRules defined
+            by this PathMatcher are matched. For example, the following
+            are all valid URLs to a BackendService resource: -
+            https://www.googleapis.com/compute/v1/projects/project
+            /global/backendServices/backendService -
+            compute/v1/projects/project/global/backendServices/backendService
+            - global/backendServices/backendService If
+            defaultRouteAction is also specified, advanced routing
+            actions, such as URL rewrites, take effect before sending
+            the request to the backend. However, if defaultService is
+            specified, defaultRouteAction cannot contain any
+            weightedBackendServices. Conversely, if defaultRouteAction
+            specifies any weightedBackendServices, defaultService must
+            not be specified. Only one of defaultService,
+            defaultUrlRedirect , or
+            defaultRouteAction.weightedBackendService must be set.
+            Authorization requires one or more of the following Google
+            IAM permissions on the specified resource default_service: -
+            compute.backendBuckets.use - compute.backendServices.use
+
+            This field is a member of `oneof`_ ``_default_service``.
+        default_url_redirect (google.cloud.compute_v1.types.HttpRedirectAction):
+            When none of the specified pathRules or
+            routeRules match, the request is redirected to a
+            URL specified by defaultUrlRedirect. If
+            defaultUrlRedirect is specified, defaultService
+            or defaultRouteAction must not be set. Not
+            supported when the URL map is bound to a target
+            gRPC proxy.
+
+            This field is a member of `oneof`_ ``_default_url_redirect``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        header_action (google.cloud.compute_v1.types.HttpHeaderAction):
+            Specifies changes to request and response
+            headers that need to take effect for the
+            selected backend service. HeaderAction specified
+            here are applied after the matching
+            HttpRouteRule HeaderAction and before the
+            HeaderAction in the UrlMap HeaderAction is not
+            supported for load balancers that have their
+            loadBalancingScheme set to EXTERNAL. Not
+            supported when the URL map is bound to a target
+            gRPC proxy that has validateForProxyless field
+            set to true.
+
+            This field is a member of `oneof`_ ``_header_action``.
+        name (str):
+            The name to which this PathMatcher is
+            referred by the HostRule.
+
+            This field is a member of `oneof`_ ``_name``.
+        path_rules (MutableSequence[google.cloud.compute_v1.types.PathRule]):
+            The list of path rules. Use this list instead of routeRules
+            when routing based on simple path matching is all that's
+            required. The order by which path rules are specified does
+            not matter. Matches are always done on the
+            longest-path-first basis. For example: a pathRule with a
+            path /a/b/c/\* will match before /a/b/\* irrespective of the
+            order in which those paths appear in this list. Within a
+            given pathMatcher, only one of pathRules or routeRules must
+            be set.
+        route_rules (MutableSequence[google.cloud.compute_v1.types.HttpRouteRule]):
+            The list of HTTP route rules. Use this list
+            instead of pathRules when advanced route
+            matching and routing actions are desired.
+            routeRules are evaluated in order of priority,
+            from the lowest to highest number. Within a
+            given pathMatcher, you can set only one of
+            pathRules or routeRules.
+    """
+
+    default_route_action: "HttpRouteAction" = proto.Field(
+        proto.MESSAGE,
+        number=378919466,
+        optional=True,
+        message="HttpRouteAction",
+    )
+    default_service: str = proto.Field(
+        proto.STRING,
+        number=370242231,
+        optional=True,
+    )
+    default_url_redirect: "HttpRedirectAction" = proto.Field(
+        proto.MESSAGE,
+        number=359503338,
+        optional=True,
+        message="HttpRedirectAction",
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    header_action: "HttpHeaderAction" = proto.Field(
+        proto.MESSAGE,
+        number=328077352,
+        optional=True,
+        message="HttpHeaderAction",
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    path_rules: MutableSequence["PathRule"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=104439901,
+        message="PathRule",
+    )
+    route_rules: MutableSequence["HttpRouteRule"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=376292225,
+        message="HttpRouteRule",
+    )
+
+
+class PathRule(proto.Message):
+    r"""A path-matching rule for a URL. If matched, will use the
+    specified BackendService to handle the traffic arriving at this
+    URL.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        paths (MutableSequence[str]):
+            The list of path patterns to match. Each must start with /
+            and the only place a \* is allowed is at the end following a
+            /. The string fed to the path matcher does not include any
+            text after the first ? or #, and those chars are not allowed
+            here.
+        route_action (google.cloud.compute_v1.types.HttpRouteAction):
+            In response to a matching path, the load
+            balancer performs advanced routing actions, such
+            as URL rewrites and header transformations,
+            before forwarding the request to the selected
+            backend. If routeAction specifies any
+            weightedBackendServices, service must not be
+            set. Conversely if service is set, routeAction
+            cannot contain any weightedBackendServices. Only
+            one of routeAction or urlRedirect must be set.
+            URL maps for classic Application Load Balancers
+            only support the urlRewrite action within a path
+            rule's routeAction.
+
+            This field is a member of `oneof`_ ``_route_action``.
+        service (str):
+            The full or partial URL of the backend
+            service resource to which traffic is directed if
+            this rule is matched. If routeAction is also
+            specified, advanced routing actions, such as URL
+            rewrites, take effect before sending the request
+            to the backend. However, if service is
+            specified, routeAction cannot contain any
+            weightedBackendServices. Conversely, if
+            routeAction specifies any
+            weightedBackendServices, service must not be
+            specified. Only one of urlRedirect, service or
+            routeAction.weightedBackendService must be set.
+
+            This field is a member of `oneof`_ ``_service``.
+        url_redirect (google.cloud.compute_v1.types.HttpRedirectAction):
+            When a path pattern is matched, the request
+            is redirected to a URL specified by urlRedirect.
+            If urlRedirect is specified, service or
+            routeAction must not be set. Not supported when
+            the URL map is bound to a target gRPC proxy.
+
+            This field is a member of `oneof`_ ``_url_redirect``.
+    """
+
+    paths: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=106438894,
+    )
+    route_action: "HttpRouteAction" = proto.Field(
+        proto.MESSAGE,
+        number=424563948,
+        optional=True,
+        message="HttpRouteAction",
+    )
+    service: str = proto.Field(
+        proto.STRING,
+        number=373540533,
+        optional=True,
+    )
+    url_redirect: "HttpRedirectAction" = proto.Field(
+        proto.MESSAGE,
+        number=405147820,
+        optional=True,
+        message="HttpRedirectAction",
+    )
+
+
+class RequestMirrorPolicy(proto.Message):
+    r"""A policy that specifies how requests intended for the route's
+    backends are shadowed to a separate mirrored backend service.
+    The load balancer doesn't wait for responses from the shadow
+    service. Before sending traffic to the shadow service, the host
+    or authority header is suffixed with -shadow.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_service (str):
+            The full or partial URL to the BackendService
+            resource being mirrored to. The backend service
+            configured for a mirroring policy must reference
+            backends that are of the same type as the
+            original backend service matched in the URL map.
+            Serverless NEG backends are not currently
+            supported as a mirrored backend service.
+
+            This field is a member of `oneof`_ ``_backend_service``.
+    """
+
+    backend_service: str = proto.Field(
+        proto.STRING,
+        number=306946058,
+        optional=True,
+    )
+
+
+class TestFailure(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        actual_output_url (str):
+            The actual output URL evaluated by a load
+            balancer containing the scheme, host, path and
+            query parameters.
+
+            This field is a member of `oneof`_ ``_actual_output_url``.
+        actual_redirect_response_code (int):
+            Actual HTTP status code for rule with ``urlRedirect``
+            calculated by load balancer
+
+            This field is a member of `oneof`_ ``_actual_redirect_response_code``.
+        actual_service (str):
+            BackendService or BackendBucket returned by
+            load balancer.
+
+            This field is a member of `oneof`_ ``_actual_service``.
+        expected_output_url (str):
+            The expected output URL evaluated by a load
+            balancer containing the scheme, host, path and
+            query parameters.
+
+            This field is a member of `oneof`_ ``_expected_output_url``.
+        expected_redirect_response_code (int):
+            Expected HTTP status code for rule with ``urlRedirect``
+            calculated by load balancer
+
+            This field is a member of `oneof`_ ``_expected_redirect_response_code``.
+        expected_service (str):
+            Expected BackendService or BackendBucket
+            resource the given URL should be mapped to.
+
+            This field is a member of `oneof`_ ``_expected_service``.
+        headers (MutableSequence[google.cloud.compute_v1.types.UrlMapTestHeader]):
+            HTTP headers of the request.
+        host (str):
+            Host portion of the URL.
+
+            This field is a member of `oneof`_ ``_host``.
+        path (str):
+            Path portion including query parameters in
+            the URL.
+
+            This field is a member of `oneof`_ ``_path``.
+    """
+
+    actual_output_url: str = proto.Field(
+        proto.STRING,
+        number=287075458,
+        optional=True,
+    )
+    actual_redirect_response_code: int = proto.Field(
+        proto.INT32,
+        number=42926553,
+        optional=True,
+    )
+    actual_service: str = proto.Field(
+        proto.STRING,
+        number=440379652,
+        optional=True,
+    )
+    expected_output_url: str = proto.Field(
+        proto.STRING,
+        number=433967384,
+        optional=True,
+    )
+    expected_redirect_response_code: int = proto.Field(
+        proto.INT32,
+        number=18888047,
+        optional=True,
+    )
+    expected_service: str = proto.Field(
+        proto.STRING,
+        number=133987374,
+        optional=True,
+    )
+    headers: MutableSequence["UrlMapTestHeader"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=258436998,
+        message="UrlMapTestHeader",
+    )
+    host: str = proto.Field(
+        proto.STRING,
+        number=3208616,
+        optional=True,
+    )
+    path: str = proto.Field(
+        proto.STRING,
+        number=3433509,
+        optional=True,
+    )
+
+
+class UrlMap(proto.Message):
+    r"""Represents a URL Map resource. Compute Engine has two URL Map
+    resources: \* `Global </compute/docs/reference/rest/v1/urlMaps>`__
+    \* `Regional </compute/docs/reference/rest/v1/regionUrlMaps>`__ A
+    URL map resource is a component of certain types of cloud load
+    balancers and Traffic Director: \* urlMaps are used by global
+    external Application Load Balancers, classic Application Load
+    Balancers, and cross-region internal Application Load Balancers. \*
+    regionUrlMaps are used by internal Application Load Balancers,
+    regional external Application Load Balancers and regional internal
+    Application Load Balancers. For a list of supported URL map features
+    by the load balancer type, see the Load balancing features: Routing
+    and traffic management table. For a list of supported URL map
+    features for Traffic Director, see the Traffic Director features:
+    Routing and traffic management table. This resource defines mappings
+    from hostnames and URL paths to either a backend service or a
+    backend bucket. To use the global urlMaps resource, the backend
+    service must have a loadBalancingScheme of either EXTERNAL or
+    INTERNAL_SELF_MANAGED. To use the regionUrlMaps resource, the
+    backend service must have a loadBalancingScheme of INTERNAL_MANAGED.
+    For more information, read URL Map Concepts.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        default_route_action (google.cloud.compute_v1.types.HttpRouteAction):
+            defaultRouteAction takes effect when none of
+            the hostRules match. The load balancer performs
+            advanced routing actions, such as URL rewrites
+            and header transformations, before forwarding
+            the request to the selected backend. If
+            defaultRouteAction specifies any
+            weightedBackendServices, defaultService must not
+            be set. Conversely if defaultService is set,
+            defaultRouteAction cannot contain any
+            weightedBackendServices. Only one of
+            defaultRouteAction or defaultUrlRedirect must be
+            set. URL maps for classic Application Load
+            Balancers only support the urlRewrite action
+            within defaultRouteAction. defaultRouteAction
+            has no effect when the URL map is bound to a
+            target gRPC proxy that has the
+            validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_default_route_action``.
+        default_service (str):
+            The full or partial URL of the defaultService
+            resource to which traffic is directed if none of
+            the hostRules match. If defaultRouteAction is
+            also specified, advanced routing actions, such
+            as URL rewrites, take effect before sending the
+            request to the backend. However, if
+            defaultService is specified, defaultRouteAction
+            cannot contain any weightedBackendServices.
+            Conversely, if routeAction specifies any
+            weightedBackendServices, service must not be
+            specified. Only one of defaultService,
+            defaultUrlRedirect , or
+            defaultRouteAction.weightedBackendService must
+            be set. defaultService has no effect when the
+            URL map is bound to a target gRPC proxy that has
+            the validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_default_service``.
+        default_url_redirect (google.cloud.compute_v1.types.HttpRedirectAction):
+            When none of the specified hostRules match,
+            the request is redirected to a URL specified by
+            defaultUrlRedirect. If defaultUrlRedirect is
+            specified, defaultService or defaultRouteAction
+            must not be set. Not supported when the URL map
+            is bound to a target gRPC proxy.
+
+            This field is a member of `oneof`_ ``_default_url_redirect``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field is
+            ignored when inserting a UrlMap. An up-to-date
+            fingerprint must be provided in order to update
+            the UrlMap, otherwise the request will fail with
+            error 412 conditionNotMet. To see the latest
+            fingerprint, make a get() request to retrieve a
+            UrlMap.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        header_action (google.cloud.compute_v1.types.HttpHeaderAction):
+            Specifies changes to request and response
+            headers that need to take effect for the
+            selected backendService. The headerAction
+            specified here take effect after headerAction
+            specified under pathMatcher. headerAction is not
+            supported for load balancers that have their
+            loadBalancingScheme set to EXTERNAL. Not
+            supported when the URL map is bound to a target
+            gRPC proxy that has validateForProxyless field
+            set to true.
+
+            This field is a member of `oneof`_ ``_header_action``.
+        host_rules (MutableSequence[google.cloud.compute_v1.types.HostRule]):
+            The list of host rules to use against the
+            URL.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#urlMaps
+            for url maps.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        path_matchers (MutableSequence[google.cloud.compute_v1.types.PathMatcher]):
+            The list of named PathMatchers to use against
+            the URL.
+        region (str):
+            [Output Only] URL of the region where the regional URL map
+            resides. This field is not applicable to global URL maps.
+            You must specify this field as part of the HTTP request URL.
+            It is not settable as a field in the request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        tests (MutableSequence[google.cloud.compute_v1.types.UrlMapTest]):
+            The list of expected URL mapping tests.
+            Request to update the UrlMap succeeds only if
+            all test cases pass. You can specify a maximum
+            of 100 tests per UrlMap. Not supported when the
+            URL map is bound to a target gRPC proxy that has
+            validateForProxyless field set to true.
+    """
+
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    default_route_action: "HttpRouteAction" = proto.Field(
+        proto.MESSAGE,
+        number=378919466,
+        optional=True,
+        message="HttpRouteAction",
+    )
+    default_service: str = proto.Field(
+        proto.STRING,
+        number=370242231,
+        optional=True,
+    )
+    default_url_redirect: "HttpRedirectAction" = proto.Field(
+        proto.MESSAGE,
+        number=359503338,
+        optional=True,
+        message="HttpRedirectAction",
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    header_action: "HttpHeaderAction" = proto.Field(
+        proto.MESSAGE,
+        number=328077352,
+        optional=True,
+        message="HttpHeaderAction",
+    )
+    host_rules: MutableSequence["HostRule"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=311804832,
+        message="HostRule",
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    path_matchers: MutableSequence["PathMatcher"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=271664219,
+        message="PathMatcher",
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    tests: MutableSequence["UrlMapTest"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=110251553,
+        message="UrlMapTest",
+    )
+
+
+class UrlMapList(proto.Message):
+    r"""Contains a list of UrlMap resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.UrlMap]):
+            A list of UrlMap resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["UrlMap"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="UrlMap",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class UrlMapTest(proto.Message):
+    r"""Message for the expected URL mappings.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        description (str):
+            Description of this test case.
+
+            This field is a member of `oneof`_ ``_description``.
+        expected_output_url (str):
+            The expected output URL evaluated by the load balancer
+            containing the scheme, host, path and query parameters. For
+            rules that forward requests to backends, the test passes
+            only when expectedOutputUrl matches the request forwarded by
+            the load balancer to backends. For rules with urlRewrite,
+            the test verifies that the forwarded request matches
+            hostRewrite and pathPrefixRewrite in the urlRewrite action.
+            When service is specified, expectedOutputUrl`s scheme is
+            ignored. For rules with urlRedirect, the test passes only if
+            expectedOutputUrl matches the URL in the load balancer's
+            redirect response. If urlRedirect specifies https_redirect,
+            the test passes only if the scheme in expectedOutputUrl is
+            also set to HTTPS. If urlRedirect specifies strip_query, the
+            test passes only if expectedOutputUrl does not contain any
+            query parameters. expectedOutputUrl is optional when service
+            is specified.
+
+            This field is a member of `oneof`_ ``_expected_output_url``.
+        expected_redirect_response_code (int):
+            For rules with urlRedirect, the test passes
+            only if expectedRedirectResponseCode matches the
+            HTTP status code in load balancer's redirect
+            response. expectedRedirectResponseCode cannot be
+            set when service is set.
+
+            This field is a member of `oneof`_ ``_expected_redirect_response_code``.
+        headers (MutableSequence[google.cloud.compute_v1.types.UrlMapTestHeader]):
+            HTTP headers for this request. If headers
+            contains a host header, then host must also
+            match the header value.
+        host (str):
+            Host portion of the URL. If headers contains
+            a host header, then host must also match the
+            header value.
+
+            This field is a member of `oneof`_ ``_host``.
+        path (str):
+            Path portion of the URL.
+
+            This field is a member of `oneof`_ ``_path``.
+        service (str):
+            Expected BackendService or BackendBucket
+            resource the given URL should be mapped to. The
+            service field cannot be set if
+            expectedRedirectResponseCode is set.
+
+            This field is a member of `oneof`_ ``_service``.
+    """
+
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    expected_output_url: str = proto.Field(
+        proto.STRING,
+        number=433967384,
+        optional=True,
+    )
+    expected_redirect_response_code: int = proto.Field(
+        proto.INT32,
+        number=18888047,
+        optional=True,
+    )
+    headers: MutableSequence["UrlMapTestHeader"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=258436998,
+        message="UrlMapTestHeader",
+    )
+    host: str = proto.Field(
+        proto.STRING,
+        number=3208616,
+        optional=True,
+    )
+    path: str = proto.Field(
+        proto.STRING,
+        number=3433509,
+        optional=True,
+    )
+    service: str = proto.Field(
+        proto.STRING,
+        number=373540533,
+        optional=True,
+    )
+
+
+class UrlMapTestHeader(proto.Message):
+    r"""HTTP headers used in UrlMapTests.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            Header name.
+
+            This field is a member of `oneof`_ ``_name``.
+        value (str):
+            Header value.
+
+            This field is a member of `oneof`_ ``_value``.
+    """
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    value: str = proto.Field(
+        proto.STRING,
+        number=111972721,
+        optional=True,
+    )
+
+
+class UrlMapValidationResult(proto.Message):
+    r"""Message representing the validation result for a UrlMap.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        load_errors (MutableSequence[str]):
+
+        load_succeeded (bool):
+            Whether the given UrlMap can be successfully
+            loaded. If false, 'loadErrors' indicates the
+            reasons.
+
+            This field is a member of `oneof`_ ``_load_succeeded``.
+        test_failures (MutableSequence[google.cloud.compute_v1.types.TestFailure]):
+
+        test_passed (bool):
+            If successfully loaded, this field indicates
+            whether the test passed. If false,
+            'testFailures's indicate the reason of failure.
+
+            This field is a member of `oneof`_ ``_test_passed``.
+    """
+
+    load_errors: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=310147300,
+    )
+    load_succeeded: bool = proto.Field(
+        proto.BOOL,
+        number=128326216,
+        optional=True,
+    )
+    test_failures: MutableSequence["TestFailure"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=505934134,
+        message="TestFailure",
+    )
+    test_passed: bool = proto.Field(
+        proto.BOOL,
+        number=192708797,
+        optional=True,
+    )
+
+
+class UrlMapsValidateResponse(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        result (google.cloud.compute_v1.types.UrlMapValidationResult):
+
+            This field is a member of `oneof`_ ``_result``.
+    """
+
+    result: "UrlMapValidationResult" = proto.Field(
+        proto.MESSAGE,
+        number=139315229,
+        optional=True,
+        message="UrlMapValidationResult",
+    )
+
+
+class UrlRewrite(proto.Message):
+    r"""The spec for modifying the path before sending the request to
+    the matched backend service.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        host_rewrite (str):
+            Before forwarding the request to the selected
+            service, the request's host header is replaced
+            with contents of hostRewrite. The value must be
+            from 1 to 255 characters.
+
+            This field is a member of `oneof`_ ``_host_rewrite``.
+        path_prefix_rewrite (str):
+            Before forwarding the request to the selected
+            backend service, the matching portion of the
+            request's path is replaced by pathPrefixRewrite.
+            The value must be from 1 to 1024 characters.
+
+            This field is a member of `oneof`_ ``_path_prefix_rewrite``.
+        path_template_rewrite (str):
+            If specified, the pattern rewrites the URL path (based on
+            the :path header) using the HTTP template syntax. A
+            corresponding path_template_match must be specified. Any
+            template variables must exist in the path_template_match
+            field. - -At least one variable must be specified in the
+            path_template_match field - You can omit variables from the
+            rewritten URL - The \* and \*\* operators cannot be matched
+            unless they have a corresponding variable name - e.g.
+            {format=*} or {var=**}. For example, a path_template_match
+            of /static/{format=**} could be rewritten as
+            /static/content/{format} to prefix /content to the URL.
+            Variables can also be re-ordered in a rewrite, so that
+            /{country}/{format}/{suffix=**} can be rewritten as
+            /content/{format}/{country}/{suffix}. At least one non-empty
+            routeRules[].matchRules[].path_template_match is required.
+            Only one of path_prefix_rewrite or path_template_rewrite may
+            be specified.
+
+            This field is a member of `oneof`_ ``_path_template_rewrite``.
+    """
+
+    host_rewrite: str = proto.Field(
+        proto.STRING,
+        number=159819253,
+        optional=True,
+    )
+    path_prefix_rewrite: str = proto.Field(
+        proto.STRING,
+        number=41186361,
+        optional=True,
+    )
+    path_template_rewrite: str = proto.Field(
+        proto.STRING,
+        number=423409569,
+        optional=True,
+    )
+
+
+class WeightedBackendService(proto.Message):
+    r"""In contrast to a single BackendService in HttpRouteAction to
+    which all matching traffic is directed to,
+    WeightedBackendService allows traffic to be split across
+    multiple backend services. The volume of traffic for each
+    backend service is proportional to the weight specified in each
+    WeightedBackendService
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        backend_service (str):
+            The full or partial URL to the default
+            BackendService resource. Before forwarding the
+            request to backendService, the load balancer
+            applies any relevant headerActions specified as
+            part of this backendServiceWeight.
+
+            This field is a member of `oneof`_ ``_backend_service``.
+        header_action (google.cloud.compute_v1.types.HttpHeaderAction):
+            Specifies changes to request and response
+            headers that need to take effect for the
+            selected backendService. headerAction specified
+            here take effect before headerAction in the
+            enclosing HttpRouteRule, PathMatcher and UrlMap.
+            headerAction is not supported for load balancers
+            that have their loadBalancingScheme set to
+            EXTERNAL. Not supported when the URL map is
+            bound to a target gRPC proxy that has
+            validateForProxyless field set to true.
+
+            This field is a member of `oneof`_ ``_header_action``.
+        weight (int):
+            Specifies the fraction of traffic sent to a
+            backend service, computed as weight / (sum of
+            all weightedBackendService weights in
+            routeAction) . The selection of a backend
+            service is determined only for new traffic. Once
+            a user's request has been directed to a backend
+            service, subsequent requests are sent to the
+            same backend service as determined by the
+            backend service's session affinity policy. The
+            value must be from 0 to 1000.
+
+            This field is a member of `oneof`_ ``_weight``.
+    """
+
+    backend_service: str = proto.Field(
+        proto.STRING,
+        number=306946058,
+        optional=True,
+    )
+    header_action: "HttpHeaderAction" = proto.Field(
+        proto.MESSAGE,
+        number=328077352,
+        optional=True,
+        message="HttpHeaderAction",
+    )
+    weight: int = proto.Field(
+        proto.UINT32,
+        number=282149496,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
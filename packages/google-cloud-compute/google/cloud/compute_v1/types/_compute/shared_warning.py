@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_data
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "Warning",
+    },
+)
+
+
+class Warning(proto.Message):
+    r"""[Output Only] Informational warning message.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        code (str):
+            [Output Only] A warning code, if applicable. For example,
+            Compute Engine returns NO_RESULTS_ON_PAGE if there are no
+            results in the response. Check the Code enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_code``.
+        data (MutableSequence[google.cloud.compute_v1.types.Data]):
+            [Output Only] Metadata about this warning in key: value
+            format. For example: "data": [ { "key": "scope", "value":
+            "zones/us-east1-d" }
+        message (str):
+            [Output Only] A human-readable description of the warning
+            code.
+
+            This field is a member of `oneof`_ ``_message``.
+    """
+
+    class Code(proto.Enum):
+        r"""[Output Only] A warning code, if applicable. For example, Compute
+        Engine returns NO_RESULTS_ON_PAGE if there are no results in the
+        response.
+
+        Values:
+            UNDEFINED_CODE (0):
+                A value indicating that the enum field is not
+                set.
+            CLEANUP_FAILED (150308440):
+                Warning about failed cleanup of transient
+                changes made by a failed operation.
+            DEPRECATED_RESOURCE_USED (391835586):
+                A link to a deprecated resource was created.
+            DEPRECATED_TYPE_USED (346526230):
+                When deploying and at least one of the
+                resources has a type marked as deprecated
+            DISK_SIZE_LARGER_THAN_IMAGE_SIZE (369442967):
+                The user created a boot disk that is larger
+                than image size.
+            EXPERIMENTAL_TYPE_USED (451954443):
+                When deploying and at least one of the
+                resources has a type marked as experimental
+            EXTERNAL_API_WARNING (175546307):
+                Warning that is present in an external api
+                call
+            FIELD_VALUE_OVERRIDEN (329669423):
+                Warning that value of a field has been
+                overridden. Deprecated unused field.
+            INJECTED_KERNELS_DEPRECATED (417377419):
+                The operation involved use of an injected
+                kernel, which is deprecated.
+            INVALID_HEALTH_CHECK_FOR_DYNAMIC_WIEGHTED_LB (401542606):
+                A WEIGHTED_MAGLEV backend service is associated with a
+                health check that is not of type HTTP/HTTPS/HTTP2.
+            LARGE_DEPLOYMENT_WARNING (481440678):
+                When deploying a deployment with a
+                exceedingly large number of resources
+            LIST_OVERHEAD_QUOTA_EXCEED (47618117):
+                Resource can't be retrieved due to list
+                overhead quota exceed which captures the amount
+                of resources filtered out by user-defined list
+                filter.
+            MISSING_TYPE_DEPENDENCY (344505463):
+                A resource depends on a missing type
+            NEXT_HOP_ADDRESS_NOT_ASSIGNED (324964999):
+                The route's nextHopIp address is not assigned
+                to an instance on the network.
+            NEXT_HOP_CANNOT_IP_FORWARD (383382887):
+                The route's next hop instance cannot ip
+                forward.
+            NEXT_HOP_INSTANCE_HAS_NO_IPV6_INTERFACE (146748434):
+                The route's nextHopInstance URL refers to an
+                instance that does not have an ipv6 interface on
+                the same network as the route.
+            NEXT_HOP_INSTANCE_NOT_FOUND (464250446):
+                The route's nextHopInstance URL refers to an
+                instance that does not exist.
+            NEXT_HOP_INSTANCE_NOT_ON_NETWORK (243758146):
+                The route's nextHopInstance URL refers to an
+                instance that is not on the same network as the
+                route.
+            NEXT_HOP_NOT_RUNNING (417081265):
+                The route's next hop instance does not have a
+                status of RUNNING.
+            NOT_CRITICAL_ERROR (105763924):
+                Error which is not critical. We decided to
+                continue the process despite the mentioned
+                error.
+            NO_RESULTS_ON_PAGE (30036744):
+                No results are present on a particular list
+                page.
+            PARTIAL_SUCCESS (39966469):
+                Success is reported, but some results may be
+                missing due to errors
+            REQUIRED_TOS_AGREEMENT (3745539):
+                The user attempted to use a resource that
+                requires a TOS they have not accepted.
+            RESOURCE_IN_USE_BY_OTHER_RESOURCE_WARNING (496728641):
+                Warning that a resource is in use.
+            RESOURCE_NOT_DELETED (168598460):
+                One or more of the resources set to
+                auto-delete could not be deleted because they
+                were in use.
+            SCHEMA_VALIDATION_IGNORED (275245642):
+                When a resource schema validation is ignored.
+            SINGLE_INSTANCE_PROPERTY_TEMPLATE (268305617):
+                Instance template used in instance group
+                manager is valid as such, but its application
+                does not make a lot of sense, because it allows
+                only single instance in instance group.
+            UNDECLARED_PROPERTIES (390513439):
+                When undeclared properties in the schema are
+                present
+            UNREACHABLE (13328052):
+                A given scope cannot be reached.
+        """
+        UNDEFINED_CODE = 0
+        CLEANUP_FAILED = 150308440
+        DEPRECATED_RESOURCE_USED = 391835586
+        DEPRECATED_TYPE_USED = 346526230
+        DISK_SIZE_LARGER_THAN_IMAGE_SIZE = 369442967
+        EXPERIMENTAL_TYPE_USED = 451954443
+        EXTERNAL_API_WARNING = 175546307
+        FIELD_VALUE_OVERRIDEN = 329669423
+        INJECTED_KERNELS_DEPRECATED = 417377419
+        INVALID_HEALTH_CHECK_FOR_DYNAMIC_WIEGHTED_LB = 401542606
+        LARGE_DEPLOYMENT_WARNING = 481440678
+        LIST_OVERHEAD_QUOTA_EXCEED = 47618117
+        MISSING_TYPE_DEPENDENCY = 344505463
+        NEXT_HOP_ADDRESS_NOT_ASSIGNED = 324964999
+        NEXT_HOP_CANNOT_IP_FORWARD = 383382887
+        NEXT_HOP_INSTANCE_HAS_NO_IPV6_INTERFACE = 146748434
+        NEXT_HOP_INSTANCE_NOT_FOUND = 464250446
+        NEXT_HOP_INSTANCE_NOT_ON_NETWORK = 243758146
+        NEXT_HOP_NOT_RUNNING = 417081265
+        NOT_CRITICAL_ERROR = 105763924
+        NO_RESULTS_ON_PAGE = 30036744
+        PARTIAL_SUCCESS = 39966469
+        REQUIRED_TOS_AGREEMENT = 3745539
+        RESOURCE_IN_USE_BY_OTHER_RESOURCE_WARNING = 496728641
+        RESOURCE_NOT_DELETED = 168598460
+        SCHEMA_VALIDATION_IGNORED = 275245642
+        SINGLE_INSTANCE_PROPERTY_TEMPLATE = 268305617
+        UNDECLARED_PROPERTIES = 390513439
+        UNREACHABLE = 13328052
+
+    code: str = proto.Field(
+        proto.STRING,
+        number=3059181,
+        optional=True,
+    )
+    data: MutableSequence[shared_data.Data] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=3076010,
+        message=shared_data.Data,
+    )
+    message: str = proto.Field(
+        proto.STRING,
+        number=418054151,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
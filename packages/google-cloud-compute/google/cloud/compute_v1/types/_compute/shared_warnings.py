@@ -0,0 +1,1125 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+from google.protobuf import any_pb2  # type: ignore
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_data
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "BulkInsertOperationStatus",
+        "Error",
+        "ErrorDetails",
+        "ErrorInfo",
+        "Errors",
+        "Help",
+        "HelpLink",
+        "InstancesBulkInsertOperationMetadata",
+        "LocalizedMessage",
+        "Operation",
+        "QuotaExceededInfo",
+        "SetCommonInstanceMetadataOperationMetadata",
+        "SetCommonInstanceMetadataOperationMetadataPerLocationOperationInfo",
+        "Status",
+        "Warnings",
+    },
+)
+
+
+class BulkInsertOperationStatus(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        created_vm_count (int):
+            [Output Only] Count of VMs successfully created so far.
+
+            This field is a member of `oneof`_ ``_created_vm_count``.
+        deleted_vm_count (int):
+            [Output Only] Count of VMs that got deleted during rollback.
+
+            This field is a member of `oneof`_ ``_deleted_vm_count``.
+        failed_to_create_vm_count (int):
+            [Output Only] Count of VMs that started creating but
+            encountered an error.
+
+            This field is a member of `oneof`_ ``_failed_to_create_vm_count``.
+        status (str):
+            [Output Only] Creation status of BulkInsert operation -
+            information if the flow is rolling forward or rolling back.
+            Check the Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        target_vm_count (int):
+            [Output Only] Count of VMs originally planned to be created.
+
+            This field is a member of `oneof`_ ``_target_vm_count``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] Creation status of BulkInsert operation - information
+        if the flow is rolling forward or rolling back.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            CREATING (455564985):
+                Rolling forward - creating VMs.
+            DONE (2104194):
+                Done
+            ROLLING_BACK (259411649):
+                Rolling back - cleaning up after an error.
+            STATUS_UNSPECIFIED (42133066):
+                No description available.
+        """
+        UNDEFINED_STATUS = 0
+        CREATING = 455564985
+        DONE = 2104194
+        ROLLING_BACK = 259411649
+        STATUS_UNSPECIFIED = 42133066
+
+    created_vm_count: int = proto.Field(
+        proto.INT32,
+        number=396924158,
+        optional=True,
+    )
+    deleted_vm_count: int = proto.Field(
+        proto.INT32,
+        number=271756013,
+        optional=True,
+    )
+    failed_to_create_vm_count: int = proto.Field(
+        proto.INT32,
+        number=58384104,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    target_vm_count: int = proto.Field(
+        proto.INT32,
+        number=532975733,
+        optional=True,
+    )
+
+
+class Error(proto.Message):
+    r"""[Output Only] If errors are generated during processing of the
+    operation, this field will be populated.
+
+    Attributes:
+        errors (MutableSequence[google.cloud.compute_v1.types.Errors]):
+            [Output Only] The array of errors encountered while
+            processing this operation.
+    """
+
+    errors: MutableSequence["Errors"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=315977579,
+        message="Errors",
+    )
+
+
+class ErrorDetails(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        error_info (google.cloud.compute_v1.types.ErrorInfo):
+
+            This field is a member of `oneof`_ ``_error_info``.
+        help_ (google.cloud.compute_v1.types.Help):
+
+            This field is a member of `oneof`_ ``_help``.
+        localized_message (google.cloud.compute_v1.types.LocalizedMessage):
+
+            This field is a member of `oneof`_ ``_localized_message``.
+        quota_info (google.cloud.compute_v1.types.QuotaExceededInfo):
+
+            This field is a member of `oneof`_ ``_quota_info``.
+    """
+
+    error_info: "ErrorInfo" = proto.Field(
+        proto.MESSAGE,
+        number=25251973,
+        optional=True,
+        message="ErrorInfo",
+    )
+    help_: "Help" = proto.Field(
+        proto.MESSAGE,
+        number=3198785,
+        optional=True,
+        message="Help",
+    )
+    localized_message: "LocalizedMessage" = proto.Field(
+        proto.MESSAGE,
+        number=404537155,
+        optional=True,
+        message="LocalizedMessage",
+    )
+    quota_info: "QuotaExceededInfo" = proto.Field(
+        proto.MESSAGE,
+        number=93923861,
+        optional=True,
+        message="QuotaExceededInfo",
+    )
+
+
+class ErrorInfo(proto.Message):
+    r"""Describes the cause of the error with structured details. Example of
+    an error when contacting the "pubsub.googleapis.com" API when it is
+    not enabled: { "reason": "API_DISABLED" "domain": "googleapis.com"
+    "metadata": { "resource": "projects/123", "service":
+    "pubsub.googleapis.com" } } This response indicates that the
+    pubsub.googleapis.com API is not enabled. Example of an error that
+    is returned when attempting to create a Spanner instance in a region
+    that is out of stock: { "reason": "STOCKOUT" "domain":
+    "spanner.googleapis.com", "metadata": { "availableRegions":
+    "us-central1,us-east2" } }
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        domain (str):
+            The logical grouping to which the "reason"
+            belongs. The error domain is typically the
+            registered service name of the tool or product
+            that generates the error. Example:
+            "pubsub.googleapis.com". If the error is
+            generated by some common infrastructure, the
+            error domain must be a globally unique value
+            that identifies the infrastructure. For Google
+            API infrastructure, the error domain is
+            "googleapis.com".
+
+            This field is a member of `oneof`_ ``_domain``.
+        metadatas (MutableMapping[str, str]):
+            Additional structured details about this error. Keys should
+            match `[a-zA-Z0-9-_]` and be limited to 64 characters in
+            length. When identifying the current value of an exceeded
+            limit, the units should be contained in the key, not the
+            value. For example, rather than {"instanceLimit":
+            "100/request"}, should be returned as,
+            {"instanceLimitPerRequest": "100"}, if the client exceeds
+            the number of instances that can be created in a single
+            (batch) request.
+        reason (str):
+            The reason of the error. This is a constant value that
+            identifies the proximate cause of the error. Error reasons
+            are unique within a particular domain of errors. This should
+            be at most 63 characters and match a regular expression of
+            ``A-Z+[A-Z0-9]``, which represents UPPER_SNAKE_CASE.
+
+            This field is a member of `oneof`_ ``_reason``.
+    """
+
+    domain: str = proto.Field(
+        proto.STRING,
+        number=284415172,
+        optional=True,
+    )
+    metadatas: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=8514340,
+    )
+    reason: str = proto.Field(
+        proto.STRING,
+        number=138777156,
+        optional=True,
+    )
+
+
+class Errors(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        code (str):
+            [Output Only] The error type identifier for this error.
+
+            This field is a member of `oneof`_ ``_code``.
+        error_details (MutableSequence[google.cloud.compute_v1.types.ErrorDetails]):
+            [Output Only] An optional list of messages that contain the
+            error details. There is a set of defined message types to
+            use for providing details.The syntax depends on the error
+            code. For example, QuotaExceededInfo will have details when
+            the error code is QUOTA_EXCEEDED.
+        location (str):
+            [Output Only] Indicates the field in the request that caused
+            the error. This property is optional.
+
+            This field is a member of `oneof`_ ``_location``.
+        message (str):
+            [Output Only] An optional, human-readable error message.
+
+            This field is a member of `oneof`_ ``_message``.
+    """
+
+    code: str = proto.Field(
+        proto.STRING,
+        number=3059181,
+        optional=True,
+    )
+    error_details: MutableSequence["ErrorDetails"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=274653963,
+        message="ErrorDetails",
+    )
+    location: str = proto.Field(
+        proto.STRING,
+        number=290430901,
+        optional=True,
+    )
+    message: str = proto.Field(
+        proto.STRING,
+        number=418054151,
+        optional=True,
+    )
+
+
+class Help(proto.Message):
+    r"""Provides links to documentation or for performing an out of
+    band action. For example, if a quota check failed with an error
+    indicating the calling project hasn't enabled the accessed
+    service, this can contain a URL pointing directly to the right
+    place in the developer console to flip the bit.
+
+    Attributes:
+        links (MutableSequence[google.cloud.compute_v1.types.HelpLink]):
+            URL(s) pointing to additional information on
+            handling the current error.
+    """
+
+    links: MutableSequence["HelpLink"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=102977465,
+        message="HelpLink",
+    )
+
+
+class HelpLink(proto.Message):
+    r"""Describes a URL link.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        description (str):
+            Describes what the link offers.
+
+            This field is a member of `oneof`_ ``_description``.
+        url (str):
+            The URL of the link.
+
+            This field is a member of `oneof`_ ``_url``.
+    """
+
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    url: str = proto.Field(
+        proto.STRING,
+        number=116079,
+        optional=True,
+    )
+
+
+class InstancesBulkInsertOperationMetadata(proto.Message):
+    r"""
+
+    Attributes:
+        per_location_status (MutableMapping[str, google.cloud.compute_v1.types.BulkInsertOperationStatus]):
+            Status information per location (location
+            name is key). Example key: zones/us-central1-a
+    """
+
+    per_location_status: MutableMapping[
+        str, "BulkInsertOperationStatus"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=167851162,
+        message="BulkInsertOperationStatus",
+    )
+
+
+class LocalizedMessage(proto.Message):
+    r"""Provides a localized error message that is safe to return to
+    the user which can be attached to an RPC error.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        locale (str):
+            The locale used following the specification
+            defined at
+            https://www.rfc-editor.org/rfc/bcp/bcp47.txt.
+            Examples are: "en-US", "fr-CH", "es-MX".
+
+            This field is a member of `oneof`_ ``_locale``.
+        message (str):
+            The localized error message in the above
+            locale.
+
+            This field is a member of `oneof`_ ``_message``.
+    """
+
+    locale: str = proto.Field(
+        proto.STRING,
+        number=513150554,
+        optional=True,
+    )
+    message: str = proto.Field(
+        proto.STRING,
+        number=418054151,
+        optional=True,
+    )
+
+
+class Operation(proto.Message):
+    r"""Represents an Operation resource. Google Compute Engine has three
+    Operation resources: \*
+    `Global </compute/docs/reference/rest/v1/globalOperations>`__ \*
+    `Regional </compute/docs/reference/rest/v1/regionOperations>`__ \*
+    `Zonal </compute/docs/reference/rest/v1/zoneOperations>`__ You can
+    use an operation resource to manage asynchronous API requests. For
+    more information, read Handling API responses. Operations can be
+    global, regional or zonal. - For global operations, use the
+    ``globalOperations`` resource. - For regional operations, use the
+    ``regionOperations`` resource. - For zonal operations, use the
+    ``zoneOperations`` resource. For more information, read Global,
+    Regional, and Zonal Resources.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        client_operation_id (str):
+            [Output Only] The value of ``requestId`` if you provided it
+            in the request. Not present otherwise.
+
+            This field is a member of `oneof`_ ``_client_operation_id``.
+        creation_timestamp (str):
+            [Deprecated] This field is deprecated.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            [Output Only] A textual description of the operation, which
+            is set when the operation is created.
+
+            This field is a member of `oneof`_ ``_description``.
+        end_time (str):
+            [Output Only] The time that this operation was completed.
+            This value is in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_end_time``.
+        error (google.cloud.compute_v1.types.Error):
+            [Output Only] If errors are generated during processing of
+            the operation, this field will be populated.
+
+            This field is a member of `oneof`_ ``_error``.
+        http_error_message (str):
+            [Output Only] If the operation fails, this field contains
+            the HTTP error message that was returned, such as
+            ``NOT FOUND``.
+
+            This field is a member of `oneof`_ ``_http_error_message``.
+        http_error_status_code (int):
+            [Output Only] If the operation fails, this field contains
+            the HTTP error status code that was returned. For example, a
+            ``404`` means the resource was not found.
+
+            This field is a member of `oneof`_ ``_http_error_status_code``.
+        id (int):
+            [Output Only] The unique identifier for the operation. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        insert_time (str):
+            [Output Only] The time that this operation was requested.
+            This value is in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_insert_time``.
+        instances_bulk_insert_operation_metadata (google.cloud.compute_v1.types.InstancesBulkInsertOperationMetadata):
+
+            This field is a member of `oneof`_ ``_instances_bulk_insert_operation_metadata``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            ``compute#operation`` for Operation resources.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            [Output Only] Name of the operation.
+
+            This field is a member of `oneof`_ ``_name``.
+        operation_group_id (str):
+            [Output Only] An ID that represents a group of operations,
+            such as when a group of operations results from a
+            ``bulkInsert`` API request.
+
+            This field is a member of `oneof`_ ``_operation_group_id``.
+        operation_type (str):
+            [Output Only] The type of operation, such as ``insert``,
+            ``update``, or ``delete``, and so on.
+
+            This field is a member of `oneof`_ ``_operation_type``.
+        progress (int):
+            [Output Only] An optional progress indicator that ranges
+            from 0 to 100. There is no requirement that this be linear
+            or support any granularity of operations. This should not be
+            used to guess when the operation will be complete. This
+            number should monotonically increase as the operation
+            progresses.
+
+            This field is a member of `oneof`_ ``_progress``.
+        region (str):
+            [Output Only] The URL of the region where the operation
+            resides. Only applicable when performing regional
+            operations.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        set_common_instance_metadata_operation_metadata (google.cloud.compute_v1.types.SetCommonInstanceMetadataOperationMetadata):
+            [Output Only] If the operation is for
+            projects.setCommonInstanceMetadata, this field will contain
+            information on all underlying zonal actions and their state.
+
+            This field is a member of `oneof`_ ``_set_common_instance_metadata_operation_metadata``.
+        start_time (str):
+            [Output Only] The time that this operation was started by
+            the server. This value is in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_start_time``.
+        status (google.cloud.compute_v1.types.Operation.Status):
+            [Output Only] The status of the operation, which can be one
+            of the following: ``PENDING``, ``RUNNING``, or ``DONE``.
+
+            This field is a member of `oneof`_ ``_status``.
+        status_message (str):
+            [Output Only] An optional textual description of the current
+            status of the operation.
+
+            This field is a member of `oneof`_ ``_status_message``.
+        target_id (int):
+            [Output Only] The unique target ID, which identifies a
+            specific incarnation of the target resource.
+
+            This field is a member of `oneof`_ ``_target_id``.
+        target_link (str):
+            [Output Only] The URL of the resource that the operation
+            modifies. For operations related to creating a snapshot,
+            this points to the persistent disk that the snapshot was
+            created from.
+
+            This field is a member of `oneof`_ ``_target_link``.
+        user (str):
+            [Output Only] User who requested the operation, for example:
+            ``user@example.com`` or
+            ``alice_smith_identifier (global/workforcePools/example-com-us-employees)``.
+
+            This field is a member of `oneof`_ ``_user``.
+        warnings (MutableSequence[google.cloud.compute_v1.types.Warnings]):
+            [Output Only] If warning messages are generated during
+            processing of the operation, this field will be populated.
+        zone (str):
+            [Output Only] The URL of the zone where the operation
+            resides. Only applicable when performing per-zone
+            operations.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the operation, which can be one of the
+        following: ``PENDING``, ``RUNNING``, or ``DONE``.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            DONE (2104194):
+                No description available.
+            PENDING (35394935):
+                No description available.
+            RUNNING (121282975):
+                No description available.
+        """
+        UNDEFINED_STATUS = 0
+        DONE = 2104194
+        PENDING = 35394935
+        RUNNING = 121282975
+
+    client_operation_id: str = proto.Field(
+        proto.STRING,
+        number=297240295,
+        optional=True,
+    )
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    end_time: str = proto.Field(
+        proto.STRING,
+        number=114938801,
+        optional=True,
+    )
+    error: "Error" = proto.Field(
+        proto.MESSAGE,
+        number=96784904,
+        optional=True,
+        message="Error",
+    )
+    http_error_message: str = proto.Field(
+        proto.STRING,
+        number=202521945,
+        optional=True,
+    )
+    http_error_status_code: int = proto.Field(
+        proto.INT32,
+        number=312345196,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    insert_time: str = proto.Field(
+        proto.STRING,
+        number=433722515,
+        optional=True,
+    )
+    instances_bulk_insert_operation_metadata: "InstancesBulkInsertOperationMetadata" = (
+        proto.Field(
+            proto.MESSAGE,
+            number=89146177,
+            optional=True,
+            message="InstancesBulkInsertOperationMetadata",
+        )
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    operation_group_id: str = proto.Field(
+        proto.STRING,
+        number=40171187,
+        optional=True,
+    )
+    operation_type: str = proto.Field(
+        proto.STRING,
+        number=177650450,
+        optional=True,
+    )
+    progress: int = proto.Field(
+        proto.INT32,
+        number=72663597,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    set_common_instance_metadata_operation_metadata: "SetCommonInstanceMetadataOperationMetadata" = proto.Field(
+        proto.MESSAGE,
+        number=490378980,
+        optional=True,
+        message="SetCommonInstanceMetadataOperationMetadata",
+    )
+    start_time: str = proto.Field(
+        proto.STRING,
+        number=37467274,
+        optional=True,
+    )
+    status: Status = proto.Field(
+        proto.ENUM,
+        number=181260274,
+        optional=True,
+        enum=Status,
+    )
+    status_message: str = proto.Field(
+        proto.STRING,
+        number=297428154,
+        optional=True,
+    )
+    target_id: int = proto.Field(
+        proto.UINT64,
+        number=258165385,
+        optional=True,
+    )
+    target_link: str = proto.Field(
+        proto.STRING,
+        number=62671336,
+        optional=True,
+    )
+    user: str = proto.Field(
+        proto.STRING,
+        number=3599307,
+        optional=True,
+    )
+    warnings: MutableSequence["Warnings"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=498091095,
+        message="Warnings",
+    )
+    zone: str = proto.Field(
+        proto.STRING,
+        number=3744684,
+        optional=True,
+    )
+
+    @property
+    def done(self) -> bool:
+        """Return True if the backing extended operation is completed, False otherwise."""
+        return self.status == type(self.status).DONE
+
+
+class QuotaExceededInfo(proto.Message):
+    r"""Additional details for quota exceeded error for resource
+    quota.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        dimensions (MutableMapping[str, str]):
+            The map holding related quota dimensions.
+        future_limit (float):
+            Future quota limit being rolled out. The
+            limit's unit depends on the quota type or
+            metric.
+
+            This field is a member of `oneof`_ ``_future_limit``.
+        limit (float):
+            Current effective quota limit. The limit's
+            unit depends on the quota type or metric.
+
+            This field is a member of `oneof`_ ``_limit``.
+        limit_name (str):
+            The name of the quota limit.
+
+            This field is a member of `oneof`_ ``_limit_name``.
+        metric_name (str):
+            The Compute Engine quota metric name.
+
+            This field is a member of `oneof`_ ``_metric_name``.
+        rollout_status (str):
+            Rollout status of the future quota limit.
+            Check the RolloutStatus enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_rollout_status``.
+    """
+
+    class RolloutStatus(proto.Enum):
+        r"""Rollout status of the future quota limit.
+
+        Values:
+            UNDEFINED_ROLLOUT_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            IN_PROGRESS (469193735):
+                IN_PROGRESS - A rollout is in process which will change the
+                limit value to future limit.
+            ROLLOUT_STATUS_UNSPECIFIED (26864568):
+                ROLLOUT_STATUS_UNSPECIFIED - Rollout status is not
+                specified. The default value.
+        """
+        UNDEFINED_ROLLOUT_STATUS = 0
+        IN_PROGRESS = 469193735
+        ROLLOUT_STATUS_UNSPECIFIED = 26864568
+
+    dimensions: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=414334925,
+    )
+    future_limit: float = proto.Field(
+        proto.DOUBLE,
+        number=456564287,
+        optional=True,
+    )
+    limit: float = proto.Field(
+        proto.DOUBLE,
+        number=102976443,
+        optional=True,
+    )
+    limit_name: str = proto.Field(
+        proto.STRING,
+        number=398197903,
+        optional=True,
+    )
+    metric_name: str = proto.Field(
+        proto.STRING,
+        number=409881530,
+        optional=True,
+    )
+    rollout_status: str = proto.Field(
+        proto.STRING,
+        number=476426816,
+        optional=True,
+    )
+
+
+class SetCommonInstanceMetadataOperationMetadata(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        client_operation_id (str):
+            [Output Only] The client operation id.
+
+            This field is a member of `oneof`_ ``_client_operation_id``.
+        per_location_operations (MutableMapping[str, google.cloud.compute_v1.types.SetCommonInstanceMetadataOperationMetadataPerLocationOperationInfo]):
+            [Output Only] Status information per location (location name
+            is key). Example key: zones/us-central1-a
+    """
+
+    client_operation_id: str = proto.Field(
+        proto.STRING,
+        number=297240295,
+        optional=True,
+    )
+    per_location_operations: MutableMapping[
+        str, "SetCommonInstanceMetadataOperationMetadataPerLocationOperationInfo"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=408987796,
+        message="SetCommonInstanceMetadataOperationMetadataPerLocationOperationInfo",
+    )
+
+
+class SetCommonInstanceMetadataOperationMetadataPerLocationOperationInfo(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        error (google.cloud.compute_v1.types.Status):
+            [Output Only] If state is ``ABANDONED`` or ``FAILED``, this
+            field is populated.
+
+            This field is a member of `oneof`_ ``_error``.
+        state (str):
+            [Output Only] Status of the action, which can be one of the
+            following: ``PROPAGATING``, ``PROPAGATED``, ``ABANDONED``,
+            ``FAILED``, or ``DONE``. Check the State enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+    """
+
+    class State(proto.Enum):
+        r"""[Output Only] Status of the action, which can be one of the
+        following: ``PROPAGATING``, ``PROPAGATED``, ``ABANDONED``,
+        ``FAILED``, or ``DONE``.
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            ABANDONED (81797556):
+                Operation not tracked in this location e.g.
+                zone is marked as DOWN.
+            DONE (2104194):
+                Operation has completed successfully.
+            FAILED (455706685):
+                Operation is in an error state.
+            PROPAGATED (507550299):
+                Operation is confirmed to be in the location.
+            PROPAGATING (164807046):
+                Operation is not yet confirmed to have been
+                created in the location.
+            UNSPECIFIED (526786327):
+                No description available.
+        """
+        UNDEFINED_STATE = 0
+        ABANDONED = 81797556
+        DONE = 2104194
+        FAILED = 455706685
+        PROPAGATED = 507550299
+        PROPAGATING = 164807046
+        UNSPECIFIED = 526786327
+
+    error: "Status" = proto.Field(
+        proto.MESSAGE,
+        number=96784904,
+        optional=True,
+        message="Status",
+    )
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+
+
+class Status(proto.Message):
+    r"""The ``Status`` type defines a logical error model that is suitable
+    for different programming environments, including REST APIs and RPC
+    APIs. It is used by `gRPC <https://github.com/grpc>`__. Each
+    ``Status`` message contains three pieces of data: error code, error
+    message, and error details. You can find out more about this error
+    model and how to work with it in the `API Design
+    Guide <https://cloud.google.com/apis/design/errors>`__.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        code (int):
+            The status code, which should be an enum
+            value of google.rpc.Code.
+
+            This field is a member of `oneof`_ ``_code``.
+        details (MutableSequence[google.protobuf.any_pb2.Any]):
+            A list of messages that carry the error
+            details. There is a common set of message types
+            for APIs to use.
+        message (str):
+            A developer-facing error message, which
+            should be in English. Any user-facing error
+            message should be localized and sent in the
+            google.rpc.Status.details field, or localized by
+            the client.
+
+            This field is a member of `oneof`_ ``_message``.
+    """
+
+    code: int = proto.Field(
+        proto.INT32,
+        number=3059181,
+        optional=True,
+    )
+    details: MutableSequence[any_pb2.Any] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=483979842,
+        message=any_pb2.Any,
+    )
+    message: str = proto.Field(
+        proto.STRING,
+        number=418054151,
+        optional=True,
+    )
+
+
+class Warnings(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        code (str):
+            [Output Only] A warning code, if applicable. For example,
+            Compute Engine returns NO_RESULTS_ON_PAGE if there are no
+            results in the response. Check the Code enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_code``.
+        data (MutableSequence[google.cloud.compute_v1.types.Data]):
+            [Output Only] Metadata about this warning in key: value
+            format. For example: "data": [ { "key": "scope", "value":
+            "zones/us-east1-d" }
+        message (str):
+            [Output Only] A human-readable description of the warning
+            code.
+
+            This field is a member of `oneof`_ ``_message``.
+    """
+
+    class Code(proto.Enum):
+        r"""[Output Only] A warning code, if applicable. For example, Compute
+        Engine returns NO_RESULTS_ON_PAGE if there are no results in the
+        response.
+
+        Values:
+            UNDEFINED_CODE (0):
+                A value indicating that the enum field is not
+                set.
+            CLEANUP_FAILED (150308440):
+                Warning about failed cleanup of transient
+                changes made by a failed operation.
+            DEPRECATED_RESOURCE_USED (391835586):
+                A link to a deprecated resource was created.
+            DEPRECATED_TYPE_USED (346526230):
+                When deploying and at least one of the
+                resources has a type marked as deprecated
+            DISK_SIZE_LARGER_THAN_IMAGE_SIZE (369442967):
+                The user created a boot disk that is larger
+                than image size.
+            EXPERIMENTAL_TYPE_USED (451954443):
+                When deploying and at least one of the
+                resources has a type marked as experimental
+            EXTERNAL_API_WARNING (175546307):
+                Warning that is present in an external api
+                call
+            FIELD_VALUE_OVERRIDEN (329669423):
+                Warning that value of a field has been
+                overridden. Deprecated unused field.
+            INJECTED_KERNELS_DEPRECATED (417377419):
+                The operation involved use of an injected
+                kernel, which is deprecated.
+            INVALID_HEALTH_CHECK_FOR_DYNAMIC_WIEGHTED_LB (401542606):
+                A WEIGHTED_MAGLEV backend service is associated with a
+                health check that is not of type HTTP/HTTPS/HTTP2.
+            LARGE_DEPLOYMENT_WARNING (481440678):
+                When deploying a deployment with a
+                exceedingly large number of resources
+            LIST_OVERHEAD_QUOTA_EXCEED (47618117):
+                Resource can't be retrieved due to list
+                overhead quota exceed which captures the amount
+                of resources filtered out by user-defined list
+                filter.
+            MISSING_TYPE_DEPENDENCY (344505463):
+                A resource depends on a missing type
+            NEXT_HOP_ADDRESS_NOT_ASSIGNED (324964999):
+                The route's nextHopIp address is not assigned
+                to an instance on the network.
+            NEXT_HOP_CANNOT_IP_FORWARD (383382887):
+                The route's next hop instance cannot ip
+                forward.
+            NEXT_HOP_INSTANCE_HAS_NO_IPV6_INTERFACE (146748434):
+                The route's nextHopInstance URL refers to an
+                instance that does not have an ipv6 interface on
+                the same network as the route.
+            NEXT_HOP_INSTANCE_NOT_FOUND (464250446):
+                The route's nextHopInstance URL refers to an
+                instance that does not exist.
+            NEXT_HOP_INSTANCE_NOT_ON_NETWORK (243758146):
+                The route's nextHopInstance URL refers to an
+                instance that is not on the same network as the
+                route.
+            NEXT_HOP_NOT_RUNNING (417081265):
+                The route's next hop instance does not have a
+                status of RUNNING.
+            NOT_CRITICAL_ERROR (105763924):
+                Error which is not critical. We decided to
+                continue the process despite the mentioned
+                error.
+            NO_RESULTS_ON_PAGE (30036744):
+                No results are present on a particular list
+                page.
+            PARTIAL_SUCCESS (39966469):
+                Success is reported, but some results may be
+                missing due to errors
+            REQUIRED_TOS_AGREEMENT (3745539):
+                The user attempted to use a resource that
+                requires a TOS they have not accepted.
+            RESOURCE_IN_USE_BY_OTHER_RESOURCE_WARNING (496728641):
+                Warning that a resource is in use.
+            RESOURCE_NOT_DELETED (168598460):
+                One or more of the resources set to
+                auto-delete could not be deleted because they
+                were in use.
+            SCHEMA_VALIDATION_IGNORED (275245642):
+                When a resource schema validation is ignored.
+            SINGLE_INSTANCE_PROPERTY_TEMPLATE (268305617):
+                Instance template used in instance group
+                manager is valid as such, but its application
+                does not make a lot of sense, because it allows
+                only single instance in instance group.
+            UNDECLARED_PROPERTIES (390513439):
+                When undeclared properties in the schema are
+                present
+            UNREACHABLE (13328052):
+                A given scope cannot be reached.
+        """
+        UNDEFINED_CODE = 0
+        CLEANUP_FAILED = 150308440
+        DEPRECATED_RESOURCE_USED = 391835586
+        DEPRECATED_TYPE_USED = 346526230
+        DISK_SIZE_LARGER_THAN_IMAGE_SIZE = 369442967
+        EXPERIMENTAL_TYPE_USED = 451954443
+        EXTERNAL_API_WARNING = 175546307
+        FIELD_VALUE_OVERRIDEN = 329669423
+        INJECTED_KERNELS_DEPRECATED = 417377419
+        INVALID_HEALTH_CHECK_FOR_DYNAMIC_WIEGHTED_LB = 401542606
+        LARGE_DEPLOYMENT_WARNING = 481440678
+        LIST_OVERHEAD_QUOTA_EXCEED = 47618117
+        MISSING_TYPE_DEPENDENCY = 344505463
+        NEXT_HOP_ADDRESS_NOT_ASSIGNED = 324964999
+        NEXT_HOP_CANNOT_IP_FORWARD = 383382887
+        NEXT_HOP_INSTANCE_HAS_NO_IPV6_INTERFACE = 146748434
+        NEXT_HOP_INSTANCE_NOT_FOUND = 464250446
+        NEXT_HOP_INSTANCE_NOT_ON_NETWORK = 243758146
+        NEXT_HOP_NOT_RUNNING = 417081265
+        NOT_CRITICAL_ERROR = 105763924
+        NO_RESULTS_ON_PAGE = 30036744
+        PARTIAL_SUCCESS = 39966469
+        REQUIRED_TOS_AGREEMENT = 3745539
+        RESOURCE_IN_USE_BY_OTHER_RESOURCE_WARNING = 496728641
+        RESOURCE_NOT_DELETED = 168598460
+        SCHEMA_VALIDATION_IGNORED = 275245642
+        SINGLE_INSTANCE_PROPERTY_TEMPLATE = 268305617
+        UNDECLARED_PROPERTIES = 390513439
+        UNREACHABLE = 13328052
+
+    code: str = proto.Field(
+        proto.STRING,
+        number=3059181,
+        optional=True,
+    )
+    data: MutableSequence[shared_data.Data] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=3076010,
+        message=shared_data.Data,
+    )
+    message: str = proto.Field(
+        proto.STRING,
+        number=418054151,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping
+
+import proto  # type: ignore
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "GetSnapshotSettingRequest",
+        "PatchSnapshotSettingRequest",
+        "SnapshotSettings",
+        "SnapshotSettingsStorageLocationSettings",
+        "SnapshotSettingsStorageLocationSettingsStorageLocationPreference",
+    },
+)
+
+
+class GetSnapshotSettingRequest(proto.Message):
+    r"""A request message for SnapshotSettingsService.Get. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+
+
+class PatchSnapshotSettingRequest(proto.Message):
+    r"""A request message for SnapshotSettingsService.Patch. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        snapshot_settings_resource (google.cloud.compute_v1.types.SnapshotSettings):
+            The body resource for this request
+        update_mask (str):
+            update_mask indicates fields to be updated as part of this
+            request.
+
+            This field is a member of `oneof`_ ``_update_mask``.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    snapshot_settings_resource: "SnapshotSettings" = proto.Field(
+        proto.MESSAGE,
+        number=357664495,
+        message="SnapshotSettings",
+    )
+    update_mask: str = proto.Field(
+        proto.STRING,
+        number=500079778,
+        optional=True,
+    )
+
+
+class SnapshotSettings(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        storage_location (google.cloud.compute_v1.types.SnapshotSettingsStorageLocationSettings):
+            Policy of which storage location is going to
+            be resolved, and additional data that
+            particularizes how the policy is going to be
+            carried out.
+
+            This field is a member of `oneof`_ ``_storage_location``.
+    """
+
+    storage_location: "SnapshotSettingsStorageLocationSettings" = proto.Field(
+        proto.MESSAGE,
+        number=460859641,
+        optional=True,
+        message="SnapshotSettingsStorageLocationSettings",
+    )
+
+
+class SnapshotSettingsStorageLocationSettings(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        locations (MutableMapping[str, google.cloud.compute_v1.types.SnapshotSettingsStorageLocationSettingsStorageLocationPreference]):
+            When the policy is SPECIFIC_LOCATIONS, snapshots will be
+            stored in the locations listed in this field. Keys are GCS
+            bucket locations.
+        policy (str):
+            The chosen location policy.
+            Check the Policy enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_policy``.
+    """
+
+    class Policy(proto.Enum):
+        r"""The chosen location policy.
+
+        Values:
+            UNDEFINED_POLICY (0):
+                A value indicating that the enum field is not
+                set.
+            LOCAL_REGION (403535464):
+                Store snapshot in the same region as with the
+                originating disk. No additional parameters are
+                needed.
+            NEAREST_MULTI_REGION (212467515):
+                Store snapshot to the nearest multi region
+                GCS bucket, relative to the originating disk. No
+                additional parameters are needed.
+            SPECIFIC_LOCATIONS (280093809):
+                Store snapshot in the specific locations, as specified by
+                the user. The list of regions to store must be defined under
+                the ``locations`` field.
+            STORAGE_LOCATION_POLICY_UNSPECIFIED (250644592):
+                No description available.
+        """
+        UNDEFINED_POLICY = 0
+        LOCAL_REGION = 403535464
+        NEAREST_MULTI_REGION = 212467515
+        SPECIFIC_LOCATIONS = 280093809
+        STORAGE_LOCATION_POLICY_UNSPECIFIED = 250644592
+
+    locations: MutableMapping[
+        str, "SnapshotSettingsStorageLocationSettingsStorageLocationPreference"
+    ] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=413423454,
+        message="SnapshotSettingsStorageLocationSettingsStorageLocationPreference",
+    )
+    policy: str = proto.Field(
+        proto.STRING,
+        number=91071794,
+        optional=True,
+    )
+
+
+class SnapshotSettingsStorageLocationSettingsStorageLocationPreference(proto.Message):
+    r"""A structure for specifying storage locations.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        name (str):
+            Name of the location. It should be one of the
+            GCS buckets.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
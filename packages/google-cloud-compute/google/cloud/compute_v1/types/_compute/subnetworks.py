@@ -0,0 +1,2161 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_region_set_policy_request
+from google.cloud.compute_v1.types._compute import shared_test_permissions_request
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListSubnetworksRequest",
+        "DeleteSubnetworkRequest",
+        "ExpandIpCidrRangeSubnetworkRequest",
+        "GetIamPolicySubnetworkRequest",
+        "GetSubnetworkRequest",
+        "InsertSubnetworkRequest",
+        "ListSubnetworksRequest",
+        "ListUsableSubnetworksRequest",
+        "PatchSubnetworkRequest",
+        "SetIamPolicySubnetworkRequest",
+        "SetPrivateIpGoogleAccessSubnetworkRequest",
+        "Subnetwork",
+        "SubnetworkAggregatedList",
+        "SubnetworkList",
+        "SubnetworkLogConfig",
+        "SubnetworkSecondaryRange",
+        "SubnetworksExpandIpCidrRangeRequest",
+        "SubnetworksScopedList",
+        "SubnetworksSetPrivateIpGoogleAccessRequest",
+        "TestIamPermissionsSubnetworkRequest",
+        "UsableSubnetwork",
+        "UsableSubnetworkSecondaryRange",
+        "UsableSubnetworksAggregatedList",
+    },
+)
+
+
+class AggregatedListSubnetworksRequest(proto.Message):
+    r"""A request message for Subnetworks.AggregatedList. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        service_project_number (int):
+
+            This field is a member of `oneof`_ ``_service_project_number``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    include_all_scopes: bool = proto.Field(
+        proto.BOOL,
+        number=391327988,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    service_project_number: int = proto.Field(
+        proto.INT64,
+        number=316757497,
+        optional=True,
+    )
+
+
+class DeleteSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        subnetwork (str):
+            Name of the Subnetwork resource to delete.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+    )
+
+
+class ExpandIpCidrRangeSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.ExpandIpCidrRange. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        subnetwork (str):
+            Name of the Subnetwork resource to update.
+        subnetworks_expand_ip_cidr_range_request_resource (google.cloud.compute_v1.types.SubnetworksExpandIpCidrRangeRequest):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+    )
+    subnetworks_expand_ip_cidr_range_request_resource: "SubnetworksExpandIpCidrRangeRequest" = proto.Field(
+        proto.MESSAGE,
+        number=477014110,
+        message="SubnetworksExpandIpCidrRangeRequest",
+    )
+
+
+class GetIamPolicySubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.GetIamPolicy. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version: int = proto.Field(
+        proto.INT32,
+        number=499220029,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class GetSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        subnetwork (str):
+            Name of the Subnetwork resource to return.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+    )
+
+
+class InsertSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        subnetwork_resource (google.cloud.compute_v1.types.Subnetwork):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    subnetwork_resource: "Subnetwork" = proto.Field(
+        proto.MESSAGE,
+        number=42233151,
+        message="Subnetwork",
+    )
+
+
+class ListSubnetworksRequest(proto.Message):
+    r"""A request message for Subnetworks.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class ListUsableSubnetworksRequest(proto.Message):
+    r"""A request message for Subnetworks.ListUsable. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class PatchSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.Patch. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        drain_timeout_seconds (int):
+            The drain timeout specifies the upper bound in seconds on
+            the amount of time allowed to drain connections from the
+            current ACTIVE subnetwork to the current BACKUP subnetwork.
+            The drain timeout is only applicable when the following
+            conditions are true: - the subnetwork being patched has
+            purpose = INTERNAL_HTTPS_LOAD_BALANCER - the subnetwork
+            being patched has role = BACKUP - the patch request is
+            setting the role to ACTIVE. Note that after this patch
+            operation the roles of the ACTIVE and BACKUP subnetworks
+            will be swapped.
+
+            This field is a member of `oneof`_ ``_drain_timeout_seconds``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        subnetwork (str):
+            Name of the Subnetwork resource to patch.
+        subnetwork_resource (google.cloud.compute_v1.types.Subnetwork):
+            The body resource for this request
+    """
+
+    drain_timeout_seconds: int = proto.Field(
+        proto.INT32,
+        number=357707098,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+    )
+    subnetwork_resource: "Subnetwork" = proto.Field(
+        proto.MESSAGE,
+        number=42233151,
+        message="Subnetwork",
+    )
+
+
+class SetIamPolicySubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.SetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        region_set_policy_request_resource (google.cloud.compute_v1.types.RegionSetPolicyRequest):
+            The body resource for this request
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_set_policy_request_resource: shared_region_set_policy_request.RegionSetPolicyRequest = proto.Field(
+        proto.MESSAGE,
+        number=276489091,
+        message=shared_region_set_policy_request.RegionSetPolicyRequest,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class SetPrivateIpGoogleAccessSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.SetPrivateIpGoogleAccess.
+    See the method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        subnetwork (str):
+            Name of the Subnetwork resource.
+        subnetworks_set_private_ip_google_access_request_resource (google.cloud.compute_v1.types.SubnetworksSetPrivateIpGoogleAccessRequest):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+    )
+    subnetworks_set_private_ip_google_access_request_resource: "SubnetworksSetPrivateIpGoogleAccessRequest" = proto.Field(
+        proto.MESSAGE,
+        number=268920696,
+        message="SubnetworksSetPrivateIpGoogleAccessRequest",
+    )
+
+
+class Subnetwork(proto.Message):
+    r"""Represents a Subnetwork resource. A subnetwork (also known as
+    a subnet) is a logical partition of a Virtual Private Cloud
+    network with one primary IP range and zero or more secondary IP
+    ranges. For more information, read Virtual Private Cloud (VPC)
+    Network.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource. This field can be set only at resource
+            creation time.
+
+            This field is a member of `oneof`_ ``_description``.
+        enable_flow_logs (bool):
+            Whether to enable flow logging for this subnetwork. If this
+            field is not explicitly set, it will not appear in get
+            listings. If not set the default behavior is determined by
+            the org policy, if there is no org policy specified, then it
+            will default to disabled. This field isn't supported if the
+            subnet purpose field is set to REGIONAL_MANAGED_PROXY.
+
+            This field is a member of `oneof`_ ``_enable_flow_logs``.
+        external_ipv6_prefix (str):
+            The external IPv6 address range that is owned
+            by this subnetwork.
+
+            This field is a member of `oneof`_ ``_external_ipv6_prefix``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a Subnetwork. An
+            up-to-date fingerprint must be provided in order
+            to update the Subnetwork, otherwise the request
+            will fail with error 412 conditionNotMet. To see
+            the latest fingerprint, make a get() request to
+            retrieve a Subnetwork.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        gateway_address (str):
+            [Output Only] The gateway address for default routes to
+            reach destination addresses outside this subnetwork.
+
+            This field is a member of `oneof`_ ``_gateway_address``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        internal_ipv6_prefix (str):
+            [Output Only] The internal IPv6 address range that is
+            assigned to this subnetwork.
+
+            This field is a member of `oneof`_ ``_internal_ipv6_prefix``.
+        ip_cidr_range (str):
+            The range of internal addresses that are
+            owned by this subnetwork. Provide this property
+            when you create the subnetwork. For example,
+            10.0.0.0/8 or 100.64.0.0/10. Ranges must be
+            unique and non-overlapping within a network.
+            Only IPv4 is supported. This field is set at
+            resource creation time. The range can be any
+            range listed in the Valid ranges list. The range
+            can be expanded after creation using
+            expandIpCidrRange.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        ipv6_access_type (str):
+            The access type of IPv6 address this subnet holds. It's
+            immutable and can only be specified during creation or the
+            first time the subnet is updated into IPV4_IPV6 dual stack.
+            Check the Ipv6AccessType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_ipv6_access_type``.
+        ipv6_cidr_range (str):
+            [Output Only] This field is for internal use.
+
+            This field is a member of `oneof`_ ``_ipv6_cidr_range``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#subnetwork for Subnetwork resources.
+
+            This field is a member of `oneof`_ ``_kind``.
+        log_config (google.cloud.compute_v1.types.SubnetworkLogConfig):
+            This field denotes the VPC flow logging
+            options for this subnetwork. If logging is
+            enabled, logs are exported to Cloud Logging.
+
+            This field is a member of `oneof`_ ``_log_config``.
+        name (str):
+            The name of the resource, provided by the client when
+            initially creating the resource. The name must be 1-63
+            characters long, and comply with RFC1035. Specifically, the
+            name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            The URL of the network to which this
+            subnetwork belongs, provided by the client when
+            initially creating the subnetwork. This field
+            can be set only at resource creation time.
+
+            This field is a member of `oneof`_ ``_network``.
+        private_ip_google_access (bool):
+            Whether the VMs in this subnet can access
+            Google services without assigned external IP
+            addresses. This field can be both set at
+            resource creation time and updated using
+            setPrivateIpGoogleAccess.
+
+            This field is a member of `oneof`_ ``_private_ip_google_access``.
+        private_ipv6_google_access (str):
+            This field is for internal use. This field
+            can be both set at resource creation time and
+            updated using patch. Check the
+            PrivateIpv6GoogleAccess enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_private_ipv6_google_access``.
+        purpose (str):
+            The purpose of the resource. This field can be either
+            PRIVATE, REGIONAL_MANAGED_PROXY, PRIVATE_SERVICE_CONNECT, or
+            INTERNAL_HTTPS_LOAD_BALANCER. PRIVATE is the default purpose
+            for user-created subnets or subnets that are automatically
+            created in auto mode networks. A subnet with purpose set to
+            REGIONAL_MANAGED_PROXY is a user-created subnetwork that is
+            reserved for regional Envoy-based load balancers. A subnet
+            with purpose set to PRIVATE_SERVICE_CONNECT is used to
+            publish services using Private Service Connect. A subnet
+            with purpose set to INTERNAL_HTTPS_LOAD_BALANCER is a
+            proxy-only subnet that can be used only by regional internal
+            HTTP(S) load balancers. Note that REGIONAL_MANAGED_PROXY is
+            the preferred setting for all regional Envoy load balancers.
+            If unspecified, the subnet purpose defaults to PRIVATE. The
+            enableFlowLogs field isn't supported if the subnet purpose
+            field is set to REGIONAL_MANAGED_PROXY. Check the Purpose
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_purpose``.
+        region (str):
+            URL of the region where the Subnetwork
+            resides. This field can be set only at resource
+            creation time.
+
+            This field is a member of `oneof`_ ``_region``.
+        role (str):
+            The role of subnetwork. Currently, this field is only used
+            when purpose = REGIONAL_MANAGED_PROXY. The value can be set
+            to ACTIVE or BACKUP. An ACTIVE subnetwork is one that is
+            currently being used for Envoy-based load balancers in a
+            region. A BACKUP subnetwork is one that is ready to be
+            promoted to ACTIVE or is currently draining. This field can
+            be updated with a patch request. Check the Role enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_role``.
+        secondary_ip_ranges (MutableSequence[google.cloud.compute_v1.types.SubnetworkSecondaryRange]):
+            An array of configurations for secondary IP
+            ranges for VM instances contained in this
+            subnetwork. The primary IP of such VM must
+            belong to the primary ipCidrRange of the
+            subnetwork. The alias IPs may belong to either
+            primary or secondary ranges. This field can be
+            updated with a patch request.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        stack_type (str):
+            The stack type for the subnet. If set to IPV4_ONLY, new VMs
+            in the subnet are assigned IPv4 addresses only. If set to
+            IPV4_IPV6, new VMs in the subnet can be assigned both IPv4
+            and IPv6 addresses. If not specified, IPV4_ONLY is used.
+            This field can be both set at resource creation time and
+            updated using patch. Check the StackType enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_stack_type``.
+        state (str):
+            [Output Only] The state of the subnetwork, which can be one
+            of the following values: READY: Subnetwork is created and
+            ready to use DRAINING: only applicable to subnetworks that
+            have the purpose set to INTERNAL_HTTPS_LOAD_BALANCER and
+            indicates that connections to the load balancer are being
+            drained. A subnetwork that is draining cannot be used or
+            modified until it reaches a status of READY Check the State
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+    """
+
+    class Ipv6AccessType(proto.Enum):
+        r"""The access type of IPv6 address this subnet holds. It's immutable
+        and can only be specified during creation or the first time the
+        subnet is updated into IPV4_IPV6 dual stack.
+
+        Values:
+            UNDEFINED_IPV6_ACCESS_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            EXTERNAL (35607499):
+                VMs on this subnet will be assigned IPv6
+                addresses that are accessible via the Internet,
+                as well as the VPC network.
+            INTERNAL (279295677):
+                VMs on this subnet will be assigned IPv6
+                addresses that are only accessible over the VPC
+                network.
+            UNSPECIFIED_IPV6_ACCESS_TYPE (313080613):
+                No description available.
+        """
+        UNDEFINED_IPV6_ACCESS_TYPE = 0
+        EXTERNAL = 35607499
+        INTERNAL = 279295677
+        UNSPECIFIED_IPV6_ACCESS_TYPE = 313080613
+
+    class PrivateIpv6GoogleAccess(proto.Enum):
+        r"""This field is for internal use. This field can be both set at
+        resource creation time and updated using patch.
+
+        Values:
+            UNDEFINED_PRIVATE_IPV6_GOOGLE_ACCESS (0):
+                A value indicating that the enum field is not
+                set.
+            DISABLE_GOOGLE_ACCESS (450958579):
+                Disable private IPv6 access to/from Google
+                services.
+            ENABLE_BIDIRECTIONAL_ACCESS_TO_GOOGLE (427975994):
+                Bidirectional private IPv6 access to/from
+                Google services.
+            ENABLE_OUTBOUND_VM_ACCESS_TO_GOOGLE (288210263):
+                Outbound private IPv6 access from VMs in this
+                subnet to Google services.
+        """
+        UNDEFINED_PRIVATE_IPV6_GOOGLE_ACCESS = 0
+        DISABLE_GOOGLE_ACCESS = 450958579
+        ENABLE_BIDIRECTIONAL_ACCESS_TO_GOOGLE = 427975994
+        ENABLE_OUTBOUND_VM_ACCESS_TO_GOOGLE = 288210263
+
+    class Purpose(proto.Enum):
+        r"""The purpose of the resource. This field can be either PRIVATE,
+        REGIONAL_MANAGED_PROXY, PRIVATE_SERVICE_CONNECT, or
+        INTERNAL_HTTPS_LOAD_BALANCER. PRIVATE is the default purpose for
+        user-created subnets or subnets that are automatically created in
+        auto mode networks. A subnet with purpose set to
+        REGIONAL_MANAGED_PROXY is a user-created subnetwork that is reserved
+        for regional Envoy-based load balancers. A subnet with purpose set
+        to PRIVATE_SERVICE_CONNECT is used to publish services using Private
+        Service Connect. A subnet with purpose set to
+        INTERNAL_HTTPS_LOAD_BALANCER is a proxy-only subnet that can be used
+        only by regional internal HTTP(S) load balancers. Note that
+        REGIONAL_MANAGED_PROXY is the preferred setting for all regional
+        Envoy load balancers. If unspecified, the subnet purpose defaults to
+        PRIVATE. The enableFlowLogs field isn't supported if the subnet
+        purpose field is set to REGIONAL_MANAGED_PROXY.
+
+        Values:
+            UNDEFINED_PURPOSE (0):
+                A value indicating that the enum field is not
+                set.
+            GLOBAL_MANAGED_PROXY (236463602):
+                Subnet reserved for Global Envoy-based Load
+                Balancing.
+            INTERNAL_HTTPS_LOAD_BALANCER (248748889):
+                Subnet reserved for Internal HTTP(S) Load
+                Balancing.
+            PRIVATE (403485027):
+                Regular user created or automatically created
+                subnet.
+            PRIVATE_NAT (367764517):
+                Subnetwork used as source range for Private
+                NAT Gateways.
+            PRIVATE_RFC_1918 (254902107):
+                Regular user created or automatically created
+                subnet.
+            PRIVATE_SERVICE_CONNECT (48134724):
+                Subnetworks created for Private Service
+                Connect in the producer network.
+            REGIONAL_MANAGED_PROXY (153049966):
+                Subnetwork used for Regional Envoy-based Load
+                Balancing.
+        """
+        UNDEFINED_PURPOSE = 0
+        GLOBAL_MANAGED_PROXY = 236463602
+        INTERNAL_HTTPS_LOAD_BALANCER = 248748889
+        PRIVATE = 403485027
+        PRIVATE_NAT = 367764517
+        PRIVATE_RFC_1918 = 254902107
+        PRIVATE_SERVICE_CONNECT = 48134724
+        REGIONAL_MANAGED_PROXY = 153049966
+
+    class Role(proto.Enum):
+        r"""The role of subnetwork. Currently, this field is only used when
+        purpose = REGIONAL_MANAGED_PROXY. The value can be set to ACTIVE or
+        BACKUP. An ACTIVE subnetwork is one that is currently being used for
+        Envoy-based load balancers in a region. A BACKUP subnetwork is one
+        that is ready to be promoted to ACTIVE or is currently draining.
+        This field can be updated with a patch request.
+
+        Values:
+            UNDEFINED_ROLE (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                The ACTIVE subnet that is currently used.
+            BACKUP (341010882):
+                The BACKUP subnet that could be promoted to
+                ACTIVE.
+        """
+        UNDEFINED_ROLE = 0
+        ACTIVE = 314733318
+        BACKUP = 341010882
+
+    class StackType(proto.Enum):
+        r"""The stack type for the subnet. If set to IPV4_ONLY, new VMs in the
+        subnet are assigned IPv4 addresses only. If set to IPV4_IPV6, new
+        VMs in the subnet can be assigned both IPv4 and IPv6 addresses. If
+        not specified, IPV4_ONLY is used. This field can be both set at
+        resource creation time and updated using patch.
+
+        Values:
+            UNDEFINED_STACK_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            IPV4_IPV6 (22197249):
+                New VMs in this subnet can have both IPv4 and
+                IPv6 addresses.
+            IPV4_ONLY (22373798):
+                New VMs in this subnet will only be assigned
+                IPv4 addresses.
+            UNSPECIFIED_STACK_TYPE (298084569):
+                No description available.
+        """
+        UNDEFINED_STACK_TYPE = 0
+        IPV4_IPV6 = 22197249
+        IPV4_ONLY = 22373798
+        UNSPECIFIED_STACK_TYPE = 298084569
+
+    class State(proto.Enum):
+        r"""[Output Only] The state of the subnetwork, which can be one of the
+        following values: READY: Subnetwork is created and ready to use
+        DRAINING: only applicable to subnetworks that have the purpose set
+        to INTERNAL_HTTPS_LOAD_BALANCER and indicates that connections to
+        the load balancer are being drained. A subnetwork that is draining
+        cannot be used or modified until it reaches a status of READY
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            DRAINING (480455402):
+                Subnetwork is being drained.
+            READY (77848963):
+                Subnetwork is ready for use.
+        """
+        UNDEFINED_STATE = 0
+        DRAINING = 480455402
+        READY = 77848963
+
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    enable_flow_logs: bool = proto.Field(
+        proto.BOOL,
+        number=151544420,
+        optional=True,
+    )
+    external_ipv6_prefix: str = proto.Field(
+        proto.STRING,
+        number=139299190,
+        optional=True,
+    )
+    fingerprint: str = proto.Field(
+        proto.STRING,
+        number=234678500,
+        optional=True,
+    )
+    gateway_address: str = proto.Field(
+        proto.STRING,
+        number=459867385,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    internal_ipv6_prefix: str = proto.Field(
+        proto.STRING,
+        number=506270056,
+        optional=True,
+    )
+    ip_cidr_range: str = proto.Field(
+        proto.STRING,
+        number=98117322,
+        optional=True,
+    )
+    ipv6_access_type: str = proto.Field(
+        proto.STRING,
+        number=504658653,
+        optional=True,
+    )
+    ipv6_cidr_range: str = proto.Field(
+        proto.STRING,
+        number=273141258,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    log_config: "SubnetworkLogConfig" = proto.Field(
+        proto.MESSAGE,
+        number=351299741,
+        optional=True,
+        message="SubnetworkLogConfig",
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    private_ip_google_access: bool = proto.Field(
+        proto.BOOL,
+        number=421491790,
+        optional=True,
+    )
+    private_ipv6_google_access: str = proto.Field(
+        proto.STRING,
+        number=48277006,
+        optional=True,
+    )
+    purpose: str = proto.Field(
+        proto.STRING,
+        number=316407070,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    role: str = proto.Field(
+        proto.STRING,
+        number=3506294,
+        optional=True,
+    )
+    secondary_ip_ranges: MutableSequence[
+        "SubnetworkSecondaryRange"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=136658915,
+        message="SubnetworkSecondaryRange",
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    stack_type: str = proto.Field(
+        proto.STRING,
+        number=425908881,
+        optional=True,
+    )
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+
+
+class SubnetworkAggregatedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableMapping[str, google.cloud.compute_v1.types.SubnetworksScopedList]):
+            A list of SubnetworksScopedList resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#subnetworkAggregatedList for aggregated lists of
+            subnetworks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (MutableSequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableMapping[str, "SubnetworksScopedList"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="SubnetworksScopedList",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    unreachables: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=243372063,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class SubnetworkList(proto.Message):
+    r"""Contains a list of Subnetwork resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.Subnetwork]):
+            A list of Subnetwork resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#subnetworkList for lists of subnetworks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["Subnetwork"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="Subnetwork",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class SubnetworkLogConfig(proto.Message):
+    r"""The available logging options for this subnetwork.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        aggregation_interval (str):
+            Can only be specified if VPC flow logging for
+            this subnetwork is enabled. Toggles the
+            aggregation interval for collecting flow logs.
+            Increasing the interval time will reduce the
+            amount of generated flow logs for long lasting
+            connections. Default is an interval of 5 seconds
+            per connection. Check the AggregationInterval
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_aggregation_interval``.
+        enable (bool):
+            Whether to enable flow logging for this subnetwork. If this
+            field is not explicitly set, it will not appear in get
+            listings. If not set the default behavior is determined by
+            the org policy, if there is no org policy specified, then it
+            will default to disabled. Flow logging isn't supported if
+            the subnet purpose field is set to REGIONAL_MANAGED_PROXY.
+
+            This field is a member of `oneof`_ ``_enable``.
+        filter_expr (str):
+            Can only be specified if VPC flow logs for
+            this subnetwork is enabled. The filter
+            expression is used to define which VPC flow logs
+            should be exported to Cloud Logging.
+
+            This field is a member of `oneof`_ ``_filter_expr``.
+        flow_sampling (float):
+            Can only be specified if VPC flow logging for this
+            subnetwork is enabled. The value of the field must be in [0,
+            1]. Set the sampling rate of VPC flow logs within the
+            subnetwork where 1.0 means all collected logs are reported
+            and 0.0 means no logs are reported. Default is 0.5 unless
+            otherwise specified by the org policy, which means half of
+            all collected logs are reported.
+
+            This field is a member of `oneof`_ ``_flow_sampling``.
+        metadata (str):
+            Can only be specified if VPC flow logs for this subnetwork
+            is enabled. Configures whether all, none or a subset of
+            metadata fields should be added to the reported VPC flow
+            logs. Default is EXCLUDE_ALL_METADATA. Check the Metadata
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_metadata``.
+        metadata_fields (MutableSequence[str]):
+            Can only be specified if VPC flow logs for this subnetwork
+            is enabled and "metadata" was set to CUSTOM_METADATA.
+    """
+
+    class AggregationInterval(proto.Enum):
+        r"""Can only be specified if VPC flow logging for this subnetwork
+        is enabled. Toggles the aggregation interval for collecting flow
+        logs. Increasing the interval time will reduce the amount of
+        generated flow logs for long lasting connections. Default is an
+        interval of 5 seconds per connection.
+
+        Values:
+            UNDEFINED_AGGREGATION_INTERVAL (0):
+                A value indicating that the enum field is not
+                set.
+            INTERVAL_10_MIN (487155916):
+                No description available.
+            INTERVAL_15_MIN (491773521):
+                No description available.
+            INTERVAL_1_MIN (69052714):
+                No description available.
+            INTERVAL_30_SEC (7548937):
+                No description available.
+            INTERVAL_5_MIN (72746798):
+                No description available.
+            INTERVAL_5_SEC (72752429):
+                No description available.
+        """
+        UNDEFINED_AGGREGATION_INTERVAL = 0
+        INTERVAL_10_MIN = 487155916
+        INTERVAL_15_MIN = 491773521
+        INTERVAL_1_MIN = 69052714
+        INTERVAL_30_SEC = 7548937
+        INTERVAL_5_MIN = 72746798
+        INTERVAL_5_SEC = 72752429
+
+    class Metadata(proto.Enum):
+        r"""Can only be specified if VPC flow logs for this subnetwork is
+        enabled. Configures whether all, none or a subset of metadata fields
+        should be added to the reported VPC flow logs. Default is
+        EXCLUDE_ALL_METADATA.
+
+        Values:
+            UNDEFINED_METADATA (0):
+                A value indicating that the enum field is not
+                set.
+            CUSTOM_METADATA (62450749):
+                No description available.
+            EXCLUDE_ALL_METADATA (334519954):
+                No description available.
+            INCLUDE_ALL_METADATA (164619908):
+                No description available.
+        """
+        UNDEFINED_METADATA = 0
+        CUSTOM_METADATA = 62450749
+        EXCLUDE_ALL_METADATA = 334519954
+        INCLUDE_ALL_METADATA = 164619908
+
+    aggregation_interval: str = proto.Field(
+        proto.STRING,
+        number=174919042,
+        optional=True,
+    )
+    enable: bool = proto.Field(
+        proto.BOOL,
+        number=311764355,
+        optional=True,
+    )
+    filter_expr: str = proto.Field(
+        proto.STRING,
+        number=183374428,
+        optional=True,
+    )
+    flow_sampling: float = proto.Field(
+        proto.FLOAT,
+        number=530150360,
+        optional=True,
+    )
+    metadata: str = proto.Field(
+        proto.STRING,
+        number=86866735,
+        optional=True,
+    )
+    metadata_fields: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=378461641,
+    )
+
+
+class SubnetworkSecondaryRange(proto.Message):
+    r"""Represents a secondary IP range of a subnetwork.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ip_cidr_range (str):
+            The range of IP addresses belonging to this
+            subnetwork secondary range. Provide this
+            property when you create the subnetwork. Ranges
+            must be unique and non-overlapping with all
+            primary and secondary IP ranges within a
+            network. Only IPv4 is supported. The range can
+            be any range listed in the Valid ranges list.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        range_name (str):
+            The name associated with this subnetwork
+            secondary range, used when adding an alias IP
+            range to a VM instance. The name must be 1-63
+            characters long, and comply with RFC1035. The
+            name must be unique within the subnetwork.
+
+            This field is a member of `oneof`_ ``_range_name``.
+    """
+
+    ip_cidr_range: str = proto.Field(
+        proto.STRING,
+        number=98117322,
+        optional=True,
+    )
+    range_name: str = proto.Field(
+        proto.STRING,
+        number=332216397,
+        optional=True,
+    )
+
+
+class SubnetworksExpandIpCidrRangeRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ip_cidr_range (str):
+            The IP (in CIDR format or netmask) of
+            internal addresses that are legal on this
+            Subnetwork. This range should be disjoint from
+            other subnetworks within this network. This
+            range can only be larger than (i.e. a superset
+            of) the range previously defined before the
+            update.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+    """
+
+    ip_cidr_range: str = proto.Field(
+        proto.STRING,
+        number=98117322,
+        optional=True,
+    )
+
+
+class SubnetworksScopedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        subnetworks (MutableSequence[google.cloud.compute_v1.types.Subnetwork]):
+            A list of subnetworks contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            An informational warning that appears when
+            the list of addresses is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    subnetworks: MutableSequence["Subnetwork"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=415853125,
+        message="Subnetwork",
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class SubnetworksSetPrivateIpGoogleAccessRequest(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        private_ip_google_access (bool):
+
+            This field is a member of `oneof`_ ``_private_ip_google_access``.
+    """
+
+    private_ip_google_access: bool = proto.Field(
+        proto.BOOL,
+        number=421491790,
+        optional=True,
+    )
+
+
+class TestIamPermissionsSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.TestIamPermissions. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    test_permissions_request_resource: shared_test_permissions_request.TestPermissionsRequest = proto.Field(
+        proto.MESSAGE,
+        number=439214758,
+        message=shared_test_permissions_request.TestPermissionsRequest,
+    )
+
+
+class UsableSubnetwork(proto.Message):
+    r"""Subnetwork which the current user has compute.subnetworks.use
+    permission on.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        external_ipv6_prefix (str):
+            [Output Only] The external IPv6 address range that is
+            assigned to this subnetwork.
+
+            This field is a member of `oneof`_ ``_external_ipv6_prefix``.
+        internal_ipv6_prefix (str):
+            [Output Only] The internal IPv6 address range that is
+            assigned to this subnetwork.
+
+            This field is a member of `oneof`_ ``_internal_ipv6_prefix``.
+        ip_cidr_range (str):
+            The range of internal addresses that are
+            owned by this subnetwork.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        ipv6_access_type (str):
+            The access type of IPv6 address this subnet holds. It's
+            immutable and can only be specified during creation or the
+            first time the subnet is updated into IPV4_IPV6 dual stack.
+            Check the Ipv6AccessType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_ipv6_access_type``.
+        network (str):
+            Network URL.
+
+            This field is a member of `oneof`_ ``_network``.
+        purpose (str):
+            The purpose of the resource. This field can be either
+            PRIVATE, REGIONAL_MANAGED_PROXY, PRIVATE_SERVICE_CONNECT, or
+            INTERNAL_HTTPS_LOAD_BALANCER. PRIVATE is the default purpose
+            for user-created subnets or subnets that are automatically
+            created in auto mode networks. A subnet with purpose set to
+            REGIONAL_MANAGED_PROXY is a user-created subnetwork that is
+            reserved for regional Envoy-based load balancers. A subnet
+            with purpose set to PRIVATE_SERVICE_CONNECT is used to
+            publish services using Private Service Connect. A subnet
+            with purpose set to INTERNAL_HTTPS_LOAD_BALANCER is a
+            proxy-only subnet that can be used only by regional internal
+            HTTP(S) load balancers. Note that REGIONAL_MANAGED_PROXY is
+            the preferred setting for all regional Envoy load balancers.
+            If unspecified, the subnet purpose defaults to PRIVATE. The
+            enableFlowLogs field isn't supported if the subnet purpose
+            field is set to REGIONAL_MANAGED_PROXY. Check the Purpose
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_purpose``.
+        role (str):
+            The role of subnetwork. Currently, this field is only used
+            when purpose = REGIONAL_MANAGED_PROXY. The value can be set
+            to ACTIVE or BACKUP. An ACTIVE subnetwork is one that is
+            currently being used for Envoy-based load balancers in a
+            region. A BACKUP subnetwork is one that is ready to be
+            promoted to ACTIVE or is currently draining. This field can
+            be updated with a patch request. Check the Role enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_role``.
+        secondary_ip_ranges (MutableSequence[google.cloud.compute_v1.types.UsableSubnetworkSecondaryRange]):
+            Secondary IP ranges.
+        stack_type (str):
+            The stack type for the subnet. If set to IPV4_ONLY, new VMs
+            in the subnet are assigned IPv4 addresses only. If set to
+            IPV4_IPV6, new VMs in the subnet can be assigned both IPv4
+            and IPv6 addresses. If not specified, IPV4_ONLY is used.
+            This field can be both set at resource creation time and
+            updated using patch. Check the StackType enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_stack_type``.
+        subnetwork (str):
+            Subnetwork URL.
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+    """
+
+    class Ipv6AccessType(proto.Enum):
+        r"""The access type of IPv6 address this subnet holds. It's immutable
+        and can only be specified during creation or the first time the
+        subnet is updated into IPV4_IPV6 dual stack.
+
+        Values:
+            UNDEFINED_IPV6_ACCESS_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            EXTERNAL (35607499):
+                VMs on this subnet will be assigned IPv6
+                addresses that are accessible via the Internet,
+                as well as the VPC network.
+            INTERNAL (279295677):
+                VMs on this subnet will be assigned IPv6
+                addresses that are only accessible over the VPC
+                network.
+        """
+        UNDEFINED_IPV6_ACCESS_TYPE = 0
+        EXTERNAL = 35607499
+        INTERNAL = 279295677
+
+    class Purpose(proto.Enum):
+        r"""The purpose of the resource. This field can be either PRIVATE,
+        REGIONAL_MANAGED_PROXY, PRIVATE_SERVICE_CONNECT, or
+        INTERNAL_HTTPS_LOAD_BALANCER. PRIVATE is the default purpose for
+        user-created subnets or subnets that are automatically created in
+        auto mode networks. A subnet with purpose set to
+        REGIONAL_MANAGED_PROXY is a user-created subnetwork that is reserved
+        for regional Envoy-based load balancers. A subnet with purpose set
+        to PRIVATE_SERVICE_CONNECT is used to publish services using Private
+        Service Connect. A subnet with purpose set to
+        INTERNAL_HTTPS_LOAD_BALANCER is a proxy-only subnet that can be used
+        only by regional internal HTTP(S) load balancers. Note that
+        REGIONAL_MANAGED_PROXY is the preferred setting for all regional
+        Envoy load balancers. If unspecified, the subnet purpose defaults to
+        PRIVATE. The enableFlowLogs field isn't supported if the subnet
+        purpose field is set to REGIONAL_MANAGED_PROXY.
+
+        Values:
+            UNDEFINED_PURPOSE (0):
+                A value indicating that the enum field is not
+                set.
+            GLOBAL_MANAGED_PROXY (236463602):
+                Subnet reserved for Global Envoy-based Load
+                Balancing.
+            INTERNAL_HTTPS_LOAD_BALANCER (248748889):
+                Subnet reserved for Internal HTTP(S) Load
+                Balancing.
+            PRIVATE (403485027):
+                Regular user created or automatically created
+                subnet.
+            PRIVATE_NAT (367764517):
+                Subnetwork used as source range for Private
+                NAT Gateways.
+            PRIVATE_RFC_1918 (254902107):
+                Regular user created or automatically created
+                subnet.
+            PRIVATE_SERVICE_CONNECT (48134724):
+                Subnetworks created for Private Service
+                Connect in the producer network.
+            REGIONAL_MANAGED_PROXY (153049966):
+                Subnetwork used for Regional Envoy-based Load
+                Balancing.
+        """
+        UNDEFINED_PURPOSE = 0
+        GLOBAL_MANAGED_PROXY = 236463602
+        INTERNAL_HTTPS_LOAD_BALANCER = 248748889
+        PRIVATE = 403485027
+        PRIVATE_NAT = 367764517
+        PRIVATE_RFC_1918 = 254902107
+        PRIVATE_SERVICE_CONNECT = 48134724
+        REGIONAL_MANAGED_PROXY = 153049966
+
+    class Role(proto.Enum):
+        r"""The role of subnetwork. Currently, this field is only used when
+        purpose = REGIONAL_MANAGED_PROXY. The value can be set to ACTIVE or
+        BACKUP. An ACTIVE subnetwork is one that is currently being used for
+        Envoy-based load balancers in a region. A BACKUP subnetwork is one
+        that is ready to be promoted to ACTIVE or is currently draining.
+        This field can be updated with a patch request.
+
+        Values:
+            UNDEFINED_ROLE (0):
+                A value indicating that the enum field is not
+                set.
+            ACTIVE (314733318):
+                The ACTIVE subnet that is currently used.
+            BACKUP (341010882):
+                The BACKUP subnet that could be promoted to
+                ACTIVE.
+        """
+        UNDEFINED_ROLE = 0
+        ACTIVE = 314733318
+        BACKUP = 341010882
+
+    class StackType(proto.Enum):
+        r"""The stack type for the subnet. If set to IPV4_ONLY, new VMs in the
+        subnet are assigned IPv4 addresses only. If set to IPV4_IPV6, new
+        VMs in the subnet can be assigned both IPv4 and IPv6 addresses. If
+        not specified, IPV4_ONLY is used. This field can be both set at
+        resource creation time and updated using patch.
+
+        Values:
+            UNDEFINED_STACK_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            IPV4_IPV6 (22197249):
+                New VMs in this subnet can have both IPv4 and
+                IPv6 addresses.
+            IPV4_ONLY (22373798):
+                New VMs in this subnet will only be assigned
+                IPv4 addresses.
+        """
+        UNDEFINED_STACK_TYPE = 0
+        IPV4_IPV6 = 22197249
+        IPV4_ONLY = 22373798
+
+    external_ipv6_prefix: str = proto.Field(
+        proto.STRING,
+        number=139299190,
+        optional=True,
+    )
+    internal_ipv6_prefix: str = proto.Field(
+        proto.STRING,
+        number=506270056,
+        optional=True,
+    )
+    ip_cidr_range: str = proto.Field(
+        proto.STRING,
+        number=98117322,
+        optional=True,
+    )
+    ipv6_access_type: str = proto.Field(
+        proto.STRING,
+        number=504658653,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    purpose: str = proto.Field(
+        proto.STRING,
+        number=316407070,
+        optional=True,
+    )
+    role: str = proto.Field(
+        proto.STRING,
+        number=3506294,
+        optional=True,
+    )
+    secondary_ip_ranges: MutableSequence[
+        "UsableSubnetworkSecondaryRange"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=136658915,
+        message="UsableSubnetworkSecondaryRange",
+    )
+    stack_type: str = proto.Field(
+        proto.STRING,
+        number=425908881,
+        optional=True,
+    )
+    subnetwork: str = proto.Field(
+        proto.STRING,
+        number=307827694,
+        optional=True,
+    )
+
+
+class UsableSubnetworkSecondaryRange(proto.Message):
+    r"""Secondary IP range of a usable subnetwork.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        ip_cidr_range (str):
+            The range of IP addresses belonging to this
+            subnetwork secondary range.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        range_name (str):
+            The name associated with this subnetwork
+            secondary range, used when adding an alias IP
+            range to a VM instance. The name must be 1-63
+            characters long, and comply with RFC1035. The
+            name must be unique within the subnetwork.
+
+            This field is a member of `oneof`_ ``_range_name``.
+    """
+
+    ip_cidr_range: str = proto.Field(
+        proto.STRING,
+        number=98117322,
+        optional=True,
+    )
+    range_name: str = proto.Field(
+        proto.STRING,
+        number=332216397,
+        optional=True,
+    )
+
+
+class UsableSubnetworksAggregatedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.UsableSubnetwork]):
+            [Output] A list of usable subnetwork URLs.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#usableSubnetworksAggregatedList for aggregated lists
+            of usable subnetworks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results. In special cases
+            listUsable may return 0 subnetworks and nextPageToken which
+            still should be used to get the next page of results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["UsableSubnetwork"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="UsableSubnetwork",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
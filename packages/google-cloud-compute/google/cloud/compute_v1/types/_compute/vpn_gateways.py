@@ -0,0 +1,1201 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_region_set_labels_request
+from google.cloud.compute_v1.types._compute import shared_test_permissions_request
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListVpnGatewaysRequest",
+        "DeleteVpnGatewayRequest",
+        "GetStatusVpnGatewayRequest",
+        "GetVpnGatewayRequest",
+        "InsertVpnGatewayRequest",
+        "ListVpnGatewaysRequest",
+        "SetLabelsVpnGatewayRequest",
+        "TestIamPermissionsVpnGatewayRequest",
+        "VpnGateway",
+        "VpnGatewayAggregatedList",
+        "VpnGatewayList",
+        "VpnGatewayStatus",
+        "VpnGatewayStatusHighAvailabilityRequirementState",
+        "VpnGatewayStatusTunnel",
+        "VpnGatewayStatusVpnConnection",
+        "VpnGatewayVpnGatewayInterface",
+        "VpnGatewaysGetStatusResponse",
+        "VpnGatewaysScopedList",
+    },
+)
+
+
+class AggregatedListVpnGatewaysRequest(proto.Message):
+    r"""A request message for VpnGateways.AggregatedList. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        service_project_number (int):
+
+            This field is a member of `oneof`_ ``_service_project_number``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    include_all_scopes: bool = proto.Field(
+        proto.BOOL,
+        number=391327988,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    service_project_number: int = proto.Field(
+        proto.INT64,
+        number=316757497,
+        optional=True,
+    )
+
+
+class DeleteVpnGatewayRequest(proto.Message):
+    r"""A request message for VpnGateways.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        vpn_gateway (str):
+            Name of the VPN gateway to delete.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    vpn_gateway: str = proto.Field(
+        proto.STRING,
+        number=406684153,
+    )
+
+
+class GetStatusVpnGatewayRequest(proto.Message):
+    r"""A request message for VpnGateways.GetStatus. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        vpn_gateway (str):
+            Name of the VPN gateway to return.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    vpn_gateway: str = proto.Field(
+        proto.STRING,
+        number=406684153,
+    )
+
+
+class GetVpnGatewayRequest(proto.Message):
+    r"""A request message for VpnGateways.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        vpn_gateway (str):
+            Name of the VPN gateway to return.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    vpn_gateway: str = proto.Field(
+        proto.STRING,
+        number=406684153,
+    )
+
+
+class InsertVpnGatewayRequest(proto.Message):
+    r"""A request message for VpnGateways.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        vpn_gateway_resource (google.cloud.compute_v1.types.VpnGateway):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    vpn_gateway_resource: "VpnGateway" = proto.Field(
+        proto.MESSAGE,
+        number=182688660,
+        message="VpnGateway",
+    )
+
+
+class ListVpnGatewaysRequest(proto.Message):
+    r"""A request message for VpnGateways.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class SetLabelsVpnGatewayRequest(proto.Message):
+    r"""A request message for VpnGateways.SetLabels. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The region for this request.
+        region_set_labels_request_resource (google.cloud.compute_v1.types.RegionSetLabelsRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_set_labels_request_resource: shared_region_set_labels_request.RegionSetLabelsRequest = proto.Field(
+        proto.MESSAGE,
+        number=259357782,
+        message=shared_region_set_labels_request.RegionSetLabelsRequest,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class TestIamPermissionsVpnGatewayRequest(proto.Message):
+    r"""A request message for VpnGateways.TestIamPermissions. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+    test_permissions_request_resource: shared_test_permissions_request.TestPermissionsRequest = proto.Field(
+        proto.MESSAGE,
+        number=439214758,
+        message=shared_test_permissions_request.TestPermissionsRequest,
+    )
+
+
+class VpnGateway(proto.Message):
+    r"""Represents a HA VPN gateway. HA VPN is a high-availability
+    (HA) Cloud VPN solution that lets you securely connect your
+    on-premises network to your Google Cloud Virtual Private Cloud
+    network through an IPsec VPN connection in a single region. For
+    more information about Cloud HA VPN solutions, see Cloud VPN
+    topologies .
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of resource. Always compute#vpnGateway
+            for VPN gateways.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this VpnGateway, which is essentially a hash of
+            the labels set used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update labels. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change labels, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make a get() request to
+            retrieve a VpnGateway.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+            Labels for this resource. These can only be
+            added or modified by the setLabels method. Each
+            label key/value pair must comply with RFC1035.
+            Label values may be empty.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            URL of the network to which this VPN gateway
+            is attached. Provided by the client when the VPN
+            gateway is created.
+
+            This field is a member of `oneof`_ ``_network``.
+        region (str):
+            [Output Only] URL of the region where the VPN gateway
+            resides.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        stack_type (str):
+            The stack type for this VPN gateway to identify the IP
+            protocols that are enabled. Possible values are: IPV4_ONLY,
+            IPV4_IPV6. If not specified, IPV4_ONLY will be used. Check
+            the StackType enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_stack_type``.
+        vpn_interfaces (MutableSequence[google.cloud.compute_v1.types.VpnGatewayVpnGatewayInterface]):
+            The list of VPN interfaces associated with
+            this VPN gateway.
+    """
+
+    class StackType(proto.Enum):
+        r"""The stack type for this VPN gateway to identify the IP protocols
+        that are enabled. Possible values are: IPV4_ONLY, IPV4_IPV6. If not
+        specified, IPV4_ONLY will be used.
+
+        Values:
+            UNDEFINED_STACK_TYPE (0):
+                A value indicating that the enum field is not
+                set.
+            IPV4_IPV6 (22197249):
+                Enable VPN gateway with both IPv4 and IPv6
+                protocols.
+            IPV4_ONLY (22373798):
+                Enable VPN gateway with only IPv4 protocol.
+        """
+        UNDEFINED_STACK_TYPE = 0
+        IPV4_IPV6 = 22197249
+        IPV4_ONLY = 22373798
+
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    network: str = proto.Field(
+        proto.STRING,
+        number=232872494,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    stack_type: str = proto.Field(
+        proto.STRING,
+        number=425908881,
+        optional=True,
+    )
+    vpn_interfaces: MutableSequence[
+        "VpnGatewayVpnGatewayInterface"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=91842181,
+        message="VpnGatewayVpnGatewayInterface",
+    )
+
+
+class VpnGatewayAggregatedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableMapping[str, google.cloud.compute_v1.types.VpnGatewaysScopedList]):
+            A list of VpnGateway resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#vpnGateway
+            for VPN gateways.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (MutableSequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableMapping[str, "VpnGatewaysScopedList"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="VpnGatewaysScopedList",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    unreachables: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=243372063,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class VpnGatewayList(proto.Message):
+    r"""Contains a list of VpnGateway resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.VpnGateway]):
+            A list of VpnGateway resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#vpnGateway
+            for VPN gateways.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["VpnGateway"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="VpnGateway",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class VpnGatewayStatus(proto.Message):
+    r"""
+
+    Attributes:
+        vpn_connections (MutableSequence[google.cloud.compute_v1.types.VpnGatewayStatusVpnConnection]):
+            List of VPN connection for this VpnGateway.
+    """
+
+    vpn_connections: MutableSequence[
+        "VpnGatewayStatusVpnConnection"
+    ] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=439334538,
+        message="VpnGatewayStatusVpnConnection",
+    )
+
+
+class VpnGatewayStatusHighAvailabilityRequirementState(proto.Message):
+    r"""Describes the high availability requirement state for the VPN
+    connection between this Cloud VPN gateway and a peer gateway.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        state (str):
+            Indicates the high availability requirement state for the
+            VPN connection. Valid values are CONNECTION_REDUNDANCY_MET,
+            CONNECTION_REDUNDANCY_NOT_MET. Check the State enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+        unsatisfied_reason (str):
+            Indicates the reason why the VPN connection does not meet
+            the high availability redundancy criteria/requirement. Valid
+            values is INCOMPLETE_TUNNELS_COVERAGE. Check the
+            UnsatisfiedReason enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_unsatisfied_reason``.
+    """
+
+    class State(proto.Enum):
+        r"""Indicates the high availability requirement state for the VPN
+        connection. Valid values are CONNECTION_REDUNDANCY_MET,
+        CONNECTION_REDUNDANCY_NOT_MET.
+
+        Values:
+            UNDEFINED_STATE (0):
+                A value indicating that the enum field is not
+                set.
+            CONNECTION_REDUNDANCY_MET (505242907):
+                VPN tunnels are configured with adequate
+                redundancy from Cloud VPN gateway to the peer
+                VPN gateway. For both GCP-to-non-GCP and
+                GCP-to-GCP connections, the adequate redundancy
+                is a pre-requirement for users to get 99.99%
+                availability on GCP side; please note that for
+                any connection, end-to-end 99.99% availability
+                is subject to proper configuration on the peer
+                VPN gateway.
+            CONNECTION_REDUNDANCY_NOT_MET (511863311):
+                VPN tunnels are not configured with adequate
+                redundancy from the Cloud VPN gateway to the
+                peer gateway
+        """
+        UNDEFINED_STATE = 0
+        CONNECTION_REDUNDANCY_MET = 505242907
+        CONNECTION_REDUNDANCY_NOT_MET = 511863311
+
+    class UnsatisfiedReason(proto.Enum):
+        r"""Indicates the reason why the VPN connection does not meet the high
+        availability redundancy criteria/requirement. Valid values is
+        INCOMPLETE_TUNNELS_COVERAGE.
+
+        Values:
+            UNDEFINED_UNSATISFIED_REASON (0):
+                A value indicating that the enum field is not
+                set.
+            INCOMPLETE_TUNNELS_COVERAGE (55917437):
+                No description available.
+        """
+        UNDEFINED_UNSATISFIED_REASON = 0
+        INCOMPLETE_TUNNELS_COVERAGE = 55917437
+
+    state: str = proto.Field(
+        proto.STRING,
+        number=109757585,
+        optional=True,
+    )
+    unsatisfied_reason: str = proto.Field(
+        proto.STRING,
+        number=55016330,
+        optional=True,
+    )
+
+
+class VpnGatewayStatusTunnel(proto.Message):
+    r"""Contains some information about a VPN tunnel.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        local_gateway_interface (int):
+            The VPN gateway interface this VPN tunnel is
+            associated with.
+
+            This field is a member of `oneof`_ ``_local_gateway_interface``.
+        peer_gateway_interface (int):
+            The peer gateway interface this VPN tunnel is
+            connected to, the peer gateway could either be
+            an external VPN gateway or a Google Cloud VPN
+            gateway.
+
+            This field is a member of `oneof`_ ``_peer_gateway_interface``.
+        tunnel_url (str):
+            URL reference to the VPN tunnel.
+
+            This field is a member of `oneof`_ ``_tunnel_url``.
+    """
+
+    local_gateway_interface: int = proto.Field(
+        proto.UINT32,
+        number=158764330,
+        optional=True,
+    )
+    peer_gateway_interface: int = proto.Field(
+        proto.UINT32,
+        number=214380385,
+        optional=True,
+    )
+    tunnel_url: str = proto.Field(
+        proto.STRING,
+        number=78975256,
+        optional=True,
+    )
+
+
+class VpnGatewayStatusVpnConnection(proto.Message):
+    r"""A VPN connection contains all VPN tunnels connected from this
+    VpnGateway to the same peer gateway. The peer gateway could
+    either be an external VPN gateway or a Google Cloud VPN gateway.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        peer_external_gateway (str):
+            URL reference to the peer external VPN gateways to which the
+            VPN tunnels in this VPN connection are connected. This field
+            is mutually exclusive with peer_gcp_gateway.
+
+            This field is a member of `oneof`_ ``_peer_external_gateway``.
+        peer_gcp_gateway (str):
+            URL reference to the peer side VPN gateways to which the VPN
+            tunnels in this VPN connection are connected. This field is
+            mutually exclusive with peer_gcp_gateway.
+
+            This field is a member of `oneof`_ ``_peer_gcp_gateway``.
+        state (google.cloud.compute_v1.types.VpnGatewayStatusHighAvailabilityRequirementState):
+            HighAvailabilityRequirementState for the VPN
+            connection.
+
+            This field is a member of `oneof`_ ``_state``.
+        tunnels (MutableSequence[google.cloud.compute_v1.types.VpnGatewayStatusTunnel]):
+            List of VPN tunnels that are in this VPN
+            connection.
+    """
+
+    peer_external_gateway: str = proto.Field(
+        proto.STRING,
+        number=384956173,
+        optional=True,
+    )
+    peer_gcp_gateway: str = proto.Field(
+        proto.STRING,
+        number=281867452,
+        optional=True,
+    )
+    state: "VpnGatewayStatusHighAvailabilityRequirementState" = proto.Field(
+        proto.MESSAGE,
+        number=109757585,
+        optional=True,
+        message="VpnGatewayStatusHighAvailabilityRequirementState",
+    )
+    tunnels: MutableSequence["VpnGatewayStatusTunnel"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=104561931,
+        message="VpnGatewayStatusTunnel",
+    )
+
+
+class VpnGatewayVpnGatewayInterface(proto.Message):
+    r"""A VPN gateway interface.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (int):
+            [Output Only] Numeric identifier for this VPN interface
+            associated with the VPN gateway.
+
+            This field is a member of `oneof`_ ``_id``.
+        interconnect_attachment (str):
+            URL of the VLAN attachment
+            (interconnectAttachment) resource for this VPN
+            gateway interface. When the value of this field
+            is present, the VPN gateway is used for HA VPN
+            over Cloud Interconnect; all egress or ingress
+            traffic for this VPN gateway interface goes
+            through the specified VLAN attachment resource.
+
+            This field is a member of `oneof`_ ``_interconnect_attachment``.
+        ip_address (str):
+            [Output Only] IP address for this VPN interface associated
+            with the VPN gateway. The IP address could be either a
+            regional external IP address or a regional internal IP
+            address. The two IP addresses for a VPN gateway must be all
+            regional external or regional internal IP addresses. There
+            cannot be a mix of regional external IP addresses and
+            regional internal IP addresses. For HA VPN over Cloud
+            Interconnect, the IP addresses for both interfaces could
+            either be regional internal IP addresses or regional
+            external IP addresses. For regular (non HA VPN over Cloud
+            Interconnect) HA VPN tunnels, the IP address must be a
+            regional external IP address.
+
+            This field is a member of `oneof`_ ``_ip_address``.
+    """
+
+    id: int = proto.Field(
+        proto.UINT32,
+        number=3355,
+        optional=True,
+    )
+    interconnect_attachment: str = proto.Field(
+        proto.STRING,
+        number=308135284,
+        optional=True,
+    )
+    ip_address: str = proto.Field(
+        proto.STRING,
+        number=406272220,
+        optional=True,
+    )
+
+
+class VpnGatewaysGetStatusResponse(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        result (google.cloud.compute_v1.types.VpnGatewayStatus):
+
+            This field is a member of `oneof`_ ``_result``.
+    """
+
+    result: "VpnGatewayStatus" = proto.Field(
+        proto.MESSAGE,
+        number=139315229,
+        optional=True,
+        message="VpnGatewayStatus",
+    )
+
+
+class VpnGatewaysScopedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        vpn_gateways (MutableSequence[google.cloud.compute_v1.types.VpnGateway]):
+            [Output Only] A list of VPN gateways contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning which replaces the list
+            of addresses when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    vpn_gateways: MutableSequence["VpnGateway"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=259177882,
+        message="VpnGateway",
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
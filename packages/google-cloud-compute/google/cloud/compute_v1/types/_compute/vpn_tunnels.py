@@ -0,0 +1,1081 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from typing import MutableMapping, MutableSequence
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._compute import shared_region_set_labels_request
+from google.cloud.compute_v1.types._compute import shared_warning
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListVpnTunnelsRequest",
+        "DeleteVpnTunnelRequest",
+        "GetVpnTunnelRequest",
+        "InsertVpnTunnelRequest",
+        "ListVpnTunnelsRequest",
+        "SetLabelsVpnTunnelRequest",
+        "VpnTunnel",
+        "VpnTunnelAggregatedList",
+        "VpnTunnelList",
+        "VpnTunnelsScopedList",
+    },
+)
+
+
+class AggregatedListVpnTunnelsRequest(proto.Message):
+    r"""A request message for VpnTunnels.AggregatedList. See the
+    method description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        service_project_number (int):
+
+            This field is a member of `oneof`_ ``_service_project_number``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    include_all_scopes: bool = proto.Field(
+        proto.BOOL,
+        number=391327988,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+    service_project_number: int = proto.Field(
+        proto.INT64,
+        number=316757497,
+        optional=True,
+    )
+
+
+class DeleteVpnTunnelRequest(proto.Message):
+    r"""A request message for VpnTunnels.Delete. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        vpn_tunnel (str):
+            Name of the VpnTunnel resource to delete.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    vpn_tunnel: str = proto.Field(
+        proto.STRING,
+        number=143821331,
+    )
+
+
+class GetVpnTunnelRequest(proto.Message):
+    r"""A request message for VpnTunnels.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        vpn_tunnel (str):
+            Name of the VpnTunnel resource to return.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    vpn_tunnel: str = proto.Field(
+        proto.STRING,
+        number=143821331,
+    )
+
+
+class InsertVpnTunnelRequest(proto.Message):
+    r"""A request message for VpnTunnels.Insert. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        vpn_tunnel_resource (google.cloud.compute_v1.types.VpnTunnel):
+            The body resource for this request
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    vpn_tunnel_resource: "VpnTunnel" = proto.Field(
+        proto.MESSAGE,
+        number=86839482,
+        message="VpnTunnel",
+    )
+
+
+class ListVpnTunnelsRequest(proto.Message):
+    r"""A request message for VpnTunnels.List. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. Most Compute resources support two types of filter
+            expressions: expressions that support regular expressions
+            and expressions that follow API improvement proposal
+            AIP-160. These two types of filter expressions cannot be
+            mixed in one request. If you want to use AIP-160, your
+            expression must specify the field name, an operator, and the
+            value that you want to use for filtering. The value must be
+            a string, a number, or a boolean. The operator must be
+            either ``=``, ``!=``, ``>``, ``<``, ``<=``, ``>=`` or ``:``.
+            For example, if you are filtering Compute Engine instances,
+            you can exclude instances named ``example-instance`` by
+            specifying ``name != example-instance``. The ``:*``
+            comparison can be used to test whether a key has been
+            defined. For example, to find all objects with ``owner``
+            label use: ``labels.owner:*`` You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+            If you want to use a regular expression, use the ``eq``
+            (equal) or ``ne`` (not equal) operator against a single
+            un-parenthesized expression with or without quotes or
+            against multiple parenthesized expressions. Examples:
+            ``fieldname eq unquoted literal``
+            ``fieldname eq 'single quoted literal'``
+            ``fieldname eq "double quoted literal"``
+            ``(fieldname1 eq literal) (fieldname2 ne "literal")`` The
+            literal value is interpreted as a regular expression using
+            Google RE2 library syntax. The literal value must match the
+            entire field. For example, to filter for instances that do
+            not end with name "instance", you would use
+            ``name ne .*instance``. You cannot combine constraints on
+            multiple fields using regular expressions.
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter: str = proto.Field(
+        proto.STRING,
+        number=336120696,
+        optional=True,
+    )
+    max_results: int = proto.Field(
+        proto.UINT32,
+        number=54715419,
+        optional=True,
+    )
+    order_by: str = proto.Field(
+        proto.STRING,
+        number=160562920,
+        optional=True,
+    )
+    page_token: str = proto.Field(
+        proto.STRING,
+        number=19994697,
+        optional=True,
+    )
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    return_partial_success: bool = proto.Field(
+        proto.BOOL,
+        number=517198390,
+        optional=True,
+    )
+
+
+class SetLabelsVpnTunnelRequest(proto.Message):
+    r"""A request message for VpnTunnels.SetLabels. See the method
+    description for details.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The region for this request.
+        region_set_labels_request_resource (google.cloud.compute_v1.types.RegionSetLabelsRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    project: str = proto.Field(
+        proto.STRING,
+        number=227560217,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+    )
+    region_set_labels_request_resource: shared_region_set_labels_request.RegionSetLabelsRequest = proto.Field(
+        proto.MESSAGE,
+        number=259357782,
+        message=shared_region_set_labels_request.RegionSetLabelsRequest,
+    )
+    request_id: str = proto.Field(
+        proto.STRING,
+        number=37109963,
+        optional=True,
+    )
+    resource: str = proto.Field(
+        proto.STRING,
+        number=195806222,
+    )
+
+
+class VpnTunnel(proto.Message):
+    r"""Represents a Cloud VPN Tunnel resource. For more information
+    about VPN, read the the Cloud VPN Overview.
+
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        detailed_status (str):
+            [Output Only] Detailed status message for the VPN tunnel.
+
+            This field is a member of `oneof`_ ``_detailed_status``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        ike_version (int):
+            IKE protocol version to use when establishing
+            the VPN tunnel with the peer VPN gateway.
+            Acceptable IKE versions are 1 or 2. The default
+            version is 2.
+
+            This field is a member of `oneof`_ ``_ike_version``.
+        kind (str):
+            [Output Only] Type of resource. Always compute#vpnTunnel for
+            VPN tunnels.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this VpnTunnel, which is essentially a hash of
+            the labels set used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update labels. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change labels, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make a get() request to
+            retrieve a VpnTunnel.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (MutableMapping[str, str]):
+            Labels for this resource. These can only be
+            added or modified by the setLabels method. Each
+            label key/value pair must comply with RFC1035.
+            Label values may be empty.
+        local_traffic_selector (MutableSequence[str]):
+            Local traffic selector to use when
+            establishing the VPN tunnel with the peer VPN
+            gateway. The value should be a CIDR formatted
+            string, for example: 192.168.0.0/16. The ranges
+            must be disjoint. Only IPv4 is supported.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        peer_external_gateway (str):
+            URL of the peer side external VPN gateway to
+            which this VPN tunnel is connected. Provided by
+            the client when the VPN tunnel is created. This
+            field is exclusive with the field
+            peerGcpGateway.
+
+            This field is a member of `oneof`_ ``_peer_external_gateway``.
+        peer_external_gateway_interface (int):
+            The interface ID of the external VPN gateway to which this
+            VPN tunnel is connected. Provided by the client when the VPN
+            tunnel is created. Possible values are: ``0``, ``1``, ``2``,
+            ``3``. The number of IDs in use depends on the external VPN
+            gateway redundancy type.
+
+            This field is a member of `oneof`_ ``_peer_external_gateway_interface``.
+        peer_gcp_gateway (str):
+            URL of the peer side HA VPN gateway to which
+            this VPN tunnel is connected. Provided by the
+            client when the VPN tunnel is created. This
+            field can be used when creating highly available
+            VPN from VPC network to VPC network, the field
+            is exclusive with the field peerExternalGateway.
+            If provided, the VPN tunnel will automatically
+            use the same vpnGatewayInterface ID in the peer
+            Google Cloud VPN gateway.
+
+            This field is a member of `oneof`_ ``_peer_gcp_gateway``.
+        peer_ip (str):
+            IP address of the peer VPN gateway. Only IPv4
+            is supported.
+
+            This field is a member of `oneof`_ ``_peer_ip``.
+        region (str):
+            [Output Only] URL of the region where the VPN tunnel
+            resides. You must specify this field as part of the HTTP
+            request URL. It is not settable as a field in the request
+            body.
+
+            This field is a member of `oneof`_ ``_region``.
+        remote_traffic_selector (MutableSequence[str]):
+            Remote traffic selectors to use when
+            establishing the VPN tunnel with the peer VPN
+            gateway. The value should be a CIDR formatted
+            string, for example: 192.168.0.0/16. The ranges
+            should be disjoint. Only IPv4 is supported.
+        router (str):
+            URL of the router resource to be used for
+            dynamic routing.
+
+            This field is a member of `oneof`_ ``_router``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        shared_secret (str):
+            Shared secret used to set the secure session
+            between the Cloud VPN gateway and the peer VPN
+            gateway.
+
+            This field is a member of `oneof`_ ``_shared_secret``.
+        shared_secret_hash (str):
+            Hash of the shared secret.
+
+            This field is a member of `oneof`_ ``_shared_secret_hash``.
+        status (str):
+            [Output Only] The status of the VPN tunnel, which can be one
+            of the following: - PROVISIONING: Resource is being
+            allocated for the VPN tunnel. - WAITING_FOR_FULL_CONFIG:
+            Waiting to receive all VPN-related configs from the user.
+            Network, TargetVpnGateway, VpnTunnel, ForwardingRule, and
+            Route resources are needed to setup the VPN tunnel. -
+            FIRST_HANDSHAKE: Successful first handshake with the peer
+            VPN. - ESTABLISHED: Secure session is successfully
+            established with the peer VPN. - NETWORK_ERROR: Deprecated,
+            replaced by NO_INCOMING_PACKETS - AUTHORIZATION_ERROR: Auth
+            error (for example, bad shared secret). -
+            NEGOTIATION_FAILURE: Handshake failed. - DEPROVISIONING:
+            Resources are being deallocated for the VPN tunnel. -
+            FAILED: Tunnel creation has failed and the tunnel is not
+            ready to be used. - NO_INCOMING_PACKETS: No incoming packets
+            from peer. - REJECTED: Tunnel configuration was rejected,
+            can be result of being denied access. -
+            ALLOCATING_RESOURCES: Cloud VPN is in the process of
+            allocating all required resources. - STOPPED: Tunnel is
+            stopped due to its Forwarding Rules being deleted for
+            Classic VPN tunnels or the project is in frozen state. -
+            PEER_IDENTITY_MISMATCH: Peer identity does not match peer
+            IP, probably behind NAT. - TS_NARROWING_NOT_ALLOWED: Traffic
+            selector narrowing not allowed for an HA-VPN tunnel. Check
+            the Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        target_vpn_gateway (str):
+            URL of the Target VPN gateway with which this
+            VPN tunnel is associated. Provided by the client
+            when the VPN tunnel is created.
+
+            This field is a member of `oneof`_ ``_target_vpn_gateway``.
+        vpn_gateway (str):
+            URL of the VPN gateway with which this VPN tunnel is
+            associated. Provided by the client when the VPN tunnel is
+            created. This must be used (instead of target_vpn_gateway)
+            if a High Availability VPN gateway resource is created.
+
+            This field is a member of `oneof`_ ``_vpn_gateway``.
+        vpn_gateway_interface (int):
+            The interface ID of the VPN gateway with which this VPN
+            tunnel is associated. Possible values are: ``0``, ``1``.
+
+            This field is a member of `oneof`_ ``_vpn_gateway_interface``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the VPN tunnel, which can be one of the
+        following: - PROVISIONING: Resource is being allocated for the VPN
+        tunnel. - WAITING_FOR_FULL_CONFIG: Waiting to receive all
+        VPN-related configs from the user. Network, TargetVpnGateway,
+        VpnTunnel, ForwardingRule, and Route resources are needed to setup
+        the VPN tunnel. - FIRST_HANDSHAKE: Successful first handshake with
+        the peer VPN. - ESTABLISHED: Secure session is successfully
+        established with the peer VPN. - NETWORK_ERROR: Deprecated, replaced
+        by NO_INCOMING_PACKETS - AUTHORIZATION_ERROR: Auth error (for
+        example, bad shared secret). - NEGOTIATION_FAILURE: Handshake
+        failed. - DEPROVISIONING: Resources are being deallocated for the
+        VPN tunnel. - FAILED: Tunnel creation has failed and the tunnel is
+        not ready to be used. - NO_INCOMING_PACKETS: No incoming packets
+        from peer. - REJECTED: Tunnel configuration was rejected, can be
+        result of being denied access. - ALLOCATING_RESOURCES: Cloud VPN is
+        in the process of allocating all required resources. - STOPPED:
+        Tunnel is stopped due to its Forwarding Rules being deleted for
+        Classic VPN tunnels or the project is in frozen state. -
+        PEER_IDENTITY_MISMATCH: Peer identity does not match peer IP,
+        probably behind NAT. - TS_NARROWING_NOT_ALLOWED: Traffic selector
+        narrowing not allowed for an HA-VPN tunnel.
+
+        Values:
+            UNDEFINED_STATUS (0):
+                A value indicating that the enum field is not
+                set.
+            ALLOCATING_RESOURCES (320922816):
+                Cloud VPN is in the process of allocating all
+                required resources (specifically, a borg task).
+            AUTHORIZATION_ERROR (23580290):
+                Auth error (e.g. bad shared secret).
+            DEPROVISIONING (428935662):
+                Resources is being deallocated for the VPN
+                tunnel.
+            ESTABLISHED (88852344):
+                Secure session is successfully established
+                with peer VPN.
+            FAILED (455706685):
+                Tunnel creation has failed and the tunnel is
+                not ready to be used.
+            FIRST_HANDSHAKE (191393000):
+                Successful first handshake with peer VPN.
+            NEGOTIATION_FAILURE (360325868):
+                Handshake failed.
+            NETWORK_ERROR (193912951):
+                Deprecated, replaced by NO_INCOMING_PACKETS
+            NO_INCOMING_PACKETS (119983216):
+                No incoming packets from peer
+            PROVISIONING (290896621):
+                Resource is being allocated for the VPN
+                tunnel.
+            REJECTED (174130302):
+                Tunnel configuration was rejected, can be
+                result of being denylisted.
+            STOPPED (444276141):
+                Tunnel is stopped due to its Forwarding Rules
+                being deleted.
+            WAITING_FOR_FULL_CONFIG (41640522):
+                Waiting to receive all VPN-related configs
+                from user. Network, TargetVpnGateway, VpnTunnel,
+                ForwardingRule and Route resources are needed to
+                setup VPN tunnel.
+        """
+        UNDEFINED_STATUS = 0
+        ALLOCATING_RESOURCES = 320922816
+        AUTHORIZATION_ERROR = 23580290
+        DEPROVISIONING = 428935662
+        ESTABLISHED = 88852344
+        FAILED = 455706685
+        FIRST_HANDSHAKE = 191393000
+        NEGOTIATION_FAILURE = 360325868
+        NETWORK_ERROR = 193912951
+        NO_INCOMING_PACKETS = 119983216
+        PROVISIONING = 290896621
+        REJECTED = 174130302
+        STOPPED = 444276141
+        WAITING_FOR_FULL_CONFIG = 41640522
+
+    creation_timestamp: str = proto.Field(
+        proto.STRING,
+        number=30525366,
+        optional=True,
+    )
+    description: str = proto.Field(
+        proto.STRING,
+        number=422937596,
+        optional=True,
+    )
+    detailed_status: str = proto.Field(
+        proto.STRING,
+        number=333501025,
+        optional=True,
+    )
+    id: int = proto.Field(
+        proto.UINT64,
+        number=3355,
+        optional=True,
+    )
+    ike_version: int = proto.Field(
+        proto.INT32,
+        number=218376220,
+        optional=True,
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    label_fingerprint: str = proto.Field(
+        proto.STRING,
+        number=178124825,
+        optional=True,
+    )
+    labels: MutableMapping[str, str] = proto.MapField(
+        proto.STRING,
+        proto.STRING,
+        number=500195327,
+    )
+    local_traffic_selector: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=317314613,
+    )
+    name: str = proto.Field(
+        proto.STRING,
+        number=3373707,
+        optional=True,
+    )
+    peer_external_gateway: str = proto.Field(
+        proto.STRING,
+        number=384956173,
+        optional=True,
+    )
+    peer_external_gateway_interface: int = proto.Field(
+        proto.INT32,
+        number=452768391,
+        optional=True,
+    )
+    peer_gcp_gateway: str = proto.Field(
+        proto.STRING,
+        number=281867452,
+        optional=True,
+    )
+    peer_ip: str = proto.Field(
+        proto.STRING,
+        number=383249700,
+        optional=True,
+    )
+    region: str = proto.Field(
+        proto.STRING,
+        number=138946292,
+        optional=True,
+    )
+    remote_traffic_selector: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=358887098,
+    )
+    router: str = proto.Field(
+        proto.STRING,
+        number=148608841,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    shared_secret: str = proto.Field(
+        proto.STRING,
+        number=381932490,
+        optional=True,
+    )
+    shared_secret_hash: str = proto.Field(
+        proto.STRING,
+        number=398881891,
+        optional=True,
+    )
+    status: str = proto.Field(
+        proto.STRING,
+        number=181260274,
+        optional=True,
+    )
+    target_vpn_gateway: str = proto.Field(
+        proto.STRING,
+        number=532512843,
+        optional=True,
+    )
+    vpn_gateway: str = proto.Field(
+        proto.STRING,
+        number=406684153,
+        optional=True,
+    )
+    vpn_gateway_interface: int = proto.Field(
+        proto.INT32,
+        number=95979123,
+        optional=True,
+    )
+
+
+class VpnTunnelAggregatedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableMapping[str, google.cloud.compute_v1.types.VpnTunnelsScopedList]):
+            A list of VpnTunnelsScopedList resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#vpnTunnel for
+            VPN tunnels.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (MutableSequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableMapping[str, "VpnTunnelsScopedList"] = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="VpnTunnelsScopedList",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    unreachables: MutableSequence[str] = proto.RepeatedField(
+        proto.STRING,
+        number=243372063,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class VpnTunnelList(proto.Message):
+    r"""Contains a list of VpnTunnel resources.
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (MutableSequence[google.cloud.compute_v1.types.VpnTunnel]):
+            A list of VpnTunnel resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#vpnTunnel for
+            VPN tunnels.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id: str = proto.Field(
+        proto.STRING,
+        number=3355,
+        optional=True,
+    )
+    items: MutableSequence["VpnTunnel"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=100526016,
+        message="VpnTunnel",
+    )
+    kind: str = proto.Field(
+        proto.STRING,
+        number=3292052,
+        optional=True,
+    )
+    next_page_token: str = proto.Field(
+        proto.STRING,
+        number=79797525,
+        optional=True,
+    )
+    self_link: str = proto.Field(
+        proto.STRING,
+        number=456214797,
+        optional=True,
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+class VpnTunnelsScopedList(proto.Message):
+    r"""
+
+    .. _oneof: https://proto-plus-python.readthedocs.io/en/stable/fields.html#oneofs-mutually-exclusive-fields
+
+    Attributes:
+        vpn_tunnels (MutableSequence[google.cloud.compute_v1.types.VpnTunnel]):
+            A list of VPN tunnels contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            Informational warning which replaces the list
+            of addresses when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    vpn_tunnels: MutableSequence["VpnTunnel"] = proto.RepeatedField(
+        proto.MESSAGE,
+        number=163494080,
+        message="VpnTunnel",
+    )
+    warning: shared_warning.Warning = proto.Field(
+        proto.MESSAGE,
+        number=50704284,
+        optional=True,
+        message=shared_warning.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
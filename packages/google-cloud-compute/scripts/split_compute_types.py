@@ -0,0 +1,306 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Shard the generated ``compute_v1/types/compute.py`` by service.
+
+The generator emits every Compute message into a single module, so touching
+any of them builds all of the proto-plus classes and their descriptors.
+This script moves each message into a shard under ``types/_compute`` and
+rewrites ``types/compute.py`` (and ``types/__init__.py``) into facades that
+import shards on first attribute access.
+
+Messages are grouped by the exact set of services that can reach them. A
+message reached only from ``instances`` lands in ``_compute/instances.py``;
+a message reached from several services lands in a ``shared_*`` shard.
+Because a message can only reference messages reachable from a superset
+of its own services, shard imports always form a DAG, and loading one
+client only builds the messages that client can actually return or accept.
+
+Run this after regenerating the library::
+
+    python scripts/split_compute_types.py
+"""
+
+import argparse
+import collections
+import pathlib
+import re
+from typing import Dict, FrozenSet, List, Set
+
+PACKAGE = "google.cloud.compute_v1.types._compute"
+
+LICENSE = """# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+
+_CLASS_RE = re.compile(r"^(?=class \w+\(\s*proto\.(?:Message|Enum)\s*\):)", re.M)
+_MESSAGE_REF_RE = re.compile(r'message="(\w+)"')
+_ANNOTATION_REF_RE = re.compile(
+    r'(: (?:MutableSequence\[|MutableMapping\[str, )?)"(\w+)"(\]? =)'
+)
+
+
+def snake_case(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", name).lower()
+
+
+def parse_classes(source: str) -> Dict[str, str]:
+    body = source.split("__all__ = tuple(sorted(__protobuf__.manifest))")[0]
+    chunks = _CLASS_RE.split(body)[1:]
+    if not chunks:
+        raise SystemExit(
+            "compute.py does not look like generated output; nothing to do"
+        )
+    classes = collections.OrderedDict()
+    for chunk in chunks:
+        name = re.match(r"class (\w+)", chunk).group(1)
+        classes[name] = chunk.rstrip("\n") + "\n"
+    return classes
+
+
+def service_roots(services_dir: pathlib.Path, names: Set[str]) -> Dict[str, Set[str]]:
+    roots = {}
+    for service in sorted(p for p in services_dir.iterdir() if p.is_dir()):
+        if service.name.startswith("__"):
+            continue
+        referenced = set()
+        for path in service.rglob("*.py"):
+            referenced |= set(re.findall(r"\bcompute\.(\w+)", path.read_text()))
+        roots[service.name] = referenced & names
+    return roots
+
+
+def assign_shards(classes: Dict[str, str], roots: Dict[str, Set[str]]):
+    deps = {name: set(_MESSAGE_REF_RE.findall(body)) for name, body in classes.items()}
+    reach: Dict[str, Set[str]] = collections.defaultdict(set)
+    for service, names in roots.items():
+        stack, seen = list(names), set()
+        while stack:
+            name = stack.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            reach[name].add(service)
+            stack.extend(deps[name])
+
+    groups: Dict[FrozenSet[str], List[str]] = collections.defaultdict(list)
+    for name in classes:
+        # Messages no service references are kept together in one shard.
+        groups[frozenset(reach[name]) or frozenset({"_unreferenced"})].append(name)
+
+    in_degree = collections.Counter(d for ds in deps.values() for d in ds)
+    shard_of = {}
+    for services, names in groups.items():
+        if len(services) == 1:
+            (shard,) = services
+            shard = shard.lstrip("_")
+        else:
+            anchor = min(names, key=lambda n: (-in_degree[n], n))
+            shard = "shared_" + snake_case(anchor)
+        for name in names:
+            shard_of[name] = shard
+    return shard_of, deps
+
+
+def render_shard(shard: str, names: List[str], classes, shard_of) -> str:
+    imported = set()
+    # A field named like an imported shard would shadow it inside the class
+    # body, so such shards are imported under an alias.
+    field_names = set(
+        re.findall(r"^    (\w+):", "".join(classes[n] for n in names), re.M)
+    )
+
+    def alias(module):
+        return f"gcc_{module}" if module in field_names else module
+
+    def qualify(name):
+        if shard_of[name] == shard:
+            return None
+        imported.add(shard_of[name])
+        return f"{alias(shard_of[name])}.{name}"
+
+    bodies = []
+    for name in names:
+        body = classes[name]
+        body = _MESSAGE_REF_RE.sub(
+            lambda m: f"message={qualify(m.group(1))}"
+            if qualify(m.group(1))
+            else m.group(0),
+            body,
+        )
+        body = _ANNOTATION_REF_RE.sub(
+            lambda m: f"{m.group(1)}{qualify(m.group(2))}{m.group(3)}"
+            if qualify(m.group(2))
+            else m.group(0),
+            body,
+        )
+        bodies.append(body)
+    text = "\n\n".join(bodies)
+
+    typing_names = [t for t in ("MutableMapping", "MutableSequence") if t in text]
+    lines = [LICENSE + "from __future__ import annotations", ""]
+    if typing_names:
+        lines += [f"from typing import {', '.join(typing_names)}", ""]
+    if "any_pb2." in text:
+        lines.append("from google.protobuf import any_pb2  # type: ignore")
+    lines.append("import proto  # type: ignore")
+    lines.append("")
+    for module in sorted(imported):
+        suffix = f" as {alias(module)}" if alias(module) != module else ""
+        lines.append(f"from {PACKAGE} import {module}{suffix}")
+    if imported:
+        lines.append("")
+    lines.append("__protobuf__ = proto.module(")
+    lines.append('    package="google.cloud.compute.v1",')
+    lines.append("    manifest={")
+    lines += [f'        "{name}",' for name in names]
+    lines += ["    },", ")", "", ""]
+    return (
+        "\n".join(lines) + text + "\n\n__all__ = tuple(sorted(__protobuf__.manifest))\n"
+    )
+
+
+def render_facade(shard_of: Dict[str, str]) -> str:
+    star_imports = "\n".join(
+        f"    from {PACKAGE}.{shard} import *  # noqa: F401,F403"
+        for shard in sorted(set(shard_of.values()))
+    )
+    mapping = "\n".join(
+        f'    "{name}": "{shard}",' for name, shard in sorted(shard_of.items())
+    )
+    return f'''{LICENSE}"""Compute message types.
+
+The messages are defined in per-service shards under ``_compute`` and are
+imported on first attribute access, so a process that only uses one client
+builds only the messages that client references.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: NO COVER
+{star_imports}
+
+# Maps each message to the ``_compute`` shard that defines it.
+_SHARDS = {{
+{mapping}
+}}
+
+__all__ = tuple(sorted(_SHARDS))
+
+
+def __getattr__(name):
+    try:
+        shard = _SHARDS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {{__name__!r}} has no attribute {{name!r}}"
+        ) from None
+    value = getattr(importlib.import_module(f"{PACKAGE}.{{shard}}"), name)
+    # Cache the resolved class so later lookups bypass this hook.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+'''
+
+
+def render_types_init(init_source: str) -> str:
+    head, rest = init_source.split("from .compute import (", 1)
+    names_block, all_block = rest.split("__all__ = (", 1)
+    names_block = names_block.strip().rstrip(")").rstrip()
+    imports = "\n".join(
+        "    " + line if line else line
+        for line in ("from .compute import (\n" + names_block + "\n)").splitlines()
+    )
+    return (
+        head
+        + "import importlib\nfrom typing import TYPE_CHECKING\n\n"
+        + "if TYPE_CHECKING:  # pragma: NO COVER\n"
+        + imports
+        + "\n\n__all__ = ("
+        + all_block.rstrip("\n")
+        + "\n\n"
+        + """
+def __getattr__(name):
+    if name in ("compute", "_compute"):
+        return importlib.import_module(f".{name}", __name__)
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".compute", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+"""
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--package-dir",
+        type=pathlib.Path,
+        default=pathlib.Path(__file__).resolve().parent.parent
+        / "google"
+        / "cloud"
+        / "compute_v1",
+    )
+    args = parser.parse_args()
+
+    types_dir = args.package_dir / "types"
+    classes = parse_classes((types_dir / "compute.py").read_text())
+    roots = service_roots(args.package_dir / "services", set(classes))
+    shard_of, _ = assign_shards(classes, roots)
+
+    shard_dir = types_dir / "_compute"
+    shard_dir.mkdir(exist_ok=True)
+    for stale in shard_dir.glob("*.py"):
+        stale.unlink()
+    (shard_dir / "__init__.py").write_text(LICENSE)
+
+    by_shard = collections.defaultdict(list)
+    for name, shard in shard_of.items():
+        by_shard[shard].append(name)
+    for shard, names in by_shard.items():
+        (shard_dir / f"{shard}.py").write_text(
+            render_shard(shard, names, classes, shard_of)
+        )
+
+    (types_dir / "compute.py").write_text(render_facade(shard_of))
+    init = types_dir / "__init__.py"
+    init.write_text(render_types_init(init.read_text()))
+    print(f"Wrote {len(classes)} messages into {len(by_shard)} shards.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Threaded throughput of one shared REST transport, by pool settings.
+
+``--threads`` threads share one ``InstancesClient`` and call
+``instances.get`` against a local HTTP/1.1 stub for ``--duration`` seconds.
+The stub runs in a separate process, answers after ``--latency`` seconds
+and counts the TCP connections it accepts. It also waits ``--handshake``
+seconds before serving a new connection, standing in for the TLS handshake
+a real endpoint requires. With the ``requests`` default of 10
+connections per host, the threads beyond the tenth open (and discard) a
+connection per call; a pool sized to the thread count keeps reusing the
+same connections.
+
+Usage::
+
+    python -m tests.benchmark.bench_http_pool [--threads 64] [--handshake 0.05]
+"""
+
+import argparse
+from concurrent import futures
+import http.server
+import json
+import multiprocessing
+import time
+
+from google.auth import credentials as ga_credentials
+
+from google.cloud.compute_helpers import http_pool
+from google.cloud.compute_v1.services.instances import InstancesClient, transports
+
+
+def _serve(ports, connections, latency, handshake):
+    body = json.dumps({"name": "vm", "status": "RUNNING"}).encode("utf-8")
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with connections.get_lock():
+                connections.value += 1
+            time.sleep(handshake)
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("localhost", 0), Handler)
+    server.daemon_threads = True
+    server.request_queue_size = 1024
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+def measure(port, connections, options, threads, duration):
+    client = InstancesClient(
+        transport=transports.InstancesRestTransport(
+            host="localhost:{}".format(port),
+            url_scheme="http",
+            credentials=ga_credentials.AnonymousCredentials(),
+            http_pool_options=options,
+        )
+    )
+    with connections.get_lock():
+        connections.value = 0
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        count = 0
+        while time.perf_counter() < deadline:
+            client.get(project="p", zone="z", instance="vm")
+            count += 1
+        return count
+
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=threads) as pool:
+        calls = sum(pool.map(lambda _: worker(), range(threads)))
+    elapsed = time.perf_counter() - start
+    client.transport.close()
+    return calls / elapsed, connections.value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--handshake", type=float, default=0.05)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    ports = multiprocessing.Queue()
+    connections = multiprocessing.Value("i", 0)
+    server = multiprocessing.Process(
+        target=_serve,
+        args=(ports, connections, args.latency, args.handshake),
+        daemon=True,
+    )
+    server.start()
+    port = ports.get(timeout=30)
+    configurations = [
+        ("requests defaults", None),
+        (
+            "pool_maxsize={}".format(args.threads),
+            http_pool.HttpPoolOptions(pool_maxsize=args.threads),
+        ),
+        (
+            "pool_maxsize={}, keep-alive".format(args.threads),
+            http_pool.HttpPoolOptions(pool_maxsize=args.threads, tcp_keepalive=30),
+        ),
+    ]
+    try:
+        print(f"{'configuration':<30}{'calls/s':>10}{'connections':>14}")
+        for name, options in configurations:
+            rate, opened = measure(
+                port, connections, options, args.threads, args.duration
+            )
+            print(f"{name:<30}{rate:>10.0f}{opened:>14}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
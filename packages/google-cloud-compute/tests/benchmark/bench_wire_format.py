@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Bytes on the wire and decode time of JSON vs binary protobuf responses.
+
+Builds a synthetic ``InstanceAggregatedList`` page and measures, for each
+wire format, the response size and the CPU spent turning it into a
+``compute.InstanceAggregatedList``: the bare decode, and a full
+``aggregated_list`` call through ``InstancesRestTransport`` with the HTTP
+session stubbed out.
+
+Usage::
+
+    python -m tests.benchmark.bench_wire_format [--zones N] [--instances N]
+"""
+
+import argparse
+import json
+import time
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+from google.protobuf import json_format
+from requests import Response
+
+from google.cloud.compute_helpers import wire
+from google.cloud.compute_v1.services.instances import transports
+from google.cloud.compute_v1.types import compute
+
+
+def build_page(zones, instances_per_zone):
+    items = {}
+    for z in range(zones):
+        zone = f"us-central{z}-a"
+        items[f"zones/{zone}"] = compute.InstancesScopedList(
+            instances=[
+                compute.Instance(
+                    id=10**12 + z * instances_per_zone + i,
+                    name=f"instance-{z}-{i}",
+                    zone=f"https://www.googleapis.com/compute/v1/projects/p/zones/{zone}",
+                    machine_type="zones/us-central1-a/machineTypes/n2-standard-8",
+                    status="RUNNING",
+                    labels={"env": "prod", "team": "infra", "tier": str(i % 3)},
+                    network_interfaces=[
+                        compute.NetworkInterface(
+                            network="global/networks/default",
+                            network_i_p=f"10.{z}.{i // 256}.{i % 256}",
+                            access_configs=[
+                                compute.AccessConfig(
+                                    name="External NAT", type_="ONE_TO_ONE_NAT"
+                                )
+                            ],
+                        )
+                    ],
+                    disks=[
+                        compute.AttachedDisk(
+                            boot=True,
+                            auto_delete=True,
+                            device_name="persistent-disk-0",
+                            disk_size_gb=100,
+                            source=f"zones/{zone}/disks/instance-{z}-{i}",
+                        )
+                    ],
+                )
+                for i in range(instances_per_zone)
+            ]
+        )
+    return compute.InstanceAggregatedList(
+        id="projects/p/aggregated/instances",
+        items=items,
+        next_page_token="next",
+    )
+
+
+def per_call_ms(fn, number):
+    start = time.process_time()
+    for _ in range(number):
+        fn()
+    return (time.process_time() - start) / number * 1e3
+
+
+def encoded_pages(page):
+    pb_page = compute.InstanceAggregatedList.pb(page)
+    # Servers send compact JSON; MessageToJson pretty-prints.
+    as_json = json.dumps(json_format.MessageToDict(pb_page)).encode("utf-8")
+    return {
+        wire.JSON: (as_json, "application/json; charset=UTF-8"),
+        wire.PROTO: (pb_page.SerializeToString(), "application/x-protobuf"),
+    }
+
+
+def bench(page, number):
+    rows = []
+    for wire_format, (content, content_type) in encoded_pages(page).items():
+        response = Response()
+        response.status_code = 200
+        response._content = content
+        response.headers["Content-Type"] = content_type
+
+        def decode():
+            wire.WireCodec.parse(
+                response,
+                compute.InstanceAggregatedList.pb(compute.InstanceAggregatedList()),
+            )
+
+        transport = transports.InstancesRestTransport(
+            credentials=ga_credentials.AnonymousCredentials(),
+            wire_format=wire_format,
+        )
+        request = compute.AggregatedListInstancesRequest(project="p")
+        with mock.patch.object(type(transport._session), "request") as req:
+            req.return_value = response
+            result = transport.aggregated_list(request)
+            assert result == page
+            call_ms = per_call_ms(lambda: transport.aggregated_list(request), number)
+        rows.append((wire_format, len(content), per_call_ms(decode, number), call_ms))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zones", type=int, default=20)
+    parser.add_argument("--instances", type=int, default=100)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    page = build_page(args.zones, args.instances)
+    print(f"{args.zones * args.instances} instances in {args.zones} zones")
+    print(f"{'format':<8}{'bytes':>12}{'decode ms':>12}{'call ms':>12}")
+    for wire_format, size, decode_ms, call_ms in bench(page, args.number):
+        print(f"{wire_format:<8}{size:>12}{decode_ms:>12.2f}{call_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A fake Compute Engine server shared by the tests of the helper modules."""
+
+import threading
+import time
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+from google.protobuf import json_format
+import pytest
+from requests import Request, Response
+from requests.sessions import Session
+
+from google.cloud.compute_v1.types import compute
+
+
+class FakeServer:
+    """Answers REST requests in place of Compute Engine, recording them.
+
+    Requests are answered with the next of ``responses``, then with
+    ``response``; each is a message, sent as JSON with status 200, or a
+    status code, sent with an empty body. Each request takes the next of
+    ``delays`` seconds, then ``delay``.
+    """
+
+    def __init__(self):
+        self.responses = []
+        self.response = compute.Zone(name="us-central1-a")
+        self.delays = []
+        self.delay = 0.0
+        self.lock = threading.Lock()
+        # The keyword arguments of each request, such as its headers.
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, method, url, **kwargs):
+        with self.lock:
+            self.requests.append(kwargs)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            answer = self.responses.pop(0) if self.responses else self.response
+            delay = self.delays.pop(0) if self.delays else self.delay
+        time.sleep(delay)
+        with self.lock:
+            self.in_flight -= 1
+        response = Response()
+        response.request = Request(method, url).prepare()
+        if isinstance(answer, int):
+            response.status_code = answer
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = json_format.MessageToJson(
+                type(answer).pb(answer)
+            ).encode()
+        return response
+
+
+@pytest.fixture
+def server():
+    server = FakeServer()
+    with mock.patch.object(Session, "request", side_effect=server):
+        yield server
+
+
+@pytest.fixture
+def rest_client():
+    """Return a function that makes clients with the hooks it is given.
+
+    Its keyword arguments are passed to the client's REST transport.
+    """
+
+    def make(client_class, *hooks, **kwargs):
+        kwargs.setdefault("credentials", ga_credentials.AnonymousCredentials())
+        transport = client_class.get_transport_class("rest")(**kwargs)
+        for hook in hooks:
+            hook.attach(transport)
+        return client_class(transport=transport)
+
+    return make
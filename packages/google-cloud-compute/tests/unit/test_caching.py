@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.compute_helpers import caching
+from google.cloud.compute_v1.services.zones import ZonesClient
+from google.cloud.compute_v1.types import compute
+
+_ZONE = "us-central1-a"
+# Compute Engine methods have no default retry, so none is cached unless
+# named.
+_TTLS = {"get": 60.0}
+
+
+def _credentials(caller):
+    credentials = ga_credentials.AnonymousCredentials()
+    credentials.service_account_email = caller
+    return credentials
+
+
+def test_repeated_call_is_answered_from_cache(server, rest_client):
+    cache = caching.ResponseCache(ttls=_TTLS)
+    client = rest_client(ZonesClient, cache)
+
+    first = client.get(project="p", zone=_ZONE)
+    second = client.get(project="p", zone=_ZONE)
+    client.get(project="p", zone="us-central1-b")
+
+    assert first == second
+    assert second.name == _ZONE
+    assert len(server.requests) == 2
+    assert cache.stats() == {"get": {"hits": 1, "misses": 2, "negative_hits": 0}}
+
+
+@pytest.mark.parametrize("ttls,requests", [({}, 2), (_TTLS, 1)])
+def test_methods_without_retry_cached_only_when_named(
+    ttls, requests, server, rest_client
+):
+    client = rest_client(ZonesClient, caching.ResponseCache(ttls=ttls))
+
+    for _ in range(2):
+        client.get(project="p", zone=_ZONE)
+
+    assert len(server.requests) == requests
+
+
+def test_not_found_cached_for_negative_ttl(server, rest_client):
+    cache = caching.ResponseCache(ttls=_TTLS, negative_ttl=10.0)
+    server.response = 404
+    client = rest_client(ZonesClient, cache)
+
+    for _ in range(2):
+        with pytest.raises(core_exceptions.NotFound):
+            client.get(project="p", zone=_ZONE)
+
+    assert len(server.requests) == 1
+
+
+def test_transports_of_other_callers_do_not_share(server, rest_client):
+    cache = caching.ResponseCache(ttls=_TTLS)
+    client = rest_client(
+        ZonesClient, cache, credentials=_credentials("a@p.iam.gserviceaccount.com")
+    )
+    other_client = rest_client(
+        ZonesClient, cache, credentials=_credentials("b@p.iam.gserviceaccount.com")
+    )
+
+    client.get(project="p", zone=_ZONE)
+    other_client.get(project="p", zone=_ZONE)
+    client.get(project="p", zone=_ZONE)
+
+    assert len(server.requests) == 2
+
+
+def test_invalidate(server, rest_client):
+    cache = caching.ResponseCache(ttls=_TTLS)
+    client = rest_client(ZonesClient, cache)
+
+    client.get(project="p", zone=_ZONE)
+    cache.invalidate("get", compute.GetZoneRequest(project="p", zone=_ZONE))
+    client.get(project="p", zone=_ZONE)
+
+    assert len(server.requests) == 2
+
+
+def test_disk_entries_decoded_as_service_types(tmp_path, server, rest_client):
+    path = str(tmp_path / "cache.sqlite")
+    credentials = _credentials("a@p.iam.gserviceaccount.com")
+    rest_client(
+        ZonesClient,
+        caching.ResponseCache(caching.DiskBackend(path), ttls=_TTLS),
+        credentials=credentials,
+    ).get(project="p", zone=_ZONE)
+
+    # A new cache on the same file, as after a restart.
+    cache = caching.ResponseCache(caching.DiskBackend(path), ttls=_TTLS)
+    client = rest_client(ZonesClient, cache, credentials=credentials)
+    response = client.get(project="p", zone=_ZONE)
+
+    assert isinstance(response, compute.Zone)
+    assert response.name == _ZONE
+    assert len(server.requests) == 1
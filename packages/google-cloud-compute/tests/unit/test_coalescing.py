@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from concurrent import futures
+
+from google.cloud.compute_helpers import coalescing
+from google.cloud.compute_v1.services.zones import ZonesClient
+
+
+def _get_concurrently(client, calls):
+    with futures.ThreadPoolExecutor(max_workers=calls) as pool:
+        results = [
+            pool.submit(client.get, project="p", zone="us-central1-a")
+            for _ in range(calls)
+        ]
+    assert [r.result().name for r in results] == ["us-central1-a"] * calls
+
+
+def test_named_method_is_coalesced(server, rest_client):
+    coalescer = coalescing.Coalescer(methods=["get"])
+    server.delay = 0.1
+
+    _get_concurrently(rest_client(ZonesClient, coalescer), 4)
+
+    assert len(server.requests) == 1
+    assert (coalescer.calls, coalescer.coalesced) == (1, 3)
+
+
+def test_methods_without_retry_are_not_coalesced_by_default(server, rest_client):
+    coalescer = coalescing.Coalescer()
+    server.delay = 0.1
+
+    _get_concurrently(rest_client(ZonesClient, coalescer), 2)
+
+    assert len(server.requests) == 2
+    assert coalescer.calls == 0
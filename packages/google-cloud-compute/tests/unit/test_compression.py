@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import gzip
+import json
+
+from google.cloud.compute_helpers import compression
+from google.cloud.compute_v1.services.instances import InstancesClient
+from google.cloud.compute_v1.types import compute
+
+_INSTANCE = compute.Instance(
+    name="vm-1", labels={"label-{}".format(i): "value" for i in range(100)}
+)
+
+
+def _client(rest_client, server, **kwargs):
+    server.response = compute.Operation(name="op", status=compute.Operation.Status.DONE)
+    return rest_client(
+        InstancesClient, compression.Compression(methods=["insert"]), **kwargs
+    )
+
+
+def test_insert_body_is_compressed(server, rest_client):
+    client = _client(rest_client, server)
+
+    client.insert(project="p", zone="z", instance_resource=_INSTANCE)
+
+    kwargs = server.requests[-1]
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"]))["name"] == "vm-1"
+
+
+def test_proto_body_is_compressed(server, rest_client):
+    client = _client(rest_client, server, wire_format="proto")
+
+    client.insert(project="p", zone="z", instance_resource=_INSTANCE)
+
+    kwargs = server.requests[-1]
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    instance = compute.Instance.deserialize(gzip.decompress(kwargs["data"]))
+    assert instance == _INSTANCE
+
+
+def test_other_methods_are_not_compressed(server, rest_client):
+    client = _client(rest_client, server)
+
+    client.update(project="p", zone="z", instance="vm-1", instance_resource=_INSTANCE)
+
+    assert "Content-Encoding" not in server.requests[-1]["headers"]
+
+
+def test_proto_rejection_keeps_compression(server, rest_client):
+    client = _client(rest_client, server, wire_format="proto")
+    server.responses = [415, 415]
+
+    client.insert(project="p", zone="z", instance_resource=_INSTANCE)
+
+    sent = [
+        (kwargs["headers"].get("Content-Encoding"), kwargs["headers"]["Content-Type"])
+        for kwargs in server.requests
+    ]
+    assert sent == [
+        ("gzip", "application/x-protobuf"),
+        (None, "application/x-protobuf"),
+        ("gzip", "application/json"),
+    ]
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.cloud.compute_v1.services.zones import ZonesClient
+from google.cloud.compute_v1.types import compute
+
+
+def _requests(count):
+    return [
+        compute.GetZoneRequest(project="p", zone="z{}".format(i)) for i in range(count)
+    ]
+
+
+def test_ordered_results_capture_errors(server, rest_client):
+    server.responses = [compute.Zone(name="z0"), 404, compute.Zone(name="z2")]
+    client = rest_client(ZonesClient)
+
+    results = list(client.batch_call("get", _requests(3), max_concurrency=1))
+
+    assert [
+        (r.index, r.response.name if r.exception is None else type(r.exception))
+        for r in results
+    ] == [(0, "z0"), (1, core_exceptions.NotFound), (2, "z2")]
+
+
+def test_concurrency_bounded(server, rest_client):
+    server.delay = 0.02
+    client = rest_client(ZonesClient)
+
+    results = list(client.batch_call("get", _requests(12), max_concurrency=3))
+
+    assert [r.index for r in results] == list(range(12))
+    assert server.max_in_flight <= 3
+
+
+def test_unknown_method_rejected(rest_client):
+    with pytest.raises(ValueError):
+        rest_client(ZonesClient).batch_call("no_such_method", [])
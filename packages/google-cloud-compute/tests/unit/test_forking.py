@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+from requests import Response
+from requests.sessions import Session
+
+from google.cloud.compute_helpers import forking
+from google.cloud.compute_v1.services.zones import ZonesClient
+
+
+def test_client_used_before_fork_works_in_child():
+    client = ZonesClient(credentials=ga_credentials.AnonymousCredentials())
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"name": "us-central1-a"}'
+
+    with mock.patch.object(Session, "request", return_value=response) as request:
+        # Resolves every method name before the fork.
+        client.list(project="p")
+        client.get(project="p", zone="us-central1-a")
+        inherited = client.transport._session
+        with mock.patch.object(forking, "_generation", forking._generation + 1):
+            zone = client.get(project="p", zone="us-central1-a")
+
+    assert zone.name == "us-central1-a"
+    assert request.call_count == 3
+    assert client.transport._session is not inherited
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+
+from google.cloud.compute_helpers import hedging
+from google.cloud.compute_v1.services.zones import ZonesClient
+
+
+def test_named_method_is_hedged(server, rest_client):
+    hedges = hedging.Hedging(methods=["get"], initial_delay=0.02)
+    client = rest_client(ZonesClient, hedges)
+    server.delays = [0.5, 0.0]
+
+    started = time.monotonic()
+    client.get(project="p", zone="us-central1-a")
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.4
+    assert len(server.requests) == 2
+    assert (hedges.attempts, hedges.hedges) == (1, 1)
+
+
+def test_methods_without_retry_are_not_hedged_by_default(server, rest_client):
+    hedges = hedging.Hedging(initial_delay=0.0)
+    client = rest_client(ZonesClient, hedges)
+    server.delay = 0.05
+
+    client.get(project="p", zone="us-central1-a")
+
+    assert len(server.requests) == 1
+    assert hedges.attempts == 0
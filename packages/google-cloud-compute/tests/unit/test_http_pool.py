@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from concurrent import futures
+import http.server
+import json
+import socket
+import threading
+
+from google.auth import credentials as ga_credentials
+import pytest
+from requests import adapters
+
+from google.cloud.compute_helpers import http_pool
+from google.cloud.compute_v1.services.instances import InstancesClient, transports
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        body = json.dumps({"name": "vm"}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = http.server.ThreadingHTTPServer(("localhost", 0), _Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _transport(**kwargs):
+    return transports.InstancesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), **kwargs
+    )
+
+
+def _pool_kw(transport, prefix="https://"):
+    return transport._session.get_adapter(prefix).poolmanager.connection_pool_kw
+
+
+def test_defaults_unchanged():
+    transport = _transport()
+
+    assert _pool_kw(transport)["maxsize"] == adapters.DEFAULT_POOLSIZE
+    assert "socket_options" not in _pool_kw(transport)
+
+
+@pytest.mark.parametrize("prefix", ["https://", "http://"])
+def test_options_applied_to_every_adapter(prefix):
+    options = http_pool.HttpPoolOptions(
+        pool_connections=4,
+        pool_maxsize=64,
+        pool_block=True,
+        tcp_keepalive=60,
+        connect_retries=2,
+    )
+    transport = _transport(http_pool_options=options)
+    adapter = transport._session.get_adapter(prefix)
+
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert len(adapter.poolmanager.pools.keys()) == 0
+    assert adapter.max_retries.connect == 2
+    assert adapter.max_retries.read is False
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in (
+        adapter.poolmanager.connection_pool_kw["socket_options"]
+    )
+
+
+def test_subclassed_adapter_keeps_its_pool_arguments():
+    class _Adapter(adapters.HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs["ssl_context"] = "context"
+            super().init_poolmanager(*args, **kwargs)
+
+    transport = _transport()
+    transport._session.mount("https://", _Adapter())
+
+    http_pool.HttpPoolOptions(pool_maxsize=32).apply(transport._session)
+
+    assert _pool_kw(transport)["ssl_context"] == "context"
+    assert _pool_kw(transport)["maxsize"] == 32
+
+
+def test_keepalive_off_by_default():
+    options = http_pool.HttpPoolOptions().socket_options()
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in options
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"pool_maxsize": 0},
+        {"pool_connections": 0},
+        {"tcp_keepalive": 0},
+        {"connect_retries": -1},
+    ],
+)
+def test_invalid_options(kwargs):
+    with pytest.raises(ValueError):
+        http_pool.HttpPoolOptions(**kwargs)
+
+
+def test_threads_reuse_pooled_connections(server):
+    threads = 8
+    client = InstancesClient(
+        transport=_transport(
+            host="localhost:{}".format(server.server_address[1]),
+            url_scheme="http",
+            http_pool_options=http_pool.HttpPoolOptions(
+                pool_maxsize=threads, pool_block=True
+            ),
+        )
+    )
+
+    with futures.ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(
+            pool.map(
+                lambda i: client.get(project="p", zone="z", instance="vm").name,
+                range(200),
+            )
+        )
+
+    assert results == ["vm"] * 200
+    assert server.connections <= threads
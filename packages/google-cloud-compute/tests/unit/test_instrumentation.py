@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.api_core import exceptions as core_exceptions
+from google.api_core import retry as retries
+import pytest
+
+from google.cloud.compute_helpers import instrumentation
+from google.cloud.compute_v1.services.zones import ZonesClient
+from google.cloud.compute_v1.types import compute
+
+
+def _kinds(events):
+    return [(e.kind, e.attempt, e.status) for e in events]
+
+
+def test_retry_reports_each_attempt(server, rest_client):
+    events = []
+    client = rest_client(ZonesClient, instrumentation.Instrumentation(events.append))
+    server.responses = [503]
+    retry = retries.Retry(
+        initial=0.01,
+        predicate=retries.if_exception_type(core_exceptions.ServiceUnavailable),
+    )
+
+    response = client.get(project="p", zone="us-central1-a", retry=retry)
+
+    assert _kinds(events) == [
+        ("start", 1, None),
+        ("end", 1, "UNAVAILABLE"),
+        ("start", 2, None),
+        ("end", 2, "OK"),
+        ("call", 2, "OK"),
+    ]
+    request = compute.GetZoneRequest(project="p", zone="us-central1-a")
+    assert {e.method for e in events} == {"get"}
+    assert {e.request_size for e in events} == {
+        compute.GetZoneRequest.pb(request).ByteSize()
+    }
+    assert events[3].response_size == compute.Zone.pb(response).ByteSize()
+
+
+def test_error_status(server, rest_client):
+    events = []
+    client = rest_client(ZonesClient, instrumentation.Instrumentation(events.append))
+    server.response = 404
+
+    with pytest.raises(core_exceptions.NotFound):
+        client.get(project="p", zone="us-central1-a")
+
+    assert _kinds(events) == [
+        ("start", 1, None),
+        ("end", 1, "NOT_FOUND"),
+        ("call", 1, "NOT_FOUND"),
+    ]
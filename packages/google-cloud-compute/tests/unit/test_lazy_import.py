@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from google.cloud import compute, compute_v1
+
+
+def _loaded_services(code):
+    # Run in a fresh interpreter; this process has already imported clients.
+    probe = (
+        code
+        + "\nimport json, sys\n"
+        + "print(json.dumps(sorted({name.split('.')[4] for name in sys.modules"
+        + " if name.startswith('google.cloud.compute_v1.services.')})))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out)
+
+
+def test_package_import_loads_no_services():
+    assert _loaded_services("from google.cloud import compute_v1") == []
+
+
+def test_client_access_loads_only_its_service():
+    loaded = _loaded_services(
+        "from google.cloud import compute_v1\ncompute_v1.InstancesClient"
+    )
+    # Instances polls zonal operations for extended operations.
+    assert loaded == ["instances", "zone_operations"]
+
+
+def test_unversioned_client_access_loads_only_its_service():
+    loaded = _loaded_services("from google.cloud import compute\ncompute.ZonesClient")
+    assert loaded == ["zones"]
+
+
+@pytest.mark.parametrize("module", [compute, compute_v1])
+def test_lazy_names_resolve(module):
+    from google.cloud.compute_v1.services.instances import InstancesClient
+    from google.cloud.compute_v1.types import compute as compute_types
+
+    assert module.InstancesClient is InstancesClient
+    assert module.Instance is compute_types.Instance
+    assert "InstancesClient" in dir(module)
+    assert set(module.__all__) <= set(dir(module))
+
+
+@pytest.mark.parametrize("module", [compute, compute_v1])
+def test_unknown_name_raises_attribute_error(module):
+    with pytest.raises(AttributeError):
+        module.NotARealClient
+
+
+def test_subpackages_resolve():
+    from google.cloud.compute_v1 import services, types
+
+    assert compute_v1.types is types
+    assert compute_v1.services is services
+
+
+def test_client_access_builds_only_referenced_messages():
+    probe = (
+        "from google.cloud import compute_v1\n"
+        "compute_v1.InstancesClient\n"
+        "import json, sys\n"
+        "print(json.dumps(sorted(name.rsplit('.', 1)[1] for name in sys.modules"
+        " if name.startswith('google.cloud.compute_v1.types._compute.'))))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    shards = json.loads(out)
+    assert "instances" in shards
+    assert "zone_operations" in shards
+    assert "routers" not in shards
+    assert "security_policies" not in shards
+
+
+def test_sharded_messages_round_trip():
+    from google.cloud.compute_v1.types import compute as compute_types
+
+    instance = compute_types.Instance(
+        name="instance_value",
+        network_interfaces=[{"access_configs": [{"name": "name_value"}]}],
+    )
+    request = compute_types.InsertInstanceRequest(instance_resource=instance)
+
+    assert pickle.loads(pickle.dumps(request)) == request
+    assert (
+        compute_types.InsertInstanceRequest.deserialize(
+            compute_types.InsertInstanceRequest.serialize(request)
+        )
+        == request
+    )
+    assert (
+        request.instance_resource.network_interfaces[0].access_configs[0].name
+        == "name_value"
+    )
+
+
+def test_types_package_resolves_messages():
+    from google.cloud.compute_v1 import types
+    from google.cloud.compute_v1.types import compute as compute_types
+
+    assert types.Instance is compute_types.Instance
+    assert set(types.__all__) == set(compute_types.__all__)
+    with pytest.raises(AttributeError):
+        compute_types.NotARealMessage
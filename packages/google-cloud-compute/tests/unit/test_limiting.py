@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from concurrent import futures
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.cloud.compute_helpers import limiting
+from google.cloud.compute_v1.services.zones import ZonesClient
+
+
+def test_concurrency_is_limited(server, rest_client):
+    limiter = limiting.Limiter(initial_limit=3, max_limit=3)
+    server.delay = 0.02
+    client = rest_client(ZonesClient, limiter)
+
+    with futures.ThreadPoolExecutor(max_workers=12) as pool:
+        for _ in range(12):
+            pool.submit(client.get, project="p", zone="us-central1-a")
+
+    assert len(server.requests) == 12
+    assert server.max_in_flight == 3
+    assert limiter.throttled > 0
+
+
+def test_unavailable_cuts_limit(server, rest_client):
+    limiter = limiting.Limiter(initial_limit=8, backoff=0.5)
+    server.responses = [503]
+    client = rest_client(ZonesClient, limiter)
+
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        client.get(project="p", zone="us-central1-a")
+
+    assert limiter.limit("get") == 4
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from concurrent import futures
+import functools
+import threading
+import time
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import extended_operation
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.compute_helpers import operations
+from google.cloud.compute_v1 import (
+    GlobalOrganizationOperationsClient,
+    ZoneOperationsClient,
+)
+from google.cloud.compute_v1.types import compute
+
+_Status = compute.Operation.Status
+
+
+class _Server:
+    """Serves operations that finish after a number of calls each."""
+
+    def __init__(self, calls_left, delay=0.0):
+        self.calls_left = dict(calls_left)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.requests = []
+
+    def __call__(self, request=None, timeout=None, **kwargs):
+        if isinstance(request, dict):
+            request = compute.WaitZoneOperationRequest(request)
+        with self.lock:
+            self.requests.append(request)
+            self.calls_left[request.operation] -= 1
+            done = self.calls_left[request.operation] <= 0
+        if self.delay:
+            time.sleep(self.delay)
+        status = _Status.DONE if done else _Status.RUNNING
+        return compute.Operation(name=request.operation, status=status)
+
+
+class _Operation(extended_operation.ExtendedOperation):
+    # As the generated clients define it.
+    @property
+    def error_message(self):
+        return self._extended_operation.http_error_message
+
+    @property
+    def error_code(self):
+        return self._extended_operation.http_error_status_code
+
+
+def _operations(service, names):
+    return [
+        _Operation.make(
+            functools.partial(
+                service.get,
+                compute.GetZoneOperationRequest(project="p", zone="z", operation=name),
+            ),
+            lambda: None,
+            compute.Operation(name=name, status=_Status.RUNNING),
+        )
+        for name in names
+    ]
+
+
+def _zone_operations(server):
+    service = ZoneOperationsClient(credentials=ga_credentials.AnonymousCredentials())
+    patcher = mock.patch.object(service, "wait", side_effect=server)
+    return service, patcher
+
+
+def test_operations_waited_for_concurrently():
+    names = ["op{}".format(i) for i in range(8)]
+    server = _Server(dict.fromkeys(names, 1), delay=0.1)
+    service, patcher = _zone_operations(server)
+    waiter = operations.Waiter(max_concurrency=8)
+
+    with patcher:
+        start = time.perf_counter()
+        completed = list(waiter.as_completed(_operations(service, names)))
+        elapsed = time.perf_counter() - start
+
+    assert sorted(f.name for f in completed) == names
+    assert all(f.done() and f.result() is None for f in completed)
+    assert elapsed < 0.5
+    assert waiter.rpcs == 8
+    assert {r.zone for r in server.requests} == {"z"}
+
+
+def test_wait_repeated_until_done():
+    server = _Server({"a": 3, "b": 1})
+    service, patcher = _zone_operations(server)
+    waiter = operations.Waiter()
+
+    with patcher:
+        completed = list(waiter.as_completed(_operations(service, ["a", "b"])))
+
+    assert [f.name for f in completed] == ["b", "a"]
+    assert waiter.rpcs == 4
+
+
+def test_completed_operations_yielded_without_calls():
+    server = _Server({})
+    service, patcher = _zone_operations(server)
+    (future,) = _operations(service, ["a"])
+    future._extended_operation.status = _Status.DONE
+
+    with patcher:
+        assert list(operations.Waiter().as_completed([future])) == [future]
+
+    assert server.requests == []
+
+
+def test_failed_operation():
+    service = ZoneOperationsClient(credentials=ga_credentials.AnonymousCredentials())
+    failed = compute.Operation(
+        name="a",
+        status=_Status.DONE,
+        http_error_status_code=404,
+        http_error_message="gone",
+    )
+    future = _Operation.make(
+        functools.partial(service.get, compute.GetZoneOperationRequest(operation="a")),
+        lambda: None,
+        compute.Operation(name="a", status=_Status.RUNNING),
+    )
+
+    with mock.patch.object(service, "wait", return_value=failed):
+        (completed,) = operations.Waiter().as_completed([future])
+
+    with pytest.raises(core_exceptions.NotFound, match="gone"):
+        completed.result()
+
+
+def test_call_error_raised():
+    service, patcher = _zone_operations(core_exceptions.PermissionDenied("no"))
+
+    with patcher, pytest.raises(core_exceptions.PermissionDenied):
+        list(operations.Waiter().as_completed(_operations(service, ["a"])))
+
+
+def test_service_without_wait_is_polled_with_backoff():
+    server = _Server({"a": 3})
+    waiter = operations.Waiter(initial_delay=1.0, max_delay=1.5, multiplier=2.0)
+
+    with mock.patch.object(
+        GlobalOrganizationOperationsClient,
+        "get",
+        autospec=True,
+        side_effect=lambda _, request, **kwargs: server(request),
+    ), mock.patch.object(operations.time, "sleep") as sleep:
+        service = GlobalOrganizationOperationsClient(
+            credentials=ga_credentials.AnonymousCredentials()
+        )
+        future = _Operation.make(
+            functools.partial(
+                service.get,
+                compute.GetGlobalOrganizationOperationRequest(operation="a"),
+            ),
+            lambda: None,
+            compute.Operation(name="a", status=_Status.RUNNING),
+        )
+        (completed,) = waiter.as_completed([future])
+
+    assert completed is future
+    assert [c.args[0] for c in sleep.call_args_list] == [1.0, 1.5, 1.5]
+    assert waiter.rpcs == 3
+
+
+def test_timeout():
+    server = _Server({"a": 1000}, delay=0.02)
+    service, patcher = _zone_operations(server)
+
+    with patcher, pytest.raises(futures.TimeoutError, match="1 operations"):
+        list(operations.Waiter().as_completed(_operations(service, ["a"]), timeout=0.1))
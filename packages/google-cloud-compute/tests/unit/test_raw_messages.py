@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.cloud.compute_helpers import raw_messages
+from google.cloud.compute_v1.services.instances import InstancesClient
+from google.cloud.compute_v1.types import compute
+
+
+def test_pager_yields_protobuf_items(server, rest_client):
+    client = rest_client(InstancesClient, raw_messages.RawMessages())
+    server.responses = [
+        compute.InstanceList(
+            items=[compute.Instance(name="a"), compute.Instance(name="b")],
+            next_page_token="2",
+        ),
+        compute.InstanceList(items=[compute.Instance(name="c")]),
+    ]
+
+    instances = list(client.list(project="p", zone="z"))
+
+    assert [type(i) for i in instances] == [compute.Instance.pb()] * 3
+    assert [i.name for i in instances] == ["a", "b", "c"]
+
+
+def test_operations_stay_proto_plus(server, rest_client):
+    client = rest_client(InstancesClient, raw_messages.RawMessages())
+    server.response = compute.Operation(name="op", status=compute.Operation.Status.DONE)
+
+    unary = client.insert_unary(project="p", zone="z", instance_resource={})
+    extended = client.insert(project="p", zone="z", instance_resource={})
+
+    assert isinstance(unary, compute.Operation)
+    assert extended.done()
+    assert extended.name == "op"
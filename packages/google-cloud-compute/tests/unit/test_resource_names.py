@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+
+import pytest
+
+from google.cloud.compute_helpers import resource_names
+from google.cloud.compute_v1.services.zones import ZonesClient
+
+_LOCATION = "projects/{project}/locations/{location}"
+
+
+def _generated_parse(template, path):
+    # The code the generator emits for parse_*_path.
+    pattern = "^" + re.sub(r"\{(\w+)\}", r"(?P<\1>.+?)", template) + "$"
+    m = re.match(pattern, path)
+    return m.groupdict() if m else {}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "projects/p/locations/l",
+        "projects/p/locations/l/m",
+        "projects/p/q/locations/l",
+        "projects/p/locations/",
+        "projects/p/locations/l\n",
+        "projects/p",
+        "",
+    ],
+)
+def test_parse_matches_generated_code(path):
+    parsed = resource_names.ResourceName(_LOCATION).parse(path)
+
+    assert parsed == _generated_parse(_LOCATION, path)
+
+
+def test_client_methods():
+    path = ZonesClient.common_location_path("p", "l")
+
+    assert path == "projects/p/locations/l"
+    assert ZonesClient.parse_common_location_path(path) == {
+        "project": "p",
+        "location": "l",
+    }
+    assert ZonesClient.parse_common_folder_path(path) == {}
+    assert ZonesClient.common_project_path("p") == "projects/p"
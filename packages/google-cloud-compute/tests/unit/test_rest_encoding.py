@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+from google.api_core import rest_helpers
+from google.protobuf import json_format
+import pytest
+
+from google.cloud.compute_helpers import rest_encoding
+from google.cloud.compute_v1.types import compute
+
+
+def _legacy(message, use_integers_for_enums=True):
+    query_params = json.loads(
+        json_format.MessageToJson(
+            message,
+            including_default_value_fields=False,
+            use_integers_for_enums=use_integers_for_enums,
+        )
+    )
+    return rest_helpers.flatten_query_params(query_params, strict=True)
+
+
+MESSAGES = [
+    compute.ListInstancesRequest.pb(compute.ListInstancesRequest()),
+    compute.ListInstancesRequest.pb(
+        compute.ListInstancesRequest(
+            project="p",
+            zone="z",
+            filter='name = "a" AND status = RUNNING',
+            max_results=50,
+            order_by="creationTimestamp desc",
+            page_token="token/with?reserved&chars",
+            return_partial_success=True,
+        )
+    ),
+    compute.InsertInstanceRequest.pb(
+        compute.InsertInstanceRequest(
+            project="p",
+            zone="z",
+            request_id="r",
+            source_instance_template="global/instanceTemplates/t",
+            instance_resource=compute.Instance(
+                name="a",
+                machine_type="zones/z/machineTypes/e2-small",
+                labels={"env": "test"},
+                tags=compute.Tags(items=["http", "https"]),
+                scheduling=compute.Scheduling(
+                    automatic_restart=False, on_host_maintenance="MIGRATE"
+                ),
+            ),
+        )
+    ),
+]
+
+
+@pytest.mark.parametrize("use_integers_for_enums", [True, False])
+@pytest.mark.parametrize("message", MESSAGES)
+def test_message_to_query_params_matches_json_round_trip(
+    message, use_integers_for_enums
+):
+    assert rest_encoding.message_to_query_params(
+        message, use_integers_for_enums=use_integers_for_enums
+    ) == _legacy(message, use_integers_for_enums=use_integers_for_enums)
+
+
+def test_optional_fields_set_to_default_are_sent():
+    message = compute.ListInstancesRequest.pb(
+        compute.ListInstancesRequest(max_results=0, return_partial_success=False)
+    )
+
+    assert rest_encoding.message_to_query_params(message) == [
+        ("maxResults", "0"),
+        ("returnPartialSuccess", "false"),
+    ]
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+import json
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+from google.protobuf import json_format
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.cloud.compute_helpers import streaming
+from google.cloud.compute_v1.services.instances import InstancesClient, transports
+from google.cloud.compute_v1.types import compute
+
+
+def _chunks(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def _streamed_response(message, content_type="application/json"):
+    response = Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(
+        json_format.MessageToJson(type(message).pb(message)).encode("utf-8")
+    )
+    response.headers["Content-Type"] = content_type
+    return response
+
+
+def _list_page(start, count, token):
+    return compute.InstanceList(
+        id="list",
+        items=[
+            compute.Instance(name="vm-{}".format(i), id=i)
+            for i in range(start, start + count)
+        ],
+        next_page_token=token,
+    )
+
+
+def _client():
+    transport = transports.InstancesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), stream_pages=True
+    )
+    return InstancesClient(transport=transport)
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 4096])
+@pytest.mark.parametrize(
+    "document",
+    [
+        {"kind": "x", "items": [{"a": 1}, {"b": [1, 2, {"c": "é"}]}], "n": 12345},
+        {"items": {"zones/a": {"x": 1.5e10}, "zones/b": {}}, "nextPageToken": "t"},
+        {"items": [], "id": "empty"},
+        {"items": {}, "id": "empty"},
+        {"id": "no items", "warning": {"code": "NO_RESULTS_ON_PAGE"}},
+        {},
+    ],
+)
+def test_iter_json_page_matches_json_loads(document, size):
+    data = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    metadata = {}
+
+    elements = list(streaming.iter_json_page(_chunks(data, size), "items", metadata))
+
+    items = document.get("items", [])
+    expected = list(items.items()) if isinstance(items, dict) else items
+    assert elements == expected
+    assert metadata == {k: v for k, v in document.items() if k != "items"}
+
+
+def test_iter_json_page_rejects_non_objects():
+    with pytest.raises(ValueError):
+        list(streaming.iter_json_page([b"[1, 2]"], "items", {}))
+
+
+def test_streamed_page_items_then_metadata():
+    page = streaming.StreamedPage(
+        _streamed_response(_list_page(0, 3, "next")), compute.InstanceList, "items"
+    )
+
+    assert [i.name for i in page.items] == ["vm-0", "vm-1", "vm-2"]
+    assert page.next_page_token == "next"
+    assert page.id == "list"
+
+
+def test_streamed_page_metadata_first_keeps_items():
+    page = streaming.StreamedPage(
+        _streamed_response(_list_page(0, 3, "next")), compute.InstanceList, "items"
+    )
+
+    assert page.next_page_token == "next"
+    assert [i.name for i in page.items] == ["vm-0", "vm-1", "vm-2"]
+
+
+def test_streamed_page_metadata_midway_keeps_items():
+    page = streaming.StreamedPage(
+        _streamed_response(_list_page(0, 3, "next")), compute.InstanceList, "items"
+    )
+    items = page.items
+    first = next(items)
+
+    assert page.id == "list"
+    assert [first.name] + [i.name for i in items] == ["vm-0", "vm-1", "vm-2"]
+
+
+def test_list_pager_fields_before_items():
+    client = _client()
+    with mock.patch.object(Session, "request") as req:
+        req.side_effect = [_streamed_response(_list_page(0, 2, ""))]
+        pager = client.list(project="p", zone="z")
+        assert pager.id == "list"
+        names = [i.name for i in pager]
+
+    assert names == ["vm-0", "vm-1"]
+
+
+def test_streamed_page_iterates_once():
+    page = streaming.StreamedPage(
+        _streamed_response(_list_page(0, 3, "")), compute.InstanceList, "items"
+    )
+    list(page.items)
+
+    with pytest.raises(RuntimeError):
+        list(page.items)
+
+
+def test_list_pager_streams_every_page():
+    client = _client()
+    with mock.patch.object(Session, "request") as req:
+        req.side_effect = [
+            _streamed_response(_list_page(0, 3, "p2")),
+            _streamed_response(_list_page(3, 2, "")),
+        ]
+        names = [i.name for i in client.list(project="p", zone="z")]
+
+    assert names == ["vm-{}".format(i) for i in range(5)]
+    assert all(call.kwargs["stream"] for call in req.call_args_list)
+
+
+def test_aggregated_list_pager_streams_scopes():
+    page = compute.InstanceAggregatedList(
+        items={
+            "zones/a": compute.InstancesScopedList(
+                instances=[compute.Instance(name="vm-a")]
+            ),
+            "zones/b": compute.InstancesScopedList(
+                instances=[compute.Instance(name="vm-b")]
+            ),
+        },
+    )
+    client = _client()
+    with mock.patch.object(Session, "request") as req:
+        req.return_value = _streamed_response(page)
+        pager = client.aggregated_list(project="p")
+        scopes = {key: [i.name for i in value.instances] for key, value in pager}
+
+    assert scopes == {"zones/a": ["vm-a"], "zones/b": ["vm-b"]}
+
+
+def test_aggregated_list_get_scans_for_key():
+    page = compute.InstanceAggregatedList(
+        items={
+            "zones/a": compute.InstancesScopedList(),
+            "zones/b": compute.InstancesScopedList(
+                instances=[compute.Instance(name="vm-b")]
+            ),
+        },
+    )
+    client = _client()
+    with mock.patch.object(Session, "request") as req:
+        req.return_value = _streamed_response(page)
+        pager = client.aggregated_list(project="p")
+
+    assert pager.get("zones/b").instances[0].name == "vm-b"
+
+
+def test_proto_response_is_decoded_whole():
+    expected = _list_page(0, 2, "")
+    response = Response()
+    response.status_code = 200
+    response._content = compute.InstanceList.serialize(expected)
+    response.headers["Content-Type"] = "application/x-protobuf"
+    client = _client()
+
+    with mock.patch.object(Session, "request") as req:
+        req.return_value = response
+        pager = client.list(project="p", zone="z")
+
+    assert pager._response == expected
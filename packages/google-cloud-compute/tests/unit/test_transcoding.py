@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+
+from google.api_core import path_template
+import pytest
+
+from google.cloud.compute_helpers import transcoding
+from google.cloud.compute_v1.services.instances.transports import rest
+from google.cloud.compute_v1.types import compute
+
+_STUBS = sorted(
+    (name, stub)
+    for name, stub in vars(rest.InstancesRestTransport).items()
+    if isinstance(getattr(stub, "_TRANSCODER", None), transcoding.Transcoder)
+)
+
+
+def _request(stub):
+    cls = stub.__call__.__annotations__["request"]
+    return cls.pb(cls())
+
+
+def _fill(message, uri):
+    """Set the fields of a URI template to values that match it."""
+    for match in re.finditer(r"{([^=}]+)(?:=([^}]+))?}", uri):
+        *parents, name = match.group(1).split(".")
+        value = (match.group(2) or "*").replace("**", "a/b").replace("*", "x")
+        target = message
+        for parent in parents:
+            target = getattr(target, parent)
+        setattr(target, name, value)
+    return message
+
+
+def _transcode_both(transcoder, message):
+    expected = path_template.transcode(transcoder.http_options, message)
+    assert transcoder.transcode(message) == expected
+    return expected
+
+
+@pytest.mark.parametrize("name,stub", _STUBS, ids=[name for name, _ in _STUBS])
+def test_matches_path_template(name, stub):
+    transcoder = stub._TRANSCODER
+    message = _fill(_request(stub), transcoder.http_options[0]["uri"])
+
+    transcoded = _transcode_both(transcoder, message)
+
+    assert transcoded["uri"].startswith("/compute/v1/projects/x/")
+
+
+@pytest.mark.parametrize("name,stub", _STUBS, ids=[name for name, _ in _STUBS])
+def test_mismatch_raises_path_template_error(name, stub):
+    with pytest.raises(ValueError) as expected:
+        path_template.transcode(stub._TRANSCODER.http_options, _request(stub))
+
+    with pytest.raises(ValueError, match=re.escape(str(expected.value))):
+        stub._TRANSCODER.transcode(_request(stub))
+
+
+def test_query_params_and_body():
+    transcoder = rest.InstancesRestTransport._Insert._TRANSCODER
+    request = compute.InsertInstanceRequest(
+        project="p",
+        zone="z",
+        request_id="r",
+        instance_resource=compute.Instance(name="a"),
+    )
+
+    transcoded = _transcode_both(transcoder, compute.InsertInstanceRequest.pb(request))
+
+    assert transcoded["method"] == "post"
+    assert transcoded["uri"] == "/compute/v1/projects/p/zones/z/instances"
+    assert transcoded["body"].name == "a"
+    assert transcoded["query_params"].request_id == "r"
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest import mock
+
+import pytest
+from google.auth import credentials as ga_credentials
+from google.protobuf import json_format
+from requests import Response
+from requests.sessions import Session
+
+from google.cloud.compute_helpers import wire
+from google.cloud.compute_v1.services.instances import InstancesClient, transports
+from google.cloud.compute_v1.types import compute
+
+
+def _response(content, content_type=None, status_code=200):
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    if content_type:
+        response.headers["Content-Type"] = content_type
+    return response
+
+
+def _client(wire_format):
+    transport = transports.InstancesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), wire_format=wire_format
+    )
+    return InstancesClient(transport=transport)
+
+
+def test_invalid_wire_format():
+    with pytest.raises(ValueError):
+        wire.WireCodec("xml")
+
+
+def test_json_is_the_default():
+    transport = transports.InstancesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    assert transport._wire.wire_format == wire.JSON
+
+
+def test_json_request():
+    codec = wire.WireCodec()
+    send = mock.Mock(return_value=_response(b"{}"))
+    body = compute.Instance.pb(compute.Instance(name="vm"))
+
+    codec.send(send, "https://h/x", timeout=1, headers={}, params=[], body=body)
+
+    kwargs = send.call_args.kwargs
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert kwargs["params"] == []
+    assert kwargs["data"] == json_format.MessageToJson(body)
+
+
+def test_proto_request():
+    codec = wire.WireCodec(wire.PROTO)
+    send = mock.Mock(return_value=_response(b"", "application/x-protobuf"))
+    body = compute.Instance.pb(compute.Instance(name="vm"))
+
+    codec.send(send, "https://h/x", timeout=1, headers={}, params=[], body=body)
+
+    kwargs = send.call_args.kwargs
+    assert kwargs["headers"]["Content-Type"] == "application/x-protobuf"
+    assert kwargs["params"] == [("$alt", "proto")]
+    assert kwargs["data"] == body.SerializeToString()
+
+
+def test_proto_request_without_body():
+    codec = wire.WireCodec(wire.PROTO)
+    send = mock.Mock(return_value=_response(b"", "application/x-protobuf"))
+
+    codec.send(send, "https://h/x", timeout=1, headers={}, params=[("a", "b")])
+
+    kwargs = send.call_args.kwargs
+    assert kwargs["params"] == [("a", "b"), ("$alt", "proto")]
+    assert "data" not in kwargs
+
+
+def test_unsupported_media_type_falls_back_to_json():
+    codec = wire.WireCodec(wire.PROTO)
+    send = mock.Mock(side_effect=[_response(b"", status_code=415), _response(b"{}")])
+    body = compute.Instance.pb(compute.Instance(name="vm"))
+
+    response = codec.send(
+        send, "https://h/x", timeout=1, headers={}, params=[], body=body
+    )
+
+    assert response.status_code == 200
+    assert send.call_count == 2
+    assert send.call_args.kwargs["headers"]["Content-Type"] == "application/json"
+    assert send.call_args.kwargs["params"] == []
+    assert codec.wire_format == wire.JSON
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["application/x-protobuf", "application/x-protobuf; charset=binary"],
+)
+def test_parse_proto(content_type):
+    expected = compute.Instance.pb(compute.Instance(name="vm", id=7))
+    actual = compute.Instance.pb(compute.Instance())
+
+    wire.WireCodec.parse(_response(expected.SerializeToString(), content_type), actual)
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("content_type", [None, "application/json; charset=UTF-8"])
+def test_parse_json(content_type):
+    actual = compute.Instance.pb(compute.Instance())
+
+    wire.WireCodec.parse(
+        _response(b'{"name": "vm", "unknownField": 1}', content_type), actual
+    )
+
+    assert actual.name == "vm"
+
+
+def test_client_round_trip_proto():
+    client = _client(wire.PROTO)
+    expected = compute.Instance(name="vm", id=7)
+
+    with mock.patch.object(Session, "request") as req:
+        req.return_value = _response(
+            compute.Instance.serialize(expected), "application/x-protobuf"
+        )
+        actual = client.get(project="p", zone="z", instance="vm")
+
+    assert actual == expected
+    assert ("$alt", "proto") in req.call_args.kwargs["params"]
+
+
+def test_client_proto_accepts_json_response():
+    client = _client(wire.PROTO)
+
+    with mock.patch.object(Session, "request") as req:
+        req.return_value = _response(b'{"name": "vm"}', "application/json")
+        actual = client.get(project="p", zone="z", instance="vm")
+
+    assert actual.name == "vm"
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Reopening transports in processes forked after they were created.
+
+A gRPC channel or HTTP session opened before ``fork()`` is not safe to
+use in the child: calls on an inherited gRPC channel can hang, and an
+inherited session's pooled connections are shared with the parent. Transports check
+a :class:`ForkGuard` each time a client looks up one of their methods,
+and the first time that happens in a child the guard calls the
+transport's reopen function, which opens a new channel or session with
+the transport's credentials and configuration.
+
+Forks are counted with :func:`os.register_at_fork` rather than by
+comparing :func:`os.getpid` on every call, which costs a system call.
+Processes started with ``spawn`` or ``forkserver`` import everything
+anew and need none of this.
+"""
+
+import os
+import threading
+from typing import Callable
+
+# The number of forks between the first import and this process.
+_generation = 0
+# Taken only to reopen a transport in a child.
+_lock = threading.Lock()
+
+
+def _after_fork_in_child() -> None:
+    global _generation, _lock
+    _generation += 1
+    # Another thread may have held the lock at fork time.
+    _lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class ForkGuard:
+    """Calls a reopen function once in each process forked after its creation.
+
+    Args:
+        reopen (Callable[[], None]): Replaces what cannot be used across
+            ``fork()``.
+    """
+
+    def __init__(self, reopen: Callable[[], None]):
+        self._reopen = reopen
+        self._generation = _generation
+
+    def check(self) -> None:
+        """Call the reopen function if the process was forked since the last call."""
+        if self._generation == _generation:
+            return
+        with _lock:
+            if self._generation != _generation:
+                self._reopen()
+                self._generation = _generation
+
+
+__all__ = ("ForkGuard",)
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client-side limits on the rate and concurrency of each method's calls.
+
+With a :class:`Limiter` attached to a transport, every attempt of a unary
+method first takes a token from the method's bucket, which refills at
+``rate`` tokens per second, and then a slot under the method's concurrency
+limit. The concurrency limit adapts to the service: it grows by one for
+every ``limit`` attempts that succeed, and is cut by ``backoff`` when an
+attempt fails with ``RESOURCE_EXHAUSTED`` or ``UNAVAILABLE``. An
+overloaded service therefore sees fewer calls, rather than every call
+retried at once.
+
+A limiter may be attached to several transports, synchronous and asyncio
+alike, which then share its limits.
+
+.. code-block:: python
+
+    limiter = limiting.Limiter(rate=50, burst=10)
+    limiter.attach(client.transport)
+"""
+
+import asyncio
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from google.api_core import exceptions as core_exceptions
+import grpc  # type: ignore
+
+from google.cloud.dialogflowcx_helpers import wrapping
+
+_STREAMING = (grpc.UnaryStreamMultiCallable, grpc.StreamStreamMultiCallable)
+
+_OVERLOADED = (grpc.StatusCode.RESOURCE_EXHAUSTED, grpc.StatusCode.UNAVAILABLE)
+
+
+def _overloaded(exc: Optional[BaseException]) -> bool:
+    if isinstance(exc, core_exceptions.GoogleAPICallError):
+        return exc.grpc_status_code in _OVERLOADED
+    if isinstance(exc, grpc.RpcError) and callable(getattr(exc, "code", None)):
+        return exc.code() in _OVERLOADED
+    return False
+
+
+def _remaining(timeout: Any, waited: float) -> Any:
+    if isinstance(timeout, (int, float)):
+        return max(0.0, timeout - waited)
+    return timeout
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class _MethodLimit:
+    """The token bucket and concurrency limit of one method."""
+
+    def __init__(self, limit: float, tokens: float):
+        self.limit = limit
+        self.in_flight = 0
+        self.tokens = tokens
+        self.refilled = time.monotonic()
+        # When the limit was last cut. Failures of attempts started
+        # before then were caused by the old limit and do not cut it again.
+        self.cut = -math.inf
+
+
+class Limiter:
+    """Limits the rate and concurrency of the calls made through transports.
+
+    Args:
+        rate (Optional[float]): Attempts per second allowed for each method,
+            for example the service's quota. ``None`` for no rate limit.
+        burst (Optional[float]): Attempts that may be made back to back
+            after a quiet period; defaults to ``rate``, or 1 if that is
+            smaller.
+        initial_limit (int): Attempts of each method allowed in flight at
+            first.
+        min_limit (int): The concurrency limit is never cut below this.
+        max_limit (int): The concurrency limit never grows above this.
+        backoff (float): The concurrency limit is multiplied by this when
+            an attempt fails with ``RESOURCE_EXHAUSTED`` or ``UNAVAILABLE``.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        backoff: float = 0.9,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "min_limit, initial_limit and max_limit must be at least 1 "
+                "and in that order"
+            )
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        if burst is None:
+            burst = max(1.0, rate or 1.0)
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self._condition = threading.Condition()
+        self._limits: Dict[str, _MethodLimit] = {}
+        self._async_waiters: Set[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = set()
+        self.throttled = 0
+
+    def attach(self, transport) -> None:
+        """Limit the calls of a transport from their next call on."""
+        transport._limiter = self
+        transport._wrapped_methods.clear()
+        wrapping.hook_async_stubs(transport)
+
+    def detach(self, transport) -> None:
+        """Stop limiting a transport's calls."""
+        transport._limiter = None
+        transport._wrapped_methods.clear()
+
+    def limit(self, name: str) -> float:
+        """Return the current concurrency limit of a method."""
+        with self._condition:
+            state = self._limits.get(name)
+            return self.initial_limit if state is None else state.limit
+
+    def factory(
+        self, name: str, factory: Callable[[Callable], Callable]
+    ) -> Callable[[Callable], Callable]:
+        """Make a wrapped-method factory limit each attempt of the method.
+
+        Args:
+            name (str): The transport method's name.
+            factory (Callable[[Callable], Callable]): Applies the method's
+                retry, timeout and error handling to a callable.
+        """
+
+        def limited_factory(method):
+            if isinstance(method, _STREAMING):
+                return factory(method)
+            return factory(self._limited(name, method))
+
+        return limited_factory
+
+    def _state(self, name: str) -> _MethodLimit:
+        state = self._limits.get(name)
+        if state is None:
+            state = self._limits[name] = _MethodLimit(
+                float(self.initial_limit), self.burst
+            )
+        return state
+
+    def _try_acquire(self, state: _MethodLimit, now: float) -> Optional[float]:
+        """Take a slot, or return how long to wait before trying again.
+
+        ``math.inf`` means until an attempt finishes. Called with the
+        condition held.
+        """
+        if state.in_flight >= int(state.limit):
+            return math.inf
+        if self.rate is not None:
+            state.tokens = min(
+                self.burst, state.tokens + (now - state.refilled) * self.rate
+            )
+            state.refilled = now
+            if state.tokens < 1:
+                return (1 - state.tokens) / self.rate
+            state.tokens -= 1
+        state.in_flight += 1
+        return None
+
+    def _wait_time(self, name: str, wait: float, deadline: Optional[float]) -> float:
+        now = time.monotonic()
+        if deadline is None:
+            return wait
+        if now >= deadline:
+            raise core_exceptions.DeadlineExceeded(
+                "Timed out waiting for the client-side limit of {}".format(name)
+            )
+        return min(wait, deadline - now)
+
+    def _acquire(self, name: str, timeout: Any) -> float:
+        started = time.monotonic()
+        deadline = started + timeout if isinstance(timeout, (int, float)) else None
+        with self._condition:
+            state = self._state(name)
+            wait = self._try_acquire(state, started)
+            if wait is not None:
+                self.throttled += 1
+            while wait is not None:
+                wait = self._wait_time(name, wait, deadline)
+                self._condition.wait(None if wait == math.inf else wait)
+                wait = self._try_acquire(state, time.monotonic())
+        return started
+
+    async def _acquire_async(self, name: str, timeout: Any) -> float:
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        deadline = started + timeout if isinstance(timeout, (int, float)) else None
+        throttled = False
+        while True:
+            with self._condition:
+                state = self._state(name)
+                wait = self._try_acquire(state, time.monotonic())
+                if wait is None:
+                    return started
+                if not throttled:
+                    throttled = True
+                    self.throttled += 1
+                wait = self._wait_time(name, wait, deadline)
+                waiter = (loop, loop.create_future())
+                self._async_waiters.add(waiter)
+            try:
+                await asyncio.wait_for(waiter[1], None if wait == math.inf else wait)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._condition:
+                    self._async_waiters.discard(waiter)
+
+    def _release(
+        self, name: str, started: float, exception: Optional[BaseException]
+    ) -> None:
+        with self._condition:
+            state = self._limits[name]
+            state.in_flight -= 1
+            if _overloaded(exception):
+                if started >= state.cut:
+                    state.limit = max(self.min_limit, state.limit * self.backoff)
+                    state.cut = time.monotonic()
+            elif exception is None:
+                state.limit = min(self.max_limit, state.limit + 1 / state.limit)
+            self._condition.notify_all()
+            waiters = list(self._async_waiters)
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # The waiter's event loop has been closed.
+                pass
+
+    def _limited(self, name: str, method: Callable) -> Callable:
+        def attempt(request, *args, **kwargs):
+            started = self._acquire(name, kwargs.get("timeout"))
+            if "timeout" in kwargs:
+                kwargs["timeout"] = _remaining(
+                    kwargs["timeout"], time.monotonic() - started
+                )
+            exception = None
+            try:
+                return method(request, *args, **kwargs)
+            except BaseException as exc:
+                exception = exc
+                raise
+            finally:
+                self._release(name, started, exception)
+
+        return attempt
+
+    def wrap_async(self, name: str, stub: Callable) -> Callable:
+        """Make each call of an asyncio unary stub wait for the limiter."""
+
+        async def attempt(request, **kwargs):
+            return await self._call_async(name, stub, request, kwargs)
+
+        return attempt
+
+    async def _call_async(self, name: str, stub: Callable, request, kwargs):
+        started = await self._acquire_async(name, kwargs.get("timeout"))
+        if "timeout" in kwargs:
+            kwargs["timeout"] = _remaining(
+                kwargs["timeout"], time.monotonic() - started
+            )
+        exception = None
+        try:
+            return await stub(request, **kwargs)
+        except BaseException as exc:
+            exception = exc
+            raise
+        finally:
+            self._release(name, started, exception)
+
+
+__all__ = ("Limiter",)
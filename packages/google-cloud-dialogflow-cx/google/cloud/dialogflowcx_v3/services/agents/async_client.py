@@ -50,6 +50,7 @@ from google.protobuf import empty_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import struct_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3.services.agents import pagers
 from google.cloud.dialogflowcx_v3.types import (
     generative_settings as gcdc_generative_settings,
@@ -66,7 +67,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, AgentsTransport
 from .transports.grpc_asyncio import AgentsGrpcAsyncIOTransport
 
 
-class AgentsAsyncClient:
+class AgentsAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing [Agents][google.cloud.dialogflow.cx.v3.Agent]."""
 
     _client: AgentsClient
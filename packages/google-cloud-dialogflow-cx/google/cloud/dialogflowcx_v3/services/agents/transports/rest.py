@@ -46,6 +46,7 @@ except AttributeError:  # pragma: NO COVER
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import http_pool, rest_encoding, transcoding
 from google.cloud.dialogflowcx_v3.types import (
     generative_settings as gcdc_generative_settings,
 )
@@ -540,6 +541,7 @@ class AgentsRestTransport(AgentsTransport):
         url_scheme: str = "https",
         interceptor: Optional[AgentsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -572,6 +574,10 @@ class AgentsRestTransport(AgentsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            http_pool_options (Optional[google.cloud.dialogflowcx_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -594,12 +600,21 @@ class AgentsRestTransport(AgentsTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
         self._operations_client: Optional[operations_v1.AbstractOperationsClient] = None
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+            self._operations_client = None
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or AgentsRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -675,6 +690,16 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{parent=projects/*/locations/*}/agents",
+                    "body": "agent",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: gcdc_agent.CreateAgentRequest,
@@ -714,16 +739,9 @@ class AgentsRestTransport(AgentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{parent=projects/*/locations/*}/agents",
-                    "body": "agent",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_agent(request, metadata)
             pb_request = gcdc_agent.CreateAgentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -735,17 +753,13 @@ class AgentsRestTransport(AgentsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -754,7 +768,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -785,6 +799,15 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: agent.DeleteAgentRequest,
@@ -806,30 +829,20 @@ class AgentsRestTransport(AgentsTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_agent(request, metadata)
             pb_request = agent.DeleteAgentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -838,7 +851,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -860,6 +873,16 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*}:export",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: agent.ExportAgentRequest,
@@ -888,16 +911,9 @@ class AgentsRestTransport(AgentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*}:export",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_export_agent(request, metadata)
             pb_request = agent.ExportAgentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -909,17 +925,13 @@ class AgentsRestTransport(AgentsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -928,7 +940,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -957,6 +969,15 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: agent.GetAgentRequest,
@@ -996,30 +1017,20 @@ class AgentsRestTransport(AgentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_agent(request, metadata)
             pb_request = agent.GetAgentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1028,7 +1039,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1058,6 +1069,15 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/validationResult}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: agent.GetAgentValidationResultRequest,
@@ -1086,32 +1106,22 @@ class AgentsRestTransport(AgentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/validationResult}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_agent_validation_result(
                 request, metadata
             )
             pb_request = agent.GetAgentValidationResultRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1120,7 +1130,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1152,6 +1162,15 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/generativeSettings}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: agent.GetGenerativeSettingsRequest,
@@ -1178,32 +1197,22 @@ class AgentsRestTransport(AgentsTransport):
                     Settings for Generative AI.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/generativeSettings}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_generative_settings(
                 request, metadata
             )
             pb_request = agent.GetGenerativeSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1212,7 +1221,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1242,6 +1251,15 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{parent=projects/*/locations/*}/agents",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: agent.ListAgentsRequest,
@@ -1269,30 +1287,20 @@ class AgentsRestTransport(AgentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{parent=projects/*/locations/*}/agents",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_agents(request, metadata)
             pb_request = agent.ListAgentsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1301,7 +1309,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1331,6 +1339,16 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*}:restore",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: agent.RestoreAgentRequest,
@@ -1359,16 +1377,9 @@ class AgentsRestTransport(AgentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*}:restore",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_restore_agent(request, metadata)
             pb_request = agent.RestoreAgentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1380,17 +1391,13 @@ class AgentsRestTransport(AgentsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1399,7 +1406,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1428,6 +1435,16 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v3/{agent.name=projects/*/locations/*/agents/*}",
+                    "body": "agent",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: gcdc_agent.UpdateAgentRequest,
@@ -1467,16 +1484,9 @@ class AgentsRestTransport(AgentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v3/{agent.name=projects/*/locations/*/agents/*}",
-                    "body": "agent",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_agent(request, metadata)
             pb_request = gcdc_agent.UpdateAgentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1488,17 +1498,13 @@ class AgentsRestTransport(AgentsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1507,7 +1513,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1538,6 +1544,16 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v3/{generative_settings.name=projects/*/locations/*/agents/*/generativeSettings}",
+                    "body": "generative_settings",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: agent.UpdateGenerativeSettingsRequest,
@@ -1565,18 +1581,11 @@ class AgentsRestTransport(AgentsTransport):
                         Settings for Generative AI.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v3/{generative_settings.name=projects/*/locations/*/agents/*/generativeSettings}",
-                    "body": "generative_settings",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_generative_settings(
                 request, metadata
             )
             pb_request = agent.UpdateGenerativeSettingsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1588,17 +1597,13 @@ class AgentsRestTransport(AgentsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1607,7 +1612,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1638,6 +1643,16 @@ class AgentsRestTransport(AgentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*}:validate",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: agent.ValidateAgentRequest,
@@ -1665,16 +1680,9 @@ class AgentsRestTransport(AgentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*}:validate",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_validate_agent(request, metadata)
             pb_request = agent.ValidateAgentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1686,17 +1694,13 @@ class AgentsRestTransport(AgentsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1705,7 +1709,7 @@ class AgentsRestTransport(AgentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -50,6 +50,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout, resource_names
 from google.cloud.dialogflowcx_v3.services.changelogs import pagers
 from google.cloud.dialogflowcx_v3.types import changelog
 
@@ -94,7 +95,7 @@ class ChangelogsClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class ChangelogsClient(metaclass=ChangelogsClientMeta):
+class ChangelogsClient(fanout.FanOutMixin, metaclass=ChangelogsClientMeta):
     """Service for managing
     [Changelogs][google.cloud.dialogflow.cx.v3.Changelog].
     """
@@ -189,81 +190,66 @@ class ChangelogsClient(metaclass=ChangelogsClientMeta):
         changelog: str,
     ) -> str:
         """Returns a fully-qualified changelog string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/changelogs/{changelog}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            changelog=changelog,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/changelogs/{changelog}"
+        ).format(project, location, agent, changelog)
 
     @staticmethod
     def parse_changelog_path(path: str) -> Dict[str, str]:
         """Parses a changelog path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/changelogs/(?P<changelog>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/changelogs/{changelog}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -271,16 +257,14 @@ class ChangelogsClient(metaclass=ChangelogsClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -39,6 +39,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.longrunning import operations_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import http_pool, rest_encoding, transcoding
 from google.cloud.dialogflowcx_v3.types import changelog
 
 from .base import ChangelogsTransport
@@ -281,6 +282,7 @@ class ChangelogsRestTransport(ChangelogsTransport):
         url_scheme: str = "https",
         interceptor: Optional[ChangelogsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -313,6 +315,10 @@ class ChangelogsRestTransport(ChangelogsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            http_pool_options (Optional[google.cloud.dialogflowcx_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -335,11 +341,19 @@ class ChangelogsRestTransport(ChangelogsTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or ChangelogsRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -357,6 +371,15 @@ class ChangelogsRestTransport(ChangelogsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/changelogs/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: changelog.GetChangelogRequest,
@@ -384,30 +407,20 @@ class ChangelogsRestTransport(ChangelogsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/changelogs/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_changelog(request, metadata)
             pb_request = changelog.GetChangelogRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -416,7 +429,7 @@ class ChangelogsRestTransport(ChangelogsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -446,6 +459,15 @@ class ChangelogsRestTransport(ChangelogsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/changelogs",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: changelog.ListChangelogsRequest,
@@ -473,30 +495,20 @@ class ChangelogsRestTransport(ChangelogsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/changelogs",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_changelogs(request, metadata)
             pb_request = changelog.ListChangelogsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -505,7 +517,7 @@ class ChangelogsRestTransport(ChangelogsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -46,6 +46,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3.services.deployments import pagers
 from google.cloud.dialogflowcx_v3.types import deployment
 
@@ -54,7 +55,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, DeploymentsTransport
 from .transports.grpc_asyncio import DeploymentsGrpcAsyncIOTransport
 
 
-class DeploymentsAsyncClient:
+class DeploymentsAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [Deployments][google.cloud.dialogflow.cx.v3.Deployment].
     """
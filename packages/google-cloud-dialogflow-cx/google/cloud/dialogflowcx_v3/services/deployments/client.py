@@ -50,6 +50,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout, resource_names
 from google.cloud.dialogflowcx_v3.services.deployments import pagers
 from google.cloud.dialogflowcx_v3.types import deployment
 
@@ -94,7 +95,7 @@ class DeploymentsClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class DeploymentsClient(metaclass=DeploymentsClientMeta):
+class DeploymentsClient(fanout.FanOutMixin, metaclass=DeploymentsClientMeta):
     """Service for managing
     [Deployments][google.cloud.dialogflow.cx.v3.Deployment].
     """
@@ -190,22 +191,16 @@ class DeploymentsClient(metaclass=DeploymentsClientMeta):
         deployment: str,
     ) -> str:
         """Returns a fully-qualified deployment string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/deployments/{deployment}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            environment=environment,
-            deployment=deployment,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/deployments/{deployment}"
+        ).format(project, location, agent, environment, deployment)
 
     @staticmethod
     def parse_deployment_path(path: str) -> Dict[str, str]:
         """Parses a deployment path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/environments/(?P<environment>.+?)/deployments/(?P<deployment>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/deployments/{deployment}"
+        ).parse(path)
 
     @staticmethod
     def experiment_path(
@@ -216,22 +211,16 @@ class DeploymentsClient(metaclass=DeploymentsClientMeta):
         experiment: str,
     ) -> str:
         """Returns a fully-qualified experiment string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/experiments/{experiment}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            environment=environment,
-            experiment=experiment,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/experiments/{experiment}"
+        ).format(project, location, agent, environment, experiment)
 
     @staticmethod
     def parse_experiment_path(path: str) -> Dict[str, str]:
         """Parses a experiment path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/environments/(?P<environment>.+?)/experiments/(?P<experiment>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/experiments/{experiment}"
+        ).parse(path)
 
     @staticmethod
     def test_case_result_path(
@@ -242,22 +231,16 @@ class DeploymentsClient(metaclass=DeploymentsClientMeta):
         result: str,
     ) -> str:
         """Returns a fully-qualified test_case_result string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}/results/{result}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            test_case=test_case,
-            result=result,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}/results/{result}"
+        ).format(project, location, agent, test_case, result)
 
     @staticmethod
     def parse_test_case_result_path(path: str) -> Dict[str, str]:
         """Parses a test_case_result path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/testCases/(?P<test_case>.+?)/results/(?P<result>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}/results/{result}"
+        ).parse(path)
 
     @staticmethod
     def version_path(
@@ -268,82 +251,66 @@ class DeploymentsClient(metaclass=DeploymentsClientMeta):
         version: str,
     ) -> str:
         """Returns a fully-qualified version string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-            version=version,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}"
+        ).format(project, location, agent, flow, version)
 
     @staticmethod
     def parse_version_path(path: str) -> Dict[str, str]:
         """Parses a version path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/versions/(?P<version>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -351,16 +318,14 @@ class DeploymentsClient(metaclass=DeploymentsClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
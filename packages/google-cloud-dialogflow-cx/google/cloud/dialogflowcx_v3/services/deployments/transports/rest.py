@@ -39,6 +39,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.longrunning import operations_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import http_pool, rest_encoding, transcoding
 from google.cloud.dialogflowcx_v3.types import deployment
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -283,6 +284,7 @@ class DeploymentsRestTransport(DeploymentsTransport):
         url_scheme: str = "https",
         interceptor: Optional[DeploymentsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -315,6 +317,10 @@ class DeploymentsRestTransport(DeploymentsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            http_pool_options (Optional[google.cloud.dialogflowcx_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -337,11 +343,19 @@ class DeploymentsRestTransport(DeploymentsTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or DeploymentsRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -359,6 +373,15 @@ class DeploymentsRestTransport(DeploymentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/environments/*/deployments/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: deployment.GetDeploymentRequest,
@@ -391,30 +414,20 @@ class DeploymentsRestTransport(DeploymentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/environments/*/deployments/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_deployment(request, metadata)
             pb_request = deployment.GetDeploymentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -423,7 +436,7 @@ class DeploymentsRestTransport(DeploymentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -453,6 +466,15 @@ class DeploymentsRestTransport(DeploymentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*/environments/*}/deployments",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: deployment.ListDeploymentsRequest,
@@ -480,32 +502,22 @@ class DeploymentsRestTransport(DeploymentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*/environments/*}/deployments",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_deployments(
                 request, metadata
             )
             pb_request = deployment.ListDeploymentsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -514,7 +526,7 @@ class DeploymentsRestTransport(DeploymentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -46,6 +46,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3.services.entity_types import pagers
 from google.cloud.dialogflowcx_v3.types import entity_type
 from google.cloud.dialogflowcx_v3.types import entity_type as gcdc_entity_type
@@ -55,7 +56,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, EntityTypesTransport
 from .transports.grpc_asyncio import EntityTypesGrpcAsyncIOTransport
 
 
-class EntityTypesAsyncClient:
+class EntityTypesAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [EntityTypes][google.cloud.dialogflow.cx.v3.EntityType].
     """
@@ -40,6 +40,7 @@ except AttributeError:  # pragma: NO COVER
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import http_pool, rest_encoding, transcoding
 from google.cloud.dialogflowcx_v3.types import entity_type
 from google.cloud.dialogflowcx_v3.types import entity_type as gcdc_entity_type
 
@@ -363,6 +364,7 @@ class EntityTypesRestTransport(EntityTypesTransport):
         url_scheme: str = "https",
         interceptor: Optional[EntityTypesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -395,6 +397,10 @@ class EntityTypesRestTransport(EntityTypesTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            http_pool_options (Optional[google.cloud.dialogflowcx_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -417,11 +423,19 @@ class EntityTypesRestTransport(EntityTypesTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or EntityTypesRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -439,6 +453,16 @@ class EntityTypesRestTransport(EntityTypesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/entityTypes",
+                    "body": "entity_type",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: gcdc_entity_type.CreateEntityTypeRequest,
@@ -499,18 +523,11 @@ class EntityTypesRestTransport(EntityTypesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/entityTypes",
-                    "body": "entity_type",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_entity_type(
                 request, metadata
             )
             pb_request = gcdc_entity_type.CreateEntityTypeRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -522,17 +539,13 @@ class EntityTypesRestTransport(EntityTypesTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -541,7 +554,7 @@ class EntityTypesRestTransport(EntityTypesTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -572,6 +585,15 @@ class EntityTypesRestTransport(EntityTypesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/entityTypes/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: entity_type.DeleteEntityTypeRequest,
@@ -593,32 +615,22 @@ class EntityTypesRestTransport(EntityTypesTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/entityTypes/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_entity_type(
                 request, metadata
             )
             pb_request = entity_type.DeleteEntityTypeRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -627,7 +639,7 @@ class EntityTypesRestTransport(EntityTypesTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -649,6 +661,15 @@ class EntityTypesRestTransport(EntityTypesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/entityTypes/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: entity_type.GetEntityTypeRequest,
@@ -709,30 +730,20 @@ class EntityTypesRestTransport(EntityTypesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/entityTypes/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_entity_type(request, metadata)
             pb_request = entity_type.GetEntityTypeRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -741,7 +752,7 @@ class EntityTypesRestTransport(EntityTypesTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -771,6 +782,15 @@ class EntityTypesRestTransport(EntityTypesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/entityTypes",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: entity_type.ListEntityTypesRequest,
@@ -798,32 +818,22 @@ class EntityTypesRestTransport(EntityTypesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/entityTypes",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_entity_types(
                 request, metadata
             )
             pb_request = entity_type.ListEntityTypesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -832,7 +842,7 @@ class EntityTypesRestTransport(EntityTypesTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -862,6 +872,16 @@ class EntityTypesRestTransport(EntityTypesTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v3/{entity_type.name=projects/*/locations/*/agents/*/entityTypes/*}",
+                    "body": "entity_type",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: gcdc_entity_type.UpdateEntityTypeRequest,
@@ -922,18 +942,11 @@ class EntityTypesRestTransport(EntityTypesTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v3/{entity_type.name=projects/*/locations/*/agents/*/entityTypes/*}",
-                    "body": "entity_type",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_entity_type(
                 request, metadata
             )
             pb_request = gcdc_entity_type.UpdateEntityTypeRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -945,17 +958,13 @@ class EntityTypesRestTransport(EntityTypesTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -964,7 +973,7 @@ class EntityTypesRestTransport(EntityTypesTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -50,6 +50,7 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import struct_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3.services.environments import pagers
 from google.cloud.dialogflowcx_v3.types import environment
 from google.cloud.dialogflowcx_v3.types import environment as gcdc_environment
@@ -59,7 +60,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, EnvironmentsTransport
 from .transports.grpc_asyncio import EnvironmentsGrpcAsyncIOTransport
 
 
-class EnvironmentsAsyncClient:
+class EnvironmentsAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [Environments][google.cloud.dialogflow.cx.v3.Environment].
     """
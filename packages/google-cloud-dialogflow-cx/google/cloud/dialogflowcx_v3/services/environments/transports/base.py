@@ -27,6 +27,7 @@ from google.longrunning import operations_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import forking, wrapping
 from google.cloud.dialogflowcx_v3 import gapic_version as package_version
 from google.cloud.dialogflowcx_v3.types import environment
 from google.cloud.dialogflowcx_v3.types import environment as gcdc_environment
@@ -125,56 +126,80 @@ class EnvironmentsTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_environments: gapic_v1.method.wrap_method(
-                self.list_environments,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_environment: gapic_v1.method.wrap_method(
-                self.get_environment,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_environment: gapic_v1.method.wrap_method(
-                self.create_environment,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_environment: gapic_v1.method.wrap_method(
-                self.update_environment,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_environment: gapic_v1.method.wrap_method(
-                self.delete_environment,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.lookup_environment_history: gapic_v1.method.wrap_method(
-                self.lookup_environment_history,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.run_continuous_test: gapic_v1.method.wrap_method(
-                self.run_continuous_test,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_continuous_test_results: gapic_v1.method.wrap_method(
-                self.list_continuous_test_results,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.deploy_flow: gapic_v1.method.wrap_method(
-                self.deploy_flow,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_environments": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_environment": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_environment": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_environment": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_environment": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "lookup_environment_history": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "run_continuous_test": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_continuous_test_results": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "deploy_flow": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
@@ -46,6 +46,7 @@ except AttributeError:  # pragma: NO COVER
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import http_pool, rest_encoding, transcoding
 from google.cloud.dialogflowcx_v3.types import environment
 from google.cloud.dialogflowcx_v3.types import environment as gcdc_environment
 
@@ -493,6 +494,7 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
         url_scheme: str = "https",
         interceptor: Optional[EnvironmentsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -525,6 +527,10 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            http_pool_options (Optional[google.cloud.dialogflowcx_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -547,12 +553,21 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
         self._operations_client: Optional[operations_v1.AbstractOperationsClient] = None
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+            self._operations_client = None
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or EnvironmentsRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -628,6 +643,16 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/environments",
+                    "body": "environment",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: gcdc_environment.CreateEnvironmentRequest,
@@ -656,18 +681,11 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/environments",
-                    "body": "environment",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_environment(
                 request, metadata
             )
             pb_request = gcdc_environment.CreateEnvironmentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -679,17 +697,13 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -698,7 +712,7 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -727,6 +741,15 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/environments/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: environment.DeleteEnvironmentRequest,
@@ -748,32 +771,22 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/environments/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_environment(
                 request, metadata
             )
             pb_request = environment.DeleteEnvironmentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -782,7 +795,7 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -804,6 +817,16 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{environment=projects/*/locations/*/agents/*/environments/*}:deployFlow",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: environment.DeployFlowRequest,
@@ -832,16 +855,9 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{environment=projects/*/locations/*/agents/*/environments/*}:deployFlow",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_deploy_flow(request, metadata)
             pb_request = environment.DeployFlowRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -853,17 +869,13 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -872,7 +884,7 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -901,6 +913,15 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/environments/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: environment.GetEnvironmentRequest,
@@ -941,30 +962,20 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/environments/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_environment(request, metadata)
             pb_request = environment.GetEnvironmentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -973,7 +984,7 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1003,6 +1014,15 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*/environments/*}/continuousTestResults",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: environment.ListContinuousTestResultsRequest,
@@ -1031,32 +1051,22 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*/environments/*}/continuousTestResults",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_continuous_test_results(
                 request, metadata
             )
             pb_request = environment.ListContinuousTestResultsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1065,7 +1075,7 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1095,6 +1105,15 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/environments",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: environment.ListEnvironmentsRequest,
@@ -1122,32 +1141,22 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/environments",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_environments(
                 request, metadata
             )
             pb_request = environment.ListEnvironmentsRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1156,7 +1165,7 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1186,6 +1195,15 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/environments/*}:lookupEnvironmentHistory",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: environment.LookupEnvironmentHistoryRequest,
@@ -1214,32 +1232,22 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/environments/*}:lookupEnvironmentHistory",
-                },
-            ]
             request, metadata = self._interceptor.pre_lookup_environment_history(
                 request, metadata
             )
             pb_request = environment.LookupEnvironmentHistoryRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1248,7 +1256,7 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1278,6 +1286,16 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{environment=projects/*/locations/*/agents/*/environments/*}:runContinuousTest",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: environment.RunContinuousTestRequest,
@@ -1306,18 +1324,11 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{environment=projects/*/locations/*/agents/*/environments/*}:runContinuousTest",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_run_continuous_test(
                 request, metadata
             )
             pb_request = environment.RunContinuousTestRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1329,17 +1340,13 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1348,7 +1355,7 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1379,6 +1386,16 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v3/{environment.name=projects/*/locations/*/agents/*/environments/*}",
+                    "body": "environment",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: gcdc_environment.UpdateEnvironmentRequest,
@@ -1407,18 +1424,11 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v3/{environment.name=projects/*/locations/*/agents/*/environments/*}",
-                    "body": "environment",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_environment(
                 request, metadata
             )
             pb_request = gcdc_environment.UpdateEnvironmentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1430,17 +1440,13 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1449,7 +1455,7 @@ class EnvironmentsRestTransport(EnvironmentsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -48,6 +48,7 @@ from google.protobuf import duration_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3.services.experiments import pagers
 from google.cloud.dialogflowcx_v3.types import experiment
 from google.cloud.dialogflowcx_v3.types import experiment as gcdc_experiment
@@ -57,7 +58,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, ExperimentsTransport
 from .transports.grpc_asyncio import ExperimentsGrpcAsyncIOTransport
 
 
-class ExperimentsAsyncClient:
+class ExperimentsAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [Experiments][google.cloud.dialogflow.cx.v3.Experiment].
     """
@@ -52,6 +52,7 @@ from google.protobuf import duration_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout, resource_names
 from google.cloud.dialogflowcx_v3.services.experiments import pagers
 from google.cloud.dialogflowcx_v3.types import experiment
 from google.cloud.dialogflowcx_v3.types import experiment as gcdc_experiment
@@ -97,7 +98,7 @@ class ExperimentsClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class ExperimentsClient(metaclass=ExperimentsClientMeta):
+class ExperimentsClient(fanout.FanOutMixin, metaclass=ExperimentsClientMeta):
     """Service for managing
     [Experiments][google.cloud.dialogflow.cx.v3.Experiment].
     """
@@ -193,22 +194,16 @@ class ExperimentsClient(metaclass=ExperimentsClientMeta):
         experiment: str,
     ) -> str:
         """Returns a fully-qualified experiment string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/experiments/{experiment}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            environment=environment,
-            experiment=experiment,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/experiments/{experiment}"
+        ).format(project, location, agent, environment, experiment)
 
     @staticmethod
     def parse_experiment_path(path: str) -> Dict[str, str]:
         """Parses a experiment path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/environments/(?P<environment>.+?)/experiments/(?P<experiment>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/experiments/{experiment}"
+        ).parse(path)
 
     @staticmethod
     def version_path(
@@ -219,82 +214,66 @@ class ExperimentsClient(metaclass=ExperimentsClientMeta):
         version: str,
     ) -> str:
         """Returns a fully-qualified version string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-            version=version,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}"
+        ).format(project, location, agent, flow, version)
 
     @staticmethod
     def parse_version_path(path: str) -> Dict[str, str]:
         """Parses a version path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/versions/(?P<version>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -302,16 +281,14 @@ class ExperimentsClient(metaclass=ExperimentsClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
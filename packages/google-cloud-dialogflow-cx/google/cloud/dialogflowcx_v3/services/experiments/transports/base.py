@@ -27,6 +27,7 @@ from google.longrunning import operations_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import forking, wrapping
 from google.cloud.dialogflowcx_v3 import gapic_version as package_version
 from google.cloud.dialogflowcx_v3.types import experiment
 from google.cloud.dialogflowcx_v3.types import experiment as gcdc_experiment
@@ -125,46 +126,70 @@ class ExperimentsTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_experiments: gapic_v1.method.wrap_method(
-                self.list_experiments,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_experiment: gapic_v1.method.wrap_method(
-                self.get_experiment,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_experiment: gapic_v1.method.wrap_method(
-                self.create_experiment,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_experiment: gapic_v1.method.wrap_method(
-                self.update_experiment,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_experiment: gapic_v1.method.wrap_method(
-                self.delete_experiment,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.start_experiment: gapic_v1.method.wrap_method(
-                self.start_experiment,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.stop_experiment: gapic_v1.method.wrap_method(
-                self.stop_experiment,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_experiments": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_experiment": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_experiment": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_experiment": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_experiment": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "start_experiment": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "stop_experiment": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
@@ -55,6 +55,7 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import struct_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout, resource_names
 from google.cloud.dialogflowcx_v3.services.flows import pagers
 from google.cloud.dialogflowcx_v3.types import advanced_settings
 from google.cloud.dialogflowcx_v3.types import flow
@@ -102,7 +103,7 @@ class FlowsClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class FlowsClient(metaclass=FlowsClientMeta):
+class FlowsClient(fanout.FanOutMixin, metaclass=FlowsClientMeta):
     """Service for managing [Flows][google.cloud.dialogflow.cx.v3.Flow]."""
 
     @staticmethod
@@ -195,21 +196,16 @@ class FlowsClient(metaclass=FlowsClientMeta):
         flow: str,
     ) -> str:
         """Returns a fully-qualified flow string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}"
+        ).format(project, location, agent, flow)
 
     @staticmethod
     def parse_flow_path(path: str) -> Dict[str, str]:
         """Parses a flow path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}"
+        ).parse(path)
 
     @staticmethod
     def flow_validation_result_path(
@@ -219,21 +215,16 @@ class FlowsClient(metaclass=FlowsClientMeta):
         flow: str,
     ) -> str:
         """Returns a fully-qualified flow_validation_result string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/validationResult".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/validationResult"
+        ).format(project, location, agent, flow)
 
     @staticmethod
     def parse_flow_validation_result_path(path: str) -> Dict[str, str]:
         """Parses a flow_validation_result path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/validationResult$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/validationResult"
+        ).parse(path)
 
     @staticmethod
     def intent_path(
@@ -243,21 +234,16 @@ class FlowsClient(metaclass=FlowsClientMeta):
         intent: str,
     ) -> str:
         """Returns a fully-qualified intent string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            intent=intent,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}"
+        ).format(project, location, agent, intent)
 
     @staticmethod
     def parse_intent_path(path: str) -> Dict[str, str]:
         """Parses a intent path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/intents/(?P<intent>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}"
+        ).parse(path)
 
     @staticmethod
     def page_path(
@@ -268,22 +254,16 @@ class FlowsClient(metaclass=FlowsClientMeta):
         page: str,
     ) -> str:
         """Returns a fully-qualified page string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/pages/{page}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-            page=page,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/pages/{page}"
+        ).format(project, location, agent, flow, page)
 
     @staticmethod
     def parse_page_path(path: str) -> Dict[str, str]:
         """Parses a page path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/pages/(?P<page>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/pages/{page}"
+        ).parse(path)
 
     @staticmethod
     def transition_route_group_path(
@@ -294,22 +274,16 @@ class FlowsClient(metaclass=FlowsClientMeta):
         transition_route_group: str,
     ) -> str:
         """Returns a fully-qualified transition_route_group string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/transitionRouteGroups/{transition_route_group}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-            transition_route_group=transition_route_group,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/transitionRouteGroups/{transition_route_group}"
+        ).format(project, location, agent, flow, transition_route_group)
 
     @staticmethod
     def parse_transition_route_group_path(path: str) -> Dict[str, str]:
         """Parses a transition_route_group path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/transitionRouteGroups/(?P<transition_route_group>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/transitionRouteGroups/{transition_route_group}"
+        ).parse(path)
 
     @staticmethod
     def webhook_path(
@@ -319,81 +293,66 @@ class FlowsClient(metaclass=FlowsClientMeta):
         webhook: str,
     ) -> str:
         """Returns a fully-qualified webhook string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            webhook=webhook,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}"
+        ).format(project, location, agent, webhook)
 
     @staticmethod
     def parse_webhook_path(path: str) -> Dict[str, str]:
         """Parses a webhook path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/webhooks/(?P<webhook>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -401,16 +360,14 @@ class FlowsClient(metaclass=FlowsClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
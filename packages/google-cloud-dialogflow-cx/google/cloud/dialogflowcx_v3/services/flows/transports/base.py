@@ -27,6 +27,7 @@ from google.longrunning import operations_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import forking, wrapping
 from google.cloud.dialogflowcx_v3 import gapic_version as package_version
 from google.cloud.dialogflowcx_v3.types import flow
 from google.cloud.dialogflowcx_v3.types import flow as gcdc_flow
@@ -125,61 +126,85 @@ class FlowsTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.create_flow: gapic_v1.method.wrap_method(
-                self.create_flow,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_flow: gapic_v1.method.wrap_method(
-                self.delete_flow,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_flows: gapic_v1.method.wrap_method(
-                self.list_flows,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_flow: gapic_v1.method.wrap_method(
-                self.get_flow,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_flow: gapic_v1.method.wrap_method(
-                self.update_flow,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.train_flow: gapic_v1.method.wrap_method(
-                self.train_flow,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.validate_flow: gapic_v1.method.wrap_method(
-                self.validate_flow,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_flow_validation_result: gapic_v1.method.wrap_method(
-                self.get_flow_validation_result,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.import_flow: gapic_v1.method.wrap_method(
-                self.import_flow,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.export_flow: gapic_v1.method.wrap_method(
-                self.export_flow,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "create_flow": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_flow": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_flows": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_flow": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_flow": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "train_flow": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "validate_flow": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_flow_validation_result": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "import_flow": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "export_flow": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
@@ -46,6 +46,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3.services.generators import pagers
 from google.cloud.dialogflowcx_v3.types import generator
 from google.cloud.dialogflowcx_v3.types import generator as gcdc_generator
@@ -55,7 +56,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, GeneratorsTransport
 from .transports.grpc_asyncio import GeneratorsGrpcAsyncIOTransport
 
 
-class GeneratorsAsyncClient:
+class GeneratorsAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [Generators][google.cloud.dialogflow.cx.v3.Generator]
     """
@@ -48,6 +48,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3.services.intents import pagers
 from google.cloud.dialogflowcx_v3.types import intent
 from google.cloud.dialogflowcx_v3.types import intent as gcdc_intent
@@ -57,7 +58,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, IntentsTransport
 from .transports.grpc_asyncio import IntentsGrpcAsyncIOTransport
 
 
-class IntentsAsyncClient:
+class IntentsAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [Intents][google.cloud.dialogflow.cx.v3.Intent].
     """
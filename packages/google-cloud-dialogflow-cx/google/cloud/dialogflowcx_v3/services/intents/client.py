@@ -52,6 +52,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout, resource_names
 from google.cloud.dialogflowcx_v3.services.intents import pagers
 from google.cloud.dialogflowcx_v3.types import intent
 from google.cloud.dialogflowcx_v3.types import intent as gcdc_intent
@@ -97,7 +98,7 @@ class IntentsClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class IntentsClient(metaclass=IntentsClientMeta):
+class IntentsClient(fanout.FanOutMixin, metaclass=IntentsClientMeta):
     """Service for managing
     [Intents][google.cloud.dialogflow.cx.v3.Intent].
     """
@@ -192,21 +193,16 @@ class IntentsClient(metaclass=IntentsClientMeta):
         entity_type: str,
     ) -> str:
         """Returns a fully-qualified entity_type string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/entityTypes/{entity_type}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            entity_type=entity_type,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/entityTypes/{entity_type}"
+        ).format(project, location, agent, entity_type)
 
     @staticmethod
     def parse_entity_type_path(path: str) -> Dict[str, str]:
         """Parses a entity_type path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/entityTypes/(?P<entity_type>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/entityTypes/{entity_type}"
+        ).parse(path)
 
     @staticmethod
     def intent_path(
@@ -216,81 +212,66 @@ class IntentsClient(metaclass=IntentsClientMeta):
         intent: str,
     ) -> str:
         """Returns a fully-qualified intent string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            intent=intent,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}"
+        ).format(project, location, agent, intent)
 
     @staticmethod
     def parse_intent_path(path: str) -> Dict[str, str]:
         """Parses a intent path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/intents/(?P<intent>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -298,16 +279,14 @@ class IntentsClient(metaclass=IntentsClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
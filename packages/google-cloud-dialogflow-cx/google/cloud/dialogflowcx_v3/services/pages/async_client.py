@@ -46,6 +46,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3.services.pages import pagers
 from google.cloud.dialogflowcx_v3.types import advanced_settings, fulfillment
 from google.cloud.dialogflowcx_v3.types import page
@@ -56,7 +57,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, PagesTransport
 from .transports.grpc_asyncio import PagesGrpcAsyncIOTransport
 
 
-class PagesAsyncClient:
+class PagesAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing [Pages][google.cloud.dialogflow.cx.v3.Page]."""
 
     _client: PagesClient
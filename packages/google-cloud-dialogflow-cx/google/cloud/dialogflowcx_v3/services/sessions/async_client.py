@@ -48,6 +48,7 @@ except AttributeError:  # pragma: NO COVER
 from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3.types import audio_config, page, session
 
 from .client import SessionsClient
@@ -55,7 +56,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, SessionsTransport
 from .transports.grpc_asyncio import SessionsGrpcAsyncIOTransport
 
 
-class SessionsAsyncClient:
+class SessionsAsyncClient(fanout.AsyncFanOutMixin):
     """A session represents an interaction with a user. You retrieve user
     input and pass it to the
     [DetectIntent][google.cloud.dialogflow.cx.v3.Sessions.DetectIntent]
@@ -51,6 +51,7 @@ except AttributeError:  # pragma: NO COVER
 from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout, resource_names
 from google.cloud.dialogflowcx_v3.types import audio_config, page, session
 
 from .transports.base import DEFAULT_CLIENT_INFO, SessionsTransport
@@ -94,7 +95,7 @@ class SessionsClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class SessionsClient(metaclass=SessionsClientMeta):
+class SessionsClient(fanout.FanOutMixin, metaclass=SessionsClientMeta):
     """A session represents an interaction with a user. You retrieve user
     input and pass it to the
     [DetectIntent][google.cloud.dialogflow.cx.v3.Sessions.DetectIntent]
@@ -190,20 +191,16 @@ class SessionsClient(metaclass=SessionsClientMeta):
         data_store: str,
     ) -> str:
         """Returns a fully-qualified data_store string."""
-        return "projects/{project}/locations/{location}/dataStores/{data_store}".format(
-            project=project,
-            location=location,
-            data_store=data_store,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/dataStores/{data_store}"
+        ).format(project, location, data_store)
 
     @staticmethod
     def parse_data_store_path(path: str) -> Dict[str, str]:
         """Parses a data_store path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/dataStores/(?P<data_store>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/dataStores/{data_store}"
+        ).parse(path)
 
     @staticmethod
     def entity_type_path(
@@ -213,21 +210,16 @@ class SessionsClient(metaclass=SessionsClientMeta):
         entity_type: str,
     ) -> str:
         """Returns a fully-qualified entity_type string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/entityTypes/{entity_type}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            entity_type=entity_type,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/entityTypes/{entity_type}"
+        ).format(project, location, agent, entity_type)
 
     @staticmethod
     def parse_entity_type_path(path: str) -> Dict[str, str]:
         """Parses a entity_type path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/entityTypes/(?P<entity_type>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/entityTypes/{entity_type}"
+        ).parse(path)
 
     @staticmethod
     def flow_path(
@@ -237,21 +229,16 @@ class SessionsClient(metaclass=SessionsClientMeta):
         flow: str,
     ) -> str:
         """Returns a fully-qualified flow string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}"
+        ).format(project, location, agent, flow)
 
     @staticmethod
     def parse_flow_path(path: str) -> Dict[str, str]:
         """Parses a flow path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}"
+        ).parse(path)
 
     @staticmethod
     def intent_path(
@@ -261,21 +248,16 @@ class SessionsClient(metaclass=SessionsClientMeta):
         intent: str,
     ) -> str:
         """Returns a fully-qualified intent string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            intent=intent,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}"
+        ).format(project, location, agent, intent)
 
     @staticmethod
     def parse_intent_path(path: str) -> Dict[str, str]:
         """Parses a intent path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/intents/(?P<intent>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}"
+        ).parse(path)
 
     @staticmethod
     def page_path(
@@ -286,22 +268,16 @@ class SessionsClient(metaclass=SessionsClientMeta):
         page: str,
     ) -> str:
         """Returns a fully-qualified page string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/pages/{page}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-            page=page,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/pages/{page}"
+        ).format(project, location, agent, flow, page)
 
     @staticmethod
     def parse_page_path(path: str) -> Dict[str, str]:
         """Parses a page path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/pages/(?P<page>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/pages/{page}"
+        ).parse(path)
 
     @staticmethod
     def session_path(
@@ -311,21 +287,16 @@ class SessionsClient(metaclass=SessionsClientMeta):
         session: str,
     ) -> str:
         """Returns a fully-qualified session string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/sessions/{session}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            session=session,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/sessions/{session}"
+        ).format(project, location, agent, session)
 
     @staticmethod
     def parse_session_path(path: str) -> Dict[str, str]:
         """Parses a session path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/sessions/(?P<session>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/sessions/{session}"
+        ).parse(path)
 
     @staticmethod
     def session_entity_type_path(
@@ -336,22 +307,16 @@ class SessionsClient(metaclass=SessionsClientMeta):
         entity_type: str,
     ) -> str:
         """Returns a fully-qualified session_entity_type string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/sessions/{session}/entityTypes/{entity_type}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            session=session,
-            entity_type=entity_type,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/sessions/{session}/entityTypes/{entity_type}"
+        ).format(project, location, agent, session, entity_type)
 
     @staticmethod
     def parse_session_entity_type_path(path: str) -> Dict[str, str]:
         """Parses a session_entity_type path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/sessions/(?P<session>.+?)/entityTypes/(?P<entity_type>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/sessions/{session}/entityTypes/{entity_type}"
+        ).parse(path)
 
     @staticmethod
     def transition_route_group_path(
@@ -362,22 +327,16 @@ class SessionsClient(metaclass=SessionsClientMeta):
         transition_route_group: str,
     ) -> str:
         """Returns a fully-qualified transition_route_group string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/transitionRouteGroups/{transition_route_group}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-            transition_route_group=transition_route_group,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/transitionRouteGroups/{transition_route_group}"
+        ).format(project, location, agent, flow, transition_route_group)
 
     @staticmethod
     def parse_transition_route_group_path(path: str) -> Dict[str, str]:
         """Parses a transition_route_group path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/transitionRouteGroups/(?P<transition_route_group>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/transitionRouteGroups/{transition_route_group}"
+        ).parse(path)
 
     @staticmethod
     def version_path(
@@ -388,22 +347,16 @@ class SessionsClient(metaclass=SessionsClientMeta):
         version: str,
     ) -> str:
         """Returns a fully-qualified version string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-            version=version,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}"
+        ).format(project, location, agent, flow, version)
 
     @staticmethod
     def parse_version_path(path: str) -> Dict[str, str]:
         """Parses a version path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/versions/(?P<version>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}"
+        ).parse(path)
 
     @staticmethod
     def webhook_path(
@@ -413,81 +366,66 @@ class SessionsClient(metaclass=SessionsClientMeta):
         webhook: str,
     ) -> str:
         """Returns a fully-qualified webhook string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            webhook=webhook,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}"
+        ).format(project, location, agent, webhook)
 
     @staticmethod
     def parse_webhook_path(path: str) -> Dict[str, str]:
         """Parses a webhook path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/webhooks/(?P<webhook>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -495,16 +433,14 @@ class SessionsClient(metaclass=SessionsClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -26,6 +26,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import forking, wrapping
 from google.cloud.dialogflowcx_v3 import gapic_version as package_version
 from google.cloud.dialogflowcx_v3.types import session
 
@@ -123,45 +124,69 @@ class SessionsTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.detect_intent: gapic_v1.method.wrap_method(
-                self.detect_intent,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "detect_intent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=220.0,
                     ),
-                    deadline=220.0,
+                    default_timeout=220.0,
+                    client_info=client_info,
                 ),
-                default_timeout=220.0,
-                client_info=client_info,
-            ),
-            self.streaming_detect_intent: gapic_v1.method.wrap_method(
-                self.streaming_detect_intent,
-                default_timeout=220.0,
-                client_info=client_info,
-            ),
-            self.match_intent: gapic_v1.method.wrap_method(
-                self.match_intent,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.fulfill_intent: gapic_v1.method.wrap_method(
-                self.fulfill_intent,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.submit_answer_feedback: gapic_v1.method.wrap_method(
-                self.submit_answer_feedback,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+                "streaming_detect_intent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=220.0,
+                    client_info=client_info,
+                ),
+                "match_intent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "fulfill_intent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "submit_answer_feedback": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
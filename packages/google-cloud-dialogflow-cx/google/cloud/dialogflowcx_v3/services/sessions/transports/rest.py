@@ -39,6 +39,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.longrunning import operations_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import http_pool, rest_encoding, transcoding
 from google.cloud.dialogflowcx_v3.types import session
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -341,6 +342,7 @@ class SessionsRestTransport(SessionsTransport):
         url_scheme: str = "https",
         interceptor: Optional[SessionsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -373,6 +375,10 @@ class SessionsRestTransport(SessionsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            http_pool_options (Optional[google.cloud.dialogflowcx_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -395,11 +401,19 @@ class SessionsRestTransport(SessionsTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or SessionsRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -417,6 +431,21 @@ class SessionsRestTransport(SessionsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{session=projects/*/locations/*/agents/*/sessions/*}:detectIntent",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v3/{session=projects/*/locations/*/agents/*/environments/*/sessions/*}:detectIntent",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: session.DetectIntentRequest,
@@ -443,21 +472,9 @@ class SessionsRestTransport(SessionsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{session=projects/*/locations/*/agents/*/sessions/*}:detectIntent",
-                    "body": "*",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v3/{session=projects/*/locations/*/agents/*/environments/*/sessions/*}:detectIntent",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_detect_intent(request, metadata)
             pb_request = session.DetectIntentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -469,17 +486,13 @@ class SessionsRestTransport(SessionsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -488,7 +501,7 @@ class SessionsRestTransport(SessionsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -509,6 +522,21 @@ class SessionsRestTransport(SessionsTransport):
         def __hash__(self):
             return hash("FulfillIntent")
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{match_intent_request.session=projects/*/locations/*/agents/*/sessions/*}:fulfillIntent",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v3/{match_intent_request.session=projects/*/locations/*/agents/*/environments/*/sessions/*}:fulfillIntent",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: session.FulfillIntentRequest,
@@ -533,21 +561,9 @@ class SessionsRestTransport(SessionsTransport):
                     Response of [FulfillIntent][]
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{match_intent_request.session=projects/*/locations/*/agents/*/sessions/*}:fulfillIntent",
-                    "body": "*",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v3/{match_intent_request.session=projects/*/locations/*/agents/*/environments/*/sessions/*}:fulfillIntent",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_fulfill_intent(request, metadata)
             pb_request = session.FulfillIntentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -559,16 +575,12 @@ class SessionsRestTransport(SessionsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
             )
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -577,7 +589,7 @@ class SessionsRestTransport(SessionsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -608,6 +620,21 @@ class SessionsRestTransport(SessionsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{session=projects/*/locations/*/agents/*/sessions/*}:matchIntent",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v3/{session=projects/*/locations/*/agents/*/environments/*/sessions/*}:matchIntent",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: session.MatchIntentRequest,
@@ -632,21 +659,9 @@ class SessionsRestTransport(SessionsTransport):
                     Response of [MatchIntent][].
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{session=projects/*/locations/*/agents/*/sessions/*}:matchIntent",
-                    "body": "*",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v3/{session=projects/*/locations/*/agents/*/environments/*/sessions/*}:matchIntent",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_match_intent(request, metadata)
             pb_request = session.MatchIntentRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -658,17 +673,13 @@ class SessionsRestTransport(SessionsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -677,7 +688,7 @@ class SessionsRestTransport(SessionsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -724,6 +735,16 @@ class SessionsRestTransport(SessionsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{session=projects/*/locations/*/agents/*/sessions/*}:submitAnswerFeedback",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: session.SubmitAnswerFeedbackRequest,
@@ -751,18 +772,11 @@ class SessionsRestTransport(SessionsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{session=projects/*/locations/*/agents/*/sessions/*}:submitAnswerFeedback",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_submit_answer_feedback(
                 request, metadata
             )
             pb_request = session.SubmitAnswerFeedbackRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -774,17 +788,13 @@ class SessionsRestTransport(SessionsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -793,7 +803,7 @@ class SessionsRestTransport(SessionsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -53,6 +53,7 @@ from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout, resource_names
 from google.cloud.dialogflowcx_v3.services.test_cases import pagers
 from google.cloud.dialogflowcx_v3.types import test_case
 from google.cloud.dialogflowcx_v3.types import test_case as gcdc_test_case
@@ -98,7 +99,7 @@ class TestCasesClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class TestCasesClient(metaclass=TestCasesClientMeta):
+class TestCasesClient(fanout.FanOutMixin, metaclass=TestCasesClientMeta):
     """Service for managing [Test
     Cases][google.cloud.dialogflow.cx.v3.TestCase] and [Test Case
     Results][google.cloud.dialogflow.cx.v3.TestCaseResult].
@@ -193,20 +194,16 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         agent: str,
     ) -> str:
         """Returns a fully-qualified agent string."""
-        return "projects/{project}/locations/{location}/agents/{agent}".format(
-            project=project,
-            location=location,
-            agent=agent,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}"
+        ).format(project, location, agent)
 
     @staticmethod
     def parse_agent_path(path: str) -> Dict[str, str]:
         """Parses a agent path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}"
+        ).parse(path)
 
     @staticmethod
     def entity_type_path(
@@ -216,21 +213,16 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         entity_type: str,
     ) -> str:
         """Returns a fully-qualified entity_type string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/entityTypes/{entity_type}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            entity_type=entity_type,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/entityTypes/{entity_type}"
+        ).format(project, location, agent, entity_type)
 
     @staticmethod
     def parse_entity_type_path(path: str) -> Dict[str, str]:
         """Parses a entity_type path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/entityTypes/(?P<entity_type>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/entityTypes/{entity_type}"
+        ).parse(path)
 
     @staticmethod
     def environment_path(
@@ -240,21 +232,16 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         environment: str,
     ) -> str:
         """Returns a fully-qualified environment string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            environment=environment,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}"
+        ).format(project, location, agent, environment)
 
     @staticmethod
     def parse_environment_path(path: str) -> Dict[str, str]:
         """Parses a environment path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/environments/(?P<environment>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}"
+        ).parse(path)
 
     @staticmethod
     def flow_path(
@@ -264,21 +251,16 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         flow: str,
     ) -> str:
         """Returns a fully-qualified flow string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}"
+        ).format(project, location, agent, flow)
 
     @staticmethod
     def parse_flow_path(path: str) -> Dict[str, str]:
         """Parses a flow path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}"
+        ).parse(path)
 
     @staticmethod
     def intent_path(
@@ -288,21 +270,16 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         intent: str,
     ) -> str:
         """Returns a fully-qualified intent string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            intent=intent,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}"
+        ).format(project, location, agent, intent)
 
     @staticmethod
     def parse_intent_path(path: str) -> Dict[str, str]:
         """Parses a intent path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/intents/(?P<intent>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/intents/{intent}"
+        ).parse(path)
 
     @staticmethod
     def page_path(
@@ -313,22 +290,16 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         page: str,
     ) -> str:
         """Returns a fully-qualified page string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/pages/{page}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-            page=page,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/pages/{page}"
+        ).format(project, location, agent, flow, page)
 
     @staticmethod
     def parse_page_path(path: str) -> Dict[str, str]:
         """Parses a page path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/pages/(?P<page>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/pages/{page}"
+        ).parse(path)
 
     @staticmethod
     def test_case_path(
@@ -338,21 +309,16 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         test_case: str,
     ) -> str:
         """Returns a fully-qualified test_case string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            test_case=test_case,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}"
+        ).format(project, location, agent, test_case)
 
     @staticmethod
     def parse_test_case_path(path: str) -> Dict[str, str]:
         """Parses a test_case path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/testCases/(?P<test_case>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}"
+        ).parse(path)
 
     @staticmethod
     def test_case_result_path(
@@ -363,22 +329,16 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         result: str,
     ) -> str:
         """Returns a fully-qualified test_case_result string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}/results/{result}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            test_case=test_case,
-            result=result,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}/results/{result}"
+        ).format(project, location, agent, test_case, result)
 
     @staticmethod
     def parse_test_case_result_path(path: str) -> Dict[str, str]:
         """Parses a test_case_result path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/testCases/(?P<test_case>.+?)/results/(?P<result>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}/results/{result}"
+        ).parse(path)
 
     @staticmethod
     def transition_route_group_path(
@@ -389,22 +349,16 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         transition_route_group: str,
     ) -> str:
         """Returns a fully-qualified transition_route_group string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/transitionRouteGroups/{transition_route_group}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-            transition_route_group=transition_route_group,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/transitionRouteGroups/{transition_route_group}"
+        ).format(project, location, agent, flow, transition_route_group)
 
     @staticmethod
     def parse_transition_route_group_path(path: str) -> Dict[str, str]:
         """Parses a transition_route_group path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/transitionRouteGroups/(?P<transition_route_group>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/transitionRouteGroups/{transition_route_group}"
+        ).parse(path)
 
     @staticmethod
     def webhook_path(
@@ -414,81 +368,66 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         webhook: str,
     ) -> str:
         """Returns a fully-qualified webhook string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            webhook=webhook,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}"
+        ).format(project, location, agent, webhook)
 
     @staticmethod
     def parse_webhook_path(path: str) -> Dict[str, str]:
         """Parses a webhook path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/webhooks/(?P<webhook>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -496,16 +435,14 @@ class TestCasesClient(metaclass=TestCasesClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -40,6 +40,7 @@ except AttributeError:  # pragma: NO COVER
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import http_pool, rest_encoding, transcoding
 from google.cloud.dialogflowcx_v3.types import (
     transition_route_group as gcdc_transition_route_group,
 )
@@ -379,6 +380,7 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
         url_scheme: str = "https",
         interceptor: Optional[TransitionRouteGroupsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -411,6 +413,10 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            http_pool_options (Optional[google.cloud.dialogflowcx_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -433,11 +439,19 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            self._session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                self._session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(self._session)
+
+        # Run again on the first call in a forked child.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or TransitionRouteGroupsRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -455,6 +469,21 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*/flows/*}/transitionRouteGroups",
+                    "body": "transition_route_group",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/transitionRouteGroups",
+                    "body": "transition_route_group",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: gcdc_transition_route_group.CreateTransitionRouteGroupRequest,
@@ -485,18 +514,6 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*/flows/*}/transitionRouteGroups",
-                    "body": "transition_route_group",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/transitionRouteGroups",
-                    "body": "transition_route_group",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_transition_route_group(
                 request, metadata
             )
@@ -505,7 +522,7 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -517,17 +534,13 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -536,7 +549,7 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -567,6 +580,19 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/flows/*/transitionRouteGroups/*}",
+                },
+                {
+                    "method": "delete",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/transitionRouteGroups/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: transition_route_group.DeleteTransitionRouteGroupRequest,
@@ -589,38 +615,24 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                         sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/flows/*/transitionRouteGroups/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/transitionRouteGroups/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_transition_route_group(
                 request, metadata
             )
             pb_request = transition_route_group.DeleteTransitionRouteGroupRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -629,7 +641,7 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -651,6 +663,19 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/flows/*/transitionRouteGroups/*}",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v3/{name=projects/*/locations/*/agents/*/transitionRouteGroups/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: transition_route_group.GetTransitionRouteGroupRequest,
@@ -681,38 +706,24 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/flows/*/transitionRouteGroups/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v3/{name=projects/*/locations/*/agents/*/transitionRouteGroups/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_transition_route_group(
                 request, metadata
             )
             pb_request = transition_route_group.GetTransitionRouteGroupRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -721,7 +732,7 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -751,6 +762,19 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*/flows/*}/transitionRouteGroups",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/transitionRouteGroups",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: transition_route_group.ListTransitionRouteGroupsRequest,
@@ -779,38 +803,24 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*/flows/*}/transitionRouteGroups",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v3/{parent=projects/*/locations/*/agents/*}/transitionRouteGroups",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_transition_route_groups(
                 request, metadata
             )
             pb_request = transition_route_group.ListTransitionRouteGroupsRequest.pb(
                 request
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -819,7 +829,7 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -849,6 +859,21 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v3/{transition_route_group.name=projects/*/locations/*/agents/*/flows/*/transitionRouteGroups/*}",
+                    "body": "transition_route_group",
+                },
+                {
+                    "method": "patch",
+                    "uri": "/v3/{transition_route_group.name=projects/*/locations/*/agents/*/transitionRouteGroups/*}",
+                    "body": "transition_route_group",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: gcdc_transition_route_group.UpdateTransitionRouteGroupRequest,
@@ -879,18 +904,6 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v3/{transition_route_group.name=projects/*/locations/*/agents/*/flows/*/transitionRouteGroups/*}",
-                    "body": "transition_route_group",
-                },
-                {
-                    "method": "patch",
-                    "uri": "/v3/{transition_route_group.name=projects/*/locations/*/agents/*/transitionRouteGroups/*}",
-                    "body": "transition_route_group",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_transition_route_group(
                 request, metadata
             )
@@ -899,7 +912,7 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                     request
                 )
             )
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -911,17 +924,13 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -930,7 +939,7 @@ class TransitionRouteGroupsRestTransport(TransitionRouteGroupsTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
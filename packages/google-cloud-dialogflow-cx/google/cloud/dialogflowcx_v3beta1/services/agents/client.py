@@ -54,6 +54,7 @@ from google.protobuf import empty_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import struct_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout, resource_names
 from google.cloud.dialogflowcx_v3beta1.services.agents import pagers
 from google.cloud.dialogflowcx_v3beta1.types import (
     generative_settings as gcdc_generative_settings,
@@ -106,7 +107,7 @@ class AgentsClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class AgentsClient(metaclass=AgentsClientMeta):
+class AgentsClient(fanout.FanOutMixin, metaclass=AgentsClientMeta):
     """Service for managing
     [Agents][google.cloud.dialogflow.cx.v3beta1.Agent].
     """
@@ -200,20 +201,16 @@ class AgentsClient(metaclass=AgentsClientMeta):
         agent: str,
     ) -> str:
         """Returns a fully-qualified agent string."""
-        return "projects/{project}/locations/{location}/agents/{agent}".format(
-            project=project,
-            location=location,
-            agent=agent,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}"
+        ).format(project, location, agent)
 
     @staticmethod
     def parse_agent_path(path: str) -> Dict[str, str]:
         """Parses a agent path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}"
+        ).parse(path)
 
     @staticmethod
     def agent_generative_settings_path(
@@ -222,20 +219,16 @@ class AgentsClient(metaclass=AgentsClientMeta):
         agent: str,
     ) -> str:
         """Returns a fully-qualified agent_generative_settings string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/generativeSettings".format(
-            project=project,
-            location=location,
-            agent=agent,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/generativeSettings"
+        ).format(project, location, agent)
 
     @staticmethod
     def parse_agent_generative_settings_path(path: str) -> Dict[str, str]:
         """Parses a agent_generative_settings path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/generativeSettings$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/generativeSettings"
+        ).parse(path)
 
     @staticmethod
     def agent_validation_result_path(
@@ -244,20 +237,16 @@ class AgentsClient(metaclass=AgentsClientMeta):
         agent: str,
     ) -> str:
         """Returns a fully-qualified agent_validation_result string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/validationResult".format(
-            project=project,
-            location=location,
-            agent=agent,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/validationResult"
+        ).format(project, location, agent)
 
     @staticmethod
     def parse_agent_validation_result_path(path: str) -> Dict[str, str]:
         """Parses a agent_validation_result path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/validationResult$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/validationResult"
+        ).parse(path)
 
     @staticmethod
     def environment_path(
@@ -267,21 +256,16 @@ class AgentsClient(metaclass=AgentsClientMeta):
         environment: str,
     ) -> str:
         """Returns a fully-qualified environment string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            environment=environment,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}"
+        ).format(project, location, agent, environment)
 
     @staticmethod
     def parse_environment_path(path: str) -> Dict[str, str]:
         """Parses a environment path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/environments/(?P<environment>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}"
+        ).parse(path)
 
     @staticmethod
     def flow_path(
@@ -291,21 +275,16 @@ class AgentsClient(metaclass=AgentsClientMeta):
         flow: str,
     ) -> str:
         """Returns a fully-qualified flow string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}"
+        ).format(project, location, agent, flow)
 
     @staticmethod
     def parse_flow_path(path: str) -> Dict[str, str]:
         """Parses a flow path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}"
+        ).parse(path)
 
     @staticmethod
     def flow_validation_result_path(
@@ -315,21 +294,16 @@ class AgentsClient(metaclass=AgentsClientMeta):
         flow: str,
     ) -> str:
         """Returns a fully-qualified flow_validation_result string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/validationResult".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/validationResult"
+        ).format(project, location, agent, flow)
 
     @staticmethod
     def parse_flow_validation_result_path(path: str) -> Dict[str, str]:
         """Parses a flow_validation_result path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/validationResult$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/validationResult"
+        ).parse(path)
 
     @staticmethod
     def security_settings_path(
@@ -338,80 +312,66 @@ class AgentsClient(metaclass=AgentsClientMeta):
         security_settings: str,
     ) -> str:
         """Returns a fully-qualified security_settings string."""
-        return "projects/{project}/locations/{location}/securitySettings/{security_settings}".format(
-            project=project,
-            location=location,
-            security_settings=security_settings,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/securitySettings/{security_settings}"
+        ).format(project, location, security_settings)
 
     @staticmethod
     def parse_security_settings_path(path: str) -> Dict[str, str]:
         """Parses a security_settings path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/securitySettings/(?P<security_settings>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/securitySettings/{security_settings}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -419,16 +379,14 @@ class AgentsClient(metaclass=AgentsClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -27,6 +27,7 @@ from google.longrunning import operations_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import forking, wrapping
 from google.cloud.dialogflowcx_v3beta1 import gapic_version as package_version
 from google.cloud.dialogflowcx_v3beta1.types import (
     generative_settings as gcdc_generative_settings,
@@ -129,75 +130,99 @@ class AgentsTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_agents: gapic_v1.method.wrap_method(
-                self.list_agents,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_agent: gapic_v1.method.wrap_method(
-                self.get_agent,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_agent: gapic_v1.method.wrap_method(
-                self.create_agent,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_agents": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_agent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_agent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=180.0,
                     ),
-                    deadline=180.0,
+                    default_timeout=180.0,
+                    client_info=client_info,
+                ),
+                "update_agent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_agent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "export_agent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "restore_agent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
                 ),
-                default_timeout=180.0,
-                client_info=client_info,
-            ),
-            self.update_agent: gapic_v1.method.wrap_method(
-                self.update_agent,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_agent: gapic_v1.method.wrap_method(
-                self.delete_agent,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.export_agent: gapic_v1.method.wrap_method(
-                self.export_agent,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.restore_agent: gapic_v1.method.wrap_method(
-                self.restore_agent,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.validate_agent: gapic_v1.method.wrap_method(
-                self.validate_agent,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_agent_validation_result: gapic_v1.method.wrap_method(
-                self.get_agent_validation_result,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_generative_settings: gapic_v1.method.wrap_method(
-                self.get_generative_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_generative_settings: gapic_v1.method.wrap_method(
-                self.update_generative_settings,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+                "validate_agent": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_agent_validation_result": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_generative_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_generative_settings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
@@ -46,6 +46,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3beta1.services.changelogs import pagers
 from google.cloud.dialogflowcx_v3beta1.types import changelog
 
@@ -54,7 +55,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, ChangelogsTransport
 from .transports.grpc_asyncio import ChangelogsGrpcAsyncIOTransport
 
 
-class ChangelogsAsyncClient:
+class ChangelogsAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [Changelogs][google.cloud.dialogflow.cx.v3beta1.Changelog].
     """
@@ -54,6 +54,7 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import struct_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout, resource_names
 from google.cloud.dialogflowcx_v3beta1.services.environments import pagers
 from google.cloud.dialogflowcx_v3beta1.types import environment as gcdc_environment
 from google.cloud.dialogflowcx_v3beta1.types import environment
@@ -99,7 +100,7 @@ class EnvironmentsClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class EnvironmentsClient(metaclass=EnvironmentsClientMeta):
+class EnvironmentsClient(fanout.FanOutMixin, metaclass=EnvironmentsClientMeta):
     """Service for managing
     [Environments][google.cloud.dialogflow.cx.v3beta1.Environment].
     """
@@ -195,22 +196,16 @@ class EnvironmentsClient(metaclass=EnvironmentsClientMeta):
         continuous_test_result: str,
     ) -> str:
         """Returns a fully-qualified continuous_test_result string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/continuousTestResults/{continuous_test_result}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            environment=environment,
-            continuous_test_result=continuous_test_result,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/continuousTestResults/{continuous_test_result}"
+        ).format(project, location, agent, environment, continuous_test_result)
 
     @staticmethod
     def parse_continuous_test_result_path(path: str) -> Dict[str, str]:
         """Parses a continuous_test_result path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/environments/(?P<environment>.+?)/continuousTestResults/(?P<continuous_test_result>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}/continuousTestResults/{continuous_test_result}"
+        ).parse(path)
 
     @staticmethod
     def environment_path(
@@ -220,21 +215,16 @@ class EnvironmentsClient(metaclass=EnvironmentsClientMeta):
         environment: str,
     ) -> str:
         """Returns a fully-qualified environment string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            environment=environment,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}"
+        ).format(project, location, agent, environment)
 
     @staticmethod
     def parse_environment_path(path: str) -> Dict[str, str]:
         """Parses a environment path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/environments/(?P<environment>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/environments/{environment}"
+        ).parse(path)
 
     @staticmethod
     def service_path(
@@ -244,21 +234,16 @@ class EnvironmentsClient(metaclass=EnvironmentsClientMeta):
         service: str,
     ) -> str:
         """Returns a fully-qualified service string."""
-        return "projects/{project}/locations/{location}/namespaces/{namespace}/services/{service}".format(
-            project=project,
-            location=location,
-            namespace=namespace,
-            service=service,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/namespaces/{namespace}/services/{service}"
+        ).format(project, location, namespace, service)
 
     @staticmethod
     def parse_service_path(path: str) -> Dict[str, str]:
         """Parses a service path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/namespaces/(?P<namespace>.+?)/services/(?P<service>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/namespaces/{namespace}/services/{service}"
+        ).parse(path)
 
     @staticmethod
     def test_case_path(
@@ -268,21 +253,16 @@ class EnvironmentsClient(metaclass=EnvironmentsClientMeta):
         test_case: str,
     ) -> str:
         """Returns a fully-qualified test_case string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            test_case=test_case,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}"
+        ).format(project, location, agent, test_case)
 
     @staticmethod
     def parse_test_case_path(path: str) -> Dict[str, str]:
         """Parses a test_case path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/testCases/(?P<test_case>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}"
+        ).parse(path)
 
     @staticmethod
     def test_case_result_path(
@@ -293,22 +273,16 @@ class EnvironmentsClient(metaclass=EnvironmentsClientMeta):
         result: str,
     ) -> str:
         """Returns a fully-qualified test_case_result string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}/results/{result}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            test_case=test_case,
-            result=result,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}/results/{result}"
+        ).format(project, location, agent, test_case, result)
 
     @staticmethod
     def parse_test_case_result_path(path: str) -> Dict[str, str]:
         """Parses a test_case_result path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/testCases/(?P<test_case>.+?)/results/(?P<result>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/testCases/{test_case}/results/{result}"
+        ).parse(path)
 
     @staticmethod
     def version_path(
@@ -319,22 +293,16 @@ class EnvironmentsClient(metaclass=EnvironmentsClientMeta):
         version: str,
     ) -> str:
         """Returns a fully-qualified version string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            flow=flow,
-            version=version,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}"
+        ).format(project, location, agent, flow, version)
 
     @staticmethod
     def parse_version_path(path: str) -> Dict[str, str]:
         """Parses a version path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/flows/(?P<flow>.+?)/versions/(?P<version>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}/versions/{version}"
+        ).parse(path)
 
     @staticmethod
     def webhook_path(
@@ -344,81 +312,66 @@ class EnvironmentsClient(metaclass=EnvironmentsClientMeta):
         webhook: str,
     ) -> str:
         """Returns a fully-qualified webhook string."""
-        return "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}".format(
-            project=project,
-            location=location,
-            agent=agent,
-            webhook=webhook,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}"
+        ).format(project, location, agent, webhook)
 
     @staticmethod
     def parse_webhook_path(path: str) -> Dict[str, str]:
         """Parses a webhook path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/agents/(?P<agent>.+?)/webhooks/(?P<webhook>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/agents/{agent}/webhooks/{webhook}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -426,16 +379,14 @@ class EnvironmentsClient(metaclass=EnvironmentsClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
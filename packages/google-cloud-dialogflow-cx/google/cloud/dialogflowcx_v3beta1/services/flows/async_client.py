@@ -51,6 +51,7 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import struct_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3beta1.services.flows import pagers
 from google.cloud.dialogflowcx_v3beta1.types import advanced_settings
 from google.cloud.dialogflowcx_v3beta1.types import flow
@@ -62,7 +63,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, FlowsTransport
 from .transports.grpc_asyncio import FlowsGrpcAsyncIOTransport
 
 
-class FlowsAsyncClient:
+class FlowsAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [Flows][google.cloud.dialogflow.cx.v3beta1.Flow].
     """
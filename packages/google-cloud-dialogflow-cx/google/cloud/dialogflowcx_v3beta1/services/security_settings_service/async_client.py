@@ -46,6 +46,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3beta1.services.security_settings_service import pagers
 from google.cloud.dialogflowcx_v3beta1.types import (
     security_settings as gcdc_security_settings,
@@ -57,7 +58,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, SecuritySettingsServiceTranspo
 from .transports.grpc_asyncio import SecuritySettingsServiceGrpcAsyncIOTransport
 
 
-class SecuritySettingsServiceAsyncClient:
+class SecuritySettingsServiceAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing security settings for Dialogflow."""
 
     _client: SecuritySettingsServiceClient
@@ -50,6 +50,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout, resource_names
 from google.cloud.dialogflowcx_v3beta1.services.security_settings_service import pagers
 from google.cloud.dialogflowcx_v3beta1.types import (
     security_settings as gcdc_security_settings,
@@ -99,7 +100,9 @@ class SecuritySettingsServiceClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class SecuritySettingsServiceClient(metaclass=SecuritySettingsServiceClientMeta):
+class SecuritySettingsServiceClient(
+    fanout.FanOutMixin, metaclass=SecuritySettingsServiceClientMeta
+):
     """Service for managing security settings for Dialogflow."""
 
     @staticmethod
@@ -191,20 +194,16 @@ class SecuritySettingsServiceClient(metaclass=SecuritySettingsServiceClientMeta)
         deidentify_template: str,
     ) -> str:
         """Returns a fully-qualified deidentify_template string."""
-        return "organizations/{organization}/locations/{location}/deidentifyTemplates/{deidentify_template}".format(
-            organization=organization,
-            location=location,
-            deidentify_template=deidentify_template,
-        )
+        return resource_names.get(
+            "organizations/{organization}/locations/{location}/deidentifyTemplates/{deidentify_template}"
+        ).format(organization, location, deidentify_template)
 
     @staticmethod
     def parse_deidentify_template_path(path: str) -> Dict[str, str]:
         """Parses a deidentify_template path into its component segments."""
-        m = re.match(
-            r"^organizations/(?P<organization>.+?)/locations/(?P<location>.+?)/deidentifyTemplates/(?P<deidentify_template>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "organizations/{organization}/locations/{location}/deidentifyTemplates/{deidentify_template}"
+        ).parse(path)
 
     @staticmethod
     def inspect_template_path(
@@ -213,20 +212,16 @@ class SecuritySettingsServiceClient(metaclass=SecuritySettingsServiceClientMeta)
         inspect_template: str,
     ) -> str:
         """Returns a fully-qualified inspect_template string."""
-        return "organizations/{organization}/locations/{location}/inspectTemplates/{inspect_template}".format(
-            organization=organization,
-            location=location,
-            inspect_template=inspect_template,
-        )
+        return resource_names.get(
+            "organizations/{organization}/locations/{location}/inspectTemplates/{inspect_template}"
+        ).format(organization, location, inspect_template)
 
     @staticmethod
     def parse_inspect_template_path(path: str) -> Dict[str, str]:
         """Parses a inspect_template path into its component segments."""
-        m = re.match(
-            r"^organizations/(?P<organization>.+?)/locations/(?P<location>.+?)/inspectTemplates/(?P<inspect_template>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "organizations/{organization}/locations/{location}/inspectTemplates/{inspect_template}"
+        ).parse(path)
 
     @staticmethod
     def security_settings_path(
@@ -235,80 +230,66 @@ class SecuritySettingsServiceClient(metaclass=SecuritySettingsServiceClientMeta)
         security_settings: str,
     ) -> str:
         """Returns a fully-qualified security_settings string."""
-        return "projects/{project}/locations/{location}/securitySettings/{security_settings}".format(
-            project=project,
-            location=location,
-            security_settings=security_settings,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/securitySettings/{security_settings}"
+        ).format(project, location, security_settings)
 
     @staticmethod
     def parse_security_settings_path(path: str) -> Dict[str, str]:
         """Parses a security_settings path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/securitySettings/(?P<security_settings>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/securitySettings/{security_settings}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -316,16 +297,14 @@ class SecuritySettingsServiceClient(metaclass=SecuritySettingsServiceClientMeta)
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -46,6 +46,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3beta1.services.session_entity_types import pagers
 from google.cloud.dialogflowcx_v3beta1.types import (
     session_entity_type as gcdc_session_entity_type,
@@ -58,7 +59,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, SessionEntityTypesTransport
 from .transports.grpc_asyncio import SessionEntityTypesGrpcAsyncIOTransport
 
 
-class SessionEntityTypesAsyncClient:
+class SessionEntityTypesAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [SessionEntityTypes][google.cloud.dialogflow.cx.v3beta1.SessionEntityType].
     """
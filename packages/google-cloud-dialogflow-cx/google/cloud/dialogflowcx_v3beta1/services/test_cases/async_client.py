@@ -49,6 +49,7 @@ from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3beta1.services.test_cases import pagers
 from google.cloud.dialogflowcx_v3beta1.types import test_case
 from google.cloud.dialogflowcx_v3beta1.types import test_case as gcdc_test_case
@@ -58,7 +59,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, TestCasesTransport
 from .transports.grpc_asyncio import TestCasesGrpcAsyncIOTransport
 
 
-class TestCasesAsyncClient:
+class TestCasesAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing [Test
     Cases][google.cloud.dialogflow.cx.v3beta1.TestCase] and [Test Case
     Results][google.cloud.dialogflow.cx.v3beta1.TestCaseResult].
@@ -27,6 +27,7 @@ from google.longrunning import operations_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import forking, wrapping
 from google.cloud.dialogflowcx_v3beta1 import gapic_version as package_version
 from google.cloud.dialogflowcx_v3beta1.types import test_case
 from google.cloud.dialogflowcx_v3beta1.types import test_case as gcdc_test_case
@@ -125,71 +126,95 @@ class TestCasesTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_test_cases: gapic_v1.method.wrap_method(
-                self.list_test_cases,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.batch_delete_test_cases: gapic_v1.method.wrap_method(
-                self.batch_delete_test_cases,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_test_case: gapic_v1.method.wrap_method(
-                self.get_test_case,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_test_case: gapic_v1.method.wrap_method(
-                self.create_test_case,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_test_case: gapic_v1.method.wrap_method(
-                self.update_test_case,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.run_test_case: gapic_v1.method.wrap_method(
-                self.run_test_case,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.batch_run_test_cases: gapic_v1.method.wrap_method(
-                self.batch_run_test_cases,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.calculate_coverage: gapic_v1.method.wrap_method(
-                self.calculate_coverage,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.import_test_cases: gapic_v1.method.wrap_method(
-                self.import_test_cases,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.export_test_cases: gapic_v1.method.wrap_method(
-                self.export_test_cases,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_test_case_results: gapic_v1.method.wrap_method(
-                self.list_test_case_results,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_test_case_result: gapic_v1.method.wrap_method(
-                self.get_test_case_result,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_test_cases": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "batch_delete_test_cases": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_test_case": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_test_case": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_test_case": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "run_test_case": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "batch_run_test_cases": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "calculate_coverage": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "import_test_cases": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "export_test_cases": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_test_case_results": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_test_case_result": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
@@ -46,6 +46,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3beta1.services.transition_route_groups import pagers
 from google.cloud.dialogflowcx_v3beta1.types import (
     transition_route_group as gcdc_transition_route_group,
@@ -58,7 +59,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, TransitionRouteGroupsTransport
 from .transports.grpc_asyncio import TransitionRouteGroupsGrpcAsyncIOTransport
 
 
-class TransitionRouteGroupsAsyncClient:
+class TransitionRouteGroupsAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [TransitionRouteGroups][google.cloud.dialogflow.cx.v3beta1.TransitionRouteGroup].
     """
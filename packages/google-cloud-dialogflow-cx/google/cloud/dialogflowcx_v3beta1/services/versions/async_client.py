@@ -51,6 +51,7 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import struct_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3beta1.services.versions import pagers
 from google.cloud.dialogflowcx_v3beta1.types import flow
 from google.cloud.dialogflowcx_v3beta1.types import version
@@ -61,7 +62,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, VersionsTransport
 from .transports.grpc_asyncio import VersionsGrpcAsyncIOTransport
 
 
-class VersionsAsyncClient:
+class VersionsAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [Versions][google.cloud.dialogflow.cx.v3beta1.Version].
     """
@@ -47,6 +47,7 @@ from google.longrunning import operations_pb2  # type: ignore
 from google.protobuf import duration_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 
+from google.cloud.dialogflowcx_helpers import fanout
 from google.cloud.dialogflowcx_v3beta1.services.webhooks import pagers
 from google.cloud.dialogflowcx_v3beta1.types import webhook
 from google.cloud.dialogflowcx_v3beta1.types import webhook as gcdc_webhook
@@ -56,7 +57,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, WebhooksTransport
 from .transports.grpc_asyncio import WebhooksGrpcAsyncIOTransport
 
 
-class WebhooksAsyncClient:
+class WebhooksAsyncClient(fanout.AsyncFanOutMixin):
     """Service for managing
     [Webhooks][google.cloud.dialogflow.cx.v3beta1.Webhook].
     """
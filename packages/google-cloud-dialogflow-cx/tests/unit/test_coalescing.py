@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from concurrent import futures
+
+from google.auth import credentials as ga_credentials
+
+from google.cloud.dialogflowcx_helpers import coalescing
+
+_NAME = "projects/p/locations/l/agents/a"
+
+
+def _concurrently(call, calls, **kwargs):
+    with futures.ThreadPoolExecutor(max_workers=calls) as pool:
+        results = [pool.submit(call, **kwargs) for _ in range(calls)]
+    return [result.result() for result in results]
+
+
+def test_identical_calls_of_named_method_share_one_rpc(server, grpc_client):
+    coalescer = coalescing.Coalescer(methods=["get_agent"])
+    server.delay = 0.1
+    client = grpc_client(coalescer)
+
+    responses = _concurrently(client.get_agent, 4, name=_NAME)
+
+    assert [r.name for r in responses] == [_NAME] * 4
+    assert len(server.requests) == 1
+    assert (coalescer.calls, coalescer.coalesced) == (1, 3)
+
+
+def test_method_without_retry_is_not_coalesced_unless_named(server, grpc_client):
+    coalescer = coalescing.Coalescer()
+    server.delay = 0.1
+    client = grpc_client(coalescer)
+
+    _concurrently(client.get_agent, 2, name=_NAME)
+
+    assert len(server.requests) == 2
+    assert coalescer.calls == 0
+
+
+def test_calls_of_different_callers_are_not_shared(server, grpc_client):
+    coalescer = coalescing.Coalescer(methods=["get_agent"])
+    server.delay = 0.1
+    clients = []
+    for caller in ("a@p.iam.gserviceaccount.com", "b@p.iam.gserviceaccount.com"):
+        credentials = ga_credentials.AnonymousCredentials()
+        credentials.service_account_email = caller
+        clients.append(grpc_client(coalescer, credentials=credentials))
+
+    with futures.ThreadPoolExecutor(max_workers=2) as pool:
+        results = [pool.submit(client.get_agent, name=_NAME) for client in clients]
+
+    assert [r.result().name for r in results] == [_NAME] * 2
+    assert (coalescer.calls, coalescer.coalesced) == (2, 0)
+
+
+def test_async_identical_calls_share_one_rpc(server, async_client):
+    coalescer = coalescing.Coalescer(methods=["get_agent"])
+    server.delay = 0.05
+
+    async def main():
+        client = async_client(coalescer)
+        return await asyncio.gather(*(client.get_agent(name=_NAME) for _ in range(4)))
+
+    responses = asyncio.run(main())
+
+    assert [r.name for r in responses] == [_NAME] * 4
+    assert len(server.requests) == 1
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import gzip
+import json
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+import grpc
+from requests import Request, Response
+from requests.sessions import Session
+
+from google.cloud.dialogflowcx_helpers import compression
+from google.cloud.dialogflowcx_v3 import AgentsClient
+from google.cloud.dialogflowcx_v3.types import agent
+
+_PARENT = "projects/p/locations/l"
+
+
+def _agent(description_size):
+    return agent.Agent(display_name="a", description="x" * description_size)
+
+
+def test_grpc_large_requests_are_compressed(server, grpc_client):
+    client = grpc_client(compression.Compression(methods=["create_agent"]))
+
+    for size in (4096, 16):
+        client.create_agent(parent=_PARENT, agent=_agent(size))
+    client.get_agent(name=_PARENT + "/agents/" + "x" * 4096)
+
+    assert server.calls[0]["compression"] == grpc.Compression.Gzip
+    assert "compression" not in server.calls[1]
+    assert "compression" not in server.calls[2]
+
+
+def test_rest_large_bodies_are_compressed():
+    client = AgentsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+    compression.Compression(methods=["create_agent"]).attach(client.transport)
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"name": "a"}'
+    response.request = Request("POST", "https://example.com").prepare()
+
+    with mock.patch.object(Session, "request", return_value=response) as request:
+        client.create_agent(parent=_PARENT, agent=_agent(4096))
+
+    kwargs = request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"]))["description"] == "x" * 4096
+
+
+def test_async_large_requests_are_compressed(server, async_client):
+    async def main():
+        client = async_client(
+            compression.Compression(methods=["create_agent"]),
+            methods=["create_agent"],
+        )
+        await client.create_agent(parent=_PARENT, agent=_agent(4096))
+
+    asyncio.run(main())
+
+    assert server.calls[0]["compression"] == grpc.Compression.Gzip
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import retry as retries
+from google.auth import credentials as ga_credentials
+import pytest
+from requests import Response
+
+from google.cloud.dialogflowcx_helpers import instrumentation
+from google.cloud.dialogflowcx_v3 import AgentsClient
+from google.cloud.dialogflowcx_v3.types import agent
+
+_NAME = "projects/p/locations/l/agents/a"
+
+
+def _kinds(events):
+    return [(e.kind, e.attempt, e.status) for e in events]
+
+
+def test_grpc_retry_reports_each_attempt(server, grpc_client):
+    events = []
+    client = grpc_client(instrumentation.Instrumentation(events.append))
+    server.errors = [core_exceptions.ServiceUnavailable("busy")]
+    retry = retries.Retry(
+        initial=0.01,
+        predicate=retries.if_exception_type(core_exceptions.ServiceUnavailable),
+    )
+
+    response = client.get_agent(name=_NAME, retry=retry)
+
+    assert _kinds(events) == [
+        ("start", 1, None),
+        ("end", 1, "UNAVAILABLE"),
+        ("start", 2, None),
+        ("end", 2, "OK"),
+        ("call", 2, "OK"),
+    ]
+    request = agent.GetAgentRequest(name=_NAME)
+    assert {e.method for e in events} == {"get_agent"}
+    assert {e.request_size for e in events} == {
+        agent.GetAgentRequest.pb(request).ByteSize()
+    }
+    assert events[3].response_size == agent.Agent.pb(response).ByteSize()
+
+
+def test_rest_error_status():
+    client = AgentsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+    events = []
+    instrumentation.Instrumentation(events.append).attach(client.transport)
+    response = Response()
+    response.status_code = 404
+    response._content = b'{"error": {"code": 404, "message": "no such agent"}}'
+    response.request = mock.Mock()
+
+    with mock.patch.object(
+        type(client.transport._session), "request", return_value=response
+    ):
+        with pytest.raises(core_exceptions.NotFound):
+            client.get_agent(name=_NAME)
+
+    assert _kinds(events) == [
+        ("start", 1, None),
+        ("end", 1, "NOT_FOUND"),
+        ("call", 1, "NOT_FOUND"),
+    ]
+    assert events[0].method == "get_agent"
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+from google.cloud.dialogflowcx_helpers import raw_messages
+from google.cloud.dialogflowcx_v3.types import agent
+
+_PARENT = "projects/p/locations/l"
+_NAME = _PARENT + "/agents/a"
+
+
+def test_response_is_protobuf(grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+
+    response = client.get_agent(name=_NAME)
+
+    assert type(response) is agent.Agent.pb()
+    assert response.default_language_code == "en"
+
+
+def test_pager_yields_protobuf_items(server, grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+
+    agents = list(client.list_agents(parent=_PARENT))
+
+    assert [type(a) for a in agents] == [agent.Agent.pb()] * 3
+    assert [a.name for a in agents] == ["a", "b", "c"]
+    assert [r.page_token for r in server.requests] == ["", "2"]
+
+
+def test_async_pager_yields_protobuf_items(async_client):
+    async def main():
+        client = async_client(raw_messages.RawMessages(), methods=["list_agents"])
+        pager = await client.list_agents(parent=_PARENT)
+        return [a async for a in pager]
+
+    agents = asyncio.run(main())
+
+    assert [type(a) for a in agents] == [agent.Agent.pb()] * 3
+    assert [a.name for a in agents] == ["a", "b", "c"]
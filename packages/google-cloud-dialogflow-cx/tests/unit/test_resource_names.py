@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+
+import pytest
+
+from google.cloud.dialogflowcx_helpers import resource_names
+from google.cloud.dialogflowcx_v3 import AgentsAsyncClient, AgentsClient
+
+_FLOW = "projects/{project}/locations/{location}/agents/{agent}/flows/{flow}"
+
+
+def _generated_parse(template, path):
+    # The code the generator emits for parse_*_path.
+    pattern = "^" + re.sub(r"\{(\w+)\}", r"(?P<\1>.+?)", template) + "$"
+    m = re.match(pattern, path)
+    return m.groupdict() if m else {}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "projects/p/locations/l/agents/a/flows/f",
+        "projects/p/locations/l/agents/a/flows/f/g",
+        "projects/p/locations/l/agents/a/b/flows/f",
+        "projects/p/locations/l/agents/a/flows/",
+        "projects/p/locations/l/agents/a/flows/f\n",
+        "projects/p/locations/l/agents/a",
+        "",
+    ],
+)
+def test_parse_matches_generated_code(path):
+    parsed = resource_names.ResourceName(_FLOW).parse(path)
+
+    assert parsed == _generated_parse(_FLOW, path)
+
+
+def test_client_methods():
+    path = AgentsClient.flow_path("p", "l", "a", "f")
+    fields = {"project": "p", "location": "l", "agent": "a", "flow": "f"}
+
+    assert path == "projects/p/locations/l/agents/a/flows/f"
+    assert AgentsClient.parse_flow_path(path) == fields
+    assert AgentsAsyncClient.parse_flow_path(path) == fields
+    assert AgentsClient.parse_environment_path(path) == {}
+    assert AgentsClient.common_location_path("p", "l") == "projects/p/locations/l"
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+from google.api_core import rest_helpers
+from google.protobuf import field_mask_pb2, json_format
+import pytest
+
+from google.cloud.dialogflowcx_helpers import rest_encoding
+from google.cloud.dialogflowcx_v3.types import advanced_settings, agent
+
+
+def _legacy(message, use_integers_for_enums=True):
+    query_params = json.loads(
+        json_format.MessageToJson(
+            message,
+            including_default_value_fields=False,
+            use_integers_for_enums=use_integers_for_enums,
+        )
+    )
+    return rest_helpers.flatten_query_params(query_params, strict=True)
+
+
+MESSAGES = [
+    agent.ListAgentsRequest.pb(agent.ListAgentsRequest()),
+    agent.ListAgentsRequest.pb(
+        agent.ListAgentsRequest(
+            parent="projects/p/locations/l",
+            page_size=50,
+            page_token="token/with?reserved&chars",
+        )
+    ),
+    agent.ExportAgentRequest.pb(
+        agent.ExportAgentRequest(
+            name="n",
+            data_format=agent.ExportAgentRequest.DataFormat.JSON_PACKAGE,
+            include_bigquery_export_settings=True,
+        )
+    ),
+    agent.UpdateAgentRequest.pb(
+        agent.UpdateAgentRequest(
+            update_mask=field_mask_pb2.FieldMask(paths=["display_name", "locked"]),
+            agent=agent.Agent(
+                name="a",
+                display_name="two words",
+                supported_language_codes=["de", "fr"],
+                enable_spell_correction=True,
+                speech_to_text_settings=agent.SpeechToTextSettings(
+                    enable_speech_adaptation=True
+                ),
+                advanced_settings=advanced_settings.AdvancedSettings(
+                    logging_settings=advanced_settings.AdvancedSettings.LoggingSettings(
+                        enable_interaction_logging=True
+                    )
+                ),
+            ),
+        )
+    ),
+]
+
+
+@pytest.mark.parametrize("use_integers_for_enums", [True, False])
+@pytest.mark.parametrize("message", MESSAGES)
+def test_message_to_query_params_matches_json_round_trip(
+    message, use_integers_for_enums
+):
+    assert rest_encoding.message_to_query_params(
+        message, use_integers_for_enums=use_integers_for_enums
+    ) == _legacy(message, use_integers_for_enums=use_integers_for_enums)
+
+
+def test_enum_sent_by_name_or_number():
+    message = agent.ExportAgentRequest.pb(
+        agent.ExportAgentRequest(
+            name="n", data_format=agent.ExportAgentRequest.DataFormat.JSON_PACKAGE
+        )
+    )
+
+    assert rest_encoding.message_to_query_params(message) == [
+        ("name", "n"),
+        ("dataFormat", "4"),
+    ]
+    assert rest_encoding.message_to_query_params(
+        message, use_integers_for_enums=False
+    ) == [("name", "n"), ("dataFormat", "JSON_PACKAGE")]
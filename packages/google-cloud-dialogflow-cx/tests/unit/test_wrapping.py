@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest import mock
+
+from google.api_core import gapic_v1
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.dialogflowcx_v3 import AgentsClient
+
+
+@pytest.fixture(params=["grpc", "rest"])
+def transport(request):
+    return AgentsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=request.param
+    ).transport
+
+
+def test_construction_wraps_nothing(transport):
+    assert len(transport._wrapped_methods) == 0
+
+
+def test_wraps_on_first_use_and_caches(transport):
+    with mock.patch.object(
+        gapic_v1.method, "wrap_method", wraps=gapic_v1.method.wrap_method
+    ) as wrap:
+        first = transport._wrapped_methods[transport.get_agent]
+        second = transport._wrapped_methods[transport.get_agent]
+
+    assert first is second
+    assert wrap.call_count == 1
+
+
+def test_every_method_resolves(transport):
+    names = list(transport._wrapped_methods._factories)
+
+    for name in reversed(names):
+        transport._wrapped_methods[getattr(transport, name)]
+
+    assert len(transport._wrapped_methods) == len(names)
+    with pytest.raises(KeyError):
+        transport._wrapped_methods[object()]
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Gzip compression of the requests of chosen methods.
+
+With :class:`Compression` attached to a transport, the requests of the
+methods it names are sent gzip-compressed: over gRPC with call
+compression, and over REST as bodies with ``Content-Encoding: gzip``.
+Requests smaller than ``min_size`` bytes are sent as they are, since
+compressing them costs more CPU time than the bytes it saves are worth.
+
+A REST server that does not accept compressed bodies answers
+``415 Unsupported Media Type``; the request is then sent again
+uncompressed, and if that succeeds the method's later requests are not
+compressed. If it fails too, the 415 was about something else, such as
+the body's content type, and compression stays on.
+
+Responses need nothing from the client. gRPC channels accept gzip
+responses, and ``requests`` asks for them with
+``Accept-Encoding: gzip, deflate`` and decodes them; whether they are
+compressed is up to the server.
+
+.. code-block:: python
+
+    Compression(methods=["inspect_content"]).attach(client.transport)
+"""
+
+import copy
+from typing import Any, Callable, Iterable, Optional
+import zlib
+
+import grpc  # type: ignore
+
+from google.cloud.dlp_helpers import wrapping
+
+# Makes zlib write a gzip header and trailer.
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+_UNSUPPORTED_MEDIA_TYPE = 415
+
+
+def gzip(data: bytes, level: int = 6) -> bytes:
+    """Gzip-compress ``data``, with no file name or time in the header."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _request_size(request: Any) -> Optional[int]:
+    pb = getattr(type(request), "pb", None)
+    message = pb(request) if pb is not None else request
+    byte_size = getattr(message, "ByteSize", None)
+    return byte_size() if byte_size is not None else None
+
+
+class _CompressedStub:
+    def __init__(self, stub: Callable, compression: "Compression"):
+        # wrap_method copies these attributes onto the callable it returns,
+        # so they must not be named like that callable's own.
+        self._stub = stub
+        self._gzip_options = compression
+
+    def _kwargs(self, request: Any, kwargs: dict) -> dict:
+        if "compression" not in kwargs and self._gzip_options.compresses(request):
+            kwargs["compression"] = grpc.Compression.Gzip
+        return kwargs
+
+    def __call__(self, request, *args, **kwargs):
+        return self._stub(request, *args, **self._kwargs(request, kwargs))
+
+    def with_call(self, request, *args, **kwargs):
+        return self._stub.with_call(request, *args, **self._kwargs(request, kwargs))
+
+    def future(self, request, *args, **kwargs):
+        return self._stub.future(request, *args, **self._kwargs(request, kwargs))
+
+
+# Subclasses of the stub types, so that wrap_method still recognizes
+# streaming stubs and translates their errors.
+class _UnaryUnary(_CompressedStub, grpc.UnaryUnaryMultiCallable):
+    pass
+
+
+class _UnaryStream(_CompressedStub, grpc.UnaryStreamMultiCallable):
+    pass
+
+
+class _StreamUnary(_CompressedStub, grpc.StreamUnaryMultiCallable):
+    pass
+
+
+class _StreamStream(_CompressedStub, grpc.StreamStreamMultiCallable):
+    pass
+
+
+_STUB_TYPES = (
+    (grpc.UnaryUnaryMultiCallable, _UnaryUnary),
+    (grpc.UnaryStreamMultiCallable, _UnaryStream),
+    (grpc.StreamUnaryMultiCallable, _StreamUnary),
+    (grpc.StreamStreamMultiCallable, _StreamStream),
+)
+
+
+class _GzipSession:
+    """Sends the bodies of one REST method's requests gzip-compressed."""
+
+    def __init__(self, session: Any, compression: "Compression"):
+        self._session = session
+        self._compression = compression
+        self._enabled = True
+
+    def __getattr__(self, name: str) -> Any:
+        send = getattr(self._session, name)
+        if name not in ("post", "put", "patch"):
+            return send
+
+        def call(url, data=None, headers=None, **kwargs):
+            return self._send(send, url, data, headers, **kwargs)
+
+        return call
+
+    def _send(self, send, url, data, headers, **kwargs):
+        if self._enabled and data is not None:
+            body = data.encode("utf-8") if isinstance(data, str) else data
+            if len(body) >= self._compression.min_size:
+                compressed = gzip(body, self._compression.level)
+                if len(compressed) < len(body):
+                    response = send(
+                        url,
+                        data=compressed,
+                        headers=dict(headers or {}, **{"Content-Encoding": "gzip"}),
+                        **kwargs,
+                    )
+                    if response.status_code != _UNSUPPORTED_MEDIA_TYPE:
+                        return response
+                    response = send(url, data=data, headers=headers, **kwargs)
+                    if response.ok:
+                        self._enabled = False
+                    return response
+        return send(url, data=data, headers=headers, **kwargs)
+
+
+class Compression:
+    """Sends the requests of a transport's methods gzip-compressed.
+
+    Args:
+        methods (Optional[Iterable[str]]): The names of the methods whose
+            requests are compressed, for example ``"inspect_content"``; all
+            of them if ``None``.
+        min_size (int): The size in bytes below which requests are sent
+            uncompressed.
+        level (int): The zlib compression level of REST bodies, from 1
+            (fastest) to 9 (smallest). gRPC uses its channel's level.
+    """
+
+    def __init__(
+        self,
+        methods: Optional[Iterable[str]] = None,
+        *,
+        min_size: int = 1024,
+        level: int = 6,
+    ):
+        if not 1 <= level <= 9:
+            raise ValueError("level must be from 1 to 9, got {}".format(level))
+        self.methods = frozenset(methods) if methods is not None else None
+        self.min_size = min_size
+        self.level = level
+
+    def attach(self, transport) -> None:
+        """Compress the requests of a transport's next calls on."""
+        transport._compression = self
+        transport._wrapped_methods.clear()
+        wrapping.hook_async_stubs(transport)
+
+    def detach(self, transport) -> None:
+        """Stop compressing a transport's requests."""
+        transport._compression = None
+        transport._wrapped_methods.clear()
+
+    def applies(self, name: str) -> bool:
+        """Whether the requests of the named method are compressed."""
+        return self.methods is None or name in self.methods
+
+    def compresses(self, request: Any) -> bool:
+        """Whether a gRPC request is large enough to be compressed.
+
+        Streams of requests always are.
+        """
+        size = _request_size(request)
+        return size is None or size >= self.min_size
+
+    def wrap(self, method: Callable) -> Callable:
+        """Return a transport method that compresses its requests."""
+        session = getattr(method, "_session", None)
+        if session is not None:
+            # A REST stub; each method gets a copy with its own session.
+            stub = copy.copy(method)
+            stub._session = _GzipSession(session, self)
+            return stub
+        for stub_type, compressed_type in _STUB_TYPES:
+            if isinstance(method, stub_type):
+                return compressed_type(method, self)
+        return _CompressedStub(method, self)
+
+    def wrap_async(self, stub: Callable) -> Callable:
+        """Return an asyncio unary stub that compresses its requests."""
+
+        def call(request, **kwargs):
+            if "compression" not in kwargs and self.compresses(request):
+                kwargs["compression"] = grpc.Compression.Gzip
+            return stub(request, **kwargs)
+
+        return call
+
+
+__all__ = (
+    "Compression",
+    "gzip",
+)
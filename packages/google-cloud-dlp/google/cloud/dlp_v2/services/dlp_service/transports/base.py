@@ -26,6 +26,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.dlp_helpers import wrapping
 from google.cloud.dlp_v2 import gapic_version as package_version
 from google.cloud.dlp_v2.types import dlp
 
@@ -122,434 +123,437 @@ class DlpServiceTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.inspect_content: gapic_v1.method.wrap_method(
-                self.inspect_content,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "inspect_content": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.redact_image: gapic_v1.method.wrap_method(
-                self.redact_image,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "redact_image": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.deidentify_content: gapic_v1.method.wrap_method(
-                self.deidentify_content,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "deidentify_content": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.reidentify_content: gapic_v1.method.wrap_method(
-                self.reidentify_content,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "reidentify_content": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.list_info_types: gapic_v1.method.wrap_method(
-                self.list_info_types,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "list_info_types": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.create_inspect_template: gapic_v1.method.wrap_method(
-                self.create_inspect_template,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.update_inspect_template: gapic_v1.method.wrap_method(
-                self.update_inspect_template,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.get_inspect_template: gapic_v1.method.wrap_method(
-                self.get_inspect_template,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "create_inspect_template": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "update_inspect_template": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "get_inspect_template": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.list_inspect_templates: gapic_v1.method.wrap_method(
-                self.list_inspect_templates,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "list_inspect_templates": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.delete_inspect_template: gapic_v1.method.wrap_method(
-                self.delete_inspect_template,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "delete_inspect_template": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.create_deidentify_template: gapic_v1.method.wrap_method(
-                self.create_deidentify_template,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.update_deidentify_template: gapic_v1.method.wrap_method(
-                self.update_deidentify_template,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.get_deidentify_template: gapic_v1.method.wrap_method(
-                self.get_deidentify_template,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "create_deidentify_template": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "update_deidentify_template": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "get_deidentify_template": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.list_deidentify_templates: gapic_v1.method.wrap_method(
-                self.list_deidentify_templates,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "list_deidentify_templates": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.delete_deidentify_template: gapic_v1.method.wrap_method(
-                self.delete_deidentify_template,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "delete_deidentify_template": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.create_job_trigger: gapic_v1.method.wrap_method(
-                self.create_job_trigger,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.update_job_trigger: gapic_v1.method.wrap_method(
-                self.update_job_trigger,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.hybrid_inspect_job_trigger: gapic_v1.method.wrap_method(
-                self.hybrid_inspect_job_trigger,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.get_job_trigger: gapic_v1.method.wrap_method(
-                self.get_job_trigger,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "create_job_trigger": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "update_job_trigger": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "hybrid_inspect_job_trigger": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "get_job_trigger": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.list_job_triggers: gapic_v1.method.wrap_method(
-                self.list_job_triggers,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "list_job_triggers": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.delete_job_trigger: gapic_v1.method.wrap_method(
-                self.delete_job_trigger,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "delete_job_trigger": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.activate_job_trigger: gapic_v1.method.wrap_method(
-                self.activate_job_trigger,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.create_discovery_config: gapic_v1.method.wrap_method(
-                self.create_discovery_config,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.update_discovery_config: gapic_v1.method.wrap_method(
-                self.update_discovery_config,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.get_discovery_config: gapic_v1.method.wrap_method(
-                self.get_discovery_config,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "activate_job_trigger": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "create_discovery_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "update_discovery_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "get_discovery_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.list_discovery_configs: gapic_v1.method.wrap_method(
-                self.list_discovery_configs,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "list_discovery_configs": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.delete_discovery_config: gapic_v1.method.wrap_method(
-                self.delete_discovery_config,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "delete_discovery_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.create_dlp_job: gapic_v1.method.wrap_method(
-                self.create_dlp_job,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.list_dlp_jobs: gapic_v1.method.wrap_method(
-                self.list_dlp_jobs,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "create_dlp_job": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "list_dlp_jobs": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.get_dlp_job: gapic_v1.method.wrap_method(
-                self.get_dlp_job,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "get_dlp_job": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.delete_dlp_job: gapic_v1.method.wrap_method(
-                self.delete_dlp_job,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "delete_dlp_job": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.cancel_dlp_job: gapic_v1.method.wrap_method(
-                self.cancel_dlp_job,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.create_stored_info_type: gapic_v1.method.wrap_method(
-                self.create_stored_info_type,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.update_stored_info_type: gapic_v1.method.wrap_method(
-                self.update_stored_info_type,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.get_stored_info_type: gapic_v1.method.wrap_method(
-                self.get_stored_info_type,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "cancel_dlp_job": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "create_stored_info_type": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "update_stored_info_type": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "get_stored_info_type": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.list_stored_info_types: gapic_v1.method.wrap_method(
-                self.list_stored_info_types,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "list_stored_info_types": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.delete_stored_info_type: gapic_v1.method.wrap_method(
-                self.delete_stored_info_type,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "delete_stored_info_type": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
-                ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.hybrid_inspect_dlp_job: gapic_v1.method.wrap_method(
-                self.hybrid_inspect_dlp_job,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.finish_dlp_job: gapic_v1.method.wrap_method(
-                self.finish_dlp_job,
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-        }
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "hybrid_inspect_dlp_job": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+                "finish_dlp_job": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=300.0,
+                    client_info=client_info,
+                ),
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Waiting for many long-running operations at once.
+
+Each :class:`~google.api_core.operation.Operation` returned by a client
+polls ``get_operation`` on its own, so waiting for hundreds of operations
+runs hundreds of polling loops. A :class:`Waiter` polls them together in
+rounds instead. Each round lists the operations under each parent with
+the client's ``list_operations`` method. Operations the list shows
+complete, or does not return, are refreshed as usual, with one
+``get_operation`` call each. The delay between rounds grows while no
+operation completes, and shrinks again when some do.
+
+A call that fails with a transient error, such as ``UNAVAILABLE``, does
+not end the wait: the operations it was for are polled again in the next
+round.
+
+.. code-block:: python
+
+    waiter = operations.Waiter(client)
+    pending = [client.train_processor_version(request=r) for r in requests]
+    for future in waiter.as_completed(pending, timeout=3600):
+        print(future.result().processor_version)
+"""
+
+from concurrent import futures
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import operation
+from google.longrunning import operations_pb2  # type: ignore
+
+# Errors of list_operations after which a parent is polled with
+# get_operation only.
+_UNLISTABLE = (
+    core_exceptions.InvalidArgument,
+    core_exceptions.MethodNotImplemented,
+    core_exceptions.PermissionDenied,
+)
+
+# Errors after which the operations polled are polled again next round.
+_TRANSIENT = (
+    core_exceptions.DeadlineExceeded,
+    core_exceptions.InternalServerError,
+    core_exceptions.ServiceUnavailable,
+    core_exceptions.TooManyRequests,
+)
+
+
+def _parent(name: str) -> Optional[str]:
+    parent, separator, _ = name.rpartition("/operations/")
+    return parent if separator else None
+
+
+class Waiter:
+    """Polls many long-running operations in shared rounds.
+
+    Args:
+        client: The client that started the operations. Its
+            ``list_operations`` method is called.
+        initial_delay (float): Seconds before the first round.
+        max_delay (float): The longest delay between rounds, in seconds.
+        multiplier (float): How much the delay grows after a round in
+            which no operation completed, and shrinks after one in which
+            some did.
+        filter (str): The filter of the ``list_operations`` calls.
+            Operations it leaves out are polled with ``get_operation``.
+
+    Attributes:
+        rounds (int): Polling rounds made.
+        rpcs (int): ``list_operations`` and ``get_operation`` calls made.
+        errors (int): Calls that failed with a transient error.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        multiplier: float = 1.5,
+        filter: str = "",
+    ):
+        if initial_delay < 0 or max_delay < initial_delay:
+            raise ValueError("need 0 <= initial_delay <= max_delay")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        self.client = client
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.filter = filter
+        self.rounds = 0
+        self.rpcs = 0
+        self.errors = 0
+        self._unlistable: Set[str] = set()
+
+    def as_completed(
+        self, operations: Iterable[operation.Operation], timeout: Optional[float] = None
+    ) -> Iterator[operation.Operation]:
+        """Yield operations as they complete.
+
+        Operations that have already completed are yielded first. A
+        yielded operation's ``result()`` returns without another RPC.
+
+        Args:
+            operations (Iterable[google.api_core.operation.Operation]): The
+                operations, as returned by the client.
+            timeout (Optional[float]): Seconds to wait in all. By default
+                there is no limit.
+
+        Raises:
+            concurrent.futures.TimeoutError: If operations are still running
+                when ``timeout`` passes.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending: Dict[str, List[operation.Operation]] = {}
+        for future in operations:
+            if future.operation.done:
+                yield future
+            else:
+                pending.setdefault(future.operation.name, []).append(future)
+
+        delay = self.initial_delay
+        while pending:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise futures.TimeoutError(
+                        "{} operations are still running".format(
+                            sum(map(len, pending.values()))
+                        )
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+            completed = False
+            for name in self._poll(list(pending)):
+                if self._refresh(pending[name]):
+                    completed = True
+                    yield from pending.pop(name)
+            if completed:
+                delay = max(delay / self.multiplier, self.initial_delay)
+            else:
+                delay = min(delay * self.multiplier, self.max_delay)
+
+    def _poll(self, names: List[str]) -> Iterator[str]:
+        """Return the names of the operations that may have completed."""
+        self.rounds += 1
+        by_parent: Dict[Optional[str], List[str]] = {}
+        for name in names:
+            by_parent.setdefault(_parent(name), []).append(name)
+        for parent, group in by_parent.items():
+            listed: Dict[str, operations_pb2.Operation] = {}
+            if parent is not None and len(group) > 1:
+                try:
+                    listed = self._list(parent, set(group))
+                except _TRANSIENT:
+                    self.errors += 1
+                    continue
+            for name in group:
+                state = listed.get(name)
+                if state is None or state.done:
+                    yield name
+
+    def _refresh(self, pending: List[operation.Operation]) -> bool:
+        """Refresh the futures of one operation; whether it has completed."""
+        done = True
+        for future in pending:
+            self.rpcs += 1
+            try:
+                done = future.done() and done
+            except _TRANSIENT:
+                self.errors += 1
+                return False
+        return done
+
+    def _list(
+        self, parent: str, wanted: Set[str]
+    ) -> Dict[str, operations_pb2.Operation]:
+        """List the wanted operations under a parent, as far as it pays."""
+        listed: Dict[str, operations_pb2.Operation] = {}
+        if parent in self._unlistable:
+            return listed
+        request = operations_pb2.ListOperationsRequest(name=parent, filter=self.filter)
+        # Past as many pages as operations wanted, getting them is cheaper.
+        for _ in range(len(wanted)):
+            self.rpcs += 1
+            try:
+                response = self.client.list_operations(request=request)
+            except _UNLISTABLE:
+                self._unlistable.add(parent)
+                break
+            for state in response.operations:
+                if state.name in wanted:
+                    listed[state.name] = state
+            if len(listed) == len(wanted) or not response.next_page_token:
+                break
+            request.page_token = response.next_page_token
+        return listed
+
+
+__all__ = ("Waiter",)
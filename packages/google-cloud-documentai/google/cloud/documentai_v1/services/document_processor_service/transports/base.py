@@ -26,6 +26,7 @@ from google.cloud.location import locations_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.documentai_helpers import wrapping
 from google.cloud.documentai_v1 import gapic_version as package_version
 from google.cloud.documentai_v1.types import document_processor_service, evaluation
 from google.cloud.documentai_v1.types import processor
@@ -125,149 +126,152 @@ class DocumentProcessorServiceTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.process_document: gapic_v1.method.wrap_method(
-                self.process_document,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "process_document": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=300.0,
                     ),
-                    deadline=300.0,
+                    default_timeout=300.0,
+                    client_info=client_info,
                 ),
-                default_timeout=300.0,
-                client_info=client_info,
-            ),
-            self.batch_process_documents: gapic_v1.method.wrap_method(
-                self.batch_process_documents,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "batch_process_documents": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
+                    default_timeout=120.0,
+                    client_info=client_info,
                 ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.fetch_processor_types: gapic_v1.method.wrap_method(
-                self.fetch_processor_types,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_processor_types: gapic_v1.method.wrap_method(
-                self.list_processor_types,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_processor_type: gapic_v1.method.wrap_method(
-                self.get_processor_type,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_processors: gapic_v1.method.wrap_method(
-                self.list_processors,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_processor: gapic_v1.method.wrap_method(
-                self.get_processor,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.train_processor_version: gapic_v1.method.wrap_method(
-                self.train_processor_version,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_processor_version: gapic_v1.method.wrap_method(
-                self.get_processor_version,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_processor_versions: gapic_v1.method.wrap_method(
-                self.list_processor_versions,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_processor_version: gapic_v1.method.wrap_method(
-                self.delete_processor_version,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.deploy_processor_version: gapic_v1.method.wrap_method(
-                self.deploy_processor_version,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.undeploy_processor_version: gapic_v1.method.wrap_method(
-                self.undeploy_processor_version,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_processor: gapic_v1.method.wrap_method(
-                self.create_processor,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_processor: gapic_v1.method.wrap_method(
-                self.delete_processor,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.enable_processor: gapic_v1.method.wrap_method(
-                self.enable_processor,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.disable_processor: gapic_v1.method.wrap_method(
-                self.disable_processor,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.set_default_processor_version: gapic_v1.method.wrap_method(
-                self.set_default_processor_version,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.review_document: gapic_v1.method.wrap_method(
-                self.review_document,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "fetch_processor_types": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_processor_types": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_processor_type": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_processors": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_processor": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "train_processor_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_processor_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_processor_versions": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_processor_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "deploy_processor_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "undeploy_processor_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_processor": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_processor": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "enable_processor": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "disable_processor": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "set_default_processor_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "review_document": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "evaluate_processor_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_evaluation": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_evaluations": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
                 ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.evaluate_processor_version: gapic_v1.method.wrap_method(
-                self.evaluate_processor_version,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_evaluation: gapic_v1.method.wrap_method(
-                self.get_evaluation,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_evaluations: gapic_v1.method.wrap_method(
-                self.list_evaluations,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
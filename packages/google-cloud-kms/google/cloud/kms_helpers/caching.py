@@ -0,0 +1,455 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Caching the responses of read methods.
+
+With a :class:`ResponseCache` attached to a transport, the response to a
+call of a cached method is kept for the method's TTL, keyed on the
+method and the serialized request, and calls with the same request are
+answered from the cache until it expires. ``NOT_FOUND`` errors can be
+cached too, for their own TTL.
+
+Entries are kept by a backend: :class:`MemoryBackend` keeps them in
+process and :class:`DiskBackend` in an SQLite file, which survives
+restarts and can be shared between processes. Both evict the least
+recently used entries beyond a size bound.
+
+Keys also name the transport's host and the caller its credentials act
+for (their service account or user, and their quota project), so that a
+cache shared by transports for different endpoints or callers never
+answers one with another's responses. Entries made with credentials that
+name no caller, such as anonymous ones, are scoped to the credentials
+object and are not shared between processes. Cached responses are only
+decoded as the message types of the services the cache is attached to;
+an entry naming any other type is a miss.
+
+.. code-block:: python
+
+    cache = caching.ResponseCache(ttls={"get_public_key": 300}, negative_ttl=30)
+    cache.attach(client.transport)
+    client.get_public_key(name=name)
+    cache.invalidate("get_public_key", kms_v1.GetPublicKeyRequest(name=name))
+"""
+
+import collections
+import dataclasses
+import hashlib
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Set
+
+from google.api_core import exceptions as core_exceptions
+from google.protobuf import message as message_lib
+import grpc  # type: ignore
+import proto  # type: ignore
+
+from google.cloud.kms_helpers import wrapping
+
+_STREAMING = (grpc.UnaryStreamMultiCallable, grpc.StreamStreamMultiCallable)
+
+
+@dataclasses.dataclass(frozen=True)
+class Entry:
+    """A cached response, or a cached ``NOT_FOUND`` error.
+
+    Attributes:
+        expires (float): When the entry expires, in seconds since the epoch.
+        response_type (Optional[str]): The response's class, as
+            ``"module:QualifiedName"``; ``None`` for an error.
+        payload (bytes): The serialized response, or the error message.
+    """
+
+    expires: float
+    response_type: Optional[str]
+    payload: bytes
+
+
+class MemoryBackend:
+    """Keeps entries in memory.
+
+    Args:
+        max_entries (int): Least recently used entries beyond this many are
+            evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "collections.OrderedDict[str, Entry]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskBackend:
+    """Keeps entries in an SQLite database file.
+
+    Args:
+        path (str): The database file, created if it does not exist.
+        max_entries (int): Least recently used entries beyond this many are
+            evicted.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = path
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, expires REAL, response_type TEXT,"
+                " payload BLOB, used REAL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS entries_used ON entries (used)"
+            )
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT expires, response_type, payload FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE entries SET used = ? WHERE key = ?", (time.time(), key)
+            )
+        return Entry(row[0], row[1], bytes(row[2]))
+
+    def set(self, key: str, entry: Entry) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, entry.expires, entry.response_type, entry.payload, time.time()),
+            )
+            (count,) = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()
+            if count > self.max_entries:
+                self._db.execute(
+                    "DELETE FROM entries WHERE key IN"
+                    " (SELECT key FROM entries ORDER BY used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+                self.evictions += count - self.max_entries
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def _serialize(message: Any) -> bytes:
+    pb = getattr(type(message), "pb", None)
+    if pb is not None:
+        # A proto-plus message.
+        message = pb(message)
+    return message.SerializeToString(deterministic=True)
+
+
+def _type_name(cls: type) -> str:
+    return "{}:{}".format(cls.__module__, cls.__qualname__)
+
+
+def _is_message_type(value: Any) -> bool:
+    return isinstance(value, type) and issubclass(
+        value, (proto.Message, message_lib.Message)
+    )
+
+
+def _known_types(transport: Any) -> Dict[str, type]:
+    """Return the message types a transport's methods may respond with.
+
+    These are the messages of its API version's ``types`` modules, and of
+    the protobuf modules its transport module imports for operations,
+    locations and IAM.
+    """
+    modules = []
+    for cls in type(transport).__mro__:
+        module = sys.modules.get(cls.__module__)
+        package, services, _ = cls.__module__.partition(".services.")
+        if module is None or not services:
+            continue
+        modules.extend(
+            value
+            for value in vars(module).values()
+            if getattr(value, "__name__", "").endswith("_pb2")
+        )
+        prefix = package + ".types."
+        modules.extend(
+            m for name, m in list(sys.modules.items()) if name.startswith(prefix)
+        )
+    return {
+        _type_name(value): value
+        for module in modules
+        for value in vars(module).values()
+        if _is_message_type(value)
+    }
+
+
+@dataclasses.dataclass
+class _MethodStats:
+    hits: int = 0
+    misses: int = 0
+    negative_hits: int = 0
+
+
+class ResponseCache:
+    """Answers repeated calls of read methods from a cache.
+
+    Args:
+        backend: Where entries are kept; a :class:`MemoryBackend` by default.
+        ttl (float): Seconds responses are kept, for idempotent methods
+            named ``get`` or ``get_*``.
+        ttls (Mapping[str, float]): Seconds responses are kept for the
+            named methods, overriding ``ttl``. Naming a method here caches
+            it whatever its name; a TTL of 0 stops it being cached.
+        negative_ttl (Optional[float]): Seconds ``NOT_FOUND`` errors are
+            kept. ``None`` to not cache errors.
+    """
+
+    def __init__(
+        self,
+        backend: Any = None,
+        *,
+        ttl: float = 60.0,
+        ttls: Optional[Mapping[str, float]] = None,
+        negative_ttl: Optional[float] = None,
+    ):
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _MethodStats] = {}
+        self._types: Dict[str, type] = {}
+        self._scopes: Set[str] = set()
+
+    def attach(self, transport) -> None:
+        """Cache the responses of a transport's read methods."""
+        known_types = _known_types(transport)
+        with self._lock:
+            self._types.update(known_types)
+            self._scopes.add(wrapping.scope(transport))
+        transport._cache = self
+        transport._wrapped_methods.clear()
+        wrapping.hook_async_stubs(transport)
+
+    def detach(self, transport) -> None:
+        """Stop caching a transport's responses."""
+        transport._cache = None
+        transport._wrapped_methods.clear()
+
+    def method_ttl(self, name: str, idempotent: bool) -> float:
+        """Return how long the responses of a method are kept; 0 if not at all."""
+        if name in self.ttls:
+            return self.ttls[name]
+        is_get = name == "get" or name.startswith("get_")
+        return self.ttl if idempotent and is_get else 0.0
+
+    def invalidate(self, name: str, request: Any, transport: Any = None) -> None:
+        """Forget the cached response to a request.
+
+        Args:
+            name (str): The method's name, for example ``"get_public_key"``.
+            request (Any): The request message.
+            transport (Any): The transport whose response is forgotten; by
+                default, those of every transport the cache was attached to.
+        """
+        if transport is not None:
+            scopes = [wrapping.scope(transport)]
+        else:
+            with self._lock:
+                scopes = list(self._scopes)
+        for each in scopes:
+            self.backend.delete(self._key(each, name, request))
+
+    def clear(self) -> None:
+        """Forget every cached response."""
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return the hits and misses of each method."""
+        with self._lock:
+            return {
+                name: dataclasses.asdict(stats)
+                for name, stats in sorted(self._stats.items())
+            }
+
+    @staticmethod
+    def _key(scope: str, name: str, request: Any) -> str:
+        digest = hashlib.sha256(scope.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(_serialize(request))
+        return digest.hexdigest()
+
+    def _count(self, name: str, field: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(name, _MethodStats())
+            setattr(stats, field, getattr(stats, field) + 1)
+
+    def _lookup(self, name: str, key: str) -> Optional[Any]:
+        """Return the cached response, raise the cached error, or return None."""
+        entry = self.backend.get(key)
+        if entry is None or entry.expires <= time.time():
+            self._count(name, "misses")
+            return None
+        if entry.response_type is None:
+            self._count(name, "negative_hits")
+            raise core_exceptions.NotFound(entry.payload.decode("utf-8"))
+        cls = self._types.get(entry.response_type)
+        if cls is None:
+            # Not a response of the attached services'; never import it.
+            self._count(name, "misses")
+            return None
+        self._count(name, "hits")
+        deserialize = getattr(cls, "deserialize", None) or cls.FromString
+        return deserialize(entry.payload)
+
+    def _store(self, name: str, key: str, ttl: float, response: Any) -> None:
+        try:
+            payload = _serialize(response)
+        except AttributeError:
+            # Not a message, so it cannot be cached.
+            return
+        type_name = _type_name(type(response))
+        with self._lock:
+            self._types.setdefault(type_name, type(response))
+        self.backend.set(key, Entry(time.time() + ttl, type_name, payload))
+
+    def _store_error(self, key: str, exc: BaseException) -> None:
+        if self.negative_ttl and isinstance(exc, core_exceptions.NotFound):
+            self.backend.set(
+                key,
+                Entry(
+                    time.time() + self.negative_ttl,
+                    None,
+                    exc.message.encode("utf-8"),
+                ),
+            )
+
+    def wrap(
+        self,
+        name: str,
+        method: Callable,
+        wrapped: Callable,
+        ttl: float,
+        *,
+        scope: str,
+    ):
+        """Answer the calls of a wrapped method from the cache.
+
+        Args:
+            name (str): The transport method's name.
+            method (Callable): The transport method.
+            wrapped (Callable): The method with its retry, timeout and error
+                handling applied.
+            ttl (float): Seconds responses are kept.
+            scope (str): The transport's :func:`~.wrapping.scope`.
+        """
+        if isinstance(method, _STREAMING):
+            return wrapped
+
+        def call(request, *args, **kwargs):
+            key = self._key(scope, name, request)
+            response = self._lookup(name, key)
+            if response is not None:
+                return response
+            try:
+                response = wrapped(request, *args, **kwargs)
+            except core_exceptions.NotFound as exc:
+                self._store_error(key, exc)
+                raise
+            self._store(name, key, ttl, response)
+            return response
+
+        return call
+
+    def wrap_async(
+        self, name: str, stub: Callable, ttl: float, *, scope: str
+    ) -> Callable:
+        """Answer the calls of an asyncio unary stub from the cache."""
+
+        async def call(request, **kwargs):
+            key = self._key(scope, name, request)
+            response = self._lookup(name, key)
+            if response is not None:
+                return response
+            try:
+                response = await stub(request, **kwargs)
+            except grpc.RpcError as exc:
+                if callable(getattr(exc, "code", None)):
+                    self._store_error(key, core_exceptions.from_grpc_error(exc))
+                raise
+            except core_exceptions.NotFound as exc:
+                self._store_error(key, exc)
+                raise
+            self._store(name, key, ttl, response)
+            return response
+
+        return call
+
+
+__all__ = (
+    "DiskBackend",
+    "Entry",
+    "MemoryBackend",
+    "ResponseCache",
+)
@@ -27,6 +27,7 @@ from google.iam.v1 import iam_policy_pb2  # type: ignore
 from google.iam.v1 import policy_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.kms_helpers import wrapping
 from google.cloud.kms_v1 import gapic_version as package_version
 from google.cloud.kms_v1.types import ekm_service
 
@@ -126,84 +127,87 @@ class EkmServiceTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_ekm_connections: gapic_v1.method.wrap_method(
-                self.list_ekm_connections,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_ekm_connections": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_ekm_connection: gapic_v1.method.wrap_method(
-                self.get_ekm_connection,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "get_ekm_connection": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_ekm_connection: gapic_v1.method.wrap_method(
-                self.create_ekm_connection,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "create_ekm_connection": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_ekm_connection: gapic_v1.method.wrap_method(
-                self.update_ekm_connection,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "update_ekm_connection": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_ekm_config: gapic_v1.method.wrap_method(
-                self.get_ekm_config,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_ekm_config: gapic_v1.method.wrap_method(
-                self.update_ekm_config,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.verify_connectivity: gapic_v1.method.wrap_method(
-                self.verify_connectivity,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+                "get_ekm_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_ekm_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "verify_connectivity": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
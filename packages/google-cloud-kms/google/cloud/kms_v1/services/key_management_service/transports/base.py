@@ -27,6 +27,7 @@ from google.iam.v1 import iam_policy_pb2  # type: ignore
 from google.iam.v1 import policy_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.kms_helpers import wrapping
 from google.cloud.kms_v1 import gapic_version as package_version
 from google.cloud.kms_v1.types import resources, service
 
@@ -126,389 +127,392 @@ class KeyManagementServiceTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_key_rings: gapic_v1.method.wrap_method(
-                self.list_key_rings,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_key_rings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_crypto_keys: gapic_v1.method.wrap_method(
-                self.list_crypto_keys,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "list_crypto_keys": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_crypto_key_versions: gapic_v1.method.wrap_method(
-                self.list_crypto_key_versions,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "list_crypto_key_versions": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_import_jobs: gapic_v1.method.wrap_method(
-                self.list_import_jobs,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "list_import_jobs": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_key_ring: gapic_v1.method.wrap_method(
-                self.get_key_ring,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "get_key_ring": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_crypto_key: gapic_v1.method.wrap_method(
-                self.get_crypto_key,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "get_crypto_key": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_crypto_key_version: gapic_v1.method.wrap_method(
-                self.get_crypto_key_version,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "get_crypto_key_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_public_key: gapic_v1.method.wrap_method(
-                self.get_public_key,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "get_public_key": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_import_job: gapic_v1.method.wrap_method(
-                self.get_import_job,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "get_import_job": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_key_ring: gapic_v1.method.wrap_method(
-                self.create_key_ring,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "create_key_ring": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_crypto_key: gapic_v1.method.wrap_method(
-                self.create_crypto_key,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "create_crypto_key": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_crypto_key_version: gapic_v1.method.wrap_method(
-                self.create_crypto_key_version,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.import_crypto_key_version: gapic_v1.method.wrap_method(
-                self.import_crypto_key_version,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_import_job: gapic_v1.method.wrap_method(
-                self.create_import_job,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "create_crypto_key_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "import_crypto_key_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "create_import_job": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_crypto_key: gapic_v1.method.wrap_method(
-                self.update_crypto_key,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "update_crypto_key": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_crypto_key_version: gapic_v1.method.wrap_method(
-                self.update_crypto_key_version,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "update_crypto_key_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_crypto_key_primary_version: gapic_v1.method.wrap_method(
-                self.update_crypto_key_primary_version,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "update_crypto_key_primary_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.destroy_crypto_key_version: gapic_v1.method.wrap_method(
-                self.destroy_crypto_key_version,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "destroy_crypto_key_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.restore_crypto_key_version: gapic_v1.method.wrap_method(
-                self.restore_crypto_key_version,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "restore_crypto_key_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.encrypt: gapic_v1.method.wrap_method(
-                self.encrypt,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "encrypt": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.decrypt: gapic_v1.method.wrap_method(
-                self.decrypt,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "decrypt": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "raw_encrypt": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "raw_decrypt": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.raw_encrypt: gapic_v1.method.wrap_method(
-                self.raw_encrypt,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.raw_decrypt: gapic_v1.method.wrap_method(
-                self.raw_decrypt,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.asymmetric_sign: gapic_v1.method.wrap_method(
-                self.asymmetric_sign,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "asymmetric_sign": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.asymmetric_decrypt: gapic_v1.method.wrap_method(
-                self.asymmetric_decrypt,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "asymmetric_decrypt": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.mac_sign: gapic_v1.method.wrap_method(
-                self.mac_sign,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "mac_sign": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.mac_verify: gapic_v1.method.wrap_method(
-                self.mac_verify,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "mac_verify": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.generate_random_bytes: gapic_v1.method.wrap_method(
-                self.generate_random_bytes,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "generate_random_bytes": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=60.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-        }
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
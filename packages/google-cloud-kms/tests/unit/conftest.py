@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A fake Cloud KMS server shared by the tests of the helper modules."""
+
+import asyncio
+import contextlib
+import threading
+import time
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.kms_v1 import (
+    KeyManagementServiceAsyncClient,
+    KeyManagementServiceClient,
+)
+from google.cloud.kms_v1.types import resources
+
+
+class FakeServer:
+    """Answers Cloud KMS calls in place of a server, recording them.
+
+    Each call takes the next of ``delays`` seconds, then ``delay``, and
+    raises the next of ``errors``, then ``error``, where not ``None``.
+    """
+
+    def __init__(self):
+        self.delays = []
+        self.delay = 0.0
+        self.errors = []
+        self.error = None
+        self.lock = threading.Lock()
+        self.requests = []
+        # The keyword arguments of each call, such as its timeout.
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @staticmethod
+    def respond(request):
+        return resources.PublicKey(name=request.name, pem="-----BEGIN PUBLIC KEY-----")
+
+    def _enter(self, request, kwargs):
+        with self.lock:
+            self.requests.append(request)
+            self.calls.append(kwargs)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            delay = self.delays.pop(0) if self.delays else self.delay
+            error = self.errors.pop(0) if self.errors else self.error
+        return delay, error
+
+    def _exit(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def __call__(self, request, **kwargs):
+        delay, error = self._enter(request, kwargs)
+        try:
+            time.sleep(delay)
+            if error is not None:
+                raise error
+            return self.respond(request)
+        finally:
+            self._exit()
+
+    async def call_async(self, request, **kwargs):
+        delay, error = self._enter(request, kwargs)
+        try:
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+            return self.respond(request)
+        finally:
+            self._exit()
+
+
+class AsyncStub(aio.UnaryUnaryMultiCallable):
+    """An asyncio unary stub answered by a :class:`FakeServer`."""
+
+    def __init__(self, server):
+        self.server = server
+
+    def __call__(self, request, **kwargs):
+        return self.server.call_async(request, **kwargs)
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.fixture
+def grpc_client(server):
+    """Return a function that makes gRPC clients answered by ``server``.
+
+    It attaches the hooks it is given to the client's transport, and
+    passes its keyword arguments to the client.
+    """
+    patches = contextlib.ExitStack()
+    patched = []
+
+    def make(*hooks, **kwargs):
+        kwargs.setdefault("credentials", ga_credentials.AnonymousCredentials())
+        client = KeyManagementServiceClient(transport="grpc", **kwargs)
+        if not patched:
+            # Every unary stub is of this type.
+            stub_type = type(client.transport.get_public_key)
+            patches.enter_context(
+                mock.patch.object(stub_type, "__call__", side_effect=server)
+            )
+            patched.append(stub_type)
+        for hook in hooks:
+            hook.attach(client.transport)
+        return client
+
+    with patches:
+        yield make
+
+
+@pytest.fixture
+def async_client(server):
+    """Return a function that makes asyncio clients answered by ``server``.
+
+    It must be called with an event loop running. The stubs of the
+    ``methods`` it is given are replaced before the hooks it is given are
+    attached.
+    """
+
+    def make(*hooks, methods=("get_public_key",)):
+        client = KeyManagementServiceAsyncClient(
+            credentials=ga_credentials.AnonymousCredentials(),
+            transport="grpc_asyncio",
+        )
+        for method in methods:
+            client.transport._stubs[method] = AsyncStub(server)
+        for hook in hooks:
+            hook.attach(client.transport)
+        return client
+
+    return make
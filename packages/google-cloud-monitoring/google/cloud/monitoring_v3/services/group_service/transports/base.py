@@ -25,6 +25,7 @@ from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.monitoring_helpers import wrapping
 from google.cloud.monitoring_v3 import gapic_version as package_version
 from google.cloud.monitoring_v3.types import group
 from google.cloud.monitoring_v3.types import group as gm_group
@@ -127,84 +128,87 @@ class GroupServiceTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_groups: gapic_v1.method.wrap_method(
-                self.list_groups,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_groups": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.get_group: gapic_v1.method.wrap_method(
-                self.get_group,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "get_group": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.create_group: gapic_v1.method.wrap_method(
-                self.create_group,
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.update_group: gapic_v1.method.wrap_method(
-                self.update_group,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "create_group": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=30.0,
+                    client_info=client_info,
+                ),
+                "update_group": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=180.0,
                     ),
-                    deadline=180.0,
+                    default_timeout=180.0,
+                    client_info=client_info,
                 ),
-                default_timeout=180.0,
-                client_info=client_info,
-            ),
-            self.delete_group: gapic_v1.method.wrap_method(
-                self.delete_group,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "delete_group": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.list_group_members: gapic_v1.method.wrap_method(
-                self.list_group_members,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "list_group_members": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-        }
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
@@ -27,6 +27,7 @@ from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.monitoring_helpers import wrapping
 from google.cloud.monitoring_v3 import gapic_version as package_version
 from google.cloud.monitoring_v3.types import metric_service
 
@@ -128,108 +129,111 @@ class MetricServiceTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_monitored_resource_descriptors: gapic_v1.method.wrap_method(
-                self.list_monitored_resource_descriptors,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_monitored_resource_descriptors": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.get_monitored_resource_descriptor: gapic_v1.method.wrap_method(
-                self.get_monitored_resource_descriptor,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "get_monitored_resource_descriptor": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.list_metric_descriptors: gapic_v1.method.wrap_method(
-                self.list_metric_descriptors,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "list_metric_descriptors": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.get_metric_descriptor: gapic_v1.method.wrap_method(
-                self.get_metric_descriptor,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "get_metric_descriptor": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.create_metric_descriptor: gapic_v1.method.wrap_method(
-                self.create_metric_descriptor,
-                default_timeout=12.0,
-                client_info=client_info,
-            ),
-            self.delete_metric_descriptor: gapic_v1.method.wrap_method(
-                self.delete_metric_descriptor,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "create_metric_descriptor": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=12.0,
+                    client_info=client_info,
+                ),
+                "delete_metric_descriptor": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.list_time_series: gapic_v1.method.wrap_method(
-                self.list_time_series,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "list_time_series": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=90.0,
                     ),
-                    deadline=90.0,
+                    default_timeout=90.0,
+                    client_info=client_info,
+                ),
+                "create_time_series": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=12.0,
+                    client_info=client_info,
+                ),
+                "create_service_time_series": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
                 ),
-                default_timeout=90.0,
-                client_info=client_info,
-            ),
-            self.create_time_series: gapic_v1.method.wrap_method(
-                self.create_time_series,
-                default_timeout=12.0,
-                client_info=client_info,
-            ),
-            self.create_service_time_series: gapic_v1.method.wrap_method(
-                self.create_service_time_series,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
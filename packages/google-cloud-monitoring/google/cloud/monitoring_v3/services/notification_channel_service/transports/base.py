@@ -25,6 +25,7 @@ from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.monitoring_helpers import wrapping
 from google.cloud.monitoring_v3 import gapic_version as package_version
 from google.cloud.monitoring_v3.types import notification, notification_service
 
@@ -125,122 +126,125 @@ class NotificationChannelServiceTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_notification_channel_descriptors: gapic_v1.method.wrap_method(
-                self.list_notification_channel_descriptors,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_notification_channel_descriptors": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.get_notification_channel_descriptor: gapic_v1.method.wrap_method(
-                self.get_notification_channel_descriptor,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "get_notification_channel_descriptor": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.list_notification_channels: gapic_v1.method.wrap_method(
-                self.list_notification_channels,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "list_notification_channels": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.get_notification_channel: gapic_v1.method.wrap_method(
-                self.get_notification_channel,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "get_notification_channel": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.create_notification_channel: gapic_v1.method.wrap_method(
-                self.create_notification_channel,
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.update_notification_channel: gapic_v1.method.wrap_method(
-                self.update_notification_channel,
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.delete_notification_channel: gapic_v1.method.wrap_method(
-                self.delete_notification_channel,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "create_notification_channel": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=30.0,
+                    client_info=client_info,
+                ),
+                "update_notification_channel": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=30.0,
+                    client_info=client_info,
+                ),
+                "delete_notification_channel": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
+                ),
+                "send_notification_channel_verification_code": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.send_notification_channel_verification_code: gapic_v1.method.wrap_method(
-                self.send_notification_channel_verification_code,
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.get_notification_channel_verification_code: gapic_v1.method.wrap_method(
-                self.get_notification_channel_verification_code,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "get_notification_channel_verification_code": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.verify_notification_channel: gapic_v1.method.wrap_method(
-                self.verify_notification_channel,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "verify_notification_channel": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-        }
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
@@ -25,6 +25,7 @@ from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.monitoring_helpers import wrapping
 from google.cloud.monitoring_v3 import gapic_version as package_version
 from google.cloud.monitoring_v3.types import service
 from google.cloud.monitoring_v3.types import service as gm_service
@@ -127,113 +128,116 @@ class ServiceMonitoringServiceTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.create_service: gapic_v1.method.wrap_method(
-                self.create_service,
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.get_service: gapic_v1.method.wrap_method(
-                self.get_service,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "create_service": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=30.0,
+                    client_info=client_info,
+                ),
+                "get_service": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.list_services: gapic_v1.method.wrap_method(
-                self.list_services,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "list_services": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
+                ),
+                "update_service": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.update_service: gapic_v1.method.wrap_method(
-                self.update_service,
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.delete_service: gapic_v1.method.wrap_method(
-                self.delete_service,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "delete_service": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.create_service_level_objective: gapic_v1.method.wrap_method(
-                self.create_service_level_objective,
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.get_service_level_objective: gapic_v1.method.wrap_method(
-                self.get_service_level_objective,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "create_service_level_objective": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=30.0,
+                    client_info=client_info,
+                ),
+                "get_service_level_objective": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.list_service_level_objectives: gapic_v1.method.wrap_method(
-                self.list_service_level_objectives,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "list_service_level_objectives": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
+                ),
+                "update_service_level_objective": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.update_service_level_objective: gapic_v1.method.wrap_method(
-                self.update_service_level_objective,
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-            self.delete_service_level_objective: gapic_v1.method.wrap_method(
-                self.delete_service_level_objective,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                "delete_service_level_objective": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=30.0,
                     ),
-                    deadline=30.0,
+                    default_timeout=30.0,
+                    client_info=client_info,
                 ),
-                default_timeout=30.0,
-                client_info=client_info,
-            ),
-        }
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
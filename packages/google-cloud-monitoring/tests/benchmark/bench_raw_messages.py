@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""CPU time of listing time series with proto-plus and with protobuf messages.
+
+A channel answers ``ListTimeSeries`` from ``--pages`` serialized pages of
+``--page-size`` time series of ``--points`` points each, so only the
+client's work is measured: the request serialization, the response
+deserialization and the reads of each time series' metric type, resource
+labels and point values. It is done with the client as is and with
+:class:`~google.cloud.monitoring_helpers.raw_messages.RawMessages` attached.
+
+Usage::
+
+    python -m tests.benchmark.bench_raw_messages [--pages 20] [--page-size 1000]
+"""
+
+import argparse
+import time
+
+from google.api import metric_pb2, monitored_resource_pb2
+from google.auth import credentials as ga_credentials
+
+from google.cloud.monitoring_helpers import raw_messages
+from google.cloud.monitoring_v3 import MetricServiceClient
+from google.cloud.monitoring_v3.services.metric_service import transports
+from google.cloud.monitoring_v3.types import common, metric, metric_service
+
+
+class _PagesChannel:
+    """Answers ListTimeSeries from serialized pages, keyed on their page token."""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def unary_unary(self, path, request_serializer=None, response_deserializer=None):
+        def call(request, timeout=None, metadata=None, **kwargs):
+            page_token = metric_service.ListTimeSeriesRequest.deserialize(
+                request_serializer(request)
+            ).page_token
+            return response_deserializer(self.pages[page_token])
+
+        return call
+
+    def close(self):
+        pass
+
+
+def make_pages(pages, page_size, points):
+    serialized = {}
+    for page in range(pages):
+        response = metric_service.ListTimeSeriesResponse(
+            time_series=[
+                metric.TimeSeries(
+                    metric=metric_pb2.Metric(
+                        type="custom.googleapis.com/latency",
+                        labels={"route": "/work/{}".format(i)},
+                    ),
+                    resource=monitored_resource_pb2.MonitoredResource(
+                        type="gce_instance",
+                        labels={"instance_id": str(i), "zone": "us-central1-a"},
+                    ),
+                    points=[
+                        metric.Point(
+                            interval=common.TimeInterval(
+                                end_time={"seconds": 1700000000 + 60 * p}
+                            ),
+                            value=common.TypedValue(double_value=i + p / 10),
+                        )
+                        for p in range(points)
+                    ],
+                )
+                for i in range(page_size)
+            ],
+            next_page_token=str(page + 1) if page + 1 < pages else "",
+        )
+        serialized[
+            "" if page == 0 else str(page)
+        ] = metric_service.ListTimeSeriesResponse.serialize(response)
+    return serialized
+
+
+def consume(client):
+    total = 0.0
+    for item in client.list_time_series(name="projects/p", filter="f"):
+        item.metric.type
+        item.resource.labels["instance_id"]
+        for point in item.points:
+            total += point.value.double_value
+    return total
+
+
+def per_series_us(client, series, repeat):
+    consume(client)
+    best = None
+    for _ in range(repeat):
+        start = time.process_time()
+        consume(client)
+        elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / series * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--points", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    channel = _PagesChannel(make_pages(args.pages, args.page_size, args.points))
+    series = args.pages * args.page_size
+    results = []
+    for label, raw in (("proto-plus", False), ("protobuf", True)):
+        client = MetricServiceClient(
+            transport=transports.MetricServiceGrpcTransport(
+                credentials=ga_credentials.AnonymousCredentials(), channel=channel
+            )
+        )
+        if raw:
+            raw_messages.RawMessages().attach(client.transport)
+        results.append((label, per_series_us(client, series, args.repeat)))
+
+    print(
+        "{} pages of {} time series of {} points".format(
+            args.pages, args.page_size, args.points
+        )
+    )
+    print(f"{'':>12}{'us/series':>10}{'speedup':>10}")
+    for label, us in results:
+        print(f"{label:>12}{us:>10.2f}{results[0][1] / us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
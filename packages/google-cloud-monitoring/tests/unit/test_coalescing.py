@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from concurrent import futures
+
+from google.cloud.monitoring_helpers import coalescing
+
+_NAME = "projects/p/metricDescriptors/custom.googleapis.com/m"
+
+
+def _concurrently(call, calls, **kwargs):
+    with futures.ThreadPoolExecutor(max_workers=calls) as pool:
+        results = [pool.submit(call, **kwargs) for _ in range(calls)]
+    return [result.result() for result in results]
+
+
+def test_identical_calls_share_one_rpc(server, grpc_client):
+    coalescer = coalescing.Coalescer()
+    server.delay = 0.1
+    client = grpc_client(coalescer)
+
+    responses = _concurrently(client.get_metric_descriptor, 4, name=_NAME)
+
+    assert [r.name for r in responses] == [_NAME] * 4
+    assert len(server.requests) == 1
+    assert (coalescer.calls, coalescer.coalesced) == (1, 3)
+
+
+def test_method_without_retry_is_not_coalesced(server, grpc_client):
+    coalescer = coalescing.Coalescer()
+    server.delay = 0.1
+    client = grpc_client(coalescer)
+
+    _concurrently(client.create_time_series, 2, name="projects/p", time_series=[])
+
+    assert len(server.requests) == 2
+    assert coalescer.calls == 0
+
+
+def test_async_identical_calls_share_one_rpc(server, async_client):
+    coalescer = coalescing.Coalescer()
+    server.delay = 0.05
+
+    async def main():
+        client = async_client(coalescer)
+        return await asyncio.gather(
+            *(client.get_metric_descriptor(name=_NAME) for _ in range(4))
+        )
+
+    responses = asyncio.run(main())
+
+    assert [r.name for r in responses] == [_NAME] * 4
+    assert len(server.requests) == 1
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+import grpc
+
+from google.cloud.monitoring_helpers import compression
+from google.cloud.monitoring_v3.types import metric
+
+_PROJECT = "projects/p"
+
+
+def _time_series(unit_size):
+    return [metric.TimeSeries(unit="x" * unit_size)]
+
+
+def test_grpc_large_requests_are_compressed(server, grpc_client):
+    client = grpc_client(compression.Compression(methods=["create_time_series"]))
+
+    client.create_time_series(name=_PROJECT, time_series=_time_series(4096))
+    client.create_time_series(name=_PROJECT, time_series=_time_series(16))
+    client.get_metric_descriptor(name=_PROJECT + "/metricDescriptors/" + "x" * 4096)
+
+    assert server.calls[0]["compression"] == grpc.Compression.Gzip
+    assert "compression" not in server.calls[1]
+    assert "compression" not in server.calls[2]
+
+
+def test_async_large_requests_are_compressed(server, async_client):
+    async def main():
+        client = async_client(
+            compression.Compression(methods=["create_time_series"]),
+            methods=["create_time_series"],
+        )
+        await client.create_time_series(name=_PROJECT, time_series=_time_series(4096))
+
+    asyncio.run(main())
+
+    assert server.calls[0]["compression"] == grpc.Compression.Gzip
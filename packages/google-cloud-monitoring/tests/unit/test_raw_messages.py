@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+from google.api import metric_pb2
+
+from google.cloud.monitoring_helpers import raw_messages
+from google.cloud.monitoring_v3.types import metric
+
+_PROJECT = "projects/p"
+
+
+def test_protobuf_response_is_returned_as_is(grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+
+    response = client.get_metric_descriptor(name=_PROJECT + "/metricDescriptors/m")
+
+    assert type(response) is metric_pb2.MetricDescriptor
+    assert response.type == "custom.googleapis.com/m"
+
+
+def test_pager_yields_protobuf_items(server, grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+
+    series = list(client.list_time_series(name=_PROJECT, filter="f"))
+
+    assert [type(s) for s in series] == [metric.TimeSeries.pb()] * 3
+    assert [s.unit for s in series] == ["a", "b", "c"]
+    assert [r.page_token for r in server.requests] == ["", "2"]
+
+
+def test_async_pager_yields_protobuf_items(async_client):
+    async def main():
+        client = async_client(raw_messages.RawMessages(), methods=["list_time_series"])
+        pager = await client.list_time_series(name=_PROJECT, filter="f")
+        return [s async for s in pager]
+
+    series = asyncio.run(main())
+
+    assert [type(s) for s in series] == [metric.TimeSeries.pb()] * 3
+    assert [s.unit for s in series] == ["a", "b", "c"]
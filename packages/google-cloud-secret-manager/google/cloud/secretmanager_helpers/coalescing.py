@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Sharing one RPC between identical concurrent calls.
+
+With a :class:`Coalescer` attached to a transport, a call of an idempotent
+method whose request and metadata (which carries the routing headers) are
+identical to those of a call already in flight makes no RPC of its own.
+It waits for the call in flight and receives a copy of its response, or
+its error. Calls are only shared between transports for the same host
+and caller, as named by :func:`~.wrapping.scope`.
+
+A method counts as idempotent when its default retry covers
+``UNAVAILABLE``, which the generator only does for methods that are safe
+to repeat, or when it is named in ``methods``. Services whose methods
+have no default retry coalesce only the methods named.
+
+Synchronous calls are coalesced whole, retries included. Asyncio clients
+apply their retries above the transport, so their attempts are coalesced
+instead.
+
+.. code-block:: python
+
+    coalescer = coalescing.Coalescer()
+    coalescer.attach(client.transport)
+"""
+
+import asyncio
+from concurrent import futures
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from google.api_core import exceptions as core_exceptions
+import grpc  # type: ignore
+
+from google.cloud.secretmanager_helpers import wrapping
+
+_STREAMING = (grpc.UnaryStreamMultiCallable, grpc.StreamStreamMultiCallable)
+
+
+def _key(scope: str, name: str, request: Any, metadata: Any) -> Optional[Hashable]:
+    pb = getattr(type(request), "pb", None)
+    message = pb(request) if pb is not None else request
+    serialize = getattr(message, "SerializeToString", None)
+    if serialize is None:
+        return None
+    key = (
+        scope,
+        name,
+        type(request),
+        serialize(deterministic=True),
+        tuple(metadata or ()),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _timeout(kwargs: Dict[str, Any]) -> Optional[float]:
+    timeout = kwargs.get("timeout")
+    return timeout if isinstance(timeout, (int, float)) else None
+
+
+def _timed_out(name: str) -> core_exceptions.DeadlineExceeded:
+    return core_exceptions.DeadlineExceeded(
+        "Timed out waiting for an identical call of {}".format(name)
+    )
+
+
+class Coalescer:
+    """Makes identical concurrent calls share one RPC.
+
+    Args:
+        methods (Optional[Iterable[str]]): The names of methods to coalesce
+            although their default retry does not cover ``UNAVAILABLE``, for
+            example ``"get_secret"``. Only name methods whose responses the
+            callers can share.
+
+    Attributes:
+        calls (int): RPCs made for calls that could have been coalesced.
+        coalesced (int): Calls that waited for another call's RPC instead
+            of making their own.
+    """
+
+    def __init__(self, methods: Optional[Iterable[str]] = None):
+        self.methods = frozenset(methods or ())
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, futures.Future] = {}
+        self._async_flights: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def attach(self, transport) -> None:
+        """Coalesce the calls of a transport's idempotent methods."""
+        transport._coalescer = self
+        transport._wrapped_methods.clear()
+        wrapping.hook_async_stubs(transport)
+
+    def detach(self, transport) -> None:
+        """Stop coalescing a transport's calls."""
+        transport._coalescer = None
+        transport._wrapped_methods.clear()
+
+    def applies(self, name: str, idempotent: bool) -> bool:
+        """Whether the calls of the named method are coalesced."""
+        return idempotent or name in self.methods
+
+    def _join(self, flights: Dict[Hashable, Any], key: Hashable, new: Callable):
+        """Return the flight for ``key`` and whether this call leads it."""
+        with self._lock:
+            flight = flights.get(key)
+            if flight is None:
+                flight = flights[key] = new()
+                self.calls += 1
+                return flight, True
+            self.coalesced += 1
+            return flight, False
+
+    def _land(self, flights: Dict[Hashable, Any], key: Hashable) -> None:
+        with self._lock:
+            del flights[key]
+
+    def wrap(
+        self, name: str, method: Callable, wrapped: Callable, *, scope: str
+    ) -> Callable:
+        """Coalesce the calls of a wrapped method.
+
+        Args:
+            name (str): The transport method's name.
+            method (Callable): The transport method.
+            wrapped (Callable): The method with its retry, timeout and error
+                handling applied.
+            scope (str): The transport's :func:`~.wrapping.scope`; only calls
+                made through transports with the same scope are coalesced.
+        """
+        if isinstance(method, _STREAMING):
+            return wrapped
+
+        def call(request, *args, **kwargs):
+            key = _key(scope, name, request, kwargs.get("metadata"))
+            if key is None:
+                return wrapped(request, *args, **kwargs)
+            flight, leader = self._join(self._flights, key, futures.Future)
+            if not leader:
+                try:
+                    return copy.deepcopy(flight.result(_timeout(kwargs)))
+                except futures.TimeoutError:
+                    raise _timed_out(name) from None
+            try:
+                response = wrapped(request, *args, **kwargs)
+            except BaseException as exc:
+                flight.set_exception(exc)
+                raise
+            else:
+                flight.set_result(response)
+                return response
+            finally:
+                self._land(self._flights, key)
+
+        return call
+
+    def wrap_async(self, name: str, stub: Callable, *, scope: str) -> Callable:
+        """Coalesce the calls of an asyncio unary stub."""
+
+        async def call(request, **kwargs):
+            key = _key(scope, name, request, kwargs.get("metadata"))
+            if key is None:
+                return await stub(request, **kwargs)
+            loop = asyncio.get_running_loop()
+            # Asyncio futures belong to one event loop.
+            flight, leader = self._join(
+                self._async_flights, (loop, key), loop.create_future
+            )
+            if not leader:
+                try:
+                    response = await asyncio.wait_for(
+                        asyncio.shield(flight), _timeout(kwargs)
+                    )
+                except asyncio.TimeoutError:
+                    raise _timed_out(name) from None
+                except asyncio.CancelledError:
+                    if not flight.cancelled():
+                        raise
+                    # The call in flight was cancelled, this one was not.
+                    return await call(request, **kwargs)
+                return copy.deepcopy(response)
+            try:
+                response = await stub(request, **kwargs)
+            except asyncio.CancelledError:
+                flight.cancel()
+                raise
+            except BaseException as exc:
+                flight.set_exception(exc)
+                # Retrieved, so that it is not logged if no call waited.
+                flight.exception()
+                raise
+            else:
+                flight.set_result(response)
+                return response
+            finally:
+                self._land(self._async_flights, (loop, key))
+
+        return call
+
+
+__all__ = ("Coalescer",)
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Lazy creation of a transport's wrapped methods.
+
+Transports used to build ``_wrapped_methods`` eagerly, calling
+``gapic_v1.method.wrap_method`` (and creating a gRPC stub) for every RPC
+of the service whenever a client was constructed. For services with
+hundreds of RPCs that dominates construction time, even though most
+processes only ever call a handful of them.
+
+The helpers that change how calls are made (compression, hedging,
+limiting, coalescing, caching, instrumentation and raw messages) hook in
+here when a method is wrapped.
+Asyncio clients call their transport's stubs directly rather than its
+wrapped methods, so for them the hooks apply through :class:`AsyncStubs`.
+"""
+
+from typing import Any, Callable, Dict, Mapping
+
+from google.api_core import exceptions as core_exceptions
+from grpc.experimental import aio  # type: ignore
+
+
+def is_idempotent(wrapped: Any) -> bool:
+    """Whether a wrapped method's default retry covers ``UNAVAILABLE``.
+
+    The generator only retries ``UNAVAILABLE`` for methods that are safe
+    to repeat.
+    """
+    retry = getattr(wrapped, "_retry", None)
+    predicate = getattr(retry, "_predicate", None)
+    return predicate is not None and bool(
+        predicate(core_exceptions.ServiceUnavailable(""))
+    )
+
+
+# Credentials attributes that name the caller, most specific first. Not
+# client_id, which every user of one OAuth client shares.
+_CALLER_ATTRIBUTES = ("service_account_email", "signer_email", "account")
+
+
+def _caller(credentials: Any) -> str:
+    if credentials is None:
+        return ""
+    caller = None
+    for attribute in _CALLER_ATTRIBUTES:
+        caller = getattr(credentials, attribute, None)
+        if caller:
+            break
+    if not caller:
+        # Whom they act for is unknown, so share entries with no others.
+        caller = "id:{}".format(id(credentials))
+    return "{}:{}:{}".format(
+        type(credentials).__qualname__,
+        caller,
+        getattr(credentials, "quota_project_id", None) or "",
+    )
+
+
+def scope(transport: Any) -> str:
+    """Return the part of a key that names a transport's endpoint and caller.
+
+    Response caches and coalescers both key their calls on it, so that
+    transports for different endpoints or callers never share responses.
+    """
+    return "{}\0{}".format(
+        getattr(transport, "_host", ""),
+        _caller(getattr(transport, "_credentials", None)),
+    )
+
+
+class LazyWrappedMethods(dict):
+    """Maps transport methods to their wrapped versions, wrapping on first use.
+
+    Clients look up ``transport._wrapped_methods[transport.some_method]``;
+    on the first lookup of a method its factory is called and the result
+    is cached, so later lookups are plain dictionary hits.
+
+    Args:
+        transport: The transport whose methods are wrapped.
+        factories (Mapping[str, Callable[[Callable], Callable]]): For each
+            method name, a callable that wraps the transport method it is
+            given.
+    """
+
+    def __init__(
+        self, transport: Any, factories: Mapping[str, Callable[[Callable], Any]]
+    ):
+        super().__init__()
+        self._transport = transport
+        self._factories = factories
+        self._idempotent: Dict[str, bool] = {}
+        self._forget_names()
+
+    def _forget_names(self) -> None:
+        # Methods already fetched from the transport while resolving a name.
+        self._names: Dict[Any, str] = {}
+        self._unscanned = iter(list(self._factories))
+
+    def clear(self) -> None:
+        """Forget every wrapped method, and the transport methods seen.
+
+        REST stubs compare equal by their session, which a transport
+        replaces when it reopens in a forked child.
+        """
+        super().clear()
+        self._forget_names()
+
+    def _name_of(self, method: Any) -> str:
+        # gRPC transports cache their stubs by method name.
+        for name, stub in getattr(self._transport, "_stubs", {}).items():
+            if stub is method and name in self._factories:
+                return name
+        name = self._names.get(method)
+        while name is None:
+            candidate_name = next(self._unscanned, None)
+            if candidate_name is None:
+                raise KeyError(method)
+            candidate = getattr(self._transport, candidate_name)
+            self._names[candidate] = candidate_name
+            if candidate == method:
+                name = candidate_name
+        return name
+
+    def __missing__(self, method: Any) -> Any:
+        name = self._name_of(method)
+        factory = self._factories[name]
+        # Set by compression.Compression.attach. Innermost, so that every
+        # attempt sends a compressed request.
+        stub = method
+        compression = getattr(self._transport, "_compression", None)
+        if compression is not None and compression.applies(name):
+            stub = compression.wrap(method)
+        # Set by hedging.Hedging.attach.
+        hedging = getattr(self._transport, "_hedging", None)
+        if hedging is not None:
+            factory = hedging.factory(name, factory)
+        # Set by limiting.Limiter.attach. Applied after hedging, so that
+        # every hedge waits for the limiter too.
+        limiter = getattr(self._transport, "_limiter", None)
+        if limiter is not None:
+            factory = limiter.factory(name, factory)
+        # Set by instrumentation.Instrumentation.attach.
+        instrumentation = getattr(self._transport, "_instrumentation", None)
+        if instrumentation is None:
+            wrapped = factory(stub)
+        else:
+            wrapped = instrumentation.wrap(name, stub, factory)
+        # Set by coalescing.Coalescer.attach. Outermost, so that a call
+        # which waits for an identical one makes no attempts of its own.
+        coalescer = getattr(self._transport, "_coalescer", None)
+        if coalescer is not None and coalescer.applies(name, self.is_idempotent(name)):
+            wrapped = coalescer.wrap(
+                name, method, wrapped, scope=scope(self._transport)
+            )
+        # Set by caching.ResponseCache.attach. Outside coalescing, so that
+        # a hit does not wait for an identical call in flight.
+        cache = getattr(self._transport, "_cache", None)
+        if cache is not None:
+            ttl = cache.method_ttl(name, self.is_idempotent(name))
+            if ttl > 0:
+                wrapped = cache.wrap(
+                    name, method, wrapped, ttl, scope=scope(self._transport)
+                )
+        # Set by raw_messages.RawMessages.attach. Outermost, so that the
+        # other hooks only ever see proto-plus responses.
+        raw_messages = getattr(self._transport, "_raw_messages", None)
+        if raw_messages is not None:
+            wrapped = raw_messages.wrap(wrapped)
+        self[method] = wrapped
+        return wrapped
+
+    def is_idempotent(self, name: str) -> bool:
+        """Whether the named method's default retry covers ``UNAVAILABLE``."""
+        idempotent = self._idempotent.get(name)
+        if idempotent is None:
+            idempotent = self._idempotent[name] = is_idempotent(
+                self._factories[name](_unwrapped)
+            )
+        return idempotent
+
+    def __contains__(self, method: Any) -> bool:
+        if super().__contains__(method):
+            return True
+        try:
+            self._name_of(method)
+        except KeyError:
+            return False
+        return True
+
+
+def _unwrapped(*args, **kwargs):
+    """Stands in for a transport method when only a wrapper's retry is read.
+
+    It is wrapped but never called.
+    """
+
+
+class _HookedUnaryUnary(aio.UnaryUnaryMultiCallable):
+    """An asyncio unary stub that applies its transport's hooks to each call."""
+
+    def __init__(self, transport: Any, name: str, stub: aio.UnaryUnaryMultiCallable):
+        self._transport = transport
+        self._name = name
+        self._stub = stub
+
+    def __call__(self, request, **kwargs):
+        call = self._stub
+        # Set by compression.Compression.attach.
+        compression = getattr(self._transport, "_compression", None)
+        if compression is not None and compression.applies(self._name):
+            call = compression.wrap_async(call)
+        # Set by limiting.Limiter.attach.
+        limiter = getattr(self._transport, "_limiter", None)
+        if limiter is not None:
+            call = limiter.wrap_async(self._name, call)
+        wrapped_methods = self._transport._wrapped_methods
+        # Set by coalescing.Coalescer.attach.
+        coalescer = getattr(self._transport, "_coalescer", None)
+        if coalescer is not None and coalescer.applies(
+            self._name, wrapped_methods.is_idempotent(self._name)
+        ):
+            call = coalescer.wrap_async(self._name, call, scope=scope(self._transport))
+        # Set by caching.ResponseCache.attach.
+        cache = getattr(self._transport, "_cache", None)
+        if cache is not None:
+            ttl = cache.method_ttl(
+                self._name, wrapped_methods.is_idempotent(self._name)
+            )
+            if ttl > 0:
+                call = cache.wrap_async(
+                    self._name, call, ttl, scope=scope(self._transport)
+                )
+        # Set by raw_messages.RawMessages.attach.
+        raw_messages = getattr(self._transport, "_raw_messages", None)
+        if raw_messages is not None:
+            call = raw_messages.wrap_async(call)
+        return call(request, **kwargs)
+
+
+class AsyncStubs(dict):
+    """A transport's stub cache whose asyncio unary stubs apply its hooks.
+
+    Args:
+        transport: The transport whose ``_stubs`` this replaces.
+        stubs (Mapping[str, Any]): The stubs already created.
+    """
+
+    def __init__(self, transport: Any, stubs: Mapping[str, Any]):
+        super().__init__()
+        self._transport = transport
+        for name, stub in stubs.items():
+            self[name] = stub
+
+    def __setitem__(self, name: str, stub: Any) -> None:
+        if isinstance(stub, aio.UnaryUnaryMultiCallable) and not isinstance(
+            stub, _HookedUnaryUnary
+        ):
+            stub = _HookedUnaryUnary(self._transport, name, stub)
+        super().__setitem__(name, stub)
+
+
+def hook_async_stubs(transport: Any) -> None:
+    """Make the asyncio unary stubs of a transport apply its hooks."""
+    stubs = getattr(transport, "_stubs", None)
+    if stubs is not None and not isinstance(stubs, AsyncStubs):
+        transport._stubs = AsyncStubs(transport, stubs)
+
+
+__all__ = (
+    "AsyncStubs",
+    "LazyWrappedMethods",
+    "hook_async_stubs",
+    "is_idempotent",
+    "scope",
+)
@@ -27,6 +27,7 @@ from google.iam.v1 import policy_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.secretmanager_helpers import wrapping
 from google.cloud.secretmanager_v1 import gapic_version as package_version
 from google.cloud.secretmanager_v1.types import resources, service
 
@@ -123,94 +124,97 @@ class SecretManagerServiceTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_secrets: gapic_v1.method.wrap_method(
-                self.list_secrets,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_secret: gapic_v1.method.wrap_method(
-                self.create_secret,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.add_secret_version: gapic_v1.method.wrap_method(
-                self.add_secret_version,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_secret: gapic_v1.method.wrap_method(
-                self.get_secret,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_secret: gapic_v1.method.wrap_method(
-                self.update_secret,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.delete_secret: gapic_v1.method.wrap_method(
-                self.delete_secret,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_secret_versions: gapic_v1.method.wrap_method(
-                self.list_secret_versions,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_secret_version: gapic_v1.method.wrap_method(
-                self.get_secret_version,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.access_secret_version: gapic_v1.method.wrap_method(
-                self.access_secret_version,
-                default_retry=retries.Retry(
-                    initial=2.0,
-                    maximum=60.0,
-                    multiplier=2.0,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ResourceExhausted,
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_secrets": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "create_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "add_secret_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "get_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "update_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "delete_secret": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "list_secret_versions": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "get_secret_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "access_secret_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=2.0,
+                        maximum=60.0,
+                        multiplier=2.0,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ResourceExhausted,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=60.0,
                     ),
-                    deadline=60.0,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "disable_secret_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "enable_secret_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "destroy_secret_version": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "set_iam_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "get_iam_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "test_iam_permissions": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
                 ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.disable_secret_version: gapic_v1.method.wrap_method(
-                self.disable_secret_version,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.enable_secret_version: gapic_v1.method.wrap_method(
-                self.enable_secret_version,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.destroy_secret_version: gapic_v1.method.wrap_method(
-                self.destroy_secret_version,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.set_iam_policy: gapic_v1.method.wrap_method(
-                self.set_iam_policy,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_iam_policy: gapic_v1.method.wrap_method(
-                self.get_iam_policy,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.test_iam_permissions: gapic_v1.method.wrap_method(
-                self.test_iam_permissions,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-        }
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
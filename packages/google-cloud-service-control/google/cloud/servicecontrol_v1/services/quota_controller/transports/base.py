@@ -24,6 +24,7 @@ import google.auth  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.servicecontrol_helpers import wrapping
 from google.cloud.servicecontrol_v1 import gapic_version as package_version
 from google.cloud.servicecontrol_v1.types import quota_controller
 
@@ -123,14 +124,17 @@ class QuotaControllerTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.allocate_quota: gapic_v1.method.wrap_method(
-                self.allocate_quota,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "allocate_quota": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
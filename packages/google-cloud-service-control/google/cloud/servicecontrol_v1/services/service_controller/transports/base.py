@@ -24,6 +24,7 @@ import google.auth  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.servicecontrol_helpers import wrapping
 from google.cloud.servicecontrol_v1 import gapic_version as package_version
 from google.cloud.servicecontrol_v1.types import service_controller
 
@@ -123,28 +124,31 @@ class ServiceControllerTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.check: gapic_v1.method.wrap_method(
-                self.check,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "check": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=5.0,
                     ),
-                    deadline=5.0,
+                    default_timeout=5.0,
+                    client_info=client_info,
                 ),
-                default_timeout=5.0,
-                client_info=client_info,
-            ),
-            self.report: gapic_v1.method.wrap_method(
-                self.report,
-                default_timeout=16.0,
-                client_info=client_info,
-            ),
-        }
+                "report": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=16.0,
+                    client_info=client_info,
+                ),
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
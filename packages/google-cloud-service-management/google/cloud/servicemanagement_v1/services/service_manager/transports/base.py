@@ -28,6 +28,7 @@ from google.iam.v1 import policy_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.servicemanagement_helpers import wrapping
 from google.cloud.servicemanagement_v1 import gapic_version as package_version
 from google.cloud.servicemanagement_v1.types import resources, servicemanager
 
@@ -129,74 +130,77 @@ class ServiceManagerTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_services: gapic_v1.method.wrap_method(
-                self.list_services,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_service: gapic_v1.method.wrap_method(
-                self.get_service,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_service: gapic_v1.method.wrap_method(
-                self.create_service,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_service: gapic_v1.method.wrap_method(
-                self.delete_service,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.undelete_service: gapic_v1.method.wrap_method(
-                self.undelete_service,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_service_configs: gapic_v1.method.wrap_method(
-                self.list_service_configs,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_service_config: gapic_v1.method.wrap_method(
-                self.get_service_config,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_service_config: gapic_v1.method.wrap_method(
-                self.create_service_config,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.submit_config_source: gapic_v1.method.wrap_method(
-                self.submit_config_source,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_service_rollouts: gapic_v1.method.wrap_method(
-                self.list_service_rollouts,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_service_rollout: gapic_v1.method.wrap_method(
-                self.get_service_rollout,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_service_rollout: gapic_v1.method.wrap_method(
-                self.create_service_rollout,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.generate_config_report: gapic_v1.method.wrap_method(
-                self.generate_config_report,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_services": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_service": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_service": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_service": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "undelete_service": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_service_configs": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_service_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_service_config": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "submit_config_source": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_service_rollouts": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_service_rollout": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_service_rollout": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "generate_config_report": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from concurrent import futures
+
+from google.cloud.servicemanagement_helpers import coalescing
+
+_SERVICE = "example.googleapis.com"
+
+
+def _concurrently(call, calls, **kwargs):
+    with futures.ThreadPoolExecutor(max_workers=calls) as pool:
+        results = [pool.submit(call, **kwargs) for _ in range(calls)]
+    return [result.result() for result in results]
+
+
+def test_identical_calls_of_named_method_share_one_rpc(server, grpc_client):
+    coalescer = coalescing.Coalescer(methods=["get_service_config"])
+    server.delay = 0.1
+    client = grpc_client(coalescer)
+
+    responses = _concurrently(
+        client.get_service_config, 4, service_name=_SERVICE, config_id="c"
+    )
+
+    assert [(r.name, r.id) for r in responses] == [(_SERVICE, "c")] * 4
+    assert len({id(r) for r in responses}) == 4
+    assert len(server.requests) == 1
+    assert (coalescer.calls, coalescer.coalesced) == (1, 3)
+
+
+def test_calls_with_other_requests_are_not_shared(server, grpc_client):
+    coalescer = coalescing.Coalescer(methods=["get_service_config"])
+    server.delay = 0.1
+    client = grpc_client(coalescer)
+
+    with futures.ThreadPoolExecutor(max_workers=2) as pool:
+        results = [
+            pool.submit(
+                client.get_service_config, service_name=_SERVICE, config_id=config
+            )
+            for config in ("a", "b")
+        ]
+
+    assert [r.result().id for r in results] == ["a", "b"]
+    assert len(server.requests) == 2
+
+
+def test_method_without_retry_is_not_coalesced_unless_named(server, grpc_client):
+    coalescer = coalescing.Coalescer()
+    server.delay = 0.1
+    client = grpc_client(coalescer)
+
+    _concurrently(client.get_service_config, 2, service_name=_SERVICE, config_id="c")
+
+    assert len(server.requests) == 2
+    assert coalescer.calls == 0
+
+
+def test_async_identical_calls_share_one_rpc(server, async_client):
+    coalescer = coalescing.Coalescer(methods=["get_service_config"])
+    server.delay = 0.05
+
+    async def main():
+        client = async_client(coalescer)
+        return await asyncio.gather(
+            *(
+                client.get_service_config(service_name=_SERVICE, config_id="c")
+                for _ in range(4)
+            )
+        )
+
+    responses = asyncio.run(main())
+
+    assert [r.id for r in responses] == ["c"] * 4
+    assert len(server.requests) == 1
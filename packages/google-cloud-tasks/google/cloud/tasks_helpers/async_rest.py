@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Non-blocking HTTP for the asyncio REST transports.
+
+:class:`AsyncAuthorizedSession` sends requests with ``aiohttp`` over a
+pooled connector and authorizes them with ordinary ``google-auth``
+credentials. Refreshing credentials is a blocking call, so it runs in the
+event loop's default executor, at most once at a time per session.
+
+``aiohttp`` is an optional dependency; install it with the ``async_rest``
+extra. It is imported when the first session is created, so that importing
+the clients, which import the asyncio REST transports, does not load it.
+"""
+
+import asyncio
+import importlib
+import os
+import ssl
+import tempfile
+from typing import Any, Callable, Mapping, Optional, Sequence, Tuple
+
+import google.auth.transport.requests
+import requests
+
+
+def _import_aiohttp():
+    try:
+        return importlib.import_module("aiohttp")
+    except ImportError as exc:
+        raise ImportError(
+            "The asyncio REST transport requires aiohttp; install "
+            "google-cloud-tasks[async_rest]."
+        ) from exc
+
+
+def _to_requests_response(
+    method: str, url: str, status: int, headers: Mapping[str, str], content: bytes
+) -> requests.Response:
+    # The transports share their response handling and error mapping with
+    # the synchronous REST transport, which expects a requests.Response.
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    response._content = content
+    response.url = url
+    response.request = requests.PreparedRequest()
+    response.request.method = method
+    response.request.url = url
+    return response
+
+
+def mtls_ssl_context(
+    client_cert_source: Callable[[], Tuple[bytes, bytes]]
+) -> ssl.SSLContext:
+    """Return an SSL context presenting the client certificate for mutual TLS.
+
+    Args:
+        client_cert_source (Callable[[], Tuple[bytes, bytes]]): Returns the
+            client certificate and private key, both in PEM format.
+    """
+    cert, key = client_cert_source()
+    context = ssl.create_default_context()
+    # load_cert_chain only reads from files. They are readable by this user
+    # only, in a directory that is too, and removed as soon as they are read.
+    directory = tempfile.mkdtemp()
+    cert_file = os.path.join(directory, "cert.pem")
+    key_file = os.path.join(directory, "key.pem")
+    try:
+        _write_private(cert_file, cert)
+        _write_private(key_file, key)
+        context.load_cert_chain(cert_file, key_file)
+    finally:
+        for path in (key_file, cert_file):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        os.rmdir(directory)
+    return context
+
+
+def _write_private(path: str, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+
+class AsyncAuthorizedSession:
+    """An ``aiohttp`` session that attaches credentials to every request.
+
+    The underlying ``aiohttp.ClientSession`` is created on first use, inside
+    the running event loop, and must be closed with :meth:`close`.
+
+    Args:
+        credentials (google.auth.credentials.Credentials): The credentials
+            to authorize requests with.
+        max_connections (int): The maximum number of open connections, or
+            ``0`` for no limit.
+        max_connections_per_host (int): The maximum number of open
+            connections to one host, or ``0`` for no limit.
+        keepalive_timeout (float): Seconds an idle connection is kept open
+            for reuse.
+        ssl_context (Optional[ssl.SSLContext]): The SSL context for HTTPS
+            connections, for example from :func:`mtls_ssl_context`.
+
+    Raises:
+        ImportError: If ``aiohttp`` is not installed.
+    """
+
+    def __init__(
+        self,
+        credentials,
+        *,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
+        self._aiohttp = _import_aiohttp()
+        if max_connections < 0 or max_connections_per_host < 0:
+            raise ValueError("connection limits must be non-negative")
+        self.credentials = credentials
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._ssl_context = ssl_context
+        self._session = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._auth_request = google.auth.transport.requests.Request()
+
+    def _client_session(self):
+        if self._session is None:
+            connector_kwargs = {}
+            if self._ssl_context is not None:
+                connector_kwargs["ssl"] = self._ssl_context
+            self._session = self._aiohttp.ClientSession(
+                connector=self._aiohttp.TCPConnector(
+                    limit=self._max_connections,
+                    limit_per_host=self._max_connections_per_host,
+                    keepalive_timeout=self._keepalive_timeout,
+                    **connector_kwargs,
+                )
+            )
+        return self._session
+
+    async def _authorize(self, method: str, url: str, headers: dict) -> None:
+        if not self.credentials.valid:
+            if self._refresh_lock is None:
+                self._refresh_lock = asyncio.Lock()
+            async with self._refresh_lock:
+                if not self.credentials.valid:
+                    # Refreshing blocks on network I/O; keep it off the loop.
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self.credentials.refresh, self._auth_request
+                    )
+        self.credentials.before_request(self._auth_request, method, url, headers)
+
+    async def open(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Sequence[Tuple[str, Any]]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Any = None,
+        timeout: Optional[float] = None,
+    ):
+        """Send a request and return the ``aiohttp`` response unread.
+
+        The caller must release the response, for example by using it as an
+        async context manager.
+        """
+        method = method.upper()
+        headers = dict(headers or {})
+        await self._authorize(method, url, headers)
+        return await self._client_session().request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            data=data,
+            timeout=self._aiohttp.ClientTimeout(total=timeout),
+        )
+
+    async def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request and read the whole response.
+
+        Takes the same arguments as :meth:`open`. The response is returned as
+        a ``requests.Response`` so that it can be handled exactly like one
+        from the synchronous REST transport.
+        """
+        async with await self.open(method, url, **kwargs) as response:
+            content = await response.read()
+            return _to_requests_response(
+                response.method,
+                str(response.url),
+                response.status,
+                response.headers,
+                content,
+            )
+
+    async def get(self, url: str, **kwargs) -> requests.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> requests.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> requests.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> requests.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> requests.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+
+__all__ = (
+    "AsyncAuthorizedSession",
+    "mtls_ssl_context",
+)
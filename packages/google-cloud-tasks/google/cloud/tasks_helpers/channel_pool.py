@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Pools of gRPC channels that behave like a single channel.
+
+A gRPC channel multiplexes every call over one HTTP/2 connection, and the
+server caps the number of concurrent streams on a connection (commonly at
+100). Calls beyond that limit queue on the client even when the server
+could take more. A pool opens several channels, each with its own
+connection, and sends every call on the channel with the fewest calls in
+flight.
+
+Multicallables returned by a pool create the underlying per-channel
+multicallable on first use and keep it, so a transport's ``_stubs`` cache
+holds one pooled multicallable per method and one real stub per channel.
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+# Gives each channel its own subchannel pool. Without it, channels created
+# with the same target and arguments share a single connection.
+_LOCAL_SUBCHANNEL_POOL = ("grpc.use_local_subchannel_pool", 1)
+
+
+def validate_pool_size(channel_pool_size: int) -> int:
+    """Check a ``channel_pool_size`` argument.
+
+    Args:
+        channel_pool_size (int): The number of channels to open.
+
+    Returns:
+        int: ``channel_pool_size``, unchanged.
+
+    Raises:
+        ValueError: If ``channel_pool_size`` is less than 1.
+    """
+    if channel_pool_size < 1:
+        raise ValueError(
+            "channel_pool_size must be at least 1, got {}".format(channel_pool_size)
+        )
+    return channel_pool_size
+
+
+def channel_options(
+    options: Sequence[Tuple[str, Any]], channel_pool_size: int
+) -> List[Tuple[str, Any]]:
+    """Return the options for each channel of a pool of the given size."""
+    options = list(options)
+    if channel_pool_size > 1:
+        options.append(_LOCAL_SUBCHANNEL_POOL)
+    return options
+
+
+class _Balancer:
+    """Tracks the calls in flight on each channel of a pool."""
+
+    def __init__(self, size: int):
+        self._in_flight = [0] * size
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> int:
+        """Pick the least-loaded channel and count a call against it."""
+        with self._lock:
+            size = len(self._in_flight)
+            # Scan from a rotating start so that ties are spread evenly.
+            best = self._next
+            for offset in range(1, size):
+                index = (self._next + offset) % size
+                if self._in_flight[index] < self._in_flight[best]:
+                    best = index
+            self._next = (best + 1) % size
+            self._in_flight[best] += 1
+            return best
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            self._in_flight[index] -= 1
+
+    @property
+    def in_flight(self) -> List[int]:
+        with self._lock:
+            return list(self._in_flight)
+
+
+class _PooledMultiCallable:
+    """Dispatches each call of one method to the least-loaded channel."""
+
+    def __init__(self, pool, kind: str, method: str, args, kwargs):
+        self._pool = pool
+        self._kind = kind
+        self._method = method
+        self._args = args
+        self._kwargs = kwargs
+        self._stubs: List[Optional[Callable]] = [None] * len(pool.channels)
+
+    def _stub(self, index: int) -> Callable:
+        stub = self._stubs[index]
+        if stub is None:
+            factory = getattr(self._pool.channels[index], self._kind)
+            stub = self._stubs[index] = factory(
+                self._method, *self._args, **self._kwargs
+            )
+        return stub
+
+    def _blocking(self, attribute: Optional[str], args, kwargs):
+        index = self._pool._balancer.acquire()
+        try:
+            stub = self._stub(index)
+            call = getattr(stub, attribute) if attribute else stub
+            return call(*args, **kwargs)
+        finally:
+            self._pool._balancer.release(index)
+
+    def _nonblocking(self, attribute: Optional[str], args, kwargs):
+        # The call object is released once it completes, which for a
+        # streaming response is after the last message.
+        balancer = self._pool._balancer
+        index = balancer.acquire()
+        try:
+            stub = self._stub(index)
+            call = (getattr(stub, attribute) if attribute else stub)(*args, **kwargs)
+        except BaseException:
+            balancer.release(index)
+            raise
+        call.add_done_callback(lambda _: balancer.release(index))
+        return call
+
+
+class _UnaryUnary(_PooledMultiCallable, grpc.UnaryUnaryMultiCallable):
+    def __call__(self, *args, **kwargs):
+        return self._blocking(None, args, kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self._blocking("with_call", args, kwargs)
+
+    def future(self, *args, **kwargs):
+        return self._nonblocking("future", args, kwargs)
+
+
+class _UnaryStream(_PooledMultiCallable, grpc.UnaryStreamMultiCallable):
+    def __call__(self, *args, **kwargs):
+        return self._nonblocking(None, args, kwargs)
+
+
+class _StreamUnary(_PooledMultiCallable, grpc.StreamUnaryMultiCallable):
+    def __call__(self, *args, **kwargs):
+        return self._blocking(None, args, kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self._blocking("with_call", args, kwargs)
+
+    def future(self, *args, **kwargs):
+        return self._nonblocking("future", args, kwargs)
+
+
+class _StreamStream(_PooledMultiCallable, grpc.StreamStreamMultiCallable):
+    def __call__(self, *args, **kwargs):
+        return self._nonblocking(None, args, kwargs)
+
+
+class _AsyncUnaryUnary(_PooledMultiCallable, aio.UnaryUnaryMultiCallable):
+    def __call__(self, *args, **kwargs):
+        return self._nonblocking(None, args, kwargs)
+
+
+class _AsyncUnaryStream(_PooledMultiCallable, aio.UnaryStreamMultiCallable):
+    def __call__(self, *args, **kwargs):
+        return self._nonblocking(None, args, kwargs)
+
+
+class _AsyncStreamUnary(_PooledMultiCallable, aio.StreamUnaryMultiCallable):
+    def __call__(self, *args, **kwargs):
+        return self._nonblocking(None, args, kwargs)
+
+
+class _AsyncStreamStream(_PooledMultiCallable, aio.StreamStreamMultiCallable):
+    def __call__(self, *args, **kwargs):
+        return self._nonblocking(None, args, kwargs)
+
+
+class ChannelPool(grpc.Channel):
+    """A fixed set of ``grpc.Channel`` objects used as one channel.
+
+    Args:
+        channels (Sequence[grpc.Channel]): The channels to dispatch to,
+            normally all to the same target.
+    """
+
+    def __init__(self, channels: Sequence[grpc.Channel]):
+        if not channels:
+            raise ValueError("a channel pool needs at least one channel")
+        self._channels = tuple(channels)
+        self._balancer = _Balancer(len(self._channels))
+
+    @property
+    def channels(self) -> Tuple[grpc.Channel, ...]:
+        """The channels in the pool."""
+        return self._channels
+
+    @property
+    def in_flight(self) -> List[int]:
+        """The number of calls in flight on each channel."""
+        return self._balancer.in_flight
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _UnaryUnary(self, "unary_unary", method, args, kwargs)
+
+    def unary_stream(self, method, *args, **kwargs):
+        return _UnaryStream(self, "unary_stream", method, args, kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return _StreamUnary(self, "stream_unary", method, args, kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return _StreamStream(self, "stream_stream", method, args, kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self._channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self._channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class AsyncChannelPool(aio.Channel):
+    """A fixed set of ``aio.Channel`` objects used as one channel.
+
+    Args:
+        channels (Sequence[aio.Channel]): The channels to dispatch to,
+            normally all to the same target.
+    """
+
+    def __init__(self, channels: Sequence[aio.Channel]):
+        if not channels:
+            raise ValueError("a channel pool needs at least one channel")
+        self._channels = tuple(channels)
+        self._balancer = _Balancer(len(self._channels))
+
+    @property
+    def channels(self) -> Tuple[aio.Channel, ...]:
+        """The channels in the pool."""
+        return self._channels
+
+    @property
+    def in_flight(self) -> List[int]:
+        """The number of calls in flight on each channel."""
+        return self._balancer.in_flight
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _AsyncUnaryUnary(self, "unary_unary", method, args, kwargs)
+
+    def unary_stream(self, method, *args, **kwargs):
+        return _AsyncUnaryStream(self, "unary_stream", method, args, kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return _AsyncStreamUnary(self, "stream_unary", method, args, kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return _AsyncStreamStream(self, "stream_stream", method, args, kwargs)
+
+    def get_state(self, try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        """Return ``READY`` if every channel is ready, else the first other state."""
+        for channel in self._channels:
+            state = channel.get_state(try_to_connect)
+            if state != grpc.ChannelConnectivity.READY:
+                return state
+        return grpc.ChannelConnectivity.READY
+
+    async def wait_for_state_change(self, last_observed_state) -> None:
+        """Wait until any channel leaves ``last_observed_state``."""
+        waiters = [
+            asyncio.ensure_future(channel.wait_for_state_change(last_observed_state))
+            for channel in self._channels
+        ]
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+            await asyncio.gather(*waiters, return_exceptions=True)
+
+    async def channel_ready(self) -> None:
+        await asyncio.gather(*(channel.channel_ready() for channel in self._channels))
+
+    async def close(self, grace: Optional[float] = None):
+        await asyncio.gather(*(channel.close(grace) for channel in self._channels))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+def pool_channels(channels: Sequence[Any]) -> Any:
+    """Return ``channels`` as one channel, pooling them if there are several."""
+    if len(channels) == 1:
+        return channels[0]
+    if isinstance(channels[0], aio.Channel):
+        return AsyncChannelPool(channels)
+    return ChannelPool(channels)
+
+
+__all__ = (
+    "AsyncChannelPool",
+    "ChannelPool",
+    "channel_options",
+    "pool_channels",
+    "validate_pool_size",
+)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Background page prefetching for the generated pagers.
+
+Each page request needs the ``next_page_token`` of the previous response,
+so pages are still fetched one after another. Prefetching moves those
+requests off the caller's path instead: while the caller works through
+page N, pages N+1 to N+k are requested in the background and buffered.
+At most ``k`` unread pages are held at any time, and no further requests
+are started once the caller stops iterating.
+"""
+
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, TypeVar
+
+PageT = TypeVar("PageT")
+
+_DONE = object()
+
+
+def validate_prefetch(prefetch: int) -> int:
+    """Check a ``prefetch`` argument.
+
+    Args:
+        prefetch (int): The number of pages to fetch ahead of the caller;
+            ``0`` disables prefetching.
+
+    Returns:
+        int: ``prefetch``, unchanged.
+
+    Raises:
+        ValueError: If ``prefetch`` is negative.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be non-negative, got {}".format(prefetch))
+    return prefetch
+
+
+def iter_pages(
+    first_page: PageT,
+    fetch_page: Callable[[str], PageT],
+    prefetch: int,
+) -> Iterator[PageT]:
+    """Yield ``first_page`` and the pages after it, fetched on a worker thread.
+
+    Args:
+        first_page: The response that has already been received.
+        fetch_page (Callable[[str], Any]): Fetches the page for a page token.
+        prefetch (int): The maximum number of unread pages to buffer; must
+            be at least 1.
+
+    Yields:
+        The pages, in order. An error raised while fetching a page is
+        re-raised here, in place of that page.
+    """
+    pages: "queue.Queue[Any]" = queue.Queue()
+    # One slot per page that may be requested without the caller having
+    # read it yet.
+    slots = threading.Semaphore(prefetch)
+    stopped = threading.Event()
+
+    def worker():
+        page = first_page
+        try:
+            while page.next_page_token:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                page = fetch_page(page.next_page_token)
+                pages.put(page)
+        except Exception as exc:
+            pages.put(exc)
+        pages.put(_DONE)
+
+    if not first_page.next_page_token:
+        yield first_page
+        return
+
+    thread = threading.Thread(target=worker, name="pager-prefetch", daemon=True)
+    thread.start()
+    try:
+        yield first_page
+        while True:
+            page = pages.get()
+            if page is _DONE:
+                return
+            if isinstance(page, Exception):
+                raise page
+            slots.release()
+            yield page
+    finally:
+        stopped.set()
+        # Wake the worker if it is waiting for a slot so that it can exit.
+        slots.release()
+
+
+async def aiter_pages(
+    first_page: PageT,
+    fetch_page: Callable[[str], Awaitable[PageT]],
+    prefetch: int,
+) -> AsyncIterator[PageT]:
+    """Yield ``first_page`` and the pages after it, fetched by a background task.
+
+    Args:
+        first_page: The response that has already been received.
+        fetch_page (Callable[[str], Awaitable[Any]]): Fetches the page for a
+            page token.
+        prefetch (int): The maximum number of unread pages to buffer; must
+            be at least 1.
+
+    Yields:
+        The pages, in order. An error raised while fetching a page is
+        re-raised here, in place of that page.
+    """
+    if not first_page.next_page_token:
+        yield first_page
+        return
+
+    pages: "asyncio.Queue[Any]" = asyncio.Queue()
+    slots = asyncio.Semaphore(prefetch)
+
+    async def worker():
+        page = first_page
+        try:
+            while page.next_page_token:
+                await slots.acquire()
+                page = await fetch_page(page.next_page_token)
+                pages.put_nowait(page)
+        except Exception as exc:
+            pages.put_nowait(exc)
+        pages.put_nowait(_DONE)
+
+    task = asyncio.ensure_future(worker())
+    try:
+        yield first_page
+        while True:
+            page = await pages.get()
+            if page is _DONE:
+                return
+            if isinstance(page, Exception):
+                raise page
+            slots.release()
+            yield page
+    finally:
+        task.cancel()
+        # Let the worker observe the cancellation before the loop can close.
+        await asyncio.gather(task, return_exceptions=True)
+
+
+__all__ = (
+    "aiter_pages",
+    "iter_pages",
+    "validate_prefetch",
+)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A process-wide registry of channels and sessions shared between transports.
+
+Transports created with ``shared=True`` look up their channel (or HTTP
+session) here by a key built from their configuration. The first transport
+with a given key creates the resource; later ones reuse it, along with its
+TLS connections, cached access token and, for gRPC, its stubs. Each
+transport holds a :class:`Lease` and the resource is closed when the last
+lease is closed.
+
+Channels and sessions cannot be used across ``fork()``: in a child process
+the registry starts out empty, and leases taken in the parent neither
+close nor count against the resources the child creates.
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+def make_key(transport_class: type, **config: Any) -> Tuple[Hashable, ...]:
+    """Build a registry key from a transport's configuration.
+
+    Credentials, callables and other objects compare by identity, so only
+    transports given the same objects share a resource. Lists become tuples.
+
+    Args:
+        transport_class (type): The transport class; resources are never
+            shared between transport classes.
+        config: The constructor arguments that affect the resource.
+
+    Returns:
+        Tuple[Hashable, ...]: The key.
+    """
+    parts = []
+    for name, value in sorted(config.items()):
+        if isinstance(value, list):
+            value = tuple(value)
+        parts.append((name, value))
+    return (transport_class,) + tuple(parts)
+
+
+class _Entry:
+    def __init__(self, resource: Any):
+        self.resource = resource
+        self.stubs: Dict[str, Callable] = {}
+        self.refcount = 0
+
+
+class Lease:
+    """A transport's reference to a shared resource.
+
+    Attributes:
+        resource: The shared channel or session.
+        stubs (Dict[str, Callable]): A stub cache shared by every transport
+            holding a lease on the same resource.
+    """
+
+    def __init__(self, registry: "Registry", key: Hashable, entry: _Entry):
+        self._registry = registry
+        self._key = key
+        self._entry = entry
+        self._generation = registry._generation
+        self._released = False
+
+    @property
+    def resource(self) -> Any:
+        return self._entry.resource
+
+    @property
+    def stubs(self) -> Dict[str, Callable]:
+        return self._entry.stubs
+
+    def _release(self) -> bool:
+        if self._released:
+            return False
+        self._released = True
+        return self._registry._release(self)
+
+    def close(self) -> None:
+        """Release the lease, closing the resource if it was the last one."""
+        if self._release():
+            self.resource.close()
+
+    async def aclose(self) -> None:
+        """Like :meth:`close`, for resources whose ``close`` is a coroutine."""
+        if self._release():
+            await self.resource.close()
+
+
+class Registry:
+    """Reference-counted resources, keyed by transport configuration."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._generation = 0
+
+    def acquire(self, key: Hashable, factory: Callable[[], Any]) -> Lease:
+        """Return a lease on the resource for ``key``, creating it if needed.
+
+        Args:
+            key (Hashable): The key, usually from :func:`make_key`.
+            factory (Callable[[], Any]): Creates the resource. It is called
+                with the registry locked, at most once per key at a time.
+
+        Returns:
+            Lease: A lease that must be closed when the caller is done.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(factory())
+            entry.refcount += 1
+            return Lease(self, key, entry)
+
+    def _release(self, lease: Lease) -> bool:
+        """Drop a lease; return whether its resource should now be closed."""
+        with self._lock:
+            if lease._generation != self._generation:
+                # Taken before a fork; the child does not own the resource.
+                return False
+            entry = lease._entry
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return False
+            if self._entries.get(lease._key) is entry:
+                del self._entries[lease._key]
+            return True
+
+    def refcount(self, key: Hashable) -> int:
+        """Return the number of open leases for ``key``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.refcount if entry is not None else 0
+
+    def _after_fork_in_child(self) -> None:
+        # The lock may have been held by another thread at fork time.
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._generation += 1
+
+
+_REGISTRY = Registry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_REGISTRY._after_fork_in_child)
+
+
+def acquire(key: Hashable, factory: Callable[[], Any]) -> Lease:
+    """Return a lease from the process-wide registry; see :meth:`Registry.acquire`."""
+    return _REGISTRY.acquire(key, factory)
+
+
+def refcount(key: Hashable) -> int:
+    """Return the number of open leases for ``key`` in the process-wide registry."""
+    return _REGISTRY.refcount(key)
+
+
+__all__ = (
+    "Lease",
+    "Registry",
+    "acquire",
+    "make_key",
+    "refcount",
+)
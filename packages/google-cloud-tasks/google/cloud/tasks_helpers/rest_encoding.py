@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Encoding of protobuf messages for REST requests."""
+
+import base64
+import math
+from typing import Any, List, Mapping, Optional, Tuple
+
+from google.api_core import rest_helpers
+from google.protobuf import descriptor, json_format
+from google.protobuf import message as message_lib
+from google.protobuf.internal import type_checkers
+
+_FieldDescriptor = descriptor.FieldDescriptor
+
+_INTEGER_TYPES = frozenset(
+    (
+        _FieldDescriptor.CPPTYPE_INT32,
+        _FieldDescriptor.CPPTYPE_UINT32,
+        _FieldDescriptor.CPPTYPE_INT64,
+        _FieldDescriptor.CPPTYPE_UINT64,
+        _FieldDescriptor.CPPTYPE_ENUM,
+    )
+)
+
+
+def message_to_query_params(
+    message: message_lib.Message,
+    defaults: Optional[Mapping[str, Any]] = None,
+    *,
+    use_integers_for_enums: bool = True,
+) -> List[Tuple[str, str]]:
+    """Flatten a protobuf message into HTTP query parameters.
+
+    This produces exactly what the transports used to compute with
+    ``rest_helpers.flatten_query_params(json.loads(MessageToJson(...)),
+    strict=True)`` (with ``including_default_value_fields=False`` and the
+    same ``use_integers_for_enums``), but walks the message once instead of
+    serializing it to a JSON string and parsing it back.
+
+    Args:
+        message (google.protobuf.message.Message): The message whose set
+            fields become query parameters.
+        defaults (Optional[Mapping[str, Any]]): JSON values for top-level
+            fields, keyed by JSON field name, that are emitted when the
+            message does not set that field.
+        use_integers_for_enums (bool): Whether enum values are sent as
+            numbers rather than names.
+
+    Returns:
+        List[Tuple[str, str]]: ``(name, value)`` pairs suitable for the
+        ``params`` argument of a ``requests`` call.
+
+    Raises:
+        ValueError: If a repeated field holds messages, which cannot be
+            represented as query parameters.
+    """
+    params: List[Tuple[str, str]] = []
+    if _is_well_known(message.DESCRIPTOR):
+        params.extend(
+            rest_helpers.flatten_query_params(
+                json_format.MessageToDict(
+                    message, use_integers_for_enums=use_integers_for_enums
+                ),
+                strict=True,
+            )
+        )
+        present = {name for name, _ in params}
+    else:
+        present = set()
+        for field, value in message.ListFields():
+            name = _json_name(field)
+            present.add(name)
+            _encode_field(field, value, name, params, use_integers_for_enums)
+
+    if defaults:
+        for name, value in defaults.items():
+            if name not in present:
+                params.extend(
+                    rest_helpers.flatten_query_params({name: value}, strict=True)
+                )
+    return params
+
+
+def _json_name(field: _FieldDescriptor) -> str:
+    if field.is_extension:
+        return "[{}]".format(field.full_name)
+    return field.json_name
+
+
+def _is_well_known(message_descriptor: descriptor.Descriptor) -> bool:
+    # Well-known types have bespoke JSON mappings (e.g. Timestamp becomes an
+    # RFC 3339 string); defer to json_format for those.
+    return message_descriptor.full_name.startswith("google.protobuf.")
+
+
+def _encode_field(field, value, key, params, ints):
+    if field.message_type and field.message_type.GetOptions().map_entry:
+        value_field = field.message_type.fields_by_name["value"]
+        for map_key, map_value in value.items():
+            if isinstance(map_key, bool):
+                map_key = "true" if map_key else "false"
+            _encode_value(value_field, map_value, f"{key}.{map_key}", params, ints)
+    elif field.label == _FieldDescriptor.LABEL_REPEATED:
+        for element in value:
+            if field.cpp_type == _FieldDescriptor.CPPTYPE_MESSAGE:
+                as_json = _well_known_to_json(element, ints)
+                if isinstance(as_json, (dict, list)) or as_json is None:
+                    raise ValueError(
+                        "query params may not contain repeated dicts or lists"
+                    )
+                params.append((key, _canonicalize(as_json)))
+            else:
+                _encode_scalar(field, element, key, params, ints)
+    else:
+        _encode_value(field, value, key, params, ints)
+
+
+def _encode_value(field, value, key, params, ints):
+    if field.cpp_type != _FieldDescriptor.CPPTYPE_MESSAGE:
+        _encode_scalar(field, value, key, params, ints)
+    elif _is_well_known(value.DESCRIPTOR):
+        params.extend(
+            rest_helpers.flatten_query_params(
+                {key: json_format.MessageToDict(value, use_integers_for_enums=ints)},
+                strict=True,
+            )
+        )
+    else:
+        for sub_field, sub_value in value.ListFields():
+            _encode_field(
+                sub_field, sub_value, f"{key}.{_json_name(sub_field)}", params, ints
+            )
+
+
+def _encode_scalar(field, value, key, params, ints):
+    cpp_type = field.cpp_type
+    if cpp_type == _FieldDescriptor.CPPTYPE_STRING:
+        if field.type == _FieldDescriptor.TYPE_BYTES:
+            value = base64.b64encode(value).decode("utf-8")
+        params.append((key, value))
+    elif cpp_type == _FieldDescriptor.CPPTYPE_BOOL:
+        params.append((key, "true" if value else "false"))
+    elif cpp_type in _INTEGER_TYPES:
+        if (
+            cpp_type == _FieldDescriptor.CPPTYPE_ENUM
+            and field.enum_type.full_name == "google.protobuf.NullValue"
+        ):
+            # JSON null; flatten_query_params drops it.
+            return
+        if cpp_type == _FieldDescriptor.CPPTYPE_ENUM and not ints:
+            enum_value = field.enum_type.values_by_number.get(value)
+            if enum_value is not None:
+                params.append((key, enum_value.name))
+                return
+        params.append((key, str(int(value))))
+    else:
+        if math.isinf(value):
+            params.append((key, "-Infinity" if value < 0 else "Infinity"))
+        elif math.isnan(value):
+            params.append((key, "NaN"))
+        else:
+            if cpp_type == _FieldDescriptor.CPPTYPE_FLOAT:
+                value = type_checkers.ToShortestFloat(value)
+            params.append((key, str(value)))
+
+
+def _well_known_to_json(value, ints):
+    if not _is_well_known(value.DESCRIPTOR):
+        return {}
+    return json_format.MessageToDict(value, use_integers_for_enums=ints)
+
+
+def _canonicalize(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+__all__ = ("message_to_query_params",)
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Transcoding of requests into HTTP calls with precompiled rules.
+
+``path_template.transcode`` parses the URI templates of a method's HTTP
+rules on every call. Each REST stub instead holds a :class:`Transcoder`,
+which parses its rules once, on first use, into the literal parts and
+field paths of each URI and a compiled pattern to validate the expanded
+URI against.
+"""
+
+import re
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from google.api_core import path_template
+from google.protobuf import message as message_lib
+
+# The variables of a URI template, as path_template parses them.
+_VARIABLE_RE = re.compile(r"{(?P<name>[^/]+?)(?:=(?P<template>.+?))?}")
+_WILDCARD_RE = re.compile(r"\*\*|\*")
+
+
+def _wildcard_pattern(match: "re.Match[str]") -> str:
+    return "(.+)" if match.group(0) == "**" else "([^/]+)"
+
+
+def _segments_pattern(template: str) -> str:
+    """Return the pattern that matches the expansions of a template."""
+    return _WILDCARD_RE.sub(_wildcard_pattern, template)
+
+
+def _variable_pattern(match: "re.Match[str]") -> str:
+    template = match.group("template")
+    if not template:
+        return "([^/]+)"
+    return _segments_pattern(template)
+
+
+class _Rule:
+    """One HTTP rule, parsed."""
+
+    __slots__ = ("method", "body", "parts", "fields", "pattern", "positional")
+
+    def __init__(self, http_option: Mapping[str, str]):
+        uri = http_option["uri"]
+        self.method = http_option["method"]
+        self.body = http_option.get("body")
+        # Alternating literal text and dotted field paths, starting with text.
+        self.parts: List[Union[str, Tuple[str, ...]]] = []
+        self.fields: List[Tuple[str, ...]] = []
+        position = 0
+        for match in _VARIABLE_RE.finditer(uri):
+            field = tuple(match.group("name").split("."))
+            self.parts.append(uri[position : match.start()])
+            self.parts.append(field)
+            self.fields.append(field)
+            position = match.end()
+        self.parts.append(uri[position:])
+        # Wildcards outside variables need positional arguments, which no
+        # request has.
+        self.positional = any(
+            _WILDCARD_RE.search(part) for part in self.parts if part.__class__ is str
+        )
+        self.pattern = re.compile(
+            _segments_pattern(_VARIABLE_RE.sub(_variable_pattern, uri)) + "$"
+        )
+
+    def transcode(self, message: message_lib.Message) -> Optional[Dict[str, Any]]:
+        """Return the transcoded request, or None if the rule does not apply."""
+        uri = []
+        for part in self.parts:
+            if part.__class__ is str:
+                uri.append(part)
+                continue
+            value: Any = message
+            for name in part:
+                value = getattr(value, name, None)
+            if not value:
+                return None
+            uri.append(str(value))
+        expanded = "".join(uri)
+        if self.pattern.match(expanded) is None:
+            return None
+
+        leftovers = message.__class__()
+        leftovers.CopyFrom(message)
+        for field in self.fields:
+            _delete_field(leftovers, field)
+
+        request: Dict[str, Any] = {"uri": expanded}
+        if self.body == "*":
+            request["body"] = leftovers
+            request["query_params"] = message.__class__()
+        elif self.body:
+            try:
+                request["body"] = getattr(leftovers, self.body)
+                leftovers.ClearField(self.body)
+            except (KeyError, AttributeError, ValueError):
+                return None
+            request["query_params"] = leftovers
+        else:
+            request["query_params"] = leftovers
+        request["method"] = self.method
+        return request
+
+
+def _delete_field(message: Any, field: Tuple[str, ...]) -> None:
+    for name in field[:-1]:
+        if not hasattr(message, name):
+            return
+        message = getattr(message, name)
+    if hasattr(message, field[-1]):
+        message.ClearField(field[-1])
+
+
+class Transcoder:
+    """Transcodes the requests of one REST method.
+
+    Gives the same results as ``path_template.transcode`` with the same
+    rules, which it defers to for requests that match none of them, so
+    that the error is the same too.
+
+    Args:
+        http_options (Sequence[Mapping[str, str]]): The method's HTTP rules,
+            each with a ``"method"``, a ``"uri"`` template and optionally a
+            ``"body"`` field, in order of preference.
+    """
+
+    def __init__(self, http_options: Sequence[Mapping[str, str]]):
+        self.http_options = [dict(http_option) for http_option in http_options]
+        self._rules: Optional[List[_Rule]] = None
+        self._lock = threading.Lock()
+
+    def _compile(self) -> List[_Rule]:
+        with self._lock:
+            if self._rules is None:
+                rules = [_Rule(option) for option in self.http_options]
+                if any(rule.positional for rule in rules):
+                    # Left to path_template, which raises the error.
+                    rules = []
+                self._rules = rules
+            return self._rules
+
+    def transcode(self, message: message_lib.Message) -> Dict[str, Any]:
+        """Transcode a request message into an HTTP call.
+
+        Args:
+            message (google.protobuf.message.Message): The request.
+
+        Returns:
+            dict: The HTTP ``"method"``, the expanded ``"uri"``, the
+            ``"query_params"`` message and, for rules with a body, the
+            ``"body"`` message.
+
+        Raises:
+            ValueError: If the request matches none of the rules.
+        """
+        rules = self._rules
+        if rules is None:
+            rules = self._compile()
+        for rule in rules:
+            request = rule.transcode(message)
+            if request is not None:
+                return request
+        return path_template.transcode(self.http_options, message)
+
+
+__all__ = ("Transcoder",)
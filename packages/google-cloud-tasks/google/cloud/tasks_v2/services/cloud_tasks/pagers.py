@@ -24,6 +24,7 @@ from typing import (
     Tuple,
 )
 
+from google.cloud.tasks_helpers import paging
 from google.cloud.tasks_v2.types import cloudtasks, queue, task
 
 
@@ -51,7 +52,8 @@ class ListQueuesPager:
         request: cloudtasks.ListQueuesRequest,
         response: cloudtasks.ListQueuesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0
     ):
         """Instantiate the pager.
 
@@ -64,23 +66,38 @@ class ListQueuesPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to request ahead of
+                iteration on a background thread. ``0`` (the default)
+                requests each page only when iteration reaches it.
         """
         self._method = method
         self._request = cloudtasks.ListQueuesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = paging.validate_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterator[cloudtasks.ListQueuesResponse]:
+        if self._prefetch:
+            for page in paging.iter_pages(
+                self._response, self._fetch_page, self._prefetch
+            ):
+                self._response = page
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request, metadata=self._metadata)
             yield self._response
 
+    def _fetch_page(self, page_token: str) -> cloudtasks.ListQueuesResponse:
+        self._request.page_token = page_token
+        return self._method(self._request, metadata=self._metadata)
+
     def __iter__(self) -> Iterator[queue.Queue]:
         for page in self.pages:
             yield from page.queues
@@ -113,7 +130,8 @@ class ListQueuesAsyncPager:
         request: cloudtasks.ListQueuesRequest,
         response: cloudtasks.ListQueuesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0
     ):
         """Instantiates the pager.
 
@@ -126,23 +144,40 @@ class ListQueuesAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to request ahead of
+                iteration on a background task. ``0`` (the default)
+                requests each page only when iteration reaches it.
         """
         self._method = method
         self._request = cloudtasks.ListQueuesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = paging.validate_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     async def pages(self) -> AsyncIterator[cloudtasks.ListQueuesResponse]:
+        if self._prefetch:
+            pages = paging.aiter_pages(self._response, self._fetch_page, self._prefetch)
+            try:
+                async for page in pages:
+                    self._response = page
+                    yield page
+            finally:
+                await pages.aclose()
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = await self._method(self._request, metadata=self._metadata)
             yield self._response
 
+    async def _fetch_page(self, page_token: str) -> cloudtasks.ListQueuesResponse:
+        self._request.page_token = page_token
+        return await self._method(self._request, metadata=self._metadata)
+
     def __aiter__(self) -> AsyncIterator[queue.Queue]:
         async def async_generator():
             async for page in self.pages:
@@ -179,7 +214,8 @@ class ListTasksPager:
         request: cloudtasks.ListTasksRequest,
         response: cloudtasks.ListTasksResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0
     ):
         """Instantiate the pager.
 
@@ -192,23 +228,38 @@ class ListTasksPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to request ahead of
+                iteration on a background thread. ``0`` (the default)
+                requests each page only when iteration reaches it.
         """
         self._method = method
         self._request = cloudtasks.ListTasksRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = paging.validate_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterator[cloudtasks.ListTasksResponse]:
+        if self._prefetch:
+            for page in paging.iter_pages(
+                self._response, self._fetch_page, self._prefetch
+            ):
+                self._response = page
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request, metadata=self._metadata)
             yield self._response
 
+    def _fetch_page(self, page_token: str) -> cloudtasks.ListTasksResponse:
+        self._request.page_token = page_token
+        return self._method(self._request, metadata=self._metadata)
+
     def __iter__(self) -> Iterator[task.Task]:
         for page in self.pages:
             yield from page.tasks
@@ -241,7 +292,8 @@ class ListTasksAsyncPager:
         request: cloudtasks.ListTasksRequest,
         response: cloudtasks.ListTasksResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0
     ):
         """Instantiates the pager.
 
@@ -254,23 +306,40 @@ class ListTasksAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to request ahead of
+                iteration on a background task. ``0`` (the default)
+                requests each page only when iteration reaches it.
         """
         self._method = method
         self._request = cloudtasks.ListTasksRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = paging.validate_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     async def pages(self) -> AsyncIterator[cloudtasks.ListTasksResponse]:
+        if self._prefetch:
+            pages = paging.aiter_pages(self._response, self._fetch_page, self._prefetch)
+            try:
+                async for page in pages:
+                    self._response = page
+                    yield page
+            finally:
+                await pages.aclose()
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = await self._method(self._request, metadata=self._metadata)
             yield self._response
 
+    async def _fetch_page(self, page_token: str) -> cloudtasks.ListTasksResponse:
+        self._request.page_token = page_token
+        return await self._method(self._request, metadata=self._metadata)
+
     def __aiter__(self) -> AsyncIterator[task.Task]:
         async def async_generator():
             async for page in self.pages:
@@ -20,17 +20,20 @@ from .base import CloudTasksTransport
 from .grpc import CloudTasksGrpcTransport
 from .grpc_asyncio import CloudTasksGrpcAsyncIOTransport
 from .rest import CloudTasksRestInterceptor, CloudTasksRestTransport
+from .rest_asyncio import CloudTasksAsyncRestTransport
 
 # Compile a registry of transports.
 _transport_registry = OrderedDict()  # type: Dict[str, Type[CloudTasksTransport]]
 _transport_registry["grpc"] = CloudTasksGrpcTransport
 _transport_registry["grpc_asyncio"] = CloudTasksGrpcAsyncIOTransport
 _transport_registry["rest"] = CloudTasksRestTransport
+_transport_registry["rest_asyncio"] = CloudTasksAsyncRestTransport
 
 __all__ = (
     "CloudTasksTransport",
     "CloudTasksGrpcTransport",
     "CloudTasksGrpcAsyncIOTransport",
     "CloudTasksRestTransport",
+    "CloudTasksAsyncRestTransport",
     "CloudTasksRestInterceptor",
 )
@@ -28,6 +28,7 @@ from google.iam.v1 import policy_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.tasks_helpers import forking, wrapping
 from google.cloud.tasks_v2 import gapic_version as package_version
 from google.cloud.tasks_v2.types import cloudtasks
 from google.cloud.tasks_v2.types import queue
@@ -126,171 +127,195 @@ class CloudTasksTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_queues: gapic_v1.method.wrap_method(
-                self.list_queues,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_queues": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=20.0,
                     ),
-                    deadline=20.0,
+                    default_timeout=20.0,
+                    client_info=client_info,
                 ),
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.get_queue: gapic_v1.method.wrap_method(
-                self.get_queue,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "get_queue": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=20.0,
                     ),
-                    deadline=20.0,
+                    default_timeout=20.0,
+                    client_info=client_info,
                 ),
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.create_queue: gapic_v1.method.wrap_method(
-                self.create_queue,
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.update_queue: gapic_v1.method.wrap_method(
-                self.update_queue,
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.delete_queue: gapic_v1.method.wrap_method(
-                self.delete_queue,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "create_queue": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=20.0,
+                    client_info=client_info,
+                ),
+                "update_queue": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=20.0,
+                    client_info=client_info,
+                ),
+                "delete_queue": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=20.0,
                     ),
-                    deadline=20.0,
+                    default_timeout=20.0,
+                    client_info=client_info,
+                ),
+                "purge_queue": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=20.0,
+                    client_info=client_info,
+                ),
+                "pause_queue": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=20.0,
+                    client_info=client_info,
+                ),
+                "resume_queue": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=20.0,
+                    client_info=client_info,
                 ),
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.purge_queue: gapic_v1.method.wrap_method(
-                self.purge_queue,
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.pause_queue: gapic_v1.method.wrap_method(
-                self.pause_queue,
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.resume_queue: gapic_v1.method.wrap_method(
-                self.resume_queue,
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.get_iam_policy: gapic_v1.method.wrap_method(
-                self.get_iam_policy,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "get_iam_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=20.0,
                     ),
-                    deadline=20.0,
+                    default_timeout=20.0,
+                    client_info=client_info,
                 ),
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.set_iam_policy: gapic_v1.method.wrap_method(
-                self.set_iam_policy,
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.test_iam_permissions: gapic_v1.method.wrap_method(
-                self.test_iam_permissions,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "set_iam_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=20.0,
+                    client_info=client_info,
+                ),
+                "test_iam_permissions": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=20.0,
                     ),
-                    deadline=20.0,
+                    default_timeout=20.0,
+                    client_info=client_info,
                 ),
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.list_tasks: gapic_v1.method.wrap_method(
-                self.list_tasks,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "list_tasks": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=20.0,
                     ),
-                    deadline=20.0,
+                    default_timeout=20.0,
+                    client_info=client_info,
                 ),
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.get_task: gapic_v1.method.wrap_method(
-                self.get_task,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "get_task": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=20.0,
                     ),
-                    deadline=20.0,
+                    default_timeout=20.0,
+                    client_info=client_info,
+                ),
+                "create_task": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=20.0,
+                    client_info=client_info,
                 ),
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.create_task: gapic_v1.method.wrap_method(
-                self.create_task,
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.delete_task: gapic_v1.method.wrap_method(
-                self.delete_task,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "delete_task": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=20.0,
                     ),
-                    deadline=20.0,
+                    default_timeout=20.0,
+                    client_info=client_info,
+                ),
+                "run_task": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=20.0,
+                    client_info=client_info,
                 ),
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-            self.run_task: gapic_v1.method.wrap_method(
-                self.run_task,
-                default_timeout=20.0,
-                client_info=client_info,
-            ),
-        }
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
@@ -26,6 +26,7 @@ from google.iam.v1 import policy_pb2  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 import grpc  # type: ignore
 
+from google.cloud.tasks_helpers import channel_pool, registry
 from google.cloud.tasks_v2.types import cloudtasks
 from google.cloud.tasks_v2.types import queue
 from google.cloud.tasks_v2.types import queue as gct_queue
@@ -67,6 +68,8 @@ class CloudTasksGrpcTransport(CloudTasksTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         api_audience: Optional[str] = None,
+        channel_pool_size: int = 1,
+        shared: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -109,6 +112,14 @@ class CloudTasksGrpcTransport(CloudTasksTransport):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            channel_pool_size (int): The number of channels to open. Each
+                call is sent on the channel with the fewest calls in flight.
+                This argument is ignored if ``channel`` is provided.
+            shared (bool): Whether to share the channel, and its stubs, with
+                other transports of this class created with ``shared=True``
+                and the same arguments. The channel is closed when the last
+                of them is closed. This argument is ignored if ``channel`` is
+                provided.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -116,6 +127,23 @@ class CloudTasksGrpcTransport(CloudTasksTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        channel_pool.validate_pool_size(channel_pool_size)
+        self._lease: Optional[registry.Lease] = None
+        shared_key = registry.make_key(
+            type(self),
+            host=host,
+            credentials=credentials,
+            credentials_file=credentials_file,
+            scopes=scopes,
+            api_mtls_endpoint=api_mtls_endpoint,
+            client_cert_source=client_cert_source,
+            ssl_channel_credentials=ssl_channel_credentials,
+            client_cert_source_for_mtls=client_cert_source_for_mtls,
+            quota_project_id=quota_project_id,
+            always_use_jwt_access=always_use_jwt_access,
+            api_audience=api_audience,
+            channel_pool_size=channel_pool_size,
+        )
         self._grpc_channel = None
         self._ssl_channel_credentials = ssl_channel_credentials
         self._stubs: Dict[str, Callable] = {}
@@ -166,22 +194,47 @@ class CloudTasksGrpcTransport(CloudTasksTransport):
         )
 
         if not self._grpc_channel:
-            self._grpc_channel = type(self).create_channel(
-                self._host,
-                # use the credentials which are saved
-                credentials=self._credentials,
-                # Set ``credentials_file`` to ``None`` here as
-                # the credentials that we saved earlier should be used.
-                credentials_file=None,
-                scopes=self._scopes,
-                ssl_credentials=self._ssl_channel_credentials,
-                quota_project_id=quota_project_id,
-                options=[
+            options = channel_pool.channel_options(
+                [
                     ("grpc.max_send_message_length", -1),
                     ("grpc.max_receive_message_length", -1),
                 ],
+                channel_pool_size,
             )
 
+            def open_channel():
+                return channel_pool.pool_channels(
+                    [
+                        type(self).create_channel(
+                            self._host,
+                            # use the credentials which are saved
+                            credentials=self._credentials,
+                            # Set ``credentials_file`` to ``None`` here as
+                            # the credentials that we saved earlier should be used.
+                            credentials_file=None,
+                            scopes=self._scopes,
+                            ssl_credentials=self._ssl_channel_credentials,
+                            quota_project_id=quota_project_id,
+                            options=options,
+                        )
+                        for _ in range(channel_pool_size)
+                    ]
+                )
+
+            def connect():
+                if shared:
+                    self._lease = registry.acquire(shared_key, open_channel)
+                    self._grpc_channel = self._lease.resource
+                    self._stubs = self._lease.stubs
+                else:
+                    self._grpc_channel = open_channel()
+                    self._stubs.clear()
+
+            # Run again on the first call in a forked child, where the
+            # registry starts out empty.
+            self._connect = connect
+            connect()
+
         # Wrap messages. This must be done after self._grpc_channel exists
         self._prep_wrapped_messages(client_info)
 
@@ -234,7 +287,11 @@ class CloudTasksGrpcTransport(CloudTasksTransport):
 
     @property
     def grpc_channel(self) -> grpc.Channel:
-        """Return the channel designed to connect to this service."""
+        """Return the channel designed to connect to this service.
+
+        With a ``channel_pool_size`` above 1 this is a
+        :class:`~google.cloud.tasks_helpers.channel_pool.ChannelPool`.
+        """
         return self._grpc_channel
 
     @property
@@ -777,7 +834,10 @@ class CloudTasksGrpcTransport(CloudTasksTransport):
         return self._stubs["run_task"]
 
     def close(self):
-        self.grpc_channel.close()
+        if self._lease is not None:
+            self._lease.close()
+        else:
+            self.grpc_channel.close()
 
     @property
     def list_locations(
@@ -26,6 +26,7 @@ from google.protobuf import empty_pb2  # type: ignore
 import grpc  # type: ignore
 from grpc.experimental import aio  # type: ignore
 
+from google.cloud.tasks_helpers import channel_pool, registry
 from google.cloud.tasks_v2.types import cloudtasks
 from google.cloud.tasks_v2.types import queue
 from google.cloud.tasks_v2.types import queue as gct_queue
@@ -112,6 +113,8 @@ class CloudTasksGrpcAsyncIOTransport(CloudTasksTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         api_audience: Optional[str] = None,
+        channel_pool_size: int = 1,
+        shared: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -155,6 +158,14 @@ class CloudTasksGrpcAsyncIOTransport(CloudTasksTransport):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            channel_pool_size (int): The number of channels to open. Each
+                call is sent on the channel with the fewest calls in flight.
+                This argument is ignored if ``channel`` is provided.
+            shared (bool): Whether to share the channel, and its stubs, with
+                other transports of this class created with ``shared=True``
+                and the same arguments. The channel is closed when the last
+                of them is closed. This argument is ignored if ``channel`` is
+                provided.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -162,6 +173,23 @@ class CloudTasksGrpcAsyncIOTransport(CloudTasksTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        channel_pool.validate_pool_size(channel_pool_size)
+        self._lease: Optional[registry.Lease] = None
+        shared_key = registry.make_key(
+            type(self),
+            host=host,
+            credentials=credentials,
+            credentials_file=credentials_file,
+            scopes=scopes,
+            api_mtls_endpoint=api_mtls_endpoint,
+            client_cert_source=client_cert_source,
+            ssl_channel_credentials=ssl_channel_credentials,
+            client_cert_source_for_mtls=client_cert_source_for_mtls,
+            quota_project_id=quota_project_id,
+            always_use_jwt_access=always_use_jwt_access,
+            api_audience=api_audience,
+            channel_pool_size=channel_pool_size,
+        )
         self._grpc_channel = None
         self._ssl_channel_credentials = ssl_channel_credentials
         self._stubs: Dict[str, Callable] = {}
@@ -211,22 +239,40 @@ class CloudTasksGrpcAsyncIOTransport(CloudTasksTransport):
         )
 
         if not self._grpc_channel:
-            self._grpc_channel = type(self).create_channel(
-                self._host,
-                # use the credentials which are saved
-                credentials=self._credentials,
-                # Set ``credentials_file`` to ``None`` here as
-                # the credentials that we saved earlier should be used.
-                credentials_file=None,
-                scopes=self._scopes,
-                ssl_credentials=self._ssl_channel_credentials,
-                quota_project_id=quota_project_id,
-                options=[
+            options = channel_pool.channel_options(
+                [
                     ("grpc.max_send_message_length", -1),
                     ("grpc.max_receive_message_length", -1),
                 ],
+                channel_pool_size,
             )
 
+            def open_channel():
+                return channel_pool.pool_channels(
+                    [
+                        type(self).create_channel(
+                            self._host,
+                            # use the credentials which are saved
+                            credentials=self._credentials,
+                            # Set ``credentials_file`` to ``None`` here as
+                            # the credentials that we saved earlier should be used.
+                            credentials_file=None,
+                            scopes=self._scopes,
+                            ssl_credentials=self._ssl_channel_credentials,
+                            quota_project_id=quota_project_id,
+                            options=options,
+                        )
+                        for _ in range(channel_pool_size)
+                    ]
+                )
+
+            if shared:
+                self._lease = registry.acquire(shared_key, open_channel)
+                self._grpc_channel = self._lease.resource
+                self._stubs = self._lease.stubs
+            else:
+                self._grpc_channel = open_channel()
+
         # Wrap messages. This must be done after self._grpc_channel exists
         self._prep_wrapped_messages(client_info)
 
@@ -235,7 +281,8 @@ class CloudTasksGrpcAsyncIOTransport(CloudTasksTransport):
         """Create the channel designed to connect to this service.
 
         This property caches on the instance; repeated calls return
-        the same channel.
+        the same channel. With a ``channel_pool_size`` above 1 this is an
+        :class:`~google.cloud.tasks_helpers.channel_pool.AsyncChannelPool`.
         """
         # Return the channel from cache.
         return self._grpc_channel
@@ -796,6 +843,8 @@ class CloudTasksGrpcAsyncIOTransport(CloudTasksTransport):
         return self._stubs["run_task"]
 
     def close(self):
+        if self._lease is not None:
+            return self._lease.aclose()
         return self.grpc_channel.close()
 
     @property
@@ -41,6 +41,7 @@ from google.iam.v1 import iam_policy_pb2  # type: ignore
 from google.iam.v1 import policy_pb2  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.tasks_helpers import http_pool, registry, rest_encoding, transcoding
 from google.cloud.tasks_v2.types import cloudtasks
 from google.cloud.tasks_v2.types import queue
 from google.cloud.tasks_v2.types import queue as gct_queue
@@ -586,6 +587,8 @@ class CloudTasksRestTransport(CloudTasksTransport):
         url_scheme: str = "https",
         interceptor: Optional[CloudTasksRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        shared: bool = False,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -618,6 +621,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            shared (bool): Whether to share the HTTP session, and with it
+                connections and the access token, with other transports of
+                this class created with ``shared=True`` and the same
+                arguments. The session is closed when the last of them is
+                closed.
+            http_pool_options (Optional[google.cloud.tasks_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -640,11 +652,39 @@ class CloudTasksRestTransport(CloudTasksTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
+
+        def open_session():
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(session)
+            return session
+
+        self._lease: Optional[registry.Lease] = None
+        shared_key = registry.make_key(
+            type(self),
+            host=host,
+            credentials=credentials,
+            client_cert_source_for_mtls=client_cert_source_for_mtls,
+            always_use_jwt_access=always_use_jwt_access,
+            api_audience=api_audience,
+            http_pool_options=http_pool_options,
         )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            if shared:
+                self._lease = registry.acquire(shared_key, open_session)
+                self._session = self._lease.resource
+            else:
+                self._session = open_session()
+
+        # Run again on the first call in a forked child, where the registry
+        # starts out empty.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or CloudTasksRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -662,6 +702,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2/{parent=projects/*/locations/*}/queues",
+                    "body": "queue",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.CreateQueueRequest,
@@ -693,16 +743,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2/{parent=projects/*/locations/*}/queues",
-                    "body": "queue",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_queue(request, metadata)
             pb_request = cloudtasks.CreateQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -714,17 +757,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -733,7 +772,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -764,6 +803,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2/{parent=projects/*/locations/*/queues/*}/tasks",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.CreateTaskRequest,
@@ -789,16 +838,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     A unit of scheduled work.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2/{parent=projects/*/locations/*/queues/*}/tasks",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_task(request, metadata)
             pb_request = cloudtasks.CreateTaskRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -810,17 +852,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -829,7 +867,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -860,6 +898,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v2/{name=projects/*/locations/*/queues/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.DeleteQueueRequest,
@@ -881,30 +928,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v2/{name=projects/*/locations/*/queues/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_queue(request, metadata)
             pb_request = cloudtasks.DeleteQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -913,7 +950,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -935,6 +972,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v2/{name=projects/*/locations/*/queues/*/tasks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.DeleteTaskRequest,
@@ -956,30 +1002,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v2/{name=projects/*/locations/*/queues/*/tasks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_task(request, metadata)
             pb_request = cloudtasks.DeleteTaskRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -988,7 +1024,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1010,6 +1046,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2/{resource=projects/*/locations/*/queues/*}:getIamPolicy",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: iam_policy_pb2.GetIamPolicyRequest,
@@ -1109,16 +1155,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2/{resource=projects/*/locations/*/queues/*}:getIamPolicy",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_iam_policy(request, metadata)
             pb_request = request
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1130,17 +1169,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1149,7 +1184,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1180,6 +1215,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v2/{name=projects/*/locations/*/queues/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.GetQueueRequest,
@@ -1211,30 +1255,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v2/{name=projects/*/locations/*/queues/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_queue(request, metadata)
             pb_request = cloudtasks.GetQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1243,7 +1277,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1273,6 +1307,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v2/{name=projects/*/locations/*/queues/*/tasks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.GetTaskRequest,
@@ -1298,30 +1341,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     A unit of scheduled work.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v2/{name=projects/*/locations/*/queues/*/tasks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_task(request, metadata)
             pb_request = cloudtasks.GetTaskRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1330,7 +1363,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1360,6 +1393,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v2/{parent=projects/*/locations/*}/queues",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.ListQueuesRequest,
@@ -1387,30 +1429,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v2/{parent=projects/*/locations/*}/queues",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_queues(request, metadata)
             pb_request = cloudtasks.ListQueuesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1419,7 +1451,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1449,6 +1481,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v2/{parent=projects/*/locations/*/queues/*}/tasks",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.ListTasksRequest,
@@ -1476,30 +1517,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v2/{parent=projects/*/locations/*/queues/*}/tasks",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_tasks(request, metadata)
             pb_request = cloudtasks.ListTasksRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1508,7 +1539,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1538,6 +1569,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2/{name=projects/*/locations/*/queues/*}:pause",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.PauseQueueRequest,
@@ -1569,16 +1610,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2/{name=projects/*/locations/*/queues/*}:pause",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_pause_queue(request, metadata)
             pb_request = cloudtasks.PauseQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1590,17 +1624,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1609,7 +1639,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1640,6 +1670,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2/{name=projects/*/locations/*/queues/*}:purge",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.PurgeQueueRequest,
@@ -1671,16 +1711,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2/{name=projects/*/locations/*/queues/*}:purge",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_purge_queue(request, metadata)
             pb_request = cloudtasks.PurgeQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1692,17 +1725,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1711,7 +1740,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1742,6 +1771,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2/{name=projects/*/locations/*/queues/*}:resume",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.ResumeQueueRequest,
@@ -1773,16 +1812,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2/{name=projects/*/locations/*/queues/*}:resume",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_resume_queue(request, metadata)
             pb_request = cloudtasks.ResumeQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1794,17 +1826,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1813,7 +1841,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1844,6 +1872,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2/{name=projects/*/locations/*/queues/*/tasks/*}:run",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.RunTaskRequest,
@@ -1869,16 +1907,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     A unit of scheduled work.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2/{name=projects/*/locations/*/queues/*/tasks/*}:run",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_run_task(request, metadata)
             pb_request = cloudtasks.RunTaskRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1890,17 +1921,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1909,7 +1936,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1940,6 +1967,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2/{resource=projects/*/locations/*/queues/*}:setIamPolicy",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: iam_policy_pb2.SetIamPolicyRequest,
@@ -2039,16 +2076,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2/{resource=projects/*/locations/*/queues/*}:setIamPolicy",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_set_iam_policy(request, metadata)
             pb_request = request
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2060,17 +2090,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2079,7 +2105,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2110,6 +2136,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2/{resource=projects/*/locations/*/queues/*}:testIamPermissions",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: iam_policy_pb2.TestIamPermissionsRequest,
@@ -2134,18 +2170,11 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     Response message for ``TestIamPermissions`` method.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2/{resource=projects/*/locations/*/queues/*}:testIamPermissions",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_test_iam_permissions(
                 request, metadata
             )
             pb_request = request
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2157,17 +2186,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2176,7 +2201,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2207,6 +2232,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v2/{queue.name=projects/*/locations/*/queues/*}",
+                    "body": "queue",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.UpdateQueueRequest,
@@ -2238,16 +2273,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v2/{queue.name=projects/*/locations/*/queues/*}",
-                    "body": "queue",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_queue(request, metadata)
             pb_request = cloudtasks.UpdateQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2259,17 +2287,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2278,7 +2302,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2547,7 +2571,10 @@ class CloudTasksRestTransport(CloudTasksTransport):
         return "rest"
 
     def close(self):
-        self._session.close()
+        if self._lease is not None:
+            self._lease.close()
+        else:
+            self._session.close()
 
 
 __all__ = ("CloudTasksRestTransport",)
@@ -41,6 +41,7 @@ from google.iam.v1 import iam_policy_pb2  # type: ignore
 from google.iam.v1 import policy_pb2  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.tasks_helpers import http_pool, registry, rest_encoding, transcoding
 from google.cloud.tasks_v2beta2.types import cloudtasks
 from google.cloud.tasks_v2beta2.types import queue
 from google.cloud.tasks_v2beta2.types import queue as gct_queue
@@ -691,6 +692,8 @@ class CloudTasksRestTransport(CloudTasksTransport):
         url_scheme: str = "https",
         interceptor: Optional[CloudTasksRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        shared: bool = False,
+        http_pool_options: Optional[http_pool.HttpPoolOptions] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -723,6 +726,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            shared (bool): Whether to share the HTTP session, and with it
+                connections and the access token, with other transports of
+                this class created with ``shared=True`` and the same
+                arguments. The session is closed when the last of them is
+                closed.
+            http_pool_options (Optional[google.cloud.tasks_helpers.http_pool.HttpPoolOptions]):
+                Connection pool settings for the HTTP session, such as
+                the number of connections kept open per host. If
+                ``None``, the ``requests`` defaults are used.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -745,11 +757,39 @@ class CloudTasksRestTransport(CloudTasksTransport):
             always_use_jwt_access=always_use_jwt_access,
             api_audience=api_audience,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
+
+        def open_session():
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+            if http_pool_options is not None:
+                http_pool_options.apply(session)
+            return session
+
+        self._lease: Optional[registry.Lease] = None
+        shared_key = registry.make_key(
+            type(self),
+            host=host,
+            credentials=credentials,
+            client_cert_source_for_mtls=client_cert_source_for_mtls,
+            always_use_jwt_access=always_use_jwt_access,
+            api_audience=api_audience,
+            http_pool_options=http_pool_options,
         )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+
+        def connect():
+            if shared:
+                self._lease = registry.acquire(shared_key, open_session)
+                self._session = self._lease.resource
+            else:
+                self._session = open_session()
+
+        # Run again on the first call in a forked child, where the registry
+        # starts out empty.
+        self._connect = connect
+        connect()
         self._interceptor = interceptor or CloudTasksRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -767,6 +807,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}:acknowledge",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.AcknowledgeTaskRequest,
@@ -788,18 +838,11 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}:acknowledge",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_acknowledge_task(
                 request, metadata
             )
             pb_request = cloudtasks.AcknowledgeTaskRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -811,17 +854,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -830,7 +869,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -853,6 +892,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}:cancelLease",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.CancelLeaseRequest,
@@ -878,16 +927,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     A unit of scheduled work.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}:cancelLease",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_cancel_lease(request, metadata)
             pb_request = cloudtasks.CancelLeaseRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -899,17 +941,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -918,7 +956,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -949,6 +987,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{parent=projects/*/locations/*}/queues",
+                    "body": "queue",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.CreateQueueRequest,
@@ -980,16 +1028,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{parent=projects/*/locations/*}/queues",
-                    "body": "queue",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_queue(request, metadata)
             pb_request = cloudtasks.CreateQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1001,17 +1042,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1020,7 +1057,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1051,6 +1088,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{parent=projects/*/locations/*/queues/*}/tasks",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.CreateTaskRequest,
@@ -1076,16 +1123,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     A unit of scheduled work.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{parent=projects/*/locations/*/queues/*}/tasks",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_task(request, metadata)
             pb_request = cloudtasks.CreateTaskRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1097,17 +1137,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1116,7 +1152,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1147,6 +1183,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.DeleteQueueRequest,
@@ -1168,30 +1213,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_queue(request, metadata)
             pb_request = cloudtasks.DeleteQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1200,7 +1235,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1222,6 +1257,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "delete",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.DeleteTaskRequest,
@@ -1243,30 +1287,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_task(request, metadata)
             pb_request = cloudtasks.DeleteTaskRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1275,7 +1309,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1297,6 +1331,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{resource=projects/*/locations/*/queues/*}:getIamPolicy",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: iam_policy_pb2.GetIamPolicyRequest,
@@ -1396,16 +1440,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{resource=projects/*/locations/*/queues/*}:getIamPolicy",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_iam_policy(request, metadata)
             pb_request = request
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1417,17 +1454,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1436,7 +1469,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1467,6 +1500,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.GetQueueRequest,
@@ -1498,30 +1540,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_queue(request, metadata)
             pb_request = cloudtasks.GetQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1530,7 +1562,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1560,6 +1592,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.GetTaskRequest,
@@ -1585,30 +1626,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     A unit of scheduled work.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_task(request, metadata)
             pb_request = cloudtasks.GetTaskRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1617,7 +1648,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1647,6 +1678,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{parent=projects/*/locations/*/queues/*}/tasks:lease",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.LeaseTasksRequest,
@@ -1674,16 +1715,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{parent=projects/*/locations/*/queues/*}/tasks:lease",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_lease_tasks(request, metadata)
             pb_request = cloudtasks.LeaseTasksRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1695,17 +1729,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1714,7 +1744,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -1745,6 +1775,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v2beta2/{parent=projects/*/locations/*}/queues",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.ListQueuesRequest,
@@ -1772,30 +1811,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v2beta2/{parent=projects/*/locations/*}/queues",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_queues(request, metadata)
             pb_request = cloudtasks.ListQueuesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1804,7 +1833,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1834,6 +1863,15 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "get",
+                    "uri": "/v2beta2/{parent=projects/*/locations/*/queues/*}/tasks",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.ListTasksRequest,
@@ -1861,30 +1899,20 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v2beta2/{parent=projects/*/locations/*/queues/*}/tasks",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_tasks(request, metadata)
             pb_request = cloudtasks.ListTasksRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1893,7 +1921,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1923,6 +1951,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*}:pause",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.PauseQueueRequest,
@@ -1954,16 +1992,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*}:pause",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_pause_queue(request, metadata)
             pb_request = cloudtasks.PauseQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -1975,17 +2006,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -1994,7 +2021,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2025,6 +2052,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*}:purge",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.PurgeQueueRequest,
@@ -2056,16 +2093,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*}:purge",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_purge_queue(request, metadata)
             pb_request = cloudtasks.PurgeQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2077,17 +2107,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2096,7 +2122,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2127,6 +2153,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}:renewLease",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.RenewLeaseRequest,
@@ -2152,16 +2188,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     A unit of scheduled work.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}:renewLease",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_renew_lease(request, metadata)
             pb_request = cloudtasks.RenewLeaseRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2173,17 +2202,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2192,7 +2217,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2223,6 +2248,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*}:resume",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.ResumeQueueRequest,
@@ -2254,16 +2289,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*}:resume",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_resume_queue(request, metadata)
             pb_request = cloudtasks.ResumeQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2275,17 +2303,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2294,7 +2318,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2325,6 +2349,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}:run",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.RunTaskRequest,
@@ -2350,16 +2384,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     A unit of scheduled work.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{name=projects/*/locations/*/queues/*/tasks/*}:run",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_run_task(request, metadata)
             pb_request = cloudtasks.RunTaskRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2371,17 +2398,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2390,7 +2413,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2421,6 +2444,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{resource=projects/*/locations/*/queues/*}:setIamPolicy",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: iam_policy_pb2.SetIamPolicyRequest,
@@ -2520,16 +2553,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{resource=projects/*/locations/*/queues/*}:setIamPolicy",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_set_iam_policy(request, metadata)
             pb_request = request
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2541,17 +2567,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2560,7 +2582,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2591,6 +2613,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "post",
+                    "uri": "/v2beta2/{resource=projects/*/locations/*/queues/*}:testIamPermissions",
+                    "body": "*",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: iam_policy_pb2.TestIamPermissionsRequest,
@@ -2615,18 +2647,11 @@ class CloudTasksRestTransport(CloudTasksTransport):
                     Response message for ``TestIamPermissions`` method.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v2beta2/{resource=projects/*/locations/*/queues/*}:testIamPermissions",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_test_iam_permissions(
                 request, metadata
             )
             pb_request = request
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2638,17 +2663,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2657,7 +2678,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -2688,6 +2709,16 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 if k not in message_dict
             }
 
+        _TRANSCODER = transcoding.Transcoder(
+            [
+                {
+                    "method": "patch",
+                    "uri": "/v2beta2/{queue.name=projects/*/locations/*/queues/*}",
+                    "body": "queue",
+                },
+            ]
+        )
+
         def __call__(
             self,
             request: cloudtasks.UpdateQueueRequest,
@@ -2719,16 +2750,9 @@ class CloudTasksRestTransport(CloudTasksTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v2beta2/{queue.name=projects/*/locations/*/queues/*}",
-                    "body": "queue",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_queue(request, metadata)
             pb_request = cloudtasks.UpdateQueueRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = self._TRANSCODER.transcode(pb_request)
 
             # Jsonify the request body
 
@@ -2740,17 +2764,13 @@ class CloudTasksRestTransport(CloudTasksTransport):
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
-            # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
+            # Flatten the query params in a single pass over the message
+            query_params = rest_encoding.message_to_query_params(
+                transcoded_request["query_params"],
+                defaults=self._get_unset_required_fields({}),
             )
-            query_params.update(self._get_unset_required_fields(query_params))
 
-            query_params["$alt"] = "json;enum-encoding=int"
+            query_params.append(("$alt", "json;enum-encoding=int"))
 
             # Send the request
             headers = dict(metadata)
@@ -2759,7 +2779,7 @@ class CloudTasksRestTransport(CloudTasksTransport):
                 "{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                params=query_params,
                 data=body,
             )
 
@@ -3080,7 +3100,10 @@ class CloudTasksRestTransport(CloudTasksTransport):
         return "rest"
 
     def close(self):
-        self._session.close()
+        if self._lease is not None:
+            self._lease.close()
+        else:
+            self._session.close()
 
 
 __all__ = ("CloudTasksRestTransport",)
@@ -49,6 +49,7 @@ from google.protobuf import duration_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.tasks_helpers import fanout
 from google.cloud.tasks_v2beta3.services.cloud_tasks import pagers
 from google.cloud.tasks_v2beta3.types import cloudtasks
 from google.cloud.tasks_v2beta3.types import queue
@@ -60,9 +61,10 @@ from google.cloud.tasks_v2beta3.types import task as gct_task
 from .client import CloudTasksClient
 from .transports.base import DEFAULT_CLIENT_INFO, CloudTasksTransport
 from .transports.grpc_asyncio import CloudTasksGrpcAsyncIOTransport
+from .transports.rest_asyncio import CloudTasksAsyncRestTransport
 
 
-class CloudTasksAsyncClient:
+class CloudTasksAsyncClient(fanout.AsyncFanOutMixin):
     """Cloud Tasks allows developers to manage the execution of
     background work in their applications.
     """
@@ -177,6 +179,10 @@ class CloudTasksAsyncClient:
         type(CloudTasksClient).get_transport_class, type(CloudTasksClient)
     )
 
+    # Transports that only asyncio clients can use; the synchronous
+    # client's registry does not list them.
+    _async_transport_registry = {"rest_asyncio": CloudTasksAsyncRestTransport}
+
     def __init__(
         self,
         *,
@@ -217,6 +223,8 @@ class CloudTasksAsyncClient:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
                 creation failed for any reason.
         """
+        if isinstance(transport, str):
+            transport = self._async_transport_registry.get(transport, transport)
         self._client = CloudTasksClient(
             credentials=credentials,
             transport=transport,
@@ -232,6 +240,7 @@ class CloudTasksAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
     ) -> pagers.ListQueuesAsyncPager:
         r"""Lists queues.
 
@@ -280,6 +289,10 @@ class CloudTasksAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager
+                requests ahead of iteration on a background task.
+                ``0`` (the default) requests each page only when
+                iteration reaches it.
 
         Returns:
             google.cloud.tasks_v2beta3.services.cloud_tasks.pagers.ListQueuesAsyncPager:
@@ -346,6 +359,7 @@ class CloudTasksAsyncClient:
             request=request,
             response=response,
             metadata=metadata,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -1638,6 +1652,7 @@ class CloudTasksAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
     ) -> pagers.ListTasksAsyncPager:
         r"""Lists the tasks in a queue.
 
@@ -1693,6 +1708,10 @@ class CloudTasksAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager
+                requests ahead of iteration on a background task.
+                ``0`` (the default) requests each page only when
+                iteration reaches it.
 
         Returns:
             google.cloud.tasks_v2beta3.services.cloud_tasks.pagers.ListTasksAsyncPager:
@@ -1759,6 +1778,7 @@ class CloudTasksAsyncClient:
             request=request,
             response=response,
             metadata=metadata,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -53,6 +53,7 @@ from google.protobuf import duration_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.tasks_helpers import fanout, resource_names
 from google.cloud.tasks_v2beta3.services.cloud_tasks import pagers
 from google.cloud.tasks_v2beta3.types import cloudtasks
 from google.cloud.tasks_v2beta3.types import queue
@@ -102,7 +103,7 @@ class CloudTasksClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class CloudTasksClient(metaclass=CloudTasksClientMeta):
+class CloudTasksClient(fanout.FanOutMixin, metaclass=CloudTasksClientMeta):
     """Cloud Tasks allows developers to manage the execution of
     background work in their applications.
     """
@@ -196,20 +197,16 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
         queue: str,
     ) -> str:
         """Returns a fully-qualified queue string."""
-        return "projects/{project}/locations/{location}/queues/{queue}".format(
-            project=project,
-            location=location,
-            queue=queue,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/queues/{queue}"
+        ).format(project, location, queue)
 
     @staticmethod
     def parse_queue_path(path: str) -> Dict[str, str]:
         """Parses a queue path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/queues/(?P<queue>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/queues/{queue}"
+        ).parse(path)
 
     @staticmethod
     def task_path(
@@ -219,81 +216,66 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
         task: str,
     ) -> str:
         """Returns a fully-qualified task string."""
-        return "projects/{project}/locations/{location}/queues/{queue}/tasks/{task}".format(
-            project=project,
-            location=location,
-            queue=queue,
-            task=task,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/queues/{queue}/tasks/{task}"
+        ).format(project, location, queue, task)
 
     @staticmethod
     def parse_task_path(path: str) -> Dict[str, str]:
         """Parses a task path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/queues/(?P<queue>.+?)/tasks/(?P<task>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/queues/{queue}/tasks/{task}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -301,16 +283,14 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -383,7 +363,9 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
         self,
         *,
         credentials: Optional[ga_credentials.Credentials] = None,
-        transport: Optional[Union[str, CloudTasksTransport]] = None,
+        transport: Optional[
+            Union[str, CloudTasksTransport, Type[CloudTasksTransport]]
+        ] = None,
         client_options: Optional[Union[client_options_lib.ClientOptions, dict]] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
     ) -> None:
@@ -395,8 +377,9 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
-            transport (Union[str, CloudTasksTransport]): The
-                transport to use. If set to None, a transport is chosen
+            transport (Union[str, CloudTasksTransport, Type[CloudTasksTransport]]): The
+                transport to use, or the class of the transport to
+                create. If set to None, a transport is chosen
                 automatically.
             client_options (Optional[Union[google.api_core.client_options.ClientOptions, dict]]): Custom options for the
                 client. It won't take effect if a ``transport`` instance is provided.
@@ -466,7 +449,12 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
                     api_key_value
                 )
 
-            Transport = type(self).get_transport_class(transport)
+            if isinstance(transport, type):
+                # Such as a transport only asyncio clients can use, which
+                # this client's registry does not list.
+                Transport = transport
+            else:
+                Transport = type(self).get_transport_class(transport)
             self._transport = Transport(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
@@ -487,6 +475,7 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
     ) -> pagers.ListQueuesPager:
         r"""Lists queues.
 
@@ -535,6 +524,10 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager
+                requests ahead of iteration on a background thread.
+                ``0`` (the default) requests each page only when
+                iteration reaches it.
 
         Returns:
             google.cloud.tasks_v2beta3.services.cloud_tasks.pagers.ListQueuesPager:
@@ -591,6 +584,7 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -1835,6 +1829,7 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
     ) -> pagers.ListTasksPager:
         r"""Lists the tasks in a queue.
 
@@ -1890,6 +1885,10 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager
+                requests ahead of iteration on a background thread.
+                ``0`` (the default) requests each page only when
+                iteration reaches it.
 
         Returns:
             google.cloud.tasks_v2beta3.services.cloud_tasks.pagers.ListTasksPager:
@@ -1946,6 +1945,7 @@ class CloudTasksClient(metaclass=CloudTasksClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch=prefetch,
         )
 
         # Done; return the response.
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Throughput of concurrent ``get_queue`` calls from asyncio over REST.
+
+An HTTP/1.1 stub runs in a separate process and answers each request
+after ``--latency`` seconds. An asyncio application keeps
+``--concurrency`` calls in flight for ``--duration`` seconds, either
+through ``CloudTasksAsyncClient`` on the ``rest_asyncio`` transport, or
+through the synchronous REST client pushed into an executor with
+``run_in_executor``, which is how asyncio applications have had to use
+REST until now. The executor is measured with the default number of
+workers and with one worker per concurrent call.
+
+Usage::
+
+    python -m tests.benchmark.bench_async_rest [--concurrency 200] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+from concurrent import futures
+import functools
+import http.server
+import json
+import multiprocessing
+import time
+
+from google.auth import credentials as ga_credentials
+
+from google.cloud.tasks_v2 import CloudTasksAsyncClient, CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+
+_NAME = "projects/p/locations/l/queues/q"
+
+
+def _serve(ports, latency):
+    body = json.dumps({"name": _NAME, "state": 1}).encode("utf-8")
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(http.server.ThreadingHTTPServer):
+        daemon_threads = True
+        # Read when the socket starts listening, so set on the class.
+        request_queue_size = 1024
+
+    server = Server(("localhost", 0), Handler)
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+async def _drive(call, concurrency, duration):
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        count = 0
+        while time.perf_counter() < deadline:
+            await call()
+            count += 1
+        return count
+
+    start = time.perf_counter()
+    calls = sum(await asyncio.gather(*(worker() for _ in range(concurrency))))
+    return calls / (time.perf_counter() - start)
+
+
+async def measure_async(host, concurrency, duration):
+    transport = transports.CloudTasksAsyncRestTransport(
+        host=host,
+        url_scheme="http",
+        credentials=ga_credentials.AnonymousCredentials(),
+        max_connections=concurrency,
+    )
+    client = CloudTasksAsyncClient(transport=transport)
+    try:
+        return await _drive(lambda: client.get_queue(name=_NAME), concurrency, duration)
+    finally:
+        await transport.close()
+
+
+async def measure_executor(host, concurrency, duration, workers):
+    client = CloudTasksClient(
+        transport=transports.CloudTasksRestTransport(
+            host=host,
+            url_scheme="http",
+            credentials=ga_credentials.AnonymousCredentials(),
+        )
+    )
+    loop = asyncio.get_running_loop()
+    with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            return await _drive(
+                lambda: loop.run_in_executor(
+                    executor, functools.partial(client.get_queue, name=_NAME)
+                ),
+                concurrency,
+                duration,
+            )
+        finally:
+            client.transport.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_serve, args=(ports, args.latency), daemon=True
+    )
+    server.start()
+    host = "localhost:{}".format(ports.get(timeout=30))
+    # The default executor of an event loop.
+    default_workers = min(32, (multiprocessing.cpu_count() or 1) + 4)
+    configurations = [
+        (
+            "rest_asyncio",
+            lambda: measure_async(host, args.concurrency, args.duration),
+        ),
+        (
+            "rest in executor ({} threads)".format(default_workers),
+            lambda: measure_executor(
+                host, args.concurrency, args.duration, default_workers
+            ),
+        ),
+        (
+            "rest in executor ({} threads)".format(args.concurrency),
+            lambda: measure_executor(
+                host, args.concurrency, args.duration, args.concurrency
+            ),
+        ),
+    ]
+    try:
+        print(f"{'transport':<36}{'calls/s':>10}")
+        for name, run in configurations:
+            print(f"{name:<36}{asyncio.run(run()):>10.0f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
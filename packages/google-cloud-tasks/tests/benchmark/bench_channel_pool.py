@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Throughput of ``get_queue`` against a local server for several pool sizes.
+
+A fake Cloud Tasks server runs in a separate process. It answers
+``GetQueue`` after a fixed latency and, like production frontends, limits
+each connection to ``--max-streams`` concurrent streams, so a single
+channel queues calls once more than that many are outstanding. The client
+keeps ``--concurrency`` calls in flight for ``--duration`` seconds per
+pool size through the grpc_asyncio transport (or, with ``--sync``, the
+gRPC transport driven from a thread pool). The defaults keep the call rate
+low enough that the stream limit, not client CPU, is the bottleneck.
+
+Usage::
+
+    python -m tests.benchmark.bench_channel_pool [--sizes 1 2 4] [--sync]
+"""
+
+import argparse
+import asyncio
+from concurrent import futures
+import multiprocessing
+import threading
+import time
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+import grpc
+from grpc.experimental import aio
+
+from google.cloud.tasks_v2 import CloudTasksAsyncClient, CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+from google.cloud.tasks_v2.types import cloudtasks, queue
+
+
+def _serve(ports, latency, max_streams):
+    async def get_queue(request, context):
+        await asyncio.sleep(latency)
+        return queue.Queue(name=request.name)
+
+    async def main():
+        server = aio.server(options=[("grpc.max_concurrent_streams", max_streams)])
+        server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    "google.cloud.tasks.v2.CloudTasks",
+                    {
+                        "GetQueue": grpc.unary_unary_rpc_method_handler(
+                            get_queue,
+                            request_deserializer=cloudtasks.GetQueueRequest.deserialize,
+                            response_serializer=queue.Queue.serialize,
+                        )
+                    },
+                ),
+            )
+        )
+        ports.put(server.add_insecure_port("localhost:0"))
+        await server.start()
+        await server.wait_for_termination()
+
+    asyncio.run(main())
+
+
+def _transport(transport_class, channel_factory, port, size):
+    def create_channel(host, **kwargs):
+        return channel_factory(host, options=kwargs["options"])
+
+    with mock.patch.object(transport_class, "create_channel", create_channel):
+        return transport_class(
+            host="localhost:{}".format(port),
+            credentials=ga_credentials.AnonymousCredentials(),
+            channel_pool_size=size,
+        )
+
+
+async def measure_async(port, size, concurrency, duration):
+    client = CloudTasksAsyncClient(
+        transport=_transport(
+            transports.CloudTasksGrpcAsyncIOTransport, aio.insecure_channel, port, size
+        )
+    )
+    await client.get_queue(name="warmup")
+    completed = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal completed
+        while time.perf_counter() < deadline:
+            await client.get_queue(name="q")
+            completed += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await client.transport.close()
+    return completed / elapsed
+
+
+def measure_sync(port, size, concurrency, duration):
+    client = CloudTasksClient(
+        transport=_transport(
+            transports.CloudTasksGrpcTransport, grpc.insecure_channel, port, size
+        )
+    )
+    client.get_queue(name="warmup")
+    completed = []
+    deadline = time.perf_counter() + duration
+    lock = threading.Lock()
+
+    def worker():
+        count = 0
+        while time.perf_counter() < deadline:
+            client.get_queue(name="q")
+            count += 1
+        with lock:
+            completed.append(count)
+
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    elapsed = time.perf_counter() - start
+    client.transport.close()
+    return sum(completed) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--max-streams", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--sync", action="store_true")
+    args = parser.parse_args()
+
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_serve, args=(ports, args.latency, args.max_streams), daemon=True
+    )
+    server.start()
+    port = ports.get(timeout=30)
+    try:
+        print(
+            "{} calls in flight, {} streams per connection, {:.0f} ms latency".format(
+                args.concurrency, args.max_streams, args.latency * 1000
+            )
+        )
+        print(f"{'pool size':>10}{'calls/s':>12}{'bound':>12}")
+        for size in args.sizes:
+            if args.sync:
+                rate = measure_sync(port, size, args.concurrency, args.duration)
+            else:
+                rate = asyncio.run(
+                    measure_async(port, size, args.concurrency, args.duration)
+                )
+            # The most a pool of this size can sustain given the stream limit.
+            bound = min(args.concurrency, size * args.max_streams) / args.latency
+            print(f"{size:>10}{rate:>12.0f}{bound:>12.0f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Latency percentiles of ``get_queue`` with and without hedging.
+
+A fake Cloud Tasks server runs in a separate process. It answers
+``GetQueue`` after ``--latency`` seconds, except for a random
+``--tail-fraction`` of calls which take ``--tail-latency`` seconds, the
+way a server stalls on a slow disk or a garbage collection pause. The
+gRPC transport makes ``--calls`` calls from ``--concurrency`` threads,
+first as is and then with :class:`~google.cloud.tasks_helpers.hedging.Hedging`
+attached, and the latency percentiles of each run are compared.
+
+Usage::
+
+    python -m tests.benchmark.bench_hedging [--tail-fraction 0.03] [--calls 2000]
+"""
+
+import argparse
+import asyncio
+from concurrent import futures
+import multiprocessing
+import random
+import time
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+import grpc
+from grpc.experimental import aio
+
+from google.cloud.tasks_helpers import hedging
+from google.cloud.tasks_v2 import CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+from google.cloud.tasks_v2.types import cloudtasks, queue
+
+
+def _serve(ports, latency, tail_fraction, tail_latency):
+    async def get_queue(request, context):
+        slow = random.random() < tail_fraction
+        await asyncio.sleep(tail_latency if slow else latency)
+        return queue.Queue(name=request.name)
+
+    async def main():
+        server = aio.server()
+        server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    "google.cloud.tasks.v2.CloudTasks",
+                    {
+                        "GetQueue": grpc.unary_unary_rpc_method_handler(
+                            get_queue,
+                            request_deserializer=cloudtasks.GetQueueRequest.deserialize,
+                            response_serializer=queue.Queue.serialize,
+                        )
+                    },
+                ),
+            )
+        )
+        ports.put(server.add_insecure_port("localhost:0"))
+        await server.start()
+        await server.wait_for_termination()
+
+    asyncio.run(main())
+
+
+def _client(port):
+    def create_channel(host, **kwargs):
+        return grpc.insecure_channel(host, options=kwargs["options"])
+
+    transport_class = transports.CloudTasksGrpcTransport
+    with mock.patch.object(transport_class, "create_channel", create_channel):
+        transport = transport_class(
+            host="localhost:{}".format(port),
+            credentials=ga_credentials.AnonymousCredentials(),
+        )
+    return CloudTasksClient(transport=transport)
+
+
+def measure(port, calls, concurrency, hedges=None):
+    client = _client(port)
+    if hedges is not None:
+        hedges.attach(client.transport)
+    # Warm up the channel and, with hedging, the latency window.
+    for _ in range(50):
+        client.get_queue(name="warmup")
+
+    def timed(_):
+        start = time.perf_counter()
+        client.get_queue(name="q")
+        return time.perf_counter() - start
+
+    with futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(timed, range(calls)))
+    client.transport.close()
+
+    def percentile(percent):
+        return latencies[min(len(latencies) - 1, int(percent / 100 * len(latencies)))]
+
+    return [percentile(50), percentile(90), percentile(99), latencies[-1]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--tail-fraction", type=float, default=0.03)
+    parser.add_argument("--tail-latency", type=float, default=0.2)
+    parser.add_argument("--percentile", type=float, default=95.0)
+    parser.add_argument("--max-hedge-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_serve,
+        args=(ports, args.latency, args.tail_fraction, args.tail_latency),
+        daemon=True,
+    )
+    server.start()
+    port = ports.get(timeout=30)
+    try:
+        print(
+            "{:.0f} ms latency, {:.0%} of calls at {:.0f} ms, {} threads".format(
+                args.latency * 1000,
+                args.tail_fraction,
+                args.tail_latency * 1000,
+                args.concurrency,
+            )
+        )
+        print(
+            f"{'':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+            f"{'hedged':>10}"
+        )
+        hedges = hedging.Hedging(
+            percentile=args.percentile,
+            max_hedge_ratio=args.max_hedge_ratio,
+            max_workers=2 * args.concurrency,
+        )
+        for label, attached in (("plain", None), ("hedged", hedges)):
+            row = measure(port, args.calls, args.concurrency, attached)
+            rate = hedges.hedges / hedges.attempts if attached else 0.0
+            cells = "".join(f"{value * 1000:>10.1f}" for value in row)
+            print(f"{label:>10}{cells}{rate:>10.1%}")
+        hedges.close()
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
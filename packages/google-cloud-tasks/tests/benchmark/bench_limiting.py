@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Goodput of an overloaded server with and without a client-side limiter.
+
+A simulated Cloud Tasks server runs in a separate process. It has
+``--capacity`` workers and each call takes ``--service-time`` seconds of
+one. A call that has queued for a worker for more than
+``--max-queue-time`` seconds is rejected with ``RESOURCE_EXHAUSTED``,
+which still takes ``--reject-time`` seconds of the worker, so under
+overload retries of rejected calls crowd out the calls that would be
+served.
+
+``--concurrency`` threads share one gRPC client and call ``get_queue`` for
+``--duration`` seconds, retrying ``RESOURCE_EXHAUSTED`` with the backoff of
+the generated default retry policies, first as is and then with a
+:class:`~google.cloud.tasks_helpers.limiting.Limiter` attached. Goodput is
+the rate of calls that succeed; the server's best is
+``capacity / service_time``.
+
+Usage::
+
+    python -m tests.benchmark.bench_limiting [--concurrency 100] [--duration 10]
+"""
+
+import argparse
+import asyncio
+from concurrent import futures
+import multiprocessing
+import threading
+import time
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import retry as retries
+from google.auth import credentials as ga_credentials
+import grpc
+from grpc.experimental import aio
+
+from google.cloud.tasks_helpers import limiting
+from google.cloud.tasks_v2 import CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+from google.cloud.tasks_v2.types import cloudtasks, queue
+
+
+def _serve(ports, capacity, service_time, max_queue_time, reject_time):
+    workers = asyncio.Semaphore(capacity)
+
+    async def get_queue(request, context):
+        arrived = time.monotonic()
+        async with workers:
+            if time.monotonic() - arrived > max_queue_time:
+                # Shedding load is cheaper than serving it, but not free.
+                await asyncio.sleep(reject_time)
+                await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "overloaded")
+            await asyncio.sleep(service_time)
+        return queue.Queue(name=request.name)
+
+    async def main():
+        server = aio.server()
+        server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    "google.cloud.tasks.v2.CloudTasks",
+                    {
+                        "GetQueue": grpc.unary_unary_rpc_method_handler(
+                            get_queue,
+                            request_deserializer=cloudtasks.GetQueueRequest.deserialize,
+                            response_serializer=queue.Queue.serialize,
+                        )
+                    },
+                ),
+            )
+        )
+        ports.put(server.add_insecure_port("localhost:0"))
+        await server.start()
+        await server.wait_for_termination()
+
+    asyncio.run(main())
+
+
+def _client(port):
+    def create_channel(host, **kwargs):
+        return grpc.insecure_channel(host, options=kwargs["options"])
+
+    transport_class = transports.CloudTasksGrpcTransport
+    with mock.patch.object(transport_class, "create_channel", create_channel):
+        transport = transport_class(
+            host="localhost:{}".format(port),
+            credentials=ga_credentials.AnonymousCredentials(),
+        )
+    return CloudTasksClient(transport=transport)
+
+
+def measure(port, concurrency, duration, initial_backoff, limiter=None):
+    client = _client(port)
+    if limiter is not None:
+        limiter.attach(client.transport)
+    client.get_queue(name="warmup")
+    lock = threading.Lock()
+    counts = {"ok": 0, "rejected": 0}
+
+    def rejected(exc):
+        with lock:
+            counts["rejected"] += 1
+
+    retry = retries.Retry(
+        initial=initial_backoff,
+        maximum=10.0,
+        multiplier=1.3,
+        predicate=retries.if_exception_type(core_exceptions.ResourceExhausted),
+        timeout=60.0,
+        on_error=rejected,
+    )
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        while time.perf_counter() < deadline:
+            client.get_queue(name="q", retry=retry)
+            with lock:
+                counts["ok"] += 1
+
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    elapsed = time.perf_counter() - start
+    client.transport.close()
+    return counts["ok"] / elapsed, counts["rejected"] / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--capacity", type=int, default=10)
+    parser.add_argument("--service-time", type=float, default=0.1)
+    parser.add_argument("--max-queue-time", type=float, default=0.05)
+    parser.add_argument("--reject-time", type=float, default=0.02)
+    parser.add_argument("--initial-backoff", type=float, default=0.1)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_serve,
+        args=(
+            ports,
+            args.capacity,
+            args.service_time,
+            args.max_queue_time,
+            args.reject_time,
+        ),
+        daemon=True,
+    )
+    server.start()
+    port = ports.get(timeout=30)
+    try:
+        print(
+            "{} threads, capacity {}, {:.0f} ms per call, best {:.0f} calls/s".format(
+                args.concurrency,
+                args.capacity,
+                args.service_time * 1000,
+                args.capacity / args.service_time,
+            )
+        )
+        print(f"{'':>10}{'goodput/s':>12}{'rejected/s':>12}{'limit':>8}")
+        goodput, rejected = measure(
+            port, args.concurrency, args.duration, args.initial_backoff
+        )
+        print(f"{'plain':>10}{goodput:>12.0f}{rejected:>12.0f}{'':>8}")
+        limiter = limiting.Limiter()
+        goodput, rejected = measure(
+            port, args.concurrency, args.duration, args.initial_backoff, limiter
+        )
+        limit = limiter.limit("get_queue")
+        print(f"{'limited':>10}{goodput:>12.0f}{rejected:>12.0f}{limit:>8.1f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Per-call CPU of REST query-parameter encoding, before and after.
+
+``before`` is the JSON round trip the transports used to perform
+(``MessageToJson`` -> ``json.loads`` -> ``flatten_query_params``);
+``after`` is :func:`google.cloud.tasks_helpers.rest_encoding.message_to_query_params`.
+Both the isolated encoding step and a full ``list_tasks``/``get_task`` call
+through the REST transport (with the HTTP session stubbed out) are timed.
+
+Usage::
+
+    python -m tests.benchmark.bench_query_params [--number N]
+"""
+
+import argparse
+import json
+import time
+from unittest import mock
+
+from google.api_core import path_template, rest_helpers
+from google.auth import credentials as ga_credentials
+from google.protobuf import json_format
+from requests import Response
+
+from google.cloud.tasks_helpers import rest_encoding
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+from google.cloud.tasks_v2.types import cloudtasks, task
+
+
+def legacy_encode(message, defaults=None):
+    query_params = json.loads(
+        json_format.MessageToJson(
+            message,
+            including_default_value_fields=False,
+            use_integers_for_enums=True,
+        )
+    )
+    query_params.update(defaults or {})
+    query_params["$alt"] = "json;enum-encoding=int"
+    return rest_helpers.flatten_query_params(query_params, strict=True)
+
+
+def new_encode(message, defaults=None):
+    query_params = rest_encoding.message_to_query_params(message, defaults=defaults)
+    query_params.append(("$alt", "json;enum-encoding=int"))
+    return query_params
+
+
+REQUESTS = {
+    "list_tasks": (
+        [
+            {
+                "method": "get",
+                "uri": "/v2/{parent=projects/*/locations/*/queues/*}/tasks",
+            }
+        ],
+        cloudtasks.ListTasksRequest(
+            parent="projects/p/locations/l/queues/q",
+            response_view=task.Task.View.FULL,
+            page_size=1000,
+            page_token="opaque-page-token",
+        ),
+    ),
+    "get_task": (
+        [
+            {
+                "method": "get",
+                "uri": "/v2/{name=projects/*/locations/*/queues/*/tasks/*}",
+            }
+        ],
+        cloudtasks.GetTaskRequest(
+            name="projects/p/locations/l/queues/q/tasks/t",
+            response_view=task.Task.View.FULL,
+        ),
+    ),
+}
+
+
+def per_call_us(fn, number):
+    start = time.process_time()
+    for _ in range(number):
+        fn()
+    return (time.process_time() - start) / number * 1e6
+
+
+def bench_encoding(number):
+    rows = []
+    for name, (http_options, request) in REQUESTS.items():
+        query = path_template.transcode(http_options, type(request).pb(request))[
+            "query_params"
+        ]
+        assert legacy_encode(query) == new_encode(query)
+        rows.append(
+            (
+                f"{name} (encode only)",
+                per_call_us(lambda: legacy_encode(query), number),
+                per_call_us(lambda: new_encode(query), number),
+            )
+        )
+    return rows
+
+
+def bench_calls(number):
+    transport = transports.CloudTasksRestTransport(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    response = Response()
+    response.status_code = 200
+    response._content = b"{}"
+
+    rows = []
+    with mock.patch.object(type(transport._session), "request") as req:
+        req.return_value = response
+        for name, (_, request) in REQUESTS.items():
+            stub = getattr(transport, name)
+            call = lambda: stub(request)  # noqa: E731
+            with mock.patch.object(
+                rest_encoding,
+                "message_to_query_params",
+                side_effect=lambda message, defaults=None: legacy_encode(message)[:-1],
+            ):
+                before = per_call_us(call, number)
+            after = per_call_us(call, number)
+            rows.append((f"{name} (full call)", before, after))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    rows = bench_encoding(args.number) + bench_calls(args.number // 4)
+    print(f"{'case':<28}{'before us':>12}{'after us':>12}{'speedup':>10}")
+    for name, before, after in rows:
+        print(f"{name:<28}{before:>12.2f}{after:>12.2f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
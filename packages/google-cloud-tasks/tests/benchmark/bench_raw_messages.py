@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""CPU time of listing tasks with proto-plus and with protobuf messages.
+
+A channel answers ``ListTasks`` from ``--pages`` serialized pages of
+``--page-size`` HTTP tasks, so only the client's work is measured: the
+request serialization, the response deserialization and the reads of
+each task's name, dispatch count, schedule time and URL. It is done with
+the client as is and with
+:class:`~google.cloud.tasks_helpers.raw_messages.RawMessages` attached.
+
+Usage::
+
+    python -m tests.benchmark.bench_raw_messages [--pages 20] [--page-size 1000]
+"""
+
+import argparse
+import time
+
+from google.auth import credentials as ga_credentials
+
+from google.cloud.tasks_helpers import raw_messages
+from google.cloud.tasks_v2 import CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+from google.cloud.tasks_v2.types import cloudtasks, target, task
+
+
+class _PagesChannel:
+    """Answers ListTasks from serialized pages, keyed on their page token."""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def unary_unary(self, path, request_serializer=None, response_deserializer=None):
+        def call(request, timeout=None, metadata=None, **kwargs):
+            page_token = cloudtasks.ListTasksRequest.deserialize(
+                request_serializer(request)
+            ).page_token
+            return response_deserializer(self.pages[page_token])
+
+        return call
+
+    def close(self):
+        pass
+
+
+def make_pages(pages, page_size):
+    serialized = {}
+    for page in range(pages):
+        response = cloudtasks.ListTasksResponse(
+            tasks=[
+                task.Task(
+                    name="projects/p/locations/l/queues/q/tasks/{}-{}".format(page, i),
+                    http_request=target.HttpRequest(
+                        url="https://example.com/work/{}".format(i),
+                        headers={"Content-Type": "application/json"},
+                        body=b"{}",
+                    ),
+                    schedule_time={"seconds": 1700000000 + i},
+                    dispatch_count=i % 5,
+                )
+                for i in range(page_size)
+            ],
+            next_page_token=str(page + 1) if page + 1 < pages else "",
+        )
+        serialized[
+            "" if page == 0 else str(page)
+        ] = cloudtasks.ListTasksResponse.serialize(response)
+    return serialized
+
+
+def consume(client):
+    dispatches = 0
+    for item in client.list_tasks(parent="projects/p/locations/l/queues/q"):
+        item.name
+        dispatches += item.dispatch_count
+        item.schedule_time
+        item.http_request.url
+    return dispatches
+
+
+def per_task_us(client, tasks, repeat):
+    consume(client)
+    best = None
+    for _ in range(repeat):
+        start = time.process_time()
+        consume(client)
+        elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / tasks * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    channel = _PagesChannel(make_pages(args.pages, args.page_size))
+    tasks = args.pages * args.page_size
+    results = []
+    for label, raw in (("proto-plus", False), ("protobuf", True)):
+        client = CloudTasksClient(
+            transport=transports.CloudTasksGrpcTransport(
+                credentials=ga_credentials.AnonymousCredentials(), channel=channel
+            )
+        )
+        if raw:
+            raw_messages.RawMessages().attach(client.transport)
+        results.append((label, per_task_us(client, tasks, args.repeat)))
+
+    print("{} pages of {} tasks".format(args.pages, args.page_size))
+    print(f"{'':>12}{'us/task':>10}{'speedup':>10}")
+    for label, us in results:
+        print(f"{label:>12}{us:>10.2f}{results[0][1] / us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""CPU time and memory of building and parsing task names, before and after.
+
+``before`` is the code the generator emits for ``task_path`` and
+``parse_task_path`` (``str.format`` with keywords and ``re.match`` with the
+pattern string); ``after`` is the client methods, which use
+:mod:`google.cloud.tasks_helpers.resource_names`. Names are parsed from a
+log of ``--names`` task names spread over ``--distinct`` tasks, one by one
+and with ``parse_many``. The memory column is what holding the parsed
+columns takes.
+
+Usage::
+
+    python -m tests.benchmark.bench_resource_names [--names N] [--distinct N]
+"""
+
+import argparse
+import random
+import re
+import time
+import tracemalloc
+
+from google.cloud.tasks_helpers import resource_names
+from google.cloud.tasks_v2 import CloudTasksClient
+
+_TEMPLATE = "projects/{project}/locations/{location}/queues/{queue}/tasks/{task}"
+
+
+def legacy_task_path(project, location, queue, task):
+    return _TEMPLATE.format(
+        project=project,
+        location=location,
+        queue=queue,
+        task=task,
+    )
+
+
+def legacy_parse_task_path(path):
+    m = re.match(
+        r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/queues/(?P<queue>.+?)/tasks/(?P<task>.+?)$",
+        path,
+    )
+    return m.groupdict() if m else {}
+
+
+def legacy_parse_many(paths):
+    columns = {"project": [], "location": [], "queue": [], "task": []}
+    for path in paths:
+        parsed = legacy_parse_task_path(path)
+        for name, column in columns.items():
+            column.append(parsed.get(name))
+    return columns
+
+
+def make_log(names, distinct):
+    tasks = [
+        (
+            "projects",
+            "project-{}".format(i % 7),
+            "locations",
+            "us-central1",
+            "queues",
+            "queue-{}".format(i % 50),
+            "tasks",
+            str(i),
+        )
+        for i in range(distinct)
+    ]
+    rng = random.Random(0)
+    # Joined one by one, so each name is a new string, as if read from a file.
+    return ["/".join(task) for task in (rng.choice(tasks) for _ in range(names))]
+
+
+def per_name_us(fn, paths):
+    start = time.process_time()
+    fn(paths)
+    return (time.process_time() - start) / len(paths) * 1e6
+
+
+def retained_mb(fn, paths):
+    tracemalloc.start()
+    result = fn(paths)  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / 2**20
+
+
+def parse_each(parse):
+    return lambda paths: [parse(path) for path in paths]
+
+
+def format_each(build):
+    return lambda tasks: [build(*task) for task in tasks]
+
+
+def bench(names, distinct):
+    paths = make_log(names, distinct)
+    tasks = [tuple(legacy_parse_task_path(path).values()) for path in paths]
+    codec = resource_names.get(_TEMPLATE)
+    assert [CloudTasksClient.parse_task_path(p) for p in paths[:1000]] == [
+        legacy_parse_task_path(p) for p in paths[:1000]
+    ]
+    assert codec.parse_many(paths[:1000]) == legacy_parse_many(paths[:1000])
+
+    cases = [
+        (
+            "task_path",
+            format_each(legacy_task_path),
+            format_each(CloudTasksClient.task_path),
+            tasks,
+        ),
+        (
+            "parse_task_path",
+            parse_each(legacy_parse_task_path),
+            parse_each(CloudTasksClient.parse_task_path),
+            paths,
+        ),
+        ("parse_many", legacy_parse_many, codec.parse_many, paths),
+    ]
+    rows = []
+    for name, before, after, args in cases:
+        codec._parse_cached.cache_clear()
+        rows.append(
+            (
+                name,
+                per_name_us(before, args),
+                per_name_us(after, args),
+                retained_mb(before, args),
+                retained_mb(after, args),
+            )
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--names", type=int, default=200000)
+    parser.add_argument("--distinct", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(
+        f"{'case':<18}{'before us':>11}{'after us':>10}{'speedup':>9}"
+        f"{'before MB':>11}{'after MB':>10}"
+    )
+    for name, before, after, before_mb, after_mb in bench(args.names, args.distinct):
+        print(
+            f"{name:<18}{before:>11.2f}{after:>10.2f}{before / after:>8.1f}x"
+            f"{before_mb:>11.1f}{after_mb:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import http.server
+import json
+import os
+import ssl
+import stat
+import subprocess
+import sys
+import threading
+from unittest import mock
+import urllib.parse
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.tasks_helpers import async_rest
+from google.cloud.tasks_v2 import CloudTasksAsyncClient, CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+from google.cloud.tasks_v2.types import cloudtasks, queue
+
+pytest.importorskip("aiohttp")
+
+_QUEUES = "/v2/projects/p/locations/l/queues"
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _reply(self, status, payload):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        self.server.requests.append(
+            (self.command, url.path, self.headers.get("Authorization"))
+        )
+        if url.path == _QUEUES:
+            if query.get("pageToken") == ["next"]:
+                self._reply(200, {"queues": [{"name": "b"}]})
+            else:
+                self._reply(200, {"queues": [{"name": "a"}], "nextPageToken": "next"})
+        elif url.path == _QUEUES + "/missing":
+            self._reply(404, {"error": {"code": 404, "message": "no such queue"}})
+        elif url.path.startswith(_QUEUES + "/"):
+            self._reply(200, {"name": url.path[len("/v2/") :], "state": 1})
+        else:
+            self._reply(404, {})
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        body = json.loads(self.rfile.read(length))
+        self.server.requests.append(
+            (self.command, urllib.parse.urlsplit(self.path).path, body)
+        )
+        self._reply(200, dict(body, state=2))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = http.server.ThreadingHTTPServer(("localhost", 0), _Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _transport(server, **kwargs):
+    kwargs.setdefault("credentials", ga_credentials.AnonymousCredentials())
+    return transports.CloudTasksAsyncRestTransport(
+        host="localhost:{}".format(server.server_address[1]),
+        url_scheme="http",
+        **kwargs,
+    )
+
+
+def _run(transport, coroutine_function):
+    async def main():
+        try:
+            return await coroutine_function(CloudTasksAsyncClient(transport=transport))
+        finally:
+            await transport.close()
+
+    return asyncio.run(main())
+
+
+def test_transport_kind():
+    client = CloudTasksAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio"
+    )
+
+    assert client.transport.kind == "rest_asyncio"
+
+
+def test_sync_client_rejects_transport():
+    with pytest.raises(KeyError):
+        CloudTasksClient(
+            credentials=ga_credentials.AnonymousCredentials(),
+            transport="rest_asyncio",
+        )
+
+
+def test_get_queue(server):
+    async def call(client):
+        return await client.get_queue(name="projects/p/locations/l/queues/q")
+
+    response = _run(_transport(server), call)
+
+    assert response.name == "projects/p/locations/l/queues/q"
+    assert response.state == queue.Queue.State.RUNNING
+
+
+def test_post_sends_body(server):
+    async def call(client):
+        return await client.create_queue(
+            parent="projects/p/locations/l", queue=queue.Queue(name="q")
+        )
+
+    response = _run(_transport(server), call)
+
+    assert response.name == "q"
+    assert response.state == queue.Queue.State.PAUSED
+    assert server.requests == [("POST", _QUEUES, {"name": "q"})]
+
+
+def test_error_mapped_to_exception(server):
+    async def call(client):
+        return await client.get_queue(name="projects/p/locations/l/queues/missing")
+
+    with pytest.raises(core_exceptions.NotFound, match="no such queue"):
+        _run(_transport(server), call)
+
+
+def test_pager_follows_page_tokens(server):
+    async def call(client):
+        pager = await client.list_queues(parent="projects/p/locations/l")
+        return [q.name async for q in pager]
+
+    assert _run(_transport(server), call) == ["a", "b"]
+
+
+def test_interceptor_hooks(server):
+    interceptor = transports.CloudTasksRestInterceptor()
+    with mock.patch.object(
+        interceptor, "pre_get_queue", side_effect=lambda r, m: (r, m)
+    ) as pre, mock.patch.object(
+        interceptor, "post_get_queue", side_effect=lambda r: r
+    ) as post:
+
+        async def call(client):
+            return await client.get_queue(name="projects/p/locations/l/queues/q")
+
+        _run(_transport(server, interceptor=interceptor), call)
+
+    pre.assert_called_once()
+    post.assert_called_once()
+
+
+def test_concurrent_calls_share_limited_connections(server):
+    async def call(client):
+        return await asyncio.gather(
+            *(
+                client.get_queue(name="projects/p/locations/l/queues/q{}".format(i))
+                for i in range(50)
+            )
+        )
+
+    responses = _run(_transport(server, max_connections=4), call)
+
+    assert [r.name.rsplit("/", 1)[1] for r in responses] == [
+        "q{}".format(i) for i in range(50)
+    ]
+    assert server.connections <= 4
+
+
+class _Credentials(ga_credentials.Credentials):
+    def __init__(self):
+        super().__init__()
+        self.refresh_threads = []
+
+    def refresh(self, request):
+        self.refresh_threads.append(threading.current_thread())
+        self.token = "fresh-token"
+
+    @property
+    def expired(self):
+        return False
+
+
+def test_credentials_refreshed_once_off_the_event_loop(server):
+    credentials = _Credentials()
+
+    async def call(client):
+        return await asyncio.gather(
+            *(
+                client.get_queue(name="projects/p/locations/l/queues/q")
+                for _ in range(10)
+            )
+        )
+
+    _run(_transport(server, credentials=credentials), call)
+
+    assert len(credentials.refresh_threads) == 1
+    assert credentials.refresh_threads[0] is not threading.main_thread()
+    assert {auth for _, _, auth in server.requests} == {"Bearer fresh-token"}
+
+
+def test_close_releases_connections(server):
+    transport = _transport(server)
+
+    async def main():
+        await transport.get_queue(
+            cloudtasks.GetQueueRequest(name="projects/p/locations/l/queues/q")
+        )
+        client_session = transport._session._session
+        await transport.close()
+        return client_session
+
+    assert asyncio.run(main()).closed
+
+
+def test_negative_connection_limit():
+    with pytest.raises(ValueError):
+        async_rest.AsyncAuthorizedSession(
+            ga_credentials.AnonymousCredentials(), max_connections=-1
+        )
+
+
+def test_importing_clients_does_not_load_aiohttp():
+    code = (
+        "import json, sys\n"
+        "from google.cloud import tasks_v2\n"
+        "print(json.dumps('aiohttp' in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert json.loads(out) is False
+
+
+def test_missing_aiohttp_raises_on_construction():
+    with mock.patch.dict(sys.modules, {"aiohttp": None}):
+        with pytest.raises(ImportError, match="async_rest"):
+            async_rest.AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+
+
+@pytest.mark.parametrize("error", [None, ssl.SSLError("bad key")])
+def test_mtls_key_file_is_private_and_removed(error):
+    seen = {}
+
+    def load_cert_chain(cert_file, key_file):
+        seen["files"] = (cert_file, key_file)
+        seen["mode"] = stat.S_IMODE(os.stat(key_file).st_mode)
+        with open(key_file, "rb") as f:
+            seen["key"] = f.read()
+        if error is not None:
+            raise error
+
+    with mock.patch.object(
+        ssl.SSLContext, "load_cert_chain", side_effect=load_cert_chain
+    ):
+        try:
+            async_rest.mtls_ssl_context(lambda: (b"cert", b"key"))
+        except ssl.SSLError:
+            assert error is not None
+
+    assert seen["mode"] == 0o600
+    assert seen["key"] == b"key"
+    assert not any(os.path.exists(path) for path in seen["files"])
+    assert not os.path.exists(os.path.dirname(seen["files"][1]))
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import time
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.tasks_helpers import caching
+from google.cloud.tasks_v2.types import cloudtasks, queue
+
+_NAME = "projects/p/locations/l/queues/q"
+
+
+def _credentials(caller, quota_project_id=None):
+    credentials = ga_credentials.AnonymousCredentials()
+    credentials.service_account_email = caller
+    credentials._quota_project_id = quota_project_id
+    return credentials
+
+
+def test_repeated_call_is_answered_from_cache(server, grpc_client):
+    cache = caching.ResponseCache()
+    client = grpc_client(cache)
+
+    first = client.get_queue(name=_NAME)
+    second = client.get_queue(name=_NAME)
+    client.get_queue(name=_NAME + "2")
+
+    assert first == second
+    assert second.state == queue.Queue.State.RUNNING
+    assert len(server.requests) == 2
+    assert cache.stats() == {"get_queue": {"hits": 1, "misses": 2, "negative_hits": 0}}
+
+
+def test_entries_expire(server, grpc_client):
+    cache = caching.ResponseCache(ttls={"get_queue": 0.05})
+    client = grpc_client(cache)
+
+    client.get_queue(name=_NAME)
+    time.sleep(0.06)
+    client.get_queue(name=_NAME)
+
+    assert len(server.requests) == 2
+
+
+def test_invalidate(server, grpc_client):
+    cache = caching.ResponseCache()
+    client = grpc_client(cache)
+
+    client.get_queue(name=_NAME)
+    cache.invalidate("get_queue", cloudtasks.GetQueueRequest(name=_NAME))
+    client.get_queue(name=_NAME)
+
+    assert len(server.requests) == 2
+
+
+@pytest.mark.parametrize("negative_ttl,rpcs", [(None, 2), (10.0, 1)])
+def test_not_found(negative_ttl, rpcs, server, grpc_client):
+    cache = caching.ResponseCache(negative_ttl=negative_ttl)
+    server.error = core_exceptions.NotFound("no such queue")
+    client = grpc_client(cache)
+
+    for _ in range(2):
+        with pytest.raises(core_exceptions.NotFound, match="no such queue"):
+            client.get_queue(name=_NAME)
+
+    assert len(server.requests) == rpcs
+
+
+@pytest.mark.parametrize("ttls,rpcs", [({}, 2), ({"list_queues": 10.0}, 1)])
+def test_only_get_methods_cached_by_default(ttls, rpcs, server, grpc_client):
+    cache = caching.ResponseCache(ttls=ttls)
+    client = grpc_client(cache)
+
+    for _ in range(2):
+        assert [q.name for q in client.list_queues(parent="p")] == ["p/queues/q"]
+
+    assert len(server.requests) == rpcs
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = caching.MemoryBackend(max_entries=2)
+    entry = caching.Entry(time.time() + 60, None, b"")
+    backend.set("a", entry)
+    backend.set("b", entry)
+    backend.get("a")
+    backend.set("c", entry)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == entry
+    assert len(backend) == 2
+    assert backend.evictions == 1
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        {"credentials": _credentials("b@p.iam.gserviceaccount.com")},
+        {"credentials": _credentials("a@p.iam.gserviceaccount.com", "other")},
+        {"client_options": {"api_endpoint": "other.example.com"}},
+    ],
+)
+def test_transports_of_other_callers_do_not_share(other, server, grpc_client):
+    cache = caching.ResponseCache()
+    kwargs = {"credentials": _credentials("a@p.iam.gserviceaccount.com")}
+    client = grpc_client(cache, **kwargs)
+    other_client = grpc_client(cache, **dict(kwargs, **other))
+
+    client.get_queue(name=_NAME)
+    other_client.get_queue(name=_NAME)
+    client.get_queue(name=_NAME)
+
+    assert len(server.requests) == 2
+
+
+def test_invalidate_every_attached_transport(server, grpc_client):
+    cache = caching.ResponseCache()
+    client = grpc_client(cache, credentials=_credentials("a@p.iam.gserviceaccount.com"))
+    other_client = grpc_client(
+        cache, credentials=_credentials("b@p.iam.gserviceaccount.com")
+    )
+    request = cloudtasks.GetQueueRequest(name=_NAME)
+
+    client.get_queue(request)
+    other_client.get_queue(request)
+    cache.invalidate("get_queue", request)
+    client.get_queue(request)
+    other_client.get_queue(request)
+
+    assert len(server.requests) == 4
+
+
+def test_disk_backend_persists(tmp_path, server, grpc_client):
+    path = str(tmp_path / "cache.sqlite")
+    caller = "a@p.iam.gserviceaccount.com"
+    client = grpc_client(
+        caching.ResponseCache(caching.DiskBackend(path)),
+        credentials=_credentials(caller),
+    )
+    client.get_queue(name=_NAME)
+
+    # A new cache on the same file, as after a restart.
+    cache = caching.ResponseCache(caching.DiskBackend(path))
+    client = grpc_client(cache, credentials=_credentials(caller))
+    response = client.get_queue(name=_NAME)
+
+    assert response.name == _NAME
+    assert len(server.requests) == 1
+    assert cache.stats()["get_queue"]["hits"] == 1
+
+
+def test_disk_entries_of_unknown_types_are_misses(tmp_path, server, grpc_client):
+    backend = caching.DiskBackend(str(tmp_path / "cache.sqlite"))
+    cache = caching.ResponseCache(backend)
+    client = grpc_client(cache)
+    client.get_queue(name=_NAME)
+    (key,) = backend._db.execute("SELECT key FROM entries").fetchone()
+    entry = backend.get(key)
+    backend.set(key, caching.Entry(entry.expires, "os:system", entry.payload))
+
+    with mock.patch("importlib.import_module") as import_module:
+        response = client.get_queue(name=_NAME)
+
+    assert response.name == _NAME
+    assert len(server.requests) == 2
+    import_module.assert_not_called()
+
+
+def test_disk_backend_evicts_least_recently_used(tmp_path):
+    backend = caching.DiskBackend(str(tmp_path / "cache.sqlite"), max_entries=2)
+    entry = caching.Entry(time.time() + 60, "module:Type", b"payload")
+    backend.set("a", entry)
+    time.sleep(0.01)
+    backend.set("b", entry)
+    time.sleep(0.01)
+    backend.get("a")
+    backend.set("c", entry)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == entry
+    assert len(backend) == 2
+    backend.clear()
+    assert len(backend) == 0
+    backend.close()
+
+
+def test_async_repeated_call_is_answered_from_cache(server, async_client):
+    cache = caching.ResponseCache()
+
+    async def main():
+        client = async_client(cache)
+        return [await client.get_queue(name=_NAME) for _ in range(3)]
+
+    responses = asyncio.run(main())
+
+    assert [r.name for r in responses] == [_NAME] * 3
+    assert len(server.requests) == 1
+    assert cache.stats()["get_queue"]["hits"] == 2
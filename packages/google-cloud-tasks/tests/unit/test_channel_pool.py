@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from concurrent import futures
+import threading
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import grpc
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.tasks_helpers import channel_pool
+from google.cloud.tasks_v2 import CloudTasksAsyncClient, CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+from google.cloud.tasks_v2.types import cloudtasks, queue
+
+
+class _FakeCloudTasks:
+    """A local server answering GetQueue, optionally holding calls open."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Semaphore(0)
+        self.peers = set()
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=16))
+        self._server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    "google.cloud.tasks.v2.CloudTasks",
+                    {
+                        "GetQueue": grpc.unary_unary_rpc_method_handler(
+                            self._get_queue,
+                            request_deserializer=cloudtasks.GetQueueRequest.deserialize,
+                            response_serializer=queue.Queue.serialize,
+                        )
+                    },
+                ),
+            )
+        )
+        self.port = self._server.add_insecure_port("localhost:0")
+
+    def _get_queue(self, request, context):
+        self.peers.add(context.peer())
+        self.started.release()
+        self.release.wait()
+        if request.name == "missing":
+            context.abort(grpc.StatusCode.NOT_FOUND, "no such queue")
+        return queue.Queue(name=request.name)
+
+    def __enter__(self):
+        self._server.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release.set()
+        self._server.stop(None)
+
+
+@pytest.fixture
+def server():
+    with _FakeCloudTasks() as server:
+        yield server
+
+
+def _insecure(factory):
+    def create_channel(host, **kwargs):
+        return factory(host, options=kwargs["options"])
+
+    return create_channel
+
+
+def _client(server, size):
+    with mock.patch.object(
+        transports.CloudTasksGrpcTransport,
+        "create_channel",
+        side_effect=_insecure(grpc.insecure_channel),
+    ):
+        transport = transports.CloudTasksGrpcTransport(
+            host="localhost:{}".format(server.port),
+            credentials=ga_credentials.AnonymousCredentials(),
+            channel_pool_size=size,
+        )
+    return CloudTasksClient(transport=transport)
+
+
+def test_validate_pool_size():
+    assert channel_pool.validate_pool_size(1) == 1
+    with pytest.raises(ValueError):
+        channel_pool.validate_pool_size(0)
+
+
+def test_transport_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        transports.CloudTasksGrpcTransport(
+            credentials=ga_credentials.AnonymousCredentials(), channel_pool_size=0
+        )
+
+
+def test_single_channel_is_not_pooled():
+    channel = grpc.insecure_channel("localhost:1")
+
+    assert channel_pool.pool_channels([channel]) is channel
+    assert channel_pool.channel_options([("a", 1)], 1) == [("a", 1)]
+
+
+@pytest.mark.parametrize(
+    "transport_class",
+    [transports.CloudTasksGrpcTransport, transports.CloudTasksGrpcAsyncIOTransport],
+)
+def test_transport_opens_pool(transport_class):
+    with mock.patch.object(transport_class, "create_channel") as create_channel:
+        create_channel.return_value = mock.Mock(spec=aio.Channel)
+        transport = transport_class(
+            credentials=ga_credentials.AnonymousCredentials(), channel_pool_size=3
+        )
+
+    assert create_channel.call_count == 3
+    for call in create_channel.call_args_list:
+        assert ("grpc.use_local_subchannel_pool", 1) in call.kwargs["options"]
+    assert len(transport.grpc_channel.channels) == 3
+
+
+def test_balancer_picks_least_loaded():
+    balancer = channel_pool._Balancer(3)
+
+    assert [balancer.acquire() for _ in range(3)] == [0, 1, 2]
+    balancer.release(1)
+    assert balancer.acquire() == 1
+    balancer.release(2)
+    balancer.release(0)
+    assert balancer.acquire() in (0, 2)
+    assert sorted(balancer.in_flight) == [0, 1, 1]
+
+
+def test_calls_spread_over_connections(server):
+    client = _client(server, 2)
+    server.release.clear()
+
+    with futures.ThreadPoolExecutor(max_workers=4) as pool:
+        calls = [pool.submit(client.get_queue, name="q{}".format(i)) for i in range(4)]
+        for _ in range(4):
+            assert server.started.acquire(timeout=10)
+        assert client.transport.grpc_channel.in_flight == [2, 2]
+        server.release.set()
+        names = sorted(call.result().name for call in calls)
+
+    assert names == ["q0", "q1", "q2", "q3"]
+    assert len(server.peers) == 2
+    assert client.transport.grpc_channel.in_flight == [0, 0]
+
+
+def test_stub_created_once_per_channel(server):
+    client = _client(server, 2)
+    pool = client.transport.grpc_channel
+    with mock.patch.object(
+        pool.channels[0], "unary_unary", wraps=pool.channels[0].unary_unary
+    ) as unary_unary:
+        for i in range(4):
+            client.get_queue(name="q{}".format(i))
+
+    assert unary_unary.call_count == 1
+    assert client.transport._stubs["get_queue"] is client.transport.get_queue
+
+
+def test_failed_call_is_released(server):
+    client = _client(server, 2)
+
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_queue(name="missing")
+
+    assert client.transport.grpc_channel.in_flight == [0, 0]
+
+
+def test_future_is_released_on_completion(server):
+    pool = _client(server, 2).transport.grpc_channel
+    server.release.clear()
+    get_queue = pool.unary_unary(
+        "/google.cloud.tasks.v2.CloudTasks/GetQueue",
+        request_serializer=cloudtasks.GetQueueRequest.serialize,
+        response_deserializer=queue.Queue.deserialize,
+    )
+
+    future = get_queue.future(cloudtasks.GetQueueRequest(name="q"))
+    assert sum(pool.in_flight) == 1
+    server.release.set()
+
+    assert future.result().name == "q"
+    assert pool.in_flight == [0, 0]
+
+
+def test_pool_closes_every_channel():
+    channels = [mock.Mock(spec=grpc.Channel) for _ in range(3)]
+
+    channel_pool.ChannelPool(channels).close()
+
+    for channel in channels:
+        channel.close.assert_called_once_with()
+
+
+def test_async_calls_spread_over_connections(server):
+    async def run():
+        with mock.patch.object(
+            transports.CloudTasksGrpcAsyncIOTransport,
+            "create_channel",
+            side_effect=_insecure(aio.insecure_channel),
+        ):
+            client = CloudTasksAsyncClient(
+                transport=transports.CloudTasksGrpcAsyncIOTransport(
+                    host="localhost:{}".format(server.port),
+                    credentials=ga_credentials.AnonymousCredentials(),
+                    channel_pool_size=2,
+                )
+            )
+        pool = client.transport.grpc_channel
+        assert isinstance(pool, channel_pool.AsyncChannelPool)
+        responses = await asyncio.gather(
+            *(client.get_queue(name="q{}".format(i)) for i in range(4))
+        )
+        with pytest.raises(core_exceptions.NotFound):
+            await client.get_queue(name="missing")
+        in_flight = pool.in_flight
+        await client.transport.close()
+        return sorted(r.name for r in responses), in_flight
+
+    names, in_flight = asyncio.run(run())
+
+    assert names == ["q0", "q1", "q2", "q3"]
+    assert in_flight == [0, 0]
+    assert len(server.peers) == 2
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from concurrent import futures
+import time
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.tasks_helpers import coalescing, limiting
+
+_NAME = "projects/p/locations/l/queues/q"
+
+
+def _client(grpc_client, **kwargs):
+    coalescer = coalescing.Coalescer(**kwargs)
+    return grpc_client(coalescer), coalescer
+
+
+def _concurrently(call, *argses):
+    with futures.ThreadPoolExecutor(max_workers=len(argses)) as pool:
+        results = [pool.submit(call, **args) for args in argses]
+    return results
+
+
+def test_identical_calls_share_one_rpc(server, grpc_client):
+    server.delay = 0.1
+    client, coalescer = _client(grpc_client)
+
+    results = _concurrently(client.get_queue, *[{"name": _NAME}] * 8)
+
+    responses = [result.result() for result in results]
+    assert len(server.requests) == 1
+    assert [r.name for r in responses] == [_NAME] * 8
+    # Each caller gets its own copy.
+    assert len({id(r) for r in responses}) == 8
+    assert (coalescer.calls, coalescer.coalesced) == (1, 7)
+
+
+def test_different_requests_are_not_shared(server, grpc_client):
+    server.delay = 0.05
+    client, coalescer = _client(grpc_client)
+
+    results = _concurrently(
+        client.get_queue, {"name": _NAME + "1"}, {"name": _NAME + "2"}
+    )
+
+    assert sorted(r.result().name for r in results) == [_NAME + "1", _NAME + "2"]
+    assert len(server.requests) == 2
+    assert coalescer.coalesced == 0
+
+
+def test_calls_of_different_callers_are_not_shared(server, grpc_client):
+    server.delay = 0.1
+    coalescer = coalescing.Coalescer()
+    clients = []
+    for caller in ("a@p.iam.gserviceaccount.com", "b@p.iam.gserviceaccount.com"):
+        credentials = ga_credentials.AnonymousCredentials()
+        credentials.service_account_email = caller
+        clients.append(grpc_client(coalescer, credentials=credentials))
+
+    with futures.ThreadPoolExecutor(max_workers=2) as pool:
+        results = [pool.submit(client.get_queue, name=_NAME) for client in clients]
+
+    assert [r.result().name for r in results] == [_NAME] * 2
+    assert len(server.requests) == 2
+    assert (coalescer.calls, coalescer.coalesced) == (2, 0)
+
+
+def test_finished_calls_are_not_shared(server, grpc_client):
+    client, _ = _client(grpc_client)
+
+    client.get_queue(name=_NAME)
+    client.get_queue(name=_NAME)
+
+    assert len(server.requests) == 2
+
+
+def test_error_is_shared(server, grpc_client):
+    server.delay = 0.1
+    server.error = core_exceptions.NotFound("no such queue")
+    client, _ = _client(grpc_client)
+
+    results = _concurrently(client.get_queue, *[{"name": _NAME}] * 3)
+
+    for result in results:
+        with pytest.raises(core_exceptions.NotFound):
+            result.result()
+    assert len(server.requests) == 1
+
+
+def test_waiting_bounded_by_timeout(server, grpc_client):
+    server.delay = 0.3
+    client, _ = _client(grpc_client)
+
+    with futures.ThreadPoolExecutor(max_workers=1) as pool:
+        slow = pool.submit(client.get_queue, name=_NAME)
+        time.sleep(0.05)
+        with pytest.raises(core_exceptions.DeadlineExceeded):
+            client.get_queue(name=_NAME, timeout=0.05)
+        assert slow.result().name == _NAME
+
+    assert len(server.requests) == 1
+
+
+def test_method_without_retry_is_not_coalesced(server, grpc_client):
+    server.delay = 0.05
+    client, coalescer = _client(grpc_client)
+
+    _concurrently(
+        client.create_queue,
+        *[{"parent": "projects/p/locations/l", "queue": {"name": _NAME}}] * 2,
+    )
+
+    assert len(server.requests) == 2
+    assert coalescer.calls == 0
+
+
+def test_named_method_is_coalesced(server, grpc_client):
+    server.delay = 0.1
+    client, coalescer = _client(grpc_client, methods=["pause_queue"])
+
+    results = _concurrently(client.pause_queue, *[{"name": _NAME}] * 4)
+
+    assert [r.result().name for r in results] == [_NAME] * 4
+    assert len(server.requests) == 1
+    assert (coalescer.calls, coalescer.coalesced) == (1, 3)
+
+
+def test_detach(server, grpc_client):
+    server.delay = 0.05
+    client, coalescer = _client(grpc_client)
+
+    coalescer.detach(client.transport)
+    _concurrently(client.get_queue, *[{"name": _NAME}] * 2)
+
+    assert len(server.requests) == 2
+
+
+def test_async_identical_calls_share_one_rpc(server, async_client):
+    server.delay = 0.05
+    coalescer = coalescing.Coalescer()
+
+    async def main():
+        client = async_client(coalescer, limiting.Limiter())
+        return await asyncio.gather(
+            *(client.get_queue(name=_NAME) for _ in range(5)),
+            client.get_queue(name=_NAME + "2"),
+        )
+
+    responses = asyncio.run(main())
+
+    assert [r.name for r in responses] == [_NAME] * 5 + [_NAME + "2"]
+    assert len(server.requests) == 2
+    assert coalescer.coalesced == 4
+
+
+def test_async_cancelled_call_does_not_fail_others(server, async_client):
+    server.delay = 0.1
+
+    async def main():
+        client = async_client(coalescing.Coalescer())
+        leader = asyncio.ensure_future(client.get_queue(name=_NAME))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(client.get_queue(name=_NAME))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    response = asyncio.run(main())
+
+    assert response.name == _NAME
+    assert len(server.requests) == 2
+
+
+def test_async_error_is_shared(server, async_client):
+    server.delay = 0.05
+    server.error = core_exceptions.NotFound("no such queue")
+
+    async def main():
+        client = async_client(coalescing.Coalescer())
+        return await asyncio.gather(
+            *(client.get_queue(name=_NAME) for _ in range(3)), return_exceptions=True
+        )
+
+    errors = asyncio.run(main())
+
+    assert [type(e) for e in errors] == [core_exceptions.NotFound] * 3
+    assert len(server.requests) == 1
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import gzip
+import json
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import grpc
+import pytest
+from requests import Request, Response
+from requests.sessions import Session
+
+from google.cloud.tasks_helpers import compression
+from google.cloud.tasks_v2 import CloudTasksClient
+from google.cloud.tasks_v2.types import target, task
+
+_PARENT = "projects/p/locations/l/queues/q"
+
+
+def _task(body_size):
+    return task.Task(
+        name=_PARENT + "/tasks/t",
+        http_request=target.HttpRequest(
+            url="https://example.com/work", body=b"{}" * (body_size // 2)
+        ),
+    )
+
+
+def test_grpc_large_requests_are_compressed(server, grpc_client):
+    client = grpc_client(compression.Compression(methods=["create_task"]))
+
+    client.create_task(parent=_PARENT, task=_task(4096))
+    client.create_task(parent=_PARENT, task=_task(16))
+
+    assert server.calls[0]["compression"] == grpc.Compression.Gzip
+    assert "compression" not in server.calls[1]
+
+
+def test_grpc_other_methods_are_not_compressed(server, grpc_client):
+    client = grpc_client(compression.Compression(methods=["create_task"]))
+
+    client.get_queue(name=_PARENT + "x" * 4096)
+
+    assert "compression" not in server.calls[0]
+
+
+def test_grpc_stub_types_are_kept():
+    compressed = compression.Compression()
+    channel = grpc.insecure_channel("localhost:1")
+    try:
+        unary = channel.unary_unary("/a/b")
+        stream = channel.unary_stream("/a/b")
+
+        assert isinstance(compressed.wrap(unary), grpc.UnaryUnaryMultiCallable)
+        assert isinstance(compressed.wrap(stream), grpc.UnaryStreamMultiCallable)
+    finally:
+        channel.close()
+
+
+def _response(message, status_code=200):
+    response = Response()
+    response.status_code = status_code
+    response._content = json.dumps(message).encode()
+    response.request = Request("POST", "https://example.com").prepare()
+    return response
+
+
+def _rest_client(**kwargs):
+    client = CloudTasksClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+    compression.Compression(methods=["create_task"], **kwargs).attach(client.transport)
+    return client
+
+
+def test_rest_large_bodies_are_compressed():
+    client = _rest_client()
+
+    with mock.patch.object(
+        Session, "request", return_value=_response({"name": "t"})
+    ) as request:
+        client.create_task(parent=_PARENT, task=_task(4096))
+
+    kwargs = request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    body = json.loads(gzip.decompress(kwargs["data"]))
+    assert body["task"]["name"] == _PARENT + "/tasks/t"
+
+
+def test_rest_small_bodies_are_sent_as_is():
+    client = _rest_client(min_size=100000)
+
+    with mock.patch.object(
+        Session, "request", return_value=_response({"name": "t"})
+    ) as request:
+        client.create_task(parent=_PARENT, task=_task(4096))
+
+    kwargs = request.call_args.kwargs
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert json.loads(kwargs["data"])["task"]["name"] == _PARENT + "/tasks/t"
+
+
+def test_rest_unsupported_encoding_falls_back():
+    client = _rest_client()
+    responses = [
+        _response({}, status_code=415),
+        _response({"name": "t"}),
+        _response({"name": "t"}),
+    ]
+
+    with mock.patch.object(Session, "request", side_effect=responses) as request:
+        client.create_task(parent=_PARENT, task=_task(4096))
+        client.create_task(parent=_PARENT, task=_task(4096))
+
+    encodings = [
+        call.kwargs["headers"].get("Content-Encoding")
+        for call in request.call_args_list
+    ]
+    assert encodings == ["gzip", None, None]
+
+
+def test_rest_stays_compressed_when_uncompressed_request_fails_too():
+    client = _rest_client()
+    responses = [
+        _response({}, status_code=415),
+        _response({}, status_code=415),
+        _response({"name": "t"}),
+    ]
+
+    with mock.patch.object(Session, "request", side_effect=responses) as request:
+        with pytest.raises(core_exceptions.GoogleAPICallError):
+            client.create_task(parent=_PARENT, task=_task(4096))
+        client.create_task(parent=_PARENT, task=_task(4096))
+
+    encodings = [
+        call.kwargs["headers"].get("Content-Encoding")
+        for call in request.call_args_list
+    ]
+    assert encodings == ["gzip", None, "gzip"]
+
+
+def test_rest_responses_may_be_compressed():
+    client = _rest_client()
+
+    assert "gzip" in client.transport._session.headers["Accept-Encoding"]
+
+
+def test_detach(server, grpc_client):
+    client = grpc_client(compression.Compression(methods=["create_task"]))
+    compression.Compression().detach(client.transport)
+
+    client.create_task(parent=_PARENT, task=_task(4096))
+
+    assert "compression" not in server.calls[0]
+
+
+def test_level_is_checked():
+    with pytest.raises(ValueError):
+        compression.Compression(level=0)
+
+
+def test_async_large_requests_are_compressed(server, async_client):
+    async def main():
+        client = async_client(
+            compression.Compression(methods=["create_task"]), methods=["create_task"]
+        )
+        await client.create_task(parent=_PARENT, task=_task(4096))
+
+    asyncio.run(main())
+
+    assert server.calls[0]["compression"] == grpc.Compression.Gzip
+
+
+def test_gzip_round_trip():
+    data = b"compressible " * 100
+
+    assert gzip.decompress(compression.gzip(data, level=1)) == data
+    assert compression.gzip(data) == compression.gzip(data)
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import threading
+import time
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+from google.auth import credentials as ga_credentials
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.tasks_helpers import fanout
+from google.cloud.tasks_v2 import CloudTasksAsyncClient, CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+from google.cloud.tasks_v2.types import cloudtasks, queue
+
+
+def _delay(name):
+    # Queue names end in the number of milliseconds the call takes.
+    return int(name.rsplit("-", 1)[1]) / 1000
+
+
+class _Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.timeouts = []
+
+    def enter(self, timeout):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.timeouts.append(timeout)
+
+    def exit(self):
+        with self.lock:
+            self.in_flight -= 1
+
+
+class _FakeTransport(transports.CloudTasksTransport):
+    """Answers GetQueue after a delay taken from the queue name."""
+
+    def __init__(self):
+        super().__init__(credentials=ga_credentials.AnonymousCredentials())
+        self.recorder = _Recorder()
+        self._wrapped_methods = {
+            self.get_queue: gapic_v1.method.wrap_method(
+                self.get_queue, default_timeout=20.0
+            )
+        }
+
+    def _get_queue(self, request, timeout=None, metadata=()):
+        self.recorder.enter(timeout)
+        try:
+            time.sleep(_delay(request.name))
+            if request.name.startswith("missing"):
+                raise core_exceptions.NotFound(request.name)
+            return queue.Queue(name=request.name)
+        finally:
+            self.recorder.exit()
+
+    @property
+    def get_queue(self):
+        return self._get_queue
+
+
+class _AsyncGetQueue(aio.UnaryUnaryMultiCallable):
+    def __init__(self, recorder):
+        self.recorder = recorder
+
+    async def __call__(self, request, timeout=None, metadata=()):
+        self.recorder.enter(timeout)
+        try:
+            await asyncio.sleep(_delay(request.name))
+            if request.name.startswith("missing"):
+                raise core_exceptions.NotFound(request.name)
+            return queue.Queue(name=request.name)
+        finally:
+            self.recorder.exit()
+
+
+class _FakeAsyncTransport(transports.CloudTasksTransport):
+    def __init__(self):
+        super().__init__(credentials=ga_credentials.AnonymousCredentials())
+        self.recorder = _Recorder()
+        self._get_queue = _AsyncGetQueue(self.recorder)
+
+    @property
+    def get_queue(self):
+        return self._get_queue
+
+
+def _requests(*names):
+    return [cloudtasks.GetQueueRequest(name=name) for name in names]
+
+
+def _summary(results):
+    return [
+        (r.index, r.response.name if r.exception is None else type(r.exception))
+        for r in results
+    ]
+
+
+def test_ordered_results_capture_errors():
+    client = CloudTasksClient(transport=_FakeTransport())
+
+    results = list(
+        client.batch_call("get_queue", _requests("a-30", "missing-0", "b-0"))
+    )
+
+    assert _summary(results) == [
+        (0, "a-30"),
+        (1, core_exceptions.NotFound),
+        (2, "b-0"),
+    ]
+    with pytest.raises(core_exceptions.NotFound):
+        results[1].result()
+    assert results[2].result().name == "b-0"
+
+
+def test_unordered_results_as_completed():
+    client = CloudTasksClient(transport=_FakeTransport())
+
+    results = client.batch_call(
+        "get_queue", _requests("slow-200", "fast-0"), ordered=False
+    )
+
+    assert [r.index for r in results] == [1, 0]
+
+
+def test_concurrency_bounded_and_requests_read_lazily():
+    transport = _FakeTransport()
+    client = CloudTasksClient(transport=transport)
+    read = []
+
+    def requests():
+        for i in range(40):
+            read.append(i)
+            yield cloudtasks.GetQueueRequest(name="q{}-5".format(i))
+
+    results = client.batch_call("get_queue", requests(), max_concurrency=4)
+    first = next(results)
+
+    assert first.index == 0
+    assert len(read) < 40
+    assert len(list(results)) == 39
+    assert transport.recorder.max_in_flight <= 4
+
+
+def _slow_first(read):
+    for i in range(40):
+        read.append(i)
+        name = "slow-200" if i == 0 else "q{}-0".format(i)
+        yield cloudtasks.GetQueueRequest(name=name)
+
+
+def test_ordered_results_held_behind_slow_call_are_bounded():
+    client = CloudTasksClient(transport=_FakeTransport())
+    read = []
+
+    results = client.batch_call("get_queue", _slow_first(read), max_concurrency=2)
+    first = next(results)
+
+    assert first.index == 0
+    # No more than twice max_concurrency requests were started meanwhile.
+    assert len(read) == 4
+    assert [r.index for r in results] == list(range(1, 40))
+
+
+def test_shared_deadline():
+    transport = _FakeTransport()
+    client = CloudTasksClient(transport=transport)
+
+    results = list(
+        client.batch_call(
+            "get_queue",
+            _requests("a-150", "b-150", "c-150"),
+            max_concurrency=1,
+            timeout=0.25,
+        )
+    )
+
+    assert _summary(results)[0] == (0, "a-150")
+    assert results[2].exception.__class__ is core_exceptions.DeadlineExceeded
+    # Each call was given only what remained of the batch's time.
+    assert all(t <= 0.25 for t in transport.recorder.timeouts)
+
+
+def test_early_exit_stops_making_calls():
+    transport = _FakeTransport()
+    client = CloudTasksClient(transport=transport)
+
+    results = client.batch_call(
+        "get_queue", _requests(*["q-20"] * 50), max_concurrency=2
+    )
+    next(results)
+    results.close()
+    time.sleep(0.1)
+
+    assert len(transport.recorder.timeouts) < 10
+
+
+@pytest.mark.parametrize(
+    "method,kwargs",
+    [
+        ("no_such_method", {}),
+        ("_transport", {}),
+        ("get_queue", {"max_concurrency": 0}),
+        ("get_queue", {"timeout": 0}),
+    ],
+)
+def test_invalid_arguments(method, kwargs):
+    client = CloudTasksClient(transport=_FakeTransport())
+
+    with pytest.raises(ValueError):
+        client.batch_call(method, [], **kwargs)
+
+
+def test_call_result():
+    assert fanout.CallResult(0, "r", "response").result() == "response"
+
+
+async def _collect(iterator):
+    return [result async for result in iterator]
+
+
+def test_async_ordered_results_capture_errors():
+    client = CloudTasksAsyncClient(transport=_FakeAsyncTransport())
+
+    results = asyncio.run(
+        _collect(client.batch_call("get_queue", _requests("a-30", "missing-0", "b-0")))
+    )
+
+    assert _summary(results) == [
+        (0, "a-30"),
+        (1, core_exceptions.NotFound),
+        (2, "b-0"),
+    ]
+
+
+def test_async_unordered_and_bounded():
+    transport = _FakeAsyncTransport()
+    client = CloudTasksAsyncClient(transport=transport)
+    names = ["slow-100"] + ["q{}-10".format(i) for i in range(20)]
+
+    results = asyncio.run(
+        _collect(
+            client.batch_call(
+                "get_queue", _requests(*names), max_concurrency=3, ordered=False
+            )
+        )
+    )
+
+    assert sorted(r.index for r in results) == list(range(21))
+    assert results[0].index != 0
+    assert transport.recorder.max_in_flight == 3
+
+
+def test_async_ordered_results_held_behind_slow_call_are_bounded():
+    client = CloudTasksAsyncClient(transport=_FakeAsyncTransport())
+    read = []
+
+    async def main():
+        results = client.batch_call("get_queue", _slow_first(read), max_concurrency=2)
+        first = await results.__anext__()
+        started = len(read)
+        rest = await _collect(results)
+        return first, started, rest
+
+    first, started, rest = asyncio.run(main())
+
+    assert first.index == 0
+    assert started == 4
+    assert [r.index for r in rest] == list(range(1, 40))
+
+
+def test_async_shared_deadline():
+    client = CloudTasksAsyncClient(transport=_FakeAsyncTransport())
+
+    results = asyncio.run(
+        _collect(
+            client.batch_call(
+                "get_queue",
+                _requests("a-150", "b-150", "c-150"),
+                max_concurrency=1,
+                timeout=0.25,
+            )
+        )
+    )
+
+    assert _summary(results)[0] == (0, "a-150")
+    assert results[2].exception.__class__ is core_exceptions.DeadlineExceeded
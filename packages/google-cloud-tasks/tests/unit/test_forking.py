@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.cloud.tasks_helpers import forking, registry
+from google.cloud.tasks_v2 import CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+
+
+def _forked():
+    """Make the guards behave as in a child forked after their creation."""
+    return mock.patch.object(forking, "_generation", forking._generation + 1)
+
+
+def test_guard_reopens_once_per_fork():
+    reopen = mock.Mock()
+    guard = forking.ForkGuard(reopen)
+
+    guard.check()
+    reopen.assert_not_called()
+    with _forked():
+        guard.check()
+        guard.check()
+    reopen.assert_called_once_with()
+
+
+def test_grpc_transport_reopens_channel():
+    with mock.patch.object(
+        transports.CloudTasksGrpcTransport,
+        "create_channel",
+        side_effect=lambda *args, **kwargs: mock.Mock(),
+    ) as create_channel:
+        transport = transports.CloudTasksGrpcTransport(
+            credentials=ga_credentials.AnonymousCredentials(), scopes=["s"]
+        )
+        inherited = transport.grpc_channel
+        stub = transport.get_queue
+        wrapped = transport._wrapped_methods[stub]
+
+        with _forked():
+            wrapped_methods = transport._wrapped_methods
+
+    assert create_channel.call_count == 2
+    assert create_channel.call_args_list[0] == create_channel.call_args_list[1]
+    assert transport.grpc_channel is not inherited
+    assert transport.get_queue is not stub
+    assert wrapped_methods[transport.get_queue] is not wrapped
+
+
+def test_given_channel_is_kept():
+    channel = mock.Mock()
+    transport = transports.CloudTasksGrpcTransport(channel=channel)
+    stub = transport.get_queue
+
+    with _forked():
+        transport._wrapped_methods
+
+    assert transport.grpc_channel is channel
+    assert transport.get_queue is stub
+
+
+def test_rest_transport_reopens_session():
+    credentials = ga_credentials.AnonymousCredentials()
+    transport = transports.CloudTasksRestTransport(credentials=credentials)
+    inherited = transport._session
+
+    with _forked():
+        transport._wrapped_methods
+
+    assert transport._session is not inherited
+    assert transport._session.credentials is credentials
+
+
+def test_rest_client_used_before_fork_works_in_child():
+    client = CloudTasksClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"name": "projects/p/locations/l/queues/q"}'
+    name = "projects/p/locations/l/queues/q"
+
+    with mock.patch.object(Session, "request", return_value=response) as request:
+        # Resolves every method name before the fork.
+        client.list_queues(parent="projects/p/locations/l")
+        client.get_queue(name=name)
+        inherited = client.transport._session
+        with _forked():
+            queue = client.get_queue(name=name)
+            client.list_queues(parent="projects/p/locations/l")
+
+    assert queue.name == name
+    assert request.call_count == 4
+    assert client.transport._session is not inherited
+
+
+def test_shared_transports_share_again_in_child():
+    credentials = ga_credentials.AnonymousCredentials()
+    with mock.patch.object(
+        transports.CloudTasksGrpcTransport,
+        "create_channel",
+        side_effect=lambda *args, **kwargs: mock.Mock(),
+    ):
+        first = transports.CloudTasksGrpcTransport(credentials=credentials, shared=True)
+        second = transports.CloudTasksGrpcTransport(
+            credentials=credentials, shared=True
+        )
+        inherited = first.grpc_channel
+
+        # The child's registry starts out empty.
+        with mock.patch.object(registry, "_REGISTRY", registry.Registry()), _forked():
+            first._wrapped_methods
+            second._wrapped_methods
+
+    assert first.grpc_channel is second.grpc_channel
+    assert first.grpc_channel is not inherited
+    assert first.get_queue is second.get_queue
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_reopened_in_forked_child():
+    transport = transports.CloudTasksRestTransport(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    inherited = transport._session
+    pid = os.fork()
+    if pid == 0:  # pragma: NO COVER
+        transport._wrapped_methods
+        os._exit(0 if transport._session is not inherited else 1)
+    _, status = os.waitpid(pid, 0)
+
+    assert os.WEXITSTATUS(status) == 0
+    transport._wrapped_methods
+    assert transport._session is inherited
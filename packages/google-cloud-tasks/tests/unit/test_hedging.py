@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.cloud.tasks_helpers import hedging, instrumentation
+
+_NAME = "projects/p/locations/l/queues/q"
+
+
+def test_slow_attempt_is_hedged(server, grpc_client):
+    hedges = hedging.Hedging(initial_delay=0.02)
+    server.delays = [0.5, 0.0]
+    client = grpc_client(hedges)
+
+    started = time.monotonic()
+    response = client.get_queue(name=_NAME)
+    elapsed = time.monotonic() - started
+
+    assert response.name == _NAME
+    # The hedge answered first.
+    assert elapsed < 0.4
+    assert len(server.calls) == 2
+    # The hedge was given only what remained of the attempt's timeout.
+    assert server.calls[1]["timeout"] < server.calls[0]["timeout"] <= 20.0
+    assert (hedges.attempts, hedges.hedges) == (1, 1)
+
+
+def test_fast_attempt_is_not_hedged(server, grpc_client):
+    hedges = hedging.Hedging(initial_delay=0.2)
+    client = grpc_client(hedges)
+
+    client.get_queue(name=_NAME)
+
+    assert len(server.calls) == 1
+    assert hedges.hedges == 0
+
+
+def test_method_without_retry_is_not_hedged(server, grpc_client):
+    hedges = hedging.Hedging(initial_delay=0.0)
+    server.delays = [0.05]
+    client = grpc_client(hedges)
+
+    client.create_queue(parent="projects/p/locations/l", queue={"name": _NAME})
+
+    assert len(server.calls) == 1
+    assert hedges.attempts == 0
+
+
+def test_named_method_is_hedged(server, grpc_client):
+    hedges = hedging.Hedging(methods=["pause_queue"], initial_delay=0.02)
+    server.delays = [0.5, 0.0]
+    client = grpc_client(hedges)
+
+    started = time.monotonic()
+    client.pause_queue(name=_NAME)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.4
+    assert len(server.calls) == 2
+    assert (hedges.attempts, hedges.hedges) == (1, 1)
+
+
+def test_attempt_without_delay_runs_on_callers_thread(server, grpc_client):
+    hedges = hedging.Hedging()
+    client = grpc_client(hedges)
+
+    client.get_queue(name=_NAME)
+
+    assert server.threads == [threading.current_thread()]
+    assert hedges.attempts == 1
+
+
+def test_attempt_without_budget_runs_on_callers_thread(server, grpc_client):
+    hedges = hedging.Hedging(initial_delay=0.0, max_hedge_ratio=0.0, max_burst=0.0)
+    server.delays = [0.01]
+    client = grpc_client(hedges)
+
+    client.get_queue(name=_NAME)
+
+    assert server.threads == [threading.current_thread()]
+    assert hedges.hedges == 0
+
+
+def test_budget_caps_hedges(server, grpc_client):
+    hedges = hedging.Hedging(
+        initial_delay=0.0, min_samples=1000, max_hedge_ratio=0.25, max_burst=2
+    )
+    server.delays = [0.01] * 100
+    client = grpc_client(hedges)
+
+    for _ in range(30):
+        client.get_queue(name=_NAME)
+
+    # Two from the saved-up burst, then one per four attempts.
+    assert hedges.attempts == 30
+    assert hedges.hedges == 9
+    assert len(server.calls) == 39
+
+
+def test_delay_follows_percentile(server, grpc_client):
+    hedges = hedging.Hedging(percentile=50, min_samples=4, window=10)
+    server.delays = [0.01, 0.02, 0.03, 0.04]
+    client = grpc_client(hedges)
+
+    for expected_calls in range(1, 5):
+        assert hedges.delay("get_queue") is None
+        client.get_queue(name=_NAME)
+        assert len(server.calls) == expected_calls
+
+    assert 0.02 <= hedges.delay("get_queue") < 0.03
+    assert hedges.delay("list_queues") is None
+
+
+def test_all_attempts_fail(server, grpc_client):
+    hedges = hedging.Hedging(initial_delay=0.0)
+    server.delays = [0.01, 0.01]
+    server.error = core_exceptions.NotFound("no such queue")
+    client = grpc_client(hedges)
+
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_queue(name=_NAME)
+
+    assert len(server.calls) == 2
+
+
+def test_hedges_are_reported_as_attempts(server, grpc_client):
+    hedges = hedging.Hedging(initial_delay=0.02)
+    server.delays = [0.2, 0.0]
+    client = grpc_client(hedges)
+    events = []
+    instrumentation.Instrumentation(events.append).attach(client.transport)
+
+    client.get_queue(name=_NAME)
+
+    call = events[-1]
+    assert (call.kind, call.attempt, call.status) == ("call", 2, "OK")
+
+
+def test_detach(server, grpc_client):
+    hedges = hedging.Hedging(initial_delay=0.0)
+    server.delays = [0.05]
+    client = grpc_client(hedges)
+
+    hedges.detach(client.transport)
+    client.get_queue(name=_NAME)
+
+    assert len(server.calls) == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"percentile": 100},
+        {"max_hedge_ratio": 2},
+        {"min_samples": 0},
+        {"min_samples": 20, "window": 10},
+    ],
+)
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        hedging.Hedging(**kwargs)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.auth import credentials as ga_credentials
+import pytest
+from requests import adapters
+
+from google.cloud.tasks_helpers import http_pool
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+
+_CREDENTIALS = ga_credentials.AnonymousCredentials()
+
+
+def _pool_kw(transport, prefix="https://"):
+    return transport._session.get_adapter(prefix).poolmanager.connection_pool_kw
+
+
+def test_defaults_unchanged():
+    transport = transports.CloudTasksRestTransport(credentials=_CREDENTIALS)
+
+    assert _pool_kw(transport)["maxsize"] == adapters.DEFAULT_POOLSIZE
+
+
+@pytest.mark.parametrize("prefix", ["https://", "http://"])
+def test_options_applied(prefix):
+    transport = transports.CloudTasksRestTransport(
+        credentials=_CREDENTIALS,
+        http_pool_options=http_pool.HttpPoolOptions(pool_maxsize=64, pool_block=True),
+    )
+
+    assert _pool_kw(transport, prefix)["maxsize"] == 64
+    assert _pool_kw(transport, prefix)["block"] is True
+
+
+def test_shared_sessions_are_keyed_by_options():
+    def transport(maxsize):
+        return transports.CloudTasksRestTransport(
+            credentials=_CREDENTIALS,
+            shared=True,
+            http_pool_options=http_pool.HttpPoolOptions(pool_maxsize=maxsize),
+        )
+
+    first, second, other = transport(32), transport(32), transport(64)
+    try:
+        assert first._session is second._session
+        assert other._session is not first._session
+        assert _pool_kw(other)["maxsize"] == 64
+    finally:
+        for t in (first, second, other):
+            t.close()
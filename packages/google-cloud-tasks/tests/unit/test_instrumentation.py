@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+from google.protobuf import json_format
+import pytest
+from requests import Response
+
+from google.cloud.tasks_helpers import instrumentation
+from google.cloud.tasks_v2 import CloudTasksClient
+from google.cloud.tasks_v2.types import cloudtasks, queue
+
+_NAME = "projects/p/locations/l/queues/q"
+
+
+def _client(transport):
+    client = CloudTasksClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport
+    )
+    events = []
+    instrumentation.Instrumentation(events.append).attach(client.transport)
+    return client, events
+
+
+def _kinds(events):
+    return [(e.kind, e.attempt, e.status) for e in events]
+
+
+def test_grpc_retry_reports_each_attempt():
+    client, events = _client("grpc")
+    response = queue.Queue(name=_NAME)
+    with mock.patch.object(
+        type(client.transport.get_queue),
+        "__call__",
+        side_effect=[core_exceptions.ServiceUnavailable("busy"), response],
+    ):
+        assert client.get_queue(name=_NAME) == response
+
+    assert _kinds(events) == [
+        ("start", 1, None),
+        ("end", 1, "UNAVAILABLE"),
+        ("start", 2, None),
+        ("end", 2, "OK"),
+        ("call", 2, "OK"),
+    ]
+    request_size = cloudtasks.GetQueueRequest.pb(
+        cloudtasks.GetQueueRequest(name=_NAME)
+    ).ByteSize()
+    assert {e.method for e in events} == {"get_queue"}
+    assert {e.request_size for e in events} == {request_size}
+    assert events[3].response_size == queue.Queue.pb(response).ByteSize()
+    assert events[1].response_size is None
+    assert events[4].duration >= events[3].duration > 0
+
+
+def _rest_response(status, content):
+    response = Response()
+    response.status_code = status
+    response._content = content
+    response.request = mock.Mock()
+    return response
+
+
+def test_rest_error_status():
+    client, events = _client("rest")
+    body = b'{"error": {"code": 404, "message": "no such queue"}}'
+    with mock.patch.object(
+        type(client.transport._session),
+        "request",
+        return_value=_rest_response(404, body),
+    ):
+        with pytest.raises(core_exceptions.NotFound):
+            client.create_queue(parent="projects/p/locations/l", queue={"name": "q"})
+
+    assert _kinds(events) == [
+        ("start", 1, None),
+        ("end", 1, "NOT_FOUND"),
+        ("call", 1, "NOT_FOUND"),
+    ]
+    assert events[0].method == "create_queue"
+
+
+def test_attach_and_detach_rewrap_methods():
+    client = CloudTasksClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+    events = []
+    hooks = instrumentation.Instrumentation(events.append)
+    content = json_format.MessageToJson(queue.Queue.pb(queue.Queue(name=_NAME)))
+    with mock.patch.object(
+        type(client.transport._session),
+        "request",
+        side_effect=lambda *a, **kw: _rest_response(200, content.encode()),
+    ):
+        client.get_queue(name=_NAME)
+        hooks.attach(client.transport)
+        client.get_queue(name=_NAME)
+        hooks.detach(client.transport)
+        client.get_queue(name=_NAME)
+
+    assert _kinds(events) == [("start", 1, None), ("end", 1, "OK"), ("call", 1, "OK")]
+    assert events[1].response_size > 0
+
+
+def _event(kind, attempt=1, status="OK", duration=0.0, **kwargs):
+    return instrumentation.RpcEvent(
+        kind, "get_queue", attempt, status, duration=duration, **kwargs
+    )
+
+
+def test_histogram():
+    histogram = instrumentation.LatencyHistogram()
+    for millis in range(1, 101):
+        histogram(_event("start", status=None))
+        histogram(
+            _event(
+                "end",
+                duration=millis / 1000,
+                request_size=10,
+                response_size=100,
+            )
+        )
+    histogram(_event("end", status="UNAVAILABLE", duration=0.001))
+    histogram(_event("call", attempt=2))
+
+    summary = histogram.summary()["get_queue"]
+
+    assert summary["attempts"] == 101
+    assert summary["calls"] == 1
+    assert summary["retries"] == 1
+    assert summary["request_bytes"] == 1000
+    assert summary["response_bytes"] == 10000
+    assert summary["statuses"] == {"OK": 100, "UNAVAILABLE": 1}
+    # Bucket bounds are within a factor of 2 ** (1 / 4) of the latency.
+    assert 0.050 <= summary["p50"] <= 0.050 * 1.19
+    assert 0.099 <= summary["p99"] <= 0.099 * 1.19
+    with pytest.raises(KeyError):
+        histogram.percentile("list_queues", 50)
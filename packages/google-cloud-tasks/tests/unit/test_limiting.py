@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from concurrent import futures
+import threading
+import time
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.cloud.tasks_helpers import limiting
+
+_NAME = "projects/p/locations/l/queues/q"
+
+
+def _call_concurrently(client, calls, **kwargs):
+    with futures.ThreadPoolExecutor(max_workers=calls) as pool:
+        for _ in range(calls):
+            pool.submit(client.get_queue, name=_NAME, **kwargs)
+
+
+def test_concurrency_is_limited(server, grpc_client):
+    limiter = limiting.Limiter(initial_limit=3, max_limit=3)
+    server.delay = 0.02
+    client = grpc_client(limiter)
+
+    _call_concurrently(client, 12)
+
+    assert len(server.calls) == 12
+    assert server.max_in_flight == 3
+    assert limiter.throttled > 0
+
+
+def test_success_raises_limit(grpc_client):
+    limiter = limiting.Limiter(initial_limit=2)
+    client = grpc_client(limiter)
+
+    for _ in range(2):
+        client.get_queue(name=_NAME)
+
+    # Each success adds 1 / limit: 2 + 1 / 2 + 1 / 2.5.
+    assert limiter.limit("get_queue") == pytest.approx(2.9)
+
+
+def test_overload_cuts_limit_once(server, grpc_client):
+    limiter = limiting.Limiter(initial_limit=8, backoff=0.5)
+    server.errors = [core_exceptions.ResourceExhausted("quota")] * 4
+    server.barrier = threading.Barrier(4)
+    client = grpc_client(limiter)
+
+    _call_concurrently(client, 4, retry=None)
+    server.barrier = None
+
+    # All four attempts were in flight when the limit was first cut.
+    assert limiter.limit("get_queue") == 4
+
+    server.errors = [core_exceptions.ServiceUnavailable("busy")]
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        client.get_queue(name=_NAME, retry=None)
+
+    assert limiter.limit("get_queue") == 2
+
+
+def test_other_errors_leave_limit(server, grpc_client):
+    limiter = limiting.Limiter(initial_limit=4)
+    server.errors = [core_exceptions.NotFound("no such queue")]
+    client = grpc_client(limiter)
+
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_queue(name=_NAME)
+
+    assert limiter.limit("get_queue") == 4
+
+
+def test_rate_is_limited(grpc_client):
+    limiter = limiting.Limiter(rate=100, burst=2)
+    client = grpc_client(limiter)
+
+    started = time.monotonic()
+    for _ in range(7):
+        client.get_queue(name=_NAME)
+    elapsed = time.monotonic() - started
+
+    # Two calls from the burst, then one every 10 ms.
+    assert elapsed >= 0.045
+
+
+def test_wait_bounded_by_timeout(server, grpc_client):
+    limiter = limiting.Limiter(initial_limit=1)
+    server.delay = 0.3
+    client = grpc_client(limiter)
+
+    with futures.ThreadPoolExecutor(max_workers=1) as pool:
+        slow = pool.submit(client.get_queue, name=_NAME)
+        time.sleep(0.05)
+        with pytest.raises(core_exceptions.DeadlineExceeded):
+            client.get_queue(name=_NAME, timeout=0.05, retry=None)
+        slow.result()
+
+    assert len(server.calls) == 1
+
+
+def test_detach(server, grpc_client):
+    limiter = limiting.Limiter(initial_limit=1)
+    server.delay = 0.02
+    client = grpc_client(limiter)
+
+    limiter.detach(client.transport)
+    _call_concurrently(client, 4)
+
+    assert server.max_in_flight > 1
+
+
+def test_async_concurrency_is_limited(server, async_client):
+    limiter = limiting.Limiter(initial_limit=2, max_limit=2)
+    server.delay = 0.02
+
+    async def main():
+        client = async_client(limiter)
+        responses = await asyncio.gather(
+            *(client.get_queue(name=_NAME) for _ in range(10))
+        )
+        assert server.max_in_flight == 2
+        limiter.detach(client.transport)
+        await asyncio.gather(*(client.get_queue(name=_NAME) for _ in range(4)))
+        return responses
+
+    responses = asyncio.run(main())
+
+    assert [r.name for r in responses] == [_NAME] * 10
+    assert server.max_in_flight == 4
+
+
+def test_limits_shared_by_sync_and_async_clients(server, grpc_client, async_client):
+    limiter = limiting.Limiter(initial_limit=2, max_limit=2)
+    server.delay = 0.1
+    client = grpc_client(limiter)
+
+    async def call_async():
+        aio_client = async_client(limiter)
+        await asyncio.gather(*(aio_client.get_queue(name=_NAME) for _ in range(3)))
+
+    with futures.ThreadPoolExecutor(max_workers=3) as pool:
+        for _ in range(3):
+            pool.submit(client.get_queue, name=_NAME)
+        asyncio.run(call_async())
+
+    assert len(server.calls) == 6
+    assert server.max_in_flight == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"rate": 0},
+        {"burst": 0.5},
+        {"backoff": 1},
+        {"min_limit": 0},
+        {"initial_limit": 5, "max_limit": 4},
+    ],
+)
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        limiting.Limiter(**kwargs)
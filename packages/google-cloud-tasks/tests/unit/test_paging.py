@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.tasks_v2 import CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import pagers
+from google.cloud.tasks_v2.types import cloudtasks, task
+
+PAGES = 5
+
+
+def _page(index):
+    return cloudtasks.ListTasksResponse(
+        tasks=[task.Task(name="t{}-{}".format(index, i)) for i in range(3)],
+        next_page_token="p{}".format(index + 1) if index + 1 < PAGES else "",
+    )
+
+
+class _Method:
+    """Serves _page(n) for page token "p<n>" and records the tokens."""
+
+    def __init__(self, fail_at=None):
+        self.tokens = []
+        self.fail_at = fail_at
+        self.lock = threading.Lock()
+
+    def __call__(self, request, metadata=()):
+        with self.lock:
+            self.tokens.append(request.page_token)
+        index = int(request.page_token[1:])
+        if index == self.fail_at:
+            raise core_exceptions.ServiceUnavailable("page {}".format(index))
+        return _page(index)
+
+
+def _pager(method, prefetch):
+    return pagers.ListTasksPager(
+        method=method,
+        request=cloudtasks.ListTasksRequest(parent="q"),
+        response=_page(0),
+        prefetch=prefetch,
+    )
+
+
+def _wait_for(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_pager_yields_every_item_in_order(prefetch):
+    method = _Method()
+
+    names = [t.name for t in _pager(method, prefetch)]
+
+    assert names == [t.name for i in range(PAGES) for t in _page(i).tasks]
+    assert method.tokens == ["p1", "p2", "p3", "p4"]
+
+
+def test_pager_prefetch_is_bounded():
+    method = _Method()
+    pages = _pager(method, 2).pages
+
+    assert next(pages).next_page_token == "p1"
+    _wait_for(lambda: len(method.tokens) == 2)
+    time.sleep(0.05)
+    assert method.tokens == ["p1", "p2"]
+
+    page = next(pages)
+    assert page.tasks[0].name == "t1-0"
+    _wait_for(lambda: len(method.tokens) == 3)
+
+
+def test_pager_tracks_the_page_being_read():
+    pager = _pager(_Method(), 2)
+    pages = pager.pages
+
+    next(pages)
+    next(pages)
+
+    assert pager.next_page_token == "p2"
+
+
+def test_pager_stops_fetching_when_iteration_stops():
+    method = _Method()
+    pages = _pager(method, 1).pages
+    next(pages)
+    next(pages)
+
+    pages.close()
+    time.sleep(0.05)
+
+    assert method.tokens in (["p1", "p2"], ["p1"])
+
+
+def test_pager_prefetch_error_is_raised_in_order():
+    pages = _pager(_Method(fail_at=3), 3).pages
+
+    assert [p.tasks[0].name for p in (next(pages), next(pages), next(pages))] == [
+        "t0-0",
+        "t1-0",
+        "t2-0",
+    ]
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        next(pages)
+
+
+def test_pager_negative_prefetch():
+    with pytest.raises(ValueError):
+        _pager(_Method(), -1)
+
+
+def test_client_passes_prefetch_to_pager():
+    client = CloudTasksClient(credentials=ga_credentials.AnonymousCredentials())
+    with mock.patch.object(type(client.transport.list_tasks), "__call__") as call:
+        call.return_value = _page(PAGES - 1)
+        pager = client.list_tasks(parent="q", prefetch=4)
+
+    assert pager._prefetch == 4
+
+
+def _async_pager(method, prefetch):
+    async def fetch(request, metadata=()):
+        await asyncio.sleep(0)
+        return method(request, metadata=metadata)
+
+    return pagers.ListTasksAsyncPager(
+        method=fetch,
+        request=cloudtasks.ListTasksRequest(parent="q"),
+        response=_page(0),
+        prefetch=prefetch,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+async def test_async_pager_yields_every_item_in_order(prefetch):
+    method = _Method()
+
+    names = [t.name async for t in _async_pager(method, prefetch)]
+
+    assert names == [t.name for i in range(PAGES) for t in _page(i).tasks]
+    assert method.tokens == ["p1", "p2", "p3", "p4"]
+
+
+@pytest.mark.asyncio
+async def test_async_pager_prefetch_is_bounded():
+    method = _Method()
+    pages = _async_pager(method, 2).pages
+
+    await pages.__anext__()
+    await pages.__anext__()
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+    # Page 1 was handed out and pages 2 and 3 fill the buffer.
+    assert method.tokens == ["p1", "p2", "p3"]
+    await pages.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_pager_prefetch_error():
+    pages = _async_pager(_Method(fail_at=2), 2).pages
+
+    await pages.__anext__()
+    await pages.__anext__()
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        await pages.__anext__()
+    await pages.aclose()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+from google.protobuf import empty_pb2
+
+from google.cloud.tasks_helpers import caching, raw_messages
+from google.cloud.tasks_v2.types import cloudtasks, queue, task
+
+_PARENT = "projects/p/locations/l/queues/q"
+
+
+def test_response_is_protobuf(grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+
+    response = client.get_queue(name=_PARENT)
+
+    assert type(response) is queue.Queue.pb()
+    assert response.name == _PARENT
+    assert response.state == queue.Queue.State.RUNNING
+
+
+def test_pager_yields_protobuf_items(server, grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+
+    pager = client.list_tasks(parent=_PARENT)
+    tasks = list(pager)
+
+    assert [type(t) for t in tasks] == [task.Task.pb()] * 3
+    assert [t.name for t in tasks] == ["a", "b", "c"]
+    assert [r.page_token for r in server.requests] == ["", "2"]
+    assert type(pager._response) is cloudtasks.ListTasksResponse.pb()
+
+
+def test_protobuf_request(server, grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+    request = cloudtasks.GetQueueRequest.pb()(name=_PARENT)
+
+    response = client.get_queue(request=request)
+
+    assert response.name == _PARENT
+    assert server.requests == [cloudtasks.GetQueueRequest(name=_PARENT)]
+
+
+def test_detach(grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+    raw_messages.RawMessages().detach(client.transport)
+
+    response = client.get_queue(name=_PARENT)
+
+    assert isinstance(response, queue.Queue)
+
+
+def test_cache_holds_proto_plus_responses(server, grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+    cache = caching.ResponseCache()
+    cache.attach(client.transport)
+
+    responses = [client.get_queue(name=_PARENT) for _ in range(2)]
+
+    assert [type(r) for r in responses] == [queue.Queue.pb()] * 2
+    assert len(server.requests) == 1
+
+
+def test_streams_and_other_responses():
+    raw = raw_messages.RawMessages()
+    stream = raw.wrap(lambda: iter([queue.Queue(name="a"), queue.Queue(name="b")]))
+    empty = raw.wrap(lambda: empty_pb2.Empty())
+
+    assert [type(r) for r in stream()] == [queue.Queue.pb()] * 2
+    assert type(empty()) is empty_pb2.Empty
+
+
+def test_async_response_is_protobuf(async_client):
+    async def main():
+        client = async_client(raw_messages.RawMessages(), methods=["list_tasks"])
+        pager = await client.list_tasks(parent=_PARENT)
+        return [t async for t in pager]
+
+    tasks = asyncio.run(main())
+
+    assert [type(t) for t in tasks] == [task.Task.pb()] * 3
+    assert [t.name for t in tasks] == ["a", "b", "c"]
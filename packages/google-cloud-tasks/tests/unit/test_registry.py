@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import os
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.tasks_helpers import registry
+from google.cloud.tasks_v2 import CloudTasksClient
+from google.cloud.tasks_v2.services.cloud_tasks import transports
+
+
+def test_make_key():
+    credentials = ga_credentials.AnonymousCredentials()
+
+    key = registry.make_key(object, scopes=["a", "b"], credentials=credentials)
+
+    assert key == registry.make_key(object, credentials=credentials, scopes=("a", "b"))
+    assert key != registry.make_key(
+        object, scopes=["a", "b"], credentials=ga_credentials.AnonymousCredentials()
+    )
+    assert key != registry.make_key(type, scopes=["a", "b"], credentials=credentials)
+    hash(key)
+
+
+def test_resource_closed_on_last_release():
+    reg = registry.Registry()
+    factory = mock.Mock()
+
+    first = reg.acquire("k", factory)
+    second = reg.acquire("k", factory)
+
+    factory.assert_called_once_with()
+    assert first.resource is second.resource
+    assert first.stubs is second.stubs
+    first.close()
+    first.close()
+    assert reg.refcount("k") == 1
+    first.resource.close.assert_not_called()
+    second.close()
+    assert reg.refcount("k") == 0
+    second.resource.close.assert_called_once_with()
+
+
+def test_new_resource_after_last_release():
+    reg = registry.Registry()
+    reg.acquire("k", mock.Mock).close()
+
+    lease = reg.acquire("k", mock.Mock)
+
+    assert lease.resource.close.call_count == 0
+    assert reg.refcount("k") == 1
+
+
+def test_failed_factory_is_not_recorded():
+    reg = registry.Registry()
+
+    with pytest.raises(RuntimeError):
+        reg.acquire("k", mock.Mock(side_effect=RuntimeError))
+
+    assert reg.refcount("k") == 0
+
+
+def test_aclose():
+    reg = registry.Registry()
+    resource = mock.Mock(close=mock.AsyncMock())
+    first = reg.acquire("k", lambda: resource)
+    second = reg.acquire("k", lambda: resource)
+
+    asyncio.run(first.aclose())
+    resource.close.assert_not_awaited()
+    asyncio.run(second.aclose())
+    resource.close.assert_awaited_once_with()
+
+
+def test_leases_from_before_fork_are_inert():
+    reg = registry.Registry()
+    inherited = reg.acquire("k", mock.Mock)
+
+    reg._after_fork_in_child()
+    fresh = reg.acquire("k", mock.Mock)
+    inherited.close()
+
+    assert fresh.resource is not inherited.resource
+    inherited.resource.close.assert_not_called()
+    assert reg.refcount("k") == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_child_process_starts_empty():
+    lease = registry.acquire(("test_child_process_starts_empty",), mock.Mock)
+    pid = os.fork()
+    if pid == 0:  # pragma: NO COVER
+        os._exit(registry.refcount(("test_child_process_starts_empty",)))
+    _, status = os.waitpid(pid, 0)
+    lease.close()
+
+    assert os.WEXITSTATUS(status) == 0
+
+
+def _new_channel(*args, **kwargs):
+    return mock.Mock()
+
+
+def _grpc_transport(credentials, **kwargs):
+    return transports.CloudTasksGrpcTransport(
+        credentials=credentials, shared=True, **kwargs
+    )
+
+
+def test_grpc_transports_share_channel_and_stubs():
+    credentials = ga_credentials.AnonymousCredentials()
+    with mock.patch.object(
+        transports.CloudTasksGrpcTransport, "create_channel", side_effect=_new_channel
+    ) as create_channel:
+        first = _grpc_transport(credentials)
+        second = _grpc_transport(credentials)
+        other = _grpc_transport(credentials, scopes=["other"])
+
+    assert create_channel.call_count == 2
+    assert first.grpc_channel is second.grpc_channel
+    assert first.grpc_channel is not other.grpc_channel
+    assert first.get_queue is second.get_queue
+
+    channel = first.grpc_channel
+    first.close()
+    channel.close.assert_not_called()
+    second.close()
+    channel.close.assert_called_once_with()
+    other.close()
+
+
+def test_client_context_manager_releases_channel():
+    credentials = ga_credentials.AnonymousCredentials()
+    with mock.patch.object(
+        transports.CloudTasksGrpcTransport, "create_channel", side_effect=_new_channel
+    ):
+        transport = _grpc_transport(credentials)
+        with CloudTasksClient(transport=_grpc_transport(credentials)):
+            pass
+
+    transport.grpc_channel.close.assert_not_called()
+    transport.close()
+    transport.grpc_channel.close.assert_called_once_with()
+
+
+def test_unshared_transports_keep_own_channel():
+    credentials = ga_credentials.AnonymousCredentials()
+    with mock.patch.object(
+        transports.CloudTasksGrpcTransport, "create_channel", side_effect=_new_channel
+    ):
+        first = transports.CloudTasksGrpcTransport(credentials=credentials)
+        second = transports.CloudTasksGrpcTransport(credentials=credentials)
+
+    assert first.grpc_channel is not second.grpc_channel
+    first.close()
+    first.grpc_channel.close.assert_called_once_with()
+
+
+def test_grpc_asyncio_transports_share_channel():
+    credentials = ga_credentials.AnonymousCredentials()
+    channel = mock.Mock(spec=aio.Channel, close=mock.AsyncMock())
+    with mock.patch.object(
+        transports.CloudTasksGrpcAsyncIOTransport,
+        "create_channel",
+        return_value=channel,
+    ) as create_channel:
+        first = transports.CloudTasksGrpcAsyncIOTransport(
+            credentials=credentials, shared=True
+        )
+        second = transports.CloudTasksGrpcAsyncIOTransport(
+            credentials=credentials, shared=True
+        )
+
+    create_channel.assert_called_once()
+    asyncio.run(first.close())
+    channel.close.assert_not_awaited()
+    asyncio.run(second.close())
+    channel.close.assert_awaited_once_with()
+
+
+def test_rest_transports_share_session():
+    credentials = ga_credentials.AnonymousCredentials()
+    first = transports.CloudTasksRestTransport(credentials=credentials, shared=True)
+    second = transports.CloudTasksRestTransport(credentials=credentials, shared=True)
+    other = transports.CloudTasksRestTransport(
+        credentials=credentials, shared=True, host="other.example.com"
+    )
+
+    assert first._session is second._session
+    assert first._session is not other._session
+    with mock.patch.object(first._session, "close") as close:
+        first.close()
+        close.assert_not_called()
+        second.close()
+        close.assert_called_once_with()
+    other.close()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+
+import pytest
+
+from google.cloud.tasks_helpers import resource_names
+from google.cloud.tasks_v2 import CloudTasksAsyncClient, CloudTasksClient
+
+_TASK = "projects/{project}/locations/{location}/queues/{queue}/tasks/{task}"
+
+
+def _generated_parse(template, path):
+    # The code the generator emits for parse_*_path.
+    pattern = "^" + re.sub(r"\{(\w+)\}", r"(?P<\1>.+?)", template) + "$"
+    m = re.match(pattern, path)
+    return m.groupdict() if m else {}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "projects/p/locations/l/queues/q/tasks/t",
+        "projects/p/locations/l/queues/q/tasks/a/b",
+        "projects/a/b/locations/l/queues/q/tasks/t",
+        "projects/p/locations/l/queues/q/tasks/t\n",
+        "projects/p/locations/l/queues/q/tasks/",
+        "projects//locations/l/queues/q/tasks/t",
+        "projects/p/locations/l/queues/q",
+        "projects/p\nq/locations/l/queues/q/tasks/t",
+        "",
+    ],
+)
+def test_parse_matches_generated_code(path):
+    parsed = resource_names.ResourceName(_TASK).parse(path)
+
+    assert parsed == _generated_parse(_TASK, path)
+
+
+def test_client_methods():
+    path = CloudTasksClient.task_path("p", "l", "q", "t")
+
+    assert path == "projects/p/locations/l/queues/q/tasks/t"
+    assert CloudTasksClient.parse_task_path(path) == {
+        "project": "p",
+        "location": "l",
+        "queue": "q",
+        "task": "t",
+    }
+    assert CloudTasksAsyncClient.parse_task_path(path) == {
+        "project": "p",
+        "location": "l",
+        "queue": "q",
+        "task": "t",
+    }
+    assert CloudTasksClient.common_project_path(7) == "projects/7"
+    assert CloudTasksClient.parse_common_project_path("folders/f") == {}
+
+
+def test_format():
+    codec = resource_names.ResourceName(_TASK)
+
+    assert codec.format("p", "l", "q", 1) == "projects/p/locations/l/queues/q/tasks/1"
+    assert codec.format("p", "l", queue="q", task="t") == (
+        "projects/p/locations/l/queues/q/tasks/t"
+    )
+    with pytest.raises(KeyError, match="queue"):
+        codec.format("p", "l", task="t")
+    with pytest.raises(KeyError, match="task"):
+        codec.format("p", "l", "q")
+    with pytest.raises(TypeError, match="4 fields, got 5 values"):
+        codec.format("p", "l", "q", "t", "u")
+
+
+def test_parse_returns_copies():
+    codec = resource_names.ResourceName(_TASK)
+    path = "projects/p/locations/l/queues/q/tasks/t"
+
+    codec.parse(path)["task"] = "changed"
+
+    assert codec.parse(path)["task"] == "t"
+
+
+def test_parse_remembers_names():
+    codec = resource_names.ResourceName(_TASK, cache_size=2)
+    paths = ["projects/p/locations/l/queues/q/tasks/{}".format(i) for i in range(3)]
+
+    for path in paths + paths[-2:]:
+        codec.parse(path)
+
+    info = codec._parse_cached.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 3, 2)
+
+
+def test_segments_interned():
+    codec = resource_names.ResourceName(_TASK)
+    first = codec.parse("projects/" + "p" * 3 + "/locations/l/queues/q/tasks/1")
+    second = codec.parse("projects/" + "p" * 3 + "/locations/l/queues/q/tasks/2")
+
+    assert first["project"] is second["project"]
+
+
+def test_parse_many():
+    codec = resource_names.ResourceName("projects/{project}/queues/{queue}")
+
+    columns = codec.parse_many(
+        iter(["projects/a/queues/x", "folders/f", "projects/b/queues/y"])
+    )
+
+    assert columns == {"project": ["a", None, "b"], "queue": ["x", None, "y"]}
+
+
+def test_parse_many_empty():
+    codec = resource_names.ResourceName("projects/{project}")
+
+    assert codec.parse_many([]) == {"project": []}
+
+
+def test_parse_many_numpy_array():
+    numpy = pytest.importorskip("numpy")
+    codec = resource_names.ResourceName("projects/{project}/queues/{queue}")
+    paths = numpy.array([["projects/a/queues/x", "folders/f"]] * 3)
+
+    columns = codec.parse_many(paths)
+
+    assert columns["project"].shape == (3, 2)
+    assert columns["project"].dtype == object
+    assert columns["queue"].tolist() == [["x", None]] * 3
+
+
+def test_get_shares_codecs():
+    assert resource_names.get(_TASK) is resource_names.get(_TASK)
+    assert resource_names.get(_TASK).fields == ("project", "location", "queue", "task")
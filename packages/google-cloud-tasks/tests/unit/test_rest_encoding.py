@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+from google.api_core import rest_helpers
+from google.protobuf import (
+    duration_pb2,
+    field_mask_pb2,
+    json_format,
+    struct_pb2,
+    timestamp_pb2,
+)
+from google.rpc import status_pb2
+import pytest
+
+from google.cloud.tasks_helpers import rest_encoding
+from google.cloud.tasks_v2.types import cloudtasks, queue, target, task
+
+
+def _legacy(message, defaults=None, use_integers_for_enums=True):
+    query_params = json.loads(
+        json_format.MessageToJson(
+            message,
+            including_default_value_fields=False,
+            use_integers_for_enums=use_integers_for_enums,
+        )
+    )
+    query_params.update(
+        {k: v for k, v in (defaults or {}).items() if k not in query_params}
+    )
+    return rest_helpers.flatten_query_params(query_params, strict=True)
+
+
+MESSAGES = [
+    cloudtasks.ListTasksRequest.pb(cloudtasks.ListTasksRequest()),
+    cloudtasks.ListTasksRequest.pb(
+        cloudtasks.ListTasksRequest(
+            parent="projects/p/locations/l/queues/q",
+            response_view=task.Task.View.FULL,
+            page_size=1000,
+            page_token="token/with?reserved&chars",
+        )
+    ),
+    cloudtasks.GetTaskRequest.pb(
+        cloudtasks.GetTaskRequest(name="n", response_view=task.Task.View.BASIC)
+    ),
+    cloudtasks.UpdateQueueRequest.pb(
+        cloudtasks.UpdateQueueRequest(
+            update_mask=field_mask_pb2.FieldMask(
+                paths=["rate_limits.max_dispatches_per_second", "retry_config"]
+            ),
+            queue=queue.Queue(
+                name="q",
+                rate_limits=queue.RateLimits(
+                    max_dispatches_per_second=0.1 + 0.2,
+                    max_concurrent_dispatches=-3,
+                ),
+                retry_config=queue.RetryConfig(
+                    max_attempts=5,
+                    min_backoff=duration_pb2.Duration(seconds=1, nanos=500000000),
+                ),
+                purge_time=timestamp_pb2.Timestamp(seconds=1700000000, nanos=1000),
+                stackdriver_logging_config=queue.StackdriverLoggingConfig(
+                    sampling_ratio=float("inf")
+                ),
+                state=queue.Queue.State.PAUSED,
+            ),
+        )
+    ),
+    cloudtasks.CreateTaskRequest.pb(
+        cloudtasks.CreateTaskRequest(
+            parent="p",
+            task=task.Task(
+                http_request=target.HttpRequest(
+                    url="https://example.com",
+                    http_method=target.HttpMethod.PUT,
+                    headers={"X-A": "1", "X-B": "two words"},
+                    body=b"\x00\xffbinary",
+                ),
+            ),
+        )
+    ),
+    struct_pb2.Struct(fields={"a": struct_pb2.Value(number_value=1.5)}),
+]
+
+
+@pytest.mark.parametrize("use_integers_for_enums", [True, False])
+@pytest.mark.parametrize("message", MESSAGES)
+def test_message_to_query_params_matches_json_round_trip(
+    message, use_integers_for_enums
+):
+    assert rest_encoding.message_to_query_params(
+        message, use_integers_for_enums=use_integers_for_enums
+    ) == _legacy(message, use_integers_for_enums=use_integers_for_enums)
+
+
+def test_message_to_query_params_enum_names():
+    message = cloudtasks.GetTaskRequest.pb(
+        cloudtasks.GetTaskRequest(name="n", response_view=task.Task.View.FULL)
+    )
+
+    assert rest_encoding.message_to_query_params(
+        message, use_integers_for_enums=False
+    ) == [("name", "n"), ("responseView", "FULL")]
+
+
+def test_message_to_query_params_defaults():
+    message = cloudtasks.ListTasksRequest.pb(cloudtasks.ListTasksRequest(page_size=5))
+    defaults = {"pageSize": 10, "pageToken": "", "view": {"a": True}}
+
+    assert rest_encoding.message_to_query_params(message, defaults=defaults) == _legacy(
+        message, defaults
+    )
+    assert rest_encoding.message_to_query_params(message, defaults=defaults) == [
+        ("pageSize", "5"),
+        ("pageToken", ""),
+        ("view.a", "true"),
+    ]
+
+
+def test_message_to_query_params_special_floats():
+    message = queue.RateLimits.pb(
+        queue.RateLimits(max_dispatches_per_second=float("nan"))
+    )
+    assert rest_encoding.message_to_query_params(message) == [
+        ("maxDispatchesPerSecond", "NaN")
+    ]
+
+
+def test_message_to_query_params_repeated_message_raises():
+    message = status_pb2.Status(details=[{}])
+    with pytest.raises(ValueError):
+        _legacy(message)
+    with pytest.raises(ValueError):
+        rest_encoding.message_to_query_params(message)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+from unittest import mock
+
+from google.api_core import path_template
+import pytest
+
+from google.cloud.tasks_helpers import transcoding
+from google.cloud.tasks_v2.services.cloud_tasks.transports import rest
+from google.cloud.tasks_v2.types import cloudtasks, queue
+
+_STUBS = sorted(
+    (name, stub)
+    for name, stub in vars(rest.CloudTasksRestTransport).items()
+    if isinstance(getattr(stub, "_TRANSCODER", None), transcoding.Transcoder)
+)
+
+
+def _request(stub):
+    cls = stub.__call__.__annotations__["request"]
+    pb = getattr(cls, "pb", None)
+    return pb(cls()) if pb is not None else cls()
+
+
+def _fill(message, uri):
+    """Set the fields of a URI template to values that match it."""
+    for match in re.finditer(r"{([^=}]+)(?:=([^}]+))?}", uri):
+        *parents, name = match.group(1).split(".")
+        value = (match.group(2) or "*").replace("**", "a/b").replace("*", "x")
+        target = message
+        for parent in parents:
+            target = getattr(target, parent)
+        setattr(target, name, value)
+    return message
+
+
+def _transcode_both(transcoder, message):
+    expected = path_template.transcode(transcoder.http_options, message)
+    assert transcoder.transcode(message) == expected
+    return expected
+
+
+@pytest.mark.parametrize("name,stub", _STUBS, ids=[name for name, _ in _STUBS])
+def test_matches_path_template(name, stub):
+    transcoder = stub._TRANSCODER
+    message = _fill(_request(stub), transcoder.http_options[0]["uri"])
+
+    transcoded = _transcode_both(transcoder, message)
+
+    assert transcoded["uri"].startswith("/v2/projects/x/locations/x")
+
+
+@pytest.mark.parametrize("name,stub", _STUBS, ids=[name for name, _ in _STUBS])
+def test_mismatch_raises_path_template_error(name, stub):
+    with pytest.raises(ValueError) as expected:
+        path_template.transcode(stub._TRANSCODER.http_options, _request(stub))
+
+    with pytest.raises(ValueError, match=re.escape(str(expected.value))):
+        stub._TRANSCODER.transcode(_request(stub))
+
+
+def test_query_params_and_body():
+    transcoder = rest.CloudTasksRestTransport._CreateQueue._TRANSCODER
+    request = cloudtasks.CreateQueueRequest(
+        parent="projects/p/locations/l",
+        queue=queue.Queue(name="projects/p/locations/l/queues/q"),
+    )
+
+    transcoded = _transcode_both(transcoder, cloudtasks.CreateQueueRequest.pb(request))
+
+    assert transcoded["method"] == "post"
+    assert transcoded["uri"] == "/v2/projects/p/locations/l/queues"
+    assert transcoded["body"].name == "projects/p/locations/l/queues/q"
+    assert not transcoded["query_params"].ListFields()
+
+    transcoder = rest.CloudTasksRestTransport._ListTasks._TRANSCODER
+    request = cloudtasks.ListTasksRequest(
+        parent="projects/p/locations/l/queues/q", page_size=7, page_token="t"
+    )
+    transcoded = _transcode_both(transcoder, cloudtasks.ListTasksRequest.pb(request))
+    assert transcoded["query_params"].page_size == 7
+    assert transcoded["query_params"].parent == ""
+
+
+def test_later_rule_used_when_earlier_does_not_match():
+    transcoder = transcoding.Transcoder(
+        [
+            {"method": "get", "uri": "/v1/{name=shelves/*}"},
+            {"method": "post", "uri": "/v1/{name=books/**}:read", "body": "*"},
+        ]
+    )
+    request = cloudtasks.GetQueueRequest.pb(
+        cloudtasks.GetQueueRequest(name="books/a/b/c")
+    )
+
+    transcoded = _transcode_both(transcoder, request)
+
+    assert (transcoded["method"], transcoded["uri"]) == ("post", "/v1/books/a/b/c:read")
+
+
+def test_positional_wildcards_left_to_path_template():
+    transcoder = transcoding.Transcoder([{"method": "get", "uri": "/v1/*/{name}"}])
+    request = cloudtasks.GetQueueRequest.pb(cloudtasks.GetQueueRequest(name="q"))
+
+    with mock.patch.object(path_template, "transcode") as slow:
+        assert transcoder.transcode(request) is slow.return_value
+
+    slow.assert_called_once_with(transcoder.http_options, request)
+
+
+def test_rules_compiled_once():
+    transcoder = transcoding.Transcoder(
+        [{"method": "get", "uri": "/v2/{name=projects/*/locations/*/queues/*}"}]
+    )
+    request = cloudtasks.GetQueueRequest.pb(
+        cloudtasks.GetQueueRequest(name="projects/p/locations/l/queues/q")
+    )
+
+    with mock.patch.object(
+        transcoding, "_Rule", wraps=transcoding._Rule
+    ) as rule, mock.patch.object(path_template, "transcode") as slow:
+        for _ in range(3):
+            assert transcoder.transcode(request)["uri"] == (
+                "/v2/projects/p/locations/l/queues/q"
+            )
+
+    assert rule.call_count == 1
+    slow.assert_not_called()
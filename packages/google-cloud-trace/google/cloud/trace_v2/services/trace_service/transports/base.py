@@ -25,6 +25,7 @@ from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.trace_helpers import wrapping
 from google.cloud.trace_v2 import gapic_version as package_version
 from google.cloud.trace_v2.types import trace, tracing
 
@@ -124,39 +125,42 @@ class TraceServiceTransport(abc.ABC):
         self._host = host
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.batch_write_spans: gapic_v1.method.wrap_method(
-                self.batch_write_spans,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=30.0,
-                    multiplier=2,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "batch_write_spans": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=30.0,
+                        multiplier=2,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
+                    default_timeout=120.0,
+                    client_info=client_info,
                 ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_span: gapic_v1.method.wrap_method(
-                self.create_span,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=1.0,
-                    multiplier=1.2,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
+                "create_span": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=0.1,
+                        maximum=1.0,
+                        multiplier=1.2,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.DeadlineExceeded,
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
+                    default_timeout=120.0,
+                    client_info=client_info,
                 ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-        }
+            },
+        )
 
     def close(self):
         """Closes resources associated with the transport.
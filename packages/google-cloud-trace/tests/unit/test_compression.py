@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import gzip
+import json
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+import grpc
+from requests import Request, Response
+from requests.sessions import Session
+
+from google.cloud.trace_helpers import compression
+from google.cloud.trace_v2 import TraceServiceClient
+from google.cloud.trace_v2.types import trace
+
+_PROJECT = "projects/p"
+
+
+def _spans(display_name_size):
+    return [
+        trace.Span(
+            name=_PROJECT + "/traces/t/spans/s",
+            display_name=trace.TruncatableString(value="x" * display_name_size),
+        )
+    ]
+
+
+def test_grpc_large_requests_are_compressed(server, grpc_client):
+    client = grpc_client(compression.Compression(methods=["batch_write_spans"]))
+
+    client.batch_write_spans(name=_PROJECT, spans=_spans(4096))
+    client.batch_write_spans(name=_PROJECT, spans=_spans(16))
+    client.create_span(request=_spans(4096)[0])
+
+    assert server.calls[0]["compression"] == grpc.Compression.Gzip
+    assert "compression" not in server.calls[1]
+    assert "compression" not in server.calls[2]
+
+
+def test_rest_large_bodies_are_compressed():
+    client = TraceServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+    compression.Compression(methods=["batch_write_spans"]).attach(client.transport)
+    response = Response()
+    response.status_code = 200
+    response._content = b"{}"
+    response.request = Request("POST", "https://example.com").prepare()
+
+    with mock.patch.object(Session, "request", return_value=response) as request:
+        client.batch_write_spans(name=_PROJECT, spans=_spans(4096))
+
+    kwargs = request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert (
+        json.loads(gzip.decompress(kwargs["data"]))["spans"][0]["displayName"]["value"]
+        == "x" * 4096
+    )
+
+
+def test_async_large_requests_are_compressed(server, async_client):
+    async def main():
+        client = async_client(
+            compression.Compression(methods=["batch_write_spans"]),
+            methods=["batch_write_spans"],
+        )
+        await client.batch_write_spans(name=_PROJECT, spans=_spans(4096))
+
+    asyncio.run(main())
+
+    assert server.calls[0]["compression"] == grpc.Compression.Gzip
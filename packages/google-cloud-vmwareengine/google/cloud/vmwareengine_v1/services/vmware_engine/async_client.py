@@ -52,6 +52,7 @@ from google.protobuf import empty_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.vmwareengine_helpers import fanout
 from google.cloud.vmwareengine_v1.services.vmware_engine import pagers
 from google.cloud.vmwareengine_v1.types import vmwareengine, vmwareengine_resources
 
@@ -60,7 +61,7 @@ from .transports.base import DEFAULT_CLIENT_INFO, VmwareEngineTransport
 from .transports.grpc_asyncio import VmwareEngineGrpcAsyncIOTransport
 
 
-class VmwareEngineAsyncClient:
+class VmwareEngineAsyncClient(fanout.AsyncFanOutMixin):
     """VMwareEngine manages VMware's private clusters in the Cloud."""
 
     _client: VmwareEngineClient
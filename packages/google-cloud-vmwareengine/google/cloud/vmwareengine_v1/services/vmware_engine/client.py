@@ -56,6 +56,7 @@ from google.protobuf import empty_pb2  # type: ignore
 from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
+from google.cloud.vmwareengine_helpers import fanout, resource_names
 from google.cloud.vmwareengine_v1.services.vmware_engine import pagers
 from google.cloud.vmwareengine_v1.types import vmwareengine, vmwareengine_resources
 
@@ -100,7 +101,7 @@ class VmwareEngineClientMeta(type):
         return next(iter(cls._transport_registry.values()))
 
 
-class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
+class VmwareEngineClient(fanout.FanOutMixin, metaclass=VmwareEngineClientMeta):
     """VMwareEngine manages VMware's private clusters in the Cloud."""
 
     @staticmethod
@@ -193,21 +194,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         cluster: str,
     ) -> str:
         """Returns a fully-qualified cluster string."""
-        return "projects/{project}/locations/{location}/privateClouds/{private_cloud}/clusters/{cluster}".format(
-            project=project,
-            location=location,
-            private_cloud=private_cloud,
-            cluster=cluster,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/clusters/{cluster}"
+        ).format(project, location, private_cloud, cluster)
 
     @staticmethod
     def parse_cluster_path(path: str) -> Dict[str, str]:
         """Parses a cluster path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/privateClouds/(?P<private_cloud>.+?)/clusters/(?P<cluster>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/clusters/{cluster}"
+        ).parse(path)
 
     @staticmethod
     def dns_bind_permission_path(
@@ -215,19 +211,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified dns_bind_permission string."""
-        return "projects/{project}/locations/{location}/dnsBindPermission".format(
-            project=project,
-            location=location,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/dnsBindPermission"
+        ).format(project, location)
 
     @staticmethod
     def parse_dns_bind_permission_path(path: str) -> Dict[str, str]:
         """Parses a dns_bind_permission path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/dnsBindPermission$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/dnsBindPermission"
+        ).parse(path)
 
     @staticmethod
     def dns_forwarding_path(
@@ -236,20 +229,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         private_cloud: str,
     ) -> str:
         """Returns a fully-qualified dns_forwarding string."""
-        return "projects/{project}/locations/{location}/privateClouds/{private_cloud}/dnsForwarding".format(
-            project=project,
-            location=location,
-            private_cloud=private_cloud,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/dnsForwarding"
+        ).format(project, location, private_cloud)
 
     @staticmethod
     def parse_dns_forwarding_path(path: str) -> Dict[str, str]:
         """Parses a dns_forwarding path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/privateClouds/(?P<private_cloud>.+?)/dnsForwarding$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/dnsForwarding"
+        ).parse(path)
 
     @staticmethod
     def external_access_rule_path(
@@ -259,21 +248,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         external_access_rule: str,
     ) -> str:
         """Returns a fully-qualified external_access_rule string."""
-        return "projects/{project}/locations/{location}/networkPolicies/{network_policy}/externalAccessRules/{external_access_rule}".format(
-            project=project,
-            location=location,
-            network_policy=network_policy,
-            external_access_rule=external_access_rule,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/networkPolicies/{network_policy}/externalAccessRules/{external_access_rule}"
+        ).format(project, location, network_policy, external_access_rule)
 
     @staticmethod
     def parse_external_access_rule_path(path: str) -> Dict[str, str]:
         """Parses a external_access_rule path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/networkPolicies/(?P<network_policy>.+?)/externalAccessRules/(?P<external_access_rule>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/networkPolicies/{network_policy}/externalAccessRules/{external_access_rule}"
+        ).parse(path)
 
     @staticmethod
     def external_address_path(
@@ -283,21 +267,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         external_address: str,
     ) -> str:
         """Returns a fully-qualified external_address string."""
-        return "projects/{project}/locations/{location}/privateClouds/{private_cloud}/externalAddresses/{external_address}".format(
-            project=project,
-            location=location,
-            private_cloud=private_cloud,
-            external_address=external_address,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/externalAddresses/{external_address}"
+        ).format(project, location, private_cloud, external_address)
 
     @staticmethod
     def parse_external_address_path(path: str) -> Dict[str, str]:
         """Parses a external_address path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/privateClouds/(?P<private_cloud>.+?)/externalAddresses/(?P<external_address>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/externalAddresses/{external_address}"
+        ).parse(path)
 
     @staticmethod
     def hcx_activation_key_path(
@@ -307,21 +286,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         hcx_activation_key: str,
     ) -> str:
         """Returns a fully-qualified hcx_activation_key string."""
-        return "projects/{project}/locations/{location}/privateClouds/{private_cloud}/hcxActivationKeys/{hcx_activation_key}".format(
-            project=project,
-            location=location,
-            private_cloud=private_cloud,
-            hcx_activation_key=hcx_activation_key,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/hcxActivationKeys/{hcx_activation_key}"
+        ).format(project, location, private_cloud, hcx_activation_key)
 
     @staticmethod
     def parse_hcx_activation_key_path(path: str) -> Dict[str, str]:
         """Parses a hcx_activation_key path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/privateClouds/(?P<private_cloud>.+?)/hcxActivationKeys/(?P<hcx_activation_key>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/hcxActivationKeys/{hcx_activation_key}"
+        ).parse(path)
 
     @staticmethod
     def logging_server_path(
@@ -331,21 +305,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         logging_server: str,
     ) -> str:
         """Returns a fully-qualified logging_server string."""
-        return "projects/{project}/locations/{location}/privateClouds/{private_cloud}/loggingServers/{logging_server}".format(
-            project=project,
-            location=location,
-            private_cloud=private_cloud,
-            logging_server=logging_server,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/loggingServers/{logging_server}"
+        ).format(project, location, private_cloud, logging_server)
 
     @staticmethod
     def parse_logging_server_path(path: str) -> Dict[str, str]:
         """Parses a logging_server path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/privateClouds/(?P<private_cloud>.+?)/loggingServers/(?P<logging_server>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/loggingServers/{logging_server}"
+        ).parse(path)
 
     @staticmethod
     def management_dns_zone_binding_path(
@@ -355,21 +324,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         management_dns_zone_binding: str,
     ) -> str:
         """Returns a fully-qualified management_dns_zone_binding string."""
-        return "projects/{project}/locations/{location}/privateClouds/{private_cloud}/managementDnsZoneBindings/{management_dns_zone_binding}".format(
-            project=project,
-            location=location,
-            private_cloud=private_cloud,
-            management_dns_zone_binding=management_dns_zone_binding,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/managementDnsZoneBindings/{management_dns_zone_binding}"
+        ).format(project, location, private_cloud, management_dns_zone_binding)
 
     @staticmethod
     def parse_management_dns_zone_binding_path(path: str) -> Dict[str, str]:
         """Parses a management_dns_zone_binding path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/privateClouds/(?P<private_cloud>.+?)/managementDnsZoneBindings/(?P<management_dns_zone_binding>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/managementDnsZoneBindings/{management_dns_zone_binding}"
+        ).parse(path)
 
     @staticmethod
     def network_path(
@@ -377,18 +341,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         network: str,
     ) -> str:
         """Returns a fully-qualified network string."""
-        return "projects/{project}/global/networks/{network}".format(
-            project=project,
-            network=network,
-        )
+        return resource_names.get(
+            "projects/{project}/global/networks/{network}"
+        ).format(project, network)
 
     @staticmethod
     def parse_network_path(path: str) -> Dict[str, str]:
         """Parses a network path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/global/networks/(?P<network>.+?)$", path
+        return resource_names.get("projects/{project}/global/networks/{network}").parse(
+            path
         )
-        return m.groupdict() if m else {}
 
     @staticmethod
     def network_peering_path(
@@ -397,20 +359,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         network_peering: str,
     ) -> str:
         """Returns a fully-qualified network_peering string."""
-        return "projects/{project}/locations/{location}/networkPeerings/{network_peering}".format(
-            project=project,
-            location=location,
-            network_peering=network_peering,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/networkPeerings/{network_peering}"
+        ).format(project, location, network_peering)
 
     @staticmethod
     def parse_network_peering_path(path: str) -> Dict[str, str]:
         """Parses a network_peering path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/networkPeerings/(?P<network_peering>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/networkPeerings/{network_peering}"
+        ).parse(path)
 
     @staticmethod
     def network_policy_path(
@@ -419,20 +377,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         network_policy: str,
     ) -> str:
         """Returns a fully-qualified network_policy string."""
-        return "projects/{project}/locations/{location}/networkPolicies/{network_policy}".format(
-            project=project,
-            location=location,
-            network_policy=network_policy,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/networkPolicies/{network_policy}"
+        ).format(project, location, network_policy)
 
     @staticmethod
     def parse_network_policy_path(path: str) -> Dict[str, str]:
         """Parses a network_policy path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/networkPolicies/(?P<network_policy>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/networkPolicies/{network_policy}"
+        ).parse(path)
 
     @staticmethod
     def node_path(
@@ -443,22 +397,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         node: str,
     ) -> str:
         """Returns a fully-qualified node string."""
-        return "projects/{project}/locations/{location}/privateClouds/{private_cloud}/clusters/{cluster}/nodes/{node}".format(
-            project=project,
-            location=location,
-            private_cloud=private_cloud,
-            cluster=cluster,
-            node=node,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/clusters/{cluster}/nodes/{node}"
+        ).format(project, location, private_cloud, cluster, node)
 
     @staticmethod
     def parse_node_path(path: str) -> Dict[str, str]:
         """Parses a node path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/privateClouds/(?P<private_cloud>.+?)/clusters/(?P<cluster>.+?)/nodes/(?P<node>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/clusters/{cluster}/nodes/{node}"
+        ).parse(path)
 
     @staticmethod
     def node_type_path(
@@ -467,20 +415,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         node_type: str,
     ) -> str:
         """Returns a fully-qualified node_type string."""
-        return "projects/{project}/locations/{location}/nodeTypes/{node_type}".format(
-            project=project,
-            location=location,
-            node_type=node_type,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/nodeTypes/{node_type}"
+        ).format(project, location, node_type)
 
     @staticmethod
     def parse_node_type_path(path: str) -> Dict[str, str]:
         """Parses a node_type path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/nodeTypes/(?P<node_type>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/nodeTypes/{node_type}"
+        ).parse(path)
 
     @staticmethod
     def private_cloud_path(
@@ -489,20 +433,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         private_cloud: str,
     ) -> str:
         """Returns a fully-qualified private_cloud string."""
-        return "projects/{project}/locations/{location}/privateClouds/{private_cloud}".format(
-            project=project,
-            location=location,
-            private_cloud=private_cloud,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}"
+        ).format(project, location, private_cloud)
 
     @staticmethod
     def parse_private_cloud_path(path: str) -> Dict[str, str]:
         """Parses a private_cloud path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/privateClouds/(?P<private_cloud>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}"
+        ).parse(path)
 
     @staticmethod
     def private_connection_path(
@@ -511,20 +451,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         private_connection: str,
     ) -> str:
         """Returns a fully-qualified private_connection string."""
-        return "projects/{project}/locations/{location}/privateConnections/{private_connection}".format(
-            project=project,
-            location=location,
-            private_connection=private_connection,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateConnections/{private_connection}"
+        ).format(project, location, private_connection)
 
     @staticmethod
     def parse_private_connection_path(path: str) -> Dict[str, str]:
         """Parses a private_connection path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/privateConnections/(?P<private_connection>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateConnections/{private_connection}"
+        ).parse(path)
 
     @staticmethod
     def subnet_path(
@@ -534,21 +470,16 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         subnet: str,
     ) -> str:
         """Returns a fully-qualified subnet string."""
-        return "projects/{project}/locations/{location}/privateClouds/{private_cloud}/subnets/{subnet}".format(
-            project=project,
-            location=location,
-            private_cloud=private_cloud,
-            subnet=subnet,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/subnets/{subnet}"
+        ).format(project, location, private_cloud, subnet)
 
     @staticmethod
     def parse_subnet_path(path: str) -> Dict[str, str]:
         """Parses a subnet path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/privateClouds/(?P<private_cloud>.+?)/subnets/(?P<subnet>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/privateClouds/{private_cloud}/subnets/{subnet}"
+        ).parse(path)
 
     @staticmethod
     def vmware_engine_network_path(
@@ -557,80 +488,66 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         vmware_engine_network: str,
     ) -> str:
         """Returns a fully-qualified vmware_engine_network string."""
-        return "projects/{project}/locations/{location}/vmwareEngineNetworks/{vmware_engine_network}".format(
-            project=project,
-            location=location,
-            vmware_engine_network=vmware_engine_network,
-        )
+        return resource_names.get(
+            "projects/{project}/locations/{location}/vmwareEngineNetworks/{vmware_engine_network}"
+        ).format(project, location, vmware_engine_network)
 
     @staticmethod
     def parse_vmware_engine_network_path(path: str) -> Dict[str, str]:
         """Parses a vmware_engine_network path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/vmwareEngineNetworks/(?P<vmware_engine_network>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return resource_names.get(
+            "projects/{project}/locations/{location}/vmwareEngineNetworks/{vmware_engine_network}"
+        ).parse(path)
 
     @staticmethod
     def common_billing_account_path(
         billing_account: str,
     ) -> str:
         """Returns a fully-qualified billing_account string."""
-        return "billingAccounts/{billing_account}".format(
-            billing_account=billing_account,
+        return resource_names.get("billingAccounts/{billing_account}").format(
+            billing_account
         )
 
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("billingAccounts/{billing_account}").parse(path)
 
     @staticmethod
     def common_folder_path(
         folder: str,
     ) -> str:
         """Returns a fully-qualified folder string."""
-        return "folders/{folder}".format(
-            folder=folder,
-        )
+        return resource_names.get("folders/{folder}").format(folder)
 
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("folders/{folder}").parse(path)
 
     @staticmethod
     def common_organization_path(
         organization: str,
     ) -> str:
         """Returns a fully-qualified organization string."""
-        return "organizations/{organization}".format(
-            organization=organization,
-        )
+        return resource_names.get("organizations/{organization}").format(organization)
 
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("organizations/{organization}").parse(path)
 
     @staticmethod
     def common_project_path(
         project: str,
     ) -> str:
         """Returns a fully-qualified project string."""
-        return "projects/{project}".format(
-            project=project,
-        )
+        return resource_names.get("projects/{project}").format(project)
 
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}").parse(path)
 
     @staticmethod
     def common_location_path(
@@ -638,16 +555,14 @@ class VmwareEngineClient(metaclass=VmwareEngineClientMeta):
         location: str,
     ) -> str:
         """Returns a fully-qualified location string."""
-        return "projects/{project}/locations/{location}".format(
-            project=project,
-            location=location,
+        return resource_names.get("projects/{project}/locations/{location}").format(
+            project, location
         )
 
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return resource_names.get("projects/{project}/locations/{location}").parse(path)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -28,6 +28,7 @@ from google.iam.v1 import policy_pb2  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.vmwareengine_helpers import forking, wrapping
 from google.cloud.vmwareengine_v1 import gapic_version as package_version
 from google.cloud.vmwareengine_v1.types import vmwareengine, vmwareengine_resources
 
@@ -122,687 +123,711 @@ class VmwareEngineTransport(abc.ABC):
         if ":" not in host:
             host += ":443"
         self._host = host
+        # Set by the transports that open their own channel or session.
+        self._connect: Optional[Callable[[], None]] = None
+        self._fork_guard = forking.ForkGuard(self._after_fork)
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.list_private_clouds: gapic_v1.method.wrap_method(
-                self.list_private_clouds,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+        # Wrap each method on first use rather than all of them up front.
+        self._lazy_wrapped_methods = wrapping.LazyWrappedMethods(
+            self,
+            {
+                "list_private_clouds": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.get_private_cloud: gapic_v1.method.wrap_method(
-                self.get_private_cloud,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "get_private_cloud": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_private_cloud: gapic_v1.method.wrap_method(
-                self.create_private_cloud,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_private_cloud: gapic_v1.method.wrap_method(
-                self.update_private_cloud,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_private_cloud: gapic_v1.method.wrap_method(
-                self.delete_private_cloud,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.undelete_private_cloud: gapic_v1.method.wrap_method(
-                self.undelete_private_cloud,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_clusters: gapic_v1.method.wrap_method(
-                self.list_clusters,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "create_private_cloud": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_private_cloud": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_private_cloud": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "undelete_private_cloud": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_clusters": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.get_cluster: gapic_v1.method.wrap_method(
-                self.get_cluster,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "get_cluster": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_cluster: gapic_v1.method.wrap_method(
-                self.create_cluster,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_cluster: gapic_v1.method.wrap_method(
-                self.update_cluster,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_cluster: gapic_v1.method.wrap_method(
-                self.delete_cluster,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_nodes: gapic_v1.method.wrap_method(
-                self.list_nodes,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "create_cluster": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_cluster": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_cluster": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_nodes": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.get_node: gapic_v1.method.wrap_method(
-                self.get_node,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "get_node": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.list_external_addresses: gapic_v1.method.wrap_method(
-                self.list_external_addresses,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "list_external_addresses": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.fetch_network_policy_external_addresses: gapic_v1.method.wrap_method(
-                self.fetch_network_policy_external_addresses,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_external_address: gapic_v1.method.wrap_method(
-                self.get_external_address,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "fetch_network_policy_external_addresses": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_external_address": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_external_address: gapic_v1.method.wrap_method(
-                self.create_external_address,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_external_address: gapic_v1.method.wrap_method(
-                self.update_external_address,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_external_address: gapic_v1.method.wrap_method(
-                self.delete_external_address,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_subnets: gapic_v1.method.wrap_method(
-                self.list_subnets,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "create_external_address": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_external_address": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_external_address": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_subnets": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.get_subnet: gapic_v1.method.wrap_method(
-                self.get_subnet,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "get_subnet": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.update_subnet: gapic_v1.method.wrap_method(
-                self.update_subnet,
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_external_access_rules: gapic_v1.method.wrap_method(
-                self.list_external_access_rules,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "update_subnet": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=60.0,
+                    client_info=client_info,
+                ),
+                "list_external_access_rules": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.get_external_access_rule: gapic_v1.method.wrap_method(
-                self.get_external_access_rule,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "get_external_access_rule": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_external_access_rule: gapic_v1.method.wrap_method(
-                self.create_external_access_rule,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_external_access_rule: gapic_v1.method.wrap_method(
-                self.update_external_access_rule,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_external_access_rule: gapic_v1.method.wrap_method(
-                self.delete_external_access_rule,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_logging_servers: gapic_v1.method.wrap_method(
-                self.list_logging_servers,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "create_external_access_rule": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_external_access_rule": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_external_access_rule": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_logging_servers": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.get_logging_server: gapic_v1.method.wrap_method(
-                self.get_logging_server,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "get_logging_server": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_logging_server: gapic_v1.method.wrap_method(
-                self.create_logging_server,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_logging_server: gapic_v1.method.wrap_method(
-                self.update_logging_server,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_logging_server: gapic_v1.method.wrap_method(
-                self.delete_logging_server,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_node_types: gapic_v1.method.wrap_method(
-                self.list_node_types,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "create_logging_server": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_logging_server": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_logging_server": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_node_types": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.get_node_type: gapic_v1.method.wrap_method(
-                self.get_node_type,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "get_node_type": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.show_nsx_credentials: gapic_v1.method.wrap_method(
-                self.show_nsx_credentials,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "show_nsx_credentials": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.show_vcenter_credentials: gapic_v1.method.wrap_method(
-                self.show_vcenter_credentials,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "show_vcenter_credentials": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.reset_nsx_credentials: gapic_v1.method.wrap_method(
-                self.reset_nsx_credentials,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.reset_vcenter_credentials: gapic_v1.method.wrap_method(
-                self.reset_vcenter_credentials,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_dns_forwarding: gapic_v1.method.wrap_method(
-                self.get_dns_forwarding,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "reset_nsx_credentials": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "reset_vcenter_credentials": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_dns_forwarding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.update_dns_forwarding: gapic_v1.method.wrap_method(
-                self.update_dns_forwarding,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_network_peering: gapic_v1.method.wrap_method(
-                self.get_network_peering,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "update_dns_forwarding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_network_peering": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.list_network_peerings: gapic_v1.method.wrap_method(
-                self.list_network_peerings,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "list_network_peerings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_network_peering: gapic_v1.method.wrap_method(
-                self.create_network_peering,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_network_peering: gapic_v1.method.wrap_method(
-                self.delete_network_peering,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_network_peering: gapic_v1.method.wrap_method(
-                self.update_network_peering,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_peering_routes: gapic_v1.method.wrap_method(
-                self.list_peering_routes,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "create_network_peering": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_network_peering": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_network_peering": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_peering_routes": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_hcx_activation_key: gapic_v1.method.wrap_method(
-                self.create_hcx_activation_key,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_hcx_activation_keys: gapic_v1.method.wrap_method(
-                self.list_hcx_activation_keys,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "create_hcx_activation_key": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_hcx_activation_keys": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.get_hcx_activation_key: gapic_v1.method.wrap_method(
-                self.get_hcx_activation_key,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "get_hcx_activation_key": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.get_network_policy: gapic_v1.method.wrap_method(
-                self.get_network_policy,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "get_network_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.list_network_policies: gapic_v1.method.wrap_method(
-                self.list_network_policies,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "list_network_policies": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_network_policy: gapic_v1.method.wrap_method(
-                self.create_network_policy,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_network_policy: gapic_v1.method.wrap_method(
-                self.update_network_policy,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_network_policy: gapic_v1.method.wrap_method(
-                self.delete_network_policy,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_management_dns_zone_bindings: gapic_v1.method.wrap_method(
-                self.list_management_dns_zone_bindings,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "create_network_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_network_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_network_policy": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_management_dns_zone_bindings": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.get_management_dns_zone_binding: gapic_v1.method.wrap_method(
-                self.get_management_dns_zone_binding,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "get_management_dns_zone_binding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_management_dns_zone_binding: gapic_v1.method.wrap_method(
-                self.create_management_dns_zone_binding,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_management_dns_zone_binding: gapic_v1.method.wrap_method(
-                self.update_management_dns_zone_binding,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_management_dns_zone_binding: gapic_v1.method.wrap_method(
-                self.delete_management_dns_zone_binding,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.repair_management_dns_zone_binding: gapic_v1.method.wrap_method(
-                self.repair_management_dns_zone_binding,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_vmware_engine_network: gapic_v1.method.wrap_method(
-                self.create_vmware_engine_network,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_vmware_engine_network: gapic_v1.method.wrap_method(
-                self.update_vmware_engine_network,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_vmware_engine_network: gapic_v1.method.wrap_method(
-                self.delete_vmware_engine_network,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_vmware_engine_network: gapic_v1.method.wrap_method(
-                self.get_vmware_engine_network,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "create_management_dns_zone_binding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_management_dns_zone_binding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_management_dns_zone_binding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "repair_management_dns_zone_binding": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "create_vmware_engine_network": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "update_vmware_engine_network": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_vmware_engine_network": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_vmware_engine_network": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.list_vmware_engine_networks: gapic_v1.method.wrap_method(
-                self.list_vmware_engine_networks,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "list_vmware_engine_networks": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.create_private_connection: gapic_v1.method.wrap_method(
-                self.create_private_connection,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_private_connection: gapic_v1.method.wrap_method(
-                self.get_private_connection,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "create_private_connection": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_private_connection": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.list_private_connections: gapic_v1.method.wrap_method(
-                self.list_private_connections,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "list_private_connections": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.update_private_connection: gapic_v1.method.wrap_method(
-                self.update_private_connection,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_private_connection: gapic_v1.method.wrap_method(
-                self.delete_private_connection,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.list_private_connection_peering_routes: gapic_v1.method.wrap_method(
-                self.list_private_connection_peering_routes,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "update_private_connection": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "delete_private_connection": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "list_private_connection_peering_routes": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.grant_dns_bind_permission: gapic_v1.method.wrap_method(
-                self.grant_dns_bind_permission,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.get_dns_bind_permission: gapic_v1.method.wrap_method(
-                self.get_dns_bind_permission,
-                default_retry=retries.Retry(
-                    initial=1.0,
-                    maximum=10.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "grant_dns_bind_permission": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+                "get_dns_bind_permission": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_retry=retries.Retry(
+                        initial=1.0,
+                        maximum=10.0,
+                        multiplier=1.3,
+                        predicate=retries.if_exception_type(
+                            core_exceptions.ServiceUnavailable,
+                        ),
+                        deadline=120.0,
                     ),
-                    deadline=120.0,
-                ),
-                default_timeout=120.0,
-                client_info=client_info,
-            ),
-            self.revoke_dns_bind_permission: gapic_v1.method.wrap_method(
-                self.revoke_dns_bind_permission,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+                    default_timeout=120.0,
+                    client_info=client_info,
+                ),
+                "revoke_dns_bind_permission": lambda method: gapic_v1.method.wrap_method(
+                    method,
+                    default_timeout=None,
+                    client_info=client_info,
+                ),
+            },
+        )
+
+    @property
+    def _wrapped_methods(self) -> wrapping.LazyWrappedMethods:
+        # Clients look their methods up here on every call.
+        self._fork_guard.check()
+        return self._lazy_wrapped_methods
+
+    @_wrapped_methods.setter
+    def _wrapped_methods(self, wrapped_methods) -> None:
+        self._lazy_wrapped_methods = wrapped_methods
+
+    def _after_fork(self) -> None:
+        # Called on the first lookup in a process forked after the
+        # transport was created. Channels given by the caller are theirs
+        # to replace.
+        if self._connect is not None:
+            self._connect()
+            self._lazy_wrapped_methods.clear()
 
     def close(self):
         """Closes resources associated with the transport.
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.vmwareengine_helpers import caching
+from google.cloud.vmwareengine_v1.types import vmwareengine, vmwareengine_resources
+
+_NAME = "projects/p/locations/l/privateClouds/pc"
+
+
+def _credentials(caller):
+    credentials = ga_credentials.AnonymousCredentials()
+    credentials.service_account_email = caller
+    return credentials
+
+
+def test_repeated_call_is_answered_from_cache(server, grpc_client):
+    cache = caching.ResponseCache()
+    client = grpc_client(cache)
+
+    first = client.get_private_cloud(name=_NAME)
+    second = client.get_private_cloud(name=_NAME)
+    client.get_private_cloud(name=_NAME + "2")
+
+    assert first == second
+    assert second.state == vmwareengine_resources.PrivateCloud.State.ACTIVE
+    assert len(server.requests) == 2
+    assert cache.stats() == {
+        "get_private_cloud": {"hits": 1, "misses": 2, "negative_hits": 0}
+    }
+
+
+@pytest.mark.parametrize("ttls,rpcs", [({}, 4), ({"list_private_clouds": 10.0}, 2)])
+def test_only_get_methods_cached_by_default(ttls, rpcs, server, grpc_client):
+    cache = caching.ResponseCache(ttls=ttls)
+    client = grpc_client(cache)
+
+    for _ in range(2):
+        clouds = client.list_private_clouds(parent="projects/p/locations/l")
+        assert [c.name for c in clouds] == ["a", "b", "c"]
+
+    assert len(server.requests) == rpcs
+
+
+def test_not_found_cached_for_negative_ttl(server, grpc_client):
+    cache = caching.ResponseCache(negative_ttl=10.0)
+    server.error = core_exceptions.NotFound("no such private cloud")
+    client = grpc_client(cache)
+
+    for _ in range(2):
+        with pytest.raises(core_exceptions.NotFound):
+            client.get_private_cloud(name=_NAME)
+
+    assert len(server.requests) == 1
+
+
+def test_transports_of_other_callers_do_not_share(server, grpc_client):
+    cache = caching.ResponseCache()
+    client = grpc_client(cache, credentials=_credentials("a@p.iam.gserviceaccount.com"))
+    other_client = grpc_client(
+        cache, credentials=_credentials("b@p.iam.gserviceaccount.com")
+    )
+
+    client.get_private_cloud(name=_NAME)
+    other_client.get_private_cloud(name=_NAME)
+    client.get_private_cloud(name=_NAME)
+
+    assert len(server.requests) == 2
+
+
+def test_invalidate(server, grpc_client):
+    cache = caching.ResponseCache()
+    client = grpc_client(cache)
+
+    client.get_private_cloud(name=_NAME)
+    cache.invalidate(
+        "get_private_cloud", vmwareengine.GetPrivateCloudRequest(name=_NAME)
+    )
+    client.get_private_cloud(name=_NAME)
+
+    assert len(server.requests) == 2
+
+
+def test_disk_entries_decoded_as_service_types(tmp_path, server, grpc_client):
+    path = str(tmp_path / "cache.sqlite")
+    credentials = _credentials("a@p.iam.gserviceaccount.com")
+    grpc_client(
+        caching.ResponseCache(caching.DiskBackend(path)), credentials=credentials
+    ).get_private_cloud(name=_NAME)
+
+    # A new cache on the same file, as after a restart.
+    cache = caching.ResponseCache(caching.DiskBackend(path))
+    client = grpc_client(cache, credentials=credentials)
+    response = client.get_private_cloud(name=_NAME)
+
+    assert isinstance(response, vmwareengine_resources.PrivateCloud)
+    assert response.name == _NAME
+    assert len(server.requests) == 1
+
+
+def test_async_repeated_call_is_answered_from_cache(server, async_client):
+    cache = caching.ResponseCache()
+
+    async def main():
+        client = async_client(cache)
+        return [await client.get_private_cloud(name=_NAME) for _ in range(3)]
+
+    responses = asyncio.run(main())
+
+    assert [r.name for r in responses] == [_NAME] * 3
+    assert len(server.requests) == 1
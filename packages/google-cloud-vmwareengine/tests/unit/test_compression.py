@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import gzip
+import json
+from unittest import mock
+
+from google.auth import credentials as ga_credentials
+import grpc
+from requests import Request, Response
+from requests.sessions import Session
+
+from google.cloud.vmwareengine_helpers import compression
+from google.cloud.vmwareengine_v1 import VmwareEngineClient
+from google.cloud.vmwareengine_v1.types import vmwareengine_resources
+
+_PARENT = "projects/p/locations/l"
+
+
+def _private_cloud(description_size):
+    return vmwareengine_resources.PrivateCloud(description="x" * description_size)
+
+
+def test_grpc_large_requests_are_compressed(server, grpc_client):
+    client = grpc_client(compression.Compression(methods=["create_private_cloud"]))
+
+    for size in (4096, 16):
+        client.create_private_cloud(
+            parent=_PARENT, private_cloud=_private_cloud(size), private_cloud_id="pc"
+        )
+    client.get_private_cloud(name=_PARENT + "/privateClouds/" + "x" * 4096)
+
+    assert server.calls[0]["compression"] == grpc.Compression.Gzip
+    assert "compression" not in server.calls[1]
+    assert "compression" not in server.calls[2]
+
+
+def test_rest_large_bodies_are_compressed():
+    client = VmwareEngineClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+    compression.Compression(methods=["create_private_cloud"]).attach(client.transport)
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"name": "op"}'
+    response.request = Request("POST", "https://example.com").prepare()
+
+    with mock.patch.object(Session, "request", return_value=response) as request:
+        client.create_private_cloud(
+            parent=_PARENT, private_cloud=_private_cloud(4096), private_cloud_id="pc"
+        )
+
+    kwargs = request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"]))["description"] == "x" * 4096
+
+
+def test_async_large_requests_are_compressed(server, async_client):
+    async def main():
+        client = async_client(
+            compression.Compression(methods=["create_private_cloud"]),
+            methods=["create_private_cloud"],
+        )
+        await client.create_private_cloud(
+            parent=_PARENT, private_cloud=_private_cloud(4096), private_cloud_id="pc"
+        )
+
+    asyncio.run(main())
+
+    assert server.calls[0]["compression"] == grpc.Compression.Gzip
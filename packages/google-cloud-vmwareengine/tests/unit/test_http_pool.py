@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import socket
+
+from google.auth import credentials as ga_credentials
+import pytest
+from requests import adapters
+
+from google.cloud.vmwareengine_helpers import http_pool
+from google.cloud.vmwareengine_v1.services.vmware_engine import transports
+
+
+def _transport(**kwargs):
+    return transports.VmwareEngineRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), **kwargs
+    )
+
+
+def test_defaults_unchanged():
+    adapter = _transport()._session.get_adapter("https://")
+
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == (
+        adapters.DEFAULT_POOLSIZE
+    )
+
+
+@pytest.mark.parametrize("prefix", ["https://", "http://"])
+def test_options_applied_to_every_adapter(prefix):
+    options = http_pool.HttpPoolOptions(
+        pool_maxsize=64, pool_block=True, tcp_keepalive=60, connect_retries=2
+    )
+    adapter = _transport(http_pool_options=options)._session.get_adapter(prefix)
+
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert adapter.max_retries.connect == 2
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in (
+        adapter.poolmanager.connection_pool_kw["socket_options"]
+    )
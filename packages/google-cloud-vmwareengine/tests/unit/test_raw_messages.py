@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+from google.cloud.vmwareengine_helpers import raw_messages
+from google.cloud.vmwareengine_v1.types import vmwareengine_resources
+
+_PARENT = "projects/p/locations/l"
+_NAME = _PARENT + "/privateClouds/pc"
+
+
+def test_response_is_protobuf(grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+
+    response = client.get_private_cloud(name=_NAME)
+
+    assert type(response) is vmwareengine_resources.PrivateCloud.pb()
+    assert response.state == vmwareengine_resources.PrivateCloud.State.ACTIVE
+
+
+def test_pager_yields_protobuf_items(server, grpc_client):
+    client = grpc_client(raw_messages.RawMessages())
+
+    clouds = list(client.list_private_clouds(parent=_PARENT))
+
+    assert [type(c) for c in clouds] == [vmwareengine_resources.PrivateCloud.pb()] * 3
+    assert [c.name for c in clouds] == ["a", "b", "c"]
+    assert [r.page_token for r in server.requests] == ["", "2"]
+
+
+def test_async_pager_yields_protobuf_items(async_client):
+    async def main():
+        client = async_client(
+            raw_messages.RawMessages(), methods=["list_private_clouds"]
+        )
+        pager = await client.list_private_clouds(parent=_PARENT)
+        return [c async for c in pager]
+
+    clouds = asyncio.run(main())
+
+    assert [type(c) for c in clouds] == [vmwareengine_resources.PrivateCloud.pb()] * 3
+    assert [c.name for c in clouds] == ["a", "b", "c"]
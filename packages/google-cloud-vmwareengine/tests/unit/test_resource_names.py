@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+
+import pytest
+
+from google.cloud.vmwareengine_helpers import resource_names
+from google.cloud.vmwareengine_v1 import VmwareEngineAsyncClient, VmwareEngineClient
+
+_PRIVATE_CLOUD = "projects/{project}/locations/{location}/privateClouds/{private_cloud}"
+
+
+def _generated_parse(template, path):
+    # The code the generator emits for parse_*_path.
+    pattern = "^" + re.sub(r"\{(\w+)\}", r"(?P<\1>.+?)", template) + "$"
+    m = re.match(pattern, path)
+    return m.groupdict() if m else {}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "projects/p/locations/l/privateClouds/pc",
+        "projects/p/locations/l/privateClouds/a/b",
+        "projects/p/locations/l/privateClouds/",
+        "projects/p/locations/l/privateClouds/pc\n",
+        "projects/p/locations/l",
+        "",
+    ],
+)
+def test_parse_matches_generated_code(path):
+    parsed = resource_names.ResourceName(_PRIVATE_CLOUD).parse(path)
+
+    assert parsed == _generated_parse(_PRIVATE_CLOUD, path)
+
+
+def test_client_methods():
+    path = VmwareEngineClient.private_cloud_path("p", "l", "pc")
+    fields = {"project": "p", "location": "l", "private_cloud": "pc"}
+
+    assert path == "projects/p/locations/l/privateClouds/pc"
+    assert VmwareEngineClient.parse_private_cloud_path(path) == fields
+    assert VmwareEngineAsyncClient.parse_private_cloud_path(path) == fields
+    assert VmwareEngineClient.parse_network_policy_path(path) == {}
+    assert VmwareEngineClient.common_location_path("p", "l") == (
+        "projects/p/locations/l"
+    )
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+from google.api_core import rest_helpers
+from google.protobuf import field_mask_pb2, json_format, timestamp_pb2
+import pytest
+
+from google.cloud.vmwareengine_helpers import rest_encoding
+from google.cloud.vmwareengine_v1.types import vmwareengine, vmwareengine_resources
+
+
+def _legacy(message, use_integers_for_enums=True):
+    query_params = json.loads(
+        json_format.MessageToJson(
+            message,
+            including_default_value_fields=False,
+            use_integers_for_enums=use_integers_for_enums,
+        )
+    )
+    return rest_helpers.flatten_query_params(query_params, strict=True)
+
+
+MESSAGES = [
+    vmwareengine.ListPrivateCloudsRequest.pb(vmwareengine.ListPrivateCloudsRequest()),
+    vmwareengine.ListPrivateCloudsRequest.pb(
+        vmwareengine.ListPrivateCloudsRequest(
+            parent="projects/p/locations/l",
+            page_size=50,
+            page_token="token/with?reserved&chars",
+            filter='name = "pc" AND state = ACTIVE',
+            order_by="name desc",
+        )
+    ),
+    vmwareengine.DeletePrivateCloudRequest.pb(
+        vmwareengine.DeletePrivateCloudRequest(
+            name="n", request_id="r", force=True, delay_hours=0
+        )
+    ),
+    vmwareengine.UpdatePrivateCloudRequest.pb(
+        vmwareengine.UpdatePrivateCloudRequest(
+            update_mask=field_mask_pb2.FieldMask(paths=["description", "type"]),
+            private_cloud=vmwareengine_resources.PrivateCloud(
+                name="pc",
+                description="two words",
+                create_time=timestamp_pb2.Timestamp(seconds=1700000000, nanos=1000),
+                state=vmwareengine_resources.PrivateCloud.State.ACTIVE,
+                type_=vmwareengine_resources.PrivateCloud.Type.STRETCHED,
+                network_config=vmwareengine_resources.NetworkConfig(
+                    management_cidr="192.168.0.0/24"
+                ),
+                management_cluster=vmwareengine_resources.PrivateCloud.ManagementCluster(
+                    cluster_id="c",
+                    node_type_configs={
+                        "standard-72": vmwareengine_resources.NodeTypeConfig(
+                            node_count=3, custom_core_count=-1
+                        )
+                    },
+                ),
+            ),
+        )
+    ),
+]
+
+
+@pytest.mark.parametrize("use_integers_for_enums", [True, False])
+@pytest.mark.parametrize("message", MESSAGES)
+def test_message_to_query_params_matches_json_round_trip(
+    message, use_integers_for_enums
+):
+    assert rest_encoding.message_to_query_params(
+        message, use_integers_for_enums=use_integers_for_enums
+    ) == _legacy(message, use_integers_for_enums=use_integers_for_enums)
+
+
+def test_optional_field_set_to_default_is_sent():
+    message = vmwareengine.DeletePrivateCloudRequest.pb(
+        vmwareengine.DeletePrivateCloudRequest(name="n", delay_hours=0)
+    )
+
+    assert rest_encoding.message_to_query_params(message) == [
+        ("name", "n"),
+        ("delayHours", "0"),
+    ]
@@ -0,0 +1,151 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client construction time for the services with the most RPCs.
+
+Each service is measured in a fresh interpreter with its package directory
+on ``sys.path``. ``lazy`` is the cost of constructing a client and making
+one call's worth of method wrapping; ``eager`` additionally wraps every
+method, which is what construction used to cost when
+``_prep_wrapped_messages`` wrapped all RPCs up front.
+
+Usage::
+
+    python scripts/benchmarks/client_construction.py [--number N] [--json]
+"""
+
+import argparse
+import json
+import pathlib
+import subprocess
+import sys
+
+PACKAGES_DIR = pathlib.Path(__file__).resolve().parents[2] / "packages"
+
+SERVICES = {
+    "analytics-admin": (
+        "google-analytics-admin",
+        "google.analytics.admin_v1alpha",
+        "AnalyticsAdminServiceClient",
+        "get_property",
+    ),
+    "vmwareengine": (
+        "google-cloud-vmwareengine",
+        "google.cloud.vmwareengine_v1",
+        "VmwareEngineClient",
+        "get_private_cloud",
+    ),
+    "compute-instances": (
+        "google-cloud-compute",
+        "google.cloud.compute_v1.services.instances",
+        "InstancesClient",
+        "get",
+    ),
+    "dialogflow-cx-agents": (
+        "google-cloud-dialogflow-cx",
+        "google.cloud.dialogflowcx_v3",
+        "AgentsClient",
+        "get_agent",
+    ),
+}
+
+_PROBE = """
+import importlib
+import statistics
+import sys
+import time
+
+from google.auth import credentials as ga_credentials
+
+module, client_name, method, transport, number = sys.argv[1:6]
+client_class = getattr(importlib.import_module(module), client_name)
+credentials = ga_credentials.AnonymousCredentials()
+
+
+def construct(eager):
+    client = client_class(credentials=credentials, transport=transport)
+    wrapped = client.transport._wrapped_methods
+    wrapped[getattr(client.transport, method)]
+    if eager:
+        for name in wrapped._factories:
+            wrapped[getattr(client.transport, name)]
+    return client
+
+
+construct(True)
+results = {}
+for eager in (False, True):
+    samples = []
+    for _ in range(int(number)):
+        start = time.perf_counter()
+        construct(eager)
+        samples.append(time.perf_counter() - start)
+    results["eager" if eager else "lazy"] = statistics.median(samples)
+print(len(construct(False).transport._wrapped_methods._factories))
+print(results["lazy"], results["eager"])
+"""
+
+
+def measure(package, module, client_name, method, transport, number):
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _PROBE,
+            module,
+            client_name,
+            method,
+            transport,
+            str(number),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=PACKAGES_DIR / package,
+    ).stdout.split()
+    return {
+        "rpcs": int(out[0]),
+        "lazy_ms": float(out[1]) * 1e3,
+        "eager_ms": float(out[2]) * 1e3,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="emit JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for name, (package, module, client_name, method) in SERVICES.items():
+        for transport in ("grpc", "rest"):
+            if name == "compute-instances" and transport == "grpc":
+                continue
+            results[f"{name}/{transport}"] = measure(
+                package, module, client_name, method, transport, args.number
+            )
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'service':<30}{'rpcs':>6}{'eager ms':>10}{'lazy ms':>10}{'speedup':>9}")
+    for name, r in results.items():
+        print(
+            f"{name:<30}{r['rpcs']:>6}{r['eager_ms']:>10.2f}{r['lazy_ms']:>10.2f}"
+            f"{r['eager_ms'] / r['lazy_ms']:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
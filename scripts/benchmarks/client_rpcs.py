@@ -0,0 +1,518 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side cost of representative RPCs against in-process fake servers.
+
+Unary, paged, server-streaming and bidi-streaming methods of a few
+clients are called over gRPC and REST against the servers of
+``fake_servers.py``, with the packages imported from their directories
+under ``packages/``. For each method and transport the table shows:
+
+* ``ops/s``: calls per second, one call at a time. A paged call reads
+  every page, a streaming call every message;
+* ``p50 ms`` and ``p99 ms``: the latency of a call;
+* ``cpu us``: CPU time of the calling thread per call, which leaves out
+  the server's threads but includes the channel's;
+* ``peak KiB``: the most memory allocated at once during a call. This
+  includes what the server allocates meanwhile, which is the same from
+  run to run.
+
+``--json`` saves the results. ``--baseline`` compares them with saved
+results, and exits with status 1 if the latency or CPU time of a method
+grew by more than ``--threshold``.
+
+Usage::
+
+    python scripts/benchmarks/client_rpcs.py [--number N] [--only NAME]
+        [--transport {grpc,rest}] [--json PATH] [--baseline PATH]
+"""
+
+import argparse
+import importlib
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, NamedTuple, Tuple
+
+from google.protobuf import empty_pb2, timestamp_pb2
+
+import fake_servers
+
+PACKAGES_DIR = pathlib.Path(__file__).resolve().parents[2] / "packages"
+
+
+class Scenario(NamedTuple):
+    """One method of one client to drive.
+
+    ``client`` is the client class's name in ``module``, or its path
+    below it. ``build`` is given the imported module and returns the
+    request (or list of requests, for bidi-streaming methods), the
+    server's ``respond`` function and the type of the request messages.
+    """
+
+    name: str
+    package: str
+    module: str
+    client: str
+    method: str
+    kind: str
+    transports: Tuple[str, ...]
+    build: Callable[[Any], Tuple[Any, Callable, Any]]
+
+
+def _pages(make_page, pages):
+    """Return a ``respond`` function serving ``pages`` pages."""
+
+    def respond(request):
+        page = int(request.page_token or 0)
+        response = make_page()
+        response.next_page_token = str(page + 1) if page + 1 < pages else ""
+        return response
+
+    return respond
+
+
+def _tasks_get_queue(m):
+    def respond(request):
+        return m.Queue(
+            name=request.name,
+            rate_limits=m.RateLimits(max_dispatches_per_second=500),
+            retry_config=m.RetryConfig(max_attempts=5),
+            state=m.Queue.State.RUNNING,
+        )
+
+    request = m.GetQueueRequest(name="projects/p/locations/l/queues/q")
+    return request, respond, m.GetQueueRequest
+
+
+def _tasks_list_tasks(m):
+    page = m.ListTasksResponse(
+        tasks=[
+            m.Task(
+                name="projects/p/locations/l/queues/q/tasks/{}".format(i),
+                http_request=m.HttpRequest(
+                    url="https://example.com/work",
+                    headers={"Content-Type": "application/json"},
+                    body=b"x" * 512,
+                ),
+                dispatch_count=i % 3,
+            )
+            for i in range(100)
+        ]
+    )
+    respond = _pages(lambda: m.ListTasksResponse(page), 3)
+    request = m.ListTasksRequest(
+        parent="projects/p/locations/l/queues/q",
+        response_view=m.Task.View.FULL,
+        page_size=100,
+    )
+    return request, respond, m.ListTasksRequest
+
+
+def _compute_get(m):
+    def respond(request):
+        return m.Instance(
+            name=request.instance,
+            machine_type="zones/us-central1-a/machineTypes/n2-standard-8",
+            status="RUNNING",
+            network_interfaces=[m.NetworkInterface(network="global/networks/default")],
+            disks=[m.AttachedDisk(boot=True, device_name="boot")],
+            labels={"env": "prod"},
+        )
+
+    request = m.GetInstanceRequest(project="p", zone="us-central1-a", instance="vm-1")
+    return request, respond, m.GetInstanceRequest
+
+
+def _compute_list(m):
+    page = m.InstanceList(
+        items=[
+            m.Instance(
+                name="vm-{}".format(i),
+                machine_type="zones/us-central1-a/machineTypes/n2-standard-8",
+                status="RUNNING",
+                labels={"env": "prod"},
+            )
+            for i in range(100)
+        ]
+    )
+    respond = _pages(lambda: m.InstanceList(page), 3)
+    request = m.ListInstancesRequest(project="p", zone="us-central1-a", max_results=100)
+    return request, respond, m.ListInstancesRequest
+
+
+def _time_series(m, count, points):
+    end = timestamp_pb2.Timestamp(seconds=1700000000)
+    return [
+        m.TimeSeries(
+            metric={
+                "type": "custom.googleapis.com/latency",
+                "labels": {"method": "m{}".format(i)},
+            },
+            resource={"type": "global", "labels": {"project_id": "p"}},
+            points=[
+                m.Point(
+                    interval=m.TimeInterval(end_time=end),
+                    value=m.TypedValue(double_value=j / 7),
+                )
+                for j in range(points)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def _monitoring_list_time_series(m):
+    page = m.ListTimeSeriesResponse(time_series=_time_series(m, 50, 60))
+    respond = _pages(lambda: m.ListTimeSeriesResponse(page), 3)
+    request = m.ListTimeSeriesRequest(
+        name="projects/p",
+        filter='metric.type = "custom.googleapis.com/latency"',
+        interval=m.TimeInterval(end_time=timestamp_pb2.Timestamp(seconds=1)),
+        view=m.ListTimeSeriesRequest.TimeSeriesView.FULL,
+    )
+    return request, respond, m.ListTimeSeriesRequest
+
+
+def _monitoring_create_time_series(m):
+    request = m.CreateTimeSeriesRequest(
+        name="projects/p", time_series=_time_series(m, 200, 1)
+    )
+    return request, lambda request: empty_pb2.Empty(), m.CreateTimeSeriesRequest
+
+
+def _speech_config(m):
+    return m.RecognitionConfig(
+        encoding=m.RecognitionConfig.AudioEncoding.LINEAR16,
+        sample_rate_hertz=16000,
+        language_code="en-US",
+    )
+
+
+def _speech_result(m, cls):
+    return cls(
+        alternatives=[
+            m.SpeechRecognitionAlternative(
+                transcript="the quick brown fox jumps over the lazy dog",
+                confidence=0.9,
+            )
+        ]
+    )
+
+
+def _speech_recognize(m):
+    def respond(request):
+        return m.RecognizeResponse(
+            results=[_speech_result(m, m.SpeechRecognitionResult)]
+        )
+
+    request = m.RecognizeRequest(
+        config=_speech_config(m),
+        audio=m.RecognitionAudio(content=b"\0" * 32000),
+    )
+    return request, respond, m.RecognizeRequest
+
+
+def _speech_streaming_recognize(m):
+    def respond(request):
+        return [
+            m.StreamingRecognizeResponse(
+                results=[_speech_result(m, m.StreamingRecognitionResult)]
+            )
+        ]
+
+    requests = [
+        m.StreamingRecognizeRequest(
+            streaming_config=m.StreamingRecognitionConfig(config=_speech_config(m))
+        )
+    ] + [m.StreamingRecognizeRequest(audio_content=b"\0" * 3200)] * 10
+    return requests, respond, m.StreamingRecognizeRequest
+
+
+def _generate_stream(m):
+    def respond(request):
+        return [
+            m.GenerateContentResponse(
+                candidates=[
+                    m.Candidate(
+                        content=m.Content(
+                            role="model", parts=[m.Part(text="token " * 20)]
+                        ),
+                        index=0,
+                    )
+                ]
+            )
+            for _ in range(20)
+        ]
+
+    request = m.GenerateContentRequest(
+        model="models/gemini-pro",
+        contents=[m.Content(role="user", parts=[m.Part(text="Tell me a story.")])],
+    )
+    return request, respond, m.GenerateContentRequest
+
+
+SCENARIOS = [
+    Scenario(
+        "tasks/get_queue",
+        "google-cloud-tasks",
+        "google.cloud.tasks_v2",
+        "CloudTasksClient",
+        "get_queue",
+        "unary",
+        ("grpc", "rest"),
+        _tasks_get_queue,
+    ),
+    Scenario(
+        "tasks/list_tasks",
+        "google-cloud-tasks",
+        "google.cloud.tasks_v2",
+        "CloudTasksClient",
+        "list_tasks",
+        "paged",
+        ("grpc", "rest"),
+        _tasks_list_tasks,
+    ),
+    Scenario(
+        "compute/instances.get",
+        "google-cloud-compute",
+        "google.cloud.compute_v1",
+        "InstancesClient",
+        "get",
+        "unary",
+        ("rest",),
+        _compute_get,
+    ),
+    Scenario(
+        "compute/instances.list",
+        "google-cloud-compute",
+        "google.cloud.compute_v1",
+        "InstancesClient",
+        "list",
+        "paged",
+        ("rest",),
+        _compute_list,
+    ),
+    Scenario(
+        "monitoring/list_time_series",
+        "google-cloud-monitoring",
+        "google.cloud.monitoring_v3",
+        "MetricServiceClient",
+        "list_time_series",
+        "paged",
+        ("grpc",),
+        _monitoring_list_time_series,
+    ),
+    Scenario(
+        "monitoring/create_time_series",
+        "google-cloud-monitoring",
+        "google.cloud.monitoring_v3",
+        "MetricServiceClient",
+        "create_time_series",
+        "unary",
+        ("grpc",),
+        _monitoring_create_time_series,
+    ),
+    Scenario(
+        "speech/recognize",
+        "google-cloud-speech",
+        "google.cloud.speech_v1",
+        "services.speech.SpeechClient",
+        "recognize",
+        "unary",
+        ("grpc", "rest"),
+        _speech_recognize,
+    ),
+    Scenario(
+        "speech/streaming_recognize",
+        "google-cloud-speech",
+        "google.cloud.speech_v1",
+        "services.speech.SpeechClient",
+        "streaming_recognize",
+        "bidi",
+        ("grpc",),
+        _speech_streaming_recognize,
+    ),
+    Scenario(
+        "generativelanguage/stream_generate_content",
+        "google-ai-generativelanguage",
+        "google.ai.generativelanguage_v1",
+        "GenerativeServiceClient",
+        "stream_generate_content",
+        "server_streaming",
+        ("grpc", "rest"),
+        _generate_stream,
+    ),
+]
+
+
+def _caller(client, scenario, request):
+    method = getattr(client, scenario.method)
+    if scenario.kind == "unary":
+        return lambda: method(request=request)
+    if scenario.kind == "bidi":
+        return lambda: list(method(requests=iter(request)))
+    return lambda: list(method(request=request))
+
+
+def measure(call, number, warmup):
+    """Return the metrics of ``number`` calls, after ``warmup`` calls."""
+    for _ in range(warmup):
+        call()
+    latencies = []
+    cpu = []
+    start = time.perf_counter()
+    for _ in range(number):
+        call_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        call()
+        cpu.append(time.thread_time() - cpu_start)
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(min(number, 50)):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "ops_per_sec": number / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1e3,
+        "p99_ms": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1e3,
+        "cpu_us": statistics.fmean(cpu) * 1e6,
+        "peak_kib": statistics.median(peaks) / 1024,
+    }
+
+
+def run(scenario, transport, number, warmup):
+    module = importlib.import_module(scenario.module)
+    # Relative to the module, so a client's hand-written helpers can be
+    # skipped.
+    client_path, _, client_name = f"{scenario.module}.{scenario.client}".rpartition(".")
+    client_class = getattr(importlib.import_module(client_path), client_name)
+    transport_class = client_class.get_transport_class(transport)
+    request, respond, request_type = scenario.build(module)
+    if transport == "grpc":
+        server = fake_servers.FakeGrpcServer(transport_class)
+        server.respond(scenario.method, respond)
+    else:
+        server = fake_servers.FakeHttpServer(transport_class)
+        server.respond(
+            request_type, respond, streaming=scenario.kind == "server_streaming"
+        )
+    with server:
+        client = client_class(transport=server.transport())
+        try:
+            return measure(_caller(client, scenario, request), number, warmup)
+        finally:
+            client.transport.close()
+
+
+def compare(results, baseline, threshold):
+    """Return the rows of changes, and whether any is a regression."""
+    rows = []
+    regressed = False
+    for key, result in results.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        changes = {
+            metric: result[metric] / before[metric] - 1
+            for metric in ("p50_ms", "p99_ms", "cpu_us", "peak_kib")
+            if before[metric]
+        }
+        worse = [
+            metric
+            for metric in ("p50_ms", "cpu_us")
+            if changes.get(metric, 0) > threshold
+        ]
+        regressed = regressed or bool(worse)
+        rows.append((key, changes, worse))
+    return rows, regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument(
+        "--only", action="append", help="run the scenarios containing NAME"
+    )
+    parser.add_argument("--transport", choices=("grpc", "rest"))
+    parser.add_argument("--json", type=pathlib.Path, help="save the results")
+    parser.add_argument(
+        "--baseline", type=pathlib.Path, help="compare with saved results"
+    )
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    scenarios = [
+        s
+        for s in SCENARIOS
+        if not args.only or any(name in s.name for name in args.only)
+    ]
+    for package in sorted({s.package for s in scenarios}):
+        sys.path.insert(0, str(PACKAGES_DIR / package))
+
+    results = {}
+    print(
+        f"{'method':<50}{'ops/s':>9}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'cpu us':>10}{'peak KiB':>10}"
+    )
+    for scenario in scenarios:
+        for transport in scenario.transports:
+            if args.transport and transport != args.transport:
+                continue
+            key = f"{scenario.name}/{transport}"
+            r = results[key] = run(scenario, transport, args.number, args.warmup)
+            print(
+                f"{key:<50}{r['ops_per_sec']:>9.0f}{r['p50_ms']:>9.2f}"
+                f"{r['p99_ms']:>9.2f}{r['cpu_us']:>10.0f}{r['peak_kib']:>10.0f}",
+                flush=True,
+            )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {"python": platform.python_version(), "results": results}, indent=2
+            )
+        )
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        rows, regressed = compare(results, baseline, args.threshold)
+        print()
+        print(f"{'method':<50}{'p50':>9}{'p99':>9}{'cpu':>9}{'peak':>9}  regressed")
+        for key, changes, worse in rows:
+            cells = "".join(
+                f"{changes[m]:>+9.0%}" if m in changes else f"{'':>9}"
+                for m in ("p50_ms", "p99_ms", "cpu_us", "peak_kib")
+            )
+            print(f"{key:<50}{cells}  {', '.join(worse)}")
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
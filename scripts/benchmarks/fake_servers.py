@@ -0,0 +1,330 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process fake servers for the generated clients.
+
+:class:`FakeGrpcServer` serves every method of a gRPC transport class. Its
+method table comes from the transport itself: each stub property is read
+with a channel that records, instead of a multicallable, the method's
+path, its streaming kind and the request and response types of its
+serializers.
+
+:class:`FakeHttpServer` serves the REST transports. Requests are decoded
+from the JSON body and the query string into the method's request type;
+path parameters are not.
+
+Both answer with a ``respond(request)`` function per method, which returns
+the response message, or for streaming methods the list of response
+messages. For bidi-streaming methods it is called once per request
+message.
+
+.. code-block:: python
+
+    server = FakeGrpcServer(CloudTasksGrpcTransport)
+    server.respond("get_queue", lambda request: queue.Queue(name=request.name))
+    with server:
+        client = CloudTasksClient(transport=server.transport())
+"""
+
+from concurrent import futures
+import http.server
+import json
+import socket
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional, Type
+import urllib.parse
+
+from google.auth import credentials as ga_credentials
+from google.protobuf import json_format
+import grpc
+
+_KINDS = ("unary_unary", "unary_stream", "stream_unary", "stream_stream")
+
+
+class GrpcMethod(NamedTuple):
+    """One method of a gRPC service, as its stub is defined."""
+
+    name: str
+    path: str
+    kind: str
+    request_type: Any
+    response_type: Any
+
+
+def _message_type(serializer: Callable) -> Any:
+    # proto-plus classes serialize with class methods, protobuf classes with
+    # unbound methods.
+    owner = getattr(serializer, "__self__", None)
+    if isinstance(owner, type):
+        return owner
+    return getattr(serializer, "__objclass__", None)
+
+
+class _RecordedStub:
+    def __init__(self, kind, path, request_type, response_type):
+        self.kind = kind
+        self.path = path
+        self.request_type = request_type
+        self.response_type = response_type
+
+    def __call__(self, *args, **kwargs):
+        raise NotImplementedError("recorded stubs cannot be called")
+
+
+class _RecordingChannel:
+    """Stands in for a channel, recording the stubs made from it."""
+
+    def _stub(self, kind):
+        def make(path, request_serializer=None, response_deserializer=None):
+            return _RecordedStub(
+                kind,
+                path,
+                _message_type(request_serializer),
+                _message_type(response_deserializer),
+            )
+
+        return make
+
+    def __getattr__(self, name):
+        if name in _KINDS:
+            return self._stub(name)
+        raise AttributeError(name)
+
+    def close(self):
+        pass
+
+
+def grpc_methods(transport_class: Type) -> Dict[str, GrpcMethod]:
+    """Return the methods of a gRPC transport class, by stub name."""
+    transport = transport_class(channel=_RecordingChannel())
+    methods = {}
+    for name in dir(transport_class):
+        if name.startswith("_") or not isinstance(
+            getattr(transport_class, name), property
+        ):
+            continue
+        try:
+            stub = getattr(transport, name)
+        except Exception:
+            continue
+        if isinstance(stub, _RecordedStub):
+            methods[name] = GrpcMethod(
+                name, stub.path, stub.kind, stub.request_type, stub.response_type
+            )
+    return methods
+
+
+def _serialize(message) -> bytes:
+    pb = getattr(type(message), "pb", None)
+    return (pb(message) if pb is not None else message).SerializeToString()
+
+
+def _deserializer(message_type) -> Callable[[bytes], Any]:
+    return getattr(message_type, "deserialize", None) or message_type.FromString
+
+
+class FakeGrpcServer:
+    """A gRPC server on a local port with every method of a transport.
+
+    Methods without a ``respond`` function answer with an empty response.
+
+    Args:
+        transport_class (Type): The generated gRPC transport class.
+        max_workers (int): Threads serving calls.
+
+    Attributes:
+        methods (Dict[str, GrpcMethod]): The transport's methods.
+        address (str): ``host:port`` of the server.
+    """
+
+    def __init__(self, transport_class: Type, max_workers: int = 8):
+        self.transport_class = transport_class
+        self.methods = grpc_methods(transport_class)
+        self._responders: Dict[str, Callable] = {}
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers))
+        handlers: Dict[str, Dict[str, grpc.RpcMethodHandler]] = {}
+        for method in self.methods.values():
+            service, _, rpc = method.path.lstrip("/").rpartition("/")
+            handlers.setdefault(service, {})[rpc] = self._handler(method)
+        self._server.add_generic_rpc_handlers(
+            tuple(
+                grpc.method_handlers_generic_handler(service, rpcs)
+                for service, rpcs in handlers.items()
+            )
+        )
+        port = self._server.add_insecure_port("localhost:0")
+        self.address = "localhost:{}".format(port)
+        self._channels = []
+
+    def respond(self, method: str, respond: Callable) -> None:
+        """Set how a method answers, by its stub name."""
+        if method not in self.methods:
+            raise KeyError(method)
+        self._responders[method] = respond
+
+    def _respond(self, method, request):
+        respond = self._responders.get(method.name)
+        if respond is None:
+            response = method.response_type()
+            return [response] if method.kind.endswith("_stream") else response
+        return respond(request)
+
+    def _handler(self, method: GrpcMethod) -> grpc.RpcMethodHandler:
+        if method.kind == "unary_unary":
+
+            def handle(request, context):
+                return self._respond(method, request)
+
+        elif method.kind == "unary_stream":
+
+            def handle(request, context):
+                yield from self._respond(method, request)
+
+        elif method.kind == "stream_unary":
+
+            def handle(requests, context):
+                response = None
+                for request in requests:
+                    response = self._respond(method, request)
+                return response
+
+        else:
+
+            def handle(requests, context):
+                for request in requests:
+                    yield from self._respond(method, request)
+
+        return getattr(grpc, method.kind + "_rpc_method_handler")(
+            handle,
+            request_deserializer=_deserializer(method.request_type),
+            response_serializer=_serialize,
+        )
+
+    def transport(self, **kwargs: Any):
+        """Return a transport connected to the server."""
+        channel = grpc.insecure_channel(self.address)
+        self._channels.append(channel)
+        return self.transport_class(channel=channel, **kwargs)
+
+    def __enter__(self):
+        self._server.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        for channel in self._channels:
+            channel.close()
+        self._server.stop(None)
+
+
+class FakeHttpServer:
+    """An HTTP/1.1 server on a local port answering for REST transports.
+
+    Each request goes to the ``respond`` function of the last method set
+    with :meth:`respond`, which is the one being driven.
+
+    Args:
+        transport_class (Type): The generated REST transport class.
+
+    Attributes:
+        address (str): ``host:port`` of the server.
+    """
+
+    def __init__(self, transport_class: Type):
+        self.transport_class = transport_class
+        self._current: Optional[tuple] = None
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body are written separately.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, content = server._answer(self.path, body)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _serve
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(("localhost", 0), Handler)
+        self._server.daemon_threads = True
+        self.address = "localhost:{}".format(self._server.server_address[1])
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def respond(
+        self, request_type: Any, respond: Callable, streaming: bool = False
+    ) -> None:
+        """Answer the coming requests as one method.
+
+        Args:
+            request_type: The method's request type.
+            respond (Callable): Returns the response to a request, or the
+                list of responses of a streaming method.
+            streaming (bool): Whether the method is server-streaming.
+        """
+        self._current = (request_type, respond, streaming)
+
+    def _answer(self, path, body):
+        if self._current is None:
+            return 404, b"{}"
+        request_type, respond, streaming = self._current
+        request = request_type()
+        pb = getattr(request_type, "pb", None)
+        pb_request = pb(request) if pb is not None else request
+        if body:
+            json_format.Parse(body, pb_request, ignore_unknown_fields=True)
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(path).query)
+        fields = {k: v[-1] for k, v in query.items() if not k.startswith("$")}
+        json_format.ParseDict(fields, pb_request, ignore_unknown_fields=True)
+        response = respond(request)
+        if streaming:
+            content = "[{}]".format(",".join(_to_json(r) for r in response))
+        else:
+            content = _to_json(response)
+        return 200, content.encode("utf-8")
+
+    def transport(self, **kwargs: Any):
+        """Return a transport connected to the server."""
+        kwargs.setdefault("credentials", ga_credentials.AnonymousCredentials())
+        return self.transport_class(host=self.address, url_scheme="http", **kwargs)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _to_json(message) -> str:
+    pb = getattr(type(message), "pb", None)
+    return json.dumps(
+        json_format.MessageToDict(
+            pb(message) if pb is not None else message,
+            use_integers_for_enums=True,
+        ),
+        separators=(",", ":"),
+    )
@@ -0,0 +1,319 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Import time and memory of every package's modules.
+
+Each module with a ``gapic_version.py`` (the unversioned module of a
+package and each of its versioned ones) is imported in a fresh
+interpreter with ``-X importtime``, with its package directory, and those
+of the packages of this repository it depends on, on ``sys.path``. After
+one import to write the bytecode, the median of ``--repeat`` imports is
+kept of:
+
+* ``wall ms``: the time ``import_module`` takes;
+* ``rss MiB``: how much the resident set grows;
+* ``own ms``, ``proto ms``, ``grpc ms``, ``core ms``: the ``-X importtime``
+  self time of the package's own modules, of protobuf and proto-plus, of
+  grpc, and of ``google.api_core`` and ``google.auth``. The rest of the
+  wall time is other dependencies and the standard library.
+
+``--json`` saves a report, which also lists the modules with the most
+self time. ``--baseline`` compares with a saved report and exits with
+status 1 if the wall time or the memory of a module grew by more than
+``--threshold`` and by at least ``--min-ms`` or ``--min-mib``.
+
+Usage::
+
+    python scripts/benchmarks/import_footprint.py [--package GLOB]
+        [--repeat N] [--jobs N] [--json PATH] [--baseline PATH]
+"""
+
+import argparse
+from concurrent import futures
+import fnmatch
+import json
+import os
+import pathlib
+import platform
+import re
+import statistics
+import subprocess
+import sys
+
+PACKAGES_DIR = pathlib.Path(__file__).resolve().parents[2] / "packages"
+
+_SKIPPED_DIRS = {"docs", "samples", "scripts", "testing", "tests"}
+
+_GROUPS = (
+    ("proto", ("google.protobuf", "proto")),
+    ("grpc", ("grpc",)),
+    ("core", ("google.api_core", "google.auth")),
+)
+
+_VERSION_RE = re.compile(r"_v\d+\w*$")
+
+_MARKER = "-- import_footprint --"
+
+_PROBE = """
+import importlib
+import json
+import os
+import sys
+import time
+
+
+def rss():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        # The peak, in KiB on Linux and bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+module = sys.argv[1]
+print({marker!r}, file=sys.stderr, flush=True)
+before = rss()
+start = time.perf_counter()
+importlib.import_module(module)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"wall": elapsed, "rss": rss() - before}}))
+"""
+
+
+def modules(package_dir):
+    """Return the modules of a package with a ``gapic_version.py``."""
+    found = []
+    for version_file in package_dir.rglob("gapic_version.py"):
+        relative = version_file.parent.relative_to(package_dir)
+        if relative.parts and relative.parts[0] not in _SKIPPED_DIRS:
+            found.append(".".join(relative.parts))
+    return sorted(found)
+
+
+def local_dependencies(package_dir):
+    """Return the directories of the packages in this repository it needs."""
+    found = []
+    pending = [package_dir]
+    while pending:
+        setup_py = pending.pop() / "setup.py"
+        if not setup_py.exists():
+            continue
+        text = setup_py.read_text()
+        for other in PACKAGES_DIR.iterdir():
+            if (
+                other != package_dir
+                and other not in found
+                and re.search(r"[\"']{}(?![\w-])".format(re.escape(other.name)), text)
+            ):
+                found.append(other)
+                pending.append(other)
+    return found
+
+
+def _in_group(name, prefixes):
+    return any(name == p or name.startswith(p + ".") for p in prefixes)
+
+
+def parse_importtime(stderr):
+    """Return the self time of each module imported after the marker."""
+    _, _, lines = stderr.partition(_MARKER)
+    times = {}
+    for line in lines.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # The header.
+            continue
+        times[fields[2].strip()] = int(fields[0]) / 1e3
+    return times
+
+
+def breakdown(times, module):
+    """Sum the self times of a module's imports by group."""
+    groups = dict.fromkeys(["own"] + [name for name, _ in _GROUPS], 0.0)
+    # google.cloud.tasks_v2 -> google.cloud.tasks, which also owns
+    # google.cloud.tasks_v2beta3 and google.cloud.tasks_helpers.
+    stem = _VERSION_RE.sub("", module)
+    for name, ms in times.items():
+        if _in_group(name, (stem,)) or name.startswith(stem + "_"):
+            groups["own"] += ms
+            continue
+        for group, prefixes in _GROUPS:
+            if _in_group(name, prefixes):
+                groups[group] += ms
+                break
+    return groups
+
+
+def run_once(package_dir, module):
+    # The package itself is found through the working directory.
+    env = dict(os.environ)
+    path = [str(d) for d in local_dependencies(package_dir)]
+    if env.get("PYTHONPATH"):
+        path.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = os.pathsep.join(path)
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _PROBE.format(marker=_MARKER),
+            module,
+        ],
+        capture_output=True,
+        text=True,
+        cwd=package_dir,
+        env=env,
+    )
+    if process.returncode:
+        error = process.stderr.strip().splitlines() or ["exit status"]
+        raise RuntimeError(error[-1])
+    result = json.loads(process.stdout.splitlines()[-1])
+    return result, parse_importtime(process.stderr)
+
+
+def measure(package_dir, module, repeat):
+    """Return the median footprint of importing a module."""
+    try:
+        run_once(package_dir, module)
+        runs = [run_once(package_dir, module) for _ in range(repeat)]
+    except RuntimeError as exc:
+        return {"error": str(exc)}
+    results = [result for result, _ in runs]
+    breakdowns = [breakdown(times, module) for _, times in runs]
+    # The slowest modules of the median run.
+    walls = [r["wall"] for r in results]
+    _, median_times = runs[walls.index(sorted(walls)[len(walls) // 2])]
+    top = sorted(median_times.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "wall_ms": statistics.median(walls) * 1e3,
+        "rss_mib": statistics.median(r["rss"] for r in results) / 2**20,
+        "self_ms": {
+            group: statistics.median(b[group] for b in breakdowns)
+            for group in breakdowns[0]
+        },
+        "slowest": [[name, ms] for name, ms in top[:10]],
+    }
+
+
+def compare(report, baseline, threshold, min_ms, min_mib):
+    """Return the regressed modules, with their changes."""
+    regressions = []
+    for key, result in report.items():
+        before = baseline.get(key)
+        if before is None or "error" in result or "error" in before:
+            continue
+        worse = []
+        for metric, floor in (("wall_ms", min_ms), ("rss_mib", min_mib)):
+            grown = result[metric] - before[metric]
+            if grown >= floor and grown > threshold * before[metric]:
+                worse.append((metric, before[metric], result[metric]))
+        if worse:
+            regressions.append((key, worse))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--package",
+        action="append",
+        help="measure the package directories matching GLOB",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="interpreters to run at once; above 1 the times are noisier",
+    )
+    parser.add_argument("--json", type=pathlib.Path, help="save the report")
+    parser.add_argument(
+        "--baseline", type=pathlib.Path, help="compare with a saved report"
+    )
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--min-ms", type=float, default=10.0)
+    parser.add_argument("--min-mib", type=float, default=1.0)
+    args = parser.parse_args()
+
+    targets = [
+        (package_dir, module)
+        for package_dir in sorted(PACKAGES_DIR.iterdir())
+        if package_dir.is_dir()
+        and (
+            not args.package
+            or any(fnmatch.fnmatch(package_dir.name, p) for p in args.package)
+        )
+        for module in modules(package_dir)
+    ]
+
+    print(
+        f"{'module':<52}{'wall ms':>9}{'rss MiB':>9}{'own ms':>8}"
+        f"{'proto ms':>9}{'grpc ms':>8}{'core ms':>8}"
+    )
+    report = {}
+    with futures.ThreadPoolExecutor(args.jobs) as executor:
+        measured = executor.map(lambda target: measure(*target, args.repeat), targets)
+        for (package_dir, module), result in zip(targets, measured):
+            key = f"{package_dir.name}:{module}"
+            report[key] = result
+            if "error" in result:
+                print(f"{module:<52}  error: {result['error']}", flush=True)
+                continue
+            own = result["self_ms"]
+            print(
+                f"{module:<52}{result['wall_ms']:>9.1f}{result['rss_mib']:>9.1f}"
+                f"{own['own']:>8.1f}{own['proto']:>9.1f}{own['grpc']:>8.1f}"
+                f"{own['core']:>8.1f}",
+                flush=True,
+            )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "repeat": args.repeat,
+                    "modules": report,
+                },
+                indent=2,
+            )
+        )
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["modules"]
+        regressions = compare(
+            report, baseline, args.threshold, args.min_ms, args.min_mib
+        )
+        print()
+        if not regressions:
+            print("No regressions.")
+        for key, worse in regressions:
+            changes = ", ".join(
+                f"{metric} {before:.1f} -> {after:.1f}"
+                for metric, before, after in worse
+            )
+            print(f"regressed: {key}: {changes}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bytes saved and CPU time spent by gzip on representative payloads.
+
+Each payload is encoded as it is sent over gRPC (binary protobuf) and
+over REST (JSON), and compressed with gzip at ``--level`` (by default 1,
+6 and 9; gRPC compresses at its channel's level, 6 unless configured
+otherwise, and the helpers' ``Compression`` at its ``level``). For each
+the table shows:
+
+* ``KiB`` and ``gzip KiB``: the size before and after compression;
+* ``saved``: the share of the bytes saved;
+* ``gzip us`` and ``gunzip us``: the CPU time to compress and to
+  decompress the payload once, the best of ``--repeat`` runs;
+* ``Mbit/s``: the link speed below which compressing shortens the time
+  to send the payload, that is the bits saved per second of compression.
+  On a link that carries many clients' traffic, compare it with each
+  client's share.
+
+The payloads are built in process with fixed seeds, with the packages
+imported from their directories under ``packages/``. Text is made of
+words of a small vocabulary, so it compresses about as well as logs and
+documents do; the Document AI request carries random bytes in place of
+a PDF, whose streams are already compressed.
+
+Usage::
+
+    python scripts/benchmarks/request_compression.py [--only NAME]
+        [--level N] [--repeat N] [--json PATH]
+"""
+
+import argparse
+import importlib
+import json
+import pathlib
+import platform
+import random
+import sys
+import time
+from typing import Any, Callable, NamedTuple
+import zlib
+
+from google.protobuf import json_format, timestamp_pb2
+
+PACKAGES_DIR = pathlib.Path(__file__).resolve().parents[2] / "packages"
+
+# Makes zlib write a gzip header and trailer.
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+_WORDS = (
+    "request response latency error retry timeout user account order "
+    "payment invoice shipment customer status pending complete failed "
+    "region zone cluster node service handler queue worker batch cache"
+).split()
+
+
+class Payload(NamedTuple):
+    """One message to compress.
+
+    ``build`` is given the imported module and returns the message.
+    """
+
+    name: str
+    package: str
+    module: str
+    build: Callable[[Any], Any]
+
+
+def _text(rng, words):
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _timestamp(seconds):
+    return timestamp_pb2.Timestamp(seconds=1700000000 + seconds)
+
+
+def _trace_batch_write_spans(m):
+    rng = random.Random(0)
+    spans = []
+    for i in range(200):
+        span_id = "{:016x}".format(rng.getrandbits(64))
+        spans.append(
+            m.Span(
+                name="projects/p/traces/{:032x}/spans/{}".format(i // 20, span_id),
+                span_id=span_id,
+                display_name=m.TruncatableString(value="/api/" + rng.choice(_WORDS)),
+                start_time=_timestamp(i),
+                end_time=_timestamp(i + 1),
+                attributes=m.Span.Attributes(
+                    attribute_map={
+                        "/http/method": m.AttributeValue(
+                            string_value=m.TruncatableString(value="POST")
+                        ),
+                        "/http/status_code": m.AttributeValue(int_value=200),
+                        "/http/url": m.AttributeValue(
+                            string_value=m.TruncatableString(
+                                value="https://example.com/api/{}/{}".format(
+                                    rng.choice(_WORDS), i
+                                )
+                            )
+                        ),
+                        "g.co/agent": m.AttributeValue(
+                            string_value=m.TruncatableString(
+                                value="opentelemetry-python 1.21.0"
+                            )
+                        ),
+                    }
+                ),
+            )
+        )
+    return m.BatchWriteSpansRequest(name="projects/p", spans=spans)
+
+
+def _monitoring_create_time_series(m):
+    rng = random.Random(0)
+    return m.CreateTimeSeriesRequest(
+        name="projects/p",
+        time_series=[
+            m.TimeSeries(
+                metric={
+                    "type": "custom.googleapis.com/http/latency",
+                    "labels": {
+                        "method": rng.choice(_WORDS),
+                        "status": str(rng.choice((200, 404, 500))),
+                    },
+                },
+                resource={
+                    "type": "k8s_container",
+                    "labels": {
+                        "project_id": "p",
+                        "location": "us-central1",
+                        "cluster_name": "prod",
+                        "namespace_name": "default",
+                        "pod_name": "frontend-{}".format(i % 20),
+                        "container_name": "server",
+                    },
+                },
+                points=[
+                    m.Point(
+                        interval=m.TimeInterval(end_time=_timestamp(60)),
+                        value=m.TypedValue(double_value=rng.lognormvariate(3, 1)),
+                    )
+                ],
+            )
+            for i in range(200)
+        ],
+    )
+
+
+def _dlp_inspect_content(m):
+    rng = random.Random(0)
+    lines = [
+        "2024-01-01T00:00:{:02d}Z user{}@example.com {}".format(
+            i % 60, rng.randrange(1000), _text(rng, 12)
+        )
+        for i in range(1000)
+    ]
+    return m.InspectContentRequest(
+        parent="projects/p/locations/global",
+        inspect_config=m.InspectConfig(
+            info_types=[
+                m.InfoType(name="EMAIL_ADDRESS"),
+                m.InfoType(name="PERSON_NAME"),
+            ]
+        ),
+        item=m.ContentItem(value="\n".join(lines)),
+    )
+
+
+def _documentai_process_document(m):
+    rng = random.Random(0)
+    return m.ProcessRequest(
+        name="projects/p/locations/us/processors/ocr",
+        raw_document=m.RawDocument(
+            content=bytes(rng.getrandbits(8) for _ in range(256 * 1024)),
+            mime_type="application/pdf",
+        ),
+    )
+
+
+def _documentai_process_response(m):
+    rng = random.Random(0)
+    text = _text(rng, 20000)
+    pages = []
+    for number in range(10):
+        start = number * len(text) // 10
+        pages.append(
+            m.Document.Page(
+                page_number=number + 1,
+                dimension=m.Document.Page.Dimension(width=612, height=792, unit="pt"),
+                paragraphs=[
+                    m.Document.Page.Paragraph(
+                        layout=m.Document.Page.Layout(
+                            text_anchor=m.Document.TextAnchor(
+                                text_segments=[
+                                    m.Document.TextAnchor.TextSegment(
+                                        start_index=start + p * 300,
+                                        end_index=start + p * 300 + 300,
+                                    )
+                                ]
+                            ),
+                            confidence=0.98,
+                        )
+                    )
+                    for p in range(40)
+                ],
+            )
+        )
+    return m.ProcessResponse(document=m.Document(text=text, pages=pages))
+
+
+def _tasks_create_task(m):
+    rng = random.Random(0)
+    body = json.dumps(
+        {
+            "order": rng.randrange(10**6),
+            "items": [
+                {"sku": rng.choice(_WORDS), "quantity": rng.randrange(1, 5)}
+                for _ in range(100)
+            ],
+        }
+    ).encode()
+    return m.CreateTaskRequest(
+        parent="projects/p/locations/l/queues/q",
+        task=m.Task(
+            http_request=m.HttpRequest(
+                url="https://example.com/orders",
+                headers={"Content-Type": "application/json"},
+                body=body,
+            )
+        ),
+    )
+
+
+def _compute_insert(m):
+    return m.InsertInstanceRequest(
+        project="p",
+        zone="us-central1-a",
+        instance_resource=m.Instance(
+            name="vm-1",
+            machine_type="zones/us-central1-a/machineTypes/n2-standard-8",
+            network_interfaces=[m.NetworkInterface(network="global/networks/default")],
+            disks=[
+                m.AttachedDisk(
+                    boot=True,
+                    auto_delete=True,
+                    initialize_params=m.AttachedDiskInitializeParams(
+                        source_image="projects/debian-cloud/global/images/family/debian-12"
+                    ),
+                )
+            ],
+            labels={"env": "prod", "team": "payments"},
+        ),
+    )
+
+
+PAYLOADS = [
+    Payload(
+        "trace/batch_write_spans",
+        "google-cloud-trace",
+        "google.cloud.trace_v2",
+        _trace_batch_write_spans,
+    ),
+    Payload(
+        "monitoring/create_time_series",
+        "google-cloud-monitoring",
+        "google.cloud.monitoring_v3",
+        _monitoring_create_time_series,
+    ),
+    Payload(
+        "dlp/inspect_content",
+        "google-cloud-dlp",
+        "google.cloud.dlp_v2",
+        _dlp_inspect_content,
+    ),
+    Payload(
+        "documentai/process_document",
+        "google-cloud-documentai",
+        "google.cloud.documentai_v1",
+        _documentai_process_document,
+    ),
+    Payload(
+        "documentai/process_document response",
+        "google-cloud-documentai",
+        "google.cloud.documentai_v1",
+        _documentai_process_response,
+    ),
+    Payload(
+        "tasks/create_task",
+        "google-cloud-tasks",
+        "google.cloud.tasks_v2",
+        _tasks_create_task,
+    ),
+    Payload(
+        "compute/instances.insert",
+        "google-cloud-compute",
+        "google.cloud.compute_v1",
+        _compute_insert,
+    ),
+]
+
+
+def gzip(data, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def best_time(function, repeat):
+    """Return the least CPU time of one call of ``function``."""
+    # Enough calls per run to make process_time's resolution negligible.
+    calls = 1
+    while True:
+        start = time.process_time()
+        for _ in range(calls):
+            function()
+        if time.process_time() - start >= 0.05:
+            break
+        calls *= 2
+    best = None
+    for _ in range(repeat):
+        start = time.process_time()
+        for _ in range(calls):
+            function()
+        elapsed = (time.process_time() - start) / calls
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure(data, level, repeat):
+    compressed = gzip(data, level)
+    gzip_s = best_time(lambda: gzip(data, level), repeat)
+    gunzip_s = best_time(lambda: zlib.decompress(compressed, _GZIP_WBITS), repeat)
+    saved = len(data) - len(compressed)
+    return {
+        "bytes": len(data),
+        "gzip_bytes": len(compressed),
+        "gzip_us": gzip_s * 1e6,
+        "gunzip_us": gunzip_s * 1e6,
+        "break_even_mbit_s": saved * 8 / gzip_s / 1e6 if saved > 0 else 0.0,
+    }
+
+
+def encodings(message):
+    pb = type(message).pb(message)
+    yield "proto", pb.SerializeToString()
+    yield "json", json_format.MessageToJson(pb, use_integers_for_enums=True).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--only", action="append", help="measure the payloads containing NAME"
+    )
+    parser.add_argument(
+        "--level",
+        type=int,
+        action="append",
+        choices=range(1, 10),
+        help="gzip levels to measure; 1, 6 and 9 by default",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", type=pathlib.Path, help="save the results")
+    args = parser.parse_args()
+
+    payloads = [
+        p
+        for p in PAYLOADS
+        if not args.only or any(name in p.name for name in args.only)
+    ]
+    for package in sorted({p.package for p in payloads}):
+        sys.path.insert(0, str(PACKAGES_DIR / package))
+
+    results = {}
+    print(
+        f"{'payload':<44}{'level':>6}{'KiB':>9}{'gzip KiB':>10}{'saved':>7}"
+        f"{'gzip us':>10}{'gunzip us':>11}{'Mbit/s':>9}"
+    )
+    for payload in payloads:
+        message = payload.build(importlib.import_module(payload.module))
+        for encoding, data in encodings(message):
+            for level in args.level or (1, 6, 9):
+                key = f"{payload.name}/{encoding}"
+                r = results[f"{key}/{level}"] = measure(data, level, args.repeat)
+                print(
+                    f"{key:<44}{level:>6}{r['bytes'] / 1024:>9.1f}"
+                    f"{r['gzip_bytes'] / 1024:>10.1f}"
+                    f"{1 - r['gzip_bytes'] / r['bytes']:>7.0%}"
+                    f"{r['gzip_us']:>10.0f}{r['gunzip_us']:>11.0f}"
+                    f"{r['break_even_mbit_s']:>9.0f}",
+                    flush=True,
+                )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {"python": platform.python_version(), "results": results}, indent=2
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()